@@ -0,0 +1,99 @@
+# Per-row tree / infection summary for the farm overview pages.
+#
+# The pages used to download every document of a row to find max(TreeNo), then ran one count() query per
+# tree to see whether it had an infected scan: N + 1 sequential round trips. Here a single query, projected
+# onto TreeNo / InfStat / timestamp, brings back every scan of the row without its raw samples. All the
+# numbers of the summary are worked out from that one result. Summaries are kept for SUMMARY_TTL seconds
+# and shared by every Streamlit session of the server process.
+#
+#   summary = get_tree_summary(db, 'Mr.Arjun', row=1)
+#   summary.total_trees, summary.no_inf, summary.no_healthy, summary.inf_per
+
+import threading
+import time
+from collections import namedtuple
+
+from google.cloud.firestore import FieldFilter
+
+from firestore_client import client_scope
+
+ROW_FIELD = 'RowNo'
+TREE_FIELD = 'TreeNo'
+STATUS_FIELD = 'InfStat'
+TIMESTAMP_FIELD = 'timestamp'
+# Seconds a summary is reused before Firestore is asked again
+SUMMARY_TTL = 60
+
+_summaries = {}
+_summaries_lock = threading.Lock()
+
+
+class TreeSummary(namedtuple('TreeSummary', ['total_trees', 'infected_trees', 'scans', 'last_timestamp'])):
+    """total_trees: highest TreeNo of the row. infected_trees: sorted tree numbers 1..total_trees with at least
+    one infected scan. last_timestamp: timestamp of the last scan in document order (None if there are none).
+    """
+    __slots__ = ()
+
+    @property
+    def no_inf(self):
+        return len(self.infected_trees)
+
+    @property
+    def no_healthy(self):
+        return self.total_trees - self.no_inf
+
+    @property
+    def inf_per(self):
+        return self.no_inf / self.total_trees * 100 if self.total_trees else 0.0
+
+
+def _tree_number(value):
+    # Firestore compares 3 and 3.0 as equal, so an integral float TreeNo is tree 3 as well
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return int(value) if float(value).is_integer() else None
+
+
+def summarize_trees(rows):
+    """TreeSummary of (TreeNo, InfStat, timestamp) tuples in document order."""
+    tree_numbers, infected, last_timestamp, scans = [], set(), None, 0
+    for tree_no, inf_stat, timestamp in rows:
+        scans += 1
+        last_timestamp = timestamp
+        if isinstance(tree_no, (int, float)) and not isinstance(tree_no, bool):
+            tree_numbers.append(tree_no)
+        number = _tree_number(tree_no)
+        if number is not None and inf_stat == 'Infected':
+            infected.add(number)
+    total_trees = max(tree_numbers) if tree_numbers else 0
+    infected_trees = sorted(number for number in infected if 1 <= number <= total_trees)
+    return TreeSummary(total_trees, infected_trees, scans, last_timestamp)
+
+
+def fetch_tree_summary(db, collection, row=1):
+    query = (db.collection(collection)
+             .where(filter=FieldFilter(ROW_FIELD, '==', row))
+             .select([TREE_FIELD, STATUS_FIELD, TIMESTAMP_FIELD]))
+    rows = []
+    for doc in query.stream():
+        data = doc.to_dict() or {}
+        rows.append((data.get(TREE_FIELD), data.get(STATUS_FIELD), data.get(TIMESTAMP_FIELD)))
+    return summarize_trees(rows)
+
+
+def get_tree_summary(db, collection, row=1, ttl=SUMMARY_TTL):
+    # The same collection name in another project or database is another collection
+    key = (client_scope(db), collection, row)
+    with _summaries_lock:
+        entry = _summaries.get(key)
+    if entry is not None and time.monotonic() - entry[1] < ttl:
+        return entry[0]
+    summary = fetch_tree_summary(db, collection, row)
+    with _summaries_lock:
+        _summaries[key] = (summary, time.monotonic())
+    return summary
+
+
+def clear_tree_summaries():
+    with _summaries_lock:
+        _summaries.clear()
@@ -5,58 +5,33 @@ import matplotlib.pyplot as plt
 from io import BytesIO
 from scipy.stats import skew, kurtosis 
 from google.cloud import firestore
+from firestore_client import get_client
+from paged_reader import get_firestore_data
 from google.cloud.firestore import FieldFilter
 from datetime import datetime, timedelta
-import time
 import zipfile
 import os
-import random
-from google.api_core.exceptions import ResourceExhausted, RetryError
+from scan_counts import get_scan_counter, status_pivot
+from scan_meta import fetch_scan_meta_many, status_counts
 from collections import defaultdict
 import matplotlib.dates as mdates
 import plotly.express as px
 import plotly.graph_objects as go
 
-def exponential_backoff(retries):
-    base_delay = 1
-    max_delay = 60
-    delay = base_delay * (2 ** retries) + random.uniform(0, 1)
-    return min(delay, max_delay)
-
-def get_firestore_data(query):
-    retries = 0
-    max_retries = 10
-    while retries < max_retries:
-        try:
-            results = query.stream()
-            return list(results)
-        except ResourceExhausted as e:
-            st.warning(f"Quota exceeded, retrying... (attempt {retries + 1})")
-            time.sleep(exponential_backoff(retries))
-            retries += 1
-        except RetryError as e:
-            st.warning(f"Retry error: {e}, retrying... (attempt {retries + 1})")
-            time.sleep(exponential_backoff(retries))
-            retries += 1
-        except Exception as e:
-            st.error(f"An error occurred: {e}")
-            break
-    raise Exception("Max retries exceeded")
 
 
 # Set page configuration
 st.set_page_config(layout="wide")
 st.title("Farm Analytics")
 
-db = firestore.Client.from_service_account_json("WEBB_APP_TREBIRTH/testdata1-20ec5-firebase-adminsdk-an9r6-a87cacba1d.json")
+db = get_client("WEBB_APP_TREBIRTH/testdata1-20ec5-firebase-adminsdk-an9r6-a87cacba1d.json")
 
 # Fetch the most recent scan data from the "demo_db" collection
 def get_recent_scans(db, num_scans=2):
-    docs = (
+    docs = get_firestore_data(
         db.collection('demo_db')
         .order_by('timestamp', direction=firestore.Query.DESCENDING)
         .limit(num_scans)
-        .stream()
     )
     radar_data_list = []
     timestamps = []
@@ -346,37 +321,21 @@ if selected_options:
                 selected_collections[collection] = []
             selected_collections[collection].append(date_str)
 
-    # Fetch data and plot charts
+    # Fetch the scans of every selected collection and date concurrently, then plot charts.
+    # All scans for demo_db (Dananjay Yadav), only the selected days otherwise
+    metas_by_collection = fetch_scan_meta_many(db, {collection: [] if collection == 'demo_db' else dates
+                                                    for collection, dates in selected_collections.items()},
+                                               device_field='DeviceName')
     for collection, dates in selected_collections.items():
-        if collection == 'demo_db' or "No Dates" in dates or not dates[0]:  # Retrieve all scans for Dananjay Yadav
-            docs = db.collection(collection).stream()
-        else:
-            docs = []
-            for date_str in dates:
-                date_obj = datetime.strptime(date_str, '%Y-%m-%d')
-                start_datetime = datetime.combine(date_obj, datetime.min.time())
-                end_datetime = datetime.combine(date_obj, datetime.max.time())
-                docs.extend(db.collection(collection)
-                            .where('timestamp', '>=', start_datetime)
-                            .where('timestamp', '<=', end_datetime)
-                            .stream())
+        metas = metas_by_collection[collection]
 
         # Process documents and retrieve device names using the DataFrame method
-        metadata_list = []
-        for doc in docs:
-            doc_data = doc.to_dict()
-            # Convert datetime values to timezone-unaware
-            for key, value in doc_data.items():
-                if isinstance(value, datetime):
-                    doc_data[key] = value.replace(tzinfo=None)
-            metadata_list.append(doc_data)
-
-        # Convert list of dictionaries to DataFrame
-        df_metadata = pd.DataFrame(metadata_list)
-
-        # Filter out the required columns including DeviceName
-        desired_columns = ['DeviceName', 'InfStat', 'timestamp']
-        df_metadata_filtered = df_metadata[desired_columns]
+        # (timestamps converted to timezone-unaware)
+        df_metadata_filtered = pd.DataFrame({
+            'DeviceName': [meta.device_name for meta in metas],
+            'InfStat': [meta.inf_stat for meta in metas],
+            'timestamp': [meta.timestamp.replace(tzinfo=None) if meta.timestamp else None for meta in metas],
+        })
 
         # Sum up counts based on 'InfStat' for healthy and infected
         healthy_count = df_metadata_filtered[df_metadata_filtered['InfStat'] == 'Healthy'].shape[0]
@@ -408,8 +367,9 @@ if selected_options:
     if collection_scan_counts:
         farmer_names_list = [farmer_names.get(collection, 'Unknown Farmer') for collection in collection_scan_counts.keys()]
         # Calculate healthy and infected counts for each collection
-        healthy_counts = [sum(1 for doc in db.collection(collection).stream() if doc.to_dict().get('InfStat') == 'Healthy') for collection in collection_scan_counts.keys()]
-        infected_counts = [sum(1 for doc in db.collection(collection).stream() if doc.to_dict().get('InfStat') == 'Infected') for collection in collection_scan_counts.keys()]
+        counts = status_pivot(get_scan_counter(db).status_table(collection_scan_counts.keys())).loc[list(collection_scan_counts)]
+        healthy_counts = counts['Healthy'].tolist()
+        infected_counts = counts['Infected'].tolist()
 
         fig = go.Figure()
 
@@ -548,8 +508,10 @@ if selected_options:
     """, unsafe_allow_html=True)
     # Process and analyze the retrieved documents
     # Process and analyze the retrieved documents
+    # All scans of every selected collection, fetched concurrently
+    all_metas = fetch_scan_meta_many(db, {collection: [] for collection in selected_collections}, device_field='DeviceName')
     for collection in selected_collections.keys():
-        docs = db.collection(collection).stream()
+        metas = all_metas[collection]
     
         # Initialize counts
         healthy_count = 0
@@ -560,11 +522,10 @@ if selected_options:
         device_data = defaultdict(lambda: defaultdict(lambda: {'Healthy': 0, 'Infected': 0}))
 
         # Process each document
-        for doc in docs:
-            doc_data = doc.to_dict()
-            inf_stat = doc_data.get('InfStat', 'Unknown')
-            device_name = doc_data.get('DeviceName')
-            timestamp = doc_data.get('timestamp', None)
+        for meta in metas:
+            inf_stat = meta.inf_stat
+            device_name = meta.device_name
+            timestamp = meta.timestamp
         
             if not timestamp or not device_name:
                 continue
@@ -4,14 +4,12 @@ import numpy as np
 import matplotlib.pyplot as plt
 from io import BytesIO
 from scipy.stats import skew, kurtosis 
-from google.cloud import firestore
+from firestore_client import get_client
 from google.cloud.firestore import FieldFilter
 from datetime import datetime, timedelta
-import time
 import zipfile
 import os
-import random
-from google.api_core.exceptions import ResourceExhausted, RetryError
+from scan_meta import fetch_scan_meta_many
 from collections import defaultdict
 import matplotlib.dates as mdates
 import plotly.express as px
@@ -22,7 +20,7 @@ import openpyxl
 st.set_page_config(layout="wide")
 st.title("Farm Analytics")
 
-db = firestore.Client.from_service_account_json("WEBB_APP_TREBIRTH/testdata1-20ec5-firebase-adminsdk-an9r6-a87cacba1d.json")
+db = get_client("WEBB_APP_TREBIRTH/testdata1-20ec5-firebase-adminsdk-an9r6-a87cacba1d.json")
 
 # Mapping collections to farmer images
 farmer_images = {
@@ -129,20 +127,25 @@ selected_collections = st.multiselect('Select collections', dropdown_options)
 # Dates dropdown based on selected collections
 dates_dropdown_options = []
 selected_collections_dict = {collection: [] for collection in collection_file_paths.keys()}
+# Firestore collection ids of the selected options
+selected_collection_ids = []
 
 for option in selected_collections:
     if option == 'Dananjay Yadav':
         selected_collections_dict['demo_db'] = [None]
+        selected_collection_ids.append('demo_db')
     else:
         collection = [key for key, value in farmer_names.items() if value == option.split(' - ')[0]][0]
         selected_collections_dict[collection] = []
+        selected_collection_ids.append(collection)
 
 # Retrieve unique dates for the selected collections
 all_dates = set()
 for collection, dates in selected_collections_dict.items():
     if collection == 'demo_db':
-        # Process Firestore data
-        docs = db.collection(collection).stream()
+        # Firestore scans are counted further down from their metadata (see fetch_scan_meta_many); the
+        # documents themselves were never used here, so they are not downloaded any more
+        docs = []
     else:
         docs = []
         for date in dates:
@@ -189,8 +192,9 @@ device_data = defaultdict(lambda: defaultdict(lambda: {'Healthy': 0, 'Infected':
 # Example data retrieval logic (Firestore and Excel processing)
 for collection, dates in selected_collections_dict.items():
     if collection == 'demo_db':
-        # Process Firestore data
-        docs = db.collection(collection).stream()
+        # Firestore scans are counted further down from their metadata (see fetch_scan_meta_many); the
+        # documents themselves were never used here, so they are not downloaded any more
+        docs = []
     else:
         docs = []
         for date in dates:
@@ -341,8 +345,10 @@ if device_data:
     """, unsafe_allow_html=True)
     # Process and analyze the retrieved documents
     # Process and analyze the retrieved documents
-    for collection in selected_collections.keys():
-        docs = db.collection(collection).stream()
+    # All scans of every selected collection, fetched concurrently
+    all_metas = fetch_scan_meta_many(db, {collection: [] for collection in selected_collection_ids}, device_field='DeviceName:')
+    for collection in selected_collection_ids:
+        metas = all_metas[collection]
     
         # Initialize counts
         healthy_count = 0
@@ -353,11 +359,10 @@ if device_data:
         device_data = defaultdict(lambda: defaultdict(lambda: {'Healthy': 0, 'Infected': 0}))
 
         # Process each document
-        for doc in docs:
-            doc_data = doc.to_dict()
-            inf_stat = doc_data.get('InfStat', 'Unknown')
-            device_name = doc_data.get('DeviceName')
-            timestamp = doc_data.get('timestamp', None)
+        for meta in metas:
+            inf_stat = meta.inf_stat
+            device_name = meta.device_name
+            timestamp = meta.timestamp
         
             if not timestamp or not device_name:
                 continue
@@ -1,44 +1,17 @@
 import streamlit as st
 from google.cloud import firestore
+from paged_reader import get_firestore_data
 import pandas as pd
 from google.cloud.firestore import FieldFilter
 from io import BytesIO
 import matplotlib.pyplot as plt
 from datetime import datetime, timedelta
 import numpy as np
-import time
 import zipfile
 import os
-import random
-from google.api_core.exceptions import ResourceExhausted, RetryError
 from collections import defaultdict
 import matplotlib.dates as mdates
 
-def exponential_backoff(retries):
-    base_delay = 1
-    max_delay = 60
-    delay = base_delay * (2 ** retries) + random.uniform(0, 1)
-    return min(delay, max_delay)
-
-def get_firestore_data(query):
-    retries = 0
-    max_retries = 10
-    while retries < max_retries:
-        try:
-            results = query.stream()
-            return list(results)
-        except ResourceExhausted as e:
-            st.warning(f"Quota exceeded, retrying... (attempt {retries + 1})")
-            time.sleep(exponential_backoff(retries))
-            retries += 1
-        except RetryError as e:
-            st.warning(f"Retry error: {e}, retrying... (attempt {retries + 1})")
-            time.sleep(exponential_backoff(retries))
-            retries += 1
-        except Exception as e:
-            st.error(f"An error occurred: {e}")
-            break
-    raise Exception("Max retries exceeded")
 
 # Initialize Firestore client
 db = firestore.Client.from_service_account_json("WEBB_APP_TREBIRTH/testdata1-20ec5-firebase-adminsdk-an9r6-a87cacba1d.json")
@@ -102,7 +75,7 @@ if selected_options:
     # Fetch data and plot pie charts
     for i, (collection, dates) in enumerate(selected_collections.items()):
         if "No Dates" in dates or not dates[0]:
-            docs = db.collection(collection).stream()
+            docs = get_firestore_data(db.collection(collection))
             st.write(f"**{collection} Collection (All Data)**")
         else:
             docs = []
@@ -110,10 +83,9 @@ if selected_options:
                 date_obj = datetime.strptime(date_str, '%Y-%m-%d')
                 start_datetime = datetime.combine(date_obj, datetime.min.time())
                 end_datetime = datetime.combine(date_obj, datetime.max.time())
-                docs.extend(db.collection(collection)
+                docs.extend(get_firestore_data(db.collection(collection)
                             .where('timestamp', '>=', start_datetime)
-                            .where('timestamp', '<=', end_datetime)
-                            .stream())
+                            .where('timestamp', '<=', end_datetime)))
 
         # Process and analyze the retrieved documents
         healthy_count = sum(1 for doc in docs if doc.to_dict().get('InfStat') == 'Healthy')
@@ -180,7 +152,7 @@ if selected_options:
     if total_infected > 0:
         sorted_collections = sorted(collection_scan_counts.items(), key=lambda item: item[1], reverse=True)
         collections = [item[0] for item in sorted_collections]
-        infected_counts = [sum(1 for doc in db.collection(collection).stream() if doc.to_dict().get('InfStat') == 'Infected') for collection in collections]
+        infected_counts = [sum(1 for doc in get_firestore_data(db.collection(collection)) if doc.to_dict().get('InfStat') == 'Infected') for collection in collections]
 
         with col3:
             fig, ax = plt.subplots(figsize=(3, 3))  # Small plot size
@@ -201,10 +173,9 @@ if selected_options:
             end_datetime = datetime.combine(date_obj, datetime.max.time())
 
             try:
-                docs = db.collection(collection) \
-                         .where('timestamp', '>=', start_datetime) \
-                         .where('timestamp', '<=', end_datetime) \
-                         .stream()
+                docs = get_firestore_data(db.collection(collection)
+                                          .where('timestamp', '>=', start_datetime)
+                                          .where('timestamp', '<=', end_datetime))
                 for doc in docs:
                     try:
                         doc_data = doc.to_dict()
@@ -0,0 +1,146 @@
+# One Firestore client per credential and server process.
+#
+# The pages built a new firestore.Client at the top of the script, so every rerun (every widget change) read the
+# key again, authenticated again and opened new gRPC channels. get_client() builds the client once per
+# service account key, and every later rerun and session of the server process gets the same client back with
+# its open channel. A new client is warmed up on a background thread with one small read, so the TLS and auth
+# handshake is done before the page's first real query. probe() measures the round trip for health checks.
+#
+#   db = get_client("WEBB_APP_TREBIRTH/testdata1-20ec5-firebase-adminsdk-an9r6-a87cacba1d.json")
+#   db = get_client(info=creds)                     # a service account dict, e.g. from st.secrets
+#   probe(db)                                       # {'ok': True, 'latency_ms': 41.7, 'error': None}
+#   client_scope(db)                                # ('testdata1-20ec5', '(default)'), to key per database caches
+#
+# get_async_client() / async_client_for() do the same for firestore.AsyncClient. Its gRPC channel belongs to the
+# event loop it is first used on, so the async clients are only used through run_async(), which runs the
+# coroutine on one process wide event loop thread.
+#
+#   metas = run_async(fetch_scan_meta_async(async_client_for(db), selections))
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+
+from google.cloud import firestore
+from google.cloud.firestore_v1.base_client import DEFAULT_DATABASE
+from google.oauth2 import service_account
+
+# The probe reads this (normally missing) document: one small read that needs the channel and the credentials
+PROBE_COLLECTION = '_health'
+PROBE_DOCUMENT = 'probe'
+PROBE_TIMEOUT = 10
+
+_clients = {}
+_clients_lock = threading.Lock()
+_last_probe = {}
+# (key_path, info, database) of every client get_client() built, by id(client)
+_sources = {}
+_async_clients = {}
+_loop = None
+_loop_lock = threading.Lock()
+
+
+def _key(key_path, info):
+    if info is not None:
+        return 'info', hashlib.sha256(json.dumps(dict(info), sort_keys=True).encode()).hexdigest()
+    return 'json', os.path.abspath(key_path)
+
+
+def get_client(key_path=None, info=None, warm_up=True, database=None):
+    """The process wide client for a service account key file (key_path) or key dict (info) and a database
+    (None for the project's default one)."""
+    if (key_path is None) == (info is None):
+        raise ValueError("Pass either key_path or info")
+    database = database or DEFAULT_DATABASE
+    key = _key(key_path, info) + (database,)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            if info is not None:
+                client = firestore.Client.from_service_account_info(dict(info), database=database)
+            else:
+                client = firestore.Client.from_service_account_json(key_path, database=database)
+            _clients[key] = client
+            _sources[id(client)] = (key_path, info, database)
+            if warm_up:
+                threading.Thread(target=probe, args=(client,), daemon=True).start()
+    return client
+
+
+def probe(client, timeout=PROBE_TIMEOUT):
+    """Time one document read: {'ok': bool, 'latency_ms': float, 'error': str or None}."""
+    start = time.perf_counter()
+    try:
+        client.collection(PROBE_COLLECTION).document(PROBE_DOCUMENT).get(timeout=timeout)
+        result = {'ok': True, 'error': None}
+    except Exception as e:
+        result = {'ok': False, 'error': f'{type(e).__name__}: {e}'}
+    result['latency_ms'] = (time.perf_counter() - start) * 1000
+    _last_probe[id(client)] = result
+    return result
+
+
+def get_async_client(key_path=None, info=None, database=None):
+    """The process wide AsyncClient for a service account key and database, like get_client(). Only use it
+    in coroutines given to run_async()."""
+    if (key_path is None) == (info is None):
+        raise ValueError("Pass either key_path or info")
+    database = database or DEFAULT_DATABASE
+    key = _key(key_path, info) + (database,)
+    with _clients_lock:
+        client = _async_clients.get(key)
+        if client is None:
+            if info is not None:
+                credentials = service_account.Credentials.from_service_account_info(dict(info))
+            else:
+                credentials = service_account.Credentials.from_service_account_file(key_path)
+            client = firestore.AsyncClient(project=credentials.project_id, credentials=credentials, database=database)
+            _async_clients[key] = client
+    return client
+
+
+def async_client_for(client):
+    """The get_async_client() client for the key and database of a get_client() client."""
+    source = _sources.get(id(client))
+    if source is None:
+        raise ValueError("Not a client from get_client()")
+    key_path, info, database = source
+    return get_async_client(key_path, info, database)
+
+
+def _event_loop():
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name='firestore-async', daemon=True).start()
+        return _loop
+
+
+def run_async(coroutine):
+    """Run coroutine on the event loop of the async clients and wait for its result."""
+    return asyncio.run_coroutine_threadsafe(coroutine, _event_loop()).result()
+
+
+def client_scope(client):
+    """(project, database) client reads from; caches of Firestore data are kept per scope."""
+    source = _sources.get(id(client))
+    return client.project, source[2] if source is not None else DEFAULT_DATABASE
+
+
+def last_probe(client):
+    """Result of the latest probe() of client (the warm-up one included), None if there was none yet."""
+    return _last_probe.get(id(client))
+
+
+def clear_clients():
+    with _clients_lock:
+        for client in _clients.values():
+            client.close()
+        _clients.clear()
+        _last_probe.clear()
+        _sources.clear()
+        _async_clients.clear()
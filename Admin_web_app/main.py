@@ -2,13 +2,14 @@ import streamlit as st
 import numpy as np
 import google.cloud
 from firebase_admin import firestore
+from firestore_client import get_client
 import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
 import pydeck as pdk
 import calendar
 from PIL import Image
-from google.cloud.firestore import FieldFilter
+from tree_summary import get_tree_summary
 import datetime
 import json
 
@@ -18,7 +19,7 @@ st.set_page_config(layout="wide")
 
 
 # Authenticate to Firestore with the JSON account key.
-db = firestore.Client.from_service_account_json("WEBB_APP_TREBIRTH/testdata1-20ec5-firebase-adminsdk-an9r6-a87cacba1d.json")
+db = get_client("WEBB_APP_TREBIRTH/testdata1-20ec5-firebase-adminsdk-an9r6-a87cacba1d.json")
 #key_dict = json.loads(st.secrets["textkey"])
 #creds = service_account.Credentials.from_service_account_info(key_dict)
 #db = firestore.Client(credentials=creds, project="TestData1")
@@ -27,38 +28,20 @@ db = firestore.Client.from_service_account_json("WEBB_APP_TREBIRTH/testdata1-20e
 #docs_ref = db.collection("DevMode").stream()
 i=1 
 df = pd.DataFrame()
-TreeNos_list = []
 #for doc in docs_ref:
     #TreeNos_list.append(doc.to_dict()['TreeNo'])
    # timestamp = doc.to_dict()['timestamp']
 
-query = db.collection('Mr.Arjun').where(filter=FieldFilter("RowNo", "==", 1)).get()
-
-for doc in query: 
-    TreeNos_list.append(doc.to_dict()['TreeNo'])
-    timestamp = doc.to_dict()['timestamp']
-
-
+# One projected query for the whole row instead of one count() per tree, cached for a minute
+summary = get_tree_summary(db, 'Mr.Arjun', row=1)
+timestamp = summary.last_timestamp
 #date = docs_ref[0].to_dict()['timestamp']
 #year,month,day = timestamp.year,timestamp.month,timestamp.day
-Total_trees = np.max(np.array(TreeNos_list)); 
 #st.write(timestamp.weekday());
-field_filter2 = FieldFilter("InfStat", "==", 'Infected');
-
-count = 1;
-no_inf = 0; 
-
-while (count <= Total_trees):
-    query = db.collection('Mr.Arjun').where(filter=FieldFilter("RowNo", "==", 1)).where(filter=FieldFilter("TreeNo", "==", count)).where(filter=field_filter2);
-    count_query=query.count().get(); 
-    nb_docs=count_query[0][0].value;
-    count+=1 
-    if nb_docs > 0: 
-        no_inf+=1
-     
-
-Inf_per = (no_inf/Total_trees)*100; 
-no_healthy = Total_trees - no_inf; 
+Total_trees = summary.total_trees
+no_inf = summary.no_inf
+Inf_per = summary.inf_per
+no_healthy = summary.no_healthy
 
 
 #date = datetime.datetime.fromtimestamp(timestamp.seconds)
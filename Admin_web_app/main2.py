@@ -2,6 +2,7 @@ import streamlit as st
 import numpy as np
 import google.cloud
 from firebase_admin import firestore
+from firestore_client import get_client
 import plotly.graph_objects as go
 import pandas as pd
 import pydeck as pdk
@@ -9,40 +10,25 @@ import calendar
 from PIL import Image
 import base64
 from io import BytesIO
-from google.cloud.firestore import FieldFilter
+from tree_summary import get_tree_summary
 import random
 
 
 st.set_page_config(layout="wide")
 
 # Authenticate to Firestore with the JSON account key.
-db = firestore.Client.from_service_account_json("WEBB_APP_TREBIRTH/testdata1-20ec5-firebase-adminsdk-an9r6-a87cacba1d.json")
+db = get_client("WEBB_APP_TREBIRTH/testdata1-20ec5-firebase-adminsdk-an9r6-a87cacba1d.json")
 
 # Define your Firestore query and data extraction logic
 i = 1 
 df = pd.DataFrame()
-TreeNos_list = []
-query = db.collection('Mr.Arjun').where(filter=FieldFilter("RowNo", "==", 1)).get()
-
-for doc in query: 
-    TreeNos_list.append(doc.to_dict()['TreeNo'])
-    timestamp = doc.to_dict()['timestamp']
-
-Total_trees = np.max(np.array(TreeNos_list))
-field_filter2 = FieldFilter("InfStat", "==", 'Infected')
-
-count = 1
-no_inf = 0
-while (count <= Total_trees):
-    query = db.collection('Mr.Arjun').where(filter=FieldFilter("RowNo", "==", 1)).where(filter=FieldFilter("TreeNo", "==", count)).where(filter=field_filter2)
-    count_query = query.count().get()
-    nb_docs = count_query[0][0].value
-    count += 1
-    if nb_docs > 0: 
-        no_inf += 1
-
-Inf_per = (no_inf / Total_trees) * 100
-no_healthy = Total_trees - no_inf
+# One projected query for the whole row instead of one count() per tree, cached for a minute
+summary = get_tree_summary(db, 'Mr.Arjun', row=1)
+timestamp = summary.last_timestamp
+Total_trees = summary.total_trees
+no_inf = summary.no_inf
+Inf_per = summary.inf_per
+no_healthy = summary.no_healthy
 
 # Sidebar customization
 image = Image.open('Admin_web_app/Farmer face in a circle.png')
@@ -0,0 +1,132 @@
+# Healthy / Infected tallies from Firestore aggregation queries.
+#
+# The pages used to stream a whole collection once per status just to count its scans. A count() aggregation
+# is answered by the server, which sends back a single number per (collection, InfStat, date range, device).
+# The counts of one page view run concurrently on a thread pool. Results are kept for TTL seconds, and the
+# cache is shared by every Streamlit session of the server process, so reruns and other users reuse them.
+#
+#   table = get_scan_counter(db).status_table(['demo_db', 'collection_1'])
+#   #    Collection   InfStat  Start   End  Device  Count
+#   # 0  demo_db      Healthy  None   None    None     12
+#   # 1  demo_db      Infected None   None    None      3
+#   # ...
+#   infected = table[table['InfStat'] == 'Infected'].set_index('Collection')['Count']
+
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+from google.cloud.firestore import FieldFilter
+from google.cloud.firestore_v1.field_path import FieldPath
+
+from firestore_client import client_scope
+from scan_meta import DEVICE_FIELD, STATUS_FIELD, TIMESTAMP_FIELD
+
+STATUSES = ('Healthy', 'Infected')
+# Seconds a count is reused before Firestore is asked again
+COUNT_TTL = 60
+MAX_WORKERS = 8
+
+# One aggregation query; None means "any" for every field but collection
+CountKey = namedtuple('CountKey', ['collection', 'inf_stat', 'start', 'end', 'device'])
+CountKey.__new__.__defaults__ = (None, None, None, None)
+
+COLUMNS = ['Collection', 'InfStat', 'Start', 'End', 'Device', 'Count']
+
+_counters = {}
+_counters_lock = threading.Lock()
+
+
+def count_query(db, key, device_field=DEVICE_FIELD):
+    query = db.collection(key.collection)
+    if key.inf_stat is not None:
+        query = query.where(filter=FieldFilter(STATUS_FIELD, '==', key.inf_stat))
+    if key.device is not None:
+        # Field paths with characters like ':' have to be quoted (see scan_meta.meta_query)
+        query = query.where(filter=FieldFilter(FieldPath(device_field).to_api_repr(), '==', key.device))
+    if key.start is not None:
+        query = query.where(filter=FieldFilter(TIMESTAMP_FIELD, '>=', key.start))
+    if key.end is not None:
+        query = query.where(filter=FieldFilter(TIMESTAMP_FIELD, '<=', key.end))
+    return query.count(alias='count')
+
+
+def run_count(db, key, device_field=DEVICE_FIELD):
+    # get() returns one list of AggregationResult per result set; a count query has exactly one
+    results = count_query(db, key, device_field).get()
+    return int(results[0][0].value)
+
+
+class ScanCounter:
+    def __init__(self, db, ttl=COUNT_TTL, max_workers=MAX_WORKERS, device_field=DEVICE_FIELD):
+        self.db = db
+        self.ttl = ttl
+        self.max_workers = max_workers
+        self.device_field = device_field
+        self._lock = threading.Lock()
+        self._cache = {}
+
+    def _cached(self, key, now):
+        entry = self._cache.get(key)
+        if entry is not None and now - entry[1] < self.ttl:
+            return entry[0]
+        return None
+
+    def counts(self, keys):
+        """{CountKey: count} for the given keys. Expired or missing counts are fetched concurrently."""
+        keys = list(dict.fromkeys(keys))
+        now = time.monotonic()
+        with self._lock:
+            found = {key: self._cached(key, now) for key in keys}
+        missing = [key for key, count in found.items() if count is None]
+
+        if len(missing) == 1 or self.max_workers <= 1:
+            fetched = [run_count(self.db, key, self.device_field) for key in missing]
+        elif missing:
+            with ThreadPoolExecutor(min(self.max_workers, len(missing))) as executor:
+                fetched = list(executor.map(lambda key: run_count(self.db, key, self.device_field), missing))
+        else:
+            fetched = []
+
+        now = time.monotonic()
+        with self._lock:
+            for key, count in zip(missing, fetched):
+                self._cache[key] = (count, now)
+                found[key] = count
+        return found
+
+    def table(self, keys):
+        """Tidy table of counts, one row per key in the given order, with the columns of COLUMNS."""
+        keys = list(keys)
+        counts = self.counts(keys)
+        rows = [(key.collection, key.inf_stat, key.start, key.end, key.device, counts[key]) for key in keys]
+        return pd.DataFrame(rows, columns=COLUMNS)
+
+    def status_table(self, collections, statuses=STATUSES, start=None, end=None, devices=(None,)):
+        """Counts of every (collection, status, device) combination between start and end."""
+        return self.table(CountKey(collection, inf_stat, start, end, device)
+                          for collection in collections for inf_stat in statuses for device in devices)
+
+    def invalidate(self, collection=None):
+        with self._lock:
+            if collection is None:
+                self._cache.clear()
+            else:
+                self._cache = {key: entry for key, entry in self._cache.items() if key.collection != collection}
+
+
+def status_pivot(table, index='Collection'):
+    """Counts table -> one row per `index` value, one column per status (missing combinations are 0)."""
+    pivot = table.pivot_table(index=index, columns='InfStat', values='Count', aggfunc='sum', fill_value=0, sort=False)
+    return pivot.reindex(columns=list(STATUSES), fill_value=0)
+
+
+def get_scan_counter(db, device_field=DEVICE_FIELD):
+    # One counter per Firestore database, device field and server process, shared by all sessions
+    with _counters_lock:
+        key = (client_scope(db), device_field)
+        if key not in _counters:
+            _counters[key] = ScanCounter(db, device_field=device_field)
+        return _counters[key]
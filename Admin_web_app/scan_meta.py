@@ -0,0 +1,130 @@
+# Metadata-only reads for the dashboard pages.
+#
+# The Farm Analytics pages only look at InfStat, the device name and the timestamp of each scan, but a plain
+# collection(...).stream() downloads the whole document with its thousands of raw samples. The queries here
+# project the documents down to those fields (Query.select), and each result is a small slotted ScanMeta.
+#
+#   metas = fetch_scan_meta(db, 'demo_db', device_field='DeviceName:')
+#   counts = status_counts(metas)          # {'Healthy': 12, 'Infected': 3}
+
+import asyncio
+from datetime import datetime
+
+from google.cloud.firestore import FieldFilter
+from google.cloud.firestore_v1.field_path import FieldPath
+
+from firestore_client import async_client_for, run_async
+from paged_reader import iter_pages
+
+STATUS_FIELD = 'InfStat'
+TIMESTAMP_FIELD = 'timestamp'
+# Some collections store the device as 'DeviceName', others as 'DeviceName:'
+DEVICE_FIELD = 'DeviceName'
+# Queries fetch_scan_meta_many() keeps in flight at once
+MAX_CONCURRENT_QUERIES = 16
+
+
+class ScanMeta:
+    __slots__ = ('id', 'inf_stat', 'device_name', 'timestamp')
+
+    def __init__(self, id, inf_stat=None, device_name=None, timestamp=None):
+        self.id = id
+        self.inf_stat = inf_stat
+        self.device_name = device_name
+        self.timestamp = timestamp
+
+    @classmethod
+    def from_snapshot(cls, doc, device_field=DEVICE_FIELD):
+        data = doc.to_dict() or {}
+        return cls(doc.id, data.get(STATUS_FIELD), data.get(device_field), data.get(TIMESTAMP_FIELD))
+
+    @property
+    def date_key(self):
+        return self.timestamp.strftime('%Y-%m-%d') if self.timestamp else None
+
+    def __repr__(self):
+        return f'ScanMeta({self.id!r}, {self.inf_stat!r}, {self.device_name!r}, {self.timestamp!r})'
+
+
+def meta_query(db, collection, start=None, end=None, device_field=DEVICE_FIELD):
+    """Query for the InfStat / device / timestamp fields of a collection, optionally between two datetimes."""
+    query = db.collection(collection)
+    if start is not None:
+        query = query.where(filter=FieldFilter(TIMESTAMP_FIELD, '>=', start))
+    if end is not None:
+        query = query.where(filter=FieldFilter(TIMESTAMP_FIELD, '<=', end))
+    # Field paths with characters like ':' have to be quoted
+    return query.select([STATUS_FIELD, TIMESTAMP_FIELD, FieldPath(device_field).to_api_repr()])
+
+
+def fetch_scan_meta(db, collection, start=None, end=None, device_field=DEVICE_FIELD):
+    return [ScanMeta.from_snapshot(doc, device_field)
+            for page in iter_pages(meta_query(db, collection, start, end, device_field)) for doc in page]
+
+
+def date_ranges(dates):
+    """(start, end) datetimes of the given days ('%Y-%m-%d' strings); one open range when dates is empty or
+    holds None / "No Dates"."""
+    if not dates or any(date_str in (None, 'No Dates') for date_str in dates):
+        return [(None, None)]
+    ranges = []
+    for date_str in dates:
+        date_obj = datetime.strptime(date_str, '%Y-%m-%d')
+        ranges.append((datetime.combine(date_obj, datetime.min.time()), datetime.combine(date_obj, datetime.max.time())))
+    return ranges
+
+
+def fetch_scan_meta_for_dates(db, collection, dates, device_field=DEVICE_FIELD):
+    """ScanMeta of the given days ('%Y-%m-%d' strings); all scans when dates is empty or holds None / "No Dates"."""
+    metas = []
+    for start, end in date_ranges(dates):
+        metas.extend(fetch_scan_meta(db, collection, start, end, device_field))
+    return metas
+
+
+# --- concurrent fetching -------------------------------------------------------------------------------------
+#
+# A page with eight farmers and a few dates each used to run dozens of these queries one after another.
+# fetch_scan_meta_many() starts all (collection, date range) queries at once on a Firestore AsyncClient
+# (at most MAX_CONCURRENT_QUERIES in flight), so the wall time is about that of the slowest query. The
+# AsyncClient is the process wide one of firestore_client.py for the page's key, kept with its channel open.
+
+
+async def _fetch_range(client, semaphore, collection, start, end, device_field):
+    async with semaphore:
+        return [ScanMeta.from_snapshot(doc, device_field)
+                async for doc in meta_query(client, collection, start, end, device_field).stream()]
+
+
+async def fetch_scan_meta_async(client, selections, device_field=DEVICE_FIELD, max_concurrency=MAX_CONCURRENT_QUERIES):
+    """{collection: [ScanMeta]} for {collection: dates} (see fetch_scan_meta_for_dates), using an AsyncClient.
+
+    Every collection keeps the order fetch_scan_meta_for_dates() would give: its date ranges in the given order,
+    the scans of each range in document order.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    jobs = [(collection, i, start, end) for collection, dates in selections.items()
+            for i, (start, end) in enumerate(date_ranges(dates))]
+    slots = {collection: [None] * len(date_ranges(dates)) for collection, dates in selections.items()}
+
+    async def run(collection, i, start, end):
+        return collection, i, await _fetch_range(client, semaphore, collection, start, end, device_field)
+
+    # Results go into their slot as they arrive
+    for finished in asyncio.as_completed([run(*job) for job in jobs]):
+        collection, i, metas = await finished
+        slots[collection][i] = metas
+    return {collection: [meta for metas in parts for meta in metas] for collection, parts in slots.items()}
+
+
+def fetch_scan_meta_many(db, selections, device_field=DEVICE_FIELD, max_concurrency=MAX_CONCURRENT_QUERIES):
+    """Blocking version of fetch_scan_meta_async() for the Streamlit pages, taking the page's get_client() client."""
+    return run_async(fetch_scan_meta_async(async_client_for(db), selections, device_field, max_concurrency))
+
+
+def status_counts(metas):
+    counts = {'Healthy': 0, 'Infected': 0}
+    for meta in metas:
+        if meta.inf_stat in counts:
+            counts[meta.inf_stat] += 1
+    return counts
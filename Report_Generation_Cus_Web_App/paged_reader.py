@@ -0,0 +1,245 @@
+# Paginated, resumable reading of the scan collections, shared by all pages.
+#
+# query.stream() followed by list(...) keeps every document of the result, raw arrays included as Python lists
+# of floats, in memory before anything is done with it. iter_pages() reads the query page_size documents at a
+# time with start_after cursors. If Firestore answers ResourceExhausted (or another transient error), it waits
+# and continues after the last document it got instead of running the whole query again.
+#
+# Retries follow a RetryPolicy: exponential backoff with jitter, a cap on consecutive retries and a total time
+# budget per query, after which RetryBudgetExceeded is raised instead of sleeping on. Reads also take tokens
+# from a process wide TokenBucket (READ_RATE documents per second, set with TREBIRTH_READ_RATE), so many
+# sessions reading at once slow down a little instead of tripping the quota together. Every query's attempts,
+# pages, documents and time spent in backoff / throttling are recorded in a QueryMetrics (see recent_metrics()).
+#
+# iter_scan_batches() decodes every page into a ScanBatch: the sensor arrays as float numpy arrays and the
+# remaining fields as metadata dicts. get_firestore_data() is the drop-in for the pages' old helper of that name
+# and returns the snapshots as a list.
+#
+#   for batch in iter_scan_batches(db.collection('DevOps').where(filter=FieldFilter('RowNo', '==', 3))):
+#       batch.arrays['RadarRaw']    # list of numpy arrays, one per scan
+#       batch.meta                  # list of dicts with the other fields
+
+import os
+import random
+import threading
+import time
+from collections import deque
+
+import numpy as np
+from google.api_core.exceptions import DeadlineExceeded, ResourceExhausted, RetryError, ServiceUnavailable
+
+ARRAY_FIELDS = ('RadarRaw', 'ADXLRaw', 'Ax', 'Ay', 'Az')
+PAGE_SIZE = 200
+MAX_RETRIES = 10
+# Seconds a query may take in total, backoff included
+RETRY_BUDGET = 120.0
+# Documents per second all queries of the server process may read together; 0 turns the limiter off
+READ_RATE = float(os.environ.get('TREBIRTH_READ_RATE', 1000))
+# How many QueryMetrics recent_metrics() keeps
+RECENT_METRICS = 100
+
+RETRYABLE = (ResourceExhausted, RetryError, ServiceUnavailable, DeadlineExceeded)
+
+
+class RetryBudgetExceeded(Exception):
+    pass
+
+
+class RetryPolicy:
+    def __init__(self, max_retries=MAX_RETRIES, budget=RETRY_BUDGET, base_delay=1.0, max_delay=60.0):
+        self.max_retries = max_retries
+        self.budget = budget
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, retries):
+        # Exponential backoff with jitter, like the pages' exponential_backoff()
+        return min(self.base_delay * (2 ** retries) + random.uniform(0, 1), self.max_delay)
+
+
+DEFAULT_POLICY = RetryPolicy()
+
+
+class TokenBucket:
+    """Thread safe token bucket: acquire(n) blocks until n tokens are available and returns the seconds waited.
+
+    Tokens may be borrowed ahead, so a request larger than the capacity waits for the refill instead of failing,
+    and callers queue up in the order they asked.
+    """
+
+    def __init__(self, rate, capacity=None):
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else rate)
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, n=1):
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= n
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+        return wait
+
+
+read_limiter = TokenBucket(READ_RATE)
+
+
+class QueryMetrics:
+    __slots__ = ('label', 'attempts', 'retries', 'pages', 'documents', 'backoff_seconds', 'throttle_seconds',
+                 'elapsed', 'error')
+
+    def __init__(self, label=''):
+        self.label = label
+        self.attempts = 0
+        self.retries = 0
+        self.pages = 0
+        self.documents = 0
+        self.backoff_seconds = 0.0
+        self.throttle_seconds = 0.0
+        self.elapsed = 0.0
+        self.error = None
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self):
+        return f'QueryMetrics({self.as_dict()})'
+
+
+_recent = deque(maxlen=RECENT_METRICS)
+
+
+def recent_metrics():
+    """as_dict() of the last RECENT_METRICS finished queries, oldest first."""
+    return [metrics.as_dict() for metrics in list(_recent)]
+
+
+def warn_on_page(attempt, error):
+    # The pages' retry messages
+    import streamlit as st
+    if isinstance(error, ResourceExhausted):
+        st.warning(f"Quota exceeded, retrying... (attempt {attempt})")
+    else:
+        st.warning(f"Retry error: {error}, retrying... (attempt {attempt})")
+
+
+def iter_pages(query, page_size=PAGE_SIZE, policy=DEFAULT_POLICY, limiter=read_limiter, metrics=None, on_retry=None):
+    """Yield the documents of query as lists of at most page_size snapshots.
+
+    Transient errors are retried per policy, continuing after the last document received. on_retry(attempt,
+    error) is called before each wait, e.g. warn_on_page to show a warning. A limit() already on the query is
+    respected; limit_to_last() queries are read in one go, with retries but without resuming.
+    """
+    metrics = metrics if metrics is not None else QueryMetrics()
+    start = time.monotonic()
+    total = getattr(query, '_limit', None)
+    pageable = not getattr(query, '_limit_to_last', False)
+    cursor = None
+    retries = 0
+    received = 0
+    try:
+        while True:
+            size = page_size if total is None else min(page_size, total - received)
+            if pageable and size <= 0:
+                return
+            page_query = query
+            if pageable:
+                page_query = query.limit(size)
+                if cursor is not None:
+                    page_query = page_query.start_after(cursor)
+            if limiter is not None:
+                metrics.throttle_seconds += limiter.acquire(size if pageable else total or page_size)
+            metrics.attempts += 1
+            page = []
+            try:
+                for doc in page_query.stream():
+                    page.append(doc)
+            except RETRYABLE as e:
+                if pageable and page:
+                    # Keep what arrived before the error and continue after it
+                    cursor = page[-1]
+                    received += len(page)
+                    metrics.pages += 1
+                    metrics.documents += len(page)
+                    yield page
+                if retries >= policy.max_retries:
+                    raise
+                delay = policy.delay(retries)
+                if time.monotonic() - start + delay > policy.budget:
+                    raise RetryBudgetExceeded(f"Query took longer than {policy.budget:g}s; last error: {e}") from e
+                if on_retry is not None:
+                    on_retry(retries + 1, e)
+                time.sleep(delay)
+                retries += 1
+                metrics.retries += 1
+                metrics.backoff_seconds += delay
+                continue
+            retries = 0
+            if page:
+                cursor = page[-1]
+                received += len(page)
+                metrics.pages += 1
+                metrics.documents += len(page)
+                yield page
+            if not pageable or len(page) < size:
+                return
+    except Exception as e:
+        metrics.error = f'{type(e).__name__}: {e}'
+        raise
+    finally:
+        metrics.elapsed = time.monotonic() - start
+        _recent.append(metrics)
+
+
+def get_firestore_data(query, page_size=PAGE_SIZE, policy=DEFAULT_POLICY, on_retry=warn_on_page, metrics=None):
+    """All documents of query as a list of snapshots, read with iter_pages()."""
+    return [doc for page in iter_pages(query, page_size, policy, metrics=metrics, on_retry=on_retry) for doc in page]
+
+
+def to_array(values):
+    if values is None:
+        return None
+    try:
+        return np.asarray(values, dtype=float)
+    except (TypeError, ValueError):
+        # Mixed / non numeric entries: keep what converts, like pd.to_numeric(errors='coerce')
+        return np.array([v if isinstance(v, (int, float)) else np.nan for v in values], dtype=float)
+
+
+class ScanBatch:
+    """One page of scans. ids and meta have one entry per scan, arrays maps each sensor field to one numpy
+    array per scan (None where the scan does not have the field)."""
+
+    def __init__(self, ids, meta, arrays):
+        self.ids = ids
+        self.meta = meta
+        self.arrays = arrays
+
+    def __len__(self):
+        return len(self.ids)
+
+
+def decode_batch(snapshots, array_fields=ARRAY_FIELDS):
+    ids, meta = [], []
+    arrays = {name: [] for name in array_fields}
+    for doc in snapshots:
+        data = doc.to_dict() or {}
+        ids.append(doc.id)
+        for name in array_fields:
+            arrays[name].append(to_array(data.pop(name, None)))
+        meta.append(data)
+    return ScanBatch(ids, meta, arrays)
+
+
+def iter_scan_batches(query, page_size=PAGE_SIZE, array_fields=ARRAY_FIELDS, policy=DEFAULT_POLICY, on_retry=None,
+                      metrics=None):
+    """Decoded ScanBatch of every page of query (see iter_pages)."""
+    for page in iter_pages(query, page_size, policy, metrics=metrics, on_retry=on_retry):
+        yield decode_batch(page, array_fields)
@@ -1,23 +1,21 @@
 import streamlit as st
-from google.cloud import firestore
+from firestore_client import get_client
+from report_data import company_hierarchy, find_scans, load_fields
 import pandas as pd
 from google.cloud.firestore import FieldFilter
 from io import BytesIO
 import matplotlib.pyplot as plt
 from datetime import datetime, timedelta
 import numpy as np
-import time
 import zipfile
 import os
 import pytz
-import random
 from scipy import signal
 from scipy.stats import skew, kurtosis
 from collections import defaultdict
 import matplotlib.dates as mdates
 import plotly.express as px
 import plotly.graph_objects as go
-from google.api_core.exceptions import ResourceExhausted, RetryError
 from reportlab.lib.pagesizes import A4
 from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -40,9 +38,6 @@ if "authenticated" not in st.session_state or not st.session_state["authenticate
 company_name = st.session_state["company"]
 st.write(f"Welcome, {company_name}!")
 
-# Initialize Firestore
-cred_path = "Report_Generation_Web_App/testdata1-20ec5-firebase-adminsdk-an9r6-d15c118c96.json"
-db = firestore.Client.from_service_account_json(cred_path)
     # Your existing web app code starts here...
 #st.title('Test Analysis Report')
 st.markdown(
@@ -56,34 +51,8 @@ st.markdown(
     unsafe_allow_html=True,
 )
 
-def exponential_backoff(retries):
-    base_delay = 1
-    max_delay = 60
-    delay = base_delay * (2 ** retries) + random.uniform(0, 1)
-    return min(delay, max_delay)
-
-def get_firestore_data(query):
-    retries = 0
-    max_retries = 10
-    while retries < max_retries:
-        try:
-            results = query.stream()
-            return list(results)
-        except ResourceExhausted as e:
-            st.warning(f"Quota exceeded, retrying... (attempt {retries + 1})")
-            time.sleep(exponential_backoff(retries))
-            retries += 1
-        except RetryError as e:
-            st.warning(f"Retry error: {e}, retrying... (attempt {retries + 1})")
-            time.sleep(exponential_backoff(retries))
-            retries += 1
-        except Exception as e:
-            st.error(f"An error occurred: {e}")
-            break
-    raise Exception("Max retries exceeded")
-
-db = firestore.Client.from_service_account_json("WEBB_APP_TREBIRTH/testdata1-20ec5-firebase-adminsdk-an9r6-a87cacba1d.json")
-query = db.collection('homescan2')
+# Firestore client: built once per server process and reused by every rerun (see firestore_client.py)
+db = get_client("WEBB_APP_TREBIRTH/testdata1-20ec5-firebase-adminsdk-an9r6-a87cacba1d.json")
 
 def convert_to_local_time(timestamp, timezone='Asia/Kolkata'):
     local_tz = pytz.timezone(timezone)
@@ -142,37 +111,9 @@ def plot_time_domain(preprocessed_scan, device_name, timestamp, scan_duration, s
 
     # Print additional metadata below the graph
   
-def fetch_data(company_name):
-    docs = query.stream()
-
-    locations = set()
-    city_to_areas = {}  # Dictionary to map cities to their respective areas
-    scans_data = []
-
-    for doc in docs:
-        data = doc.to_dict()
-        company = data.get("CompanyName", "").strip()
-
-        if company == company_name:  # Check if the company matches the logged-in user
-            location = data.get("City", "").strip()
-            if location:
-                locations.add(location)
-
-                Area = data.get("Area", "").strip()
-                if Area:
-                    if location not in city_to_areas:
-                        city_to_areas[location] = set()
-                    city_to_areas[location].add(Area)
-
-            # Convert timestamp to scan_date
-            timestamp_str = data.get("timestamp")
-            scan_date = datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S").strftime('%Y-%m-%d') if timestamp_str else "Unknown Date"
-            data["scan_date"] = scan_date
-            scans_data.append(data)
-
-    return sorted(locations), city_to_areas, scans_data
-
-locations, city_to_areas, scans_data = fetch_data(company_name)
+# City / Area choices of this company only, from a projected query (see report_data.py)
+hierarchy = company_hierarchy(db, company_name)
+locations, city_to_areas = hierarchy.locations, hierarchy.city_to_areas
 
 
 st.title(f"{company_name} Scan Report Viewer")
@@ -188,13 +129,8 @@ selected_Areas = st.multiselect("Select Report Area:", sorted(filtered_areas))
 selected_date =st.date_input("Seelect scan date:")
 selected_date_str = selected_date.strftime("%Y-%m-%d") if selected_date else None
         
-filtered_scans = [
-    scan for scan in scans_data 
-    if (not selected_locations or scan["City"].strip() in selected_locations)
-    and (not selected_Areas or scan["Area"].strip() in selected_Areas)
-    and (not selected_date_str or scan.get("scan_date", "Unknown Date") == selected_date_str)
-    and scan["CompanyName"].strip() == company_name
-]
+# Metadata of the matching scans only; the company, location, area and date filters run in Firestore
+filtered_scans = find_scans(db, company_name, hierarchy, selected_locations, selected_Areas, selected_date_str)
 
 if not filtered_scans:
     st.write("No data found.")
@@ -223,7 +159,10 @@ if st.button("Download Selected Apartment Scans"):
         if scan.get("Apartment", "").strip() in selected_apartments
     ]
     if final_scans:
-        df = pd.DataFrame(final_scans)
+        # Whole documents, RadarRaw included, of the selected scans only
+        documents = load_fields(db, [scan["_id"] for scan in final_scans], fields=None)
+        df = pd.DataFrame([{**documents[scan["_id"]], "scan_date": scan["scan_date"]}
+                           for scan in final_scans if scan["_id"] in documents])
         csv = df.to_csv(index=False).encode('utf-8')
         st.download_button(
             label="Download data as CSV",
@@ -287,11 +226,9 @@ def generate_pdf():
     elements.append(Spacer(1, 20))  # Extra space before table
    
     
-    filtered_scans = [scan for scan in scans_data if 
-        (not selected_locations or scan["City"].strip() in selected_locations) and
-        (not selected_Areas or scan["Area"].strip() in selected_Areas) and
-        scan["CompanyName"].strip() == company_name
-    ]
+    filtered_scans = find_scans(db, company_name, hierarchy, selected_locations, selected_Areas)
+    # RadarRaw of just the scans going into the report
+    radar = load_fields(db, [scan["_id"] for scan in filtered_scans])
     
     if not filtered_scans:
         elements.append(Paragraph("No data found.", body_style))
@@ -340,7 +277,7 @@ def generate_pdf():
                 elements.append(Paragraph(f"{i}.{j} Radar Scan", heading_style_sub))
                 pest_details = scan.get("PestDetails", "N/A")
                 
-                radar_raw = scan.get('RadarRaw', [])
+                radar_raw = radar.get(scan["_id"], {}).get('RadarRaw', [])
                 if radar_raw:
                     processed_scan = preprocess_radar_data(radar_raw)
                     device_name = scan.get('Devicename', 'Unknown Device')
@@ -0,0 +1,151 @@
+# Data access for the company report viewer (pages/ main5.py).
+#
+# The viewer used to stream the whole homescan2 collection, radar arrays included, for every company and then
+# keep the logged in company's scans in Python. Here the predicates go to Firestore instead:
+#   company_hierarchy()   City / Area choices of one company, from a query for the company's documents projected
+#                         onto the company, City and Area fields
+#   find_scans()          metadata of the company's scans in the chosen cities / areas / day, projected onto
+#                         META_FIELDS so RadarRaw is not downloaded
+#   load_fields()         RadarRaw (or whole documents) of just the scans that go into the PDF or the CSV
+# The stored CompanyName / City / Area values are not always trimmed. The company's documents are found with an
+# 'in' filter over the name padded with the stray whitespace seen in the data (company_spellings()), and the
+# hierarchy keeps every stored spelling of a trimmed name, so the queries match the scans the Python filters did.
+#
+# Company + City / Area + timestamp queries need composite indexes; Firestore's error message links to the
+# console page creating the missing one.
+
+import threading
+import time
+
+from google.cloud.firestore import FieldFilter
+
+from firestore_client import client_scope
+from paged_reader import iter_pages
+
+COLLECTION = 'homescan2'
+COMPANY_FIELD = 'CompanyName'
+CITY_FIELD = 'City'
+AREA_FIELD = 'Area'
+TIMESTAMP_FIELD = 'timestamp'
+# Every field of a scan document the viewer shows, except the RadarRaw samples
+META_FIELDS = ('CompanyName', 'City', 'Area', 'Apartment', 'Incharge', 'Room', 'ReportRequestedBy', 'PestDetails',
+               'Devicename', 'SamplingRate', 'HowUsed', 'Battery', 'ScanDuration', 'Positioned', 'Compass',
+               'DamageVisible', 'timestamp')
+# Firestore's limit on the values of one 'in' filter
+MAX_IN_VALUES = 30
+# Seconds a company's City / Area hierarchy is reused
+HIERARCHY_TTL = 300
+# Whitespace stored before / after company names; every combination is one value of the company's 'in' filter
+LEADING_PADDING = ('', ' ', '  ', '\t')
+TRAILING_PADDING = ('', ' ', '  ', '\t', '\n', '\r\n', ' \n')
+
+_hierarchies = {}
+_hierarchies_lock = threading.Lock()
+
+
+class Hierarchy:
+    """locations: sorted trimmed City names. city_to_areas: {city: set of trimmed Area names}.
+    spellings: {(field, trimmed value): set of stored values}."""
+
+    def __init__(self, locations, city_to_areas, spellings):
+        self.locations = locations
+        self.city_to_areas = city_to_areas
+        self.spellings = spellings
+
+    def stored(self, field, values):
+        return sorted(set().union(*(self.spellings.get((field, value), {value}) for value in values)))
+
+
+def company_spellings(company_name):
+    """The stored spellings of company_name the hierarchy query looks for."""
+    return sorted({lead + company_name + trail for lead in LEADING_PADDING for trail in TRAILING_PADDING})
+
+
+def fetch_hierarchy(db, company_name):
+    locations, city_to_areas, spellings = set(), {}, {}
+    query = db.collection(COLLECTION).where(filter=FieldFilter(COMPANY_FIELD, 'in', company_spellings(company_name)))
+    for page in iter_pages(query.select([COMPANY_FIELD, CITY_FIELD, AREA_FIELD])):
+        for doc in page:
+            data = doc.to_dict() or {}
+            if (data.get(COMPANY_FIELD) or '').strip() != company_name:
+                continue
+            spellings.setdefault((COMPANY_FIELD, company_name), set()).add(data[COMPANY_FIELD])
+            city = (data.get(CITY_FIELD) or '').strip()
+            if not city:
+                continue
+            locations.add(city)
+            spellings.setdefault((CITY_FIELD, city), set()).add(data[CITY_FIELD])
+            area = (data.get(AREA_FIELD) or '').strip()
+            if area:
+                city_to_areas.setdefault(city, set()).add(area)
+                spellings.setdefault((AREA_FIELD, area), set()).add(data[AREA_FIELD])
+    return Hierarchy(sorted(locations), city_to_areas, spellings)
+
+
+def company_hierarchy(db, company_name, ttl=HIERARCHY_TTL):
+    key = (client_scope(db), company_name)
+    with _hierarchies_lock:
+        entry = _hierarchies.get(key)
+    if entry is not None and time.monotonic() - entry[1] < ttl:
+        return entry[0]
+    hierarchy = fetch_hierarchy(db, company_name)
+    with _hierarchies_lock:
+        _hierarchies[key] = (hierarchy, time.monotonic())
+    return hierarchy
+
+
+def scan_date(timestamp_str):
+    # Timestamps are stored as '%Y-%m-%d %H:%M:%S' strings
+    return timestamp_str[:10] if timestamp_str else "Unknown Date"
+
+
+def find_scans(db, company_name, hierarchy, cities=(), areas=(), date_str=None):
+    """Metadata dicts (META_FIELDS plus '_id' and 'scan_date') of the company's scans in the given trimmed
+    cities / areas (all when empty) taken on date_str ('%Y-%m-%d', any day when None)."""
+    query = db.collection(COLLECTION)
+    companies = hierarchy.stored(COMPANY_FIELD, [company_name])
+    if len(companies) == 1:
+        query = query.where(filter=FieldFilter(COMPANY_FIELD, '==', companies[0]))
+        # One 'in' filter goes to Firestore: areas if any were picked (they are the narrower one), cities otherwise
+        for field, values in ((AREA_FIELD, areas), (CITY_FIELD, cities)):
+            stored = hierarchy.stored(field, values) if values else []
+            if stored and len(stored) <= MAX_IN_VALUES:
+                query = query.where(filter=FieldFilter(field, 'in', stored))
+                break
+    else:
+        # At most len(company_spellings()) values; the company's 'in' filter is the query's one; cities and areas are checked below
+        query = query.where(filter=FieldFilter(COMPANY_FIELD, 'in', companies))
+    if date_str:
+        # The '%Y-%m-%d %H:%M:%S' strings sort like the times they stand for
+        query = (query.where(filter=FieldFilter(TIMESTAMP_FIELD, '>=', f'{date_str} 00:00:00'))
+                 .where(filter=FieldFilter(TIMESTAMP_FIELD, '<=', f'{date_str} 23:59:59')))
+
+    cities, areas = set(cities), set(areas)
+    scans = []
+    for page in iter_pages(query.select(list(META_FIELDS))):
+        for doc in page:
+            data = doc.to_dict() or {}
+            # The remaining predicates (and the trimming) are checked here
+            if (data.get(COMPANY_FIELD) or '').strip() != company_name:
+                continue
+            if cities and (data.get(CITY_FIELD) or '').strip() not in cities:
+                continue
+            if areas and (data.get(AREA_FIELD) or '').strip() not in areas:
+                continue
+            data['_id'] = doc.id
+            data['scan_date'] = scan_date(data.get(TIMESTAMP_FIELD))
+            scans.append(data)
+    return scans
+
+
+def load_fields(db, scan_ids, fields=('RadarRaw',)):
+    """{scan id: dict of fields} for the given scans; fields=None loads whole documents."""
+    collection = db.collection(COLLECTION)
+    loaded = {}
+    scan_ids = list(dict.fromkeys(scan_ids))
+    for start in range(0, len(scan_ids), 100):
+        refs = [collection.document(scan_id) for scan_id in scan_ids[start:start + 100]]
+        for doc in db.get_all(refs, field_paths=list(fields) if fields is not None else None):
+            if doc.exists:
+                loaded[doc.id] = doc.to_dict() or {}
+    return loaded
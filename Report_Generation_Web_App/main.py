@@ -22,7 +22,7 @@ if label_infstat != 'All':
 
 # Get documents based on the query
 try:
-    query_results = [doc.to_dict() for doc in query.stream()]
+    query_results = [doc.to_dict() for doc in get_firestore_data(query)]
 except Exception as e:
     st.error(f"Failed to retrieve data: {e}")
     st.stop()
@@ -164,6 +164,7 @@ import matplotlib.pyplot as plt
 from io import BytesIO
 from scipy.stats import skew, kurtosis
 from google.cloud import firestore
+from paged_reader import get_firestore_data
 from google.cloud.firestore import FieldFilter
 from datetime import datetime, timedelta
 import pytz
@@ -191,11 +192,10 @@ def convert_to_local_time(timestamp, timezone='Asia/Kolkata'):
     
 # Fetch the most recent scan data from the "demo_db" collection
 def get_recent_scans(db, num_scans=3):
-    docs = (
+    docs = get_firestore_data(
         db.collection('demo_day')
         .order_by('timestamp', direction=firestore.Query.DESCENDING)
         .limit(num_scans)
-        .stream()
     )
     metadata_list = []
     for doc in docs:
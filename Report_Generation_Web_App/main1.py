@@ -1,23 +1,21 @@
 import streamlit as st
 from google.cloud import firestore
+from paged_reader import get_firestore_data
 import pandas as pd
 from google.cloud.firestore import FieldFilter
 from io import BytesIO
 import matplotlib.pyplot as plt
 from datetime import datetime, timedelta
 import numpy as np
-import time
 import zipfile
 import os
 import pytz
-import random
 from scipy import signal
 from scipy.stats import skew, kurtosis
 from collections import defaultdict
 import matplotlib.dates as mdates
 import plotly.express as px
 import plotly.graph_objects as go
-from google.api_core.exceptions import ResourceExhausted, RetryError
 
 
 st.set_page_config(layout="wide")
@@ -33,38 +31,13 @@ st.markdown(
     unsafe_allow_html=True,
 )
 
-def exponential_backoff(retries):
-    base_delay = 1
-    max_delay = 60
-    delay = base_delay * (2 ** retries) + random.uniform(0, 1)
-    return min(delay, max_delay)
-
-def get_firestore_data(query):
-    retries = 0
-    max_retries = 10
-    while retries < max_retries:
-        try:
-            results = query.stream()
-            return list(results)
-        except ResourceExhausted as e:
-            st.warning(f"Quota exceeded, retrying... (attempt {retries + 1})")
-            time.sleep(exponential_backoff(retries))
-            retries += 1
-        except RetryError as e:
-            st.warning(f"Retry error: {e}, retrying... (attempt {retries + 1})")
-            time.sleep(exponential_backoff(retries))
-            retries += 1
-        except Exception as e:
-            st.error(f"An error occurred: {e}")
-            break
-    raise Exception("Max retries exceeded")
 
 db = firestore.Client.from_service_account_json("WEBB_APP_TREBIRTH/testdata1-20ec5-firebase-adminsdk-an9r6-a87cacba1d.json")
 query = db.collection('demo_db') 
 
 def fetch_data():
     collection_ref = query
-    docs = collection_ref.stream()
+    docs = get_firestore_data(collection_ref)
     
     locations = set()
     companies = set()
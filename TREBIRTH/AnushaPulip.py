@@ -9,18 +9,12 @@ from google.cloud import firestore
 from io import BytesIO
 from datetime import datetime
 from scipy.signal import remez, get_window
+from filter_design import remez_design
 
 # Function to apply filter
 def apply_filter(data, filter_type, cutoff_freq, sampling_rate=100, stopband_attenuation=60, steepness=0.9999):
-    if filter_type == 'LPF' or filter_type == 'HPF':
-        numtaps = 2 * int(sampling_rate / cutoff_freq) + 1
-        b = signal.remez(numtaps, [0, cutoff_freq - steepness / 2, cutoff_freq + steepness / 2, sampling_rate / 2], [1, 0], fs=sampling_rate, weight=[1, stopband_attenuation])
-    elif filter_type == 'BPF':
-        numtaps = 2 * int(sampling_rate / min(cutoff_freq)) + 1
-        b = signal.remez(numtaps, [0, cutoff_freq[0] - steepness / 2, cutoff_freq[0] + steepness / 2, cutoff_freq[1] - steepness / 2, cutoff_freq[1] + steepness / 2, sampling_rate / 2], [0, 1, 0], fs=sampling_rate, weight=[stopband_attenuation, 1, stopband_attenuation])
-    
-    window = get_window('hamming', numtaps)
-    b *= window
+    # The windowed remez design is cached per (type, cutoff, fs, attenuation, steepness), see filter_design.py
+    b = remez_design(filter_type, cutoff_freq, sampling_rate, stopband_attenuation, steepness)
     filtered_data = signal.lfilter(b, 1, data)
     return filtered_data
 
@@ -1,105 +1,5 @@
-import pandas as pd
-import numpy as np
+# The coefficients now live in filter_coefs.npy (set "FILTERS", see coef_store.py). This module only keeps
+# `from FILTERS import coefLPF1Hz, ...` working without parsing the float literals on every start.
+from coef_store import load_set
 
-
-
-
-coefLPF1Hz=[0.00010877160624458, 4.58995326753224e-05, 5.52506581805068e-05, 6.55977716582546e-05, 7.69710659237324e-05, 8.93726332177835e-05, 0.00010281783000424, 0.000117290373202586, 0.000132786273193585, 0.000149271203487334, 0.000166718099514122, 0.000185067391607648, 0.000204262084096551, 0.00022420362778304, 0.000244798390324596, 0.000265916230561958, 0.000287433659736095, 0.00030919432078532, 0.000331054489391796, 0.000352823777060829, 0.000374311238316321, 0.000395277014674441, 0.000415492495802553, 0.000434691472360602, 0.000452639675243045, 0.000469056712952941, 0.00048366692426123, 0.000496121220829766, 0.000506108008408858, 0.000513294925157335, 0.000517426138244265, 0.000518136847979996, 0.000515062458467457, 0.000507801453764427, 0.000496206662711197, 0.000479827772856829, 0.000458254162718612, 0.000431402511640835, 0.000398751103791305, 0.000360177655697511, 0.000315323261199569, 0.000264012993512773, 0.000205985314336493, 0.000141100286980363, 6.91770478649591e-05, -9.8644616482369e-06, -9.61217112754059e-05, -0.000189606328980219, -0.000290332278381257, -0.000398216671614147, -0.000513164299690017, -0.000634991514267676, -0.000763496664794519, -0.000898391817708867, -0.00103936577488192, -0.00118600819724815, -0.00133787302943035, -0.00149442963727915, -0.00165512440308312, -0.00181930999638577, -0.00198629774027926, -0.00215530689276874, -0.00232554177932884, -0.00249612832630855, -0.00266615169718488, -0.00283459623128221, -0.00300045849426633, -0.00316266906019473, -0.003320115811286, -0.00347160330374486, -0.00361601619749759, -0.00375208060511117, -0.00387858049263913, -0.0039942763245353, -0.00409788275923637, -0.00418815800218578, -0.00426381981815562, -0.00432362442541615, -0.00436632370800929, -0.00439071691574879, -0.00439561468606026, -0.00437987668716225, -0.00434240130525201, -0.00428214620583514, -0.0041981236747201, -0.00408942371306142, -0.00395520184816756, -0.00379469512705335, -0.00360723084670758, -0.00339224013981661, -0.00314924604377453, -0.00287787480279444, -0.00257786323979358, -0.00224907429549463, -0.00189148964019102, -0.00150521018262824, -0.00109045628936389, -0.000647590783428602, -0.000177106630131041, 0.000320378914282433, 0.000844120706341141, 0.0013932176682471, 0.0019666561933907, 0.00256329901293803, 0.00318187057431809, 0.00382095734450128, 0.00447906811009143, 0.00515454396555921, 0.00584565848438607, 0.00655056048798194, 0.00726729977469119, 0.00799384389938652, 0.00872807421690832, 0.00946780124061525, 0.0102107614427398, 0.0109546473887809, 0.0116970910035885, 0.0124357001263489, 0.0131680558488522, 0.0138917264328339, 0.0146042625124119, 0.0153032355696543, 0.015986233701339, 0.0166508776670651, 0.0172948190320118, 0.0179157704650569, 0.0185115040879977, 0.0190798715319268, 0.0196187979962576, 0.0201263103053419, 0.0206005389744845, 0.0210397322976936, 0.0214422456095449, 0.0218065761307584, 0.0221313598790736, 0.0224153757200942, 0.0226575387389574, 0.0228569418979688, 0.0230128245233629, 0.0231245971184999, 0.0231918285040598, 0.0232142752117006, 0.0231918285040598, 0.0231245971184999, 0.0230128245233629, 0.0228569418979688, 0.0226575387389574, 0.0224153757200942, 0.0221313598790736, 0.0218065761307584, 0.0214422456095449, 0.0210397322976936, 0.0206005389744845, 0.0201263103053419, 0.0196187979962576, 0.0190798715319268, 0.0185115040879977, 0.0179157704650569, 0.0172948190320118, 0.0166508776670651, 0.015986233701339, 0.0153032355696543, 0.0146042625124119, 0.0138917264328339, 0.0131680558488522, 0.0124357001263489, 0.0116970910035885, 0.0109546473887809, 0.0102107614427398, 0.00946780124061525, 0.00872807421690832, 0.00799384389938652, 0.00726729977469119, 0.00655056048798194, 0.00584565848438607, 0.00515454396555921, 0.00447906811009143, 0.00382095734450128, 0.00318187057431809, 0.00256329901293803, 0.0019666561933907, 0.0013932176682471, 0.000844120706341141, 0.000320378914282433, -0.000177106630131041, -0.000647590783428602, -0.00109045628936389, -0.00150521018262824, -0.00189148964019102, -0.00224907429549463, -0.00257786323979358, -0.00287787480279444, -0.00314924604377453, -0.00339224013981661, -0.00360723084670758, -0.00379469512705335, -0.00395520184816756, -0.00408942371306142, -0.0041981236747201, -0.00428214620583514, -0.00434240130525201, -0.00437987668716225, -0.00439561468606026, -0.00439071691574879, -0.00436632370800929, -0.00432362442541615, -0.00426381981815562, -0.00418815800218578, -0.00409788275923637, -0.0039942763245353, -0.00387858049263913, -0.00375208060511117, -0.00361601619749759, -0.00347160330374486, -0.003320115811286, -0.00316266906019473, -0.00300045849426633, -0.00283459623128221, -0.00266615169718488, -0.00249612832630855, -0.00232554177932884, -0.00215530689276874, -0.00198629774027926, -0.00181930999638577, -0.00165512440308312, -0.00149442963727915, -0.00133787302943035, -0.00118600819724815, -0.00103936577488192, -0.000898391817708867, -0.000763496664794519, -0.000634991514267676, -0.000513164299690017, -0.000398216671614147, -0.000290332278381257, -0.000189606328980219, -9.61217112754059e-05, -9.8644616482369e-06, 6.91770478649591e-05, 0.000141100286980363, 0.000205985314336493, 0.000264012993512773, 0.000315323261199569, 0.000360177655697511, 0.000398751103791305, 0.000431402511640835, 0.000458254162718612, 0.000479827772856829, 0.000496206662711197, 0.000507801453764427, 0.000515062458467457, 0.000518136847979996, 0.000517426138244265, 0.000513294925157335, 0.000506108008408858, 0.000496121220829766, 0.00048366692426123, 0.000469056712952941, 0.000452639675243045, 0.000434691472360602, 0.000415492495802553, 0.000395277014674441, 0.000374311238316321, 0.000352823777060829, 0.000331054489391796, 0.00030919432078532, 0.000287433659736095, 0.000265916230561958, 0.000244798390324596, 0.00022420362778304, 0.000204262084096551, 0.000185067391607648, 0.000166718099514122, 0.000149271203487334, 0.000132786273193585, 0.000117290373202586, 0.00010281783000424, 8.93726332177835e-05, 7.69710659237324e-05, 6.55977716582546e-05, 5.52506581805068e-05, 4.58995326753224e-05, 0.00010877160624458]coefLPF2Hz=[8.6282232305933e-05, 6.2244554730525e-05, 8.37440516064567e-05, 0.000109344805920938, 0.000139385334557774, 0.000174145157067755, 0.000213863112209846, 0.000258693604647317, 0.00030873403956039, 0.0003639909227719, 0.000424399017778638, 0.000489775423708666, 0.000559833970432311, 0.000634141958754836, 0.000712158676593042, 0.000793205241816938, 0.000876502032005822, 0.000961114670105921, 0.00104598990153592, 0.00112992525072411, 0.00121164893847591, 0.00128978816848066, 0.00136291189262973, 0.00142946316397708, 0.00148786623344657, 0.00153652679595819, 0.0015739264488343, 0.0015984828289443, 0.00160870932351266, 0.00160323624489993, 0.0015809186476517, 0.00154050982069301, 0.00148122166479812, 0.00140239642248017, 0.00130352672098389, 0.00118459086297051, 0.00104565048415891, 0.000887261442928225, 0.000710192848537627, 0.000515656996270743, 0.000305138490941817, 8.05276200742015e-05, -0.00015599404890791, -0.000401868362119919, -0.000654267982896891, -0.000910053268722423, -0.00116587416470754, -0.0014181402452479, -0.00166312736991747, -0.00189698413291048, -0.00211584282887368, -0.00231581851178701, -0.00249311882472109, -0.00264408358191704, -0.0027653007547302, -0.00285361567159059, -0.00290623192465215, -0.00292077117196636, -0.00289536516863145, -0.00282864759098716, -0.00271986837607757, -0.00256892078352474, -0.00237636711240545, -0.00214344374933079, -0.00187218174181465, -0.00156523457291481, -0.00122606412085937, -0.000858765448648235, -0.000468136187019467, -5.95720754552589e-05, 0.000360964020802165, 0.000787020405085947, 0.00121173315990235, 0.00162792416519515, 0.00202820514109522, 0.00240509147150863, 0.00275110864372388, 0.00305893003806416, 0.00332150052543274, 0.00353217284387453, 0.0036848206909306, 0.00377398219210315, 0.00379497572355848, 0.00374402077801493, 0.00361832865691073, 0.00341621636324372, 0.00313718021676067, 0.00278196427186049, 0.00235260100949314, 0.00185246979917177, 0.00128627450118569, 0.000660060960574131, -1.88214403248453e-05, -0.000741753770135867, -0.00149896282064989, -0.00227954966850161, -0.00307166054347212, -0.00386258570736205, -0.00463891185743288, -0.00538671071583846, -0.00609168317395333, -0.00673938403225112, -0.00731539565810964, -0.00780555959404158, -0.00819616675794387, -0.00847417577228178, -0.00862742379815393, -0.00864482527151564, -0.00851656533784976, -0.00823427598076375, -0.00779120819785823, -0.00718237041876792, -0.00640466042340634, -0.00545696210795552, -0.00434023056826099, -0.00305752985746573, -0.00161406588487577, -1.71716231228864e-05, 0.00172372101252833, 0.00359716910170211, 0.00558978529854834, 0.00768638772185354, 0.00987013662964204, 0.0121227256787448, 0.0144245633031765, 0.0167550140918133, 0.0190926252233784, 0.0214153772547169, 0.0237009699575164, 0.0259270646452265, 0.0280715839907018, 0.030112975652347, 0.0320304892264281, 0.0338044386982005, 0.0354164498107324, 0.036849710318941, 0.0380891660164486, 0.0391217404731388, 0.0399364845789852, 0.0405247358009803, 0.0408802163228712, 0.0409991345836916, 0.0408802163228712, 0.0405247358009803, 0.0399364845789852, 0.0391217404731388, 0.0380891660164486, 0.036849710318941, 0.0354164498107324, 0.0338044386982005, 0.0320304892264281, 0.030112975652347, 0.0280715839907018, 0.0259270646452265, 0.0237009699575164, 0.0214153772547169, 0.0190926252233784, 0.0167550140918133, 0.0144245633031765, 0.0121227256787448, 0.00987013662964204, 0.00768638772185354, 0.00558978529854834, 0.00359716910170211, 0.00172372101252833, -1.71716231228864e-05, -0.00161406588487577, -0.00305752985746573, -0.00434023056826099, -0.00545696210795552, -0.00640466042340634, -0.00718237041876792, -0.00779120819785823, -0.00823427598076375, -0.00851656533784976, -0.00864482527151564, -0.00862742379815393, -0.00847417577228178, -0.00819616675794387, -0.00780555959404158, -0.00731539565810964, -0.00673938403225112, -0.00609168317395333, -0.00538671071583846, -0.00463891185743288, -0.00386258570736205, -0.00307166054347212, -0.00227954966850161, -0.00149896282064989, -0.000741753770135867, -1.88214403248453e-05, 0.000660060960574131, 0.00128627450118569, 0.00185246979917177, 0.00235260100949314, 0.00278196427186049, 0.00313718021676067, 0.00341621636324372, 0.00361832865691073, 0.00374402077801493, 0.00379497572355848, 0.00377398219210315, 0.0036848206909306, 0.00353217284387453, 0.00332150052543274, 0.00305893003806416, 0.00275110864372388, 0.00240509147150863, 0.00202820514109522, 0.00162792416519515, 0.00121173315990235, 0.000787020405085947, 0.000360964020802165, -5.95720754552589e-05, -0.000468136187019467, -0.000858765448648235, -0.00122606412085937, -0.00156523457291481, -0.00187218174181465, -0.00214344374933079, -0.00237636711240545, -0.00256892078352474, -0.00271986837607757, -0.00282864759098716, -0.00289536516863145, -0.00292077117196636, -0.00290623192465215, -0.00285361567159059, -0.0027653007547302, -0.00264408358191704, -0.00249311882472109, -0.00231581851178701, -0.00211584282887368, -0.00189698413291048, -0.00166312736991747, -0.0014181402452479, -0.00116587416470754, -0.000910053268722423, -0.000654267982896891, -0.000401868362119919, -0.00015599404890791, 8.05276200742015e-05, 0.000305138490941817, 0.000515656996270743, 0.000710192848537627, 0.000887261442928225, 0.00104565048415891, 0.00118459086297051, 0.00130352672098389, 0.00140239642248017, 0.00148122166479812, 0.00154050982069301, 0.0015809186476517, 0.00160323624489993, 0.00160870932351266, 0.0015984828289443, 0.0015739264488343, 0.00153652679595819, 0.00148786623344657, 0.00142946316397708, 0.00136291189262973, 0.00128978816848066, 0.00121164893847591, 0.00112992525072411, 0.00104598990153592, 0.000961114670105921, 0.000876502032005822, 0.000793205241816938, 0.000712158676593042, 0.000634141958754836, 0.000559833970432311, 0.000489775423708666, 0.000424399017778638, 0.0003639909227719, 0.00030873403956039, 0.000258693604647317, 0.000213863112209846, 0.000174145157067755, 0.000139385334557774, 0.000109344805920938, 8.37440516064567e-05, 6.2244554730525e-05, 8.6282232305933e-05]
-coefLPF3Hz=[-6.99301460170451e-05, -1.27294519741933e-05, -8.11411045408637e-06, 1.67184405911462e-06, 1.77840076853354e-05, 4.14884213044807e-05, 7.40834318163375e-05, 0.000116865803575584, 0.000171045064272654, 0.000237704923185143, 0.000317711011408356, 0.000411669800318729, 0.000519836351524135, 0.000642078335303101, 0.000777788804605022, 0.00092587138343042, 0.00108467682705843, 0.00125201535395662, 0.00142513605863457, 0.00160077293724391, 0.00177516401262185, 0.00194413826580013, 0.00210316833418595, 0.00224751240531228, 0.00237229761872403, 0.00247272140562518, 0.00254415241655769, 0.00258235323506947, 0.00258357897384877, 0.00254479897491382, 0.00246378444500681, 0.00233934924828448, 0.00217139494841597, 0.00196110118058125, 0.00171082854778259, 0.00142427506773054, 0.00110634003178155, 0.000763418233790885, 0.000402676278687535, 3.24321578568528e-05, -0.000338143972103122, -0.00069952690910493, -0.00104171796504747, -0.00135486594216018, -0.00162933744781569, -0.00185621982117435, -0.00202749795289286, -0.00213648883428371, -0.0021780231196067, -0.00214879445039037, -0.00204748171638433, -0.00187497867879537, -0.0016344104803423, -0.00133122505398164, -0.000973069203963525, -0.000569723112755563, -0.000132823433463393, 0.000324365981210866, 0.000787364665345585, 0.00124084696549161, 0.00166914123279329, 0.00205670696761573, 0.00238868606355285, 0.00265141281573357, 0.00283296380233021, 0.00292360330188214, 0.00291624724603694, 0.00280680817862765, 0.00259451279888829, 0.00228206074549647, 0.00187571214563911, 0.00138522302306568, 0.000823723883289755, 0.000207423223869904, -0.000444835413988881, -0.00111207444171618, -0.00177170979879374, -0.00240043369788754, -0.00297476285950768, -0.00347201391006037, -0.00387100194217959, -0.00415292168008815, -0.00430205363195555, -0.0043065046659126, -0.00415876570648408, -0.00385623178741504, -0.0034015025549751, -0.00280259633604184, -0.00207291688788151, -0.00123111106689101, -0.000300666809769615, 0.000690594293727216, 0.00171126866092813, 0.00272721244731997, 0.00370257791344167, 0.00460091250139174, 0.00538636111670095, 0.00602489574531808, 0.00648555513284098, 0.00674163547114917, 0.00677184035070967, 0.00656124820968649, 0.00610219768192734, 0.00539492615734454, 0.00444804760898892, 0.00327873132601737, 0.00191268024605889, 0.00038378744048743, -0.0012664013307753, -0.00298955873100662, -0.0047316343364161104, -0.00643417760645398, -0.00803576570088953, -0.0094737339766264, -0.010685813792603, -0.0116120049196257, -0.0121963430283493, -0.012388664519801, -0.0121462633165832, -0.0114353894244639, -0.0102325513987052, -0.00852557574313943, -0.00631437599278263, -0.0036114238244595, -0.000441871502657626, 0.0031566501888543, 0.00713460223112998, 0.0114314236319287, 0.0159767546241912, 0.0206919372426781, 0.0254917760512308, 0.0302865139651212, 0.0349839442762046, 0.0394916527811519, 0.0437192696465484, 0.0475807098420872, 0.0509963597478593, 0.0538950416741514, 0.0562158674515515, 0.0579097663738589, 0.0589407646366908, 0.0592868902347875, 0.0589407646366908, 0.0579097663738589, 0.0562158674515515, 0.0538950416741514, 0.0509963597478593, 0.0475807098420872, 0.0437192696465484, 0.0394916527811519, 0.0349839442762046, 0.0302865139651212, 0.0254917760512308, 0.0206919372426781, 0.0159767546241912, 0.0114314236319287, 0.00713460223112998, 0.0031566501888543, -0.000441871502657626, -0.0036114238244595, -0.00631437599278263, -0.00852557574313943, -0.0102325513987052, -0.0114353894244639, -0.0121462633165832, -0.012388664519801, -0.0121963430283493, -0.0116120049196257, -0.010685813792603, -0.0094737339766264, -0.00803576570088953, -0.00643417760645398, -0.0047316343364161104, -0.00298955873100662, -0.0012664013307753, 0.00038378744048743, 0.00191268024605889, 0.00327873132601737, 0.00444804760898892, 0.00539492615734454, 0.00610219768192734, 0.00656124820968649, 0.00677184035070967, 0.00674163547114917, 0.00648555513284098, 0.00602489574531808, 0.00538636111670095, 0.00460091250139174, 0.00370257791344167, 0.00272721244731997, 0.00171126866092813, 0.000690594293727216, -0.000300666809769615, -0.00123111106689101, -0.00207291688788151, -0.00280259633604184, -0.0034015025549751, -0.00385623178741504, -0.00415876570648408, -0.0043065046659126, -0.00430205363195555, -0.00415292168008815, -0.00387100194217959, -0.00347201391006037, -0.00297476285950768, -0.00240043369788754, -0.00177170979879374, -0.00111207444171618, -0.000444835413988881, 0.000207423223869904, 0.000823723883289755, 0.00138522302306568, 0.00187571214563911, 0.00228206074549647, 0.00259451279888829, 0.00280680817862765, 0.00291624724603694, 0.00292360330188214, 0.00283296380233021, 0.00265141281573357, 0.00238868606355285, 0.00205670696761573, 0.00166914123279329, 0.00124084696549161, 0.000787364665345585, 0.000324365981210866, -0.000132823433463393, -0.000569723112755563, -0.000973069203963525, -0.00133122505398164, -0.0016344104803423, -0.00187497867879537, -0.00204748171638433, -0.00214879445039037, -0.0021780231196067, -0.00213648883428371, -0.00202749795289286, -0.00185621982117435, -0.00162933744781569, -0.00135486594216018, -0.00104171796504747, -0.00069952690910493, -0.000338143972103122, 3.24321578568528e-05, 0.000402676278687535, 0.000763418233790885, 0.00110634003178155, 0.00142427506773054, 0.00171082854778259, 0.00196110118058125, 0.00217139494841597, 0.00233934924828448, 0.00246378444500681, 0.00254479897491382, 0.00258357897384877, 0.00258235323506947, 0.00254415241655769, 0.00247272140562518, 0.00237229761872403, 0.00224751240531228, 0.00210316833418595, 0.00194413826580013, 0.00177516401262185, 0.00160077293724391, 0.00142513605863457, 0.00125201535395662, 0.00108467682705843, 0.00092587138343042, 0.000777788804605022, 0.000642078335303101, 0.000519836351524135, 0.000411669800318729, 0.000317711011408356, 0.000237704923185143, 0.000171045064272654, 0.000116865803575584, 7.40834318163375e-05, 4.14884213044807e-05, 1.77840076853354e-05, 1.67184405911462e-06, -8.11411045408637e-06, -1.27294519741933e-05, -6.99301460170451e-05]
-coefLPF4Hz=[-9.54174859263817e-05, -8.79118721831916e-05, -0.000123525899713118, -0.000164044355517482, -0.000207949620009686, -0.000253037764658506, -0.000296430640501298, -0.000334583668271658, -0.000363386370110708, -0.000378291626736578, -0.000374535699710512, -0.000347353172731495, -0.000292262993246289, -0.000205341111355267, -8.35846755279466e-05, 7.47982703876679e-05, 0.000270077254831634, 0.000500833062918783, 0.000763739255735781, 0.00105347611543314, 0.00136269168948789, 0.00168222053112261, 0.0020013013630063, 0.00230791449414468, 0.00258916556080754, 0.00283202301588922, 0.00302386521992159, 0.00315307736865578, 0.00320972169851936, 0.00318651967451815, 0.00307882781975759, 0.00288573076070163, 0.00260996794243475, 0.00225821623809189, 0.00184113264302529, 0.00137292788913635, 0.000871078642315071, 0.000355503806845778, -0.000152144543509279, -0.000629591931421428, -0.00105495836864743, -0.00140798355933296, -0.00167108627764732, -0.0018304845529618, -0.00187708160877748, -0.00180722045385336, -0.00162309148857381, -0.00133294292862919, -0.000950906481759075, -0.000496534051544257, 6.07529827801003e-06, 0.000529325394815922, 0.00104350813037435, 0.00151836079390932, 0.001924740237836, 0.00223625511978182, 0.0024309311584556, 0.00249263441578938, 0.00241219240391683, 0.00218832211264551, 0.00182797652590312, 0.00134632316735222, 0.000766299497396513, 0.000117534286845717, -0.000564939300332578, -0.00124260329650573, -0.00187542159993208, -0.00242419519224069, -0.00285281845707931, -0.00313060784842892, -0.00323429319506989, -0.00314977661910102, -0.00287336207081976, -0.00241250915353937, -0.00178588865431787, -0.00102285988869945, -0.000162235519546119, 0.000749505532064627, 0.00166062887701361, 0.00251687478965856, 0.00326457547043434, 0.00385381312362271, 0.00424157134473187, 0.00439457860381802, 0.00429180838170587, 0.00392629146248058, 0.00330626547470493, 0.00245547202985933, 0.001412559074861, 0.000229573754974535, -0.00103035498317968, -0.00229619892977938, -0.00349268610320155, -0.00454457787790845, -0.00538098590698837, -0.00593982304763449, -0.00617185194133615, -0.0060443202250927, -0.00554375333951228, -0.00467786121245747, -0.00347628320813657, -0.0019901713785125, -0.00029047816485446, 0.00153492785895592, 0.00338530814381761, 0.00515200649092142, 0.00672419152992557, 0.00799496602090426, 0.00886771275158157, 0.00926215577965021, 0.00911995843285969, 0.00840940133605338, 0.00712897380814694, 0.00530949981886423, 0.00301475187228483, 0.000340331127138541, -0.00258911265596624, -0.00562433112104967, -0.00859736520695316, -0.0113287386254766, -0.0136354902816702, -0.0153398911856826, -0.0162781905838205, -0.0163092084322705, -0.0153221220299264, -0.0132432223606423, -0.0100411358283924, -0.00573031299959539, -0.000372487920989045, 0.00592395920448824, 0.013006817967952, 0.0206849091890804, 0.0287348686126461, 0.0369095121887642, 0.0449475108200305, 0.0525838249086858, 0.0595605926464216, 0.0656377875185559, 0.0706033405233554, 0.0742820881430631, 0.0765432688555916, 0.0773060994749335, 0.0765432688555916, 0.0742820881430631, 0.0706033405233554, 0.0656377875185559, 0.0595605926464216, 0.0525838249086858, 0.0449475108200305, 0.0369095121887642, 0.0287348686126461, 0.0206849091890804, 0.013006817967952, 0.00592395920448824, -0.000372487920989045, -0.00573031299959539, -0.0100411358283924, -0.0132432223606423, -0.0153221220299264, -0.0163092084322705, -0.0162781905838205, -0.0153398911856826, -0.0136354902816702, -0.0113287386254766, -0.00859736520695316, -0.00562433112104967, -0.00258911265596624, 0.000340331127138541, 0.00301475187228483, 0.00530949981886423, 0.00712897380814694, 0.00840940133605338, 0.00911995843285969, 0.00926215577965021, 0.00886771275158157, 0.00799496602090426, 0.00672419152992557, 0.00515200649092142, 0.00338530814381761, 0.00153492785895592, -0.00029047816485446, -0.0019901713785125, -0.00347628320813657, -0.00467786121245747, -0.00554375333951228, -0.0060443202250927, -0.00617185194133615, -0.00593982304763449, -0.00538098590698837, -0.00454457787790845, -0.00349268610320155, -0.00229619892977938, -0.00103035498317968, 0.000229573754974535, 0.001412559074861, 0.00245547202985933, 0.00330626547470493, 0.00392629146248058, 0.00429180838170587, 0.00439457860381802, 0.00424157134473187, 0.00385381312362271, 0.00326457547043434, 0.00251687478965856, 0.00166062887701361, 0.000749505532064627, -0.000162235519546119, -0.00102285988869945, -0.00178588865431787, -0.00241250915353937, -0.00287336207081976, -0.00314977661910102, -0.00323429319506989, -0.00313060784842892, -0.00285281845707931, -0.00242419519224069, -0.00187542159993208, -0.00124260329650573, -0.000564939300332578, 0.000117534286845717, 0.000766299497396513, 0.00134632316735222, 0.00182797652590312, 0.00218832211264551, 0.00241219240391683, 0.00249263441578938, 0.0024309311584556, 0.00223625511978182, 0.001924740237836, 0.00151836079390932, 0.00104350813037435, 0.000529325394815922, 6.07529827801003e-06, -0.000496534051544257, -0.000950906481759075, -0.00133294292862919, -0.00162309148857381, -0.00180722045385336, -0.00187708160877748, -0.0018304845529618, -0.00167108627764732, -0.00140798355933296, -0.00105495836864743, -0.000629591931421428, -0.000152144543509279, 0.000355503806845778, 0.000871078642315071, 0.00137292788913635, 0.00184113264302529, 0.00225821623809189, 0.00260996794243475, 0.00288573076070163, 0.00307882781975759, 0.00318651967451815, 0.00320972169851936, 0.00315307736865578, 0.00302386521992159, 0.00283202301588922, 0.00258916556080754, 0.00230791449414468, 0.0020013013630063, 0.00168222053112261, 0.00136269168948789, 0.00105347611543314, 0.000763739255735781, 0.000500833062918783, 0.000270077254831634, 7.47982703876679e-05, -8.35846755279466e-05, -0.000205341111355267, -0.000292262993246289, -0.000347353172731495, -0.000374535699710512, -0.000378291626736578, -0.000363386370110708, -0.000334583668271658, -0.000296430640501298, -0.000253037764658506, -0.000207949620009686, -0.000164044355517482, -0.000123525899713118, -8.79118721831916e-05, -9.54174859263817e-05]
-coefLPF5Hz=[8.58559846439298e-06, -9.96045036043213e-05, -0.000145364350742628, -0.000239706545759862, -0.000368009796424372, -0.000531623646592088, -0.000731367255269745, -0.000965791885579856, -0.00123069762920004, -0.00151888030685613, -0.00182011578008294, -0.00212135027446078, -0.00240720546862097, -0.00266071715378927, -0.0028643357128543, -0.00300109971836618, -0.00305593626182179, -0.0030169701485987, -0.00287678295856958, -0.00263343580215796, -0.00229125027866611, -0.00186112802770249, -0.00136045414395822, -0.00081244232494921, -0.000245027214055133, 0.000310754763470621, 0.000822719866526283, 0.00125978874470678, 0.0015942995031033, 0.0018042712514918, 0.00187534399684679, 0.00180230399084608, 0.00158995780480054, 0.00125333233186481, 0.000817037376226666, 0.00031386196452789, -0.000217409399673589, -0.000734749261176157, -0.00119606955925228, -0.00156253456374279, -0.0018018359938669, -0.00189107004719281, -0.0018190207981861, -0.00158751590870567, -0.00121180409060325, -0.000719796908791083, -0.000150268980868353, 0.000449979451274248, 0.00102982239938498, 0.00153800446378254, 0.00192753741758074, 0.0021598867759152, 0.00220871063777909, 0.00206271279723389, 0.00172722760589249, 0.00122439362852208, 0.000592071278352308, -0.000118795626788258, -0.000848211577155376, -0.00153203763044302, -0.00210713744193751, -0.00251760566072405, -0.00271948198498085, -0.00268555835451539, -0.00240845570085119, -0.00190215272959666, -0.00120181522791561, -0.000361543348816508, 0.000549486155980121, 0.00145258377557556, 0.00226606603297096, 0.00291249639078849, 0.00332576610769807, 0.00345761576322902, 0.00328276841590933, 0.00280234999259981, 0.00204502229901756, 0.00106580696050935, -5.76289894310253e-05, -0.00123078340383232, -0.00235003031334642, -0.00331142279482859, -0.0040200673929838, -0.00439905981708975, -0.00439735281142926, -0.00399561182073828, -0.00320961465910046, -0.00209059864588071, -0.000722547650151019, 0.00078368008253927, 0.00229884238042838, 0.00368598306942169, 0.00481225288490728, 0.00556108076170906, 0.00584346498698733, 0.0056075016450816, 0.00484505255468123, 0.00359496828355903, 0.00194223768059054, 1.31080886365469e-05, -0.00203381758721557, -0.00401975473533981, -0.00576049229844538, -0.00708235709168115, -0.00783830313437009, -0.00792256153920004, -0.00728260646219278, -0.00592720612177189, -0.00392962297034829, -0.00142551861103553, 0.00139469395398157, 0.00429871835021413, 0.00702954724286314, 0.00932591811169439, 0.0109445271120279, 0.0116821883306104, 0.0113961460573815, 0.0100209266103445, 0.00758001265987498, 0.00419109532230829, 6.44370556746275e-05, -0.00450634153822108, -0.00916036931355986, -0.013491777761817, -0.0170767651047172, -0.0195034652123751, -0.020402757019013, -0.0194774678950615, -0.0165280236732933, -0.0114722694971752, -0.00435802286194296, 0.00463303390278974, 0.0151904795234468, 0.0268893980250455, 0.0392128222918912, 0.051581181303572, 0.0633866571249259, 0.0740303617891471, 0.0829595974565147, 0.0897028268988844, 0.0938997173119642, 0.0953243420014891, 0.0938997173119642, 0.0897028268988844, 0.0829595974565147, 0.0740303617891471, 0.0633866571249259, 0.051581181303572, 0.0392128222918912, 0.0268893980250455, 0.0151904795234468, 0.00463303390278974, -0.00435802286194296, -0.0114722694971752, -0.0165280236732933, -0.0194774678950615, -0.020402757019013, -0.0195034652123751, -0.0170767651047172, -0.013491777761817, -0.00916036931355986, -0.00450634153822108, 6.44370556746275e-05, 0.00419109532230829, 0.00758001265987498, 0.0100209266103445, 0.0113961460573815, 0.0116821883306104, 0.0109445271120279, 0.00932591811169439, 0.00702954724286314, 0.00429871835021413, 0.00139469395398157, -0.00142551861103553, -0.00392962297034829, -0.00592720612177189, -0.00728260646219278, -0.00792256153920004, -0.00783830313437009, -0.00708235709168115, -0.00576049229844538, -0.00401975473533981, -0.00203381758721557, 1.31080886365469e-05, 0.00194223768059054, 0.00359496828355903, 0.00484505255468123, 0.0056075016450816, 0.00584346498698733, 0.00556108076170906, 0.00481225288490728, 0.00368598306942169, 0.00229884238042838, 0.00078368008253927, -0.000722547650151019, -0.00209059864588071, -0.00320961465910046, -0.00399561182073828, -0.00439735281142926, -0.00439905981708975, -0.0040200673929838, -0.00331142279482859, -0.00235003031334642, -0.00123078340383232, -5.76289894310253e-05, 0.00106580696050935, 0.00204502229901756, 0.00280234999259981, 0.00328276841590933, 0.00345761576322902, 0.00332576610769807, 0.00291249639078849, 0.00226606603297096, 0.00145258377557556, 0.000549486155980121, -0.000361543348816508, -0.00120181522791561, -0.00190215272959666, -0.00240845570085119, -0.00268555835451539, -0.00271948198498085, -0.00251760566072405, -0.00210713744193751, -0.00153203763044302, -0.000848211577155376, -0.000118795626788258, 0.000592071278352308, 0.00122439362852208, 0.00172722760589249, 0.00206271279723389, 0.00220871063777909, 0.0021598867759152, 0.00192753741758074, 0.00153800446378254, 0.00102982239938498, 0.000449979451274248, -0.000150268980868353, -0.000719796908791083, -0.00121180409060325, -0.00158751590870567, -0.0018190207981861, -0.00189107004719281, -0.0018018359938669, -0.00156253456374279, -0.00119606955925228, -0.000734749261176157, -0.000217409399673589, 0.00031386196452789, 0.000817037376226666, 0.00125333233186481, 0.00158995780480054, 0.00180230399084608, 0.00187534399684679, 0.0018042712514918, 0.0015942995031033, 0.00125978874470678, 0.000822719866526283, 0.000310754763470621, -0.000245027214055133, -0.00081244232494921, -0.00136045414395822, -0.00186112802770249, -0.00229125027866611, -0.00263343580215796, -0.00287678295856958, -0.0030169701485987, -0.00305593626182179, -0.00300109971836618, -0.0028643357128543, -0.00266071715378927, -0.00240720546862097, -0.00212135027446078, -0.00182011578008294, -0.00151888030685613, -0.00123069762920004, -0.000965791885579856, -0.000731367255269745, -0.000531623646592088, -0.000368009796424372, -0.000239706545759862, -0.000145364350742628, -9.96045036043213e-05, 8.58559846439298e-06]
-coefLPF6Hz=[9.51953917198201e-05, 9.29348299772035e-05, 0.000122864680800356, 0.000143346501199133, 0.000144426348853192, 0.000114512537039848, 4.1343119767701e-05, -8.66246574467262e-05, -0.000278653086735759, -0.000540044716560056, -0.000870628882983346, -0.0012634725843973, -0.00170415499505119, -0.00217072113611898, -0.00263457300901084, -0.00306216147271356, -0.0034175074118375, -0.00366533092229529, -0.00377469393739297, -0.0037226009674987, -0.00349719155063168, -0.00310012124616361, -0.00254798671517167, -0.00187222651858013, -0.00111734711203486, -0.000337719635498011, 0.000406781445990221, 0.00105649131512855, 0.00155786803630902, 0.00186888168127091, 0.00196446144298232, 0.00183939355481797, 0.00151020671747381, 0.00101419502014655, 0.000406446893336401, -0.00024534262195971, -0.000867751815829899, -0.00138942409966435, -0.00174905577240851, -0.00190254075139288, -0.00182857243430628, -0.00153178398891885, -0.00104308153809623, -0.000416869370770367, 0.000274512132639704, 0.000948797745476176, 0.0015232437926453, 0.00192455835163045, 0.00209805358832118, 0.00201504041969171, 0.001677260292732, 0.00111785081620897, 0.000398528101797365, -0.000396842338232539, -0.00117177476289134, -0.00182849435277269, -0.0022800665834526, -0.00246166375863738, -0.00233951409703447, -0.0019165425464467, -0.00123349427900087, -0.000365549777623394, 0.000585613886217076, 0.00150341456163111, 0.00227033512129029, 0.00278268750737259, 0.00296425836668143, 0.00277721819898915, 0.00222861577429072, 0.00137159231372714, 0.000300776132787158, -0.000857692964841159, -0.00196068568136128, -0.0028653572958888, -0.0034472715180677, -0.00361700995521037, -0.00333323479997745, -0.00261020009681654, -0.00151868694810959, -0.000179773194084619, 0.00124803451114882, 0.00258708311308422, 0.00366212247881173, 0.00432271928586425, 0.00446354823231381, 0.00404009454974359, 0.00307740277962306, 0.00167047133924042, -2.41585665724037e-05, -0.00180506169786629, -0.00344912405283191, -0.00473869638387645, -0.00548951356582856, -0.00557585039439777, -0.00494970680252947, -0.00365114783630325, -0.00180817872077261, 0.000374541757334576, 0.00263719521837174, 0.0046945462399488, 0.00627049422311412, 0.00713355116888784, 0.00712873376349285, 0.0062018339070542, 0.00441245205130337, 0.00193369432906696, -0.000962391789483581, -0.00393253970473916, -0.00660065563603407, -0.00860271142967563, -0.00963314096927288, -0.00948705826516433, -0.00809304977350245, -0.0055317977069005, -0.00203752475410341, 0.00201915638088893, 0.00616608385757383, 0.00987921476364516, 0.0126422107142905, 0.0140097235324356, 0.0136672622181755, 0.0114806513723623, 0.00752869074098506, 0.00211439893334844, -0.0042478837643533, -0.0108694492141259, -0.016945806894901, -0.0216316548967594, -0.0241253129236686, -0.0237540446413231, -0.0200515356460638, -0.0128189699599109, -0.00216285481540334, 0.0114953920165076, 0.0274399787925874, 0.0447105747083805, 0.062177281506065, 0.0786341753659977, 0.0929026112361478, 0.103934538447745, 0.110905704733335, 0.113289738595858, 0.110905704733335, 0.103934538447745, 0.0929026112361478, 0.0786341753659977, 0.062177281506065, 0.0447105747083805, 0.0274399787925874, 0.0114953920165076, -0.00216285481540334, -0.0128189699599109, -0.0200515356460638, -0.0237540446413231, -0.0241253129236686, -0.0216316548967594, -0.016945806894901, -0.0108694492141259, -0.0042478837643533, 0.00211439893334844, 0.00752869074098506, 0.0114806513723623, 0.0136672622181755, 0.0140097235324356, 0.0126422107142905, 0.00987921476364516, 0.00616608385757383, 0.00201915638088893, -0.00203752475410341, -0.0055317977069005, -0.00809304977350245, -0.00948705826516433, -0.00963314096927288, -0.00860271142967563, -0.00660065563603407, -0.00393253970473916, -0.000962391789483581, 0.00193369432906696, 0.00441245205130337, 0.0062018339070542, 0.00712873376349285, 0.00713355116888784, 0.00627049422311412, 0.0046945462399488, 0.00263719521837174, 0.000374541757334576, -0.00180817872077261, -0.00365114783630325, -0.00494970680252947, -0.00557585039439777, -0.00548951356582856, -0.00473869638387645, -0.00344912405283191, -0.00180506169786629, -2.41585665724037e-05, 0.00167047133924042, 0.00307740277962306, 0.00404009454974359, 0.00446354823231381, 0.00432271928586425, 0.00366212247881173, 0.00258708311308422, 0.00124803451114882, -0.000179773194084619, -0.00151868694810959, -0.00261020009681654, -0.00333323479997745, -0.00361700995521037, -0.0034472715180677, -0.0028653572958888, -0.00196068568136128, -0.000857692964841159, 0.000300776132787158, 0.00137159231372714, 0.00222861577429072, 0.00277721819898915, 0.00296425836668143, 0.00278268750737259, 0.00227033512129029, 0.00150341456163111, 0.000585613886217076, -0.000365549777623394, -0.00123349427900087, -0.0019165425464467, -0.00233951409703447, -0.00246166375863738, -0.0022800665834526, -0.00182849435277269, -0.00117177476289134, -0.000396842338232539, 0.000398528101797365, 0.00111785081620897, 0.001677260292732, 0.00201504041969171, 0.00209805358832118, 0.00192455835163045, 0.0015232437926453, 0.000948797745476176, 0.000274512132639704, -0.000416869370770367, -0.00104308153809623, -0.00153178398891885, -0.00182857243430628, -0.00190254075139288, -0.00174905577240851, -0.00138942409966435, -0.000867751815829899, -0.00024534262195971, 0.000406446893336401, 0.00101419502014655, 0.00151020671747381, 0.00183939355481797, 0.00196446144298232, 0.00186888168127091, 0.00155786803630902, 0.00105649131512855, 0.000406781445990221, -0.000337719635498011, -0.00111734711203486, -0.00187222651858013, -0.00254798671517167, -0.00310012124616361, -0.00349719155063168, -0.0037226009674987, -0.00377469393739297, -0.00366533092229529, -0.0034175074118375, -0.00306216147271356, -0.00263457300901084, -0.00217072113611898, -0.00170415499505119, -0.0012634725843973, -0.000870628882983346, -0.000540044716560056, -0.000278653086735759, -8.66246574467262e-05, 4.1343119767701e-05, 0.000114512537039848, 0.000144426348853192, 0.000143346501199133, 0.000122864680800356, 9.29348299772035e-05, 9.51953917198201e-05]
-coefLPF7Hz=[0.000122674393004877, 0.000244487033404312, 0.000422963403225206, 0.000704626074208424, 0.0010365192496463, 0.00146170298267679, 0.00191573814622894, 0.00241195183228318, 0.00287219139467693, 0.00328651619365861, 0.00357383999875522, 0.00371989635121225, 0.0036619965246103, 0.00340670657597581, 0.00293191048808701, 0.00228352328308138, 0.00148874650295602, 0.000632328270925589, -0.000223024950142992, -0.000978308732751376, -0.00157004200999626, -0.00192407102768521, -0.00201658474880428, -0.00183231542158286, -0.00141084170307018, -0.000803876567191467, -0.000105304321533849, 0.000593538133065505, 0.00118596680598067, 0.00159278157891253, 0.00174841536052999, 0.00163478053737679, 0.00126334817665631, 0.000694204769628869, 1.00561891046636e-05, -0.000679105869383376, -0.00126763684569652, -0.00165656605464509, -0.00178254094746526, -0.00161680614472321, -0.00118205768136263, -0.000540227120736443, 0.000206819498063527, 0.000940968289708341, 0.00153872838914792, 0.00189832850266321, 0.00195066962775057, 0.00167797692202158, 0.00111305128280633, 0.000341069965073034, -0.000517386493362638, -0.00132045295302009, -0.00193190188160878, -0.00224037116592351, -0.00218247438846926, -0.00175228904315426, -0.0010076891752497, -6.07332312250037e-05, 0.000936451626552584, 0.00181771472552644, 0.00242826538753001, 0.00265321333384188, 0.00243695265111418, 0.00179696899379912, 0.000822549437924515, -0.000335523472668896, -0.00148909767369953, -0.00244154681250711, -0.0030218632664606, -0.00311385560072563, -0.00267934083473362, -0.00176752244064391, -0.000511455147665506, 0.000891195286225359, 0.00220811335247232, 0.00321068204381944, 0.00371261503756352, 0.0036040884875174, 0.00287382781637672, 0.00161617569948596, 1.99244622052599e-05, -0.0016588249958735, -0.00313725825045145, -0.00415236321117545, -0.00450704069737175, -0.00410678702540073, -0.00298126563620825, -0.00128548386939516, 0.000719966845199696, 0.00270789512830421, 0.00433668791969844, 0.00530779371732825, 0.00541889924595713, 0.0046036398105266, 0.00295033661581981, 0.000695553597079685, -0.00180795035957871, -0.00414465121324883, -0.0059035049023038, -0.00674807244729412, -0.0064782756731985, -0.00507242199841842, -0.00270179598227178, 0.000286753414389685, 0.00341868976093036, 0.00616440213706141, 0.00802540492190589, 0.00862102333146511, 0.00776064207407368, 0.00548898099039663, 0.00209484106956546, -0.00192036926509534, -0.00591173688190434, -0.00918888181637331, -0.0111284575399063, -0.0112840840308954, -0.00947511034443557, -0.00583878957927563, -0.00083424799406438, 0.00480543701478256, 0.0101697152444542, 0.0143036262207077, 0.0163596015678238, 0.0157456760823768, 0.0122471481473478, 0.00610123294727804, -0.0019900248793595, -0.0109147106797061, -0.0192707122886746, -0.0255368169034692, -0.02827419939747, -0.026331427157176, -0.0190245893933594, -0.00626618381392555, 0.0113774565897241, 0.0327111918572842, 0.0560188071343618, 0.0792419050723826, 0.100209047091181, 0.116886122150787, 0.127616351144111, 0.131318292178733, 0.127616351144111, 0.116886122150787, 0.100209047091181, 0.0792419050723826, 0.0560188071343618, 0.0327111918572842, 0.0113774565897241, -0.00626618381392555, -0.0190245893933594, -0.026331427157176, -0.02827419939747, -0.0255368169034692, -0.0192707122886746, -0.0109147106797061, -0.0019900248793595, 0.00610123294727804, 0.0122471481473478, 0.0157456760823768, 0.0163596015678238, 0.0143036262207077, 0.0101697152444542, 0.00480543701478256, -0.00083424799406438, -0.00583878957927563, -0.00947511034443557, -0.0112840840308954, -0.0111284575399063, -0.00918888181637331, -0.00591173688190434, -0.00192036926509534, 0.00209484106956546, 0.00548898099039663, 0.00776064207407368, 0.00862102333146511, 0.00802540492190589, 0.00616440213706141, 0.00341868976093036, 0.000286753414389685, -0.00270179598227178, -0.00507242199841842, -0.0064782756731985, -0.00674807244729412, -0.0059035049023038, -0.00414465121324883, -0.00180795035957871, 0.000695553597079685, 0.00295033661581981, 0.0046036398105266, 0.00541889924595713, 0.00530779371732825, 0.00433668791969844, 0.00270789512830421, 0.000719966845199696, -0.00128548386939516, -0.00298126563620825, -0.00410678702540073, -0.00450704069737175, -0.00415236321117545, -0.00313725825045145, -0.0016588249958735, 1.99244622052599e-05, 0.00161617569948596, 0.00287382781637672, 0.0036040884875174, 0.00371261503756352, 0.00321068204381944, 0.00220811335247232, 0.000891195286225359, -0.000511455147665506, -0.00176752244064391, -0.00267934083473362, -0.00311385560072563, -0.0030218632664606, -0.00244154681250711, -0.00148909767369953, -0.000335523472668896, 0.000822549437924515, 0.00179696899379912, 0.00243695265111418, 0.00265321333384188, 0.00242826538753001, 0.00181771472552644, 0.000936451626552584, -6.07332312250037e-05, -0.0010076891752497, -0.00175228904315426, -0.00218247438846926, -0.00224037116592351, -0.00193190188160878, -0.00132045295302009, -0.000517386493362638, 0.000341069965073034, 0.00111305128280633, 0.00167797692202158, 0.00195066962775057, 0.00189832850266321, 0.00153872838914792, 0.000940968289708341, 0.000206819498063527, -0.000540227120736443, -0.00118205768136263, -0.00161680614472321, -0.00178254094746526, -0.00165656605464509, -0.00126763684569652, -0.000679105869383376, 1.00561891046636e-05, 0.000694204769628869, 0.00126334817665631, 0.00163478053737679, 0.00174841536052999, 0.00159278157891253, 0.00118596680598067, 0.000593538133065505, -0.000105304321533849, -0.000803876567191467, -0.00141084170307018, -0.00183231542158286, -0.00201658474880428, -0.00192407102768521, -0.00157004200999626, -0.000978308732751376, -0.000223024950142992, 0.000632328270925589, 0.00148874650295602, 0.00228352328308138, 0.00293191048808701, 0.00340670657597581, 0.0036619965246103, 0.00371989635121225, 0.00357383999875522, 0.00328651619365861, 0.00287219139467693, 0.00241195183228318, 0.00191573814622894, 0.00146170298267679, 0.0010365192496463, 0.000704626074208424, 0.000422963403225206, 0.000244487033404312, 0.000122674393004877]
-coefLPF8Hz=[-9.12267516430519e-05, -7.94918647138575e-05, -7.36614520322672e-05, -1.6496197736113e-05, 0.000119273128765204, 0.000358967259731168, 0.00072006521596475, 0.00120595328744975, 0.00180076736416206, 0.00246645917480369, 0.00314351710421691, 0.00375575991361354, 0.00421933210110559, 0.00445474453269032, 0.00440057179390664, 0.00402624479633694, 0.00334159502333473, 0.00240063649777001, 0.00129845778145018, 0.000160566153007429, -0.000874137251641479, -0.00167459434170937, -0.00213909535723957, -0.00221370905920164, -0.00190377120072229, -0.00127573953632064, -0.000448004648974995, 0.000427408290478392, 0.00119082232855544, 0.00170319639863394, 0.00187153484532204, 0.00166731760033842, 0.0011326580976924, 0.000373892621505642, -0.000457953171020453, -0.00119569705484065, -0.00168882481010505, -0.00183386888172933, -0.00159642982953977, -0.00101987196211419, -0.000218491716500068, 0.000644102341472585, 0.00138744697916072, 0.00185130093537184, 0.00192982244988394, 0.00159554285749474, 0.000907737328446864, 2.85481495987747e-06, -0.000931740364540439, -0.00169590497783024, -0.00211895578868346, -0.00209732636783794, -0.00161938803457873, -0.00077152343545212, 0.000276622733088149, 0.00130530179219415, 0.00209021533264597, 0.00245073732651731, 0.00229095342034024, 0.00162404338369026, 0.000574076725056305, -0.000646113978211704, -0.00177738935101458, -0.00256864057146726, -0.00283190296529437, -0.00248613576830276, -0.00157974223936177, -0.000285878208947569, 0.00112964477695301, 0.00236219608748956, 0.00313312290465495, 0.00325190008837077, 0.00266196977962165, 0.00145944014393353, -0.000120721862514934, -0.00174952317713164, -0.0030715145649128, -0.00378143562062601, -0.0036935451213267, -0.00278820947657581, -0.00122436801383408, 0.000686524898324232, 0.00254123461240443, 0.00392864037399117, 0.00451961431985863, 0.00414338669194427, 0.0028331904630524, 0.000829424202840044, -0.00146234827481675, -0.00355186687272553, -0.00496737783815219, -0.00536026441811858, -0.00458825104413068, -0.00275786800930409, -0.000214679985404627, 0.00251939178010707, 0.00485085863713484, 0.00624100210404499, 0.00632736786462522, 0.00501361919883693, 0.00250638203266144, -0.000712064077484682, -0.00397297985034528, -0.00655651344260736, -0.00784651027402039, -0.00747231287872623, -0.00540591375548538, -0.00199068162157528, 0.00210900032391914, 0.0060313017542065, 0.00889182775000969, 0.00997550277604494, 0.00890526794392272, 0.00574972403292889, 0.0010423810326166, -0.00429800096412485, -0.00913611999051849, -0.0123487564479479, -0.0130693314683498, -0.0108981506865196, -0.00603138602053811, 0.000724594487278825, 0.00806603716426325, 0.0144190770710852, 0.0182448949858981, 0.0183677572603766, 0.014262491447614, 0.00624136294334759, -0.00450423110292865, -0.0160269759248207, -0.0259011720093367, -0.0316143492900081, -0.031008886601337, -0.022696739785176, -0.00637116877130386, 0.0170456430544001, 0.0454536268905413, 0.0758249522283276, 0.104618770111281, 0.128296077930386, 0.143851255596207, 0.149272113167412, 0.143851255596207, 0.128296077930386, 0.104618770111281, 0.0758249522283276, 0.0454536268905413, 0.0170456430544001, -0.00637116877130386, -0.022696739785176, -0.031008886601337, -0.0316143492900081, -0.0259011720093367, -0.0160269759248207, -0.00450423110292865, 0.00624136294334759, 0.014262491447614, 0.0183677572603766, 0.0182448949858981, 0.0144190770710852, 0.00806603716426325, 0.000724594487278825, -0.00603138602053811, -0.0108981506865196, -0.0130693314683498, -0.0123487564479479, -0.00913611999051849, -0.00429800096412485, 0.0010423810326166, 0.00574972403292889, 0.00890526794392272, 0.00997550277604494, 0.00889182775000969, 0.0060313017542065, 0.00210900032391914, -0.00199068162157528, -0.00540591375548538, -0.00747231287872623, -0.00784651027402039, -0.00655651344260736, -0.00397297985034528, -0.000712064077484682, 0.00250638203266144, 0.00501361919883693, 0.00632736786462522, 0.00624100210404499, 0.00485085863713484, 0.00251939178010707, -0.000214679985404627, -0.00275786800930409, -0.00458825104413068, -0.00536026441811858, -0.00496737783815219, -0.00355186687272553, -0.00146234827481675, 0.000829424202840044, 0.0028331904630524, 0.00414338669194427, 0.00451961431985863, 0.00392864037399117, 0.00254123461240443, 0.000686524898324232, -0.00122436801383408, -0.00278820947657581, -0.0036935451213267, -0.00378143562062601, -0.0030715145649128, -0.00174952317713164, -0.000120721862514934, 0.00145944014393353, 0.00266196977962165, 0.00325190008837077, 0.00313312290465495, 0.00236219608748956, 0.00112964477695301, -0.000285878208947569, -0.00157974223936177, -0.00248613576830276, -0.00283190296529437, -0.00256864057146726, -0.00177738935101458, -0.000646113978211704, 0.000574076725056305, 0.00162404338369026, 0.00229095342034024, 0.00245073732651731, 0.00209021533264597, 0.00130530179219415, 0.000276622733088149, -0.00077152343545212, -0.00161938803457873, -0.00209732636783794, -0.00211895578868346, -0.00169590497783024, -0.000931740364540439, 2.85481495987747e-06, 0.000907737328446864, 0.00159554285749474, 0.00192982244988394, 0.00185130093537184, 0.00138744697916072, 0.000644102341472585, -0.000218491716500068, -0.00101987196211419, -0.00159642982953977, -0.00183386888172933, -0.00168882481010505, -0.00119569705484065, -0.000457953171020453, 0.000373892621505642, 0.0011326580976924, 0.00166731760033842, 0.00187153484532204, 0.00170319639863394, 0.00119082232855544, 0.000427408290478392, -0.000448004648974995, -0.00127573953632064, -0.00190377120072229, -0.00221370905920164, -0.00213909535723957, -0.00167459434170937, -0.000874137251641479, 0.000160566153007429, 0.00129845778145018, 0.00240063649777001, 0.00334159502333473, 0.00402624479633694, 0.00440057179390664, 0.00445474453269032, 0.00421933210110559, 0.00375575991361354, 0.00314351710421691, 0.00246645917480369, 0.00180076736416206, 0.00120595328744975, 0.00072006521596475, 0.000358967259731168, 0.000119273128765204, -1.6496197736113e-05, -7.36614520322672e-05, -7.94918647138575e-05, -9.12267516430519e-05]
-coefLPF9Hz=[-0.00015891369722663, -0.000337235706522446, -0.000638128130293509, -0.00104538145419971, -0.00153555832451148, -0.00205764875098998, -0.00253503789295034, -0.00287455063880954, -0.00298145086158454, -0.00277880935351533, -0.00222724509919168, -0.00134051984614303, -0.000192519390129729, 0.00108705023949854, 0.00233030090825545, 0.00335854231296566, 0.00401604114215622, 0.00420253903747082, 0.00389723852449036, 0.0031684669312984, 0.00216449626381482, 0.0010870237418083, 0.000151033731543792, -0.000460152577408714, -0.000635108112698357, -0.000359911147425032, 0.00027736003653186, 0.00110569967612029, 0.00191003422948133, 0.00248169594600651, 0.002668702190197, 0.00241353185687379, 0.00176888866185394, 0.000886383326873828, -1.96609530164295e-05, -0.000725286899147141, -0.00105386493634165, -0.000922582550956386, -0.000366227668523132, 0.000468746136354272, 0.00135937038019998, 0.0020624648189924, 0.002378090312042, 0.00220380857069712, 0.00156498025127304, 0.000612350156896661, -0.000413891624799732, -0.00124518891099122, -0.00165563531566418, -0.00152432540159653, -0.000871901084502176, 0.000139476129831854, 0.00124435046759751, 0.00214160371653512, 0.0025745668027705, 0.00240244198550353, 0.00164338834938532, 0.000476287167908999, -0.000801024543638398, -0.00184771919985589, -0.00237096188701543, -0.00220785825853134, -0.00137567471595367, -7.51556613982449e-05, 0.00135603114358144, 0.00252936635614802, 0.00310936887656694, 0.00290777409047763, 0.00194184492049259, 0.000439168652950075, -0.00121485831818039, -0.00257522167450623, -0.00325641958250202, -0.00304096382795203, -0.00194699233412351, -0.000234604666261738, 0.00165385861939459, 0.00320634632288325, 0.00397825327111296, 0.00371776806054779, 0.00244450388929537, 0.000457547617282631, -0.00173277574827009, -0.00353452407283131, -0.00443267598659157, -0.00413459386886115, -0.00266184496532312, -0.000360478431462293, 0.0021772594151811, 0.00426288540072539, 0.0052959531471465, 0.00493389901984414, 0.00320017643166622, 0.000497677771766891, -0.00248126963651965, -0.00492936375342225, -0.00614001605795529, -0.00570752792727937, -0.00365602258628823, -0.000457835277224206, 0.00307004710817463, 0.00597019886197399, 0.0073997213922949, 0.00686924708489512, 0.00439974325365178, 0.000549242280085066, -0.00370586626797266, -0.00721179548192942, -0.00894272638461096, -0.00829165452544934, -0.00526660399300662, -0.000532547875086878, 0.00472301576906641, 0.00907673858023533, 0.0112417461408147, 0.0104312705845367, 0.00661496983406746, 0.000590740697333817, -0.00616163347970167, -0.0118234100694596, -0.0147011094902851, -0.0136990889601422, -0.00867632880469538, -0.000583518025127314, 0.00867521986463475, 0.0166455664017127, 0.0209127388526099, 0.0197458915688598, 0.0126412107549783, 0.000620255231632975, -0.0138113026489357, -0.0270648126948551, -0.0351656973101123, -0.034608607153144, -0.0231871681171302, -0.000609710930267988, 0.0312495686033632, 0.068540154400389, 0.106047165135199, 0.138113697235332, 0.159690309909155, 0.167296056442045, 0.159690309909155, 0.138113697235332, 0.106047165135199, 0.068540154400389, 0.0312495686033632, -0.000609710930267988, -0.0231871681171302, -0.034608607153144, -0.0351656973101123, -0.0270648126948551, -0.0138113026489357, 0.000620255231632975, 0.0126412107549783, 0.0197458915688598, 0.0209127388526099, 0.0166455664017127, 0.00867521986463475, -0.000583518025127314, -0.00867632880469538, -0.0136990889601422, -0.0147011094902851, -0.0118234100694596, -0.00616163347970167, 0.000590740697333817, 0.00661496983406746, 0.0104312705845367, 0.0112417461408147, 0.00907673858023533, 0.00472301576906641, -0.000532547875086878, -0.00526660399300662, -0.00829165452544934, -0.00894272638461096, -0.00721179548192942, -0.00370586626797266, 0.000549242280085066, 0.00439974325365178, 0.00686924708489512, 0.0073997213922949, 0.00597019886197399, 0.00307004710817463, -0.000457835277224206, -0.00365602258628823, -0.00570752792727937, -0.00614001605795529, -0.00492936375342225, -0.00248126963651965, 0.000497677771766891, 0.00320017643166622, 0.00493389901984414, 0.0052959531471465, 0.00426288540072539, 0.0021772594151811, -0.000360478431462293, -0.00266184496532312, -0.00413459386886115, -0.00443267598659157, -0.00353452407283131, -0.00173277574827009, 0.000457547617282631, 0.00244450388929537, 0.00371776806054779, 0.00397825327111296, 0.00320634632288325, 0.00165385861939459, -0.000234604666261738, -0.00194699233412351, -0.00304096382795203, -0.00325641958250202, -0.00257522167450623, -0.00121485831818039, 0.000439168652950075, 0.00194184492049259, 0.00290777409047763, 0.00310936887656694, 0.00252936635614802, 0.00135603114358144, -7.51556613982449e-05, -0.00137567471595367, -0.00220785825853134, -0.00237096188701543, -0.00184771919985589, -0.000801024543638398, 0.000476287167908999, 0.00164338834938532, 0.00240244198550353, 0.0025745668027705, 0.00214160371653512, 0.00124435046759751, 0.000139476129831854, -0.000871901084502176, -0.00152432540159653, -0.00165563531566418, -0.00124518891099122, -0.000413891624799732, 0.000612350156896661, 0.00156498025127304, 0.00220380857069712, 0.002378090312042, 0.0020624648189924, 0.00135937038019998, 0.000468746136354272, -0.000366227668523132, -0.000922582550956386, -0.00105386493634165, -0.000725286899147141, -1.96609530164295e-05, 0.000886383326873828, 0.00176888866185394, 0.00241353185687379, 0.002668702190197, 0.00248169594600651, 0.00191003422948133, 0.00110569967612029, 0.00027736003653186, -0.000359911147425032, -0.000635108112698357, -0.000460152577408714, 0.000151033731543792, 0.0010870237418083, 0.00216449626381482, 0.0031684669312984, 0.00389723852449036, 0.00420253903747082, 0.00401604114215622, 0.00335854231296566, 0.00233030090825545, 0.00108705023949854, -0.000192519390129729, -0.00134051984614303, -0.00222724509919168, -0.00277880935351533, -0.00298145086158454, -0.00287455063880954, -0.00253503789295034, -0.00205764875098998, -0.00153555832451148, -0.00104538145419971, -0.000638128130293509, -0.000337235706522446, -0.00015891369722663]
-coefLPF10Hz=[8.56837727902448e-05, 5.03252615753159e-05, -2.96719511594967e-05, -0.000241116318262003, -0.000633528225588087, -0.00123428050286192, -0.0020305012565942, -0.00295664511930533, -0.00389351997003414, -0.0046820536723849, -0.00515186556787708, -0.00515984204353105, -0.00463021845680155, -0.00358494976834094, -0.00215446632808561, -0.000562387575022146, 0.000915501626645667, 0.00201082213460935, 0.00252654306264297, 0.00238870154162528, 0.00167065500094675, 0.000581104678550664, -0.000584393921648404, -0.00151715811851552, -0.00197570079806841, -0.00185069142813272, -0.00119576386778578, -0.000212883172948161, 0.000803786389166993, 0.00155252999439331, 0.00181220791952554, 0.00150839519099173, 0.000737350693012262, -0.000261416094992096, -0.00117638032288774, -0.00171924890832762, -0.00171489837872233, -0.00115847775139572, -0.000220360483061812, 0.000803937245391656, 0.00158504524558605, 0.00186430299958567, 0.00153893062916155, 0.000699636360256242, -0.000392985388249342, -0.00138788260795914, -0.00195497099760407, -0.00189374226154938, -0.00120337231283717, -9.01159105345262e-05, 0.00109291038422457, 0.0019565183088185, 0.00220247275702353, 0.00172544048275416, 0.000655558453834102, -0.000675199724217817, -0.00183481336750887, -0.00243031138353642, -0.0022399654224482, -0.00129413502158791, 0.000123932530209579, 0.00156147923643249, 0.00253954319855061, 0.00271140384187078, 0.0019840300277437, 0.000560475454762049, -0.00111453851092192, -0.00249211905937093, -0.00309776962649431, -0.0026933722193337, -0.00136769624123417, 0.000478056623840521, 0.00224979734614731, 0.00335025146793226, 0.00337870307358253, 0.00227449783980799, 0.000353691473874968, -0.00177865269460636, -0.00341716757959644, -0.00398764655623944, -0.0032459688231611, -0.00137625452394947, 0.00104960045188498, 0.00324428023790929, 0.00445835252418525, 0.00423359425808754, 0.00257169645995118, -4.2630849520674e-05, -0.00277927911547839, -0.00472335861545639, -0.00517797417280577, -0.00390990284280262, -0.00125290464040994, 0.00197360624680288, 0.00471320377690501, 0.00601435576866924, 0.005356110307972, 0.00284768741597045, -0.000771987948539312, -0.00434603639404423, -0.00666394800902989, -0.00686542492719581, -0.00475102124274087, -0.000890009750670168, 0.00352285313606681, 0.00702927784451028, 0.00838085075032678, 0.00697286797844081, 0.00309116125155423, -0.00212268673780385, -0.00699511220418363, -0.00984507532770646, -0.00954878903039852, -0.00595959635369475, -3.29864057599228e-05, 0.00640664494778457, 0.011207523649877, 0.0125851335465786, 0.00975286410938405, 0.00327556307514197, -0.0049935077663616, -0.0124078219139844, -0.0163315532045635, -0.0150192240382477, -0.00829346969769575, 0.00221680140425164, 0.0133977178360257, 0.021486633994894, 0.0232148413823314, 0.016935686062762, 0.00339304822211929, -0.0141369022399032, -0.0304347460666545, -0.0395566578506825, -0.0363929420326244, -0.0181587656253636, 0.0145984026403473, 0.0577812907098201, 0.104422394786122, 0.146130194277676, 0.174961347548926, 0.185254661027688, 0.174961347548926, 0.146130194277676, 0.104422394786122, 0.0577812907098201, 0.0145984026403473, -0.0181587656253636, -0.0363929420326244, -0.0395566578506825, -0.0304347460666545, -0.0141369022399032, 0.00339304822211929, 0.016935686062762, 0.0232148413823314, 0.021486633994894, 0.0133977178360257, 0.00221680140425164, -0.00829346969769575, -0.0150192240382477, -0.0163315532045635, -0.0124078219139844, -0.0049935077663616, 0.00327556307514197, 0.00975286410938405, 0.0125851335465786, 0.011207523649877, 0.00640664494778457, -3.29864057599228e-05, -0.00595959635369475, -0.00954878903039852, -0.00984507532770646, -0.00699511220418363, -0.00212268673780385, 0.00309116125155423, 0.00697286797844081, 0.00838085075032678, 0.00702927784451028, 0.00352285313606681, -0.000890009750670168, -0.00475102124274087, -0.00686542492719581, -0.00666394800902989, -0.00434603639404423, -0.000771987948539312, 0.00284768741597045, 0.005356110307972, 0.00601435576866924, 0.00471320377690501, 0.00197360624680288, -0.00125290464040994, -0.00390990284280262, -0.00517797417280577, -0.00472335861545639, -0.00277927911547839, -4.2630849520674e-05, 0.00257169645995118, 0.00423359425808754, 0.00445835252418525, 0.00324428023790929, 0.00104960045188498, -0.00137625452394947, -0.0032459688231611, -0.00398764655623944, -0.00341716757959644, -0.00177865269460636, 0.000353691473874968, 0.00227449783980799, 0.00337870307358253, 0.00335025146793226, 0.00224979734614731, 0.000478056623840521, -0.00136769624123417, -0.0026933722193337, -0.00309776962649431, -0.00249211905937093, -0.00111453851092192, 0.000560475454762049, 0.0019840300277437, 0.00271140384187078, 0.00253954319855061, 0.00156147923643249, 0.000123932530209579, -0.00129413502158791, -0.0022399654224482, -0.00243031138353642, -0.00183481336750887, -0.000675199724217817, 0.000655558453834102, 0.00172544048275416, 0.00220247275702353, 0.0019565183088185, 0.00109291038422457, -9.01159105345262e-05, -0.00120337231283717, -0.00189374226154938, -0.00195497099760407, -0.00138788260795914, -0.000392985388249342, 0.000699636360256242, 0.00153893062916155, 0.00186430299958567, 0.00158504524558605, 0.000803937245391656, -0.000220360483061812, -0.00115847775139572, -0.00171489837872233, -0.00171924890832762, -0.00117638032288774, -0.000261416094992096, 0.000737350693012262, 0.00150839519099173, 0.00181220791952554, 0.00155252999439331, 0.000803786389166993, -0.000212883172948161, -0.00119576386778578, -0.00185069142813272, -0.00197570079806841, -0.00151715811851552, -0.000584393921648404, 0.000581104678550664, 0.00167065500094675, 0.00238870154162528, 0.00252654306264297, 0.00201082213460935, 0.000915501626645667, -0.000562387575022146, -0.00215446632808561, -0.00358494976834094, -0.00463021845680155, -0.00515984204353105, -0.00515186556787708, -0.0046820536723849, -0.00389351997003414, -0.00295664511930533, -0.0020305012565942, -0.00123428050286192, -0.000633528225588087, -0.000241116318262003, -2.96719511594967e-05, 5.03252615753159e-05, 8.56837727902448e-05]
-coefLPF11Hz=[0.00018951365281227, 0.000454538696836156, 0.000887299815614568, 0.00144546454458715, 0.00204145700358266, 0.00253232125315654, 0.00274457528136075, 0.0025179675210087, 0.00175842817139656, 0.00048436640687738, -0.00115201520199655, -0.00287937357107649, -0.00436221330477358, -0.00528417047741316, -0.00543822998209329, -0.0047953126766947, -0.00352678356378078, -0.00196847125435672, -0.00053151098096598, 0.000415400388008481, 0.000656895249405152, 0.00019778487337803, -0.000738056642433169, -0.00178021803415283, -0.00253408678688203, -0.00271350937133711, -0.00223842143170436, -0.00126246289450752, -0.000119055170192226, 0.000797243109030742, 0.00117305702728229, 0.0008914502602829, 7.71264854318206e-05, -0.000946736013087568, -0.00177636644759643, -0.00207795983629814, -0.0017152561635388, -0.000805379620532552, 0.000320503435569751, 0.00123945669778718, 0.00159781066989595, 0.00125009947146806, 0.000321647783277974, -0.000832068644249653, -0.00175704142135197, -0.00207530754213383, -0.00163587863841023, -0.000581979974976162, 0.000694880367000851, 0.00170037679361847, 0.00202889761641004, 0.00152752308075825, 0.000366534361053218, -0.00101522503225297, -0.00207370756401275, -0.00237155525402668, -0.00175646972232936, -0.000433823200178696, 0.00109997316224435, 0.00224284155387112, 0.00252261326008393, 0.00179114149043149, 0.000297761680105425, -0.00139261864726951, -0.00261114152603631, -0.00284771796276104, -0.00196226975618769, -0.000257658621312989, 0.00162118873315736, 0.00292971900739563, 0.00311732322382959, 0.00205700511708648, 0.00011619288373468, -0.00196717566585007, -0.00336293850443184, -0.00347727759538127, -0.00220229959913839, 1.71842599592136e-05, 0.00233533848047061, 0.0038252582939836, 0.00384717546877637, 0.00231961813293973, -0.000220053669896066, -0.00280051731552141, -0.00438492293550543, -0.00428429686087751, -0.00245233455306991, 0.000462834534913145, 0.00334317726479998, 0.00502582842744848, 0.00476852785804564, 0.00257071816854885, -0.000786287173595275, -0.00401125598515635, -0.00579481484685227, -0.00533563662416722, -0.00269166321779643, 0.00119439667756439, 0.00482392240974834, 0.00671377983361404, 0.00599489166421632, 0.00279929718316614, -0.00173220364859477, -0.00584766851255174, -0.00785207276987055, -0.00679450426236068, -0.00290009276711558, 0.0024428850281452, 0.00716447656538901, 0.00930121698650691, 0.007795928517234, 0.00298969974519441, -0.00341249738716742, -0.00892660719930422, -0.0112313958333583, -0.00911816904992078, -0.00306997478495619, 0.00478982984890789, 0.0114103715108421, 0.0139593146630838, 0.0109847164686637, 0.00313415223318675, -0.00689322912293448, -0.0152149818813128, -0.0181930844029463, -0.0139195899853622, -0.00318904496381429, 0.010472660492083, 0.0218382146184603, 0.0257973635262866, 0.0193748591129611, 0.00322836016314044, -0.0179741494426999, -0.0365544399293191, -0.0439979721277033, -0.0336751196684454, -0.00324777337913687, 0.0440565208342929, 0.0997984149098842, 0.152300537899904, 0.189710748195122, 0.203257143575289, 0.189710748195122, 0.152300537899904, 0.0997984149098842, 0.0440565208342929, -0.00324777337913687, -0.0336751196684454, -0.0439979721277033, -0.0365544399293191, -0.0179741494426999, 0.00322836016314044, 0.0193748591129611, 0.0257973635262866, 0.0218382146184603, 0.010472660492083, -0.00318904496381429, -0.0139195899853622, -0.0181930844029463, -0.0152149818813128, -0.00689322912293448, 0.00313415223318675, 0.0109847164686637, 0.0139593146630838, 0.0114103715108421, 0.00478982984890789, -0.00306997478495619, -0.00911816904992078, -0.0112313958333583, -0.00892660719930422, -0.00341249738716742, 0.00298969974519441, 0.007795928517234, 0.00930121698650691, 0.00716447656538901, 0.0024428850281452, -0.00290009276711558, -0.00679450426236068, -0.00785207276987055, -0.00584766851255174, -0.00173220364859477, 0.00279929718316614, 0.00599489166421632, 0.00671377983361404, 0.00482392240974834, 0.00119439667756439, -0.00269166321779643, -0.00533563662416722, -0.00579481484685227, -0.00401125598515635, -0.000786287173595275, 0.00257071816854885, 0.00476852785804564, 0.00502582842744848, 0.00334317726479998, 0.000462834534913145, -0.00245233455306991, -0.00428429686087751, -0.00438492293550543, -0.00280051731552141, -0.000220053669896066, 0.00231961813293973, 0.00384717546877637, 0.0038252582939836, 0.00233533848047061, 1.71842599592136e-05, -0.00220229959913839, -0.00347727759538127, -0.00336293850443184, -0.00196717566585007, 0.00011619288373468, 0.00205700511708648, 0.00311732322382959, 0.00292971900739563, 0.00162118873315736, -0.000257658621312989, -0.00196226975618769, -0.00284771796276104, -0.00261114152603631, -0.00139261864726951, 0.000297761680105425, 0.00179114149043149, 0.00252261326008393, 0.00224284155387112, 0.00109997316224435, -0.000433823200178696, -0.00175646972232936, -0.00237155525402668, -0.00207370756401275, -0.00101522503225297, 0.000366534361053218, 0.00152752308075825, 0.00202889761641004, 0.00170037679361847, 0.000694880367000851, -0.000581979974976162, -0.00163587863841023, -0.00207530754213383, -0.00175704142135197, -0.000832068644249653, 0.000321647783277974, 0.00125009947146806, 0.00159781066989595, 0.00123945669778718, 0.000320503435569751, -0.000805379620532552, -0.0017152561635388, -0.00207795983629814, -0.00177636644759643, -0.000946736013087568, 7.71264854318206e-05, 0.0008914502602829, 0.00117305702728229, 0.000797243109030742, -0.000119055170192226, -0.00126246289450752, -0.00223842143170436, -0.00271350937133711, -0.00253408678688203, -0.00178021803415283, -0.000738056642433169, 0.00019778487337803, 0.000656895249405152, 0.000415400388008481, -0.00053151098096598, -0.00196847125435672, -0.00352678356378078, -0.0047953126766947, -0.00543822998209329, -0.00528417047741316, -0.00436221330477358, -0.00287937357107649, -0.00115201520199655, 0.00048436640687738, 0.00175842817139656, 0.0025179675210087, 0.00274457528136075, 0.00253232125315654, 0.00204145700358266, 0.00144546454458715, 0.000887299815614568, 0.000454538696836156, 0.00018951365281227]
-coefLPF12Hz=[-7.98720740302863e-05, -7.51024489403882e-06, 0.000192418802301194, 0.00064992210341775, 0.0014286747829008, 0.00251295883697501, 0.00377442162079058, 0.00497222909441207, 0.00579794421923262, 0.00596055388390111, 0.00528876951375247, 0.00381456786152037, 0.00180175706762569, -0.000302288106368034, -0.0019870834745993, -0.00283785829367019, -0.00267834361910166, -0.00164257783227195, -0.000141704242860594, 0.00127095958304502, 0.00209306149565565, 0.00205410323873376, 0.00121430745507489, -6.08229067203119e-05, -0.00124513022790112, -0.00186138423764748, -0.00167296204058761, -0.00077979325243603, 0.000424725623008493, 0.00141901072861941, 0.00177509080714061, 0.00134250533199677, 0.000315123363947893, -0.000850788104204979, -0.00163478536011403, -0.00168204945564047, -0.000964127102290022, 0.000202803274052986, 0.00129381774667891, 0.00180853678242135, 0.00149905137755096, 0.000489301459803112, -0.00077186018844172, -0.00170765192352954, -0.00187511640872704, -0.00117359237495383, 9.76817128288967e-05, 0.00136495598403346, 0.00203682219248737, 0.00177852842449867, 0.00067721616255105, -0.000782920930762669, -0.00193152618685095, -0.00221797766470097, -0.00147380063556012, -6.84819196499907e-06, 0.00152333244683728, 0.00240020197753462, 0.00218399779223201, 0.000929941330871154, -0.000816410379242, -0.00225431262815411, -0.00269316840684784, -0.00188229043266474, -0.000148417317091906, 0.00173221090812812, 0.00287922885816389, 0.00271821517742795, 0.00126542927411467, -0.000852693684159924, -0.0026667563490086, -0.00330581093388585, -0.00241296054680664, -0.000338052638621553, 0.00199405521708386, 0.00349292685343396, 0.00340975654490956, 0.00170767086497151, -0.000886325645951614, -0.00318782505803575, -0.00409258871741, -0.00310282588142789, -0.000592780865125233, 0.00232468668049635, 0.00428755381001833, 0.00431670638714336, 0.00229905019334519, -0.000914318575395121, -0.00386116823241098, -0.0051288028468954, -0.0040260753061015, -0.000949359766021059, 0.00274679027646905, 0.0053397967627351, 0.00553569815725685, 0.00310668407615184, -0.000940981547712581, -0.00477430459651309, -0.00655594974760202, -0.00531614978758609, -0.00146441318937259, 0.00332229594717579, 0.00681903755395317, 0.00727613684577501, 0.00428054050980947, -0.000962380809060649, -0.00609659188987123, -0.00865943952070663, -0.00724583729217298, -0.00224982949436327, 0.00419582995183728, 0.00910909873043246, 0.0100153547241402, 0.00616413340241202, -0.000979105072685627, -0.00825337736646899, -0.0121679063426912, -0.0105369408721285, -0.00363559958187897, 0.00570751096438025, 0.0132170711721963, 0.015065479374603, 0.00974058162392741, -0.000988954442340907, -0.0125502846901014, -0.019411974308358, -0.0175902533828518, -0.00673459905673339, 0.00921052614371684, 0.0232379480108393, 0.0280827613382333, 0.0195534126280813, -0.000997351007342605, -0.0262254034145085, -0.0448019422083151, -0.0453297502384343, -0.0207981014597439, 0.0281244115029862, 0.0923295818960374, 0.156520387879732, 0.203827472644323, 0.221224906527591, 0.203827472644323, 0.156520387879732, 0.0923295818960374, 0.0281244115029862, -0.0207981014597439, -0.0453297502384343, -0.0448019422083151, -0.0262254034145085, -0.000997351007342605, 0.0195534126280813, 0.0280827613382333, 0.0232379480108393, 0.00921052614371684, -0.00673459905673339, -0.0175902533828518, -0.019411974308358, -0.0125502846901014, -0.000988954442340907, 0.00974058162392741, 0.015065479374603, 0.0132170711721963, 0.00570751096438025, -0.00363559958187897, -0.0105369408721285, -0.0121679063426912, -0.00825337736646899, -0.000979105072685627, 0.00616413340241202, 0.0100153547241402, 0.00910909873043246, 0.00419582995183728, -0.00224982949436327, -0.00724583729217298, -0.00865943952070663, -0.00609659188987123, -0.000962380809060649, 0.00428054050980947, 0.00727613684577501, 0.00681903755395317, 0.00332229594717579, -0.00146441318937259, -0.00531614978758609, -0.00655594974760202, -0.00477430459651309, -0.000940981547712581, 0.00310668407615184, 0.00553569815725685, 0.0053397967627351, 0.00274679027646905, -0.000949359766021059, -0.0040260753061015, -0.0051288028468954, -0.00386116823241098, -0.000914318575395121, 0.00229905019334519, 0.00431670638714336, 0.00428755381001833, 0.00232468668049635, -0.000592780865125233, -0.00310282588142789, -0.00409258871741, -0.00318782505803575, -0.000886325645951614, 0.00170767086497151, 0.00340975654490956, 0.00349292685343396, 0.00199405521708386, -0.000338052638621553, -0.00241296054680664, -0.00330581093388585, -0.0026667563490086, -0.000852693684159924, 0.00126542927411467, 0.00271821517742795, 0.00287922885816389, 0.00173221090812812, -0.000148417317091906, -0.00188229043266474, -0.00269316840684784, -0.00225431262815411, -0.000816410379242, 0.000929941330871154, 0.00218399779223201, 0.00240020197753462, 0.00152333244683728, -6.84819196499907e-06, -0.00147380063556012, -0.00221797766470097, -0.00193152618685095, -0.000782920930762669, 0.00067721616255105, 0.00177852842449867, 0.00203682219248737, 0.00136495598403346, 9.76817128288967e-05, -0.00117359237495383, -0.00187511640872704, -0.00170765192352954, -0.00077186018844172, 0.000489301459803112, 0.00149905137755096, 0.00180853678242135, 0.00129381774667891, 0.000202803274052986, -0.000964127102290022, -0.00168204945564047, -0.00163478536011403, -0.000850788104204979, 0.000315123363947893, 0.00134250533199677, 0.00177509080714061, 0.00141901072861941, 0.000424725623008493, -0.00077979325243603, -0.00167296204058761, -0.00186138423764748, -0.00124513022790112, -6.08229067203119e-05, 0.00121430745507489, 0.00205410323873376, 0.00209306149565565, 0.00127095958304502, -0.000141704242860594, -0.00164257783227195, -0.00267834361910166, -0.00283785829367019, -0.0019870834745993, -0.000302288106368034, 0.00180175706762569, 0.00381456786152037, 0.00528876951375247, 0.00596055388390111, 0.00579794421923262, 0.00497222909441207, 0.00377442162079058, 0.00251295883697501, 0.0014286747829008, 0.00064992210341775, 0.000192418802301194, -7.51024489403882e-06, -7.98720740302863e-05]
-coefLPF13Hz=[-0.000228897649288174, -0.000610936474962312, -0.00122121510943424, -0.0019556928199371, -0.00260250161798605, -0.00286901743665096, -0.00247506522299836, -0.00127613220975102, 0.000633761180656174, 0.00289173735425887, 0.00494255350610848, 0.00621059287981065, 0.00631193726671299, 0.00522104742665391, 0.00331286525431161, 0.00124658292020008, -0.000276211623802357, -0.000785567312621617, -0.000232903497711566, 0.000992424820340547, 0.00223544027296029, 0.00286675999613562, 0.0025644434905057, 0.00145633964706698, 5.35771463118319e-05, -0.000997279052172024, -0.00122754149498089, -0.000574539769592514, 0.00058837047838016, 0.00163797523623988, 0.00201403154163983, 0.001503553371283, 0.000351788418841134, -0.000860021164165096, -0.00151201946561804, -0.00126834612179039, -0.000257926180809315, 0.00098436010624147, 0.00179153321217023, 0.00171488152814144, 0.0007678094368789, -0.000569248002600287, -0.00159276491435863, -0.00174675774203685, -0.000926157609479925, 0.000452045335339102, 0.00165616608926067, 0.00202410653263256, 0.00132389971429514, -0.000105000023828346, -0.00151442685028853, -0.00213803571391902, -0.00160703184676844, -0.000166574789533068, 0.00143287158029125, 0.00232361633605298, 0.00198880224594567, 0.000559033819947649, -0.00123139669496389, -0.0024195230480715, -0.00232986303133014, -0.000956182228454055, 0.00100555725589868, 0.00250665119494433, 0.00270371455664057, 0.00142960137045064, -0.000684366934992989, -0.00251772269677397, -0.00305226469392825, -0.00193482257813619, 0.000298186127380602, 0.00247328066992915, 0.003393578814263, 0.00249431591234062, 0.000182780013716378, -0.0023387984263394, -0.00369505342972367, -0.00308431322412738, -0.000746743580870536, 0.00211668097118396, 0.0039568372891446, 0.00371057404255171, 0.00140927346323513, -0.00178359442846391, -0.00415518644310258, -0.00435746622939999, -0.00216744038504935, 0.00133217517193472, 0.00428099193982169, 0.00502427052472503, 0.0030348137853779, -0.000736633758972363, -0.00430555321152019, -0.00569082331025166, -0.00400662151968979, -1.14669904846721e-05, 0.00421767176247715, 0.00635583445595122, 0.00509823547694408, 0.000939643338965357, -0.00399227167518159, -0.00701346692818099, -0.00633162507023042, -0.00209119534161266, 0.00358458466885288, 0.00764032353721147, 0.00771655926565049, 0.00350048424297646, -0.00296244436976713, -0.00823701050498482, -0.00930099883442186, -0.0052480157912094, 0.00205387357445889, 0.00878605930657779, 0.0111429703845488, 0.00744233412389237, -0.000766704034000787, -0.00928726879874242, -0.0133696749975632, -0.0102963732975334, -0.00108204421220948, 0.00972322513591604, 0.0161981820344168, 0.0141906322582779, 0.00381899825910596, -0.0100933990417118, -0.0201125057712179, -0.0199707627640931, -0.00819323684202035, 0.010386436432182, 0.0262961767942236, 0.0298283180307933, 0.0162677600609886, -0.0106000937581638, -0.0386797262385214, -0.0518392934853887, -0.0367307567920421, 0.0107290923793027, 0.0821955254523055, 0.158747549052625, 0.217317912175484, 0.23922500715195, 0.217317912175484, 0.158747549052625, 0.0821955254523055, 0.0107290923793027, -0.0367307567920421, -0.0518392934853887, -0.0386797262385214, -0.0106000937581638, 0.0162677600609886, 0.0298283180307933, 0.0262961767942236, 0.010386436432182, -0.00819323684202035, -0.0199707627640931, -0.0201125057712179, -0.0100933990417118, 0.00381899825910596, 0.0141906322582779, 0.0161981820344168, 0.00972322513591604, -0.00108204421220948, -0.0102963732975334, -0.0133696749975632, -0.00928726879874242, -0.000766704034000787, 0.00744233412389237, 0.0111429703845488, 0.00878605930657779, 0.00205387357445889, -0.0052480157912094, -0.00930099883442186, -0.00823701050498482, -0.00296244436976713, 0.00350048424297646, 0.00771655926565049, 0.00764032353721147, 0.00358458466885288, -0.00209119534161266, -0.00633162507023042, -0.00701346692818099, -0.00399227167518159, 0.000939643338965357, 0.00509823547694408, 0.00635583445595122, 0.00421767176247715, -1.14669904846721e-05, -0.00400662151968979, -0.00569082331025166, -0.00430555321152019, -0.000736633758972363, 0.0030348137853779, 0.00502427052472503, 0.00428099193982169, 0.00133217517193472, -0.00216744038504935, -0.00435746622939999, -0.00415518644310258, -0.00178359442846391, 0.00140927346323513, 0.00371057404255171, 0.0039568372891446, 0.00211668097118396, -0.000746743580870536, -0.00308431322412738, -0.00369505342972367, -0.0023387984263394, 0.000182780013716378, 0.00249431591234062, 0.003393578814263, 0.00247328066992915, 0.000298186127380602, -0.00193482257813619, -0.00305226469392825, -0.00251772269677397, -0.000684366934992989, 0.00142960137045064, 0.00270371455664057, 0.00250665119494433, 0.00100555725589868, -0.000956182228454055, -0.00232986303133014, -0.0024195230480715, -0.00123139669496389, 0.000559033819947649, 0.00198880224594567, 0.00232361633605298, 0.00143287158029125, -0.000166574789533068, -0.00160703184676844, -0.00213803571391902, -0.00151442685028853, -0.000105000023828346, 0.00132389971429514, 0.00202410653263256, 0.00165616608926067, 0.000452045335339102, -0.000926157609479925, -0.00174675774203685, -0.00159276491435863, -0.000569248002600287, 0.0007678094368789, 0.00171488152814144, 0.00179153321217023, 0.00098436010624147, -0.000257926180809315, -0.00126834612179039, -0.00151201946561804, -0.000860021164165096, 0.000351788418841134, 0.001503553371283, 0.00201403154163983, 0.00163797523623988, 0.00058837047838016, -0.000574539769592514, -0.00122754149498089, -0.000997279052172024, 5.35771463118319e-05, 0.00145633964706698, 0.0025644434905057, 0.00286675999613562, 0.00223544027296029, 0.000992424820340547, -0.000232903497711566, -0.000785567312621617, -0.000276211623802357, 0.00124658292020008, 0.00331286525431161, 0.00522104742665391, 0.00631193726671299, 0.00621059287981065, 0.00494255350610848, 0.00289173735425887, 0.000633761180656174, -0.00127613220975102, -0.00247506522299836, -0.00286901743665096, -0.00260250161798605, -0.0019556928199371, -0.00122121510943424, -0.000610936474962312, -0.000228897649288174]
-coefLPF14Hz=[7.59719499966504e-05, -4.44151659851562e-05, -0.000414455510647422, -0.00121779088401224, -0.00250044001385466, -0.00411068188652321, -0.00567135375250476, -0.00666184539013065, -0.00660471396556221, -0.00529124957567274, -0.00293967598017365, -0.000188692010607066, 0.00210626119638915, 0.00320967760117246, 0.00283067900251936, 0.00127479969870261, -0.000670463074387681, -0.00208423739742653, -0.00233871198976512, -0.00139387289424269, 0.000194399882833926, 0.0015670118851106, 0.00201120801593082, 0.00133240467593452, -5.10404078152188e-05, -0.00134543478122376, -0.00182544936493176, -0.00123869394179143, 5.50215457603088e-05, 0.00129300040188141, 0.00175060943882142, 0.00116323946898668, -0.000117080471043291, -0.00132573634976534, -0.00173635693343399, -0.00109528846852742, 0.000219526244393322, 0.00141639276708159, 0.00176189090726933, 0.00102812537359006, -0.000356856740961135, -0.00155494438830584, -0.0018215377776589, -0.000966223861527843, 0.000513573245900912, 0.00171866792575128, 0.00189160356715606, 0.000890891079552617, -0.000700051574428579, -0.0019097327947681, -0.00196900474078983, -0.000797778733484344, 0.000918755727735831, 0.00212791177356544, 0.00205254019559765, 0.000687857820824945, -0.00116391985781216, -0.00236229803537804, -0.00212847778718098, -0.000548673739472979, 0.00144292184573775, 0.0026133968594557, 0.00219171245068146, 0.00037302269726535, -0.00176101272040354, -0.00288218545674577, -0.00223935833365404, -0.000156880881897088, 0.00212023476733601, 0.00316714809050853, 0.0022673752353479, -0.000103293775429808, -0.00252043340061551, -0.00346320767316996, -0.00226758316444185, 0.000414545759459846, 0.0029630975369387, 0.00376417809487352, 0.00222771934178548, -0.000790570703462215, -0.00345798106688324, -0.00407260054137047, -0.00214364679062192, 0.00123822711731731, 0.00400959173545152, 0.00438752468540867, 0.00200976214479977, -0.00176325420070107, -0.0046182242724715, -0.00470060533476819, -0.00181082504352625, 0.00238137866851969, 0.0052920136608586, 0.00500719667154733, 0.00153050791820174, -0.003112879613596, -0.00604436226923854, -0.00530563667870381, -0.00115165885369816, 0.00398179218892462, 0.00689235886684624, 0.00559460982293757, 0.000652797364637561, -0.0050191086196987, -0.00785793457764147, -0.00587064083468568, -1.74800127189767e-06, 0.00627109549796959, 0.00897422275826566, 0.00612840554830168, -0.000851934564533339, -0.00781233203960593, -0.0102977220597486, -0.00636468574062392, 0.00198498387399885, 0.00976215473662253, 0.0119221560399182, 0.0065759283381627, -0.00352675277750063, -0.0123281019983098, -0.0140158166077163, -0.00675888006732885, 0.00571457739125911, 0.0159046033734242, 0.0169105829688646, 0.0069129002306592, -0.00903472724430362, -0.0213353817532462, -0.0213471126952389, -0.00703622571298659, 0.0146838202469942, 0.0308200475041727, 0.0293888751984194, 0.00712515322182601, -0.0266005242223105, -0.0524398585534023, -0.0497230407599836, -0.00717739045029881, 0.0697286304640985, 0.15894987694996, 0.230092896843345, 0.257194244700308, 0.230092896843345, 0.15894987694996, 0.0697286304640985, -0.00717739045029881, -0.0497230407599836, -0.0524398585534023, -0.0266005242223105, 0.00712515322182601, 0.0293888751984194, 0.0308200475041727, 0.0146838202469942, -0.00703622571298659, -0.0213471126952389, -0.0213353817532462, -0.00903472724430362, 0.0069129002306592, 0.0169105829688646, 0.0159046033734242, 0.00571457739125911, -0.00675888006732885, -0.0140158166077163, -0.0123281019983098, -0.00352675277750063, 0.0065759283381627, 0.0119221560399182, 0.00976215473662253, 0.00198498387399885, -0.00636468574062392, -0.0102977220597486, -0.00781233203960593, -0.000851934564533339, 0.00612840554830168, 0.00897422275826566, 0.00627109549796959, -1.74800127189767e-06, -0.00587064083468568, -0.00785793457764147, -0.0050191086196987, 0.000652797364637561, 0.00559460982293757, 0.00689235886684624, 0.00398179218892462, -0.00115165885369816, -0.00530563667870381, -0.00604436226923854, -0.003112879613596, 0.00153050791820174, 0.00500719667154733, 0.0052920136608586, 0.00238137866851969, -0.00181082504352625, -0.00470060533476819, -0.0046182242724715, -0.00176325420070107, 0.00200976214479977, 0.00438752468540867, 0.00400959173545152, 0.00123822711731731, -0.00214364679062192, -0.00407260054137047, -0.00345798106688324, -0.000790570703462215, 0.00222771934178548, 0.00376417809487352, 0.0029630975369387, 0.000414545759459846, -0.00226758316444185, -0.00346320767316996, -0.00252043340061551, -0.000103293775429808, 0.0022673752353479, 0.00316714809050853, 0.00212023476733601, -0.000156880881897088, -0.00223935833365404, -0.00288218545674577, -0.00176101272040354, 0.00037302269726535, 0.00219171245068146, 0.0026133968594557, 0.00144292184573775, -0.000548673739472979, -0.00212847778718098, -0.00236229803537804, -0.00116391985781216, 0.000687857820824945, 0.00205254019559765, 0.00212791177356544, 0.000918755727735831, -0.000797778733484344, -0.00196900474078983, -0.0019097327947681, -0.000700051574428579, 0.000890891079552617, 0.00189160356715606, 0.00171866792575128, 0.000513573245900912, -0.000966223861527843, -0.0018215377776589, -0.00155494438830584, -0.000356856740961135, 0.00102812537359006, 0.00176189090726933, 0.00141639276708159, 0.000219526244393322, -0.00109528846852742, -0.00173635693343399, -0.00132573634976534, -0.000117080471043291, 0.00116323946898668, 0.00175060943882142, 0.00129300040188141, 5.50215457603088e-05, -0.00123869394179143, -0.00182544936493176, -0.00134543478122376, -5.10404078152188e-05, 0.00133240467593452, 0.00201120801593082, 0.0015670118851106, 0.000194399882833926, -0.00139387289424269, -0.00233871198976512, -0.00208423739742653, -0.000670463074387681, 0.00127479969870261, 0.00283067900251936, 0.00320967760117246, 0.00210626119638915, -0.000188692010607066, -0.00293967598017365, -0.00529124957567274, -0.00660471396556221, -0.00666184539013065, -0.00567135375250476, -0.00411068188652321, -0.00250044001385466, -0.00121779088401224, -0.000414455510647422, -4.44151659851562e-05, 7.59719499966504e-05]
-coefLPF15Hz=[0.000281507332792115, 0.000827801846028885, 0.00168884197491566, 0.00264307708858891, 0.00326739620836809, 0.00306390298581617, 0.00170521546646595, -0.000722685563564361, -0.00362924887032057, -0.00607896468313642, -0.00717506928947776, -0.00649824221449735, -0.00436452710417264, -0.00173088017435798, 0.000244321747525881, 0.000776704936290286, -0.000143508640899572, -0.00176187477466686, -0.00299407354926966, -0.0030478682163959, -0.0018729613855278, -0.000168864448005742, 0.001058471797867, 0.00112360385687828, 8.44391357365413e-05, -0.00130585149242333, -0.00208979662267417, -0.00172674284529262, -0.000442536399213901, 0.000923163227138322, 0.00147628067029619, 0.000867423284538268, -0.000469479271697276, -0.00160470077899556, -0.00174057607803622, -0.000759094363657526, 0.000686479997475682, 0.00160880249459721, 0.0013637200554634, 0.000105625001388002, -0.00130060531972293, -0.00186507199778999, -0.00116232366033145, 0.000353656397531082, 0.00164147221884191, 0.00178666134097444, 0.000650791445269839, -0.00100387568405197, -0.00202096205461194, -0.00165366514622297, -0.000109015092895007, 0.0015623620541216, 0.00217874137951331, 0.00126115265681823, -0.00059798725926458, -0.00211222253318775, -0.00218743831765301, -0.000708737912286813, 0.00133607877620469, 0.00251292242162038, 0.0019442604262928, -4.07379832797683e-05, -0.0020876675956404, -0.00273763106131705, -0.00146378003166411, 0.000910575469151703, 0.00273870431711551, 0.00268920223918894, 0.0007117552344593, -0.00186785168111205, -0.00323177494845559, -0.00234710048740998, 0.000258571717473606, 0.0028010795043505, 0.00345692490856506, 0.00166660642276018, -0.00140423677700075, -0.00361636367343229, -0.00334198707338466, -0.000655945345528402, 0.00263428695631119, 0.00419839888868334, 0.00282771329792208, -0.000642015384347504, -0.00382681627577899, -0.00442578445132533, -0.00187598994238782, 0.00215404877653518, 0.00484597813463207, 0.004194584923835, 0.000490524737649645, -0.00376607661516661, -0.00554276735014871, -0.00342480118074483, 0.00127919993100149, 0.00532681517653598, 0.0057648296112805, 0.0020699010743914, -0.00333502131362591, -0.0066526420548326, -0.00536379432840906, -0.000118285018972326, 0.00554019304650542, 0.00754862297832381, 0.00422085039076958, -0.00238434802935544, -0.00770429338558801, -0.00779872803713855, -0.00223667887254828, 0.00534933151417159, 0.00960045919213852, 0.0071804318647742, -0.000661400416543387, -0.00864500471580584, -0.0109671154306442, -0.00546284575889086, 0.00452378270216211, 0.012093898279842, 0.0114855937060687, 0.00236138446769012, -0.00943184821023292, -0.0155031842354748, -0.0107597549755232, 0.00253248859959299, 0.0155718840792025, 0.0186627909751995, 0.00817195934374253, -0.0100253528809224, -0.0235029544640301, -0.021367966921898, -0.0024391118428969, 0.0222292993620872, 0.0350903104159208, 0.0234472219777699, -0.0103931156574998, -0.047071458132566, -0.0587969256658582, -0.0247534065262515, 0.0552374816733322, 0.157123001660597, 0.242156591108602, 0.275196892291637, 0.242156591108602, 0.157123001660597, 0.0552374816733322, -0.0247534065262515, -0.0587969256658582, -0.047071458132566, -0.0103931156574998, 0.0234472219777699, 0.0350903104159208, 0.0222292993620872, -0.0024391118428969, -0.021367966921898, -0.0235029544640301, -0.0100253528809224, 0.00817195934374253, 0.0186627909751995, 0.0155718840792025, 0.00253248859959299, -0.0107597549755232, -0.0155031842354748, -0.00943184821023292, 0.00236138446769012, 0.0114855937060687, 0.012093898279842, 0.00452378270216211, -0.00546284575889086, -0.0109671154306442, -0.00864500471580584, -0.000661400416543387, 0.0071804318647742, 0.00960045919213852, 0.00534933151417159, -0.00223667887254828, -0.00779872803713855, -0.00770429338558801, -0.00238434802935544, 0.00422085039076958, 0.00754862297832381, 0.00554019304650542, -0.000118285018972326, -0.00536379432840906, -0.0066526420548326, -0.00333502131362591, 0.0020699010743914, 0.0057648296112805, 0.00532681517653598, 0.00127919993100149, -0.00342480118074483, -0.00554276735014871, -0.00376607661516661, 0.000490524737649645, 0.004194584923835, 0.00484597813463207, 0.00215404877653518, -0.00187598994238782, -0.00442578445132533, -0.00382681627577899, -0.000642015384347504, 0.00282771329792208, 0.00419839888868334, 0.00263428695631119, -0.000655945345528402, -0.00334198707338466, -0.00361636367343229, -0.00140423677700075, 0.00166660642276018, 0.00345692490856506, 0.0028010795043505, 0.000258571717473606, -0.00234710048740998, -0.00323177494845559, -0.00186785168111205, 0.0007117552344593, 0.00268920223918894, 0.00273870431711551, 0.000910575469151703, -0.00146378003166411, -0.00273763106131705, -0.0020876675956404, -4.07379832797683e-05, 0.0019442604262928, 0.00251292242162038, 0.00133607877620469, -0.000708737912286813, -0.00218743831765301, -0.00211222253318775, -0.00059798725926458, 0.00126115265681823, 0.00217874137951331, 0.0015623620541216, -0.000109015092895007, -0.00165366514622297, -0.00202096205461194, -0.00100387568405197, 0.000650791445269839, 0.00178666134097444, 0.00164147221884191, 0.000353656397531082, -0.00116232366033145, -0.00186507199778999, -0.00130060531972293, 0.000105625001388002, 0.0013637200554634, 0.00160880249459721, 0.000686479997475682, -0.000759094363657526, -0.00174057607803622, -0.00160470077899556, -0.000469479271697276, 0.000867423284538268, 0.00147628067029619, 0.000923163227138322, -0.000442536399213901, -0.00172674284529262, -0.00208979662267417, -0.00130585149242333, 8.44391357365413e-05, 0.00112360385687828, 0.001058471797867, -0.000168864448005742, -0.0018729613855278, -0.0030478682163959, -0.00299407354926966, -0.00176187477466686, -0.000143508640899572, 0.000776704936290286, 0.000244321747525881, -0.00173088017435798, -0.00436452710417264, -0.00649824221449735, -0.00717506928947776, -0.00607896468313642, -0.00362924887032057, -0.000722685563564361, 0.00170521546646595, 0.00306390298581617, 0.00326739620836809, 0.00264307708858891, 0.00168884197491566, 0.000827801846028885, 0.000281507332792115]
-coefLPF16Hz=[-7.59895874876788e-05, 0.000100259204953602, 0.000692829254913131, 0.0019441681954663, 0.00381637350903506, 0.0058744741566122, 0.00734230595634683, 0.00741507139356277, 0.00571124720414873, 0.00260798449331622, -0.000792198485810488, -0.00313178334741817, -0.00349804751507121, -0.00195295877711896, 0.000458463197743511, 0.00228170697339596, 0.00249688609819849, 0.00111676574627594, -0.0008537727706388, -0.00208895093772461, -0.00181633463639602, -0.000312725872163341, 0.00131521666706394, 0.00191772747891264, 0.00110873799979418, -0.000476622208946278, -0.00165725739922942, -0.00157319593775123, -0.000313091748938196, 0.00115914014413242, 0.00172870695281212, 0.000968894378529315, -0.000534596617805175, -0.00162537569991982, -0.00145785637193819, -0.000151489975635553, 0.00128904925275902, 0.00173980938613213, 0.000830837613816564, -0.000749601777760078, -0.00177087725594681, -0.00141375160179756, 7.3956003280196e-05, 0.00154353347540936, 0.00182758625635222, 0.000664021236565611, -0.0010670213178986, -0.00200455802183707, -0.00137283117232859, 0.000380006588012097, 0.00189443752010379, 0.00195025594664539, 0.000446408793029392, -0.00147452310119988, -0.00229063045150342, -0.00130324310657337, 0.000769911701815247, 0.00231090370651535, 0.00206059553104328, 0.000143673028679145, -0.00197188791075072, -0.00259474840694825, -0.00115844914630601, 0.00127378474271239, 0.0027906459448532, 0.00213072065024448, -0.000274003505989288, -0.00256831244565625, -0.00290065280613164, -0.000912811160237516, 0.00190256285763811, 0.00331699685406944, 0.00212559769382749, -0.000834594268310656, -0.00326205326357134, -0.00317495661487267, -0.000523205655694659, 0.00267830481487183, 0.00387386322099091, 0.00200108906766129, -0.00157923326803069, -0.00406133179737547, -0.00338633225048125, 5.90157741181317e-05, 0.00363143556475096, 0.00445063264999723, 0.00171292625661611, -0.00255274217877771, -0.00497681781210177, -0.00350152472821411, 0.000886850812014205, 0.00479309373028907, 0.00502874640266437, 0.00120202088456588, -0.00381179670756732, -0.0060157898637779, -0.0034637031855294, 0.00204772353885983, 0.00621866291176886, 0.00558390578784603, 0.000370631799268831, -0.00546423242674014, -0.00721581783467703, -0.00320205923147942, 0.00368081347841597, 0.00801634203715971, 0.00610273903888793, -0.0009251055825613, -0.00768990550986174, -0.00865118868859299, -0.00260184470673488, 0.00603497953985235, 0.0103903460320685, 0.00656107315784254, -0.00297528770143742, -0.010868270038839, -0.0104917695279261, -0.00141979402681962, 0.00967677760643358, 0.0138383260173732, 0.00693560145260845, -0.00646899650555006, -0.0159683613921921, -0.0132248569427015, 0.000946490956773001, 0.0161646441319668, 0.0198319390534626, 0.00721643705375153, -0.0135462325049752, -0.0262366150920183, -0.0186290934356359, 0.0067428424755601, 0.0319061981246486, 0.0350358557106302, 0.00739254960264776, -0.036354478307971, -0.0631930788040562, -0.0410371674079711, 0.0391920068231021, 0.153297362655787, 0.253426175054981, 0.293166678870673, 0.253426175054981, 0.153297362655787, 0.0391920068231021, -0.0410371674079711, -0.0631930788040562, -0.036354478307971, 0.00739254960264776, 0.0350358557106302, 0.0319061981246486, 0.0067428424755601, -0.0186290934356359, -0.0262366150920183, -0.0135462325049752, 0.00721643705375153, 0.0198319390534626, 0.0161646441319668, 0.000946490956773001, -0.0132248569427015, -0.0159683613921921, -0.00646899650555006, 0.00693560145260845, 0.0138383260173732, 0.00967677760643358, -0.00141979402681962, -0.0104917695279261, -0.010868270038839, -0.00297528770143742, 0.00656107315784254, 0.0103903460320685, 0.00603497953985235, -0.00260184470673488, -0.00865118868859299, -0.00768990550986174, -0.0009251055825613, 0.00610273903888793, 0.00801634203715971, 0.00368081347841597, -0.00320205923147942, -0.00721581783467703, -0.00546423242674014, 0.000370631799268831, 0.00558390578784603, 0.00621866291176886, 0.00204772353885983, -0.0034637031855294, -0.0060157898637779, -0.00381179670756732, 0.00120202088456588, 0.00502874640266437, 0.00479309373028907, 0.000886850812014205, -0.00350152472821411, -0.00497681781210177, -0.00255274217877771, 0.00171292625661611, 0.00445063264999723, 0.00363143556475096, 5.90157741181317e-05, -0.00338633225048125, -0.00406133179737547, -0.00157923326803069, 0.00200108906766129, 0.00387386322099091, 0.00267830481487183, -0.000523205655694659, -0.00317495661487267, -0.00326205326357134, -0.000834594268310656, 0.00212559769382749, 0.00331699685406944, 0.00190256285763811, -0.000912811160237516, -0.00290065280613164, -0.00256831244565625, -0.000274003505989288, 0.00213072065024448, 0.0027906459448532, 0.00127378474271239, -0.00115844914630601, -0.00259474840694825, -0.00197188791075072, 0.000143673028679145, 0.00206059553104328, 0.00231090370651535, 0.000769911701815247, -0.00130324310657337, -0.00229063045150342, -0.00147452310119988, 0.000446408793029392, 0.00195025594664539, 0.00189443752010379, 0.000380006588012097, -0.00137283117232859, -0.00200455802183707, -0.0010670213178986, 0.000664021236565611, 0.00182758625635222, 0.00154353347540936, 7.3956003280196e-05, -0.00141375160179756, -0.00177087725594681, -0.000749601777760078, 0.000830837613816564, 0.00173980938613213, 0.00128904925275902, -0.000151489975635553, -0.00145785637193819, -0.00162537569991982, -0.000534596617805175, 0.000968894378529315, 0.00172870695281212, 0.00115914014413242, -0.000313091748938196, -0.00157319593775123, -0.00165725739922942, -0.000476622208946278, 0.00110873799979418, 0.00191772747891264, 0.00131521666706394, -0.000312725872163341, -0.00181633463639602, -0.00208895093772461, -0.0008537727706388, 0.00111676574627594, 0.00249688609819849, 0.00228170697339596, 0.000458463197743511, -0.00195295877711896, -0.00349804751507121, -0.00313178334741817, -0.000792198485810488, 0.00260798449331622, 0.00571124720414873, 0.00741507139356277, 0.00734230595634683, 0.0058744741566122, 0.00381637350903506, 0.0019441681954663, 0.000692829254913131, 0.000100259204953602, -7.59895874876788e-05]
-coefLPF17Hz=[-0.000355200887318519, -0.00114398296071603, -0.00238555110783671, -0.00365679490597255, -0.00419918875209898, -0.00326782570757757, -0.000650946066661786, 0.0029842440509138, 0.00624072546566327, 0.0076745118581666, 0.00665567754591225, 0.00384060073277498, 0.000863468864578262, -0.000638257301058797, -5.29404458221814e-05, 0.00183507357642997, 0.00342752311041053, 0.00346038802340037, 0.00189603322938774, -9.93747749592351e-05, -0.00107837103730639, -0.000430787099559152, 0.00116639568241625, 0.0023167382229212, 0.00203564973337929, 0.000536578714256819, -0.000964125958479932, -0.00126337920871114, -0.000171751679774561, 0.00133314325497977, 0.00193325363480789, 0.00108760843688938, -0.000503544940763304, -0.00149119449818044, -0.00103390099089431, 0.000467436047722687, 0.00169850671868451, 0.00156058429163474, 0.000135087729115389, -0.00136184297141644, -0.00162051053091465, -0.000388530459506496, 0.00127698769745895, 0.00190515181982672, 0.000900431907886174, -0.000901510343055019, -0.00192798053557331, -0.00124148027422954, 0.000603730405623241, 0.0020007127395078, 0.00168266451282548, -0.000134191005073863, -0.00188596038238091, -0.00200469493079569, -0.000319710292684606, 0.00173259202698679, 0.00232736327049737, 0.000868640017491118, -0.00142461994588951, -0.00253273764932909, -0.00141090521326085, 0.0010313342093764, 0.00265964489924491, 0.0019752805415819, -0.000511423804814274, -0.00264856415666129, -0.00250037063735454, -9.56553971982215e-05, 0.00250785222284331, 0.00297874451863132, 0.000794525036442017, -0.00220429687695808, -0.00335816882693749, -0.00154165542935606, 0.0017514476785316, 0.00362710303699288, 0.00232814303435263, -0.00112930234139032, -0.0037359920049033, -0.00310189023737958, 0.000360996329529434, 0.0036713004447598, 0.0038365956226197, 0.0005493905338351, -0.00340040863947127, -0.00448337387179621, -0.00157513718973292, 0.00290571846542607, 0.00499548772926992, 0.00268078198446305, -0.0021815048571226, -0.00533429606103233, -0.00383507227862003, 0.00121520604514539, 0.00544486063853201, 0.0049805632734772, -2.35030268395568e-05, -0.00529633649170561, -0.00607638313930428, -0.00139114919652399, 0.00483862555277673, 0.00705537058892475, 0.00299876134611359, -0.00404213362841326, -0.00786091645501446, -0.00477513227750902, 0.00286817785899081, 0.00842153845392614, 0.00668142214210634, -0.00128413628273017, -0.00866169920397138, -0.00867218359357779, -0.000742405728144279, 0.00849952756000148, 0.0106989426961259, 0.00325277066470258, -0.00783765064630712, -0.0127088496005546, -0.00630647185494242, 0.00655089617532012, 0.0146429441636169, 0.00999478769496155, -0.00447398405962658, -0.0164557924678238, -0.0145071070691002, 0.00131949786470045, 0.0180858733154002, 0.0201948731482198, 0.00341672782520116, -0.0194955906410265, -0.0278681234126113, -0.0108625205359292, 0.020638063739065, 0.0396004499483765, 0.024064428670499, -0.0214781707534648, -0.0625811567200195, -0.055257027790367, 0.0219974141047428, 0.147509314547477, 0.263905241239517, 0.311166257832287, 0.263905241239517, 0.147509314547477, 0.0219974141047428, -0.055257027790367, -0.0625811567200195, -0.0214781707534648, 0.024064428670499, 0.0396004499483765, 0.020638063739065, -0.0108625205359292, -0.0278681234126113, -0.0194955906410265, 0.00341672782520116, 0.0201948731482198, 0.0180858733154002, 0.00131949786470045, -0.0145071070691002, -0.0164557924678238, -0.00447398405962658, 0.00999478769496155, 0.0146429441636169, 0.00655089617532012, -0.00630647185494242, -0.0127088496005546, -0.00783765064630712, 0.00325277066470258, 0.0106989426961259, 0.00849952756000148, -0.000742405728144279, -0.00867218359357779, -0.00866169920397138, -0.00128413628273017, 0.00668142214210634, 0.00842153845392614, 0.00286817785899081, -0.00477513227750902, -0.00786091645501446, -0.00404213362841326, 0.00299876134611359, 0.00705537058892475, 0.00483862555277673, -0.00139114919652399, -0.00607638313930428, -0.00529633649170561, -2.35030268395568e-05, 0.0049805632734772, 0.00544486063853201, 0.00121520604514539, -0.00383507227862003, -0.00533429606103233, -0.0021815048571226, 0.00268078198446305, 0.00499548772926992, 0.00290571846542607, -0.00157513718973292, -0.00448337387179621, -0.00340040863947127, 0.0005493905338351, 0.0038365956226197, 0.0036713004447598, 0.000360996329529434, -0.00310189023737958, -0.0037359920049033, -0.00112930234139032, 0.00232814303435263, 0.00362710303699288, 0.0017514476785316, -0.00154165542935606, -0.00335816882693749, -0.00220429687695808, 0.000794525036442017, 0.00297874451863132, 0.00250785222284331, -9.56553971982215e-05, -0.00250037063735454, -0.00264856415666129, -0.000511423804814274, 0.0019752805415819, 0.00265964489924491, 0.0010313342093764, -0.00141090521326085, -0.00253273764932909, -0.00142461994588951, 0.000868640017491118, 0.00232736327049737, 0.00173259202698679, -0.000319710292684606, -0.00200469493079569, -0.00188596038238091, -0.000134191005073863, 0.00168266451282548, 0.0020007127395078, 0.000603730405623241, -0.00124148027422954, -0.00192798053557331, -0.000901510343055019, 0.000900431907886174, 0.00190515181982672, 0.00127698769745895, -0.000388530459506496, -0.00162051053091465, -0.00136184297141644, 0.000135087729115389, 0.00156058429163474, 0.00169850671868451, 0.000467436047722687, -0.00103390099089431, -0.00149119449818044, -0.000503544940763304, 0.00108760843688938, 0.00193325363480789, 0.00133314325497977, -0.000171751679774561, -0.00126337920871114, -0.000964125958479932, 0.000536578714256819, 0.00203564973337929, 0.0023167382229212, 0.00116639568241625, -0.000430787099559152, -0.00107837103730639, -9.93747749592351e-05, 0.00189603322938774, 0.00346038802340037, 0.00342752311041053, 0.00183507357642997, -5.29404458221814e-05, -0.000638257301058797, 0.000863468864578262, 0.00384060073277498, 0.00665567754591225, 0.0076745118581666, 0.00624072546566327, 0.0029842440509138, -0.000650946066661786, -0.00326782570757757, -0.00419918875209898, -0.00365679490597255, -0.00238555110783671, -0.00114398296071603, -0.000355200887318519]
-coefLPF18Hz=[8.29286929908569e-05, -0.000150380552386712, -0.00101496819175829, -0.00281071634845042, -0.00530720917066848, -0.00759276097360147, -0.00838943185976378, -0.00682157856926372, -0.00317037751652148, 0.00100640068546268, 0.00366382810250035, 0.00356095373775103, 0.0011504644410144, -0.00166969778810695, -0.00287236812116072, -0.00175401904100134, 0.000597927979666603, 0.00222050948918815, 0.00186579313953368, -2.16744742546652e-05, -0.0017452567881921, -0.00183651913001252, -0.000305405393646099, 0.0014175631989528, 0.00178409644288501, 0.000512474613395726, -0.00118607372454364, -0.00173680065075813, -0.000652996831567955, 0.0010247826402383, 0.0017094027868514, 0.000758736172554422, -0.000917658249932699, -0.00171624440295741, -0.000864233035150298, 0.00083189144694599, 0.00174164092994868, 0.000971065449844266, -0.000758979587857901, -0.00177992352522619, -0.00107798085952442, 0.000701492046565265, 0.00184140501414974, 0.00120428195947104, -0.00063540539506504, -0.00190273263361918, -0.0013293742583107, 0.00058058019415179, 0.0019862723097699, 0.00147902189863808, -0.000510496854268391, -0.00206883159103901, -0.0016356245593574, 0.000438113619439677, 0.00216145419601366, 0.00181018759749869, -0.000352792280817488, -0.0022556384985734, -0.00199759116977599, 0.000256805932883705, 0.00235253999481109, 0.00219906435658151, -0.000149199029005401, -0.00245254167275093, -0.00241649123922977, 2.79949928468428e-05, 0.00255550619217483, 0.00265227307436536, 0.000110438761003445, -0.00265880224081558, -0.00290585457881367, -0.000266488980084547, 0.00276335365634457, 0.00318058468890063, 0.000444757968447576, -0.00286565811850849, -0.00347533947603152, -0.000645569490295155, 0.00296589728311132, 0.00379147775696166, 0.000869841539648486, -0.00306595142195872, -0.00413411461018567, -0.00112348329423858, 0.00316233661218917, 0.00450283811814615, 0.00140611642052851, -0.0032594213942315, -0.0049067960947545, -0.00172780250040746, 0.00335148316976547, 0.00534609419626586, 0.0020903236248458, -0.00344105468563205, -0.00582918547265532, -0.00250291007739339, 0.00352535676360736, 0.0063613486449496, 0.00297208916969849, -0.00360577756544803, -0.00695359947447481, -0.00350934596779156, 0.00368242507065502, 0.00761970940932394, 0.0041295417568526, -0.00375607576872465, -0.00837950273023728, -0.00485483738071367, 0.00382527419439751, 0.00925762406646929, 0.00571355726886766, -0.00389006813292792, -0.0102907791674171, -0.00674813808878758, 0.00394802714760907, 0.0115293178608761, 0.00801741456697206, -0.00399956482669149, -0.0130531891518642, -0.00961431327946899, 0.00404469376568743, 0.0149904965773237, 0.0116906841202939, -0.00408364399627383, -0.0175602626184803, -0.0145123062899619, 0.00411803847834436, 0.0211720212032881, 0.0185943225229073, -0.00414650883055077, -0.0266774470613243, -0.0250656577198861, 0.00417008782130514, 0.0362099936883812, 0.0369950473631021, -0.00418687926059488, -0.0570174709560695, -0.0666498182928559, 0.00419745509475455, 0.139847436512951, 0.273522019353452, 0.329132554416423, 0.273522019353452, 0.139847436512951, 0.00419745509475455, -0.0666498182928559, -0.0570174709560695, -0.00418687926059488, 0.0369950473631021, 0.0362099936883812, 0.00417008782130514, -0.0250656577198861, -0.0266774470613243, -0.00414650883055077, 0.0185943225229073, 0.0211720212032881, 0.00411803847834436, -0.0145123062899619, -0.0175602626184803, -0.00408364399627383, 0.0116906841202939, 0.0149904965773237, 0.00404469376568743, -0.00961431327946899, -0.0130531891518642, -0.00399956482669149, 0.00801741456697206, 0.0115293178608761, 0.00394802714760907, -0.00674813808878758, -0.0102907791674171, -0.00389006813292792, 0.00571355726886766, 0.00925762406646929, 0.00382527419439751, -0.00485483738071367, -0.00837950273023728, -0.00375607576872465, 0.0041295417568526, 0.00761970940932394, 0.00368242507065502, -0.00350934596779156, -0.00695359947447481, -0.00360577756544803, 0.00297208916969849, 0.0063613486449496, 0.00352535676360736, -0.00250291007739339, -0.00582918547265532, -0.00344105468563205, 0.0020903236248458, 0.00534609419626586, 0.00335148316976547, -0.00172780250040746, -0.0049067960947545, -0.0032594213942315, 0.00140611642052851, 0.00450283811814615, 0.00316233661218917, -0.00112348329423858, -0.00413411461018567, -0.00306595142195872, 0.000869841539648486, 0.00379147775696166, 0.00296589728311132, -0.000645569490295155, -0.00347533947603152, -0.00286565811850849, 0.000444757968447576, 0.00318058468890063, 0.00276335365634457, -0.000266488980084547, -0.00290585457881367, -0.00265880224081558, 0.000110438761003445, 0.00265227307436536, 0.00255550619217483, 2.79949928468428e-05, -0.00241649123922977, -0.00245254167275093, -0.000149199029005401, 0.00219906435658151, 0.00235253999481109, 0.000256805932883705, -0.00199759116977599, -0.0022556384985734, -0.000352792280817488, 0.00181018759749869, 0.00216145419601366, 0.000438113619439677, -0.0016356245593574, -0.00206883159103901, -0.000510496854268391, 0.00147902189863808, 0.0019862723097699, 0.00058058019415179, -0.0013293742583107, -0.00190273263361918, -0.00063540539506504, 0.00120428195947104, 0.00184140501414974, 0.000701492046565265, -0.00107798085952442, -0.00177992352522619, -0.000758979587857901, 0.000971065449844266, 0.00174164092994868, 0.00083189144694599, -0.000864233035150298, -0.00171624440295741, -0.000917658249932699, 0.000758736172554422, 0.0017094027868514, 0.0010247826402383, -0.000652996831567955, -0.00173680065075813, -0.00118607372454364, 0.000512474613395726, 0.00178409644288501, 0.0014175631989528, -0.000305405393646099, -0.00183651913001252, -0.0017452567881921, -2.16744742546652e-05, 0.00186579313953368, 0.00222050948918815, 0.000597927979666603, -0.00175401904100134, -0.00287236812116072, -0.00166969778810695, 0.0011504644410144, 0.00356095373775103, 0.00366382810250035, 0.00100640068546268, -0.00317037751652148, -0.00682157856926372, -0.00838943185976378, -0.00759276097360147, -0.00530720917066848, -0.00281071634845042, -0.00101496819175829, -0.000150380552386712, 8.29286929908569e-05]
-coefLPF19Hz=[0.000462287107923478, 0.00162623118883129, 0.00348711547193026, 0.0052975072179167, 0.00578299539281757, 0.00392612594460476, -8.69253046825838e-05, -0.00457892323576643, -0.00723944654128684, -0.00670004031695372, -0.00364026441771318, -0.00041003151137898, 0.000705308438407813, -0.0007586263584952, -0.00315373995577455, -0.00419687796108471, -0.00296102595106203, -0.000621652530454284, 0.000708337615789481, -3.251989331116e-05, -0.00190441462172692, -0.00293803738340318, -0.00207062034077092, -0.000155505060643361, 0.000933556961402257, 0.000196837939926922, -0.00149990161124696, -0.00233218211802222, -0.00139436258308891, 0.000373975302297644, 0.00116889921865245, 0.000203317314658941, -0.00146420352613693, -0.00203104225626923, -0.000848217549364016, 0.00087704048937513, 0.00133795840492688, 4.64293841609298e-05, -0.00161798487554743, -0.00184664456675245, -0.000335922173730625, 0.0013466292933863, 0.00140220472487324, -0.000261212961272812, -0.00187599560215916, -0.0016704272276802, 0.000208839319820695, 0.00178921253005734, 0.00135107945679968, -0.00069195964704177, -0.00216323470049227, -0.00142706586061714, 0.000806750016316145, 0.00216434249064483, 0.0011321700283615, -0.00125439044133744, -0.00243622123255635, -0.00106381692547987, 0.00147533458187719, 0.00245692589425942, 0.00074305286669249, -0.00190279359310265, -0.00261890433587348, -0.000531079578920868, 0.00220061703723376, 0.00261239808463495, 0.000149245751901505, -0.00261643092557818, -0.00266219271469826, 0.000190004848089497, 0.00294648945393315, 0.00257885454990076, -0.000654014849657709, -0.00333522018188101, -0.00249191328624191, 0.00111882718467083, 0.0036629828036446, 0.00229364870994618, -0.00167282732790231, -0.00400074458620104, -0.00204822474600067, 0.00224935958375604, 0.00428049485467238, 0.00169630207948384, -0.00289132466954243, -0.00453239016493256, -0.00126774698004652, 0.00356004174166793, 0.00471226664293814, 0.000724953498668712, -0.00427884755849307, -0.00483456197780005, -8.71700854255843e-05, 0.0050154084958478, 0.00486006674324443, -0.000676512904095292, -0.00578341607342937, -0.00479208494804245, 0.00155664238118541, 0.006557018633511, 0.00459485983602497, -0.00258148930930532, -0.00734587223327995, -0.00426651122340069, 0.00374469403915204, 0.00812176059227974, 0.00376426903284103, -0.00507964965747714, -0.00888950827890234, -0.00306967158042008, 0.00659983593743602, 0.00963104616402371, 0.00213586605376658, -0.00834530296119151, -0.0103409334984017, -0.000910814907287754, 0.0103661962374835, 0.0110072699758916, -0.00068853957322656, -0.0127473397720074, -0.0116190350800724, 0.00279400091678719, 0.0156358760251302, 0.0121718836175302, -0.00561908891527032, -0.0192837046241882, -0.0126525172347772, 0.00957419955717451, 0.0241987370047155, 0.0130582957793001, -0.0155039062236323, -0.0314958451370996, -0.0133791808628825, 0.025538464132699, 0.0442334758080446, 0.0136113194546438, -0.0469213595764863, -0.0746710477958946, -0.0137540856095149, 0.130388407745174, 0.282285046713223, 0.347133987421628, 0.282285046713223, 0.130388407745174, -0.0137540856095149, -0.0746710477958946, -0.0469213595764863, 0.0136113194546438, 0.0442334758080446, 0.025538464132699, -0.0133791808628825, -0.0314958451370996, -0.0155039062236323, 0.0130582957793001, 0.0241987370047155, 0.00957419955717451, -0.0126525172347772, -0.0192837046241882, -0.00561908891527032, 0.0121718836175302, 0.0156358760251302, 0.00279400091678719, -0.0116190350800724, -0.0127473397720074, -0.00068853957322656, 0.0110072699758916, 0.0103661962374835, -0.000910814907287754, -0.0103409334984017, -0.00834530296119151, 0.00213586605376658, 0.00963104616402371, 0.00659983593743602, -0.00306967158042008, -0.00888950827890234, -0.00507964965747714, 0.00376426903284103, 0.00812176059227974, 0.00374469403915204, -0.00426651122340069, -0.00734587223327995, -0.00258148930930532, 0.00459485983602497, 0.006557018633511, 0.00155664238118541, -0.00479208494804245, -0.00578341607342937, -0.000676512904095292, 0.00486006674324443, 0.0050154084958478, -8.71700854255843e-05, -0.00483456197780005, -0.00427884755849307, 0.000724953498668712, 0.00471226664293814, 0.00356004174166793, -0.00126774698004652, -0.00453239016493256, -0.00289132466954243, 0.00169630207948384, 0.00428049485467238, 0.00224935958375604, -0.00204822474600067, -0.00400074458620104, -0.00167282732790231, 0.00229364870994618, 0.0036629828036446, 0.00111882718467083, -0.00249191328624191, -0.00333522018188101, -0.000654014849657709, 0.00257885454990076, 0.00294648945393315, 0.000190004848089497, -0.00266219271469826, -0.00261643092557818, 0.000149245751901505, 0.00261239808463495, 0.00220061703723376, -0.000531079578920868, -0.00261890433587348, -0.00190279359310265, 0.00074305286669249, 0.00245692589425942, 0.00147533458187719, -0.00106381692547987, -0.00243622123255635, -0.00125439044133744, 0.0011321700283615, 0.00216434249064483, 0.000806750016316145, -0.00142706586061714, -0.00216323470049227, -0.00069195964704177, 0.00135107945679968, 0.00178921253005734, 0.000208839319820695, -0.0016704272276802, -0.00187599560215916, -0.000261212961272812, 0.00140220472487324, 0.0013466292933863, -0.000335922173730625, -0.00184664456675245, -0.00161798487554743, 4.64293841609298e-05, 0.00133795840492688, 0.00087704048937513, -0.000848217549364016, -0.00203104225626923, -0.00146420352613693, 0.000203317314658941, 0.00116889921865245, 0.000373975302297644, -0.00139436258308891, -0.00233218211802222, -0.00149990161124696, 0.000196837939926922, 0.000933556961402257, -0.000155505060643361, -0.00207062034077092, -0.00293803738340318, -0.00190441462172692, -3.251989331116e-05, 0.000708337615789481, -0.000621652530454284, -0.00296102595106203, -0.00419687796108471, -0.00315373995577455, -0.0007586263584952, 0.000705308438407813, -0.00041003151137898, -0.00364026441771318, -0.00670004031695372, -0.00723944654128684, -0.00457892323576643, -8.69253046825838e-05, 0.00392612594460476, 0.00578299539281757, 0.0052975072179167, 0.00348711547193026, 0.00162623118883129, 0.000462287107923478]
-coefLPF20Hz=[-0.000100200123816761, 0.000182808557031791, 0.00136497806807079, 0.00379620948317419, 0.00689682802174286, 0.00905820793351631, 0.00852624674341879, 0.00486441815294096, -0.000240421213600854, -0.00383663338361304, -0.00386616497901397, -0.000885961795486277, 0.00229777709846353, 0.00297961393809571, 0.000869902377713768, -0.00177983217139505, -0.00240677101048003, -0.00059408926939684, 0.001644012215273, 0.00200201329897973, 0.000241657744487555, -0.00165662043323945, -0.00166454419219118, 0.000135230824167131, 0.00170691535939721, 0.00133061774077004, -0.000516926358758156, -0.00173352375872829, -0.000962885361572802, 0.000889950484780956, 0.00170034158946751, 0.000546519967233408, -0.00123692282217911, -0.00158670216391335, -8.8270370967569e-05, 0.00152845108903259, 0.00137479378290105, -0.000395666521144705, -0.0017311418605457, -0.00105060080026468, 0.000887271734181318, 0.00182159252020006, 0.000618763026141168, -0.00135588082734463, -0.00178097909532464, -0.000101729025789312, 0.00175456636884161, 0.00158529299037198, -0.000477544517405623, -0.00204169169452315, -0.00122237834383544, 0.00109142927821871, 0.00219184204370868, 0.000714444944038664, -0.00167802713259298, -0.00216079369916879, -7.75694698784306e-05, 0.00218383637440517, 0.00192116770735928, -0.000660117107918386, -0.00256744173849005, -0.00148511139220177, 0.00142093335171498, 0.00274687867462816, 0.000832611561146988, -0.00216944579297752, -0.00270478957752386, -1.84048159640417e-05, 0.00281150163951873, 0.00239300052769977, -0.000921133822687621, -0.00328329367598845, -0.00180987948397772, 0.00190864670813848, 0.00350781517635852, 0.000963568927936764, -0.00286231382328371, -0.00342860567083487, 0.000104635592840878, 0.00368534494238759, 0.00300532284161768, -0.00132766237998939, -0.00427740716822691, -0.00222128834148346, 0.00261631362054631, 0.00454680901563019, 0.00109363049370298, -0.00385830337316982, -0.0044148301757283, 0.000326981835283301, 0.00492668947028255, 0.00382442758341557, -0.00195787236347935, -0.00569222847801115, -0.00275277780020518, 0.0036818855771046, 0.00602966385576815, 0.00121552691143338, -0.00535237346173433, -0.00582651820697291, 0.000732788524845876, 0.00680566277209489, 0.00499930221503905, -0.00299185776066293, -0.00786635874926949, -0.00350162979244764, 0.00541418185284731, 0.00835036735531112, 0.00131990684562691, -0.00782412079083114, -0.0080928049700607, 0.00150251135078352, 0.0100031112651185, 0.0069367343599539, -0.00488076378081802, -0.0117076850663513, -0.00474471215834247, 0.00868753707984269, 0.0126725906890178, 0.00139904828022533, -0.0127497012269933, -0.0125901488865024, 0.00323605128018476, 0.0168771362324059, 0.011101657266776, -0.00934670230226889, -0.0208525206002497, -0.0076889118208296, 0.0173265800746874, 0.02446705363995, 0.00144696739475683, -0.0281345939712977, -0.027518509007031, 0.00975859435840591, 0.0446366960096094, 0.0298330068358994, -0.0331236472388882, -0.0788816308629139, -0.0312785995190989, 0.11928531515473, 0.290132923398474, 0.365103799001086, 0.290132923398474, 0.11928531515473, -0.0312785995190989, -0.0788816308629139, -0.0331236472388882, 0.0298330068358994, 0.0446366960096094, 0.00975859435840591, -0.027518509007031, -0.0281345939712977, 0.00144696739475683, 0.02446705363995, 0.0173265800746874, -0.0076889118208296, -0.0208525206002497, -0.00934670230226889, 0.011101657266776, 0.0168771362324059, 0.00323605128018476, -0.0125901488865024, -0.0127497012269933, 0.00139904828022533, 0.0126725906890178, 0.00868753707984269, -0.00474471215834247, -0.0117076850663513, -0.00488076378081802, 0.0069367343599539, 0.0100031112651185, 0.00150251135078352, -0.0080928049700607, -0.00782412079083114, 0.00131990684562691, 0.00835036735531112, 0.00541418185284731, -0.00350162979244764, -0.00786635874926949, -0.00299185776066293, 0.00499930221503905, 0.00680566277209489, 0.000732788524845876, -0.00582651820697291, -0.00535237346173433, 0.00121552691143338, 0.00602966385576815, 0.0036818855771046, -0.00275277780020518, -0.00569222847801115, -0.00195787236347935, 0.00382442758341557, 0.00492668947028255, 0.000326981835283301, -0.0044148301757283, -0.00385830337316982, 0.00109363049370298, 0.00454680901563019, 0.00261631362054631, -0.00222128834148346, -0.00427740716822691, -0.00132766237998939, 0.00300532284161768, 0.00368534494238759, 0.000104635592840878, -0.00342860567083487, -0.00286231382328371, 0.000963568927936764, 0.00350781517635852, 0.00190864670813848, -0.00180987948397772, -0.00328329367598845, -0.000921133822687621, 0.00239300052769977, 0.00281150163951873, -1.84048159640417e-05, -0.00270478957752386, -0.00216944579297752, 0.000832611561146988, 0.00274687867462816, 0.00142093335171498, -0.00148511139220177, -0.00256744173849005, -0.000660117107918386, 0.00192116770735928, 0.00218383637440517, -7.75694698784306e-05, -0.00216079369916879, -0.00167802713259298, 0.000714444944038664, 0.00219184204370868, 0.00109142927821871, -0.00122237834383544, -0.00204169169452315, -0.000477544517405623, 0.00158529299037198, 0.00175456636884161, -0.000101729025789312, -0.00178097909532464, -0.00135588082734463, 0.000618763026141168, 0.00182159252020006, 0.000887271734181318, -0.00105060080026468, -0.0017311418605457, -0.000395666521144705, 0.00137479378290105, 0.00152845108903259, -8.8270370967569e-05, -0.00158670216391335, -0.00123692282217911, 0.000546519967233408, 0.00170034158946751, 0.000889950484780956, -0.000962885361572802, -0.00173352375872829, -0.000516926358758156, 0.00133061774077004, 0.00170691535939721, 0.000135230824167131, -0.00166454419219118, -0.00165662043323945, 0.000241657744487555, 0.00200201329897973, 0.001644012215273, -0.00059408926939684, -0.00240677101048003, -0.00177983217139505, 0.000869902377713768, 0.00297961393809571, 0.00229777709846353, -0.000885961795486277, -0.00386616497901397, -0.00383663338361304, -0.000240421213600854, 0.00486441815294096, 0.00852624674341879, 0.00905820793351631, 0.00689682802174286, 0.00379620948317419, 0.00136497806807079, 0.000182808557031791, -0.000100200123816761]
-coefLPF21Hz=[-0.000623350921941928, -0.00239329070532247, -0.0053264587725714, -0.00818100124009217, -0.0088971064135583, -0.00616531835809749, -0.000962736669098231, 0.00362957863010626, 0.00468954775891956, 0.00200477502229894, -0.00159792146443499, -0.00276771614384763, -0.000729835920493463, 0.00211834104681887, 0.00278731614760221, 0.000797773546872389, -0.0014702900977221, -0.00151027192924612, 0.00054938916357433, 0.00222461225658863, 0.00160791269975106, -0.000459146272864258, -0.00147157829070039, -0.000269359862418685, 0.00161985686049452, 0.00188156184992723, 0.000233670133570728, -0.00126131325134357, -0.000757049216378598, 0.00109616209435924, 0.00196923196740416, 0.000763512110980919, -0.00100680690728714, -0.00110477412429936, 0.000608000436749312, 0.00196931349463007, 0.00123190408635106, -0.000700395204616044, -0.00137469709352944, 0.00010244564754972, 0.00187989891180058, 0.00167095023356749, -0.000313145682307892, -0.00156191182328809, -0.00043729005674925, 0.00167941463075401, 0.00207427809161937, 0.000171564017890761, -0.00164241863313984, -0.00100745933185699, 0.00134353455560464, 0.00241702813812912, 0.000762621030977765, -0.00157783673719291, -0.00158578525101955, 0.00084376136299532, 0.00264402361672725, 0.00143932057001269, -0.00132849256914615, -0.00211653401493552, 0.000188108841552799, 0.00270963864757473, 0.00216170847067116, -0.000879413143263528, -0.00255392255435317, -0.00061239710263789, 0.00257163940209467, 0.00289193506800689, -0.000202965928918492, -0.00282477244890402, -0.00152362619004649, 0.00217961040256242, 0.00354984940524326, 0.000681726280792958, -0.00287254849917285, -0.00249236852271436, 0.00151324491863902, 0.00407203494624989, 0.00175973795047733, -0.00263441809686997, -0.00345654278371778, 0.000545614691658633, 0.00436353457070842, 0.00298043994810634, -0.00205196343463122, -0.00431626756179432, -0.000699058242098697, 0.00435424623275591, 0.00428112305429913, -0.00109470075260746, -0.00499451139527223, -0.00221602089048931, 0.00394861835030356, 0.00557746369500454, 0.000276687084721317, -0.00536585760200902, -0.00394093081417645, 0.00308095173057856, 0.00677351551589663, 0.00207121260809638, -0.00533085260727298, -0.00583384310343914, 0.00165161779400902, 0.00774208270227315, 0.00430019581920933, -0.00474569876323491, -0.0078009776169923, -0.000412942296963113, 0.0083577176160153, 0.00698319054120066, -0.00344963571511187, -0.00976254034486497, -0.00325128488510872, 0.00842809665165448, 0.0101380244038556, -0.00123379469127942, -0.0116347176496016, -0.00707758613993054, 0.00771587027148463, 0.0138922285659948, 0.00229779935744887, -0.01331556502936, -0.0123353919964724, 0.00580519667369138, 0.0185899775231795, 0.00797250900837792, -0.0147202154295222, -0.0201783137301341, 0.00173239483230021, 0.0252933455110895, 0.0181161471164844, -0.0157826830591246, -0.03448089484692, -0.00778126351088234, 0.0383704103374262, 0.0429129408460703, -0.0164421511503137, -0.0788515966496987, -0.0477053244643885, 0.10686861787415, 0.297294769717045, 0.383331517006556, 0.297294769717045, 0.10686861787415, -0.0477053244643885, -0.0788515966496987, -0.0164421511503137, 0.0429129408460703, 0.0383704103374262, -0.00778126351088234, -0.03448089484692, -0.0157826830591246, 0.0181161471164844, 0.0252933455110895, 0.00173239483230021, -0.0201783137301341, -0.0147202154295222, 0.00797250900837792, 0.0185899775231795, 0.00580519667369138, -0.0123353919964724, -0.01331556502936, 0.00229779935744887, 0.0138922285659948, 0.00771587027148463, -0.00707758613993054, -0.0116347176496016, -0.00123379469127942, 0.0101380244038556, 0.00842809665165448, -0.00325128488510872, -0.00976254034486497, -0.00344963571511187, 0.00698319054120066, 0.0083577176160153, -0.000412942296963113, -0.0078009776169923, -0.00474569876323491, 0.00430019581920933, 0.00774208270227315, 0.00165161779400902, -0.00583384310343914, -0.00533085260727298, 0.00207121260809638, 0.00677351551589663, 0.00308095173057856, -0.00394093081417645, -0.00536585760200902, 0.000276687084721317, 0.00557746369500454, 0.00394861835030356, -0.00221602089048931, -0.00499451139527223, -0.00109470075260746, 0.00428112305429913, 0.00435424623275591, -0.000699058242098697, -0.00431626756179432, -0.00205196343463122, 0.00298043994810634, 0.00436353457070842, 0.000545614691658633, -0.00345654278371778, -0.00263441809686997, 0.00175973795047733, 0.00407203494624989, 0.00151324491863902, -0.00249236852271436, -0.00287254849917285, 0.000681726280792958, 0.00354984940524326, 0.00217961040256242, -0.00152362619004649, -0.00282477244890402, -0.000202965928918492, 0.00289193506800689, 0.00257163940209467, -0.00061239710263789, -0.00255392255435317, -0.000879413143263528, 0.00216170847067116, 0.00270963864757473, 0.000188108841552799, -0.00211653401493552, -0.00132849256914615, 0.00143932057001269, 0.00264402361672725, 0.00084376136299532, -0.00158578525101955, -0.00157783673719291, 0.000762621030977765, 0.00241702813812912, 0.00134353455560464, -0.00100745933185699, -0.00164241863313984, 0.000171564017890761, 0.00207427809161937, 0.00167941463075401, -0.00043729005674925, -0.00156191182328809, -0.000313145682307892, 0.00167095023356749, 0.00187989891180058, 0.00010244564754972, -0.00137469709352944, -0.000700395204616044, 0.00123190408635106, 0.00196931349463007, 0.000608000436749312, -0.00110477412429936, -0.00100680690728714, 0.000763512110980919, 0.00196923196740416, 0.00109616209435924, -0.000757049216378598, -0.00126131325134357, 0.000233670133570728, 0.00188156184992723, 0.00161985686049452, -0.000269359862418685, -0.00147157829070039, -0.000459146272864258, 0.00160791269975106, 0.00222461225658863, 0.00054938916357433, -0.00151027192924612, -0.0014702900977221, 0.000797773546872389, 0.00278731614760221, 0.00211834104681887, -0.000729835920493463, -0.00276771614384763, -0.00159792146443499, 0.00200477502229894, 0.00468954775891956, 0.00362957863010626, -0.000962736669098231, -0.00616531835809749, -0.0088971064135583, -0.00818100124009217, -0.0053264587725714, -0.00239329070532247, -0.000623350921941928]
-coefLPF22Hz=[0.000133274432359754, -0.000176676630554087, -0.00171065129596454, -0.00485948435480148, -0.00848924920158731, -0.0100802723945135, -0.00763572895379131, -0.00194761830996315, 0.00331053192205592, 0.00448447038979191, 0.00137353513813008, -0.00243953499138908, -0.00310697227569199, -0.000380677080525164, 0.00237593811121038, 0.00209612800732528, -0.000579571887439678, -0.00229100254782817, -0.00107848534837914, 0.00135495205784328, 0.00191905484312257, 2.55715105882196e-05, -0.00178846853775725, -0.0012028587929265, 0.000921189691999353, 0.00175315437902162, 0.00023817885393506, -0.00155383574368879, -0.00122395637765201, 0.000752730396609091, 0.00168900383622121, 0.000319189798054005, -0.00148691318075617, -0.00125920295145786, 0.000702619045144082, 0.00171430331596045, 0.00036838414419966, -0.00150710481252449, -0.00132021339641199, 0.000708885705568766, 0.00179328861111337, 0.000396246128018945, -0.00159479129358373, -0.00140903707553724, 0.000759595351276454, 0.00193255566265674, 0.000430822033289166, -0.0017266659402851, -0.00152983291336593, 0.000828318295679226, 0.00210615682617757, 0.000461249365279538, -0.00190122457368154, -0.00167690155565414, 0.000923389890333359, 0.00232826810569334, 0.000506092888591607, -0.00210392451118835, -0.00184798938221047, 0.00103317307241111, 0.0025776221043856, 0.000541265217067519, -0.00235375229125095, -0.00204944390852688, 0.00116682039253724, 0.00287381343483839, 0.000586921607650241, -0.00263637698929855, -0.00227171785913439, 0.00133224694908349, 0.00322134201801181, 0.000639317328984717, -0.00296383209529017, -0.00252847626431351, 0.00151954734002087, 0.00361158145093535, 0.000685744661528984, -0.00335028731808096, -0.00282467832675185, 0.00173819560939463, 0.00405881727327096, 0.000731336197026353, -0.00379955435848774, -0.00315800726680643, 0.00200521333676036, 0.00458158916392256, 0.000775338351117152, -0.00433182686652459, -0.0035437629290704, 0.00232923066486713, 0.00520012167605655, 0.000821264725574541, -0.00496532851312007, -0.00399458117207238, 0.00272485464710376, 0.00593784964306984, 0.000863946632081555, -0.00573622396359253, -0.00453381288299927, 0.0032153351445456998, 0.00683638379176222, 0.000904378383900017, -0.00669089533770204, -0.00518994590841475, 0.00384175845910478, 0.00796213785814125, 0.000940165366835656, -0.00791261015034158, -0.00602079191634069, 0.00466172048525339, 0.00942206017427845, 0.000971965711528131, -0.00953400741062198, -0.00711794903897614, 0.00578038802120897, 0.0114077561903348, 0.00100159483657978, -0.0117985742894459, -0.00865384757521627, 0.00739582203840448, 0.0142881370713218, 0.00102542593862688, -0.0152132364154177, -0.0109959482460654, 0.00994179448459432, 0.0189013980139798, 0.00104494171496807, -0.021000399055751, -0.0150701526311431, 0.0145804635504858, 0.0276115692385301, 0.00105867408018977, -0.0331150052770269, -0.0241396927812132, 0.025774113351547, 0.0506535307943367, 0.00106461328197227, -0.0752675543645325, -0.0631902889524916, 0.0926569966288123, 0.303037306928762, 0.401066167170588, 0.303037306928762, 0.0926569966288123, -0.0631902889524916, -0.0752675543645325, 0.00106461328197227, 0.0506535307943367, 0.025774113351547, -0.0241396927812132, -0.0331150052770269, 0.00105867408018977, 0.0276115692385301, 0.0145804635504858, -0.0150701526311431, -0.021000399055751, 0.00104494171496807, 0.0189013980139798, 0.00994179448459432, -0.0109959482460654, -0.0152132364154177, 0.00102542593862688, 0.0142881370713218, 0.00739582203840448, -0.00865384757521627, -0.0117985742894459, 0.00100159483657978, 0.0114077561903348, 0.00578038802120897, -0.00711794903897614, -0.00953400741062198, 0.000971965711528131, 0.00942206017427845, 0.00466172048525339, -0.00602079191634069, -0.00791261015034158, 0.000940165366835656, 0.00796213785814125, 0.00384175845910478, -0.00518994590841475, -0.00669089533770204, 0.000904378383900017, 0.00683638379176222, 0.0032153351445456998, -0.00453381288299927, -0.00573622396359253, 0.000863946632081555, 0.00593784964306984, 0.00272485464710376, -0.00399458117207238, -0.00496532851312007, 0.000821264725574541, 0.00520012167605655, 0.00232923066486713, -0.0035437629290704, -0.00433182686652459, 0.000775338351117152, 0.00458158916392256, 0.00200521333676036, -0.00315800726680643, -0.00379955435848774, 0.000731336197026353, 0.00405881727327096, 0.00173819560939463, -0.00282467832675185, -0.00335028731808096, 0.000685744661528984, 0.00361158145093535, 0.00151954734002087, -0.00252847626431351, -0.00296383209529017, 0.000639317328984717, 0.00322134201801181, 0.00133224694908349, -0.00227171785913439, -0.00263637698929855, 0.000586921607650241, 0.00287381343483839, 0.00116682039253724, -0.00204944390852688, -0.00235375229125095, 0.000541265217067519, 0.0025776221043856, 0.00103317307241111, -0.00184798938221047, -0.00210392451118835, 0.000506092888591607, 0.00232826810569334, 0.000923389890333359, -0.00167690155565414, -0.00190122457368154, 0.000461249365279538, 0.00210615682617757, 0.000828318295679226, -0.00152983291336593, -0.0017266659402851, 0.000430822033289166, 0.00193255566265674, 0.000759595351276454, -0.00140903707553724, -0.00159479129358373, 0.000396246128018945, 0.00179328861111337, 0.000708885705568766, -0.00132021339641199, -0.00150710481252449, 0.00036838414419966, 0.00171430331596045, 0.000702619045144082, -0.00125920295145786, -0.00148691318075617, 0.000319189798054005, 0.00168900383622121, 0.000752730396609091, -0.00122395637765201, -0.00155383574368879, 0.00023817885393506, 0.00175315437902162, 0.000921189691999353, -0.0012028587929265, -0.00178846853775725, 2.55715105882196e-05, 0.00191905484312257, 0.00135495205784328, -0.00107848534837914, -0.00229100254782817, -0.000579571887439678, 0.00209612800732528, 0.00237593811121038, -0.000380677080525164, -0.00310697227569199, -0.00243953499138908, 0.00137353513813008, 0.00448447038979191, 0.00331053192205592, -0.00194761830996315, -0.00763572895379131, -0.0100802723945135, -0.00848924920158731, -0.00485948435480148, -0.00171065129596454, -0.000176676630554087, 0.000133274432359754]
-coefLPF23Hz=[0.000652357703322716, 0.00283867448153843, 0.0064366252038215, 0.00962115506363234, 0.00946283414888073, 0.00494411047400859, -0.00136052864779372, -0.00476952432679486, -0.00302067451107962, 0.00134333925266048, 0.00344226617426462, 0.00136602625730901, -0.00196914157941808, -0.00248040452485636, 0.000118093208737024, 0.00227382566725921, 0.00128467522035031, -0.00129003499010939, -0.00193481045117654, 7.94629032231411e-05, 0.00185186548697148, 0.000965539624072732, -0.00122187926195901, -0.00159207107164395, 0.000309964468382314, 0.00170876498483191, 0.000612284456298858, -0.00134767859145145, -0.0013164065926828, 0.000639336058004543, 0.00164263199692061, 0.000220231688219295, -0.0015315252051026, -0.00101770956488046, 0.00101858924110417, 0.00156060598794722, -0.000225054178755774, -0.00170621420659154, -0.000653870784086545, 0.00140823167842227, 0.00140042238158151, -0.000721678504026304, -0.00181582439472199, -0.000197840329423864, 0.00177052898966741, 0.00112096971114099, -0.00125085393838792, -0.00180804311522937, 0.000360949605258815, 0.00206352112024118, 0.000694441510967222, -0.00178468661767497, -0.00164700783055966, 0.00100391509621756, 0.00223596538715648, 0.000113961148967258, -0.00227138616933764, -0.00129772060343995, 0.00169449031014406, 0.00223136007826535, -0.000611603274117926, -0.00264533778117479, -0.000730754639631292, 0.0023859334966356, 0.00200010116580233, -0.00145881261739889, -0.00284900766907479, 4.87813032361452e-05, 0.00300714404468878, 0.00150952445910416, -0.00236410933049507, -0.0028063241097265, 0.00101946062421222, 0.00346623417400036, 0.000727834698111484, -0.0032547274061707, -0.00244865918567282, 0.00214448599460971, 0.00367987326675698, -0.000342928609783341, -0.00404014696801524, -0.00173491375199593, 0.003342517972263, 0.00355531351262541, -0.00166731172850785, -0.00459884768357462, -0.000629794711476884, 0.00450929533244149, 0.00299687932645565, -0.00319664497703308, -0.00481450591190827, 0.000873914565592155, 0.00553180587570127, 0.00194881898848504, -0.00482742531073198, -0.00456251969154231, 0.00273448910361411, 0.00624344699746014, 0.00034436595636596, -0.00643688874281458, -0.0037083726277093, 0.0049061557413248, 0.00649179526375777, -0.00183986326208554, -0.0078679740191169, -0.00213564939140841, 0.00728175503306027, 0.00607408071710521, -0.00462681695828602, -0.00892466279412218, 0.000307209580193371, 0.00976004478479473, 0.00477760943701635, -0.00803215276109778, -0.00937742826285122, 0.00379017897274554, 0.0121859576722227, 0.00227532980707509, -0.0121337121848492, -0.00890529919955899, 0.00865423887630158, 0.0144352242802855, -0.00194721469591976, -0.0171542081976569, -0.00697253454921154, 0.0156521140869689, 0.0163581616772835, -0.00911922693126483, -0.0238937453396911, -0.00237231067315342, 0.0270187831588046, 0.0178237992026539, -0.0231393150253668, -0.0354505437037419, 0.00940252151731948, 0.0528699942463473, 0.0187490742140426, -0.0676183266547644, -0.0766639925562505, 0.0774658366232987, 0.30805505335757, 0.419067382100539, 0.30805505335757, 0.0774658366232987, -0.0766639925562505, -0.0676183266547644, 0.0187490742140426, 0.0528699942463473, 0.00940252151731948, -0.0354505437037419, -0.0231393150253668, 0.0178237992026539, 0.0270187831588046, -0.00237231067315342, -0.0238937453396911, -0.00911922693126483, 0.0163581616772835, 0.0156521140869689, -0.00697253454921154, -0.0171542081976569, -0.00194721469591976, 0.0144352242802855, 0.00865423887630158, -0.00890529919955899, -0.0121337121848492, 0.00227532980707509, 0.0121859576722227, 0.00379017897274554, -0.00937742826285122, -0.00803215276109778, 0.00477760943701635, 0.00976004478479473, 0.000307209580193371, -0.00892466279412218, -0.00462681695828602, 0.00607408071710521, 0.00728175503306027, -0.00213564939140841, -0.0078679740191169, -0.00183986326208554, 0.00649179526375777, 0.0049061557413248, -0.0037083726277093, -0.00643688874281458, 0.00034436595636596, 0.00624344699746014, 0.00273448910361411, -0.00456251969154231, -0.00482742531073198, 0.00194881898848504, 0.00553180587570127, 0.000873914565592155, -0.00481450591190827, -0.00319664497703308, 0.00299687932645565, 0.00450929533244149, -0.000629794711476884, -0.00459884768357462, -0.00166731172850785, 0.00355531351262541, 0.003342517972263, -0.00173491375199593, -0.00404014696801524, -0.000342928609783341, 0.00367987326675698, 0.00214448599460971, -0.00244865918567282, -0.0032547274061707, 0.000727834698111484, 0.00346623417400036, 0.00101946062421222, -0.0028063241097265, -0.00236410933049507, 0.00150952445910416, 0.00300714404468878, 4.87813032361452e-05, -0.00284900766907479, -0.00145881261739889, 0.00200010116580233, 0.0023859334966356, -0.000730754639631292, -0.00264533778117479, -0.000611603274117926, 0.00223136007826535, 0.00169449031014406, -0.00129772060343995, -0.00227138616933764, 0.000113961148967258, 0.00223596538715648, 0.00100391509621756, -0.00164700783055966, -0.00178468661767497, 0.000694441510967222, 0.00206352112024118, 0.000360949605258815, -0.00180804311522937, -0.00125085393838792, 0.00112096971114099, 0.00177052898966741, -0.000197840329423864, -0.00181582439472199, -0.000721678504026304, 0.00140042238158151, 0.00140823167842227, -0.000653870784086545, -0.00170621420659154, -0.000225054178755774, 0.00156060598794722, 0.00101858924110417, -0.00101770956488046, -0.0015315252051026, 0.000220231688219295, 0.00164263199692061, 0.000639336058004543, -0.0013164065926828, -0.00134767859145145, 0.000612284456298858, 0.00170876498483191, 0.000309964468382314, -0.00159207107164395, -0.00122187926195901, 0.000965539624072732, 0.00185186548697148, 7.94629032231411e-05, -0.00193481045117654, -0.00129003499010939, 0.00128467522035031, 0.00227382566725921, 0.000118093208737024, -0.00248040452485636, -0.00196914157941808, 0.00136602625730901, 0.00344226617426462, 0.00134333925266048, -0.00302067451107962, -0.00476952432679486, -0.00136052864779372, 0.00494411047400859, 0.00946283414888073, 0.00962115506363234, 0.0064366252038215, 0.00283867448153843, 0.000652357703322716]
-coefLPF24Hz=[-0.000191668768133183, 9.59591281043075e-05, 0.00199667234292753, 0.00594641484105615, 0.0100066675307339, 0.0105627334683648, 0.00585156017879146, -0.00119158894609717, -0.00492223217023954, -0.00272540932516504, 0.00194736178587075, 0.00344832120647423, 0.000508850312884472, -0.0026095356850936, -0.0018993389914821, 0.00125339210294919, 0.00233615140719455, 5.86775030674857e-05, -0.00209070789231147, -0.00105980249329885, 0.00143573073160573, 0.00165174545744347, -0.00060236771295891, -0.00183458573586171, -0.000230470427552187, 0.00166488065853894, 0.000937437039493055, -0.00122405871768962, -0.0014351577745273, 0.000605129723857317, 0.00167358024719197, 9.1592218363458e-05, -0.00163485522481305, -0.000765143790343964, 0.00133130205209066, 0.0013171647544439, -0.000811020554176124, -0.0016684528424396, 0.000147975572942333, 0.00176490362970496, 0.000565404915535664, -0.00158242247179932, -0.00122595916930075, 0.00112997929196497, 0.0017237108929595, -0.000464246859716421, -0.00196821674775221, -0.000318843346874107, 0.00190703565102008, 0.00110179611086836, -0.0015336772360684, -0.00176706630879121, 0.000878134160693469, 0.00219686772030903, -1.93237739736975e-05, -0.00229385927424252, -0.000911489246164754, 0.00201902655862397, 0.00176792721370005, -0.00139025081704995, -0.00241011073091871, 0.000473950388215376, 0.0027123643704017, 0.000609925740210668, -0.00258423351742964, -0.0016873020580829, 0.00201337897344355, 0.00257736015812437, -0.00106341932859047, -0.00313000241522356, -0.000157315018883134, 0.00321440901290127, 0.00147265521055998, -0.00276383042202844, -0.00265867316853159, 0.00182114226092016, 0.00352597929280954, -0.000481369856973823, -0.00389717316994797, -0.00108121521086603, 0.00364400232051585, 0.00260473229639491, -0.00277799597196642, -0.00386969161148107, 0.0013436582406769, 0.00460753872018745, 0.000451869992063047, -0.00466643565314236, -0.00237037756061181, 0.00394947368604607, 0.00409684675729816, -0.0025012612455264, -0.00533405777608917, 0.000475578412708394, 0.00582383587812941, 0.0018604625639109, -0.00540076491161771, -0.00415969259470622, 0.00402811890159327, 0.00604138238772907, -0.00181843958411035, -0.00715055234374777, -0.000973450342737505, 0.00720920765554491, 0.00396898551241344, -0.00606881675897466, -0.00670668191018102, 0.00375262098831695, 0.00870615606116072, -0.000470801157851527, -0.0095379053207851, -0.00338956322698825, 0.00889092992025147, 0.00729868901696958, -0.00662909692668655, -0.0106344901682745, 0.00284098141180093, 0.0127640763321163, 0.00214918712775258, -0.0131210014462186, -0.00778852425158887, 0.0112889384242936, 0.0133410483415289, -0.00705235894700393, -0.0179228465871649, 0.000465893450671764, 0.0205945133010572, 0.00815837629954956, -0.0203895915061795, -0.0182489515369339, 0.0163347373736182, 0.0290359471621068, -0.00731849717738521, -0.0396211603366617, -0.008388811911188, 0.0490732241067863, 0.0349245254323537, -0.0565381745440877, -0.0879123137051969, 0.0613177498166096, 0.312083892356314, 0.437038825095993, 0.312083892356314, 0.0613177498166096, -0.0879123137051969, -0.0565381745440877, 0.0349245254323537, 0.0490732241067863, -0.008388811911188, -0.0396211603366617, -0.00731849717738521, 0.0290359471621068, 0.0163347373736182, -0.0182489515369339, -0.0203895915061795, 0.00815837629954956, 0.0205945133010572, 0.000465893450671764, -0.0179228465871649, -0.00705235894700393, 0.0133410483415289, 0.0112889384242936, -0.00778852425158887, -0.0131210014462186, 0.00214918712775258, 0.0127640763321163, 0.00284098141180093, -0.0106344901682745, -0.00662909692668655, 0.00729868901696958, 0.00889092992025147, -0.00338956322698825, -0.0095379053207851, -0.000470801157851527, 0.00870615606116072, 0.00375262098831695, -0.00670668191018102, -0.00606881675897466, 0.00396898551241344, 0.00720920765554491, -0.000973450342737505, -0.00715055234374777, -0.00181843958411035, 0.00604138238772907, 0.00402811890159327, -0.00415969259470622, -0.00540076491161771, 0.0018604625639109, 0.00582383587812941, 0.000475578412708394, -0.00533405777608917, -0.0025012612455264, 0.00409684675729816, 0.00394947368604607, -0.00237037756061181, -0.00466643565314236, 0.000451869992063047, 0.00460753872018745, 0.0013436582406769, -0.00386969161148107, -0.00277799597196642, 0.00260473229639491, 0.00364400232051585, -0.00108121521086603, -0.00389717316994797, -0.000481369856973823, 0.00352597929280954, 0.00182114226092016, -0.00265867316853159, -0.00276383042202844, 0.00147265521055998, 0.00321440901290127, -0.000157315018883134, -0.00313000241522356, -0.00106341932859047, 0.00257736015812437, 0.00201337897344355, -0.0016873020580829, -0.00258423351742964, 0.000609925740210668, 0.0027123643704017, 0.000473950388215376, -0.00241011073091871, -0.00139025081704995, 0.00176792721370005, 0.00201902655862397, -0.000911489246164754, -0.00229385927424252, -1.93237739736975e-05, 0.00219686772030903, 0.000878134160693469, -0.00176706630879121, -0.0015336772360684, 0.00110179611086836, 0.00190703565102008, -0.000318843346874107, -0.00196821674775221, -0.000464246859716421, 0.0017237108929595, 0.00112997929196497, -0.00122595916930075, -0.00158242247179932, 0.000565404915535664, 0.00176490362970496, 0.000147975572942333, -0.0016684528424396, -0.000811020554176124, 0.0013171647544439, 0.00133130205209066, -0.000765143790343964, -0.00163485522481305, 9.1592218363458e-05, 0.00167358024719197, 0.000605129723857317, -0.0014351577745273, -0.00122405871768962, 0.000937437039493055, 0.00166488065853894, -0.000230470427552187, -0.00183458573586171, -0.00060236771295891, 0.00165174545744347, 0.00143573073160573, -0.00105980249329885, -0.00209070789231147, 5.86775030674857e-05, 0.00233615140719455, 0.00125339210294919, -0.0018993389914821, -0.0026095356850936, 0.000508850312884472, 0.00344832120647423, 0.00194736178587075, -0.00272540932516504, -0.00492223217023954, -0.00119158894609717, 0.00585156017879146, 0.0105627334683648, 0.0100066675307339, 0.00594641484105615, 0.00199667234292753, 9.59591281043075e-05, -0.000191668768133183]
-coefLPF25Hz=[-0.000673987279592066, -0.0032545273836451, -0.00751707580600535, -0.0107658327669735, -0.00924442459531676, -0.00274761862372025, 0.00381022939319342, 0.00478660121368485, 0.000342782819795973, -0.00352884712526988, -0.00226160374069102, 0.00172439238389626, 0.00275668506515247, -0.000195759842185264, -0.00248964039961748, -0.000880370225620994, 0.00187215885159161, 0.00152920968881122, -0.00113649794453824, -0.00183156085629792, 0.00040549566330361, 0.00186244680758702, 0.000247900762584071, -0.00169671539801139, -0.000794265196306266, 0.0013858916619381, 0.00121380998612348, -0.00097492551317308, -0.00149545818842729, 0.000505738031925118, 0.00163968983549922, -9.61462755845177e-06, -0.00164603022121266, -0.000482287556401088, 0.00151711987119849, 0.000936639876661771, -0.00126536183939157, -0.00132741643553855, 0.000902129902488737, 0.00162516633239611, -0.000446817757775254, -0.0018010283948929, -6.93682366181479e-05, 0.00183525514344066, 0.000609477404224774, -0.00171766050837193, -0.00113366972317852, 0.00144645578597682, 0.00159835825106546, -0.00103235701592747, -0.00196064101144931, 0.000499862695216415, 0.00218471170317163, 0.000117740886981379, -0.00224162688979406, -0.000779515811696345, 0.00210790296831143, 0.0014303333697538, -0.00177821612650817, -0.00201070690535843, 0.00126811098969016, 0.00246839762074584, -0.000604769940273065, -0.0027558585358077, -0.000172115466558854, 0.00283148100026763, 0.00100674415783141, -0.00266843375133503, -0.00183285308175448, 0.00225798174957823, 0.00257903143149644, -0.00161038560876859, -0.00317144604853237, 0.000759302077730235, 0.00354227520870218, 0.000237324047342178, -0.00364209197609407, -0.00130840789841359, 0.00343974005217245, 0.00237520470902451, -0.00291867638098466, -0.0033457826236871, 0.00208814668792687, 0.00412266391496698, -0.000991066859506607, -0.00461942812114062, -0.000302478444519456, 0.00476934323997528, 0.0017043029219187, -0.00452646062978826, -0.00311209503719445, 0.00386654979029364, 0.00440914432330581, -0.00279516245515455, -0.00546951441855181, 0.00135797741522249, 0.00617513101944267, 0.000361623330600268, -0.00643002765611975, -0.00225358327233387, 0.00616379767283781, 0.00418885585811801, -0.00532858123521789, -0.00601206171892078, 0.00391534414393919, 0.00754935212521028, -0.0019719980943433, -0.00863925021257452, -0.000411496207398145, 0.00914002692983989, 0.0031160468620118, -0.00891856260463961, -0.00597459263116889, 0.00787320314331315, 0.00877654740268214, -0.00595605725901059, -0.011292843784224, 0.00316910487381938, 0.0132883578782859, 0.000449257501692582, -0.014508159578377, -0.00480663869458473, 0.0146870866330634, 0.00974706436997784, -0.0135757645650724, -0.0150847596811741, 0.0109121121280921, 0.0206139548873798, -0.00636657115959622, -0.0260760387174925, -0.00047971601235789, 0.031228507057291, 0.0103690673138458, -0.0358426696705814, -0.0249116995260549, 0.0396840908437021, 0.0483553238982645, -0.0425633434417545, -0.096653293432853, 0.0443683728325335, 0.315128481209287, 0.455043371630231, 0.315128481209287, 0.0443683728325335, -0.096653293432853, -0.0425633434417545, 0.0483553238982645, 0.0396840908437021, -0.0249116995260549, -0.0358426696705814, 0.0103690673138458, 0.031228507057291, -0.00047971601235789, -0.0260760387174925, -0.00636657115959622, 0.0206139548873798, 0.0109121121280921, -0.0150847596811741, -0.0135757645650724, 0.00974706436997784, 0.0146870866330634, -0.00480663869458473, -0.014508159578377, 0.000449257501692582, 0.0132883578782859, 0.00316910487381938, -0.011292843784224, -0.00595605725901059, 0.00877654740268214, 0.00787320314331315, -0.00597459263116889, -0.00891856260463961, 0.0031160468620118, 0.00914002692983989, -0.000411496207398145, -0.00863925021257452, -0.0019719980943433, 0.00754935212521028, 0.00391534414393919, -0.00601206171892078, -0.00532858123521789, 0.00418885585811801, 0.00616379767283781, -0.00225358327233387, -0.00643002765611975, 0.000361623330600268, 0.00617513101944267, 0.00135797741522249, -0.00546951441855181, -0.00279516245515455, 0.00440914432330581, 0.00386654979029364, -0.00311209503719445, -0.00452646062978826, 0.0017043029219187, 0.00476934323997528, -0.000302478444519456, -0.00461942812114062, -0.000991066859506607, 0.00412266391496698, 0.00208814668792687, -0.0033457826236871, -0.00291867638098466, 0.00237520470902451, 0.00343974005217245, -0.00130840789841359, -0.00364209197609407, 0.000237324047342178, 0.00354227520870218, 0.000759302077730235, -0.00317144604853237, -0.00161038560876859, 0.00257903143149644, 0.00225798174957823, -0.00183285308175448, -0.00266843375133503, 0.00100674415783141, 0.00283148100026763, -0.000172115466558854, -0.0027558585358077, -0.000604769940273065, 0.00246839762074584, 0.00126811098969016, -0.00201070690535843, -0.00177821612650817, 0.0014303333697538, 0.00210790296831143, -0.000779515811696345, -0.00224162688979406, 0.000117740886981379, 0.00218471170317163, 0.000499862695216415, -0.00196064101144931, -0.00103235701592747, 0.00159835825106546, 0.00144645578597682, -0.00113366972317852, -0.00171766050837193, 0.000609477404224774, 0.00183525514344066, -6.93682366181479e-05, -0.0018010283948929, -0.000446817757775254, 0.00162516633239611, 0.000902129902488737, -0.00132741643553855, -0.00126536183939157, 0.000936639876661771, 0.00151711987119849, -0.000482287556401088, -0.00164603022121266, -9.61462755845177e-06, 0.00163968983549922, 0.000505738031925118, -0.00149545818842729, -0.00097492551317308, 0.00121380998612348, 0.0013858916619381, -0.000794265196306266, -0.00169671539801139, 0.000247900762584071, 0.00186244680758702, 0.00040549566330361, -0.00183156085629792, -0.00113649794453824, 0.00152920968881122, 0.00187215885159161, -0.000880370225620994, -0.00248964039961748, -0.000195759842185264, 0.00275668506515247, 0.00172439238389626, -0.00226160374069102, -0.00352884712526988, 0.000342782819795973, 0.00478660121368485, 0.00381022939319342, -0.00274761862372025, -0.00924442459531676, -0.0107658327669735, -0.00751707580600535, -0.0032545273836451, -0.000673987279592066]
-coefLPF26Hz=[0.000290531022810636, 0.000120041496952642, -0.00212935558407776, -0.00698337295384516, -0.0114010852941486, -0.0105213288381499, -0.00351419777820854, 0.00374143498180576, 0.00455002966939738, -0.000376251832991732, -0.0037376429876456, -0.00136170954807476, 0.00253123577947621, 0.00210630559103362, -0.00143529243970948, -0.00231346903043925, 0.0005534563928547, 0.00223716480131659, 0.000120441366192998, -0.00201825487701901, -0.000621985764089248, 0.00173446448456516, 0.000991258227168459, -0.00142448578765258, -0.00126176722824181, 0.00110462931728065, 0.00145640952393837, -0.000779866573927786, -0.0015862242317455, 0.000456087926414766, 0.00166150317516006, -0.000133541805858045, -0.0016838954266819, -0.000180650847539617, 0.00166137982211783, 0.000487431240369556, -0.00159450942576507, -0.000783925211667473, 0.00148505134600038, 0.00106953273841837, -0.00132953848579129, -0.00133839123407982, 0.00112540314471197, 0.00157983541160772, -0.000876758830049975, -0.00178689099535103, 0.000587852785329166, 0.00195391028867845, -0.000261902921881396, -0.00207412719205198, -9.72952602924798e-05, 0.0021394543307544, 0.00048446323454351, -0.00213915072540204, -0.000887744053208164, 0.00206624425573359, 0.00129118663984131, -0.00192250931383111, -0.0016853751502741, 0.00170785001710131, 0.00206186005799251, -0.0014191927027607, -0.0024086283646866, 0.00105223235185139, 0.00270287388575549, -0.000618781864765071, -0.00293280185850467, 0.000129719049032999, 0.00309179197787887, 0.000410569785812335, -0.00316681668946525, -0.000994815315083026, 0.003137710376929, 0.00159899050750774, -0.00299908513857019, -0.00220050219178194, 0.00275694397136103, 0.00279293587484108, -0.00240172358295239, -0.00335899789738355, 0.00192186879468536, 0.00386083964485315, -0.00133726118033139, -0.00428661800512835, 0.00065739293178602, 0.00463128612620499, 0.000135365308284784, -0.00483696072840973, -0.000984170520683736, 0.0049269637111511, 0.00190877612613192, -0.00485340493658924, -0.00286414703795071, 0.00461877340190608, 0.00383741175041822, -0.00420346463631927, -0.00479553206284835, 0.00360278310221012, 0.00570964343101313, -0.00281326805417741, -0.00654916886495955, 0.00183392902822618, 0.00728037518852834, -0.000668755314886365, -0.00786793023231644, -0.000672613395339646, 0.00827682286563498, 0.00217595259616878, -0.00847351386951554, -0.00382602278227173, 0.00842018660224782, 0.00559889442674189, -0.0080847888539571, -0.00747576103624382, 0.00742243354748346, 0.00942004465522662, -0.00640254533309374, -0.0114096691235149, 0.00497401234309621, 0.0134065934291684, -0.00308906908043671, -0.0153808454160388, 0.000678350551253725, 0.0172986072227389, 0.00235481317430955, -0.0191209490640452, -0.00614595532102144, 0.0208186056268983, 0.0109239959211822, -0.0223630673579836, -0.0170934903132426, 0.0237215784010098, 0.0254205672200046, -0.0248682292409851, -0.0375715486961388, 0.0257849315732026, 0.0579285936481208, -0.0264532239689931, -0.102627825536813, 0.0268585723770455, 0.31714606792357, 0.473006647472567, 0.31714606792357, 0.0268585723770455, -0.102627825536813, -0.0264532239689931, 0.0579285936481208, 0.0257849315732026, -0.0375715486961388, -0.0248682292409851, 0.0254205672200046, 0.0237215784010098, -0.0170934903132426, -0.0223630673579836, 0.0109239959211822, 0.0208186056268983, -0.00614595532102144, -0.0191209490640452, 0.00235481317430955, 0.0172986072227389, 0.000678350551253725, -0.0153808454160388, -0.00308906908043671, 0.0134065934291684, 0.00497401234309621, -0.0114096691235149, -0.00640254533309374, 0.00942004465522662, 0.00742243354748346, -0.00747576103624382, -0.0080847888539571, 0.00559889442674189, 0.00842018660224782, -0.00382602278227173, -0.00847351386951554, 0.00217595259616878, 0.00827682286563498, -0.000672613395339646, -0.00786793023231644, -0.000668755314886365, 0.00728037518852834, 0.00183392902822618, -0.00654916886495955, -0.00281326805417741, 0.00570964343101313, 0.00360278310221012, -0.00479553206284835, -0.00420346463631927, 0.00383741175041822, 0.00461877340190608, -0.00286414703795071, -0.00485340493658924, 0.00190877612613192, 0.0049269637111511, -0.000984170520683736, -0.00483696072840973, 0.000135365308284784, 0.00463128612620499, 0.00065739293178602, -0.00428661800512835, -0.00133726118033139, 0.00386083964485315, 0.00192186879468536, -0.00335899789738355, -0.00240172358295239, 0.00279293587484108, 0.00275694397136103, -0.00220050219178194, -0.00299908513857019, 0.00159899050750774, 0.003137710376929, -0.000994815315083026, -0.00316681668946525, 0.000410569785812335, 0.00309179197787887, 0.000129719049032999, -0.00293280185850467, -0.000618781864765071, 0.00270287388575549, 0.00105223235185139, -0.0024086283646866, -0.0014191927027607, 0.00206186005799251, 0.00170785001710131, -0.0016853751502741, -0.00192250931383111, 0.00129118663984131, 0.00206624425573359, -0.000887744053208164, -0.00213915072540204, 0.00048446323454351, 0.0021394543307544, -9.72952602924798e-05, -0.00207412719205198, -0.000261902921881396, 0.00195391028867845, 0.000587852785329166, -0.00178689099535103, -0.000876758830049975, 0.00157983541160772, 0.00112540314471197, -0.00133839123407982, -0.00132953848579129, 0.00106953273841837, 0.00148505134600038, -0.000783925211667473, -0.00159450942576507, 0.000487431240369556, 0.00166137982211783, -0.000180650847539617, -0.0016838954266819, -0.000133541805858045, 0.00166150317516006, 0.000456087926414766, -0.0015862242317455, -0.000779866573927786, 0.00145640952393837, 0.00110462931728065, -0.00126176722824181, -0.00142448578765258, 0.000991258227168459, 0.00173446448456516, -0.000621985764089248, -0.00201825487701901, 0.000120441366192998, 0.00223716480131659, 0.0005534563928547, -0.00231346903043925, -0.00143529243970948, 0.00210630559103362, 0.00253123577947621, -0.00136170954807476, -0.0037376429876456, -0.000376251832991732, 0.00455002966939738, 0.00374143498180576, -0.00351419777820854, -0.0105213288381499, -0.0114010852941486, -0.00698337295384516, -0.00212935558407776, 0.000120041496952642, 0.000290531022810636]
-coefLPF27Hz=[0.000697532035608203, 0.00368438496813219, 0.00864389352806316, 0.0117456845790381, 0.00846757244828158, 0.00017758798297739, -0.00546130016960331, -0.00322406320258759, 0.00252031687389111, 0.00356525648378953, -0.000710191672494799, -0.00316566366540084, -0.000323458916945229, 0.00262719146417471, 0.000902312433133758, -0.00212499140645078, -0.00122083401478536, 0.00170565151584211, 0.00139878578218568, -0.00136072848770727, -0.001492993599051, 0.00108493528870173, 0.00154731597330473, -0.00085804814254326, -0.00157866766519895, 0.000669626790534566, 0.00160005191998969, -0.000508596008684604, -0.0016171683470889, 0.000368609430544243, 0.00163627544844397, -0.000240215537113803, -0.0016562904300155, 0.000120664379999133, 0.00167938780976177, -5.49839557252716e-06, -0.00170601908271442, -0.000109240898325409, 0.00173597898865216, 0.000228259386427277, -0.00176519243757925, -0.000351144699260053, 0.00179296033766752, 0.000478584128531835, -0.0018186828138859, -0.000611445104605324, 0.00184173138888898, 0.000751022021689721, -0.0018600146462785, -0.000896358975097594, 0.00187403614862875, 0.00104860247010322, -0.00188325190002413, -0.00120946710773906, 0.0018854364070005, 0.00137953495215621, -0.00187746950575469, -0.00155644189898307, 0.00185921795498966, 0.00173923008608418, -0.00183127429062737, -0.00192862614949388, 0.00179311419075806, 0.00212567920611915, -0.00174271300119452, -0.00232998424535877, 0.00167883656118763, 0.00254132988735493, -0.00159996504937154, -0.00275946881952995, 0.0015039343747086, 0.0029828483518602, -0.00138928883168684, -0.0032089627827989, 0.00125693888878509, 0.00343739319209176, -0.00110795201963896, -0.00367031695695826, 0.000940106070617584, 0.00390887408126994, -0.000749095318864083, -0.00415060699988278, 0.000532441316416378, 0.0043916318178326, -0.000291396846232353, -0.00463123011653849, 2.7011428686131e-05, 0.00487138456729212, 0.000262764006502004, -0.00511387869946768, -0.000582997770128075, 0.00535671804916971, 0.00093748677233409, -0.00559643954979557, -0.00132752039584828, 0.00583044680182854, 0.00175237568895591, -0.00606059701843037, -0.0022149327112526, 0.00628910871068565, 0.00272208338512862, -0.00651517278855562, -0.00328208266119308, 0.00673290132803275, 0.00389736108262062, -0.00694075149537225, -0.00457066807903583, 0.00714238587268479, 0.00531138314136084, -0.00734163533229064, -0.00613783544645653, 0.00753233994414032, 0.0070636724169735, -0.00770977615759309, -0.00810199292424443, 0.00787592560497273, 0.00927455278861157, -0.0080378134132046, -0.0106232471647661, 0.0081897637733109, 0.0121946391611599, -0.00832702677677348, -0.0140502720603601, 0.00844993523480891, 0.0162827558800595, -0.00856746909190598, -0.0190528136840302, 0.00866990643376335, 0.0225977351203078, -0.00875626488770348, -0.0273325296695979, 0.00882730580278306, 0.0340414033566156, -0.00890040361258724, -0.0444488683106647, 0.00893713219893791, 0.0629214622557972, -0.00897783298051339, -0.105660733509534, 0.00899710682060444, 0.318163133942651, 0.490997732053387, 0.318163133942651, 0.00899710682060444, -0.105660733509534, -0.00897783298051339, 0.0629214622557972, 0.00893713219893791, -0.0444488683106647, -0.00890040361258724, 0.0340414033566156, 0.00882730580278306, -0.0273325296695979, -0.00875626488770348, 0.0225977351203078, 0.00866990643376335, -0.0190528136840302, -0.00856746909190598, 0.0162827558800595, 0.00844993523480891, -0.0140502720603601, -0.00832702677677348, 0.0121946391611599, 0.0081897637733109, -0.0106232471647661, -0.0080378134132046, 0.00927455278861157, 0.00787592560497273, -0.00810199292424443, -0.00770977615759309, 0.0070636724169735, 0.00753233994414032, -0.00613783544645653, -0.00734163533229064, 0.00531138314136084, 0.00714238587268479, -0.00457066807903583, -0.00694075149537225, 0.00389736108262062, 0.00673290132803275, -0.00328208266119308, -0.00651517278855562, 0.00272208338512862, 0.00628910871068565, -0.0022149327112526, -0.00606059701843037, 0.00175237568895591, 0.00583044680182854, -0.00132752039584828, -0.00559643954979557, 0.00093748677233409, 0.00535671804916971, -0.000582997770128075, -0.00511387869946768, 0.000262764006502004, 0.00487138456729212, 2.7011428686131e-05, -0.00463123011653849, -0.000291396846232353, 0.0043916318178326, 0.000532441316416378, -0.00415060699988278, -0.000749095318864083, 0.00390887408126994, 0.000940106070617584, -0.00367031695695826, -0.00110795201963896, 0.00343739319209176, 0.00125693888878509, -0.0032089627827989, -0.00138928883168684, 0.0029828483518602, 0.0015039343747086, -0.00275946881952995, -0.00159996504937154, 0.00254132988735493, 0.00167883656118763, -0.00232998424535877, -0.00174271300119452, 0.00212567920611915, 0.00179311419075806, -0.00192862614949388, -0.00183127429062737, 0.00173923008608418, 0.00185921795498966, -0.00155644189898307, -0.00187746950575469, 0.00137953495215621, 0.0018854364070005, -0.00120946710773906, -0.00188325190002413, 0.00104860247010322, 0.00187403614862875, -0.000896358975097594, -0.0018600146462785, 0.000751022021689721, 0.00184173138888898, -0.000611445104605324, -0.0018186828138859, 0.000478584128531835, 0.00179296033766752, -0.000351144699260053, -0.00176519243757925, 0.000228259386427277, 0.00173597898865216, -0.000109240898325409, -0.00170601908271442, -5.49839557252716e-06, 0.00167938780976177, 0.000120664379999133, -0.0016562904300155, -0.000240215537113803, 0.00163627544844397, 0.000368609430544243, -0.0016171683470889, -0.000508596008684604, 0.00160005191998969, 0.000669626790534566, -0.00157866766519895, -0.00085804814254326, 0.00154731597330473, 0.00108493528870173, -0.001492993599051, -0.00136072848770727, 0.00139878578218568, 0.00170565151584211, -0.00122083401478536, -0.00212499140645078, 0.000902312433133758, 0.00262719146417471, -0.000323458916945229, -0.00316566366540084, -0.000710191672494799, 0.00356525648378953, 0.00252031687389111, -0.00322406320258759, -0.00546130016960331, 0.00017758798297739, 0.00846757244828158, 0.0117456845790381, 0.00864389352806316, 0.00368438496813219, 0.000697532035608203]
-coefLPF28Hz=[-0.000458647855152701, -0.000589209311679817, 0.00192011557449242, 0.00783764863018687, 0.0126736120837136, 0.0101468781053373, 0.00117077680013464, -0.00501720885662651, -0.00245968485486883, 0.00307640692762556, 0.0028252789254625, -0.00181037035149023, -0.00269033328320329, 0.00109362799916776, 0.00246956805919478, -0.000677701811679702, -0.00225644259843781, 0.000439396138039266, 0.00207856056089865, -0.000308348510765444, -0.00193921834651971, 0.000244053419644106, 0.00183424746712609, -0.000222406384042253, -0.00175682708080326, 0.000230352742797918, 0.00170239969680535, -0.000258348797877935, -0.00166507275491581, 0.000301596942666406, 0.00163995259711287, -0.00036008530267115, -0.00162876267599908, 0.000426037259151814, 0.00162359503478201, -0.000502882731145329, -0.00162646567369217, 0.000586234705483293, 0.00163322854902255, -0.000676039957322797, -0.00164180680041264, 0.00077186983148968, 0.00164906609895321, -0.000875616017301863, -0.00165420225109922, 0.000988766951932282, 0.00165815448409886, -0.00111070335408108, -0.00166105541431741, 0.00123979538745285, 0.00166145629085348, -0.00137506614857714, -0.00165755743337992, 0.00151594252073406, 0.00164687093385035, -0.00166302776376891, -0.00162694209682093, 0.00181921872948476, 0.00159939717545477, -0.00198330888502623, -0.00156295919957052, 0.0021568758974336, 0.00152115183621655, -0.00233329084242939, -0.00146761231260811, 0.00251384577861389, 0.00139906018640294, -0.00270137339340998, -0.00131507353658536, 0.00289809739444553, 0.00121781467739638, -0.00310308228612905, -0.00110943012641152, 0.00331079143666355, 0.000985544589850965, -0.00351949613782605, -0.000839833627461794, 0.00373409463364882, 0.000672461669479937, -0.00395837515297762, -0.000490194668127183, 0.00418443238437716, 0.000289134502119609, -0.0044090637149488, -6.49350400866778e-05, 0.00462678659818552, -0.000203135825865774, -0.00487207880415713, 0.000469538308287752, 0.00509235564201935, -0.000784140030938553, -0.00532409109226111, 0.00112552005556572, 0.0055555535912827, -0.00149759083736144, -0.00578150630900077, 0.00190996810342443, 0.00600710617650252, -0.00236253120535404, -0.0062303330825274, 0.00285934198242228, 0.00645034756956486, -0.0034049398230583, -0.0066660136213118, 0.00400503858316758, 0.00687577313178127, -0.00466793544364324, -0.00708015061092617, 0.00540098451064825, 0.00727639610334031, -0.00621756930732903, -0.00746514169524071, 0.00713279845035674, 0.00764981721889155, -0.00815734244249684, -0.00781869218483659, 0.00932819427648999, 0.00798273087686995, -0.0106692077404164, -0.00813449454343392, 0.0122306712095745, 0.00827510537332616, -0.0140780867461308, -0.00840366070226545, 0.0163096937308258, 0.00852132525551847, -0.0190730678270203, -0.00862639602825394, 0.0226099299223569, 0.00871700336661436, -0.0273404002012352, -0.00879384475622352, 0.0340557138262677, 0.00885861845324005, -0.044448746477997, -0.00890994204430399, 0.0629275116005019, 0.00894586287326334, -0.10566082262256, -0.00896662425738929, 0.31816141202792, 0.50897220445998, 0.31816141202792, -0.00896662425738929, -0.10566082262256, 0.00894586287326334, 0.0629275116005019, -0.00890994204430399, -0.044448746477997, 0.00885861845324005, 0.0340557138262677, -0.00879384475622352, -0.0273404002012352, 0.00871700336661436, 0.0226099299223569, -0.00862639602825394, -0.0190730678270203, 0.00852132525551847, 0.0163096937308258, -0.00840366070226545, -0.0140780867461308, 0.00827510537332616, 0.0122306712095745, -0.00813449454343392, -0.0106692077404164, 0.00798273087686995, 0.00932819427648999, -0.00781869218483659, -0.00815734244249684, 0.00764981721889155, 0.00713279845035674, -0.00746514169524071, -0.00621756930732903, 0.00727639610334031, 0.00540098451064825, -0.00708015061092617, -0.00466793544364324, 0.00687577313178127, 0.00400503858316758, -0.0066660136213118, -0.0034049398230583, 0.00645034756956486, 0.00285934198242228, -0.0062303330825274, -0.00236253120535404, 0.00600710617650252, 0.00190996810342443, -0.00578150630900077, -0.00149759083736144, 0.0055555535912827, 0.00112552005556572, -0.00532409109226111, -0.000784140030938553, 0.00509235564201935, 0.000469538308287752, -0.00487207880415713, -0.000203135825865774, 0.00462678659818552, -6.49350400866778e-05, -0.0044090637149488, 0.000289134502119609, 0.00418443238437716, -0.000490194668127183, -0.00395837515297762, 0.000672461669479937, 0.00373409463364882, -0.000839833627461794, -0.00351949613782605, 0.000985544589850965, 0.00331079143666355, -0.00110943012641152, -0.00310308228612905, 0.00121781467739638, 0.00289809739444553, -0.00131507353658536, -0.00270137339340998, 0.00139906018640294, 0.00251384577861389, -0.00146761231260811, -0.00233329084242939, 0.00152115183621655, 0.0021568758974336, -0.00156295919957052, -0.00198330888502623, 0.00159939717545477, 0.00181921872948476, -0.00162694209682093, -0.00166302776376891, 0.00164687093385035, 0.00151594252073406, -0.00165755743337992, -0.00137506614857714, 0.00166145629085348, 0.00123979538745285, -0.00166105541431741, -0.00111070335408108, 0.00165815448409886, 0.000988766951932282, -0.00165420225109922, -0.000875616017301863, 0.00164906609895321, 0.00077186983148968, -0.00164180680041264, -0.000676039957322797, 0.00163322854902255, 0.000586234705483293, -0.00162646567369217, -0.000502882731145329, 0.00162359503478201, 0.000426037259151814, -0.00162876267599908, -0.00036008530267115, 0.00163995259711287, 0.000301596942666406, -0.00166507275491581, -0.000258348797877935, 0.00170239969680535, 0.000230352742797918, -0.00175682708080326, -0.000222406384042253, 0.00183424746712609, 0.000244053419644106, -0.00193921834651971, -0.000308348510765444, 0.00207856056089865, 0.000439396138039266, -0.00225644259843781, -0.000677701811679702, 0.00246956805919478, 0.00109362799916776, -0.00269033328320329, -0.00181037035149023, 0.0028252789254625, 0.00307640692762556, -0.00245968485486883, -0.00501720885662651, 0.00117077680013464, 0.0101468781053373, 0.0126736120837136, 0.00783764863018687, 0.00192011557449242, -0.000589209311679817, -0.000458647855152701]
-coefLPF29Hz=[-0.000717071419935696, -0.00412283541548223, -0.00979801538801674, -0.0125194778948161, -0.00715884076124605, 0.00243474608453573, 0.00592506692664004, 0.000568879408594431, -0.00424122396361012, -0.00139642887355666, 0.00315489563795604, 0.00153661077213171, -0.00251396143326224, -0.00144853257446124, 0.00214558235210231, 0.00128422769055509, -0.00193700007262684, -0.00109154825011111, 0.00182494725199972, 0.000889381264339067, -0.00176634695017797, -0.000679201846628367, 0.0017375664320582, 0.000462020945227648, -0.00172250325183417, -0.000241194571603345, 0.0017024969026783, 8.92095203870387e-06, -0.00167632132117945, 0.000226203875596851, 0.00162972787887144, -0.000468167470710539, -0.00156223265072075, 0.00070880343771497, 0.00146404560616326, -0.000949026079552667, -0.00133586451925104, 0.00118102855234166, 0.00117430754412897, -0.00139874741786137, -0.000977532518114103, 0.00159574147863073, 0.000744916131063093, -0.00176580128740619, -0.000477464394672945, 0.00190303431027973, 0.000179226138499336, -0.00199951328482364, 0.000146046380410709, 0.00204829857859566, -0.000494031237877997, -0.00204499048661361, 0.000856696661715326, 0.00198461405449299, -0.00122524986344402, -0.00186370258037866, 0.00158787986670652, 0.00167680598414625, -0.00193598054229911, -0.00142326475391778, 0.00225865255533414, 0.00110391544933526, -0.00254517667134013, -0.000723212932501571, 0.00278234832868491, 0.000285905103463915, -0.00295807621831967, 0.000201132569917112, 0.00306141561374003, -0.000728024631710623, -0.00308188174940648, 0.00128283201280202, 0.00300992748301298, -0.0018518493402964, -0.00283716865274954, 0.00242144910941806, 0.00255971091058409, -0.00297510324777298, -0.00217652485757952, 0.00349407281030923, 0.00168949820959635, -0.00395689306584615, -0.00110105703046393, 0.00434303505713537, 0.00041622764525319, -0.00463364512506973, 0.000355877138187179, 0.00481142490532994, -0.00120138825660564, -0.00486019381803984, 0.0021013588559706, 0.00476350154505763, -0.00303435695001422, -0.00450645079307061, 0.0039765314684547, 0.00407621067908566, -0.00490297995368246, -0.00346396164644384, 0.00578795171295798, 0.00266812675203939, -0.00660011539823333, -0.00168931260034313, 0.00730693028643147, 0.00053395041572581, -0.00786944840725537, 0.000795498148137568, 0.00825604584853478, -0.00228717625877054, -0.00843279566106353, 0.00392601663842413, 0.00836886604459622, -0.00568589677491579, -0.00802487277392477, 0.00754149063136442, 0.00735889703062968, -0.00946960907003711, -0.00633161006831624, 0.0114431253506499, 0.00490149303647476, -0.0134301848576286, -0.00301941673467016, 0.015392552952267, 0.000615402644849212, -0.0172928976002466, 0.00241381785164325, 0.0191097718578023, -0.00619715223224296, -0.0207991077665072, 0.0109750886541703, 0.0223459304116744, -0.0171231825428674, -0.0236861565880512, 0.025453029742982, 0.0248385176729222, -0.037595227830043, -0.0257534661785252, 0.0579442474465555, 0.026417739742156, -0.102638063339293, -0.0268245215595863, 0.31714799175915, 0.526959390733769, 0.31714799175915, -0.0268245215595863, -0.102638063339293, 0.026417739742156, 0.0579442474465555, -0.0257534661785252, -0.037595227830043, 0.0248385176729222, 0.025453029742982, -0.0236861565880512, -0.0171231825428674, 0.0223459304116744, 0.0109750886541703, -0.0207991077665072, -0.00619715223224296, 0.0191097718578023, 0.00241381785164325, -0.0172928976002466, 0.000615402644849212, 0.015392552952267, -0.00301941673467016, -0.0134301848576286, 0.00490149303647476, 0.0114431253506499, -0.00633161006831624, -0.00946960907003711, 0.00735889703062968, 0.00754149063136442, -0.00802487277392477, -0.00568589677491579, 0.00836886604459622, 0.00392601663842413, -0.00843279566106353, -0.00228717625877054, 0.00825604584853478, 0.000795498148137568, -0.00786944840725537, 0.00053395041572581, 0.00730693028643147, -0.00168931260034313, -0.00660011539823333, 0.00266812675203939, 0.00578795171295798, -0.00346396164644384, -0.00490297995368246, 0.00407621067908566, 0.0039765314684547, -0.00450645079307061, -0.00303435695001422, 0.00476350154505763, 0.0021013588559706, -0.00486019381803984, -0.00120138825660564, 0.00481142490532994, 0.000355877138187179, -0.00463364512506973, 0.00041622764525319, 0.00434303505713537, -0.00110105703046393, -0.00395689306584615, 0.00168949820959635, 0.00349407281030923, -0.00217652485757952, -0.00297510324777298, 0.00255971091058409, 0.00242144910941806, -0.00283716865274954, -0.0018518493402964, 0.00300992748301298, 0.00128283201280202, -0.00308188174940648, -0.000728024631710623, 0.00306141561374003, 0.000201132569917112, -0.00295807621831967, 0.000285905103463915, 0.00278234832868491, -0.000723212932501571, -0.00254517667134013, 0.00110391544933526, 0.00225865255533414, -0.00142326475391778, -0.00193598054229911, 0.00167680598414625, 0.00158787986670652, -0.00186370258037866, -0.00122524986344402, 0.00198461405449299, 0.000856696661715326, -0.00204499048661361, -0.000494031237877997, 0.00204829857859566, 0.000146046380410709, -0.00199951328482364, 0.000179226138499336, 0.00190303431027973, -0.000477464394672945, -0.00176580128740619, 0.000744916131063093, 0.00159574147863073, -0.000977532518114103, -0.00139874741786137, 0.00117430754412897, 0.00118102855234166, -0.00133586451925104, -0.000949026079552667, 0.00146404560616326, 0.00070880343771497, -0.00156223265072075, -0.000468167470710539, 0.00162972787887144, 0.000226203875596851, -0.00167632132117945, 8.92095203870387e-06, 0.0017024969026783, -0.000241194571603345, -0.00172250325183417, 0.000462020945227648, 0.0017375664320582, -0.000679201846628367, -0.00176634695017797, 0.000889381264339067, 0.00182494725199972, -0.00109154825011111, -0.00193700007262684, 0.00128422769055509, 0.00214558235210231, -0.00144853257446124, -0.00251396143326224, 0.00153661077213171, 0.00315489563795604, -0.00139642887355666, -0.00424122396361012, 0.000568879408594431, 0.00592506692664004, 0.00243474608453573, -0.00715884076124605, -0.0125194778948161, -0.00979801538801674, -0.00412283541548223, -0.000717071419935696]
-coefLPF30Hz=[0.00075361844461446, 0.00155774438099197, -0.000956145836920408, -0.00821836583917656, -0.0138876001167824, -0.00987281805369443, 0.000471119864818101, 0.00464149448461444, -0.000467091328628653, -0.00403420068393662, -9.33432004417693e-05, 0.0031814075281458, -3.39085578451672e-05, -0.00272245959752173, 0.000242482692645104, 0.00236290412087609, -0.000515508213879523, -0.00205609760086897, 0.00080081478539878, 0.00175396794973409, -0.00107454877575583, -0.00143279330257713, 0.00131538483798234, 0.00107989148652046, -0.0015057294341266, -0.000693607401694217, 0.00162903309682604, 0.000280429047289987, -0.00167046979993059, 0.000147654101872869, 0.00162065101694652, -0.000570517262041129, -0.00147203675251788, 0.000966810412329992, 0.00122497660463944, -0.00131226238877651, -0.000887730410512214, 0.00158001030893884, 0.000472726239738165, -0.00174830760649579, -2.85360094097558e-06, 0.00179677029630698, -0.000494881099988055, -0.00171253377198756, 0.000988404745300006, 0.00149274781190221, -0.00143962544605303, -0.00114063428478209, 0.00181337269688247, 0.000673458035410937, -0.00207337133943282, -0.000116746268003044, 0.002189272302953, -0.000495270258362692, -0.00214053588322101, 0.00111776975671238, 0.00191379964461991, -0.00170513794125089, -0.00151268330753951, 0.00220666731205977, 0.000952970172122706, -0.00257417833835795, -0.000264326210437423, 0.00276732545699982, -0.000506321449174816, -0.00274931907914046, 0.00130942539810492, 0.00250683964459203, -0.00207594586993343, -0.00202867220833336, 0.0027516285360087, 0.00134462007166469, -0.00325678502237174, -0.000471919414230868, 0.00355583416064718, -0.000509731894048433, -0.00357386927746875, 0.00156166680580084, 0.0033128439008496, -0.00257163221122633, -0.00273207427032589, 0.00348426670366709, 0.00187286140177245, -0.00419638779164959, -0.000767904188103453, 0.00462968022036506, -0.000522599144484168, -0.00473005357159137, 0.00189345265614098, 0.00442797099692267, -0.0032667416720304, -0.00372244568595834, 0.00452618015660031, 0.00263917752311704, -0.00553175734949984, -0.00120059646747852, 0.00618442127908965, -0.00051804861018505, -0.00640036268965095, 0.00239554238274095, 0.00609947240538742, -0.00429878410730614, -0.00523535008510617, 0.00608338015679987, 0.00380931179845303, -0.00758967119524065, -0.00186615701154382, 0.00865180643932734, -0.000513363196155177, -0.00912024388296031, 0.0032061569529627, 0.00887322049211772, -0.00604234565289292, -0.00781485053263919, 0.00882291913624504, 0.00589237023365737, -0.0113230300909443, -0.00310231687345286, 0.0132963438837703, -0.000514521880060876, -0.0144950946721603, 0.00485956513359994, 0.0146638898100845, -0.00978827155252945, -0.0135442868755164, 0.0151179835829718, 0.0108714160827713, -0.0206264972867461, -0.00632919715420864, 0.0260786628258619, -0.000512501650543791, -0.0312261485503853, 0.0104012035732177, 0.0358264426823791, -0.0249358025884099, -0.0396644853477958, 0.0483660371980394, 0.0425458167015152, -0.096670619283912, -0.0443378306026896, 0.315120356942793, 0.544941806937626, 0.315120356942793, -0.0443378306026896, -0.096670619283912, 0.0425458167015152, 0.0483660371980394, -0.0396644853477958, -0.0249358025884099, 0.0358264426823791, 0.0104012035732177, -0.0312261485503853, -0.000512501650543791, 0.0260786628258619, -0.00632919715420864, -0.0206264972867461, 0.0108714160827713, 0.0151179835829718, -0.0135442868755164, -0.00978827155252945, 0.0146638898100845, 0.00485956513359994, -0.0144950946721603, -0.000514521880060876, 0.0132963438837703, -0.00310231687345286, -0.0113230300909443, 0.00589237023365737, 0.00882291913624504, -0.00781485053263919, -0.00604234565289292, 0.00887322049211772, 0.0032061569529627, -0.00912024388296031, -0.000513363196155177, 0.00865180643932734, -0.00186615701154382, -0.00758967119524065, 0.00380931179845303, 0.00608338015679987, -0.00523535008510617, -0.00429878410730614, 0.00609947240538742, 0.00239554238274095, -0.00640036268965095, -0.00051804861018505, 0.00618442127908965, -0.00120059646747852, -0.00553175734949984, 0.00263917752311704, 0.00452618015660031, -0.00372244568595834, -0.0032667416720304, 0.00442797099692267, 0.00189345265614098, -0.00473005357159137, -0.000522599144484168, 0.00462968022036506, -0.000767904188103453, -0.00419638779164959, 0.00187286140177245, 0.00348426670366709, -0.00273207427032589, -0.00257163221122633, 0.0033128439008496, 0.00156166680580084, -0.00357386927746875, -0.000509731894048433, 0.00355583416064718, -0.000471919414230868, -0.00325678502237174, 0.00134462007166469, 0.0027516285360087, -0.00202867220833336, -0.00207594586993343, 0.00250683964459203, 0.00130942539810492, -0.00274931907914046, -0.000506321449174816, 0.00276732545699982, -0.000264326210437423, -0.00257417833835795, 0.000952970172122706, 0.00220666731205977, -0.00151268330753951, -0.00170513794125089, 0.00191379964461991, 0.00111776975671238, -0.00214053588322101, -0.000495270258362692, 0.002189272302953, -0.000116746268003044, -0.00207337133943282, 0.000673458035410937, 0.00181337269688247, -0.00114063428478209, -0.00143962544605303, 0.00149274781190221, 0.000988404745300006, -0.00171253377198756, -0.000494881099988055, 0.00179677029630698, -2.85360094097558e-06, -0.00174830760649579, 0.000472726239738165, 0.00158001030893884, -0.000887730410512214, -0.00131226238877651, 0.00122497660463944, 0.000966810412329992, -0.00147203675251788, -0.000570517262041129, 0.00162065101694652, 0.000147654101872869, -0.00167046979993059, 0.000280429047289987, 0.00162903309682604, -0.000693607401694217, -0.0015057294341266, 0.00107989148652046, 0.00131538483798234, -0.00143279330257713, -0.00107454877575583, 0.00175396794973409, 0.00080081478539878, -0.00205609760086897, -0.000515508213879523, 0.00236290412087609, 0.000242482692645104, -0.00272245959752173, -3.39085578451672e-05, 0.0031814075281458, -9.33432004417693e-05, -0.00403420068393662, -0.000467091328628653, 0.00464149448461444, 0.000471119864818101, -0.00987281805369443, -0.0138876001167824, -0.00821836583917656, -0.000956145836920408, 0.00155774438099197, 0.00075361844461446]
-coefLPF31Hz=[0.000720766644612784, 0.00454618248841151, 0.0109514045625496, 0.01306134839556, 0.00541053731373121, -0.00473732302751099, -0.00509095761407055, 0.0022966365520343, 0.00400600435237504, -0.00165647078872557, -0.0031408537033557, 0.00160392301580976, 0.00243450450949902, -0.00174216486475129, -0.00179271581858904, 0.00190432837963354, 0.00116089324245066, -0.00200603774317471, -0.000526148534424591, 0.00199548919597809, -9.56909060094391e-05, -0.00184092497672263, 0.000672464225809611, 0.00153446572795138, -0.00115823879752558, -0.00108912072827143, 0.0015011012205404, 0.000531482754733139, -0.00166601177236473, 8.1378833410676e-05, 0.00162350592025318, -0.000683474013542241, -0.00136668190007407, 0.00120531108634306, 0.00092194219801621, -0.00156940913681183, -0.000328567828910917, 0.00172830527600171, -0.00033165932809015, -0.00163855735638231, 0.000978571630794069, 0.00130280909380254, -0.00151423863003814, -0.000749073093009927, 0.00185576466447022, 4.52994631719511e-05, -0.00193708878808576, 0.000714660551146543, 0.00172533469767689, -0.00142065077545279, -0.00122863865868705, 0.00196156483062984, 0.000500396958473534, -0.00224039375129152, 0.000365639693915612, 0.00219030807958187, -0.00124749255577278, -0.00179075848487641, 0.00200758763942646, 0.00107053573466901, -0.00251909053811345, -0.000116959072023648, 0.00267647217556203, -0.000942262459130105, -0.00242284994964983, 0.00194859866209973, 0.00175937293014901, -0.00273703265418129, -0.000750883662958142, 0.00316418264629426, -0.000471884273007818, -0.00312396126044915, 0.00173734673057204, 0.00257932134590029, -0.00284555217082862, -0.00156532953001107, 0.00360596714812498, 0.00019898753053045, -0.00386183001769096, 0.00133569539496771, 0.00352070782624253, -0.00280932344392403, -0.00257540516245322, 0.00397923008608691, 0.00111434287929045, -0.00462648830327471, 0.000681725927473473, 0.00459152658952512, -0.00256054105641363, -0.00380828447194862, 0.00422612459752332, 0.00231773888176312, -0.00538988282738823, -0.000284589454358543, 0.00580275573583335, -0.00203089627805835, -0.00531549969455322, 0.00428602694694642, 0.00389768917153529, -0.00611265282646423, -0.00166635833663067, 0.00716334176201407, -0.00111896418814324, -0.00716602374959221, 0.00408525809568875, 0.00598374906851073, -0.00677862151818123, -0.00364215610347696, 0.00873135940221083, 0.000354777261551193, -0.00952079155014813, 0.00349093599377661, 0.00883876933263188, -0.0073690777313798, -0.00655447045602454, 0.0106686330227138, 0.0027563467107656, -0.012764374061169, 0.00222991137853704, 0.0130939105740957, -0.0078562672121288, -0.0112430616512156, 0.0133764395109295, 0.00698945431449509, -0.0179409727266899, -0.000406841892044859, 0.0205794571543065, -0.00822031286388736, -0.0203685482798794, 0.0182840088280057, 0.0162929405323013, -0.0290522291144641, -0.00726652211464632, 0.0396248261112094, -0.00843086675991327, -0.0490577357065857, 0.0349606997519176, 0.0565074832606205, -0.0879362573815736, -0.0612803543438677, 0.312090910858517, 0.562922760980621, 0.312090910858517, -0.0612803543438677, -0.0879362573815736, 0.0565074832606205, 0.0349606997519176, -0.0490577357065857, -0.00843086675991327, 0.0396248261112094, -0.00726652211464632, -0.0290522291144641, 0.0162929405323013, 0.0182840088280057, -0.0203685482798794, -0.00822031286388736, 0.0205794571543065, -0.000406841892044859, -0.0179409727266899, 0.00698945431449509, 0.0133764395109295, -0.0112430616512156, -0.0078562672121288, 0.0130939105740957, 0.00222991137853704, -0.012764374061169, 0.0027563467107656, 0.0106686330227138, -0.00655447045602454, -0.0073690777313798, 0.00883876933263188, 0.00349093599377661, -0.00952079155014813, 0.000354777261551193, 0.00873135940221083, -0.00364215610347696, -0.00677862151818123, 0.00598374906851073, 0.00408525809568875, -0.00716602374959221, -0.00111896418814324, 0.00716334176201407, -0.00166635833663067, -0.00611265282646423, 0.00389768917153529, 0.00428602694694642, -0.00531549969455322, -0.00203089627805835, 0.00580275573583335, -0.000284589454358543, -0.00538988282738823, 0.00231773888176312, 0.00422612459752332, -0.00380828447194862, -0.00256054105641363, 0.00459152658952512, 0.000681725927473473, -0.00462648830327471, 0.00111434287929045, 0.00397923008608691, -0.00257540516245322, -0.00280932344392403, 0.00352070782624253, 0.00133569539496771, -0.00386183001769096, 0.00019898753053045, 0.00360596714812498, -0.00156532953001107, -0.00284555217082862, 0.00257932134590029, 0.00173734673057204, -0.00312396126044915, -0.000471884273007818, 0.00316418264629426, -0.000750883662958142, -0.00273703265418129, 0.00175937293014901, 0.00194859866209973, -0.00242284994964983, -0.000942262459130105, 0.00267647217556203, -0.000116959072023648, -0.00251909053811345, 0.00107053573466901, 0.00200758763942646, -0.00179075848487641, -0.00124749255577278, 0.00219030807958187, 0.000365639693915612, -0.00224039375129152, 0.000500396958473534, 0.00196156483062984, -0.00122863865868705, -0.00142065077545279, 0.00172533469767689, 0.000714660551146543, -0.00193708878808576, 4.52994631719511e-05, 0.00185576466447022, -0.000749073093009927, -0.00151423863003814, 0.00130280909380254, 0.000978571630794069, -0.00163855735638231, -0.00033165932809015, 0.00172830527600171, -0.000328567828910917, -0.00156940913681183, 0.00092194219801621, 0.00120531108634306, -0.00136668190007407, -0.000683474013542241, 0.00162350592025318, 8.1378833410676e-05, -0.00166601177236473, 0.000531482754733139, 0.0015011012205404, -0.00108912072827143, -0.00115823879752558, 0.00153446572795138, 0.000672464225809611, -0.00184092497672263, -9.56909060094391e-05, 0.00199548919597809, -0.000526148534424591, -0.00200603774317471, 0.00116089324245066, 0.00190432837963354, -0.00179271581858904, -0.00174216486475129, 0.00243450450949902, 0.00160392301580976, -0.0031408537033557, -0.00165647078872557, 0.00400600435237504, 0.0022966365520343, -0.00509095761407055, -0.00473732302751099, 0.00541053731373121, 0.01306134839556, 0.0109514045625496, 0.00454618248841151, 0.000720766644612784]
-coefLPF32Hz=[-0.00130061793339303, -0.00360139681913505, -0.00184522769124443, 0.00713088371676886, 0.0147747116776535, 0.0102268617846496, -0.000506388797770902, -0.00225406513566747, 0.00358501110200893, 0.00335617140759195, -0.00214246469342986, -0.00154712051426335, 0.0026402082149918, 0.000889287538656753, -0.00238876453732878, 9.50102397387438e-05, 0.00216455145801424, -0.000837668231751682, -0.0016398804972249, 0.00143353482169603, 0.000950154260684564, -0.00174548401104073, -0.000151741835033699, 0.00173264696685975, -0.000631026849357315, -0.00139555041064215, 0.00125260997387818, 0.000778294898450007, -0.00160567979012219, -1.12287218308379e-05, 0.00159624540621589, -0.000766792706420145, -0.0012315468921203, 0.00137127764026055, 0.000564297925420705, -0.00167215170549245, 0.000255130994983587, 0.0015757305301119, -0.00104997328369997, -0.00108906488356666, 0.00162502894447461, 0.000305126999290294, -0.0018249980507366, 0.000607790944896789, 0.00158291737189504, -0.00142121329572198, -0.000913544150331224, 0.00193972063934622, -3.02302995955301e-05, -0.00199288926015115, 0.0010462182991996, 0.00154349737458674, -0.00186874471396139, -0.000653585582383478, 0.00227954401225511, -0.000480844277870944, -0.00213741450325823, 0.00158293024716155, 0.0014202182880092, -0.00237701687953562, -0.000274450936943022, 0.00261799817713969, -0.00105157512220334, -0.00220241402264459, 0.00221924781239921, 0.0011686654227243, -0.00291438860291008, 0.000272054749403996, 0.00291664236068248, -0.00177187680858187, -0.00214840637367992, 0.00295275403268175, 0.000741873017710452, -0.0034724753145918, 0.000994469033503953, 0.0031249368835569, -0.00264428613609825, -0.00192441293577307, 0.00375529540872373, 9.15782518314698e-05, -0.00398842461878283, 0.00195044924758746, 0.00319187345965232, -0.00368094812542192, -0.00146034472389425, 0.00462373821026648, -0.000832374682615627, -0.0044318302397, 0.00315228833481395, 0.0030405555432119, -0.00488863124340668, -0.00069212049364215, 0.00550789761795061, -0.0021096959377155, -0.00472956183362041, 0.00466886350533414, 0.0025987389195528, -0.00627230097298484, 0.000490072337797732, 0.00639124019315773, -0.00382577263514396, -0.00480942645450295, 0.00654797085343739, 0.00171947622488537, -0.00786794241779656, 0.00224188227029955, 0.00723635460590071, -0.00614233883546297, -0.00454160070137102, 0.00894769570225823, 0.000211538098886804, -0.00974245870997038, 0.00484661023744491, 0.00798746153150166, -0.00941253947308362, -0.00372662842801112, 0.0121916474890828, -0.0023414705877202, -0.0121096643472251, 0.00894593310108066, 0.00861482158326255, -0.0144504746406428, -0.00190218192537871, 0.0171498664267685, -0.00701309104758324, -0.0156251004206275, 0.0163785222265814, 0.00908844014663544, -0.0238967548500745, 0.00239985690459728, 0.0270127887629494, -0.0178500464980687, -0.0231169403935969, 0.0354562266732095, 0.00938532122156656, -0.0528724299435311, 0.0187709028685255, 0.0676036100686846, -0.0766722827391508, -0.0774525021796642, 0.308060656630811, 0.580913372328355, 0.308060656630811, -0.0774525021796642, -0.0766722827391508, 0.0676036100686846, 0.0187709028685255, -0.0528724299435311, 0.00938532122156656, 0.0354562266732095, -0.0231169403935969, -0.0178500464980687, 0.0270127887629494, 0.00239985690459728, -0.0238967548500745, 0.00908844014663544, 0.0163785222265814, -0.0156251004206275, -0.00701309104758324, 0.0171498664267685, -0.00190218192537871, -0.0144504746406428, 0.00861482158326255, 0.00894593310108066, -0.0121096643472251, -0.0023414705877202, 0.0121916474890828, -0.00372662842801112, -0.00941253947308362, 0.00798746153150166, 0.00484661023744491, -0.00974245870997038, 0.000211538098886804, 0.00894769570225823, -0.00454160070137102, -0.00614233883546297, 0.00723635460590071, 0.00224188227029955, -0.00786794241779656, 0.00171947622488537, 0.00654797085343739, -0.00480942645450295, -0.00382577263514396, 0.00639124019315773, 0.000490072337797732, -0.00627230097298484, 0.0025987389195528, 0.00466886350533414, -0.00472956183362041, -0.0021096959377155, 0.00550789761795061, -0.00069212049364215, -0.00488863124340668, 0.0030405555432119, 0.00315228833481395, -0.0044318302397, -0.000832374682615627, 0.00462373821026648, -0.00146034472389425, -0.00368094812542192, 0.00319187345965232, 0.00195044924758746, -0.00398842461878283, 9.15782518314698e-05, 0.00375529540872373, -0.00192441293577307, -0.00264428613609825, 0.0031249368835569, 0.000994469033503953, -0.0034724753145918, 0.000741873017710452, 0.00295275403268175, -0.00214840637367992, -0.00177187680858187, 0.00291664236068248, 0.000272054749403996, -0.00291438860291008, 0.0011686654227243, 0.00221924781239921, -0.00220241402264459, -0.00105157512220334, 0.00261799817713969, -0.000274450936943022, -0.00237701687953562, 0.0014202182880092, 0.00158293024716155, -0.00213741450325823, -0.000480844277870944, 0.00227954401225511, -0.000653585582383478, -0.00186874471396139, 0.00154349737458674, 0.0010462182991996, -0.00199288926015115, -3.02302995955301e-05, 0.00193972063934622, -0.000913544150331224, -0.00142121329572198, 0.00158291737189504, 0.000607790944896789, -0.0018249980507366, 0.000305126999290294, 0.00162502894447461, -0.00108906488356666, -0.00104997328369997, 0.0015757305301119, 0.000255130994983587, -0.00167215170549245, 0.000564297925420705, 0.00137127764026055, -0.0012315468921203, -0.000766792706420145, 0.00159624540621589, -1.12287218308379e-05, -0.00160567979012219, 0.000778294898450007, 0.00125260997387818, -0.00139555041064215, -0.000631026849357315, 0.00173264696685975, -0.000151741835033699, -0.00174548401104073, 0.000950154260684564, 0.00143353482169603, -0.0016398804972249, -0.000837668231751682, 0.00216455145801424, 9.50102397387438e-05, -0.00238876453732878, 0.000889287538656753, 0.0026402082149918, -0.00154712051426335, -0.00214246469342986, 0.00335617140759195, 0.00358501110200893, -0.00225406513566747, -0.000506388797770902, 0.0102268617846496, 0.0147747116776535, 0.00713088371676886, -0.00184522769124443, -0.00360139681913505, -0.00130061793339303]
-coefLPF33Hz=[-0.000685181893226424, -0.0048962578456439, -0.0120548091054022, -0.0133772547713763, -0.0033889627325641, 0.00641561377898802, 0.00316643366783986, -0.00441309211484975, -0.00193235422602368, 0.00371184970169945, 0.000675641817803767, -0.00321594245333991, 0.000479250058420848, 0.00256250127574697, -0.00141401005296208, -0.00166191859795343, 0.00198680534525158, 0.000584313200592942, -0.00208766760173071, 0.000490379149765192, 0.00169010322515277, -0.00133546308871887, -0.000886231610391781, 0.00175093888607415, -0.000112327052055833, -0.00162820483031877, 0.00102617568652776, 0.00100247359103828, -0.00158689584763006, -6.58615058643377e-05, 0.00161387599401618, -0.00088591036280788, -0.00108650256268857, 0.00154043899259214, 0.000171334739643989, -0.00166039186926705, 0.000832296096041927, 0.00118419276219622, -0.00157342936051587, -0.00025556116438086, 0.00176704421832834, -0.000820401639579031, -0.00131797914713219, 0.00165070341967744, 0.00034388225340258, -0.00191761484012329, 0.000823340973561743, 0.00147683630493136, -0.00176335176208268, -0.000443150951393012, 0.00210226860043926, -0.000840988127961513, -0.0016652145877671, 0.00190681675814073, 0.0005532169969998, -0.00233045161490378, 0.000865766949050848, 0.0018940892367611, -0.00207520253426373, -0.000689448182909466, 0.0025923784910094, -0.000888717276930869, -0.00215543199081284, 0.00226633406758112, 0.000844827115754171, -0.00289355247282956, 0.000914551284952634, 0.00245765786613489, -0.00248498831489762, -0.00102704327559653, 0.00324070944751759, -0.000938364715670065, -0.00280952483876868, 0.00272866457645091, 0.00124426472991594, -0.00363048622720942, 0.000959204773590472, 0.00320619802359609, -0.00300656694451092, -0.0014878351115879, 0.00408532074648815, -0.000985828646333166, -0.00367577528478848, 0.0033286610508605, 0.0017853363166136, -0.00461111798868734, 0.0010044946571147, 0.0042217860471649, -0.00369729518747285, -0.00213175324082602, 0.00523000055811675, -0.00102685881935051, -0.00487500862646596, 0.00413460949769357, 0.00255716176653011, -0.0059687131766273, 0.00103866103892902, 0.00565901906501483, -0.00465221256090788, -0.0030707431101572, 0.00686537534260468, -0.0010575212031441, -0.00663054334355647, 0.00529638208105721, 0.00372401100874347, -0.00798857338278114, 0.00106544080407555, 0.00785882531206814, -0.00610896827662306, -0.00455686589120603, 0.00944687064796063, -0.00108353853631507, -0.0094932376954748, 0.00719486723689132, 0.00569818457713448, -0.0114263678823399, 0.00109170530642659, 0.0117637884353127, -0.0087174241911051, -0.00732286491266537, 0.0143130267134282, -0.00109410733035323, -0.0151820344504781, 0.0110517190085408, 0.00989207468704892, -0.0189128911296413, 0.00111153902653609, 0.0209826264442495, -0.0151188845429963, -0.0145413442714385, 0.0276210294600862, -0.00111267697067202, -0.0330980449739542, 0.0241828059932827, 0.0257378441905691, -0.0506678474694741, 0.00111286069262149, 0.0752510059393194, -0.0632274157566716, -0.0926208597434604, 0.303053149947997, 0.598885340138292, 0.303053149947997, -0.0926208597434604, -0.0632274157566716, 0.0752510059393194, 0.00111286069262149, -0.0506678474694741, 0.0257378441905691, 0.0241828059932827, -0.0330980449739542, -0.00111267697067202, 0.0276210294600862, -0.0145413442714385, -0.0151188845429963, 0.0209826264442495, 0.00111153902653609, -0.0189128911296413, 0.00989207468704892, 0.0110517190085408, -0.0151820344504781, -0.00109410733035323, 0.0143130267134282, -0.00732286491266537, -0.0087174241911051, 0.0117637884353127, 0.00109170530642659, -0.0114263678823399, 0.00569818457713448, 0.00719486723689132, -0.0094932376954748, -0.00108353853631507, 0.00944687064796063, -0.00455686589120603, -0.00610896827662306, 0.00785882531206814, 0.00106544080407555, -0.00798857338278114, 0.00372401100874347, 0.00529638208105721, -0.00663054334355647, -0.0010575212031441, 0.00686537534260468, -0.0030707431101572, -0.00465221256090788, 0.00565901906501483, 0.00103866103892902, -0.0059687131766273, 0.00255716176653011, 0.00413460949769357, -0.00487500862646596, -0.00102685881935051, 0.00523000055811675, -0.00213175324082602, -0.00369729518747285, 0.0042217860471649, 0.0010044946571147, -0.00461111798868734, 0.0017853363166136, 0.0033286610508605, -0.00367577528478848, -0.000985828646333166, 0.00408532074648815, -0.0014878351115879, -0.00300656694451092, 0.00320619802359609, 0.000959204773590472, -0.00363048622720942, 0.00124426472991594, 0.00272866457645091, -0.00280952483876868, -0.000938364715670065, 0.00324070944751759, -0.00102704327559653, -0.00248498831489762, 0.00245765786613489, 0.000914551284952634, -0.00289355247282956, 0.000844827115754171, 0.00226633406758112, -0.00215543199081284, -0.000888717276930869, 0.0025923784910094, -0.000689448182909466, -0.00207520253426373, 0.0018940892367611, 0.000865766949050848, -0.00233045161490378, 0.0005532169969998, 0.00190681675814073, -0.0016652145877671, -0.000840988127961513, 0.00210226860043926, -0.000443150951393012, -0.00176335176208268, 0.00147683630493136, 0.000823340973561743, -0.00191761484012329, 0.00034388225340258, 0.00165070341967744, -0.00131797914713219, -0.000820401639579031, 0.00176704421832834, -0.00025556116438086, -0.00157342936051587, 0.00118419276219622, 0.000832296096041927, -0.00166039186926705, 0.000171334739643989, 0.00154043899259214, -0.00108650256268857, -0.00088591036280788, 0.00161387599401618, -6.58615058643377e-05, -0.00158689584763006, 0.00100247359103828, 0.00102617568652776, -0.00162820483031877, -0.000112327052055833, 0.00175093888607415, -0.000886231610391781, -0.00133546308871887, 0.00169010322515277, 0.000490379149765192, -0.00208766760173071, 0.000584313200592942, 0.00198680534525158, -0.00166191859795343, -0.00141401005296208, 0.00256250127574697, 0.000479250058420848, -0.00321594245333991, 0.000675641817803767, 0.00371184970169945, -0.00193235422602368, -0.00441309211484975, 0.00316643366783986, 0.00641561377898802, -0.0033889627325641, -0.0133772547713763, -0.0120548091054022, -0.0048962578456439, -0.000685181893226424]
-coefLPF34Hz=[0.0024116112326431, 0.00833234522368213, 0.0101564050825498, 0.000364028451565867, -0.0108185997401773, -0.00818183946080634, 0.000456597594002635, -0.00131331663244367, -0.0067037778627924, -0.00303248023823253, 0.000800671126591237, -0.00310085724240002, -0.00405128326616852, 0.000307043682339263, -0.000549064195610555, -0.00352200341679187, -0.00071853959175241, 0.000750297931945171, -0.00236048278298045, -0.00155954185863643, 0.00111643265266053, -0.00108655670474277, -0.00201337534654099, 0.00088302679505835, 3.71676513312444e-05, -0.00206115157578851, 0.000307658112340518, 0.000876122112289135, -0.00174269956152966, -0.000404213574394465, 0.00135766689560251, -0.00113725437758152, -0.00109033060513755, 0.00144625703251931, -0.000343792793197932, -0.0015938205049316, 0.00116010926102746, 0.000503778545472694, -0.00180521336949331, 0.000555046389015065, 0.00125134044061936, -0.00165520487390062, -0.000254207692784081, 0.00175114019457358, -0.00112901929793464, -0.00110338258442923, 0.00187282831705847, -0.000300083792497511, -0.00180192667946808, 0.00155172258443965, 0.000684412031039355, -0.00216494283731814, 0.000812992765780013, 0.00161766515236204, -0.00206244650670671, -0.000218090693760501, 0.0022761948800421, -0.0014604475693343, -0.0013350469204296, 0.00247439250350562, -0.000433949141021921, -0.00228855335424838, 0.00210567056233814, 0.000839563750447114, -0.00282690332790055, 0.0011750890331314, 0.00208869399119748, -0.00276168390152845, -0.000172926434748104, 0.00301037878952581, -0.00202394609811063, -0.00167250298994218, 0.0033428107697089, -0.00069437951714515, -0.00299365639753048, 0.00292060917737532, 0.00100011311951096, -0.00379628916151158, 0.00173020129978596, 0.00271363030973847, -0.00380720214220242, -6.23183459781207e-05, 0.0040391028074753, -0.00290010238345539, -0.00212051787349933, 0.00459857782681029, -0.00115111434541746, -0.00399563106890381, 0.00414226570325629, 0.00115808266968723, -0.00521742192441888, 0.0026162299533559, 0.00357830375299716, -0.00539290068014918, 0.000192462974425294, 0.00555520293635591, -0.00429589806483561, -0.00271031967731536, 0.00654368980850203, -0.00195883912192248, -0.00549224631734491, 0.00613459396936355, 0.00129564784874131, -0.00748784101286314, 0.004157049371284, 0.00489815451720306, -0.0080710107864641, 0.000746129667905156, 0.00808001195208415, -0.00680098915162309, -0.00361514064959209, 0.0100055785411614, -0.00355585064856074, -0.00814340573068604, 0.00993535155544805, 0.00140842779990061, -0.0118552623631297, 0.00735708925020574, 0.00744764082976367, -0.013669530035842, 0.00210873724723977, 0.0135276239632387, -0.0125895665753356, -0.00554736340765347, 0.0183532114100676, -0.00777071445726943, -0.0149288415366341, 0.0204292094740347, 0.00148507324833268, -0.025055885767673, 0.0178962512999141, 0.0159930568970429, -0.0347141804622774, 0.00802678784036748, 0.0381314745229207, -0.0426918921997604, -0.0166615927280173, 0.079080138495398, -0.0479465767080785, -0.106629205677162, 0.297069372792696, 0.616883893421007, 0.297069372792696, -0.106629205677162, -0.0479465767080785, 0.079080138495398, -0.0166615927280173, -0.0426918921997604, 0.0381314745229207, 0.00802678784036748, -0.0347141804622774, 0.0159930568970429, 0.0178962512999141, -0.025055885767673, 0.00148507324833268, 0.0204292094740347, -0.0149288415366341, -0.00777071445726943, 0.0183532114100676, -0.00554736340765347, -0.0125895665753356, 0.0135276239632387, 0.00210873724723977, -0.013669530035842, 0.00744764082976367, 0.00735708925020574, -0.0118552623631297, 0.00140842779990061, 0.00993535155544805, -0.00814340573068604, -0.00355585064856074, 0.0100055785411614, -0.00361514064959209, -0.00680098915162309, 0.00808001195208415, 0.000746129667905156, -0.0080710107864641, 0.00489815451720306, 0.004157049371284, -0.00748784101286314, 0.00129564784874131, 0.00613459396936355, -0.00549224631734491, -0.00195883912192248, 0.00654368980850203, -0.00271031967731536, -0.00429589806483561, 0.00555520293635591, 0.000192462974425294, -0.00539290068014918, 0.00357830375299716, 0.0026162299533559, -0.00521742192441888, 0.00115808266968723, 0.00414226570325629, -0.00399563106890381, -0.00115111434541746, 0.00459857782681029, -0.00212051787349933, -0.00290010238345539, 0.0040391028074753, -6.23183459781207e-05, -0.00380720214220242, 0.00271363030973847, 0.00173020129978596, -0.00379628916151158, 0.00100011311951096, 0.00292060917737532, -0.00299365639753048, -0.00069437951714515, 0.0033428107697089, -0.00167250298994218, -0.00202394609811063, 0.00301037878952581, -0.000172926434748104, -0.00276168390152845, 0.00208869399119748, 0.0011750890331314, -0.00282690332790055, 0.000839563750447114, 0.00210567056233814, -0.00228855335424838, -0.000433949141021921, 0.00247439250350562, -0.0013350469204296, -0.0014604475693343, 0.0022761948800421, -0.000218090693760501, -0.00206244650670671, 0.00161766515236204, 0.000812992765780013, -0.00216494283731814, 0.000684412031039355, 0.00155172258443965, -0.00180192667946808, -0.000300083792497511, 0.00187282831705847, -0.00110338258442923, -0.00112901929793464, 0.00175114019457358, -0.000254207692784081, -0.00165520487390062, 0.00125134044061936, 0.000555046389015065, -0.00180521336949331, 0.000503778545472694, 0.00116010926102746, -0.0015938205049316, -0.000343792793197932, 0.00144625703251931, -0.00109033060513755, -0.00113725437758152, 0.00135766689560251, -0.000404213574394465, -0.00174269956152966, 0.000876122112289135, 0.000307658112340518, -0.00206115157578851, 3.71676513312444e-05, 0.00088302679505835, -0.00201337534654099, -0.00108655670474277, 0.00111643265266053, -0.00155954185863643, -0.00236048278298045, 0.000750297931945171, -0.00071853959175241, -0.00352200341679187, -0.000549064195610555, 0.000307043682339263, -0.00405128326616852, -0.00310085724240002, 0.000800671126591237, -0.00303248023823253, -0.0067037778627924, -0.00131331663244367, 0.000456597594002635, -0.00818183946080634, -0.0108185997401773, 0.000364028451565867, 0.0101564050825498, 0.00833234522368213, 0.0024116112326431]
-coefLPF35Hz=[0.000562783917486351, 0.00505059232158137, 0.0130400469690542, 0.013571370952406, 0.00136621873486415, -0.00727507988312578, -0.000657873414494078, 0.00510741277417986, -0.000972196914100124, -0.00353917850286504, 0.00229077753191201, 0.00176863916555388, -0.0028355220195446, 9.49898795897612e-05, 0.00239263801675547, -0.00156702299643469, -0.0011184550492914, 0.0021494804492018, -0.000451451963966349, -0.001657719097906, 0.00160360000178252, 0.000386562339296757, -0.0017983090234799, 0.00097986618921212, 0.000978657934790567, -0.00169759493797492, 0.000364215546310114, 0.00137268436847054, -0.00144015099431743, -0.000212514494108605, 0.00160139905698362, -0.00107056907261521, -0.000739049153494788, 0.00167336805705467, -0.000616615352902223, -0.00119332015784158, 0.001598118869745, -9.84202466710757e-05, -0.00155063578958525, 0.00137683695510076, 0.000453196271300164, -0.00178606895249208, 0.00101604964734648, 0.00100339905913062, -0.00187740768074041, 0.000523387855914166, 0.00151073939167251, -0.0017928775451079, -7.16572275283205e-05, 0.0019201135214466, -0.00152347445534544, -0.000723680393820448, 0.00218765247156546, -0.00107245175207592, -0.00138246097150612, 0.00227134387499288, -0.00045711443404351, -0.00198790776409153, 0.00213911317147343, 0.000289645468891182, -0.00247573553341548, 0.00176456134342857, 0.00111133571641445, -0.00276999109669203, 0.0011548993479606, 0.0019257180931793, -0.00281950024169473, 0.000348195167136409, 0.00265814915508873, -0.00259133511312519, -0.000611168903728034, 0.00322569918327077, -0.00206268300771482, -0.00165002995775474, 0.00354271567699948, -0.0012427635507939, -0.00267149833678283, 0.00354161090156582, -0.00017373006032899, -0.0035702288725592, 0.0031797773964702, 0.00107487224361898, -0.00424432179242129, 0.00243713442762378, 0.00241308515323711, -0.00458925914872437, 0.00132130663701259, 0.00371648313417538, -0.00451419596883417, -0.000109605576839914, 0.0048475889476212, -0.00396835164152086, -0.00176656617361501, 0.00567741567607679, -0.00292314783876683, -0.00353390412968629, 0.00607047978917021, -0.0013859823655959, -0.0052529160426849, 0.00590718427562194, 0.000572728316272392, -0.00675262313571278, 0.00511155915883654, 0.00285195231568671, -0.00786254621374637, 0.00362565559929016, 0.00531481273745579, -0.00838539073806015, 0.00144033959991446, 0.00775915542156333, -0.00815378472611002, -0.0013923071262966799, 0.00997551986630056, -0.00701704073389001, -0.00479661034166528, 0.011712167025246, -0.00482923956223736, -0.00862532337547909, 0.012695891232207, -0.00148660647456632, -0.0127189259327982, 0.0126325581172489, 0.0031593761123771, -0.0168688221584002, 0.0111487764393868, 0.0092875707370336, -0.0208528522703564, 0.0077541115065285, 0.0172879468332285, -0.0244857347588957, 0.00150304154025499, 0.0281061593634853, -0.0275511990975708, -0.00970968507998476, 0.0446243014442714, -0.029873742615356, -0.0330806579520978, 0.078888701732587, -0.0313188866851637, -0.119252825986431, 0.290148140435192, 0.634846649129787, 0.290148140435192, -0.119252825986431, -0.0313188866851637, 0.078888701732587, -0.0330806579520978, -0.029873742615356, 0.0446243014442714, -0.00970968507998476, -0.0275511990975708, 0.0281061593634853, 0.00150304154025499, -0.0244857347588957, 0.0172879468332285, 0.0077541115065285, -0.0208528522703564, 0.0092875707370336, 0.0111487764393868, -0.0168688221584002, 0.0031593761123771, 0.0126325581172489, -0.0127189259327982, -0.00148660647456632, 0.012695891232207, -0.00862532337547909, -0.00482923956223736, 0.011712167025246, -0.00479661034166528, -0.00701704073389001, 0.00997551986630056, -0.0013923071262966799, -0.00815378472611002, 0.00775915542156333, 0.00144033959991446, -0.00838539073806015, 0.00531481273745579, 0.00362565559929016, -0.00786254621374637, 0.00285195231568671, 0.00511155915883654, -0.00675262313571278, 0.000572728316272392, 0.00590718427562194, -0.0052529160426849, -0.0013859823655959, 0.00607047978917021, -0.00353390412968629, -0.00292314783876683, 0.00567741567607679, -0.00176656617361501, -0.00396835164152086, 0.0048475889476212, -0.000109605576839914, -0.00451419596883417, 0.00371648313417538, 0.00132130663701259, -0.00458925914872437, 0.00241308515323711, 0.00243713442762378, -0.00424432179242129, 0.00107487224361898, 0.0031797773964702, -0.0035702288725592, -0.00017373006032899, 0.00354161090156582, -0.00267149833678283, -0.0012427635507939, 0.00354271567699948, -0.00165002995775474, -0.00206268300771482, 0.00322569918327077, -0.000611168903728034, -0.00259133511312519, 0.00265814915508873, 0.000348195167136409, -0.00281950024169473, 0.0019257180931793, 0.0011548993479606, -0.00276999109669203, 0.00111133571641445, 0.00176456134342857, -0.00247573553341548, 0.000289645468891182, 0.00213911317147343, -0.00198790776409153, -0.00045711443404351, 0.00227134387499288, -0.00138246097150612, -0.00107245175207592, 0.00218765247156546, -0.000723680393820448, -0.00152347445534544, 0.0019201135214466, -7.16572275283205e-05, -0.0017928775451079, 0.00151073939167251, 0.000523387855914166, -0.00187740768074041, 0.00100339905913062, 0.00101604964734648, -0.00178606895249208, 0.000453196271300164, 0.00137683695510076, -0.00155063578958525, -9.84202466710757e-05, 0.001598118869745, -0.00119332015784158, -0.000616615352902223, 0.00167336805705467, -0.000739049153494788, -0.00107056907261521, 0.00160139905698362, -0.000212514494108605, -0.00144015099431743, 0.00137268436847054, 0.000364215546310114, -0.00169759493797492, 0.000978657934790567, 0.00097986618921212, -0.0017983090234799, 0.000386562339296757, 0.00160360000178252, -0.001657719097906, -0.000451451963966349, 0.0021494804492018, -0.0011184550492914, -0.00156702299643469, 0.00239263801675547, 9.49898795897612e-05, -0.0028355220195446, 0.00176863916555388, 0.00229077753191201, -0.00353917850286504, -0.000972196914100124, 0.00510741277417986, -0.000657873414494078, -0.00727507988312578, 0.00136621873486415, 0.013571370952406, 0.0130400469690542, 0.00505059232158137, 0.000562783917486351]
-coefLPF36Hz=[-0.00293177407530472, -0.011116263254479, -0.0149382460825728, -0.00443705235952082, 0.00681263320938572, 0.00200196253688296, -0.00504792891805932, 0.000424552029061346, 0.00361673059843297, -0.00222108367900921, -0.00163785606433218, 0.00285348168842412, -0.000489211708746893, -0.00211958304492405, 0.0019493739409225, 0.000434116934568594, -0.00207875827344368, 0.00122966377935997, 0.000928394975841326, -0.00189375208750939, 0.000696854135421089, 0.00120002678076585, -0.00168229678137328, 0.000294738912190189, 0.00136657458980512, -0.001483023593615, -2.54110514321184e-05, 0.00147944586396585, -0.00129711279448157, -0.000300631792938078, 0.0015632845237296, -0.00112071287598513, -0.000548866675601916, 0.0016335729457499, -0.000942593844500994, -0.00079008480660249, 0.00168709797163352, -0.000754144102219239, -0.00102558888629811, 0.0017247445433635, -0.000550381661776317, -0.00126208711977295, 0.00174290159050942, -0.000323644835635088, -0.00149869845313126, 0.00173548278120521, -7.02268697350866e-05, -0.00173416397240672, 0.001695787597621, 0.000213999360984297, -0.00196196331315813, 0.00161515491537975, 0.000525970921258644, -0.00217469052501132, 0.00149241418352727, 0.000866091804672829, -0.00236658712757767, 0.00131945999180982, 0.00122681909386027, -0.00253092215551224, 0.00109886167507304, 0.00161002682737239, -0.00266170460141382, 0.000822392595286463, 0.00200819686587661, -0.00275137853710441, 0.000488758529851517, 0.00241963388287622, -0.00278781599752075, 9.2822927130688e-05, 0.00282977956215273, -0.00276277215799662, -0.000360483477364186, 0.0032321064205866, -0.00266822387870545, -0.000868233121590298, 0.00361672705485399, -0.0025024883389756, -0.00143316920671383, 0.0039761760535067, -0.0022524549467426, -0.00204979706016566, 0.00430163083794688, -0.00190704225526532, -0.00271632241665913, 0.00457098111736086, -0.00146480083433633, -0.00342197909452281, 0.00477887782721189, -0.000915785418312028, -0.00415682847187684, 0.00491626824984753, -0.000255651851919678, -0.00492334628714018, 0.00496072118589279, 0.00051743117366821, -0.00572366442216913, 0.00488541946356908, 0.00141322856987922, -0.00653285812780771, 0.00469193955933282, 0.00245786202708673, -0.00732682398842076, 0.00436568388777067, 0.0036487836265165, -0.0081261430560871, 0.00385645269635376, 0.00499533030394413, -0.00890871568014982, 0.0031578331226176, 0.0065454551424018, -0.00965534768124175, 0.00221070158807738, 0.00829887498935796, -0.0103716778146956, 0.000977486482473099, 0.0103364855973753, -0.011037043480124, -0.000632675647554078, 0.012725509719524, -0.0116559514022598, -0.00274662473811364, 0.0156289650060026, -0.0121996629527607, -0.00558731805509821, 0.0192750230291104, -0.0126781256652407, -0.00954145232110092, 0.0241965011886447, -0.0130842318238994, -0.0154836545131832, 0.0314991347268984, -0.0133973852135296, -0.0255220357291409, 0.0442357056438722, -0.0136317584101194, -0.0469063695072816, 0.0746775014937452, -0.0137709369091363, -0.130380756540924, 0.282292911767563, 0.652851191323697, 0.282292911767563, -0.130380756540924, -0.0137709369091363, 0.0746775014937452, -0.0469063695072816, -0.0136317584101194, 0.0442357056438722, -0.0255220357291409, -0.0133973852135296, 0.0314991347268984, -0.0154836545131832, -0.0130842318238994, 0.0241965011886447, -0.00954145232110092, -0.0126781256652407, 0.0192750230291104, -0.00558731805509821, -0.0121996629527607, 0.0156289650060026, -0.00274662473811364, -0.0116559514022598, 0.012725509719524, -0.000632675647554078, -0.011037043480124, 0.0103364855973753, 0.000977486482473099, -0.0103716778146956, 0.00829887498935796, 0.00221070158807738, -0.00965534768124175, 0.0065454551424018, 0.0031578331226176, -0.00890871568014982, 0.00499533030394413, 0.00385645269635376, -0.0081261430560871, 0.0036487836265165, 0.00436568388777067, -0.00732682398842076, 0.00245786202708673, 0.00469193955933282, -0.00653285812780771, 0.00141322856987922, 0.00488541946356908, -0.00572366442216913, 0.00051743117366821, 0.00496072118589279, -0.00492334628714018, -0.000255651851919678, 0.00491626824984753, -0.00415682847187684, -0.000915785418312028, 0.00477887782721189, -0.00342197909452281, -0.00146480083433633, 0.00457098111736086, -0.00271632241665913, -0.00190704225526532, 0.00430163083794688, -0.00204979706016566, -0.0022524549467426, 0.0039761760535067, -0.00143316920671383, -0.0025024883389756, 0.00361672705485399, -0.000868233121590298, -0.00266822387870545, 0.0032321064205866, -0.000360483477364186, -0.00276277215799662, 0.00282977956215273, 9.2822927130688e-05, -0.00278781599752075, 0.00241963388287622, 0.000488758529851517, -0.00275137853710441, 0.00200819686587661, 0.000822392595286463, -0.00266170460141382, 0.00161002682737239, 0.00109886167507304, -0.00253092215551224, 0.00122681909386027, 0.00131945999180982, -0.00236658712757767, 0.000866091804672829, 0.00149241418352727, -0.00217469052501132, 0.000525970921258644, 0.00161515491537975, -0.00196196331315813, 0.000213999360984297, 0.001695787597621, -0.00173416397240672, -7.02268697350866e-05, 0.00173548278120521, -0.00149869845313126, -0.000323644835635088, 0.00174290159050942, -0.00126208711977295, -0.000550381661776317, 0.0017247445433635, -0.00102558888629811, -0.000754144102219239, 0.00168709797163352, -0.00079008480660249, -0.000942593844500994, 0.0016335729457499, -0.000548866675601916, -0.00112071287598513, 0.0015632845237296, -0.000300631792938078, -0.00129711279448157, 0.00147944586396585, -2.54110514321184e-05, -0.001483023593615, 0.00136657458980512, 0.000294738912190189, -0.00168229678137328, 0.00120002678076585, 0.000696854135421089, -0.00189375208750939, 0.000928394975841326, 0.00122966377935997, -0.00207875827344368, 0.000434116934568594, 0.0019493739409225, -0.00211958304492405, -0.000489211708746893, 0.00285348168842412, -0.00163785606433218, -0.00222108367900921, 0.00361673059843297, 0.000424552029061346, -0.00504792891805932, 0.00200196253688296, 0.00681263320938572, -0.00443705235952082, -0.0149382460825728, -0.011116263254479, -0.00293177407530472]
-coefLPF37Hz=[-0.00024563084756141, -0.00472131708641148, -0.0137756706121218, -0.0139499179576283, 0.000217553507052873, 0.00731721228923029, -0.00174705215720125, -0.00428403444336044, 0.00332811050553005, 0.00136528809058689, -0.00347573463364348, 0.00126551708199321, 0.0019650786187412, -0.00257170221348898, 0.000344394565810145, 0.00197212080512979, -0.00196808164422361, -7.22291829361592e-05, 0.00185456602819574, -0.00160208512316961, -0.000259507526169025, 0.00174077825521573, -0.00138861037330499, -0.000338747447841282, 0.00165718219740869, -0.00127411750022451, -0.000365227185692498, 0.00160341639217307, -0.00122938615899964, -0.000364242966896704, 0.00158261155654617, -0.00122618457644852, -0.000346172380969575, 0.00158530087230513, -0.0012584811387942, -0.000320297306144768, 0.00160761394819044, -0.00131845662233644, -0.000292337906756703, 0.00164506291226217, -0.00139504853164325, -0.000255799929308568, 0.00169524948043057, -0.00148934984471319, -0.000212438625519248, 0.00175640314445727, -0.00160009063163698, -0.000162545943995376, 0.00182661350077662, -0.00172731960045565, -0.000106166327810108, 0.00190676712812243, -0.00186811517909512, -4.54180413054746e-05, 0.00199067301177067, -0.00202079198849682, 2.65419878225247e-05, 0.00207768746505932, -0.00218919966287236, 0.000111169087752963, 0.00216968150208358, -0.00237430044606319, 0.00020761920172318, 0.00226482109220086, -0.00257782036741542, 0.000317009398862276, 0.00236558582061106, -0.00279720891285547, 0.000439474050937872, 0.00246811125426451, -0.00303166420375114, 0.000580110151341146, 0.00256859229551924, -0.00328805489192047, 0.000742468743679807, 0.00267135719287523, -0.00356885991497155, 0.000925534908962622, 0.00277828972835999, -0.0038718417964147, 0.00112886342182895, 0.00288355788561641, -0.00419641613681623, 0.00136127588146536, 0.00298269438695423, -0.00455200642403333, 0.00163090154397377, 0.00308298200663305, -0.00494614063244741, 0.00193310502149113, 0.00318522699969145, -0.00537472346666764, 0.00227403962646123, 0.00328161220993486, -0.00584359237967181, 0.00266938639319994, 0.00337354001971648, -0.00636848478069172, 0.00312407458668839, 0.00346514736886881, -0.00695824904317052, 0.00364337615971998, 0.0035541286705666, -0.00761798475450628, 0.00424836901629444, 0.0036345172072337, -0.00837183421168994, 0.00496448598178103, 0.00371261797969417, -0.0092505511795143, 0.00580856747599214, 0.00378921221019346, -0.0102754879733259, 0.00682730927683079, 0.00385227742432861, -0.0115086395163032, 0.0080901112920719, 0.00391487329107477, -0.0130345531763998, 0.00967469076545478, 0.00397631844963363, -0.0149628474076045, 0.0117444991639568, 0.00402251728309737, -0.0175345705798648, 0.0145604530343871, 0.00406094632705782, -0.0211562796926977, 0.0186243649430312, 0.00408642081981747, -0.0266606275492436, 0.0251025251054786, 0.00412269641111515, -0.0361901603833991, 0.0370253061072532, 0.00413923630915382, -0.0569977554112572, 0.0666748707139098, 0.00414739304808066, -0.139826152889805, 0.273548087754815, 0.67082342941893, 0.273548087754815, -0.139826152889805, 0.00414739304808066, 0.0666748707139098, -0.0569977554112572, 0.00413923630915382, 0.0370253061072532, -0.0361901603833991, 0.00412269641111515, 0.0251025251054786, -0.0266606275492436, 0.00408642081981747, 0.0186243649430312, -0.0211562796926977, 0.00406094632705782, 0.0145604530343871, -0.0175345705798648, 0.00402251728309737, 0.0117444991639568, -0.0149628474076045, 0.00397631844963363, 0.00967469076545478, -0.0130345531763998, 0.00391487329107477, 0.0080901112920719, -0.0115086395163032, 0.00385227742432861, 0.00682730927683079, -0.0102754879733259, 0.00378921221019346, 0.00580856747599214, -0.0092505511795143, 0.00371261797969417, 0.00496448598178103, -0.00837183421168994, 0.0036345172072337, 0.00424836901629444, -0.00761798475450628, 0.0035541286705666, 0.00364337615971998, -0.00695824904317052, 0.00346514736886881, 0.00312407458668839, -0.00636848478069172, 0.00337354001971648, 0.00266938639319994, -0.00584359237967181, 0.00328161220993486, 0.00227403962646123, -0.00537472346666764, 0.00318522699969145, 0.00193310502149113, -0.00494614063244741, 0.00308298200663305, 0.00163090154397377, -0.00455200642403333, 0.00298269438695423, 0.00136127588146536, -0.00419641613681623, 0.00288355788561641, 0.00112886342182895, -0.0038718417964147, 0.00277828972835999, 0.000925534908962622, -0.00356885991497155, 0.00267135719287523, 0.000742468743679807, -0.00328805489192047, 0.00256859229551924, 0.000580110151341146, -0.00303166420375114, 0.00246811125426451, 0.000439474050937872, -0.00279720891285547, 0.00236558582061106, 0.000317009398862276, -0.00257782036741542, 0.00226482109220086, 0.00020761920172318, -0.00237430044606319, 0.00216968150208358, 0.000111169087752963, -0.00218919966287236, 0.00207768746505932, 2.65419878225247e-05, -0.00202079198849682, 0.00199067301177067, -4.54180413054746e-05, -0.00186811517909512, 0.00190676712812243, -0.000106166327810108, -0.00172731960045565, 0.00182661350077662, -0.000162545943995376, -0.00160009063163698, 0.00175640314445727, -0.000212438625519248, -0.00148934984471319, 0.00169524948043057, -0.000255799929308568, -0.00139504853164325, 0.00164506291226217, -0.000292337906756703, -0.00131845662233644, 0.00160761394819044, -0.000320297306144768, -0.0012584811387942, 0.00158530087230513, -0.000346172380969575, -0.00122618457644852, 0.00158261155654617, -0.000364242966896704, -0.00122938615899964, 0.00160341639217307, -0.000365227185692498, -0.00127411750022451, 0.00165718219740869, -0.000338747447841282, -0.00138861037330499, 0.00174077825521573, -0.000259507526169025, -0.00160208512316961, 0.00185456602819574, -7.22291829361592e-05, -0.00196808164422361, 0.00197212080512979, 0.000344394565810145, -0.00257170221348898, 0.0019650786187412, 0.00126551708199321, -0.00347573463364348, 0.00136528809058689, 0.00332811050553005, -0.00428403444336044, -0.00174705215720125, 0.00731721228923029, 0.000217553507052873, -0.0139499179576283, -0.0137756706121218, -0.00472131708641148, -0.00024563084756141]
-coefLPF38Hz=[0.00307289816024789, 0.0120660340646265, 0.0154117371121505, 0.00252014582314836, -0.00763207516937944, 0.00044495577021925, 0.00486869268850821, -0.00294750391278785, -0.00179164994050159, 0.00355280689289696, -0.00124591008542554, -0.00192978282061021, 0.00267107066988312, -0.000678226053375999, -0.00171529386596799, 0.00218874696280241, -0.000543570050525024, -0.00145762171662368, 0.00193305922451971, -0.000589668277463709, -0.00120683011336027, 0.0017945689547276, -0.000720462782365412, -0.000960109820209659, 0.00170947015050218, -0.000894267707653703, -0.000707250882432994, 0.0016404571407259, -0.00108554986668565, -0.000437284383936345, 0.001559832151104, -0.00128341114603119, -0.000145279339857239, 0.00145464300265036, -0.00147123434121216, 0.000167620854588339, 0.00130763280855719, -0.00163605897951554, 0.000502513045142176, 0.00111076450891854, -0.0017676660151062, 0.000851433574624703, 0.000860573538091844, -0.00185004553091507, 0.00120345308042825, 0.000551086518327919, -0.00187101438205186, 0.00154838750237629, 0.000186612103682608, -0.0018176367673473, 0.00186742220747511, -0.000232753894215509, -0.0016783834733486, 0.0021498077104278, -0.000694798486069778, -0.00144951316448365, 0.00237068178446242, -0.00118771632152028, -0.0011211233833649, 0.00251732176437066, -0.00169468084561184, -0.000700065515970851, 0.00256558879314431, -0.00219174647763925, -0.000183146030687321, 0.0025017051463341, -0.00265821797570417, 0.000413195892526781, 0.00230724947398243, -0.00306302603100279, 0.00108223962053421, 0.00197314449604315, -0.00338448641629739, 0.00179745828592442, 0.00149376719826732, -0.0035903662917243, 0.00253586076788892, 0.000871095183952656, -0.00365402909338915, 0.00326051250849412, 0.000108308854592664, -0.00354694983890867, 0.00393831155474341, -0.000780391017220634, -0.00324389095038995, 0.00453108728370639, -0.00178053493202876, -0.00273613350509754, 0.00499536197636521, -0.00285847631327539, -0.00200669764895925, 0.00529331342930835, -0.00397107956841911, -0.00104666076395216, 0.00538299731014261, -0.00507156627616616, 0.000141900038582875, 0.00521064815020727, -0.00613019960175403, 0.0015323440382234, 0.00473227468094973, -0.00708398418150649, 0.0031234507901096, 0.00393709574279969, -0.0078541639129165, 0.00487745725595094, 0.00276085194077066, -0.00840003108101057, 0.00675068316637161, 0.00118708323322093, -0.00861477311847259, 0.00872074200615106, -0.000833962416378999, -0.00844992238316089, 0.0107243503465326, -0.00332549313862398, -0.00777986245531962, 0.0127171495532083, -0.00636419974247801, -0.00650331199242916, 0.0146385276553051, -0.0100322797881618, -0.0044225732425036, 0.0164351043834406, -0.0145365663741566, -0.00127575594167228, 0.0180703502043624, -0.0202142116153724, 0.00345011213314162, 0.019472303768018, -0.0278741591011108, 0.0108935845491164, 0.0206114361468976, -0.0396022450379443, 0.0240886590110073, 0.0214551338029397, -0.0625780763436199, 0.0552775797238037, 0.0219688766941988, -0.147496169376415, 0.263918313446244, 0.688808415011362, 0.263918313446244, -0.147496169376415, 0.0219688766941988, 0.0552775797238037, -0.0625780763436199, 0.0214551338029397, 0.0240886590110073, -0.0396022450379443, 0.0206114361468976, 0.0108935845491164, -0.0278741591011108, 0.019472303768018, 0.00345011213314162, -0.0202142116153724, 0.0180703502043624, -0.00127575594167228, -0.0145365663741566, 0.0164351043834406, -0.0044225732425036, -0.0100322797881618, 0.0146385276553051, -0.00650331199242916, -0.00636419974247801, 0.0127171495532083, -0.00777986245531962, -0.00332549313862398, 0.0107243503465326, -0.00844992238316089, -0.000833962416378999, 0.00872074200615106, -0.00861477311847259, 0.00118708323322093, 0.00675068316637161, -0.00840003108101057, 0.00276085194077066, 0.00487745725595094, -0.0078541639129165, 0.00393709574279969, 0.0031234507901096, -0.00708398418150649, 0.00473227468094973, 0.0015323440382234, -0.00613019960175403, 0.00521064815020727, 0.000141900038582875, -0.00507156627616616, 0.00538299731014261, -0.00104666076395216, -0.00397107956841911, 0.00529331342930835, -0.00200669764895925, -0.00285847631327539, 0.00499536197636521, -0.00273613350509754, -0.00178053493202876, 0.00453108728370639, -0.00324389095038995, -0.000780391017220634, 0.00393831155474341, -0.00354694983890867, 0.000108308854592664, 0.00326051250849412, -0.00365402909338915, 0.000871095183952656, 0.00253586076788892, -0.0035903662917243, 0.00149376719826732, 0.00179745828592442, -0.00338448641629739, 0.00197314449604315, 0.00108223962053421, -0.00306302603100279, 0.00230724947398243, 0.000413195892526781, -0.00265821797570417, 0.0025017051463341, -0.000183146030687321, -0.00219174647763925, 0.00256558879314431, -0.000700065515970851, -0.00169468084561184, 0.00251732176437066, -0.0011211233833649, -0.00118771632152028, 0.00237068178446242, -0.00144951316448365, -0.000694798486069778, 0.0021498077104278, -0.0016783834733486, -0.000232753894215509, 0.00186742220747511, -0.0018176367673473, 0.000186612103682608, 0.00154838750237629, -0.00187101438205186, 0.000551086518327919, 0.00120345308042825, -0.00185004553091507, 0.000860573538091844, 0.000851433574624703, -0.0017676660151062, 0.00111076450891854, 0.000502513045142176, -0.00163605897951554, 0.00130763280855719, 0.000167620854588339, -0.00147123434121216, 0.00145464300265036, -0.000145279339857239, -0.00128341114603119, 0.001559832151104, -0.000437284383936345, -0.00108554986668565, 0.0016404571407259, -0.000707250882432994, -0.000894267707653703, 0.00170947015050218, -0.000960109820209659, -0.000720462782365412, 0.0017945689547276, -0.00120683011336027, -0.000589668277463709, 0.00193305922451971, -0.00145762171662368, -0.000543570050525024, 0.00218874696280241, -0.00171529386596799, -0.000678226053375999, 0.00267107066988312, -0.00192978282061021, -0.00124591008542554, 0.00355280689289696, -0.00179164994050159, -0.00294750391278785, 0.00486869268850821, 0.00044495577021925, -0.00763207516937944, 0.00252014582314836, 0.0154117371121505, 0.0120660340646265, 0.00307289816024789]
-coefLPF39Hz=[-0.000539202695235323, 0.0031379941196706, 0.0138593760447524, 0.0152460569476565, -0.00047821939848843, -0.00666421768767048, 0.00341279566337196, 0.00246781031004129, -0.0041663560113438, 0.00133862344594944, 0.00216974424017081, -0.00300041317423396, 0.000959563352308338, 0.00162988356042967, -0.00243661551310278, 0.0010397153606682, 0.00109453358656096, -0.00209431251470101, 0.00124630040415745, 0.000567635058546937, -0.00178606100179911, 0.00146424177423946, 3.9020011897488e-05, -0.00143728079154345, 0.00161960200051034, -0.000479296390018235, -0.00101226133896066, 0.00166018724582178, -0.000959780085726249, -0.000504565174892199, 0.00155684928405016, -0.00135636474307241, 6.30918330286478e-05, 0.00129028121299426, -0.0016187635255553, 0.000648773760378552, 0.000860026517932363, -0.0017048778025021, 0.00119272004033216, 0.000293342046557793, -0.00158058183772758, 0.00162578755131435, -0.000361389468202534, -0.00123236285244713, 0.00188309358301415, -0.00103426561608173, -0.000679874992321902, 0.00190825576222944, -0.00163629400416089, 2.95939718406689e-05, 0.00166418310813242, -0.00207625758152911, 0.000822559928120754, 0.00115007685126612, -0.00227209195721017, 0.00159711442179684, 0.000402675916564086, -0.00215947502040566, 0.00223883146408701, -0.000506836186070803, -0.00171112117851426, 0.00263932838554504, -0.00146867197133458, -0.000947932682646512, 0.00270455200496305, -0.0023448881136653, 6.44573409985809e-05, 0.00237208113431079, -0.0029941613281095, 0.00121533489221858, 0.00163290807328371, -0.00328817603567767, 0.00235251569297185, 0.000537302762810973, -0.00312778496993763, 0.00330349330516048, -0.000806084030259946, -0.00246761741761169, 0.00389820908010644, -0.00223236340202047, -0.00133055977571378, 0.00398909397145401, -0.0035383842859838, 0.000190023195352949, 0.00348020248161626, -0.00451041960139869, 0.00192890373614102, 0.00235319937271167, -0.00494871123800918, 0.00365818686566343, 0.000677042437421791, -0.00469622693385044, 0.00511323028265193, -0.00139045371201277, -0.00366991148262276, 0.00602605932332207, -0.00360946992743922, -0.00188412040938316, 0.00616395418482287, -0.00567684967914533, 0.000532059762731671, 0.00536460699838277, -0.00725140213626649, 0.00333461223260652, 0.00355898345754533, -0.00799477887863837, 0.00618909779640421, 0.000799620850994787, -0.00762510935894256, 0.00869254556278946, -0.00271193891159426, -0.00595023867979162, 0.0103921057672497, -0.00663815447311544, -0.00288660570639479, 0.010835133172973, -0.0105357188711181, 0.00150484415875374, 0.00962176317600856, -0.0138562641382055, 0.00700427372317992, 0.00640687874225603, -0.0159567164280034, 0.0132680268895706, 0.000881854574074937, -0.0161277418733659, 0.0198526036984493, -0.00727739389803286, -0.0135051141130861, 0.0262302155423128, -0.0186734639848699, -0.00670282073764354, 0.0318732976655534, -0.035063708393826, 0.00744081189417165, 0.036330031938436, -0.0631914740199504, 0.0410719100746233, 0.0391470607012494, -0.153289010174176, 0.253452936345644, 0.706796759630667, 0.253452936345644, -0.153289010174176, 0.0391470607012494, 0.0410719100746233, -0.0631914740199504, 0.036330031938436, 0.00744081189417165, -0.035063708393826, 0.0318732976655534, -0.00670282073764354, -0.0186734639848699, 0.0262302155423128, -0.0135051141130861, -0.00727739389803286, 0.0198526036984493, -0.0161277418733659, 0.000881854574074937, 0.0132680268895706, -0.0159567164280034, 0.00640687874225603, 0.00700427372317992, -0.0138562641382055, 0.00962176317600856, 0.00150484415875374, -0.0105357188711181, 0.010835133172973, -0.00288660570639479, -0.00663815447311544, 0.0103921057672497, -0.00595023867979162, -0.00271193891159426, 0.00869254556278946, -0.00762510935894256, 0.000799620850994787, 0.00618909779640421, -0.00799477887863837, 0.00355898345754533, 0.00333461223260652, -0.00725140213626649, 0.00536460699838277, 0.000532059762731671, -0.00567684967914533, 0.00616395418482287, -0.00188412040938316, -0.00360946992743922, 0.00602605932332207, -0.00366991148262276, -0.00139045371201277, 0.00511323028265193, -0.00469622693385044, 0.000677042437421791, 0.00365818686566343, -0.00494871123800918, 0.00235319937271167, 0.00192890373614102, -0.00451041960139869, 0.00348020248161626, 0.000190023195352949, -0.0035383842859838, 0.00398909397145401, -0.00133055977571378, -0.00223236340202047, 0.00389820908010644, -0.00246761741761169, -0.000806084030259946, 0.00330349330516048, -0.00312778496993763, 0.000537302762810973, 0.00235251569297185, -0.00328817603567767, 0.00163290807328371, 0.00121533489221858, -0.0029941613281095, 0.00237208113431079, 6.44573409985809e-05, -0.0023448881136653, 0.00270455200496305, -0.000947932682646512, -0.00146867197133458, 0.00263932838554504, -0.00171112117851426, -0.000506836186070803, 0.00223883146408701, -0.00215947502040566, 0.000402675916564086, 0.00159711442179684, -0.00227209195721017, 0.00115007685126612, 0.000822559928120754, -0.00207625758152911, 0.00166418310813242, 2.95939718406689e-05, -0.00163629400416089, 0.00190825576222944, -0.000679874992321902, -0.00103426561608173, 0.00188309358301415, -0.00123236285244713, -0.000361389468202534, 0.00162578755131435, -0.00158058183772758, 0.000293342046557793, 0.00119272004033216, -0.0017048778025021, 0.000860026517932363, 0.000648773760378552, -0.0016187635255553, 0.00129028121299426, 6.30918330286478e-05, -0.00135636474307241, 0.00155684928405016, -0.000504565174892199, -0.000959780085726249, 0.00166018724582178, -0.00101226133896066, -0.000479296390018235, 0.00161960200051034, -0.00143728079154345, 3.9020011897488e-05, 0.00146424177423946, -0.00178606100179911, 0.000567635058546937, 0.00124630040415745, -0.00209431251470101, 0.00109453358656096, 0.0010397153606682, -0.00243661551310278, 0.00162988356042967, 0.000959563352308338, -0.00300041317423396, 0.00216974424017081, 0.00133862344594944, -0.0041663560113438, 0.00246781031004129, 0.00341279566337196, -0.00666421768767048, -0.00047821939848843, 0.0152460569476565, 0.0138593760447524, 0.0031379941196706, -0.000539202695235323]
-coefLPF40Hz=[-0.0032250784492945, -0.0130320845228826, -0.0157030994003847, -0.00042528137840806, 0.00776319866032573, -0.00292119264129341, -0.00340638692655055, 0.00446592426092403, -0.0010231989133062, -0.00257186787211531, 0.00320199572387908, -0.00100426222474182, -0.00166717842714443, 0.00260124306745952, -0.00135140539027016, -0.000804067851872868, 0.00210821146222129, -0.00168514038648929, 3.11073971972729e-05, 0.00151783639003594, -0.00183647377735071, 0.000786531069824008, 0.000783299090336174, -0.00170918683494959, 0.00136247684528852, -4.02952218965722e-05, -0.00127345052259229, 0.00164414097578029, -0.000828624949889362, -0.00057066958996709, 0.00155385645038169, -0.00142288040832046, 0.000273476061508525, 0.00107888833902629, -0.00167269801560103, 0.00107649524012122, 0.000300191562795051, -0.00148609916206982, 0.0016337946356234, -0.000614415020699479, -0.000873333993568271, 0.00177600136606556, -0.00142776260118773, 4.40701652428593e-05, 0.00141487996378238, -0.00190668374462709, 0.00104375878594896, 0.000601035385876302, -0.0018726055500469, 0.00184388010560773, -0.000488961397311659, -0.00127247220815001, 0.00218918376645455, -0.00156504284427016, -0.000214316103421284, 0.00191249810509908, -0.0023032327313131, 0.00105011619219524, 0.00101519160305048, -0.00243826350991357, 0.00216223477635922, -0.000315101612127948, -0.00183989052070339, 0.00276385688023799, -0.00173687902342213, -0.000592179409009726, 0.00259744335183211, -0.00282021158360999, 0.00102029896635903, 0.00159910367929156, -0.00318910724967086, 0.00255077285893199, -4.04068590015679e-05, -0.00261613836009123, 0.00351310840469612, -0.00191601570560783, -0.00114283222720508, 0.00352259492684518, -0.0034739749570675, 0.000917275066572307, 0.0024277692560975, -0.00418612074315329, 0.00301051944598406, 0.000399187764840187, -0.00369001453728359, 0.00449403485113754, -0.00207776885005153, -0.00194867484549804, 0.00479801869836977, -0.00430664097634385, 0.000696876332645291, 0.00362661056982397, -0.00555216830078489, 0.00356868747706256, 0.00109465540331217, -0.00524376849989866, 0.00582401070912725, -0.00222502396014556, -0.00319133987940828, 0.00662952995518446, -0.00546163823319059, 0.000260120113278367, 0.00544586140042827, -0.00756509385837378, 0.00433250345038284, 0.00226721493761729, -0.00765580478419245, 0.0078420757591112, -0.00234906786616733, -0.0052606898413699, 0.00959516760161967, -0.00725183334077294, -0.000570610467676037, 0.00858931601141665, -0.0109871181735914, 0.00553747392113961, 0.00445417339323195, -0.0120727504101425, 0.0115210926754868, -0.00243154444208959, -0.0093775836760319, 0.0155065193546815, -0.0108112904979515, -0.00247743527024517, 0.0155455977746203, -0.0186760210936893, 0.00821655539761463, 0.00997888032036366, -0.0234912536995137, 0.0213982924208902, -0.00248435657925342, -0.0221990964511693, 0.0350907445540467, -0.0234748870112901, -0.0103570869158585, 0.0470530761262612, -0.0588073967337701, 0.0247841520954649, 0.0552099060811387, -0.157118646001142, 0.242178226818587, 0.724770785125, 0.242178226818587, -0.157118646001142, 0.0552099060811387, 0.0247841520954649, -0.0588073967337701, 0.0470530761262612, -0.0103570869158585, -0.0234748870112901, 0.0350907445540467, -0.0221990964511693, -0.00248435657925342, 0.0213982924208902, -0.0234912536995137, 0.00997888032036366, 0.00821655539761463, -0.0186760210936893, 0.0155455977746203, -0.00247743527024517, -0.0108112904979515, 0.0155065193546815, -0.0093775836760319, -0.00243154444208959, 0.0115210926754868, -0.0120727504101425, 0.00445417339323195, 0.00553747392113961, -0.0109871181735914, 0.00858931601141665, -0.000570610467676037, -0.00725183334077294, 0.00959516760161967, -0.0052606898413699, -0.00234906786616733, 0.0078420757591112, -0.00765580478419245, 0.00226721493761729, 0.00433250345038284, -0.00756509385837378, 0.00544586140042827, 0.000260120113278367, -0.00546163823319059, 0.00662952995518446, -0.00319133987940828, -0.00222502396014556, 0.00582401070912725, -0.00524376849989866, 0.00109465540331217, 0.00356868747706256, -0.00555216830078489, 0.00362661056982397, 0.000696876332645291, -0.00430664097634385, 0.00479801869836977, -0.00194867484549804, -0.00207776885005153, 0.00449403485113754, -0.00369001453728359, 0.000399187764840187, 0.00301051944598406, -0.00418612074315329, 0.0024277692560975, 0.000917275066572307, -0.0034739749570675, 0.00352259492684518, -0.00114283222720508, -0.00191601570560783, 0.00351310840469612, -0.00261613836009123, -4.04068590015679e-05, 0.00255077285893199, -0.00318910724967086, 0.00159910367929156, 0.00102029896635903, -0.00282021158360999, 0.00259744335183211, -0.000592179409009726, -0.00173687902342213, 0.00276385688023799, -0.00183989052070339, -0.000315101612127948, 0.00216223477635922, -0.00243826350991357, 0.00101519160305048, 0.00105011619219524, -0.0023032327313131, 0.00191249810509908, -0.000214316103421284, -0.00156504284427016, 0.00218918376645455, -0.00127247220815001, -0.000488961397311659, 0.00184388010560773, -0.0018726055500469, 0.000601035385876302, 0.00104375878594896, -0.00190668374462709, 0.00141487996378238, 4.40701652428593e-05, -0.00142776260118773, 0.00177600136606556, -0.000873333993568271, -0.000614415020699479, 0.0016337946356234, -0.00148609916206982, 0.000300191562795051, 0.00107649524012122, -0.00167269801560103, 0.00107888833902629, 0.000273476061508525, -0.00142288040832046, 0.00155385645038169, -0.00057066958996709, -0.000828624949889362, 0.00164414097578029, -0.00127345052259229, -4.02952218965722e-05, 0.00136247684528852, -0.00170918683494959, 0.000783299090336174, 0.000786531069824008, -0.00183647377735071, 0.00151783639003594, 3.11073971972729e-05, -0.00168514038648929, 0.00210821146222129, -0.000804067851872868, -0.00135140539027016, 0.00260124306745952, -0.00166717842714443, -0.00100426222474182, 0.00320199572387908, -0.00257186787211531, -0.0010231989133062, 0.00446592426092403, -0.00340638692655055, -0.00292119264129341, 0.00776319866032573, -0.00042528137840806, -0.0157030994003847, -0.0130320845228826, -0.0032250784492945]
-coefLPF41Hz=[0.00269965038547092, 0.00269565291972947, -0.0105092836771258, -0.0183361523110358, -0.00345480515660976, 0.00387180202862923, -0.00478484805766507, -0.000821746355076636, 0.00328207016598884, -0.003051751821304, 0.000315532359593839, 0.00206190633467071, -0.00261523111446567, 0.00121157957604657, 0.000844188583826325, -0.00208766896684888, 0.00178872879736678, -0.000322278212131075, -0.00123337556216168, 0.0018655476053021, -0.00124489932032497, -0.000144051932105963, 0.00137702410850278, -0.00167312841845731, 0.000890414339711851, 0.000431936971254174, -0.00145289088003866, 0.00153626853370739, -0.000644298548047924, -0.0006442560702423, 0.00152517100242662, -0.00144342452839117, 0.00045226062117532, 0.000833715759714592, -0.00160830900054501, 0.00137983008365885, -0.000279472909965635, -0.00102146685462853, 0.00170691354870082, -0.00133290530421535, 0.000105601362389494, 0.00122389843489433, -0.00182057642161188, 0.00128507861559708, 8.43622222197977e-05, -0.00144682006193602, 0.00194093937224301, -0.00122377665660179, -0.000298114203748202, 0.00168862069834775, -0.00206255758165992, 0.00114119124254297, 0.000540432819796766, -0.00194935120125451, 0.00217775031984279, -0.00103336612637309, -0.000815976520258829, 0.00222679024052433, -0.0022840070625033, 0.000893664862995731, 0.00112884688460452, -0.00252195010792769, 0.00237581822154405, -0.00071008985287978, -0.00148094721832655, 0.00283109545257149, -0.00244027859424611, 0.000481275296151715, 0.00187261367250013, -0.00314560130189572, 0.00247784648334419, -0.000205266004102603, -0.00230548238997615, 0.00346930416378926, -0.00248515757208669, -0.000128461655798002, 0.00278569931349863, -0.00380203221179371, 0.0024477120554485, 0.000528369269737399, -0.00331695392776148, 0.00413162436119325, -0.00236018185335489, -0.00100276457282763, 0.00389477619463202, -0.00445907636714348, 0.00221441282192787, 0.00155400722029019, -0.00453156885833587, 0.00478259314948808, -0.00200325122483783, -0.0022023517006828, 0.0052357495171351, -0.00509828301292427, 0.00170651172991247, 0.0029654448013702, -0.00601013715446205, 0.00540029685546673, -0.00130867056240355, -0.00385523749927088, 0.00687490522212487, -0.00568605985061205, 0.000799576840655376, 0.00491771254587575, -0.00785017129922056, 0.00596454343071388, -0.000123472338108085, -0.00618613115085978, 0.00898339702065279, -0.00620773221004298, -0.000743953050918686, 0.00774819715067737, -0.0103089088781853, 0.00644209112672455, 0.0018940980853443, -0.00971501117456212, 0.01194059632766, -0.00664955449976755, -0.00345763733182516, 0.012293624219367, -0.0140411260540527, 0.00681748232978679, 0.00565299754205851, -0.0158779103069643, 0.0169392924933783, -0.00696547806241279, -0.00898157233026718, 0.0213210907805169, -0.021377179779539, 0.0070813946318693, 0.0146521941013319, -0.030809341325773, 0.0294043959853076, -0.00717665765271796, -0.0265720708755593, 0.0524450484288886, -0.0497413236189416, 0.00721771168963371, 0.0697054716032983, -0.158946827403914, 0.230113999778829, 0.742758080664223, 0.230113999778829, -0.158946827403914, 0.0697054716032983, 0.00721771168963371, -0.0497413236189416, 0.0524450484288886, -0.0265720708755593, -0.00717665765271796, 0.0294043959853076, -0.030809341325773, 0.0146521941013319, 0.0070813946318693, -0.021377179779539, 0.0213210907805169, -0.00898157233026718, -0.00696547806241279, 0.0169392924933783, -0.0158779103069643, 0.00565299754205851, 0.00681748232978679, -0.0140411260540527, 0.012293624219367, -0.00345763733182516, -0.00664955449976755, 0.01194059632766, -0.00971501117456212, 0.0018940980853443, 0.00644209112672455, -0.0103089088781853, 0.00774819715067737, -0.000743953050918686, -0.00620773221004298, 0.00898339702065279, -0.00618613115085978, -0.000123472338108085, 0.00596454343071388, -0.00785017129922056, 0.00491771254587575, 0.000799576840655376, -0.00568605985061205, 0.00687490522212487, -0.00385523749927088, -0.00130867056240355, 0.00540029685546673, -0.00601013715446205, 0.0029654448013702, 0.00170651172991247, -0.00509828301292427, 0.0052357495171351, -0.0022023517006828, -0.00200325122483783, 0.00478259314948808, -0.00453156885833587, 0.00155400722029019, 0.00221441282192787, -0.00445907636714348, 0.00389477619463202, -0.00100276457282763, -0.00236018185335489, 0.00413162436119325, -0.00331695392776148, 0.000528369269737399, 0.0024477120554485, -0.00380203221179371, 0.00278569931349863, -0.000128461655798002, -0.00248515757208669, 0.00346930416378926, -0.00230548238997615, -0.000205266004102603, 0.00247784648334419, -0.00314560130189572, 0.00187261367250013, 0.000481275296151715, -0.00244027859424611, 0.00283109545257149, -0.00148094721832655, -0.00071008985287978, 0.00237581822154405, -0.00252195010792769, 0.00112884688460452, 0.000893664862995731, -0.0022840070625033, 0.00222679024052433, -0.000815976520258829, -0.00103336612637309, 0.00217775031984279, -0.00194935120125451, 0.000540432819796766, 0.00114119124254297, -0.00206255758165992, 0.00168862069834775, -0.000298114203748202, -0.00122377665660179, 0.00194093937224301, -0.00144682006193602, 8.43622222197977e-05, 0.00128507861559708, -0.00182057642161188, 0.00122389843489433, 0.000105601362389494, -0.00133290530421535, 0.00170691354870082, -0.00102146685462853, -0.000279472909965635, 0.00137983008365885, -0.00160830900054501, 0.000833715759714592, 0.00045226062117532, -0.00144342452839117, 0.00152517100242662, -0.0006442560702423, -0.000644298548047924, 0.00153626853370739, -0.00145289088003866, 0.000431936971254174, 0.000890414339711851, -0.00167312841845731, 0.00137702410850278, -0.000144051932105963, -0.00124489932032497, 0.0018655476053021, -0.00123337556216168, -0.000322278212131075, 0.00178872879736678, -0.00208766896684888, 0.000844188583826325, 0.00121157957604657, -0.00261523111446567, 0.00206190633467071, 0.000315532359593839, -0.003051751821304, 0.00328207016598884, -0.000821746355076636, -0.00478484805766507, 0.00387180202862923, -0.00345480515660976, -0.0183361523110358, -0.0105092836771258, 0.00269565291972947, 0.00269965038547092]
-coefLPF42Hz=[0.00325919124554863, 0.0138300160888317, 0.0158900204014543, -0.00154412857918871, -0.0072380182428481, 0.00491781706169658, 0.00109091814582823, -0.00438011074511327, 0.00337701246250141, -0.000100480197648588, -0.00257246354695517, 0.00299809667218221, -0.00137120275693122, -0.000894893729503594, 0.00229021473973167, -0.00210499417298908, 0.000666810447917921, 0.00102488535174427, -0.00196290558433342, 0.00168494031559983, -0.000454063837457503, -0.00095672394665339, 0.00174752226706308, -0.0015154588795269, 0.000442986368059813, 0.000836847023372286, -0.00161850388839058, 0.00148405873205106, -0.000531692680630907, -0.00070488851741114, 0.00154130867465809, -0.00152948280882295, 0.000674648862176917, 0.000555800466918776, -0.00149351836288512, 0.00161989929816111, -0.000857153223598015, -0.000391873600154527, 0.00145151590267902, -0.00173543862461748, 0.00107001494606435, 0.000203781687509858, -0.0014014633348692, 0.00186135128234955, -0.00130913806493935, 1.70277544775702e-05, 0.00132928548158688, -0.00199064280386148, 0.00157546737432591, -0.00027256940518816, -0.00123035650561909, 0.00211131391328799, -0.00186036898356392, 0.000569400149800834, 0.0010927221514534, -0.00221705998425161, 0.00216098463299264, -0.000904411544101823, -0.000906155202802593, 0.00229522090714527, -0.00246992753890464, 0.00128342099141767, 0.000665616399595941, -0.00233024888758365, 0.00278079814980414, -0.00171094510818678, -0.000356696310940691, 0.00232085416943824, -0.00308976066218816, 0.0021817428503803, -2.14808753451871e-05, -0.00225368871441815, 0.0033842022660182, -0.00269072861999755, 0.000475336330096531, 0.00211058738806889, -0.00365007668192654, 0.00323953236392017, -0.00101591830489352, -0.00188088427023939, 0.0038787653664177, -0.00382616752091584, 0.00164448523606835, 0.00155189508120299, -0.00406063951009803, 0.00443060235906671, -0.00237854300054227, -0.00112297636279155, 0.00415560319816175, -0.00506799107989784, 0.00319929793643512, 0.000541658690985392, -0.00417386667027968, 0.00570868282301637, -0.00414210028478963, 0.000189219560410653, 0.00408445753002554, -0.00635159684840117, 0.00520783044993604, -0.00109488116327859, -0.00385964821613109, 0.00698064971719076, -0.00640809927732654, 0.00222073329472798, 0.00346251181015903, -0.00759262387954351, 0.0077703941751021, -0.00361674814338341, -0.00285373816634134, 0.00818675590951278, -0.00932580662844778, 0.00533989244170744, 0.00195852727575201, -0.00873420675195082, 0.0111567238212279, -0.00750923790187721, -0.000676239134719674, 0.0092281040717627, -0.0133733137336057, 0.0103514715130581, -0.00114978501892971, -0.00967335728892393, 0.0161877005004822, -0.0142273591965605, 0.00388143746977407, 0.0100423530435953, -0.02009819601601, 0.0199955550122748, -0.00824233575188582, -0.0103391508966953, 0.0262776645163458, -0.0298461013934844, 0.0163080430417108, 0.0105594967747785, -0.0386570804774642, 0.051845064672248, -0.0367646449432453, -0.0106863083095975, 0.0821705944420035, -0.158755137853087, 0.217348428808074, 0.760735964805356, 0.217348428808074, -0.158755137853087, 0.0821705944420035, -0.0106863083095975, -0.0367646449432453, 0.051845064672248, -0.0386570804774642, 0.0105594967747785, 0.0163080430417108, -0.0298461013934844, 0.0262776645163458, -0.0103391508966953, -0.00824233575188582, 0.0199955550122748, -0.02009819601601, 0.0100423530435953, 0.00388143746977407, -0.0142273591965605, 0.0161877005004822, -0.00967335728892393, -0.00114978501892971, 0.0103514715130581, -0.0133733137336057, 0.0092281040717627, -0.000676239134719674, -0.00750923790187721, 0.0111567238212279, -0.00873420675195082, 0.00195852727575201, 0.00533989244170744, -0.00932580662844778, 0.00818675590951278, -0.00285373816634134, -0.00361674814338341, 0.0077703941751021, -0.00759262387954351, 0.00346251181015903, 0.00222073329472798, -0.00640809927732654, 0.00698064971719076, -0.00385964821613109, -0.00109488116327859, 0.00520783044993604, -0.00635159684840117, 0.00408445753002554, 0.000189219560410653, -0.00414210028478963, 0.00570868282301637, -0.00417386667027968, 0.000541658690985392, 0.00319929793643512, -0.00506799107989784, 0.00415560319816175, -0.00112297636279155, -0.00237854300054227, 0.00443060235906671, -0.00406063951009803, 0.00155189508120299, 0.00164448523606835, -0.00382616752091584, 0.0038787653664177, -0.00188088427023939, -0.00101591830489352, 0.00323953236392017, -0.00365007668192654, 0.00211058738806889, 0.000475336330096531, -0.00269072861999755, 0.0033842022660182, -0.00225368871441815, -2.14808753451871e-05, 0.0021817428503803, -0.00308976066218816, 0.00232085416943824, -0.000356696310940691, -0.00171094510818678, 0.00278079814980414, -0.00233024888758365, 0.000665616399595941, 0.00128342099141767, -0.00246992753890464, 0.00229522090714527, -0.000906155202802593, -0.000904411544101823, 0.00216098463299264, -0.00221705998425161, 0.0010927221514534, 0.000569400149800834, -0.00186036898356392, 0.00211131391328799, -0.00123035650561909, -0.00027256940518816, 0.00157546737432591, -0.00199064280386148, 0.00132928548158688, 1.70277544775702e-05, -0.00130913806493935, 0.00186135128234955, -0.0014014633348692, 0.000203781687509858, 0.00107001494606435, -0.00173543862461748, 0.00145151590267902, -0.000391873600154527, -0.000857153223598015, 0.00161989929816111, -0.00149351836288512, 0.000555800466918776, 0.000674648862176917, -0.00152948280882295, 0.00154130867465809, -0.00070488851741114, -0.000531692680630907, 0.00148405873205106, -0.00161850388839058, 0.000836847023372286, 0.000442986368059813, -0.0015154588795269, 0.00174752226706308, -0.00095672394665339, -0.000454063837457503, 0.00168494031559983, -0.00196290558433342, 0.00102488535174427, 0.000666810447917921, -0.00210499417298908, 0.00229021473973167, -0.000894893729503594, -0.00137120275693122, 0.00299809667218221, -0.00257246354695517, -0.000100480197648588, 0.00337701246250141, -0.00438011074511327, 0.00109091814582823, 0.00491781706169658, -0.0072380182428481, -0.00154412857918871, 0.0158900204014543, 0.0138300160888317, 0.00325919124554863]
-coefLPF43Hz=[-0.00701090967875529, -0.0177972414477156, -0.00810859331883771, 0.00784531730670435, -0.000515281702682636, -0.00431095403498796, 0.00435979609586624, -0.00140495631048574, -0.00173686097126718, 0.00312745258480221, -0.00239412462647812, 0.000406520492709985, 0.00150631006108179, -0.00233539795400311, 0.0018157425179126, -0.000403901055780125, -0.00107510498924967, 0.00187382505644442, -0.00166680372480933, 0.000644680885331514, 0.000632175246778144, -0.00153140692481423, 0.0016461661865788, -0.000961184153050081, -0.000164946459884435, 0.00118122320104515, -0.0016116262253648, 0.00126665301198244, -0.000320321578084244, -0.000772950179356408, 0.00149713703640336, -0.00151507939560993, 0.000814809519978032, 0.000280573795926963, -0.00125694649039103, 0.0016519179446935, -0.00127110639637458, 0.000279329155700335, 0.000869113242614292, -0.00163519136776762, 0.00164624183878203, -0.000875767742912452, -0.000335238539492922, 0.00142667465466241, -0.00187566570688864, 0.0014479694667511, -0.000315489511484904, -0.00101073146821776, 0.00190593314238153, -0.00192706267257882, 0.00103094956126609, 0.000394583372357853, -0.00169019638558684, 0.00223100852286283, -0.0017301751565337, 0.000382492322764721, 0.00120648973191095, -0.00228590829991578, 0.00232192249089533, -0.0012519364025469, -0.000464306738777211, 0.00203513062752786, -0.00270306285451468, 0.00211163956983334, -0.000483456989342796, -0.00144716797321067, 0.00278024615605535, -0.00284070281465063, 0.00155509418337652, 0.000547930993321681, -0.0024651121688991, 0.00332137124220968, -0.0026036442677704, 0.000630779850421091, 0.00174696652003903, -0.00340938383779645, 0.00350797674494125, -0.00194882583695082, -0.000616386245807824, 0.00302449148975432, -0.00409308130048706, 0.00326551140710608, -0.000844050284497193, -0.00211432107057615, 0.00421102415099372, -0.0043928669114708, 0.00249416982476635, 0.000692524824097453, -0.00372524990559511, 0.00513513497043258, -0.00415609444212379, 0.00114260471412355, 0.00257500402644844, -0.00527210866822527, 0.00560026702166353, -0.00325944944100927, -0.000774484516657259, 0.00466322820863581, -0.00654890929628277, 0.00541619492953503, -0.00161657933956097, -0.00319730989513975, 0.00677499789748322, -0.00732230782008638, 0.00439280812933701, 0.000834103578739378, -0.00601494404593224, 0.00866137858070664, -0.00732050596420787, 0.00235695994365465, 0.00410258153115076, -0.00906825570136693, 0.0100423423996225, -0.00624358181818089, -0.000886662644639214, 0.00819309518465881, -0.012166260074214, 0.0105861926653547, -0.00370572054074306, -0.00564632613978774, 0.0131881675673823, -0.0150824208312675, 0.00979281733401564, 0.000929095788009525, -0.0125096497548681, 0.0194088908517982, -0.0176242183074573, 0.0067847705255011, 0.00916483333048027, -0.0232155977784151, 0.02809427810471, -0.0195898551243403, -0.000954125773854993, 0.026192597154693, -0.0447980231830347, 0.0453492519996842, -0.0208326819291443, -0.0280897254430417, 0.0923086879695248, -0.156526223330897, 0.203853319834036, 0.778735121762989, 0.203853319834036, -0.156526223330897, 0.0923086879695248, -0.0280897254430417, -0.0208326819291443, 0.0453492519996842, -0.0447980231830347, 0.026192597154693, -0.000954125773854993, -0.0195898551243403, 0.02809427810471, -0.0232155977784151, 0.00916483333048027, 0.0067847705255011, -0.0176242183074573, 0.0194088908517982, -0.0125096497548681, 0.000929095788009525, 0.00979281733401564, -0.0150824208312675, 0.0131881675673823, -0.00564632613978774, -0.00370572054074306, 0.0105861926653547, -0.012166260074214, 0.00819309518465881, -0.000886662644639214, -0.00624358181818089, 0.0100423423996225, -0.00906825570136693, 0.00410258153115076, 0.00235695994365465, -0.00732050596420787, 0.00866137858070664, -0.00601494404593224, 0.000834103578739378, 0.00439280812933701, -0.00732230782008638, 0.00677499789748322, -0.00319730989513975, -0.00161657933956097, 0.00541619492953503, -0.00654890929628277, 0.00466322820863581, -0.000774484516657259, -0.00325944944100927, 0.00560026702166353, -0.00527210866822527, 0.00257500402644844, 0.00114260471412355, -0.00415609444212379, 0.00513513497043258, -0.00372524990559511, 0.000692524824097453, 0.00249416982476635, -0.0043928669114708, 0.00421102415099372, -0.00211432107057615, -0.000844050284497193, 0.00326551140710608, -0.00409308130048706, 0.00302449148975432, -0.000616386245807824, -0.00194882583695082, 0.00350797674494125, -0.00340938383779645, 0.00174696652003903, 0.000630779850421091, -0.0026036442677704, 0.00332137124220968, -0.0024651121688991, 0.000547930993321681, 0.00155509418337652, -0.00284070281465063, 0.00278024615605535, -0.00144716797321067, -0.000483456989342796, 0.00211163956983334, -0.00270306285451468, 0.00203513062752786, -0.000464306738777211, -0.0012519364025469, 0.00232192249089533, -0.00228590829991578, 0.00120648973191095, 0.000382492322764721, -0.0017301751565337, 0.00223100852286283, -0.00169019638558684, 0.000394583372357853, 0.00103094956126609, -0.00192706267257882, 0.00190593314238153, -0.00101073146821776, -0.000315489511484904, 0.0014479694667511, -0.00187566570688864, 0.00142667465466241, -0.000335238539492922, -0.000875767742912452, 0.00164624183878203, -0.00163519136776762, 0.000869113242614292, 0.000279329155700335, -0.00127110639637458, 0.0016519179446935, -0.00125694649039103, 0.000280573795926963, 0.000814809519978032, -0.00151507939560993, 0.00149713703640336, -0.000772950179356408, -0.000320321578084244, 0.00126665301198244, -0.0016116262253648, 0.00118122320104515, -0.000164946459884435, -0.000961184153050081, 0.0016461661865788, -0.00153140692481423, 0.000632175246778144, 0.000644680885331514, -0.00166680372480933, 0.00187382505644442, -0.00107510498924967, -0.000403901055780125, 0.0018157425179126, -0.00233539795400311, 0.00150631006108179, 0.000406520492709985, -0.00239412462647812, 0.00312745258480221, -0.00173686097126718, -0.00140495631048574, 0.00435979609586624, -0.00431095403498796, -0.000515281702682636, 0.00784531730670435, -0.00810859331883771, -0.0177972414477156, -0.00701090967875529]
-coefLPF44Hz=[-0.00279711134169176, -0.0139521802253108, -0.0164466457340992, 0.00270414592982765, 0.00650842853205348, -0.00603214504866634, 0.00118569914021935, 0.00293697834596914, -0.00410536772677925, 0.00260630669925573, 5.31093510766114e-06, -0.0021158735533545, 0.00279744265824163, -0.00200564248997821, 0.000370723521872984, 0.00123232506516154, -0.00209559725744299, 0.00193436005250016, -0.000941792596649872, -0.000377531221573311, 0.00144143394560575, -0.00182797455388623, 0.00142769183763463, -0.000450704588564913, -0.000671450594300541, 0.0014812769374754, -0.00165899690363031, 0.00115852281999908, -0.000194138080217019, -0.000837136694749456, 0.00152316251358684, -0.00159039327594018, 0.00101713790781333, -3.13972370308158e-05, -0.000977300922394011, 0.0016056780443956, -0.00159549011349272, 0.00094226267150661, 0.000103652145142484, -0.00113192533162581, 0.00173217595797843, -0.001650103758658, 0.000898554348976166, 0.000241642770115579, -0.00132131432011766, 0.00190141096677832, -0.0017319582449037, 0.000855288958948138, 0.000399919836878567, -0.00154136922116747, 0.0021001904816456, -0.00183026341044978, 0.000808844419124625, 0.000581951187110754, -0.00179577002133479, 0.00233082102748187, -0.001942310315525, 0.00075048908390635, 0.000797329523672034, -0.00209158104385704, 0.00259204439145202, -0.00206115095293007, 0.00066951240378331, 0.00105429221366381, -0.00242978293440776, 0.00287857941636557, -0.00217882075520421, 0.000563902520743772, 0.00135235813709263, -0.00281033597845917, 0.00319634190236401, -0.0023013502527738, 0.000431136289678496, 0.00170404102273219, -0.00325023567107676, 0.00354998617620383, -0.00242018987356984, 0.000253315007263702, 0.00212040425511551, -0.00374906879457481, 0.00393353704914649, -0.00253037613900458, 3.57214774187498e-05, 0.00260414914765001, -0.00431574337953558, 0.00437075704577809, -0.0026397722634048, -0.000232228470721959, 0.00318954688874937, -0.00497707865726729, 0.00486010404370073, -0.0027484653255869, -0.000594515044701598, 0.00386581868829759, -0.00576411974113732, 0.00541540838967314, -0.00284435866070487, -0.00102196042394225, 0.00471183111202334, -0.0067009202448588, 0.00607123996173181, -0.00294076090887326, -0.00158700168770431, 0.00576480087431893, -0.00784453188956301, 0.00686340055137857, -0.00302300689503807, -0.00232539869955081, 0.00709593567864852, -0.00930331424804788, 0.00786012235348265, -0.00309667130839761, -0.00331797488895352, 0.00887815995121851, -0.011237378786693, 0.00916876242707555, -0.00315220456070103, -0.00471112303696305, 0.0113712869182693, -0.0139700229282661, 0.0110341923387293, -0.00320398026530506, -0.00682982184473106, 0.015184707451339, -0.0182039859198742, 0.0139582055113577, -0.00323988415196169, -0.0104243056583604, 0.0218098106240862, -0.0258046114905332, 0.0194141427168937, -0.00327590327134575, -0.0179397962224002, 0.0365412622519475, -0.0440062527871892, 0.0337080248889581, -0.00329615165472625, -0.0440155366285064, 0.0997861555408965, -0.152317032690818, 0.189742998774219, 0.796706739620732, 0.189742998774219, -0.152317032690818, 0.0997861555408965, -0.0440155366285064, -0.00329615165472625, 0.0337080248889581, -0.0440062527871892, 0.0365412622519475, -0.0179397962224002, -0.00327590327134575, 0.0194141427168937, -0.0258046114905332, 0.0218098106240862, -0.0104243056583604, -0.00323988415196169, 0.0139582055113577, -0.0182039859198742, 0.015184707451339, -0.00682982184473106, -0.00320398026530506, 0.0110341923387293, -0.0139700229282661, 0.0113712869182693, -0.00471112303696305, -0.00315220456070103, 0.00916876242707555, -0.011237378786693, 0.00887815995121851, -0.00331797488895352, -0.00309667130839761, 0.00786012235348265, -0.00930331424804788, 0.00709593567864852, -0.00232539869955081, -0.00302300689503807, 0.00686340055137857, -0.00784453188956301, 0.00576480087431893, -0.00158700168770431, -0.00294076090887326, 0.00607123996173181, -0.0067009202448588, 0.00471183111202334, -0.00102196042394225, -0.00284435866070487, 0.00541540838967314, -0.00576411974113732, 0.00386581868829759, -0.000594515044701598, -0.0027484653255869, 0.00486010404370073, -0.00497707865726729, 0.00318954688874937, -0.000232228470721959, -0.0026397722634048, 0.00437075704577809, -0.00431574337953558, 0.00260414914765001, 3.57214774187498e-05, -0.00253037613900458, 0.00393353704914649, -0.00374906879457481, 0.00212040425511551, 0.000253315007263702, -0.00242018987356984, 0.00354998617620383, -0.00325023567107676, 0.00170404102273219, 0.000431136289678496, -0.0023013502527738, 0.00319634190236401, -0.00281033597845917, 0.00135235813709263, 0.000563902520743772, -0.00217882075520421, 0.00287857941636557, -0.00242978293440776, 0.00105429221366381, 0.00066951240378331, -0.00206115095293007, 0.00259204439145202, -0.00209158104385704, 0.000797329523672034, 0.00075048908390635, -0.001942310315525, 0.00233082102748187, -0.00179577002133479, 0.000581951187110754, 0.000808844419124625, -0.00183026341044978, 0.0021001904816456, -0.00154136922116747, 0.000399919836878567, 0.000855288958948138, -0.0017319582449037, 0.00190141096677832, -0.00132131432011766, 0.000241642770115579, 0.000898554348976166, -0.001650103758658, 0.00173217595797843, -0.00113192533162581, 0.000103652145142484, 0.00094226267150661, -0.00159549011349272, 0.0016056780443956, -0.000977300922394011, -3.13972370308158e-05, 0.00101713790781333, -0.00159039327594018, 0.00152316251358684, -0.000837136694749456, -0.000194138080217019, 0.00115852281999908, -0.00165899690363031, 0.0014812769374754, -0.000671450594300541, -0.000450704588564913, 0.00142769183763463, -0.00182797455388623, 0.00144143394560575, -0.000377531221573311, -0.000941792596649872, 0.00193436005250016, -0.00209559725744299, 0.00123232506516154, 0.000370723521872984, -0.00200564248997821, 0.00279744265824163, -0.0021158735533545, 5.31093510766114e-06, 0.00260630669925573, -0.00410536772677925, 0.00293697834596914, 0.00118569914021935, -0.00603214504866634, 0.00650842853205348, 0.00270414592982765, -0.0164466457340992, -0.0139521802253108, -0.00279711134169176]
-coefLPF45Hz=[0.00761695458377913, 0.0189399742169847, 0.00659043656336219, -0.00863828121707057, 0.00285244968005706, 0.00253714969417832, -0.0045902192115408, 0.00352155443140669, -0.000912712142353826, -0.00156456776428169, 0.00283992463978584, -0.00264161148895116, 0.00135272910356758, 0.000310023474911324, -0.0016342277517418, 0.00217006842185109, -0.00182075059787107, 0.000822606815455983, 0.000396155849480137, -0.00137893150145335, 0.00180034709721843, -0.00155890487551903, 0.000783374973946148, 0.000232178428937903, -0.00113055282943583, 0.00161170550038523, -0.00152922113516024, 0.00092724225935157, -1.74194746886707e-05, -0.000890343946604655, 0.00149348101242372, -0.00159288717250639, 0.00115526155645241, -0.000322982290581937, -0.000628994706340992, 0.00138317972813426, -0.00168397077455306, 0.00142190705167175, -0.000673056650169604, -0.000321838894074269, 0.00123384560793047, -0.00175510624530064, 0.00169927962616332, -0.00106670563914441, 5.13104728421733e-05, 0.00101610199716476, -0.00177654880526115, 0.00196258230081252, -0.00149036920197129, 0.00049609821777849, 0.000703810646088256, -0.00171428125630038, 0.00218474484892561, -0.0019331259030198, 0.00101470678742062, 0.000285994890501566, -0.00154679917255047, 0.00233470292395322, -0.00236439324062756, 0.00159385800746203, -0.000246679008480079, -0.00124421930572796, 0.00237740820427347, -0.00275473158474656, 0.00221133021023642, -0.000898019732853377, -0.000787666309758175, 0.00226832973186018, -0.00307240439357621, 0.0028402451831193, -0.00166494708783276, -0.000157316230552778, 0.00200249580843669, -0.00324590672838302, 0.00346753869997717, -0.00250442749827678, 0.000646062705438773, 0.00150997702636775, -0.00327190974377543, 0.00400430401393517, -0.00340505027925469, 0.00162834882903834, 0.000785393880649378, -0.00306700124095165, 0.00441489568216807, -0.00432629279546676, 0.00277291364499238, -0.000201274891995443, -0.00258302783926897, 0.00463827876300723, -0.00521851799724514, 0.00405759396971412, -0.00146249386366784, -0.00177531660889144, 0.00459623951756164, -0.00600957786011909, 0.00545296332706194, -0.00301330142723388, -0.00058895050864456, 0.00420722958772592, -0.00661644180433262, 0.0069174188494198, -0.00487520995610475, 0.00104418898407104, 0.0033850535658746, -0.00695354302837025, 0.00839344941632083, -0.007061489537926, 0.0032156310371847, 0.00200390997681495, -0.00691406445452381, 0.00982475832163526, -0.00959551393255473, 0.00605592471813163, -0.000144500198991924, -0.00631777456102907, 0.0111690394089842, -0.0126046091881585, 0.00981842384118763, -0.00336409161354817, -0.00490901939448727, 0.0123563747908288, -0.0163291608698446, 0.0150613063851243, -0.00836134173216521, -0.00214456684981046, 0.0133439303807681, -0.0214659786171334, 0.0232311104661797, -0.0169868519389661, 0.00346265628301771, 0.014078736513216, -0.0304051342718608, 0.0395665387373467, -0.036433335487589, 0.0182178003544434, 0.0145434178192794, -0.0577345972675747, 0.104406603975929, -0.146147069040092, 0.175004665836593, 0.81468559299929, 0.175004665836593, -0.146147069040092, 0.104406603975929, -0.0577345972675747, 0.0145434178192794, 0.0182178003544434, -0.036433335487589, 0.0395665387373467, -0.0304051342718608, 0.014078736513216, 0.00346265628301771, -0.0169868519389661, 0.0232311104661797, -0.0214659786171334, 0.0133439303807681, -0.00214456684981046, -0.00836134173216521, 0.0150613063851243, -0.0163291608698446, 0.0123563747908288, -0.00490901939448727, -0.00336409161354817, 0.00981842384118763, -0.0126046091881585, 0.0111690394089842, -0.00631777456102907, -0.000144500198991924, 0.00605592471813163, -0.00959551393255473, 0.00982475832163526, -0.00691406445452381, 0.00200390997681495, 0.0032156310371847, -0.007061489537926, 0.00839344941632083, -0.00695354302837025, 0.0033850535658746, 0.00104418898407104, -0.00487520995610475, 0.0069174188494198, -0.00661644180433262, 0.00420722958772592, -0.00058895050864456, -0.00301330142723388, 0.00545296332706194, -0.00600957786011909, 0.00459623951756164, -0.00177531660889144, -0.00146249386366784, 0.00405759396971412, -0.00521851799724514, 0.00463827876300723, -0.00258302783926897, -0.000201274891995443, 0.00277291364499238, -0.00432629279546676, 0.00441489568216807, -0.00306700124095165, 0.000785393880649378, 0.00162834882903834, -0.00340505027925469, 0.00400430401393517, -0.00327190974377543, 0.00150997702636775, 0.000646062705438773, -0.00250442749827678, 0.00346753869997717, -0.00324590672838302, 0.00200249580843669, -0.000157316230552778, -0.00166494708783276, 0.0028402451831193, -0.00307240439357621, 0.00226832973186018, -0.000787666309758175, -0.000898019732853377, 0.00221133021023642, -0.00275473158474656, 0.00237740820427347, -0.00124421930572796, -0.000246679008480079, 0.00159385800746203, -0.00236439324062756, 0.00233470292395322, -0.00154679917255047, 0.000285994890501566, 0.00101470678742062, -0.0019331259030198, 0.00218474484892561, -0.00171428125630038, 0.000703810646088256, 0.00049609821777849, -0.00149036920197129, 0.00196258230081252, -0.00177654880526115, 0.00101610199716476, 5.13104728421733e-05, -0.00106670563914441, 0.00169927962616332, -0.00175510624530064, 0.00123384560793047, -0.000321838894074269, -0.000673056650169604, 0.00142190705167175, -0.00168397077455306, 0.00138317972813426, -0.000628994706340992, -0.000322982290581937, 0.00115526155645241, -0.00159288717250639, 0.00149348101242372, -0.000890343946604655, -1.74194746886707e-05, 0.00092724225935157, -0.00152922113516024, 0.00161170550038523, -0.00113055282943583, 0.000232178428937903, 0.000783374973946148, -0.00155890487551903, 0.00180034709721843, -0.00137893150145335, 0.000396155849480137, 0.000822606815455983, -0.00182075059787107, 0.00217006842185109, -0.0016342277517418, 0.000310023474911324, 0.00135272910356758, -0.00264161148895116, 0.00283992463978584, -0.00156456776428169, -0.000912712142353826, 0.00352155443140669, -0.0045902192115408, 0.00253714969417832, 0.00285244968005706, -0.00863828121707057, 0.00659043656336219, 0.0189399742169847, 0.00761695458377913]
-coefLPF46Hz=[0.000245186237588131, 0.0109966774569372, 0.0191304378842841, -0.00013263512516052, -0.00660746767837194, 0.00583566705444092, -0.00221959238397113, -0.00127541464603451, 0.00322417569596888, -0.00336671271646826, 0.00216520954160821, -0.000385463047715418, -0.00123281237235408, 0.00218214529393262, -0.00227701505148208, 0.00162104584960357, -0.000525278081383311, -0.000629070250926614, 0.00148997951922848, -0.00184068807932812, 0.00162000365608519, -0.000940326264732577, 2.4781140650131e-05, 0.000857444276743399, -0.00146197622908135, 0.00163794897255832, -0.00134800850013261, 0.000686245403817776, 0.000157259896933831, -0.000951879032523951, 0.00148008044711617, -0.00159863984277227, 0.00127709268830441, -0.000595703260049446, -0.000258340368189846, 0.00105364599811084, -0.00157391734526253, 0.00166923408249425, -0.00130341894389368, 0.000566208058754196, 0.000349029507483074, -0.00119319698343469, 0.00172944880816401, -0.00180518075224329, 0.00138278453523604, -0.000560282190277512, -0.00044572612432353, 0.0013630742584272, -0.00193845698683484, 0.00199772178972741, -0.00150352329736025, 0.000570214741577819, 0.000558657698935738, -0.00157773579776657, 0.00220298534247243, -0.00224040551979672, 0.00165491552755026, -0.000583733229514043, -0.000696900672638892, 0.00184102727317246, -0.00252228456105385, 0.00252929519257951, -0.00183110261592554, 0.000594034359514056, 0.00086605658661694, -0.0021510969309049, 0.00289274719991278, -0.00286534065137395, 0.00204029477540034, -0.000605908052049603, -0.00106491864468103, 0.0025144570460353, -0.0033364416437361, 0.00326517974180586, -0.00227859602931951, 0.000613757747870213, 0.00130366733345356, -0.00295061774505514, 0.00385219661451975, -0.00373044715946679, 0.00256103558705015, -0.00062126891591331, -0.00158442180377439, 0.00346673276645911, -0.00447270667710658, 0.00429122209548455, -0.00289937756536682, 0.000631592158887131, 0.00193397281232434, -0.00409445780511474, 0.00523014456515373, -0.00496843342343706, 0.00330830666409333, -0.000635419864984779, -0.00236290054177388, 0.0048699923113393, -0.00616528468131551, 0.00581226156943472, -0.00382564107695412, 0.000636115750258817, 0.00289999714339453, -0.00587454430086795, 0.00735910206768432, -0.00690474598801309, 0.00448123863520897, -0.000634359772803823, -0.00362564902176859, 0.00717489736066525, -0.00896696899651279, 0.00835867132487801, -0.0053694802497844, 0.000652063944756556, 0.0046286368288928, -0.00902237468279931, 0.0112243578793293, -0.010451109541947, 0.00666575417902412, -0.000644787814104163, -0.00612236990096794, 0.0118045854142876, -0.0147092117529236, 0.0137409362065633, -0.00874189907684045, 0.000647287511568792, 0.00862611489672226, -0.0166130508799368, 0.0208990513829335, -0.019754025566182, 0.0126662870872205, -0.000648990568217928, -0.0137908290752346, 0.0270564356579568, -0.0351742364508934, 0.0346341590087404, -0.0232248943232303, 0.000650244179817969, 0.0312172739076137, -0.0685187027766271, 0.106036682377935, -0.138117277071561, 0.159707904147539, 0.832681002021821, 0.159707904147539, -0.138117277071561, 0.106036682377935, -0.0685187027766271, 0.0312172739076137, 0.000650244179817969, -0.0232248943232303, 0.0346341590087404, -0.0351742364508934, 0.0270564356579568, -0.0137908290752346, -0.000648990568217928, 0.0126662870872205, -0.019754025566182, 0.0208990513829335, -0.0166130508799368, 0.00862611489672226, 0.000647287511568792, -0.00874189907684045, 0.0137409362065633, -0.0147092117529236, 0.0118045854142876, -0.00612236990096794, -0.000644787814104163, 0.00666575417902412, -0.010451109541947, 0.0112243578793293, -0.00902237468279931, 0.0046286368288928, 0.000652063944756556, -0.0053694802497844, 0.00835867132487801, -0.00896696899651279, 0.00717489736066525, -0.00362564902176859, -0.000634359772803823, 0.00448123863520897, -0.00690474598801309, 0.00735910206768432, -0.00587454430086795, 0.00289999714339453, 0.000636115750258817, -0.00382564107695412, 0.00581226156943472, -0.00616528468131551, 0.0048699923113393, -0.00236290054177388, -0.000635419864984779, 0.00330830666409333, -0.00496843342343706, 0.00523014456515373, -0.00409445780511474, 0.00193397281232434, 0.000631592158887131, -0.00289937756536682, 0.00429122209548455, -0.00447270667710658, 0.00346673276645911, -0.00158442180377439, -0.00062126891591331, 0.00256103558705015, -0.00373044715946679, 0.00385219661451975, -0.00295061774505514, 0.00130366733345356, 0.000613757747870213, -0.00227859602931951, 0.00326517974180586, -0.0033364416437361, 0.0025144570460353, -0.00106491864468103, -0.000605908052049603, 0.00204029477540034, -0.00286534065137395, 0.00289274719991278, -0.0021510969309049, 0.00086605658661694, 0.000594034359514056, -0.00183110261592554, 0.00252929519257951, -0.00252228456105385, 0.00184102727317246, -0.000696900672638892, -0.000583733229514043, 0.00165491552755026, -0.00224040551979672, 0.00220298534247243, -0.00157773579776657, 0.000558657698935738, 0.000570214741577819, -0.00150352329736025, 0.00199772178972741, -0.00193845698683484, 0.0013630742584272, -0.00044572612432353, -0.000560282190277512, 0.00138278453523604, -0.00180518075224329, 0.00172944880816401, -0.00119319698343469, 0.000349029507483074, 0.000566208058754196, -0.00130341894389368, 0.00166923408249425, -0.00157391734526253, 0.00105364599811084, -0.000258340368189846, -0.000595703260049446, 0.00127709268830441, -0.00159863984277227, 0.00148008044711617, -0.000951879032523951, 0.000157259896933831, 0.000686245403817776, -0.00134800850013261, 0.00163794897255832, -0.00146197622908135, 0.000857444276743399, 2.4781140650131e-05, -0.000940326264732577, 0.00162000365608519, -0.00184068807932812, 0.00148997951922848, -0.000629070250926614, -0.000525278081383311, 0.00162104584960357, -0.00227701505148208, 0.00218214529393262, -0.00123281237235408, -0.000385463047715418, 0.00216520954160821, -0.00336671271646826, 0.00322417569596888, -0.00127541464603451, -0.00221959238397113, 0.00583566705444092, -0.00660746767837194, -0.00013263512516052, 0.0191304378842841, 0.0109966774569372, 0.000245186237588131]
-coefLPF47Hz=[-0.00823329235289328, -0.0199585561828532, -0.00483614469791333, 0.00886039666805225, -0.00493514096304798, -0.00013093316239855, 0.00340795266611013, -0.00425810039289694, 0.00321842570422221, -0.00124585639240091, -0.000753581757113592, 0.00214861066607683, -0.00265673890320926, 0.00231084184058331, -0.0013582833979689, 0.000151179615014159, 0.000964411643844375, -0.00172066067194392, 0.00197425891682626, -0.00171882520546633, 0.0010612087259202, -0.000192321540039926, -0.000675741036691909, 0.00134529965195441, -0.00167613847060625, 0.00160969291874413, -0.0011792430620779, 0.00049053082908724, 0.000298357812994213, -0.00101228467593731, 0.00149414170732398, -0.00164023709404834, 0.00142104298938816, -0.000884627725854718, 0.000147581661768226, 0.000630985729546375, -0.00128269084467221, 0.00166302228229461, -0.00168245539568886, 0.00132793930185, -0.000669168047141149, -0.000155448182533322, 0.000969900817128167, -0.00159412443375602, 0.00188481152778779, -0.00176606368828881, 0.00125019346349394, -0.000436197355921154, -0.000504939227817075, 0.00136908486447952, -0.00196050680590398, 0.00213949079659004, -0.00184837640763422, 0.00113152061380331, -0.00013381532144015, -0.00093586519113311, 0.00184167931409648, -0.00237376201611248, 0.00239941512330129, -0.00189206701040863, 0.000940447305775994, 0.000265775488784077, -0.0014641099429591, 0.00239305175048192, -0.00282224657580573, 0.00265298831592265, -0.00186162540288686, 0.00064966231580741, 0.000798906900265857, -0.00210587346133207, 0.00301708765961759, -0.00330323624229959, 0.00284410680713481, -0.00174929159798401, 0.00021099899740397, 0.00146342273885698, -0.00287662828234094, 0.00371900891873142, -0.00378451994512266, 0.00299571849551862, -0.00149809350313949, -0.000397907286696965, 0.00230319600520371, -0.0037987500302992, 0.00451698217142774, -0.00425332225818165, 0.00303725137067064, -0.00108309238205945, -0.00121965930287571, 0.00337582766968736, -0.00488591548860179, 0.00538526951456916, -0.00471581579360805, 0.00295907462819118, -0.000436212707262559, -0.00232828667028818, 0.00472432623706431, -0.00620007154699191, 0.00637987604758113, -0.00514727168519146, 0.00268575989126496, 0.000531145171511062, -0.00382620326021055, 0.00646770185975448, -0.00783172780193613, 0.00753712559817325, -0.00553475472915986, 0.00214789018255421, 0.00196125168797088, -0.00592054371945416, 0.00883642090723418, -0.00998650033502329, 0.00897923218074479, -0.00586624182793857, 0.00117213379394967, 0.00418248775538807, -0.00905735968442244, 0.012319893354229, -0.0130935110556081, 0.0109706371134752, -0.00613716725739156, -0.000610615733577407, 0.00797376522359515, -0.0143681803993831, 0.0182394650276465, -0.0184052026399048, 0.0143324651902708, -0.00632941105645673, -0.00441502423182959, 0.0159519414858161, -0.025863924340203, 0.0316187638731111, -0.031055158695074, 0.0227660191125511, -0.00645472634330137, -0.0169727823711464, 0.045400964351021, -0.0757986237158357, 0.104633026429416, -0.128341606038711, 0.143920355227489, 0.850645588112473, 0.143920355227489, -0.128341606038711, 0.104633026429416, -0.0757986237158357, 0.045400964351021, -0.0169727823711464, -0.00645472634330137, 0.0227660191125511, -0.031055158695074, 0.0316187638731111, -0.025863924340203, 0.0159519414858161, -0.00441502423182959, -0.00632941105645673, 0.0143324651902708, -0.0184052026399048, 0.0182394650276465, -0.0143681803993831, 0.00797376522359515, -0.000610615733577407, -0.00613716725739156, 0.0109706371134752, -0.0130935110556081, 0.012319893354229, -0.00905735968442244, 0.00418248775538807, 0.00117213379394967, -0.00586624182793857, 0.00897923218074479, -0.00998650033502329, 0.00883642090723418, -0.00592054371945416, 0.00196125168797088, 0.00214789018255421, -0.00553475472915986, 0.00753712559817325, -0.00783172780193613, 0.00646770185975448, -0.00382620326021055, 0.000531145171511062, 0.00268575989126496, -0.00514727168519146, 0.00637987604758113, -0.00620007154699191, 0.00472432623706431, -0.00232828667028818, -0.000436212707262559, 0.00295907462819118, -0.00471581579360805, 0.00538526951456916, -0.00488591548860179, 0.00337582766968736, -0.00121965930287571, -0.00108309238205945, 0.00303725137067064, -0.00425332225818165, 0.00451698217142774, -0.0037987500302992, 0.00230319600520371, -0.000397907286696965, -0.00149809350313949, 0.00299571849551862, -0.00378451994512266, 0.00371900891873142, -0.00287662828234094, 0.00146342273885698, 0.00021099899740397, -0.00174929159798401, 0.00284410680713481, -0.00330323624229959, 0.00301708765961759, -0.00210587346133207, 0.000798906900265857, 0.00064966231580741, -0.00186162540288686, 0.00265298831592265, -0.00282224657580573, 0.00239305175048192, -0.0014641099429591, 0.000265775488784077, 0.000940447305775994, -0.00189206701040863, 0.00239941512330129, -0.00237376201611248, 0.00184167931409648, -0.00093586519113311, -0.00013381532144015, 0.00113152061380331, -0.00184837640763422, 0.00213949079659004, -0.00196050680590398, 0.00136908486447952, -0.000504939227817075, -0.000436197355921154, 0.00125019346349394, -0.00176606368828881, 0.00188481152778779, -0.00159412443375602, 0.000969900817128167, -0.000155448182533322, -0.000669168047141149, 0.00132793930185, -0.00168245539568886, 0.00166302228229461, -0.00128269084467221, 0.000630985729546375, 0.000147581661768226, -0.000884627725854718, 0.00142104298938816, -0.00164023709404834, 0.00149414170732398, -0.00101228467593731, 0.000298357812994213, 0.00049053082908724, -0.0011792430620779, 0.00160969291874413, -0.00167613847060625, 0.00134529965195441, -0.000675741036691909, -0.000192321540039926, 0.0010612087259202, -0.00171882520546633, 0.00197425891682626, -0.00172066067194392, 0.000964411643844375, 0.000151179615014159, -0.0013582833979689, 0.00231084184058331, -0.00265673890320926, 0.00214861066607683, -0.000753581757113592, -0.00124585639240091, 0.00321842570422221, -0.00425810039289694, 0.00340795266611013, -0.00013093316239855, -0.00493514096304798, 0.00886039666805225, -0.00483614469791333, -0.0199585561828532, -0.00823329235289328]
-coefLPF48Hz=[0.0123322810088398, 0.0183555943030669, -0.0036412626808832, -0.00335337323801924, 0.00532022315150587, -0.00443217756170512, 0.00231412270593763, -7.11010582352003e-05, -0.00164712753588104, 0.00255949143627242, -0.00265797438795413, 0.00210619779589118, -0.00115696879379319, 8.24038520899489e-05, 0.000879261987031339, -0.00155560797988473, 0.00185521359183696, -0.0017661442856447, 0.00134470197403961, -0.000698344521044337, -3.95157445609976e-05, 0.000733607360266495, -0.00126549087075388, 0.00155187301218326, -0.00155552727159714, 0.00128520550195413, -0.000793277558568644, 0.00016844693190587, 0.000481446102129182, -0.00104708224195092, 0.00143242198489461, -0.00157163347813543, 0.00144108688137698, -0.00106022510930459, 0.00048919832776404, 0.000177243861779992, -0.00082703730798331, 0.00135035245685704, -0.00165457420243952, 0.00168142981457565, -0.00141941136947055, 0.000903636784131666, -0.000213204651942051, -0.000537412323716984, 0.0012208953657862, -0.0017182332247166, 0.00193577735389138, -0.00182557826986158, 0.00139470721484314, -0.000703995171329862, -0.000136307383289048, 0.000987318141293274, -0.00170339387299766, 0.00215106487072177, -0.00224932050767155, 0.00194976655578833, -0.00131740397630482, 0.000400814300903172, 0.000590517697227127, -0.001553151925755, 0.00227614166973697, -0.00262609008792679, 0.00255673945757552, -0.00202828111816043, 0.00111581359522666, 1.77045953512903e-05, -0.00120245611681834, 0.00224404412625381, -0.00293680845693849, 0.00314545751114248, -0.00282679776355894, 0.00200596171029875, -0.000789438358726737, -0.000624914356419156, 0.00199141479113902, -0.00307486795074808, 0.00368205553323452, -0.00368223176543769, 0.00303882692587738, -0.00183305970494043, 0.000252604806064951, 0.00144584773231541, -0.00297852418739545, 0.00407550490848953, -0.00452259064766115, 0.00420414781754861, -0.00313691390972682, 0.00147337457135662, 0.000528459312346847, -0.00254565242262322, 0.0042326123622306, -0.00527697536739823, 0.00546069298706136, -0.00470378649529494, 0.00308656028525862, -0.000845410947812646, -0.00166669060360627, 0.00403611284108083, -0.00584583135512495, 0.0067467667835917, -0.006528449034789, 0.00515997900457751, -0.00280743833530461, -0.000179118192767362, 0.00332408494324938, -0.00609882158959143, 0.00799822842675948, -0.00863516172523114, 0.00781208537592794, -0.0055618343068042, 0.00217667900172529, 0.00184784858826617, -0.00585504095821634, 0.00915895228541478, -0.0111222182306752, 0.0113029744764724, -0.00951263431543499, 0.00588558948818192, -0.000886685314369997, -0.00476263188240844, 0.0101415151393456, -0.0142907808313221, 0.0163642466694113, -0.0157621070301184, 0.0122701415506928, -0.00613068181768189, -0.00196028102949038, 0.0108929368675851, -0.0192578113180508, 0.0255327235325607, -0.0282801789326739, 0.0263437604621381, -0.0190377140347002, 0.00627812896671296, 0.0113678126220755, -0.0327051623979497, 0.056015531235558, -0.0792409288316254, 0.100212649856847, -0.116895358773828, 0.127628599086472, 0.868668927109526, 0.127628599086472, -0.116895358773828, 0.100212649856847, -0.0792409288316254, 0.056015531235558, -0.0327051623979497, 0.0113678126220755, 0.00627812896671296, -0.0190377140347002, 0.0263437604621381, -0.0282801789326739, 0.0255327235325607, -0.0192578113180508, 0.0108929368675851, -0.00196028102949038, -0.00613068181768189, 0.0122701415506928, -0.0157621070301184, 0.0163642466694113, -0.0142907808313221, 0.0101415151393456, -0.00476263188240844, -0.000886685314369997, 0.00588558948818192, -0.00951263431543499, 0.0113029744764724, -0.0111222182306752, 0.00915895228541478, -0.00585504095821634, 0.00184784858826617, 0.00217667900172529, -0.0055618343068042, 0.00781208537592794, -0.00863516172523114, 0.00799822842675948, -0.00609882158959143, 0.00332408494324938, -0.000179118192767362, -0.00280743833530461, 0.00515997900457751, -0.006528449034789, 0.0067467667835917, -0.00584583135512495, 0.00403611284108083, -0.00166669060360627, -0.000845410947812646, 0.00308656028525862, -0.00470378649529494, 0.00546069298706136, -0.00527697536739823, 0.0042326123622306, -0.00254565242262322, 0.000528459312346847, 0.00147337457135662, -0.00313691390972682, 0.00420414781754861, -0.00452259064766115, 0.00407550490848953, -0.00297852418739545, 0.00144584773231541, 0.000252604806064951, -0.00183305970494043, 0.00303882692587738, -0.00368223176543769, 0.00368205553323452, -0.00307486795074808, 0.00199141479113902, -0.000624914356419156, -0.000789438358726737, 0.00200596171029875, -0.00282679776355894, 0.00314545751114248, -0.00293680845693849, 0.00224404412625381, -0.00120245611681834, 1.77045953512903e-05, 0.00111581359522666, -0.00202828111816043, 0.00255673945757552, -0.00262609008792679, 0.00227614166973697, -0.001553151925755, 0.000590517697227127, 0.000400814300903172, -0.00131740397630482, 0.00194976655578833, -0.00224932050767155, 0.00215106487072177, -0.00170339387299766, 0.000987318141293274, -0.000136307383289048, -0.000703995171329862, 0.00139470721484314, -0.00182557826986158, 0.00193577735389138, -0.0017182332247166, 0.0012208953657862, -0.000537412323716984, -0.000213204651942051, 0.000903636784131666, -0.00141941136947055, 0.00168142981457565, -0.00165457420243952, 0.00135035245685704, -0.00082703730798331, 0.000177243861779992, 0.00048919832776404, -0.00106022510930459, 0.00144108688137698, -0.00157163347813543, 0.00143242198489461, -0.00104708224195092, 0.000481446102129182, 0.00016844693190587, -0.000793277558568644, 0.00128520550195413, -0.00155552727159714, 0.00155187301218326, -0.00126549087075388, 0.000733607360266495, -3.95157445609976e-05, -0.000698344521044337, 0.00134470197403961, -0.0017661442856447, 0.00185521359183696, -0.00155560797988473, 0.000879261987031339, 8.24038520899489e-05, -0.00115696879379319, 0.00210619779589118, -0.00265797438795413, 0.00255949143627242, -0.00164712753588104, -7.11010582352003e-05, 0.00231412270593763, -0.00443217756170512, 0.00532022315150587, -0.00335337323801924, -0.0036412626808832, 0.0183555943030669, 0.0123322810088398]
-coefLPF49Hz=[0.00753528355484947, 0.0202449151110126, 0.00458269706875, -0.00891984622637859, 0.00595219168558483, -0.00161324021346937, -0.00174748627899836, 0.00350561505536909, -0.00380500367961761, 0.00307595561922166, -0.00179964028654428, 0.000387763997100591, 0.000855413935378538, -0.00174319640173496, 0.00219305619617949, -0.00220963292505403, 0.00186256243416237, -0.0012558474104519, 0.000514771251201563, 0.000242947985220406, -0.000908622988664351, 0.00140205321939832, -0.00167022209372764, 0.00169501965027492, -0.0014867763793864, 0.00108570673700534, -0.000552009382430499, -4.35609464651856e-05, 0.000624603723358264, -0.00111797536240914, 0.00146275440482239, -0.00161823440897086, 0.00156439340277342, -0.00130671117051738, 0.000876820294768162, -0.00032760886662765, -0.000273552719549841, 0.000852213116575101, -0.00133334444435053, 0.00165357773712318, -0.00176777376963716, 0.00165615984070008, -0.00132633057885988, 0.000815282022693701, -0.000182924453217658, -0.000495730382898138, 0.0011348812295332, -0.00165002276854814, 0.00196894309293615, -0.0020454227234562, 0.00185846527203037, -0.00142356269917767, 0.000786141460838278, -1.98946969165181e-05, -0.000783043108049403, 0.00151701150521359, -0.00208287435454943, 0.00240249221037373, -0.00242269745933004, 0.00212870880582591, -0.00154521003659382, 0.000734122336705972, 0.000208683927706593, -0.00116728775319364, 0.0020114710630673, -0.00264232561606382, 0.0029428110390152, -0.002899371877393, 0.00244520447076674, -0.00168298188243788, 0.000638715672110535, 0.000525426078734881, -0.00166876524669554, 0.00266812837021625, -0.00335218522022242, 0.00363197184765046, -0.00346513704944485, 0.00282854739908337, -0.00178947771505539, 0.000482460246437577, 0.000956681534762946, -0.00235344185288387, 0.00350232427999716, -0.00425296191990889, 0.00449652000288079, -0.00417063297155585, 0.00327457165902927, -0.00190994626402936, 0.000231552033808921, 0.00156795775030763, -0.00326542712226681, 0.00462574387150753, -0.00545350279646421, 0.00562131097108289, -0.00507229868090999, 0.00383105282713661, -0.0020161636325159, -0.000164418477774802, 0.00244743141673782, -0.00454873563069171, 0.00618883855191257, -0.00712424521834215, 0.00718533476074706, -0.00631102255037211, 0.00455855501629762, -0.00210074282910558, -0.000794675539856356, 0.00378749252068242, -0.00649821515336204, 0.00855153774375837, -0.00963287348272192, 0.00953599939898725, -0.00818679431641589, 0.00565756768461249, -0.00217316011264691, -0.00189338958570297, 0.0060637713095139, -0.00980823528504188, 0.0126082015222957, -0.0140142334571152, 0.0137107221170764, -0.0115597407059313, 0.00763046665831013, -0.00222135265545154, -0.00414895918159027, 0.0107871686944451, -0.0168900159108848, 0.0216082908088158, -0.0241343342641195, 0.0237963983905644, -0.0201195399008495, 0.012903059942471, -0.00224861139740598, -0.0114095922413686, 0.0273729864017474, -0.044663556662833, 0.062160149026473, -0.0786482496453268, 0.0929452729142275, -0.10399942538177, 0.110983279911063, 0.886626926871945, 0.110983279911063, -0.10399942538177, 0.0929452729142275, -0.0786482496453268, 0.062160149026473, -0.044663556662833, 0.0273729864017474, -0.0114095922413686, -0.00224861139740598, 0.012903059942471, -0.0201195399008495, 0.0237963983905644, -0.0241343342641195, 0.0216082908088158, -0.0168900159108848, 0.0107871686944451, -0.00414895918159027, -0.00222135265545154, 0.00763046665831013, -0.0115597407059313, 0.0137107221170764, -0.0140142334571152, 0.0126082015222957, -0.00980823528504188, 0.0060637713095139, -0.00189338958570297, -0.00217316011264691, 0.00565756768461249, -0.00818679431641589, 0.00953599939898725, -0.00963287348272192, 0.00855153774375837, -0.00649821515336204, 0.00378749252068242, -0.000794675539856356, -0.00210074282910558, 0.00455855501629762, -0.00631102255037211, 0.00718533476074706, -0.00712424521834215, 0.00618883855191257, -0.00454873563069171, 0.00244743141673782, -0.000164418477774802, -0.0020161636325159, 0.00383105282713661, -0.00507229868090999, 0.00562131097108289, -0.00545350279646421, 0.00462574387150753, -0.00326542712226681, 0.00156795775030763, 0.000231552033808921, -0.00190994626402936, 0.00327457165902927, -0.00417063297155585, 0.00449652000288079, -0.00425296191990889, 0.00350232427999716, -0.00235344185288387, 0.000956681534762946, 0.000482460246437577, -0.00178947771505539, 0.00282854739908337, -0.00346513704944485, 0.00363197184765046, -0.00335218522022242, 0.00266812837021625, -0.00166876524669554, 0.000525426078734881, 0.000638715672110535, -0.00168298188243788, 0.00244520447076674, -0.002899371877393, 0.0029428110390152, -0.00264232561606382, 0.0020114710630673, -0.00116728775319364, 0.000208683927706593, 0.000734122336705972, -0.00154521003659382, 0.00212870880582591, -0.00242269745933004, 0.00240249221037373, -0.00208287435454943, 0.00151701150521359, -0.000783043108049403, -1.98946969165181e-05, 0.000786141460838278, -0.00142356269917767, 0.00185846527203037, -0.0020454227234562, 0.00196894309293615, -0.00165002276854814, 0.0011348812295332, -0.000495730382898138, -0.000182924453217658, 0.000815282022693701, -0.00132633057885988, 0.00165615984070008, -0.00176777376963716, 0.00165357773712318, -0.00133334444435053, 0.000852213116575101, -0.000273552719549841, -0.00032760886662765, 0.000876820294768162, -0.00130671117051738, 0.00156439340277342, -0.00161823440897086, 0.00146275440482239, -0.00111797536240914, 0.000624603723358264, -4.35609464651856e-05, -0.000552009382430499, 0.00108570673700534, -0.0014867763793864, 0.00169501965027492, -0.00167022209372764, 0.00140205321939832, -0.000908622988664351, 0.000242947985220406, 0.000514771251201563, -0.0012558474104519, 0.00186256243416237, -0.00220963292505403, 0.00219305619617949, -0.00174319640173496, 0.000855413935378538, 0.000387763997100591, -0.00179964028654428, 0.00307595561922166, -0.00380500367961761, 0.00350561505536909, -0.00174748627899836, -0.00161324021346937, 0.00595219168558483, -0.00891984622637859, 0.00458269706875, 0.0202449151110126, 0.00753528355484947]
-coefLPF50Hz=[-0.014055281272872, -0.0187621243300897, 0.00594744002988936, 0.00108943591137015, -0.00420900764815394, 0.00483814400576867, -0.0040411159176888, 0.00257856472556377, -0.000968147612804411, -0.000464571016885659, 0.00154029988387264, -0.00218849040516548, 0.00241696571370555, -0.00227995256268391, 0.00186421584631857, -0.00126405324373871, 0.000575750043238393, 0.000114398992598322, -0.000733003445693353, 0.0012261399394762, -0.00155648832041053, 0.00170620143103922, -0.00167567100883188, 0.00147979603681623, -0.0011451017336256, 0.00070927039690001, -0.000216888474537744, -0.000287081952543737, 0.000758244218676692, -0.00115435909504463, 0.00144087148584733, -0.00159437790317889, 0.00160127779128188, -0.00145940994658635, 0.00118098442290112, -0.000790362047787384, 0.000319700392758014, 0.000190469548273806, -0.000694717216208091, 0.00114748969217436, -0.00150817140775593, 0.00173972283612873, -0.00181743444493835, 0.00172975397982456, -0.00148025201508313, 0.00108375611238731, -0.000572790592985523, -9.26614891796171e-06, 0.000612596300472372, -0.00118174516612661, 0.00166410590984637, -0.00201018547205889, 0.00218894213367979, -0.00216014649515357, 0.00195115178242048, -0.00151995370024031, 0.000968797989897714, -0.00027039847273501, -0.000469984375640606, 0.00118689970628187, -0.00184644952182937, 0.00235633306136079, -0.0026581025140798, 0.00274163463285356, -0.00257849833707755, 0.0021536157350255, -0.00151167956711176, 0.000709791889640016, 0.000195789509243329, -0.00113667329562637, 0.00201333823275368, -0.00273571775524435, 0.00323830658427882, -0.00347244078015686, 0.00339642560366373, -0.00299525822434151, 0.00229389372078559, -0.00135068454372481, 0.000242066986289987, 0.000944468413844824, -0.0021070285075196, 0.00313330402880179, -0.00391636744712133, 0.00437351584193157, -0.00445089689307525, 0.00412338799385364, -0.00339810635576266, 0.0023192457781876, -0.000966550524835439, -0.000548216882730671, 0.00209046054826793, -0.00351854756447141, 0.00469931213699361, -0.00551264856245588, 0.00586145096456812, -0.00568539653957292, 0.00497286514698076, -0.00375836367747829, 0.00212519735145915, -0.000200289722375145, -0.00185677657995491, 0.00386934329265743, -0.0056514520243479, 0.00702224037797528, -0.00783109636202512, 0.00796499366390168, -0.00736781779649533, 0.00604057436041044, -0.00406707790300318, 0.00156650752364844, 0.00125398805325274, -0.00417606115081396, 0.00693295172789233, -0.00926262848839546, 0.0109214986343028, -0.0116954126270056, 0.0114412401365699, -0.0100946858643914, 0.00767325225685336, -0.00429488378462782, 0.000175416480730844, 0.00440566816153372, -0.00907780227559308, 0.0134329260422686, -0.017044961128462, 0.0195022073299034, -0.0204270789916888, 0.0195222494201426, -0.0165897872013897, 0.0115456302841818, -0.00443567456460878, -0.00455562500431354, 0.0151172957348776, -0.0268295117079992, 0.0391747146132322, -0.0515668620538308, 0.0633940298821901, -0.0740590141249585, 0.083007613345482, -0.0897637430168088, 0.093965588246519, 0.90460895132687, 0.093965588246519, -0.0897637430168088, 0.083007613345482, -0.0740590141249585, 0.0633940298821901, -0.0515668620538308, 0.0391747146132322, -0.0268295117079992, 0.0151172957348776, -0.00455562500431354, -0.00443567456460878, 0.0115456302841818, -0.0165897872013897, 0.0195222494201426, -0.0204270789916888, 0.0195022073299034, -0.017044961128462, 0.0134329260422686, -0.00907780227559308, 0.00440566816153372, 0.000175416480730844, -0.00429488378462782, 0.00767325225685336, -0.0100946858643914, 0.0114412401365699, -0.0116954126270056, 0.0109214986343028, -0.00926262848839546, 0.00693295172789233, -0.00417606115081396, 0.00125398805325274, 0.00156650752364844, -0.00406707790300318, 0.00604057436041044, -0.00736781779649533, 0.00796499366390168, -0.00783109636202512, 0.00702224037797528, -0.0056514520243479, 0.00386934329265743, -0.00185677657995491, -0.000200289722375145, 0.00212519735145915, -0.00375836367747829, 0.00497286514698076, -0.00568539653957292, 0.00586145096456812, -0.00551264856245588, 0.00469931213699361, -0.00351854756447141, 0.00209046054826793, -0.000548216882730671, -0.000966550524835439, 0.0023192457781876, -0.00339810635576266, 0.00412338799385364, -0.00445089689307525, 0.00437351584193157, -0.00391636744712133, 0.00313330402880179, -0.0021070285075196, 0.000944468413844824, 0.000242066986289987, -0.00135068454372481, 0.00229389372078559, -0.00299525822434151, 0.00339642560366373, -0.00347244078015686, 0.00323830658427882, -0.00273571775524435, 0.00201333823275368, -0.00113667329562637, 0.000195789509243329, 0.000709791889640016, -0.00151167956711176, 0.0021536157350255, -0.00257849833707755, 0.00274163463285356, -0.0026581025140798, 0.00235633306136079, -0.00184644952182937, 0.00118689970628187, -0.000469984375640606, -0.00027039847273501, 0.000968797989897714, -0.00151995370024031, 0.00195115178242048, -0.00216014649515357, 0.00218894213367979, -0.00201018547205889, 0.00166410590984637, -0.00118174516612661, 0.000612596300472372, -9.26614891796171e-06, -0.000572790592985523, 0.00108375611238731, -0.00148025201508313, 0.00172975397982456, -0.00181743444493835, 0.00173972283612873, -0.00150817140775593, 0.00114748969217436, -0.000694717216208091, 0.000190469548273806, 0.000319700392758014, -0.000790362047787384, 0.00118098442290112, -0.00145940994658635, 0.00160127779128188, -0.00159437790317889, 0.00144087148584733, -0.00115435909504463, 0.000758244218676692, -0.000287081952543737, -0.000216888474537744, 0.00070927039690001, -0.0011451017336256, 0.00147979603681623, -0.00167567100883188, 0.00170620143103922, -0.00155648832041053, 0.0012261399394762, -0.000733003445693353, 0.000114398992598322, 0.000575750043238393, -0.00126405324373871, 0.00186421584631857, -0.00227995256268391, 0.00241696571370555, -0.00218849040516548, 0.00154029988387264, -0.000464571016885659, -0.000968147612804411, 0.00257856472556377, -0.0040411159176888, 0.00483814400576867, -0.00420900764815394, 0.00108943591137015, 0.00594744002988936, -0.0187621243300897, -0.014055281272872]
-coefHPF1Hz=[0.0126953505354668, -0.00213178615526062, -0.00196422473847171, -0.00181083482269189, -0.00167220558462628, -0.00154430319458497, -0.00142814196628175, -0.00131956850387113, -0.00121960578355321, -0.0011245731413451, -0.00103579890382873, -0.000949087965268235, -0.000866418985090272, -0.000784272075391706, -0.000703986789279248, -0.000622917349969141, -0.000542160296317075, -0.000459241517801905, -0.000376077658711678, -0.00028993959017384, -0.00020348411678504, -0.000113790412704761, -2.38814762691594e-05, 6.91614892550561e-05, 0.000161745195934934, 0.000256860967918834, 0.000350276062123679, 0.000445165453245009, 0.000537108412068374, 0.000629073923957016, 0.000716679837174004, 0.000802597455116926, 0.00088193660163829, 0.000958230212130545, 0.00102530713565941, 0.00108838597676913, 0.00113980831179356, 0.00118612348930956, 0.00121739860613881, 0.00124436235221566, 0.0012502349761204, 0.00125905319372826, 0.00123727137521013, 0.00120762265489855, 0.00118171603689494, 0.00112141506919868, 0.00105130657178137, 0.000966334954299548, 0.000875178445735724, 0.000768628700342577, 0.000650371719833452, 0.000515626281977248, 0.000370546248728054, 0.000213514972180013, 4.90625845167638e-05, -0.000123018495028934, -0.000300018751522104, -0.000482747495824905, -0.000668009911263913, -0.000856752847125541, -0.00104475685126849, -0.00123219867021832, -0.0014148112066059, -0.00159222974167494, -0.00176052264219783, -0.00191921484809602, -0.00206464403804305, -0.0021962459448753, -0.0023109943289222, -0.00240811687059367, -0.0024853706140595, -0.00254182915109888, -0.00257534350574094, -0.0025853730231593, -0.00256941137218082, -0.00252778456252021, -0.00245826383551065, -0.00236161639487763, -0.00223634811679451, -0.00208352915972871, -0.00190179843973664, -0.00169336114759488, -0.00145791374167077, -0.00119638095674203, -0.00091464249925406, -0.00060375347311695, -0.000278345129528471, 6.58573837966761e-05, 0.000428033819425389, 0.000803167532010436, 0.00118706756043682, 0.00157703815778348, 0.00197116731644807, 0.00236621444185297, 0.00275820841919636, 0.00314132047818997, 0.00351291174040126, 0.00386894365168667, 0.00420506547448212, 0.00451854478689857, 0.00480379811831766, 0.00505742068807482, 0.00527459862255045, 0.00545162946473588, 0.00558491844284849, 0.0056712048969731, 0.00570739223798071, 0.00569029664969703, 0.0056172526912567, 0.00548516239463008, 0.00529227521662725, 0.0050363657813178, 0.00471641153836523, 0.00433147719297497, 0.00388082831118682, 0.00336458671388914, 0.00278280948511035, 0.00213625896934378, 0.00142644319046285, 0.000654572726636628, -0.000176791752411987, -0.00106585366582912, -0.00200895506957567, -0.00300413823493655, -0.00404509652047501, -0.00513066179614664, -0.00625266296360216, -0.00740867397348118, -0.00859472370116297, -0.0098009766988484, -0.0110251223036795, -0.0122603590868685, -0.0135008615193883, -0.0147391356145986, -0.0159696765747657, -0.0171858153013586, -0.0183822617923605, -0.0195512835803866, -0.0206851742563002, -0.0217804614264617, -0.0228292606437544, -0.0238266287125742, -0.024767034792124, -0.0256441200496612, -0.0264540952771705, -0.0271914184790609, -0.0278529424641263, -0.0284340745585943, -0.0289322139918073, -0.0293433771907657, -0.0296659118652422, -0.0298972099041794, -0.0300365494123122, 0.969916973203186, -0.0300365494123122, -0.0298972099041794, -0.0296659118652422, -0.0293433771907657, -0.0289322139918073, -0.0284340745585943, -0.0278529424641263, -0.0271914184790609, -0.0264540952771705, -0.0256441200496612, -0.024767034792124, -0.0238266287125742, -0.0228292606437544, -0.0217804614264617, -0.0206851742563002, -0.0195512835803866, -0.0183822617923605, -0.0171858153013586, -0.0159696765747657, -0.0147391356145986, -0.0135008615193883, -0.0122603590868685, -0.0110251223036795, -0.0098009766988484, -0.00859472370116297, -0.00740867397348118, -0.00625266296360216, -0.00513066179614664, -0.00404509652047501, -0.00300413823493655, -0.00200895506957567, -0.00106585366582912, -0.000176791752411987, 0.000654572726636628, 0.00142644319046285, 0.00213625896934378, 0.00278280948511035, 0.00336458671388914, 0.00388082831118682, 0.00433147719297497, 0.00471641153836523, 0.0050363657813178, 0.00529227521662725, 0.00548516239463008, 0.0056172526912567, 0.00569029664969703, 0.00570739223798071, 0.0056712048969731, 0.00558491844284849, 0.00545162946473588, 0.00527459862255045, 0.00505742068807482, 0.00480379811831766, 0.00451854478689857, 0.00420506547448212, 0.00386894365168667, 0.00351291174040126, 0.00314132047818997, 0.00275820841919636, 0.00236621444185297, 0.00197116731644807, 0.00157703815778348, 0.00118706756043682, 0.000803167532010436, 0.000428033819425389, 6.58573837966761e-05, -0.000278345129528471, -0.00060375347311695, -0.00091464249925406, -0.00119638095674203, -0.00145791374167077, -0.00169336114759488, -0.00190179843973664, -0.00208352915972871, -0.00223634811679451, -0.00236161639487763, -0.00245826383551065, -0.00252778456252021, -0.00256941137218082, -0.0025853730231593, -0.00257534350574094, -0.00254182915109888, -0.0024853706140595, -0.00240811687059367, -0.0023109943289222, -0.0021962459448753, -0.00206464403804305, -0.00191921484809602, -0.00176052264219783, -0.00159222974167494, -0.0014148112066059, -0.00123219867021832, -0.00104475685126849, -0.000856752847125541, -0.000668009911263913, -0.000482747495824905, -0.000300018751522104, -0.000123018495028934, 4.90625845167638e-05, 0.000213514972180013, 0.000370546248728054, 0.000515626281977248, 0.000650371719833452, 0.000768628700342577, 0.000875178445735724, 0.000966334954299548, 0.00105130657178137, 0.00112141506919868, 0.00118171603689494, 0.00120762265489855, 0.00123727137521013, 0.00125905319372826, 0.0012502349761204, 0.00124436235221566, 0.00121739860613881, 0.00118612348930956, 0.00113980831179356, 0.00108838597676913, 0.00102530713565941, 0.000958230212130545, 0.00088193660163829, 0.000802597455116926, 0.000716679837174004, 0.000629073923957016, 0.000537108412068374, 0.000445165453245009, 0.000350276062123679, 0.000256860967918834, 0.000161745195934934, 6.91614892550561e-05, -2.38814762691594e-05, -0.000113790412704761, -0.00020348411678504, -0.00028993959017384, -0.000376077658711678, -0.000459241517801905, -0.000542160296317075, -0.000622917349969141, -0.000703986789279248, -0.000784272075391706, -0.000866418985090272, -0.000949087965268235, -0.00103579890382873, -0.0011245731413451, -0.00121960578355321, -0.00131956850387113, -0.00142814196628175, -0.00154430319458497, -0.00167220558462628, -0.00181083482269189, -0.00196422473847171, -0.00213178615526062, 0.0126953505354668]
-coefHPF2Hz=[0.00331647449782467, -0.0139400182744929, 0.000675922591316195, 0.00350403859310997, 0.00353164018031333, 0.00295528962783163, 0.00230773257074429, 0.00171139551533248, 0.00118902710440133, 0.000738210542730012, 0.000353862676163122, 2.79958416530553e-05, -0.000245390153700653, -0.000471709663538885, -0.000655749592541755, -0.000801873964222357, -0.00091293943552743, -0.000992599107833961, -0.00104197517753651, -0.00106357536094175, -0.00105948841308953, -0.00103081797139174, -0.000978935290139822, -0.000906024992603984, -0.000812386967737758, -0.000701140728767403, -0.000573572322654088, -0.000432035640185653, -0.00027904728307739, -0.000115663169668716, 5.31727945583745e-05, 0.000224865638162473, 0.000394913271347479, 0.000560919356467126, 0.000718823126849865, 0.00086437353242467, 0.000993834233156441, 0.0011034330764147, 0.00119121967759637, 0.00125278991051029, 0.00128689574820099, 0.00128964070904678, 0.00126215866897632, 0.0012015130679678, 0.00111015835257817, 0.000985834442077817, 0.000833157379645785, 0.000652395525799246, 0.000449003372947942, 0.000224661097478466, -1.41753021310062e-05, -0.000264047064827927, -0.000516991076591826, -0.000770391946057401, -0.00101481398171756, -0.00124643994116696, -0.00145555311604935, -0.00163982751667696, -0.00179041249582173, -0.00190547337207239, -0.00197554658103738, -0.00200316869972021, -0.00198031883209022, -0.00191102289531814, -0.00178727179603353, -0.00161826143444657, -0.00139638895400352, -0.00113553951881323, -0.000829602980640828, -0.000491322566927452, -0.000130349297490186, 0.000264638858277116, 0.000648791686951939, 0.00105857493552958, 0.00144570623678498, 0.00181793310742076, 0.0021705798412075, 0.00248075930289729, 0.00273849700182565, 0.00295317471589026, 0.00310092927354662, 0.00317554249147193, 0.00317868983048939, 0.00311125676698972, 0.00295896229436416, 0.00272433840104772, 0.00241483135016, 0.00203846975982232, 0.00158954410892038, 0.00107739181636816, 0.000515522295229061, -8.16205897945413e-05, -0.000706908039842065, -0.00134826371094328, -0.00199294905984829, -0.00261670609540958, -0.00320694238520444, -0.00374906155012766, -0.00423130249892453, -0.0046392336765549, -0.00495409945422874, -0.0051638933884446, -0.00525750034889014, -0.00523088768803742, -0.00507874332708999, -0.00479725521311291, -0.00438327965247407, -0.0038382261351396, -0.00316890469233794, -0.0023852129530158, -0.00150116302603914, -0.000529792425814628, 0.000511772307916619, 0.00160662711175718, 0.0027309156430165, 0.00386105761706747, 0.00496849256313022, 0.00602854396199647, 0.00701266286291048, 0.00789521731811695, 0.00864781454127425, 0.00924631026590134, 0.0096653727437163, 0.00988396288515237, 0.00987868646713671, 0.00963300103010119, 0.00913113986980422, 0.00836657757617167, 0.0073321107251423, 0.00602804109369679, 0.00445334120754329, 0.00261916910239963, 0.000534293630412554, -0.00178147295495587, -0.00431354560774739, -0.00703221635772883, -0.00991350587867704, -0.0129186791015364, -0.0160209995441211, -0.0191778781604706, -0.02235229661108, -0.0255047294890655, -0.0285915962072735, -0.0315805374396568, -0.0344220190151264, -0.0370823815435738, -0.0395267947874191, -0.041718053127291, -0.0436263342124114, -0.0452261308825129, -0.0464930100371626, -0.047411965155245, -0.0479680334197467, 0.951846087533309, -0.0479680334197467, -0.047411965155245, -0.0464930100371626, -0.0452261308825129, -0.0436263342124114, -0.041718053127291, -0.0395267947874191, -0.0370823815435738, -0.0344220190151264, -0.0315805374396568, -0.0285915962072735, -0.0255047294890655, -0.02235229661108, -0.0191778781604706, -0.0160209995441211, -0.0129186791015364, -0.00991350587867704, -0.00703221635772883, -0.00431354560774739, -0.00178147295495587, 0.000534293630412554, 0.00261916910239963, 0.00445334120754329, 0.00602804109369679, 0.0073321107251423, 0.00836657757617167, 0.00913113986980422, 0.00963300103010119, 0.00987868646713671, 0.00988396288515237, 0.0096653727437163, 0.00924631026590134, 0.00864781454127425, 0.00789521731811695, 0.00701266286291048, 0.00602854396199647, 0.00496849256313022, 0.00386105761706747, 0.0027309156430165, 0.00160662711175718, 0.000511772307916619, -0.000529792425814628, -0.00150116302603914, -0.0023852129530158, -0.00316890469233794, -0.0038382261351396, -0.00438327965247407, -0.00479725521311291, -0.00507874332708999, -0.00523088768803742, -0.00525750034889014, -0.0051638933884446, -0.00495409945422874, -0.0046392336765549, -0.00423130249892453, -0.00374906155012766, -0.00320694238520444, -0.00261670609540958, -0.00199294905984829, -0.00134826371094328, -0.000706908039842065, -8.16205897945413e-05, 0.000515522295229061, 0.00107739181636816, 0.00158954410892038, 0.00203846975982232, 0.00241483135016, 0.00272433840104772, 0.00295896229436416, 0.00311125676698972, 0.00317868983048939, 0.00317554249147193, 0.00310092927354662, 0.00295317471589026, 0.00273849700182565, 0.00248075930289729, 0.0021705798412075, 0.00181793310742076, 0.00144570623678498, 0.00105857493552958, 0.000648791686951939, 0.000264638858277116, -0.000130349297490186, -0.000491322566927452, -0.000829602980640828, -0.00113553951881323, -0.00139638895400352, -0.00161826143444657, -0.00178727179603353, -0.00191102289531814, -0.00198031883209022, -0.00200316869972021, -0.00197554658103738, -0.00190547337207239, -0.00179041249582173, -0.00163982751667696, -0.00145555311604935, -0.00124643994116696, -0.00101481398171756, -0.000770391946057401, -0.000516991076591826, -0.000264047064827927, -1.41753021310062e-05, 0.000224661097478466, 0.000449003372947942, 0.000652395525799246, 0.000833157379645785, 0.000985834442077817, 0.00111015835257817, 0.0012015130679678, 0.00126215866897632, 0.00128964070904678, 0.00128689574820099, 0.00125278991051029, 0.00119121967759637, 0.0011034330764147, 0.000993834233156441, 0.00086437353242467, 0.000718823126849865, 0.000560919356467126, 0.000394913271347479, 0.000224865638162473, 5.31727945583745e-05, -0.000115663169668716, -0.00027904728307739, -0.000432035640185653, -0.000573572322654088, -0.000701140728767403, -0.000812386967737758, -0.000906024992603984, -0.000978935290139822, -0.00103081797139174, -0.00105948841308953, -0.00106357536094175, -0.00104197517753651, -0.000992599107833961, -0.00091293943552743, -0.000801873964222357, -0.000655749592541755, -0.000471709663538885, -0.000245390153700653, 2.79958416530553e-05, 0.000353862676163122, 0.000738210542730012, 0.00118902710440133, 0.00171139551533248, 0.00230773257074429, 0.00295528962783163, 0.00353164018031333, 0.00350403859310997, 0.000675922591316195, -0.0139400182744929, 0.00331647449782467]
-coefHPF3Hz=[-0.000689917048518801, 0.0131208193176048, -0.00674310671703746, -0.00551325386577732, -0.0035895336363878, -0.00202209731609848, -0.000811637759788575, 8.80838135820543e-05, 0.000727709934386825, 0.00114782125768765, 0.00139004143065106, 0.00148516755706393, 0.00146530431786211, 0.00135436203466013, 0.00117794217655487, 0.00095331560069818, 0.000700297748560186, 0.000429738159409563, 0.000157180651323568, -0.000108136875936976, -0.00035384762953718, -0.000574951051206107, -0.000761897805532275, -0.000911701152252633, -0.00101586704901597, -0.00107488474925239, -0.00108451500685702, -0.00104647476904324, -0.00096102167253663, -0.000831904381177632, -0.000664840500292211, -0.000465203597199179, -0.000239948065738645, 6.10864574105366e-07, 0.0002486154189606, 0.000490663293555841, 0.000720650832895318, 0.000923907638684427, 0.001092461623904, 0.00121738777270119, 0.00129308976518568, 0.00131055407424066, 0.00127071056404839, 0.00117092095578245, 0.0010145071991633, 0.00080416617430636, 0.00055059389630132, 0.000259611555818091, -5.49067754736858e-05, -0.000380672629259716, -0.000702668548106715, -0.00100854719809133, -0.0012785674838705, -0.0015043962352286, -0.00167068597417873, -0.00176715653281229, -0.00178839139062286, -0.00172800041807523, -0.00158650840848605, -0.00136558565188284, -0.00107134040380919, -0.000716280607807121, -0.000310398417511884, 0.000125999729130417, 0.000578247900648294, 0.0010224323140008, 0.00144207382883986, 0.00181374561932016, 0.00212149676033799, 0.0023447145810869, 0.0024732411680455, 0.00249311023844923, 0.00240235398334253, 0.00219611869959788, 0.00188277805312744, 0.00146811132257677, 0.000969667080147078, 0.000401370120096902, -0.000208988750839065, -0.000841043196870612, -0.00146223083941996, -0.00204788757414365, -0.00256925559938932, -0.00299221454137953, -0.00331522426917346, -0.00348015058742546, -0.00352239165845722, -0.00339044792871205, -0.00309680360126265, -0.00266318412059762, -0.00207972645477051, -0.00136833710698396, -0.000569602817719058, 0.000291512643484303, 0.00119159848393182, 0.00208409567913644, 0.0029209614208656, 0.0036651590943609, 0.00428798929396854, 0.00475288426046532, 0.00502708961591294, 0.00508425323728486, 0.00491564836111999, 0.00451948633486242, 0.00390231070612419, 0.00307409064897789, 0.00206034251854538, 0.000893943305961819, -0.000376599834397271, -0.00170120680708204, -0.00302405874237267, -0.00429002174828178, -0.00544219413445223, -0.00642070287154672, -0.0071691604413155, -0.00763944154847659, -0.0077943297401692, -0.00761072054880463, -0.00707124153680553, -0.00617754480520449, -0.00494197674956007, -0.00339683648089624, -0.00158399607297273, 0.000437686327345514, 0.00259603539681412, 0.00480410575812524, 0.00697571139842393, 0.00901403113838973, 0.0108198489040203, 0.0122951150267081, 0.0133525723815118, 0.0139032276920942, 0.0138722611528328, 0.0132030714667648, 0.0118546192150857, 0.00979878167156205, 0.00704219886736362, 0.00360204519478733, -0.000482114306981141, -0.00513813170180059, -0.0102932701355425, -0.0158384050773801, -0.0216613008488116, -0.0276318341975715, -0.0336113900732246, -0.0394602073236606, -0.0450311102434247, -0.0501894206074236, -0.054800798197105, -0.058750240355349, -0.0619324359025996, -0.0642679038319717, -0.0656928377818627, 0.933826819674416, -0.0656928377818627, -0.0642679038319717, -0.0619324359025996, -0.058750240355349, -0.054800798197105, -0.0501894206074236, -0.0450311102434247, -0.0394602073236606, -0.0336113900732246, -0.0276318341975715, -0.0216613008488116, -0.0158384050773801, -0.0102932701355425, -0.00513813170180059, -0.000482114306981141, 0.00360204519478733, 0.00704219886736362, 0.00979878167156205, 0.0118546192150857, 0.0132030714667648, 0.0138722611528328, 0.0139032276920942, 0.0133525723815118, 0.0122951150267081, 0.0108198489040203, 0.00901403113838973, 0.00697571139842393, 0.00480410575812524, 0.00259603539681412, 0.000437686327345514, -0.00158399607297273, -0.00339683648089624, -0.00494197674956007, -0.00617754480520449, -0.00707124153680553, -0.00761072054880463, -0.0077943297401692, -0.00763944154847659, -0.0071691604413155, -0.00642070287154672, -0.00544219413445223, -0.00429002174828178, -0.00302405874237267, -0.00170120680708204, -0.000376599834397271, 0.000893943305961819, 0.00206034251854538, 0.00307409064897789, 0.00390231070612419, 0.00451948633486242, 0.00491564836111999, 0.00508425323728486, 0.00502708961591294, 0.00475288426046532, 0.00428798929396854, 0.0036651590943609, 0.0029209614208656, 0.00208409567913644, 0.00119159848393182, 0.000291512643484303, -0.000569602817719058, -0.00136833710698396, -0.00207972645477051, -0.00266318412059762, -0.00309680360126265, -0.00339044792871205, -0.00352239165845722, -0.00348015058742546, -0.00331522426917346, -0.00299221454137953, -0.00256925559938932, -0.00204788757414365, -0.00146223083941996, -0.000841043196870612, -0.000208988750839065, 0.000401370120096902, 0.000969667080147078, 0.00146811132257677, 0.00188277805312744, 0.00219611869959788, 0.00240235398334253, 0.00249311023844923, 0.0024732411680455, 0.0023447145810869, 0.00212149676033799, 0.00181374561932016, 0.00144207382883986, 0.0010224323140008, 0.000578247900648294, 0.000125999729130417, -0.000310398417511884, -0.000716280607807121, -0.00107134040380919, -0.00136558565188284, -0.00158650840848605, -0.00172800041807523, -0.00178839139062286, -0.00176715653281229, -0.00167068597417873, -0.0015043962352286, -0.0012785674838705, -0.00100854719809133, -0.000702668548106715, -0.000380672629259716, -5.49067754736858e-05, 0.000259611555818091, 0.00055059389630132, 0.00080416617430636, 0.0010145071991633, 0.00117092095578245, 0.00127071056404839, 0.00131055407424066, 0.00129308976518568, 0.00121738777270119, 0.001092461623904, 0.000923907638684427, 0.000720650832895318, 0.000490663293555841, 0.0002486154189606, 6.10864574105366e-07, -0.000239948065738645, -0.000465203597199179, -0.000664840500292211, -0.000831904381177632, -0.00096102167253663, -0.00104647476904324, -0.00108451500685702, -0.00107488474925239, -0.00101586704901597, -0.000911701152252633, -0.000761897805532275, -0.000574951051206107, -0.00035384762953718, -0.000108136875936976, 0.000157180651323568, 0.000429738159409563, 0.000700297748560186, 0.00095331560069818, 0.00117794217655487, 0.00135436203466013, 0.00146530431786211, 0.00148516755706393, 0.00139004143065106, 0.00114782125768765, 0.000727709934386825, 8.80838135820543e-05, -0.000811637759788575, -0.00202209731609848, -0.0035895336363878, -0.00551325386577732, -0.00674310671703746, 0.0131208193176048, -0.000689917048518801]
-coefHPF4Hz=[-0.0114635406039293, 0.00956353769950997, 0.00540383250861613, 0.00238269000870601, 0.000305954278272649, -0.00100911006990453, -0.00172492074232764, -0.00198725707267065, -0.00192218983627072, -0.00163620757125334, -0.00121674717029381, -0.00073695741221067, -0.000251280242563803, 0.00019655111068988, 0.000578097137340166, 0.000871445565290802, 0.00106716703060692, 0.0011610476644087, 0.001157454816854, 0.00106369528650477, 0.000893522394459619, 0.000661485956194281, 0.000387081143510395, 8.93282673989233e-05, -0.000210382305525945, -0.000492739274935081, -0.000737951254147546, -0.000931000992426295, -0.00105789011071404, -0.00111042230364825, -0.00108282247373548, -0.00097691735256991, -0.000798041523620122, -0.000558144643049782, -0.000270833678214826, 4.36753759570441e-05, 0.000365235031929688, 0.000670046052218952, 0.000937087388779288, 0.00114431551379831, 0.00127713346021272, 0.0013205052191527, 0.00127083420872582, 0.00112439720525076, 0.0008928381984652, 0.000583672387395968, 0.000223313762345837, -0.00017525269721173, -0.000565079928400368, -0.000951405423404398, -0.00125840854617561, -0.0015078846836936, -0.00165344446849152, -0.00167056439964312, -0.00158415326217512, -0.00137491663153264, -0.00104629131193413, -0.00062899254483435, -0.000155984613148704, 0.000354853357503106, 0.000866949142283906, 0.00133906859320288, 0.00172753070151832, 0.00200838786546036, 0.00215889654027656, 0.00216206699018261, 0.0020041663933205, 0.00168973576460628, 0.00123736512296304, 0.000678260518633334, 4.5549646105002e-05, -0.000620697126484019, -0.0012756525294097, -0.00186855157419664, -0.00235164317755058, -0.00268343470288185, -0.00283534159884394, -0.00278897804751959, -0.00253997121034258, -0.00209551956858673, -0.00147787258148611, -0.000721975883390715, 0.000122452716930924, 0.000997693944618001, 0.00183998319393843, 0.00258851811411568, 0.00318517603562464, 0.00358115414495179, 0.00373728192335105, 0.00363213955125862, 0.00325747295020383, 0.00262846705432527, 0.00177640265344064, 0.000755694043077879, -0.000371325019414603, -0.00152474217071773, -0.00262864095778176, -0.00359528350403668, -0.00435775727830574, -0.00484009429126113, -0.00499963665716063, -0.00480858902647635, -0.00425362915174697, -0.00336643381574239, -0.00218665251242562, -0.000782185428647245, 0.000753287813404995, 0.00231805767330642, 0.00380769471021531, 0.00510468627597018, 0.00610895568529793, 0.00673231041054465, 0.00690769797354273, 0.00659234396357561, 0.00577955801826908, 0.00449887092049839, 0.002810594551603, 0.000807029440901411, -0.00138941970709804, -0.00363323919125995, -0.00576873479821089, -0.0076383486697273, -0.00909169301227936, -0.009993259877833, -0.0102362417619108, -0.00975301802243168, -0.00852072249476993, -0.00656356591191296, -0.00395568471806895, -0.000822213426152508, 0.00266419468018679, 0.00629259106173297, 0.00982575643045457, 0.013009661954495, 0.0155862932611379, 0.0173081723047294, 0.0179560590551466, 0.0173512754032491, 0.0153681191307912, 0.0119396916260506, 0.00707007501915007, 0.00083327244911445, -0.00662381105554548, -0.015088906501049, -0.024285857261305, -0.0338959431904258, -0.0435652215978453, -0.0529265278817958, -0.0616084085720862, -0.0692608020576295, -0.0755737427924405, -0.0802780188684087, -0.0831834240950322, 0.915833490160729, -0.0831834240950322, -0.0802780188684087, -0.0755737427924405, -0.0692608020576295, -0.0616084085720862, -0.0529265278817958, -0.0435652215978453, -0.0338959431904258, -0.024285857261305, -0.015088906501049, -0.00662381105554548, 0.00083327244911445, 0.00707007501915007, 0.0119396916260506, 0.0153681191307912, 0.0173512754032491, 0.0179560590551466, 0.0173081723047294, 0.0155862932611379, 0.013009661954495, 0.00982575643045457, 0.00629259106173297, 0.00266419468018679, -0.000822213426152508, -0.00395568471806895, -0.00656356591191296, -0.00852072249476993, -0.00975301802243168, -0.0102362417619108, -0.009993259877833, -0.00909169301227936, -0.0076383486697273, -0.00576873479821089, -0.00363323919125995, -0.00138941970709804, 0.000807029440901411, 0.002810594551603, 0.00449887092049839, 0.00577955801826908, 0.00659234396357561, 0.00690769797354273, 0.00673231041054465, 0.00610895568529793, 0.00510468627597018, 0.00380769471021531, 0.00231805767330642, 0.000753287813404995, -0.000782185428647245, -0.00218665251242562, -0.00336643381574239, -0.00425362915174697, -0.00480858902647635, -0.00499963665716063, -0.00484009429126113, -0.00435775727830574, -0.00359528350403668, -0.00262864095778176, -0.00152474217071773, -0.000371325019414603, 0.000755694043077879, 0.00177640265344064, 0.00262846705432527, 0.00325747295020383, 0.00363213955125862, 0.00373728192335105, 0.00358115414495179, 0.00318517603562464, 0.00258851811411568, 0.00183998319393843, 0.000997693944618001, 0.000122452716930924, -0.000721975883390715, -0.00147787258148611, -0.00209551956858673, -0.00253997121034258, -0.00278897804751959, -0.00283534159884394, -0.00268343470288185, -0.00235164317755058, -0.00186855157419664, -0.0012756525294097, -0.000620697126484019, 4.5549646105002e-05, 0.000678260518633334, 0.00123736512296304, 0.00168973576460628, 0.0020041663933205, 0.00216206699018261, 0.00215889654027656, 0.00200838786546036, 0.00172753070151832, 0.00133906859320288, 0.000866949142283906, 0.000354853357503106, -0.000155984613148704, -0.00062899254483435, -0.00104629131193413, -0.00137491663153264, -0.00158415326217512, -0.00167056439964312, -0.00165344446849152, -0.0015078846836936, -0.00125840854617561, -0.000951405423404398, -0.000565079928400368, -0.00017525269721173, 0.000223313762345837, 0.000583672387395968, 0.0008928381984652, 0.00112439720525076, 0.00127083420872582, 0.0013205052191527, 0.00127713346021272, 0.00114431551379831, 0.000937087388779288, 0.000670046052218952, 0.000365235031929688, 4.36753759570441e-05, -0.000270833678214826, -0.000558144643049782, -0.000798041523620122, -0.00097691735256991, -0.00108282247373548, -0.00111042230364825, -0.00105789011071404, -0.000931000992426295, -0.000737951254147546, -0.000492739274935081, -0.000210382305525945, 8.93282673989233e-05, 0.000387081143510395, 0.000661485956194281, 0.000893522394459619, 0.00106369528650477, 0.001157454816854, 0.0011610476644087, 0.00106716703060692, 0.000871445565290802, 0.000578097137340166, 0.00019655111068988, -0.000251280242563803, -0.00073695741221067, -0.00121674717029381, -0.00163620757125334, -0.00192218983627072, -0.00198725707267065, -0.00172492074232764, -0.00100911006990453, 0.000305954278272649, 0.00238269000870601, 0.00540383250861613, 0.00956353769950997, -0.0114635406039293]
-coefHPF5Hz=[0.0102232036784198, -0.01196338116942, -0.00462594343058113, -0.000199910730389145, 0.00208524900481501, 0.0028788678167616, 0.00271531114945385, 0.00201265224013278, 0.00108857685313709, 0.000164364701754363, -0.000613533314957006, -0.001166480118984, -0.00146354435419646, -0.00151460364623425, -0.00135461282772847, -0.00103478017572377, -0.000613984387253704, -0.000153542699833291, 0.000292859696150531, 0.000676795451039283, 0.000963381391008264, 0.00112809158969443, 0.00116166092114457, 0.00106583287047403, 0.000856094296852146, 0.000556698872788244, 0.000201620096166931, -0.00017426638973654, -0.000530373100267651, -0.000832586414561575, -0.00104846562132157, -0.00115593428007158, -0.00114178427080509, -0.00100800218219526, -0.000763180358599218, -0.000433054649469524, -4.6652371792183e-05, 0.000354278379084863, 0.000731163985424298, 0.00104116260654277, 0.00125243068618093, 0.00133565545607468, 0.00128220602830355, 0.00108693972111121, 0.00077239696555511, 0.0003592764038449, -0.000104853620586416, -0.000581137804613158, -0.00100914745096369, -0.00135438798227106, -0.00155971569802051, -0.00162048654535347, -0.00149386191098694, -0.00121996500090474, -0.000792353128483015, -0.000258867847385428, 0.000307463570743613, 0.000890114948991391, 0.00138854409978108, 0.00175933889880358, 0.00196693788730915, 0.00197678877662147, 0.00176357228398161, 0.0013594587022928, 0.000795422527402943, 0.000119705812527561, -0.000607822225868751, -0.00129790708366592, -0.00187853588365358, -0.00228596780801801, -0.00247463739863836, -0.00240612442959817, -0.00207593216525497, -0.00150608458596273, -0.000754743605203283, 0.00011019697912538, 0.0010040163378685, 0.00183754115776383, 0.00251354979992932, 0.00295195372748512, 0.00309425254120324, 0.00291667558585633, 0.00242216598057967, 0.00164999864607735, 0.000663530925023569, -0.000442019879257152, -0.00155366502057888, -0.00255193075145588, -0.0033269627265628, -0.00378568923316463, -0.00386832119500283, -0.00354566867839464, -0.00283153650562237, -0.00178122875497024, -0.000488378643632756, 0.000920414167639204, 0.00230244152837443, 0.00351007796549146, 0.00440675702894809, 0.00488477307596904, 0.00487089897478684, 0.0043414007140855, 0.00332285855937303, 0.00189725157910105, 0.000191890418285118, -0.00162297734350994, -0.00337021656996273, -0.00485086640152489, -0.00590990576517073, -0.00639691763823218, -0.00623914896554644, -0.0054113377301389, -0.00395877547050947, -0.00199687303904999, 0.000295626445515861, 0.00270593565654324, 0.00498033040706235, 0.00687496172315813, 0.008165893672915, 0.00867794718103357, 0.00829958531977344, 0.00701351117346388, 0.00488673211892458, 0.00207931755750707, -0.00116902218503775, -0.00454720175258045, -0.00771672096061846, -0.0103277129938156, -0.0120593583426823, -0.0126501387982004, -0.0119381383813136, -0.00987216769190495, -0.00653455211654056, -0.00213659745072627, 0.00297941269209215, 0.00836940295838012, 0.0135079198726043, 0.01783897387775, 0.0208117634937184, 0.0219296799173897, 0.0207939131473918, 0.0171525712084831, 0.0109122759505582, 0.00217131613635658, -0.00878654142197277, -0.0214994360958733, -0.0353537924150521, -0.0496226555819264, -0.0635227460515582, -0.0762493949075175, -0.0870565585176903, -0.0952834322456145, -0.100433795617728, 0.897815271025478, -0.100433795617728, -0.0952834322456145, -0.0870565585176903, -0.0762493949075175, -0.0635227460515582, -0.0496226555819264, -0.0353537924150521, -0.0214994360958733, -0.00878654142197277, 0.00217131613635658, 0.0109122759505582, 0.0171525712084831, 0.0207939131473918, 0.0219296799173897, 0.0208117634937184, 0.01783897387775, 0.0135079198726043, 0.00836940295838012, 0.00297941269209215, -0.00213659745072627, -0.00653455211654056, -0.00987216769190495, -0.0119381383813136, -0.0126501387982004, -0.0120593583426823, -0.0103277129938156, -0.00771672096061846, -0.00454720175258045, -0.00116902218503775, 0.00207931755750707, 0.00488673211892458, 0.00701351117346388, 0.00829958531977344, 0.00867794718103357, 0.008165893672915, 0.00687496172315813, 0.00498033040706235, 0.00270593565654324, 0.000295626445515861, -0.00199687303904999, -0.00395877547050947, -0.0054113377301389, -0.00623914896554644, -0.00639691763823218, -0.00590990576517073, -0.00485086640152489, -0.00337021656996273, -0.00162297734350994, 0.000191890418285118, 0.00189725157910105, 0.00332285855937303, 0.0043414007140855, 0.00487089897478684, 0.00488477307596904, 0.00440675702894809, 0.00351007796549146, 0.00230244152837443, 0.000920414167639204, -0.000488378643632756, -0.00178122875497024, -0.00283153650562237, -0.00354566867839464, -0.00386832119500283, -0.00378568923316463, -0.0033269627265628, -0.00255193075145588, -0.00155366502057888, -0.000442019879257152, 0.000663530925023569, 0.00164999864607735, 0.00242216598057967, 0.00291667558585633, 0.00309425254120324, 0.00295195372748512, 0.00251354979992932, 0.00183754115776383, 0.0010040163378685, 0.00011019697912538, -0.000754743605203283, -0.00150608458596273, -0.00207593216525497, -0.00240612442959817, -0.00247463739863836, -0.00228596780801801, -0.00187853588365358, -0.00129790708366592, -0.000607822225868751, 0.000119705812527561, 0.000795422527402943, 0.0013594587022928, 0.00176357228398161, 0.00197678877662147, 0.00196693788730915, 0.00175933889880358, 0.00138854409978108, 0.000890114948991391, 0.000307463570743613, -0.000258867847385428, -0.000792353128483015, -0.00121996500090474, -0.00149386191098694, -0.00162048654535347, -0.00155971569802051, -0.00135438798227106, -0.00100914745096369, -0.000581137804613158, -0.000104853620586416, 0.0003592764038449, 0.00077239696555511, 0.00108693972111121, 0.00128220602830355, 0.00133565545607468, 0.00125243068618093, 0.00104116260654277, 0.000731163985424298, 0.000354278379084863, -4.6652371792183e-05, -0.000433054649469524, -0.000763180358599218, -0.00100800218219526, -0.00114178427080509, -0.00115593428007158, -0.00104846562132157, -0.000832586414561575, -0.000530373100267651, -0.00017426638973654, 0.000201620096166931, 0.000556698872788244, 0.000856094296852146, 0.00106583287047403, 0.00116166092114457, 0.00112809158969443, 0.000963381391008264, 0.000676795451039283, 0.000292859696150531, -0.000153542699833291, -0.000613984387253704, -0.00103478017572377, -0.00135461282772847, -0.00151460364623425, -0.00146354435419646, -0.001166480118984, -0.000613533314957006, 0.000164364701754363, 0.00108857685313709, 0.00201265224013278, 0.00271531114945385, 0.0028788678167616, 0.00208524900481501, -0.000199910730389145, -0.00462594343058113, -0.01196338116942, 0.0102232036784198]
-coefHPF6Hz=[-0.008573044457848, 0.0136330137371311, 0.00230194959129318, -0.00280119046531004, -0.00407677713593212, -0.00329882892476739, -0.00169420493712581, -4.99636814304724e-05, 0.00120377087791253, 0.00188814916597097, 0.00200904345017772, 0.00167450782497236, 0.00104987045583411, 0.000305439584491251, -0.000401919867879187, -0.00095895682850441, -0.00129096804923074, -0.0013757947319108, -0.00122385092137579, -0.000885407953169527, -0.00042495256371141, 7.73212004156963e-05, 0.000546967455656797, 0.000914907305479903, 0.00113484162312088, 0.00117840421703597, 0.00104699020193845, 0.0007601781961387, 0.000364527658559422, -8.58178096749332e-05, -0.000523050410232028, -0.000889094953310313, -0.00112771475263712, -0.0012071143132027, -0.00110955102010394, -0.000849887617664825, -0.000458265180131869, 8.43489864237663e-06, 0.000488648097115156, 0.000909687483288293, 0.00121297620521189, 0.00134641609227788, 0.00128961287760011, 0.0010397567008479, 0.000632211949652948, 0.000113938866438949, -0.000437927076476311, -0.00095080061784034, -0.00134166421145634, -0.00155567249834752, -0.00154580206901287, -0.00131380565423582, -0.00087372383346515, -0.000293830889673287, 0.000363303678685273, 0.000985151168384007, 0.00149935079493533, 0.00180932476822958, 0.00186743151764281, 0.00166566332947298, 0.00118832732881272, 0.000541074923695238, -0.000232494427390663, -0.001004148221936, -0.00165415510632539, -0.00209692854837946, -0.00225938969735445, -0.00208686059403113, -0.00160400470963209, -0.000870515275220856, 2.64071786234468e-05, 0.000968147756493794, 0.00180521687358566, 0.00241357900884829, 0.00270151307826868, 0.00261096932547381, 0.00213059164989887, 0.00131330914931499, 0.000269269957815158, -0.000859447286537174, -0.0019188967833438, -0.00275033836456035, -0.00321907748746231, -0.00323534094145274, -0.00278052563946403, -0.00190077253690333, -0.00070430867370273, 0.000654465107442428, 0.00198575630865531, 0.00309177004317427, 0.00379786827361272, 0.00398385894654768, 0.00360047706727295, 0.00267582082174889, 0.0013145468693062, -0.000308817969970186, -0.00197007769466304, -0.00342748621812444, -0.00445892001639652, -0.00489386964181197, -0.00463932522556365, -0.00369683723554598, -0.00216542309817973, -0.0002350987356159, 0.00183570223998555, 0.00375085231446968, 0.0052239146609925, 0.00601711860495198, 0.00597927383688599, 0.00506704469144361, 0.00336512453760964, 0.00106946848796758, -0.00151829197652027, -0.00404701753597983, -0.00613618767209992, -0.00746495137736769, -0.00778458525836582, -0.00698729329626082, -0.00511704342146682, -0.00236752694320682, 0.000917169758236433, 0.00430584424331604, 0.00731134283753463, 0.00946741558760908, 0.0103992924802993, 0.00987395062659551, 0.00785068593002273, 0.00450288453182755, 0.0002003666293897, -0.00452027202772317, -0.00901501679633305, -0.0126097817162196, -0.0146977009713882, -0.0148204747824301, -0.0127418339476204, -0.00851774201252816, -0.00249642455863485, 0.00468229639596229, 0.0121443349201032, 0.0188594681786871, 0.0237587954283506, 0.0258535384194921, 0.0243468114020277, 0.0187446966493229, 0.00893342220556761, -0.00477902902970669, -0.0216732591288092, -0.0406643394690911, -0.0603938835063715, -0.0793533890074043, -0.0960310872905018, -0.109057389535785, -0.117342655206355, 0.879815108392859, -0.117342655206355, -0.109057389535785, -0.0960310872905018, -0.0793533890074043, -0.0603938835063715, -0.0406643394690911, -0.0216732591288092, -0.00477902902970669, 0.00893342220556761, 0.0187446966493229, 0.0243468114020277, 0.0258535384194921, 0.0237587954283506, 0.0188594681786871, 0.0121443349201032, 0.00468229639596229, -0.00249642455863485, -0.00851774201252816, -0.0127418339476204, -0.0148204747824301, -0.0146977009713882, -0.0126097817162196, -0.00901501679633305, -0.00452027202772317, 0.0002003666293897, 0.00450288453182755, 0.00785068593002273, 0.00987395062659551, 0.0103992924802993, 0.00946741558760908, 0.00731134283753463, 0.00430584424331604, 0.000917169758236433, -0.00236752694320682, -0.00511704342146682, -0.00698729329626082, -0.00778458525836582, -0.00746495137736769, -0.00613618767209992, -0.00404701753597983, -0.00151829197652027, 0.00106946848796758, 0.00336512453760964, 0.00506704469144361, 0.00597927383688599, 0.00601711860495198, 0.0052239146609925, 0.00375085231446968, 0.00183570223998555, -0.0002350987356159, -0.00216542309817973, -0.00369683723554598, -0.00463932522556365, -0.00489386964181197, -0.00445892001639652, -0.00342748621812444, -0.00197007769466304, -0.000308817969970186, 0.0013145468693062, 0.00267582082174889, 0.00360047706727295, 0.00398385894654768, 0.00379786827361272, 0.00309177004317427, 0.00198575630865531, 0.000654465107442428, -0.00070430867370273, -0.00190077253690333, -0.00278052563946403, -0.00323534094145274, -0.00321907748746231, -0.00275033836456035, -0.0019188967833438, -0.000859447286537174, 0.000269269957815158, 0.00131330914931499, 0.00213059164989887, 0.00261096932547381, 0.00270151307826868, 0.00241357900884829, 0.00180521687358566, 0.000968147756493794, 2.64071786234468e-05, -0.000870515275220856, -0.00160400470963209, -0.00208686059403113, -0.00225938969735445, -0.00209692854837946, -0.00165415510632539, -0.001004148221936, -0.000232494427390663, 0.000541074923695238, 0.00118832732881272, 0.00166566332947298, 0.00186743151764281, 0.00180932476822958, 0.00149935079493533, 0.000985151168384007, 0.000363303678685273, -0.000293830889673287, -0.00087372383346515, -0.00131380565423582, -0.00154580206901287, -0.00155567249834752, -0.00134166421145634, -0.00095080061784034, -0.000437927076476311, 0.000113938866438949, 0.000632211949652948, 0.0010397567008479, 0.00128961287760011, 0.00134641609227788, 0.00121297620521189, 0.000909687483288293, 0.000488648097115156, 8.43489864237663e-06, -0.000458265180131869, -0.000849887617664825, -0.00110955102010394, -0.0012071143132027, -0.00112771475263712, -0.000889094953310313, -0.000523050410232028, -8.58178096749332e-05, 0.000364527658559422, 0.0007601781961387, 0.00104699020193845, 0.00117840421703597, 0.00113484162312088, 0.000914907305479903, 0.000546967455656797, 7.73212004156963e-05, -0.00042495256371141, -0.000885407953169527, -0.00122385092137579, -0.0013757947319108, -0.00129096804923074, -0.00095895682850441, -0.000401919867879187, 0.000305439584491251, 0.00104987045583411, 0.00167450782497236, 0.00200904345017772, 0.00188814916597097, 0.00120377087791253, -4.99636814304724e-05, -0.00169420493712581, -0.00329882892476739, -0.00407677713593212, -0.00280119046531004, 0.00230194959129318, 0.0136330137371311, -0.008573044457848]
-coefHPF7Hz=[0.00664164672693703, -0.014276606070117, 0.00150747575598868, 0.00557390336692666, 0.00428170098751527, 0.00140115040377327, -0.00110250335775105, -0.00246215473080484, -0.00262590133011137, -0.00191612116628936, -0.000775796543990408, 0.000378543232341293, 0.00124682311640071, 0.00167107882906675, 0.00163124084635073, 0.00121079913036999, 0.000556695314794631, -0.000160278405754629, -0.000780852423955705, -0.00118888083342913, -0.00132069885501939, -0.0011729700892617, -0.000793699630413771, -0.000271209859873703, 0.000287725331205836, 0.000774337485565267, 0.00109867126631475, 0.00120323109539457, 0.001074084145678, 0.000737103489524342, 0.000258929644513628, -0.000271294266226015, -0.000753735306093925, -0.00109686186983843, -0.00123414823024671, -0.00113924375245738, -0.000822816036543569, -0.000341661352492509, 0.000217423380606384, 0.000750180560810074, 0.00115541298348105, 0.00135083301869977, 0.00129469492010701, 0.000986068036752351, 0.000478281489537118, -0.000139786146481199, -0.000753446424556235, -0.00124747813352535, -0.00152041049372971, -0.0015124335216287, -0.00121095965621614, -0.000665976088574154, 3.21236286911758e-05, 0.000751068858351413, 0.00135750641758336, 0.00172637646812557, 0.00178048394552284, 0.00149337248927508, 0.000908453511009975, 0.000120127502202723, -0.000724895230022923, -0.00146765119379246, -0.00196402205608073, -0.00209642070096644, -0.00184807821493191, -0.00120853963026709, -0.000334813238714577, 0.000665422791856379, 0.001575074648761, 0.00221778691347574, 0.00247361736224582, 0.00226082759918176, 0.0015956588152543, 0.000607098962039297, -0.000549388848812315, -0.00165922919620106, -0.00249549226445245, -0.00288819282401672, -0.00275383870100917, -0.00208139705219798, -0.000972394148022943, 0.000372304284246373, 0.00170238222320641, 0.00277465787561525, 0.0033686328804739, 0.0033418523950021, 0.00266890221547271, 0.00145581245446882, -9.29294708485212e-05, -0.00170053725636477, -0.00306463118704508, -0.00390533524059233, -0.00403609549404677, -0.00340022812328715, -0.00208598034802384, -0.000304283650296094, 0.00162855766267981, 0.00334747701434063, 0.00450941178651972, 0.00486834790455005, 0.00431384264986779, 0.00290678969312896, 0.000866294269069923, -0.00145252928045827, -0.0036188265619427, -0.00520654042943475, -0.00588526303340076, -0.00547223838640867, -0.00398894295260844, -0.00165430988095165, 0.00113550291793371, 0.0038733000865987, 0.00602895693608259, 0.00715848034046903, 0.00698007266106814, 0.00545375521909531, 0.00277914060856433, -0.000602864858853615, -0.0040984956494002, -0.00704343250741115, -0.00883724603703654, -0.00905267071961959, -0.00753592865975543, -0.00444951388746528, -0.000267537374173998, 0.00429617167402225, 0.00840387415562913, 0.0112262471880439, 0.012119116535872, 0.0107283330606103, 0.00712441468933935, 0.00177696684059703, -0.00445689925178773, -0.0104774353926884, -0.0151114055879417, -0.0173103638995115, -0.0163619862927254, -0.0120543341703134, -0.00475102978548466, 0.00457596230804598, 0.0144549947078757, 0.0231010921402382, 0.0286575275270984, 0.0294744102613443, 0.0243826256152552, 0.0128972528393535, -0.00464394202129704, -0.0270659590528142, -0.0524628778834237, -0.0784097748945983, -0.102248535387821, -0.121436882915595, -0.133877406751034, 0.861813558349759, -0.133877406751034, -0.121436882915595, -0.102248535387821, -0.0784097748945983, -0.0524628778834237, -0.0270659590528142, -0.00464394202129704, 0.0128972528393535, 0.0243826256152552, 0.0294744102613443, 0.0286575275270984, 0.0231010921402382, 0.0144549947078757, 0.00457596230804598, -0.00475102978548466, -0.0120543341703134, -0.0163619862927254, -0.0173103638995115, -0.0151114055879417, -0.0104774353926884, -0.00445689925178773, 0.00177696684059703, 0.00712441468933935, 0.0107283330606103, 0.012119116535872, 0.0112262471880439, 0.00840387415562913, 0.00429617167402225, -0.000267537374173998, -0.00444951388746528, -0.00753592865975543, -0.00905267071961959, -0.00883724603703654, -0.00704343250741115, -0.0040984956494002, -0.000602864858853615, 0.00277914060856433, 0.00545375521909531, 0.00698007266106814, 0.00715848034046903, 0.00602895693608259, 0.0038733000865987, 0.00113550291793371, -0.00165430988095165, -0.00398894295260844, -0.00547223838640867, -0.00588526303340076, -0.00520654042943475, -0.0036188265619427, -0.00145252928045827, 0.000866294269069923, 0.00290678969312896, 0.00431384264986779, 0.00486834790455005, 0.00450941178651972, 0.00334747701434063, 0.00162855766267981, -0.000304283650296094, -0.00208598034802384, -0.00340022812328715, -0.00403609549404677, -0.00390533524059233, -0.00306463118704508, -0.00170053725636477, -9.29294708485212e-05, 0.00145581245446882, 0.00266890221547271, 0.0033418523950021, 0.0033686328804739, 0.00277465787561525, 0.00170238222320641, 0.000372304284246373, -0.000972394148022943, -0.00208139705219798, -0.00275383870100917, -0.00288819282401672, -0.00249549226445245, -0.00165922919620106, -0.000549388848812315, 0.000607098962039297, 0.0015956588152543, 0.00226082759918176, 0.00247361736224582, 0.00221778691347574, 0.001575074648761, 0.000665422791856379, -0.000334813238714577, -0.00120853963026709, -0.00184807821493191, -0.00209642070096644, -0.00196402205608073, -0.00146765119379246, -0.000724895230022923, 0.000120127502202723, 0.000908453511009975, 0.00149337248927508, 0.00178048394552284, 0.00172637646812557, 0.00135750641758336, 0.000751068858351413, 3.21236286911758e-05, -0.000665976088574154, -0.00121095965621614, -0.0015124335216287, -0.00152041049372971, -0.00124747813352535, -0.000753446424556235, -0.000139786146481199, 0.000478281489537118, 0.000986068036752351, 0.00129469492010701, 0.00135083301869977, 0.00115541298348105, 0.000750180560810074, 0.000217423380606384, -0.000341661352492509, -0.000822816036543569, -0.00113924375245738, -0.00123414823024671, -0.00109686186983843, -0.000753735306093925, -0.000271294266226015, 0.000258929644513628, 0.000737103489524342, 0.001074084145678, 0.00120323109539457, 0.00109867126631475, 0.000774337485565267, 0.000287725331205836, -0.000271209859873703, -0.000793699630413771, -0.0011729700892617, -0.00132069885501939, -0.00118888083342913, -0.000780852423955705, -0.000160278405754629, 0.000556695314794631, 0.00121079913036999, 0.00163124084635073, 0.00167107882906675, 0.00124682311640071, 0.000378543232341293, -0.000775796543990408, -0.00191612116628936, -0.00262590133011137, -0.00246215473080484, -0.00110250335775105, 0.00140115040377327, 0.00428170098751527, 0.00557390336692666, 0.00150747575598868, -0.014276606070117, 0.00664164672693703]
-coefHPF8Hz=[-0.00428770721189211, 0.0132550089395395, -0.00659480861402953, -0.00643228019261266, -0.00148385032138744, 0.00230948879560603, 0.00354098833989834, 0.00273169410537481, 0.000973006508255651, -0.000757184051018424, -0.00184867552213575, -0.00209731835119524, -0.00161251121738627, -0.000693717958880253, 0.00031162085669345, 0.00110064816566136, 0.00149026691686427, 0.00142426989780651, 0.000978082271016979, 0.000304239181510067, -0.000402206385740576, -0.000962361768117317, -0.00124742758713152, -0.0012045873045875, -0.000860353850106058, -0.000312760056864683, 0.00030057216784961, 0.000829098426622032, 0.00114807059954193, 0.00118286177111549, 0.000930818511716884, 0.000450802655959347, -0.000142885065132915, -0.000709574944837884, -0.00111021828226076, -0.00124894210446746, -0.00108563991510969, -0.000655791246298496, -5.47388063434242e-05, 0.000574047791930321, 0.00108281711566307, 0.00134369146900961, 0.00128692541987645, 0.000913825652134814, 0.00030566660196234, -0.000400070540314589, -0.00103413925504095, -0.0014410361743518, -0.00151127048119631, -0.00121658889696622, -0.000612280514657671, 0.000166692803120313, 0.000938274520634322, 0.0015122194071594, 0.00174177296418796, 0.00155400574272652, 0.00097918552046632, 0.000139427472387642, -0.000769558277741674, -0.00153303341390243, -0.00195346282456766, -0.00191487435699299, -0.00140715504501063, -0.000534040207632345, 0.000508811444386975, 0.00147336644246036, 0.00212289057051289, 0.00228539695938069, 0.00189534416704893, 0.00102753581786381, -0.000137061186619323, -0.00131101459892688, -0.00223459614037511, -0.00263607487119073, -0.00243403678046506, -0.0016121753167026, -0.000363745413895226, 0.00102240233253883, 0.00224047197649162, 0.00295365283759295, 0.00298642754649691, 0.00229996964139774, 0.0010100933937586, -0.000583921460039849, -0.0021031185904492, -0.003194673904211, -0.0035566782154858, -0.00306575306624586, -0.00180705596841531, -5.24014946175186e-05, 0.00180937812397603, 0.00331977762543472, 0.00409032824348709, 0.003907160083138, 0.00276771751521303, 0.00089250108431713, -0.00129694229811086, -0.00327676066814781, -0.00455715706534829, -0.00480150907312448, -0.0038911752533007, -0.00198149699697286, 0.000514222518567824, 0.00301277810737824, 0.00491360732946101, 0.00572523616937257, 0.00518951190328017, 0.00335340111342886, 0.000596021711418655, -0.00246293613227742, -0.00509565562989423, -0.00664590130455762, -0.00666961817625216, -0.00506597631787465, -0.00212268143483699, 0.00152151289502386, 0.00502699620444698, 0.00753399920004326, 0.00836963223165996, 0.00721244799173793, 0.00420740498783976, -4.60399062537647e-05, -0.00459815085940747, -0.00836151652314145, -0.0103581737879341, -0.00997009693895155, -0.00709784720790683, -0.00223411429697418, 0.00360968849305935, 0.00908627500577028, 0.0128260165702202, 0.0137485142211058, 0.0113517121038531, 0.00587425606948674, -0.00167458510799176, -0.00968432096839669, -0.0162485177182433, -0.0195751454673831, -0.0184124617322494, -0.0124098452247005, -0.00229760507748225, 0.0101303820044372, 0.0222450816422108, 0.0310368759331178, 0.0336492019764986, 0.0279663088703606, 0.0130801903013588, -0.0104091620178402, -0.0403865825860673, -0.0734789747970222, -0.105519635703124, -0.13225154409388, -0.149968905689428, 0.843832118445568, -0.149968905689428, -0.13225154409388, -0.105519635703124, -0.0734789747970222, -0.0403865825860673, -0.0104091620178402, 0.0130801903013588, 0.0279663088703606, 0.0336492019764986, 0.0310368759331178, 0.0222450816422108, 0.0101303820044372, -0.00229760507748225, -0.0124098452247005, -0.0184124617322494, -0.0195751454673831, -0.0162485177182433, -0.00968432096839669, -0.00167458510799176, 0.00587425606948674, 0.0113517121038531, 0.0137485142211058, 0.0128260165702202, 0.00908627500577028, 0.00360968849305935, -0.00223411429697418, -0.00709784720790683, -0.00997009693895155, -0.0103581737879341, -0.00836151652314145, -0.00459815085940747, -4.60399062537647e-05, 0.00420740498783976, 0.00721244799173793, 0.00836963223165996, 0.00753399920004326, 0.00502699620444698, 0.00152151289502386, -0.00212268143483699, -0.00506597631787465, -0.00666961817625216, -0.00664590130455762, -0.00509565562989423, -0.00246293613227742, 0.000596021711418655, 0.00335340111342886, 0.00518951190328017, 0.00572523616937257, 0.00491360732946101, 0.00301277810737824, 0.000514222518567824, -0.00198149699697286, -0.0038911752533007, -0.00480150907312448, -0.00455715706534829, -0.00327676066814781, -0.00129694229811086, 0.00089250108431713, 0.00276771751521303, 0.003907160083138, 0.00409032824348709, 0.00331977762543472, 0.00180937812397603, -5.24014946175186e-05, -0.00180705596841531, -0.00306575306624586, -0.0035566782154858, -0.003194673904211, -0.0021031185904492, -0.000583921460039849, 0.0010100933937586, 0.00229996964139774, 0.00298642754649691, 0.00295365283759295, 0.00224047197649162, 0.00102240233253883, -0.000363745413895226, -0.0016121753167026, -0.00243403678046506, -0.00263607487119073, -0.00223459614037511, -0.00131101459892688, -0.000137061186619323, 0.00102753581786381, 0.00189534416704893, 0.00228539695938069, 0.00212289057051289, 0.00147336644246036, 0.000508811444386975, -0.000534040207632345, -0.00140715504501063, -0.00191487435699299, -0.00195346282456766, -0.00153303341390243, -0.000769558277741674, 0.000139427472387642, 0.00097918552046632, 0.00155400574272652, 0.00174177296418796, 0.0015122194071594, 0.000938274520634322, 0.000166692803120313, -0.000612280514657671, -0.00121658889696622, -0.00151127048119631, -0.0014410361743518, -0.00103413925504095, -0.000400070540314589, 0.00030566660196234, 0.000913825652134814, 0.00128692541987645, 0.00134369146900961, 0.00108281711566307, 0.000574047791930321, -5.47388063434242e-05, -0.000655791246298496, -0.00108563991510969, -0.00124894210446746, -0.00111021828226076, -0.000709574944837884, -0.000142885065132915, 0.000450802655959347, 0.000930818511716884, 0.00118286177111549, 0.00114807059954193, 0.000829098426622032, 0.00030057216784961, -0.000312760056864683, -0.000860353850106058, -0.0012045873045875, -0.00124742758713152, -0.000962361768117317, -0.000402206385740576, 0.000304239181510067, 0.000978082271016979, 0.00142426989780651, 0.00149026691686427, 0.00110064816566136, 0.00031162085669345, -0.000693717958880253, -0.00161251121738627, -0.00209731835119524, -0.00184867552213575, -0.000757184051018424, 0.000973006508255651, 0.00273169410537481, 0.00354098833989834, 0.00230948879560603, -0.00148385032138744, -0.00643228019261266, -0.00659480861402953, 0.0132550089395395, -0.00428770721189211]
-coefHPF9Hz=[0.00135327164060985, -0.00954201848671379, 0.0121479422977988, 0.00229238945397393, -0.00395360075209426, -0.00445107113284961, -0.00207433645737878, 0.000624636476392734, 0.00225958369620946, 0.00247986842516547, 0.00160518531210475, 0.000255201117078632, -0.000963940484167164, -0.00164117322198895, -0.00163742366151445, -0.00106207301045837, -0.000189262845046988, 0.000663156000101559, 0.0012249430803876, 0.00134878358198529, 0.00103585630231275, 0.000414632421066604, -0.000306657314389567, -0.000902217672168588, -0.00120060114719893, -0.00112377165112572, -0.000708281251731675, -8.49127289631966e-05, 0.000558871114844861, 0.00103221169238329, 0.00119489752024323, 0.00100054200273971, 0.00050235487999102, -0.000151327662977675, -0.00077100928150315, -0.00117074885594022, -0.00122840278634868, -0.000919253407960602, -0.000323842658070994, 0.000385191239501205, 0.00100041546798112, 0.00133344963582436, 0.00127700575311744, 0.000833828054611171, 0.00012237008138964, -0.000651571169020627, -0.00125812217399968, -0.00150698177810324, -0.00131327378496556, -0.000715039473650776, 0.000121638392748234, 0.000958254470991503, 0.00153932577149738, 0.00168157540329707, 0.00132128500316766, 0.000547974076307371, -0.000424739845234463, -0.0013118044547489, -0.00184276296820612, -0.00184058268703747, -0.00128268696739334, -0.000312202912396137, 0.00079507815323441, 0.00171392327103864, 0.00215610936154852, 0.00196821230680873, 0.00117558871746352, -6.33744751666094e-06, -0.00124046185767065, -0.00215547217436777, -0.00246372286523599, -0.00204167500923892, -0.000986626894001215, 0.000415518364646396, 0.00175581600089558, 0.00263155215224674, 0.00275370838406328, 0.00205218211787785, 0.00069813454101585, -0.000927304178747788, -0.00235233022347764, -0.00313341704640898, -0.00301003178011824, -0.00197009857591245, -0.000293389257383985, 0.00155602699232329, 0.00301900262219138, 0.00365449365915456, 0.00320728930976295, 0.00178837678918485, -0.000252056625958757, -0.00230424390686124, -0.00377321383371223, -0.00417928101430749, -0.00333811035569387, -0.00146818444486133, 0.000957002921661773, 0.00320823370005485, 0.00460581732097544, 0.00469893281934821, 0.0033773191188148, 0.000965742957260309, -0.00185352962594452, -0.00427348116072851, -0.00553999896002631, -0.0052009651995325, -0.00327922520019297, -0.000268181794084971, 0.00300308805993147, 0.00555871167564971, 0.00657963330168049, 0.00567831294746183, 0.00301634793344905, -0.000725626395062154, -0.00448026911431049, -0.00711220248127861, -0.00776629845098321, -0.00612005951354523, -0.00251135987796519, 0.00210607835092132, 0.00641018516948724, 0.00907337361936203, 0.00918088787942702, 0.00651390975177186, 0.00165729130286218, -0.00408785637666425, -0.00905936121726918, -0.0116814455371441, -0.0109695760027792, -0.00684560836536254, -0.000239253907571276, 0.00708498042470708, 0.012978933580868, 0.0154958943935199, 0.0135107826714053, 0.00711350187932265, -0.00227193214922045, -0.0121713803300238, -0.0196322679996576, -0.0220320562391124, -0.0178598195659363, -0.0073124683770223, 0.00752510825683376, 0.0229561738423016, 0.0344019165524914, 0.0374167126583918, 0.0287877213703401, 0.00743357461275516, -0.0251142987412715, -0.0648147482900993, -0.105777269370267, -0.141379019295109, -0.165574157938961, 0.825855499040307, -0.165574157938961, -0.141379019295109, -0.105777269370267, -0.0648147482900993, -0.0251142987412715, 0.00743357461275516, 0.0287877213703401, 0.0374167126583918, 0.0344019165524914, 0.0229561738423016, 0.00752510825683376, -0.0073124683770223, -0.0178598195659363, -0.0220320562391124, -0.0196322679996576, -0.0121713803300238, -0.00227193214922045, 0.00711350187932265, 0.0135107826714053, 0.0154958943935199, 0.012978933580868, 0.00708498042470708, -0.000239253907571276, -0.00684560836536254, -0.0109695760027792, -0.0116814455371441, -0.00905936121726918, -0.00408785637666425, 0.00165729130286218, 0.00651390975177186, 0.00918088787942702, 0.00907337361936203, 0.00641018516948724, 0.00210607835092132, -0.00251135987796519, -0.00612005951354523, -0.00776629845098321, -0.00711220248127861, -0.00448026911431049, -0.000725626395062154, 0.00301634793344905, 0.00567831294746183, 0.00657963330168049, 0.00555871167564971, 0.00300308805993147, -0.000268181794084971, -0.00327922520019297, -0.0052009651995325, -0.00553999896002631, -0.00427348116072851, -0.00185352962594452, 0.000965742957260309, 0.0033773191188148, 0.00469893281934821, 0.00460581732097544, 0.00320823370005485, 0.000957002921661773, -0.00146818444486133, -0.00333811035569387, -0.00417928101430749, -0.00377321383371223, -0.00230424390686124, -0.000252056625958757, 0.00178837678918485, 0.00320728930976295, 0.00365449365915456, 0.00301900262219138, 0.00155602699232329, -0.000293389257383985, -0.00197009857591245, -0.00301003178011824, -0.00313341704640898, -0.00235233022347764, -0.000927304178747788, 0.00069813454101585, 0.00205218211787785, 0.00275370838406328, 0.00263155215224674, 0.00175581600089558, 0.000415518364646396, -0.000986626894001215, -0.00204167500923892, -0.00246372286523599, -0.00215547217436777, -0.00124046185767065, -6.33744751666094e-06, 0.00117558871746352, 0.00196821230680873, 0.00215610936154852, 0.00171392327103864, 0.00079507815323441, -0.000312202912396137, -0.00128268696739334, -0.00184058268703747, -0.00184276296820612, -0.0013118044547489, -0.000424739845234463, 0.000547974076307371, 0.00132128500316766, 0.00168157540329707, 0.00153932577149738, 0.000958254470991503, 0.000121638392748234, -0.000715039473650776, -0.00131327378496556, -0.00150698177810324, -0.00125812217399968, -0.000651571169020627, 0.00012237008138964, 0.000833828054611171, 0.00127700575311744, 0.00133344963582436, 0.00100041546798112, 0.000385191239501205, -0.000323842658070994, -0.000919253407960602, -0.00122840278634868, -0.00117074885594022, -0.00077100928150315, -0.000151327662977675, 0.00050235487999102, 0.00100054200273971, 0.00119489752024323, 0.00103221169238329, 0.000558871114844861, -8.49127289631966e-05, -0.000708281251731675, -0.00112377165112572, -0.00120060114719893, -0.000902217672168588, -0.000306657314389567, 0.000414632421066604, 0.00103585630231275, 0.00134878358198529, 0.0012249430803876, 0.000663156000101559, -0.000189262845046988, -0.00106207301045837, -0.00163742366151445, -0.00164117322198895, -0.000963940484167164, 0.000255201117078632, 0.00160518531210475, 0.00247986842516547, 0.00225958369620946, 0.000624636476392734, -0.00207433645737878, -0.00445107113284961, -0.00395360075209426, 0.00229238945397393, 0.0121479422977988, -0.00954201848671379, 0.00135327164060985]
-coefHPF10Hz=[0.00349504545497434, -0.00301258726071079, -0.0101239691169453, 0.0113142358455215, 0.000915541757710308, 0.00212808109207649, -0.00315998130273048, -0.00227584533326588, -0.0021080299663963, 2.00707378591708e-05, 0.00117257036740933, 0.00190954438776764, 0.00152146772986169, 0.000640815040816525, -0.000451970640299177, -0.00121101800860835, -0.00143084537891964, -0.00106170124176866, -0.000315184215217681, 0.000502238432028305, 0.00108304413715148, 0.00123003173880098, 0.000913015741024722, 0.000269672933098599, -0.000455767230241338, -0.000999273524183597, -0.00117010335635119, -0.000912288237105242, -0.000322579776197849, 0.000383661638951263, 0.00095499503793159, 0.00118260277612953, 0.000986650499631429, 0.000428434276877371, -0.000296582106954419, -0.00092853136500791, -0.00123952925857336, -0.00110716111201381, -0.000569282834948961, 0.000191434471537213, 0.000907047418167288, 0.00131585792953533, 0.00126108923632259, 0.00074376628983948, -6.19572008712656e-05, -0.000877285137512588, -0.00140322698797667, -0.00143928899369272, -0.000950958642700694, -9.75783223052511e-05, 0.000829342330252596, 0.00148985008962523, 0.00163736828243158, 0.00119220017892602, 0.000292166826789071, -0.000753048580192537, -0.00157009662870218, -0.0018479829133269, -0.00146391083738604, -0.00052968395548753, 0.000639989470002484, 0.00162808658523875, 0.00206728889397614, 0.00177152697893458, 0.000815586868879336, -0.000480870982118888, -0.00165926017223621, -0.00228897971852144, -0.00211002633349241, -0.00115673923378638, 0.000265247127296401, 0.00165486199121713, 0.00250577192782173, 0.0024808777652423, 0.00155288467450379, 1.32090081044335e-05, -0.00159981629887524, -0.00270736936773302, -0.00287972492893041, -0.00200997368094714, -0.000367776270900147, 0.00148389004851989, 0.0028842935274168, 0.00329986979304095, 0.00253433245276259, 0.000809292408941262, -0.0012922932863264, -0.00302458133429645, -0.0037380227476462, -0.00313022118375127, -0.00135034084644553, 0.0010081400065178, 0.00311643186222571, 0.00419143210655874, 0.00380057402458411, 0.00200195342012069, -0.000613482243569552, -0.00314181461672909, -0.00465152157122156, -0.00455028000303377, -0.00278426217378995, 8.55960429580968e-05, 0.00308071753862427, 0.00510904252362074, 0.00538748342224907, 0.00372293015877829, 0.000609869945837096, -0.00290872457172724, -0.00555939030724255, -0.00632991853804429, -0.0048519800694385, -0.00150867087727333, 0.00259290238054312, 0.00599239260584532, 0.00740648427497484, 0.00621618755885107, 0.00266628627144037, -0.00208162665596423, -0.0063932193618816, -0.00865692595025473, -0.00790148108497356, -0.00419432150560551, 0.00131494221583747, 0.00676234611213132, 0.0101399742682739, 0.0100567481704153, 0.00626576116389388, -0.000168900087601251, -0.00709027164427104, -0.0120202481544646, -0.0129527429629967, -0.00917127336126826, -0.0016027500535619, 0.00736926351080366, 0.0145816232724051, 0.0171773882277894, 0.0136405027291523, 0.00450486579498693, -0.0075940771269056, -0.0185863228049671, -0.0242268929696143, -0.0215222944957088, -0.0100060980092035, 0.00775627529101874, 0.0264671853510504, 0.0393618237361603, 0.040051868360127, 0.0244219533796886, -0.00785530896503228, -0.052864015429128, -0.103007268604783, -0.148702248346966, -0.180650468089132, 0.807890524428393, -0.180650468089132, -0.148702248346966, -0.103007268604783, -0.052864015429128, -0.00785530896503228, 0.0244219533796886, 0.040051868360127, 0.0393618237361603, 0.0264671853510504, 0.00775627529101874, -0.0100060980092035, -0.0215222944957088, -0.0242268929696143, -0.0185863228049671, -0.0075940771269056, 0.00450486579498693, 0.0136405027291523, 0.0171773882277894, 0.0145816232724051, 0.00736926351080366, -0.0016027500535619, -0.00917127336126826, -0.0129527429629967, -0.0120202481544646, -0.00709027164427104, -0.000168900087601251, 0.00626576116389388, 0.0100567481704153, 0.0101399742682739, 0.00676234611213132, 0.00131494221583747, -0.00419432150560551, -0.00790148108497356, -0.00865692595025473, -0.0063932193618816, -0.00208162665596423, 0.00266628627144037, 0.00621618755885107, 0.00740648427497484, 0.00599239260584532, 0.00259290238054312, -0.00150867087727333, -0.0048519800694385, -0.00632991853804429, -0.00555939030724255, -0.00290872457172724, 0.000609869945837096, 0.00372293015877829, 0.00538748342224907, 0.00510904252362074, 0.00308071753862427, 8.55960429580968e-05, -0.00278426217378995, -0.00455028000303377, -0.00465152157122156, -0.00314181461672909, -0.000613482243569552, 0.00200195342012069, 0.00380057402458411, 0.00419143210655874, 0.00311643186222571, 0.0010081400065178, -0.00135034084644553, -0.00313022118375127, -0.0037380227476462, -0.00302458133429645, -0.0012922932863264, 0.000809292408941262, 0.00253433245276259, 0.00329986979304095, 0.0028842935274168, 0.00148389004851989, -0.000367776270900147, -0.00200997368094714, -0.00287972492893041, -0.00270736936773302, -0.00159981629887524, 1.32090081044335e-05, 0.00155288467450379, 0.0024808777652423, 0.00250577192782173, 0.00165486199121713, 0.000265247127296401, -0.00115673923378638, -0.00211002633349241, -0.00228897971852144, -0.00165926017223621, -0.000480870982118888, 0.000815586868879336, 0.00177152697893458, 0.00206728889397614, 0.00162808658523875, 0.000639989470002484, -0.00052968395548753, -0.00146391083738604, -0.0018479829133269, -0.00157009662870218, -0.000753048580192537, 0.000292166826789071, 0.00119220017892602, 0.00163736828243158, 0.00148985008962523, 0.000829342330252596, -9.75783223052511e-05, -0.000950958642700694, -0.00143928899369272, -0.00140322698797667, -0.000877285137512588, -6.19572008712656e-05, 0.00074376628983948, 0.00126108923632259, 0.00131585792953533, 0.000907047418167288, 0.000191434471537213, -0.000569282834948961, -0.00110716111201381, -0.00123952925857336, -0.00092853136500791, -0.000296582106954419, 0.000428434276877371, 0.000986650499631429, 0.00118260277612953, 0.00095499503793159, 0.000383661638951263, -0.000322579776197849, -0.000912288237105242, -0.00117010335635119, -0.000999273524183597, -0.000455767230241338, 0.000269672933098599, 0.000913015741024722, 0.00123003173880098, 0.00108304413715148, 0.000502238432028305, -0.000315184215217681, -0.00106170124176866, -0.00143084537891964, -0.00121101800860835, -0.000451970640299177, 0.000640815040816525, 0.00152146772986169, 0.00190954438776764, 0.00117257036740933, 2.00707378591708e-05, -0.0021080299663963, -0.00227584533326588, -0.00315998130273048, 0.00212808109207649, 0.000915541757710308, 0.0113142358455215, -0.0101239691169453, -0.00301258726071079, 0.00349504545497434]
-coefHPF11Hz=[-0.00488522443947233, 0.0127149490898744, -0.00576706329121478, -0.00570692474423502, -0.000616478645730867, 0.00291299857127414, 0.00323296341941945, 0.00137328380501969, -0.000859270121743258, -0.00211491582563278, -0.00196277887494174, -0.000794471356554156, 0.000605330987722749, 0.00150919065597418, 0.00156366515089901, 0.00086130105956711, -0.000176074142736486, -0.00104132704534451, -0.001360629586749, -0.00104329551724256, -0.000275096622723154, 0.000574755314323075, 0.00113379322660371, 0.00117397412573762, 0.000701092367716634, -6.70192152774289e-05, -0.000791814734043047, -0.0011665146662484, -0.001032934494912, -0.00045610367767754, 0.000320994741881603, 0.000963626835607558, 0.00120069234310665, 0.00092178382165376, 0.000241897923070547, -0.000557771221013241, -0.00113336844885957, -0.00123605159989216, -0.000806850781185112, -1.84901011172018e-05, 0.000804107039799421, 0.00130450359589569, 0.00126041023609591, 0.000667215846221779, -0.000234767723181596, -0.00107052462710449, -0.00147230789940783, -0.00125432093237022, -0.000483283350413624, 0.000526740518153915, 0.00135174739455432, 0.0016239305503058, 0.00120599857165835, 0.000245284687777693, -0.000861208019500146, -0.00164439032932997, -0.0017462052544461, -0.00109841775892767, 5.66805371685907e-05, 0.00123660539499579, 0.00193538875303071, 0.00182344751459447, 0.000918911503144496, -0.000428711907690269, -0.00164664933919884, -0.00220983071368827, -0.00183638053114571, -0.000655572764391632, 0.000866409754617145, 0.0020823222097379, 0.00244684048607539, 0.00178054772623326, 0.000294570962091101, -0.00136605753952628, -0.0025304442663116, -0.00264334636900604, -0.00161763628848214, 0.000147421671226432, 0.00194030066089963, 0.00297742481636738, 0.00276670735457016, 0.00135765509440648, -0.000707674343974815, -0.00256951078959377, -0.00340328152887166, -0.00280309314516658, -0.000968938797255379, 0.00137699267310232, 0.00324467145719225, 0.00379267667467045, 0.00272683310024666, 0.000436255755406451, -0.00215794014953623, -0.00395134275434646, -0.00412426942424043, -0.00251767802333067, 0.00025483735598044, 0.00305607477361035, 0.00468375197333846, 0.00436993115061397, 0.00214679093712114, -0.00112500936462862, -0.00407874943496725, -0.00542595342681967, -0.00449921344348609, -0.00157568480675243, 0.00219558426130216, 0.00522743873660235, 0.0061643681586237, 0.0044819001444228, 0.000762601689974922, -0.00350615820221176, -0.00651214686192963, -0.00687957909388808, -0.00428046951053495, 0.00034358452774823, 0.00511532727039858, 0.00797249509814369, 0.00755424636181816, 0.00382130503361608, -0.0018364559963471, -0.00710113957319897, -0.00965241535029296, -0.00818003042250561, -0.00301856021345255, 0.00386974902975148, 0.00962711833336187, 0.0116489244195641, 0.00873560282422225, 0.00171894267911357, -0.00671161873614136, -0.0130056890035654, -0.0141882682383778, -0.00921160432364239, 0.000407353490244164, 0.0109601198440336, 0.017918408742417, 0.017754923972876, 0.00959150318709758, -0.00410349755193312, -0.0181004797873869, -0.0262261355249088, -0.0238120732291971, -0.00987114247427493, 0.011822963300043, 0.0334057468716206, 0.0451413916554173, 0.0386528695661841, 0.0100416273775678, -0.0382100285472961, -0.0972812304049876, -0.154140038025539, -0.195161299792403, 0.789900046494943, -0.195161299792403, -0.154140038025539, -0.0972812304049876, -0.0382100285472961, 0.0100416273775678, 0.0386528695661841, 0.0451413916554173, 0.0334057468716206, 0.011822963300043, -0.00987114247427493, -0.0238120732291971, -0.0262261355249088, -0.0181004797873869, -0.00410349755193312, 0.00959150318709758, 0.017754923972876, 0.017918408742417, 0.0109601198440336, 0.000407353490244164, -0.00921160432364239, -0.0141882682383778, -0.0130056890035654, -0.00671161873614136, 0.00171894267911357, 0.00873560282422225, 0.0116489244195641, 0.00962711833336187, 0.00386974902975148, -0.00301856021345255, -0.00818003042250561, -0.00965241535029296, -0.00710113957319897, -0.0018364559963471, 0.00382130503361608, 0.00755424636181816, 0.00797249509814369, 0.00511532727039858, 0.00034358452774823, -0.00428046951053495, -0.00687957909388808, -0.00651214686192963, -0.00350615820221176, 0.000762601689974922, 0.0044819001444228, 0.0061643681586237, 0.00522743873660235, 0.00219558426130216, -0.00157568480675243, -0.00449921344348609, -0.00542595342681967, -0.00407874943496725, -0.00112500936462862, 0.00214679093712114, 0.00436993115061397, 0.00468375197333846, 0.00305607477361035, 0.00025483735598044, -0.00251767802333067, -0.00412426942424043, -0.00395134275434646, -0.00215794014953623, 0.000436255755406451, 0.00272683310024666, 0.00379267667467045, 0.00324467145719225, 0.00137699267310232, -0.000968938797255379, -0.00280309314516658, -0.00340328152887166, -0.00256951078959377, -0.000707674343974815, 0.00135765509440648, 0.00276670735457016, 0.00297742481636738, 0.00194030066089963, 0.000147421671226432, -0.00161763628848214, -0.00264334636900604, -0.0025304442663116, -0.00136605753952628, 0.000294570962091101, 0.00178054772623326, 0.00244684048607539, 0.0020823222097379, 0.000866409754617145, -0.000655572764391632, -0.00183638053114571, -0.00220983071368827, -0.00164664933919884, -0.000428711907690269, 0.000918911503144496, 0.00182344751459447, 0.00193538875303071, 0.00123660539499579, 5.66805371685907e-05, -0.00109841775892767, -0.0017462052544461, -0.00164439032932997, -0.000861208019500146, 0.000245284687777693, 0.00120599857165835, 0.0016239305503058, 0.00135174739455432, 0.000526740518153915, -0.000483283350413624, -0.00125432093237022, -0.00147230789940783, -0.00107052462710449, -0.000234767723181596, 0.000667215846221779, 0.00126041023609591, 0.00130450359589569, 0.000804107039799421, -1.84901011172018e-05, -0.000806850781185112, -0.00123605159989216, -0.00113336844885957, -0.000557771221013241, 0.000241897923070547, 0.00092178382165376, 0.00120069234310665, 0.000963626835607558, 0.000320994741881603, -0.00045610367767754, -0.001032934494912, -0.0011665146662484, -0.000791814734043047, -6.70192152774289e-05, 0.000701092367716634, 0.00117397412573762, 0.00113379322660371, 0.000574755314323075, -0.000275096622723154, -0.00104329551724256, -0.001360629586749, -0.00104132704534451, -0.000176074142736486, 0.00086130105956711, 0.00156366515089901, 0.00150919065597418, 0.000605330987722749, -0.000794471356554156, -0.00196277887494174, -0.00211491582563278, -0.000859270121743258, 0.00137328380501969, 0.00323296341941945, 0.00291299857127414, -0.000616478645730867, -0.00570692474423502, -0.00576706329121478, 0.0127149490898744, -0.00488522443947233]
-coefHPF12Hz=[0.00333408231171546, -0.011348717250362, 0.00937513877852073, 0.00381991458865295, -0.00300500516632954, -0.00426633549383714, -0.00155526633322623, 0.0015536177454536, 0.00276388135518229, 0.00183055084388762, -0.000101640374699568, -0.00162684523975567, -0.0019260019297973, -0.00105055693121007, 0.000314494661992162, 0.00134339622626665, 0.00152160151858634, 0.000855890034191662, -0.000213283020657657, -0.00109003419387307, -0.00133625685104087, -0.000872765927378559, 1.96668221941264e-05, 0.000864981219949716, 0.00123868882004845, 0.000970721166335523, 0.000214683701823822, -0.000637762745089823, -0.00115861370613344, -0.00109205378287853, -0.000474043728181371, 0.000384544389951073, 0.00105649577106956, 0.00120467085329635, 0.000746324291187269, -9.66268997839164e-05, -0.000906932731663614, -0.00127860231204637, -0.00101448922232814, -0.000231768971944094, 0.000690271776671513, 0.00129306068762225, 0.00126271079623375, 0.000592384356943836, -0.00040108674572777, -0.00122768038760062, -0.00146448102258637, -0.000968762768513657, 3.72158579477657e-05, 0.00106409643049554, 0.00159470266390271, 0.00133849912142468, 0.000392134206741303, -0.000792250074433069, -0.00162581167760945, -0.00167036460984323, -0.000868968097180796, 0.000406761627931514, 0.00153310805241781, 0.00193111581356414, 0.001366055943827, 8.43441269704417e-05, -0.00129690251232744, -0.0020818700101751, -0.00184689426868329, -0.000667018371484988, 0.000905540773185585, 0.0020905817321069, 0.0022706167658899, 0.00130789670717655, -0.00036250316633736, -0.00192485642093748, -0.00258560496167407, -0.00196458978595299, -0.000321429143391328, 0.00156415919235928, 0.00273884019376112, 0.00258914114853004, 0.00110958224006, -0.000984546604818769, -0.00269809769366033, -0.00310630975682101, -0.00197716474314217, 0.000213797844953884, 0.0024032772138733, 0.0034712807541015, 0.00284482960929458, 0.000742299175989792, -0.00184267824108496, -0.00360964411606716, -0.00364298690260506, -0.001835089121917, 0.000998792620394728, 0.00346142182113766, 0.00429311481632802, 0.0029990402804255, 0.000117019014052092, -0.00297188202814625, -0.00470865128762932, -0.0041536622986348, -0.00147111284839696, 0.00210254721108214, 0.00480212022683745, 0.00520927089890852, 0.00300087520726872, -0.000846682768296992, -0.00448155176099382, -0.00604912734144074, -0.00463448862756436, -0.000786425995731136, 0.00368130073980815, 0.00654439805934114, 0.00625942713900913, 0.00277702012002749, -0.00233475049256455, -0.0065817377010639, -0.00775209204649868, -0.00505436435662794, 0.000394703144000424, 0.00601734743339826, 0.00896779521605827, 0.00754878550375001, 0.00216782863275979, -0.0047211818362176, -0.0097242844798807, -0.0101467855251654, -0.00540348218087256, 0.00251371225203182, 0.00983088915589339, 0.012749568346921, 0.0093657000449452, 0.00081582640134692, -0.00901917867072765, -0.015221043409051, -0.0142016274674124, -0.00566204572787652, 0.00688311410789322, 0.0174493324754244, 0.0202889705802647, 0.0128217079025041, -0.00263048122666153, -0.0193131919777829, -0.0287034750319483, -0.0244366920298542, -0.00582578745862092, 0.0207256104708162, 0.0432583771566485, 0.0484844754993957, 0.0271528273578453, -0.0216053169077506, -0.0887564264263854, -0.157609459800199, -0.209059113262438, 0.771896716079817, -0.209059113262438, -0.157609459800199, -0.0887564264263854, -0.0216053169077506, 0.0271528273578453, 0.0484844754993957, 0.0432583771566485, 0.0207256104708162, -0.00582578745862092, -0.0244366920298542, -0.0287034750319483, -0.0193131919777829, -0.00263048122666153, 0.0128217079025041, 0.0202889705802647, 0.0174493324754244, 0.00688311410789322, -0.00566204572787652, -0.0142016274674124, -0.015221043409051, -0.00901917867072765, 0.00081582640134692, 0.0093657000449452, 0.012749568346921, 0.00983088915589339, 0.00251371225203182, -0.00540348218087256, -0.0101467855251654, -0.0097242844798807, -0.0047211818362176, 0.00216782863275979, 0.00754878550375001, 0.00896779521605827, 0.00601734743339826, 0.000394703144000424, -0.00505436435662794, -0.00775209204649868, -0.0065817377010639, -0.00233475049256455, 0.00277702012002749, 0.00625942713900913, 0.00654439805934114, 0.00368130073980815, -0.000786425995731136, -0.00463448862756436, -0.00604912734144074, -0.00448155176099382, -0.000846682768296992, 0.00300087520726872, 0.00520927089890852, 0.00480212022683745, 0.00210254721108214, -0.00147111284839696, -0.0041536622986348, -0.00470865128762932, -0.00297188202814625, 0.000117019014052092, 0.0029990402804255, 0.00429311481632802, 0.00346142182113766, 0.000998792620394728, -0.001835089121917, -0.00364298690260506, -0.00360964411606716, -0.00184267824108496, 0.000742299175989792, 0.00284482960929458, 0.0034712807541015, 0.0024032772138733, 0.000213797844953884, -0.00197716474314217, -0.00310630975682101, -0.00269809769366033, -0.000984546604818769, 0.00110958224006, 0.00258914114853004, 0.00273884019376112, 0.00156415919235928, -0.000321429143391328, -0.00196458978595299, -0.00258560496167407, -0.00192485642093748, -0.00036250316633736, 0.00130789670717655, 0.0022706167658899, 0.0020905817321069, 0.000905540773185585, -0.000667018371484988, -0.00184689426868329, -0.0020818700101751, -0.00129690251232744, 8.43441269704417e-05, 0.001366055943827, 0.00193111581356414, 0.00153310805241781, 0.000406761627931514, -0.000868968097180796, -0.00167036460984323, -0.00162581167760945, -0.000792250074433069, 0.000392134206741303, 0.00133849912142468, 0.00159470266390271, 0.00106409643049554, 3.72158579477657e-05, -0.000968762768513657, -0.00146448102258637, -0.00122768038760062, -0.00040108674572777, 0.000592384356943836, 0.00126271079623375, 0.00129306068762225, 0.000690271776671513, -0.000231768971944094, -0.00101448922232814, -0.00127860231204637, -0.000906932731663614, -9.66268997839164e-05, 0.000746324291187269, 0.00120467085329635, 0.00105649577106956, 0.000384544389951073, -0.000474043728181371, -0.00109205378287853, -0.00115861370613344, -0.000637762745089823, 0.000214683701823822, 0.000970721166335523, 0.00123868882004845, 0.000864981219949716, 1.96668221941264e-05, -0.000872765927378559, -0.00133625685104087, -0.00109003419387307, -0.000213283020657657, 0.000855890034191662, 0.00152160151858634, 0.00134339622626665, 0.000314494661992162, -0.00105055693121007, -0.0019260019297973, -0.00162684523975567, -0.000101640374699568, 0.00183055084388762, 0.00276388135518229, 0.0015536177454536, -0.00155526633322623, -0.00426633549383714, -0.00300500516632954, 0.00381991458865295, 0.00937513877852073, -0.011348717250362, 0.00333408231171546]
-coefHPF13Hz=[-0.00169401206251925, 0.00856029920230141, -0.0118971383360546, 0.000982411753827959, 0.00581708823754731, 0.0023079717832895, -0.00215079208897833, -0.00335885522727541, -0.00150248833108307, 0.00107848066147869, 0.0023263252136742, 0.00168653459930524, -8.13594548574471e-06, -0.00144494460801054, -0.00173811952609882, -0.00087728976200652, 0.0004437435086221, 0.00135909298201824, 0.00135861784576763, 0.000528479161512559, -0.000562695570388283, -0.00125316161362968, -0.00116103315953222, -0.000385514314759591, 0.000588767705331977, 0.00118763637351127, 0.00107749546131446, 0.000340149239055793, -0.000586802525611738, -0.0011665560436492, -0.00106472750972305, -0.000345779932089072, 0.000580809052006696, 0.00117832692824136, 0.00110111777594155, 0.00037955041216549, -0.000576219355433906, -0.00121870088418673, -0.00116678017216331, -0.00043370956997526, 0.00057375495612645, 0.00127746450524927, 0.00125797509318156, 0.000503161250028894, -0.000571625432900666, -0.00135051142605207, -0.00136857322498252, -0.000588544983355472, 0.00056549412686763, 0.00143508792107517, 0.00150072822868063, 0.000690472462445825, -0.000556770507030939, -0.00153058608276471, -0.00165054906273271, -0.000810296647947638, 0.000542866685759562, 0.00163623935385023, 0.00181954101269084, 0.000944753931048311, -0.000520600034512825, -0.00174853929329788, -0.00200668513155975, -0.00109998042923772, 0.000491658907970145, 0.00186570989415079, 0.00220969697204399, 0.00127669264489706, -0.000446932916908746, -0.00198732269612744, -0.00243403341955419, -0.00147799331060465, 0.000386598862031295, 0.00211179659775951, 0.00268216262713222, 0.00170783685155017, -0.000311105049659145, -0.00224107248344685, -0.00295056618213683, -0.00196668586019903, 0.000213558199629332, 0.00237109333512379, 0.00324242017614565, 0.00226096301739594, -8.96915653559096e-05, -0.00249924820648823, -0.00356601683883563, -0.00259437430576779, -6.60894585563284e-05, 0.00263380779453507, 0.00391550696484548, 0.00298081550849346, 0.000243697565349301, -0.00275807582568288, -0.00430637282041946, -0.00341102046906983, -0.000468736373698267, 0.00288189772787942, 0.00473574775342745, 0.003903620116744, 0.000747986028330755, -0.00300719150882131, -0.00521029815119981, -0.00447872544261979, -0.0010791984103168, 0.00312817469952397, 0.00574451782434175, 0.00514058812693065, 0.00148449983727986, -0.00324608916066975, -0.00634571553219098, -0.00591777602406539, -0.001983886109958, 0.00335335315720349, 0.00704797072214358, 0.00684047789615638, 0.00260118137348861, -0.00345336523922885, -0.00787708273808005, -0.00796342629725153, -0.00336177853894032, 0.00354209871097426, 0.00886918703959395, 0.0093561861139137, 0.00434908928453105, -0.00362896291131809, -0.0101065468584882, -0.0111392994333432, -0.00564937727677469, 0.00370200827506626, 0.0117234713726846, 0.0135255215948096, 0.00742347565954341, -0.00376708071749902, -0.0139364387778469, -0.0169040090367622, -0.0100274923866381, 0.00381964024551262, 0.0172541312091893, 0.0221256210932806, 0.014186991628085, -0.00386293171333907, -0.0228577252344908, -0.0313927281977514, -0.021980744642635, 0.00389339955774737, 0.0346941177285591, 0.0527864362431886, 0.0420963824896405, -0.00391148980689259, -0.0777005352798862, -0.159067728940336, -0.222277495253892, 0.753919020906521, -0.222277495253892, -0.159067728940336, -0.0777005352798862, -0.00391148980689259, 0.0420963824896405, 0.0527864362431886, 0.0346941177285591, 0.00389339955774737, -0.021980744642635, -0.0313927281977514, -0.0228577252344908, -0.00386293171333907, 0.014186991628085, 0.0221256210932806, 0.0172541312091893, 0.00381964024551262, -0.0100274923866381, -0.0169040090367622, -0.0139364387778469, -0.00376708071749902, 0.00742347565954341, 0.0135255215948096, 0.0117234713726846, 0.00370200827506626, -0.00564937727677469, -0.0111392994333432, -0.0101065468584882, -0.00362896291131809, 0.00434908928453105, 0.0093561861139137, 0.00886918703959395, 0.00354209871097426, -0.00336177853894032, -0.00796342629725153, -0.00787708273808005, -0.00345336523922885, 0.00260118137348861, 0.00684047789615638, 0.00704797072214358, 0.00335335315720349, -0.001983886109958, -0.00591777602406539, -0.00634571553219098, -0.00324608916066975, 0.00148449983727986, 0.00514058812693065, 0.00574451782434175, 0.00312817469952397, -0.0010791984103168, -0.00447872544261979, -0.00521029815119981, -0.00300719150882131, 0.000747986028330755, 0.003903620116744, 0.00473574775342745, 0.00288189772787942, -0.000468736373698267, -0.00341102046906983, -0.00430637282041946, -0.00275807582568288, 0.000243697565349301, 0.00298081550849346, 0.00391550696484548, 0.00263380779453507, -6.60894585563284e-05, -0.00259437430576779, -0.00356601683883563, -0.00249924820648823, -8.96915653559096e-05, 0.00226096301739594, 0.00324242017614565, 0.00237109333512379, 0.000213558199629332, -0.00196668586019903, -0.00295056618213683, -0.00224107248344685, -0.000311105049659145, 0.00170783685155017, 0.00268216262713222, 0.00211179659775951, 0.000386598862031295, -0.00147799331060465, -0.00243403341955419, -0.00198732269612744, -0.000446932916908746, 0.00127669264489706, 0.00220969697204399, 0.00186570989415079, 0.000491658907970145, -0.00109998042923772, -0.00200668513155975, -0.00174853929329788, -0.000520600034512825, 0.000944753931048311, 0.00181954101269084, 0.00163623935385023, 0.000542866685759562, -0.000810296647947638, -0.00165054906273271, -0.00153058608276471, -0.000556770507030939, 0.000690472462445825, 0.00150072822868063, 0.00143508792107517, 0.00056549412686763, -0.000588544983355472, -0.00136857322498252, -0.00135051142605207, -0.000571625432900666, 0.000503161250028894, 0.00125797509318156, 0.00127746450524927, 0.00057375495612645, -0.00043370956997526, -0.00116678017216331, -0.00121870088418673, -0.000576219355433906, 0.00037955041216549, 0.00110111777594155, 0.00117832692824136, 0.000580809052006696, -0.000345779932089072, -0.00106472750972305, -0.0011665560436492, -0.000586802525611738, 0.000340149239055793, 0.00107749546131446, 0.00118763637351127, 0.000588767705331977, -0.000385514314759591, -0.00116103315953222, -0.00125316161362968, -0.000562695570388283, 0.000528479161512559, 0.00135861784576763, 0.00135909298201824, 0.0004437435086221, -0.00087728976200652, -0.00173811952609882, -0.00144494460801054, -8.13594548574471e-06, 0.00168653459930524, 0.0023263252136742, 0.00107848066147869, -0.00150248833108307, -0.00335885522727541, -0.00215079208897833, 0.0023079717832895, 0.00581708823754731, 0.000982411753827959, -0.0118971383360546, 0.00856029920230141, -0.00169401206251925]
-coefHPF14Hz=[-0.00169401206251925, 0.00856029920230141, -0.0118971383360546, 0.000982411753827959, 0.00581708823754731, 0.0023079717832895, -0.00215079208897833, -0.00335885522727541, -0.00150248833108307, 0.00107848066147869, 0.0023263252136742, 0.00168653459930524, -8.13594548574471e-06, -0.00144494460801054, -0.00173811952609882, -0.00087728976200652, 0.0004437435086221, 0.00135909298201824, 0.00135861784576763, 0.000528479161512559, -0.000562695570388283, -0.00125316161362968, -0.00116103315953222, -0.000385514314759591, 0.000588767705331977, 0.00118763637351127, 0.00107749546131446, 0.000340149239055793, -0.000586802525611738, -0.0011665560436492, -0.00106472750972305, -0.000345779932089072, 0.000580809052006696, 0.00117832692824136, 0.00110111777594155, 0.00037955041216549, -0.000576219355433906, -0.00121870088418673, -0.00116678017216331, -0.00043370956997526, 0.00057375495612645, 0.00127746450524927, 0.00125797509318156, 0.000503161250028894, -0.000571625432900666, -0.00135051142605207, -0.00136857322498252, -0.000588544983355472, 0.00056549412686763, 0.00143508792107517, 0.00150072822868063, 0.000690472462445825, -0.000556770507030939, -0.00153058608276471, -0.00165054906273271, -0.000810296647947638, 0.000542866685759562, 0.00163623935385023, 0.00181954101269084, 0.000944753931048311, -0.000520600034512825, -0.00174853929329788, -0.00200668513155975, -0.00109998042923772, 0.000491658907970145, 0.00186570989415079, 0.00220969697204399, 0.00127669264489706, -0.000446932916908746, -0.00198732269612744, -0.00243403341955419, -0.00147799331060465, 0.000386598862031295, 0.00211179659775951, 0.00268216262713222, 0.00170783685155017, -0.000311105049659145, -0.00224107248344685, -0.00295056618213683, -0.00196668586019903, 0.000213558199629332, 0.00237109333512379, 0.00324242017614565, 0.00226096301739594, -8.96915653559096e-05, -0.00249924820648823, -0.00356601683883563, -0.00259437430576779, -6.60894585563284e-05, 0.00263380779453507, 0.00391550696484548, 0.00298081550849346, 0.000243697565349301, -0.00275807582568288, -0.00430637282041946, -0.00341102046906983, -0.000468736373698267, 0.00288189772787942, 0.00473574775342745, 0.003903620116744, 0.000747986028330755, -0.00300719150882131, -0.00521029815119981, -0.00447872544261979, -0.0010791984103168, 0.00312817469952397, 0.00574451782434175, 0.00514058812693065, 0.00148449983727986, -0.00324608916066975, -0.00634571553219098, -0.00591777602406539, -0.001983886109958, 0.00335335315720349, 0.00704797072214358, 0.00684047789615638, 0.00260118137348861, -0.00345336523922885, -0.00787708273808005, -0.00796342629725153, -0.00336177853894032, 0.00354209871097426, 0.00886918703959395, 0.0093561861139137, 0.00434908928453105, -0.00362896291131809, -0.0101065468584882, -0.0111392994333432, -0.00564937727677469, 0.00370200827506626, 0.0117234713726846, 0.0135255215948096, 0.00742347565954341, -0.00376708071749902, -0.0139364387778469, -0.0169040090367622, -0.0100274923866381, 0.00381964024551262, 0.0172541312091893, 0.0221256210932806, 0.014186991628085, -0.00386293171333907, -0.0228577252344908, -0.0313927281977514, -0.021980744642635, 0.00389339955774737, 0.0346941177285591, 0.0527864362431886, 0.0420963824896405, -0.00391148980689259, -0.0777005352798862, -0.159067728940336, -0.222277495253892, 0.753919020906521, -0.222277495253892, -0.159067728940336, -0.0777005352798862, -0.00391148980689259, 0.0420963824896405, 0.0527864362431886, 0.0346941177285591, 0.00389339955774737, -0.021980744642635, -0.0313927281977514, -0.0228577252344908, -0.00386293171333907, 0.014186991628085, 0.0221256210932806, 0.0172541312091893, 0.00381964024551262, -0.0100274923866381, -0.0169040090367622, -0.0139364387778469, -0.00376708071749902, 0.00742347565954341, 0.0135255215948096, 0.0117234713726846, 0.00370200827506626, -0.00564937727677469, -0.0111392994333432, -0.0101065468584882, -0.00362896291131809, 0.00434908928453105, 0.0093561861139137, 0.00886918703959395, 0.00354209871097426, -0.00336177853894032, -0.00796342629725153, -0.00787708273808005, -0.00345336523922885, 0.00260118137348861, 0.00684047789615638, 0.00704797072214358, 0.00335335315720349, -0.001983886109958, -0.00591777602406539, -0.00634571553219098, -0.00324608916066975, 0.00148449983727986, 0.00514058812693065, 0.00574451782434175, 0.00312817469952397, -0.0010791984103168, -0.00447872544261979, -0.00521029815119981, -0.00300719150882131, 0.000747986028330755, 0.003903620116744, 0.00473574775342745, 0.00288189772787942, -0.000468736373698267, -0.00341102046906983, -0.00430637282041946, -0.00275807582568288, 0.000243697565349301, 0.00298081550849346, 0.00391550696484548, 0.00263380779453507, -6.60894585563284e-05, -0.00259437430576779, -0.00356601683883563, -0.00249924820648823, -8.96915653559096e-05, 0.00226096301739594, 0.00324242017614565, 0.00237109333512379, 0.000213558199629332, -0.00196668586019903, -0.00295056618213683, -0.00224107248344685, -0.000311105049659145, 0.00170783685155017, 0.00268216262713222, 0.00211179659775951, 0.000386598862031295, -0.00147799331060465, -0.00243403341955419, -0.00198732269612744, -0.000446932916908746, 0.00127669264489706, 0.00220969697204399, 0.00186570989415079, 0.000491658907970145, -0.00109998042923772, -0.00200668513155975, -0.00174853929329788, -0.000520600034512825, 0.000944753931048311, 0.00181954101269084, 0.00163623935385023, 0.000542866685759562, -0.000810296647947638, -0.00165054906273271, -0.00153058608276471, -0.000556770507030939, 0.000690472462445825, 0.00150072822868063, 0.00143508792107517, 0.00056549412686763, -0.000588544983355472, -0.00136857322498252, -0.00135051142605207, -0.000571625432900666, 0.000503161250028894, 0.00125797509318156, 0.00127746450524927, 0.00057375495612645, -0.00043370956997526, -0.00116678017216331, -0.00121870088418673, -0.000576219355433906, 0.00037955041216549, 0.00110111777594155, 0.00117832692824136, 0.000580809052006696, -0.000345779932089072, -0.00106472750972305, -0.0011665560436492, -0.000586802525611738, 0.000340149239055793, 0.00107749546131446, 0.00118763637351127, 0.000588767705331977, -0.000385514314759591, -0.00116103315953222, -0.00125316161362968, -0.000562695570388283, 0.000528479161512559, 0.00135861784576763, 0.00135909298201824, 0.0004437435086221, -0.00087728976200652, -0.00173811952609882, -0.00144494460801054, -8.13594548574471e-06, 0.00168653459930524, 0.0023263252136742, 0.00107848066147869, -0.00150248833108307, -0.00335885522727541, -0.00215079208897833, 0.0023079717832895, 0.00581708823754731, 0.000982411753827959, -0.0118971383360546, 0.00856029920230141, -0.00169401206251925]
-coefHPF15Hz=[0.00301521698077751, -0.00792676700730901, 0.00322440748081815, 0.0084169122843675, -0.00729922296328759, -0.000440128243936272, -0.00291727610982162, 0.00490201886573625, 0.000264736945562514, 0.00155219686067511, -0.00321976225188782, -0.000608238934753237, -0.00114689500827354, 0.00210921345910639, 0.000900179777345332, 0.00110561614477134, -0.00127591150367829, -0.00102073775738344, -0.00120390085058816, 0.000574758830486531, 0.000945761797594563, 0.00130572664577659, 4.60680853131981e-05, -0.000687123012465516, -0.00131580625208794, -0.000573506921643794, 0.000279228223412667, 0.00117222417671763, 0.000962974701448616, 0.000214515401746918, -0.00085169095302714, -0.00115845270589345, -0.000705767854558937, 0.000372170181516467, 0.00111507600735327, 0.00109799958352443, 0.000202820163307478, -0.000823658150090109, -0.00129561260016767, -0.000775473691855436, 0.000320384675499865, 0.00123054422844081, 0.00122818679688425, 0.000310575633017004, -0.000882755190094803, -0.00144733803434509, -0.000947117449088544, 0.000292346112401726, 0.00135680971421691, 0.00144375679363026, 0.00043859435067158, -0.000936278392022216, -0.00166429693462837, -0.0011629714615448, 0.000237692452837273, 0.00152104208950757, 0.00170984616663628, 0.000612448158643103, -0.000996473070145914, -0.00192283203261793, -0.00143465342899854, 0.00015878236152575, 0.00170472492350557, 0.00202938632888339, 0.000836072762670663, -0.00104662390431319, -0.00221963276943248, -0.00176991863490278, 4.01931367934153e-05, 0.00189977342631802, 0.0024103229047166, 0.00112297460875003, -0.00107437606124891, -0.00255906156853457, -0.00218009903781866, -0.000134310446502213, 0.00210569377567493, 0.00286139969763598, 0.00148951983591115, -0.00107257458160024, -0.00294581469865323, -0.00267864590531632, -0.000377567157956724, 0.00231939697718317, 0.00339152315943069, 0.0019519689174283, -0.00102936218731949, -0.00337864331345868, -0.00328538497675862, -0.000710347682080975, 0.00252943400474512, 0.00401718016670519, 0.0025428140149401, -0.000925730863703754, -0.00386684049607005, -0.00403661055231137, -0.00116245397443525, 0.00273763898396431, 0.00476662024036847, 0.00329922200821451, -0.000742736817294391, -0.00443160407037399, -0.00496604793699717, -0.00177468564914729, 0.00293507333973205, 0.00568044037838085, 0.00427362262518093, -0.000436082380569779, -0.00509179748309437, -0.00616023131351014, -0.00261145186149773, 0.00311404686772363, 0.00682629178570523, 0.00559315040933012, 2.92578098508938e-05, -0.00590377104125179, -0.0077341643660873, -0.00380217669559378, 0.00327935292354936, 0.00834813628813948, 0.00741828122299156, 0.000767688988052853, -0.00696161898119655, -0.00994740739547324, -0.00557113803555688, 0.00341963342467746, 0.0105204962223401, 0.0101615456915033, 0.00196862409078368, -0.00848257351355293, -0.0133732784665613, -0.00842850045627424, 0.00353530212594316, 0.0140200545158957, 0.0147885050435858, 0.0041402556857222, -0.0110509486803003, -0.0195580940978729, -0.0138688369943743, 0.00361561643196465, 0.0209878123974002, 0.0245725814615196, 0.00907901911078981, -0.0169206765437023, -0.0349300864329085, -0.0285696787800487, 0.00366631378726842, 0.0435700942148508, 0.0610486047944264, 0.0311427254079039, -0.0492976004956234, -0.155904253728281, -0.246536200754128, 0.717969132071278, -0.246536200754128, -0.155904253728281, -0.0492976004956234, 0.0311427254079039, 0.0610486047944264, 0.0435700942148508, 0.00366631378726842, -0.0285696787800487, -0.0349300864329085, -0.0169206765437023, 0.00907901911078981, 0.0245725814615196, 0.0209878123974002, 0.00361561643196465, -0.0138688369943743, -0.0195580940978729, -0.0110509486803003, 0.0041402556857222, 0.0147885050435858, 0.0140200545158957, 0.00353530212594316, -0.00842850045627424, -0.0133732784665613, -0.00848257351355293, 0.00196862409078368, 0.0101615456915033, 0.0105204962223401, 0.00341963342467746, -0.00557113803555688, -0.00994740739547324, -0.00696161898119655, 0.000767688988052853, 0.00741828122299156, 0.00834813628813948, 0.00327935292354936, -0.00380217669559378, -0.0077341643660873, -0.00590377104125179, 2.92578098508938e-05, 0.00559315040933012, 0.00682629178570523, 0.00311404686772363, -0.00261145186149773, -0.00616023131351014, -0.00509179748309437, -0.000436082380569779, 0.00427362262518093, 0.00568044037838085, 0.00293507333973205, -0.00177468564914729, -0.00496604793699717, -0.00443160407037399, -0.000742736817294391, 0.00329922200821451, 0.00476662024036847, 0.00273763898396431, -0.00116245397443525, -0.00403661055231137, -0.00386684049607005, -0.000925730863703754, 0.0025428140149401, 0.00401718016670519, 0.00252943400474512, -0.000710347682080975, -0.00328538497675862, -0.00337864331345868, -0.00102936218731949, 0.0019519689174283, 0.00339152315943069, 0.00231939697718317, -0.000377567157956724, -0.00267864590531632, -0.00294581469865323, -0.00107257458160024, 0.00148951983591115, 0.00286139969763598, 0.00210569377567493, -0.000134310446502213, -0.00218009903781866, -0.00255906156853457, -0.00107437606124891, 0.00112297460875003, 0.0024103229047166, 0.00189977342631802, 4.01931367934153e-05, -0.00176991863490278, -0.00221963276943248, -0.00104662390431319, 0.000836072762670663, 0.00202938632888339, 0.00170472492350557, 0.00015878236152575, -0.00143465342899854, -0.00192283203261793, -0.000996473070145914, 0.000612448158643103, 0.00170984616663628, 0.00152104208950757, 0.000237692452837273, -0.0011629714615448, -0.00166429693462837, -0.000936278392022216, 0.00043859435067158, 0.00144375679363026, 0.00135680971421691, 0.000292346112401726, -0.000947117449088544, -0.00144733803434509, -0.000882755190094803, 0.000310575633017004, 0.00122818679688425, 0.00123054422844081, 0.000320384675499865, -0.000775473691855436, -0.00129561260016767, -0.000823658150090109, 0.000202820163307478, 0.00109799958352443, 0.00111507600735327, 0.000372170181516467, -0.000705767854558937, -0.00115845270589345, -0.00085169095302714, 0.000214515401746918, 0.000962974701448616, 0.00117222417671763, 0.000279228223412667, -0.000573506921643794, -0.00131580625208794, -0.000687123012465516, 4.60680853131981e-05, 0.00130572664577659, 0.000945761797594563, 0.000574758830486531, -0.00120390085058816, -0.00102073775738344, -0.00127591150367829, 0.00110561614477134, 0.000900179777345332, 0.00210921345910639, -0.00114689500827354, -0.000608238934753237, -0.00321976225188782, 0.00155219686067511, 0.000264736945562514, 0.00490201886573625, -0.00291727610982162, -0.000440128243936272, -0.00729922296328759, 0.0084169122843675, 0.00322440748081815, -0.00792676700730901, 0.00301521698077751]
-coefHPF16Hz=[-0.00237931601820237, 0.00900399404616618, -0.0106815684126964, 0.000701625460067716, 0.00534552177493466, 0.00130950459081059, -0.00290596411041387, -0.00269530996119844, 0.0003101654822886, 0.00234103795235814, 0.00167034024769458, -0.000488712640834855, -0.00185035399381838, -0.00131477310230477, 0.000348568611028637, 0.00151019836627096, 0.00121684056544204, -0.000118986110091621, -0.00124247922281758, -0.00121242206142371, -0.000141183909860698, 0.000989634648628976, 0.00122675890437392, 0.00041362906150717, -0.000722175755751171, -0.00121939269820854, -0.000678564525458264, 0.000424279219303317, 0.00116271986736704, 0.000918575133920377, -9.63506221759267e-05, -0.00103640027665953, -0.00111251134537697, -0.000254690056859041, 0.000831825710438497, 0.00123806854623355, 0.000610691788425358, -0.000548380855814594, -0.00127286883460374, -0.000945619026463239, 0.000190911593995839, 0.00120170831186968, 0.0012308722300766, 0.000219900994182947, -0.00101370725722923, -0.00143306960297029, -0.000656491115248931, 0.000705670786925851, 0.00152364864804234, 0.00108432223634968, -0.000290617217023742, -0.00147798688600667, -0.00146099234048883, -0.000206092080187477, 0.00127900266809705, 0.00174183905784552, 0.000748826726173838, -0.000923490875206538, -0.00188489832320635, -0.00129151725633726, 0.00042509235038191, 0.00185550775531445, 0.00177803378558299, 0.000187862097108932, -0.00163094958211123, -0.00215096392373874, -0.00086968996509313, 0.0012060614186431, 0.00235474342662583, 0.00155858808824659, -0.00059257035516425, -0.00234291551633348, -0.002186923188257, -0.000171557789304849, 0.00208524389427416, 0.00267759498553966, 0.00102942690152665, -0.00156991302617918, -0.00295892832189841, -0.00190686352902698, 0.000813746873070253, 0.00296947517584279, 0.00271179510218455, 0.000144561008359719, -0.00266699624892259, -0.00335183061952247, -0.00123435754659135, 0.00203901537492129, 0.00373036984577446, 0.00235979862546231, -0.00109333872204333, -0.00377694040376377, -0.0034004849949668, -0.000121850481121717, 0.00342934582241822, 0.0042421318211168, 0.00150927686021495, -0.00264503583415814, -0.00477402280865594, -0.00295704158903247, 0.00145518243830756, 0.0048645322328678, 0.00433675668084337, 9.38734259156019e-05, -0.0044566759614318, -0.00547016880084912, -0.00190230661540376, 0.00348298173133158, 0.00622168135432998, 0.00382395045400402, -0.00196252187573823, -0.00641854120608551, -0.00568613187445537, -7.15060205204973e-05, 0.00595572677369823, 0.00728784550662773, 0.00249628330136568, -0.00473599484303654, -0.00841093087274982, -0.00516176835846583, 0.00272589789408027, 0.00885117572849767, 0.00784733679995554, 4.68975979992062e-05, -0.008389580540368, -0.0103007278831145, -0.00352036284080053, 0.00685853416054136, 0.0122371934925981, 0.00754828160943225, -0.00410036984962674, -0.0133298778695661, -0.0119453785894453, -3.62727892897721e-05, 0.0132252221287822, 0.0164884909363037, 0.00571184712671261, -0.0114831022544852, -0.0209198537957953, -0.0132199894264576, 0.00745993099082991, 0.0249862383303367, 0.0232473093260964, 2.85732736412405e-05, -0.0284511164884237, -0.0376989106026277, -0.014030743477605, 0.0310947965904428, 0.0635612347162817, 0.0467423895121142, -0.0327461927505904, -0.151317171723621, -0.257515045523331, 0.699973793087898, -0.257515045523331, -0.151317171723621, -0.0327461927505904, 0.0467423895121142, 0.0635612347162817, 0.0310947965904428, -0.014030743477605, -0.0376989106026277, -0.0284511164884237, 2.85732736412405e-05, 0.0232473093260964, 0.0249862383303367, 0.00745993099082991, -0.0132199894264576, -0.0209198537957953, -0.0114831022544852, 0.00571184712671261, 0.0164884909363037, 0.0132252221287822, -3.62727892897721e-05, -0.0119453785894453, -0.0133298778695661, -0.00410036984962674, 0.00754828160943225, 0.0122371934925981, 0.00685853416054136, -0.00352036284080053, -0.0103007278831145, -0.008389580540368, 4.68975979992062e-05, 0.00784733679995554, 0.00885117572849767, 0.00272589789408027, -0.00516176835846583, -0.00841093087274982, -0.00473599484303654, 0.00249628330136568, 0.00728784550662773, 0.00595572677369823, -7.15060205204973e-05, -0.00568613187445537, -0.00641854120608551, -0.00196252187573823, 0.00382395045400402, 0.00622168135432998, 0.00348298173133158, -0.00190230661540376, -0.00547016880084912, -0.0044566759614318, 9.38734259156019e-05, 0.00433675668084337, 0.0048645322328678, 0.00145518243830756, -0.00295704158903247, -0.00477402280865594, -0.00264503583415814, 0.00150927686021495, 0.0042421318211168, 0.00342934582241822, -0.000121850481121717, -0.0034004849949668, -0.00377694040376377, -0.00109333872204333, 0.00235979862546231, 0.00373036984577446, 0.00203901537492129, -0.00123435754659135, -0.00335183061952247, -0.00266699624892259, 0.000144561008359719, 0.00271179510218455, 0.00296947517584279, 0.000813746873070253, -0.00190686352902698, -0.00295892832189841, -0.00156991302617918, 0.00102942690152665, 0.00267759498553966, 0.00208524389427416, -0.000171557789304849, -0.002186923188257, -0.00234291551633348, -0.00059257035516425, 0.00155858808824659, 0.00235474342662583, 0.0012060614186431, -0.00086968996509313, -0.00215096392373874, -0.00163094958211123, 0.000187862097108932, 0.00177803378558299, 0.00185550775531445, 0.00042509235038191, -0.00129151725633726, -0.00188489832320635, -0.000923490875206538, 0.000748826726173838, 0.00174183905784552, 0.00127900266809705, -0.000206092080187477, -0.00146099234048883, -0.00147798688600667, -0.000290617217023742, 0.00108432223634968, 0.00152364864804234, 0.000705670786925851, -0.000656491115248931, -0.00143306960297029, -0.00101370725722923, 0.000219900994182947, 0.0012308722300766, 0.00120170831186968, 0.000190911593995839, -0.000945619026463239, -0.00127286883460374, -0.000548380855814594, 0.000610691788425358, 0.00123806854623355, 0.000831825710438497, -0.000254690056859041, -0.00111251134537697, -0.00103640027665953, -9.63506221759267e-05, 0.000918575133920377, 0.00116271986736704, 0.000424279219303317, -0.000678564525458264, -0.00121939269820854, -0.000722175755751171, 0.00041362906150717, 0.00122675890437392, 0.000989634648628976, -0.000141183909860698, -0.00121242206142371, -0.00124247922281758, -0.000118986110091621, 0.00121684056544204, 0.00151019836627096, 0.000348568611028637, -0.00131477310230477, -0.00185035399381838, -0.000488712640834855, 0.00167034024769458, 0.00234103795235814, 0.0003101654822886, -0.00269530996119844, -0.00290596411041387, 0.00130950459081059, 0.00534552177493466, 0.000701625460067716, -0.0106815684126964, 0.00900399404616618, -0.00237931601820237]
-coefHPF17Hz=[0.0012365033943574, -0.00650495313760725, 0.0112657897917822, -0.00545052782086388, -0.00453533806492364, 0.0025597779774879, 0.00378013408225201, -5.09406456585378e-05, -0.00282548963403691, -0.00176401729328725, 0.0010158792656798, 0.00220682423281277, 0.00089693365479365, -0.00114057721229816, -0.00175715990123769, -0.000549208502785484, 0.00106891526249826, 0.00149021989446532, 0.000433079426744538, -0.000958285785617511, -0.00134226761691957, -0.000427278936064382, 0.000844999963027367, 0.00126388061026149, 0.00048030293305792, -0.000729996712323531, -0.00122925640803069, -0.000569216257351346, 0.000614963274873436, 0.00121685215456624, 0.000680635577977683, -0.000493673949758267, -0.0012142611583647, -0.000806977797985776, 0.000361431671458106, 0.00121229148724184, 0.000943301428473818, -0.000216190471688604, -0.00120110940895411, -0.00108544671245499, 5.25725372480579e-05, 0.00117684465823156, 0.00122955910415632, 0.000128200694861344, -0.00113069653531767, -0.00137122417260241, -0.000331168064064048, 0.00106094975161862, 0.00150785517162784, 0.000552116671178057, -0.000962964571302024, -0.00163214062995658, -0.000790335545885852, 0.000832086787688012, 0.00173869513574305, 0.00104399520409176, -0.000665917665304141, -0.00182084561690362, -0.00130887977003285, 0.000459671380736321, 0.00187352945276994, 0.0015825990121321, -0.000215458603424357, -0.00188907819526946, -0.00185646109608286, -7.20799915657043e-05, 0.00186211669320879, 0.00212802594712154, 0.00039777741891469, -0.00178607707048203, -0.00238682257251117, -0.000762565368044926, 0.00165688736386125, 0.00262432672228621, 0.00115982838172672, -0.0014652218846932, -0.00283024609374149, -0.00158883362037626, 0.00120757997182653, 0.00299512104214098, 0.00204382355787988, -0.000878627505950991, -0.00311234544625287, -0.00251631084242339, 0.000479585872168053, 0.00316674289214672, 0.00299837746795486, -7.45352520412655e-06, -0.00315086325821673, -0.00347451298453897, -0.000540050046910655, 0.00305001557280356, 0.00393828330465183, 0.00115893438503109, -0.00285327851394196, -0.00437487829345434, -0.00184971597653862, 0.00255430099119237, 0.00476718776283316, 0.00260756799644473, -0.00214113965343155, -0.00510268855417588, -0.00341949289511367, 0.0015970356823213, 0.00536690524446621, 0.00427567587745326, -0.000909635699237714, -0.00553733292950289, -0.00517955005276133, 8.4163763285583e-05, 0.00558220819565741, 0.00612480173540848, 0.000896040596058786, -0.0054969313447824, -0.00707761326928708, -0.00205374178279297, 0.00524907939869288, 0.00804149508173806, 0.00338710067788109, -0.00479782803591959, -0.00899811495114069, -0.00493810201712643, 0.00412679128659782, 0.00993550480878676, 0.00671481634368227, -0.00317163387655693, -0.010838269012745, -0.00877567801527228, 0.00188204623671036, 0.0116889545027245, 0.0111772464895782, -0.00014292596193922, -0.0124763202430451, -0.0140551302541446, -0.00218209626276934, 0.013194060341813, 0.0175960857914345, 0.00536425908631834, -0.0138172052301636, -0.0222043295519587, -0.00991893974425883, 0.0143457953498856, 0.0287164433932044, 0.0169629650501336, -0.0147646999548366, -0.0392476289825817, -0.0295628581183962, 0.0150715610478475, 0.0610349552220766, 0.0599694083708938, -0.0152574074783789, -0.144803807456611, -0.26767161137901, 0.681983915345696, -0.26767161137901, -0.144803807456611, -0.0152574074783789, 0.0599694083708938, 0.0610349552220766, 0.0150715610478475, -0.0295628581183962, -0.0392476289825817, -0.0147646999548366, 0.0169629650501336, 0.0287164433932044, 0.0143457953498856, -0.00991893974425883, -0.0222043295519587, -0.0138172052301636, 0.00536425908631834, 0.0175960857914345, 0.013194060341813, -0.00218209626276934, -0.0140551302541446, -0.0124763202430451, -0.00014292596193922, 0.0111772464895782, 0.0116889545027245, 0.00188204623671036, -0.00877567801527228, -0.010838269012745, -0.00317163387655693, 0.00671481634368227, 0.00993550480878676, 0.00412679128659782, -0.00493810201712643, -0.00899811495114069, -0.00479782803591959, 0.00338710067788109, 0.00804149508173806, 0.00524907939869288, -0.00205374178279297, -0.00707761326928708, -0.0054969313447824, 0.000896040596058786, 0.00612480173540848, 0.00558220819565741, 8.4163763285583e-05, -0.00517955005276133, -0.00553733292950289, -0.000909635699237714, 0.00427567587745326, 0.00536690524446621, 0.0015970356823213, -0.00341949289511367, -0.00510268855417588, -0.00214113965343155, 0.00260756799644473, 0.00476718776283316, 0.00255430099119237, -0.00184971597653862, -0.00437487829345434, -0.00285327851394196, 0.00115893438503109, 0.00393828330465183, 0.00305001557280356, -0.000540050046910655, -0.00347451298453897, -0.00315086325821673, -7.45352520412655e-06, 0.00299837746795486, 0.00316674289214672, 0.000479585872168053, -0.00251631084242339, -0.00311234544625287, -0.000878627505950991, 0.00204382355787988, 0.00299512104214098, 0.00120757997182653, -0.00158883362037626, -0.00283024609374149, -0.0014652218846932, 0.00115982838172672, 0.00262432672228621, 0.00165688736386125, -0.000762565368044926, -0.00238682257251117, -0.00178607707048203, 0.00039777741891469, 0.00212802594712154, 0.00186211669320879, -7.20799915657043e-05, -0.00185646109608286, -0.00188907819526946, -0.000215458603424357, 0.0015825990121321, 0.00187352945276994, 0.000459671380736321, -0.00130887977003285, -0.00182084561690362, -0.000665917665304141, 0.00104399520409176, 0.00173869513574305, 0.000832086787688012, -0.000790335545885852, -0.00163214062995658, -0.000962964571302024, 0.000552116671178057, 0.00150785517162784, 0.00106094975161862, -0.000331168064064048, -0.00137122417260241, -0.00113069653531767, 0.000128200694861344, 0.00122955910415632, 0.00117684465823156, 5.25725372480579e-05, -0.00108544671245499, -0.00120110940895411, -0.000216190471688604, 0.000943301428473818, 0.00121229148724184, 0.000361431671458106, -0.000806977797985776, -0.0012142611583647, -0.000493673949758267, 0.000680635577977683, 0.00121685215456624, 0.000614963274873436, -0.000569216257351346, -0.00122925640803069, -0.000729996712323531, 0.00048030293305792, 0.00126388061026149, 0.000844999963027367, -0.000427278936064382, -0.00134226761691957, -0.000958285785617511, 0.000433079426744538, 0.00149021989446532, 0.00106891526249826, -0.000549208502785484, -0.00175715990123769, -0.00114057721229816, 0.00089693365479365, 0.00220682423281277, 0.0010158792656798, -0.00176401729328725, -0.00282548963403691, -5.09406456585378e-05, 0.00378013408225201, 0.0025597779774879, -0.00453533806492364, -0.00545052782086388, 0.0112657897917822, -0.00650495313760725, 0.0012365033943574]
-coefHPF18Hz=[-0.000126640650947928, 0.00307226847406512, -0.0093677694896887, 0.0100705882639118, -0.000549740162524821, -0.0052169202395133, -0.000639239350552179, 0.00329837145815226, 0.00194499423172231, -0.00146419652078385, -0.00240661291447705, -0.000376880247467955, 0.00174062281092289, 0.00159037696904012, -0.000293960754848135, -0.00162938198735952, -0.00106040434238305, 0.000587159479880719, 0.00146841595252625, 0.000730544913851335, -0.00072276117490842, -0.00133423097624084, -0.000525417346631506, 0.000794136618289647, 0.00124365087814229, 0.000391215348023023, -0.00084463145170471, -0.00118659184169097, -0.000300434035235968, 0.000890037705674725, 0.00116083967414836, 0.000232000265463072, -0.000941080713266043, -0.00115416908077084, -0.000177617249530848, 0.000999321489993615, 0.00116494646741111, 0.000128044141523605, -0.00106518821412868, -0.0011889540121914, -8.17506069681131e-05, 0.00114405113816895, 0.00122072928856848, 3.32002636386573e-05, -0.00123071313810652, -0.00126206745010968, 1.99232305383199e-05, 0.00132872798626801, 0.00130727032402606, -7.82460638048705e-05, -0.00143767227424241, -0.00135357990523369, 0.000142783703381238, 0.00155300735286952, 0.00140467297101629, -0.000214459722183816, -0.00167680145578734, -0.00145902107032218, 0.000292641422331602, 0.0018123632996368, 0.00151384686048169, -0.000378179488608171, -0.00195870656335655, -0.00157099149360557, 0.000474014793637582, 0.00211682717296166, 0.00162796630519524, -0.000581668373425948, -0.00228523658733858, -0.00168351658582368, 0.000700290246864907, 0.00246288030588164, 0.00173911082312189, -0.000828747663110708, -0.00265278598398067, -0.00179648358148876, 0.000970780442589481, 0.00285674918306326, 0.00185397565028217, -0.00112911069582476, -0.00307511325863465, -0.00190814615678215, 0.00130242173975369, 0.00330779129349733, 0.00196067088128746, -0.00149204022625459, -0.00355546858750926, -0.00201406614322798, 0.00170004558586814, 0.00382276124511021, 0.00206690656189328, -0.00192900724983085, -0.00411322567527027, -0.00211814956652149, 0.00218433024868653, 0.00442664551197452, 0.00216678719402776, -0.00246745158066377, -0.00476556441596092, -0.00221337562894499, 0.00277947547152157, 0.00513715001458008, 0.0022598923928225, -0.00312960411711233, -0.00554629141149575, -0.00230430575530586, 0.00352466692883694, 0.00599854860032048, 0.00234385772061955, -0.00396913552807772, -0.00650104305182713, -0.0023830171420573, 0.00447373512790638, 0.00706857719774916, 0.00242121466120967, -0.00505456683695259, -0.00771711716774892, -0.0024552251817519, 0.00573173509212882, 0.00846191114989692, 0.00248464570787812, -0.00652379837674433, -0.00933430463851967, -0.00251590850641498, 0.00747362310262912, 0.0103757849943642, 0.00254745019286163, -0.00863996190529781, -0.0116402208715405, -0.00257386066969175, 0.0100884429153784, 0.0132314886536111, 0.00259296025344684, -0.0119455115190711, -0.0153062207801792, -0.00261114026860836, 0.0144547230928375, 0.0181068427447107, 0.00262846605819877, -0.0179986667308499, -0.0221723799233146, -0.00263909838578042, 0.0234403326400083, 0.0286200090836806, 0.00265305107916392, -0.0329191006590767, -0.0405180983087341, -0.00265516721494081, 0.0536655913236677, 0.0701373697515962, 0.00266604325967432, -0.136450367952606, -0.276969931955982, 0.66400722442938, -0.276969931955982, -0.136450367952606, 0.00266604325967432, 0.0701373697515962, 0.0536655913236677, -0.00265516721494081, -0.0405180983087341, -0.0329191006590767, 0.00265305107916392, 0.0286200090836806, 0.0234403326400083, -0.00263909838578042, -0.0221723799233146, -0.0179986667308499, 0.00262846605819877, 0.0181068427447107, 0.0144547230928375, -0.00261114026860836, -0.0153062207801792, -0.0119455115190711, 0.00259296025344684, 0.0132314886536111, 0.0100884429153784, -0.00257386066969175, -0.0116402208715405, -0.00863996190529781, 0.00254745019286163, 0.0103757849943642, 0.00747362310262912, -0.00251590850641498, -0.00933430463851967, -0.00652379837674433, 0.00248464570787812, 0.00846191114989692, 0.00573173509212882, -0.0024552251817519, -0.00771711716774892, -0.00505456683695259, 0.00242121466120967, 0.00706857719774916, 0.00447373512790638, -0.0023830171420573, -0.00650104305182713, -0.00396913552807772, 0.00234385772061955, 0.00599854860032048, 0.00352466692883694, -0.00230430575530586, -0.00554629141149575, -0.00312960411711233, 0.0022598923928225, 0.00513715001458008, 0.00277947547152157, -0.00221337562894499, -0.00476556441596092, -0.00246745158066377, 0.00216678719402776, 0.00442664551197452, 0.00218433024868653, -0.00211814956652149, -0.00411322567527027, -0.00192900724983085, 0.00206690656189328, 0.00382276124511021, 0.00170004558586814, -0.00201406614322798, -0.00355546858750926, -0.00149204022625459, 0.00196067088128746, 0.00330779129349733, 0.00130242173975369, -0.00190814615678215, -0.00307511325863465, -0.00112911069582476, 0.00185397565028217, 0.00285674918306326, 0.000970780442589481, -0.00179648358148876, -0.00265278598398067, -0.000828747663110708, 0.00173911082312189, 0.00246288030588164, 0.000700290246864907, -0.00168351658582368, -0.00228523658733858, -0.000581668373425948, 0.00162796630519524, 0.00211682717296166, 0.000474014793637582, -0.00157099149360557, -0.00195870656335655, -0.000378179488608171, 0.00151384686048169, 0.0018123632996368, 0.000292641422331602, -0.00145902107032218, -0.00167680145578734, -0.000214459722183816, 0.00140467297101629, 0.00155300735286952, 0.000142783703381238, -0.00135357990523369, -0.00143767227424241, -7.82460638048705e-05, 0.00130727032402606, 0.00132872798626801, 1.99232305383199e-05, -0.00126206745010968, -0.00123071313810652, 3.32002636386573e-05, 0.00122072928856848, 0.00114405113816895, -8.17506069681131e-05, -0.0011889540121914, -0.00106518821412868, 0.000128044141523605, 0.00116494646741111, 0.000999321489993615, -0.000177617249530848, -0.00115416908077084, -0.000941080713266043, 0.000232000265463072, 0.00116083967414836, 0.000890037705674725, -0.000300434035235968, -0.00118659184169097, -0.00084463145170471, 0.000391215348023023, 0.00124365087814229, 0.000794136618289647, -0.000525417346631506, -0.00133423097624084, -0.00072276117490842, 0.000730544913851335, 0.00146841595252625, 0.000587159479880719, -0.00106040434238305, -0.00162938198735952, -0.000293960754848135, 0.00159037696904012, 0.00174062281092289, -0.000376880247467955, -0.00240661291447705, -0.00146419652078385, 0.00194499423172231, 0.00329837145815226, -0.000639239350552179, -0.0052169202395133, -0.000549740162524821, 0.0100705882639118, -0.0093677694896887, 0.00307226847406512, -0.000126640650947928]
-coefHPF19Hz=[-0.00114455720878403, 0.002278484242247, 0.00193540529974609, -0.0100295035724979, 0.00993269320657439, -0.0006168727113007, -0.00255451755884077, -0.0024734986292784, 0.00200847757533551, 0.00226609923020049, -9.76358991275699e-05, -0.00207025813213102, -0.00111507678789578, 0.00100766444180908, 0.00167678225949984, 0.000278183934957038, -0.00129777022433468, -0.00122083189862881, 0.000261239953437484, 0.00133692376982679, 0.000811643370437491, -0.000611061213736446, -0.00127127163182578, -0.000460764006856783, 0.000846381371833951, 0.00116140753009656, 0.000152523911490442, -0.00101348547923993, -0.00102281496307819, 0.000127216571893969, 0.00113363220978333, 0.000859874933275175, -0.000390019998630695, -0.00121422468075567, -0.000672211611492913, 0.000643278653721441, 0.00125471801449337, 0.000454957850400388, -0.000883541011361318, -0.00125300912152489, -0.000207418993524812, 0.00110735334813658, 0.00120453143637425, -6.99453300060208e-05, -0.0013101108558109, -0.00110032722843036, 0.000374357065752891, 0.00147902035117252, 0.000936000222006313, -0.000698164459812214, -0.00160171401078841, -0.000710159502337688, 0.00103180816814698, 0.00166654046988351, 0.000420939077015609, -0.00136053907926495, -0.0016603765056379, -7.36480941414761e-05, 0.0016664337400929, 0.00157557668462067, -0.000321647113113003, -0.00193493738716264, -0.00140705891764464, 0.00075575535920874, 0.00215098926595974, 0.00114804528905567, -0.00121544499772433, -0.00229555946515131, -0.00079644981470156, 0.00168202027955574, 0.00234985572626759, 0.000357543916343903, -0.00213429086862089, -0.00229916829608391, 0.000159518189851863, 0.00254923843067228, 0.00213305610276442, -0.000742483748562455, -0.00290319798015959, -0.0018437918157643, 0.00137488563261061, 0.003172806518155, 0.0014263058299032, -0.00203646621195744, -0.00333373708149125, -0.00087904868153668, 0.00270175344636167, 0.00336065155098285, 0.000207521174466626, -0.00333826114774027, -0.00323280728983717, 0.000572968588261254, 0.00391348632265639, 0.00293756820369936, -0.0014441053975073, -0.00439814843514594, -0.00246325988240958, 0.00238748918339617, 0.00475763611018474, 0.00179821288047947, -0.00337433454077348, -0.00495326658624769, -0.000940326732832582, 0.00436564767334445, 0.00495245036598415, -0.000102522005744643, -0.00532339633721428, -0.004726801765202, 0.00132057747209155, 0.00620879975383775, 0.00424554319924106, -0.00270251872689604, -0.00697251981165338, -0.00347783032183421, 0.00422585443182694, 0.00755862481959421, 0.00239980585417615, -0.00585737471090568, -0.00791693205100323, -0.00098942778490759, 0.00756698180581293, 0.00799357093827036, -0.00078600916884257, -0.00932049328967378, -0.00771602716234739, 0.00296046812749869, 0.0110709378592033, 0.00700458050301572, -0.00556857913554967, -0.0127819834965408, -0.00576231840674372, 0.00868183577249715, 0.014421048769118, 0.00383924361332089, -0.0124303376184629, -0.0159351168418258, -0.00101303135379388, 0.0170441899694062, 0.0172849173009482, -0.00311652463983388, -0.0230012348411318, -0.0184486389783009, 0.00941380950752916, 0.0313849712519976, 0.0193853064859289, -0.0199870688639268, -0.0452176766263102, -0.020072161612984, 0.0420539787932305, 0.0767398206267142, 0.0204903308189746, -0.12635493601322, -0.285375075258341, 0.646029694923968, -0.285375075258341, -0.12635493601322, 0.0204903308189746, 0.0767398206267142, 0.0420539787932305, -0.020072161612984, -0.0452176766263102, -0.0199870688639268, 0.0193853064859289, 0.0313849712519976, 0.00941380950752916, -0.0184486389783009, -0.0230012348411318, -0.00311652463983388, 0.0172849173009482, 0.0170441899694062, -0.00101303135379388, -0.0159351168418258, -0.0124303376184629, 0.00383924361332089, 0.014421048769118, 0.00868183577249715, -0.00576231840674372, -0.0127819834965408, -0.00556857913554967, 0.00700458050301572, 0.0110709378592033, 0.00296046812749869, -0.00771602716234739, -0.00932049328967378, -0.00078600916884257, 0.00799357093827036, 0.00756698180581293, -0.00098942778490759, -0.00791693205100323, -0.00585737471090568, 0.00239980585417615, 0.00755862481959421, 0.00422585443182694, -0.00347783032183421, -0.00697251981165338, -0.00270251872689604, 0.00424554319924106, 0.00620879975383775, 0.00132057747209155, -0.004726801765202, -0.00532339633721428, -0.000102522005744643, 0.00495245036598415, 0.00436564767334445, -0.000940326732832582, -0.00495326658624769, -0.00337433454077348, 0.00179821288047947, 0.00475763611018474, 0.00238748918339617, -0.00246325988240958, -0.00439814843514594, -0.0014441053975073, 0.00293756820369936, 0.00391348632265639, 0.000572968588261254, -0.00323280728983717, -0.00333826114774027, 0.000207521174466626, 0.00336065155098285, 0.00270175344636167, -0.00087904868153668, -0.00333373708149125, -0.00203646621195744, 0.0014263058299032, 0.003172806518155, 0.00137488563261061, -0.0018437918157643, -0.00290319798015959, -0.000742483748562455, 0.00213305610276442, 0.00254923843067228, 0.000159518189851863, -0.00229916829608391, -0.00213429086862089, 0.000357543916343903, 0.00234985572626759, 0.00168202027955574, -0.00079644981470156, -0.00229555946515131, -0.00121544499772433, 0.00114804528905567, 0.00215098926595974, 0.00075575535920874, -0.00140705891764464, -0.00193493738716264, -0.000321647113113003, 0.00157557668462067, 0.0016664337400929, -7.36480941414761e-05, -0.0016603765056379, -0.00136053907926495, 0.000420939077015609, 0.00166654046988351, 0.00103180816814698, -0.000710159502337688, -0.00160171401078841, -0.000698164459812214, 0.000936000222006313, 0.00147902035117252, 0.000374357065752891, -0.00110032722843036, -0.0013101108558109, -6.99453300060208e-05, 0.00120453143637425, 0.00110735334813658, -0.000207418993524812, -0.00125300912152489, -0.000883541011361318, 0.000454957850400388, 0.00125471801449337, 0.000643278653721441, -0.000672211611492913, -0.00121422468075567, -0.000390019998630695, 0.000859874933275175, 0.00113363220978333, 0.000127216571893969, -0.00102281496307819, -0.00101348547923993, 0.000152523911490442, 0.00116140753009656, 0.000846381371833951, -0.000460764006856783, -0.00127127163182578, -0.000611061213736446, 0.000811643370437491, 0.00133692376982679, 0.000261239953437484, -0.00122083189862881, -0.00129777022433468, 0.000278183934957038, 0.00167678225949984, 0.00100766444180908, -0.00111507678789578, -0.00207025813213102, -9.76358991275699e-05, 0.00226609923020049, 0.00200847757533551, -0.0024734986292784, -0.00255451755884077, -0.0006168727113007, 0.00993269320657439, -0.0100295035724979, 0.00193540529974609, 0.002278484242247, -0.00114455720878403]
-coefHPF20Hz=[0.00169100639331132, -0.00683192957060817, 0.0103671341762725, -0.00499782854364536, -0.00370199577076154, 0.00316569894975366, 0.00282127072031868, -0.00162332654016828, -0.00264106407642509, 0.000254797447229898, 0.00224440974469436, 0.000873936836193085, -0.0014459523693275, -0.00155378216473711, 0.000361641276331126, 0.00159953076303722, 0.000676025123530365, -0.00101994526096304, -0.00129763995070717, 6.85771019450657e-05, 0.00126526013715229, 0.000823404661678758, -0.000620780437746826, -0.0012403214630185501, -0.000304017378689203, 0.000982710555359604, 0.0010309140299889, -0.000195059523993476, -0.0011693687798776, -0.00069665472673578, 0.000638218033780612, 0.00119135293319004, 0.000275320765202797, -0.000994173153002551, -0.0010513744481423, 0.000193684036124422, 0.00122530260027649, 0.000760730023697608, -0.000661494004752835, -0.00130170736213936, -0.000341252960152723, 0.00107337690705149, 0.00119854645722755, -0.000164348717724196, -0.001371251378405, -0.000913668419718686, 0.000701537860534735, 0.00150330485875225, 0.000460737975323732, -0.00119832776302353, -0.00142867563049745, 0.000114378208072727, 0.0015798321686969, 0.0011341613171217, -0.000747826875647445, -0.00177701920955089, -0.000629420865757724, 0.0013544703338478, 0.0017326984208307, -3.80785472967481e-05, -0.00183944799102514, -0.00142206694032861, 0.000791757056198648, 0.00211380291808043, 0.000854444109992597, -0.00152865527262978, -0.00210985352037011, -8.21989820165414e-05, 0.00214198231757543, 0.00179090032827964, -0.000813888180732012, -0.00252195617676464, -0.00115762195160994, 0.00171679350650212, 0.00257970705698561, 0.00025809587157694, -0.00249346611154458, -0.00225802801585434, 0.00081008397138604, 0.00300992534171787, 0.00155188626928081, -0.00191408457164539, -0.00315047038910916, -0.000511554560709645, 0.00289324451654757, 0.00284490081421222, -0.000759165921361551, -0.00358873929814055, -0.00206999375450073, 0.00210583493325288, 0.00385815721572007, 0.000872497504976665, -0.0033497691405006, -0.00359550633948431, 0.000640605473803225, 0.00429034539334143, 0.00275717677768337, -0.00229580017549439, -0.00474398081201068, -0.00137678900036172, 0.00387567210548956, 0.0045694274840313, -0.000428537244602358, -0.0051500972619817, -0.00368526350333956, 0.00247214427386533, 0.00588181121034287, 0.00210741385030976, -0.00451907270780747, -0.00586120078252655, 6.46414521845364e-05, 0.00626338441127331, 0.00497300320573371, -0.00264070482858492, -0.00740469832899132, -0.00317093131160933, 0.00532233042777549, 0.00768231646838019, 0.000524133718752974, -0.00777956385724469, -0.0068576140689711, 0.0027780070620006, 0.0096133384382404, 0.00481732469146741, -0.00644568059205665, -0.0104365135421076, -0.00152840324112575, 0.0100669728767397, 0.00988467317280051, -0.00288932216528362, -0.0131817741394375, -0.00764433790906511, 0.00823435243577612, 0.0152366140420481, 0.00343760612476855, -0.0141611160124927, -0.0156255223860203, 0.00297567093387695, 0.0202718212670757, 0.013621473690266, -0.0119708961294046, -0.0261113599300405, -0.00814543927376884, 0.0243968813803917, 0.0312313545504983, -0.00302682755903806, -0.0429491700596792, -0.0352192569685019, 0.0271044371148745, 0.0794375489194804, 0.0377515381029876, -0.11464060453725, -0.292882411796976, 0.628043016072477, -0.292882411796976, -0.11464060453725, 0.0377515381029876, 0.0794375489194804, 0.0271044371148745, -0.0352192569685019, -0.0429491700596792, -0.00302682755903806, 0.0312313545504983, 0.0243968813803917, -0.00814543927376884, -0.0261113599300405, -0.0119708961294046, 0.013621473690266, 0.0202718212670757, 0.00297567093387695, -0.0156255223860203, -0.0141611160124927, 0.00343760612476855, 0.0152366140420481, 0.00823435243577612, -0.00764433790906511, -0.0131817741394375, -0.00288932216528362, 0.00988467317280051, 0.0100669728767397, -0.00152840324112575, -0.0104365135421076, -0.00644568059205665, 0.00481732469146741, 0.0096133384382404, 0.0027780070620006, -0.0068576140689711, -0.00777956385724469, 0.000524133718752974, 0.00768231646838019, 0.00532233042777549, -0.00317093131160933, -0.00740469832899132, -0.00264070482858492, 0.00497300320573371, 0.00626338441127331, 6.46414521845364e-05, -0.00586120078252655, -0.00451907270780747, 0.00210741385030976, 0.00588181121034287, 0.00247214427386533, -0.00368526350333956, -0.0051500972619817, -0.000428537244602358, 0.0045694274840313, 0.00387567210548956, -0.00137678900036172, -0.00474398081201068, -0.00229580017549439, 0.00275717677768337, 0.00429034539334143, 0.000640605473803225, -0.00359550633948431, -0.0033497691405006, 0.000872497504976665, 0.00385815721572007, 0.00210583493325288, -0.00206999375450073, -0.00358873929814055, -0.000759165921361551, 0.00284490081421222, 0.00289324451654757, -0.000511554560709645, -0.00315047038910916, -0.00191408457164539, 0.00155188626928081, 0.00300992534171787, 0.00081008397138604, -0.00225802801585434, -0.00249346611154458, 0.00025809587157694, 0.00257970705698561, 0.00171679350650212, -0.00115762195160994, -0.00252195617676464, -0.000813888180732012, 0.00179090032827964, 0.00214198231757543, -8.21989820165414e-05, -0.00210985352037011, -0.00152865527262978, 0.000854444109992597, 0.00211380291808043, 0.000791757056198648, -0.00142206694032861, -0.00183944799102514, -3.80785472967481e-05, 0.0017326984208307, 0.0013544703338478, -0.000629420865757724, -0.00177701920955089, -0.000747826875647445, 0.0011341613171217, 0.0015798321686969, 0.000114378208072727, -0.00142867563049745, -0.00119832776302353, 0.000460737975323732, 0.00150330485875225, 0.000701537860534735, -0.000913668419718686, -0.001371251378405, -0.000164348717724196, 0.00119854645722755, 0.00107337690705149, -0.000341252960152723, -0.00130170736213936, -0.000661494004752835, 0.000760730023697608, 0.00122530260027649, 0.000193684036124422, -0.0010513744481423, -0.000994173153002551, 0.000275320765202797, 0.00119135293319004, 0.000638218033780612, -0.00069665472673578, -0.0011693687798776, -0.000195059523993476, 0.0010309140299889, 0.000982710555359604, -0.000304017378689203, -0.0012403214630185501, -0.000620780437746826, 0.000823404661678758, 0.00126526013715229, 6.85771019450657e-05, -0.00129763995070717, -0.00101994526096304, 0.000676025123530365, 0.00159953076303722, 0.000361641276331126, -0.00155378216473711, -0.0014459523693275, 0.000873936836193085, 0.00224440974469436, 0.000254797447229898, -0.00264106407642509, -0.00162332654016828, 0.00282127072031868, 0.00316569894975366, -0.00370199577076154, -0.00499782854364536, 0.0103671341762725, -0.00683192957060817, 0.00169100639331132]
-coefHPF21Hz=[-0.000806720190438947, 0.00454147817375884, -0.00948324260415514, 0.00840912226877668, 3.29731564715611e-05, -0.00491161077951185, 0.000276599024523076, 0.00347340310061073, 0.000390255761317232, -0.00259095681117467, -0.00110871859674854, 0.00172946472599387, 0.00161906962991572, -0.000778230986076926, -0.00176631970820152, -0.000178050052959165, 0.00148879766194688, 0.000951800793757428, -0.000839410434285773, -0.00135484003540159, 1.21407891772044e-06, 0.00127520333730534, 0.000767262515752139, -0.000750857922088209, -0.00120576109462884, -3.00486534814383e-05, 0.00115973158760894, 0.000773866036653834, -0.000645092195278706, -0.00119000416973426, -0.000137150547992098, 0.00110269472064554, 0.000869869920824875, -0.000535243734225088, -0.00123872807474517, -0.000287578857976311, 0.00106924990989521, 0.00101569479591087, -0.000408143920438144, -0.00132096378438597, -0.000474229440580144, 0.0010362413746884, 0.00119633330822727, -0.000256211553062831, -0.00141250768748602, -0.000700003533581664, 0.000988332922123931, 0.00140126500200899, -6.75053248112123e-05, -0.00150448493960728, -0.000958784609192911, 0.000909935873715136, 0.00162120966485995, 0.000161915376739683, -0.00157600564648795, -0.00125196213986755, 0.000785887167940613, 0.0018448061803193, 0.000446538683262655, -0.0016179835222192, -0.00157881572127157, 0.000604400384178118, 0.00206605400373146, 0.00078749157900911, -0.00161522867192299, -0.0019370484726657, 0.000357505664531806, 0.00227164753824943, 0.001188911360402, -0.00155765384329323, -0.00231551957090264, 3.5447494418765e-05, 0.00244699196582021, 0.00164546174300326, -0.00142260651918339, -0.00270436059864585, -0.000374127454712741, 0.00257061608423822, 0.00216608412974902, -0.00119739471115807, -0.00309479618213142, -0.000880976897526193, 0.00263299925285113, 0.00274109824614893, -0.000867837557643062, -0.00346913074353002, -0.00148768371169372, 0.00260809837680545, 0.00336176381332895, -0.000410596798107255, -0.00380905746174983, -0.00220433325204068, 0.00247131610260815, 0.00402460981789304, 0.000191951300375669, -0.00409567817591158, -0.00303735193049533, 0.00219974810476485, 0.00471891716361695, 0.00095619384325568, -0.00430175572490558, -0.00399039608818724, 0.00176192846067579, 0.00542636949645628, 0.00191189617315885, -0.00439582439292098, -0.005074006617551, 0.00111599018975198, 0.00613812580925154, 0.00309247125536388, -0.00434791095995382, -0.00629747312200607, 0.000213951960728378, 0.00683866803291466, 0.00453375853620364, -0.00409392246383201, -0.00769492336019613, -0.00101112904410706, 0.00750093157336024, 0.00633003970162698, -0.0035855275104954, -0.00930570433192944, -0.00267212357689773, 0.00812093942131798, 0.00858906608396764, -0.00271399722940362, -0.0112090663845191, -0.00496547960086621, 0.00867624217976158, 0.0115525783406659, -0.00129152673095171, -0.0136013745346846, -0.00825389637091388, 0.00915674722148564, 0.01571028584971, 0.00104275252429642, -0.0168866071927738, -0.0133678256528954, 0.00953888997751901, 0.0222748046767274, 0.0052354476149873, -0.0222213650669226, -0.0226577253949056, 0.00982346096842119, 0.0351717709439901, 0.0145373939514958, -0.0340401084076324, -0.0463566117973666, 0.00999768523208009, 0.0780983263405584, 0.0539335221038965, -0.101467814022677, -0.299453575253996, 0.610056784025202, -0.299453575253996, -0.101467814022677, 0.0539335221038965, 0.0780983263405584, 0.00999768523208009, -0.0463566117973666, -0.0340401084076324, 0.0145373939514958, 0.0351717709439901, 0.00982346096842119, -0.0226577253949056, -0.0222213650669226, 0.0052354476149873, 0.0222748046767274, 0.00953888997751901, -0.0133678256528954, -0.0168866071927738, 0.00104275252429642, 0.01571028584971, 0.00915674722148564, -0.00825389637091388, -0.0136013745346846, -0.00129152673095171, 0.0115525783406659, 0.00867624217976158, -0.00496547960086621, -0.0112090663845191, -0.00271399722940362, 0.00858906608396764, 0.00812093942131798, -0.00267212357689773, -0.00930570433192944, -0.0035855275104954, 0.00633003970162698, 0.00750093157336024, -0.00101112904410706, -0.00769492336019613, -0.00409392246383201, 0.00453375853620364, 0.00683866803291466, 0.000213951960728378, -0.00629747312200607, -0.00434791095995382, 0.00309247125536388, 0.00613812580925154, 0.00111599018975198, -0.005074006617551, -0.00439582439292098, 0.00191189617315885, 0.00542636949645628, 0.00176192846067579, -0.00399039608818724, -0.00430175572490558, 0.00095619384325568, 0.00471891716361695, 0.00219974810476485, -0.00303735193049533, -0.00409567817591158, 0.000191951300375669, 0.00402460981789304, 0.00247131610260815, -0.00220433325204068, -0.00380905746174983, -0.000410596798107255, 0.00336176381332895, 0.00260809837680545, -0.00148768371169372, -0.00346913074353002, -0.000867837557643062, 0.00274109824614893, 0.00263299925285113, -0.000880976897526193, -0.00309479618213142, -0.00119739471115807, 0.00216608412974902, 0.00257061608423822, -0.000374127454712741, -0.00270436059864585, -0.00142260651918339, 0.00164546174300326, 0.00244699196582021, 3.5447494418765e-05, -0.00231551957090264, -0.00155765384329323, 0.001188911360402, 0.00227164753824943, 0.000357505664531806, -0.0019370484726657, -0.00161522867192299, 0.00078749157900911, 0.00206605400373146, 0.000604400384178118, -0.00157881572127157, -0.0016179835222192, 0.000446538683262655, 0.0018448061803193, 0.000785887167940613, -0.00125196213986755, -0.00157600564648795, 0.000161915376739683, 0.00162120966485995, 0.000909935873715136, -0.000958784609192911, -0.00150448493960728, -6.75053248112123e-05, 0.00140126500200899, 0.000988332922123931, -0.000700003533581664, -0.00141250768748602, -0.000256211553062831, 0.00119633330822727, 0.0010362413746884, -0.000474229440580144, -0.00132096378438597, -0.000408143920438144, 0.00101569479591087, 0.00106924990989521, -0.000287578857976311, -0.00123872807474517, -0.000535243734225088, 0.000869869920824875, 0.00110269472064554, -0.000137150547992098, -0.00119000416973426, -0.000645092195278706, 0.000773866036653834, 0.00115973158760894, -3.00486534814383e-05, -0.00120576109462884, -0.000750857922088209, 0.000767262515752139, 0.00127520333730534, 1.21407891772044e-06, -0.00135484003540159, -0.000839410434285773, 0.000951800793757428, 0.00148879766194688, -0.000178050052959165, -0.00176631970820152, -0.000778230986076926, 0.00161906962991572, 0.00172946472599387, -0.00110871859674854, -0.00259095681117467, 0.000390255761317232, 0.00347340310061073, 0.000276599024523076, -0.00491161077951185, 3.29731564715611e-05, 0.00840912226877668, -0.00948324260415514, 0.00454147817375884, -0.000806720190438947]
-coefHPF22Hz=[7.52547062563367e-05, -0.00197015132982181, 0.0067871083073369, -0.0100249696555888, 0.00550356776191889, 0.00281062035676225, -0.00397417399554037, -0.00164386719251845, 0.00279477843354546, 0.00160432184624753, -0.00189284101262864, -0.00176409418261108, 0.0010679518762278, 0.00184271738189643, -0.000271274151440205, -0.00172101904875823, -0.000453004049953217, 0.00136120748151853, 0.0010131118168126, -0.000791216486441145, -0.00131788383801511, 0.000107803904666963, 0.00130336690576844, 0.000552422100842285, -0.000970176970901204, -0.00104113533209761, 0.000396938690572676, 0.0012355605646343, 0.000271408231347802, -0.0010756902031019, -0.000861969832365515, 0.000603208789169502, 0.00119973415962087, 6.23729040255532e-05, -0.00118169394068882, -0.00072768704279243, 0.000794178290330768, 0.00119228240296788, -0.00013671625349295, -0.00130162990342514, -0.000600449413634368, 0.000998123770065716, 0.00119017848173454, -0.000351872268470931, -0.00143110633492186, -0.000456546773902789, 0.00122163692791416, 0.00117517764582964, -0.000593066646130564, -0.00156314949915289, -0.00028215177865352, 0.00146489683024226, 0.00113720840458555, -0.000871526705268729, -0.00168764432776472, -6.39951707636023e-05, 0.00172478332566257, 0.00106032257923349, -0.00118915200166074, -0.00179218267466028, 0.000208155677989096, 0.001990444043084, 0.000931856786519406, -0.00153996876960843, -0.00186386703274729, 0.000531285041844567, 0.00225591678917236, 0.000749829943891936, -0.00192614794857426, -0.00189820660492172, 0.000916599969990915, 0.00251592320236086, 0.000496535752428288, -0.00234365238653107, -0.00187660667787507, 0.00136499430800939, 0.0027539563337317, 0.000168344452309584, -0.00278482829888829, -0.00179139355378847, 0.00187590888357357, 0.00296547467831694, -0.000244079264063036, -0.00324878487270188, -0.00163018553581097, 0.00245896088010252, 0.0031350580971534, -0.000756398452792964, -0.00372477637685134, -0.00137194486210096, 0.00310704814483586, 0.00324732870328012, -0.00136991373083304, -0.00420679713403022, -0.00101165914194427, 0.00383093331644969, 0.00329418604926758, -0.00210792307364424, -0.00469167700628446, -0.000517126206383212, 0.00463344978964202, 0.00324744332836173, -0.00298210421672846, -0.00516414666964107, 0.000125719527167754, 0.00552245022964106, 0.00309692487245397, -0.0040236443922852, -0.00562640986407795, 0.000962737873198471, 0.00651757592058834, 0.00279900731336652, -0.00526650438206077, -0.00606062320868406, 0.00203487270937625, 0.00764121508158555, 0.00232404599395497, -0.00677633466222345, -0.0064676155476448, 0.00343210254495415, 0.00893958990387168, 0.00159773832629665, -0.00864913309637525, -0.00683204150852993, 0.00527280977208532, 0.0105010346049098, 0.00052193320079083, -0.0110762872243557, -0.00715430043949748, 0.00781534610297453, 0.0124824684359547, -0.00110834234385858, -0.0144163147649288, -0.00742514638350213, 0.0115446716435801, 0.0152601021470909, -0.00373615745732377, -0.0194983788175947, -0.0076441361203415, 0.0176948194866143, 0.0197382736630138, -0.00849851627626202, -0.0286916531307716, -0.00780312007549013, 0.0302124819638795, 0.0291738992060095, -0.0198738533148063, -0.0522142452595737, -0.00789954387950871, 0.0727906676548776, 0.0685584167056398, -0.0869982987732932, -0.305062959124225, 0.592064166019106, -0.305062959124225, -0.0869982987732932, 0.0685584167056398, 0.0727906676548776, -0.00789954387950871, -0.0522142452595737, -0.0198738533148063, 0.0291738992060095, 0.0302124819638795, -0.00780312007549013, -0.0286916531307716, -0.00849851627626202, 0.0197382736630138, 0.0176948194866143, -0.0076441361203415, -0.0194983788175947, -0.00373615745732377, 0.0152601021470909, 0.0115446716435801, -0.00742514638350213, -0.0144163147649288, -0.00110834234385858, 0.0124824684359547, 0.00781534610297453, -0.00715430043949748, -0.0110762872243557, 0.00052193320079083, 0.0105010346049098, 0.00527280977208532, -0.00683204150852993, -0.00864913309637525, 0.00159773832629665, 0.00893958990387168, 0.00343210254495415, -0.0064676155476448, -0.00677633466222345, 0.00232404599395497, 0.00764121508158555, 0.00203487270937625, -0.00606062320868406, -0.00526650438206077, 0.00279900731336652, 0.00651757592058834, 0.000962737873198471, -0.00562640986407795, -0.0040236443922852, 0.00309692487245397, 0.00552245022964106, 0.000125719527167754, -0.00516414666964107, -0.00298210421672846, 0.00324744332836173, 0.00463344978964202, -0.000517126206383212, -0.00469167700628446, -0.00210792307364424, 0.00329418604926758, 0.00383093331644969, -0.00101165914194427, -0.00420679713403022, -0.00136991373083304, 0.00324732870328012, 0.00310704814483586, -0.00137194486210096, -0.00372477637685134, -0.000756398452792964, 0.0031350580971534, 0.00245896088010252, -0.00163018553581097, -0.00324878487270188, -0.000244079264063036, 0.00296547467831694, 0.00187590888357357, -0.00179139355378847, -0.00278482829888829, 0.000168344452309584, 0.0027539563337317, 0.00136499430800939, -0.00187660667787507, -0.00234365238653107, 0.000496535752428288, 0.00251592320236086, 0.000916599969990915, -0.00189820660492172, -0.00192614794857426, 0.000749829943891936, 0.00225591678917236, 0.000531285041844567, -0.00186386703274729, -0.00153996876960843, 0.000931856786519406, 0.001990444043084, 0.000208155677989096, -0.00179218267466028, -0.00118915200166074, 0.00106032257923349, 0.00172478332566257, -6.39951707636023e-05, -0.00168764432776472, -0.000871526705268729, 0.00113720840458555, 0.00146489683024226, -0.00028215177865352, -0.00156314949915289, -0.000593066646130564, 0.00117517764582964, 0.00122163692791416, -0.000456546773902789, -0.00143110633492186, -0.000351872268470931, 0.00119017848173454, 0.000998123770065716, -0.000600449413634368, -0.00130162990342514, -0.00013671625349295, 0.00119228240296788, 0.000794178290330768, -0.00072768704279243, -0.00118169394068882, 6.23729040255532e-05, 0.00119973415962087, 0.000603208789169502, -0.000861969832365515, -0.0010756902031019, 0.000271408231347802, 0.0012355605646343, 0.000396938690572676, -0.00104113533209761, -0.000970176970901204, 0.000552422100842285, 0.00130336690576844, 0.000107803904666963, -0.00131788383801511, -0.000791216486441145, 0.0010131118168126, 0.00136120748151853, -0.000453004049953217, -0.00172101904875823, -0.000271274151440205, 0.00184271738189643, 0.0010679518762278, -0.00176409418261108, -0.00189284101262864, 0.00160432184624753, 0.00279477843354546, -0.00164386719251845, -0.00397417399554037, 0.00281062035676225, 0.00550356776191889, -0.0100249696555888, 0.0067871083073369, -0.00197015132982181, 7.52547062563367e-05]
-coefHPF23Hz=[0.000630726318650174, -0.00122391351452417, -0.00121820608632415, 0.00721611199937316, -0.0103277075436535, 0.00510792241041476, 0.00230728179670139, -0.00229502930487103, -0.00228180045064122, 0.00191855160447874, 0.00188826153802108, -0.00120706432844749, -0.00184162836207743, 0.000614809284485518, 0.00175413983053958, -4.26250255928708e-05, -0.00158150537100458, -0.000474156212245004, 0.00128657773852817, 0.000895210316603067, -0.000870603849444014, -0.00117565038825645, 0.000368874057658638, 0.00127280292506718, 0.000164041203075203, -0.00116859609079882, -0.000653211298456237, 0.000869948137993362, 0.00102299644514271, -0.000418727699211187, -0.00120685748342333, -0.000114548978983072, 0.00116476386212161, 0.000638035340835268, -0.000893700454437016, -0.00105378840220761, 0.000433670959826913, 0.00127412646183228, 0.000138830153782411, -0.00124595811695229, -0.000713834230383066, 0.000955162870956069, 0.00117750077419377, -0.000444916570815221, -0.00142387828204095, -0.000197319286764218, 0.00138607549716432, 0.000846277346940993, -0.00104817346804835, -0.00136632831622637, 0.000457991883496698, 0.00163473470528698, 0.000280731289038307, -0.00157285856982444, -0.00102121634568361, 0.00116236518061405, 0.00160784417554229, -0.000465824024387506, -0.00189481051683447, -0.00039481547082503, 0.00179262458446396, 0.00124927006625736, -0.00128985994689112, -0.00190967709384723, 0.000460273813011064, 0.00221003410446732, 0.000550284720785513, -0.00205583404668523, -0.00153283316757703, 0.00143422296200616, 0.00227154243856736, -0.000438279261128906, -0.00258133086379735, -0.000747253296310564, 0.00235159463127182, 0.00187925588882568, -0.00157828745757584, -0.00270809109998261, 0.000385693921780986, 0.00301523215303741, 0.00100932264115984, -0.0026869916268162, -0.00231392060248125, 0.00172985792821107, 0.00323388857214992, -0.000295903541609214, -0.00352629776419307, -0.00134537572356759, 0.00306433559628871, 0.00285064633449104, -0.00187394153800426, -0.00387397140464342, 0.000148259077923186, 0.00413477109999357, 0.0017903505300175, -0.00350376104028726, -0.00352504607950178, 0.00201859103577906, 0.0046595412022255, 6.96212607158314e-05, -0.00486601441424766, -0.00237314914693251, 0.00401066340874474, 0.00438990172776321, -0.00215414921395446, -0.00565067615746133, -0.000392220304255136, 0.00578010625778166, 0.00314635851429718, -0.00462025309475659, -0.00552011497588111, 0.00228115066385832, 0.00692884070425257, 0.000873366489594403, -0.00695517052656954, -0.00422123730179174, 0.00539105384199661, 0.00706351639733286, -0.00239167049727127, -0.00868371649351598, -0.00158012890853648, 0.0085467786634408, 0.00578519882375596, -0.00643301418851002, -0.00930579478748764, 0.002490500230744, 0.0112512756122366, 0.00271212302208045, -0.0109325964885699, -0.00822366976229856, 0.0079931560427663, 0.0128827286376321, -0.00256218862470693, -0.0154897541427479, -0.00469299932163385, 0.0150076101649828, 0.0126112685576054, -0.0107644023427324, -0.0196562192838175, 0.00261898832983984, 0.0240626986987645, 0.00897749490165322, -0.0240004649549267, -0.0229966303596539, 0.0176070868583095, 0.0379587533243691, -0.00265278034252798, -0.0521300990818618, -0.0251590415572054, 0.0637775304726149, 0.081221610124927, -0.0714271678116052, -0.309706223099504, 0.574093422938312, -0.309706223099504, -0.0714271678116052, 0.081221610124927, 0.0637775304726149, -0.0251590415572054, -0.0521300990818618, -0.00265278034252798, 0.0379587533243691, 0.0176070868583095, -0.0229966303596539, -0.0240004649549267, 0.00897749490165322, 0.0240626986987645, 0.00261898832983984, -0.0196562192838175, -0.0107644023427324, 0.0126112685576054, 0.0150076101649828, -0.00469299932163385, -0.0154897541427479, -0.00256218862470693, 0.0128827286376321, 0.0079931560427663, -0.00822366976229856, -0.0109325964885699, 0.00271212302208045, 0.0112512756122366, 0.002490500230744, -0.00930579478748764, -0.00643301418851002, 0.00578519882375596, 0.0085467786634408, -0.00158012890853648, -0.00868371649351598, -0.00239167049727127, 0.00706351639733286, 0.00539105384199661, -0.00422123730179174, -0.00695517052656954, 0.000873366489594403, 0.00692884070425257, 0.00228115066385832, -0.00552011497588111, -0.00462025309475659, 0.00314635851429718, 0.00578010625778166, -0.000392220304255136, -0.00565067615746133, -0.00215414921395446, 0.00438990172776321, 0.00401066340874474, -0.00237314914693251, -0.00486601441424766, 6.96212607158314e-05, 0.0046595412022255, 0.00201859103577906, -0.00352504607950178, -0.00350376104028726, 0.0017903505300175, 0.00413477109999357, 0.000148259077923186, -0.00387397140464342, -0.00187394153800426, 0.00285064633449104, 0.00306433559628871, -0.00134537572356759, -0.00352629776419307, -0.000295903541609214, 0.00323388857214992, 0.00172985792821107, -0.00231392060248125, -0.0026869916268162, 0.00100932264115984, 0.00301523215303741, 0.000385693921780986, -0.00270809109998261, -0.00157828745757584, 0.00187925588882568, 0.00235159463127182, -0.000747253296310564, -0.00258133086379735, -0.000438279261128906, 0.00227154243856736, 0.00143422296200616, -0.00153283316757703, -0.00205583404668523, 0.000550284720785513, 0.00221003410446732, 0.000460273813011064, -0.00190967709384723, -0.00128985994689112, 0.00124927006625736, 0.00179262458446396, -0.00039481547082503, -0.00189481051683447, -0.000465824024387506, 0.00160784417554229, 0.00116236518061405, -0.00102121634568361, -0.00157285856982444, 0.000280731289038307, 0.00163473470528698, 0.000457991883496698, -0.00136632831622637, -0.00104817346804835, 0.000846277346940993, 0.00138607549716432, -0.000197319286764218, -0.00142387828204095, -0.000444916570815221, 0.00117750077419377, 0.000955162870956069, -0.000713834230383066, -0.00124595811695229, 0.000138830153782411, 0.00127412646183228, 0.000433670959826913, -0.00105378840220761, -0.000893700454437016, 0.000638035340835268, 0.00116476386212161, -0.000114548978983072, -0.00120685748342333, -0.000418727699211187, 0.00102299644514271, 0.000869948137993362, -0.000653211298456237, -0.00116859609079882, 0.000164041203075203, 0.00127280292506718, 0.000368874057658638, -0.00117565038825645, -0.000870603849444014, 0.000895210316603067, 0.00128657773852817, -0.000474156212245004, -0.00158150537100458, -4.26250255928708e-05, 0.00175413983053958, 0.000614809284485518, -0.00184162836207743, -0.00120706432844749, 0.00188826153802108, 0.00191855160447874, -0.00228180045064122, -0.00229502930487103, 0.00230728179670139, 0.00510792241041476, -0.0103277075436535, 0.00721611199937316, -0.00121820608632415, -0.00122391351452417, 0.000630726318650174]
-coefHPF24Hz=[-0.00116438465037222, 0.00486449981334476, -0.00882085834297046, 0.00761845416858108, -0.000632055271085092, -0.00429115393566955, 0.00162454220565455, 0.00280954306693745, -0.00146354249803816, -0.00216991967286399, 0.00112345359334984, 0.00188514969521844, -0.000744587034297185, -0.00172823110421005, 0.000371241912166394, 0.00160701110103128, 1.44516483080869e-06, -0.00146276165810719, -0.000350963414261089, 0.00127195842946675, 0.000670092261890256, -0.00101999041265489, -0.000929035354754948, 0.000707426607334537, 0.00111445671982942, -0.000346072518000236, -0.00120059144671407, -4.23181157743386e-05, 0.00117849082162956, 0.000428148503425408, -0.00103889095111666, -0.000775732353321035, 0.000787929761402276, 0.00105182909909581, -0.000442224412014997, -0.00122310797802323, 3.33635873437379e-05, 0.00126302129345991, 0.000402373009965232, -0.00115935511459488, -0.000815832226490645, 0.00091109412726503, 0.00116155679534653, -0.000537943195259748, -0.00139098831635732, 7.19542093560397e-05, 0.00146852172828096, 0.000439516225640119, -0.00137153988572301, -0.00094020188287024, 0.00109992458472825, 0.00136432477050169, -0.000667019044884543, -0.00165633548481803, 0.000113702902884203, 0.00176742912740113, 0.000503177370072417, -0.00166804189439957, -0.00111110421482445, 0.00134898707155565, 0.00163557502503053, -0.000831429523807021, -0.00200183383788413, 0.000161019914199211, 0.00214995325396553, 0.000590409423811736, -0.00203750312541329, -0.00133947791169045, 0.00165815538779298, 0.00198717784937753, -0.00103115955131796, -0.00244387908697101, 0.000213573136643781, 0.00263274834308519, 0.000709199307967918, -0.00250443402733438, -0.00162813691047793, 0.00204141425731336, 0.00243020872520982, -0.00127543160856966, -0.00299655097994267, 0.000270857598691279, 0.003233431119938, 0.0008677740376341, -0.00308019438525349, -0.00200506545282028, 0.00251486469243084, 0.00299736322024496, -0.00156971540474438, -0.00370299550921601, 0.000328777583242177, 0.00399988597655009, 0.00108310461429111, -0.0038139704592731, -0.00249520840615755, 0.0031111200126476, 0.00373482599811695, -0.00193578279928465, -0.00461681254383903, 0.00038101745191258, 0.00499777231629346, 0.00138571485157781, -0.00476511375485315, -0.00317035192103786, 0.003890392956148, 0.00473642092745016, -0.00240436671576423, -0.00586655017280481, 0.000434313738506252, 0.00636022147513967, 0.0018253521824376, -0.00607395074044211, -0.00413067909372532, 0.00496580713228187, 0.00616875148671968, -0.00304582283299826, -0.00767276848174554, 0.000478693314924821, 0.00835840392612921, 0.00250927481654903, -0.00802729831099586, -0.00560327270639305, 0.00658356339377486, 0.00841642479860781, -0.00403359481284097, -0.010548690338477, 0.000513362871156361, 0.0116285068815438, 0.00369413644941671, -0.0113305074564382, -0.0081900167463821, 0.00942225095008792, 0.0124861311523241, -0.00580804711028252, -0.0160211438638622, 0.000540839323000075, 0.0181921696710638, 0.00617768139568187, -0.0183859635394633, -0.0140061531740304, 0.0159892707724943, 0.0224808673757507, -0.0103417264237344, -0.0310479093433735, 0.000559573387045692, 0.039118020764616, 0.0149755505663822, -0.0461159216549026, -0.0404246055898603, 0.0515284598072575, 0.0915547994055002, -0.0549510526910251, -0.313356942596472, 0.556122208527917, -0.313356942596472, -0.0549510526910251, 0.0915547994055002, 0.0515284598072575, -0.0404246055898603, -0.0461159216549026, 0.0149755505663822, 0.039118020764616, 0.000559573387045692, -0.0310479093433735, -0.0103417264237344, 0.0224808673757507, 0.0159892707724943, -0.0140061531740304, -0.0183859635394633, 0.00617768139568187, 0.0181921696710638, 0.000540839323000075, -0.0160211438638622, -0.00580804711028252, 0.0124861311523241, 0.00942225095008792, -0.0081900167463821, -0.0113305074564382, 0.00369413644941671, 0.0116285068815438, 0.000513362871156361, -0.010548690338477, -0.00403359481284097, 0.00841642479860781, 0.00658356339377486, -0.00560327270639305, -0.00802729831099586, 0.00250927481654903, 0.00835840392612921, 0.000478693314924821, -0.00767276848174554, -0.00304582283299826, 0.00616875148671968, 0.00496580713228187, -0.00413067909372532, -0.00607395074044211, 0.0018253521824376, 0.00636022147513967, 0.000434313738506252, -0.00586655017280481, -0.00240436671576423, 0.00473642092745016, 0.003890392956148, -0.00317035192103786, -0.00476511375485315, 0.00138571485157781, 0.00499777231629346, 0.00038101745191258, -0.00461681254383903, -0.00193578279928465, 0.00373482599811695, 0.0031111200126476, -0.00249520840615755, -0.0038139704592731, 0.00108310461429111, 0.00399988597655009, 0.000328777583242177, -0.00370299550921601, -0.00156971540474438, 0.00299736322024496, 0.00251486469243084, -0.00200506545282028, -0.00308019438525349, 0.0008677740376341, 0.003233431119938, 0.000270857598691279, -0.00299655097994267, -0.00127543160856966, 0.00243020872520982, 0.00204141425731336, -0.00162813691047793, -0.00250443402733438, 0.000709199307967918, 0.00263274834308519, 0.000213573136643781, -0.00244387908697101, -0.00103115955131796, 0.00198717784937753, 0.00165815538779298, -0.00133947791169045, -0.00203750312541329, 0.000590409423811736, 0.00214995325396553, 0.000161019914199211, -0.00200183383788413, -0.000831429523807021, 0.00163557502503053, 0.00134898707155565, -0.00111110421482445, -0.00166804189439957, 0.000503177370072417, 0.00176742912740113, 0.000113702902884203, -0.00165633548481803, -0.000667019044884543, 0.00136432477050169, 0.00109992458472825, -0.00094020188287024, -0.00137153988572301, 0.000439516225640119, 0.00146852172828096, 7.19542093560397e-05, -0.00139098831635732, -0.000537943195259748, 0.00116155679534653, 0.00091109412726503, -0.000815832226490645, -0.00115935511459488, 0.000402373009965232, 0.00126302129345991, 3.33635873437379e-05, -0.00122310797802323, -0.000442224412014997, 0.00105182909909581, 0.000787929761402276, -0.000775732353321035, -0.00103889095111666, 0.000428148503425408, 0.00117849082162956, -4.23181157743386e-05, -0.00120059144671407, -0.000346072518000236, 0.00111445671982942, 0.000707426607334537, -0.000929035354754948, -0.00101999041265489, 0.000670092261890256, 0.00127195842946675, -0.000350963414261089, -0.00146276165810719, 1.44516483080869e-06, 0.00160701110103128, 0.000371241912166394, -0.00172823110421005, -0.000744587034297185, 0.00188514969521844, 0.00112345359334984, -0.00216991967286399, -0.00146354249803816, 0.00280954306693745, 0.00162454220565455, -0.00429115393566955, -0.000632055271085092, 0.00761845416858108, -0.00882085834297046, 0.00486449981334476, -0.00116438465037222]
-coefHPF25Hz=[0.000483653107935069, -0.00292958878471268, 0.00709230301152674, -0.008994941442229, 0.0048264560208093, 0.00216425500406151, -0.00413337590268467, -0.000165455469558945, 0.00310861967270303, -0.000376150792443417, -0.0024456849243508, 0.000450855992033854, 0.00204332375396593, -0.000357624539810668, -0.00179099764706359, 0.000196413269238633, 0.00161964245544049, -7.25749064918779e-06, -0.00148387932432906, -0.000194039165708792, 0.00135579502033163, 0.000399590191140822, -0.00121990026602382, -0.000600620470726914, 0.00106557215057972, 0.00078786638854252, -0.000884863999559207, -0.000954058716735117, 0.000675496956586414, 0.00109088171813946, -0.000439345897222359, -0.00118781864878879, 0.000178079542035869, 0.0012388635102541, 0.000100254400370163, -0.0012370418007582, -0.000384614142425406, 0.00117447840697859, 0.000666243851170774, -0.00105026828762519, -0.000931414015653347, 0.000865654619778146, 0.0011636686062741, -0.00062152342355215, -0.00135074805059743, 0.000326519174505902, 0.00147821056685997, 7.94203090479203e-06, -0.00153140540146236, -0.00037202794645378, 0.00150651889499319, 0.000742133576007812, -0.00139125658750685, -0.00110422943974848, 0.00118892115163682, 0.00143240107793973, -0.000898131221645408, -0.00170922130636017, 0.00053098859020392, 0.00191088136875447, -9.90188911487654e-05, -0.00202037313984865, -0.000377356968771283, 0.00202110836716007, 0.000875417036952882, -0.00190236052781881, -0.00136903010223659, 0.00166032432386348, 0.00182867554118551, -0.00129769614176452, -0.00222362293835038, 0.000824067361115744, 0.00252414069540218, -0.00025650744239549, -0.00270353667697387, -0.000379778741814985, 0.00273800309745757, 0.00105552952779051, -0.0026133917535062, -0.00173213489391013, 0.00231913861358911, 0.00237141980966955, -0.00185758642306209, -0.00293018584682134, 0.0012379636166862, 0.00336915529065365, -0.000483620976075699, -0.00364831255220504, -0.000375307104229711, 0.00373600367559233, 0.00129695381991174, -0.00360656189127873, -0.00223277559808332, 0.0032443287432471, 0.00312997396861058, -0.00264808032617471, -0.00393006790961977, 0.00182795066179857, 0.00457589520553575, -0.000809427675617154, -0.00501244584115159, -0.000368145214812856, 0.00519108997320604, 0.00165134528963953, -0.00507078222397004, -0.00297796630021137, 0.00462648113836352, 0.00427294521489487, -0.00384488617280741, -0.00545839621560002, 0.00273326418054366, 0.00645167185399119, -0.00131753373306127, -0.00717023657750453, -0.000357516209365272, 0.00753586994763014, 0.00222987397647022, -0.00748150317350398, -0.00421828430463562, 0.00695230887048553, 0.0062267014070289, -0.00591156079659051, -0.00814515807510661, 0.00434396093332932, 0.00984837094441992, -0.00224815051215906, -0.0112133670878254, -0.000343180115738429, 0.0120975075851014, 0.0033978067377205, -0.0123889894958946, -0.00682041729506031, 0.0119268656091029, 0.0105482818019213, -0.0106005064958654, -0.0144497735979311, 0.00824119892812365, 0.0184165991044683, -0.00467084824364041, -0.0223309736391524, -0.000342589291930173, 0.0260514739166034, 0.00720142441627894, -0.0294514299272523, -0.0166531675627204, 0.0324197433122736, 0.0303131218868288, -0.0348450311178269, -0.0525001877411307, 0.0366412158052365, 0.0992725800112531, -0.0377488277852871, -0.316011280588917, 0.53812441355369, -0.316011280588917, -0.0377488277852871, 0.0992725800112531, 0.0366412158052365, -0.0525001877411307, -0.0348450311178269, 0.0303131218868288, 0.0324197433122736, -0.0166531675627204, -0.0294514299272523, 0.00720142441627894, 0.0260514739166034, -0.000342589291930173, -0.0223309736391524, -0.00467084824364041, 0.0184165991044683, 0.00824119892812365, -0.0144497735979311, -0.0106005064958654, 0.0105482818019213, 0.0119268656091029, -0.00682041729506031, -0.0123889894958946, 0.0033978067377205, 0.0120975075851014, -0.000343180115738429, -0.0112133670878254, -0.00224815051215906, 0.00984837094441992, 0.00434396093332932, -0.00814515807510661, -0.00591156079659051, 0.0062267014070289, 0.00695230887048553, -0.00421828430463562, -0.00748150317350398, 0.00222987397647022, 0.00753586994763014, -0.000357516209365272, -0.00717023657750453, -0.00131753373306127, 0.00645167185399119, 0.00273326418054366, -0.00545839621560002, -0.00384488617280741, 0.00427294521489487, 0.00462648113836352, -0.00297796630021137, -0.00507078222397004, 0.00165134528963953, 0.00519108997320604, -0.000368145214812856, -0.00501244584115159, -0.000809427675617154, 0.00457589520553575, 0.00182795066179857, -0.00393006790961977, -0.00264808032617471, 0.00312997396861058, 0.0032443287432471, -0.00223277559808332, -0.00360656189127873, 0.00129695381991174, 0.00373600367559233, -0.000375307104229711, -0.00364831255220504, -0.000483620976075699, 0.00336915529065365, 0.0012379636166862, -0.00293018584682134, -0.00185758642306209, 0.00237141980966955, 0.00231913861358911, -0.00173213489391013, -0.0026133917535062, 0.00105552952779051, 0.00273800309745757, -0.000379778741814985, -0.00270353667697387, -0.00025650744239549, 0.00252414069540218, 0.000824067361115744, -0.00222362293835038, -0.00129769614176452, 0.00182867554118551, 0.00166032432386348, -0.00136903010223659, -0.00190236052781881, 0.000875417036952882, 0.00202110836716007, -0.000377356968771283, -0.00202037313984865, -9.90188911487654e-05, 0.00191088136875447, 0.00053098859020392, -0.00170922130636017, -0.000898131221645408, 0.00143240107793973, 0.00118892115163682, -0.00110422943974848, -0.00139125658750685, 0.000742133576007812, 0.00150651889499319, -0.00037202794645378, -0.00153140540146236, 7.94203090479203e-06, 0.00147821056685997, 0.000326519174505902, -0.00135074805059743, -0.00062152342355215, 0.0011636686062741, 0.000865654619778146, -0.000931414015653347, -0.00105026828762519, 0.000666243851170774, 0.00117447840697859, -0.000384614142425406, -0.0012370418007582, 0.000100254400370163, 0.0012388635102541, 0.000178079542035869, -0.00118781864878879, -0.000439345897222359, 0.00109088171813946, 0.000675496956586414, -0.000954058716735117, -0.000884863999559207, 0.00078786638854252, 0.00106557215057972, -0.000600620470726914, -0.00121990026602382, 0.000399590191140822, 0.00135579502033163, -0.000194039165708792, -0.00148387932432906, -7.25749064918779e-06, 0.00161964245544049, 0.000196413269238633, -0.00179099764706359, -0.000357624539810668, 0.00204332375396593, 0.000450855992033854, -0.0024456849243508, -0.000376150792443417, 0.00310861967270303, -0.000165455469558945, -0.00413337590268467, 0.00216425500406151, 0.0048264560208093, -0.008994941442229, 0.00709230301152674, -0.00292958878471268, 0.000483653107935069]
-coefHPF26Hz=[1.34855224229915e-05, 0.00102094648624807, -0.00423355490373472, 0.00812345488451734, -0.00826485004427596, 0.00279287850866696, 0.00325055342197006, -0.00337740288652785, -0.00111449493469235, 0.00287167080328958, 0.000233852620077858, -0.00236761747964612, 0.000123568703590286, 0.00199614291923592, -0.000250311683535943, -0.00174025678750797, 0.000269479077006256, 0.00156444010085091, -0.000230178689234078, -0.00144842660086047, 0.000164379759699955, 0.00136542070963335, -7.60536124536113e-05, -0.00130960025733223, -2.22551249100642e-05, 0.00126638946986654, 0.000130673017597007, -0.00123050484066907, -0.000246192666391376, 0.00119556025716931, 0.000368653055891681, -0.00115900632853057, -0.000494156818152313, 0.00111361000751648, 0.000625533462101388, -0.00106002785942032, -0.000758800681632618, 0.000994282122299591, 0.000893091328281898, -0.000914511254720678, -0.00102661514298405, 0.000818750858354975, 0.00115867670282397, -0.000708775405429269, -0.00128273476388649, 0.00057950090292028, 0.00139934367721626, -0.000432257273109352, -0.0015046717253154, 0.00026609921835817, 0.00159688572396587, -8.30130621838293e-05, -0.00167048599374301, -0.000119604832885676, 0.00172628342356281, 0.000337024520878824, -0.00175879069067896, -0.000569159928778961, 0.00176685745800016, 0.000811383830235103, -0.00174521740850647, -0.00106306553386957, 0.00169338364526741, 0.00131848826566, -0.00160646530943573, -0.00157610380066606, 0.00148428949171342, 0.00182981595445723, -0.0013228181400827, -0.00207826304268135, 0.00112432623470024, 0.00231424760213846, -0.000887549798041799, -0.00253295563747453, 0.000614250799124439, 0.00272594390981122, -0.000302024623190515, -0.00289031596662593, -4.5303684710912e-05, 0.00301834944410613, 0.000427428415117725, -0.00310663837671515, -0.000838921078544496, 0.00314788306168618, 0.00127723416553632, -0.00313886591690302, -0.0017345146307537, 0.0030718168977747, 0.00220668095776218, -0.00294329693835536, -0.00268524724084704, 0.00274607092002991, 0.0031666026923558, -0.00247985015141515, -0.00364098105092528, 0.00214164035617455, 0.00409984997706105, -0.00173148909370573, -0.00452987622062829, 0.00124409249116482, 0.00492398556555991, -0.00068069662475258, -0.0052706426552385, 3.9855278209815e-05, 0.00556295735575476, 0.000672239885331192, -0.00578722855908036, -0.00145264994373865, 0.00593131509642913, 0.00229603850686308, -0.00597917540475539, -0.0032033377828134, 0.00592412646672094, 0.00416584287963196, -0.00575424654848001, -0.00517518359043571, 0.00545745552494353, 0.00621983013241154, -0.00501551780898834, -0.00729493547423024, 0.00441575469482427, 0.0083918474815565, -0.00364411377080149, -0.00950110197981294, 0.00268736438177074, 0.0106052729034629, -0.0015185661867155, -0.0116963094268517, 0.000110891750258522, 0.0127671984863083, 0.00156467726836983, -0.0138063421552326, -0.00354759728577132, 0.0147926501680221, 0.00591279885261391, -0.0157253344238683, -0.00874822655843083, 0.0165946433593036, 0.0121934624420855, -0.0173863078422644, -0.0164842981676588, 0.0180852517682908, 0.0220441970305407, -0.0187010037096948, -0.0296360680101577, 0.0192094392142901, 0.0409570945728843, -0.0196079006461952, -0.0604117904215684, 0.019906467824803, 0.104134686017929, -0.020074527548372, -0.317657147027075, 0.520141748491819, -0.317657147027075, -0.020074527548372, 0.104134686017929, 0.019906467824803, -0.0604117904215684, -0.0196079006461952, 0.0409570945728843, 0.0192094392142901, -0.0296360680101577, -0.0187010037096948, 0.0220441970305407, 0.0180852517682908, -0.0164842981676588, -0.0173863078422644, 0.0121934624420855, 0.0165946433593036, -0.00874822655843083, -0.0157253344238683, 0.00591279885261391, 0.0147926501680221, -0.00354759728577132, -0.0138063421552326, 0.00156467726836983, 0.0127671984863083, 0.000110891750258522, -0.0116963094268517, -0.0015185661867155, 0.0106052729034629, 0.00268736438177074, -0.00950110197981294, -0.00364411377080149, 0.0083918474815565, 0.00441575469482427, -0.00729493547423024, -0.00501551780898834, 0.00621983013241154, 0.00545745552494353, -0.00517518359043571, -0.00575424654848001, 0.00416584287963196, 0.00592412646672094, -0.0032033377828134, -0.00597917540475539, 0.00229603850686308, 0.00593131509642913, -0.00145264994373865, -0.00578722855908036, 0.000672239885331192, 0.00556295735575476, 3.9855278209815e-05, -0.0052706426552385, -0.00068069662475258, 0.00492398556555991, 0.00124409249116482, -0.00452987622062829, -0.00173148909370573, 0.00409984997706105, 0.00214164035617455, -0.00364098105092528, -0.00247985015141515, 0.0031666026923558, 0.00274607092002991, -0.00268524724084704, -0.00294329693835536, 0.00220668095776218, 0.0030718168977747, -0.0017345146307537, -0.00313886591690302, 0.00127723416553632, 0.00314788306168618, -0.000838921078544496, -0.00310663837671515, 0.000427428415117725, 0.00301834944410613, -4.5303684710912e-05, -0.00289031596662593, -0.000302024623190515, 0.00272594390981122, 0.000614250799124439, -0.00253295563747453, -0.000887549798041799, 0.00231424760213846, 0.00112432623470024, -0.00207826304268135, -0.0013228181400827, 0.00182981595445723, 0.00148428949171342, -0.00157610380066606, -0.00160646530943573, 0.00131848826566, 0.00169338364526741, -0.00106306553386957, -0.00174521740850647, 0.000811383830235103, 0.00176685745800016, -0.000569159928778961, -0.00175879069067896, 0.000337024520878824, 0.00172628342356281, -0.000119604832885676, -0.00167048599374301, -8.30130621838293e-05, 0.00159688572396587, 0.00026609921835817, -0.0015046717253154, -0.000432257273109352, 0.00139934367721626, 0.00057950090292028, -0.00128273476388649, -0.000708775405429269, 0.00115867670282397, 0.000818750858354975, -0.00102661514298405, -0.000914511254720678, 0.000893091328281898, 0.000994282122299591, -0.000758800681632618, -0.00106002785942032, 0.000625533462101388, 0.00111361000751648, -0.000494156818152313, -0.00115900632853057, 0.000368653055891681, 0.00119556025716931, -0.000246192666391376, -0.00123050484066907, 0.000130673017597007, 0.00126638946986654, -2.22551249100642e-05, -0.00130960025733223, -7.60536124536113e-05, 0.00136542070963335, 0.000164379759699955, -0.00144842660086047, -0.000230178689234078, 0.00156444010085091, 0.000269479077006256, -0.00174025678750797, -0.000250311683535943, 0.00199614291923592, 0.000123568703590286, -0.00236761747964612, 0.000233852620077858, 0.00287167080328958, -0.00111449493469235, -0.00337740288652785, 0.00325055342197006, 0.00279287850866696, -0.00826485004427596, 0.00812345488451734, -0.00423355490373472, 0.00102094648624807, 1.34855224229915e-05]
-coefHPF27Hz=[-0.000437201437209955, 0.00101835993204671, -8.88875483713299e-05, -0.00369845825965069, 0.00818771414349434, -0.00855413023027777, 0.00336000647315623, 0.00221481955369137, -0.00240858082508993, -0.00127884566865615, 0.00251352529977249, 0.000269520913397327, -0.00210082536695398, 0.000155288533729255, 0.00180512557029149, -0.000406278397600571, -0.00155645674962104, 0.000535892037576371, 0.0013733440911685, -0.000607410909441688, -0.00123874033895332, 0.000645639339400968, 0.00114341287683398, -0.000666683825536434, -0.00107825193480654, 0.000679091402802635, 0.00103648806640587, -0.000687778597834221, -0.00101274413868663, 0.00069475871367503, 0.00100466572265491, -0.000703530911434589, -0.00100707772604304, 0.000712463188743296, 0.00102051898357129, -0.000724377644711664, -0.00104144992315318, 0.000738357685240514, 0.00106918353095893, -0.000754603142086179, -0.00110247506134965, 0.000772529822029199, 0.00114101915460557, -0.000792085415683585, -0.00118421941197823, 0.000812134885330747, 0.00123372779796662, -0.000834975026928126, -0.00128717076960047, 0.000858726955255211, 0.00134634333382317, -0.000885770872210025, -0.00140824506563104, 0.000913326790551829, 0.00147485255680932, -0.000943002531206926, -0.00154417809088379, 0.000972226571284842, 0.00161861287566732, -0.00100254756776249, -0.00169704265933663, 0.00103241608662331, 0.00178164683408811, -0.0010640410011397, -0.00187061501339623, 0.00109552287618939, 0.00196651668546217, -0.00113051484684414, -0.00206447541723346, 0.00116320405217326, 0.00217037619699216, -0.00119915049661291, -0.00227812120553723, 0.00123053988374758, 0.00239657402739658, -0.00126528334429997, -0.0025196623864396, 0.0012982463182085, 0.00265260780187293, -0.00133456668269904, -0.00279104509106006, 0.00137155453821091, 0.00293455772058689, -0.00140482282117762, -0.00309020921927443, 0.00144229518912884, 0.00324829517231391, -0.00146948024753462, -0.00342900857512266, 0.00150968450064886, 0.00360882931245057, -0.00154056921389099, -0.00380731901495276, 0.00157723475296517, 0.00401333987226257, -0.00161103775678232, -0.00423110369971337, 0.00163750687415041, 0.0044736814179124, -0.00167228167708543, -0.00472863997401892, 0.00170865642610387, 0.00499418045615637, -0.00173381053035383, -0.00528982335157778, 0.00176409601599358, 0.00560714773746058, -0.00179576175837993, -0.00594699808531775, 0.00182411566501783, 0.00631697384982277, -0.00185099676804976, -0.0067221211610675, 0.0018799050323343, 0.00716194369574998, -0.0019045110823263, -0.00764850886968837, 0.00192972847231689, 0.00818585150717794, -0.00195378900651625, -0.00878381324730117, 0.00197699604545814, 0.00945361922247515, -0.00199920994166788, -0.010209751599009, 0.00202020502369677, 0.0110706905338749, -0.00203800660496098, -0.012065079867761, 0.00205726685625888, 0.0132216203334396, -0.00207287319298842, -0.0145917429164163, 0.00208876878541172, 0.016238732652967, -0.00210244837202255, -0.018262132807422, 0.00211471856189607, 0.0208119793274348, -0.00212604839727921, -0.0241300255442169, 0.00213574095801656, 0.0286354553282171, -0.00214343582024798, -0.0351205202940578, 0.00215035130844678, 0.0452795632651428, -0.00215433137425152, -0.0635251098747471, 0.00215958398989701, 0.106020098857857, -0.00216046913056199, -0.318283494233217, 0.502163366446982, -0.318283494233217, -0.00216046913056199, 0.106020098857857, 0.00215958398989701, -0.0635251098747471, -0.00215433137425152, 0.0452795632651428, 0.00215035130844678, -0.0351205202940578, -0.00214343582024798, 0.0286354553282171, 0.00213574095801656, -0.0241300255442169, -0.00212604839727921, 0.0208119793274348, 0.00211471856189607, -0.018262132807422, -0.00210244837202255, 0.016238732652967, 0.00208876878541172, -0.0145917429164163, -0.00207287319298842, 0.0132216203334396, 0.00205726685625888, -0.012065079867761, -0.00203800660496098, 0.0110706905338749, 0.00202020502369677, -0.010209751599009, -0.00199920994166788, 0.00945361922247515, 0.00197699604545814, -0.00878381324730117, -0.00195378900651625, 0.00818585150717794, 0.00192972847231689, -0.00764850886968837, -0.0019045110823263, 0.00716194369574998, 0.0018799050323343, -0.0067221211610675, -0.00185099676804976, 0.00631697384982277, 0.00182411566501783, -0.00594699808531775, -0.00179576175837993, 0.00560714773746058, 0.00176409601599358, -0.00528982335157778, -0.00173381053035383, 0.00499418045615637, 0.00170865642610387, -0.00472863997401892, -0.00167228167708543, 0.0044736814179124, 0.00163750687415041, -0.00423110369971337, -0.00161103775678232, 0.00401333987226257, 0.00157723475296517, -0.00380731901495276, -0.00154056921389099, 0.00360882931245057, 0.00150968450064886, -0.00342900857512266, -0.00146948024753462, 0.00324829517231391, 0.00144229518912884, -0.00309020921927443, -0.00140482282117762, 0.00293455772058689, 0.00137155453821091, -0.00279104509106006, -0.00133456668269904, 0.00265260780187293, 0.0012982463182085, -0.0025196623864396, -0.00126528334429997, 0.00239657402739658, 0.00123053988374758, -0.00227812120553723, -0.00119915049661291, 0.00217037619699216, 0.00116320405217326, -0.00206447541723346, -0.00113051484684414, 0.00196651668546217, 0.00109552287618939, -0.00187061501339623, -0.0010640410011397, 0.00178164683408811, 0.00103241608662331, -0.00169704265933663, -0.00100254756776249, 0.00161861287566732, 0.000972226571284842, -0.00154417809088379, -0.000943002531206926, 0.00147485255680932, 0.000913326790551829, -0.00140824506563104, -0.000885770872210025, 0.00134634333382317, 0.000858726955255211, -0.00128717076960047, -0.000834975026928126, 0.00123372779796662, 0.000812134885330747, -0.00118421941197823, -0.000792085415683585, 0.00114101915460557, 0.000772529822029199, -0.00110247506134965, -0.000754603142086179, 0.00106918353095893, 0.000738357685240514, -0.00104144992315318, -0.000724377644711664, 0.00102051898357129, 0.000712463188743296, -0.00100707772604304, -0.000703530911434589, 0.00100466572265491, 0.00069475871367503, -0.00101274413868663, -0.000687778597834221, 0.00103648806640587, 0.000679091402802635, -0.00107825193480654, -0.000666683825536434, 0.00114341287683398, 0.000645639339400968, -0.00123874033895332, -0.000607410909441688, 0.0013733440911685, 0.000535892037576371, -0.00155645674962104, -0.000406278397600571, 0.00180512557029149, 0.000155288533729255, -0.00210082536695398, 0.000269520913397327, 0.00251352529977249, -0.00127884566865615, -0.00240858082508993, 0.00221481955369137, 0.00336000647315623, -0.00855413023027777, 0.00818771414349434, -0.00369845825965069, -8.88875483713299e-05, 0.00101835993204671, -0.000437201437209955]
-coefHPF28Hz=[0.000771413557116472, -0.0032488239511862, 0.00669455972324528, -0.00806323264234227, 0.00483042090788234, 0.000944188474232558, -0.00386696575608312, 0.00150411152110028, 0.0021773752647724102, -0.00212718246421973, -0.000948868773260576, 0.00208942754447486, 0.000143891969247498, -0.00184749664732389, 0.000355951129698422, 0.00155236313511657, -0.000671851869433487, -0.00127648873062293, 0.000865917277681266, 0.00102609906441305, -0.000994040947193296, -0.000809222775329607, 0.0010738380516626, 0.000614902236818659, -0.00112897321588394, -0.000445088095400104, 0.00116608124153778, 0.000285516185744446, -0.00119334530729913, -0.000136880772595245, 0.00120866493519416, -7.11385006331224e-06, -0.00121848854518467, 0.000147074921734338, 0.00121968681208731, -0.000288984694591408, -0.00121267625716935, 0.000430060041892893, 0.00119582451684599, -0.000574598468521771, -0.00116875968702869, 0.000721236920167876, 0.0011268541730448, -0.000868522401165726, -0.00107298064083951, 0.00101687307607527, 0.00100337560108874, -0.00116703269725697, -0.000914684149559691, 0.00131196313576264, 0.000809730105266353, -0.00145455228884546, -0.00068514997669911, 0.00158893816918601, 0.000542623613782588, -0.00171530094781401, -0.00038218487851845, 0.00183209427348889, 0.000201083449453316, -0.00193456642535915, -2.50083613031159e-06, 0.0020221070556362, -0.000215962839579184, -0.00208879244403644, 0.000448858150339213, 0.00213581611299233, -0.000698528911580939, -0.00215794762430315, 0.00096108706385544, 0.0021533713855888, -0.00123441640791365, -0.0021205606029709, 0.00151656167454412, 0.00205661458449473, -0.00180381635277713, -0.00196146868761718, 0.00209495642865978, 0.00183231034425721, -0.00238716304710378, -0.00166678413928109, 0.00267660548287384, 0.0014625180106016, -0.00295802229696083, -0.00121923481307349, 0.00322636079143031, 0.000938115717549864, -0.0034789170675306, -0.000618396349678828, 0.00371108615904189, 0.000260913864642031, -0.00391983377721743, 0.000135063150990498, 0.00410078082049237, -0.00057079778624745, -0.00424635596897871, 0.00104292035883286, 0.00435274509228589, -0.00155050846249966, -0.00441389100189633, 0.00209004855413112, 0.00442588047810944, -0.00265921365906356, -0.00438429505335151, 0.00325530593008379, 0.00428566581444125, -0.00387829998004232, -0.00412200908886528, 0.00452366378762055, 0.00388788477170978, -0.00518792689418043, -0.00357636036112771, 0.00586503048454174, 0.00318347188993875, -0.00655201870573166, -0.0027021047432399, 0.00724286274215835, 0.00212955774248165, -0.00794040337865601, -0.00144941693454446, 0.00863299524823111, 0.000657373291557407, -0.00932062442408253, 0.000263864421353849, 0.00999093836314925, -0.00132029279044177, -0.0106455308294155, 0.00253217883005468, 0.0112823580335699, -0.00392971962680629, -0.0118875980361692, 0.00553231670575437, 0.0124748328446616, -0.00740902480683771, -0.0130102317569753, 0.00959305481043279, 0.0135164354492336, -0.0121976648170758, -0.013980965663044, 0.0153688070762553, 0.0143967724988462, -0.0193405517050755, -0.0147645698161477, 0.0245295804973901, 0.0150829096596948, -0.0317279435888568, -0.0153408736189031, 0.0426157457550723, 0.0155487113508141, -0.0616079666705185, -0.015699451939401, 0.104868361246333, 0.0157872203587903, -0.31789988801291, 0.484187543985372, -0.31789988801291, 0.0157872203587903, 0.104868361246333, -0.015699451939401, -0.0616079666705185, 0.0155487113508141, 0.0426157457550723, -0.0153408736189031, -0.0317279435888568, 0.0150829096596948, 0.0245295804973901, -0.0147645698161477, -0.0193405517050755, 0.0143967724988462, 0.0153688070762553, -0.013980965663044, -0.0121976648170758, 0.0135164354492336, 0.00959305481043279, -0.0130102317569753, -0.00740902480683771, 0.0124748328446616, 0.00553231670575437, -0.0118875980361692, -0.00392971962680629, 0.0112823580335699, 0.00253217883005468, -0.0106455308294155, -0.00132029279044177, 0.00999093836314925, 0.000263864421353849, -0.00932062442408253, 0.000657373291557407, 0.00863299524823111, -0.00144941693454446, -0.00794040337865601, 0.00212955774248165, 0.00724286274215835, -0.0027021047432399, -0.00655201870573166, 0.00318347188993875, 0.00586503048454174, -0.00357636036112771, -0.00518792689418043, 0.00388788477170978, 0.00452366378762055, -0.00412200908886528, -0.00387829998004232, 0.00428566581444125, 0.00325530593008379, -0.00438429505335151, -0.00265921365906356, 0.00442588047810944, 0.00209004855413112, -0.00441389100189633, -0.00155050846249966, 0.00435274509228589, 0.00104292035883286, -0.00424635596897871, -0.00057079778624745, 0.00410078082049237, 0.000135063150990498, -0.00391983377721743, 0.000260913864642031, 0.00371108615904189, -0.000618396349678828, -0.0034789170675306, 0.000938115717549864, 0.00322636079143031, -0.00121923481307349, -0.00295802229696083, 0.0014625180106016, 0.00267660548287384, -0.00166678413928109, -0.00238716304710378, 0.00183231034425721, 0.00209495642865978, -0.00196146868761718, -0.00180381635277713, 0.00205661458449473, 0.00151656167454412, -0.0021205606029709, -0.00123441640791365, 0.0021533713855888, 0.00096108706385544, -0.00215794762430315, -0.000698528911580939, 0.00213581611299233, 0.000448858150339213, -0.00208879244403644, -0.000215962839579184, 0.0020221070556362, -2.50083613031159e-06, -0.00193456642535915, 0.000201083449453316, 0.00183209427348889, -0.00038218487851845, -0.00171530094781401, 0.000542623613782588, 0.00158893816918601, -0.00068514997669911, -0.00145455228884546, 0.000809730105266353, 0.00131196313576264, -0.000914684149559691, -0.00116703269725697, 0.00100337560108874, 0.00101687307607527, -0.00107298064083951, -0.000868522401165726, 0.0011268541730448, 0.000721236920167876, -0.00116875968702869, -0.000574598468521771, 0.00119582451684599, 0.000430060041892893, -0.00121267625716935, -0.000288984694591408, 0.00121968681208731, 0.000147074921734338, -0.00121848854518467, -7.11385006331224e-06, 0.00120866493519416, -0.000136880772595245, -0.00119334530729913, 0.000285516185744446, 0.00116608124153778, -0.000445088095400104, -0.00112897321588394, 0.000614902236818659, 0.0010738380516626, -0.000809222775329607, -0.000994040947193296, 0.00102609906441305, 0.000865917277681266, -0.00127648873062293, -0.000671851869433487, 0.00155236313511657, 0.000355951129698422, -0.00184749664732389, 0.000143891969247498, 0.00208942754447486, -0.000948868773260576, -0.00212718246421973, 0.0021773752647724102, 0.00150411152110028, -0.00386696575608312, 0.000944188474232558, 0.00483042090788234, -0.00806323264234227, 0.00669455972324528, -0.0032488239511862, 0.000771413557116472]
-coefHPF29Hz=[-0.000246396131213827, 0.00167771049628361, -0.00459949347321115, 0.00747515574428385, -0.00733684275375975, 0.00309215364245622, 0.00216029584583092, -0.00372588703816805, 0.000767307372596257, 0.0024410594589804, -0.00187365766281426, -0.00111314985257983, 0.00205985954102294, 0.000107544088654191, -0.00183108057459123, 0.000569593287633569, 0.00144009021486041, -0.0009874353974701, -0.00100691606299142, 0.0012156160495109, 0.000585761071973345, -0.00130832859668674, -0.000198227730187652, 0.0013015736238752, -0.000143953431858786, -0.00122695800107483, 0.000445979590602216, 0.00109494951096673, -0.000702841307798965, -0.00092061437735695, 0.000917886844520505, 0.000708565798710711, -0.00108763852370037, -0.000465752902002378, 0.00121011427567984, 0.000195496930687154, -0.00127618125956884, 8.86286211407744e-05, 0.00128725873701195, -0.000382144575561784, -0.00123610991097979, 0.000670607852990707, 0.00112409990337622, -0.000944052183418572, -0.00095066649010609, 0.00118839474962303, 0.000721699155212985, -0.00139534541487508, -0.000437799590231758, 0.00154812064343886, 0.00011021136881346, -0.00163682185692132, 0.000251398115934032, 0.00164890566498259, -0.000629703609490665, -0.00157971351587131, 0.00101062782014807, 0.00142166292616154, -0.0013714258129662, -0.00117788445270456, 0.00169380993033936, 0.000852615849294733, -0.00195765304955865, -0.000457043709178898, 0.00214862287189399, -5.07978484223049e-07, -0.00224592951524497, 0.000499856699714791, 0.00223704084151181, -0.00101979382054944, -0.00211182653034203, 0.00153353913560777, 0.00186957456985388, -0.00201830044025297, -0.00150885042758418, 0.00244474909300924, 0.00103925576372052, -0.00278875971430116, -0.000471889329977607, 0.00302397381176724, -0.000173029977589458, -0.00312997049416897, 0.000873609090083612, 0.00308486955250529, -0.00159557650241857, -0.00287979334241834, 0.0023060804620772, 0.00251010482283647, -0.00296864533309038, -0.00198080263541316, 0.00355078892833948, 0.00129722638919707, -0.00401251455671144, -0.00047888478671899, 0.00431912843612854, -0.000448168766951523, -0.00443735713004145, 0.00144482746485642, 0.00434758536380499, -0.00247325843109595, -0.00403195419844254, 0.00348741241920047, 0.00348323629214571, -0.00444114832386994, -0.00269706181299457, 0.00527743792115597, 0.00168741612783062, -0.00594367418690203, -0.000477825452466562, 0.0063883778020692, -0.000893582739335857, -0.0065725615856975, 0.00239036905220953, 0.00645081161370476, -0.00395753470043843, -0.00598877940480246, 0.00553029561476357, 0.00516284215025788, -0.00703335543569979, -0.00396959234604401, 0.00839909213313104, 0.00240393734249052, -0.0095455797273166, -0.000478490990550878, 0.0103896382676768, -0.00178257228047124, -0.0108417066112011, 0.0043317692573047, 0.0108266093374632, -0.00712487883563943, -0.0102576918869504, 0.0101030765826294, 0.00904438009413284, -0.0131963766431934, -0.00708765373803419, 0.0163210565096673, 0.00428555000751174, -0.0194105581944231, -0.000475347217376506, 0.0223784928000325, -0.00457400326461316, -0.025138695455945, 0.011245550169718, 0.0276234443591329, -0.0202940373235378, -0.0297653243614947, 0.0333693675945104, 0.0314939801377179, -0.0548079018721558, -0.032763736217309, 0.100700197428269, 0.0335515503504174, -0.316503226781733, 0.466200011615397, -0.316503226781733, 0.0335515503504174, 0.100700197428269, -0.032763736217309, -0.0548079018721558, 0.0314939801377179, 0.0333693675945104, -0.0297653243614947, -0.0202940373235378, 0.0276234443591329, 0.011245550169718, -0.025138695455945, -0.00457400326461316, 0.0223784928000325, -0.000475347217376506, -0.0194105581944231, 0.00428555000751174, 0.0163210565096673, -0.00708765373803419, -0.0131963766431934, 0.00904438009413284, 0.0101030765826294, -0.0102576918869504, -0.00712487883563943, 0.0108266093374632, 0.0043317692573047, -0.0108417066112011, -0.00178257228047124, 0.0103896382676768, -0.000478490990550878, -0.0095455797273166, 0.00240393734249052, 0.00839909213313104, -0.00396959234604401, -0.00703335543569979, 0.00516284215025788, 0.00553029561476357, -0.00598877940480246, -0.00395753470043843, 0.00645081161370476, 0.00239036905220953, -0.0065725615856975, -0.000893582739335857, 0.0063883778020692, -0.000477825452466562, -0.00594367418690203, 0.00168741612783062, 0.00527743792115597, -0.00269706181299457, -0.00444114832386994, 0.00348323629214571, 0.00348741241920047, -0.00403195419844254, -0.00247325843109595, 0.00434758536380499, 0.00144482746485642, -0.00443735713004145, -0.000448168766951523, 0.00431912843612854, -0.00047888478671899, -0.00401251455671144, 0.00129722638919707, 0.00355078892833948, -0.00198080263541316, -0.00296864533309038, 0.00251010482283647, 0.0023060804620772, -0.00287979334241834, -0.00159557650241857, 0.00308486955250529, 0.000873609090083612, -0.00312997049416897, -0.000173029977589458, 0.00302397381176724, -0.000471889329977607, -0.00278875971430116, 0.00103925576372052, 0.00244474909300924, -0.00150885042758418, -0.00201830044025297, 0.00186957456985388, 0.00153353913560777, -0.00211182653034203, -0.00101979382054944, 0.00223704084151181, 0.000499856699714791, -0.00224592951524497, -5.07978484223049e-07, 0.00214862287189399, -0.000457043709178898, -0.00195765304955865, 0.000852615849294733, 0.00169380993033936, -0.00117788445270456, -0.0013714258129662, 0.00142166292616154, 0.00101062782014807, -0.00157971351587131, -0.000629703609490665, 0.00164890566498259, 0.000251398115934032, -0.00163682185692132, 0.00011021136881346, 0.00154812064343886, -0.000437799590231758, -0.00139534541487508, 0.000721699155212985, 0.00118839474962303, -0.00095066649010609, -0.000944052183418572, 0.00112409990337622, 0.000670607852990707, -0.00123610991097979, -0.000382144575561784, 0.00128725873701195, 8.86286211407744e-05, -0.00127618125956884, 0.000195496930687154, 0.00121011427567984, -0.000465752902002378, -0.00108763852370037, 0.000708565798710711, 0.000917886844520505, -0.00092061437735695, -0.000702841307798965, 0.00109494951096673, 0.000445979590602216, -0.00122695800107483, -0.000143953431858786, 0.0013015736238752, -0.000198227730187652, -0.00130832859668674, 0.000585761071973345, 0.0012156160495109, -0.00100691606299142, -0.0009874353974701, 0.00144009021486041, 0.000569593287633569, -0.00183108057459123, 0.000107544088654191, 0.00205985954102294, -0.00111314985257983, -0.00187365766281426, 0.0024410594589804, 0.000767307372596257, -0.00372588703816805, 0.00216029584583092, 0.00309215364245622, -0.00733684275375975, 0.00747515574428385, -0.00459949347321115, 0.00167771049628361, -0.000246396131213827]
-coefHPF30Hz=[-8.2875906692731e-05, -0.000341878307429922, 0.00209462106933819, -0.00516753654688815, 0.00764621609010819, -0.00687191578263368, 0.00245355199661652, 0.00234702398966149, -0.0034793605572024, 0.000612301622886187, 0.00233151905260412, -0.00185639591053216, -0.000911036724998862, 0.00204354364163155, -0.000224563346938722, -0.00168365914070521, 0.000964139111357571, 0.00109253022766061, -0.00134078418827738, -0.000453169488831508, 0.0014275613296789, -0.000134253892910169, -0.00129853541880666, 0.000616557113024411, 0.00101911254275742, -0.00096809926466114, -0.000643594772315969, 0.0011774538821355, 0.000219216149436568, -0.00124383124536624, 0.000214726357760786, 0.00116964990407606, -0.000618421824785949, -0.000967144381287721, 0.000956696340142368, 0.000654793767710725, -0.00119652657700514, -0.000260961586222621, 0.00131121114073037, -0.000175946854186845, -0.00128686930149593, 0.000615078904807206, 0.00111933366095874, -0.00101286871422702, -0.000815589795945951, 0.00132343158075948, 0.000399731043107233, -0.00150926695569712, 9.52614632559511e-05, 0.00153627083729363, -0.000618348560765718, -0.00138931449738057, 0.00111311228777106, 0.00107033504388218, -0.00152030989860765, -0.000602579550238861, 0.00178762823038088, 2.66924807197647e-05, -0.00187467262740452, 0.000603733564427419, 0.0017545482209324, -0.00122258118090644, -0.00142018665750116, 0.00175570473091938, 0.000892029622679307, -0.00213466429362639, -0.000213248126560426, 0.00230145779748827, -0.00054917127261114, -0.00222316231930004, 0.00132204154385042, 0.00188125266457797, -0.00201536286113238, -0.00129157289684713, 0.00254399153543798, 0.000495399784183121, -0.00282770298853631, 0.000431314114517703, 0.00281301467244653, -0.00139263071599672, -0.00248013416403697, 0.00229055332181676, 0.0018302545509093, -0.00301396708557259, -0.000906646458008077, 0.0034620750882927, -0.000210730390391816, -0.00355696676925418, 0.00141141836125873, 0.0032564346624882, -0.00256808172345464, -0.00255954524123648, 0.00355297788363308, 0.00149828153442575, -0.0042338898798021, -0.000154579865378365, 0.00449766032709826, -0.00134058001542822, -0.00428020283616598, 0.00283950434075621, 0.0035574021004677, -0.00418196695001784, -0.0023465184069822, 0.00519208377845069, 0.000734870641335969, -0.00571952814569433, 0.00113455414486441, 0.00566340097790197, -0.00309486023471821, -0.00495528573693678, 0.00493792065818137, 0.00359068796862395, -0.0064327681157809, -0.00165836627134984, 0.00738964591365275, -0.000714049461799757, -0.00762737940460273, 0.00332329913382117, 0.00701747297990928, -0.00590178370232225, -0.00552976345125998, 0.0081881042010267, 0.00317489015815021, -0.00986818648632089, -9.77997228047648e-05, 0.0106878643311305, -0.00350618550228576, -0.010402205223292, 0.00733172508465286, 0.0088568702470248, -0.0110255811678593, -0.00596938456246312, 0.0141771284760744, 0.0017623043430796, -0.0163537993477785, 0.0036437713754479, 0.0171078295596753, -0.0100226016970012, -0.0159952747420904, 0.0170638605671515, 0.0125550065962691, -0.0243889190272315, -0.00624802008657497, 0.0315802364734852, -0.00373063001527656, -0.0382034217191524, 0.018968230510912, 0.0438514566407475, -0.0436593586356228, -0.048166181005213, 0.0936564413987742, 0.05087314707852, -0.314084974365363, 0.448204281675958, -0.314084974365363, 0.05087314707852, 0.0936564413987742, -0.048166181005213, -0.0436593586356228, 0.0438514566407475, 0.018968230510912, -0.0382034217191524, -0.00373063001527656, 0.0315802364734852, -0.00624802008657497, -0.0243889190272315, 0.0125550065962691, 0.0170638605671515, -0.0159952747420904, -0.0100226016970012, 0.0171078295596753, 0.0036437713754479, -0.0163537993477785, 0.0017623043430796, 0.0141771284760744, -0.00596938456246312, -0.0110255811678593, 0.0088568702470248, 0.00733172508465286, -0.010402205223292, -0.00350618550228576, 0.0106878643311305, -9.77997228047648e-05, -0.00986818648632089, 0.00317489015815021, 0.0081881042010267, -0.00552976345125998, -0.00590178370232225, 0.00701747297990928, 0.00332329913382117, -0.00762737940460273, -0.000714049461799757, 0.00738964591365275, -0.00165836627134984, -0.0064327681157809, 0.00359068796862395, 0.00493792065818137, -0.00495528573693678, -0.00309486023471821, 0.00566340097790197, 0.00113455414486441, -0.00571952814569433, 0.000734870641335969, 0.00519208377845069, -0.0023465184069822, -0.00418196695001784, 0.0035574021004677, 0.00283950434075621, -0.00428020283616598, -0.00134058001542822, 0.00449766032709826, -0.000154579865378365, -0.0042338898798021, 0.00149828153442575, 0.00355297788363308, -0.00255954524123648, -0.00256808172345464, 0.0032564346624882, 0.00141141836125873, -0.00355696676925418, -0.000210730390391816, 0.0034620750882927, -0.000906646458008077, -0.00301396708557259, 0.0018302545509093, 0.00229055332181676, -0.00248013416403697, -0.00139263071599672, 0.00281301467244653, 0.000431314114517703, -0.00282770298853631, 0.000495399784183121, 0.00254399153543798, -0.00129157289684713, -0.00201536286113238, 0.00188125266457797, 0.00132204154385042, -0.00222316231930004, -0.00054917127261114, 0.00230145779748827, -0.000213248126560426, -0.00213466429362639, 0.000892029622679307, 0.00175570473091938, -0.00142018665750116, -0.00122258118090644, 0.0017545482209324, 0.000603733564427419, -0.00187467262740452, 2.66924807197647e-05, 0.00178762823038088, -0.000602579550238861, -0.00152030989860765, 0.00107033504388218, 0.00111311228777106, -0.00138931449738057, -0.000618348560765718, 0.00153627083729363, 9.52614632559511e-05, -0.00150926695569712, 0.000399731043107233, 0.00132343158075948, -0.000815589795945951, -0.00101286871422702, 0.00111933366095874, 0.000615078904807206, -0.00128686930149593, -0.000175946854186845, 0.00131121114073037, -0.000260961586222621, -0.00119652657700514, 0.000654793767710725, 0.000956696340142368, -0.000967144381287721, -0.000618421824785949, 0.00116964990407606, 0.000214726357760786, -0.00124383124536624, 0.000219216149436568, 0.0011774538821355, -0.000643594772315969, -0.00096809926466114, 0.00101911254275742, 0.000616557113024411, -0.00129853541880666, -0.000134253892910169, 0.0014275613296789, -0.000453169488831508, -0.00134078418827738, 0.00109253022766061, 0.000964139111357571, -0.00168365914070521, -0.000224563346938722, 0.00204354364163155, -0.000911036724998862, -0.00185639591053216, 0.00233151905260412, 0.000612301622886187, -0.0034793605572024, 0.00234702398966149, 0.00245355199661652, -0.00687191578263368, 0.00764621609010819, -0.00516753654688815, 0.00209462106933819, -0.000341878307429922, -8.2875906692731e-05]
-coefHPF31Hz=[0.000335490897099189, -0.000919615061978587, 0.000981502399024222, 0.000657533412673602, -0.00410369250171481, 0.00737334579841657, -0.00762038285927454, 0.00406048808738757, 0.000603500781819555, -0.00252150532610805, 0.000712760386675778, 0.00190741677062832, -0.00200141543667241, -0.000285534330976122, 0.00183277353950093, -0.000753567565163918, -0.00123735374794453, 0.00135478264929242, 0.000413880757815316, -0.00145999579668588, 0.00034907920976706, 0.00119984792915361, -0.000916638225225058, -0.000705628418679615, 0.00122023403626268, 0.000106637946960119, -0.0012397224782479, 0.000471678416893202, 0.00100520821459869, -0.000929756031185799, -0.00057620092382733, 0.00119319972940399, 3.66001443203622e-05, -0.00121947034710057, 0.000512972319835069, 0.00100910870793098, -0.000980099470350403, -0.000587020249802524, 0.00126633573481775, 3.45231418993982e-05, -0.00132149218662796, 0.000563848808468174, 0.00110639548647659, -0.00107982985627043, -0.000657879559222255, 0.00141445114992176, 4.44133564946134e-05, -0.00148724814775775, 0.000624397108838227, 0.00126232880523392, -0.00121471951440148, -0.000770284569707482, 0.00161554211001497, 7.16682516369142e-05, -0.00171421647499774, 0.000696795742564912, 0.00147413417463639, -0.00139096644306618, -0.000912102594032353, 0.00186362747972309, 0.000110991153126806, -0.00199267703081378, 0.000776857121465621, 0.00173570531911117, -0.0015941505722378, -0.00109840044505586, 0.002164579435232, 0.000169846206322689, -0.00233618258019134, 0.000872073050849054, 0.00204964801789666, -0.0018308329313188, -0.0013239033393678, 0.00251248835913015, 0.000254905306434827, -0.00274323132872046, 0.000966309982687941, 0.0024352579443621, -0.00210283863277978, -0.00160675225033257, 0.00292332037574608, 0.000370569911720595, -0.00322764802812052, 0.00105932160399092, 0.00290684304767547, -0.00241435004699001, -0.00196286306583175, 0.00340986802054216, 0.000530016504000008, -0.00381376802697275, 0.00115340417272446, 0.00348484990933717, -0.00277296709059474, -0.0024148232656287, 0.00399350284180858, 0.00074720526322028, -0.00453149422234045, 0.00124618700629558, 0.00420569760133952, -0.00319596168911442, -0.00299225287112965, 0.00470464491653894, 0.00104334169302043, -0.00542543104587685, 0.00133252969379689, 0.0051253671364022, -0.00370444945066166, -0.00375229443682829, 0.00559914700295561, 0.00145533926299672, -0.00657885265376185, 0.00141188078042089, 0.00634026890651437, -0.00434610149539327, -0.00478118209404884, 0.00677030094200665, 0.00204409923449454, -0.00813489159183086, 0.00148237058636208, 0.00802257478866026, -0.00520190299841841, -0.00625039457604192, 0.00840561608487812, 0.00292160069654517, -0.0103754683081749, 0.0015435612533635, 0.0105233662189006, -0.0064466437386423, -0.00851340032664263, 0.0109015203488341, 0.00434385249593164, -0.0139449263503022, 0.00159208230229591, 0.0146909308039538, -0.00851348633510207, -0.0124836824719225, 0.0153233084421797, 0.00700618104002862, -0.0206947567379409, 0.001626180907338, 0.0232007587772229, -0.0128548751485482, -0.02139302900042, 0.0257178014418755, 0.0137700251231956, -0.0389662932765635, 0.00164700339297652, 0.0512116821023883, -0.0290562783449766, -0.061109606905613, 0.0839285503871015, 0.067542980432777, -0.310673270380108, 0.430225902029552, -0.310673270380108, 0.067542980432777, 0.0839285503871015, -0.061109606905613, -0.0290562783449766, 0.0512116821023883, 0.00164700339297652, -0.0389662932765635, 0.0137700251231956, 0.0257178014418755, -0.02139302900042, -0.0128548751485482, 0.0232007587772229, 0.001626180907338, -0.0206947567379409, 0.00700618104002862, 0.0153233084421797, -0.0124836824719225, -0.00851348633510207, 0.0146909308039538, 0.00159208230229591, -0.0139449263503022, 0.00434385249593164, 0.0109015203488341, -0.00851340032664263, -0.0064466437386423, 0.0105233662189006, 0.0015435612533635, -0.0103754683081749, 0.00292160069654517, 0.00840561608487812, -0.00625039457604192, -0.00520190299841841, 0.00802257478866026, 0.00148237058636208, -0.00813489159183086, 0.00204409923449454, 0.00677030094200665, -0.00478118209404884, -0.00434610149539327, 0.00634026890651437, 0.00141188078042089, -0.00657885265376185, 0.00145533926299672, 0.00559914700295561, -0.00375229443682829, -0.00370444945066166, 0.0051253671364022, 0.00133252969379689, -0.00542543104587685, 0.00104334169302043, 0.00470464491653894, -0.00299225287112965, -0.00319596168911442, 0.00420569760133952, 0.00124618700629558, -0.00453149422234045, 0.00074720526322028, 0.00399350284180858, -0.0024148232656287, -0.00277296709059474, 0.00348484990933717, 0.00115340417272446, -0.00381376802697275, 0.000530016504000008, 0.00340986802054216, -0.00196286306583175, -0.00241435004699001, 0.00290684304767547, 0.00105932160399092, -0.00322764802812052, 0.000370569911720595, 0.00292332037574608, -0.00160675225033257, -0.00210283863277978, 0.0024352579443621, 0.000966309982687941, -0.00274323132872046, 0.000254905306434827, 0.00251248835913015, -0.0013239033393678, -0.0018308329313188, 0.00204964801789666, 0.000872073050849054, -0.00233618258019134, 0.000169846206322689, 0.002164579435232, -0.00109840044505586, -0.0015941505722378, 0.00173570531911117, 0.000776857121465621, -0.00199267703081378, 0.000110991153126806, 0.00186362747972309, -0.000912102594032353, -0.00139096644306618, 0.00147413417463639, 0.000696795742564912, -0.00171421647499774, 7.16682516369142e-05, 0.00161554211001497, -0.000770284569707482, -0.00121471951440148, 0.00126232880523392, 0.000624397108838227, -0.00148724814775775, 4.44133564946134e-05, 0.00141445114992176, -0.000657879559222255, -0.00107982985627043, 0.00110639548647659, 0.000563848808468174, -0.00132149218662796, 3.45231418993982e-05, 0.00126633573481775, -0.000587020249802524, -0.000980099470350403, 0.00100910870793098, 0.000512972319835069, -0.00121947034710057, 3.66001443203622e-05, 0.00119319972940399, -0.00057620092382733, -0.000929756031185799, 0.00100520821459869, 0.000471678416893202, -0.0012397224782479, 0.000106637946960119, 0.00122023403626268, -0.000705628418679615, -0.000916638225225058, 0.00119984792915361, 0.00034907920976706, -0.00145999579668588, 0.000413880757815316, 0.00135478264929242, -0.00123735374794453, -0.000753567565163918, 0.00183277353950093, -0.000285534330976122, -0.00200141543667241, 0.00190741677062832, 0.000712760386675778, -0.00252150532610805, 0.000603500781819555, 0.00406048808738757, -0.00762038285927454, 0.00737334579841657, -0.00410369250171481, 0.000657533412673602, 0.000981502399024222, -0.000919615061978587, 0.000335490897099189]
-coefHPF32Hz=[-0.000450810684332323, 0.00193256347787358, -0.00437816079518602, 0.00660114792135611, -0.00664403163303398, 0.00372219125197022, 0.000608619585995416, -0.00323274495273621, 0.0023820940300212, 0.000574640519011659, -0.00237126929729963, 0.00130799600825308, 0.00106619103544099, -0.00187133352035579, 0.000341872452001617, 0.00143628245141034, -0.00123447786238566, -0.000522578918264926, 0.00146306409185963, -0.000412414063698956, -0.0011197617037431, 0.0010600975640024, 0.000439837985102818, -0.00127428308504123, 0.00031613550460845, 0.00105770768312854, -0.000916368055652414, -0.00051789279012809, 0.0012027351566147, -0.000167212598910143, -0.00110734099279589, 0.000793186268353146, 0.000669482068148644, -0.00117997946805791, -1.48601783347687e-05, 0.00120969783973823, -0.000665460605187755, -0.000863009400101135, 0.00116729332075479, 0.00023018801071382, -0.00132973349356881, 0.000508993120600503, 0.00108726668071916, -0.00113702174347861, -0.000486676125924555, 0.00145176103042318, -0.000310983529188479, -0.00133252738026063, 0.00107229633841829, 0.000782627593169814, -0.00155550748897542, 5.9515770592633e-05, 0.00158729426637149, -0.000955233342001457, -0.00111709874732594, 0.00162429677036908, 0.000251596555672793, -0.00183586441013974, 0.000769303182241986, 0.0014838197582087, -0.00163649024598473, -0.000631025270273444, 0.0020647233967007, -0.000500674591990109, -0.00187695726780951, 0.00157799123667186, 0.00107617632019869, -0.00225508500012412, 0.000141604146333273, 0.00227913022245236, -0.00142848938613039, -0.00158186600125849, 0.00238324426382141, 0.000315833508386826, -0.00266988435398684, 0.00116776124145557, 0.00213798038940552, -0.00242061724600652, -0.000880523584815568, 0.00302741886436721, -0.000774660369723343, -0.00273704919159442, 0.0023466895588476, 0.00155129238123813, -0.00332859265457883, 0.000241048970709471, 0.00335271794110787, -0.00213174308906835, -0.00231951589299967, 0.00353392212533715, 0.000453658429461641, -0.00396188676280443, 0.00174318734627071, 0.00318283204815113, -0.00361396705547492, -0.00131856077223047, 0.00453692933983554, -0.00115746536286739, -0.00412099946485802, 0.00352705083812573, 0.00235885552649573, -0.00503436186651491, 0.000337567953295906, 0.0051148258195858, -0.00322246558765194, -0.00358960423548149, 0.00541541238102322, 0.000753141889552632, -0.00614677329059015, 0.00265478738790364, 0.00501432243402935, -0.00562833787335078, -0.00215234730935026, 0.00717956663326957, -0.00174870179925502, -0.00665014622893309, 0.0056025174611206, 0.0039336687391741, -0.00819468241281617, 0.000416930272871557, 0.00853268441878331, -0.0052643457974297, -0.00618217028243816, 0.00915318897031997, 0.00148097817327652, -0.0107185512790964, 0.00447442035336262, 0.00908435471949949, -0.0100294964181229, -0.004195197601805, 0.0133615671269271, -0.00302934013872905, -0.0129808219994343, 0.0107912594444228, 0.00821951197517358, -0.0167844847386729, 0.000470052852756011, 0.018693119496439, -0.0114150176073493, -0.0147729628833174, 0.021896361619094, 0.00435377205117844, -0.0285425934887587, 0.0118730030263337, 0.0277878071411802, -0.0319170619972154, -0.0159192437063706, 0.0527486578746008, -0.0121619580450051, -0.0709400969283091, 0.0717985628212044, 0.0833497735297987, -0.30627792967297, 0.412260534526252, -0.30627792967297, 0.0833497735297987, 0.0717985628212044, -0.0709400969283091, -0.0121619580450051, 0.0527486578746008, -0.0159192437063706, -0.0319170619972154, 0.0277878071411802, 0.0118730030263337, -0.0285425934887587, 0.00435377205117844, 0.021896361619094, -0.0147729628833174, -0.0114150176073493, 0.018693119496439, 0.000470052852756011, -0.0167844847386729, 0.00821951197517358, 0.0107912594444228, -0.0129808219994343, -0.00302934013872905, 0.0133615671269271, -0.004195197601805, -0.0100294964181229, 0.00908435471949949, 0.00447442035336262, -0.0107185512790964, 0.00148097817327652, 0.00915318897031997, -0.00618217028243816, -0.0052643457974297, 0.00853268441878331, 0.000416930272871557, -0.00819468241281617, 0.0039336687391741, 0.0056025174611206, -0.00665014622893309, -0.00174870179925502, 0.00717956663326957, -0.00215234730935026, -0.00562833787335078, 0.00501432243402935, 0.00265478738790364, -0.00614677329059015, 0.000753141889552632, 0.00541541238102322, -0.00358960423548149, -0.00322246558765194, 0.0051148258195858, 0.000337567953295906, -0.00503436186651491, 0.00235885552649573, 0.00352705083812573, -0.00412099946485802, -0.00115746536286739, 0.00453692933983554, -0.00131856077223047, -0.00361396705547492, 0.00318283204815113, 0.00174318734627071, -0.00396188676280443, 0.000453658429461641, 0.00353392212533715, -0.00231951589299967, -0.00213174308906835, 0.00335271794110787, 0.000241048970709471, -0.00332859265457883, 0.00155129238123813, 0.0023466895588476, -0.00273704919159442, -0.000774660369723343, 0.00302741886436721, -0.000880523584815568, -0.00242061724600652, 0.00213798038940552, 0.00116776124145557, -0.00266988435398684, 0.000315833508386826, 0.00238324426382141, -0.00158186600125849, -0.00142848938613039, 0.00227913022245236, 0.000141604146333273, -0.00225508500012412, 0.00107617632019869, 0.00157799123667186, -0.00187695726780951, -0.000500674591990109, 0.0020647233967007, -0.000631025270273444, -0.00163649024598473, 0.0014838197582087, 0.000769303182241986, -0.00183586441013974, 0.000251596555672793, 0.00162429677036908, -0.00111709874732594, -0.000955233342001457, 0.00158729426637149, 5.9515770592633e-05, -0.00155550748897542, 0.000782627593169814, 0.00107229633841829, -0.00133252738026063, -0.000310983529188479, 0.00145176103042318, -0.000486676125924555, -0.00113702174347861, 0.00108726668071916, 0.000508993120600503, -0.00132973349356881, 0.00023018801071382, 0.00116729332075479, -0.000863009400101135, -0.000665460605187755, 0.00120969783973823, -1.48601783347687e-05, -0.00117997946805791, 0.000669482068148644, 0.000793186268353146, -0.00110734099279589, -0.000167212598910143, 0.0012027351566147, -0.00051789279012809, -0.000916368055652414, 0.00105770768312854, 0.00031613550460845, -0.00127428308504123, 0.000439837985102818, 0.0010600975640024, -0.0011197617037431, -0.000412414063698956, 0.00146306409185963, -0.000522578918264926, -0.00123447786238566, 0.00143628245141034, 0.000341872452001617, -0.00187133352035579, 0.00106619103544099, 0.00130799600825308, -0.00237126929729963, 0.000574640519011659, 0.0023820940300212, -0.00323274495273621, 0.000608619585995416, 0.00372219125197022, -0.00664403163303398, 0.00660114792135611, -0.00437816079518602, 0.00193256347787358, -0.000450810684332323]
-coefHPF33Hz=[8.53508689610863e-05, -0.000804952158195676, 0.00249651006605012, -0.00489746705050486, 0.0066928219045168, -0.00627872271810007, 0.00323056279100462, 0.000832275711024751, -0.00321168143157673, 0.00241848931891478, 0.000358327704334124, -0.00228516850643317, 0.00161738764019653, 0.000630858465676314, -0.00190143256169906, 0.000917162154852619, 0.000999506054080363, -0.0015726827234064, 0.00024156022365513, 0.00127558692827614, -0.00113711118520142, -0.000393606284945795, 0.00135316253137742, -0.000565727422298189, -0.000910252243529409, 0.00117317142471611, 8.44856309313152e-05, -0.00120679141145546, 0.000734812132539406, 0.000698934830456995, -0.00120337674322728, 0.000111770531085596, 0.00113312548914647, -0.000873901425455224, -0.000559674886207341, 0.00126273551971239, -0.000277625087026563, -0.00110250707978141, 0.00102370712696379, 0.0004436040296109, -0.00134940993317206, 0.000449360351243134, 0.00108851500746129, -0.00119320839262974, -0.000325359818523059, 0.00145386984328535, -0.000638937676477763, -0.00107925294971104, 0.00138836470298542, 0.000189073210395296, -0.00157154983659706, 0.000860404125878903, 0.00105722547200591, -0.00160706214636681, -2.05836707319763e-05, 0.00168851023955624, -0.00111381331192632, -0.001011660539704, 0.0018410735729854, -0.000180793886954025, -0.00180076317913392, 0.00139876767929291, 0.000941438012373639, -0.00209469984197266, 0.000424521422961035, 0.00190361707639235, -0.0017229359040081, -0.000832239390881875, 0.00236069578950502, -0.00071646068029505, -0.00198618471885333, 0.00208203054956386, 0.000680133527175614, -0.00263480544729481, 0.00105672748826243, 0.0020489249228436, -0.00248286299629547, -0.000476834977610877, 0.00291905702158397, -0.00146098586293961, -0.00207440922659096, 0.0029208315251897, 0.000212991845373583, -0.00320200384468169, 0.00192440335887791, 0.00206472611561217, -0.00340211655502434, 0.00011750281988229, 0.00348909763542748, -0.00246495530176146, -0.00200527390045886, 0.00393097053496232, -0.000533091464373297, -0.00376744143706101, 0.00308528479865885, 0.00188902949874616, -0.00451007849288039, 0.00104052811078551, 0.00404497292044659, -0.00381067203929757, -0.00169712334615507, 0.00514935226617784, -0.00166863978746421, -0.00430553997553707, 0.00464928000387203, 0.00142125537990454, -0.00586472000709414, 0.00244227425260955, 0.00455471958407535, -0.00564420259669703, -0.00102442897110285, 0.00666582187434526, -0.00339719528959289, -0.00478833702682986, 0.00683463184689433, 0.000485012666992804, -0.00760119098050234, 0.00461056994284939, 0.00499640502986033, -0.0082961959555563, 0.000256507159895614, 0.0087194286388597, -0.00617912965666637, -0.00518610224608057, 0.0101678455016944, -0.00129809977242497, -0.0101205033263669, 0.00829273680319606, 0.00535444395514492, -0.0126923632495681, 0.00281339228158821, 0.0120026575993161, -0.0113262503110967, -0.00549391559590799, 0.0163662337563348, -0.00516530975794639, -0.0147989826817903, 0.0161164368261605, 0.00560328520906436, -0.0224139796658978, 0.00928687547107294, 0.0196618357568122, -0.0250214476118149, -0.00568219344581996, 0.0347840359351561, -0.0184362327733509, -0.0310549101706781, 0.0482769591005791, 0.00572897469604516, -0.077181543544638, 0.057596691372228, 0.0981093568498981, -0.300886931464344, 0.394255105509667, -0.300886931464344, 0.0981093568498981, 0.057596691372228, -0.077181543544638, 0.00572897469604516, 0.0482769591005791, -0.0310549101706781, -0.0184362327733509, 0.0347840359351561, -0.00568219344581996, -0.0250214476118149, 0.0196618357568122, 0.00928687547107294, -0.0224139796658978, 0.00560328520906436, 0.0161164368261605, -0.0147989826817903, -0.00516530975794639, 0.0163662337563348, -0.00549391559590799, -0.0113262503110967, 0.0120026575993161, 0.00281339228158821, -0.0126923632495681, 0.00535444395514492, 0.00829273680319606, -0.0101205033263669, -0.00129809977242497, 0.0101678455016944, -0.00518610224608057, -0.00617912965666637, 0.0087194286388597, 0.000256507159895614, -0.0082961959555563, 0.00499640502986033, 0.00461056994284939, -0.00760119098050234, 0.000485012666992804, 0.00683463184689433, -0.00478833702682986, -0.00339719528959289, 0.00666582187434526, -0.00102442897110285, -0.00564420259669703, 0.00455471958407535, 0.00244227425260955, -0.00586472000709414, 0.00142125537990454, 0.00464928000387203, -0.00430553997553707, -0.00166863978746421, 0.00514935226617784, -0.00169712334615507, -0.00381067203929757, 0.00404497292044659, 0.00104052811078551, -0.00451007849288039, 0.00188902949874616, 0.00308528479865885, -0.00376744143706101, -0.000533091464373297, 0.00393097053496232, -0.00200527390045886, -0.00246495530176146, 0.00348909763542748, 0.00011750281988229, -0.00340211655502434, 0.00206472611561217, 0.00192440335887791, -0.00320200384468169, 0.000212991845373583, 0.0029208315251897, -0.00207440922659096, -0.00146098586293961, 0.00291905702158397, -0.000476834977610877, -0.00248286299629547, 0.0020489249228436, 0.00105672748826243, -0.00263480544729481, 0.000680133527175614, 0.00208203054956386, -0.00198618471885333, -0.00071646068029505, 0.00236069578950502, -0.000832239390881875, -0.0017229359040081, 0.00190361707639235, 0.000424521422961035, -0.00209469984197266, 0.000941438012373639, 0.00139876767929291, -0.00180076317913392, -0.000180793886954025, 0.0018410735729854, -0.001011660539704, -0.00111381331192632, 0.00168851023955624, -2.05836707319763e-05, -0.00160706214636681, 0.00105722547200591, 0.000860404125878903, -0.00157154983659706, 0.000189073210395296, 0.00138836470298542, -0.00107925294971104, -0.000638937676477763, 0.00145386984328535, -0.000325359818523059, -0.00119320839262974, 0.00108851500746129, 0.000449360351243134, -0.00134940993317206, 0.0004436040296109, 0.00102370712696379, -0.00110250707978141, -0.000277625087026563, 0.00126273551971239, -0.000559674886207341, -0.000873901425455224, 0.00113312548914647, 0.000111770531085596, -0.00120337674322728, 0.000698934830456995, 0.000734812132539406, -0.00120679141145546, 8.44856309313152e-05, 0.00117317142471611, -0.000910252243529409, -0.000565727422298189, 0.00135316253137742, -0.000393606284945795, -0.00113711118520142, 0.00127558692827614, 0.00024156022365513, -0.0015726827234064, 0.000999506054080363, 0.000917162154852619, -0.00190143256169906, 0.000630858465676314, 0.00161738764019653, -0.00228516850643317, 0.000358327704334124, 0.00241848931891478, -0.00321168143157673, 0.000832275711024751, 0.00323056279100462, -0.00627872271810007, 0.0066928219045168, -0.00489746705050486, 0.00249651006605012, -0.000804952158195676, 8.53508689610863e-05]
-coefHPF34Hz=[0.000122934754183417, -6.76120669038655e-05, -0.000601139365128553, 0.00227452016882553, -0.00465007234479232, 0.00651448435298069, -0.0063898639293736, 0.00378390357032099, 3.88133396403328e-05, -0.00272423365833267, 0.00265369351414666, -0.000371442282886671, -0.00183393470601125, 0.00198142486342359, -0.000190427160051592, -0.0015626346449827, 0.00151009737670069, 0.000124804092506574, -0.00147504707586728, 0.0011023348771721, 0.000467237347087657, -0.00141003908519419, 0.000692345063801395, 0.000788719881275293, -0.00128978048394798, 0.00025720831881198, 0.00105207979566036, -0.00107801014751849, -0.000190887444234671, 0.00121555735943534, -0.000758553580780075, -0.000623209740223529, 0.00124673181528289, -0.000343743971580807, -0.00099090980423237, 0.00111749606256459, 0.000139521018585832, -0.00124751785145426, 0.00082622747894243, 0.000636530360509915, -0.00134325897476216, 0.000389099134579601, 0.00108298947743964, -0.00124610403029392, -0.000147900236953281, 0.0014041246401996, -0.000940831504458034, -0.000722206968973131, 0.00153859737178865, -0.000448982346585552, -0.00124860815815421, 0.00143916137538722, 0.000178956084199424, -0.00163984304144092, 0.00109397231516079, 0.000854747844016509, -0.00180677708341403, 0.000518029384078398, 0.00147997431051889, -0.00169346472031406, -0.000225653639178371, 0.00194522729323915, -0.00128129288710205, -0.00103432284659012, 0.00214811491043248, -0.000597514628411923, -0.00177640257402993, 0.00200781223443971, 0.000292826777450781, -0.00232822485817241, 0.00150859325107649, 0.00126054285217185, -0.00256353378882095, 0.000683290518575203, 0.00214571690373331, -0.00238397750481305, -0.000390458391798959, 0.00280211408053896, -0.00177738395086847, -0.00154638610549361, 0.00306428419465638, -0.000767061770175093, -0.00261248533593169, 0.00283934166835338, 0.000524861492127624, -0.00338432303892162, 0.00208678364773316, 0.00192174995764254, -0.00368508964657441, 0.000855671660831051, 0.00319876903156008, -0.00339001392937693, -0.00071556660433369, 0.00411604225579908, -0.00245578230557261, -0.00240970066736284, 0.00445836354393866, -0.000942527485606611, -0.00395212480463738, 0.00407122016454647, 0.000985226451429974, -0.00505404762694314, 0.00290354423338783, 0.00306047304583228, -0.00544737976752942, 0.00102057295355141, 0.00495387000359477, -0.00494485311492948, -0.00137458157487534, 0.00630261315141959, -0.00346799892010436, -0.00396645308043497, 0.00677739984747489, -0.00109111180638981, -0.0063451418632293, 0.00612665275615873, 0.00195629462594507, -0.0080626301181661, 0.00423505733954865, 0.00529056339324687, -0.00868370048434964, 0.00115239206753386, 0.00841490548965871, -0.00786182588332145, -0.00287162899993356, 0.0107503266244347, -0.0053794008950936, -0.00740594238597473, 0.0117088742756366, -0.00120440865021637, -0.0118488875519775, 0.0107416477024781, 0.00449454772741218, -0.0154678490502213, 0.00738408488446508, 0.0113452236729331, -0.0174177062886257, 0.00124051374937468, 0.018816237264905, -0.0167356799320519, -0.00810167498399532, 0.0262539161563073, -0.0121394949247187, -0.0214567202202498, 0.0329689189373101, -0.00126295221862141, -0.0413804488775165, 0.0383124273475271, 0.023147285835645, -0.0794862467159128, 0.0417508629686489, 0.111609077131282, -0.294545265168005, 0.376270891318583, -0.294545265168005, 0.111609077131282, 0.0417508629686489, -0.0794862467159128, 0.023147285835645, 0.0383124273475271, -0.0413804488775165, -0.00126295221862141, 0.0329689189373101, -0.0214567202202498, -0.0121394949247187, 0.0262539161563073, -0.00810167498399532, -0.0167356799320519, 0.018816237264905, 0.00124051374937468, -0.0174177062886257, 0.0113452236729331, 0.00738408488446508, -0.0154678490502213, 0.00449454772741218, 0.0107416477024781, -0.0118488875519775, -0.00120440865021637, 0.0117088742756366, -0.00740594238597473, -0.0053794008950936, 0.0107503266244347, -0.00287162899993356, -0.00786182588332145, 0.00841490548965871, 0.00115239206753386, -0.00868370048434964, 0.00529056339324687, 0.00423505733954865, -0.0080626301181661, 0.00195629462594507, 0.00612665275615873, -0.0063451418632293, -0.00109111180638981, 0.00677739984747489, -0.00396645308043497, -0.00346799892010436, 0.00630261315141959, -0.00137458157487534, -0.00494485311492948, 0.00495387000359477, 0.00102057295355141, -0.00544737976752942, 0.00306047304583228, 0.00290354423338783, -0.00505404762694314, 0.000985226451429974, 0.00407122016454647, -0.00395212480463738, -0.000942527485606611, 0.00445836354393866, -0.00240970066736284, -0.00245578230557261, 0.00411604225579908, -0.00071556660433369, -0.00339001392937693, 0.00319876903156008, 0.000855671660831051, -0.00368508964657441, 0.00192174995764254, 0.00208678364773316, -0.00338432303892162, 0.000524861492127624, 0.00283934166835338, -0.00261248533593169, -0.000767061770175093, 0.00306428419465638, -0.00154638610549361, -0.00177738395086847, 0.00280211408053896, -0.000390458391798959, -0.00238397750481305, 0.00214571690373331, 0.000683290518575203, -0.00256353378882095, 0.00126054285217185, 0.00150859325107649, -0.00232822485817241, 0.000292826777450781, 0.00200781223443971, -0.00177640257402993, -0.000597514628411923, 0.00214811491043248, -0.00103432284659012, -0.00128129288710205, 0.00194522729323915, -0.000225653639178371, -0.00169346472031406, 0.00147997431051889, 0.000518029384078398, -0.00180677708341403, 0.000854747844016509, 0.00109397231516079, -0.00163984304144092, 0.000178956084199424, 0.00143916137538722, -0.00124860815815421, -0.000448982346585552, 0.00153859737178865, -0.000722206968973131, -0.000940831504458034, 0.0014041246401996, -0.000147900236953281, -0.00124610403029392, 0.00108298947743964, 0.000389099134579601, -0.00134325897476216, 0.000636530360509915, 0.00082622747894243, -0.00124751785145426, 0.000139521018585832, 0.00111749606256459, -0.00099090980423237, -0.000343743971580807, 0.00124673181528289, -0.000623209740223529, -0.000758553580780075, 0.00121555735943534, -0.000190887444234671, -0.00107801014751849, 0.00105207979566036, 0.00025720831881198, -0.00128978048394798, 0.000788719881275293, 0.000692345063801395, -0.00141003908519419, 0.000467237347087657, 0.0011023348771721, -0.00147504707586728, 0.000124804092506574, 0.00151009737670069, -0.0015626346449827, -0.000190427160051592, 0.00198142486342359, -0.00183393470601125, -0.000371442282886671, 0.00265369351414666, -0.00272423365833267, 3.88133396403328e-05, 0.00378390357032099, -0.0063898639293736, 0.00651448435298069, -0.00465007234479232, 0.00227452016882553, -0.000601139365128553, -6.76120669038655e-05, 0.000122934754183417]
-coefHPF35Hz=[-0.000266933304780979, 0.000799196646702341, -0.00136187850107778, 0.00130764704899533, 6.58849929468029e-06, -0.00257583628701196, 0.00538187216009174, -0.00682242845110031, 0.00582911175944726, -0.0028390203889645, -0.000310084746901625, 0.00168194868247666, -0.000755662605963752, -0.00117515770484445, 0.0021545575776628, -0.00129101282652796, -0.000513490188554956, 0.0015150095178001, -0.000844238138097236, -0.000684194393133883, 0.00145275746505029, -0.000703009292746306, -0.0007210737069798, 0.00130035709241659, -0.000453464490997341, -0.000866866330011371, 0.00121922227295885, -0.000234300888690598, -0.000993222761131216, 0.00110897765442011, 1.08034666608024e-05, -0.00111925229657072, 0.000976316295700193, 0.000267084813565052, -0.00122147394448924, 0.000803147198749992, 0.000537610737032466, -0.00129503684113831, 0.000592346700112255, 0.000805629038843513, -0.00131992996573179, 0.000336587845337202, 0.00106225938715278, -0.00128366069892032, 3.34042619109703e-05, 0.00130144379962579, -0.00118658747405508, -0.000299947523938088, 0.00149670706335654, -0.00101189327041912, -0.00066138987619888, 0.00163837119405791, -0.000761342655375938, -0.00103333009160177, 0.00170933763720456, -0.000437442803334783, -0.00139421896423498, 0.00169023286952472, -4.15346950032216e-05, -0.00172761034576998, 0.00157347388559395, 0.000410177908982438, -0.0020058089861985, 0.00134664744667766, 0.000904112342858417, -0.00220806212536307, 0.00100982213514326, 0.0014145944927688, -0.00230863031544624, 0.000565131937664351, 0.00191340690270784, -0.00228395375907721, 1.9050843271603e-05, 0.00237383346451463, -0.00212243449053206, -0.000603954472941763, 0.00275407930513154, -0.0018037023757172, -0.00128787700216236, 0.00302877863982326, -0.00133237868074637, -0.0019917338045323, 0.00315642267894304, -0.000705030354343487, -0.00268426314681049, 0.00311463452697829, 5.64937405495192e-05, -0.00331345743309535, 0.00287067517773105, 0.000936484529161306, -0.00384092391382311, 0.00241687397427693, 0.00189134055158013, -0.00420951573269529, 0.00173789502485468, 0.00288456741011164, -0.00437980148948135, 0.000845429721454168, 0.00385622061221882, -0.00430271946640035, -0.000248700836071929, 0.00475060363029107, -0.00394632127812728, -0.0015096451320773, 0.00549805473889146, -0.00328001226663012, -0.00289568946557056, 0.00603170361614821, -0.00228913977806466, -0.00434845541405514, 0.0062821074840008, -0.000971295355999012, -0.00579687913024461, 0.00618052975979023, 0.00066355307516882, -0.00716102735866313, 0.00566469464892193, 0.00258813341390531, -0.00834874668703055, 0.00467560333870729, 0.0047620956820616, -0.00926011695895801, 0.00316048468863911, 0.00713037507452958, -0.00978474109488859, 0.00106786316199095, 0.009627818206338, -0.00980253705205883, -0.00165444484622507, 0.012176853584913, -0.00917080091398455, -0.00507836489952251, 0.014697200016755, -0.00771362159710589, -0.00931490507744246, 0.0171023100595983, -0.00517497543318116, -0.014577766935504, 0.0193103285663018, -0.00113093007534487, -0.0213094400273018, 0.0212393963215802, 0.00527487610190496, -0.0305634867029548, 0.0228217092300495, 0.0161542465567563, -0.0453174098994348, 0.0239953733004195, 0.0387246174291206, -0.0777525952925221, 0.0247193336655334, 0.123678265947287, -0.287267008224273, 0.35829549348162, -0.287267008224273, 0.123678265947287, 0.0247193336655334, -0.0777525952925221, 0.0387246174291206, 0.0239953733004195, -0.0453174098994348, 0.0161542465567563, 0.0228217092300495, -0.0305634867029548, 0.00527487610190496, 0.0212393963215802, -0.0213094400273018, -0.00113093007534487, 0.0193103285663018, -0.014577766935504, -0.00517497543318116, 0.0171023100595983, -0.00931490507744246, -0.00771362159710589, 0.014697200016755, -0.00507836489952251, -0.00917080091398455, 0.012176853584913, -0.00165444484622507, -0.00980253705205883, 0.009627818206338, 0.00106786316199095, -0.00978474109488859, 0.00713037507452958, 0.00316048468863911, -0.00926011695895801, 0.0047620956820616, 0.00467560333870729, -0.00834874668703055, 0.00258813341390531, 0.00566469464892193, -0.00716102735866313, 0.00066355307516882, 0.00618052975979023, -0.00579687913024461, -0.000971295355999012, 0.0062821074840008, -0.00434845541405514, -0.00228913977806466, 0.00603170361614821, -0.00289568946557056, -0.00328001226663012, 0.00549805473889146, -0.0015096451320773, -0.00394632127812728, 0.00475060363029107, -0.000248700836071929, -0.00430271946640035, 0.00385622061221882, 0.000845429721454168, -0.00437980148948135, 0.00288456741011164, 0.00173789502485468, -0.00420951573269529, 0.00189134055158013, 0.00241687397427693, -0.00384092391382311, 0.000936484529161306, 0.00287067517773105, -0.00331345743309535, 5.64937405495192e-05, 0.00311463452697829, -0.00268426314681049, -0.000705030354343487, 0.00315642267894304, -0.0019917338045323, -0.00133237868074637, 0.00302877863982326, -0.00128787700216236, -0.0018037023757172, 0.00275407930513154, -0.000603954472941763, -0.00212243449053206, 0.00237383346451463, 1.9050843271603e-05, -0.00228395375907721, 0.00191340690270784, 0.000565131937664351, -0.00230863031544624, 0.0014145944927688, 0.00100982213514326, -0.00220806212536307, 0.000904112342858417, 0.00134664744667766, -0.0020058089861985, 0.000410177908982438, 0.00157347388559395, -0.00172761034576998, -4.15346950032216e-05, 0.00169023286952472, -0.00139421896423498, -0.000437442803334783, 0.00170933763720456, -0.00103333009160177, -0.000761342655375938, 0.00163837119405791, -0.00066138987619888, -0.00101189327041912, 0.00149670706335654, -0.000299947523938088, -0.00118658747405508, 0.00130144379962579, 3.34042619109703e-05, -0.00128366069892032, 0.00106225938715278, 0.000336587845337202, -0.00131992996573179, 0.000805629038843513, 0.000592346700112255, -0.00129503684113831, 0.000537610737032466, 0.000803147198749992, -0.00122147394448924, 0.000267084813565052, 0.000976316295700193, -0.00111925229657072, 1.08034666608024e-05, 0.00110897765442011, -0.000993222761131216, -0.000234300888690598, 0.00121922227295885, -0.000866866330011371, -0.000453464490997341, 0.00130035709241659, -0.0007210737069798, -0.000703009292746306, 0.00145275746505029, -0.000684194393133883, -0.000844238138097236, 0.0015150095178001, -0.000513490188554956, -0.00129101282652796, 0.0021545575776628, -0.00117515770484445, -0.000755662605963752, 0.00168194868247666, -0.000310084746901625, -0.0028390203889645, 0.00582911175944726, -0.00682242845110031, 0.00538187216009174, -0.00257583628701196, 6.58849929468029e-06, 0.00130764704899533, -0.00136187850107778, 0.000799196646702341, -0.000266933304780979]
-coefHPF36Hz=[0.000213248257241684, -0.000989035998646283, 0.00239660106599056, -0.0042335905460561, 0.00565707966644803, -0.00574352392067931, 0.00401827531034728, -0.00105152531921446, -0.00172984378430839, 0.00286245037633196, -0.00189264584477506, -0.000244573586934822, 0.00186514883467537, -0.00180260872688519, 0.00028793378210643, 0.0012939117737085, -0.00160165880507196, 0.000473365341698687, 0.000985234960923538, -0.00143532605503908, 0.000523430222800288, 0.00082875992891936, -0.00132306864587845, 0.000520201437063928, 0.000760667193704676, -0.00125590368422865, 0.000494477426242615, 0.000747788213005998, -0.00122409930662454, 0.000460012520507628, 0.000770165132884384, -0.00121797947099201, 0.000421492849344337, 0.000816211690965221, -0.00122950666566895, 0.000379350510264777, 0.000879576863548384, -0.00125222750746787, 0.000331137125235844, 0.000958832657323323, -0.00128397326893456, 0.000276877738090239, 0.00105119868358389, -0.00132103689245702, 0.000214030428299447, 0.00115750601298525, -0.00136369769404078, 0.000144198333814936, 0.00127421850733744, -0.00140788586286158, 6.49467428478004e-05, 0.0014009655559956, -0.00145138065370126, -2.55336108213893e-05, 0.00153738362432278, -0.00149175563984374, -0.000129892846784872, 0.00168472189301672, -0.00152886110292824, -0.000248296010884721, 0.00184187155238226, -0.00156045154129016, -0.000382906839463676, 0.00201011575862354, -0.00158781845418302, -0.000530382475814192, 0.00218284064841748, -0.00160209804303162, -0.000699097573549676, 0.00236575067072015, -0.00160641480030916, -0.000886394465927358, 0.00255453933294675, -0.00159460068344076, -0.00109877551885347, 0.00275449779235773, -0.00157090036689824, -0.0013315816293495, 0.00295980701763175, -0.00152957437151126, -0.00158790012885345, 0.00316938957254092, -0.00146657539744939, -0.00187151113270712, 0.0033840751800563, -0.00137984174121975, -0.00218516875614567, 0.00360553058836719, -0.00127058025152701, -0.00252574857881883, 0.00382731659957898, -0.00113072042852321, -0.00289905101606064, 0.0040502033917067, -0.000957122034481324, -0.00330776029005313, 0.00427255926247302, -0.000743812503304184, -0.00375860099906035, 0.00449843651560658, -0.000492569673913868, -0.00424811823921705, 0.00471937850756851, -0.000191531784776653, -0.00478529933910884, 0.00493573737783465, 0.000167121916156941, -0.00537907159382571, 0.00514997500140812, 0.000588248348183631, -0.00603459928854218, 0.00535977637382928, 0.00108119824393906, -0.00675782349549467, 0.00555604773060023, 0.00167081765281813, -0.00757605581605463, 0.0057523236947814, 0.00236007899660012, -0.00849274002478298, 0.00593186516038067, 0.00318866700361052, -0.00954712007451511, 0.00610254762547813, 0.00418661080846433, -0.0107757886651984, 0.00626315484727974, 0.00540389382973505, -0.0122327335140225, 0.00640533154379745, 0.00692950322324254, -0.014019957215927, 0.00653847478589912, 0.00888117605051097, -0.0162782185163588, 0.00665166686896297, 0.0114873036026668, -0.0192816235010844, 0.00675169761526688, 0.0151482837031151, -0.0235361538852655, 0.0068321692911091, 0.0207215080586876, -0.0301752799733991, 0.00689707212881636, 0.0303340733590331, -0.0422607864019295, 0.00694231611881325, 0.051237964426336, -0.072063048325924, 0.00697070402696565, 0.134176272355752, -0.279069089018312, 0.340312050128938, -0.279069089018312, 0.134176272355752, 0.00697070402696565, -0.072063048325924, 0.051237964426336, 0.00694231611881325, -0.0422607864019295, 0.0303340733590331, 0.00689707212881636, -0.0301752799733991, 0.0207215080586876, 0.0068321692911091, -0.0235361538852655, 0.0151482837031151, 0.00675169761526688, -0.0192816235010844, 0.0114873036026668, 0.00665166686896297, -0.0162782185163588, 0.00888117605051097, 0.00653847478589912, -0.014019957215927, 0.00692950322324254, 0.00640533154379745, -0.0122327335140225, 0.00540389382973505, 0.00626315484727974, -0.0107757886651984, 0.00418661080846433, 0.00610254762547813, -0.00954712007451511, 0.00318866700361052, 0.00593186516038067, -0.00849274002478298, 0.00236007899660012, 0.0057523236947814, -0.00757605581605463, 0.00167081765281813, 0.00555604773060023, -0.00675782349549467, 0.00108119824393906, 0.00535977637382928, -0.00603459928854218, 0.000588248348183631, 0.00514997500140812, -0.00537907159382571, 0.000167121916156941, 0.00493573737783465, -0.00478529933910884, -0.000191531784776653, 0.00471937850756851, -0.00424811823921705, -0.000492569673913868, 0.00449843651560658, -0.00375860099906035, -0.000743812503304184, 0.00427255926247302, -0.00330776029005313, -0.000957122034481324, 0.0040502033917067, -0.00289905101606064, -0.00113072042852321, 0.00382731659957898, -0.00252574857881883, -0.00127058025152701, 0.00360553058836719, -0.00218516875614567, -0.00137984174121975, 0.0033840751800563, -0.00187151113270712, -0.00146657539744939, 0.00316938957254092, -0.00158790012885345, -0.00152957437151126, 0.00295980701763175, -0.0013315816293495, -0.00157090036689824, 0.00275449779235773, -0.00109877551885347, -0.00159460068344076, 0.00255453933294675, -0.000886394465927358, -0.00160641480030916, 0.00236575067072015, -0.000699097573549676, -0.00160209804303162, 0.00218284064841748, -0.000530382475814192, -0.00158781845418302, 0.00201011575862354, -0.000382906839463676, -0.00156045154129016, 0.00184187155238226, -0.000248296010884721, -0.00152886110292824, 0.00168472189301672, -0.000129892846784872, -0.00149175563984374, 0.00153738362432278, -2.55336108213893e-05, -0.00145138065370126, 0.0014009655559956, 6.49467428478004e-05, -0.00140788586286158, 0.00127421850733744, 0.000144198333814936, -0.00136369769404078, 0.00115750601298525, 0.000214030428299447, -0.00132103689245702, 0.00105119868358389, 0.000276877738090239, -0.00128397326893456, 0.000958832657323323, 0.000331137125235844, -0.00125222750746787, 0.000879576863548384, 0.000379350510264777, -0.00122950666566895, 0.000816211690965221, 0.000421492849344337, -0.00121797947099201, 0.000770165132884384, 0.000460012520507628, -0.00122409930662454, 0.000747788213005998, 0.000494477426242615, -0.00125590368422865, 0.000760667193704676, 0.000520201437063928, -0.00132306864587845, 0.00082875992891936, 0.000523430222800288, -0.00143532605503908, 0.000985234960923538, 0.000473365341698687, -0.00160165880507196, 0.0012939117737085, 0.00028793378210643, -0.00180260872688519, 0.00186514883467537, -0.000244573586934822, -0.00189264584477506, 0.00286245037633196, -0.00172984378430839, -0.00105152531921446, 0.00401827531034728, -0.00574352392067931, 0.00565707966644803, -0.0042335905460561, 0.00239660106599056, -0.000989035998646283, 0.000213248257241684]
-coefHPF37Hz=[1.82949142054894e-05, 0.000246140466563619, -0.000975994286645549, 0.00231288131698951, -0.00401143961255555, 0.00541140670027615, -0.00569461403770429, 0.00438848622211933, -0.00180080171083133, -0.000978735390956916, 0.00263056029339833, -0.00242051023763445, 0.000719297010755895, 0.00119962788415301, -0.00201118842697897, 0.0012566235988314, 0.000357781677503555, -0.00153078980629844, 0.00138305999739653, -0.000127763831622738, -0.00114126422898453, 0.00137129473541618, -0.000420952892974796, -0.000846649052206041, 0.00132365973527095, -0.000617675612962152, -0.000618266005375569, 0.00127315340825853, -0.000768022412551991, -0.000429178139810569, 0.00122620152173161, -0.000895019154372921, -0.000262869438966388, 0.00118377580267076, -0.00101178501069163, -0.000107469272324205, 0.00114478145221527, -0.00112772663659447, 4.93533365659661e-05, 0.00110206779146853, -0.00124396738024662, 0.000214305659219436, 0.00104867163460047, -0.0013572322150402, 0.000388128655298961, 0.000982386877140787, -0.00146663974607085, 0.000571847850938745, 0.000902410969254631, -0.00157462477969177, 0.000772387780046503, 0.00079944457664511, -0.00167405884602441, 0.000988836207828291, 0.000667386717290191, -0.00175484422930368, 0.00121154519719137, 0.000512746239692522, -0.00182077757383817, 0.00144372679836582, 0.000331915125898385, -0.00186956210755212, 0.00168752067704185, 0.000116890475158435, -0.00188956515934199, 0.00193231031242417, -0.000126296836642093, -0.00188238380835662, 0.00217838970339898, -0.000399217461532773, -0.00184615103648158, 0.0024278004537945, -0.000711615517062881, -0.00176372685392948, 0.00266061627005737, -0.00104608653183925, -0.0016482566222466, 0.00288845364972389, -0.00141660290500056, -0.00148276048581984, 0.00309518485691434, -0.00181308656651725, -0.00126937176240996, 0.00327816625936053, -0.00223336860650241, -0.00100740485260641, 0.00343643406814059, -0.0026808767615214, -0.000687414810816242, 0.00355825749972846, -0.00314763583824982, -0.000310940056926909, 0.00364219881957233, -0.00363575584690189, 0.000131012399923447, 0.00367563746983729, -0.004135886820564, 0.000636189455927806, 0.0036568888838001, -0.00464957645472172, 0.00121332071848223, 0.00357370914395161, -0.00516913525215109, 0.00186371247640122, 0.00341991648379006, -0.00569265330597747, 0.00259483903879473, 0.00318313287379802, -0.00621284940666461, 0.0034096971674999, 0.00285597117521419, -0.00672990340243638, 0.00432178256519823, 0.00241933260559522, -0.00723388978435998, 0.0053370833933738, 0.0018612331514472, -0.00772503004388992, 0.00647542007504702, 0.00115628075654974, -0.00819649047283164, 0.00775767948909518, 0.000275466288596401, -0.00864404271479216, 0.00921649488095422, -0.000823073478690013, -0.00906243056383657, 0.0108990718694754, -0.00219749793323186, -0.00945077046746649, 0.0128856394011119, -0.00394587310243633, -0.00979933586644014, 0.0152938713993774, -0.00621319133428817, -0.0101106976315772, 0.0183436351516627, -0.00926859687371336, -0.0103794454367635, 0.0224366531509211, -0.0136229263767523, -0.0106033611469403, 0.0284212326280193, -0.0204038559343369, -0.0107800852339388, 0.0384244931085509, -0.0326749500548267, -0.0109092110583141, 0.0596935136362314, -0.062704632014516, -0.0109855957129741, 0.142966669292779, -0.269976370054124, 0.322320367669426, -0.269976370054124, 0.142966669292779, -0.0109855957129741, -0.062704632014516, 0.0596935136362314, -0.0109092110583141, -0.0326749500548267, 0.0384244931085509, -0.0107800852339388, -0.0204038559343369, 0.0284212326280193, -0.0106033611469403, -0.0136229263767523, 0.0224366531509211, -0.0103794454367635, -0.00926859687371336, 0.0183436351516627, -0.0101106976315772, -0.00621319133428817, 0.0152938713993774, -0.00979933586644014, -0.00394587310243633, 0.0128856394011119, -0.00945077046746649, -0.00219749793323186, 0.0108990718694754, -0.00906243056383657, -0.000823073478690013, 0.00921649488095422, -0.00864404271479216, 0.000275466288596401, 0.00775767948909518, -0.00819649047283164, 0.00115628075654974, 0.00647542007504702, -0.00772503004388992, 0.0018612331514472, 0.0053370833933738, -0.00723388978435998, 0.00241933260559522, 0.00432178256519823, -0.00672990340243638, 0.00285597117521419, 0.0034096971674999, -0.00621284940666461, 0.00318313287379802, 0.00259483903879473, -0.00569265330597747, 0.00341991648379006, 0.00186371247640122, -0.00516913525215109, 0.00357370914395161, 0.00121332071848223, -0.00464957645472172, 0.0036568888838001, 0.000636189455927806, -0.004135886820564, 0.00367563746983729, 0.000131012399923447, -0.00363575584690189, 0.00364219881957233, -0.000310940056926909, -0.00314763583824982, 0.00355825749972846, -0.000687414810816242, -0.0026808767615214, 0.00343643406814059, -0.00100740485260641, -0.00223336860650241, 0.00327816625936053, -0.00126937176240996, -0.00181308656651725, 0.00309518485691434, -0.00148276048581984, -0.00141660290500056, 0.00288845364972389, -0.0016482566222466, -0.00104608653183925, 0.00266061627005737, -0.00176372685392948, -0.000711615517062881, 0.0024278004537945, -0.00184615103648158, -0.000399217461532773, 0.00217838970339898, -0.00188238380835662, -0.000126296836642093, 0.00193231031242417, -0.00188956515934199, 0.000116890475158435, 0.00168752067704185, -0.00186956210755212, 0.000331915125898385, 0.00144372679836582, -0.00182077757383817, 0.000512746239692522, 0.00121154519719137, -0.00175484422930368, 0.000667386717290191, 0.000988836207828291, -0.00167405884602441, 0.00079944457664511, 0.000772387780046503, -0.00157462477969177, 0.000902410969254631, 0.000571847850938745, -0.00146663974607085, 0.000982386877140787, 0.000388128655298961, -0.0013572322150402, 0.00104867163460047, 0.000214305659219436, -0.00124396738024662, 0.00110206779146853, 4.93533365659661e-05, -0.00112772663659447, 0.00114478145221527, -0.000107469272324205, -0.00101178501069163, 0.00118377580267076, -0.000262869438966388, -0.000895019154372921, 0.00122620152173161, -0.000429178139810569, -0.000768022412551991, 0.00127315340825853, -0.000618266005375569, -0.000617675612962152, 0.00132365973527095, -0.000846649052206041, -0.000420952892974796, 0.00137129473541618, -0.00114126422898453, -0.000127763831622738, 0.00138305999739653, -0.00153078980629844, 0.000357781677503555, 0.0012566235988314, -0.00201118842697897, 0.00119962788415301, 0.000719297010755895, -0.00242051023763445, 0.00263056029339833, -0.000978735390956916, -0.00180080171083133, 0.00438848622211933, -0.00569461403770429, 0.00541140670027615, -0.00401143961255555, 0.00231288131698951, -0.000975994286645549, 0.000246140466563619, 1.82949142054894e-05]
-coefHPF38Hz=[-0.000136083044197712, 0.000253184987347767, -0.000211428077579502, -0.00027021920734557, 0.00138261422005548, -0.00302628292058586, 0.00470899885264871, -0.00568309339261702, 0.00531787054000768, -0.00351824587015612, 0.000909186264592664, 0.00140089383224072, -0.00240294297636088, 0.00178337436215366, -0.000136387936531505, -0.00138898400602627, 0.00181322455966417, -0.000950834093214604, -0.000498058296610956, 0.00146524573732082, -0.00128337770806759, 0.000154371732342112, 0.0010259488891235, -0.00135688826969911, 0.000616451386624112, 0.000581739834241232, -0.0012795007152975, 0.000931763350670093, 0.000164554421583272, -0.00111257832831882, 0.00113975526342014, -0.000225424912093895, -0.000878271133298474, 0.00125765174378397, -0.000589905066288168, -0.000580793436841084, 0.0012814883677078, -0.00091479142409288, -0.000232455469501799, 0.00120917978825156, -0.00118418978567595, 0.000151345606547349, 0.0010410555602936, -0.00138302329969191, 0.000555354258413786, 0.000775579928838732, -0.0014908220512957, 0.000956504786545849, 0.00041711211074549, -0.00148633434113681, 0.00132336053875236, -1.87593997332999e-05, -0.00135500849268992, 0.00162226050551156, -0.000507673628766953, -0.00108981542342713, 0.00181862149019547, -0.00101546658119646, -0.000695264697245831, 0.00188201547795851, -0.00150116728411599, -0.000188519400738685, 0.00179071995535032, -0.00192217387596838, 0.00040372676598983, 0.00153118871250522, -0.00223463181739201, 0.0010445434669222, 0.00109998475037265, -0.00239450240221526, 0.00168435121403087, 0.000510320927518886, -0.00236567529193139, 0.00226626716101001, -0.000207608899802471, -0.00212518000765947, 0.00273223215852217, -0.00100948226110544, -0.00166486217608671, 0.00302672599691141, -0.001838672971654, -0.000993420804866777, 0.00310108084514176, -0.00262910106628697, -0.000137656928411827, 0.00291797435938462, -0.00330932347696915, 0.000858032637866154, 0.00245430616469171, -0.0038052552209154, 0.0019304270867097, 0.00170688582839655, -0.00404667611090831, 0.00299972903225145, 0.000696784093746488, -0.00397557918852565, 0.00397617886489414, -0.00053120992499245, -0.00355122520880295, 0.00476602718348618, -0.00191061959458326, -0.00275303559309171, 0.00527576007877828, -0.00335399722249236, -0.00158501845809184, 0.00541850843969016, -0.00475609120788339, -7.84922301039313e-05, 0.00512024549809814, -0.00599799609691179, 0.00170621098497127, 0.00432598326687163, -0.00695235498463213, 0.00367906772177029, 0.00300630490970031, -0.00749073749837486, 0.00572283212419365, 0.00116153186100444, -0.00749095402529935, 0.00769803881669494, -0.00117818163122096, -0.0068404943729747, 0.00944580920744211, -0.00395267553285196, -0.00543885049933194, 0.0107901077039173, -0.00707292125765943, -0.00319719897197018, 0.0115386579573506, -0.0104250591934701, -3.09794605557447e-05, 0.01147749519737, -0.013876006665176, 0.00415935893067971, 0.0103519208602987, -0.0172796123055677, 0.00953037370900969, 0.00781860939874213, -0.0204852482365524, 0.0163958204837331, 0.0033185554377698, -0.0233461260086038, 0.0254877023039251, -0.00428934139396525, -0.0257273282520427, 0.0387959703766929, -0.0180465343822726, -0.0275146529843029, 0.0634145810210288, -0.0501595337613688, -0.0286225136861618, 0.149931982674836, -0.260026115002403, 0.304335514678879, -0.260026115002403, 0.149931982674836, -0.0286225136861618, -0.0501595337613688, 0.0634145810210288, -0.0275146529843029, -0.0180465343822726, 0.0387959703766929, -0.0257273282520427, -0.00428934139396525, 0.0254877023039251, -0.0233461260086038, 0.0033185554377698, 0.0163958204837331, -0.0204852482365524, 0.00781860939874213, 0.00953037370900969, -0.0172796123055677, 0.0103519208602987, 0.00415935893067971, -0.013876006665176, 0.01147749519737, -3.09794605557447e-05, -0.0104250591934701, 0.0115386579573506, -0.00319719897197018, -0.00707292125765943, 0.0107901077039173, -0.00543885049933194, -0.00395267553285196, 0.00944580920744211, -0.0068404943729747, -0.00117818163122096, 0.00769803881669494, -0.00749095402529935, 0.00116153186100444, 0.00572283212419365, -0.00749073749837486, 0.00300630490970031, 0.00367906772177029, -0.00695235498463213, 0.00432598326687163, 0.00170621098497127, -0.00599799609691179, 0.00512024549809814, -7.84922301039313e-05, -0.00475609120788339, 0.00541850843969016, -0.00158501845809184, -0.00335399722249236, 0.00527576007877828, -0.00275303559309171, -0.00191061959458326, 0.00476602718348618, -0.00355122520880295, -0.00053120992499245, 0.00397617886489414, -0.00397557918852565, 0.000696784093746488, 0.00299972903225145, -0.00404667611090831, 0.00170688582839655, 0.0019304270867097, -0.0038052552209154, 0.00245430616469171, 0.000858032637866154, -0.00330932347696915, 0.00291797435938462, -0.000137656928411827, -0.00262910106628697, 0.00310108084514176, -0.000993420804866777, -0.001838672971654, 0.00302672599691141, -0.00166486217608671, -0.00100948226110544, 0.00273223215852217, -0.00212518000765947, -0.000207608899802471, 0.00226626716101001, -0.00236567529193139, 0.000510320927518886, 0.00168435121403087, -0.00239450240221526, 0.00109998475037265, 0.0010445434669222, -0.00223463181739201, 0.00153118871250522, 0.00040372676598983, -0.00192217387596838, 0.00179071995535032, -0.000188519400738685, -0.00150116728411599, 0.00188201547795851, -0.000695264697245831, -0.00101546658119646, 0.00181862149019547, -0.00108981542342713, -0.000507673628766953, 0.00162226050551156, -0.00135500849268992, -1.87593997332999e-05, 0.00132336053875236, -0.00148633434113681, 0.00041711211074549, 0.000956504786545849, -0.0014908220512957, 0.000775579928838732, 0.000555354258413786, -0.00138302329969191, 0.0010410555602936, 0.000151345606547349, -0.00118418978567595, 0.00120917978825156, -0.000232455469501799, -0.00091479142409288, 0.0012814883677078, -0.000580793436841084, -0.000589905066288168, 0.00125765174378397, -0.000878271133298474, -0.000225424912093895, 0.00113975526342014, -0.00111257832831882, 0.000164554421583272, 0.000931763350670093, -0.0012795007152975, 0.000581739834241232, 0.000616451386624112, -0.00135688826969911, 0.0010259488891235, 0.000154371732342112, -0.00128337770806759, 0.00146524573732082, -0.000498058296610956, -0.000950834093214604, 0.00181322455966417, -0.00138898400602627, -0.000136387936531505, 0.00178337436215366, -0.00240294297636088, 0.00140089383224072, 0.000909186264592664, -0.00351824587015612, 0.00531787054000768, -0.00568309339261702, 0.00470899885264871, -0.00302628292058586, 0.00138261422005548, -0.00027021920734557, -0.000211428077579502, 0.000253184987347767, -0.000136083044197712]
-coefHPF39Hz=[0.000210652804010339, -0.000632893129527552, 0.00128904680716036, -0.00198024773789452, 0.00234487899323738, -0.00198956628350085, 0.000712743931614136, 0.00130221576196765, -0.00346176104638805, 0.00497243778387892, -0.00521668707449567, 0.00410070911867739, -0.00215929643665088, 0.000317821971054148, 0.000587377380947069, -0.000265088416634965, -0.000875368029223496, 0.00198084737794518, -0.00228080990385104, 0.00156069694765598, -0.000280283495739163, -0.000743752827896924, 0.000886515008549978, -0.000130766781392685, -0.000931325315940062, 0.00151383279583802, -0.00118568622075983, 0.000170552367097202, 0.00081536178188652, -0.00107697582865155, 0.000442115141279269, 0.000610098169696879, -0.00129308831498059, 0.00108649068169479, -0.000123688867973702, -0.000896062263037063, 0.00121689396214159, -0.000589380628240535, -0.000530492590092954, 0.00130523384104837, -0.00113544096609845, 0.000118836520251634, 0.00100211589881163, -0.00138154228264262, 0.000708116005707226, 0.000539870386993865, -0.00142977318572965, 0.00126781299767152, -0.000136831596062915, -0.00113690218406651, 0.00158528057933027, -0.000832455988897172, -0.000593560608628412, 0.00162747032432939, -0.0014597494889927, 0.000167616657445397, 0.00130616452832104, -0.00183874231964676, 0.00098060945865376, 0.000669943011396168, -0.00187980721118838, 0.00169968460688151, -0.000205854492693665, -0.00151245331457379, 0.00214450302190789, -0.00115558430997695, -0.00076668710563843, 0.00218561109492558, -0.00198638033263124, 0.000248528989108066, 0.00176044974315228, -0.00250602780136473, 0.00135572461859717, 0.000892075477723909, -0.00255655372555344, 0.00232809825079944, -0.00029459663655052, -0.00206085295617718, 0.00293740727682331, -0.00158958016114393, -0.00104823091664638, 0.0030026269115122, -0.00273357357776055, 0.000342738787829248, 0.00242649445650327, -0.00345526191333276, 0.00186596935073364, 0.00124063435806106, -0.00353921075702871, 0.00321522250164716, -0.000390724396953446, -0.0028749116217896, 0.00407993479856591, -0.00219068516246017, -0.00148673628004984, 0.00419848072575824, -0.00379825749833356, 0.000437189142584515, 0.00343568510832488, -0.00484897870392185, 0.00258005422211303, 0.00180775180700454, -0.00502791790178556, 0.00452260780144279, -0.000481790555876432, -0.00415490718871332, 0.00582422797153692, -0.00306500308811566, -0.00223200331724064, 0.00609962833258738, -0.00545077406628158, 0.000523519033638415, 0.00510767182363297, -0.0071061467670474, 0.00369293026706437, 0.00281430301161926, -0.00754469792466509, 0.00669619253336171, -0.000560440312065625, -0.0064328972001944, 0.00888276001855208, -0.00455347781743798, -0.00366093196398295, 0.0096208645570961, -0.00848652547559797, 0.000591183505719704, 0.00841515904510569, -0.0115502701932003, 0.00584437822163306, 0.0049956226734916, -0.0128966887439857, 0.0113401757713561, -0.000615665321509676, -0.0117347712479675, 0.0160882414809506, -0.00807263308075173, -0.00740795108332515, 0.0189335281687626, -0.0167423286805312, 0.000634025294271656, 0.0185359949727434, -0.0257596039661715, 0.0130320668531144, 0.0131437612150113, -0.034156420464704, 0.0313803279295863, -0.000645710293346305, -0.0409768412498899, 0.062108717912521, -0.0350754426318562, -0.0454248394736647, 0.15497965894391, -0.249253531380305, 0.286364033921345, -0.249253531380305, 0.15497965894391, -0.0454248394736647, -0.0350754426318562, 0.062108717912521, -0.0409768412498899, -0.000645710293346305, 0.0313803279295863, -0.034156420464704, 0.0131437612150113, 0.0130320668531144, -0.0257596039661715, 0.0185359949727434, 0.000634025294271656, -0.0167423286805312, 0.0189335281687626, -0.00740795108332515, -0.00807263308075173, 0.0160882414809506, -0.0117347712479675, -0.000615665321509676, 0.0113401757713561, -0.0128966887439857, 0.0049956226734916, 0.00584437822163306, -0.0115502701932003, 0.00841515904510569, 0.000591183505719704, -0.00848652547559797, 0.0096208645570961, -0.00366093196398295, -0.00455347781743798, 0.00888276001855208, -0.0064328972001944, -0.000560440312065625, 0.00669619253336171, -0.00754469792466509, 0.00281430301161926, 0.00369293026706437, -0.0071061467670474, 0.00510767182363297, 0.000523519033638415, -0.00545077406628158, 0.00609962833258738, -0.00223200331724064, -0.00306500308811566, 0.00582422797153692, -0.00415490718871332, -0.000481790555876432, 0.00452260780144279, -0.00502791790178556, 0.00180775180700454, 0.00258005422211303, -0.00484897870392185, 0.00343568510832488, 0.000437189142584515, -0.00379825749833356, 0.00419848072575824, -0.00148673628004984, -0.00219068516246017, 0.00407993479856591, -0.0028749116217896, -0.000390724396953446, 0.00321522250164716, -0.00353921075702871, 0.00124063435806106, 0.00186596935073364, -0.00345526191333276, 0.00242649445650327, 0.000342738787829248, -0.00273357357776055, 0.0030026269115122, -0.00104823091664638, -0.00158958016114393, 0.00293740727682331, -0.00206085295617718, -0.00029459663655052, 0.00232809825079944, -0.00255655372555344, 0.000892075477723909, 0.00135572461859717, -0.00250602780136473, 0.00176044974315228, 0.000248528989108066, -0.00198638033263124, 0.00218561109492558, -0.00076668710563843, -0.00115558430997695, 0.00214450302190789, -0.00151245331457379, -0.000205854492693665, 0.00169968460688151, -0.00187980721118838, 0.000669943011396168, 0.00098060945865376, -0.00183874231964676, 0.00130616452832104, 0.000167616657445397, -0.0014597494889927, 0.00162747032432939, -0.000593560608628412, -0.000832455988897172, 0.00158528057933027, -0.00113690218406651, -0.000136831596062915, 0.00126781299767152, -0.00142977318572965, 0.000539870386993865, 0.000708116005707226, -0.00138154228264262, 0.00100211589881163, 0.000118836520251634, -0.00113544096609845, 0.00130523384104837, -0.000530492590092954, -0.000589380628240535, 0.00121689396214159, -0.000896062263037063, -0.000123688867973702, 0.00108649068169479, -0.00129308831498059, 0.000610098169696879, 0.000442115141279269, -0.00107697582865155, 0.00081536178188652, 0.000170552367097202, -0.00118568622075983, 0.00151383279583802, -0.000931325315940062, -0.000130766781392685, 0.000886515008549978, -0.000743752827896924, -0.000280283495739163, 0.00156069694765598, -0.00228080990385104, 0.00198084737794518, -0.000875368029223496, -0.000265088416634965, 0.000587377380947069, 0.000317821971054148, -0.00215929643665088, 0.00410070911867739, -0.00521668707449567, 0.00497243778387892, -0.00346176104638805, 0.00130221576196765, 0.000712743931614136, -0.00198956628350085, 0.00234487899323738, -0.00198024773789452, 0.00128904680716036, -0.000632893129527552, 0.000210652804010339]
-coefHPF40Hz=[-4.82482439587064e-05, 0.000363491450357742, -0.000959478565198333, 0.00192600681812904, -0.00311431643348648, 0.00421575633224017, -0.00481296057492569, 0.00455335702616496, -0.00333814912582695, 0.00143495011462215, 0.000570183097512812, -0.00199093938789971, 0.0023446736693846, -0.00159353729175308, 0.00018603554600379, 0.00114484305115522, -0.00174037789649888, 0.00134928644701098, -0.000252182841227363, -0.000900317065141578, 0.00145440726189735, -0.00112179641701894, 0.000138353896892176, 0.000883062913392809, -0.00132252533220544, 0.000926704996301293, 3.99555885364286e-05, -0.000961570481936212, 0.00125575244547626, -0.000739890204094672, -0.000251908522505694, 0.00107904679022623, -0.0012034306193144, 0.000538604273465498, 0.000487660829347047, -0.00120420004616907, 0.0011320070430844, -0.000303769252940127, -0.000745741636912799, 0.00132145909073441, -0.00102561953000997, 3.1468579518441e-05, 0.00101487536421264, -0.00141169181479845, 0.000870167006001798, 0.000277390389266566, -0.00127866043487691, 0.00145241519913535, -0.000650293633001197, -0.00062259416023567, 0.00152302199933833, -0.0014261734472842, 0.000357114963430863, 0.000999365455591395, -0.0017350249022258, 0.00132444619036651, 2.43201234011872e-06, -0.00138369998506701, 0.0018832022571692, -0.00112306407965137, -0.000435070622343889, 0.00176644221256444, -0.00195495664738332, 0.000820938563067851, 0.000923282665668178, -0.0021179003245636, 0.0019246015595634, -0.000412088180602134, -0.00144932103054863, 0.00240719040659474, -0.00176726659115956, -0.000107744478099366, 0.00199647178483409, -0.00261166327972196, 0.00147473076207195, 0.000720220465096976, -0.00252501488886418, 0.00268998792533032, -0.00102588336184599, -0.00141712691035534, 0.00300770075652611, -0.00261939265801376, 0.000423646790810775, 0.00216551571957759, -0.00339783358797019, 0.0023661927738651, 0.000333129336039183, -0.00293533097159348, 0.0036564517555, -0.00191172283514176, -0.00122609535715935, 0.0036787983307822, -0.00373419578574744, 0.00123524216946645, 0.00223502612686183, -0.00434929484307653, 0.00359089721665157, -0.000332939735833798, -0.00332054779145016, 0.00488605712380792, -0.00318153295037726, -0.000796015128610807, 0.00443872335743545, -0.00522917151728242, 0.00247052642681177, 0.00213713143303962, -0.00553132522930371, 0.00531215432052193, -0.00142570763971025, -0.00366606415576092, 0.00653087071695653, -0.00506612399908487, 2.12443422412221e-05, 0.00534665493061096, -0.00735870787857175, 0.00441700936562424, 0.00176613957119844, -0.00713479151948047, 0.007927736544142, -0.00328693257661775, -0.00395543390301805, 0.00897309459820235, -0.00813079261964354, 0.00157649833987215, 0.00658063579385479, -0.0108048587756397, 0.00784415107777964, 0.000840445008429048, -0.00969485627799435, 0.012562985819991, -0.00689214850721373, -0.00417129143580825, 0.0134213624894807, -0.0141859139015467, 0.00500681372561137, 0.00879051606638158, -0.0180320150515598, 0.0156103095346651, -0.00167600092359023, -0.0155154891969492, 0.0242079992715982, -0.0167827852722196, -0.0043050727008535, 0.0265041098027101, -0.0339483377237207, 0.0176551141234005, 0.0168700604896857, -0.049786514740675, 0.0558774580266132, -0.0181934010700921, -0.0609406934079749, 0.158054938630104, -0.237675083382398, 0.268375403480761, -0.237675083382398, 0.158054938630104, -0.0609406934079749, -0.0181934010700921, 0.0558774580266132, -0.049786514740675, 0.0168700604896857, 0.0176551141234005, -0.0339483377237207, 0.0265041098027101, -0.0043050727008535, -0.0167827852722196, 0.0242079992715982, -0.0155154891969492, -0.00167600092359023, 0.0156103095346651, -0.0180320150515598, 0.00879051606638158, 0.00500681372561137, -0.0141859139015467, 0.0134213624894807, -0.00417129143580825, -0.00689214850721373, 0.012562985819991, -0.00969485627799435, 0.000840445008429048, 0.00784415107777964, -0.0108048587756397, 0.00658063579385479, 0.00157649833987215, -0.00813079261964354, 0.00897309459820235, -0.00395543390301805, -0.00328693257661775, 0.007927736544142, -0.00713479151948047, 0.00176613957119844, 0.00441700936562424, -0.00735870787857175, 0.00534665493061096, 2.12443422412221e-05, -0.00506612399908487, 0.00653087071695653, -0.00366606415576092, -0.00142570763971025, 0.00531215432052193, -0.00553132522930371, 0.00213713143303962, 0.00247052642681177, -0.00522917151728242, 0.00443872335743545, -0.000796015128610807, -0.00318153295037726, 0.00488605712380792, -0.00332054779145016, -0.000332939735833798, 0.00359089721665157, -0.00434929484307653, 0.00223502612686183, 0.00123524216946645, -0.00373419578574744, 0.0036787983307822, -0.00122609535715935, -0.00191172283514176, 0.0036564517555, -0.00293533097159348, 0.000333129336039183, 0.0023661927738651, -0.00339783358797019, 0.00216551571957759, 0.000423646790810775, -0.00261939265801376, 0.00300770075652611, -0.00141712691035534, -0.00102588336184599, 0.00268998792533032, -0.00252501488886418, 0.000720220465096976, 0.00147473076207195, -0.00261166327972196, 0.00199647178483409, -0.000107744478099366, -0.00176726659115956, 0.00240719040659474, -0.00144932103054863, -0.000412088180602134, 0.0019246015595634, -0.0021179003245636, 0.000923282665668178, 0.000820938563067851, -0.00195495664738332, 0.00176644221256444, -0.000435070622343889, -0.00112306407965137, 0.0018832022571692, -0.00138369998506701, 2.43201234011872e-06, 0.00132444619036651, -0.0017350249022258, 0.000999365455591395, 0.000357114963430863, -0.0014261734472842, 0.00152302199933833, -0.00062259416023567, -0.000650293633001197, 0.00145241519913535, -0.00127866043487691, 0.000277390389266566, 0.000870167006001798, -0.00141169181479845, 0.00101487536421264, 3.1468579518441e-05, -0.00102561953000997, 0.00132145909073441, -0.000745741636912799, -0.000303769252940127, 0.0011320070430844, -0.00120420004616907, 0.000487660829347047, 0.000538604273465498, -0.0012034306193144, 0.00107904679022623, -0.000251908522505694, -0.000739890204094672, 0.00125575244547626, -0.000961570481936212, 3.99555885364286e-05, 0.000926704996301293, -0.00132252533220544, 0.000883062913392809, 0.000138353896892176, -0.00112179641701894, 0.00145440726189735, -0.000900317065141578, -0.000252182841227363, 0.00134928644701098, -0.00174037789649888, 0.00114484305115522, 0.00018603554600379, -0.00159353729175308, 0.0023446736693846, -0.00199093938789971, 0.000570183097512812, 0.00143495011462215, -0.00333814912582695, 0.00455335702616496, -0.00481296057492569, 0.00421575633224017, -0.00311431643348648, 0.00192600681812904, -0.000959478565198333, 0.000363491450357742, -4.82482439587064e-05]
-coefHPF41Hz=[-7.17849997838461e-05, 4.03116550088626e-05, 0.000124055168959607, -0.000551084728313732, 0.00130677849251541, -0.00234681953200818, 0.00347936685108477, -0.00438838787602039, 0.00472742429690585, -0.00425877127575063, 0.00298188919389674, -0.00118518066582683, -0.000621244074716372, 0.0018826152395735, -0.00222109237582844, 0.00160429535300256, -0.000374927393067935, -0.000886205291089151, 0.00161224912908429, -0.00150511254630236, 0.00066980097385543, 0.000442472058436802, -0.00126024431945341, 0.00137903958840602, -0.000764309449161185, -0.000234983429612745, 0.0010733314141071, -0.00129999246357907, 0.000801102355541713, 0.000138861021082535, -0.000992564848114907, 0.00128072275637165, -0.00083986028198709, -8.2648776854573e-05, 0.00096319871243778, -0.00129543708652212, 0.000879860538516954, 5.55690010790022e-05, -0.000977351635906709, 0.0013476696777512, -0.000936309638276046, -3.67908408570282e-05, 0.00101661362899832, -0.00142730458065714, 0.00100891342199146, 1.92938840316542e-05, -0.00107118939911318, 0.00152581950976375, -0.00109240630868394, -5.50559216596572e-06, 0.00114236427674958, -0.0016450421266012, 0.00118968772001218, -7.97184472094962e-06, -0.00122746199929778, 0.00178397113874383, -0.00130166901812828, 2.33102917688275e-05, 0.00132412688952727, -0.00194099974251869, 0.00142785736370493, -4.09880674563996e-05, -0.00143123616264671, 0.00211453927212511, -0.00156617265010379, 5.84095718611268e-05, 0.00155163742723183, -0.00230700692277587, 0.00171765978612658, -7.4421314379788e-05, -0.00168889428912635, 0.00252378088093473, -0.00188826437634366, 9.42981575180357e-05, 0.00183906570038973, -0.00276201908050269, 0.00207546914058448, -0.000115120733997468, -0.00200550197477779, 0.00302469383768928, -0.00228059552974517, 0.000135678808477561, 0.00219167920251577, -0.00331594520073657, 0.00250615482645422, -0.000155056356106797, -0.00240214402106526, 0.00364225461016875, -0.00275774276009065, 0.000175523436490512, 0.00263859118058115, -0.00400765803161554, 0.0030386839324771, -0.00019703921030578, -0.00290495951016014, 0.00441776375420627, -0.00335237193134842, 0.000217510438378718, 0.00320918496165635, -0.0048830387194431, 0.00370622274208393, -0.00023656627653022, -0.00356026142434839, 0.005416894888246, -0.00411064663545268, 0.000255051006584587, 0.00396843255268411, -0.0060354156497707, 0.00457774471408077, -0.000272115734364474, -0.0044497967056566, 0.00676296189496872, -0.0051266428051582, 0.000289053380244371, 0.00502440453987867, -0.0076313710541404, 0.00578193486176014, -0.000305011549264499, -0.00572401125105963, 0.00868978203820072, -0.00658220828298455, 0.000320589646351572, 0.00659493578644544, -0.0100115006747517, 0.00758481590792312, -0.000333516076819125, -0.00771486985771909, 0.011719411092754, -0.00888845617730745, 0.000344334333016536, 0.00921201123859554, -0.0140233507081998, 0.0106658516500947, -0.000354002403619946, -0.0113216163696383, 0.0173181594325664, -0.0132504648222, 0.000362624988743515, 0.0145313475497192, -0.022450731825087, 0.0173860276135415, -0.000369170447770971, -0.0200405944081402, 0.0316262125721303, -0.0251419943677921, 0.00037379521388308, 0.0317876629649475, -0.0529284369023303, 0.0452090070576007, -0.000376387798104342, -0.0747164412856391, 0.159114089655863, -0.225331680158573, 0.250377737309246, -0.225331680158573, 0.159114089655863, -0.0747164412856391, -0.000376387798104342, 0.0452090070576007, -0.0529284369023303, 0.0317876629649475, 0.00037379521388308, -0.0251419943677921, 0.0316262125721303, -0.0200405944081402, -0.000369170447770971, 0.0173860276135415, -0.022450731825087, 0.0145313475497192, 0.000362624988743515, -0.0132504648222, 0.0173181594325664, -0.0113216163696383, -0.000354002403619946, 0.0106658516500947, -0.0140233507081998, 0.00921201123859554, 0.000344334333016536, -0.00888845617730745, 0.011719411092754, -0.00771486985771909, -0.000333516076819125, 0.00758481590792312, -0.0100115006747517, 0.00659493578644544, 0.000320589646351572, -0.00658220828298455, 0.00868978203820072, -0.00572401125105963, -0.000305011549264499, 0.00578193486176014, -0.0076313710541404, 0.00502440453987867, 0.000289053380244371, -0.0051266428051582, 0.00676296189496872, -0.0044497967056566, -0.000272115734364474, 0.00457774471408077, -0.0060354156497707, 0.00396843255268411, 0.000255051006584587, -0.00411064663545268, 0.005416894888246, -0.00356026142434839, -0.00023656627653022, 0.00370622274208393, -0.0048830387194431, 0.00320918496165635, 0.000217510438378718, -0.00335237193134842, 0.00441776375420627, -0.00290495951016014, -0.00019703921030578, 0.0030386839324771, -0.00400765803161554, 0.00263859118058115, 0.000175523436490512, -0.00275774276009065, 0.00364225461016875, -0.00240214402106526, -0.000155056356106797, 0.00250615482645422, -0.00331594520073657, 0.00219167920251577, 0.000135678808477561, -0.00228059552974517, 0.00302469383768928, -0.00200550197477779, -0.000115120733997468, 0.00207546914058448, -0.00276201908050269, 0.00183906570038973, 9.42981575180357e-05, -0.00188826437634366, 0.00252378088093473, -0.00168889428912635, -7.4421314379788e-05, 0.00171765978612658, -0.00230700692277587, 0.00155163742723183, 5.84095718611268e-05, -0.00156617265010379, 0.00211453927212511, -0.00143123616264671, -4.09880674563996e-05, 0.00142785736370493, -0.00194099974251869, 0.00132412688952727, 2.33102917688275e-05, -0.00130166901812828, 0.00178397113874383, -0.00122746199929778, -7.97184472094962e-06, 0.00118968772001218, -0.0016450421266012, 0.00114236427674958, -5.50559216596572e-06, -0.00109240630868394, 0.00152581950976375, -0.00107118939911318, 1.92938840316542e-05, 0.00100891342199146, -0.00142730458065714, 0.00101661362899832, -3.67908408570282e-05, -0.000936309638276046, 0.0013476696777512, -0.000977351635906709, 5.55690010790022e-05, 0.000879860538516954, -0.00129543708652212, 0.00096319871243778, -8.2648776854573e-05, -0.00083986028198709, 0.00128072275637165, -0.000992564848114907, 0.000138861021082535, 0.000801102355541713, -0.00129999246357907, 0.0010733314141071, -0.000234983429612745, -0.000764309449161185, 0.00137903958840602, -0.00126024431945341, 0.000442472058436802, 0.00066980097385543, -0.00150511254630236, 0.00161224912908429, -0.000886205291089151, -0.000374927393067935, 0.00160429535300256, -0.00222109237582844, 0.0018826152395735, -0.000621244074716372, -0.00118518066582683, 0.00298188919389674, -0.00425877127575063, 0.00472742429690585, -0.00438838787602039, 0.00347936685108477, -0.00234681953200818, 0.00130677849251541, -0.000551084728313732, 0.000124055168959607, 4.03116550088626e-05, -7.17849997838461e-05]
-coefHPF42Hz=[0.000128682512133728, -0.000282400429553701, 0.00048001770951167, -0.000624275039130218, 0.000587733477625393, -0.000241380338804473, -0.000487956707053685, 0.0015624418067608, -0.0028064622161083, 0.00393025299866839, -0.00460736504288225, 0.00458578658076294, -0.0037937066752492298, 0.002393471078417, -0.000753430618593551, -0.000664227194049538, 0.00146363020553419, -0.00146327923292604, 0.000769458267045614, 0.000261011608950819, -0.00116079601815743, 0.00154108698704243, -0.00125115199774119, 0.000438508946984741, 0.000519799353249541, -0.00118756292239007, 0.00126742017129377, -0.000736868007627857, -0.000141393071090368, 0.000942235624701257, -0.00127878327939183, 0.000987627757381693, -0.000209599208228332, -0.000675091081399281, 0.00122936021810064, -0.00117333866981537, 0.00052577097043343, 0.000398941211506143, -0.00114072606209341, 0.00132053359330713, -0.000833028697351172, -9.24778863039759e-05, 0.000997790398909554, -0.00142076452416942, 0.00112985983003638, -0.000249855341114178, -0.000789150469481368, 0.0014601935886813, -0.001405243258967, 0.000624970870349635, 0.000507588433909562, -0.0014236098994476, 0.00164273454329579, -0.0010236163748081, -0.000149263920561941, 0.00129415558723202, -0.00181908632283474, 0.00142658986782279, -0.000279885939784877, -0.00106124108400589, 0.00191203775046301, -0.00181097295366185, 0.000768168153248805, 0.000718730280307727, -0.00190000658028531, 0.0021503363957439, -0.00129803368371719, -0.000265440886521776, 0.001762443327675, -0.00241422254957892, 0.00184430352139595, -0.000292114304422817, -0.00148264343964045, 0.0025697379551358, -0.00237340520459535, 0.000935989598698157, 0.00105423026292981, -0.00258990301776811, 0.00285239504095632, -0.00164558004365241, -0.000472934296358093, 0.00244564140045802, -0.00324057928407257, 0.00238856949799744, -0.000253857217715182, -0.00211517199913934, 0.00349787557517084, -0.00312745925874692, 0.00111158368986851, 0.00158102208249305, -0.00358219432116783, 0.00381626392605802, -0.00207402480712719, -0.00083544394220153, 0.00345497508677445, -0.00440515103739089, 0.00310622913067083, -0.000120574375310071, -0.0030817624696752, 0.00484188387313493, -0.00416632245054632, 0.00127940759927588, 0.00242941274454625, -0.00506771508379929, 0.00519954520068309, -0.00261881308071381, -0.00147587289167762, 0.00502860732268891, -0.00615070824336387, 0.00411567706225795, 0.00019498933373116, -0.0046585186600187, 0.00694610508685095, -0.00572681358233209, 0.00142335142806638, 0.00390071592904108, -0.00751661782927923, 0.0074144255459042, -0.00340068283413803, -0.00268020555979164, 0.00777327668832136, -0.00912814497312162, 0.00576004284910244, 0.000907301454268281, -0.0076093431260725, 0.0108112759522111, -0.00853903832802766, 0.00153871876353431, 0.00689044720658257, -0.012408925321829, 0.0118212045663871, -0.00485568162193935, -0.00541745433726136, 0.0138695831561045, -0.0157938041454368, 0.00941798078947315, 0.0028398524553277, -0.0151491888962469, 0.0208995655606329, -0.0160544971855367, 0.0016103004720345, 0.0161878850495794, -0.0282642221958651, 0.0269142627512829, -0.00998524263412158, -0.0169622348762176, 0.0417811092129724, -0.0500438069647217, 0.0309705610966743, 0.0174381768123922, -0.0863350663837042, 0.158144198628628, -0.212286320488005, 0.232404210831101, -0.212286320488005, 0.158144198628628, -0.0863350663837042, 0.0174381768123922, 0.0309705610966743, -0.0500438069647217, 0.0417811092129724, -0.0169622348762176, -0.00998524263412158, 0.0269142627512829, -0.0282642221958651, 0.0161878850495794, 0.0016103004720345, -0.0160544971855367, 0.0208995655606329, -0.0151491888962469, 0.0028398524553277, 0.00941798078947315, -0.0157938041454368, 0.0138695831561045, -0.00541745433726136, -0.00485568162193935, 0.0118212045663871, -0.012408925321829, 0.00689044720658257, 0.00153871876353431, -0.00853903832802766, 0.0108112759522111, -0.0076093431260725, 0.000907301454268281, 0.00576004284910244, -0.00912814497312162, 0.00777327668832136, -0.00268020555979164, -0.00340068283413803, 0.0074144255459042, -0.00751661782927923, 0.00390071592904108, 0.00142335142806638, -0.00572681358233209, 0.00694610508685095, -0.0046585186600187, 0.00019498933373116, 0.00411567706225795, -0.00615070824336387, 0.00502860732268891, -0.00147587289167762, -0.00261881308071381, 0.00519954520068309, -0.00506771508379929, 0.00242941274454625, 0.00127940759927588, -0.00416632245054632, 0.00484188387313493, -0.0030817624696752, -0.000120574375310071, 0.00310622913067083, -0.00440515103739089, 0.00345497508677445, -0.00083544394220153, -0.00207402480712719, 0.00381626392605802, -0.00358219432116783, 0.00158102208249305, 0.00111158368986851, -0.00312745925874692, 0.00349787557517084, -0.00211517199913934, -0.000253857217715182, 0.00238856949799744, -0.00324057928407257, 0.00244564140045802, -0.000472934296358093, -0.00164558004365241, 0.00285239504095632, -0.00258990301776811, 0.00105423026292981, 0.000935989598698157, -0.00237340520459535, 0.0025697379551358, -0.00148264343964045, -0.000292114304422817, 0.00184430352139595, -0.00241422254957892, 0.001762443327675, -0.000265440886521776, -0.00129803368371719, 0.0021503363957439, -0.00190000658028531, 0.000718730280307727, 0.000768168153248805, -0.00181097295366185, 0.00191203775046301, -0.00106124108400589, -0.000279885939784877, 0.00142658986782279, -0.00181908632283474, 0.00129415558723202, -0.000149263920561941, -0.0010236163748081, 0.00164273454329579, -0.0014236098994476, 0.000507588433909562, 0.000624970870349635, -0.001405243258967, 0.0014601935886813, -0.000789150469481368, -0.000249855341114178, 0.00112985983003638, -0.00142076452416942, 0.000997790398909554, -9.24778863039759e-05, -0.000833028697351172, 0.00132053359330713, -0.00114072606209341, 0.000398941211506143, 0.00052577097043343, -0.00117333866981537, 0.00122936021810064, -0.000675091081399281, -0.000209599208228332, 0.000987627757381693, -0.00127878327939183, 0.000942235624701257, -0.000141393071090368, -0.000736868007627857, 0.00126742017129377, -0.00118756292239007, 0.000519799353249541, 0.000438508946984741, -0.00125115199774119, 0.00154108698704243, -0.00116079601815743, 0.000261011608950819, 0.000769458267045614, -0.00146327923292604, 0.00146363020553419, -0.000664227194049538, -0.000753430618593551, 0.002393471078417, -0.0037937066752492298, 0.00458578658076294, -0.00460736504288225, 0.00393025299866839, -0.0028064622161083, 0.0015624418067608, -0.000487956707053685, -0.000241380338804473, 0.000587733477625393, -0.000624275039130218, 0.00048001770951167, -0.000282400429553701, 0.000128682512133728]
-coefHPF43Hz=[-0.000115359899738645, 0.000382507148062018, -0.000792714366337441, 0.00143445507181217, -0.00218855402521118, 0.00298577763545228, -0.00361739816817746, 0.0039252314287465, -0.00374589448801897, 0.00304848676766137, -0.00190859565032426, 0.000550350696108823, 0.000733477611740035, -0.00163837496695224, 0.0019583727232128, -0.00164458681318676, 0.000838864748915417, 0.000171186276803916, -0.00103778514232648, 0.0014724290543098, -0.00134280088971871, 0.000721513842771761, 0.000141883119472235, -0.000912187141209535, 0.00129542042726885, -0.00115072831172319, 0.000545590202382137, 0.00027034004738643, -0.000963456153216215, 0.00125005234021241, -0.00101199711193495, 0.000347155985630827, 0.000467969582531985, -0.00109050132795057, 0.00125363554043315, -0.000880575291825024, 0.000121376662509142, 0.000705405281986142, -0.00124448730052955, 0.00125513986817703, -0.00071826304804017, -0.000148579656704853, 0.000977723003436937, -0.00140589062898273, 0.00123233396423512, -0.00051211999442597, -0.000458570862721152, 0.00126277184122037, -0.00154075044700386, 0.00114990163479486, -0.000236050429641993, -0.000818938478912303, 0.00155546448100509, -0.00163526128972902, 0.000995584827475538, 0.000111334922682133, -0.00121611994256188, 0.00182998687966438, -0.00165994215541194, 0.000746918519976628, 0.000537548083564669, -0.00164090292070285, 0.00206612750964906, -0.00159429949252509, 0.000394180279840977, 0.00103495285299321, -0.00206956367031897, 0.00223266916458917, -0.00141211694224124, -7.28239263669586e-05, 0.00159330984748966, -0.00247566709861052, 0.00229853937581388, -0.00109161856898505, -0.000656422508993986, 0.00219369662730845, -0.00282686848779159, 0.00223209274100175, -0.000616398277797692, -0.00134935906287673, 0.00280689685352202, -0.00308341276183101, 0.00199975365979455, 2.63568050038389e-05, -0.00213760833756617, 0.00339764408301535, -0.00320409074441202, 0.00157289939222304, 0.000838687569486445, -0.00299369652227421, 0.00391868030493012, -0.00314062324954264, 0.000922347599122782, 0.00181802296908052, -0.00388368051345063, 0.00431862468363295, -0.0028461079608135, 2.65202316942242e-05, 0.00294977282627287, -0.00476097724781144, 0.00453681776859434, -0.00227046457672469, -0.00113291851592485, 0.00421172942890729, -0.00557066151797385, 0.00450732722559263, -0.00136389726445976, -0.002567974496244, 0.00557113774510433, -0.00624613914004789, 0.00415494450556056, -7.25017895332851e-05, -0.00428827418570451, 0.00698653148564618, -0.00670766636847585, 0.00338999307007295, 0.00166927742248969, -0.00630799431982655, 0.00841070198855541, -0.00685873816408983, 0.00209821470238603, 0.00395201174699117, -0.00865622054819167, 0.00979081061197151, -0.00657090225035136, 0.000110696729712908, 0.00692833763284194, -0.0114066762611941, 0.0110743821863559, -0.00565471963858179, -0.00285909295119658, 0.0108914454516002, -0.014737355530979, 0.0122088865198297, -0.0037681429156224, -0.0073990047527834, 0.0165050565179038, -0.0191113009000254, 0.0131473196358901, -0.000135208010098825, -0.0149963691091402, 0.0255942321584646, -0.0259317282486159, 0.0138490655941051, 0.00769275867763589, -0.0308937175446083, 0.0453313892146659, -0.0414714559573702, 0.0142830117675287, 0.0343631113489189, -0.0954788176283287, 0.15515731444515, -0.198563182403667, 0.214430039527905, -0.198563182403667, 0.15515731444515, -0.0954788176283287, 0.0343631113489189, 0.0142830117675287, -0.0414714559573702, 0.0453313892146659, -0.0308937175446083, 0.00769275867763589, 0.0138490655941051, -0.0259317282486159, 0.0255942321584646, -0.0149963691091402, -0.000135208010098825, 0.0131473196358901, -0.0191113009000254, 0.0165050565179038, -0.0073990047527834, -0.0037681429156224, 0.0122088865198297, -0.014737355530979, 0.0108914454516002, -0.00285909295119658, -0.00565471963858179, 0.0110743821863559, -0.0114066762611941, 0.00692833763284194, 0.000110696729712908, -0.00657090225035136, 0.00979081061197151, -0.00865622054819167, 0.00395201174699117, 0.00209821470238603, -0.00685873816408983, 0.00841070198855541, -0.00630799431982655, 0.00166927742248969, 0.00338999307007295, -0.00670766636847585, 0.00698653148564618, -0.00428827418570451, -7.25017895332851e-05, 0.00415494450556056, -0.00624613914004789, 0.00557113774510433, -0.002567974496244, -0.00136389726445976, 0.00450732722559263, -0.00557066151797385, 0.00421172942890729, -0.00113291851592485, -0.00227046457672469, 0.00453681776859434, -0.00476097724781144, 0.00294977282627287, 2.65202316942242e-05, -0.0028461079608135, 0.00431862468363295, -0.00388368051345063, 0.00181802296908052, 0.000922347599122782, -0.00314062324954264, 0.00391868030493012, -0.00299369652227421, 0.000838687569486445, 0.00157289939222304, -0.00320409074441202, 0.00339764408301535, -0.00213760833756617, 2.63568050038389e-05, 0.00199975365979455, -0.00308341276183101, 0.00280689685352202, -0.00134935906287673, -0.000616398277797692, 0.00223209274100175, -0.00282686848779159, 0.00219369662730845, -0.000656422508993986, -0.00109161856898505, 0.00229853937581388, -0.00247566709861052, 0.00159330984748966, -7.28239263669586e-05, -0.00141211694224124, 0.00223266916458917, -0.00206956367031897, 0.00103495285299321, 0.000394180279840977, -0.00159429949252509, 0.00206612750964906, -0.00164090292070285, 0.000537548083564669, 0.000746918519976628, -0.00165994215541194, 0.00182998687966438, -0.00121611994256188, 0.000111334922682133, 0.000995584827475538, -0.00163526128972902, 0.00155546448100509, -0.000818938478912303, -0.000236050429641993, 0.00114990163479486, -0.00154075044700386, 0.00126277184122037, -0.000458570862721152, -0.00051211999442597, 0.00123233396423512, -0.00140589062898273, 0.000977723003436937, -0.000148579656704853, -0.00071826304804017, 0.00125513986817703, -0.00124448730052955, 0.000705405281986142, 0.000121376662509142, -0.000880575291825024, 0.00125363554043315, -0.00109050132795057, 0.000467969582531985, 0.000347155985630827, -0.00101199711193495, 0.00125005234021241, -0.000963456153216215, 0.00027034004738643, 0.000545590202382137, -0.00115072831172319, 0.00129542042726885, -0.000912187141209535, 0.000141883119472235, 0.000721513842771761, -0.00134280088971871, 0.0014724290543098, -0.00103778514232648, 0.000171186276803916, 0.000838864748915417, -0.00164458681318676, 0.0019583727232128, -0.00163837496695224, 0.000733477611740035, 0.000550350696108823, -0.00190859565032426, 0.00304848676766137, -0.00374589448801897, 0.0039252314287465, -0.00361739816817746, 0.00298577763545228, -0.00218855402521118, 0.00143445507181217, -0.000792714366337441, 0.000382507148062018, -0.000115359899738645]
-coefHPF44Hz=[-3.96111813301371e-05, -3.45523104062458e-05, 0.000171742513331731, -0.000445061768873919, 0.00088101636127256, -0.00147458395739547, 0.00217556226086585, -0.00288576300414374, 0.00347083745255832, -0.00378691336243416, 0.00371726176462505, -0.00320970145173421, 0.00230319454646462, -0.00113327586068109, -8.9178655184748e-05, 0.00112374515085912, -0.00176048109459833, 0.00187788699641749, -0.00148112210427519, 0.000706907460918737, 0.000209483564301527, -0.000998130871273721, 0.00143170252478199, -0.00139290289089373, 0.000910598592557352, -0.000151596637946224, -0.000631362635625479, 0.001180198366556, -0.00131540867637207, 0.000995992573795125, -0.00033444525059978, -0.000439757772815803, 0.0010569478997204, -0.00129961218775839, 0.00107906486261776, -0.000468590411680108, -0.000318748312088671, 0.00100281590210749, -0.00133448353192311, 0.00118580075750633, -0.000599319871291295, -0.000222322598684066, 0.000985020458526303, -0.00140725254242247, 0.00132318357885496, -0.000747272396246411, -0.000124669913708218, 0.00098082697982016, -0.0015038037257027, 0.00148741763778771, -0.0009171646005299, -1.68271177885654e-05, 0.000981955070808795, -0.00162057707441373, 0.00168165991255809, -0.00111849599224421, 0.000114718743520776, 0.0009741482939809, -0.00174558216376689, 0.00189796540256131, -0.00134745640503344, 0.000268859439610685, 0.000958086472666317, -0.00188130551507856, 0.0021420172692957, -0.00161297244220328, 0.000456533097017276, 0.000922856879267143, -0.00201895686159848, 0.00240842878557308, -0.00191318440925809, 0.000678311597830393, 0.000867280278486554, -0.00215842340898147, 0.00269912524975982, -0.00225172557257669, 0.000938073955527255, 0.000789314952830695, -0.00230145991223998, 0.00302056511521242, -0.0026392566393685, 0.00124876822492967, 0.000676367868180667, -0.00243821058123856, 0.00336681521693226, -0.00307321702400268, 0.00160908697475104, 0.000531382338502423, -0.00257570326572245, 0.00374987547546893, -0.00356927976561882, 0.00203511523965789, 0.000342025984294396, -0.00270886993806341, 0.004173300693881, -0.00413800879708973, 0.00254013702578552, 9.78676003610699e-05, -0.00283492276632299, 0.00464393085284153, -0.00479397503956436, 0.00314102479046262, -0.000213131631695977, -0.00295264504326326, 0.00517354520305436, -0.00555874855654386, 0.00386102281531532, -0.000605499863549655, -0.00306499023245037, 0.00578570229253917, -0.00647171472925263, 0.00474322501767742, -0.00111025907202803, -0.00316654263300548, 0.00650589532664652, -0.00758259558821425, 0.00584345206277679, -0.00176511173379993, -0.00325906401975215, 0.0073842532828801, -0.00897993924809029, 0.0072599525261706, -0.00263846409453247, -0.00334007640461165, 0.00850061679749896, -0.010810681517143, 0.00915829023016509, -0.0038447428886868, -0.00341320381017432, 0.0100110558777252, -0.0133607806255383, 0.0118672183517336, -0.00562135963351828, -0.00347032023231057, 0.012219041460644, -0.0172153482124506, 0.0160818645916783, -0.00848041603388957, -0.00351579218523736, 0.0158853519072195, -0.0238827944090056, 0.023677231575569, -0.0138836008521001, -0.00354759446405431, 0.0234494986365578, -0.0386330266124051, 0.0418766419897338, -0.0281546390624535, -0.00356974687127339, 0.0495692203068431, -0.101899139814433, 0.150183450507103, -0.184180829945381, 0.196423513398146, -0.184180829945381, 0.150183450507103, -0.101899139814433, 0.0495692203068431, -0.00356974687127339, -0.0281546390624535, 0.0418766419897338, -0.0386330266124051, 0.0234494986365578, -0.00354759446405431, -0.0138836008521001, 0.023677231575569, -0.0238827944090056, 0.0158853519072195, -0.00351579218523736, -0.00848041603388957, 0.0160818645916783, -0.0172153482124506, 0.012219041460644, -0.00347032023231057, -0.00562135963351828, 0.0118672183517336, -0.0133607806255383, 0.0100110558777252, -0.00341320381017432, -0.0038447428886868, 0.00915829023016509, -0.010810681517143, 0.00850061679749896, -0.00334007640461165, -0.00263846409453247, 0.0072599525261706, -0.00897993924809029, 0.0073842532828801, -0.00325906401975215, -0.00176511173379993, 0.00584345206277679, -0.00758259558821425, 0.00650589532664652, -0.00316654263300548, -0.00111025907202803, 0.00474322501767742, -0.00647171472925263, 0.00578570229253917, -0.00306499023245037, -0.000605499863549655, 0.00386102281531532, -0.00555874855654386, 0.00517354520305436, -0.00295264504326326, -0.000213131631695977, 0.00314102479046262, -0.00479397503956436, 0.00464393085284153, -0.00283492276632299, 9.78676003610699e-05, 0.00254013702578552, -0.00413800879708973, 0.004173300693881, -0.00270886993806341, 0.000342025984294396, 0.00203511523965789, -0.00356927976561882, 0.00374987547546893, -0.00257570326572245, 0.000531382338502423, 0.00160908697475104, -0.00307321702400268, 0.00336681521693226, -0.00243821058123856, 0.000676367868180667, 0.00124876822492967, -0.0026392566393685, 0.00302056511521242, -0.00230145991223998, 0.000789314952830695, 0.000938073955527255, -0.00225172557257669, 0.00269912524975982, -0.00215842340898147, 0.000867280278486554, 0.000678311597830393, -0.00191318440925809, 0.00240842878557308, -0.00201895686159848, 0.000922856879267143, 0.000456533097017276, -0.00161297244220328, 0.0021420172692957, -0.00188130551507856, 0.000958086472666317, 0.000268859439610685, -0.00134745640503344, 0.00189796540256131, -0.00174558216376689, 0.0009741482939809, 0.000114718743520776, -0.00111849599224421, 0.00168165991255809, -0.00162057707441373, 0.000981955070808795, -1.68271177885654e-05, -0.0009171646005299, 0.00148741763778771, -0.0015038037257027, 0.00098082697982016, -0.000124669913708218, -0.000747272396246411, 0.00132318357885496, -0.00140725254242247, 0.000985020458526303, -0.000222322598684066, -0.000599319871291295, 0.00118580075750633, -0.00133448353192311, 0.00100281590210749, -0.000318748312088671, -0.000468590411680108, 0.00107906486261776, -0.00129961218775839, 0.0010569478997204, -0.000439757772815803, -0.00033444525059978, 0.000995992573795125, -0.00131540867637207, 0.001180198366556, -0.000631362635625479, -0.000151596637946224, 0.000910598592557352, -0.00139290289089373, 0.00143170252478199, -0.000998130871273721, 0.000209483564301527, 0.000706907460918737, -0.00148112210427519, 0.00187788699641749, -0.00176048109459833, 0.00112374515085912, -8.9178655184748e-05, -0.00113327586068109, 0.00230319454646462, -0.00320970145173421, 0.00371726176462505, -0.00378691336243416, 0.00347083745255832, -0.00288576300414374, 0.00217556226086585, -0.00147458395739547, 0.00088101636127256, -0.000445061768873919, 0.000171742513331731, -3.45523104062458e-05, -3.96111813301371e-05]
-coefHPF45Hz=[8.85884431943289e-05, -0.000136525408869546, 0.000198518889999396, -0.000227590195819714, 0.000182620898772675, -2.01401246030112e-05, -0.000294204292907969, 0.000772675646221877, -0.00139432744187919, 0.00209959669133694, -0.0027936651449597, 0.00335965429731162, -0.00368036028214278, 0.00366473836933728, -0.00327293187327386, 0.00253295894447836, -0.00154373882925642, 0.000461530735281246, 0.000529223342159606, -0.00125461814556985, 0.00159112310796391, -0.00149673032442127, 0.00102378193049864, -0.000309962216228183, -0.000453047283085962, 0.00106547726558845, -0.00136956179023958, 0.00129024887957539, -0.000855500121981199, 0.000189680318379536, 0.000519277477097272, -0.00107092388565327, 0.00130799534221923, -0.00116143037850492, 0.000671593367050626, 2.12326469020689e-05, -0.000715310792330678, 0.00120482045146784, -0.0013401534493909, 0.00107345864460105, -0.000475635684452201, -0.000281319071040335, 0.000972709561895259, -0.00138684822119157, 0.00138932001028576, -0.000966154787623333, 0.000232382032659352, 0.000598263912752288, -0.00127470234369566, 0.001583661917811, -0.00141629518764226, 0.000805645086538866, 7.77777888914374e-05, -0.000972685788400012, 0.0016035173416171, -0.00176460944407767, 0.00138648272743881, -0.00056310045368261, -0.000470024874916788, 0.00140235443132885, -0.00194093140429517, 0.00190171989859882, -0.00127136971392949, 0.000218980250732033, 0.000948010014513673, -0.00187283265933755, 0.00225766664126198, -0.00195868275174667, 0.00103767979129952, 0.000247635022929265, -0.00151462917077546, 0.00236876152595214, -0.00252558034762265, 0.00190419732049149, -0.000661902218572425, -0.000843610797069224, 0.00215608130848813, -0.00285795260632583, 0.00270209636479114, -0.0016967563026215, 0.000115067599371938, 0.00157737844089986, -0.00285834377193213, 0.00330886942635491, -0.00274871092838351, 0.00130398540851395, 0.000617356754593466, -0.0024389944890919, 0.00358769103003658, -0.00367212060054044, 0.00261380445791512, -0.000686973809482531, -0.00154949241875859, 0.00341224509199801, -0.00430041056740325, 0.00388721821439972, -0.00223582686896662, -0.000200547374907481, 0.00270010403133408, -0.00448392494655272, 0.00495618576277796, -0.00389977527348486, 0.00156409655354388, 0.0013879786076124, -0.0040649237922998, 0.00561262368908406, -0.00548324193511515, 0.00362332164931097, -0.000518176426413182, -0.00292924806200242, 0.00565657505451203, -0.00676474167063415, 0.00580856949194316, -0.0029629887958537, -0.000994098436825132, 0.00488785649527116, -0.00748889862152766, 0.00789404463350214, -0.00582968901832651, 0.00177880555005435, 0.00311911406571167, -0.00737904113724055, 0.00961009451054618, -0.00895670094184886, 0.00540503233286006, 0.000149352023940334, -0.00611073970176136, 0.0106254081483932, -0.0121383815126152, 0.00990293066114278, -0.00428312483597533, -0.00325971187795841, 0.0105188906347146, -0.0151547664114387, 0.0154055502851897, -0.0106915506467745, 0.00192222856247775, 0.00861353992715718, -0.0177822994371606, 0.0224521425398248, -0.0204373882509299, 0.0112829815469094, 0.00334714330871969, -0.0198233345126705, 0.033254396714256, -0.0386041221431241, 0.0319619799743583, -0.0116519352946635, -0.0211142134745695, 0.0622323329701091, -0.105388970548703, 0.143299951888053, -0.169229978025464, 0.178441415023019, -0.169229978025464, 0.143299951888053, -0.105388970548703, 0.0622323329701091, -0.0211142134745695, -0.0116519352946635, 0.0319619799743583, -0.0386041221431241, 0.033254396714256, -0.0198233345126705, 0.00334714330871969, 0.0112829815469094, -0.0204373882509299, 0.0224521425398248, -0.0177822994371606, 0.00861353992715718, 0.00192222856247775, -0.0106915506467745, 0.0154055502851897, -0.0151547664114387, 0.0105188906347146, -0.00325971187795841, -0.00428312483597533, 0.00990293066114278, -0.0121383815126152, 0.0106254081483932, -0.00611073970176136, 0.000149352023940334, 0.00540503233286006, -0.00895670094184886, 0.00961009451054618, -0.00737904113724055, 0.00311911406571167, 0.00177880555005435, -0.00582968901832651, 0.00789404463350214, -0.00748889862152766, 0.00488785649527116, -0.000994098436825132, -0.0029629887958537, 0.00580856949194316, -0.00676474167063415, 0.00565657505451203, -0.00292924806200242, -0.000518176426413182, 0.00362332164931097, -0.00548324193511515, 0.00561262368908406, -0.0040649237922998, 0.0013879786076124, 0.00156409655354388, -0.00389977527348486, 0.00495618576277796, -0.00448392494655272, 0.00270010403133408, -0.000200547374907481, -0.00223582686896662, 0.00388721821439972, -0.00430041056740325, 0.00341224509199801, -0.00154949241875859, -0.000686973809482531, 0.00261380445791512, -0.00367212060054044, 0.00358769103003658, -0.0024389944890919, 0.000617356754593466, 0.00130398540851395, -0.00274871092838351, 0.00330886942635491, -0.00285834377193213, 0.00157737844089986, 0.000115067599371938, -0.0016967563026215, 0.00270209636479114, -0.00285795260632583, 0.00215608130848813, -0.000843610797069224, -0.000661902218572425, 0.00190419732049149, -0.00252558034762265, 0.00236876152595214, -0.00151462917077546, 0.000247635022929265, 0.00103767979129952, -0.00195868275174667, 0.00225766664126198, -0.00187283265933755, 0.000948010014513673, 0.000218980250732033, -0.00127136971392949, 0.00190171989859882, -0.00194093140429517, 0.00140235443132885, -0.000470024874916788, -0.00056310045368261, 0.00138648272743881, -0.00176460944407767, 0.0016035173416171, -0.000972685788400012, 7.77777888914374e-05, 0.000805645086538866, -0.00141629518764226, 0.001583661917811, -0.00127470234369566, 0.000598263912752288, 0.000232382032659352, -0.000966154787623333, 0.00138932001028576, -0.00138684822119157, 0.000972709561895259, -0.000281319071040335, -0.000475635684452201, 0.00107345864460105, -0.0013401534493909, 0.00120482045146784, -0.000715310792330678, 2.12326469020689e-05, 0.000671593367050626, -0.00116143037850492, 0.00130799534221923, -0.00107092388565327, 0.000519277477097272, 0.000189680318379536, -0.000855500121981199, 0.00129024887957539, -0.00136956179023958, 0.00106547726558845, -0.000453047283085962, -0.000309962216228183, 0.00102378193049864, -0.00149673032442127, 0.00159112310796391, -0.00125461814556985, 0.000529223342159606, 0.000461530735281246, -0.00154373882925642, 0.00253295894447836, -0.00327293187327386, 0.00366473836933728, -0.00368036028214278, 0.00335965429731162, -0.0027936651449597, 0.00209959669133694, -0.00139432744187919, 0.000772675646221877, -0.000294204292907969, -2.01401246030112e-05, 0.000182620898772675, -0.000227590195819714, 0.000198518889999396, -0.000136525408869546, 8.85884431943289e-05]
-coefHPF46Hz=[-0.000107381851674961, 0.000219245091294882, -0.000408260849442528, 0.000662206322412256, -0.000967347324715691, 0.00129388689440423, -0.00159685403571881, 0.00182068446881969, -0.00190744410482463, 0.00180750715229335, -0.00149090667533989, 0.000957232847587492, -0.000241300840192048, -0.000587401624795105, 0.00143193378378503, -0.00218185549048299, 0.00273179511591492, -0.00300087457242057, 0.00295003803816951, -0.00259213636690643, 0.00199312781606956, -0.00126239034946296, 0.000533871593426774, 5.91480000155848e-05, -0.000410442267123778, 0.000462941130860799, -0.00022152636615578, -0.000246872735422166, 0.000826501658980344, -0.00137707115877, 0.00176436372442525, -0.00189038014334929, 0.00171626748393919, -0.00127252001423003, 0.000653460442998884, 3.14422458549253e-06, -0.000547410127010357, 0.000852436556948311, -0.000845264228880964, 0.000525925533969266, 3.02458807634728e-05, -0.000688376707331436, 0.00128479029595375, -0.00166585995458361, 0.00172590372287982, -0.00143484835235461, 0.000848422611134161, -9.77061419279958e-05, -0.000640329143656132, 0.00118481620010367, -0.00139568921890773, 0.00121016118928428, -0.000661533209772887, -0.000125022918348944, 0.000959804680015733, -0.0016331375392267, 0.00196693924622589, -0.00186064279634299, 0.00131977731515122, -0.000459264378956525, -0.00052054469771343, 0.00138033998551957, -0.00190020058835466, 0.00193574707440488, -0.0014578735519808, 0.000565331662275618, 0.000534283164190763, -0.00157181073171492, 0.00228149226162755, -0.00246811525519978, 0.00205946843297861, -0.00113027485675244, -0.000109843114562139, 0.00136296566320819, -0.00231396044214084, 0.00270924882103013, -0.00242375169160436, 0.00149854084971608, -0.000138303880323878, -0.00133264878955147, 0.00254669221272349, -0.00318378699037725, 0.00305467808500119, -0.0021550237629213, 0.000675359039284702, 0.00103774902218229, -0.00256186976098342, 0.00350197127816124, -0.00359175197191168, 0.00276736351025399, -0.00119349688191078, -0.000767073224589241, 0.00263558876890289, -0.00393282784474705, 0.00430049421505718, -0.00359807923717893, 0.0019494737812036, 0.000274991898242618, -0.00253979635342879, 0.00427146839350015, -0.00500199614370088, 0.00449299735070095, -0.00280827030727107, 0.000313680645564881, 0.00239939885124751, -0.00465183962108739, 0.00584416507560123, -0.00561298010072712, 0.00393631488990434, -0.00115849933347115, -0.00207619351590182, 0.0049695388221639, -0.00676271647921185, 0.00693104573022101, -0.00533114935979022, 0.0022606883368635, 0.00158958207203518, -0.00528593323881296, 0.00787254519274831, -0.00861214638018924, 0.00718733791318631, -0.00380962718044977, -0.000797155515981276, 0.00554334584229952, -0.00922213248456667, 0.0108056199983596, -0.00971801136081512, 0.00601647171984295, -0.000428074400947751, -0.00577717382110428, 0.0110586444970652, -0.0139674257123593, 0.0135174460034711, -0.00947584460335937, 0.00249551581638491, 0.00595570289579675, -0.0138702635582366, 0.0191338325326539, -0.0200289448713786, 0.0156993993764583, -0.00646597007091248, -0.00609073624353805, 0.0193187015252862, -0.0299356059954892, 0.0346477741259438, -0.0308290517723264, 0.0171218901987615, 0.00616840086510382, -0.0369788042499692, 0.0717282969121119, -0.105860417996532, 0.134594618971043, -0.153747630723972, 0.160468810648329, -0.153747630723972, 0.134594618971043, -0.105860417996532, 0.0717282969121119, -0.0369788042499692, 0.00616840086510382, 0.0171218901987615, -0.0308290517723264, 0.0346477741259438, -0.0299356059954892, 0.0193187015252862, -0.00609073624353805, -0.00646597007091248, 0.0156993993764583, -0.0200289448713786, 0.0191338325326539, -0.0138702635582366, 0.00595570289579675, 0.00249551581638491, -0.00947584460335937, 0.0135174460034711, -0.0139674257123593, 0.0110586444970652, -0.00577717382110428, -0.000428074400947751, 0.00601647171984295, -0.00971801136081512, 0.0108056199983596, -0.00922213248456667, 0.00554334584229952, -0.000797155515981276, -0.00380962718044977, 0.00718733791318631, -0.00861214638018924, 0.00787254519274831, -0.00528593323881296, 0.00158958207203518, 0.0022606883368635, -0.00533114935979022, 0.00693104573022101, -0.00676271647921185, 0.0049695388221639, -0.00207619351590182, -0.00115849933347115, 0.00393631488990434, -0.00561298010072712, 0.00584416507560123, -0.00465183962108739, 0.00239939885124751, 0.000313680645564881, -0.00280827030727107, 0.00449299735070095, -0.00500199614370088, 0.00427146839350015, -0.00253979635342879, 0.000274991898242618, 0.0019494737812036, -0.00359807923717893, 0.00430049421505718, -0.00393282784474705, 0.00263558876890289, -0.000767073224589241, -0.00119349688191078, 0.00276736351025399, -0.00359175197191168, 0.00350197127816124, -0.00256186976098342, 0.00103774902218229, 0.000675359039284702, -0.0021550237629213, 0.00305467808500119, -0.00318378699037725, 0.00254669221272349, -0.00133264878955147, -0.000138303880323878, 0.00149854084971608, -0.00242375169160436, 0.00270924882103013, -0.00231396044214084, 0.00136296566320819, -0.000109843114562139, -0.00113027485675244, 0.00205946843297861, -0.00246811525519978, 0.00228149226162755, -0.00157181073171492, 0.000534283164190763, 0.000565331662275618, -0.0014578735519808, 0.00193574707440488, -0.00190020058835466, 0.00138033998551957, -0.00052054469771343, -0.000459264378956525, 0.00131977731515122, -0.00186064279634299, 0.00196693924622589, -0.0016331375392267, 0.000959804680015733, -0.000125022918348944, -0.000661533209772887, 0.00121016118928428, -0.00139568921890773, 0.00118481620010367, -0.000640329143656132, -9.77061419279958e-05, 0.000848422611134161, -0.00143484835235461, 0.00172590372287982, -0.00166585995458361, 0.00128479029595375, -0.000688376707331436, 3.02458807634728e-05, 0.000525925533969266, -0.000845264228880964, 0.000852436556948311, -0.000547410127010357, 3.14422458549253e-06, 0.000653460442998884, -0.00127252001423003, 0.00171626748393919, -0.00189038014334929, 0.00176436372442525, -0.00137707115877, 0.000826501658980344, -0.000246872735422166, -0.00022152636615578, 0.000462941130860799, -0.000410442267123778, 5.91480000155848e-05, 0.000533871593426774, -0.00126239034946296, 0.00199312781606956, -0.00259213636690643, 0.00295003803816951, -0.00300087457242057, 0.00273179511591492, -0.00218185549048299, 0.00143193378378503, -0.000587401624795105, -0.000241300840192048, 0.000957232847587492, -0.00149090667533989, 0.00180750715229335, -0.00190744410482463, 0.00182068446881969, -0.00159685403571881, 0.00129388689440423, -0.000967347324715691, 0.000662206322412256, -0.000408260849442528, 0.000219245091294882, -0.000107381851674961]
-coefHPF47Hz=[-2.92134772963669e-05, -4.01629962781369e-05, 0.00011109155599206, -0.000238810965696093, 0.000432532403670674, -0.000697393285773853, 0.00103020835965773, -0.00141686460354962, 0.00183133343145885, -0.00223661544869941, 0.00258781776265807, -0.0028372485170408, 0.00294102142087365, -0.00286627612060936, 0.00259786939842722, -0.00214328624352883, 0.00153469476114989, -0.000827359273239952, 9.42051711976543e-05, 0.000583071977875736, -0.0011252411774126, 0.00146747685829471, -0.0015700596943468, 0.00142593499768488, -0.00106358494661064, 0.000544316128228922, 4.60280745877409e-05, -0.000609907968616055, 0.00105354279054447, -0.00130249375355632, 0.00131468921714056, -0.00108848065198612, 0.000663950354445646, -0.000116900218529722, -0.000453698344645468, 0.000942829896803536, -0.00125835056119347, 0.00133829824064981, -0.00116317941509248, 0.00076081809398653, -0.000202742457862448, -0.000407882214013757, 0.000954968285370603, -0.00133079003431811, 0.00145728424261021, -0.00130182306683991, 0.000885348588530753, -0.000280269004851837, -0.000401582282839249, 0.00102915661197496, -0.00147697745732184, 0.00164989396802514, -0.00150296553188626, 0.00105236691119582, -0.000374784055474322, -0.000405103598227922, 0.00113712573973987, -0.0016741645477704, 0.00190135295942762, -0.00176022271556528, 0.00126276718247258, -0.00049221604631196, -0.000410272049485249, 0.00127101427217189, -0.00191683145379064, 0.00220949046076289, -0.00207478124428661, 0.00152022152090005, -0.000637326324474886, -0.000412750571990594, 0.00142811962896805, -0.00220450084910837, 0.0025758578817108, -0.00244931504712645, 0.00182711469649581, -0.000810610096295703, -0.000415306789962154, 0.00161519807300666, -0.00254776611283945, 0.00301380388502645, -0.00289799646818247, 0.00219600993727737, -0.00102064648195249, -0.000415153301519887, 0.00183603630189848, -0.00295644268451153, 0.00353718763985985, -0.00343566193585059, 0.00263905403189952, -0.00127328171405743, -0.000415429028270349, 0.00210393680182883, -0.00345311550025047, 0.00417500625946719, -0.00409307924446613, 0.0031832188105563, -0.00158626493570423, -0.000411813944556167, 0.00242981119536066, -0.00406276569890922, 0.00496191514727258, -0.00490753419891502, 0.00385979531890612, -0.00197631376960915, -0.000408841309362612, 0.00284254468709096, -0.00483692578364059, 0.00596521169035768, -0.00595065407649705, 0.00473045909139395, -0.00248060006413798, -0.000405614200844241, 0.00338354942936301, -0.00585728830289755, 0.00729580831259494, -0.00734321563638863, 0.00590081558934926, -0.00316311278475262, -0.000402194766608718, 0.0041297496084743, -0.00727616041058742, 0.00916298228596446, -0.00931649076110501, 0.007576566376436, -0.00415133771562789, -0.000396750880771024, 0.00523558442660447, -0.00940713651152315, 0.0120069214419191, -0.012367001874294, 0.0102077707445116, -0.00572705422438758, -0.000395217020689627, 0.00708432357418116, -0.0130410377515657, 0.0169699341798701, -0.0178284493728921, 0.0150530569437413, -0.0087200591923445, -0.000392750746079934, 0.0108619850635352, -0.0207913100138992, 0.0280797087250107, -0.0307467842736057, 0.0272645620449162, -0.0168416752661174, -0.000389033450449747, 0.0233147529209121, -0.0499339746140688, 0.0775868212524053, -0.103293854452563, 0.124154640980657, -0.137746758148371, 0.142464711191753, -0.137746758148371, 0.124154640980657, -0.103293854452563, 0.0775868212524053, -0.0499339746140688, 0.0233147529209121, -0.000389033450449747, -0.0168416752661174, 0.0272645620449162, -0.0307467842736057, 0.0280797087250107, -0.0207913100138992, 0.0108619850635352, -0.000392750746079934, -0.0087200591923445, 0.0150530569437413, -0.0178284493728921, 0.0169699341798701, -0.0130410377515657, 0.00708432357418116, -0.000395217020689627, -0.00572705422438758, 0.0102077707445116, -0.012367001874294, 0.0120069214419191, -0.00940713651152315, 0.00523558442660447, -0.000396750880771024, -0.00415133771562789, 0.007576566376436, -0.00931649076110501, 0.00916298228596446, -0.00727616041058742, 0.0041297496084743, -0.000402194766608718, -0.00316311278475262, 0.00590081558934926, -0.00734321563638863, 0.00729580831259494, -0.00585728830289755, 0.00338354942936301, -0.000405614200844241, -0.00248060006413798, 0.00473045909139395, -0.00595065407649705, 0.00596521169035768, -0.00483692578364059, 0.00284254468709096, -0.000408841309362612, -0.00197631376960915, 0.00385979531890612, -0.00490753419891502, 0.00496191514727258, -0.00406276569890922, 0.00242981119536066, -0.000411813944556167, -0.00158626493570423, 0.0031832188105563, -0.00409307924446613, 0.00417500625946719, -0.00345311550025047, 0.00210393680182883, -0.000415429028270349, -0.00127328171405743, 0.00263905403189952, -0.00343566193585059, 0.00353718763985985, -0.00295644268451153, 0.00183603630189848, -0.000415153301519887, -0.00102064648195249, 0.00219600993727737, -0.00289799646818247, 0.00301380388502645, -0.00254776611283945, 0.00161519807300666, -0.000415306789962154, -0.000810610096295703, 0.00182711469649581, -0.00244931504712645, 0.0025758578817108, -0.00220450084910837, 0.00142811962896805, -0.000412750571990594, -0.000637326324474886, 0.00152022152090005, -0.00207478124428661, 0.00220949046076289, -0.00191683145379064, 0.00127101427217189, -0.000410272049485249, -0.00049221604631196, 0.00126276718247258, -0.00176022271556528, 0.00190135295942762, -0.0016741645477704, 0.00113712573973987, -0.000405103598227922, -0.000374784055474322, 0.00105236691119582, -0.00150296553188626, 0.00164989396802514, -0.00147697745732184, 0.00102915661197496, -0.000401582282839249, -0.000280269004851837, 0.000885348588530753, -0.00130182306683991, 0.00145728424261021, -0.00133079003431811, 0.000954968285370603, -0.000407882214013757, -0.000202742457862448, 0.00076081809398653, -0.00116317941509248, 0.00133829824064981, -0.00125835056119347, 0.000942829896803536, -0.000453698344645468, -0.000116900218529722, 0.000663950354445646, -0.00108848065198612, 0.00131468921714056, -0.00130249375355632, 0.00105354279054447, -0.000609907968616055, 4.60280745877409e-05, 0.000544316128228922, -0.00106358494661064, 0.00142593499768488, -0.0015700596943468, 0.00146747685829471, -0.0011252411774126, 0.000583071977875736, 9.42051711976543e-05, -0.000827359273239952, 0.00153469476114989, -0.00214328624352883, 0.00259786939842722, -0.00286627612060936, 0.00294102142087365, -0.0028372485170408, 0.00258781776265807, -0.00223661544869941, 0.00183133343145885, -0.00141686460354962, 0.00103020835965773, -0.000697393285773853, 0.000432532403670674, -0.000238810965696093, 0.00011109155599206, -4.01629962781369e-05, -2.92134772963669e-05]
-coefHPF48Hz=[7.0290440308797e-05, -7.65569205525457e-05, 0.000103988167013887, -0.00012282422571633, 0.000122965231493543, -9.2657639720476e-05, 1.97418548950527e-05, 0.000106668914585392, -0.000294259194840215, 0.000545589828429833, -0.000856458319754971, 0.00121480324103893, -0.00160042575223659, 0.0019857808840602, -0.00233793091774886, 0.00262152097841263, -0.00280250419668693, 0.00285230629180392, -0.0027519726781697, 0.00249563156483521, -0.00209268937838412, 0.00156845743976532, -0.000962914886579348, 0.00032735741636364, 0.000280666292586115, -0.000803455562605115, 0.00119005795143559, -0.00140287803446133, 0.0014226466693506, -0.00125212379568435, 0.000916444695770144, -0.000461201767868382, -5.26629490226933e-05, 0.000556030726647491, -0.000980323905540815, 0.00126654718614784, -0.00137347090381369, 0.00128374565714469, -0.00100700884072706, 0.000579402005557144, -5.93603284443871e-05, -0.000479924961952372, 0.000960422419590337, -0.00131026111000717, 0.0014743285923138, -0.00142287444635291, 0.00115675718938128, -0.000708485643427732, 0.000138680991893455, 0.000471796898809115, -0.00103300310960355, 0.00145886370738354, -0.00168019283734417, 0.00165569131854446, -0.00137928135380514, 0.00088256017778669, -0.000231584668056238, -0.000481486575705985, 0.00115122186278092, -0.00167418939251382, 0.00196470289768786, -0.00196855344420884, 0.00167264453208365, -0.00110882125407412, 0.000351065474043703, 0.000493822015040613, -0.00130095493724713, 0.00194554310476224, -0.00232188836993476, 0.00236035526139538, -0.00203966282397817, 0.00139237352028672, -0.000502419975633169, -0.000505298871665547, 0.00148207056762531, -0.00227698231445134, 0.00275987060592878, -0.00284220291468073, 0.0024925949751842, -0.00174430432129695, 0.000693232847144356, 0.000513773185571646, -0.00169898244651981, 0.0026794837924225, -0.00329498715105142, 0.00343344063125614, -0.00305055932876178, 0.00217988149689847, -0.000931442255989109, -0.000521356507289964, 0.00196521589428281, -0.00317766958681339, 0.00396073534435707, -0.00417250181736056, 0.00375169243759088, -0.00273111999556616, 0.00123742435429318, 0.000523570897089476, -0.00229436376678706, 0.00380258921952649, -0.00480201218050059, 0.0051116480056459, -0.00464694714469513, 0.00343789310554961, -0.00163054777263805, -0.000529048089348599, 0.00272709212889278, -0.00462635666364664, 0.00591651755685269, -0.00636317515454196, 0.005848067751054, -0.00439386399283018, 0.00216895630711559, 0.000529651812515468, -0.00331396495004569, 0.0057586860291443, -0.00746379017147465, 0.00811709963180239, -0.00754746159239649, 0.00575999176801754, -0.00294699347612039, -0.000528574093902494, 0.00417636110849392, -0.0074439039625597, 0.0097956746915577, -0.0107951487117428, 0.0101780225720151, -0.00790525508062024, 0.00418682401389263, 0.000529287803723539, -0.00560376023198075, 0.0102841063140917, -0.0138055186997934, 0.0155018495132809, -0.0149119673970787, 0.0118665029417205, -0.00654174772664301, -0.000528833623618817, 0.0084898923450443, -0.0162447122605674, 0.0225732881199036, -0.026275045804092, 0.0263193871072902, -0.0219854742637382, 0.0129732124577387, 0.000529727712595186, -0.0178350532685525, 0.0377989720092721, -0.0589220677082196, 0.0794938341469111, -0.0977660861516043, 0.112135591336867, -0.121314788109305, 0.124470576589384, -0.121314788109305, 0.112135591336867, -0.0977660861516043, 0.0794938341469111, -0.0589220677082196, 0.0377989720092721, -0.0178350532685525, 0.000529727712595186, 0.0129732124577387, -0.0219854742637382, 0.0263193871072902, -0.026275045804092, 0.0225732881199036, -0.0162447122605674, 0.0084898923450443, -0.000528833623618817, -0.00654174772664301, 0.0118665029417205, -0.0149119673970787, 0.0155018495132809, -0.0138055186997934, 0.0102841063140917, -0.00560376023198075, 0.000529287803723539, 0.00418682401389263, -0.00790525508062024, 0.0101780225720151, -0.0107951487117428, 0.0097956746915577, -0.0074439039625597, 0.00417636110849392, -0.000528574093902494, -0.00294699347612039, 0.00575999176801754, -0.00754746159239649, 0.00811709963180239, -0.00746379017147465, 0.0057586860291443, -0.00331396495004569, 0.000529651812515468, 0.00216895630711559, -0.00439386399283018, 0.005848067751054, -0.00636317515454196, 0.00591651755685269, -0.00462635666364664, 0.00272709212889278, -0.000529048089348599, -0.00163054777263805, 0.00343789310554961, -0.00464694714469513, 0.0051116480056459, -0.00480201218050059, 0.00380258921952649, -0.00229436376678706, 0.000523570897089476, 0.00123742435429318, -0.00273111999556616, 0.00375169243759088, -0.00417250181736056, 0.00396073534435707, -0.00317766958681339, 0.00196521589428281, -0.000521356507289964, -0.000931442255989109, 0.00217988149689847, -0.00305055932876178, 0.00343344063125614, -0.00329498715105142, 0.0026794837924225, -0.00169898244651981, 0.000513773185571646, 0.000693232847144356, -0.00174430432129695, 0.0024925949751842, -0.00284220291468073, 0.00275987060592878, -0.00227698231445134, 0.00148207056762531, -0.000505298871665547, -0.000502419975633169, 0.00139237352028672, -0.00203966282397817, 0.00236035526139538, -0.00232188836993476, 0.00194554310476224, -0.00130095493724713, 0.000493822015040613, 0.000351065474043703, -0.00110882125407412, 0.00167264453208365, -0.00196855344420884, 0.00196470289768786, -0.00167418939251382, 0.00115122186278092, -0.000481486575705985, -0.000231584668056238, 0.00088256017778669, -0.00137928135380514, 0.00165569131854446, -0.00168019283734417, 0.00145886370738354, -0.00103300310960355, 0.000471796898809115, 0.000138680991893455, -0.000708485643427732, 0.00115675718938128, -0.00142287444635291, 0.0014743285923138, -0.00131026111000717, 0.000960422419590337, -0.000479924961952372, -5.93603284443871e-05, 0.000579402005557144, -0.00100700884072706, 0.00128374565714469, -0.00137347090381369, 0.00126654718614784, -0.000980323905540815, 0.000556030726647491, -5.26629490226933e-05, -0.000461201767868382, 0.000916444695770144, -0.00125212379568435, 0.0014226466693506, -0.00140287803446133, 0.00119005795143559, -0.000803455562605115, 0.000280666292586115, 0.00032735741636364, -0.000962914886579348, 0.00156845743976532, -0.00209268937838412, 0.00249563156483521, -0.0027519726781697, 0.00285230629180392, -0.00280250419668693, 0.00262152097841263, -0.00233793091774886, 0.0019857808840602, -0.00160042575223659, 0.00121480324103893, -0.000856458319754971, 0.000545589828429833, -0.000294259194840215, 0.000106668914585392, 1.97418548950527e-05, -9.2657639720476e-05, 0.000122965231493543, -0.00012282422571633, 0.000103988167013887, -7.65569205525457e-05, 7.0290440308797e-05]
-coefHPF49Hz=[-7.96622062471938e-05, 0.000114691954516501, -0.000188313029521155, 0.000283540474861409, -0.000399650981286001, 0.000533566935706392, -0.000679547422185348, 0.00082911998349478, -0.000971320825515934, 0.0010932222068085, -0.0011807470003732, 0.00121978250812948, -0.00119752447890558, 0.00110386580685056, -0.000932711555148333, 0.000683180916006555, -0.000360501419735045, -2.36760477355609e-05, 0.000451514780842642, -0.000899709227596124, 0.00134094116916585, -0.00174594541361906, 0.00208571336795174, -0.0023341128015132, 0.00247060766438892, -0.00248217594179587, 0.00236541635202921, -0.00212719330111351, 0.00178491242527394, -0.00136543491563429, 0.000903225347827599, -0.000437540572337455, 8.99661559501867e-06, 0.000344216502564407, -0.000590075091818708, 0.00070608500310391, -0.000681877725636432, 0.00052069397897464, -0.000239583107903741, -0.000131765168187161, 0.000553588857907743, -0.00097977459277103, 0.00136236782510919, -0.00165654459042403, 0.00182546612946546, -0.00184445544782484, 0.00170415251072233, -0.00141212813079399, 0.000992737898795015, -0.000485253295047878, -5.98484530738989e-05, 0.000585809461840544, -0.00103559120346112, 0.00135805100176823, -0.00151383408094931, 0.0014802017946812, -0.00125428953127705, 0.000854293709687421, -0.000318417580857822, -0.000298442468454106, 0.000930028993801585, -0.00150555495576577, 0.00195734298033452, -0.0022285055933601, 0.00227976839825126, -0.00209464369772503, 0.00168233419952144, -0.00107788849115621, 0.000339482290481301, 0.000456993656924306, -0.0012256097739507, 0.00187953187125135, -0.00234070137381947, 0.00254901291417908, -0.00246986200031215, 0.00209927079818455, -0.00146575307329293, 0.000628678953842775, 0.00032693857057403, -0.00129874616169974, 0.00217773374089886, -0.00286014831957687, 0.00325940166076459, -0.00331662825711093, 0.00300863712171373, -0.00235223761637487, 0.00140429920200285, -0.000257299969934293, -0.000969331545673214, 0.00214132467270525, -0.00312394237738031, 0.00379710453254684, -0.00406962125790491, 0.00389089203728401, -0.00325861571007348, 0.00222149169270412, -0.000876325538898268, -0.000640414460125274, 0.00216588680040342, -0.00352783274794449, 0.00456342761199195, -0.00513807601324522, 0.00516199540857187, -0.00460268833006928, 0.00349164042932886, -0.00192424796291833, 5.25990985344832e-05, 0.00192845218832873, -0.00380073888044936, 0.00534589217927792, -0.00636976659154966, 0.00672552877749409, -0.00633281950663884, 0.00519063778569612, -0.00338218766825689, 0.00107071682208659, 0.00151372837337349, -0.00409570124493012, 0.00638203164043819, -0.00809316899903198, 0.00899499647532274, -0.00892770858996983, 0.00782848644705099, -0.00574514064294154, 0.00283873581793606, 0.000625797125375481, -0.00430078660855856, 0.00778725255288359, -0.0106739829425671, 0.0125807418587028, -0.0132014095733255, 0.0123426881487901, -0.00995418910470722, 0.00614637596751593, -0.00119384220462471, -0.00447723338261466, 0.0103171853916417, -0.0156946534352991, 0.0199488398482132, -0.022447852864634, 0.0226479818209345, -0.0201484529001944, 0.0147364444138839, -0.0064178343579697, -0.00456966495430948, 0.0177628187441038, -0.032498744985428, 0.0479586769621081, -0.063226299245625, 0.0773559325030642, -0.0894448982427477, 0.0987038900271752, -0.104519323543162, 0.106502211047619, -0.104519323543162, 0.0987038900271752, -0.0894448982427477, 0.0773559325030642, -0.063226299245625, 0.0479586769621081, -0.032498744985428, 0.0177628187441038, -0.00456966495430948, -0.0064178343579697, 0.0147364444138839, -0.0201484529001944, 0.0226479818209345, -0.022447852864634, 0.0199488398482132, -0.0156946534352991, 0.0103171853916417, -0.00447723338261466, -0.00119384220462471, 0.00614637596751593, -0.00995418910470722, 0.0123426881487901, -0.0132014095733255, 0.0125807418587028, -0.0106739829425671, 0.00778725255288359, -0.00430078660855856, 0.000625797125375481, 0.00283873581793606, -0.00574514064294154, 0.00782848644705099, -0.00892770858996983, 0.00899499647532274, -0.00809316899903198, 0.00638203164043819, -0.00409570124493012, 0.00151372837337349, 0.00107071682208659, -0.00338218766825689, 0.00519063778569612, -0.00633281950663884, 0.00672552877749409, -0.00636976659154966, 0.00534589217927792, -0.00380073888044936, 0.00192845218832873, 5.25990985344832e-05, -0.00192424796291833, 0.00349164042932886, -0.00460268833006928, 0.00516199540857187, -0.00513807601324522, 0.00456342761199195, -0.00352783274794449, 0.00216588680040342, -0.000640414460125274, -0.000876325538898268, 0.00222149169270412, -0.00325861571007348, 0.00389089203728401, -0.00406962125790491, 0.00379710453254684, -0.00312394237738031, 0.00214132467270525, -0.000969331545673214, -0.000257299969934293, 0.00140429920200285, -0.00235223761637487, 0.00300863712171373, -0.00331662825711093, 0.00325940166076459, -0.00286014831957687, 0.00217773374089886, -0.00129874616169974, 0.00032693857057403, 0.000628678953842775, -0.00146575307329293, 0.00209927079818455, -0.00246986200031215, 0.00254901291417908, -0.00234070137381947, 0.00187953187125135, -0.0012256097739507, 0.000456993656924306, 0.000339482290481301, -0.00107788849115621, 0.00168233419952144, -0.00209464369772503, 0.00227976839825126, -0.0022285055933601, 0.00195734298033452, -0.00150555495576577, 0.000930028993801585, -0.000298442468454106, -0.000318417580857822, 0.000854293709687421, -0.00125428953127705, 0.0014802017946812, -0.00151383408094931, 0.00135805100176823, -0.00103559120346112, 0.000585809461840544, -5.98484530738989e-05, -0.000485253295047878, 0.000992737898795015, -0.00141212813079399, 0.00170415251072233, -0.00184445544782484, 0.00182546612946546, -0.00165654459042403, 0.00136236782510919, -0.00097977459277103, 0.000553588857907743, -0.000131765168187161, -0.000239583107903741, 0.00052069397897464, -0.000681877725636432, 0.00070608500310391, -0.000590075091818708, 0.000344216502564407, 8.99661559501867e-06, -0.000437540572337455, 0.000903225347827599, -0.00136543491563429, 0.00178491242527394, -0.00212719330111351, 0.00236541635202921, -0.00248217594179587, 0.00247060766438892, -0.0023341128015132, 0.00208571336795174, -0.00174594541361906, 0.00134094116916585, -0.000899709227596124, 0.000451514780842642, -2.36760477355609e-05, -0.000360501419735045, 0.000683180916006555, -0.000932711555148333, 0.00110386580685056, -0.00119752447890558, 0.00121978250812948, -0.0011807470003732, 0.0010932222068085, -0.000971320825515934, 0.00082911998349478, -0.000679547422185348, 0.000533566935706392, -0.000399650981286001, 0.000283540474861409, -0.000188313029521155, 0.000114691954516501, -7.96622062471938e-05]
-coefHPF50Hz=[-3.9779239302901e-05, -6.95602759597563e-06, 2.40927553716377e-05, -5.47964253518819e-05, 0.000101569017713103, -0.000167009236049054, 0.000253395028109334, -0.000362312900186401, 0.000494327837974667, -0.000648690006902508, 0.000823107020072904, -0.00101360158168897, 0.0012144659739952, -0.00141834769123639, 0.00161645192194554, -0.00179888874698521, 0.00195514248188698, -0.00207465724898321, 0.00214750778247225, -0.0021651099416931, 0.00212092953186433, -0.00201112801542849, 0.00183510126943113, -0.00159586228942535, 0.0013002207902457, -0.000958728281587355, 0.000585354526729996, -0.000196899103299707, -0.000187839134589349, 0.000549096572060063, -0.00086731218640997, 0.00112439597584707, -0.00130499394837612, 0.00139768166858445, -0.00139595032974091, 0.00129889956077125, -0.0011116060600474, 0.000845141191486862, -0.000516185089754045, 0.00014612931572312, 0.00024029853627574, -0.000616158410141405, 0.000954562077665067, -0.00123019318414244, 0.00142133681696591, -0.00151153411519275, 0.00149099829021523, -0.00135761640957841, 0.00111743692108626, -0.000784589839630451, 0.000380606579251201, 6.68437527423245e-05, -0.000525729257007645, 0.000961852142057368, -0.00134130149825466, 0.00163300953175457, -0.00181121297907666, 0.001857636374205, -0.00176321783785681, 0.00152921356419321, -0.0011675750942228, 0.000700526517144229, -0.000159342761425869, -0.000417619129303701, 0.000987529466127146, -0.00150616121569249, 0.00193122295883848, -0.0022256969943919, 0.00236092531932279, -0.00231921540974705, 0.00209571402583034, -0.00169940028492629, 0.00115302600099755, -0.000492008981980987, -0.000237697081977047, 0.000982653293546095, -0.00168572401058194, 0.00229033968725599, -0.0027448801631957, 0.00300690160712348, -0.00304694389674701, 0.00285131663825465, -0.00242403466344179, 0.00178728464801154, -0.00098061802552463, 5.87124764974856e-05, 0.000912137603120039, -0.00185859880184768, 0.00270564884798489, -0.00338231539575768, 0.00382738525840556, -0.00399464224838311, 0.00385719374880447, -0.00341052450813596, 0.00267396373226932, -0.00169038924591256, 0.000524094257122463, 0.000743109312186551, -0.00201733388853521, 0.00319927227187713, -0.00419160320573238, 0.00490662740510784, -0.00527355702405172, 0.00524488315971121, -0.0048012903029616, 0.00395465893047336, -0.00274884053819049, 0.00125803236276996, 0.000417263084342616, -0.00215648958202644, 0.00382718679668987, -0.00529445261731691, 0.00643114930925704, -0.00712808170581937, 0.00730339820950189, -0.00691046838686769, 0.00594356400747821, -0.00444082890264252, 0.00248412996798283, -0.000195632566351715, -0.00226875196909074, 0.00472890438691664, -0.00699230039031554, 0.0088675326449706, -0.0101785645267172, 0.0107787991256381, -0.0105639465206056, 0.00948272558655357, -0.00754454960100877, 0.00482349762449731, -0.00145811161010344, -0.00235317419208358, 0.00636089197278478, -0.0102772892817417, 0.0137923217366973, -0.0165919758324938, 0.018377834980478, -0.0188866755789186, 0.017908826291029, -0.0153040833948984, 0.0110140702914285, -0.00507014673688386, -0.00240378248283176, 0.0111938949900103, -0.0210045035591454, 0.0314711975521129, -0.0421783944288166, 0.0526803298889832, -0.0625243104581419, 0.0712748212426395, -0.0785371460819463, 0.0839789729377799, -0.0873487750073397, 0.0884897918664288, -0.0873487750073397, 0.0839789729377799, -0.0785371460819463, 0.0712748212426395, -0.0625243104581419, 0.0526803298889832, -0.0421783944288166, 0.0314711975521129, -0.0210045035591454, 0.0111938949900103, -0.00240378248283176, -0.00507014673688386, 0.0110140702914285, -0.0153040833948984, 0.017908826291029, -0.0188866755789186, 0.018377834980478, -0.0165919758324938, 0.0137923217366973, -0.0102772892817417, 0.00636089197278478, -0.00235317419208358, -0.00145811161010344, 0.00482349762449731, -0.00754454960100877, 0.00948272558655357, -0.0105639465206056, 0.0107787991256381, -0.0101785645267172, 0.0088675326449706, -0.00699230039031554, 0.00472890438691664, -0.00226875196909074, -0.000195632566351715, 0.00248412996798283, -0.00444082890264252, 0.00594356400747821, -0.00691046838686769, 0.00730339820950189, -0.00712808170581937, 0.00643114930925704, -0.00529445261731691, 0.00382718679668987, -0.00215648958202644, 0.000417263084342616, 0.00125803236276996, -0.00274884053819049, 0.00395465893047336, -0.0048012903029616, 0.00524488315971121, -0.00527355702405172, 0.00490662740510784, -0.00419160320573238, 0.00319927227187713, -0.00201733388853521, 0.000743109312186551, 0.000524094257122463, -0.00169038924591256, 0.00267396373226932, -0.00341052450813596, 0.00385719374880447, -0.00399464224838311, 0.00382738525840556, -0.00338231539575768, 0.00270564884798489, -0.00185859880184768, 0.000912137603120039, 5.87124764974856e-05, -0.00098061802552463, 0.00178728464801154, -0.00242403466344179, 0.00285131663825465, -0.00304694389674701, 0.00300690160712348, -0.0027448801631957, 0.00229033968725599, -0.00168572401058194, 0.000982653293546095, -0.000237697081977047, -0.000492008981980987, 0.00115302600099755, -0.00169940028492629, 0.00209571402583034, -0.00231921540974705, 0.00236092531932279, -0.0022256969943919, 0.00193122295883848, -0.00150616121569249, 0.000987529466127146, -0.000417619129303701, -0.000159342761425869, 0.000700526517144229, -0.0011675750942228, 0.00152921356419321, -0.00176321783785681, 0.001857636374205, -0.00181121297907666, 0.00163300953175457, -0.00134130149825466, 0.000961852142057368, -0.000525729257007645, 6.68437527423245e-05, 0.000380606579251201, -0.000784589839630451, 0.00111743692108626, -0.00135761640957841, 0.00149099829021523, -0.00151153411519275, 0.00142133681696591, -0.00123019318414244, 0.000954562077665067, -0.000616158410141405, 0.00024029853627574, 0.00014612931572312, -0.000516185089754045, 0.000845141191486862, -0.0011116060600474, 0.00129889956077125, -0.00139595032974091, 0.00139768166858445, -0.00130499394837612, 0.00112439597584707, -0.00086731218640997, 0.000549096572060063, -0.000187839134589349, -0.000196899103299707, 0.000585354526729996, -0.000958728281587355, 0.0013002207902457, -0.00159586228942535, 0.00183510126943113, -0.00201112801542849, 0.00212092953186433, -0.0021651099416931, 0.00214750778247225, -0.00207465724898321, 0.00195514248188698, -0.00179888874698521, 0.00161645192194554, -0.00141834769123639, 0.0012144659739952, -0.00101360158168897, 0.000823107020072904, -0.000648690006902508, 0.000494327837974667, -0.000362312900186401, 0.000253395028109334, -0.000167009236049054, 0.000101569017713103, -5.47964253518819e-05, 2.40927553716377e-05, -6.95602759597563e-06, -3.9779239302901e-05]
+globals().update(load_set('FILTERS'))
@@ -1,105 +1,5 @@
+# The coefficients now live in filter_coefs.npy (set "Filters", see coef_store.py). This module only keeps
+# `from Filters import coefLPF1Hz, ...` working without parsing the float literals on every start.
+from coef_store import load_set
 
-import pandas as pd
-import numpy as np
-
-
-coefLPF1Hz=[0.000112763886687098, 5.2588724470898e-05, 6.43223399680057e-05, 7.74316063993969e-05, 9.19397712165417e-05, 0.000107882517517894, 0.000125198623332953, 0.000143878501653206, 0.00016387218204448, 0.000185185429020983, 0.000207675342998351, 0.00023120928455973, 0.000255626690511628, 0.000280933313002943, 0.000306791208994216, 0.00033292057524595, 0.000359277434456304, 0.000385338763741785, 0.000410986520409637, 0.000435793822854464, 0.000459438790476236, 0.000481493885730548, 0.000501573656613774, 0.000519237991033127, 0.000534016044584767, 0.000545415291303876, 0.000552967545655343, 0.000556180286730492, 0.000554510066155082, 0.000547497334634639, 0.000534603736925842, 0.000515305986481587, 0.000489160540276479, 0.00045564613428995, 0.000414342085659392, 0.000364794894471181, 0.0003066443781627, 0.000239527218016727, 0.000163147843097471, 7.72532546034955e-05, -1.83389533453551e-05, -0.000123771484358511, -0.000239088465953547, -0.000364261392813969, -0.000499215754337984, -0.000643746368284181, -0.000797582895908662, -0.000960361705170319, -0.00113160549244916, -0.00131075998644286, -0.00149714112736521, -0.00168999105286141, -0.00188841873889328, -0.00209144973379004, -0.002298001543363, -0.00250689828117564, -0.00271684474778452, -0.0029264768639576, -0.00313432613637017, -0.00333883396701412, -0.00353838060238626, -0.00373125645503572, -0.0039156992751192, -0.00408989019928887, -0.00425196659450294, -0.00440003697872141, -0.00453217211269358, -0.0046464501074743, -0.00474093983403113, -0.00481372805330596, -0.0048629246808927, -0.00488669155585777, -0.00488322656240368, -0.00485081320847054, -0.00478781108518112, -0.00469267272213453, -0.00456396676038134, -0.00440038145582841, -0.0042007495705141, -0.00396404615077351, -0.00368941028700678, -0.00337615754786203, -0.00302377793664173, -0.00263196056664354, -0.00220059412658714, -0.00172977386042333, -0.00121980439935619, -0.000671220966530614, -8.47694506477737e-05, 0.000538572701967304, 0.00119760725789775, 0.00189090927130507, 0.00261683224423324, 0.00337351365831479, 0.00415887258257745, 0.0049706283997491, 0.00580630264785578, 0.00666322485256308, 0.00753855138996989, 0.00842927679752191, 0.00933224348510019, 0.0102441586832942, 0.0111616156597206, 0.0120811012082032, 0.0129990245752276, 0.0139117289981527, 0.0148155183833199, 0.0157066680018463, 0.0165814524334452, 0.0174361679046162, 0.0182671465653658, 0.019070781973026, 0.0198435516574728, 0.0205820347297031, 0.021282932533313, 0.0219430927143542, 0.0225595233207225, 0.0231294105118662, 0.0236501393752912, 0.0241193092504946, 0.0245347467514829, 0.0248945171540714, 0.0251969428746056, 0.0254406071284053, 0.0256243654060155, 0.0257473542668272, 0.025808995012286, 0.025808995012286, 0.0257473542668272, 0.0256243654060155, 0.0254406071284053, 0.0251969428746056, 0.0248945171540714, 0.0245347467514829, 0.0241193092504946, 0.0236501393752912, 0.0231294105118662, 0.0225595233207225, 0.0219430927143542, 0.021282932533313, 0.0205820347297031, 0.0198435516574728, 0.019070781973026, 0.0182671465653658, 0.0174361679046162, 0.0165814524334452, 0.0157066680018463, 0.0148155183833199, 0.0139117289981527, 0.0129990245752276, 0.0120811012082032, 0.0111616156597206, 0.0102441586832942, 0.00933224348510019, 0.00842927679752191, 0.00753855138996989, 0.00666322485256308, 0.00580630264785578, 0.0049706283997491, 0.00415887258257745, 0.00337351365831479, 0.00261683224423324, 0.00189090927130507, 0.00119760725789775, 0.000538572701967304, -8.47694506477737e-05, -0.000671220966530614, -0.00121980439935619, -0.00172977386042333, -0.00220059412658714, -0.00263196056664354, -0.00302377793664173, -0.00337615754786203, -0.00368941028700678, -0.00396404615077351, -0.0042007495705141, -0.00440038145582841, -0.00456396676038134, -0.00469267272213453, -0.00478781108518112, -0.00485081320847054, -0.00488322656240368, -0.00488669155585777, -0.0048629246808927, -0.00481372805330596, -0.00474093983403113, -0.0046464501074743, -0.00453217211269358, -0.00440003697872141, -0.00425196659450294, -0.00408989019928887, -0.0039156992751192, -0.00373125645503572, -0.00353838060238626, -0.00333883396701412, -0.00313432613637017, -0.0029264768639576, -0.00271684474778452, -0.00250689828117564, -0.002298001543363, -0.00209144973379004, -0.00188841873889328, -0.00168999105286141, -0.00149714112736521, -0.00131075998644286, -0.00113160549244916, -0.000960361705170319, -0.000797582895908662, -0.000643746368284181, -0.000499215754337984, -0.000364261392813969, -0.000239088465953547, -0.000123771484358511, -1.83389533453551e-05, 7.72532546034955e-05, 0.000163147843097471, 0.000239527218016727, 0.0003066443781627, 0.000364794894471181, 0.000414342085659392, 0.00045564613428995, 0.000489160540276479, 0.000515305986481587, 0.000534603736925842, 0.000547497334634639, 0.000554510066155082, 0.000556180286730492, 0.000552967545655343, 0.000545415291303876, 0.000534016044584767, 0.000519237991033127, 0.000501573656613774, 0.000481493885730548, 0.000459438790476236, 0.000435793822854464, 0.000410986520409637, 0.000385338763741785, 0.000359277434456304, 0.00033292057524595, 0.000306791208994216, 0.000280933313002943, 0.000255626690511628, 0.00023120928455973, 0.000207675342998351, 0.000185185429020983, 0.00016387218204448, 0.000143878501653206, 0.000125198623332953, 0.000107882517517894, 9.19397712165417e-05, 7.74316063993969e-05, 6.43223399680057e-05, 5.2588724470898e-05, 0.000112763886687098]
-coefLPF2Hz=[9.11641297485456e-05, 7.24304479222425e-05, 9.98625939142384e-05, 0.000132949713960951, 0.000172144208399672, 0.000217802599980821, 0.000270262288340855, 0.000329620277645883, 0.000395857088780149, 0.00046885189374228, 0.000548387759560438, 0.00063374701998945, 0.000724410437167249, 0.000819312184283389, 0.000917338438021508, 0.00101712506459334, 0.00111709979664988, 0.0012154942797242, 0.00131032216433121, 0.00139949050725757, 0.00148075164020169, 0.00155175072167271, 0.00161016074243066, 0.00165357737235237, 0.00167968421688404, 0.00168626265577701, 0.00167125062883427, 0.00163283105372899, 0.00156944905701928, 0.0014799360230296, 0.00136347947173801, 0.00121973362881124, 0.0010488548613666, 0.0008515165321947, 0.000628969753504, 0.000383055314471573, 0.000116194322985064, -0.000168591600798076, -0.000467734388473951, -0.000777097614664586, -0.00109208866362417, -0.00140765422567496, -0.00171839347038367, -0.00201863219621004, -0.00230252239053759, -0.00256414377524546, -0.00279763862716464, -0.00299731481214261, -0.00315780240305528, -0.00327414775568527, -0.00334199324678541, -0.00335764820296658, -0.00331825023707925, -0.00322185067004768, -0.00306752488926148, -0.00285544407385812, -0.00258695334571065, -0.00226459739688873, -0.00189215567303465, -0.00147461273094809, -0.00101815993656643, -0.000530097271042028, -1.87851952296193e-05, 0.000506491968887614, 0.00103564963519894, 0.00155797571317691, 0.00206230465862953, 0.00253723134111905, 0.00297132279190968, 0.00335336251082846, 0.00367257351275267, 0.00391888991911864, 0.0040831740203426, 0.00415747444550873, 0.00413524039649085, 0.00401154025118301, 0.00378324490715222, 0.00344919646854738, 0.00301033925546021, 0.00246981984373931, 0.00183304005331712, 0.00110768967408669, 0.000303705616383309, -0.000566781680704538, -0.00148957019884364, -0.00244853894113571, -0.00342585254206197, -0.00440220177087397, -0.0053570810531255, -0.00626910548719838, -0.00711635142929397, -0.00787671842274489, -0.00852832176498607, -0.00904987897833474, -0.00942111424295164, -0.00962315050801617, -0.00963889524648212, -0.00945340565538324, -0.00905422485416243, -0.0084316950507216, -0.00757921820113478, -0.00649347951074782, -0.00517462043433424, -0.00362635030090071, -0.00185600665543531, 0.000125449949201125, 0.00230350034686294, 0.00466019607053421, 0.00717435201559169, 0.00982178976684581, 0.0125756506021077, 0.0154067468056693, 0.0182839655783981, 0.0211747125154971, 0.0240453852788016, 0.0268618742388728, 0.0295900756197731, 0.032196415874001, 0.0346483711054568, 0.0369149718283369, 0.0389672977572993, 0.0407789314709244, 0.0423263833636946, 0.0435894683643996, 0.0445516309583153, 0.0452002139653707, 0.0455266612022465, 0.0455266612022465, 0.0452002139653707, 0.0445516309583153, 0.0435894683643996, 0.0423263833636946, 0.0407789314709244, 0.0389672977572993, 0.0369149718283369, 0.0346483711054568, 0.032196415874001, 0.0295900756197731, 0.0268618742388728, 0.0240453852788016, 0.0211747125154971, 0.0182839655783981, 0.0154067468056693, 0.0125756506021077, 0.00982178976684581, 0.00717435201559169, 0.00466019607053421, 0.00230350034686294, 0.000125449949201125, -0.00185600665543531, -0.00362635030090071, -0.00517462043433424, -0.00649347951074782, -0.00757921820113478, -0.0084316950507216, -0.00905422485416243, -0.00945340565538324, -0.00963889524648212, -0.00962315050801617, -0.00942111424295164, -0.00904987897833474, -0.00852832176498607, -0.00787671842274489, -0.00711635142929397, -0.00626910548719838, -0.0053570810531255, -0.00440220177087397, -0.00342585254206197, -0.00244853894113571, -0.00148957019884364, -0.000566781680704538, 0.000303705616383309, 0.00110768967408669, 0.00183304005331712, 0.00246981984373931, 0.00301033925546021, 0.00344919646854738, 0.00378324490715222, 0.00401154025118301, 0.00413524039649085, 0.00415747444550873, 0.0040831740203426, 0.00391888991911864, 0.00367257351275267, 0.00335336251082846, 0.00297132279190968, 0.00253723134111905, 0.00206230465862953, 0.00155797571317691, 0.00103564963519894, 0.000506491968887614, -1.87851952296193e-05, -0.000530097271042028, -0.00101815993656643, -0.00147461273094809, -0.00189215567303465, -0.00226459739688873, -0.00258695334571065, -0.00285544407385812, -0.00306752488926148, -0.00322185067004768, -0.00331825023707925, -0.00335764820296658, -0.00334199324678541, -0.00327414775568527, -0.00315780240305528, -0.00299731481214261, -0.00279763862716464, -0.00256414377524546, -0.00230252239053759, -0.00201863219621004, -0.00171839347038367, -0.00140765422567496, -0.00109208866362417, -0.000777097614664586, -0.000467734388473951, -0.000168591600798076, 0.000116194322985064, 0.000383055314471573, 0.000628969753504, 0.0008515165321947, 0.0010488548613666, 0.00121973362881124, 0.00136347947173801, 0.0014799360230296, 0.00156944905701928, 0.00163283105372899, 0.00167125062883427, 0.00168626265577701, 0.00167968421688404, 0.00165357737235237, 0.00161016074243066, 0.00155175072167271, 0.00148075164020169, 0.00139949050725757, 0.00131032216433121, 0.0012154942797242, 0.00111709979664988, 0.00101712506459334, 0.000917338438021508, 0.000819312184283389, 0.000724410437167249, 0.00063374701998945, 0.000548387759560438, 0.00046885189374228, 0.000395857088780149, 0.000329620277645883, 0.000270262288340855, 0.000217802599980821, 0.000172144208399672, 0.000132949713960951, 9.98625939142384e-05, 7.24304479222425e-05, 9.11641297485456e-05]
-coefLPF3Hz=[-6.86240052659829e-05, -8.37147465410367e-06, 4.19318226986562e-07, 1.7401043040926e-05, 4.43200445876596e-05, 8.31094478733308e-05, 0.000135697683440637, 0.000203960555706328, 0.000289495486104097, 0.000393570224740765, 0.000516902068404816, 0.000659658417757885, 0.000821252247567013, 0.00100035157431399, 0.00119463450771628, 0.001400890927686, 0.00161489722768338, 0.00183176782469367, 0.00204552508122019, 0.00224958805730683, 0.00243704223501375, 0.00260039479333146, 0.00273234934619106, 0.00282570262762713, 0.0028739088817528, 0.00287121036002065, 0.00281308112457121, 0.0026964164340702, 0.00251990504612884, 0.00228415394280558, 0.00199191209673719, 0.00164807794469452, 0.0012597885033702, 0.000836263341037797, 0.000388653371595744, -7.02959208822876e-05, -0.000526452828707826, -0.000964980390676835, -0.00137064923577187, -0.00172852689603682, -0.00202453571530506, -0.00224606631893325, -0.00238258421679681, -0.00242617160749426, -0.00237200383083691, -0.0022187429651166, -0.00196880209947445, -0.00162847889592861, -0.00120791806386253, -0.000720940449507162, -0.000184697230796859, 0.000380837771545257, 0.000953555027853847, 0.00150994613675405, 0.00202602080912621, 0.00247829360869323, 0.00284472428367256, 0.00310578368351435, 0.00324534390644832, 0.00325157858853084, 0.00311767074548752, 0.00284237802571171, 0.0024303752328114, 0.00189238870470584, 0.00124506355357884, 0.000510584743735521, -0.00028397478134881, -0.0011075229160719, -0.00192605329849551, -0.00270393748736938, -0.00340535575084899, -0.00399578111157471, -0.00444356228578023, -0.00472139396828983, -0.00480773824054595, -0.0046880654170107, -0.00435584653183598, -0.00381330757221529, -0.00307181455635484, -0.00215192522487506, -0.00108304065613626, 9.73142158603363e-05, 0.00134460447517561, 0.00260874255245271, 0.00383586903803115, 0.00497036707195076, 0.00595708653505176, 0.00674366828282877, 0.00728287753419409, 0.00753486768713528, 0.00746929315960698, 0.00706711959377542, 0.00632214724737144, 0.00524205479936676, 0.00384900620696949, 0.00217971055168744, 0.00028493123669902, -0.0017715642936255, -0.00391459460816556, -0.0060596649653018, -0.0081155102132042, -0.00998701981735648, -0.0115784281075919, -0.0127966756840102, -0.0135548293306287, -0.0137754256923665, -0.013393606906684, -0.0123599596525657, -0.0106429015809057, -0.00823054994372689, -0.00513198153410802, -0.00137779250772313, 0.0029800204797213, 0.00786893704959586, 0.0131974891586201, 0.0188575185855968, 0.024727044828537, 0.0306736575280551, 0.0365583241806266, 0.0422394986829464, 0.0475773704143, 0.0524381357629579, 0.056698135089128, 0.0602477075876998, 0.0629946359252687, 0.0648670673529406, 0.0658157842472369, 0.0658157842472369, 0.0648670673529406, 0.0629946359252687, 0.0602477075876998, 0.056698135089128, 0.0524381357629579, 0.0475773704143, 0.0422394986829464, 0.0365583241806266, 0.0306736575280551, 0.024727044828537, 0.0188575185855968, 0.0131974891586201, 0.00786893704959586, 0.0029800204797213, -0.00137779250772313, -0.00513198153410802, -0.00823054994372689, -0.0106429015809057, -0.0123599596525657, -0.013393606906684, -0.0137754256923665, -0.0135548293306287, -0.0127966756840102, -0.0115784281075919, -0.00998701981735648, -0.0081155102132042, -0.0060596649653018, -0.00391459460816556, -0.0017715642936255, 0.00028493123669902, 0.00217971055168744, 0.00384900620696949, 0.00524205479936676, 0.00632214724737144, 0.00706711959377542, 0.00746929315960698, 0.00753486768713528, 0.00728287753419409, 0.00674366828282877, 0.00595708653505176, 0.00497036707195076, 0.00383586903803115, 0.00260874255245271, 0.00134460447517561, 9.73142158603363e-05, -0.00108304065613626, -0.00215192522487506, -0.00307181455635484, -0.00381330757221529, -0.00435584653183598, -0.0046880654170107, -0.00480773824054595, -0.00472139396828983, -0.00444356228578023, -0.00399578111157471, -0.00340535575084899, -0.00270393748736938, -0.00192605329849551, -0.0011075229160719, -0.00028397478134881, 0.000510584743735521, 0.00124506355357884, 0.00189238870470584, 0.0024303752328114, 0.00284237802571171, 0.00311767074548752, 0.00325157858853084, 0.00324534390644832, 0.00310578368351435, 0.00284472428367256, 0.00247829360869323, 0.00202602080912621, 0.00150994613675405, 0.000953555027853847, 0.000380837771545257, -0.000184697230796859, -0.000720940449507162, -0.00120791806386253, -0.00162847889592861, -0.00196880209947445, -0.0022187429651166, -0.00237200383083691, -0.00242617160749426, -0.00238258421679681, -0.00224606631893325, -0.00202453571530506, -0.00172852689603682, -0.00137064923577187, -0.000964980390676835, -0.000526452828707826, -7.02959208822876e-05, 0.000388653371595744, 0.000836263341037797, 0.0012597885033702, 0.00164807794469452, 0.00199191209673719, 0.00228415394280558, 0.00251990504612884, 0.0026964164340702, 0.00281308112457121, 0.00287121036002065, 0.0028739088817528, 0.00282570262762713, 0.00273234934619106, 0.00260039479333146, 0.00243704223501375, 0.00224958805730683, 0.00204552508122019, 0.00183176782469367, 0.00161489722768338, 0.001400890927686, 0.00119463450771628, 0.00100035157431399, 0.000821252247567013, 0.000659658417757885, 0.000516902068404816, 0.000393570224740765, 0.000289495486104097, 0.000203960555706328, 0.000135697683440637, 8.31094478733308e-05, 4.43200445876596e-05, 1.7401043040926e-05, 4.19318226986562e-07, -8.37147465410367e-06, -6.86240052659829e-05]
-coefLPF4Hz=[-0.000100547111306941, -9.98420911313642e-05, -0.000142233840091814, -0.000189625925048907, -0.000239113096352302, -0.000286601209382727, -0.000327082433703349, -0.000354434589872967, -0.000361901736111248, -0.000342543642888265, -0.000289238252540085, -0.000195798231756452, -5.71490870066321e-05, 0.000129941079371016, 0.000366378454878581, 0.000650236986708035, 0.000976400464605515, 0.00133648578112017, 0.00171871588972986, 0.00210846869113592, 0.00248852029207174, 0.00284001277640037, 0.00314322231933933, 0.00337890133011949, 0.00352932572856476, 0.00357973587329055, 0.00351941309777697, 0.0033428296608501, 0.00305042266284289, 0.00264918162192538, 0.00215270934981471, 0.00158100043232544, 0.0009596464267859, 0.000318726542793124, -0.0003088320561331, -0.000889023171440519, -0.00138896257608832, -0.00177891892545113, -0.00203453856337548, -0.0021386118747484, -0.00208274934344755, -0.00186828063587377, -0.00150683649407886, -0.00101999924479404, -0.00043849507879293, 0.000199502356128094, 0.000850473470227337, 0.00146834872634555, 0.00200745195680612, 0.00242575204763454, 0.00268788631214586, 0.00276803917242808, 0.00265213613558849, 0.00233950586267644, 0.0018434971040834, 0.0011913205569759, 0.000422706733004361, -0.000412200267543816, -0.00125602502632241, -0.00204781369838104, -0.00272735206542524, -0.00323945654643539, -0.00353832912325076, -0.00359127357742023, -0.00338185406018981, -0.00291186615866478, -0.00220225678517218, -0.00129255351308677, -0.00023906395624964, 0.000888390775201713, 0.00201075345368027, 0.00304505960747257, 0.00391019999989772, 0.00453301122684665, 0.00485397582687835, 0.00483240900834914, 0.00445040645461678, 0.00371551999157445, 0.00266158396246309, 0.00134784318536458, -0.000143960885829084, -0.00171414184163605, -0.00325132341947331, -0.00463976511220663, -0.00576755658507111, -0.00653489608205875, -0.00686211226653478, -0.00669661011014748, -0.00601841210806295, -0.00484361148368905, -0.00322558216726796, -0.0012535235955702, 0.000951498712541086, 0.00324310450361955, 0.00545822739345001, 0.00742755832260568, 0.00898698632259657, 0.0099895320995115, 0.0103167889710973, 0.0098892833667087, 0.0086748163091197, 0.0066943043691424, 0.00402443361622883, 0.000796949588345624, -0.00280569886664799, -0.00655812912338646, -0.0102030101817782, -0.013464607257838, -0.0160642754089664, -0.0177369130618337, -0.0182475170707547, -0.0174067240803656, -0.0150844567691819, -0.0112206753633898, -0.00583259198576114, 0.000982306554760269, 0.00904764448498283, 0.0181140907405895, 0.027869541248724, 0.037953140993967, 0.0479723573627884, 0.0575222437842796, 0.0662057888696385, 0.0736542386034866, 0.0795462112015548, 0.0836245268165519, 0.0857097639855411, 0.0857097639855411, 0.0836245268165519, 0.0795462112015548, 0.0736542386034866, 0.0662057888696385, 0.0575222437842796, 0.0479723573627884, 0.037953140993967, 0.027869541248724, 0.0181140907405895, 0.00904764448498283, 0.000982306554760269, -0.00583259198576114, -0.0112206753633898, -0.0150844567691819, -0.0174067240803656, -0.0182475170707547, -0.0177369130618337, -0.0160642754089664, -0.013464607257838, -0.0102030101817782, -0.00655812912338646, -0.00280569886664799, 0.000796949588345624, 0.00402443361622883, 0.0066943043691424, 0.0086748163091197, 0.0098892833667087, 0.0103167889710973, 0.0099895320995115, 0.00898698632259657, 0.00742755832260568, 0.00545822739345001, 0.00324310450361955, 0.000951498712541086, -0.0012535235955702, -0.00322558216726796, -0.00484361148368905, -0.00601841210806295, -0.00669661011014748, -0.00686211226653478, -0.00653489608205875, -0.00576755658507111, -0.00463976511220663, -0.00325132341947331, -0.00171414184163605, -0.000143960885829084, 0.00134784318536458, 0.00266158396246309, 0.00371551999157445, 0.00445040645461678, 0.00483240900834914, 0.00485397582687835, 0.00453301122684665, 0.00391019999989772, 0.00304505960747257, 0.00201075345368027, 0.000888390775201713, -0.00023906395624964, -0.00129255351308677, -0.00220225678517218, -0.00291186615866478, -0.00338185406018981, -0.00359127357742023, -0.00353832912325076, -0.00323945654643539, -0.00272735206542524, -0.00204781369838104, -0.00125602502632241, -0.000412200267543816, 0.000422706733004361, 0.0011913205569759, 0.0018434971040834, 0.00233950586267644, 0.00265213613558849, 0.00276803917242808, 0.00268788631214586, 0.00242575204763454, 0.00200745195680612, 0.00146834872634555, 0.000850473470227337, 0.000199502356128094, -0.00043849507879293, -0.00101999924479404, -0.00150683649407886, -0.00186828063587377, -0.00208274934344755, -0.0021386118747484, -0.00203453856337548, -0.00177891892545113, -0.00138896257608832, -0.000889023171440519, -0.0003088320561331, 0.000318726542793124, 0.0009596464267859, 0.00158100043232544, 0.00215270934981471, 0.00264918162192538, 0.00305042266284289, 0.0033428296608501, 0.00351941309777697, 0.00357973587329055, 0.00352932572856476, 0.00337890133011949, 0.00314322231933933, 0.00284001277640037, 0.00248852029207174, 0.00210846869113592, 0.00171871588972986, 0.00133648578112017, 0.000976400464605515, 0.000650236986708035, 0.000366378454878581, 0.000129941079371016, -5.71490870066321e-05, -0.000195798231756452, -0.000289238252540085, -0.000342543642888265, -0.000361901736111248, -0.000354434589872967, -0.000327082433703349, -0.000286601209382727, -0.000239113096352302, -0.000189625925048907, -0.000142233840091814, -9.98420911313642e-05, -0.000100547111306941]
-coefLPF5Hz=[-1.40916528815031e-05, -0.000142018259917901, -0.000209854743735406, -0.000355582238739949, -0.000544413162078179, -0.000783289712655867, -0.00107018864483529, -0.00139905948227846, -0.00175871056677016, -0.00213281058695508, -0.0025003960825064, -0.00283690767577248, -0.00311581757946247, -0.00331064544492765, -0.00339735140828385, -0.00335679602348372, -0.00317717652964241, -0.00285601932146135, -0.0024015456087973, -0.00183316071909114, -0.00118099276410651, -0.000484343265436387, 0.000210883622382316, 0.000855712589921317, 0.00140217455671339, 0.001807674097048, 0.00203920747997639, 0.0020770881615444, 0.00191759688298627, 0.00157428826473417, 0.00107767412588009, 0.000473379638049925, -0.000181451945747322, -0.00082311921182845, -0.00138727528260864, -0.00181512380206924, -0.00205960887632351, -0.00209067870698164, -0.00189907059681116, -0.00149810750024802, -0.00092347447236856, -0.000230430291909628, 0.000511148305766273, 0.00122336722206073, 0.0018281777792251, 0.00225586600982362, 0.00245269166714166, 0.00238747116958902, 0.00205611592939532, 0.00148321965365467, 0.00072082259654454, -0.000155752970917235, -0.00105533845051476, -0.00187961733472391, -0.00253399325241474, -0.00293783587702855, -0.00303421680829837, -0.0027973508356705, -0.00223694603134752, -0.00139910299486282, -0.000362947082119161, 0.000766269904527434, 0.00186758795583093, 0.00281678142513617, 0.00350008492205824, 0.00382727350822911, 0.00374301909705489, 0.00323482951994885, 0.00233681490481287, 0.00112837473833602, -0.000272139232830954, -0.0017184792393702, -0.00305118167672861, -0.00411464096453196, -0.00477459625443912, -0.00493428137259683, -0.00454729896429572, -0.00362569202875508, -0.00224191087564826, -0.000524278376561883, 0.00135403602246189, 0.00319159778771633, 0.00477946301191402, 0.00592388668554036, 0.00646877621600469, 0.00631530181761939, 0.00543639989430991, 0.00388422868039547, 0.00178946681953548, -0.000648151547912538, -0.00317738414104177, -0.00551977586376783, -0.00739854245093002, -0.00856909642810229, -0.00884811490705203, -0.00813794432475945, -0.00644338252153406, -0.00387860678867283, -0.000662924110792752, 0.00289507994493137, 0.00642390186798687, 0.00952408316451559, 0.011808750515959, 0.0129457182296477, 0.0126973771062158, 0.0109537923433622, 0.0077555925805356, 0.00330359644664807, -0.00204658096104262, -0.00780517028353267, -0.0133833013608821, -0.0181396435332623, -0.021435124979554, -0.0226908428241457, -0.0214441434526721, -0.0173974254869578, -0.0104551397417885, -0.000744939965404646, 0.011379410948279, 0.0253543447219191, 0.0404412117468781, 0.0557769438419164, 0.0704366834133983, 0.0835032664925303, 0.094137708520059, 0.101644715044057, 0.105527562234924, 0.105527562234924, 0.101644715044057, 0.094137708520059, 0.0835032664925303, 0.0704366834133983, 0.0557769438419164, 0.0404412117468781, 0.0253543447219191, 0.011379410948279, -0.000744939965404646, -0.0104551397417885, -0.0173974254869578, -0.0214441434526721, -0.0226908428241457, -0.021435124979554, -0.0181396435332623, -0.0133833013608821, -0.00780517028353267, -0.00204658096104262, 0.00330359644664807, 0.0077555925805356, 0.0109537923433622, 0.0126973771062158, 0.0129457182296477, 0.011808750515959, 0.00952408316451559, 0.00642390186798687, 0.00289507994493137, -0.000662924110792752, -0.00387860678867283, -0.00644338252153406, -0.00813794432475945, -0.00884811490705203, -0.00856909642810229, -0.00739854245093002, -0.00551977586376783, -0.00317738414104177, -0.000648151547912538, 0.00178946681953548, 0.00388422868039547, 0.00543639989430991, 0.00631530181761939, 0.00646877621600469, 0.00592388668554036, 0.00477946301191402, 0.00319159778771633, 0.00135403602246189, -0.000524278376561883, -0.00224191087564826, -0.00362569202875508, -0.00454729896429572, -0.00493428137259683, -0.00477459625443912, -0.00411464096453196, -0.00305118167672861, -0.0017184792393702, -0.000272139232830954, 0.00112837473833602, 0.00233681490481287, 0.00323482951994885, 0.00374301909705489, 0.00382727350822911, 0.00350008492205824, 0.00281678142513617, 0.00186758795583093, 0.000766269904527434, -0.000362947082119161, -0.00139910299486282, -0.00223694603134752, -0.0027973508356705, -0.00303421680829837, -0.00293783587702855, -0.00253399325241474, -0.00187961733472391, -0.00105533845051476, -0.000155752970917235, 0.00072082259654454, 0.00148321965365467, 0.00205611592939532, 0.00238747116958902, 0.00245269166714166, 0.00225586600982362, 0.0018281777792251, 0.00122336722206073, 0.000511148305766273, -0.000230430291909628, -0.00092347447236856, -0.00149810750024802, -0.00189907059681116, -0.00209067870698164, -0.00205960887632351, -0.00181512380206924, -0.00138727528260864, -0.00082311921182845, -0.000181451945747322, 0.000473379638049925, 0.00107767412588009, 0.00157428826473417, 0.00191759688298627, 0.0020770881615444, 0.00203920747997639, 0.001807674097048, 0.00140217455671339, 0.000855712589921317, 0.000210883622382316, -0.000484343265436387, -0.00118099276410651, -0.00183316071909114, -0.0024015456087973, -0.00285601932146135, -0.00317717652964241, -0.00335679602348372, -0.00339735140828385, -0.00331064544492765, -0.00311581757946247, -0.00283690767577248, -0.0025003960825064, -0.00213281058695508, -0.00175871056677016, -0.00139905948227846, -0.00107018864483529, -0.000783289712655867, -0.000544413162078179, -0.000355582238739949, -0.000209854743735406, -0.000142018259917901, -1.40916528815031e-05]
-coefLPF6Hz=[9.76976238815578e-05, 9.62595842655334e-05, 0.000120393836478941, 0.000123207721286208, 8.83573798917251e-05, -1.98497866808563e-06, -0.000165136907320955, -0.000414615893364324, -0.000757291368058786, -0.00119065608093385, -0.00170033734942044, -0.00225960748600189, -0.00282954834630815, -0.00336180293849276, -0.00380263669615293, -0.00409860722151243, -0.0042031571520177, -0.00408326761169666, -0.00372537010644701, -0.00313960565673266, -0.00236133954943205, -0.00144982047283634, -0.0004833761254206, 0.000448198174296746, 0.00125357845679284, 0.00185098294442393, 0.00217892443809615, 0.00220516975421771, 0.00193251307983808, 0.00140023540970501, 0.000680884919881485, -0.00012773664319968, -0.000914423881505933, -0.00156898440723989, -0.00199728108821362, -0.00213479147181037, -0.00195668677564622, -0.00148277321311805, -0.000776261768157665, 6.37273871059119e-05, 0.000915285773668199, 0.00165072330703786, 0.00215524088012726, 0.00234453661469462, 0.00217867689183901, 0.00166997636977418, 0.000883380461585503, -7.10973467244213e-05, -0.00105310183474553, -0.00191201406928277, -0.00250952542818809, -0.00274145407312066, -0.00255538292627949, -0.00196120524553215, -0.00103259132450389, 0.00010132650333678, 0.00127326533824239, 0.00230186793367071, 0.00301920658977197, 0.00329758510941471, 0.00307148805955194, 0.00235097443681455, 0.00122399460029285, -0.000153315409262436, -0.00157749363936888, -0.00282710347967739, -0.00369644446054918, -0.00402861620549047, -0.00374270523010043, -0.00285056526418407, -0.001459979259458, 0.000237016096312224, 0.00198963562746975, 0.0035244618842758, 0.00458710998639238, 0.00498323378870253, 0.00461243933547323, 0.0034893889414509, 0.00174810339118953, -0.000372185322988192, -0.00255846342655323, -0.00446874345533123, -0.00578403962971334, -0.0062598239293473, -0.00576892077542107, -0.00432866679746794, -0.00210716005207415, 0.000593617209904124, 0.00337661093466074, 0.00580576356694597, 0.00747173593270754, 0.00805772999471847, 0.00739526035208768, 0.00550064279189375, 0.00258534288069803, -0.000963128086315504, -0.00462879378843507, -0.00783794130219486, -0.0100438085025019, -0.010813364484261, -0.00990322339693791, -0.0073125004664886, -0.00330303972862114, 0.00161837479469215, 0.00675599776435353, 0.0113139003568024, 0.0145070770241301, 0.015680508529326, 0.014419761956828, 0.0106368570488509, 0.00461758405713865, -0.00297901906484227, -0.0111722796084689, -0.0187590523405572, -0.0244502487963362, -0.0270290043372211, -0.0255110671233746, -0.0192867776006549, -0.00822548538588022, 0.00727267620767468, 0.026286539660194, 0.0474465075492654, 0.0690634030736422, 0.0892996673563201, 0.106363351486766, 0.118702090953416, 0.125173860150718, 0.125173860150718, 0.118702090953416, 0.106363351486766, 0.0892996673563201, 0.0690634030736422, 0.0474465075492654, 0.026286539660194, 0.00727267620767468, -0.00822548538588022, -0.0192867776006549, -0.0255110671233746, -0.0270290043372211, -0.0244502487963362, -0.0187590523405572, -0.0111722796084689, -0.00297901906484227, 0.00461758405713865, 0.0106368570488509, 0.014419761956828, 0.015680508529326, 0.0145070770241301, 0.0113139003568024, 0.00675599776435353, 0.00161837479469215, -0.00330303972862114, -0.0073125004664886, -0.00990322339693791, -0.010813364484261, -0.0100438085025019, -0.00783794130219486, -0.00462879378843507, -0.000963128086315504, 0.00258534288069803, 0.00550064279189375, 0.00739526035208768, 0.00805772999471847, 0.00747173593270754, 0.00580576356694597, 0.00337661093466074, 0.000593617209904124, -0.00210716005207415, -0.00432866679746794, -0.00576892077542107, -0.0062598239293473, -0.00578403962971334, -0.00446874345533123, -0.00255846342655323, -0.000372185322988192, 0.00174810339118953, 0.0034893889414509, 0.00461243933547323, 0.00498323378870253, 0.00458710998639238, 0.0035244618842758, 0.00198963562746975, 0.000237016096312224, -0.001459979259458, -0.00285056526418407, -0.00374270523010043, -0.00402861620549047, -0.00369644446054918, -0.00282710347967739, -0.00157749363936888, -0.000153315409262436, 0.00122399460029285, 0.00235097443681455, 0.00307148805955194, 0.00329758510941471, 0.00301920658977197, 0.00230186793367071, 0.00127326533824239, 0.00010132650333678, -0.00103259132450389, -0.00196120524553215, -0.00255538292627949, -0.00274145407312066, -0.00250952542818809, -0.00191201406928277, -0.00105310183474553, -7.10973467244213e-05, 0.000883380461585503, 0.00166997636977418, 0.00217867689183901, 0.00234453661469462, 0.00215524088012726, 0.00165072330703786, 0.000915285773668199, 6.37273871059119e-05, -0.000776261768157665, -0.00148277321311805, -0.00195668677564622, -0.00213479147181037, -0.00199728108821362, -0.00156898440723989, -0.000914423881505933, -0.00012773664319968, 0.000680884919881485, 0.00140023540970501, 0.00193251307983808, 0.00220516975421771, 0.00217892443809615, 0.00185098294442393, 0.00125357845679284, 0.000448198174296746, -0.0004833761254206, -0.00144982047283634, -0.00236133954943205, -0.00313960565673266, -0.00372537010644701, -0.00408326761169666, -0.0042031571520177, -0.00409860722151243, -0.00380263669615293, -0.00336180293849276, -0.00282954834630815, -0.00225960748600189, -0.00170033734942044, -0.00119065608093385, -0.000757291368058786, -0.000414615893364324, -0.000165136907320955, -1.98497866808563e-06, 8.83573798917251e-05, 0.000123207721286208, 0.000120393836478941, 9.62595842655334e-05, 9.76976238815578e-05]
-coefLPF7Hz=[0.00014707472109285, 0.000289000525962142, 0.000534796618512837, 0.00087251952697515, 0.00129595990831674, 0.00178207013392173, 0.00229027495413109, 0.00276412592552764, 0.00313678282474372, 0.0033396662482711, 0.0033130640445196, 0.0030174905107908, 0.00244377553929436, 0.00161945043315728, 0.000609998444227304, -0.000486025378335509, -0.00154826628088787, -0.00245099152170994, -0.00308213414919853, -0.00336208615265324, -0.00325892197816167, -0.00279675882169392, -0.00205509450407059, -0.0011586403712191, -0.000258610183417392, 0.000491907284454057, 0.000964335446754776, 0.00107795411801265, 0.000815769771762063, 0.000229501137587805, -0.000567925774867371, -0.0014216614375339, -0.00216295844060796, -0.00264102441019287, -0.00275270161266408, -0.00246412620710781, -0.00181978907649075, -0.000936561263554281, 1.69231954949962e-05, 0.000852068513567444, 0.00139744083865899, 0.00153406519255844, 0.00122171922839118, 0.000510425459873232, -0.000465913656008514, -0.00151329810738184, -0.00241482286735223, -0.00297431268914223, -0.00305774184454123, -0.00262382633661056, -0.00173694395955673, -0.00055880619302331, 0.000680469894551359, 0.00172692223824715, 0.00235448642019746, 0.0024135216266488, 0.00186584605022828, 0.000798307673502126, -0.000589034681917415, -0.00201900473687007, -0.00319141545969775, -0.00384479513921957, -0.00381321141445627, -0.0030660618879013, -0.00172159887370925, -2.99539791686104e-05, 0.00167240700189277, 0.00302878559218762, 0.00373616021132778, 0.00361181583442192, 0.00263832015075092, 0.000976231195203145, -0.00105990473528908, -0.0030592507083385, -0.00459581375525705, -0.00531729834774812, -0.00502348092626643, -0.00371706431490816, -0.00161476651352461, 0.000885945311642295, 0.00328004033304, 0.00505499597968345, 0.0057983454179806, 0.00529060162763571, 0.00356323820419542, 0.000907500503122831, -0.00217077348202109, -0.00504416868369985, -0.00708805009240636, -0.00781224858030287, -0.00697306094011626, -0.00464096140825597, -0.00120707132194934, 0.00267696227089323, 0.00621761328591274, 0.00863597113409909, 0.00933225151780914, 0.0080248813743666, 0.00483368647305431, 0.000286052604840331, -0.00476081655795057, -0.00927184049479522, -0.0122347911537651, -0.0128727499386951, -0.0108261965016557, -0.00626563109035157, 9.34540982109387e-05, 0.00708427876385812, 0.0132817252156726, 0.0172651317544933, 0.0179059236003787, 0.0146270745486536, 0.00758292782720557, -0.0022807802117803, -0.0133073683944614, -0.0233463983490686, -0.0300788010535358, -0.0313999860725887, -0.0257977950395724, -0.0126596807781968, 0.00754744485614383, 0.0332618517835557, 0.0619866524771139, 0.0906056858286515, 0.115809900648105, 0.134568757261985, 0.144572185496069, 0.144572185496069, 0.134568757261985, 0.115809900648105, 0.0906056858286515, 0.0619866524771139, 0.0332618517835557, 0.00754744485614383, -0.0126596807781968, -0.0257977950395724, -0.0313999860725887, -0.0300788010535358, -0.0233463983490686, -0.0133073683944614, -0.0022807802117803, 0.00758292782720557, 0.0146270745486536, 0.0179059236003787, 0.0172651317544933, 0.0132817252156726, 0.00708427876385812, 9.34540982109387e-05, -0.00626563109035157, -0.0108261965016557, -0.0128727499386951, -0.0122347911537651, -0.00927184049479522, -0.00476081655795057, 0.000286052604840331, 0.00483368647305431, 0.0080248813743666, 0.00933225151780914, 0.00863597113409909, 0.00621761328591274, 0.00267696227089323, -0.00120707132194934, -0.00464096140825597, -0.00697306094011626, -0.00781224858030287, -0.00708805009240636, -0.00504416868369985, -0.00217077348202109, 0.000907500503122831, 0.00356323820419542, 0.00529060162763571, 0.0057983454179806, 0.00505499597968345, 0.00328004033304, 0.000885945311642295, -0.00161476651352461, -0.00371706431490816, -0.00502348092626643, -0.00531729834774812, -0.00459581375525705, -0.0030592507083385, -0.00105990473528908, 0.000976231195203145, 0.00263832015075092, 0.00361181583442192, 0.00373616021132778, 0.00302878559218762, 0.00167240700189277, -2.99539791686104e-05, -0.00172159887370925, -0.0030660618879013, -0.00381321141445627, -0.00384479513921957, -0.00319141545969775, -0.00201900473687007, -0.000589034681917415, 0.000798307673502126, 0.00186584605022828, 0.0024135216266488, 0.00235448642019746, 0.00172692223824715, 0.000680469894551359, -0.00055880619302331, -0.00173694395955673, -0.00262382633661056, -0.00305774184454123, -0.00297431268914223, -0.00241482286735223, -0.00151329810738184, -0.000465913656008514, 0.000510425459873232, 0.00122171922839118, 0.00153406519255844, 0.00139744083865899, 0.000852068513567444, 1.69231954949962e-05, -0.000936561263554281, -0.00181978907649075, -0.00246412620710781, -0.00275270161266408, -0.00264102441019287, -0.00216295844060796, -0.0014216614375339, -0.000567925774867371, 0.000229501137587805, 0.000815769771762063, 0.00107795411801265, 0.000964335446754776, 0.000491907284454057, -0.000258610183417392, -0.0011586403712191, -0.00205509450407059, -0.00279675882169392, -0.00325892197816167, -0.00336208615265324, -0.00308213414919853, -0.00245099152170994, -0.00154826628088787, -0.000486025378335509, 0.000609998444227304, 0.00161945043315728, 0.00244377553929436, 0.0030174905107908, 0.0033130640445196, 0.0033396662482711, 0.00313678282474372, 0.00276412592552764, 0.00229027495413109, 0.00178207013392173, 0.00129595990831674, 0.00087251952697515, 0.000534796618512837, 0.000289000525962142, 0.00014707472109285]
-coefLPF8Hz=[-8.83315095923028e-05, -6.1093715231841e-05, -1.51136154225606e-05, 0.000122554240276897, 0.000391045802631022, 0.00081959016249405, 0.00141573658603828, 0.00215591098954449, 0.00297951561074024, 0.00379102227793234, 0.00447044954323188, 0.00489179328457017, 0.004947480448748, 0.00457313902376801, 0.00376818891546044, 0.00260587191028892, 0.00122945652669551, -0.000167534224806669, -0.00137374974895532, -0.00220027455681234, -0.00251992904672202, -0.00229714377448525, -0.00160027250561149, -0.000592315323147325, 0.000499912887342396, 0.00143247285197007, 0.00199728307313444, 0.00206946940696574, 0.00163756772465107, 0.000808523742895003, -0.000215090699817352, -0.00118146663503332, -0.00184955068379355, -0.00204839517735641, -0.00172134176061009, -0.000943274601942747, 9.44521265352858e-05, 0.00112910141070966, 0.00189144021681222, 0.00217478318811616, 0.00189059301079271, 0.00109571445672143, -1.70256126811701e-05, -0.0011640841934756, -0.00204208986485372, -0.00240700200296141, -0.0021410646543152, -0.00128943280636131, -5.52654272489929e-05, 0.00124729196924078, 0.00227184599199855, 0.00273073582052691, 0.00247468872714604, 0.0015392945373647, 0.000144313202966604, -0.0013563991599251, -0.00256338849473902, -0.00313674494063313, -0.00289051973375327, -0.00185051135084756, -0.000258013080059313, 0.00148428723146087, 0.00291266160326971, 0.00362437367849274, 0.00338960754936483, 0.0022226178183022, 0.000390725417441753, -0.00164455226757218, -0.00334200287752195, -0.00422290065535488, -0.00400398482613498, -0.00268480637156165, -0.000563341975057956, 0.00182827740820074, 0.00385497166108916, 0.00494509616893059, 0.00474901686897298, 0.00324654500936155, 0.000771320523028787, -0.00205922426657309, -0.00449480292270152, -0.00584803927950338, -0.0056847524689607, -0.00395704481450718, -0.00103980440957893, 0.00234502461503028, 0.00530278359276501, 0.00699804994389317, 0.00688519835390717, 0.00487530529164957, 0.00139035883813578, -0.00271708779256149, -0.00636598912682869, -0.00852429322614999, -0.00849233616960041, -0.00611643277159582, -0.00187053088929778, 0.00322526932690923, 0.00783923242556022, 0.0106640897017049, 0.010772644491769, 0.00789969820900753, 0.0025696950458546, -0.00397596827937613, -0.0100489953111515, -0.0139268550566585, -0.0143119013736404, -0.0107211039861847, -0.00369899247600101, 0.00521717245684384, 0.0137940181311397, 0.0196097910825295, 0.0206657603274082, 0.0159594869184953, 0.00587608417543162, -0.00771379335674106, -0.0216989821656182, -0.032288342320333, -0.0357837767719625, -0.0294069088311269, -0.0119984778975711, 0.0155722668555044, 0.0503948688369389, 0.0879260170357764, 0.122752466106984, 0.149563082861908, 0.164135523988594, 0.164135523988594, 0.149563082861908, 0.122752466106984, 0.0879260170357764, 0.0503948688369389, 0.0155722668555044, -0.0119984778975711, -0.0294069088311269, -0.0357837767719625, -0.032288342320333, -0.0216989821656182, -0.00771379335674106, 0.00587608417543162, 0.0159594869184953, 0.0206657603274082, 0.0196097910825295, 0.0137940181311397, 0.00521717245684384, -0.00369899247600101, -0.0107211039861847, -0.0143119013736404, -0.0139268550566585, -0.0100489953111515, -0.00397596827937613, 0.0025696950458546, 0.00789969820900753, 0.010772644491769, 0.0106640897017049, 0.00783923242556022, 0.00322526932690923, -0.00187053088929778, -0.00611643277159582, -0.00849233616960041, -0.00852429322614999, -0.00636598912682869, -0.00271708779256149, 0.00139035883813578, 0.00487530529164957, 0.00688519835390717, 0.00699804994389317, 0.00530278359276501, 0.00234502461503028, -0.00103980440957893, -0.00395704481450718, -0.0056847524689607, -0.00584803927950338, -0.00449480292270152, -0.00205922426657309, 0.000771320523028787, 0.00324654500936155, 0.00474901686897298, 0.00494509616893059, 0.00385497166108916, 0.00182827740820074, -0.000563341975057956, -0.00268480637156165, -0.00400398482613498, -0.00422290065535488, -0.00334200287752195, -0.00164455226757218, 0.000390725417441753, 0.0022226178183022, 0.00338960754936483, 0.00362437367849274, 0.00291266160326971, 0.00148428723146087, -0.000258013080059313, -0.00185051135084756, -0.00289051973375327, -0.00313674494063313, -0.00256338849473902, -0.0013563991599251, 0.000144313202966604, 0.0015392945373647, 0.00247468872714604, 0.00273073582052691, 0.00227184599199855, 0.00124729196924078, -5.52654272489929e-05, -0.00128943280636131, -0.0021410646543152, -0.00240700200296141, -0.00204208986485372, -0.0011640841934756, -1.70256126811701e-05, 0.00109571445672143, 0.00189059301079271, 0.00217478318811616, 0.00189144021681222, 0.00112910141070966, 9.44521265352858e-05, -0.000943274601942747, -0.00172134176061009, -0.00204839517735641, -0.00184955068379355, -0.00118146663503332, -0.000215090699817352, 0.000808523742895003, 0.00163756772465107, 0.00206946940696574, 0.00199728307313444, 0.00143247285197007, 0.000499912887342396, -0.000592315323147325, -0.00160027250561149, -0.00229714377448525, -0.00251992904672202, -0.00220027455681234, -0.00137374974895532, -0.000167534224806669, 0.00122945652669551, 0.00260587191028892, 0.00376818891546044, 0.00457313902376801, 0.004947480448748, 0.00489179328457017, 0.00447044954323188, 0.00379102227793234, 0.00297951561074024, 0.00215591098954449, 0.00141573658603828, 0.00081959016249405, 0.000391045802631022, 0.000122554240276897, -1.51136154225606e-05, -6.1093715231841e-05, -8.83315095923028e-05]
-coefLPF9Hz=[-0.000175237225140108, -0.000392496956047448, -0.000747248518525067, -0.00120572371336688, -0.0017088808809611, -0.00215698210270924, -0.00242238878734991, -0.00237548125034064, -0.00191829997978861, -0.00101919726158092, 0.000262931321809727, 0.00177338777639409, 0.00328081386873734, 0.00452087100682945, 0.00525486239863656, 0.00533068707005012, 0.00472863149798195, 0.00357754501912371, 0.00213348603257048, 0.000723056609220144, -0.00033647265729091, -0.000819399013038672, -0.000653248885399345, 5.91515524746443e-05, 0.00106555590450175, 0.00203402245817704, 0.00264755559741847, 0.00269730097474685, 0.00214616812396201, 0.00114278515940253, -2.08984794906235e-05, -0.000997152031055467, -0.00148999803554981, -0.00134969108264641, -0.000624256698658504, 0.000450292803536785, 0.00151997796398599, 0.00222349874143318, 0.00230901749154754, 0.0017199633998123, 0.000620418175923852, -0.000650468502426948, -0.00168357195957418, -0.00213210709919423, -0.0018290772270471, -0.000850186557891536, 0.000500746981109247, 0.00178301347146364, 0.00255976246756903, 0.00254415913954079, 0.00170213203621985, 0.000275642514935143, -0.00128547762363751, -0.00246445026854188, -0.00284795588708748, -0.00227007963997719, -0.000880430747570583, 0.000890587813426195, 0.00246259570379022, 0.00329334395612468, 0.00306340365213763, 0.0017954094147923, -0.000136008736384012, -0.00211239977719836, -0.00346779329059456, -0.0037112371045059, -0.0027021225625948, -0.000716339580005635, 0.00162468249626106, 0.00354572739517032, 0.00437179420412863, 0.00376219077618764, 0.00184423961813907, -0.000803883524417483, -0.00332400801854316, -0.00485305050821451, -0.00481536923527556, -0.00313424861296639, -0.000286628273152736, 0.00282662918687665, 0.00516149184642108, 0.00587659792506602, 0.00463078902113988, 0.00172907685170514, -0.00194160048617476, -0.00517759259513266, -0.00684752733428957, -0.00628101289911648, -0.00352586993695531, 0.000621513019970761, 0.00483729549457602, 0.00768459048697232, 0.00809381805368423, 0.00575153853807402, 0.00126025800561491, -0.00400028051362937, -0.0082847031437046, -0.0100472908988254, -0.00848219994680138, -0.00385514393567986, 0.00250039234296051, 0.00854723310721255, 0.0121754436865045, 0.0119110973790673, 0.00747291973200902, -2.11358513643204e-05, -0.00829657141038023, -0.0145741869908247, -0.0164541336737583, -0.0127641029139239, -0.00409155824053505, 0.00720419434074057, 0.0175572212114645, 0.0232179751451599, 0.0214606701043842, 0.0116200594706658, -0.0043770861238526, -0.0221972690694334, -0.0360186125886909, -0.0399847902266455, -0.0298273488257638, -0.00421529605111278, 0.0345606856226799, 0.0807998899392229, 0.126495228109021, 0.163082578108766, 0.183406989267482, 0.183406989267482, 0.163082578108766, 0.126495228109021, 0.0807998899392229, 0.0345606856226799, -0.00421529605111278, -0.0298273488257638, -0.0399847902266455, -0.0360186125886909, -0.0221972690694334, -0.0043770861238526, 0.0116200594706658, 0.0214606701043842, 0.0232179751451599, 0.0175572212114645, 0.00720419434074057, -0.00409155824053505, -0.0127641029139239, -0.0164541336737583, -0.0145741869908247, -0.00829657141038023, -2.11358513643204e-05, 0.00747291973200902, 0.0119110973790673, 0.0121754436865045, 0.00854723310721255, 0.00250039234296051, -0.00385514393567986, -0.00848219994680138, -0.0100472908988254, -0.0082847031437046, -0.00400028051362937, 0.00126025800561491, 0.00575153853807402, 0.00809381805368423, 0.00768459048697232, 0.00483729549457602, 0.000621513019970761, -0.00352586993695531, -0.00628101289911648, -0.00684752733428957, -0.00517759259513266, -0.00194160048617476, 0.00172907685170514, 0.00463078902113988, 0.00587659792506602, 0.00516149184642108, 0.00282662918687665, -0.000286628273152736, -0.00313424861296639, -0.00481536923527556, -0.00485305050821451, -0.00332400801854316, -0.000803883524417483, 0.00184423961813907, 0.00376219077618764, 0.00437179420412863, 0.00354572739517032, 0.00162468249626106, -0.000716339580005635, -0.0027021225625948, -0.0037112371045059, -0.00346779329059456, -0.00211239977719836, -0.000136008736384012, 0.0017954094147923, 0.00306340365213763, 0.00329334395612468, 0.00246259570379022, 0.000890587813426195, -0.000880430747570583, -0.00227007963997719, -0.00284795588708748, -0.00246445026854188, -0.00128547762363751, 0.000275642514935143, 0.00170213203621985, 0.00254415913954079, 0.00255976246756903, 0.00178301347146364, 0.000500746981109247, -0.000850186557891536, -0.0018290772270471, -0.00213210709919423, -0.00168357195957418, -0.000650468502426948, 0.000620418175923852, 0.0017199633998123, 0.00230901749154754, 0.00222349874143318, 0.00151997796398599, 0.000450292803536785, -0.000624256698658504, -0.00134969108264641, -0.00148999803554981, -0.000997152031055467, -2.08984794906235e-05, 0.00114278515940253, 0.00214616812396201, 0.00269730097474685, 0.00264755559741847, 0.00203402245817704, 0.00106555590450175, 5.91515524746443e-05, -0.000653248885399345, -0.000819399013038672, -0.00033647265729091, 0.000723056609220144, 0.00213348603257048, 0.00357754501912371, 0.00472863149798195, 0.00533068707005012, 0.00525486239863656, 0.00452087100682945, 0.00328081386873734, 0.00177338777639409, 0.000262931321809727, -0.00101919726158092, -0.00191829997978861, -0.00237548125034064, -0.00242238878734991, -0.00215698210270924, -0.0017088808809611, -0.00120572371336688, -0.000747248518525067, -0.000392496956047448, -0.000175237225140108]
-coefLPF10Hz=[7.35174610057901e-05, -7.40732350626779e-06, -0.000192462209174096, -0.000597034750890031, -0.00127517782968965, -0.00222350781471371, -0.00335448606980411, -0.00449071598407293, -0.00538986991683532, -0.00579883048362633, -0.00552741669021186, -0.0045188640125666, -0.00289337755945848, -0.000943694920580038, 0.000924684801292215, 0.00229708709754949, 0.00286955005904271, 0.00254632507290687, 0.00148072029911792, 3.92129654521742e-05, -0.00130547740933836, -0.00212183008149069, -0.00215981570736067, -0.00143513433197406, -0.000225331550411294, 0.00102524524756548, 0.00186156044565979, 0.00198139008302928, 0.00134693681576594, 0.000201638979432554, -0.00101708550830817, -0.00184009153471559, -0.00194470587455584, -0.00128169116626972, -0.000100324858651385, 0.00114154165728828, 0.0019515263669999, 0.00199583343206623, 0.0012361912489273, -4.54674115451444e-05, -0.00134878988046211, -0.00214772469662587, -0.00210093816707199, -0.00119637525173307, 0.000230955210966163, 0.0016204936889412, 0.00240408005101902, 0.00223638421851251, 0.00114510372638314, -0.000463777818405577, -0.00195452469393015, -0.00271074321772006, -0.00238829655284189, -0.0010689576814862, 0.000752749317734615, 0.00235234238203804, 0.00306134928039987, 0.0025444440883453, 0.000953729387975201, -0.0011093722436423, -0.00281870470098249, -0.00345182500693003, -0.00269264998874615, -0.000782589575534597, 0.00154992844093201, 0.00336416013173605, 0.00388366054336248, 0.00282517296667404, 0.000541770680849322, -0.00208864620014318, -0.00399731624156851, -0.00435547026298107, -0.00292973118166052, -0.000211380196855487, 0.00274636391321839, 0.00473213443623022, 0.00486823373283221, 0.00299249154186962, -0.000233626514057324, -0.00355096327406969, -0.00558871812131746, -0.0054251204464835, -0.00299571086382405, 0.000828368597367584, 0.00454413559648041, 0.00660032934262294, 0.00603700556778575, 0.00292062467797351, -0.00161773469442197, -0.00578200444770263, -0.00781180778857287, -0.0067147520420544, -0.00273033665642646, 0.00268386220110147, 0.00737064536130482, 0.00931765435435364, 0.00750294521745331, 0.0023935549935526, -0.00413366446993167, -0.00945967300906549, -0.0112499863820878, -0.00844696812451072, -0.00181774046278829, 0.00620336856524826, 0.0123728799235773, 0.0139067398967173, 0.00967855451362338, 0.000853333563064597, -0.00935387791383724, -0.0167821161078006, -0.0179330855572554, -0.0114910912863144, 0.000861701201287951, 0.014735816214848, 0.0244428077745158, 0.025104986040647, 0.0147417537942949, -0.00445548322962937, -0.0262241739954742, -0.0418229623170821, -0.0427059674766086, -0.0234526368908814, 0.0160260819000893, 0.0698047857478063, 0.127117827400667, 0.175122831672976, 0.202450031109696, 0.202450031109696, 0.175122831672976, 0.127117827400667, 0.0698047857478063, 0.0160260819000893, -0.0234526368908814, -0.0427059674766086, -0.0418229623170821, -0.0262241739954742, -0.00445548322962937, 0.0147417537942949, 0.025104986040647, 0.0244428077745158, 0.014735816214848, 0.000861701201287951, -0.0114910912863144, -0.0179330855572554, -0.0167821161078006, -0.00935387791383724, 0.000853333563064597, 0.00967855451362338, 0.0139067398967173, 0.0123728799235773, 0.00620336856524826, -0.00181774046278829, -0.00844696812451072, -0.0112499863820878, -0.00945967300906549, -0.00413366446993167, 0.0023935549935526, 0.00750294521745331, 0.00931765435435364, 0.00737064536130482, 0.00268386220110147, -0.00273033665642646, -0.0067147520420544, -0.00781180778857287, -0.00578200444770263, -0.00161773469442197, 0.00292062467797351, 0.00603700556778575, 0.00660032934262294, 0.00454413559648041, 0.000828368597367584, -0.00299571086382405, -0.0054251204464835, -0.00558871812131746, -0.00355096327406969, -0.000233626514057324, 0.00299249154186962, 0.00486823373283221, 0.00473213443623022, 0.00274636391321839, -0.000211380196855487, -0.00292973118166052, -0.00435547026298107, -0.00399731624156851, -0.00208864620014318, 0.000541770680849322, 0.00282517296667404, 0.00388366054336248, 0.00336416013173605, 0.00154992844093201, -0.000782589575534597, -0.00269264998874615, -0.00345182500693003, -0.00281870470098249, -0.0011093722436423, 0.000953729387975201, 0.0025444440883453, 0.00306134928039987, 0.00235234238203804, 0.000752749317734615, -0.0010689576814862, -0.00238829655284189, -0.00271074321772006, -0.00195452469393015, -0.000463777818405577, 0.00114510372638314, 0.00223638421851251, 0.00240408005101902, 0.0016204936889412, 0.000230955210966163, -0.00119637525173307, -0.00210093816707199, -0.00214772469662587, -0.00134878988046211, -4.54674115451444e-05, 0.0012361912489273, 0.00199583343206623, 0.0019515263669999, 0.00114154165728828, -0.000100324858651385, -0.00128169116626972, -0.00194470587455584, -0.00184009153471559, -0.00101708550830817, 0.000201638979432554, 0.00134693681576594, 0.00198139008302928, 0.00186156044565979, 0.00102524524756548, -0.000225331550411294, -0.00143513433197406, -0.00215981570736067, -0.00212183008149069, -0.00130547740933836, 3.92129654521742e-05, 0.00148072029911792, 0.00254632507290687, 0.00286955005904271, 0.00229708709754949, 0.000924684801292215, -0.000943694920580038, -0.00289337755945848, -0.0045188640125666, -0.00552741669021186, -0.00579883048362633, -0.00538986991683532, -0.00449071598407293, -0.00335448606980411, -0.00222350781471371, -0.00127517782968965, -0.000597034750890031, -0.000192462209174096, -7.40732350626779e-06, 7.35174610057901e-05]
-coefLPF11Hz=[0.000208967475256392, 0.00051883684500206, 0.000996676103660154, 0.00154494838556464, 0.00199101927717563, 0.00210484067552565, 0.00166886307228494, 0.000568863482809557, -0.00112685049738425, -0.00313844839493862, -0.00502019401992112, -0.00628119135720244, -0.00654655444758089, -0.00570359959526244, -0.00397096477257852, -0.00185292786858232, 1.75794006777079e-05, 0.00109771896456584, 0.00113318542441579, 0.000255994222415876, -0.00106467098167075, -0.00220734657046241, -0.00264865778506553, -0.00217782367171726, -0.000983634115120603, 0.000427847972571217, 0.00145387643738143, 0.00166127619474748, 0.000981707253228447, -0.000253157300267654, -0.00145719087957561, -0.00205473270557327, -0.00174672116445103, -0.000655359616252063, 0.000723735955420233, 0.0017460678419476, 0.00191952285452827, 0.00114304124161798, -0.000232811731916913, -0.001558671294448, -0.00218788274266703, -0.00178805955978971, -0.00051338347418549, 0.00105116173287077, 0.00215611553531775, 0.00224482046485354, 0.0012324388430271, -0.00043219158795641, -0.00196196138864316, -0.00260062584528441, -0.00199387048325168, -0.000381325681756834, 0.00149285235222878, 0.00272071861234349, 0.00266795416918708, 0.00129854459606423, -0.000778176200055403, -0.00257496525456772, -0.00319311947461679, -0.00226891682689563, -0.00017973736841946, 0.00210386105009088, 0.00346564335907241, 0.00318611348907152, 0.00131775799490166, -0.00130036053668111, -0.00341492358699956, -0.00395463974309768, -0.00256862223389975, 0.00016167683503954, 0.00295912291086795, 0.00444375956542514, 0.0038088873379691, 0.00125135727146636, -0.00206992343015729, -0.00455301206262691, -0.00492004153610807, -0.00286773533273794, 0.000726545127134386, 0.00417054105754704, 0.0057470435854563, 0.00456253102035169, 0.00103874304801265, -0.00321690495879863, -0.00613534723593164, -0.00618261672511572, -0.00315351800728018, 0.00164258769453638, 0.00593390798496271, 0.00755033575067096, 0.00550673148132904, 0.000571284197614492, -0.00499608812170785, -0.00846202054819143, -0.007943469025116, -0.00340437220760171, 0.00319029198000464, 0.00870016452351126, 0.0102797179298479, 0.00681614326253921, -0.000376887126861764, -0.00801048463098127, -0.0122871493900998, -0.0107448758550478, -0.0036036909182633, 0.00609091779237344, 0.0137068982957387, 0.0151684135092538, 0.00904104898027189, -0.00246439461684759, -0.0141698057276293, -0.0201399864954259, -0.0165265273759039, -0.00375042200696042, 0.0130984561219293, 0.0260547314889504, 0.0277026546202188, 0.0148627633393611, -0.00909840927599103, -0.0345372129295542, -0.0485775476876928, -0.0399534656517904, -0.00382238109086302, 0.0554179040714612, 0.124604064061972, 0.185627295762428, 0.221327780247626, 0.221327780247626, 0.185627295762428, 0.124604064061972, 0.0554179040714612, -0.00382238109086302, -0.0399534656517904, -0.0485775476876928, -0.0345372129295542, -0.00909840927599103, 0.0148627633393611, 0.0277026546202188, 0.0260547314889504, 0.0130984561219293, -0.00375042200696042, -0.0165265273759039, -0.0201399864954259, -0.0141698057276293, -0.00246439461684759, 0.00904104898027189, 0.0151684135092538, 0.0137068982957387, 0.00609091779237344, -0.0036036909182633, -0.0107448758550478, -0.0122871493900998, -0.00801048463098127, -0.000376887126861764, 0.00681614326253921, 0.0102797179298479, 0.00870016452351126, 0.00319029198000464, -0.00340437220760171, -0.007943469025116, -0.00846202054819143, -0.00499608812170785, 0.000571284197614492, 0.00550673148132904, 0.00755033575067096, 0.00593390798496271, 0.00164258769453638, -0.00315351800728018, -0.00618261672511572, -0.00613534723593164, -0.00321690495879863, 0.00103874304801265, 0.00456253102035169, 0.0057470435854563, 0.00417054105754704, 0.000726545127134386, -0.00286773533273794, -0.00492004153610807, -0.00455301206262691, -0.00206992343015729, 0.00125135727146636, 0.0038088873379691, 0.00444375956542514, 0.00295912291086795, 0.00016167683503954, -0.00256862223389975, -0.00395463974309768, -0.00341492358699956, -0.00130036053668111, 0.00131775799490166, 0.00318611348907152, 0.00346564335907241, 0.00210386105009088, -0.00017973736841946, -0.00226891682689563, -0.00319311947461679, -0.00257496525456772, -0.000778176200055403, 0.00129854459606423, 0.00266795416918708, 0.00272071861234349, 0.00149285235222878, -0.000381325681756834, -0.00199387048325168, -0.00260062584528441, -0.00196196138864316, -0.00043219158795641, 0.0012324388430271, 0.00224482046485354, 0.00215611553531775, 0.00105116173287077, -0.00051338347418549, -0.00178805955978971, -0.00218788274266703, -0.001558671294448, -0.000232811731916913, 0.00114304124161798, 0.00191952285452827, 0.0017460678419476, 0.000723735955420233, -0.000655359616252063, -0.00174672116445103, -0.00205473270557327, -0.00145719087957561, -0.000253157300267654, 0.000981707253228447, 0.00166127619474748, 0.00145387643738143, 0.000427847972571217, -0.000983634115120603, -0.00217782367171726, -0.00264865778506553, -0.00220734657046241, -0.00106467098167075, 0.000255994222415876, 0.00113318542441579, 0.00109771896456584, 1.75794006777079e-05, -0.00185292786858232, -0.00397096477257852, -0.00570359959526244, -0.00654655444758089, -0.00628119135720244, -0.00502019401992112, -0.00313844839493862, -0.00112685049738425, 0.000568863482809557, 0.00166886307228494, 0.00210484067552565, 0.00199101927717563, 0.00154494838556464, 0.000996676103660154, 0.00051883684500206, 0.000208967475256392]
-coefLPF12Hz=[-5.5092483804547e-05, 0.000109466649148, 0.000517384522348666, 0.00133244455128468, 0.00257787129875938, 0.00410501524673244, 0.00557412378751577, 0.00652438941000661, 0.00652786891217159, 0.00537760543838485, 0.00322701410037641, 0.000603555268885736, -0.0017393921476797, -0.00309231756618859, -0.0030778086794844, -0.00182669188596437, 5.2223346950243e-05, 0.00171546446594369, 0.00244586424366496, 0.00197013105804233, 0.000580058812373229, -0.00100956650844363, -0.00200801096853135, -0.00193640790037624, -0.00086423209711509, 0.000628539707192661, 0.00175070648791734, 0.00191163220962183, 0.00103303099495954, -0.000406078288263222, -0.00162141071776513, -0.00194426225810424, -0.00118787744569357, 0.000241422125202589, 0.00155648207789837, 0.00201740757180146, 0.00134534227137477, -0.000108747119139512, -0.00154267096239605, -0.00214109860993703, -0.00153614918449416, -3.16226155898491e-05, 0.00154515691668303, 0.00229457342582597, 0.0017551827214193, 0.000185124174715906, -0.00155573267486269, -0.00247307778125178, -0.00200292559502628, -0.000354730571046235, 0.00157415840975882, 0.00268341151548258, 0.00229418878435902, 0.000560402265162052, -0.00158024100008453, -0.00290969842797005, -0.00261943575471966, -0.000797863401141772, 0.00157622155651152, 0.00315519166010382, 0.00298386254049636, 0.00107245220098884, -0.0015598067339764, -0.00342310809999432, -0.00339606851508498, -0.00139517241788398, 0.00152213194841509, 0.00371037342196629, 0.00385949574896642, 0.00177321465113432, -0.00145685423112884, -0.00401511889004631, -0.00437700877650017, -0.00221083135855309, 0.00136326878983339, 0.00434332170068591, 0.00495998675755306, 0.00271891665858513, -0.00123854010709947, -0.00470495891613175, -0.00562954309863313, -0.00332145981964606, 0.00106677437789649, 0.00509964798172006, 0.00639967363142833, 0.00403671519386028, -0.000839364173764391, -0.00553771440669262, -0.00729737043047621, -0.00489376506962651, 0.000544982506783843, 0.00603873645524971, 0.00836935693985763, 0.00594427066109493, -0.000157596934124966, -0.00662341110606271, -0.00967883041713224, -0.00726111334826362, -0.00035838768623503, 0.00732732663041682, 0.0113275525105364, 0.00896093637473976, 0.00105791406582852, -0.00821521826897106, -0.0134943416977109, -0.0112504399028178, -0.00203984037067315, 0.00940629155774434, 0.0165159578116672, 0.0145296672536269, 0.00350337127898988, -0.011138828083761, -0.0210974644197094, -0.0196699656220795, -0.00590006401502647, 0.013985225428726, 0.0290207932613851, 0.0290124006723461, 0.0105331857790882, -0.0197375539590137, -0.0464522582990307, -0.0517048218559245, -0.0233336437395566, 0.038388723599294, 0.119030638319244, 0.194471130015776, 0.23995995071264, 0.23995995071264, 0.194471130015776, 0.119030638319244, 0.038388723599294, -0.0233336437395566, -0.0517048218559245, -0.0464522582990307, -0.0197375539590137, 0.0105331857790882, 0.0290124006723461, 0.0290207932613851, 0.013985225428726, -0.00590006401502647, -0.0196699656220795, -0.0210974644197094, -0.011138828083761, 0.00350337127898988, 0.0145296672536269, 0.0165159578116672, 0.00940629155774434, -0.00203984037067315, -0.0112504399028178, -0.0134943416977109, -0.00821521826897106, 0.00105791406582852, 0.00896093637473976, 0.0113275525105364, 0.00732732663041682, -0.00035838768623503, -0.00726111334826362, -0.00967883041713224, -0.00662341110606271, -0.000157596934124966, 0.00594427066109493, 0.00836935693985763, 0.00603873645524971, 0.000544982506783843, -0.00489376506962651, -0.00729737043047621, -0.00553771440669262, -0.000839364173764391, 0.00403671519386028, 0.00639967363142833, 0.00509964798172006, 0.00106677437789649, -0.00332145981964606, -0.00562954309863313, -0.00470495891613175, -0.00123854010709947, 0.00271891665858513, 0.00495998675755306, 0.00434332170068591, 0.00136326878983339, -0.00221083135855309, -0.00437700877650017, -0.00401511889004631, -0.00145685423112884, 0.00177321465113432, 0.00385949574896642, 0.00371037342196629, 0.00152213194841509, -0.00139517241788398, -0.00339606851508498, -0.00342310809999432, -0.0015598067339764, 0.00107245220098884, 0.00298386254049636, 0.00315519166010382, 0.00157622155651152, -0.000797863401141772, -0.00261943575471966, -0.00290969842797005, -0.00158024100008453, 0.000560402265162052, 0.00229418878435902, 0.00268341151548258, 0.00157415840975882, -0.000354730571046235, -0.00200292559502628, -0.00247307778125178, -0.00155573267486269, 0.000185124174715906, 0.0017551827214193, 0.00229457342582597, 0.00154515691668303, -3.16226155898491e-05, -0.00153614918449416, -0.00214109860993703, -0.00154267096239605, -0.000108747119139512, 0.00134534227137477, 0.00201740757180146, 0.00155648207789837, 0.000241422125202589, -0.00118787744569357, -0.00194426225810424, -0.00162141071776513, -0.000406078288263222, 0.00103303099495954, 0.00191163220962183, 0.00175070648791734, 0.000628539707192661, -0.00086423209711509, -0.00193640790037624, -0.00200801096853135, -0.00100956650844363, 0.000580058812373229, 0.00197013105804233, 0.00244586424366496, 0.00171546446594369, 5.2223346950243e-05, -0.00182669188596437, -0.0030778086794844, -0.00309231756618859, -0.0017393921476797, 0.000603555268885736, 0.00322701410037641, 0.00537760543838485, 0.00652786891217159, 0.00652438941000661, 0.00557412378751577, 0.00410501524673244, 0.00257787129875938, 0.00133244455128468, 0.000517384522348666, 0.000109466649148, -5.5092483804547e-05]
-coefLPF13Hz=[-0.000251703033549117, -0.00068046507640924, -0.00129972510953771, -0.00188193318741952, -0.0020630365513304, -0.00146279410971114, 0.000111461902367001, 0.00248334232521038, 0.00506412638385878, 0.00701589157668882, 0.00758744475153425, 0.00647980319371311, 0.00405067483398878, 0.00121979290445413, -0.000917475999059592, -0.00159946342516979, -0.000770552366387279, 0.000892717295345892, 0.00233812266912243, 0.00270045246601157, 0.00176626767110878, 7.78595930686011e-05, -0.00139226224671689, -0.00181504329025775, -0.000995167649252715, 0.000514879881743852, 0.00175170181084906, 0.00193106187638058, 0.000933295930981668, -0.000618238722090436, -0.0017433171364549, -0.00172257433960474, -0.000560998215349713, 0.00100143973750192, 0.00195128605025189, 0.00165161901424474, 0.000266121867052551, -0.0013252040988231, -0.00208054840364666, -0.00147530018104326, 0.000134685154110595, 0.00171639722763767, 0.00221735436371736, 0.0012619367438282, -0.000572326608053695, -0.00209915368867784, -0.00228695452883517, -0.000952554900445023, 0.00107922667522766, 0.00248069168972416, 0.0022849047432815, 0.000548653724036436, -0.00163735291908868, -0.00282929560791491, -0.00218007341357195, -3.58176048795587e-05, 0.00223762202263058, 0.00312018585937731, 0.00194973577933669, -0.00059039701619506, -0.00286214443056881, -0.00332435721622854, -0.00157338294626584, 0.00132688798881727, 0.00348410268327797, 0.00340688708890564, 0.00102938035786129, -0.00216882599699863, -0.00407633550490181, -0.00333779648618019, -0.000307658008291279, 0.00309559461009917, 0.00459663089935401, 0.00307729412247719, -0.000605205847416637, -0.00408583141252546, -0.00500207457593571, -0.00258824188880104, 0.001716141821749, 0.00511054099396364, 0.00524506643664031, 0.00183436043823904, -0.00302644226180317, -0.00613410027621685, -0.00527513358526874, -0.000783682550649046, 0.00452529142405876, 0.00710350778934681, 0.00502368865359475, -0.000610157813150008, -0.0062100384940735, -0.00796783904990682, -0.0044209913788536, 0.00239290037380604, 0.00806998540030867, 0.00865712001055654, 0.00336847421287149, -0.00464172418244778, -0.0101175868778348, -0.00910741501363979, -0.00175687942489104, 0.00744765568027061, 0.0123593083146818, 0.00920925432259881, -0.000607710918699413, -0.0109945642539637, -0.0148481634399123, -0.00880320791524411, 0.0040729051871125, 0.0156604989999901, 0.0177472512693202, 0.00762881752383683, -0.00933377118011614, -0.0222788673112706, -0.0214666963632066, -0.00509760987947724, 0.0181487336797285, 0.0331376794569735, 0.0272553715545687, -0.000609849507872811, -0.0366741427848606, -0.057351665595906, -0.041016683083174, 0.0194844549977805, 0.110514264387226, 0.201597643695351, 0.2583791121664, 0.2583791121664, 0.201597643695351, 0.110514264387226, 0.0194844549977805, -0.041016683083174, -0.057351665595906, -0.0366741427848606, -0.000609849507872811, 0.0272553715545687, 0.0331376794569735, 0.0181487336797285, -0.00509760987947724, -0.0214666963632066, -0.0222788673112706, -0.00933377118011614, 0.00762881752383683, 0.0177472512693202, 0.0156604989999901, 0.0040729051871125, -0.00880320791524411, -0.0148481634399123, -0.0109945642539637, -0.000607710918699413, 0.00920925432259881, 0.0123593083146818, 0.00744765568027061, -0.00175687942489104, -0.00910741501363979, -0.0101175868778348, -0.00464172418244778, 0.00336847421287149, 0.00865712001055654, 0.00806998540030867, 0.00239290037380604, -0.0044209913788536, -0.00796783904990682, -0.0062100384940735, -0.000610157813150008, 0.00502368865359475, 0.00710350778934681, 0.00452529142405876, -0.000783682550649046, -0.00527513358526874, -0.00613410027621685, -0.00302644226180317, 0.00183436043823904, 0.00524506643664031, 0.00511054099396364, 0.001716141821749, -0.00258824188880104, -0.00500207457593571, -0.00408583141252546, -0.000605205847416637, 0.00307729412247719, 0.00459663089935401, 0.00309559461009917, -0.000307658008291279, -0.00333779648618019, -0.00407633550490181, -0.00216882599699863, 0.00102938035786129, 0.00340688708890564, 0.00348410268327797, 0.00132688798881727, -0.00157338294626584, -0.00332435721622854, -0.00286214443056881, -0.00059039701619506, 0.00194973577933669, 0.00312018585937731, 0.00223762202263058, -3.58176048795587e-05, -0.00218007341357195, -0.00282929560791491, -0.00163735291908868, 0.000548653724036436, 0.0022849047432815, 0.00248069168972416, 0.00107922667522766, -0.000952554900445023, -0.00228695452883517, -0.00209915368867784, -0.000572326608053695, 0.0012619367438282, 0.00221735436371736, 0.00171639722763767, 0.000134685154110595, -0.00147530018104326, -0.00208054840364666, -0.0013252040988231, 0.000266121867052551, 0.00165161901424474, 0.00195128605025189, 0.00100143973750192, -0.000560998215349713, -0.00172257433960474, -0.0017433171364549, -0.000618238722090436, 0.000933295930981668, 0.00193106187638058, 0.00175170181084906, 0.000514879881743852, -0.000995167649252715, -0.00181504329025775, -0.00139226224671689, 7.78595930686011e-05, 0.00176626767110878, 0.00270045246601157, 0.00233812266912243, 0.000892717295345892, -0.000770552366387279, -0.00159946342516979, -0.000917475999059592, 0.00121979290445413, 0.00405067483398878, 0.00647980319371311, 0.00758744475153425, 0.00701589157668882, 0.00506412638385878, 0.00248334232521038, 0.000111461902367001, -0.00146279410971114, -0.0020630365513304, -0.00188193318741952, -0.00129972510953771, -0.00068046507640924, -0.000251703033549117]
-coefLPF14Hz=[3.49156336905698e-05, -0.000244074601503269, -0.000969289110948429, -0.00233847017326971, -0.00423836410648016, -0.00618592061511383, -0.00742037680277765, -0.00722071909188742, -0.00531820142269757, -0.00216862311817243, 0.00112634437622398, 0.00328538503381051, 0.00349440954666139, 0.00187383921405003, -0.000540941735189238, -0.00234676632483463, -0.00256135839434226, -0.00118633997527528, 0.000815943130104859, 0.00213903295692865, 0.00196637321328115, 0.000487429257557461, -0.00124717835309369, -0.00204418249002602, -0.00138059124923713, 0.000243081025802315, 0.00165913667327602, 0.00185761313572471, 0.000704816727703094, -0.00095760819519058, -0.00191417636271389, -0.00145654036980015, 9.08746550660084e-05, 0.00159251478749514, 0.00192612049558302, 0.00081701498714153, -0.000935827449154867, -0.00202872825580342, -0.00161729349574113, 3.342326286127e-05, 0.00171225084551074, 0.0021448353237242, 0.000957093245161798, -0.0010068219045324, -0.00227852913480848, -0.00185837450036233, 3.00981468837145e-06, 0.00194262830231564, 0.00247813665803424, 0.00113610906489763, -0.0011398176997062, -0.00264653896619758, -0.0021912869538816, -3.05827365043306e-05, 0.00225729525835678, 0.00292003057863602, 0.00136879175308383, -0.0013120318200787, -0.00311532335609441, -0.00260875789328024, -6.5785698824855e-05, 0.00265798798528281, 0.00347252184978999, 0.0016509671480072, -0.00153939435282645, -0.00370954587471643, -0.0031312431937336, -0.000104718838960799, 0.00316473600137513, 0.00416573555927389, 0.00200225346688707, -0.00182698426856315, -0.00445441451917593, -0.0037826586203839, -0.000147287145978207, 0.00380635426121184, 0.00503741577425914, 0.00243767535883189, -0.00220079901874798, -0.00540413458755694, -0.00460608705418054, -0.000187546731509961, 0.00464288879236202, 0.00616323251989292, 0.00298991488509503, -0.00270610325112404, -0.00666008975354862, -0.00568775970390257, -0.000224275749871568, 0.00577772102843727, 0.00768346927857969, 0.00372884737711019, -0.00341310457969768, -0.00840058047629658, -0.00718644052645624, -0.000259597739472824, 0.00740028243116171, 0.00986018080180712, 0.00478128118297007, -0.00447344490718066, -0.0109975525279526, -0.00943324427779705, -0.000287460916689642, 0.00994328112821555, 0.0133017045793113, 0.0064553962417829, -0.00623924149681179, -0.0153625451595438, -0.0132756693574894, -0.000311401230528875, 0.0145568840557704, 0.0197047784382608, 0.00965131293161596, -0.00978989405737567, -0.024440800229368, -0.0216122144132225, -0.000328133073603543, 0.0257985203285118, 0.0363680192317427, 0.0186291743720031, -0.0208741257030332, -0.0562090795812469, -0.0554192195140851, -0.000334103106857688, 0.0992861235648025, 0.206922179749811, 0.276514748819692, 0.276514748819692, 0.206922179749811, 0.0992861235648025, -0.000334103106857688, -0.0554192195140851, -0.0562090795812469, -0.0208741257030332, 0.0186291743720031, 0.0363680192317427, 0.0257985203285118, -0.000328133073603543, -0.0216122144132225, -0.024440800229368, -0.00978989405737567, 0.00965131293161596, 0.0197047784382608, 0.0145568840557704, -0.000311401230528875, -0.0132756693574894, -0.0153625451595438, -0.00623924149681179, 0.0064553962417829, 0.0133017045793113, 0.00994328112821555, -0.000287460916689642, -0.00943324427779705, -0.0109975525279526, -0.00447344490718066, 0.00478128118297007, 0.00986018080180712, 0.00740028243116171, -0.000259597739472824, -0.00718644052645624, -0.00840058047629658, -0.00341310457969768, 0.00372884737711019, 0.00768346927857969, 0.00577772102843727, -0.000224275749871568, -0.00568775970390257, -0.00666008975354862, -0.00270610325112404, 0.00298991488509503, 0.00616323251989292, 0.00464288879236202, -0.000187546731509961, -0.00460608705418054, -0.00540413458755694, -0.00220079901874798, 0.00243767535883189, 0.00503741577425914, 0.00380635426121184, -0.000147287145978207, -0.0037826586203839, -0.00445441451917593, -0.00182698426856315, 0.00200225346688707, 0.00416573555927389, 0.00316473600137513, -0.000104718838960799, -0.0031312431937336, -0.00370954587471643, -0.00153939435282645, 0.0016509671480072, 0.00347252184978999, 0.00265798798528281, -6.5785698824855e-05, -0.00260875789328024, -0.00311532335609441, -0.0013120318200787, 0.00136879175308383, 0.00292003057863602, 0.00225729525835678, -3.05827365043306e-05, -0.0021912869538816, -0.00264653896619758, -0.0011398176997062, 0.00113610906489763, 0.00247813665803424, 0.00194262830231564, 3.00981468837145e-06, -0.00185837450036233, -0.00227852913480848, -0.0010068219045324, 0.000957093245161798, 0.0021448353237242, 0.00171225084551074, 3.342326286127e-05, -0.00161729349574113, -0.00202872825580342, -0.000935827449154867, 0.00081701498714153, 0.00192612049558302, 0.00159251478749514, 9.08746550660084e-05, -0.00145654036980015, -0.00191417636271389, -0.00095760819519058, 0.000704816727703094, 0.00185761313572471, 0.00165913667327602, 0.000243081025802315, -0.00138059124923713, -0.00204418249002602, -0.00124717835309369, 0.000487429257557461, 0.00196637321328115, 0.00213903295692865, 0.000815943130104859, -0.00118633997527528, -0.00256135839434226, -0.00234676632483463, -0.000540941735189238, 0.00187383921405003, 0.00349440954666139, 0.00328538503381051, 0.00112634437622398, -0.00216862311817243, -0.00531820142269757, -0.00722071909188742, -0.00742037680277765, -0.00618592061511383, -0.00423836410648016, -0.00233847017326971, -0.000969289110948429, -0.000244074601503269, 3.49156336905698e-05]
-coefLPF15Hz=[0.00030929742164439, 0.000901063430095245, 0.00169792285773244, 0.00224493391981393, 0.00190235738944891, 0.000201605575053821, -0.00273102461979602, -0.00599848460217067, -0.00823154134171069, -0.00829790212817625, -0.00603007201172283, -0.00246961969673972, 0.000629994527354542, 0.0018125288336557, 0.000811979140414226, -0.00129201785879897, -0.00281084242880241, -0.00260267428850629, -0.000842049785179851, 0.00115663650330607, 0.00194389498904601, 0.00102687384980513, -0.000775141967158387, -0.00198642148280152, -0.00163775073978249, -2.59171422031428e-05, 0.0015342927521692, 0.00177700756677483, 0.000517011808130249, -0.00119306759468499, -0.00192238888143928, -0.00104684076935423, 0.000717965080229201, 0.00189427249766546, 0.00147284260397246, -0.000221469691103757, -0.00177131653589576, -0.00184370397653251, -0.000331286922926144, 0.00151610548836032, 0.00211764857292554, 0.000909047443551661, -0.00113350525760775, -0.00227540565723419, -0.00149128310588145, 0.000619166984678314, 0.00228151110385426, 0.002033286088222, 5.97330143598212e-06, -0.00211764988730275, -0.00249425134816991, -0.000714737841054873, 0.00177250862433007, 0.00283363167507589, 0.00147412100790504, -0.00123943413269549, -0.00300743697702595, -0.00224064443111693, 0.000518546008068617, 0.00296200394154743, 0.00294056085141898, 0.000347966256396847, -0.00268169099734953, -0.00352240180286753, -0.00132508882969928, 0.00214737572713607, 0.00392390577931112, 0.00235935854663633, -0.00135563643598375, -0.00408415859381364, -0.00338304184189756, 0.000320774624229692, 0.00394680773515095, 0.00431244972065695, 0.000915231174097564, -0.00347690952425241, -0.00506707595933043, -0.00229943007284968, 0.00264807128149484, 0.00555800166738465, 0.00375462122076792, -0.00145698965378561, -0.00569951825295096, -0.00518237567907886, -6.72912099125354e-05, 0.0054300664830461, 0.00649253167426441, 0.00189915465364016, -0.00466997368420412, -0.00755271508744266, -0.00395801476576748, 0.00338322625666598, 0.00824648416061817, 0.00615666234857538, -0.00154165156017056, -0.00844919235872174, -0.00838691458209805, -0.000869758975908254, 0.00802416986142438, 0.0105073314269237, 0.00383367548981606, -0.00684819965340918, -0.0123763613884546, -0.00734223214075875, 0.0047655510039786, 0.0138136239354557, 0.0113756069985658, -0.00159644842996565, -0.0146178509171373, -0.0159526203067641, -0.00293862703759954, 0.0145185216326441, 0.0211711049444879, 0.00934154696312893, -0.0130934611266839, -0.0273339576620662, -0.0186836044987546, 0.00952578220679664, 0.03535508306299, 0.0338239512234785, -0.0016240374251662, -0.0484189261071268, -0.0654381024069117, -0.0201613491295848, 0.0855997137546896, 0.210419541042782, 0.294405208497231, 0.294405208497231, 0.210419541042782, 0.0855997137546896, -0.0201613491295848, -0.0654381024069117, -0.0484189261071268, -0.0016240374251662, 0.0338239512234785, 0.03535508306299, 0.00952578220679664, -0.0186836044987546, -0.0273339576620662, -0.0130934611266839, 0.00934154696312893, 0.0211711049444879, 0.0145185216326441, -0.00293862703759954, -0.0159526203067641, -0.0146178509171373, -0.00159644842996565, 0.0113756069985658, 0.0138136239354557, 0.0047655510039786, -0.00734223214075875, -0.0123763613884546, -0.00684819965340918, 0.00383367548981606, 0.0105073314269237, 0.00802416986142438, -0.000869758975908254, -0.00838691458209805, -0.00844919235872174, -0.00154165156017056, 0.00615666234857538, 0.00824648416061817, 0.00338322625666598, -0.00395801476576748, -0.00755271508744266, -0.00466997368420412, 0.00189915465364016, 0.00649253167426441, 0.0054300664830461, -6.72912099125354e-05, -0.00518237567907886, -0.00569951825295096, -0.00145698965378561, 0.00375462122076792, 0.00555800166738465, 0.00264807128149484, -0.00229943007284968, -0.00506707595933043, -0.00347690952425241, 0.000915231174097564, 0.00431244972065695, 0.00394680773515095, 0.000320774624229692, -0.00338304184189756, -0.00408415859381364, -0.00135563643598375, 0.00235935854663633, 0.00392390577931112, 0.00214737572713607, -0.00132508882969928, -0.00352240180286753, -0.00268169099734953, 0.000347966256396847, 0.00294056085141898, 0.00296200394154743, 0.000518546008068617, -0.00224064443111693, -0.00300743697702595, -0.00123943413269549, 0.00147412100790504, 0.00283363167507589, 0.00177250862433007, -0.000714737841054873, -0.00249425134816991, -0.00211764988730275, 5.97330143598212e-06, 0.002033286088222, 0.00228151110385426, 0.000619166984678314, -0.00149128310588145, -0.00227540565723419, -0.00113350525760775, 0.000909047443551661, 0.00211764857292554, 0.00151610548836032, -0.000331286922926144, -0.00184370397653251, -0.00177131653589576, -0.000221469691103757, 0.00147284260397246, 0.00189427249766546, 0.000717965080229201, -0.00104684076935423, -0.00192238888143928, -0.00119306759468499, 0.000517011808130249, 0.00177700756677483, 0.0015342927521692, -2.59171422031428e-05, -0.00163775073978249, -0.00198642148280152, -0.000775141967158387, 0.00102687384980513, 0.00194389498904601, 0.00115663650330607, -0.000842049785179851, -0.00260267428850629, -0.00281084242880241, -0.00129201785879897, 0.000811979140414226, 0.0018125288336557, 0.000629994527354542, -0.00246961969673972, -0.00603007201172283, -0.00829790212817625, -0.00823154134171069, -0.00599848460217067, -0.00273102461979602, 0.000201605575053821, 0.00190235738944891, 0.00224493391981393, 0.00169792285773244, 0.000901063430095245, 0.00030929742164439]
-coefLPF16Hz=[-1.59387207767994e-05, 0.000406975479637599, 0.00154909818577793, 0.00359744580472452, 0.00612307022585303, 0.0080712191822304, 0.00821149482125075, 0.00594459480811909, 0.00192783084331401, -0.00204546657002646, -0.00402268879941613, -0.00316022570972014, -0.000366148929084925, 0.00225927398560178, 0.00288357714485116, 0.00125130325351664, -0.00118083667041781, -0.00242982132684771, -0.00157477745577351, 0.000536431240227857, 0.00204930893679246, 0.0016967386407872, -0.000131580560952899, -0.00176628057487835, -0.00175267704268274, -0.000143406591973717, 0.00156471435529709, 0.0017994288063954, 0.000353360751117061, -0.0014219413918487, -0.00186246777842608, -0.000543440622564203, 0.00130607749722117, 0.00193659084923252, 0.000725856624690954, -0.00120506778714475, -0.00201951819804646, -0.000904203759750209, 0.00112065416474783, 0.00212599262904616, 0.00110377805244161, -0.00102715609257145, -0.00223980415742036, -0.00132106127379417, 0.000919243366210293, 0.00235311617682792, 0.00154892245997752, -0.000805397485130621, -0.00248021211663215, -0.0018096141052191, 0.000657660872324477, 0.00259236842228604, 0.00207746827274599, -0.000498490810458111, -0.00271139352311076, -0.00237543863648208, 0.000305290921100258, 0.0028188703596672, 0.0026918267621868, -8.45429861872885e-05, -0.00292076138560562, -0.00303614516942871, -0.000176840515660097, 0.00300437626797224, 0.00340046409896265, 0.000476516837390372, -0.00306959466602095, -0.00378580302849585, -0.000817044953061344, 0.00311530989058836, 0.0041954856773996, 0.00120549616874125, -0.00313508686312143, -0.00462765836544109, -0.00164382663935581, 0.00312824827727773, 0.00508711478744753, 0.00214064261860709, -0.00308928823721954, -0.00557733525782005, -0.00270709224577018, 0.0030074553867075, 0.0060952855485248, 0.00334693955447342, -0.00288088776133456, -0.00664848794396257, -0.00407436536497862, 0.00270067072472391, 0.00724275417173242, 0.00490566329471272, -0.00245618272437092, -0.00788573927652677, -0.00586093126006906, 0.0021368436941608, 0.00859357824410466, 0.00697487454879987, -0.00172009612284279, -0.00938036969900288, -0.00828733951850904, 0.00118371906628547, 0.0102769537748542, 0.00986696816994661, -0.000484807752640357, -0.011319708137425, -0.0118076605522977, -0.000430860374192319, 0.0125793339166119, 0.0142729294893403, 0.0016620372597296, -0.0141682233238374, -0.0175402243272549, -0.00338020886070168, 0.0162937561168852, 0.0221323989559297, 0.00591574191292345, -0.0193898189959872, -0.0291823025545049, -0.0100284140497178, 0.0244926471761243, 0.041626601585516, 0.0178716139857633, -0.0349098204038507, -0.0702436780896217, -0.0389892486863966, 0.0698236849364551, 0.212042328509117, 0.311977603064387, 0.311977603064387, 0.212042328509117, 0.0698236849364551, -0.0389892486863966, -0.0702436780896217, -0.0349098204038507, 0.0178716139857633, 0.041626601585516, 0.0244926471761243, -0.0100284140497178, -0.0291823025545049, -0.0193898189959872, 0.00591574191292345, 0.0221323989559297, 0.0162937561168852, -0.00338020886070168, -0.0175402243272549, -0.0141682233238374, 0.0016620372597296, 0.0142729294893403, 0.0125793339166119, -0.000430860374192319, -0.0118076605522977, -0.011319708137425, -0.000484807752640357, 0.00986696816994661, 0.0102769537748542, 0.00118371906628547, -0.00828733951850904, -0.00938036969900288, -0.00172009612284279, 0.00697487454879987, 0.00859357824410466, 0.0021368436941608, -0.00586093126006906, -0.00788573927652677, -0.00245618272437092, 0.00490566329471272, 0.00724275417173242, 0.00270067072472391, -0.00407436536497862, -0.00664848794396257, -0.00288088776133456, 0.00334693955447342, 0.0060952855485248, 0.0030074553867075, -0.00270709224577018, -0.00557733525782005, -0.00308928823721954, 0.00214064261860709, 0.00508711478744753, 0.00312824827727773, -0.00164382663935581, -0.00462765836544109, -0.00313508686312143, 0.00120549616874125, 0.0041954856773996, 0.00311530989058836, -0.000817044953061344, -0.00378580302849585, -0.00306959466602095, 0.000476516837390372, 0.00340046409896265, 0.00300437626797224, -0.000176840515660097, -0.00303614516942871, -0.00292076138560562, -8.45429861872885e-05, 0.0026918267621868, 0.0028188703596672, 0.000305290921100258, -0.00237543863648208, -0.00271139352311076, -0.000498490810458111, 0.00207746827274599, 0.00259236842228604, 0.000657660872324477, -0.0018096141052191, -0.00248021211663215, -0.000805397485130621, 0.00154892245997752, 0.00235311617682792, 0.000919243366210293, -0.00132106127379417, -0.00223980415742036, -0.00102715609257145, 0.00110377805244161, 0.00212599262904616, 0.00112065416474783, -0.000904203759750209, -0.00201951819804646, -0.00120506778714475, 0.000725856624690954, 0.00193659084923252, 0.00130607749722117, -0.000543440622564203, -0.00186246777842608, -0.0014219413918487, 0.000353360751117061, 0.0017994288063954, 0.00156471435529709, -0.000143406591973717, -0.00175267704268274, -0.00176628057487835, -0.000131580560952899, 0.0016967386407872, 0.00204930893679246, 0.000536431240227857, -0.00157477745577351, -0.00242982132684771, -0.00118083667041781, 0.00125130325351664, 0.00288357714485116, 0.00225927398560178, -0.000366148929084925, -0.00316022570972014, -0.00402268879941613, -0.00204546657002646, 0.00192783084331401, 0.00594459480811909, 0.00821149482125075, 0.0080712191822304, 0.00612307022585303, 0.00359744580472452, 0.00154909818577793, 0.000406975479637599, -1.59387207767994e-05]
-coefLPF17Hz=[-0.000390692754451534, -0.00122062607897685, -0.00226987940617898, -0.00271599443755925, -0.00156145174204448, 0.00156027953107814, 0.00572284778147966, 0.00890605236143833, 0.00920362122219944, 0.00627922186897769, 0.00186585051723474, -0.00131165772026794, -0.00151992084352578, 0.000669027883594032, 0.00290211681118306, 0.00305194557520465, 0.0010055020307292, -0.00134808350082893, -0.00192351865724605, -0.000377538868823674, 0.00162851346732022, 0.00207690230507346, 0.000554947981032185, -0.00138133209914637, -0.00179244719641753, -0.000308929186790145, 0.00150844699405451, 0.00177156844241007, 0.000206588822606462, -0.00155794421386861, -0.00167451796993068, -8.44335790420347e-06, 0.00169598417745289, 0.00162549256705355, -0.000181641779097344, -0.00183386621573778, -0.00155693772754497, 0.000404843254095546, 0.0019898757116218, 0.00147584310623791, -0.0006546480084295, -0.00215537568273716, -0.0013764898149502, 0.000928109655295198, 0.00232023490614966, 0.00124988838585808, -0.00122560110650666, -0.00247618225139426, -0.00108674632079228, 0.0015498095599312, 0.00261925373447421, 0.00088300735112446, -0.00189896661800365, -0.00274318469206925, -0.000635894469853173, 0.00226600254770606, 0.00283278149974768, 0.000329572472879243, -0.00266193083568922, -0.00289644193303644, 2.28413709622721e-05, 0.00306533318355187, 0.00290974671084368, -0.000439328819656524, -0.00348331603553678, -0.00287396710758758, 0.000914927071988569, 0.00390344224697457, 0.00277551294723659, -0.0014544976927, -0.00431901719923509, -0.00260386504139879, 0.00206115493197463, 0.00472197718256305, 0.0023473611114259, -0.00273945176115089, -0.00510753879393274, -0.0020007934817169, 0.00348385627213123, 0.00545783240517537, 0.00154455540865694, -0.00430266218132457, -0.00576729697944407, -0.000970156461162669, 0.0051938965344861, 0.0060217059801374, 0.000264013414714721, -0.00615425983088721, -0.00619731457050038, 0.000603862418993503, 0.00720026095887994, 0.00629085317875942, -0.0016416592083212, -0.00832158652444432, -0.00626460991922605, 0.002896777975502, 0.00954358991004974, 0.00610568800836428, -0.00440076167529759, -0.0108734954793875, -0.00577105493211826, 0.00622303061188925, 0.0123449425060115, 0.00521486753034883, -0.00845898067325666, -0.0140074782703005, -0.00436492846031695, 0.0112639978234849, 0.0159456286859286, 0.0030983585798481, -0.0149165289316133, -0.0183266632205926, -0.00120779343359751, 0.019930818773172, 0.0214689646245974, -0.00174726642433676, -0.0274384223161495, -0.0261296941428945, 0.00679836367973164, 0.04036291122293, 0.0344486619853392, -0.017258439092505, -0.0694792653378804, -0.0559655913528121, 0.0523070500259523, 0.211787420913279, 0.329270206565317, 0.329270206565317, 0.211787420913279, 0.0523070500259523, -0.0559655913528121, -0.0694792653378804, -0.017258439092505, 0.0344486619853392, 0.04036291122293, 0.00679836367973164, -0.0261296941428945, -0.0274384223161495, -0.00174726642433676, 0.0214689646245974, 0.019930818773172, -0.00120779343359751, -0.0183266632205926, -0.0149165289316133, 0.0030983585798481, 0.0159456286859286, 0.0112639978234849, -0.00436492846031695, -0.0140074782703005, -0.00845898067325666, 0.00521486753034883, 0.0123449425060115, 0.00622303061188925, -0.00577105493211826, -0.0108734954793875, -0.00440076167529759, 0.00610568800836428, 0.00954358991004974, 0.002896777975502, -0.00626460991922605, -0.00832158652444432, -0.0016416592083212, 0.00629085317875942, 0.00720026095887994, 0.000603862418993503, -0.00619731457050038, -0.00615425983088721, 0.000264013414714721, 0.0060217059801374, 0.0051938965344861, -0.000970156461162669, -0.00576729697944407, -0.00430266218132457, 0.00154455540865694, 0.00545783240517537, 0.00348385627213123, -0.0020007934817169, -0.00510753879393274, -0.00273945176115089, 0.0023473611114259, 0.00472197718256305, 0.00206115493197463, -0.00260386504139879, -0.00431901719923509, -0.0014544976927, 0.00277551294723659, 0.00390344224697457, 0.000914927071988569, -0.00287396710758758, -0.00348331603553678, -0.000439328819656524, 0.00290974671084368, 0.00306533318355187, 2.28413709622721e-05, -0.00289644193303644, -0.00266193083568922, 0.000329572472879243, 0.00283278149974768, 0.00226600254770606, -0.000635894469853173, -0.00274318469206925, -0.00189896661800365, 0.00088300735112446, 0.00261925373447421, 0.0015498095599312, -0.00108674632079228, -0.00247618225139426, -0.00122560110650666, 0.00124988838585808, 0.00232023490614966, 0.000928109655295198, -0.0013764898149502, -0.00215537568273716, -0.0006546480084295, 0.00147584310623791, 0.0019898757116218, 0.000404843254095546, -0.00155693772754497, -0.00183386621573778, -0.000181641779097344, 0.00162549256705355, 0.00169598417745289, -8.44335790420347e-06, -0.00167451796993068, -0.00155794421386861, 0.000206588822606462, 0.00177156844241007, 0.00150844699405451, -0.000308929186790145, -0.00179244719641753, -0.00138133209914637, 0.000554947981032185, 0.00207690230507346, 0.00162851346732022, -0.000377538868823674, -0.00192351865724605, -0.00134808350082893, 0.0010055020307292, 0.00305194557520465, 0.00290211681118306, 0.000669027883594032, -0.00151992084352578, -0.00131165772026794, 0.00186585051723474, 0.00627922186897769, 0.00920362122219944, 0.00890605236143833, 0.00572284778147966, 0.00156027953107814, -0.00156145174204448, -0.00271599443755925, -0.00226987940617898, -0.00122062607897685, -0.000390692754451534]
-coefLPF18Hz=[-2.17901965333983e-09, -0.000595408391599509, -0.00225670900632582, -0.00507465595092478, -0.00804605244835613, -0.00933200204555097, -0.0074779989309993, -0.00284276255503529, 0.00213541365637991, 0.00447561164046822, 0.00299028540794681, -0.000615938766272879, -0.00309279971465505, -0.00243621521825698, 0.000393823598357235, 0.00250480511232836, 0.0019176871603923, -0.000549929869625071, -0.0022393309507396, -0.00144870924454635, 0.000837391750375686, 0.00208779986075835, 0.000988117663836819, -0.00116486788484463, -0.00194537124602361, -0.000509546325140551, 0.00147956517834421, 0.00174899691031755, 1.9866866995806e-06, -0.00174175506138366, -0.00146057873364546, 0.000530280107066412, 0.00191825496459596, 0.00106359635984852, -0.00106644520927567, -0.0019798412381234, -0.00056294187125749, 0.00156542361784541, 0.00189359992551836, -2.71037309567218e-05, -0.00198004820320899, -0.00163258213676761, 0.000683620843369453, 0.002268312468288, 0.0011915957073178, -0.0013627313436517, -0.00238753887023181, -0.00058435320971297, 0.00200233903853746, 0.00229448937121785, -0.000163466770396368, -0.00253599271032107, -0.00195836706197549, 0.00101256264426991, 0.00290605050602171, 0.00138265522230981, -0.00188748878370986, -0.0030422492138305, -0.000581203121066439, 0.0027036934997307, 0.00288385524734305, -0.000416589882114724, -0.00338439025748094, -0.00241129650734666, 0.00153175265476621, 0.00382971958391598, 0.00161548000813759, -0.00266820257230064, -0.00394330955369236, -0.000503843571994975, 0.00373664599746248, 0.00368136346304232, -0.000838476836689991, -0.00458805762491629, -0.00297592036879412, 0.00234222966349808, 0.00512016768747737, 0.00183918482465992, -0.00386515624926471, -0.00520301035246954, -0.000291438056425851, 0.00526903250286106, 0.00475364163119911, -0.00158057813841029, -0.00638185528530441, -0.00370793908644738, 0.00365585979408422, 0.00703461108538593, 0.00204894916458122, -0.00577043003025687, -0.00706773761337952, 0.000187686172101768, 0.00772318529428284, 0.00634204034174043, -0.00291125056011289, -0.00928526551502768, -0.0047484591980062, 0.00597877668947979, 0.0102149335295785, 0.00222217702540064, -0.00919150867784424, -0.0102609233152175, 0.0012571680067493, 0.0122990533079876, 0.00916161990625154, -0.00567568535211345, -0.0150078217988041, -0.00663820835915927, 0.0109993833140256, 0.016972766972858, 0.00234982022677104, -0.0172160901533399, -0.0177638947397535, 0.00423140078553083, 0.0244363458330521, 0.0167561328120983, -0.0141790014177182, -0.0331788590231556, -0.0127730144917427, 0.0302994830298353, 0.0453390627905481, 0.00241389749383788, -0.0631950137182679, -0.0702219379635241, 0.0335252196523236, 0.209649688271813, 0.346209396192461, 0.346209396192461, 0.209649688271813, 0.0335252196523236, -0.0702219379635241, -0.0631950137182679, 0.00241389749383788, 0.0453390627905481, 0.0302994830298353, -0.0127730144917427, -0.0331788590231556, -0.0141790014177182, 0.0167561328120983, 0.0244363458330521, 0.00423140078553083, -0.0177638947397535, -0.0172160901533399, 0.00234982022677104, 0.016972766972858, 0.0109993833140256, -0.00663820835915927, -0.0150078217988041, -0.00567568535211345, 0.00916161990625154, 0.0122990533079876, 0.0012571680067493, -0.0102609233152175, -0.00919150867784424, 0.00222217702540064, 0.0102149335295785, 0.00597877668947979, -0.0047484591980062, -0.00928526551502768, -0.00291125056011289, 0.00634204034174043, 0.00772318529428284, 0.000187686172101768, -0.00706773761337952, -0.00577043003025687, 0.00204894916458122, 0.00703461108538593, 0.00365585979408422, -0.00370793908644738, -0.00638185528530441, -0.00158057813841029, 0.00475364163119911, 0.00526903250286106, -0.000291438056425851, -0.00520301035246954, -0.00386515624926471, 0.00183918482465992, 0.00512016768747737, 0.00234222966349808, -0.00297592036879412, -0.00458805762491629, -0.000838476836689991, 0.00368136346304232, 0.00373664599746248, -0.000503843571994975, -0.00394330955369236, -0.00266820257230064, 0.00161548000813759, 0.00382971958391598, 0.00153175265476621, -0.00241129650734666, -0.00338439025748094, -0.000416589882114724, 0.00288385524734305, 0.0027036934997307, -0.000581203121066439, -0.0030422492138305, -0.00188748878370986, 0.00138265522230981, 0.00290605050602171, 0.00101256264426991, -0.00195836706197549, -0.00253599271032107, -0.000163466770396368, 0.00229448937121785, 0.00200233903853746, -0.00058435320971297, -0.00238753887023181, -0.0013627313436517, 0.0011915957073178, 0.002268312468288, 0.000683620843369453, -0.00163258213676761, -0.00198004820320899, -2.71037309567218e-05, 0.00189359992551836, 0.00156542361784541, -0.00056294187125749, -0.0019798412381234, -0.00106644520927567, 0.00106359635984852, 0.00191825496459596, 0.000530280107066412, -0.00146057873364546, -0.00174175506138366, 1.9866866995806e-06, 0.00174899691031755, 0.00147956517834421, -0.000509546325140551, -0.00194537124602361, -0.00116486788484463, 0.000988117663836819, 0.00208779986075835, 0.000837391750375686, -0.00144870924454635, -0.0022393309507396, -0.000549929869625071, 0.0019176871603923, 0.00250480511232836, 0.000393823598357235, -0.00243621521825698, -0.00309279971465505, -0.000615938766272879, 0.00299028540794681, 0.00447561164046822, 0.00213541365637991, -0.00284276255503529, -0.0074779989309993, -0.00933200204555097, -0.00804605244835613, -0.00507465595092478, -0.00225670900632582, -0.000595408391599509, -2.17901965333983e-09]
-coefLPF19Hz=[0.000510003504660989, 0.00170707633980023, 0.00316032314262874, 0.0034744828424895, 0.00121589811005072, -0.00352858572379633, -0.00842998106375103, -0.0102651772797172, -0.00762552276884297, -0.00250237068827465, 0.00115214032985791, 0.000907989561702395, -0.00194280827067772, -0.0038168729827288, -0.00255888717004298, 0.000428772555122456, 0.00192347545248467, 0.000539370077948588, -0.00180311137110938, -0.00221988218451367, -0.000246482675153189, 0.00170932824896836, 0.00133556589503439, -0.000793210330368278, -0.00197516923357709, -0.000738031235743224, 0.00135008098319619, 0.00166145873114807, -0.000182282223552517, -0.00182499835336745, -0.00115448412899558, 0.000996048515023736, 0.00187628820732892, 0.000328143674248983, -0.00168548702161647, -0.00155242226395394, 0.000611054416563424, 0.00203509689162098, 0.000831096413894091, -0.00150937759393855, -0.00195193233659302, 0.000156140923926006, 0.00213893629026778, 0.00138046303328444, -0.0012296751247198, -0.00232386153261126, -0.000392040120547093, 0.00214505875130611, 0.00195930736143665, -0.000827363975564344, -0.00264634739834205, -0.00104352966618763, 0.00201998283374877, 0.00255429959540836, -0.000271263346165436, -0.00287378867649042, -0.0017900011711676, 0.00172496835984, 0.00312703225021394, 0.000447508856152805, -0.00296309772339656, -0.00261211061279451, 0.00122786235199487, 0.00363482180570805, 0.00133519832679514, -0.0028597242831171, -0.00347084942533688, 0.000504794054178305, 0.00402213011514481, 0.00237523794261463, -0.00252277050712923, -0.00432668311945314, -0.000463754320466396, 0.00423270242006269, 0.00355007846698795, -0.00190406525671068, -0.00512724825824269, -0.00169260672061048, 0.00420112737546685, 0.00483021083803829, -0.0009560437263846, -0.00581185933780712, -0.00319390844976079, 0.0038532920291202, 0.0061796262956051, 0.000378696171416699, -0.00630039242674327, -0.00497197211424198, 0.00310506139990111, 0.00755154149224025, 0.0021613790815399, -0.00650504513711426, -0.0070402383834361, 0.00185160797282143, 0.00889864875117788, 0.00448348811208822, -0.00631510071973609, -0.00943765484385506, -6.14888389477673e-05, 0.0101728712630286, 0.0075030235215874, -0.00557372890753805, -0.0122664278413083, -0.00290426140961639, 0.0113259368291326, 0.0115390488790889, -0.00400325207092862, -0.0157658798338321, -0.00721922241250403, 0.0123102350895617, 0.0173190393889786, -0.0010162404118121, -0.0205695524901848, -0.0143461324928245, 0.0130847776870831, 0.026896714967802, 0.00504573296741168, -0.0287553076265022, -0.0288050286726545, 0.0136188011763064, 0.0487825375300489, 0.0218244039266785, -0.0518844387540634, -0.0811158062393049, 0.013891346223542, 0.205648782762882, 0.362833060662704, 0.362833060662704, 0.205648782762882, 0.013891346223542, -0.0811158062393049, -0.0518844387540634, 0.0218244039266785, 0.0487825375300489, 0.0136188011763064, -0.0288050286726545, -0.0287553076265022, 0.00504573296741168, 0.026896714967802, 0.0130847776870831, -0.0143461324928245, -0.0205695524901848, -0.0010162404118121, 0.0173190393889786, 0.0123102350895617, -0.00721922241250403, -0.0157658798338321, -0.00400325207092862, 0.0115390488790889, 0.0113259368291326, -0.00290426140961639, -0.0122664278413083, -0.00557372890753805, 0.0075030235215874, 0.0101728712630286, -6.14888389477673e-05, -0.00943765484385506, -0.00631510071973609, 0.00448348811208822, 0.00889864875117788, 0.00185160797282143, -0.0070402383834361, -0.00650504513711426, 0.0021613790815399, 0.00755154149224025, 0.00310506139990111, -0.00497197211424198, -0.00630039242674327, 0.000378696171416699, 0.0061796262956051, 0.0038532920291202, -0.00319390844976079, -0.00581185933780712, -0.0009560437263846, 0.00483021083803829, 0.00420112737546685, -0.00169260672061048, -0.00512724825824269, -0.00190406525671068, 0.00355007846698795, 0.00423270242006269, -0.000463754320466396, -0.00432668311945314, -0.00252277050712923, 0.00237523794261463, 0.00402213011514481, 0.000504794054178305, -0.00347084942533688, -0.0028597242831171, 0.00133519832679514, 0.00363482180570805, 0.00122786235199487, -0.00261211061279451, -0.00296309772339656, 0.000447508856152805, 0.00312703225021394, 0.00172496835984, -0.0017900011711676, -0.00287378867649042, -0.000271263346165436, 0.00255429959540836, 0.00201998283374877, -0.00104352966618763, -0.00264634739834205, -0.000827363975564344, 0.00195930736143665, 0.00214505875130611, -0.000392040120547093, -0.00232386153261126, -0.0012296751247198, 0.00138046303328444, 0.00213893629026778, 0.000156140923926006, -0.00195193233659302, -0.00150937759393855, 0.000831096413894091, 0.00203509689162098, 0.000611054416563424, -0.00155242226395394, -0.00168548702161647, 0.000328143674248983, 0.00187628820732892, 0.000996048515023736, -0.00115448412899558, -0.00182499835336745, -0.000182282223552517, 0.00166145873114807, 0.00135008098319619, -0.000738031235743224, -0.00197516923357709, -0.000793210330368278, 0.00133556589503439, 0.00170932824896836, -0.000246482675153189, -0.00221988218451367, -0.00180311137110938, 0.000539370077948588, 0.00192347545248467, 0.000428772555122456, -0.00255888717004298, -0.0038168729827288, -0.00194280827067772, 0.000907989561702395, 0.00115214032985791, -0.00250237068827465, -0.00762552276884297, -0.0102651772797172, -0.00842998106375103, -0.00352858572379633, 0.00121589811005072, 0.0034744828424895, 0.00316032314262874, 0.00170707633980023, 0.000510003504660989]
-coefLPF20Hz=[8.80547348453634e-06, 0.000798591641225316, 0.0030766131448111, 0.00670560989150403, 0.00978679218950707, 0.00961756323317087, 0.00519157135246608, -0.00107210371894395, -0.00477037368081531, -0.00344851100597363, 0.000847819707221234, 0.00348301843602125, 0.00198376396490479, -0.00148388674328818, -0.00279118443610975, -0.00065783638723653, 0.002040542232251, 0.00196899279294269, -0.00056630953077522, -0.00219062754037947, -0.000875553938195457, 0.0015131145580041, 0.00178277450480127, -0.000345456128253765, -0.00193937287398014, -0.000852605529194075, 0.00138388916137426, 0.00168342847438197, -0.00035526367744397, -0.00189604640546644, -0.000786878499014193, 0.00143649602392093, 0.00165829804200445, -0.000463617616080787, -0.00196611558553133, -0.000701688229369454, 0.00159704952918246, 0.00167753965018626, -0.000642841628085415, -0.00211990990282984, -0.000606894270082449, 0.00183318729375171, 0.00173045806137173, -0.000865549148196383, -0.00231849908512393, -0.000489161265687882, 0.00212313993002633, 0.00178329842717107, -0.00114854676018927, -0.00255422659652618, -0.000331890422608816, 0.00247523788812574, 0.00183556922605132, -0.00148969105377319, -0.00281796630953899, -0.000130067786466586, 0.00287750677480532, 0.00186271778123013, -0.00190544180611497, -0.00310352507576488, 0.000137329461512953, 0.00334627370110097, 0.00186885621914061, -0.00239346635418906, -0.00340130266857367, 0.000477024718535292, 0.0038667311527106, 0.00181813697936695, -0.00298440251834957, -0.00371187900767385, 0.000913561668140121, 0.00446111463293915, 0.00171559159292236, -0.00367555959569252, -0.00401511665497652, 0.00147530436301865, 0.00513349318638575, 0.00152721692082926, -0.00451104646360726, -0.00432642599511822, 0.00217683721558386, 0.00589143993837032, 0.00123068944635815, -0.00551544349539928, -0.0046290152689938, 0.0030712248104267, 0.00676670067838064, 0.000799827772129278, -0.00673217595223402, -0.00491243901056357, 0.00422405343965483, 0.00779576623903768, 0.000181318265229744, -0.00824512592179561, -0.00517528191356205, 0.00573213297167314, 0.00903639856238348, -0.000713262185914662, -0.0101967627858817, -0.00541243280125109, 0.00777787196980365, 0.0106140695010241, -0.00202319735061586, -0.0128417835249348, -0.00561801930378732, 0.0107045345923693, 0.0127676653075848, -0.0040420431365755, -0.0167250576471965, -0.00578978872849643, 0.0152753053831339, 0.0160599335388351, -0.00745479450892854, -0.0231958883299711, -0.00592270331061523, 0.0235864133952068, 0.0221331688916683, -0.0143941052680775, -0.0367985289529405, -0.00601105496511244, 0.0441992380616295, 0.0386320012480452, -0.0364663846184264, -0.0880863789150099, -0.00605681953339764, 0.199827875227249, 0.379074384257174, 0.379074384257174, 0.199827875227249, -0.00605681953339764, -0.0880863789150099, -0.0364663846184264, 0.0386320012480452, 0.0441992380616295, -0.00601105496511244, -0.0367985289529405, -0.0143941052680775, 0.0221331688916683, 0.0235864133952068, -0.00592270331061523, -0.0231958883299711, -0.00745479450892854, 0.0160599335388351, 0.0152753053831339, -0.00578978872849643, -0.0167250576471965, -0.0040420431365755, 0.0127676653075848, 0.0107045345923693, -0.00561801930378732, -0.0128417835249348, -0.00202319735061586, 0.0106140695010241, 0.00777787196980365, -0.00541243280125109, -0.0101967627858817, -0.000713262185914662, 0.00903639856238348, 0.00573213297167314, -0.00517528191356205, -0.00824512592179561, 0.000181318265229744, 0.00779576623903768, 0.00422405343965483, -0.00491243901056357, -0.00673217595223402, 0.000799827772129278, 0.00676670067838064, 0.0030712248104267, -0.0046290152689938, -0.00551544349539928, 0.00123068944635815, 0.00589143993837032, 0.00217683721558386, -0.00432642599511822, -0.00451104646360726, 0.00152721692082926, 0.00513349318638575, 0.00147530436301865, -0.00401511665497652, -0.00367555959569252, 0.00171559159292236, 0.00446111463293915, 0.000913561668140121, -0.00371187900767385, -0.00298440251834957, 0.00181813697936695, 0.0038667311527106, 0.000477024718535292, -0.00340130266857367, -0.00239346635418906, 0.00186885621914061, 0.00334627370110097, 0.000137329461512953, -0.00310352507576488, -0.00190544180611497, 0.00186271778123013, 0.00287750677480532, -0.000130067786466586, -0.00281796630953899, -0.00148969105377319, 0.00183556922605132, 0.00247523788812574, -0.000331890422608816, -0.00255422659652618, -0.00114854676018927, 0.00178329842717107, 0.00212313993002633, -0.000489161265687882, -0.00231849908512393, -0.000865549148196383, 0.00173045806137173, 0.00183318729375171, -0.000606894270082449, -0.00211990990282984, -0.000642841628085415, 0.00167753965018626, 0.00159704952918246, -0.000701688229369454, -0.00196611558553133, -0.000463617616080787, 0.00165829804200445, 0.00143649602392093, -0.000786878499014193, -0.00189604640546644, -0.00035526367744397, 0.00168342847438197, 0.00138388916137426, -0.000852605529194075, -0.00193937287398014, -0.000345456128253765, 0.00178277450480127, 0.0015131145580041, -0.000875553938195457, -0.00219062754037947, -0.00056630953077522, 0.00196899279294269, 0.002040542232251, -0.00065783638723653, -0.00279118443610975, -0.00148388674328818, 0.00198376396490479, 0.00348301843602125, 0.000847819707221234, -0.00344851100597363, -0.00477037368081531, -0.00107210371894395, 0.00519157135246608, 0.00961756323317087, 0.00978679218950707, 0.00670560989150403, 0.0030766131448111, 0.000798591641225316, 8.80547348453634e-06]
-coefLPF21Hz=[-0.000694849229878029, -0.00249860389096494, -0.00468738784436146, -0.0049736300082102, -0.00137365445655616, 0.00507090557142804, 0.0100351358546786, 0.00958392849727076, 0.0044416001599507, -0.000279953983718037, -0.000380406467302389, 0.00290943883246015, 0.00470448196445223, 0.00254259662127438, -0.000783805205153605, -0.0011741197624479, 0.00134100652239783, 0.00289199896313784, 0.00122353790362579, -0.00129217927239253, -0.00118619046346439, 0.00115191515786491, 0.00215722447768773, 0.000326728482399085, -0.0016373064278976, -0.000873408951778752, 0.00139702229197284, 0.00171529546937557, -0.000425980887541358, -0.00181152057257874, -0.000347603161525045, 0.00174227042405872, 0.00124916443684163, -0.00112590766772205, -0.00176958297012397, 0.000347171826285658, 0.00201356956438267, 0.000625405777210546, -0.00176058269532816, -0.00146766585516237, 0.00113995254233406, 0.00207753285930511, -0.000186362874036882, -0.00224424051722775, -0.000871821389702315, 0.00192526775472569, 0.00182679711468555, -0.00113970135880057, -0.00245032001103924, 2.66492650029702e-05, 0.00257764977206764, 0.00119891095419559, -0.00213129414197966, -0.0022730078350084, 0.0011532307847969, 0.00293634708764503, 0.000189878406288535, -0.00299409159343405, -0.00163096556408118, 0.00236118946749854, 0.00283113604199263, -0.00113932122183835, -0.00352196144669022, -0.000477673956686513, 0.00348173268935268, 0.00216466570437822, -0.00263151144966448, -0.00353022444895104, 0.00109213496018832, 0.00423815220623775, 0.000862147269440292, -0.00406270327464645, -0.00284427291393685, 0.00293585290378338, 0.00440335945259621, -0.00100294228948661, -0.00512926445010882, -0.00137999181009177, 0.00476962957277521, 0.00373073382489709, -0.003276536512117, -0.0055153796089846, 0.000846352329506767, 0.00625468658162154, 0.00208048823658387, -0.00565642246867306, -0.00491078677244439, 0.00367701412798855, 0.00698311727641695, -0.000592048019246907, -0.00773927256226954, -0.00306366110961721, 0.00681683205867782, 0.00653844555520375, -0.00419021756066458, -0.00903283048192781, 0.000185026511396009, 0.00982865147442914, 0.00451289667857328, -0.0084755121022661, -0.00897035970204078, 0.00490268097647259, 0.0121439370552387, 0.000495255618001271, -0.0130849001324104, -0.00687711546236012, 0.0111278000070437, 0.0130403314561956, -0.00605713619044826, -0.0175756431697721, -0.00177879786103839, 0.0190765719511394, 0.0114496891378851, -0.016328703204163, -0.021476725083045, 0.00847675067220523, 0.0299452179243265, 0.00496659458479723, -0.0345459099521122, -0.0243562051847686, 0.0323333172732924, 0.0508918290255983, -0.0181279017476854, -0.0908207538750775, -0.025884828374802, 0.192223843971915, 0.394966443817795, 0.394966443817795, 0.192223843971915, -0.025884828374802, -0.0908207538750775, -0.0181279017476854, 0.0508918290255983, 0.0323333172732924, -0.0243562051847686, -0.0345459099521122, 0.00496659458479723, 0.0299452179243265, 0.00847675067220523, -0.021476725083045, -0.016328703204163, 0.0114496891378851, 0.0190765719511394, -0.00177879786103839, -0.0175756431697721, -0.00605713619044826, 0.0130403314561956, 0.0111278000070437, -0.00687711546236012, -0.0130849001324104, 0.000495255618001271, 0.0121439370552387, 0.00490268097647259, -0.00897035970204078, -0.0084755121022661, 0.00451289667857328, 0.00982865147442914, 0.000185026511396009, -0.00903283048192781, -0.00419021756066458, 0.00653844555520375, 0.00681683205867782, -0.00306366110961721, -0.00773927256226954, -0.000592048019246907, 0.00698311727641695, 0.00367701412798855, -0.00491078677244439, -0.00565642246867306, 0.00208048823658387, 0.00625468658162154, 0.000846352329506767, -0.0055153796089846, -0.003276536512117, 0.00373073382489709, 0.00476962957277521, -0.00137999181009177, -0.00512926445010882, -0.00100294228948661, 0.00440335945259621, 0.00293585290378338, -0.00284427291393685, -0.00406270327464645, 0.000862147269440292, 0.00423815220623775, 0.00109213496018832, -0.00353022444895104, -0.00263151144966448, 0.00216466570437822, 0.00348173268935268, -0.000477673956686513, -0.00352196144669022, -0.00113932122183835, 0.00283113604199263, 0.00236118946749854, -0.00163096556408118, -0.00299409159343405, 0.000189878406288535, 0.00293634708764503, 0.0011532307847969, -0.0022730078350084, -0.00213129414197966, 0.00119891095419559, 0.00257764977206764, 2.66492650029702e-05, -0.00245032001103924, -0.00113970135880057, 0.00182679711468555, 0.00192526775472569, -0.000871821389702315, -0.00224424051722775, -0.000186362874036882, 0.00207753285930511, 0.00113995254233406, -0.00146766585516237, -0.00176058269532816, 0.000625405777210546, 0.00201356956438267, 0.000347171826285658, -0.00176958297012397, -0.00112590766772205, 0.00124916443684163, 0.00174227042405872, -0.000347603161525045, -0.00181152057257874, -0.000425980887541358, 0.00171529546937557, 0.00139702229197284, -0.000873408951778752, -0.0016373064278976, 0.000326728482399085, 0.00215722447768773, 0.00115191515786491, -0.00118619046346439, -0.00129217927239253, 0.00122353790362579, 0.00289199896313784, 0.00134100652239783, -0.0011741197624479, -0.000783805205153605, 0.00254259662127438, 0.00470448196445223, 0.00290943883246015, -0.000380406467302389, -0.000279953983718037, 0.0044416001599507, 0.00958392849727076, 0.0100351358546786, 0.00507090557142804, -0.00137365445655616, -0.0049736300082102, -0.00468738784436146, -0.00249860389096494, -0.000694849229878029]
-coefLPF22Hz=[-4.88962664293299e-06, -0.00100114128715611, -0.00398822080433951, -0.00842026420675617, -0.0111432760425628, -0.00875573819189428, -0.00180669456353868, 0.00435131051819851, 0.00458819708948408, -0.000151749776507384, -0.00371036070557033, -0.00205899550306093, 0.00195273617257491, 0.00277244121357363, -0.000312138813609753, -0.00258961271982209, -0.000906486582404121, 0.00194310096732305, 0.00166220800462011, -0.00110729685636912, -0.00200376847232646, 0.000251331317075667, 0.00200757606413233, 0.000526274569970068, -0.00174585527019333, -0.00116229171844859, 0.00128772128510194, 0.00161870922774378, -0.000694469890740059, -0.00186846076100541, 2.69421170130573e-05, 0.00189202848199986, 0.000643651424590221, -0.00169376316584705, -0.00125245093658369, 0.00129124336213329, 0.00173673820984736, -0.000720005843553903, -0.00204331529014441, 2.86400312814742e-05, 0.00212741196509802, 0.000718304575961168, -0.00195678185098997, -0.00143438431612446, 0.00153235893011234, 0.00203222620362722, -0.000883350735526577, -0.00242835596307086, 7.31502684369408e-05, 0.00256461435516348, 0.000821716638560981, -0.0023979371977286, -0.00170276494987871, 0.00191481826060166, 0.0024562847268416, -0.00114636038631344, -0.00297774514306699, 0.000159839669932702, 0.00318039652312266, 0.000942007299600357, -0.00301608796513386, -0.00204873193379429, 0.00245387524862528, 0.00301524457008641, -0.00152509276420583, -0.00370717975321886, 0.000306644641270344, 0.00400835288683443, 0.00107595613899662, -0.00384947561871505, -0.00247958347011841, 0.0031959966589719, 0.00373815668663976, -0.00206162516666104, -0.00466467791002836, 0.000547333176666839, 0.00511807172680405, 0.00120561857818097, -0.0049966645437429, -0.00302405227372142, 0.00423530575121341, 0.00468692464513814, -0.00284979755837851, -0.00596634579271108, 0.000942710478347076, 0.00667106337314369, 0.00132960458351495, -0.00663891855578107, -0.00374385288505868, 0.00576537193373301, 0.00601108796814999, -0.00406066148326312, -0.00785747366992873, 0.00159755036400223, 0.00899545745769551, 0.00144597704812995, -0.00916737064426669, -0.00477184168731164, 0.00823461791548449, 0.00807179629716281, -0.00608463172885691, -0.0109196330047992, 0.00278493271185407, 0.0129316567210168, 0.00152629884167444, -0.0136948221393286, -0.00655248468667825, 0.0128677110069665, 0.0119011666115122, -0.0101645285310414, -0.0170684944724962, 0.00538977744372969, 0.021470816077757, 0.00158252274426716, -0.0244394160617538, -0.0108487064364542, 0.0251857433947414, 0.0225844472096126, -0.0226789723086301, -0.0373672713754787, 0.0151684651472563, 0.0571152648583658, 0.00161629778863632, -0.0891818073506777, -0.045044766177185, 0.182928044712445, 0.410445294106943, 0.410445294106943, 0.182928044712445, -0.045044766177185, -0.0891818073506777, 0.00161629778863632, 0.0571152648583658, 0.0151684651472563, -0.0373672713754787, -0.0226789723086301, 0.0225844472096126, 0.0251857433947414, -0.0108487064364542, -0.0244394160617538, 0.00158252274426716, 0.021470816077757, 0.00538977744372969, -0.0170684944724962, -0.0101645285310414, 0.0119011666115122, 0.0128677110069665, -0.00655248468667825, -0.0136948221393286, 0.00152629884167444, 0.0129316567210168, 0.00278493271185407, -0.0109196330047992, -0.00608463172885691, 0.00807179629716281, 0.00823461791548449, -0.00477184168731164, -0.00916737064426669, 0.00144597704812995, 0.00899545745769551, 0.00159755036400223, -0.00785747366992873, -0.00406066148326312, 0.00601108796814999, 0.00576537193373301, -0.00374385288505868, -0.00663891855578107, 0.00132960458351495, 0.00667106337314369, 0.000942710478347076, -0.00596634579271108, -0.00284979755837851, 0.00468692464513814, 0.00423530575121341, -0.00302405227372142, -0.0049966645437429, 0.00120561857818097, 0.00511807172680405, 0.000547333176666839, -0.00466467791002836, -0.00206162516666104, 0.00373815668663976, 0.0031959966589719, -0.00247958347011841, -0.00384947561871505, 0.00107595613899662, 0.00400835288683443, 0.000306644641270344, -0.00370717975321886, -0.00152509276420583, 0.00301524457008641, 0.00245387524862528, -0.00204873193379429, -0.00301608796513386, 0.000942007299600357, 0.00318039652312266, 0.000159839669932702, -0.00297774514306699, -0.00114636038631344, 0.0024562847268416, 0.00191481826060166, -0.00170276494987871, -0.0023979371977286, 0.000821716638560981, 0.00256461435516348, 7.31502684369408e-05, -0.00242835596307086, -0.000883350735526577, 0.00203222620362722, 0.00153235893011234, -0.00143438431612446, -0.00195678185098997, 0.000718304575961168, 0.00212741196509802, 2.86400312814742e-05, -0.00204331529014441, -0.000720005843553903, 0.00173673820984736, 0.00129124336213329, -0.00125245093658369, -0.00169376316584705, 0.000643651424590221, 0.00189202848199986, 2.69421170130573e-05, -0.00186846076100541, -0.000694469890740059, 0.00161870922774378, 0.00128772128510194, -0.00116229171844859, -0.00174585527019333, 0.000526274569970068, 0.00200757606413233, 0.000251331317075667, -0.00200376847232646, -0.00110729685636912, 0.00166220800462011, 0.00194310096732305, -0.000906486582404121, -0.00258961271982209, -0.000312138813609753, 0.00277244121357363, 0.00195273617257491, -0.00205899550306093, -0.00371036070557033, -0.000151749776507384, 0.00458819708948408, 0.00435131051819851, -0.00180669456353868, -0.00875573819189428, -0.0111432760425628, -0.00842026420675617, -0.00398822080433951, -0.00100114128715611, -4.88962664293299e-06]
-coefLPF23Hz=[0.00099649636807472, 0.0038702550857945, 0.00753903159775989, 0.008313294861609, 0.00341735905902665, -0.00456328881331526, -0.00888996045387721, -0.00604813866000863, -0.00041060757173602, 0.000959828337350892, -0.00268619296333765, -0.00533589658034533, -0.00311493059392162, 0.00037028187111771, -1.49780326680768e-05, -0.00305760205168637, -0.00353609895688574, -0.000694879790485945, 0.00082113235480213, -0.00121479382061714, -0.003070599225035, -0.00149146325242799, 0.000861430907982057, 8.22458637272786e-05, -0.00228969659343494, -0.00200664164236751, 0.000511775971807788, 0.000940919358498485, -0.00137878808890769, -0.00227368480235026, -6.79232228118817e-05, 0.00142252498456928, -0.000406331996920266, -0.00228250286813067, -0.000783724176658823, 0.00153410965892201, 0.000568585584364902, -0.0019928074537916, -0.00153355998484214, 0.0012569908032837, 0.00144523876619111, -0.00137374017335258, -0.00217091513437196, 0.000611001616848842, 0.00209016720213361, -0.000455331439720807, -0.00254676301450811, -0.00033586980666212, 0.00236276875497432, 0.000669635107122214, -0.0025185140718012, -0.00144287770665999, 0.00215332131679419, 0.00184370738168911, -0.0019844301882769, -0.0025040088606378, 0.0014068233272331, 0.00283408349205175, -0.00094514882001309, -0.00327754277150172, 0.000182288192340095, 0.00341059249713844, 0.000495862682232378, -0.00354379347613029, -0.00137022303730909, 0.00337008560825859, 0.00213968889322476, -0.00312289675556051, -0.00299303198483509, 0.00258480014805536, 0.00368966327161821, -0.00194387497150161, -0.00435650669368724, 0.00105585105067741, 0.00480475365952678, -7.98122256359447e-05, -0.0051226082014712, -0.00107332313205065, 0.00516239255077711, 0.00226279802690261, -0.00498130256192458, -0.00351536254626697, 0.0044889109866217, 0.00470970303576196, -0.00373486316259004, -0.00583843054158088, 0.00267427085830647, 0.00679953979718905, -0.0013533866466422, -0.00756160147341425, -0.000239816361099194, 0.00801913137115672, 0.00202501910816249, -0.00814932868850796, -0.00398304858017066, 0.00786978662153404, 0.00602660512327353, -0.00715520993442387, -0.00810437746335485, 0.00594457152209242, 0.0101186492150826, -0.00420862696769717, -0.0119698178949371, 0.00193258458762584, 0.0135628684767075, 0.00090251721687671, -0.0147965644186153, -0.00433639388593189, 0.0155164848015569, 0.00836240635130248, -0.0156017347421695, -0.0130358210594849, 0.0148718416871973, 0.0184486132303901, -0.0130757547071295, -0.0247774261775698, 0.00983558471351824, 0.0324097453607517, -0.00447079186376018, -0.042246559714672, -0.0045235661045219, 0.0565899598680613, 0.0212693621616219, -0.0832363140021768, -0.0631270634329337, 0.171987745008895, 0.425540994518541, 0.425540994518541, 0.171987745008895, -0.0631270634329337, -0.0832363140021768, 0.0212693621616219, 0.0565899598680613, -0.0045235661045219, -0.042246559714672, -0.00447079186376018, 0.0324097453607517, 0.00983558471351824, -0.0247774261775698, -0.0130757547071295, 0.0184486132303901, 0.0148718416871973, -0.0130358210594849, -0.0156017347421695, 0.00836240635130248, 0.0155164848015569, -0.00433639388593189, -0.0147965644186153, 0.00090251721687671, 0.0135628684767075, 0.00193258458762584, -0.0119698178949371, -0.00420862696769717, 0.0101186492150826, 0.00594457152209242, -0.00810437746335485, -0.00715520993442387, 0.00602660512327353, 0.00786978662153404, -0.00398304858017066, -0.00814932868850796, 0.00202501910816249, 0.00801913137115672, -0.000239816361099194, -0.00756160147341425, -0.0013533866466422, 0.00679953979718905, 0.00267427085830647, -0.00583843054158088, -0.00373486316259004, 0.00470970303576196, 0.0044889109866217, -0.00351536254626697, -0.00498130256192458, 0.00226279802690261, 0.00516239255077711, -0.00107332313205065, -0.0051226082014712, -7.98122256359447e-05, 0.00480475365952678, 0.00105585105067741, -0.00435650669368724, -0.00194387497150161, 0.00368966327161821, 0.00258480014805536, -0.00299303198483509, -0.00312289675556051, 0.00213968889322476, 0.00337008560825859, -0.00137022303730909, -0.00354379347613029, 0.000495862682232378, 0.00341059249713844, 0.000182288192340095, -0.00327754277150172, -0.00094514882001309, 0.00283408349205175, 0.0014068233272331, -0.0025040088606378, -0.0019844301882769, 0.00184370738168911, 0.00215332131679419, -0.00144287770665999, -0.0025185140718012, 0.000669635107122214, 0.00236276875497432, -0.00033586980666212, -0.00254676301450811, -0.000455331439720807, 0.00209016720213361, 0.000611001616848842, -0.00217091513437196, -0.00137374017335258, 0.00144523876619111, 0.0012569908032837, -0.00153355998484214, -0.0019928074537916, 0.000568585584364902, 0.00153410965892201, -0.000783724176658823, -0.00228250286813067, -0.000406331996920266, 0.00142252498456928, -6.79232228118817e-05, -0.00227368480235026, -0.00137878808890769, 0.000940919358498485, 0.000511775971807788, -0.00200664164236751, -0.00228969659343494, 8.22458637272786e-05, 0.000861430907982057, -0.00149146325242799, -0.003070599225035, -0.00121479382061714, 0.00082113235480213, -0.000694879790485945, -0.00353609895688574, -0.00305760205168637, -1.49780326680768e-05, 0.00037028187111771, -0.00311493059392162, -0.00533589658034533, -0.00268619296333765, 0.000959828337350892, -0.00041060757173602, -0.00604813866000863, -0.00888996045387721, -0.00456328881331526, 0.00341735905902665, 0.008313294861609, 0.00753903159775989, 0.0038702550857945, 0.00099649636807472]
-coefLPF24Hz=[-2.12126799879648e-05, 0.00117361232117482, 0.0049488647171749, 0.0101255030461853, 0.0119365769589989, 0.0067858768493875, -0.00185150802703828, -0.00572120304669287, -0.00176946126893998, 0.00350367427262163, 0.00282613024029057, -0.00182113691827989, -0.0029434947580665, 0.000690700982962326, 0.00273342566572203, 5.11870838650948e-05, -0.00243059231706467, -0.00054125149092361, 0.00212369916641286, 0.000871677117574876, -0.001845161847629, -0.00110450005501696, 0.00160212367512512, 0.00128181059726568, -0.00138700820059076, -0.00142568354458157, 0.00119258179799282, 0.0015497380051549, -0.00101135079387757, -0.00166207596614778, 0.000835793085277621, 0.00176518054670715, -0.000661298404638216, -0.00185933373959373, 0.000487154705243572, 0.00194841987127092, -0.000309032576577413, -0.00203315580871643, 0.000123310107971223, 0.00211468869969444, 7.76487620461322e-05, -0.00218487433216908, -0.000290215521545509, 0.00224594792134003, 0.000521247616625768, -0.00228662888453993, -0.000760615123162132, 0.00231382803178926, 0.0010140527483193, -0.00232299321747668, -0.00128197976007233, 0.0023092843360992, 0.00156063011577213, -0.00227374773734257, -0.00185387313786005, 0.00220724494713183, 0.00215310938328415, -0.00211220015572243, -0.00245726543472523, 0.00198990402849822, 0.00277048403009438, -0.0018317441108935, -0.00308587597930468, 0.00163806065418884, 0.00340268212098151, -0.00140408374072929, -0.0037152413841335, 0.00112811637816731, 0.00401612628820493, -0.00081628059496342, -0.00431047823076003, 0.000461322903556373, 0.00459426399151849, -5.68992549975205e-05, -0.00485694048642619, -0.000394954179117965, 0.00509122941497627, 0.000886693831283547, -0.0053028465917198, -0.00142556705299251, 0.00548844947864403, 0.00202089302900175, -0.00563260728268048, -0.00266662116449842, 0.005730538075143, 0.00335791340081353, -0.00578647110998935, -0.00410497916008799, 0.00579177260662748, 0.00491537037031446, -0.00572888467927606, -0.00578106151806369, 0.00559578953392465, 0.00670323009555438, -0.0053949657368756, -0.00770402453852715, 0.00509921568474592, 0.00878058347852636, -0.004694773820458, -0.00992995369734418, 0.00418720691540142, 0.0111902112345697, -0.00353543481680083, -0.0125689643203399, 0.00271200718205925, 0.014080978435841, -0.00170277840420683, -0.0157958702835049, 0.00042146385285079, 0.0177371525370689, 0.00117332464295546, -0.0200300486587622, -0.00323068037648841, 0.0227972213984501, 0.00592595546725643, -0.0263057156685422, -0.00961161914127231, 0.0310192036797707, 0.0149512393753774, -0.0379130855147339, -0.0234346810424953, 0.0493804961439816, 0.0391978563262979, -0.073296403706877, -0.0796215023223844, 0.159544805427702, 0.440191234111979, 0.440191234111979, 0.159544805427702, -0.0796215023223844, -0.073296403706877, 0.0391978563262979, 0.0493804961439816, -0.0234346810424953, -0.0379130855147339, 0.0149512393753774, 0.0310192036797707, -0.00961161914127231, -0.0263057156685422, 0.00592595546725643, 0.0227972213984501, -0.00323068037648841, -0.0200300486587622, 0.00117332464295546, 0.0177371525370689, 0.00042146385285079, -0.0157958702835049, -0.00170277840420683, 0.014080978435841, 0.00271200718205925, -0.0125689643203399, -0.00353543481680083, 0.0111902112345697, 0.00418720691540142, -0.00992995369734418, -0.004694773820458, 0.00878058347852636, 0.00509921568474592, -0.00770402453852715, -0.0053949657368756, 0.00670323009555438, 0.00559578953392465, -0.00578106151806369, -0.00572888467927606, 0.00491537037031446, 0.00579177260662748, -0.00410497916008799, -0.00578647110998935, 0.00335791340081353, 0.005730538075143, -0.00266662116449842, -0.00563260728268048, 0.00202089302900175, 0.00548844947864403, -0.00142556705299251, -0.0053028465917198, 0.000886693831283547, 0.00509122941497627, -0.000394954179117965, -0.00485694048642619, -5.68992549975205e-05, 0.00459426399151849, 0.000461322903556373, -0.00431047823076003, -0.00081628059496342, 0.00401612628820493, 0.00112811637816731, -0.0037152413841335, -0.00140408374072929, 0.00340268212098151, 0.00163806065418884, -0.00308587597930468, -0.0018317441108935, 0.00277048403009438, 0.00198990402849822, -0.00245726543472523, -0.00211220015572243, 0.00215310938328415, 0.00220724494713183, -0.00185387313786005, -0.00227374773734257, 0.00156063011577213, 0.0023092843360992, -0.00128197976007233, -0.00232299321747668, 0.0010140527483193, 0.00231382803178926, -0.000760615123162132, -0.00228662888453993, 0.000521247616625768, 0.00224594792134003, -0.000290215521545509, -0.00218487433216908, 7.76487620461322e-05, 0.00211468869969444, 0.000123310107971223, -0.00203315580871643, -0.000309032576577413, 0.00194841987127092, 0.000487154705243572, -0.00185933373959373, -0.000661298404638216, 0.00176518054670715, 0.000835793085277621, -0.00166207596614778, -0.00101135079387757, 0.0015497380051549, 0.00119258179799282, -0.00142568354458157, -0.00138700820059076, 0.00128181059726568, 0.00160212367512512, -0.00110450005501696, -0.001845161847629, 0.000871677117574876, 0.00212369916641286, -0.00054125149092361, -0.00243059231706467, 5.11870838650948e-05, 0.00273342566572203, 0.000690700982962326, -0.0029434947580665, -0.00182113691827989, 0.00282613024029057, 0.00350367427262163, -0.00176946126893998, -0.00572120304669287, -0.00185150802703828, 0.0067858768493875, 0.0119365769589989, 0.0101255030461853, 0.0049488647171749, 0.00117361232117482, -2.12126799879648e-05]
-coefLPF25Hz=[-0.00126215044826271, -0.00533334545665566, -0.0106207093617716, -0.0117060311944355, -0.00527466007766919, 0.00339535525307924, 0.00538192066168738, -8.91811027991282e-05, -0.00409518363145417, -0.00116253012447249, 0.00303801854938623, 0.00159876987935887, -0.00229549620834677, -0.00172747531698388, 0.00181352147311339, 0.0017249850757408, -0.001492968968982, -0.00168473810362879, 0.00129528732839288, 0.00162764633298592, -0.00117202089405134, -0.00158011914657756, 0.00110817020083859, 0.00153775584120745, -0.00107838092886297, -0.00150732034561133, 0.00108120410292319, 0.00148230633068966, -0.00110547615045772, -0.00146961056959566, 0.00114877450224514, 0.00146218631483268, -0.00120348729642826, -0.0014602830625719, 0.00127346618726881, 0.00146196614323054, -0.00135319502715348, -0.00146857968023655, 0.00144253792664105, 0.00147446599506632, -0.00154162996574252, -0.00148248481834401, 0.00165027356997494, 0.0014897801329358, -0.00176571607017251, -0.00149250771354054, 0.0018961523578791, 0.00149788219144726, -0.00203196693342477, -0.00149861912704587, 0.00217956751802402, 0.00149750052595654, -0.00233594858440207, -0.00149452062917682, 0.00249801524699844, 0.00148140117831721, -0.00267419106227511, -0.00146673816533807, 0.00285591757957747, 0.00143970220190318, -0.00305296536128655, -0.00140841874363924, 0.00325893123470197, 0.00136645542760473, -0.00347794007230915, -0.0013156193764752, 0.00370954404394523, 0.00125512074993631, -0.00395264895371257, -0.00118217162998551, 0.00420917201209008, 0.00109598948325746, -0.00447930744424816, -0.000994524142227024, 0.00476436977886412, 0.000875240048610383, -0.00506742072928028, -0.000738399834547408, 0.00538934992759576, 0.000583119108722679, -0.0057301755089349, -0.00040665368336914, 0.00609132833581455, 0.000206121607227863, -0.006473997405273, 2.32223973304102e-05, 0.00688185081635981, -0.000286201643537566, -0.00732093633821718, 0.000584699900712367, 0.00779493313199118, -0.000922863120874573, -0.0083080941017474, 0.00130668295305551, 0.00886641169777021, -0.00174242159073748, -0.00947244606959539, 0.00225026567886774, 0.0101508946884304, -0.00282568209926542, -0.010894287427908, 0.0035130373136284, 0.0117561613090623, -0.00429463441184382, -0.0127211571504853, 0.00523820716408655, 0.0138552480302879, -0.00636475192013229, -0.0151964181283433, 0.00774086306407365, 0.0168149049495912, -0.00947756761557809, -0.0188526978275695, 0.0117013936294492, 0.0214862593813872, -0.0146750678848438, -0.0250522626585015, 0.018886522737666, 0.0302339375147493, -0.025303978477305, -0.0385228778292587, 0.036314767651604, 0.0540461009107474, -0.0598020447603819, -0.0941840441283496, 0.145659403970132, 0.454431760165425, 0.454431760165425, 0.145659403970132, -0.0941840441283496, -0.0598020447603819, 0.0540461009107474, 0.036314767651604, -0.0385228778292587, -0.025303978477305, 0.0302339375147493, 0.018886522737666, -0.0250522626585015, -0.0146750678848438, 0.0214862593813872, 0.0117013936294492, -0.0188526978275695, -0.00947756761557809, 0.0168149049495912, 0.00774086306407365, -0.0151964181283433, -0.00636475192013229, 0.0138552480302879, 0.00523820716408655, -0.0127211571504853, -0.00429463441184382, 0.0117561613090623, 0.0035130373136284, -0.010894287427908, -0.00282568209926542, 0.0101508946884304, 0.00225026567886774, -0.00947244606959539, -0.00174242159073748, 0.00886641169777021, 0.00130668295305551, -0.0083080941017474, -0.000922863120874573, 0.00779493313199118, 0.000584699900712367, -0.00732093633821718, -0.000286201643537566, 0.00688185081635981, 2.32223973304102e-05, -0.006473997405273, 0.000206121607227863, 0.00609132833581455, -0.00040665368336914, -0.0057301755089349, 0.000583119108722679, 0.00538934992759576, -0.000738399834547408, -0.00506742072928028, 0.000875240048610383, 0.00476436977886412, -0.000994524142227024, -0.00447930744424816, 0.00109598948325746, 0.00420917201209008, -0.00118217162998551, -0.00395264895371257, 0.00125512074993631, 0.00370954404394523, -0.0013156193764752, -0.00347794007230915, 0.00136645542760473, 0.00325893123470197, -0.00140841874363924, -0.00305296536128655, 0.00143970220190318, 0.00285591757957747, -0.00146673816533807, -0.00267419106227511, 0.00148140117831721, 0.00249801524699844, -0.00149452062917682, -0.00233594858440207, 0.00149750052595654, 0.00217956751802402, -0.00149861912704587, -0.00203196693342477, 0.00149788219144726, 0.0018961523578791, -0.00149250771354054, -0.00176571607017251, 0.0014897801329358, 0.00165027356997494, -0.00148248481834401, -0.00154162996574252, 0.00147446599506632, 0.00144253792664105, -0.00146857968023655, -0.00135319502715348, 0.00146196614323054, 0.00127346618726881, -0.0014602830625719, -0.00120348729642826, 0.00146218631483268, 0.00114877450224514, -0.00146961056959566, -0.00110547615045772, 0.00148230633068966, 0.00108120410292319, -0.00150732034561133, -0.00107838092886297, 0.00153775584120745, 0.00110817020083859, -0.00158011914657756, -0.00117202089405134, 0.00162764633298592, 0.00129528732839288, -0.00168473810362879, -0.001492968968982, 0.0017249850757408, 0.00181352147311339, -0.00172747531698388, -0.00229549620834677, 0.00159876987935887, 0.00303801854938623, -0.00116253012447249, -0.00409518363145417, -8.91811027991282e-05, 0.00538192066168738, 0.00339535525307924, -0.00527466007766919, -0.0117060311944355, -0.0106207093617716, -0.00533334545665566, -0.00126215044826271]
-coefLPF26Hz=[9.04796507727413e-05, -0.00124986940324724, -0.00587931381722753, -0.0117498919258052, -0.0121394814549481, -0.00407028725348534, 0.00479800425781144, 0.00471550080230899, -0.00193588944075831, -0.00402851096207612, 0.000800264237427613, 0.00337349310517658, -0.000364385938908861, -0.00289020612967088, 0.000238305534995082, 0.0025455444145619, -0.000262720208452249, -0.00229366580899396, 0.000367022923740903, 0.00209891907764102, -0.000516954595794093, -0.00193607730124615, 0.000692947661104409, 0.00178487238544502, -0.000886065665351243, -0.00163496526409642, 0.00108420847282023, 0.00147181198486958, -0.00128549286168672, -0.00129405891104623, 0.00147547266914823, 0.0010864925274231, -0.00165760007462131, -0.000853454270640102, 0.00182019550894139, 0.00058965148248656, -0.00195908796705187, -0.000296264794800217, 0.00206852716690646, -2.21342769303366e-05, -0.00213780190483462, 0.000365970745271852, 0.00216395486284213, -0.00072687357658884, -0.00213817737623396, 0.00109837379733235, 0.00205151182777453, -0.00147801891736946, -0.0019041771473867, 0.00185439449166994, 0.0016928900949493, -0.00221576092435584, -0.00141415019549606, 0.0025523956515496, 0.00106889032689685, -0.00285259110459453, -0.000661626362384513, 0.00309832951808523, 0.000189337226628421, -0.00328237447182859, 0.000341014535980243, 0.00339628810467639, -0.000915542193595655, -0.00342490911922618, 0.00152393495973962, 0.0033566656079755, -0.00215353192603925, -0.0031816485482303, 0.00279044007894277, 0.00289324206479406, -0.00341784666584238, -0.0024867783088247, 0.0040180469543246, 0.00196270296770639, -0.00456822932918476, -0.0013216055408014, 0.00504439993037628, 0.000564108072620223, -0.00542536799789445, 0.000305096687253213, 0.00569261710154089, -0.00127429596585102, -0.00582829938973684, 0.00232159395577553, 0.00580472953310322, -0.00343028355070272, -0.00559711921445472, 0.00458649136540177, 0.0051925446283914, -0.0057648104097352, -0.00457811991476257, 0.00693343045080828, 0.00374039776816986, -0.00805348263113511, -0.00265517055054641, 0.00910167772454835, 0.00131716061429531, -0.0100437729277379, 0.000273321513110577, 0.0108294520024485, -0.00212911494430766, -0.0114110740277044, 0.00427015220037346, 0.011754586462741, -0.00669599686407864, -0.0118008030812292, 0.00941799364703475, 0.0114687851022246, -0.0124862536332167, -0.0106955880042104, 0.0159403187936451, 0.00936981357116777, -0.0198578469183528, -0.00730157304333815, 0.0244393273422387, 0.00426527353444229, -0.0299586183172117, 0.000251243879189993, 0.0370832956425567, -0.00719613306754143, -0.0472481295919599, 0.0189784999662159, 0.0645717497890799, -0.0434580510365699, -0.106401498494338, 0.130510432510502, 0.468199565881201, 0.468199565881201, 0.130510432510502, -0.106401498494338, -0.0434580510365699, 0.0645717497890799, 0.0189784999662159, -0.0472481295919599, -0.00719613306754143, 0.0370832956425567, 0.000251243879189993, -0.0299586183172117, 0.00426527353444229, 0.0244393273422387, -0.00730157304333815, -0.0198578469183528, 0.00936981357116777, 0.0159403187936451, -0.0106955880042104, -0.0124862536332167, 0.0114687851022246, 0.00941799364703475, -0.0118008030812292, -0.00669599686407864, 0.011754586462741, 0.00427015220037346, -0.0114110740277044, -0.00212911494430766, 0.0108294520024485, 0.000273321513110577, -0.0100437729277379, 0.00131716061429531, 0.00910167772454835, -0.00265517055054641, -0.00805348263113511, 0.00374039776816986, 0.00693343045080828, -0.00457811991476257, -0.0057648104097352, 0.0051925446283914, 0.00458649136540177, -0.00559711921445472, -0.00343028355070272, 0.00580472953310322, 0.00232159395577553, -0.00582829938973684, -0.00127429596585102, 0.00569261710154089, 0.000305096687253213, -0.00542536799789445, 0.000564108072620223, 0.00504439993037628, -0.0013216055408014, -0.00456822932918476, 0.00196270296770639, 0.0040180469543246, -0.0024867783088247, -0.00341784666584238, 0.00289324206479406, 0.00279044007894277, -0.0031816485482303, -0.00215353192603925, 0.0033566656079755, 0.00152393495973962, -0.00342490911922618, -0.000915542193595655, 0.00339628810467639, 0.000341014535980243, -0.00328237447182859, 0.000189337226628421, 0.00309832951808523, -0.000661626362384513, -0.00285259110459453, 0.00106889032689685, 0.0025523956515496, -0.00141415019549606, -0.00221576092435584, 0.0016928900949493, 0.00185439449166994, -0.0019041771473867, -0.00147801891736946, 0.00205151182777453, 0.00109837379733235, -0.00213817737623396, -0.00072687357658884, 0.00216395486284213, 0.000365970745271852, -0.00213780190483462, -2.21342769303366e-05, 0.00206852716690646, -0.000296264794800217, -0.00195908796705187, 0.00058965148248656, 0.00182019550894139, -0.000853454270640102, -0.00165760007462131, 0.0010864925274231, 0.00147547266914823, -0.00129405891104623, -0.00128549286168672, 0.00147181198486958, 0.00108420847282023, -0.00163496526409642, -0.000886065665351243, 0.00178487238544502, 0.000692947661104409, -0.00193607730124615, -0.000516954595794093, 0.00209891907764102, 0.000367022923740903, -0.00229366580899396, -0.000262720208452249, 0.0025455444145619, 0.000238305534995082, -0.00289020612967088, -0.000364385938908861, 0.00337349310517658, 0.000800264237427613, -0.00402851096207612, -0.00193588944075831, 0.00471550080230899, 0.00479800425781144, -0.00407028725348534, -0.0121394814549481, -0.0117498919258052, -0.00587931381722753, -0.00124986940324724, 9.04796507727413e-05]
-coefLPF27Hz=[0.00136383691243436, 0.00616414446918552, 0.0120365668948567, 0.0117474524846894, 0.00272943944738625, -0.00563407115535703, -0.00376025328652785, 0.00316990064877616, 0.00329075638487529, -0.00222112471356134, -0.00272150465807101, 0.00189259792314079, 0.00220419946675445, -0.00182208270191986, -0.00173398653552838, 0.00185868332394075, 0.00128018837402386, -0.0019192826746868, -0.000824978581650832, 0.00195963420309654, 0.000360817828791642, -0.00194882667532813, 0.000104784823527884, 0.00186285546946534, -0.000560946083605723, -0.00168728450870151, 0.000988689829721125, 0.00141541052012776, -0.00136669503496245, -0.00105256748652291, 0.00166577248702442, 0.000607387600218799, -0.00186156575984976, -9.99659513799141e-05, 0.00193048813914503, -0.00044464755289945, -0.00186003820330169, 0.0009879707141261, 0.00163941300013916, -0.00149205160405883, -0.00127132160800506, 0.00191668972155206, 0.000773133447044747, -0.0022176770547504, -0.000168564979992605, 0.00236009420084292, -0.000505830651160841, -0.00232021394259752, 0.00119804576602107, 0.00207944905017011, -0.00185491181767656, -0.00163766229873188, 0.00241988547094925, 0.00101456738031303, -0.00283188850617758, -0.000240504620196401, 0.00304167236301735, -0.000635175315192869, -0.00301284575980577, 0.00154373708208187, 0.00271710229065267, -0.00241499175233783, -0.00215335291403225, 0.00316960355173272, 0.00134324684982222, -0.00372443523938803, -0.000321918287483727, 0.00401846553853523, -0.000836396290129529, -0.00398873406221435, 0.00205374171221831, 0.00360748033520934, -0.00322528760446189, -0.00286306659219466, 0.00424672979874651, 0.00178024429762619, -0.00500885424382601, -0.000410090054575387, 0.0054170907846389, -0.00116121304462556, -0.00539239208865374, 0.00282214279447935, 0.00488420855093917, -0.00443887032979939, -0.00387603338662099, 0.00586392700579773, 0.00238886660385403, -0.00694988710154002, -0.000489150215393234, 0.00755391160857512, -0.00172137301385434, -0.00756446831746869, 0.00408697070866248, 0.00688188320220574, -0.0064467103549999, -0.00548622747479458, 0.00856587611581136, 0.00334547193456366, -0.0102681759291971, -0.000558386231444791, 0.0113019409044709, -0.00278714571885344, -0.0114808749352173, 0.00651619639009114, 0.0106360310254445, -0.0103870303424973, -0.00860298067217646, 0.014144030229782, 0.00528220824805425, -0.0174750127726512, -0.000608322725631334, 0.0200153389765328, -0.00548662731711004, -0.0213759216072991, 0.0130740583545114, 0.0210928536309391, -0.0223004104592823, -0.0185061839640211, 0.0336013144477734, 0.0125040171417985, -0.0482099476019096, -0.000625957935730975, 0.0699861201280268, -0.0249955621894464, -0.116021918958387, 0.114176380293708, 0.48153127078183, 0.48153127078183, 0.114176380293708, -0.116021918958387, -0.0249955621894464, 0.0699861201280268, -0.000625957935730975, -0.0482099476019096, 0.0125040171417985, 0.0336013144477734, -0.0185061839640211, -0.0223004104592823, 0.0210928536309391, 0.0130740583545114, -0.0213759216072991, -0.00548662731711004, 0.0200153389765328, -0.000608322725631334, -0.0174750127726512, 0.00528220824805425, 0.014144030229782, -0.00860298067217646, -0.0103870303424973, 0.0106360310254445, 0.00651619639009114, -0.0114808749352173, -0.00278714571885344, 0.0113019409044709, -0.000558386231444791, -0.0102681759291971, 0.00334547193456366, 0.00856587611581136, -0.00548622747479458, -0.0064467103549999, 0.00688188320220574, 0.00408697070866248, -0.00756446831746869, -0.00172137301385434, 0.00755391160857512, -0.000489150215393234, -0.00694988710154002, 0.00238886660385403, 0.00586392700579773, -0.00387603338662099, -0.00443887032979939, 0.00488420855093917, 0.00282214279447935, -0.00539239208865374, -0.00116121304462556, 0.0054170907846389, -0.000410090054575387, -0.00500885424382601, 0.00178024429762619, 0.00424672979874651, -0.00286306659219466, -0.00322528760446189, 0.00360748033520934, 0.00205374171221831, -0.00398873406221435, -0.000836396290129529, 0.00401846553853523, -0.000321918287483727, -0.00372443523938803, 0.00134324684982222, 0.00316960355173272, -0.00215335291403225, -0.00241499175233783, 0.00271710229065267, 0.00154373708208187, -0.00301284575980577, -0.000635175315192869, 0.00304167236301735, -0.000240504620196401, -0.00283188850617758, 0.00101456738031303, 0.00241988547094925, -0.00163766229873188, -0.00185491181767656, 0.00207944905017011, 0.00119804576602107, -0.00232021394259752, -0.000505830651160841, 0.00236009420084292, -0.000168564979992605, -0.0022176770547504, 0.000773133447044747, 0.00191668972155206, -0.00127132160800506, -0.00149205160405883, 0.00163941300013916, 0.0009879707141261, -0.00186003820330169, -0.00044464755289945, 0.00193048813914503, -9.99659513799141e-05, -0.00186156575984976, 0.000607387600218799, 0.00166577248702442, -0.00105256748652291, -0.00136669503496245, 0.00141541052012776, 0.000988689829721125, -0.00168728450870151, -0.000560946083605723, 0.00186285546946534, 0.000104784823527884, -0.00194882667532813, 0.000360817828791642, 0.00195963420309654, -0.000824978581650832, -0.0019192826746868, 0.00128018837402386, 0.00185868332394075, -0.00173398653552838, -0.00182208270191986, 0.00220419946675445, 0.00189259792314079, -0.00272150465807101, -0.00222112471356134, 0.00329075638487529, 0.00316990064877616, -0.00376025328652785, -0.00563407115535703, 0.00272943944738625, 0.0117474524846894, 0.0120365668948567, 0.00616414446918552, 0.00136383691243436]
-coefLPF28Hz=[-0.000240452906329346, 0.00110676119033022, 0.00664200821991344, 0.0132417780547296, 0.0118579811261398, 0.00113784848805683, -0.00629732422075844, -0.0019056217313506, 0.00434364218372141, 0.00146779869316041, -0.00349851986445338, -0.000819433069024129, 0.00303638469501716, 0.000142056615703658, -0.00266331205138469, 0.000510380520225822, 0.00224860004513001, -0.00109284041151359, -0.00173488719089041, 0.00155849527787895, 0.00111776015583158, -0.00185107118735321, -0.000417847794311942, 0.00193542060401133, -0.000301180036027177, -0.00177822234550609, 0.000973738204629319, 0.00139035022139232, -0.0015102839448732, -0.000802033648406047, 0.00183479979577555, 7.87261416486287e-05, -0.00189309121351405, 0.000680546971974324, 0.00165463958397081, -0.00136881265750698, -0.00113586677247066, 0.00187679263775424, 0.000401297073790093, -0.00210437435683921, 0.000453990122312383, 0.00199522237561843, -0.00129961551014805, -0.00153972273900012, 0.00199250694602196, 0.000781970608711984, -0.00240131325233443, 0.000180885895547665, 0.00243334602623167, -0.00120219850965747, -0.00204695681782748, 0.0021099613329699, 0.00126432097713662, -0.00273871431086514, -0.000182415239647574, 0.00295148085055312, -0.00103885669365881, -0.0026657709324744, 0.00220201866800529, 0.00187959966447208, -0.00309707480990897, -0.000676993495512604, 0.00354015964140079, -0.000772846631910851, -0.00340388779264051, 0.00223934845813095, 0.00264594549105392, -0.00346796082229493, -0.00133345593873694, 0.00421447515955366, -0.000362077437194964, -0.00429040334602299, 0.00218533661847313, 0.00360696825346495, -0.00382769612368364, -0.0021999175404537, 0.00497392345148127, 0.00023418896747469, -0.0053595119327773, 0.00200944294870032, 0.00482516656722505, -0.00416545344626657, -0.00335369346418939, 0.00583828149612139, 0.00108914915048451, -0.00667001292642329, 0.0016625745162063, 0.00639695339683378, -0.00447859352256462, -0.0049181711290991, 0.00686979826970131, 0.00233421913163723, -0.00834843586401218, 0.00105165868593431, 0.00851483218575562, -0.00475622257161558, -0.00713508340423202, 0.00817394181471441, 0.00420611068491143, -0.0106569291297326, 4.19512007203502e-06, 0.0115937083895629, -0.00498448458139468, -0.0105301327697208, 0.0100108878635118, 0.00725926114939293, -0.0142171998976621, -0.00188911704146087, 0.016675078904264, -0.00515750588007875, -0.0165323961324125, 0.0131323965289691, 0.0131158585620469, -0.0209663502874798, -0.00593963641422635, 0.0273641125161143, -0.00529038187867327, -0.0308402620273177, 0.0207656785533942, 0.0294469264922147, -0.0412515993280653, -0.0201351649417447, 0.0698389521249997, -0.00534874492822327, -0.12276844072051, 0.0968507278258209, 0.494362643225022, 0.494362643225022, 0.0968507278258209, -0.12276844072051, -0.00534874492822327, 0.0698389521249997, -0.0201351649417447, -0.0412515993280653, 0.0294469264922147, 0.0207656785533942, -0.0308402620273177, -0.00529038187867327, 0.0273641125161143, -0.00593963641422635, -0.0209663502874798, 0.0131158585620469, 0.0131323965289691, -0.0165323961324125, -0.00515750588007875, 0.016675078904264, -0.00188911704146087, -0.0142171998976621, 0.00725926114939293, 0.0100108878635118, -0.0105301327697208, -0.00498448458139468, 0.0115937083895629, 4.19512007203502e-06, -0.0106569291297326, 0.00420611068491143, 0.00817394181471441, -0.00713508340423202, -0.00475622257161558, 0.00851483218575562, 0.00105165868593431, -0.00834843586401218, 0.00233421913163723, 0.00686979826970131, -0.0049181711290991, -0.00447859352256462, 0.00639695339683378, 0.0016625745162063, -0.00667001292642329, 0.00108914915048451, 0.00583828149612139, -0.00335369346418939, -0.00416545344626657, 0.00482516656722505, 0.00200944294870032, -0.0053595119327773, 0.00023418896747469, 0.00497392345148127, -0.0021999175404537, -0.00382769612368364, 0.00360696825346495, 0.00218533661847313, -0.00429040334602299, -0.000362077437194964, 0.00421447515955366, -0.00133345593873694, -0.00346796082229493, 0.00264594549105392, 0.00223934845813095, -0.00340388779264051, -0.000772846631910851, 0.00354015964140079, -0.000676993495512604, -0.00309707480990897, 0.00187959966447208, 0.00220201866800529, -0.0026657709324744, -0.00103885669365881, 0.00295148085055312, -0.000182415239647574, -0.00273871431086514, 0.00126432097713662, 0.0021099613329699, -0.00204695681782748, -0.00120219850965747, 0.00243334602623167, 0.000180885895547665, -0.00240131325233443, 0.000781970608711984, 0.00199250694602196, -0.00153972273900012, -0.00129961551014805, 0.00199522237561843, 0.000453990122312383, -0.00210437435683921, 0.000401297073790093, 0.00187679263775424, -0.00113586677247066, -0.00136881265750698, 0.00165463958397081, 0.000680546971974324, -0.00189309121351405, 7.87261416486287e-05, 0.00183479979577555, -0.000802033648406047, -0.0015102839448732, 0.00139035022139232, 0.000973738204629319, -0.00177822234550609, -0.000301180036027177, 0.00193542060401133, -0.000417847794311942, -0.00185107118735321, 0.00111776015583158, 0.00155849527787895, -0.00173488719089041, -0.00109284041151359, 0.00224860004513001, 0.000510380520225822, -0.00266331205138469, 0.000142056615703658, 0.00303638469501716, -0.000819433069024129, -0.00349851986445338, 0.00146779869316041, 0.00434364218372141, -0.0019056217313506, -0.00629732422075844, 0.00113784848805683, 0.0118579811261398, 0.0132417780547296, 0.00664200821991344, 0.00110676119033022, -0.000240452906329346]
-coefLPF29Hz=[-0.00148573269876107, -0.00705991812582764, -0.0134080392340283, -0.0112289255765202, 0.000186099440373694, 0.00671768029993072, 0.000837991586149098, -0.00476734716796485, -0.000296017759776931, 0.00376362871034733, -0.000502142185250495, -0.0029911349994678, 0.00127091744268542, 0.0021796700718978, -0.00186210314864073, -0.00125533304441999, 0.00216801029898713, 0.000263436574235589, -0.00211190380555304, 0.000682754388347163, 0.00168227234836248, -0.00142930216224719, -0.000937591608953417, 0.00183387673128007, 1.39296952095345e-05, -0.00180595922132597, 0.000894638606737253, 0.00133729454846376, -0.00158128122527032, -0.000525625535769057, 0.00186793358881853, -0.000444880770631053, -0.00166372674841191, 0.00133363232200802, 0.00099711000438212, -0.00189785505075886, -1.64522003528508e-05, 0.00196279052080263, -0.00103246374789129, -0.00147515343737306, 0.00186246465168755, 0.000528862810488048, -0.00222068007493092, 0.000646442537631416, 0.00196447359449643, -0.0017344970061206, -0.00111202081518723, 0.00241472082213197, -0.00014370093731462, -0.00244995996926848, 0.00147629119764967, 0.00176667927063287, -0.00250560467634831, -0.000496335441122027, 0.00289684577239835, -0.0010485757163411, -0.00247013865217228, 0.00244170177529274, 0.00126847040363864, -0.00325377555812836, 0.000435175852913446, 0.00318260711153252, -0.00219092851124968, -0.00215759067030927, 0.00348051093895295, 0.000378619441579219, -0.00386933575384064, 0.00170985767223293, 0.00314685940436117, -0.00351424106717112, -0.00139914793552929, 0.00446879305542301, -0.000964694347348063, -0.00419109326401776, 0.00330630848021009, 0.00261706527013018, -0.00492958175980475, -7.46335891617838e-05, 0.00525456535089791, -0.00279771586271992, -0.00403481900603203, 0.00517212653140699, 0.00144199459765708, -0.00627721691557028, 0.00191519466701118, 0.00562008541781261, -0.00512138488528125, -0.00316069738889665, 0.00720388084629975, -0.000584064501338509, -0.00735777821135413, 0.0046940944969108, 0.00530147112365516, -0.00794075461724557, -0.00129093711444201, 0.00925103891232639, -0.00373294196462146, -0.00791090126863264, 0.00841498314449294, 0.00388000414879671, -0.01129920478164, 0.00206816186748354, 0.011174094922874, -0.00849474431262822, -0.00749972792043534, 0.0135589215199094, 0.000668468503785821, -0.0154300946982395, 0.00796072699783566, 0.0127861527599754, -0.0162393314993279, -0.00525400102264867, 0.0215865427428367, -0.00634429665094345, -0.0214835527889539, 0.0199672875475789, 0.0139612056138036, -0.0325084462766932, 0.00214713582548222, 0.0399975425110301, -0.0274974169554411, -0.0372861628592835, 0.0641454713558432, 0.014581423064051, -0.126496248987184, 0.0786459325571496, 0.50671970441283, 0.50671970441283, 0.0786459325571496, -0.126496248987184, 0.014581423064051, 0.0641454713558432, -0.0372861628592835, -0.0274974169554411, 0.0399975425110301, 0.00214713582548222, -0.0325084462766932, 0.0139612056138036, 0.0199672875475789, -0.0214835527889539, -0.00634429665094345, 0.0215865427428367, -0.00525400102264867, -0.0162393314993279, 0.0127861527599754, 0.00796072699783566, -0.0154300946982395, 0.000668468503785821, 0.0135589215199094, -0.00749972792043534, -0.00849474431262822, 0.011174094922874, 0.00206816186748354, -0.01129920478164, 0.00388000414879671, 0.00841498314449294, -0.00791090126863264, -0.00373294196462146, 0.00925103891232639, -0.00129093711444201, -0.00794075461724557, 0.00530147112365516, 0.0046940944969108, -0.00735777821135413, -0.000584064501338509, 0.00720388084629975, -0.00316069738889665, -0.00512138488528125, 0.00562008541781261, 0.00191519466701118, -0.00627721691557028, 0.00144199459765708, 0.00517212653140699, -0.00403481900603203, -0.00279771586271992, 0.00525456535089791, -7.46335891617838e-05, -0.00492958175980475, 0.00261706527013018, 0.00330630848021009, -0.00419109326401776, -0.000964694347348063, 0.00446879305542301, -0.00139914793552929, -0.00351424106717112, 0.00314685940436117, 0.00170985767223293, -0.00386933575384064, 0.000378619441579219, 0.00348051093895295, -0.00215759067030927, -0.00219092851124968, 0.00318260711153252, 0.000435175852913446, -0.00325377555812836, 0.00126847040363864, 0.00244170177529274, -0.00247013865217228, -0.0010485757163411, 0.00289684577239835, -0.000496335441122027, -0.00250560467634831, 0.00176667927063287, 0.00147629119764967, -0.00244995996926848, -0.00014370093731462, 0.00241472082213197, -0.00111202081518723, -0.0017344970061206, 0.00196447359449643, 0.000646442537631416, -0.00222068007493092, 0.000528862810488048, 0.00186246465168755, -0.00147515343737306, -0.00103246374789129, 0.00196279052080263, -1.64522003528508e-05, -0.00189785505075886, 0.00099711000438212, 0.00133363232200802, -0.00166372674841191, -0.000444880770631053, 0.00186793358881853, -0.000525625535769057, -0.00158128122527032, 0.00133729454846376, 0.000894638606737253, -0.00180595922132597, 1.39296952095345e-05, 0.00183387673128007, -0.000937591608953417, -0.00142930216224719, 0.00168227234836248, 0.000682754388347163, -0.00211190380555304, 0.000263436574235589, 0.00216801029898713, -0.00125533304441999, -0.00186210314864073, 0.0021796700718978, 0.00127091744268542, -0.0029911349994678, -0.000502142185250495, 0.00376362871034733, -0.000296017759776931, -0.00476734716796485, 0.000837991586149098, 0.00671768029993072, 0.000186099440373694, -0.0112289255765202, -0.0134080392340283, -0.00705991812582764, -0.00148573269876107]
-coefLPF30Hz=[0.000552123035209424, -0.000469949291301382, -0.00694071366842072, -0.0146009600504479, -0.0114773102468085, 0.0012929062807318, 0.00605010875405172, -0.0013874461674899, -0.00417605528993762, 0.00201143290661075, 0.00269971966697778, -0.00256819631212362, -0.001262085471837, 0.00272378918990188, -0.00013355848741922, -0.00234292623208655, 0.00129246506056605, 0.00145562012890676, -0.00197168742350963, -0.000261871407189905, 0.00200120895219978, -0.000910729796170332, -0.00137787142974603, 0.00170360022947761, 0.00030226584444242, -0.00185605147621283, 0.000852997324140679, 0.00130044744789914, -0.00167825448474577, -0.000238638472418804, 0.00184114788183884, -0.000944190470980376, -0.0012582615594432, 0.00178028906181548, 0.000129554177084207, -0.0019080508266451, 0.00111432064651791, 0.0012321898151353, -0.00196097019766537, 1.63362343635427e-05, 0.00202082819559852, -0.001349829056994, -0.00120599577398273, 0.00220322091281942, -0.000203713526570247, -0.00216553759773432, 0.00164728866068856, 0.00117212923721868, -0.00249818888001165, 0.000430564047872191, 0.00232688573980909, -0.00199740207575818, -0.00111163397837041, 0.00283112603447133, -0.000716996802618543, -0.00249091363669655, 0.00241143347505154, 0.00100828430518949, -0.00320569923001282, 0.0010769895164548, 0.00265347713203177, -0.00289985350393834, -0.000858205784175516, 0.00361976099470217, -0.00151317550373059, -0.00279771372115542, 0.00346312336258495, 0.000632954502154479, -0.00407225342440401, 0.00205565523050909, 0.00292009115732192, -0.00412176588850812, -0.000324896238247062, 0.00456815057228761, -0.00271287974322665, -0.00300739840717617, 0.00487998024085085, -9.35974144372241e-05, -0.00509941524014127, 0.00352176788943674, 0.00303772621008719, -0.00577246194900666, 0.000655428031963255, 0.00568564181034905, -0.00451613779992754, -0.00300326422797429, 0.00682064509411458, -0.0014006803267362, -0.00632224145219818, 0.00576125205191806, 0.00286518373725195, -0.00809316177290124, 0.00240107949965315, 0.00704939642349364, -0.00734351783464016, -0.00259624765636749, 0.00966678846676832, -0.00376531523860518, -0.00789005551802612, 0.00944380112572784, 0.00213343828968314, -0.0117221492030931, 0.0056801006483725, 0.00892959806688152, -0.0123576263194859, -0.00134801640429264, 0.0145906314183773, -0.0085569240210546, -0.0103500875244135, 0.016763058580924, 1.48518886970359e-06, -0.0190367211824165, 0.0133386906787806, 0.0125776347874434, -0.0244245426749939, 0.00259816776938753, 0.0273423911136629, -0.0229391103607874, -0.0170718578877548, 0.0418161165150561, -0.00921960849901033, -0.0500069183048655, 0.0533585995451563, 0.03378430092655, -0.127114293936644, 0.0597567435390489, 0.518575482816395, 0.518575482816395, 0.0597567435390489, -0.127114293936644, 0.03378430092655, 0.0533585995451563, -0.0500069183048655, -0.00921960849901033, 0.0418161165150561, -0.0170718578877548, -0.0229391103607874, 0.0273423911136629, 0.00259816776938753, -0.0244245426749939, 0.0125776347874434, 0.0133386906787806, -0.0190367211824165, 1.48518886970359e-06, 0.016763058580924, -0.0103500875244135, -0.0085569240210546, 0.0145906314183773, -0.00134801640429264, -0.0123576263194859, 0.00892959806688152, 0.0056801006483725, -0.0117221492030931, 0.00213343828968314, 0.00944380112572784, -0.00789005551802612, -0.00376531523860518, 0.00966678846676832, -0.00259624765636749, -0.00734351783464016, 0.00704939642349364, 0.00240107949965315, -0.00809316177290124, 0.00286518373725195, 0.00576125205191806, -0.00632224145219818, -0.0014006803267362, 0.00682064509411458, -0.00300326422797429, -0.00451613779992754, 0.00568564181034905, 0.000655428031963255, -0.00577246194900666, 0.00303772621008719, 0.00352176788943674, -0.00509941524014127, -9.35974144372241e-05, 0.00487998024085085, -0.00300739840717617, -0.00271287974322665, 0.00456815057228761, -0.000324896238247062, -0.00412176588850812, 0.00292009115732192, 0.00205565523050909, -0.00407225342440401, 0.000632954502154479, 0.00346312336258495, -0.00279771372115542, -0.00151317550373059, 0.00361976099470217, -0.000858205784175516, -0.00289985350393834, 0.00265347713203177, 0.0010769895164548, -0.00320569923001282, 0.00100828430518949, 0.00241143347505154, -0.00249091363669655, -0.000716996802618543, 0.00283112603447133, -0.00111163397837041, -0.00199740207575818, 0.00232688573980909, 0.000430564047872191, -0.00249818888001165, 0.00117212923721868, 0.00164728866068856, -0.00216553759773432, -0.000203713526570247, 0.00220322091281942, -0.00120599577398273, -0.001349829056994, 0.00202082819559852, 1.63362343635427e-05, -0.00196097019766537, 0.0012321898151353, 0.00111432064651791, -0.0019080508266451, 0.000129554177084207, 0.00178028906181548, -0.0012582615594432, -0.000944190470980376, 0.00184114788183884, -0.000238638472418804, -0.00167825448474577, 0.00130044744789914, 0.000852997324140679, -0.00185605147621283, 0.00030226584444242, 0.00170360022947761, -0.00137787142974603, -0.000910729796170332, 0.00200120895219978, -0.000261871407189905, -0.00197168742350963, 0.00145562012890676, 0.00129246506056605, -0.00234292623208655, -0.00013355848741922, 0.00272378918990188, -0.001262085471837, -0.00256819631212362, 0.00269971966697778, 0.00201143290661075, -0.00417605528993762, -0.0013874461674899, 0.00605010875405172, 0.0012929062807318, -0.0114773102468085, -0.0146009600504479, -0.00694071366842072, -0.000469949291301382, 0.000552123035209424]
-coefLPF31Hz=[0.00161806972347352, 0.00801141514951759, 0.0146784440778461, 0.010134123226565, -0.00313238638616624, -0.00635630859631598, 0.00242704948918393, 0.00404889185141045, -0.00295526252223602, -0.00209599463019672, 0.00324508257210634, 0.000222148160448345, -0.00284820663713115, 0.00134617811946625, 0.00172430952675333, -0.00222063399310911, -0.000179758307281325, 0.0021387088521146, -0.00123662272940816, -0.0011664710487014, 0.0019619343048288, -0.000256639132571438, -0.00169792420622852, 0.00146530649001438, 0.000590066727994856, -0.00186899392444662, 0.000799570553919007, 0.00125977754003083, -0.00174170912550625, 5.04106175713806e-05, 0.00171322052582234, -0.0013577414584977, -0.000698539457586952, 0.00192150559568882, -0.000765941854088436, -0.00137798644324437, 0.00185430494950396, -1.97669421136114e-05, -0.00190143945630525, 0.00149989590722096, 0.00080427896159743, -0.00218306019973517, 0.000867202805465295, 0.00159391507042234, -0.00214956856528727, 1.86529174643576e-05, 0.00222920493249029, -0.00176330787112609, -0.000948014734278529, 0.00258516759898321, -0.00103711725803249, -0.00189244319569003, 0.00257365304109357, -3.68097079805449e-05, -0.00267004123652626, 0.00213725699866841, 0.00112275132626198, -0.00312813125983608, 0.00127846058505753, 0.00228010748817452, -0.00313565819050228, 7.30234791547139e-05, 0.00323936973818651, -0.00262828466633637, -0.00133588198291805, 0.00381984821953846, -0.001607673227319, -0.00275865636632364, 0.00386965139535365, -0.000144616690974647, -0.00396529254711593, 0.00328463475385674, 0.00159339384455417, -0.00472365632420791, 0.00204814648428067, 0.00336772156608035, -0.0048288744226041, 0.000257962978365198, 0.00490132604246544, -0.00415591016746937, -0.00190006792844663, 0.00590864173722405, -0.00267163024229231, -0.00415548111595577, 0.00612823362679127, -0.000455993112341695, -0.00616691865893831, 0.00536934299757689, 0.00228446007557807, -0.0075552244016172, 0.0035700234259371, 0.00522879954186282, -0.00798641026265535, 0.000779180422128204, 0.00796150104955945, -0.00719101762733426, -0.00281681013881061, 0.0100050621458419, -0.0049842879237094, -0.00683990765455707, 0.0108990742714485, -0.00132804711662883, -0.0108085152596764, 0.0101845934807657, 0.00363050953589626, -0.0141585093240829, 0.0074675193484103, 0.00963487384408229, -0.016179492118269, 0.00243776015513624, 0.0162458705238231, -0.0161438613559821, -0.00523774468927465, 0.0229699666156369, -0.013076575066756, -0.016085022511173, 0.0292443804394164, -0.00543804837136598, -0.0315409231565057, 0.0345179174282404, 0.0105745876060941, -0.0568191346410449, 0.0383349609164323, 0.0513668719151635, -0.124602371641013, 0.0403320722485767, 0.529921253703505, 0.529921253703505, 0.0403320722485767, -0.124602371641013, 0.0513668719151635, 0.0383349609164323, -0.0568191346410449, 0.0105745876060941, 0.0345179174282404, -0.0315409231565057, -0.00543804837136598, 0.0292443804394164, -0.016085022511173, -0.013076575066756, 0.0229699666156369, -0.00523774468927465, -0.0161438613559821, 0.0162458705238231, 0.00243776015513624, -0.016179492118269, 0.00963487384408229, 0.0074675193484103, -0.0141585093240829, 0.00363050953589626, 0.0101845934807657, -0.0108085152596764, -0.00132804711662883, 0.0108990742714485, -0.00683990765455707, -0.0049842879237094, 0.0100050621458419, -0.00281681013881061, -0.00719101762733426, 0.00796150104955945, 0.000779180422128204, -0.00798641026265535, 0.00522879954186282, 0.0035700234259371, -0.0075552244016172, 0.00228446007557807, 0.00536934299757689, -0.00616691865893831, -0.000455993112341695, 0.00612823362679127, -0.00415548111595577, -0.00267163024229231, 0.00590864173722405, -0.00190006792844663, -0.00415591016746937, 0.00490132604246544, 0.000257962978365198, -0.0048288744226041, 0.00336772156608035, 0.00204814648428067, -0.00472365632420791, 0.00159339384455417, 0.00328463475385674, -0.00396529254711593, -0.000144616690974647, 0.00386965139535365, -0.00275865636632364, -0.001607673227319, 0.00381984821953846, -0.00133588198291805, -0.00262828466633637, 0.00323936973818651, 7.30234791547139e-05, -0.00313565819050228, 0.00228010748817452, 0.00127846058505753, -0.00312813125983608, 0.00112275132626198, 0.00213725699866841, -0.00267004123652626, -3.68097079805449e-05, 0.00257365304109357, -0.00189244319569003, -0.00103711725803249, 0.00258516759898321, -0.000948014734278529, -0.00176330787112609, 0.00222920493249029, 1.86529174643576e-05, -0.00214956856528727, 0.00159391507042234, 0.000867202805465295, -0.00218306019973517, 0.00080427896159743, 0.00149989590722096, -0.00190143945630525, -1.97669421136114e-05, 0.00185430494950396, -0.00137798644324437, -0.000765941854088436, 0.00192150559568882, -0.000698539457586952, -0.0013577414584977, 0.00171322052582234, 5.04106175713806e-05, -0.00174170912550625, 0.00125977754003083, 0.000799570553919007, -0.00186899392444662, 0.000590066727994856, 0.00146530649001438, -0.00169792420622852, -0.000256639132571438, 0.0019619343048288, -0.0011664710487014, -0.00123662272940816, 0.0021387088521146, -0.000179758307281325, -0.00222063399310911, 0.00172430952675333, 0.00134617811946625, -0.00284820663713115, 0.000222148160448345, 0.00324508257210634, -0.00209599463019672, -0.00295526252223602, 0.00404889185141045, 0.00242704948918393, -0.00635630859631598, -0.00313238638616624, 0.010134123226565, 0.0146784440778461, 0.00801141514951759, 0.00161806972347352]
-coefLPF32Hz=[-0.00122770470168863, -0.0013825745849734, 0.00593986051368457, 0.0158026049751814, 0.0118921955487977, -0.00219043940929495, -0.00410975356288757, 0.00389255324920995, 0.00189705690684916, -0.0037023848676128, 0.000531169905499897, 0.00274927324087511, -0.00214648626884309, -0.000944461306529622, 0.002522883473397, -0.000957033949713552, -0.00156746258237966, 0.00205361546422101, -0.000138906926510361, -0.00180725038125834, 0.00157760530679628, 0.000438063839431706, -0.00187306573150946, 0.00113794958110709, 0.00086794489121543, -0.00185600113161191, 0.00072719273810152, 0.00121536840483625, -0.00177796781661366, 0.000332271324930581, 0.00150358646775489, -0.00165721072410363, -6.73035591771715e-05, 0.00174656778828682, -0.00148342217541416, -0.000473589361972406, 0.00194755722116628, -0.00125171661278828, -0.000894455604052929, 0.00209830621673461, -0.000949573087544485, -0.00132631690520496, 0.00217757079172715, -0.000576055317073391, -0.00175408753050307, 0.00217507476505178, -0.000127575477054945, -0.00215874985141165, 0.00207412001077607, 0.000385422691662131, -0.00251902179123459, 0.00186879465374451, 0.00095198107145849, -0.00281958258496513, 0.00154953537607981, 0.00156365257596677, -0.00303528963611516, 0.00110331669348348, 0.0021941170751904, -0.00313848476586674, 0.000535470652094825, 0.00281629953578346, -0.00311012396094552, -0.00014564884583994, 0.00340538620375038, -0.00293053275120938, -0.000929421582987341, 0.00393089781493899, -0.00258410863724787, -0.00180225637128966, 0.0043600218318072, -0.00205142370430122, -0.00273949058494946, 0.00464990490492006, -0.00132696527628452, -0.00370338240056002, 0.00476702768453405, -0.000418580521468618, -0.00466284846612732, 0.00468472053010023, 0.000675554955121564, -0.00558113731444298, 0.00436521944527775, 0.00194783078231937, -0.00640872909084341, 0.0037719724478872, 0.00337276958732038, -0.00709243052665654, 0.00288551336570016, 0.00492496873934417, -0.00758862762024189, 0.00167824176694695, 0.00658689734918725, -0.00783355384233387, 0.000111283702932199, 0.00831030733713977, -0.00775948629594728, -0.00183117836151999, 0.0100599238799041, -0.00730257673329827, -0.00419122321440987, 0.011805259594114, -0.00636234759235627, -0.007031378279258, 0.0134894841211748, -0.00481524460155872, -0.0104224169727389, 0.0150821595177518, -0.00249784615836381, -0.014555756628622, 0.0165384626725697, 0.000903778858123946, -0.0197561717084527, 0.0177995112137373, 0.005939211699273, -0.0267284596368362, 0.0188713059723203, 0.0139589374004196, -0.0372136470770592, 0.0196945458075496, 0.0286298961085349, -0.0569212249092356, 0.0202562474011093, 0.0664847094319455, -0.119011860457122, 0.020544430051692, 0.54074148926536, 0.54074148926536, 0.020544430051692, -0.119011860457122, 0.0664847094319455, 0.0202562474011093, -0.0569212249092356, 0.0286298961085349, 0.0196945458075496, -0.0372136470770592, 0.0139589374004196, 0.0188713059723203, -0.0267284596368362, 0.005939211699273, 0.0177995112137373, -0.0197561717084527, 0.000903778858123946, 0.0165384626725697, -0.014555756628622, -0.00249784615836381, 0.0150821595177518, -0.0104224169727389, -0.00481524460155872, 0.0134894841211748, -0.007031378279258, -0.00636234759235627, 0.011805259594114, -0.00419122321440987, -0.00730257673329827, 0.0100599238799041, -0.00183117836151999, -0.00775948629594728, 0.00831030733713977, 0.000111283702932199, -0.00783355384233387, 0.00658689734918725, 0.00167824176694695, -0.00758862762024189, 0.00492496873934417, 0.00288551336570016, -0.00709243052665654, 0.00337276958732038, 0.0037719724478872, -0.00640872909084341, 0.00194783078231937, 0.00436521944527775, -0.00558113731444298, 0.000675554955121564, 0.00468472053010023, -0.00466284846612732, -0.000418580521468618, 0.00476702768453405, -0.00370338240056002, -0.00132696527628452, 0.00464990490492006, -0.00273949058494946, -0.00205142370430122, 0.0043600218318072, -0.00180225637128966, -0.00258410863724787, 0.00393089781493899, -0.000929421582987341, -0.00293053275120938, 0.00340538620375038, -0.00014564884583994, -0.00311012396094552, 0.00281629953578346, 0.000535470652094825, -0.00313848476586674, 0.0021941170751904, 0.00110331669348348, -0.00303528963611516, 0.00156365257596677, 0.00154953537607981, -0.00281958258496513, 0.00095198107145849, 0.00186879465374451, -0.00251902179123459, 0.000385422691662131, 0.00207412001077607, -0.00215874985141165, -0.000127575477054945, 0.00217507476505178, -0.00175408753050307, -0.000576055317073391, 0.00217757079172715, -0.00132631690520496, -0.000949573087544485, 0.00209830621673461, -0.000894455604052929, -0.00125171661278828, 0.00194755722116628, -0.000473589361972406, -0.00148342217541416, 0.00174656778828682, -6.73035591771715e-05, -0.00165721072410363, 0.00150358646775489, 0.000332271324930581, -0.00177796781661366, 0.00121536840483625, 0.00072719273810152, -0.00185600113161191, 0.00086794489121543, 0.00113794958110709, -0.00187306573150946, 0.000438063839431706, 0.00157760530679628, -0.00180725038125834, -0.000138906926510361, 0.00205361546422101, -0.00156746258237966, -0.000957033949713552, 0.002522883473397, -0.000944461306529622, -0.00214648626884309, 0.00274927324087511, 0.000531169905499897, -0.0037023848676128, 0.00189705690684916, 0.00389255324920995, -0.00410975356288757, -0.00219043940929495, 0.0118921955487977, 0.0158026049751814, 0.00593986051368457, -0.0013825745849734, -0.00122770470168863]
-coefLPF33Hz=[-0.00173322551005037, -0.00897265441634382, -0.0158084235230623, -0.00855023677557615, 0.00571385884780255, 0.00461558820414012, -0.00490656753823397, -0.00133532806544103, 0.00429717153191075, -0.00139773690782416, -0.00255992256334761, 0.00288357443182974, 7.88665485526026e-05, -0.00252992987358753, 0.00191912582614266, 0.000682846283295176, -0.00229177761658331, 0.00134222267533256, 0.00093650581183831, -0.00208038939116097, 0.00100298834132745, 0.0010499821188809, -0.00193651720519748, 0.000808025499822217, 0.00111495348889892, -0.00185885206865674, 0.000695433881945154, 0.00116815850158029, -0.00183582876312425, 0.000630722970511924, 0.00122764455642378, -0.0018540152591659, 0.000592545959152945, 0.00129973548470301, -0.00190063759055603, 0.000570035051604813, 0.00138062473513483, -0.0019740387037087, 0.000559668266699175, 0.00147704845318196, -0.00206714832632986, 0.00055645601292777, 0.00158428796565762, -0.00218313545270051, 0.0005592205590337, 0.0017101505587929, -0.00231654694468602, 0.000563485476289125, 0.00185132603388823, -0.00246922387661005, 0.000566012685974166, 0.00201062941972021, -0.00263342109590421, 0.000569641612543868, 0.002182492892967, -0.00281727882755607, 0.000574115082775782, 0.00237346384701714, -0.0030180696366249, 0.000580005119088958, 0.0025840869802221, -0.00324145943505891, 0.000581076810240155, 0.00281638592940727, -0.0034809608341031, 0.000583832020669212, 0.00307102447311822, -0.00374426776713874, 0.000583506520230787, 0.00334673931134434, -0.00403425204472687, 0.000587579807183037, 0.00365529412388658, -0.00435399043521148, 0.000591552821506677, 0.00399784487218754, -0.00471094936611461, 0.000591840153529578, 0.00438050471176495, -0.00510408526137893, 0.000594960387561118, 0.00481106567940969, -0.00554217897835092, 0.000600150264033569, 0.00529263271899581, -0.00604869194930636, 0.000594897485834149, 0.00583358300954103, -0.00663361094758717, 0.000584769658833369, 0.00646218042847962, -0.00729181667961268, 0.000591286871529047, 0.00720415924251293, -0.0080616917580504, 0.000592326991555089, 0.00806613319767344, -0.00899553526989797, 0.000590295090094126, 0.00912121306048188, -0.010107822143825, 0.000593651275553822, 0.0104113570947916, -0.0115031043917755, 0.000588056936589395, 0.0120430004459746, -0.0132806281927664, 0.00059585476865685, 0.0141906601787686, -0.0156586841740801, 0.000586955582489192, 0.0171425591433912, -0.0189753703276213, 0.000591028646434046, 0.0214737000205024, -0.0240086683570533, 0.00058948965148458, 0.0285103871452478, -0.0325330298761076, 0.000587339502053322, 0.0419687498134452, -0.0502902893518528, 0.000587640894219893, 0.0783885228542572, -0.110502897099426, 0.000587233782990304, 0.551024038519356, 0.551024038519356, 0.000587233782990304, -0.110502897099426, 0.0783885228542572, 0.000587640894219893, -0.0502902893518528, 0.0419687498134452, 0.000587339502053322, -0.0325330298761076, 0.0285103871452478, 0.00058948965148458, -0.0240086683570533, 0.0214737000205024, 0.000591028646434046, -0.0189753703276213, 0.0171425591433912, 0.000586955582489192, -0.0156586841740801, 0.0141906601787686, 0.00059585476865685, -0.0132806281927664, 0.0120430004459746, 0.000588056936589395, -0.0115031043917755, 0.0104113570947916, 0.000593651275553822, -0.010107822143825, 0.00912121306048188, 0.000590295090094126, -0.00899553526989797, 0.00806613319767344, 0.000592326991555089, -0.0080616917580504, 0.00720415924251293, 0.000591286871529047, -0.00729181667961268, 0.00646218042847962, 0.000584769658833369, -0.00663361094758717, 0.00583358300954103, 0.000594897485834149, -0.00604869194930636, 0.00529263271899581, 0.000600150264033569, -0.00554217897835092, 0.00481106567940969, 0.000594960387561118, -0.00510408526137893, 0.00438050471176495, 0.000591840153529578, -0.00471094936611461, 0.00399784487218754, 0.000591552821506677, -0.00435399043521148, 0.00365529412388658, 0.000587579807183037, -0.00403425204472687, 0.00334673931134434, 0.000583506520230787, -0.00374426776713874, 0.00307102447311822, 0.000583832020669212, -0.0034809608341031, 0.00281638592940727, 0.000581076810240155, -0.00324145943505891, 0.0025840869802221, 0.000580005119088958, -0.0030180696366249, 0.00237346384701714, 0.000574115082775782, -0.00281727882755607, 0.002182492892967, 0.000569641612543868, -0.00263342109590421, 0.00201062941972021, 0.000566012685974166, -0.00246922387661005, 0.00185132603388823, 0.000563485476289125, -0.00231654694468602, 0.0017101505587929, 0.0005592205590337, -0.00218313545270051, 0.00158428796565762, 0.00055645601292777, -0.00206714832632986, 0.00147704845318196, 0.000559668266699175, -0.0019740387037087, 0.00138062473513483, 0.000570035051604813, -0.00190063759055603, 0.00129973548470301, 0.000592545959152945, -0.0018540152591659, 0.00122764455642378, 0.000630722970511924, -0.00183582876312425, 0.00116815850158029, 0.000695433881945154, -0.00185885206865674, 0.00111495348889892, 0.000808025499822217, -0.00193651720519748, 0.0010499821188809, 0.00100298834132745, -0.00208038939116097, 0.00093650581183831, 0.00134222267533256, -0.00229177761658331, 0.000682846283295176, 0.00191912582614266, -0.00252992987358753, 7.88665485526026e-05, 0.00288357443182974, -0.00255992256334761, -0.00139773690782416, 0.00429717153191075, -0.00133532806544103, -0.00490656753823397, 0.00461558820414012, 0.00571385884780255, -0.00855023677557615, -0.0158084235230623, -0.00897265441634382, -0.00173322551005037]
-coefLPF34Hz=[0.00285680299273051, 0.0068603397747867, 7.9917025072436e-05, -0.0145356961926207, -0.0135222389153157, -0.000211384875117663, -0.000646172870047974, -0.00643494830912327, -0.00029139165189085, 0.00177838802038133, -0.0035126839425436, -0.000244084777583798, 0.0020701008524815, -0.00237948462336577, -0.000161767605168398, 0.00192870688600812, -0.00193768409037235, -3.20586035485633e-05, 0.00172267481065967, -0.00177830870941042, 0.000143674793983055, 0.0015180935714827, -0.00174967758254502, 0.000355061785443262, 0.00132184865304684, -0.00177453208814992, 0.000594958557275601, 0.00111896365951647, -0.00181318117291027, 0.000859576536532697, 0.000890583649004892, -0.00185266525606819, 0.00113914906084373, 0.000633537150164385, -0.00186618010608706, 0.00142913745794208, 0.000336532245568176, -0.00184646575308566, 0.00171636139733529, -1.61337345740966e-06, -0.00177458254915868, 0.0019929632510788, -0.000384375339696748, -0.00164484457521178, 0.00224403776891327, -0.000805769322611888, -0.00144211393350495, 0.00245845680415213, -0.00125988318022195, -0.00115989977086195, 0.0026202787239125, -0.00173735491102749, -0.000792373573388482, 0.00271424706331832, -0.002226026261046, -0.000339430637864951, 0.0027231867752403, -0.00270965564671153, 0.000196447366980848, 0.00262947185641599, -0.00316817206539093, 0.000811905141748997, 0.00241773750169456, -0.00358028663476393, 0.00149868812951691, 0.00207439716750129, -0.0039229769594583, 0.00224528487573777, 0.00159168279414538, -0.00417056320483365, 0.00303380183319592, 0.000964311836858832, -0.00429550973388918, 0.00384049145797413, 0.000188959996139511, -0.00426913284801914, 0.00463800770906856, -0.000735685383519882, -0.00406588419704827, 0.00539316631339459, -0.00180775913150302, -0.00366062253867656, 0.00607435373137495, -0.00301399956526463, -0.00302901363216099, 0.00664213827950916, -0.00433655840940741, -0.002144455602533, 0.00705613677141389, -0.00575095304799884, -0.000981330517331062, 0.0072651915803424, -0.00723730056365161, 0.000484389362062999, 0.00721661877718416, -0.00877116209573546, 0.00227762094312255, 0.00685215123353442, -0.0103200336846357, 0.0044319609802041, 0.00610006273195793, -0.0118482593495832, 0.0069996031396488, 0.00487183147100518, -0.0133115770360183, 0.0100658986885533, 0.00302428743844111, -0.0146919675940034, 0.0137691305481886, 0.000361559558488281, -0.0159436181330649, 0.0183766417544303, -0.00349694075788705, -0.0170582987804964, 0.0244250236327706, -0.00926414108399975, -0.0179543062928222, 0.0332121656261464, -0.0187706629496657, -0.018670886796498, 0.0484140930693125, -0.0376993252301668, -0.01916291101374, 0.0865232657289685, -0.0992528910742816, -0.0193977387205662, 0.560774761998702, 0.560774761998702, -0.0193977387205662, -0.0992528910742816, 0.0865232657289685, -0.01916291101374, -0.0376993252301668, 0.0484140930693125, -0.018670886796498, -0.0187706629496657, 0.0332121656261464, -0.0179543062928222, -0.00926414108399975, 0.0244250236327706, -0.0170582987804964, -0.00349694075788705, 0.0183766417544303, -0.0159436181330649, 0.000361559558488281, 0.0137691305481886, -0.0146919675940034, 0.00302428743844111, 0.0100658986885533, -0.0133115770360183, 0.00487183147100518, 0.0069996031396488, -0.0118482593495832, 0.00610006273195793, 0.0044319609802041, -0.0103200336846357, 0.00685215123353442, 0.00227762094312255, -0.00877116209573546, 0.00721661877718416, 0.000484389362062999, -0.00723730056365161, 0.0072651915803424, -0.000981330517331062, -0.00575095304799884, 0.00705613677141389, -0.002144455602533, -0.00433655840940741, 0.00664213827950916, -0.00302901363216099, -0.00301399956526463, 0.00607435373137495, -0.00366062253867656, -0.00180775913150302, 0.00539316631339459, -0.00406588419704827, -0.000735685383519882, 0.00463800770906856, -0.00426913284801914, 0.000188959996139511, 0.00384049145797413, -0.00429550973388918, 0.000964311836858832, 0.00303380183319592, -0.00417056320483365, 0.00159168279414538, 0.00224528487573777, -0.0039229769594583, 0.00207439716750129, 0.00149868812951691, -0.00358028663476393, 0.00241773750169456, 0.000811905141748997, -0.00316817206539093, 0.00262947185641599, 0.000196447366980848, -0.00270965564671153, 0.0027231867752403, -0.000339430637864951, -0.002226026261046, 0.00271424706331832, -0.000792373573388482, -0.00173735491102749, 0.0026202787239125, -0.00115989977086195, -0.00125988318022195, 0.00245845680415213, -0.00144211393350495, -0.000805769322611888, 0.00224403776891327, -0.00164484457521178, -0.000384375339696748, 0.0019929632510788, -0.00177458254915868, -1.61337345740966e-06, 0.00171636139733529, -0.00184646575308566, 0.000336532245568176, 0.00142913745794208, -0.00186618010608706, 0.000633537150164385, 0.00113914906084373, -0.00185266525606819, 0.000890583649004892, 0.000859576536532697, -0.00181318117291027, 0.00111896365951647, 0.000594958557275601, -0.00177453208814992, 0.00132184865304684, 0.000355061785443262, -0.00174967758254502, 0.0015180935714827, 0.000143674793983055, -0.00177830870941042, 0.00172267481065967, -3.20586035485633e-05, -0.00193768409037235, 0.00192870688600812, -0.000161767605168398, -0.00237948462336577, 0.0020701008524815, -0.000244084777583798, -0.0035126839425436, 0.00177838802038133, -0.00029139165189085, -0.00643494830912327, -0.000646172870047974, -0.000211384875117663, -0.0135222389153157, -0.0145356961926207, 7.9917025072436e-05, 0.0068603397747867, 0.00285680299273051]
-coefLPF35Hz=[0.00175336292638578, 0.00978327892956999, 0.0167385151616101, 0.00669041198496611, -0.00756333257658127, -0.0019483922714084, 0.0057421033413008, -0.00201145428004824, -0.00284226012544359, 0.00372625747572819, -0.000833361766635079, -0.00231012011400864, 0.00283376058109419, -0.000746599374001072, -0.00172249947831304, 0.00241397617582134, -0.000973825750524526, -0.00115912288539628, 0.00214703890167501, -0.0012822401420341, -0.000589374195905384, 0.00187926289091901, -0.00157615693129353, -3.94162545897447e-06, 0.00153467138176974, -0.00178628831299054, 0.00058530314524248, 0.00107727127726338, -0.00186244150866047, 0.00114213976566694, 0.000507191069024471, -0.00176432947048608, 0.00160988345835694, -0.000149176695256879, -0.001462477831643, 0.00192954692994136, -0.000845001090331968, -0.000960199356326279, 0.00204430620765693, -0.00150225789843754, -0.000282132958157979, 0.00190525625268826, -0.00203943895033887, 0.000514470331546287, 0.00149298207670749, -0.00236567228308576, 0.00134705348371988, 0.000815475255448599, -0.00241082519844367, 0.00211005890826097, -7.10061943198677e-05, -0.00212064028880477, 0.00268477905786897, -0.00108224193960099, -0.00148411485261648, 0.00296303554395536, -0.00209084620791387, -0.000532892766225161, 0.00285336278447557, -0.00295759852661457, 0.000647028018360992, 0.00231063271017895, -0.00352805270713479, 0.00192555749420387, 0.00133515583033075, -0.00367615611534783, 0.00313380073445073, 1.23983160310332e-06, -0.00330356499486846, 0.00408286741417603, -0.00156140644273001, -0.00237924409091354, 0.00458431821925222, -0.00316012926293031, -0.000931584031805445, 0.00448712710646839, -0.00457330547275904, 0.000915033184303625, 0.00369205770373294, -0.00556363505673277, 0.00296417436104825, 0.00219623519829229, -0.00589088286830296, 0.00496324817191853, 8.84324236510165e-05, -0.00537653710613381, 0.00659907505885512, -0.00246916959655214, -0.00394675158348709, 0.00754752347141279, -0.00519965317495319, -0.00160267416589831, 0.00755461305682618, -0.00771084631308182, 0.00153385552482682, 0.00638481117054204, -0.00962839606310401, 0.00517269909620838, 0.00391064869806669, -0.0105091148835438, 0.00897073157428244, 0.000152900861144492, -0.0099729072892059, 0.0124157408062659, -0.00475539630696992, -0.00764913503278458, 0.0149651422697844, -0.0105353739968417, -0.00325122650630152, 0.0159586524443214, -0.0168102112357627, 0.00352779517740275, 0.0146745439359386, -0.0231214976823395, 0.0130762469884326, 0.0100710911018838, -0.0289474893615958, 0.0264259929894756, 0.000189176759486424, -0.0338293690663983, 0.0468884503738621, -0.0206743475806261, -0.0373429141869986, 0.0904842518363126, -0.0855883002280699, -0.0391763496552328, 0.569952564417553, 0.569952564417553, -0.0391763496552328, -0.0855883002280699, 0.0904842518363126, -0.0373429141869986, -0.0206743475806261, 0.0468884503738621, -0.0338293690663983, 0.000189176759486424, 0.0264259929894756, -0.0289474893615958, 0.0100710911018838, 0.0130762469884326, -0.0231214976823395, 0.0146745439359386, 0.00352779517740275, -0.0168102112357627, 0.0159586524443214, -0.00325122650630152, -0.0105353739968417, 0.0149651422697844, -0.00764913503278458, -0.00475539630696992, 0.0124157408062659, -0.0099729072892059, 0.000152900861144492, 0.00897073157428244, -0.0105091148835438, 0.00391064869806669, 0.00517269909620838, -0.00962839606310401, 0.00638481117054204, 0.00153385552482682, -0.00771084631308182, 0.00755461305682618, -0.00160267416589831, -0.00519965317495319, 0.00754752347141279, -0.00394675158348709, -0.00246916959655214, 0.00659907505885512, -0.00537653710613381, 8.84324236510165e-05, 0.00496324817191853, -0.00589088286830296, 0.00219623519829229, 0.00296417436104825, -0.00556363505673277, 0.00369205770373294, 0.000915033184303625, -0.00457330547275904, 0.00448712710646839, -0.000931584031805445, -0.00316012926293031, 0.00458431821925222, -0.00237924409091354, -0.00156140644273001, 0.00408286741417603, -0.00330356499486846, 1.23983160310332e-06, 0.00313380073445073, -0.00367615611534783, 0.00133515583033075, 0.00192555749420387, -0.00352805270713479, 0.00231063271017895, 0.000647028018360992, -0.00295759852661457, 0.00285336278447557, -0.000532892766225161, -0.00209084620791387, 0.00296303554395536, -0.00148411485261648, -0.00108224193960099, 0.00268477905786897, -0.00212064028880477, -7.10061943198677e-05, 0.00211005890826097, -0.00241082519844367, 0.000815475255448599, 0.00134705348371988, -0.00236567228308576, 0.00149298207670749, 0.000514470331546287, -0.00203943895033887, 0.00190525625268826, -0.000282132958157979, -0.00150225789843754, 0.00204430620765693, -0.000960199356326279, -0.000845001090331968, 0.00192954692994136, -0.001462477831643, -0.000149176695256879, 0.00160988345835694, -0.00176432947048608, 0.000507191069024471, 0.00114213976566694, -0.00186244150866047, 0.00107727127726338, 0.00058530314524248, -0.00178628831299054, 0.00153467138176974, -3.94162545897447e-06, -0.00157615693129353, 0.00187926289091901, -0.000589374195905384, -0.0012822401420341, 0.00214703890167501, -0.00115912288539628, -0.000973825750524526, 0.00241397617582134, -0.00172249947831304, -0.000746599374001072, 0.00283376058109419, -0.00231012011400864, -0.000833361766635079, 0.00372625747572819, -0.00284226012544359, -0.00201145428004824, 0.0057421033413008, -0.0019483922714084, -0.00756333257658127, 0.00669041198496611, 0.0167385151616101, 0.00978327892956999, 0.00175336292638578]
-coefLPF36Hz=[-0.00504301001310579, -0.0154822631693373, -0.0126799401349031, 0.00422041201121857, 0.0050810509600277, -0.00520576808367204, 0.000113584734912658, 0.00365066771027227, -0.00323857275352688, 0.000132274266963544, 0.00250272484717232, -0.0026739016721776, 0.000703684320454189, 0.00155028719924618, -0.00235205533057406, 0.00129568986906054, 0.00062796141014429, -0.0019334178329788, 0.0017349163517142, -0.000287724386189575, -0.00129128154352378, 0.00187319538879541, -0.00109252386196892, -0.000448605860666648, 0.00163907154272767, -0.00164681833871654, 0.00048269112014469, 0.00102037003276463, -0.0018031006071699, 0.00130914503237705, 0.000121594195664463, -0.00148767292853298, 0.00182187163499387, -0.000867995434745181, -0.000726908232565038, 0.00184881061952583, -0.00168681562483544, 0.000317504161376191, 0.00132560496591561, -0.00208389848682904, 0.00138245227569277, 0.000335295522946374, -0.00188342718977111, 0.00214833829250201, -0.000887251577360591, -0.00106437315560936, 0.00234126693173206, -0.00199903097431404, 0.000209246210103384, 0.00181548574823732, -0.00263387835446681, 0.00160166270162361, 0.000627705864687333, -0.00251366195768136, 0.00269397339654243, -0.000945418471455347, -0.00155945106795269, 0.00308572121421289, -0.00245658206392837, 5.60699036241223e-05, 0.00253258771487773, -0.00341614352913215, 0.00190730756111022, 0.00104956026261794, -0.00342058451990615, 0.00344410084434817, -0.00100837486734868, -0.00228108175911904, 0.00411788489213119, -0.00308593081197251, -0.000209093361650333, 0.00352954366978247, -0.0045098672186693, 0.00230157702720174, 0.00168557340992515, -0.00467877284346394, 0.00448638742964602, -0.00106824874207625, -0.00332554618012568, 0.00558699654911462, -0.00395730394113304, -0.000606880035882516, 0.00500785605388136, -0.00608127170917525, 0.00284799293519904, 0.00264406405079877, -0.00657579408485989, 0.00602298656779425, -0.0011031064344164, -0.00493624156540546, 0.00783313302716603, -0.00528015097201781, -0.00126893258976273, 0.00736817098011599, -0.00858441042965814, 0.0036886288178334, 0.00424865391353469, -0.00973522736655961, 0.00860532451707963, -0.00113292296999436, -0.00779468085156262, 0.0118310672457383, -0.00762093583504899, -0.00253740740725167, 0.0118308470859301, -0.0134091242922862, 0.00532245452362248, 0.00756628230233285, -0.0163667100886745, 0.0141394398096863, -0.00115345537500679, -0.0144394844561305, 0.0214934712813019, -0.0135229405250221, -0.00596183701357068, 0.0244018095590924, -0.0277955401305589, 0.0104837567917803, 0.0191362348097036, -0.041637454254, 0.037637026734169, -0.00116721513580274, -0.0525952754833737, 0.0900902577803731, -0.0697824611933594, -0.0586501751299431, 0.578587906454901, 0.578587906454901, -0.0586501751299431, -0.0697824611933594, 0.0900902577803731, -0.0525952754833737, -0.00116721513580274, 0.037637026734169, -0.041637454254, 0.0191362348097036, 0.0104837567917803, -0.0277955401305589, 0.0244018095590924, -0.00596183701357068, -0.0135229405250221, 0.0214934712813019, -0.0144394844561305, -0.00115345537500679, 0.0141394398096863, -0.0163667100886745, 0.00756628230233285, 0.00532245452362248, -0.0134091242922862, 0.0118308470859301, -0.00253740740725167, -0.00762093583504899, 0.0118310672457383, -0.00779468085156262, -0.00113292296999436, 0.00860532451707963, -0.00973522736655961, 0.00424865391353469, 0.0036886288178334, -0.00858441042965814, 0.00736817098011599, -0.00126893258976273, -0.00528015097201781, 0.00783313302716603, -0.00493624156540546, -0.0011031064344164, 0.00602298656779425, -0.00657579408485989, 0.00264406405079877, 0.00284799293519904, -0.00608127170917525, 0.00500785605388136, -0.000606880035882516, -0.00395730394113304, 0.00558699654911462, -0.00332554618012568, -0.00106824874207625, 0.00448638742964602, -0.00467877284346394, 0.00168557340992515, 0.00230157702720174, -0.0045098672186693, 0.00352954366978247, -0.000209093361650333, -0.00308593081197251, 0.00411788489213119, -0.00228108175911904, -0.00100837486734868, 0.00344410084434817, -0.00342058451990615, 0.00104956026261794, 0.00190730756111022, -0.00341614352913215, 0.00253258771487773, 5.60699036241223e-05, -0.00245658206392837, 0.00308572121421289, -0.00155945106795269, -0.000945418471455347, 0.00269397339654243, -0.00251366195768136, 0.000627705864687333, 0.00160166270162361, -0.00263387835446681, 0.00181548574823732, 0.000209246210103384, -0.00199903097431404, 0.00234126693173206, -0.00106437315560936, -0.000887251577360591, 0.00214833829250201, -0.00188342718977111, 0.000335295522946374, 0.00138245227569277, -0.00208389848682904, 0.00132560496591561, 0.000317504161376191, -0.00168681562483544, 0.00184881061952583, -0.000726908232565038, -0.000867995434745181, 0.00182187163499387, -0.00148767292853298, 0.000121594195664463, 0.00130914503237705, -0.0018031006071699, 0.00102037003276463, 0.00048269112014469, -0.00164681833871654, 0.00163907154272767, -0.000448605860666648, -0.00109252386196892, 0.00187319538879541, -0.00129128154352378, -0.000287724386189575, 0.0017349163517142, -0.0019334178329788, 0.00062796141014429, 0.00129568986906054, -0.00235205533057406, 0.00155028719924618, 0.000703684320454189, -0.0026739016721776, 0.00250272484717232, 0.000132274266963544, -0.00323857275352688, 0.00365066771027227, 0.000113584734912658, -0.00520576808367204, 0.0050810509600277, 0.00422041201121857, -0.0126799401349031, -0.0154822631693373, -0.00504301001310579]
-coefLPF37Hz=[-0.00146228958600278, -0.0100627044221106, -0.0176254246679519, -0.00522636503242834, 0.00850439265252542, -0.000774570031654428, -0.00484474598690906, 0.00430344031548382, -0.000276569712034378, -0.00300868805566172, 0.00330037054936897, -0.0011054185950494, -0.00151790024105843, 0.00269251028017585, -0.00187266791341722, -0.000106989893563079, 0.00180898896833126, -0.00217326204899353, 0.00110839321287938, 0.000589437630656635, -0.00180904694258231, 0.00182977247812762, -0.000700536716276222, -0.000824385544149573, 0.00179432090731253, -0.00163239520349095, 0.000462702897871803, 0.000983986305955797, -0.00181682428807981, 0.00153136817762828, -0.000300923143051465, -0.00112740965367989, 0.00188360139778181, -0.00149371292919939, 0.000173037327940325, 0.00128927125321375, -0.00199492997520184, 0.00148827003704736, -4.63461854447664e-05, -0.00147502741804233, 0.00213982690839492, -0.00150209608350466, -9.3474674410433e-05, 0.00169309210142984, -0.00230822345925208, 0.00151918204989956, 0.000248048539927157, -0.00194038297303904, 0.00250236375798025, -0.00153756955684682, -0.000427412087173273, 0.00222229120618189, -0.0027213798968337, 0.00154923305821153, 0.000642473170790637, -0.00254174460626285, 0.00295403753832184, -0.00154841879669054, -0.00089134991143005, 0.00289707360887748, -0.00320389700804985, 0.00153449845327986, 0.00117620515143232, -0.0032971846421917, 0.00347534017262802, -0.00150322988936066, -0.00150968161328402, 0.00374770595224627, -0.00376960820967839, 0.0014451940712315, 0.00190380205958911, -0.00425060627862872, 0.00408024006866145, -0.00135821855353525, -0.00235714692628565, 0.00481835080953393, -0.00441451890427636, 0.00124496764590393, 0.00289552952775665, -0.0054568300890992, 0.00479365144583083, -0.0010718450800822, -0.00351680112644173, 0.00620706477229682, -0.00518798184665277, 0.000858075388272781, 0.00426158947049112, -0.00706790701683497, 0.00563694138552104, -0.00058256779867126, -0.00516073193848111, 0.00808987121032619, -0.00615693356679697, 0.000219523447401537, 0.00627497571612876, -0.00932707033082059, 0.0067597312748566, 0.000257065841611821, -0.00767542521025941, 0.0108684887430494, -0.00750190159383656, -0.00089663315431617, 0.00949697082561636, -0.0128905211192032, 0.00844473098368397, 0.00179939664377682, -0.0119789574757544, 0.015649765538014, -0.00974458293005056, -0.00311765895236813, 0.015611907256096, -0.019733186034025, 0.011679578548081, 0.00521093930193859, -0.021483459466298, 0.0265258319249841, -0.0149781934445752, -0.00905187471588031, 0.0327138081911151, -0.0403593278291302, 0.0222261698931903, 0.0184367841051959, -0.0636530243554246, 0.0853564229890635, -0.0522890050952593, -0.0775583291068711, 0.58663449866295, 0.58663449866295, -0.0775583291068711, -0.0522890050952593, 0.0853564229890635, -0.0636530243554246, 0.0184367841051959, 0.0222261698931903, -0.0403593278291302, 0.0327138081911151, -0.00905187471588031, -0.0149781934445752, 0.0265258319249841, -0.021483459466298, 0.00521093930193859, 0.011679578548081, -0.019733186034025, 0.015611907256096, -0.00311765895236813, -0.00974458293005056, 0.015649765538014, -0.0119789574757544, 0.00179939664377682, 0.00844473098368397, -0.0128905211192032, 0.00949697082561636, -0.00089663315431617, -0.00750190159383656, 0.0108684887430494, -0.00767542521025941, 0.000257065841611821, 0.0067597312748566, -0.00932707033082059, 0.00627497571612876, 0.000219523447401537, -0.00615693356679697, 0.00808987121032619, -0.00516073193848111, -0.00058256779867126, 0.00563694138552104, -0.00706790701683497, 0.00426158947049112, 0.000858075388272781, -0.00518798184665277, 0.00620706477229682, -0.00351680112644173, -0.0010718450800822, 0.00479365144583083, -0.0054568300890992, 0.00289552952775665, 0.00124496764590393, -0.00441451890427636, 0.00481835080953393, -0.00235714692628565, -0.00135821855353525, 0.00408024006866145, -0.00425060627862872, 0.00190380205958911, 0.0014451940712315, -0.00376960820967839, 0.00374770595224627, -0.00150968161328402, -0.00150322988936066, 0.00347534017262802, -0.0032971846421917, 0.00117620515143232, 0.00153449845327986, -0.00320389700804985, 0.00289707360887748, -0.00089134991143005, -0.00154841879669054, 0.00295403753832184, -0.00254174460626285, 0.000642473170790637, 0.00154923305821153, -0.0027213798968337, 0.00222229120618189, -0.000427412087173273, -0.00153756955684682, 0.00250236375798025, -0.00194038297303904, 0.000248048539927157, 0.00151918204989956, -0.00230822345925208, 0.00169309210142984, -9.3474674410433e-05, -0.00150209608350466, 0.00213982690839492, -0.00147502741804233, -4.63461854447664e-05, 0.00148827003704736, -0.00199492997520184, 0.00128927125321375, 0.000173037327940325, -0.00149371292919939, 0.00188360139778181, -0.00112740965367989, -0.000300923143051465, 0.00153136817762828, -0.00181682428807981, 0.000983986305955797, 0.000462702897871803, -0.00163239520349095, 0.00179432090731253, -0.000824385544149573, -0.000700536716276222, 0.00182977247812762, -0.00180904694258231, 0.000589437630656635, 0.00110839321287938, -0.00217326204899353, 0.00180898896833126, -0.000106989893563079, -0.00187266791341722, 0.00269251028017585, -0.00151790024105843, -0.0011054185950494, 0.00330037054936897, -0.00300868805566172, -0.000276569712034378, 0.00430344031548382, -0.00484474598690906, -0.000774570031654428, 0.00850439265252542, -0.00522636503242834, -0.0176254246679519, -0.0100627044221106, -0.00146228958600278]
-coefLPF38Hz=[0.00556377022421381, 0.0168958919069672, 0.0117028384647876, -0.00649855627606371, -0.00282416581369619, 0.0058336244637295, -0.00304016358534315, -0.00127213196739831, 0.00360431892815931, -0.00296827004156462, 0.000509217554068255, 0.00185020196836822, -0.00271189525852174, 0.00183136917326665, 1.54435798550017e-05, -0.00165319801459167, 0.00219605016725842, -0.00146433002318292, -2.34945360318276e-05, 0.00140109125625658, -0.00194373368883927, 0.00141151356654233, -0.000141498920013114, -0.00116478855641356, 0.00182006637386168, -0.00149908073508826, 0.000386937895696986, 0.000926058435981389, -0.00175051530732792, 0.00165331244796104, -0.000681425473526948, -0.000664436091886016, 0.00168197073093267, -0.00183019134817422, 0.00101608319581012, 0.00035593080793138, -0.00157974527012273, 0.00200893866584757, -0.00138647934961204, 7.49834296356845e-06, 0.00142731069968287, -0.0021599291851764, 0.00177673274173392, -0.000433289613848033, -0.00119806436164654, 0.00226350871706677, -0.00217296530443128, 0.000921609722646867, 0.000878820270550035, -0.00229397760750376, 0.00255229724901391, -0.00146826225536231, -0.000454465508259041, 0.00222113945124671, -0.00290348164102163, 0.00205360377673624, -9.3578278910547e-05, -0.00204179491133373, 0.003171881798408, -0.00268741652257747, 0.000743908790816315, 0.00170702739191193, -0.0033591971657888, 0.00332025022232841, -0.00150787363009598, -0.00121338727907307, 0.00341808561107111, -0.00392325211455076, 0.00237362385234664, 0.000536007516359475, -0.00331433600430135, 0.00446965002175619, -0.00331627067456158, 0.000334586836748353, 0.00300174595366175, -0.00492052947988026, 0.00432374207243919, -0.00139476665948525, -0.00245074900267459, 0.00521970246233601, -0.00536344895366247, 0.00265028660944688, 0.00163586180753488, -0.00530761936248486, 0.0063793900556683, -0.00410985216010737, -0.000503796318753623, 0.00514083215431779, -0.00733047282340292, 0.00574862931492899, -0.000990527504257665, -0.00463181742197847, 0.00816893814753937, -0.0075811497643342, 0.00288158059033841, 0.00371271687635713, -0.00881649769749665, 0.00958199789483552, -0.00525662824651108, -0.0022571091201266, 0.00919482599483245, -0.0117767035307335, 0.00822636711777879, 0.000104715067053885, -0.00918387695860428, 0.0141991944887186, -0.0120207340342146, 0.00304836502463396, 0.00863144835014639, -0.0169858567314028, 0.0170711954799611, -0.00774719069305656, -0.00719740926063028, 0.0204347431880904, -0.0244284932942646, 0.0153935953545454, 0.00412825341437047, -0.0254887041919038, 0.0372093019731313, -0.0302768883754257, 0.00312414929216733, 0.0358895928093598, -0.0696585429084395, 0.0765044802376397, -0.0334895457576833, -0.0958098966212498, 0.594117180696219, 0.594117180696219, -0.0958098966212498, -0.0334895457576833, 0.0765044802376397, -0.0696585429084395, 0.0358895928093598, 0.00312414929216733, -0.0302768883754257, 0.0372093019731313, -0.0254887041919038, 0.00412825341437047, 0.0153935953545454, -0.0244284932942646, 0.0204347431880904, -0.00719740926063028, -0.00774719069305656, 0.0170711954799611, -0.0169858567314028, 0.00863144835014639, 0.00304836502463396, -0.0120207340342146, 0.0141991944887186, -0.00918387695860428, 0.000104715067053885, 0.00822636711777879, -0.0117767035307335, 0.00919482599483245, -0.0022571091201266, -0.00525662824651108, 0.00958199789483552, -0.00881649769749665, 0.00371271687635713, 0.00288158059033841, -0.0075811497643342, 0.00816893814753937, -0.00463181742197847, -0.000990527504257665, 0.00574862931492899, -0.00733047282340292, 0.00514083215431779, -0.000503796318753623, -0.00410985216010737, 0.0063793900556683, -0.00530761936248486, 0.00163586180753488, 0.00265028660944688, -0.00536344895366247, 0.00521970246233601, -0.00245074900267459, -0.00139476665948525, 0.00432374207243919, -0.00492052947988026, 0.00300174595366175, 0.000334586836748353, -0.00331627067456158, 0.00446965002175619, -0.00331433600430135, 0.000536007516359475, 0.00237362385234664, -0.00392325211455076, 0.00341808561107111, -0.00121338727907307, -0.00150787363009598, 0.00332025022232841, -0.0033591971657888, 0.00170702739191193, 0.000743908790816315, -0.00268741652257747, 0.003171881798408, -0.00204179491133373, -9.3578278910547e-05, 0.00205360377673624, -0.00290348164102163, 0.00222113945124671, -0.000454465508259041, -0.00146826225536231, 0.00255229724901391, -0.00229397760750376, 0.000878820270550035, 0.000921609722646867, -0.00217296530443128, 0.00226350871706677, -0.00119806436164654, -0.000433289613848033, 0.00177673274173392, -0.0021599291851764, 0.00142731069968287, 7.49834296356845e-06, -0.00138647934961204, 0.00200893866584757, -0.00157974527012273, 0.00035593080793138, 0.00101608319581012, -0.00183019134817422, 0.00168197073093267, -0.000664436091886016, -0.000681425473526948, 0.00165331244796104, -0.00175051530732792, 0.000926058435981389, 0.000386937895696986, -0.00149908073508826, 0.00182006637386168, -0.00116478855641356, -0.000141498920013114, 0.00141151356654233, -0.00194373368883927, 0.00140109125625658, -2.34945360318276e-05, -0.00146433002318292, 0.00219605016725842, -0.00165319801459167, 1.54435798550017e-05, 0.00183136917326665, -0.00271189525852174, 0.00185020196836822, 0.000509217554068255, -0.00296827004156462, 0.00360431892815931, -0.00127213196739831, -0.00304016358534315, 0.0058336244637295, -0.00282416581369619, -0.00649855627606371, 0.0117028384647876, 0.0168958919069672, 0.00556377022421381]
-coefLPF39Hz=[9.42810424089733e-05, 0.00833926353671592, 0.0188445987915847, 0.00609054216274982, -0.00842014716408338, 0.00240795415622808, 0.00302585163253398, -0.0046114823763953, 0.0028274340650159, 0.000217574534348772, -0.00249907510064289, 0.00298598482847347, -0.00181119390267464, -0.000125379910178158, 0.00174996857648257, -0.00232419865195098, 0.00171589254552499, -0.000343749577068911, -0.00107953354134619, 0.00190286477097725, -0.00180560179599356, 0.000887851605105493, 0.000395343482446229, -0.00145835454527741, 0.00183962394611783, -0.00138879046640883, 0.000324249055792038, 0.000878129966893682, -0.00169144888766195, 0.00175643678854981, -0.00103846770247323, -0.000152362601699402, 0.00129667923574648, -0.00188740074249555, 0.00164995310024307, -0.000670372982965605, -0.000637785377599817, 0.00170240360359148, -0.00204019817847881, 0.0014794543870303, -0.000237785055096965, -0.00116030652307526, 0.00209437104628073, -0.00212732082378414, 0.00121105429762521, 0.000286738554296817, -0.00172480850968415, 0.00245405004620511, -0.00211427285939581, 0.000811278027159643, 0.00091672545510348, -0.00231749759851633, 0.00274433329058909, -0.00195733235496394, 0.000254676718302891, 0.00164416003855252, -0.00290126702151124, 0.00291851618360208, -0.00162426133637628, -0.000461593299077702, 0.00244748764268182, -0.0034405953279224, 0.00293730807293952, -0.00108752899788644, -0.00134629426243616, 0.00330606432673665, -0.0038844400442065, 0.00274492587719341, -0.000312838096091318, -0.00238977887241339, 0.00416696414701718, -0.0041656659323532, 0.00229609061874025, 0.000707478642116751, -0.00356386770022239, 0.00497572535427126, -0.00423717664795898, 0.00155017486962748, 0.00199112688281947, -0.00484050627622812, 0.00568669007629634, -0.00402024185931262, 0.000449806291688098, 0.0035425995016924, -0.00618796033669757, 0.00620900635619422, -0.00344905156956063, -0.00106154407949982, 0.00536342351609236, -0.00756435494348491, 0.00647723601545513, -0.00240634005478559, -0.0030350131531525, 0.00751017015272169, -0.00889687576642878, 0.00637409555571206, -0.000781382346261733, -0.00561729072801147, 0.00997553241178378, -0.0101629985826274, 0.0057624288031682, 0.00164910296665998, -0.00899102875814995, 0.0129099706181294, -0.0113100496444115, 0.00438325539129973, 0.00528471845258076, -0.0135901876159356, 0.0165871905157713, -0.0122871756397858, 0.00175559815403271, 0.0110157682557509, -0.0204909181107826, 0.0218111533182902, -0.0130613204543223, -0.00344020849140116, 0.0215061900439849, -0.0330879560950017, 0.0313221895769505, -0.0136020586917544, -0.0164745348235174, 0.0490892294583174, -0.0701337158310568, 0.0639708274762262, -0.0138677687015364, -0.113199979156825, 0.601006323258721, 0.601006323258721, -0.113199979156825, -0.0138677687015364, 0.0639708274762262, -0.0701337158310568, 0.0490892294583174, -0.0164745348235174, -0.0136020586917544, 0.0313221895769505, -0.0330879560950017, 0.0215061900439849, -0.00344020849140116, -0.0130613204543223, 0.0218111533182902, -0.0204909181107826, 0.0110157682557509, 0.00175559815403271, -0.0122871756397858, 0.0165871905157713, -0.0135901876159356, 0.00528471845258076, 0.00438325539129973, -0.0113100496444115, 0.0129099706181294, -0.00899102875814995, 0.00164910296665998, 0.0057624288031682, -0.0101629985826274, 0.00997553241178378, -0.00561729072801147, -0.000781382346261733, 0.00637409555571206, -0.00889687576642878, 0.00751017015272169, -0.0030350131531525, -0.00240634005478559, 0.00647723601545513, -0.00756435494348491, 0.00536342351609236, -0.00106154407949982, -0.00344905156956063, 0.00620900635619422, -0.00618796033669757, 0.0035425995016924, 0.000449806291688098, -0.00402024185931262, 0.00568669007629634, -0.00484050627622812, 0.00199112688281947, 0.00155017486962748, -0.00423717664795898, 0.00497572535427126, -0.00356386770022239, 0.000707478642116751, 0.00229609061874025, -0.0041656659323532, 0.00416696414701718, -0.00238977887241339, -0.000312838096091318, 0.00274492587719341, -0.0038844400442065, 0.00330606432673665, -0.00134629426243616, -0.00108752899788644, 0.00293730807293952, -0.0034405953279224, 0.00244748764268182, -0.000461593299077702, -0.00162426133637628, 0.00291851618360208, -0.00290126702151124, 0.00164416003855252, 0.000254676718302891, -0.00195733235496394, 0.00274433329058909, -0.00231749759851633, 0.00091672545510348, 0.000811278027159643, -0.00211427285939581, 0.00245405004620511, -0.00172480850968415, 0.000286738554296817, 0.00121105429762521, -0.00212732082378414, 0.00209437104628073, -0.00116030652307526, -0.000237785055096965, 0.0014794543870303, -0.00204019817847881, 0.00170240360359148, -0.000637785377599817, -0.000670372982965605, 0.00164995310024307, -0.00188740074249555, 0.00129667923574648, -0.000152362601699402, -0.00103846770247323, 0.00175643678854981, -0.00169144888766195, 0.000878129966893682, 0.000324249055792038, -0.00138879046640883, 0.00183962394611783, -0.00145835454527741, 0.000395343482446229, 0.000887851605105493, -0.00180560179599356, 0.00190286477097725, -0.00107953354134619, -0.000343749577068911, 0.00171589254552499, -0.00232419865195098, 0.00174996857648257, -0.000125379910178158, -0.00181119390267464, 0.00298598482847347, -0.00249907510064289, 0.000217574534348772, 0.0028274340650159, -0.0046114823763953, 0.00302585163253398, 0.00240795415622808, -0.00842014716408338, 0.00609054216274982, 0.0188445987915847, 0.00833926353671592, 9.42810424089733e-05]
-coefLPF40Hz=[-0.00616084580586884, -0.0182744481117102, -0.0102328867246698, 0.00831702722149104, -5.00247176442262e-05, -0.00488920382954998, 0.00490977284559682, -0.00196559701875344, -0.00132894328182734, 0.0031943676462941, -0.00310582166244603, 0.0015590771122309, 0.000455367451557623, -0.00198318401200039, 0.0024663949131529, -0.00186243187478796, 0.000555606114256565, 0.000857594978708868, -0.00182100994672236, 0.00200654818923079, -0.00140634127709938, 0.000299067092889177, 0.000877175141050193, -0.00168259029826228, 0.00183581284200123, -0.00130153363424038, 0.000289190063582947, 0.000822907035312236, -0.00162849292438517, 0.00183474651113078, -0.00136337827338247, 0.000383799906031645, 0.000752769603054677, -0.00163484904559245, 0.00193227489697253, -0.00152386420302273, 0.000540362836012898, 0.000672211796864824, -0.00167408466371674, 0.00209394322098748, -0.00175444708186929, 0.000752621711792763, 0.000568620116871362, -0.00173540624214969, 0.00230698820451235, -0.00204611793515293, 0.00101251309771217, 0.000442909408106074, -0.00179909424111013, 0.00255155239235011, -0.00238538650614012, 0.00133389143300499, 0.000280385633926703, -0.00184364199946066, 0.00282639488555979, -0.00277650889032201, 0.00171554339414809, 4.44997109761026e-05, -0.00188567039963831, 0.00310095938091033, -0.00324085187656693, 0.00217715209778493, -0.000239929064363069, -0.00187243954825971, 0.00340562092936136, -0.0037599580082224, 0.00272194014354247, -0.000618605285226948, -0.00181913848374706, 0.00371908775322764, -0.00433915521206826, 0.00337135745635312, -0.0011005243514258, -0.00169882391541586, 0.00402887956943951, -0.00499597296080725, 0.00415082672188571, -0.00171280567996367, -0.00149539116223297, 0.00433889628584984, -0.00574107887032757, 0.00508385433445234, -0.00248861199398208, -0.00118813443456709, 0.00464251266358956, -0.00658578284487269, 0.00620414861900364, -0.00347989625427854, -0.000722074456396899, 0.00492835181195818, -0.00757848451961552, 0.00758446566038068, -0.00476325389225293, -4.6275484848644e-05, 0.00519510947515568, -0.00877859987891262, 0.00934481104985202, -0.00645180032559033, 0.000911984079222553, 0.00542909495452907, -0.010270751981262, 0.0116716073312113, -0.00880033178155473, 0.00233486769615221, 0.00563693351714177, -0.0122836908758187, 0.0149624706175303, -0.0122548188539849, 0.00455997379895413, 0.00581027685695387, -0.0152754318354351, 0.0201422154628583, -0.0179215528010377, 0.00841490964814888, 0.00594112636342079, -0.0205354060610726, 0.0298531357443455, -0.0292644389060542, 0.0167299205431605, 0.00603661416305724, -0.0333627595172244, 0.0564789327536939, -0.0650381240543957, 0.0483655507035287, 0.00608014795406053, -0.129576272865365, 0.607300295575799, 0.607300295575799, -0.129576272865365, 0.00608014795406053, 0.0483655507035287, -0.0650381240543957, 0.0564789327536939, -0.0333627595172244, 0.00603661416305724, 0.0167299205431605, -0.0292644389060542, 0.0298531357443455, -0.0205354060610726, 0.00594112636342079, 0.00841490964814888, -0.0179215528010377, 0.0201422154628583, -0.0152754318354351, 0.00581027685695387, 0.00455997379895413, -0.0122548188539849, 0.0149624706175303, -0.0122836908758187, 0.00563693351714177, 0.00233486769615221, -0.00880033178155473, 0.0116716073312113, -0.010270751981262, 0.00542909495452907, 0.000911984079222553, -0.00645180032559033, 0.00934481104985202, -0.00877859987891262, 0.00519510947515568, -4.6275484848644e-05, -0.00476325389225293, 0.00758446566038068, -0.00757848451961552, 0.00492835181195818, -0.000722074456396899, -0.00347989625427854, 0.00620414861900364, -0.00658578284487269, 0.00464251266358956, -0.00118813443456709, -0.00248861199398208, 0.00508385433445234, -0.00574107887032757, 0.00433889628584984, -0.00149539116223297, -0.00171280567996367, 0.00415082672188571, -0.00499597296080725, 0.00402887956943951, -0.00169882391541586, -0.0011005243514258, 0.00337135745635312, -0.00433915521206826, 0.00371908775322764, -0.00181913848374706, -0.000618605285226948, 0.00272194014354247, -0.0037599580082224, 0.00340562092936136, -0.00187243954825971, -0.000239929064363069, 0.00217715209778493, -0.00324085187656693, 0.00310095938091033, -0.00188567039963831, 4.44997109761026e-05, 0.00171554339414809, -0.00277650889032201, 0.00282639488555979, -0.00184364199946066, 0.000280385633926703, 0.00133389143300499, -0.00238538650614012, 0.00255155239235011, -0.00179909424111013, 0.000442909408106074, 0.00101251309771217, -0.00204611793515293, 0.00230698820451235, -0.00173540624214969, 0.000568620116871362, 0.000752621711792763, -0.00175444708186929, 0.00209394322098748, -0.00167408466371674, 0.000672211796864824, 0.000540362836012898, -0.00152386420302273, 0.00193227489697253, -0.00163484904559245, 0.000752769603054677, 0.000383799906031645, -0.00136337827338247, 0.00183474651113078, -0.00162849292438517, 0.000822907035312236, 0.000289190063582947, -0.00130153363424038, 0.00183581284200123, -0.00168259029826228, 0.000877175141050193, 0.000299067092889177, -0.00140634127709938, 0.00200654818923079, -0.00182100994672236, 0.000857594978708868, 0.000555606114256565, -0.00186243187478796, 0.0024663949131529, -0.00198318401200039, 0.000455367451557623, 0.0015590771122309, -0.00310582166244603, 0.0031943676462941, -0.00132894328182734, -0.00196559701875344, 0.00490977284559682, -0.00488920382954998, -5.00247176442262e-05, 0.00831702722149104, -0.0102328867246698, -0.0182744481117102, -0.00616084580586884]
-coefLPF41Hz=[0.00715548873555526, 0.00856079791480472, -0.0121105370977346, -0.014627767425147, 0.000391465799856867, -0.00626005632087411, -0.00425945667635335, 0.0012994470921228, -0.00481386531610723, 0.000966874422905459, -0.000862253261717906, -0.00201294497841898, 0.00195020855389425, -0.00250786591502609, 0.00121503151955615, -0.000323923008631266, -0.00107831895375422, 0.00167599088450959, -0.00195345657929542, 0.00142808660081352, -0.000611711459228742, -0.000446766628883931, 0.00127697508112371, -0.00174146977103243, 0.00164718076947226, -0.00107407870002495, 0.000173527948798447, 0.000779856155475526, -0.00150337402679703, 0.00178920503504945, -0.00153797030742668, 0.000828897423924241, 0.000149949341364333, -0.00110034488795049, 0.00175733700624709, -0.00190046940894045, 0.00148285027695339, -0.000605219937589516, -0.000484687614494668, 0.00147279903775715, -0.00205594625199844, 0.00204340525990576, -0.00142029002229826, 0.000341517458039464, 0.000887229532611595, -0.00190299689042127, 0.00239383896299161, -0.00218598427217443, 0.00131071682622456, 9.52767999227826e-07, -0.00137544832537625, 0.00240255431852791, -0.00275461009395642, 0.002296512566667, -0.00111979664514344, -0.000448703808845319, 0.00196719907376392, -0.00296272561005204, 0.00312133944983936, -0.0023412536673624, 0.000819740003163358, 0.00102811881512114, -0.00266148151332341, 0.00357688630964306, -0.00346623253757353, 0.00230147562586185, -0.000385346227732417, -0.00175013050057395, 0.00347091528571051, -0.00424934745884716, 0.00377366007899659, -0.00214601917415501, -0.000211317959251504, 0.00264852480709167, -0.00442901758628402, 0.00495530177318397, -0.00402676446132391, 0.00184701649655893, 0.00103504034681231, -0.00376606441170745, 0.00552035040640034, -0.00571803680327403, 0.00420047987735418, -0.00133098232206862, -0.0021145964989777, 0.00514886372618332, -0.00681883579423527, 0.0065323284353491, -0.00426484619800628, 0.000547740163089385, 0.00357392930302758, -0.00690503755762769, 0.00838765402872452, -0.00742803672262007, 0.00415866597519747, 0.000626505381623146, -0.00557827162687924, 0.00922554881481328, -0.0103629197513498, 0.00844713274566166, -0.00380231218169002, -0.00241017970592104, 0.00845350355146437, -0.0124798099796805, 0.0130789524218385, -0.00972702914988546, 0.00303661739374463, 0.00531444439041624, -0.0130010748831993, 0.017583719454268, -0.0173013225251775, 0.0115985654410164, -0.00144459030513668, -0.0107145210771351, 0.021506686443436, -0.0273830788625342, 0.0256560112795093, -0.0152732289113558, -0.00257682203631737, 0.0243882726488619, -0.0447807465177728, 0.0571893753829821, -0.0547619628268407, 0.0303913813189154, 0.0259317048197177, -0.144844920358823, 0.613014631484958, 0.613014631484958, -0.144844920358823, 0.0259317048197177, 0.0303913813189154, -0.0547619628268407, 0.0571893753829821, -0.0447807465177728, 0.0243882726488619, -0.00257682203631737, -0.0152732289113558, 0.0256560112795093, -0.0273830788625342, 0.021506686443436, -0.0107145210771351, -0.00144459030513668, 0.0115985654410164, -0.0173013225251775, 0.017583719454268, -0.0130010748831993, 0.00531444439041624, 0.00303661739374463, -0.00972702914988546, 0.0130789524218385, -0.0124798099796805, 0.00845350355146437, -0.00241017970592104, -0.00380231218169002, 0.00844713274566166, -0.0103629197513498, 0.00922554881481328, -0.00557827162687924, 0.000626505381623146, 0.00415866597519747, -0.00742803672262007, 0.00838765402872452, -0.00690503755762769, 0.00357392930302758, 0.000547740163089385, -0.00426484619800628, 0.0065323284353491, -0.00681883579423527, 0.00514886372618332, -0.0021145964989777, -0.00133098232206862, 0.00420047987735418, -0.00571803680327403, 0.00552035040640034, -0.00376606441170745, 0.00103504034681231, 0.00184701649655893, -0.00402676446132391, 0.00495530177318397, -0.00442901758628402, 0.00264852480709167, -0.000211317959251504, -0.00214601917415501, 0.00377366007899659, -0.00424934745884716, 0.00347091528571051, -0.00175013050057395, -0.000385346227732417, 0.00230147562586185, -0.00346623253757353, 0.00357688630964306, -0.00266148151332341, 0.00102811881512114, 0.000819740003163358, -0.0023412536673624, 0.00312133944983936, -0.00296272561005204, 0.00196719907376392, -0.000448703808845319, -0.00111979664514344, 0.002296512566667, -0.00275461009395642, 0.00240255431852791, -0.00137544832537625, 9.52767999227826e-07, 0.00131071682622456, -0.00218598427217443, 0.00239383896299161, -0.00190299689042127, 0.000887229532611595, 0.000341517458039464, -0.00142029002229826, 0.00204340525990576, -0.00205594625199844, 0.00147279903775715, -0.000484687614494668, -0.000605219937589516, 0.00148285027695339, -0.00190046940894045, 0.00175733700624709, -0.00110034488795049, 0.000149949341364333, 0.000828897423924241, -0.00153797030742668, 0.00178920503504945, -0.00150337402679703, 0.000779856155475526, 0.000173527948798447, -0.00107407870002495, 0.00164718076947226, -0.00174146977103243, 0.00127697508112371, -0.000446766628883931, -0.000611711459228742, 0.00142808660081352, -0.00195345657929542, 0.00167599088450959, -0.00107831895375422, -0.000323923008631266, 0.00121503151955615, -0.00250786591502609, 0.00195020855389425, -0.00201294497841898, -0.000862253261717906, 0.000966874422905459, -0.00481386531610723, 0.0012994470921228, -0.00425945667635335, -0.00626005632087411, 0.000391465799856867, -0.014627767425147, -0.0121105370977346, 0.00856079791480472, 0.00715548873555526]
-coefLPF42Hz=[0.00635191213974269, 0.0192253427619028, 0.00893178066843361, -0.00934126533859537, 0.00265167064325015, 0.00283446964550318, -0.00493096177564419, 0.00414848758886968, -0.00186464384049269, -0.000593795271820441, 0.00233502520756554, -0.00297846864201631, 0.00257399081790882, -0.00144988187344571, 5.28364401207581e-05, 0.00119159099875811, -0.00197934250790946, 0.00216643024202234, -0.00177182342094554, 0.00095190234112807, 5.62954212466635e-05, -0.000996898066543565, 0.00165072949541043, -0.00187943698519934, 0.00164853019049648, -0.00102753094758355, 0.000170470562950339, 0.000720055576367679, -0.00143825074019611, 0.00181830193005744, -0.00177138874828307, 0.00130624010405029, -0.000525449531721328, -0.000394915634716385, 0.00124358535020915, -0.00182103908058209, 0.00198399690847988, -0.00168310987329064, 0.00097439161253333, -9.63647823553921e-06, -0.000991808853806958, 0.00179571366415832, -0.00220488623913932, 0.0021086299098513, -0.00151094320525423, 0.000528414248419435, 0.000621589162295764, -0.00167709216782091, 0.00237974025878014, -0.0025563990619767, 0.00212276146509357, -0.00118413165274588, -0.000107254972694283, 0.00140684401334843, -0.00246519488392428, 0.00296937668781301, -0.00279416481660564, 0.00196088914669043, -0.000598688861729809, -0.000962784264906791, 0.00236973034665188, -0.00330121271635187, 0.00348461611777791, -0.00284491379595518, 0.00150995227435177, 0.000259377523508014, -0.0020678515274724, 0.00347174904887673, -0.0041260200093996, 0.00384464425421152, -0.00262930928001616, 0.000715625515815454, 0.00146465664131074, -0.00341349190207681, 0.00466968850661756, -0.004887624325341, 0.00394757679142613, -0.00201828303368054, -0.000493145036319366, 0.00303604386923004, -0.00501476865365617, 0.00591965478184217, -0.0054662696540434, 0.00368473267928236, -0.000923477478886969, -0.00223004685375001, 0.0050608584117639, -0.00686951373388578, 0.00715481627399956, -0.00575320004887295, 0.00289107889092077, 0.000851437315416613, -0.00465816247808752, 0.00763116643767058, -0.00899621931917942, 0.00831178511256419, -0.00558762509312657, 0.00131912280605555, 0.00360981519195988, -0.00808464559964864, 0.0110016971360704, -0.0115258415342225, 0.00932687223737152, -0.00467429686050536, -0.00154859576729954, 0.00802919818495303, -0.0132483968543757, 0.0158292410507553, -0.0148623509507433, 0.0101477679025283, -0.00235152790154772, -0.00707367931879509, 0.0161069848806107, -0.0225376565398666, 0.0244304090483399, -0.0205465133983425, 0.0107205656401548, 0.00393802972375228, -0.0210904190553693, 0.0373793935453576, -0.0488042808020503, 0.0511500003544816, -0.0401718238899821, 0.0110180129952196, 0.0450646138757113, -0.158763982459561, 0.618090711004251, 0.618090711004251, -0.158763982459561, 0.0450646138757113, 0.0110180129952196, -0.0401718238899821, 0.0511500003544816, -0.0488042808020503, 0.0373793935453576, -0.0210904190553693, 0.00393802972375228, 0.0107205656401548, -0.0205465133983425, 0.0244304090483399, -0.0225376565398666, 0.0161069848806107, -0.00707367931879509, -0.00235152790154772, 0.0101477679025283, -0.0148623509507433, 0.0158292410507553, -0.0132483968543757, 0.00802919818495303, -0.00154859576729954, -0.00467429686050536, 0.00932687223737152, -0.0115258415342225, 0.0110016971360704, -0.00808464559964864, 0.00360981519195988, 0.00131912280605555, -0.00558762509312657, 0.00831178511256419, -0.00899621931917942, 0.00763116643767058, -0.00465816247808752, 0.000851437315416613, 0.00289107889092077, -0.00575320004887295, 0.00715481627399956, -0.00686951373388578, 0.0050608584117639, -0.00223004685375001, -0.000923477478886969, 0.00368473267928236, -0.0054662696540434, 0.00591965478184217, -0.00501476865365617, 0.00303604386923004, -0.000493145036319366, -0.00201828303368054, 0.00394757679142613, -0.004887624325341, 0.00466968850661756, -0.00341349190207681, 0.00146465664131074, 0.000715625515815454, -0.00262930928001616, 0.00384464425421152, -0.0041260200093996, 0.00347174904887673, -0.0020678515274724, 0.000259377523508014, 0.00150995227435177, -0.00284491379595518, 0.00348461611777791, -0.00330121271635187, 0.00236973034665188, -0.000962784264906791, -0.000598688861729809, 0.00196088914669043, -0.00279416481660564, 0.00296937668781301, -0.00246519488392428, 0.00140684401334843, -0.000107254972694283, -0.00118413165274588, 0.00212276146509357, -0.0025563990619767, 0.00237974025878014, -0.00167709216782091, 0.000621589162295764, 0.000528414248419435, -0.00151094320525423, 0.0021086299098513, -0.00220488623913932, 0.00179571366415832, -0.000991808853806958, -9.63647823553921e-06, 0.00097439161253333, -0.00168310987329064, 0.00198399690847988, -0.00182103908058209, 0.00124358535020915, -0.000394915634716385, -0.000525449531721328, 0.00130624010405029, -0.00177138874828307, 0.00181830193005744, -0.00143825074019611, 0.000720055576367679, 0.000170470562950339, -0.00102753094758355, 0.00164853019049648, -0.00187943698519934, 0.00165072949541043, -0.000996898066543565, 5.62954212466635e-05, 0.00095190234112807, -0.00177182342094554, 0.00216643024202234, -0.00197934250790946, 0.00119159099875811, 5.28364401207581e-05, -0.00144988187344571, 0.00257399081790882, -0.00297846864201631, 0.00233502520756554, -0.000593795271820441, -0.00186464384049269, 0.00414848758886968, -0.00493096177564419, 0.00283446964550318, 0.00265167064325015, -0.00934126533859537, 0.00893178066843361, 0.0192253427619028, 0.00635191213974269]
-coefLPF43Hz=[-0.0115347182633849, -0.0195551147102526, 0.00201474403158003, 0.0050971766445728, -0.00610328921050928, 0.00413895094231064, -0.00130227871474674, -0.00116406164504632, 0.00267580466368207, -0.00311382768336165, 0.00265083444638634, -0.0016057973956282, 0.000336804424597062, 0.000840094015371283, -0.0016927826963321, 0.00209566793319104, -0.00202792905029782, 0.00155707201270721, -0.000811517507616628, -4.51244946207859e-05, 0.000847845615659878, -0.00145624040796961, 0.00177299849847397, -0.00175465199555397, 0.00141415337328065, -0.000820606118946539, 8.23949389485296e-05, 0.000668798967982167, -0.00130256849353284, 0.00170702781648138, -0.00181022928592162, 0.00158875902974664, -0.00107724942625782, 0.000360745565912289, 0.000440528919275233, -0.00118369802801602, 0.00174186278257435, -0.00199497688811458, 0.00191720899692879, -0.00146127282579806, 0.000758979523945316, 0.000141794662836146, -0.00103450948202597, 0.00177433345692972, -0.00224530822029728, 0.00231395766632121, -0.00196576905056805, 0.00126079614489873, -0.000285381144729278, -0.000794029030993754, 0.00176758965673267, -0.00246852181985878, 0.0027675357719054, -0.00257602693935315, 0.0018995072118696, -0.000850517056719217, -0.000397706569833497, 0.00164115807901428, -0.00265809929629964, 0.00324105870850099, -0.00325954879662804, 0.00269175850581997, -0.00161239840059507, 0.000183803940273057, 0.00135922809365393, -0.00273560607412144, 0.00368445137137775, -0.00401468714517468, 0.00364113431075923, -0.00259204689827051, 0.00101539353514918, 0.000835558329616921, -0.00263825751418098, 0.00405735574980594, -0.00482175769120384, 0.00475734572102697, -0.0038380065897277, 0.00216345937086272, -4.14244948241174e-06, -0.00229214675796758, 0.00430180881142214, -0.0056491608868811, 0.00605802813355744, -0.00539274165708633, 0.00371517265126444, -0.00126018190683859, -0.00158314976546121, 0.00432115022847668, -0.00645453225560704, 0.00756026868780237, -0.00736512966190921, 0.00582219065141573, -0.00312109488284912, -0.000341289566983257, 0.00399844691810655, -0.00720054654656955, 0.00933943441404001, -0.00994525997804199, 0.00878327383575018, -0.00592246442439028, 0.00173987346453887, 0.00312238314957171, -0.0078559155158022, 0.0115934781977996, -0.0135677730304345, 0.0132470618770443, -0.0104542120602505, 0.00542303157841271, 0.00119138922588357, -0.00838248335030685, 0.014930096330836, -0.0195757361767847, 0.0212221190308055, -0.0191205190749811, 0.0130542718483134, -0.00341817648128527, -0.00874781041116362, 0.0218376603677719, -0.0337810164966097, 0.042245742596916, -0.0448090995989136, 0.0390425266027458, -0.0223536917374796, -0.00893770056978122, 0.063142211035275, -0.171316756490885, 0.622578318218173, 0.622578318218173, -0.171316756490885, 0.063142211035275, -0.00893770056978122, -0.0223536917374796, 0.0390425266027458, -0.0448090995989136, 0.042245742596916, -0.0337810164966097, 0.0218376603677719, -0.00874781041116362, -0.00341817648128527, 0.0130542718483134, -0.0191205190749811, 0.0212221190308055, -0.0195757361767847, 0.014930096330836, -0.00838248335030685, 0.00119138922588357, 0.00542303157841271, -0.0104542120602505, 0.0132470618770443, -0.0135677730304345, 0.0115934781977996, -0.0078559155158022, 0.00312238314957171, 0.00173987346453887, -0.00592246442439028, 0.00878327383575018, -0.00994525997804199, 0.00933943441404001, -0.00720054654656955, 0.00399844691810655, -0.000341289566983257, -0.00312109488284912, 0.00582219065141573, -0.00736512966190921, 0.00756026868780237, -0.00645453225560704, 0.00432115022847668, -0.00158314976546121, -0.00126018190683859, 0.00371517265126444, -0.00539274165708633, 0.00605802813355744, -0.0056491608868811, 0.00430180881142214, -0.00229214675796758, -4.14244948241174e-06, 0.00216345937086272, -0.0038380065897277, 0.00475734572102697, -0.00482175769120384, 0.00405735574980594, -0.00263825751418098, 0.000835558329616921, 0.00101539353514918, -0.00259204689827051, 0.00364113431075923, -0.00401468714517468, 0.00368445137137775, -0.00273560607412144, 0.00135922809365393, 0.000183803940273057, -0.00161239840059507, 0.00269175850581997, -0.00325954879662804, 0.00324105870850099, -0.00265809929629964, 0.00164115807901428, -0.000397706569833497, -0.000850517056719217, 0.0018995072118696, -0.00257602693935315, 0.0027675357719054, -0.00246852181985878, 0.00176758965673267, -0.000794029030993754, -0.000285381144729278, 0.00126079614489873, -0.00196576905056805, 0.00231395766632121, -0.00224530822029728, 0.00177433345692972, -0.00103450948202597, 0.000141794662836146, 0.000758979523945316, -0.00146127282579806, 0.00191720899692879, -0.00199497688811458, 0.00174186278257435, -0.00118369802801602, 0.000440528919275233, 0.000360745565912289, -0.00107724942625782, 0.00158875902974664, -0.00181022928592162, 0.00170702781648138, -0.00130256849353284, 0.000668798967982167, 8.23949389485296e-05, -0.000820606118946539, 0.00141415337328065, -0.00175465199555397, 0.00177299849847397, -0.00145624040796961, 0.000847845615659878, -4.51244946207859e-05, -0.000811517507616628, 0.00155707201270721, -0.00202792905029782, 0.00209566793319104, -0.0016927826963321, 0.000840094015371283, 0.000336804424597062, -0.0016057973956282, 0.00265083444638634, -0.00311382768336165, 0.00267580466368207, -0.00116406164504632, -0.00130227871474674, 0.00413895094231064, -0.00610328921050928, 0.0050971766445728, 0.00201474403158003, -0.0195551147102526, -0.0115347182633849]
-coefLPF44Hz=[-0.00278699842308023, -0.0174998455737418, -0.0129014995665367, 0.00888645928811283, -0.00218942463483289, -0.00214241151842392, 0.00400866940907899, -0.00410656337286815, 0.0031538454856058, -0.00172905413192169, 0.000254441114188713, 0.000987488361544609, -0.00184558160675203, 0.00225826218935604, -0.00224549565811085, 0.00187931265991388, -0.00126391090614099, 0.000514814103251068, 0.000251108054599025, -0.000932719063257873, 0.00144828074796303, -0.0017427677042219, 0.00179040441253671, -0.0015962023906461, 0.00119315942763136, -0.000638473471630471, 3.02901533217638e-06, 0.000632570570238539, -0.00118713630052348, 0.00159144343623168, -0.00179497804074091, 0.0017675793603845, -0.00150720186952192, 0.00104379073228956, -0.000431854757932276, -0.000255240119870325, 0.000929648619122996, -0.00150416728497539, 0.00190403835432427, -0.00206965278609686, 0.00196862602776024, -0.00160530654985022, 0.00101768668440932, -0.00027063509673763, -0.000545009430986029, 0.00132560478189928, -0.00196872161043366, 0.00238282537487578, -0.00249924430713419, 0.0022913659948091, -0.00177190238857234, 0.000993862874615291, -4.61848006980308e-05, -0.000953361212704277, 0.00187853177548504, -0.00259940563449449, 0.00301299384823522, -0.0030497437818054, 0.00268804741021247, -0.00194831631006935, 0.000926759959960001, 0.000293746329928801, -0.00150717433866515, 0.00261860651431892, -0.00341292962672009, 0.00381546408849027, -0.00374232063218094, 0.00315090286005929, -0.00213288205231099, 0.000772243290964194, 0.000777045346165623, -0.00228833267701984, 0.00358856680732372, -0.00449698950358335, 0.00485424783190779, -0.00458654522664316, 0.00371253394297989, -0.00229857990098776, 0.000491865549328662, 0.00148077103188937, -0.00336783663851645, 0.00493135679346917, -0.00594456646601408, 0.00623043273202059, -0.00570944438117427, 0.00440878191215368, -0.00244605845833737, 2.99793277707648e-05, 0.00255038204118771, -0.00496113319226087, 0.00687563304180756, -0.00801641688816203, 0.008183882783275, -0.00728294557892189, 0.00535012696467565, -0.00256349323611734, -0.000772238306999747, 0.00426321323792561, -0.00747190849748326, 0.00996011332353975, -0.0113368468921338, 0.0113201923539735, -0.00979372312054246, 0.00682389036067817, -0.00265789444034401, -0.00228370499598408, 0.00743928518506834, -0.0121664265916802, 0.0158026106192194, -0.0177426670044911, 0.0175263344985448, -0.0149059033026861, 0.00987888961305496, -0.00272594001725422, -0.00598251868216458, 0.0154176984906066, -0.0245437202342531, 0.0321687892408452, -0.037038370892823, 0.0378841150055179, -0.0334325159689237, 0.0223144885026522, -0.00276641075272766, -0.028466063191079, 0.0796659435848099, -0.182347010776479, 0.626453142522748, 0.626453142522748, -0.182347010776479, 0.0796659435848099, -0.028466063191079, -0.00276641075272766, 0.0223144885026522, -0.0334325159689237, 0.0378841150055179, -0.037038370892823, 0.0321687892408452, -0.0245437202342531, 0.0154176984906066, -0.00598251868216458, -0.00272594001725422, 0.00987888961305496, -0.0149059033026861, 0.0175263344985448, -0.0177426670044911, 0.0158026106192194, -0.0121664265916802, 0.00743928518506834, -0.00228370499598408, -0.00265789444034401, 0.00682389036067817, -0.00979372312054246, 0.0113201923539735, -0.0113368468921338, 0.00996011332353975, -0.00747190849748326, 0.00426321323792561, -0.000772238306999747, -0.00256349323611734, 0.00535012696467565, -0.00728294557892189, 0.008183882783275, -0.00801641688816203, 0.00687563304180756, -0.00496113319226087, 0.00255038204118771, 2.99793277707648e-05, -0.00244605845833737, 0.00440878191215368, -0.00570944438117427, 0.00623043273202059, -0.00594456646601408, 0.00493135679346917, -0.00336783663851645, 0.00148077103188937, 0.000491865549328662, -0.00229857990098776, 0.00371253394297989, -0.00458654522664316, 0.00485424783190779, -0.00449698950358335, 0.00358856680732372, -0.00228833267701984, 0.000777045346165623, 0.000772243290964194, -0.00213288205231099, 0.00315090286005929, -0.00374232063218094, 0.00381546408849027, -0.00341292962672009, 0.00261860651431892, -0.00150717433866515, 0.000293746329928801, 0.000926759959960001, -0.00194831631006935, 0.00268804741021247, -0.0030497437818054, 0.00301299384823522, -0.00259940563449449, 0.00187853177548504, -0.000953361212704277, -4.61848006980308e-05, 0.000993862874615291, -0.00177190238857234, 0.0022913659948091, -0.00249924430713419, 0.00238282537487578, -0.00196872161043366, 0.00132560478189928, -0.000545009430986029, -0.00027063509673763, 0.00101768668440932, -0.00160530654985022, 0.00196862602776024, -0.00206965278609686, 0.00190403835432427, -0.00150416728497539, 0.000929648619122996, -0.000255240119870325, -0.000431854757932276, 0.00104379073228956, -0.00150720186952192, 0.0017675793603845, -0.00179497804074091, 0.00159144343623168, -0.00118713630052348, 0.000632570570238539, 3.02901533217638e-06, -0.000638473471630471, 0.00119315942763136, -0.0015962023906461, 0.00179040441253671, -0.0017427677042219, 0.00144828074796303, -0.000932719063257873, 0.000251108054599025, 0.000514814103251068, -0.00126391090614099, 0.00187931265991388, -0.00224549565811085, 0.00225826218935604, -0.00184558160675203, 0.000987488361544609, 0.000254441114188713, -0.00172905413192169, 0.0031538454856058, -0.00410656337286815, 0.00400866940907899, -0.00214241151842392, -0.00218942463483289, 0.00888645928811283, -0.0129014995665367, -0.0174998455737418, -0.00278699842308023]
-coefLPF45Hz=[0.0130347075988046, 0.0199587597871579, -0.00472224540619345, -0.00273010333500634, 0.00537493485520649, -0.00527994916956686, 0.00383658529066774, -0.00194142353097103, 0.000135263102823181, 0.00129212091529571, -0.00222236318392919, 0.0026479024593633, -0.0026302833755859, 0.00226483886374248, -0.00166017847771399, 0.000926008941025794, -0.000161031044184958, -0.000551875037732554, 0.00114824692172251, -0.00158477126622895, 0.00183641560356802, -0.0018949252259554, 0.00176900269183016, -0.00147998130786434, 0.00105986220569367, -0.000550152445328442, -3.57916796193611e-06, 0.000553260221341592, -0.00105120803087736, 0.00145686162329194, -0.0017353657966661, 0.00186086449343203, -0.0018221191114897, 0.0016170016237998, -0.00126839322986685, 0.000785666172534315, -0.000239891866184017, -0.000377300654071467, 0.000941770487000138, -0.00147422540670685, 0.00188049590774862, -0.00212180680288429, 0.00220586819174509, -0.00208404727155441, 0.00175929238193195, -0.00127840946896717, 0.000659867370883616, 6.09326957410877e-05, -0.000802917430397, 0.00149633797724416, -0.00209470187543913, 0.00253975516390203, -0.00276997569968164, 0.00275404166475368, -0.00249319283083772, 0.00200072768614843, -0.00129870820011365, 0.000437040361590568, 0.000504616362511786, -0.00144151580751378, 0.00229603216800928, -0.00299173500421201, 0.0034550937153919, -0.00362666006321519, 0.00347554585037119, -0.00300522516578523, 0.00224271607086119, -0.00123702212393506, 6.38899882786474e-05, 0.0011832810001575, -0.00238767273136543, 0.00344216573923646, -0.00423639254248314, 0.00470177572619236, -0.00476434908000767, 0.00440758317519192, -0.00362778117471467, 0.00247142242107772, -0.00103045480426723, -0.000589837824748071, 0.00224668117744893, -0.00379674519361204, 0.00510594812127731, -0.00603571668570877, 0.0064755415454669, -0.00636048597175526, 0.00566151372923769, -0.00440343010830348, 0.0026707678889797, -0.000584430755687152, -0.00169897767995532, 0.00398579035290422, -0.00607221512869989, 0.00776175553654462, -0.00887175654812016, 0.00925704348250749, -0.0088320840151949, 0.00757715496245044, -0.00553869793629021, 0.0028289539543259, 0.000370157578671218, -0.00381456759089171, 0.00722474820139329, -0.0102991757329117, 0.0127292235786575, -0.0142388138694897, 0.0146000017915974, -0.0136653140642886, 0.0113660307980051, -0.00774067212496908, 0.00293486465199588, 0.00278846478879612, -0.00907309116966193, 0.015477101719787, -0.0214804597643864, 0.0265241785478364, -0.030017973594885, 0.0313721837027344, -0.0299997946006014, 0.0252968242653611, -0.0165938149237967, 0.00299608581201133, 0.0170014611963772, -0.0465695687296677, 0.0941824139290763, -0.191727967047828, 0.629693545757201, 0.629693545757201, -0.191727967047828, 0.0941824139290763, -0.0465695687296677, 0.0170014611963772, 0.00299608581201133, -0.0165938149237967, 0.0252968242653611, -0.0299997946006014, 0.0313721837027344, -0.030017973594885, 0.0265241785478364, -0.0214804597643864, 0.015477101719787, -0.00907309116966193, 0.00278846478879612, 0.00293486465199588, -0.00774067212496908, 0.0113660307980051, -0.0136653140642886, 0.0146000017915974, -0.0142388138694897, 0.0127292235786575, -0.0102991757329117, 0.00722474820139329, -0.00381456759089171, 0.000370157578671218, 0.0028289539543259, -0.00553869793629021, 0.00757715496245044, -0.0088320840151949, 0.00925704348250749, -0.00887175654812016, 0.00776175553654462, -0.00607221512869989, 0.00398579035290422, -0.00169897767995532, -0.000584430755687152, 0.0026707678889797, -0.00440343010830348, 0.00566151372923769, -0.00636048597175526, 0.0064755415454669, -0.00603571668570877, 0.00510594812127731, -0.00379674519361204, 0.00224668117744893, -0.000589837824748071, -0.00103045480426723, 0.00247142242107772, -0.00362778117471467, 0.00440758317519192, -0.00476434908000767, 0.00470177572619236, -0.00423639254248314, 0.00344216573923646, -0.00238767273136543, 0.0011832810001575, 6.38899882786474e-05, -0.00123702212393506, 0.00224271607086119, -0.00300522516578523, 0.00347554585037119, -0.00362666006321519, 0.0034550937153919, -0.00299173500421201, 0.00229603216800928, -0.00144151580751378, 0.000504616362511786, 0.000437040361590568, -0.00129870820011365, 0.00200072768614843, -0.00249319283083772, 0.00275404166475368, -0.00276997569968164, 0.00253975516390203, -0.00209470187543913, 0.00149633797724416, -0.000802917430397, 6.09326957410877e-05, 0.000659867370883616, -0.00127840946896717, 0.00175929238193195, -0.00208404727155441, 0.00220586819174509, -0.00212180680288429, 0.00188049590774862, -0.00147422540670685, 0.000941770487000138, -0.000377300654071467, -0.000239891866184017, 0.000785666172534315, -0.00126839322986685, 0.0016170016237998, -0.0018221191114897, 0.00186086449343203, -0.0017353657966661, 0.00145686162329194, -0.00105120803087736, 0.000553260221341592, -3.57916796193611e-06, -0.000550152445328442, 0.00105986220569367, -0.00147998130786434, 0.00176900269183016, -0.0018949252259554, 0.00183641560356802, -0.00158477126622895, 0.00114824692172251, -0.000551875037732554, -0.000161031044184958, 0.000926008941025794, -0.00166017847771399, 0.00226483886374248, -0.0026302833755859, 0.0026479024593633, -0.00222236318392919, 0.00129212091529571, 0.000135263102823181, -0.00194142353097103, 0.00383658529066774, -0.00527994916956686, 0.00537493485520649, -0.00273010333500634, -0.00472224540619345, 0.0199587597871579, 0.0130347075988046]
-coefLPF46Hz=[-0.017198178715178, -0.0144284294661056, 0.00826066796853842, -0.00380360306647089, 0.000725922267448897, 0.00126102326756447, -0.00240230499784932, 0.00290557568881567, -0.00294431874402623, 0.00266160827045102, -0.0021717871820654, 0.00156689745638151, -0.000918498479135229, 0.000280110745608781, 0.000306449275471244, -0.000813039463968632, 0.00122116490704225, -0.00151923860977452, 0.00170284431500432, -0.00177143446943174, 0.00173094219329265, -0.00159024947737254, 0.00136060344374039, -0.00105815622294412, 0.000699618860113635, -0.000303692258331526, -0.000107928320483296, 0.000519207019332096, -0.000894027884909603, 0.0012486648165378, -0.00150160927159024, 0.00171907155839952, -0.00182037043392929, 0.00181775181626869, -0.00173595587563155, 0.00154554889903921, -0.00125017566924589, 0.000884897211388535, -0.000464249020474313, -8.09358575467808e-06, 0.000505766816956983, -0.000989712359368051, 0.00143256031997707, -0.00181614257403264, 0.00212137057232388, -0.0023218062574473, 0.00239408838276527, -0.00233106395776443, 0.00213538306314143, -0.00181452127107824, 0.00137701073317825, -0.000836670103366586, 0.000219561484762152, 0.000441482495698583, -0.00110782916788765, 0.0017404892541704, -0.0023078281226513, 0.00277189403877949, -0.0031120700095644, 0.00328387124810306, -0.00328616641904984, 0.0030941083572988, -0.00271633164247763, 0.00217310930842148, -0.00147594157166137, 0.000660211245879529, 0.000232287059404757, -0.00116418956397305, 0.00208416815281496, -0.0029324797204189, 0.00365976183808156, -0.00422241401052818, 0.00457574929089625, -0.00468913178623132, 0.00454733798470083, -0.00414404002669545, 0.00348543685377246, -0.00259057429908116, 0.0014971173871441, -0.00025628085470733, -0.00107328745382773, 0.00242158952213505, -0.00371432819055637, 0.00487398603057488, -0.0058292982768864, 0.00651932932503196, -0.00688608539268921, 0.00689197577058208, -0.00650604632931355, 0.00573284715307877, -0.00458285277653763, 0.00309531370084615, -0.00133131707998927, -0.000637627753808288, 0.00271338839750657, -0.00478766626326699, 0.00675075125467912, -0.00848571751901418, 0.00987996991614526, -0.0108340243397719, 0.0112578717151144, -0.0110780591681966, 0.0102538531477088, -0.00877183513563352, 0.00664526065936533, -0.0039257954815424, 0.000696354784768039, 0.00292769257846823, -0.00679957740587534, 0.010748444317285, -0.0145782302918516, 0.018082893216316, -0.0210429092347963, 0.0232327161727737, -0.0244237672914358, 0.024385263967855, -0.0228924152540223, 0.0197058127227309, -0.0145655908378664, 0.0071407505211212, 0.0030378968265882, -0.0167503822078032, 0.0354869731395272, -0.0625004101294477, 0.10643892563267, -0.199445370145611, 0.632327557900068, 0.632327557900068, -0.199445370145611, 0.10643892563267, -0.0625004101294477, 0.0354869731395272, -0.0167503822078032, 0.0030378968265882, 0.0071407505211212, -0.0145655908378664, 0.0197058127227309, -0.0228924152540223, 0.024385263967855, -0.0244237672914358, 0.0232327161727737, -0.0210429092347963, 0.018082893216316, -0.0145782302918516, 0.010748444317285, -0.00679957740587534, 0.00292769257846823, 0.000696354784768039, -0.0039257954815424, 0.00664526065936533, -0.00877183513563352, 0.0102538531477088, -0.0110780591681966, 0.0112578717151144, -0.0108340243397719, 0.00987996991614526, -0.00848571751901418, 0.00675075125467912, -0.00478766626326699, 0.00271338839750657, -0.000637627753808288, -0.00133131707998927, 0.00309531370084615, -0.00458285277653763, 0.00573284715307877, -0.00650604632931355, 0.00689197577058208, -0.00688608539268921, 0.00651932932503196, -0.0058292982768864, 0.00487398603057488, -0.00371432819055637, 0.00242158952213505, -0.00107328745382773, -0.00025628085470733, 0.0014971173871441, -0.00259057429908116, 0.00348543685377246, -0.00414404002669545, 0.00454733798470083, -0.00468913178623132, 0.00457574929089625, -0.00422241401052818, 0.00365976183808156, -0.0029324797204189, 0.00208416815281496, -0.00116418956397305, 0.000232287059404757, 0.000660211245879529, -0.00147594157166137, 0.00217310930842148, -0.00271633164247763, 0.0030941083572988, -0.00328616641904984, 0.00328387124810306, -0.0031120700095644, 0.00277189403877949, -0.0023078281226513, 0.0017404892541704, -0.00110782916788765, 0.000441482495698583, 0.000219561484762152, -0.000836670103366586, 0.00137701073317825, -0.00181452127107824, 0.00213538306314143, -0.00233106395776443, 0.00239408838276527, -0.0023218062574473, 0.00212137057232388, -0.00181614257403264, 0.00143256031997707, -0.000989712359368051, 0.000505766816956983, -8.09358575467808e-06, -0.000464249020474313, 0.000884897211388535, -0.00125017566924589, 0.00154554889903921, -0.00173595587563155, 0.00181775181626869, -0.00182037043392929, 0.00171907155839952, -0.00150160927159024, 0.0012486648165378, -0.000894027884909603, 0.000519207019332096, -0.000107928320483296, -0.000303692258331526, 0.000699618860113635, -0.00105815622294412, 0.00136060344374039, -0.00159024947737254, 0.00173094219329265, -0.00177143446943174, 0.00170284431500432, -0.00151923860977452, 0.00122116490704225, -0.000813039463968632, 0.000306449275471244, 0.000280110745608781, -0.000918498479135229, 0.00156689745638151, -0.0021717871820654, 0.00266160827045102, -0.00294431874402623, 0.00290557568881567, -0.00240230499784932, 0.00126102326756447, 0.000725922267448897, -0.00380360306647089, 0.00826066796853842, -0.0144284294661056, -0.017198178715178]
-coefLPF47Hz=[0.00921825296594946, -0.00950823438603121, -0.0157655279491466, 0.000505816857504923, -0.00616780025705043, 0.00151946700876177, -0.00237686354387158, 0.000681495533347133, -0.000492440848907582, -0.0002759139113141, 0.000585403306340347, -0.000985306754150929, 0.00121099679590558, -0.00141396744768243, 0.00152593092692931, -0.00159347048896857, 0.00160126695013448, -0.0015642340522653, 0.00148185514331574, -0.00135940921279819, 0.0012017407067752, -0.00100986144990138, 0.000793052707737506, -0.000550952420248873, 0.000293389617234746, -2.3827313578622e-05, -0.000250802705221724, 0.000524723963274411, -0.000789053896709423, 0.0010389643681893, -0.00126561048865686, 0.00146200717100409, -0.00162287671134605, 0.00174101400071061, -0.00181205413839195, 0.00183235438372185, -0.0017966777299677, 0.00170677049638905, -0.00156100544855797, 0.0013595758108462, -0.00111135573841898, 0.000814388783916261, -0.000482562272954264, 0.000116680497736277, 0.000268296180967, -0.000664144088994441, 0.0010573053330152, -0.0014397220208088, 0.00179899711788554, -0.00211799742517432, 0.00238432153772213, -0.00259424976039827, 0.00274139168822652, -0.0028158920241581, 0.00279072445295304, -0.0026781276486903, 0.00249314572996984, -0.00222513313970375, 0.00186499370795273, -0.00142663503122093, 0.000931615865919819, -0.000373540253506034, -0.000226418884642039, 0.000838100846275652, -0.0014617657025266, 0.00207879021959188, -0.00265738515361547, 0.00319243023050856, -0.00366391526940059, 0.00404184199485657, -0.00431855367667429, 0.00448497023429255, -0.00451325126096742, 0.00441291789480817, -0.00417723885593371, 0.00379282014464349, -0.00328226164399489, 0.00264160403589036, -0.00187743264832991, 0.00102205950647866, -7.83999944615824e-05, -0.000925241980983933, 0.00195356770281505, -0.00299589316086304, 0.00400440687409252, -0.00495568690363519, 0.00582269297750996, -0.0065594378264681, 0.00715532712107565, -0.00757292735024059, 0.0077851745796942, -0.00778860141330157, 0.00754740874332737, -0.00706648382503195, 0.00633743095205261, -0.00535539611211323, 0.00414913150457878, -0.00271099250490618, 0.0010812164346082, 0.000717999033110289, -0.00264738492817405, 0.00466122662709095, -0.00671959625952, 0.00876692502237767, -0.0107400346742708, 0.0125899167813711, -0.0142407709000986, 0.0156554365382955, -0.0167354921510156, 0.0174462641809306, -0.0176959943818592, 0.0174446496733295, -0.0166113678961584, 0.0151302193742413, -0.0129344568447457, 0.00993780282030898, -0.0060377409904058, 0.00111177217517514, 0.00502872914847841, -0.0126614429945237, 0.0222448106310822, -0.0345750602844126, 0.0511970769948739, -0.075449317745645, 0.11608919942206, -0.20540278593953, 0.634338650982355, 0.634338650982355, -0.20540278593953, 0.11608919942206, -0.075449317745645, 0.0511970769948739, -0.0345750602844126, 0.0222448106310822, -0.0126614429945237, 0.00502872914847841, 0.00111177217517514, -0.0060377409904058, 0.00993780282030898, -0.0129344568447457, 0.0151302193742413, -0.0166113678961584, 0.0174446496733295, -0.0176959943818592, 0.0174462641809306, -0.0167354921510156, 0.0156554365382955, -0.0142407709000986, 0.0125899167813711, -0.0107400346742708, 0.00876692502237767, -0.00671959625952, 0.00466122662709095, -0.00264738492817405, 0.000717999033110289, 0.0010812164346082, -0.00271099250490618, 0.00414913150457878, -0.00535539611211323, 0.00633743095205261, -0.00706648382503195, 0.00754740874332737, -0.00778860141330157, 0.0077851745796942, -0.00757292735024059, 0.00715532712107565, -0.0065594378264681, 0.00582269297750996, -0.00495568690363519, 0.00400440687409252, -0.00299589316086304, 0.00195356770281505, -0.000925241980983933, -7.83999944615824e-05, 0.00102205950647866, -0.00187743264832991, 0.00264160403589036, -0.00328226164399489, 0.00379282014464349, -0.00417723885593371, 0.00441291789480817, -0.00451325126096742, 0.00448497023429255, -0.00431855367667429, 0.00404184199485657, -0.00366391526940059, 0.00319243023050856, -0.00265738515361547, 0.00207879021959188, -0.0014617657025266, 0.000838100846275652, -0.000226418884642039, -0.000373540253506034, 0.000931615865919819, -0.00142663503122093, 0.00186499370795273, -0.00222513313970375, 0.00249314572996984, -0.0026781276486903, 0.00279072445295304, -0.0028158920241581, 0.00274139168822652, -0.00259424976039827, 0.00238432153772213, -0.00211799742517432, 0.00179899711788554, -0.0014397220208088, 0.0010573053330152, -0.000664144088994441, 0.000268296180967, 0.000116680497736277, -0.000482562272954264, 0.000814388783916261, -0.00111135573841898, 0.0013595758108462, -0.00156100544855797, 0.00170677049638905, -0.0017966777299677, 0.00183235438372185, -0.00181205413839195, 0.00174101400071061, -0.00162287671134605, 0.00146200717100409, -0.00126561048865686, 0.0010389643681893, -0.000789053896709423, 0.000524723963274411, -0.000250802705221724, -2.3827313578622e-05, 0.000293389617234746, -0.000550952420248873, 0.000793052707737506, -0.00100986144990138, 0.0012017407067752, -0.00135940921279819, 0.00148185514331574, -0.0015642340522653, 0.00160126695013448, -0.00159347048896857, 0.00152593092692931, -0.00141396744768243, 0.00121099679590558, -0.000985306754150929, 0.000585403306340347, -0.0002759139113141, -0.000492440848907582, 0.000681495533347133, -0.00237686354387158, 0.00151946700876177, -0.00616780025705043, 0.000505816857504923, -0.0157655279491466, -0.00950823438603121, 0.00921825296594946]
-coefLPF48Hz=[0.00867007143401076, 0.0157883388145969, -0.00564992936219443, 0.00101385586139062, 0.0010413797190885, -0.0018923306067603, 0.00218595856780519, -0.00222702323379249, 0.00215685636586697, -0.00204084114951351, 0.00190914490433284, -0.0017739710414547, 0.00164011712317587, -0.00150849200754198, 0.00137846070169204, -0.00124907022162077, 0.00111906749923781, -0.000987304472873436, 0.000852736633452046, -0.000714722361210552, 0.000572443814079157, -0.000425535874761445, 0.000274194787611964, -0.00011861259061751, -4.06419427149765e-05, 0.00020339924270733, -0.000368511939461807, 0.000534337737239302, -0.000699994851233312, 0.000863746298262139, -0.00102427337901147, 0.00117922961848978, -0.00132661012205956, 0.00146432602261604, -0.00159205330299353, 0.00170226743245712, -0.00180649050081283, 0.00187521745369148, -0.0019504610775433, 0.00197635332792355, -0.00200123790688511, 0.00199840741851067, -0.00195756876906617, 0.00190609005045224, -0.00182587692949354, 0.00170690352582821, -0.00156837263701398, 0.0014095139185633, -0.00121682289237401, 0.000995565451155676, -0.000758232717279886, 0.000502339696998835, -0.000220455606058771, -8.20486678511437e-05, 0.000393994184378792, -0.000713242578213418, 0.00104353243838285, -0.00138205515589402, 0.00171957529082875, -0.0020483624715657, 0.00236677551841455, -0.00267615385681799, 0.00297193221476562, -0.0032453489124113, 0.00348958956770758, -0.00370125531182235, 0.00388049791115933, -0.0040237865404816, 0.00412532743069963, -0.00417963577257971, 0.00418280649648379, -0.00413330192702308, 0.0040336626483713, -0.00387822884422572, 0.0036721295689558, -0.00340157028270206, 0.00307786794193899, -0.00269333152084666, 0.00225464571656026, -0.00176730754970143, 0.00122733554250307, -0.000643059165744475, 1.56418063285632e-05, 0.000654707172404991, -0.00135747916253903, 0.00208694464076825, -0.00283785343761329, 0.00359921680182478, -0.0043643809242954, 0.00512954724014492, -0.00588530705941086, 0.00662041608864692, -0.007326641912962, 0.00799499905574892, -0.00861319049931246, 0.00916906056973467, -0.00965510860430792, 0.0100635684953948, -0.0103817907968608, 0.0105998775642596, -0.0107089030643705, 0.0106968013874963, -0.0105526080890666, 0.0102637989312099, -0.00982106182311889, 0.00921474514853005, -0.00843086538671345, 0.00745721039556758, -0.00627935980396766, 0.00488249848819009, -0.0032497077650388, 0.00135365887546551, 0.000830344711745978, -0.00334086441896928, 0.0062215756951505, -0.00953802446721486, 0.0133810023478362, -0.0178728652096902, 0.023204234715322, -0.0296686622693049, 0.0377431993445973, -0.0482593198701003, 0.0627892888852043, -0.0847148726052569, 0.122845879061125, -0.209507890459501, 0.635717944700551, 0.635717944700551, -0.209507890459501, 0.122845879061125, -0.0847148726052569, 0.0627892888852043, -0.0482593198701003, 0.0377431993445973, -0.0296686622693049, 0.023204234715322, -0.0178728652096902, 0.0133810023478362, -0.00953802446721486, 0.0062215756951505, -0.00334086441896928, 0.000830344711745978, 0.00135365887546551, -0.0032497077650388, 0.00488249848819009, -0.00627935980396766, 0.00745721039556758, -0.00843086538671345, 0.00921474514853005, -0.00982106182311889, 0.0102637989312099, -0.0105526080890666, 0.0106968013874963, -0.0107089030643705, 0.0105998775642596, -0.0103817907968608, 0.0100635684953948, -0.00965510860430792, 0.00916906056973467, -0.00861319049931246, 0.00799499905574892, -0.007326641912962, 0.00662041608864692, -0.00588530705941086, 0.00512954724014492, -0.0043643809242954, 0.00359921680182478, -0.00283785343761329, 0.00208694464076825, -0.00135747916253903, 0.000654707172404991, 1.56418063285632e-05, -0.000643059165744475, 0.00122733554250307, -0.00176730754970143, 0.00225464571656026, -0.00269333152084666, 0.00307786794193899, -0.00340157028270206, 0.0036721295689558, -0.00387822884422572, 0.0040336626483713, -0.00413330192702308, 0.00418280649648379, -0.00417963577257971, 0.00412532743069963, -0.0040237865404816, 0.00388049791115933, -0.00370125531182235, 0.00348958956770758, -0.0032453489124113, 0.00297193221476562, -0.00267615385681799, 0.00236677551841455, -0.0020483624715657, 0.00171957529082875, -0.00138205515589402, 0.00104353243838285, -0.000713242578213418, 0.000393994184378792, -8.20486678511437e-05, -0.000220455606058771, 0.000502339696998835, -0.000758232717279886, 0.000995565451155676, -0.00121682289237401, 0.0014095139185633, -0.00156837263701398, 0.00170690352582821, -0.00182587692949354, 0.00190609005045224, -0.00195756876906617, 0.00199840741851067, -0.00200123790688511, 0.00197635332792355, -0.0019504610775433, 0.00187521745369148, -0.00180649050081283, 0.00170226743245712, -0.00159205330299353, 0.00146432602261604, -0.00132661012205956, 0.00117922961848978, -0.00102427337901147, 0.000863746298262139, -0.000699994851233312, 0.000534337737239302, -0.000368511939461807, 0.00020339924270733, -4.06419427149765e-05, -0.00011861259061751, 0.000274194787611964, -0.000425535874761445, 0.000572443814079157, -0.000714722361210552, 0.000852736633452046, -0.000987304472873436, 0.00111906749923781, -0.00124907022162077, 0.00137846070169204, -0.00150849200754198, 0.00164011712317587, -0.0017739710414547, 0.00190914490433284, -0.00204084114951351, 0.00215685636586697, -0.00222702323379249, 0.00218595856780519, -0.0018923306067603, 0.0010413797190885, 0.00101385586139062, -0.00564992936219443, 0.0157883388145969, 0.00867007143401076]
-coefLPF49Hz=[4.62837353990417e-05, -1.54415382650727e-05, 1.80005264613697e-05, -2.08279809002455e-05, 2.39401382822919e-05, -2.73529195483856e-05, 3.1083770937931e-05, -3.5157013558087e-05, 3.96017023855373e-05, -4.44467106661543e-05, 4.9710654566591e-05, -5.54019401334466e-05, 6.15387035929583e-05, -6.81664847575742e-05, 7.53377829971696e-05, -8.3047786929155e-05, 9.12741141392949e-05, -0.000100179631528688, 0.000109668156125731, -0.000119846491838246, 0.00013071790378116, -0.000142319103618984, 0.000154684328176963, -0.000167852375133633, 0.000181862830347935, -0.000196749591507939, 0.00021254751914222, -0.000229301238022245, 0.000247059653009001, -0.000265861327402104, 0.000285738739730342, -0.000306747020897786, 0.000328939183225402, -0.000352335644233748, 0.000377018195707367, -0.000403009332186079, 0.000430372526997253, -0.000459156408356211, 0.000489418565146561, -0.000521213935891188, 0.00055459578739651, -0.000589623081019988, 0.000626358612584001, -0.000664863367325057, 0.000705196454190624, -0.000747423146227208, 0.000791614026842425, -0.000837831952600397, 0.000886148591633787, -0.000936645388480891, 0.000989382294165474, -0.001044450021852, 0.00110192153061115, -0.00116188466932451, 0.00122442195708193, -0.00128962141159714, 0.00135757696748351, -0.00142838413081195, 0.00150214138024441, -0.00157895190023358, 0.00165892488210478, -0.0017421721064295, 0.00182881007847069, -0.00191896670977471, 0.00201276902193923, -0.00211034960860095, 0.00221185927776369, -0.00231744239327254, 0.00242726429145396, -0.00254148952088652, 0.00266029949018721, -0.00278388481944133, 0.00291244744307965, -0.00304620427682456, 0.00318538607398892, -0.00333023994671226, 0.00348103040728305, -0.00363804414001526, 0.00380158953479043, -0.00397199524504288, 0.00414962284683344, -0.00433486350050785, 0.00452813796920798, -0.00472991265271147, 0.00494068798289997, -0.00516101994537303, 0.00539151341827145, -0.0056328367958788, 0.00588572742429772, -0.00615099913736422, 0.00642955674038806, -0.00672240681070022, 0.00703067424719633, -0.00735561648821215, 0.00769864699168407, -0.00806136293765183, 0.00844556803651614, -0.00885331457624031, 0.00928694576502687, -0.00974914305868715, 0.0102430014807247, -0.0107720987187666, 0.011340604450284, -0.0119533983243591, 0.0126162318930124, -0.0133359331777639, 0.0141206655629058, -0.0149802739479494, 0.0159267355479611, -0.0169747742536262, 0.0181426902057165, -0.0194535126010279, 0.0209366362723369, -0.0226301720690109, 0.0245844380748078, -0.0268672699373945, 0.0295723551753063, -0.0328328489192871, 0.0368445809267681, -0.0419078480261484, 0.0485077687278267, -0.057482303081812, 0.0704143035831862, -0.0906956402001982, 0.127145247221898, -0.212099323709802, 0.636584009221956, 0.636584009221956, -0.212099323709802, 0.127145247221898, -0.0906956402001982, 0.0704143035831862, -0.057482303081812, 0.0485077687278267, -0.0419078480261484, 0.0368445809267681, -0.0328328489192871, 0.0295723551753063, -0.0268672699373945, 0.0245844380748078, -0.0226301720690109, 0.0209366362723369, -0.0194535126010279, 0.0181426902057165, -0.0169747742536262, 0.0159267355479611, -0.0149802739479494, 0.0141206655629058, -0.0133359331777639, 0.0126162318930124, -0.0119533983243591, 0.011340604450284, -0.0107720987187666, 0.0102430014807247, -0.00974914305868715, 0.00928694576502687, -0.00885331457624031, 0.00844556803651614, -0.00806136293765183, 0.00769864699168407, -0.00735561648821215, 0.00703067424719633, -0.00672240681070022, 0.00642955674038806, -0.00615099913736422, 0.00588572742429772, -0.0056328367958788, 0.00539151341827145, -0.00516101994537303, 0.00494068798289997, -0.00472991265271147, 0.00452813796920798, -0.00433486350050785, 0.00414962284683344, -0.00397199524504288, 0.00380158953479043, -0.00363804414001526, 0.00348103040728305, -0.00333023994671226, 0.00318538607398892, -0.00304620427682456, 0.00291244744307965, -0.00278388481944133, 0.00266029949018721, -0.00254148952088652, 0.00242726429145396, -0.00231744239327254, 0.00221185927776369, -0.00211034960860095, 0.00201276902193923, -0.00191896670977471, 0.00182881007847069, -0.0017421721064295, 0.00165892488210478, -0.00157895190023358, 0.00150214138024441, -0.00142838413081195, 0.00135757696748351, -0.00128962141159714, 0.00122442195708193, -0.00116188466932451, 0.00110192153061115, -0.001044450021852, 0.000989382294165474, -0.000936645388480891, 0.000886148591633787, -0.000837831952600397, 0.000791614026842425, -0.000747423146227208, 0.000705196454190624, -0.000664863367325057, 0.000626358612584001, -0.000589623081019988, 0.00055459578739651, -0.000521213935891188, 0.000489418565146561, -0.000459156408356211, 0.000430372526997253, -0.000403009332186079, 0.000377018195707367, -0.000352335644233748, 0.000328939183225402, -0.000306747020897786, 0.000285738739730342, -0.000265861327402104, 0.000247059653009001, -0.000229301238022245, 0.00021254751914222, -0.000196749591507939, 0.000181862830347935, -0.000167852375133633, 0.000154684328176963, -0.000142319103618984, 0.00013071790378116, -0.000119846491838246, 0.000109668156125731, -0.000100179631528688, 9.12741141392949e-05, -8.3047786929155e-05, 7.53377829971696e-05, -6.81664847575742e-05, 6.15387035929583e-05, -5.54019401334466e-05, 4.9710654566591e-05, -4.44467106661543e-05, 3.96017023855373e-05, -3.5157013558087e-05, 3.1083770937931e-05, -2.73529195483856e-05, 2.39401382822919e-05, -2.08279809002455e-05, 1.80005264613697e-05, -1.54415382650727e-05, 4.62837353990417e-05]
-coefLPF50Hz=[0.000312039122914052, -4.08435851753202e-05, 4.34992545367574e-05, -4.6260828093455e-05, 4.91263406066308e-05, -5.21017617912321e-05, 5.51834721467025e-05, -5.83783846056115e-05, 6.16877094665854e-05, -6.51135323041922e-05, 6.86614291068185e-05, -7.23343205882869e-05, 7.61344839600716e-05, -8.00682505885446e-05, 8.4135335316669e-05, -8.83372192353965e-05, 9.26747824689245e-05, -9.71496232772418e-05, 0.000101759048610203, -0.000106502048718899, 0.000111380404155119, -0.000116398946242788, 0.000121559777121012, -0.000126870789700308, 0.000132341182130299, -0.000137981255942103, 0.000143794398605106, -0.000149780980913903, 0.00015593591277903, -0.000162247727240022, 0.00016870345935144, -0.000175302690007749, 0.000182055336025028, -0.000188996819874709, 0.000196170166987986, -0.000203587954958255, 0.000211189563354381, -0.00021881752010026, 0.000226414402795368, -0.000234824660332658, 0.000242918239689121, -0.000251381179715525, 0.000260014437059114, -0.000268841936562454, 0.00027786994351309, -0.000287095066122785, 0.000296520712058159, -0.000306149363623764, 0.000315978255978768, -0.000326013226188681, 0.000336254582537358, -0.000346703964720761, 0.00035736634038667, -0.000368245021518138, 0.000379339090710636, -0.000390649518243899, 0.0004021766059397, -0.000413920765471637, 0.000425878354317918, -0.000438051658535196, 0.000450446069488929, -0.00046306691240781, 0.000475916345710982, -0.000488996100991459, 0.000502304031502922, -0.000515834950482802, 0.000529581857936191, -0.000543548215697476, 0.000557742431522636, -0.000572177179652312, 0.000586859825161709, -0.000601777093613269, 0.000616904827245266, -0.000632239299155753, 0.000647812303381118, -0.000663672123332313, 0.000679764198621487, -0.000695964794839361, 0.000712551180795283, -0.000729278058657521, 0.000746268189474204, -0.000763487708815603, 0.000780936654337926, -0.000798621336012555, 0.00081653392752893, -0.000834675697156028, 0.000853047218257943, -0.000871644138406187, 0.000890469458292008, -0.000909524633306896, 0.000928805711526912, -0.000948313478604895, 0.000968046784016259, -0.00098800197099883, 0.00100817383202083, -0.00102856183843214, 0.00104916869524632, -0.00106999468293714, 0.00109103775835403, -0.00111229745935365, 0.00113376978686953, -0.00115544886347274, 0.00117732950510948, -0.00119941336883938, 0.00122170465613198, -0.00124420357467187, 0.00126690528595258, -0.00128979901551307, 0.00131287582405282, -0.00133614396325221, 0.00135961371061187, -0.00138328008634863, 0.00140711871382359, -0.00143111486682907, 0.00145530775564295, -0.00147970431748605, 0.00150420612145661, -0.00152893364205794, 0.00155379676915961, -0.00157883010344925, 0.00160402194715379, -0.00162936230621308, 0.00165485519763415, -0.00168049079708767, 0.00170626655838346, -0.0017321838571378, 0.0017582341412107, -0.0017844151357149, 0.00181072469565744, -0.00183715367408921, 0.00186369574733066, -0.00189034860875458, 0.00191711092778914, -0.00194397812202985, 0.00197094421194777, -0.00199800583303807, 0.00202515723164747, -0.00205238985238343, 0.00207969910837865, -0.00210708379759475, 0.00213454249851523, -0.00216206800592386, 0.00218965061091084, -0.00221728251298189, 0.00224495989333244, -0.00227268499974894, 0.00230045623484635, -0.0023282586349984, 0.00235608007063195, -0.00238391962827958, 0.00241178444384265, -0.00243966578886939, 0.0024675336719277, -0.00249539900088099, 0.00252328604391204, -0.00255112482348932, 0.00257897091146205, -0.00260678011817864, 0.0026345588290335, -0.00266230328410989, 0.00268999862042339, -0.00271764967878078, 0.00274524612986417, -0.00277277949799183, 0.00280024970628192, -0.00282764387801053, 0.00285495457499968, -0.00288218058509157, 0.00290931679732975, -0.00293635482438469, 0.00296328805162115, -0.00299011113814197, 0.0030168179182699, -0.00304339841056314, 0.003069848852012, -0.00309616687895737, 0.0031223467774998, -0.00314837810658948, 0.00317425188024027, -0.00319996263642029, 0.00322550847327657, -0.003250885284313, 0.00327608656861814, -0.00330109917148075, 0.00332591697679965, -0.00335054070266606, 0.00337496643831571, -0.00339918129848264, 0.00342317364729528, -0.00344694502938847, 0.00347050178234326, -0.00349381869515647, 0.00351688846807249, -0.00353973373983179, 0.00356230751542519, -0.00358463628505346, 0.0036066996455827, -0.00362849305614764, 0.00365002152846988, -0.00367126401279809, 0.00369222640590505, -0.00371289839663849, 0.00373327009587124, -0.00375334515025157, 0.00377311777015048, -0.00379257692796492, 0.00381172031510324, -0.0038305433195413, 0.00384904040592266, -0.00386720373653229, 0.00388503204160603, -0.00390252408997748, 0.00391967318603871, -0.003936469490741, 0.0039529094172544, -0.00396899066434963, 0.00398471247628552, -0.00400006881490599, 0.00401505387765172, -0.00402966103722428, 0.00404388916151833, -0.00405773840188388, 0.00407120350328799, -0.00408427378781438, 0.00409694807233358, -0.00410922783176163, 0.00412111315122692, -0.00413259202145512, 0.00414365957000216, -0.00415432488169229, 0.0041645770094577, -0.00417440282953472, 0.00418382654356873, -0.00419281873024493, 0.00420139502322388, -0.0042095463538462, 0.00421726282395447, -0.00422455827585476, 0.00423141362322654, -0.00423783936805551, 0.00424383569203796, -0.00424938842386448, 0.00425450337428083, -0.00425918073087763, 0.00426341494262033, -0.00426720397654303, 0.00427055168196025, -0.0042734585913336, 0.00427592022119381, -0.00427793074119258, 0.00427949427441768, -0.00428061274789689, 0.00428128610824543, 0.995718489199623, 0.00428128610824543, -0.00428061274789689, 0.00427949427441768, -0.00427793074119258, 0.00427592022119381, -0.0042734585913336, 0.00427055168196025, -0.00426720397654303, 0.00426341494262033, -0.00425918073087763, 0.00425450337428083, -0.00424938842386448, 0.00424383569203796, -0.00423783936805551, 0.00423141362322654, -0.00422455827585476, 0.00421726282395447, -0.0042095463538462, 0.00420139502322388, -0.00419281873024493, 0.00418382654356873, -0.00417440282953472, 0.0041645770094577, -0.00415432488169229, 0.00414365957000216, -0.00413259202145512, 0.00412111315122692, -0.00410922783176163, 0.00409694807233358, -0.00408427378781438, 0.00407120350328799, -0.00405773840188388, 0.00404388916151833, -0.00402966103722428, 0.00401505387765172, -0.00400006881490599, 0.00398471247628552, -0.00396899066434963, 0.0039529094172544, -0.003936469490741, 0.00391967318603871, -0.00390252408997748, 0.00388503204160603, -0.00386720373653229, 0.00384904040592266, -0.0038305433195413, 0.00381172031510324, -0.00379257692796492, 0.00377311777015048, -0.00375334515025157, 0.00373327009587124, -0.00371289839663849, 0.00369222640590505, -0.00367126401279809, 0.00365002152846988, -0.00362849305614764, 0.0036066996455827, -0.00358463628505346, 0.00356230751542519, -0.00353973373983179, 0.00351688846807249, -0.00349381869515647, 0.00347050178234326, -0.00344694502938847, 0.00342317364729528, -0.00339918129848264, 0.00337496643831571, -0.00335054070266606, 0.00332591697679965, -0.00330109917148075, 0.00327608656861814, -0.003250885284313, 0.00322550847327657, -0.00319996263642029, 0.00317425188024027, -0.00314837810658948, 0.0031223467774998, -0.00309616687895737, 0.003069848852012, -0.00304339841056314, 0.0030168179182699, -0.00299011113814197, 0.00296328805162115, -0.00293635482438469, 0.00290931679732975, -0.00288218058509157, 0.00285495457499968, -0.00282764387801053, 0.00280024970628192, -0.00277277949799183, 0.00274524612986417, -0.00271764967878078, 0.00268999862042339, -0.00266230328410989, 0.0026345588290335, -0.00260678011817864, 0.00257897091146205, -0.00255112482348932, 0.00252328604391204, -0.00249539900088099, 0.0024675336719277, -0.00243966578886939, 0.00241178444384265, -0.00238391962827958, 0.00235608007063195, -0.0023282586349984, 0.00230045623484635, -0.00227268499974894, 0.00224495989333244, -0.00221728251298189, 0.00218965061091084, -0.00216206800592386, 0.00213454249851523, -0.00210708379759475, 0.00207969910837865, -0.00205238985238343, 0.00202515723164747, -0.00199800583303807, 0.00197094421194777, -0.00194397812202985, 0.00191711092778914, -0.00189034860875458, 0.00186369574733066, -0.00183715367408921, 0.00181072469565744, -0.0017844151357149, 0.0017582341412107, -0.0017321838571378, 0.00170626655838346, -0.00168049079708767, 0.00165485519763415, -0.00162936230621308, 0.00160402194715379, -0.00157883010344925, 0.00155379676915961, -0.00152893364205794, 0.00150420612145661, -0.00147970431748605, 0.00145530775564295, -0.00143111486682907, 0.00140711871382359, -0.00138328008634863, 0.00135961371061187, -0.00133614396325221, 0.00131287582405282, -0.00128979901551307, 0.00126690528595258, -0.00124420357467187, 0.00122170465613198, -0.00119941336883938, 0.00117732950510948, -0.00115544886347274, 0.00113376978686953, -0.00111229745935365, 0.00109103775835403, -0.00106999468293714, 0.00104916869524632, -0.00102856183843214, 0.00100817383202083, -0.00098800197099883, 0.000968046784016259, -0.000948313478604895, 0.000928805711526912, -0.000909524633306896, 0.000890469458292008, -0.000871644138406187, 0.000853047218257943, -0.000834675697156028, 0.00081653392752893, -0.000798621336012555, 0.000780936654337926, -0.000763487708815603, 0.000746268189474204, -0.000729278058657521, 0.000712551180795283, -0.000695964794839361, 0.000679764198621487, -0.000663672123332313, 0.000647812303381118, -0.000632239299155753, 0.000616904827245266, -0.000601777093613269, 0.000586859825161709, -0.000572177179652312, 0.000557742431522636, -0.000543548215697476, 0.000529581857936191, -0.000515834950482802, 0.000502304031502922, -0.000488996100991459, 0.000475916345710982, -0.00046306691240781, 0.000450446069488929, -0.000438051658535196, 0.000425878354317918, -0.000413920765471637, 0.0004021766059397, -0.000390649518243899, 0.000379339090710636, -0.000368245021518138, 0.00035736634038667, -0.000346703964720761, 0.000336254582537358, -0.000326013226188681, 0.000315978255978768, -0.000306149363623764, 0.000296520712058159, -0.000287095066122785, 0.00027786994351309, -0.000268841936562454, 0.000260014437059114, -0.000251381179715525, 0.000242918239689121, -0.000234824660332658, 0.000226414402795368, -0.00021881752010026, 0.000211189563354381, -0.000203587954958255, 0.000196170166987986, -0.000188996819874709, 0.000182055336025028, -0.000175302690007749, 0.00016870345935144, -0.000162247727240022, 0.00015593591277903, -0.000149780980913903, 0.000143794398605106, -0.000137981255942103, 0.000132341182130299, -0.000126870789700308, 0.000121559777121012, -0.000116398946242788, 0.000111380404155119, -0.000106502048718899, 0.000101759048610203, -9.71496232772418e-05, 9.26747824689245e-05, -8.83372192353965e-05, 8.4135335316669e-05, -8.00682505885446e-05, 7.61344839600716e-05, -7.23343205882869e-05, 6.86614291068185e-05, -6.51135323041922e-05, 6.16877094665854e-05, -5.83783846056115e-05, 5.51834721467025e-05, -5.21017617912321e-05, 4.91263406066308e-05, -4.6260828093455e-05, 4.34992545367574e-05, -4.08435851753202e-05, 0.000312039122914052]
-coefHPF1Hz=[0.0122816931227031, -0.0022399283900814, -0.0020498828927551, -0.00187985734688287, -0.00172587503961865, -0.00158704822595197, -0.00145952142679053, -0.00134296207725143, -0.00123365468554416, -0.0011313767353902, -0.0010327295889187, -0.000937837787709954, -0.000843629474143649, -0.000750560861067162, -0.000655654858231354, -0.000560008375553551, -0.000461212279958254, -0.000360992089712956, -0.000256445075407574, -0.000150161098987618, -4.01026958532817e-05, 7.17061403519877e-05, 0.000186526625246799, 0.000301188959141577, 0.000417797243565455, 0.000532268629729765, 0.000646108728049657, 0.000755997199341213, 0.000862662855204741, 0.000962357174604397, 0.00105642488207457, 0.00114038760074296, 0.00121595281277304, 0.00127810809801091, 0.00132964359437157, 0.0013646946336495, 0.00138731576906412, 0.00139022518031182, 0.00137978187903791, 0.00134597236928134, 0.00130124656825329, 0.00122643994626924, 0.00114267288478051, 0.00104441473097545, 0.000904118940469961, 0.000767766124009419, 0.000610899930243135, 0.000439125273567446, 0.000245083528339252, 4.11959884777388e-05, -0.000174848119991546, -0.000394740319468224, -0.000622225308808935, -0.000851453315901475, -0.00108485087623307, -0.00131581979276035, -0.00154443871850569, -0.00176339844688219, -0.0019723752076222, -0.00216515034984876, -0.00234166388744604, -0.00249553262892251, -0.00262782486632898, -0.0027332959784519, -0.0028116734044381, -0.00285825231892119, -0.00287404131699528, -0.00285298497638581, -0.0027974278857412, -0.0027026258639183, -0.00257059014491108, -0.00239867717065267, -0.0021894709575188, -0.00194123106509343, -0.00165751284177688, -0.0013376042370062, -0.000985926828344702, -0.000602548651463929, -0.000193113809127519, 0.000241593454964321, 0.000694770403788764, 0.00116538560976621, 0.00164482039761331, 0.00213433170914976, 0.00261880530770627, 0.00310485861421177, 0.00357681152885891, 0.00402991920457449, 0.00446284095081087, 0.00486682991992287, 0.0052333445149598, 0.00555735162981111, 0.00583353154298967, 0.00605661940505692, 0.00621976175305648, 0.00631768777015036, 0.00634470209710239, 0.00629734782669805, 0.00617114900221365, 0.00596379976395053, 0.005671311480847, 0.00529181082402618, 0.00482186727705251, 0.00426199635348143, 0.00361184539965395, 0.00287234807569728, 0.0020434115302440598, 0.00112972693393353, 0.000131712890318021, -0.000946527816949833, -0.00210002651428302, -0.00332499889781188, -0.00461464599249406, -0.00596277540467611, -0.00736215726916323, -0.00880491853818122, -0.0102830744543133, -0.0117878701560447, -0.0133108470615044, -0.0148422861960166, -0.0163731961580519, -0.0178932133217316, -0.0193930209269754, -0.0208617525454784, -0.0222905818193703, -0.0236689831439535, -0.0249873563021401, -0.0262394864221413, -0.0274119242946673, -0.0285012494930069, -0.0294978961797178, -0.0303937995095683, -0.0311831639618223, -0.0318618881416092, -0.0324241054583948, -0.0328656416665473, -0.0331830124230236, -0.0333743976062627, 0.966561710912809, -0.0333743976062627, -0.0331830124230236, -0.0328656416665473, -0.0324241054583948, -0.0318618881416092, -0.0311831639618223, -0.0303937995095683, -0.0294978961797178, -0.0285012494930069, -0.0274119242946673, -0.0262394864221413, -0.0249873563021401, -0.0236689831439535, -0.0222905818193703, -0.0208617525454784, -0.0193930209269754, -0.0178932133217316, -0.0163731961580519, -0.0148422861960166, -0.0133108470615044, -0.0117878701560447, -0.0102830744543133, -0.00880491853818122, -0.00736215726916323, -0.00596277540467611, -0.00461464599249406, -0.00332499889781188, -0.00210002651428302, -0.000946527816949833, 0.000131712890318021, 0.00112972693393353, 0.0020434115302440598, 0.00287234807569728, 0.00361184539965395, 0.00426199635348143, 0.00482186727705251, 0.00529181082402618, 0.005671311480847, 0.00596379976395053, 0.00617114900221365, 0.00629734782669805, 0.00634470209710239, 0.00631768777015036, 0.00621976175305648, 0.00605661940505692, 0.00583353154298967, 0.00555735162981111, 0.0052333445149598, 0.00486682991992287, 0.00446284095081087, 0.00402991920457449, 0.00357681152885891, 0.00310485861421177, 0.00261880530770627, 0.00213433170914976, 0.00164482039761331, 0.00116538560976621, 0.000694770403788764, 0.000241593454964321, -0.000193113809127519, -0.000602548651463929, -0.000985926828344702, -0.0013376042370062, -0.00165751284177688, -0.00194123106509343, -0.0021894709575188, -0.00239867717065267, -0.00257059014491108, -0.0027026258639183, -0.0027974278857412, -0.00285298497638581, -0.00287404131699528, -0.00285825231892119, -0.0028116734044381, -0.0027332959784519, -0.00262782486632898, -0.00249553262892251, -0.00234166388744604, -0.00216515034984876, -0.0019723752076222, -0.00176339844688219, -0.00154443871850569, -0.00131581979276035, -0.00108485087623307, -0.000851453315901475, -0.000622225308808935, -0.000394740319468224, -0.000174848119991546, 4.11959884777388e-05, 0.000245083528339252, 0.000439125273567446, 0.000610899930243135, 0.000767766124009419, 0.000904118940469961, 0.00104441473097545, 0.00114267288478051, 0.00122643994626924, 0.00130124656825329, 0.00134597236928134, 0.00137978187903791, 0.00139022518031182, 0.00138731576906412, 0.0013646946336495, 0.00132964359437157, 0.00127810809801091, 0.00121595281277304, 0.00114038760074296, 0.00105642488207457, 0.000962357174604397, 0.000862662855204741, 0.000755997199341213, 0.000646108728049657, 0.000532268629729765, 0.000417797243565455, 0.000301188959141577, 0.000186526625246799, 7.17061403519877e-05, -4.01026958532817e-05, -0.000150161098987618, -0.000256445075407574, -0.000360992089712956, -0.000461212279958254, -0.000560008375553551, -0.000655654858231354, -0.000750560861067162, -0.000843629474143649, -0.000937837787709954, -0.0010327295889187, -0.0011313767353902, -0.00123365468554416, -0.00134296207725143, -0.00145952142679053, -0.00158704822595197, -0.00172587503961865, -0.00187985734688287, -0.0020498828927551, -0.0022399283900814, 0.0122816931227031]
-coefHPF2Hz=[0.00403209782731666, -0.013612538025729, 2.59717109631358e-05, 0.00334833486408894, 0.00362543482889631, 0.00307525287079274, 0.00236333067090972, 0.0016843054784716, 0.00108688835409581, 0.00057731454058436, 0.000150303226719161, -0.000203595824124349, -0.000492671099058029, -0.000722726339054336, -0.000901678408338166, -0.00103239631900644, -0.00112067227614115, -0.00116853257040167, -0.00118036589523332, -0.0011564744147537, -0.0011017404271443, -0.00101587813626364, -0.000902499446731402, -0.000762685536787046, -0.00060234083668214, -0.00042215661762091, -0.000227801044402166, -2.19463801107012e-05, 0.000188178527995627, 0.000399773434049577, 0.000605035802062304, 0.000800529822140272, 0.000978220924357439, 0.0011344306330069, 0.0012615491869622, 0.00135740750219684, 0.00141511370367835, 0.00143355619590541, 0.00140871323690031, 0.00134196385630416, 0.00122957297588756, 0.0010752398712168, 0.000879573286118286, 0.000648966671677777, 0.000385255150232742, 9.87245441720689e-05, -0.000205912114273295, -0.000518002068416526, -0.000832033225074104, -0.00113417278368345, -0.00141866471304023, -0.00167199689458312, -0.00188843050474785, -0.00205520381347671, -0.00217053480729927, -0.00222260047927424, -0.00221200802848113, -0.00213054417464508, -0.0019832128932892, -0.00176274789477994, -0.00148189455666, -0.00113763477660531, -0.000746055514506746, -0.000305361071361646, 0.000157764386807623, 0.000652379658768977, 0.00113864375429754, 0.0016286072742549, 0.00208590376723786, 0.00250181309249715, 0.00287653360482643, 0.00316421483775418, 0.00338851877287002, 0.00351776080158679, 0.00353956479759262, 0.00346296734777757, 0.00328153350493388, 0.00297942862497359, 0.0025790627251626, 0.00208214960644241, 0.00149304007461287, 0.000820327018689225, 9.46962629477033e-05, -0.000672054705241704, -0.00146376398765734, -0.00225986598244412, -0.00302645310398369, -0.00374396618179271, -0.00439126854483236, -0.00494840269857758, -0.00538696996974154, -0.00568809082173198, -0.00583549563291259, -0.00582100502943402, -0.00563215112432081, -0.00526240131211691, -0.00470905748580677, -0.00398126201766973, -0.00308933231532417, -0.00204970246255828, -0.000879747934568428, 0.0003953388863765, 0.00174726496492545, 0.00313857198054567, 0.00453145049212702, 0.00588631582693348, 0.00716638375755386, 0.00832967898827732, 0.00933424473139807, 0.0101362881620999, 0.0106984004082988, 0.0109855430051815, 0.0109686518647759, 0.0106200513835997, 0.00992100542963166, 0.0088567975761498, 0.00741973371296733, 0.00560728586161012, 0.00343093613780876, 0.000907887470465127, -0.00193803762918433, -0.00507769488824387, -0.00847048625910351, -0.0120743843454964, -0.0158413995313075, -0.0197170538637175, -0.0236399855461008, -0.0275518521650095, -0.0313904739042945, -0.0350917803029744, -0.0385957027357391, -0.0418462101279152, -0.0447862377366356, -0.0473631814926135, -0.0495415291281918, -0.0512704236380051, -0.0525313238933853, -0.0532958073086654, 0.946448561442037, -0.0532958073086654, -0.0525313238933853, -0.0512704236380051, -0.0495415291281918, -0.0473631814926135, -0.0447862377366356, -0.0418462101279152, -0.0385957027357391, -0.0350917803029744, -0.0313904739042945, -0.0275518521650095, -0.0236399855461008, -0.0197170538637175, -0.0158413995313075, -0.0120743843454964, -0.00847048625910351, -0.00507769488824387, -0.00193803762918433, 0.000907887470465127, 0.00343093613780876, 0.00560728586161012, 0.00741973371296733, 0.0088567975761498, 0.00992100542963166, 0.0106200513835997, 0.0109686518647759, 0.0109855430051815, 0.0106984004082988, 0.0101362881620999, 0.00933424473139807, 0.00832967898827732, 0.00716638375755386, 0.00588631582693348, 0.00453145049212702, 0.00313857198054567, 0.00174726496492545, 0.0003953388863765, -0.000879747934568428, -0.00204970246255828, -0.00308933231532417, -0.00398126201766973, -0.00470905748580677, -0.00526240131211691, -0.00563215112432081, -0.00582100502943402, -0.00583549563291259, -0.00568809082173198, -0.00538696996974154, -0.00494840269857758, -0.00439126854483236, -0.00374396618179271, -0.00302645310398369, -0.00225986598244412, -0.00146376398765734, -0.000672054705241704, 9.46962629477033e-05, 0.000820327018689225, 0.00149304007461287, 0.00208214960644241, 0.0025790627251626, 0.00297942862497359, 0.00328153350493388, 0.00346296734777757, 0.00353956479759262, 0.00351776080158679, 0.00338851877287002, 0.00316421483775418, 0.00287653360482643, 0.00250181309249715, 0.00208590376723786, 0.0016286072742549, 0.00113864375429754, 0.000652379658768977, 0.000157764386807623, -0.000305361071361646, -0.000746055514506746, -0.00113763477660531, -0.00148189455666, -0.00176274789477994, -0.0019832128932892, -0.00213054417464508, -0.00221200802848113, -0.00222260047927424, -0.00217053480729927, -0.00205520381347671, -0.00188843050474785, -0.00167199689458312, -0.00141866471304023, -0.00113417278368345, -0.000832033225074104, -0.000518002068416526, -0.000205912114273295, 9.87245441720689e-05, 0.000385255150232742, 0.000648966671677777, 0.000879573286118286, 0.0010752398712168, 0.00122957297588756, 0.00134196385630416, 0.00140871323690031, 0.00143355619590541, 0.00141511370367835, 0.00135740750219684, 0.0012615491869622, 0.0011344306330069, 0.000978220924357439, 0.000800529822140272, 0.000605035802062304, 0.000399773434049577, 0.000188178527995627, -2.19463801107012e-05, -0.000227801044402166, -0.00042215661762091, -0.00060234083668214, -0.000762685536787046, -0.000902499446731402, -0.00101587813626364, -0.0011017404271443, -0.0011564744147537, -0.00118036589523332, -0.00116853257040167, -0.00112067227614115, -0.00103239631900644, -0.000901678408338166, -0.000722726339054336, -0.000492671099058029, -0.000203595824124349, 0.000150303226719161, 0.00057731454058436, 0.00108688835409581, 0.0016843054784716, 0.00236333067090972, 0.00307525287079274, 0.00362543482889631, 0.00334833486408894, 2.59717109631358e-05, -0.013612538025729, 0.00403209782731666]
-coefHPF3Hz=[-0.00225979052882009, 0.0134530870211525, -0.00487915456978356, -0.00575493859259177, -0.00396720127521897, -0.00215137802656551, -0.00071862937376929, 0.000318225941907886, 0.00101584797633454, 0.00143329552154068, 0.00162699868927608, 0.00164537073772285, 0.00153154324361422, 0.00131983146685971, 0.00104251058422806, 0.000724435575653024, 0.000388157269727535, 5.14035288615118e-05, -0.000267297709726797, -0.000555620887704357, -0.000801670587706651, -0.000995613472940396, -0.00112870670342111, -0.0011987219794692, -0.00120285878670346, -0.00114162241697084, -0.00101565637239168, -0.000833960764432874, -0.00060066691723483, -0.000330225228249213, -3.33497001978062e-05, 0.000272474599292393, 0.000574744610568277, 0.000853441112603633, 0.00109492277112176, 0.00128477022567933, 0.00141004251951977, 0.00146092348953954, 0.00143269748377916, 0.0013197914246037, 0.00112980940423031, 0.000866493497824929, 0.00054215381507667, 0.000173056224554321, -0.000224088480352934, -0.000628747933495371, -0.00101474820853534, -0.0013641719474199, -0.00165051585713841, -0.00185971693164257, -0.00197291936316285, -0.00198131185582985, -0.00187736293014372, -0.0016616444518884, -0.0013410228336102, -0.000928075349271268, -0.000442928123799125, 9.26866175843508e-05, 0.000650402576488334, 0.0012002446850727, 0.00171000628789038, 0.00214937609093256, 0.00248866413159134, 0.00270498034006329, 0.00277994341959815, 0.00270322534135371, 0.00246885795159314, 0.00208382347705206, 0.00156054655183833, 0.000924190966175551, 0.000201592903262175, -0.000566471857778543, -0.00134739133730191, -0.00208836820409914, -0.00275971807955135, -0.00329740117895309, -0.00369635346868931, -0.00389176965033274, -0.00389449015127002, -0.00367428335287804, -0.00322681134465599, -0.00259371082283361, -0.00176450679070346, -0.000795396003322834, 0.000264462273800753, 0.00137512184441656, 0.00247508532765373, 0.00348583723155081, 0.00436499004724766, 0.00505627243526674, 0.00550217843338231, 0.00565867051061126, 0.00551656246436228, 0.00506169521987589, 0.00429388890243885, 0.00323347889672342, 0.00193375153542203, 0.000447854396053145, -0.00115907418989058, -0.00281233947010475, -0.0044125179181298, -0.00587099154117635, -0.00709801224921217, -0.0080188327929415, -0.00855511711606903, -0.00865377335897722, -0.00827166111676308, -0.00739731732671673, -0.00604205220302008, -0.00424785138798445, -0.00206770347987222, 0.000412480676804176, 0.00308387414064318, 0.00581642289115664, 0.00847494147396276, 0.0109029528445887, 0.0129580762017806, 0.014493287467397, 0.0153715233323538, 0.0154743352046612, 0.0147092727828519, 0.0130030599830439, 0.0103364286445491, 0.00670157306214161, 0.00214684317519768, -0.00325621725048567, -0.0093980080228273, -0.0161322443591658, -0.0232887003299862, -0.0306679313842649, -0.0380621144872359, -0.0452503284655232, -0.052017111243564, -0.0581535597573315, -0.0634682085577733, -0.0677921590066219, -0.0709859040465011, -0.0729456126982836, 0.926393863785469, -0.0729456126982836, -0.0709859040465011, -0.0677921590066219, -0.0634682085577733, -0.0581535597573315, -0.052017111243564, -0.0452503284655232, -0.0380621144872359, -0.0306679313842649, -0.0232887003299862, -0.0161322443591658, -0.0093980080228273, -0.00325621725048567, 0.00214684317519768, 0.00670157306214161, 0.0103364286445491, 0.0130030599830439, 0.0147092727828519, 0.0154743352046612, 0.0153715233323538, 0.014493287467397, 0.0129580762017806, 0.0109029528445887, 0.00847494147396276, 0.00581642289115664, 0.00308387414064318, 0.000412480676804176, -0.00206770347987222, -0.00424785138798445, -0.00604205220302008, -0.00739731732671673, -0.00827166111676308, -0.00865377335897722, -0.00855511711606903, -0.0080188327929415, -0.00709801224921217, -0.00587099154117635, -0.0044125179181298, -0.00281233947010475, -0.00115907418989058, 0.000447854396053145, 0.00193375153542203, 0.00323347889672342, 0.00429388890243885, 0.00506169521987589, 0.00551656246436228, 0.00565867051061126, 0.00550217843338231, 0.00505627243526674, 0.00436499004724766, 0.00348583723155081, 0.00247508532765373, 0.00137512184441656, 0.000264462273800753, -0.000795396003322834, -0.00176450679070346, -0.00259371082283361, -0.00322681134465599, -0.00367428335287804, -0.00389449015127002, -0.00389176965033274, -0.00369635346868931, -0.00329740117895309, -0.00275971807955135, -0.00208836820409914, -0.00134739133730191, -0.000566471857778543, 0.000201592903262175, 0.000924190966175551, 0.00156054655183833, 0.00208382347705206, 0.00246885795159314, 0.00270322534135371, 0.00277994341959815, 0.00270498034006329, 0.00248866413159134, 0.00214937609093256, 0.00171000628789038, 0.0012002446850727, 0.000650402576488334, 9.26866175843508e-05, -0.000442928123799125, -0.000928075349271268, -0.0013410228336102, -0.0016616444518884, -0.00187736293014372, -0.00198131185582985, -0.00197291936316285, -0.00185971693164257, -0.00165051585713841, -0.0013641719474199, -0.00101474820853534, -0.000628747933495371, -0.000224088480352934, 0.000173056224554321, 0.00054215381507667, 0.000866493497824929, 0.00112980940423031, 0.0013197914246037, 0.00143269748377916, 0.00146092348953954, 0.00141004251951977, 0.00128477022567933, 0.00109492277112176, 0.000853441112603633, 0.000574744610568277, 0.000272474599292393, -3.33497001978062e-05, -0.000330225228249213, -0.00060066691723483, -0.000833960764432874, -0.00101565637239168, -0.00114162241697084, -0.00120285878670346, -0.0011987219794692, -0.00112870670342111, -0.000995613472940396, -0.000801670587706651, -0.000555620887704357, -0.000267297709726797, 5.14035288615118e-05, 0.000388157269727535, 0.000724435575653024, 0.00104251058422806, 0.00131983146685971, 0.00153154324361422, 0.00164537073772285, 0.00162699868927608, 0.00143329552154068, 0.00101584797633454, 0.000318225941907886, -0.00071862937376929, -0.00215137802656551, -0.00396720127521897, -0.00575493859259177, -0.00487915456978356, 0.0134530870211525, -0.00225979052882009]
-coefHPF4Hz=[-0.00462419942960388, -0.00469581104625385, 0.014308463042652, -7.50635602971841e-05, 0.0016821446604837, -0.00177467732941026, -0.00178016894782362, -0.00232145899623794, -0.00198572314186323, -0.00160125418200032, -0.00100593231750925, -0.000412472472295013, 0.000157637823808901, 0.000634113510612716, 0.000993103049844935, 0.00121630494694077, 0.00130133188871791, 0.00125442402862616, 0.00109042033949656, 0.000830865497072871, 0.000506094583528966, 0.000140131520167804, -0.000229595554316371, -0.000577610699479214, -0.000871132712077003, -0.00109007133738649, -0.00121204872712592, -0.00122819003422282, -0.00113559252163562, -0.000938850877109128, -0.000654007299961305, -0.000302727001524275, 8.80141478379674e-05, 0.000482330679150703, 0.000849956112860046, 0.00115380352414597, 0.00136621543287167, 0.00146445153561475, 0.00143407889967107, 0.00127326670604897, 0.000990042697435886, 0.00060471517136915, 0.000147432671888607, -0.000345404835088677, -0.000828911690665243, -0.00126181770359931, -0.00160056107449215, -0.00181083859855525, -0.00186796826252253, -0.00175746511851707, -0.00148334742294167, -0.00106105070689078, -0.000521041152068783, 9.14488076547469e-05, 0.000727821609534901, 0.00132946451575824, 0.00184138763032176, 0.0022135298831177, 0.00240332971645284, 0.0023868471254048, 0.00215345668088002, 0.0017132405042012, 0.00109749554678022, 0.00034987879131985, -0.000467123390454781, -0.00128380843432099, -0.00202807475951062, -0.0026273252759348, -0.00302118715412141, -0.00316363697808671, -0.00302772440191219, -0.0026127372578909, -0.00194183214593031, -0.00106031709649359, -3.77343004136721e-05, 0.00104092327909108, 0.00208509819898513, 0.00299680917868941, 0.00368640931947169, 0.00408410709687807, 0.00413589351812677, 0.00381983253458115, 0.00314583327056253, 0.00215265550501514, 0.000912791606712151, -0.000479785059618236, -0.00190925135909778, -0.00324188342225199, -0.00435859958696103, -0.00515919840667089, -0.0055449130812167, -0.00544246061108152, -0.00485037306168779, -0.00380212180474855, -0.00234206612472624, -0.000577725868104361, 0.00133824839033586, 0.00325961725350249, 0.00501427350746661, 0.00642175536631613, 0.00734871806681586, 0.00768746682361609, 0.0073540029452812, 0.00634130598920736, 0.00468846926361395, 0.00248914897842088, -8.7357091942893e-05, -0.00285072170924465, -0.00557480970310674, -0.00800364060382014, -0.00991735089215601, -0.0110959312593391, -0.0113710968933175, -0.0106488186503611, -0.00889057774782106, -0.00616121051082033, -0.00260630017724708, 0.00155589987325426, 0.00601312432489152, 0.010427510031903, 0.0144045310668517, 0.017552457790547, 0.0195020877905778, 0.0199166240527241, 0.0185475638315979, 0.0152324625606543, 0.00991403460410583, 0.00268081076296832, -0.0062982841888071, -0.0166843822804376, -0.0280957351732563, -0.0400134034988186, -0.0519148337749022, -0.0632176996695738, -0.0733742782731083, -0.0818737576450209, -0.0882769496032683, -0.092261348979107, 0.906390761405621, -0.092261348979107, -0.0882769496032683, -0.0818737576450209, -0.0733742782731083, -0.0632176996695738, -0.0519148337749022, -0.0400134034988186, -0.0280957351732563, -0.0166843822804376, -0.0062982841888071, 0.00268081076296832, 0.00991403460410583, 0.0152324625606543, 0.0185475638315979, 0.0199166240527241, 0.0195020877905778, 0.017552457790547, 0.0144045310668517, 0.010427510031903, 0.00601312432489152, 0.00155589987325426, -0.00260630017724708, -0.00616121051082033, -0.00889057774782106, -0.0106488186503611, -0.0113710968933175, -0.0110959312593391, -0.00991735089215601, -0.00800364060382014, -0.00557480970310674, -0.00285072170924465, -8.7357091942893e-05, 0.00248914897842088, 0.00468846926361395, 0.00634130598920736, 0.0073540029452812, 0.00768746682361609, 0.00734871806681586, 0.00642175536631613, 0.00501427350746661, 0.00325961725350249, 0.00133824839033586, -0.000577725868104361, -0.00234206612472624, -0.00380212180474855, -0.00485037306168779, -0.00544246061108152, -0.0055449130812167, -0.00515919840667089, -0.00435859958696103, -0.00324188342225199, -0.00190925135909778, -0.000479785059618236, 0.000912791606712151, 0.00215265550501514, 0.00314583327056253, 0.00381983253458115, 0.00413589351812677, 0.00408410709687807, 0.00368640931947169, 0.00299680917868941, 0.00208509819898513, 0.00104092327909108, -3.77343004136721e-05, -0.00106031709649359, -0.00194183214593031, -0.0026127372578909, -0.00302772440191219, -0.00316363697808671, -0.00302118715412141, -0.0026273252759348, -0.00202807475951062, -0.00128380843432099, -0.000467123390454781, 0.00034987879131985, 0.00109749554678022, 0.0017132405042012, 0.00215345668088002, 0.0023868471254048, 0.00240332971645284, 0.0022135298831177, 0.00184138763032176, 0.00132946451575824, 0.000727821609534901, 9.14488076547469e-05, -0.000521041152068783, -0.00106105070689078, -0.00148334742294167, -0.00175746511851707, -0.00186796826252253, -0.00181083859855525, -0.00160056107449215, -0.00126181770359931, -0.000828911690665243, -0.000345404835088677, 0.000147432671888607, 0.00060471517136915, 0.000990042697435886, 0.00127326670604897, 0.00143407889967107, 0.00146445153561475, 0.00136621543287167, 0.00115380352414597, 0.000849956112860046, 0.000482330679150703, 8.80141478379674e-05, -0.000302727001524275, -0.000654007299961305, -0.000938850877109128, -0.00113559252163562, -0.00122819003422282, -0.00121204872712592, -0.00109007133738649, -0.000871132712077003, -0.000577610699479214, -0.000229595554316371, 0.000140131520167804, 0.000506094583528966, 0.000830865497072871, 0.00109042033949656, 0.00125442402862616, 0.00130133188871791, 0.00121630494694077, 0.000993103049844935, 0.000634113510612716, 0.000157637823808901, -0.000412472472295013, -0.00100593231750925, -0.00160125418200032, -0.00198572314186323, -0.00232145899623794, -0.00178016894782362, -0.00177467732941026, 0.0016821446604837, -7.50635602971841e-05, 0.014308463042652, -0.00469581104625385, -0.00462419942960388]
-coefHPF5Hz=[0.00956367058833668, -0.0119212288690506, -0.00405831902646122, 0.00045145356153105, 0.00254934901016218, 0.00303412444373432, 0.00254807115769333, 0.00158880895036027, 0.000510717306153346, -0.000444778744217611, -0.0011450240462716, -0.00152865511246308, -0.00160258003038319, -0.00140704633325859, -0.00101556140485138, -0.000505584813310738, 3.57146036771371e-05, 0.000536092273799322, 0.000930977700015319, 0.00118022791196388, 0.001257674028512, 0.00116524049178839, 0.000917995811895929, 0.000553471414614567, 0.0001162633626021, -0.000334510313043723, -0.000745106317815263, -0.00106093889819342, -0.0012447738389416, -0.00126792231690738, -0.00112731177828622, -0.000833656162367827, -0.000423886118932116, 5.62303137922574e-05, 0.000543266471513095, 0.000978073089623548, 0.00129923986463661, 0.00146454360063623, 0.00144176660963984, 0.0012302341017729, 0.000845134820094812, 0.000333412865621965, -0.000248398291572463, -0.000821322697614001, -0.00131596585179138, -0.00165715153747603, -0.00179839619373738, -0.00170469590516205, -0.0013857262498952, -0.000863289073270068, -0.000205568920436941, 0.000516362407542441, 0.00120327136748198, 0.00176353826866267, 0.00212780781371604, 0.00220948793192849, 0.0020297188373288, 0.00154997874792775, 0.0008499113389797, 9.38818538989921e-06, -0.000884497954949716, -0.00170814376847458, -0.00233825247216215, -0.00269785420393375, -0.00272755389277831, -0.00239281551992899, -0.00172174556308681, -0.000794410046970341, 0.000280710985949014, 0.00137984306632157, 0.0023575398632494, 0.00307339761450932, 0.00341846731422924, 0.00333508832498686, 0.00281280936319803, 0.00189328065615499, 0.00067171975178388, -0.000703559321551216, -0.002056852013179, -0.00320953421766229, -0.004005216054084, -0.00432099676806996, -0.00408867581888347, -0.00330521576131275, -0.00204410159853695, -0.000444440534018018, 0.00130019527683565, 0.00297152748344033, 0.00434818242880656, 0.00523729552283264, 0.00549213145473938, 0.00504148586811501, 0.00390083938056156, 0.00218177562699859, 7.28224604041034e-05, -0.00217231760738331, -0.00427160924604135, -0.00594142484859641, -0.00694169939216295, -0.00709468455603075, -0.00632735700858161, -0.00467556884923962, -0.00229957938617645, 0.000545041571801825, 0.00351356177435653, 0.00623444973199331, 0.00833473928691455, 0.00949730461671676, 0.00950067652360316, 0.00824915966496071, 0.00581073814762233, 0.00239450069780052, -0.00162801303250427, -0.0057925260079122, -0.00957116393311215, -0.0124374549796383, -0.0139328752706736, -0.0137282789168555, -0.0116690109984903, -0.00781559961806215, -0.00246475386758587, 0.00388251860396056, 0.0105375808822168, 0.0166908516438467, 0.0214838619546462, 0.0241046698095773, 0.0238608338253104, 0.0202702201761749, 0.0131199896076765, 0.00250790453675206, -0.0111540527638131, -0.0271487477581551, -0.0445077018074611, -0.0620872039246279, -0.0786694243205407, -0.0930587314318305, -0.104190108133576, -0.111224120803159, 0.886370223003179, -0.111224120803159, -0.104190108133576, -0.0930587314318305, -0.0786694243205407, -0.0620872039246279, -0.0445077018074611, -0.0271487477581551, -0.0111540527638131, 0.00250790453675206, 0.0131199896076765, 0.0202702201761749, 0.0238608338253104, 0.0241046698095773, 0.0214838619546462, 0.0166908516438467, 0.0105375808822168, 0.00388251860396056, -0.00246475386758587, -0.00781559961806215, -0.0116690109984903, -0.0137282789168555, -0.0139328752706736, -0.0124374549796383, -0.00957116393311215, -0.0057925260079122, -0.00162801303250427, 0.00239450069780052, 0.00581073814762233, 0.00824915966496071, 0.00950067652360316, 0.00949730461671676, 0.00833473928691455, 0.00623444973199331, 0.00351356177435653, 0.000545041571801825, -0.00229957938617645, -0.00467556884923962, -0.00632735700858161, -0.00709468455603075, -0.00694169939216295, -0.00594142484859641, -0.00427160924604135, -0.00217231760738331, 7.28224604041034e-05, 0.00218177562699859, 0.00390083938056156, 0.00504148586811501, 0.00549213145473938, 0.00523729552283264, 0.00434818242880656, 0.00297152748344033, 0.00130019527683565, -0.000444440534018018, -0.00204410159853695, -0.00330521576131275, -0.00408867581888347, -0.00432099676806996, -0.004005216054084, -0.00320953421766229, -0.002056852013179, -0.000703559321551216, 0.00067171975178388, 0.00189328065615499, 0.00281280936319803, 0.00333508832498686, 0.00341846731422924, 0.00307339761450932, 0.0023575398632494, 0.00137984306632157, 0.000280710985949014, -0.000794410046970341, -0.00172174556308681, -0.00239281551992899, -0.00272755389277831, -0.00269785420393375, -0.00233825247216215, -0.00170814376847458, -0.000884497954949716, 9.38818538989921e-06, 0.0008499113389797, 0.00154997874792775, 0.0020297188373288, 0.00220948793192849, 0.00212780781371604, 0.00176353826866267, 0.00120327136748198, 0.000516362407542441, -0.000205568920436941, -0.000863289073270068, -0.0013857262498952, -0.00170469590516205, -0.00179839619373738, -0.00165715153747603, -0.00131596585179138, -0.000821322697614001, -0.000248398291572463, 0.000333412865621965, 0.000845134820094812, 0.0012302341017729, 0.00144176660963984, 0.00146454360063623, 0.00129923986463661, 0.000978073089623548, 0.000543266471513095, 5.62303137922574e-05, -0.000423886118932116, -0.000833656162367827, -0.00112731177828622, -0.00126792231690738, -0.0012447738389416, -0.00106093889819342, -0.000745106317815263, -0.000334510313043723, 0.0001162633626021, 0.000553471414614567, 0.000917995811895929, 0.00116524049178839, 0.001257674028512, 0.00118022791196388, 0.000930977700015319, 0.000536092273799322, 3.57146036771371e-05, -0.000505584813310738, -0.00101556140485138, -0.00140704633325859, -0.00160258003038319, -0.00152865511246308, -0.0011450240462716, -0.000444778744217611, 0.000510717306153346, 0.00158880895036027, 0.00254807115769333, 0.00303412444373432, 0.00254934901016218, 0.00045145356153105, -0.00405831902646122, -0.0119212288690506, 0.00956367058833668]
-coefHPF6Hz=[-0.00799585967674611, 0.0134410299289778, 0.001493718660633, -0.00341891818845348, -0.00418398966909905, -0.00290253355223835, -0.000989697411321248, 0.000708591894667253, 0.00178210035343867, 0.00213474475612689, 0.00186771040896923, 0.00118730876197234, 0.00032960456929634, -0.000490220739685433, -0.00110949235060818, -0.00143400740635686, -0.0014376325685592, -0.0011544089120901, -0.000665045307926845, -7.50123173603279e-05, 0.00050183072567683, 0.000964476180908933, 0.00123456792473501, 0.00127443300636749, 0.00108036526600652, 0.000690986450309045, 0.00017647427040319, -0.000371723498218901, -0.00085934585414631, -0.00119768314439416, -0.00132814820578571, -0.00122092408617404, -0.000890971667418256, -0.000391227556120104, 0.000193803348561864, 0.000764145573697872, 0.00121570130467373, 0.0014663117298952, 0.00145998017172379, 0.00118978088236969, 0.000693015821859989, 4.97197882479989e-05, -0.000630921571500434, -0.00122628483520401, -0.00162782156526528, -0.00175114664214533, -0.00156569064797684, -0.00108577585862022, -0.000388480506028982, 0.000417286799661913, 0.00118270337077439, 0.00177459211676504, 0.0020693845944577, 0.00200908784795329, 0.00157513584970689, 0.000841253029048212, -9.08282328501719e-05, -0.00104445827238864, -0.00186384704202622, -0.0023867765884664, -0.00249222230489392, -0.00217276683352919, -0.00141753760936516, -0.000388389437502161, 0.000768713595998361, 0.00185357590929801, 0.00265227646640725, 0.00300758022862362, 0.00285110843101425, 0.00216295748260985, 0.00104457565576452, -0.000315025113235775, -0.00168355929634293, -0.00282911909038932, -0.00352402454575803, -0.00361437397998305, -0.00305594257968616, -0.00192323896249641, -0.000381169212196909, 0.00131567757536614, 0.00286752601230574, 0.00398091592161311, 0.00443785895247022, 0.00412163095711965, 0.00304885702578328, 0.00136341962644858, -0.000664262949302562, -0.00268499024433481, -0.00433164256664701, -0.00529567857010419, -0.00536248811679871, -0.00446914199934123, -0.00271505949712828, -0.000364197672515079, 0.00219413449604099, 0.00450879544913251, 0.00615510475349659, 0.00679443621095288, 0.00625175685667083, 0.00454468871909137, 0.00190165373409397, -0.00126016953281205, -0.00440806664043377, -0.00697390167319285, -0.00845959015898351, -0.00852432416794042, -0.00705140257139359, -0.00419099104100636, -0.000347754252113586, 0.00386144318190856, 0.00771333329099084, 0.0104814087671194, 0.0115817422023631, 0.0106661764770354, 0.00772552134418432, 0.00309057117689599, -0.00256180619128563, -0.00833251724337101, -0.0131878727588584, -0.016161176319766, -0.0164999746215659, -0.0138238262071951, -0.00823595863326653, -0.000334315802126851, 0.00880190132669446, 0.0177316554368802, 0.0248406375651623, 0.0285422880364512, 0.0275173170043133, 0.0209260130532009, 0.00855429947453503, -0.0090978409386405, -0.0308284896021001, -0.0548580574630499, -0.079006310519369, -0.100939905023781, -0.118456949683662, -0.129760652688362, 0.866333606207977, -0.129760652688362, -0.118456949683662, -0.100939905023781, -0.079006310519369, -0.0548580574630499, -0.0308284896021001, -0.0090978409386405, 0.00855429947453503, 0.0209260130532009, 0.0275173170043133, 0.0285422880364512, 0.0248406375651623, 0.0177316554368802, 0.00880190132669446, -0.000334315802126851, -0.00823595863326653, -0.0138238262071951, -0.0164999746215659, -0.016161176319766, -0.0131878727588584, -0.00833251724337101, -0.00256180619128563, 0.00309057117689599, 0.00772552134418432, 0.0106661764770354, 0.0115817422023631, 0.0104814087671194, 0.00771333329099084, 0.00386144318190856, -0.000347754252113586, -0.00419099104100636, -0.00705140257139359, -0.00852432416794042, -0.00845959015898351, -0.00697390167319285, -0.00440806664043377, -0.00126016953281205, 0.00190165373409397, 0.00454468871909137, 0.00625175685667083, 0.00679443621095288, 0.00615510475349659, 0.00450879544913251, 0.00219413449604099, -0.000364197672515079, -0.00271505949712828, -0.00446914199934123, -0.00536248811679871, -0.00529567857010419, -0.00433164256664701, -0.00268499024433481, -0.000664262949302562, 0.00136341962644858, 0.00304885702578328, 0.00412163095711965, 0.00443785895247022, 0.00398091592161311, 0.00286752601230574, 0.00131567757536614, -0.000381169212196909, -0.00192323896249641, -0.00305594257968616, -0.00361437397998305, -0.00352402454575803, -0.00282911909038932, -0.00168355929634293, -0.000315025113235775, 0.00104457565576452, 0.00216295748260985, 0.00285110843101425, 0.00300758022862362, 0.00265227646640725, 0.00185357590929801, 0.000768713595998361, -0.000388389437502161, -0.00141753760936516, -0.00217276683352919, -0.00249222230489392, -0.0023867765884664, -0.00186384704202622, -0.00104445827238864, -9.08282328501719e-05, 0.000841253029048212, 0.00157513584970689, 0.00200908784795329, 0.0020693845944577, 0.00177459211676504, 0.00118270337077439, 0.000417286799661913, -0.000388480506028982, -0.00108577585862022, -0.00156569064797684, -0.00175114664214533, -0.00162782156526528, -0.00122628483520401, -0.000630921571500434, 4.97197882479989e-05, 0.000693015821859989, 0.00118978088236969, 0.00145998017172379, 0.0014663117298952, 0.00121570130467373, 0.000764145573697872, 0.000193803348561864, -0.000391227556120104, -0.000890971667418256, -0.00122092408617404, -0.00132814820578571, -0.00119768314439416, -0.00085934585414631, -0.000371723498218901, 0.00017647427040319, 0.000690986450309045, 0.00108036526600652, 0.00127443300636749, 0.00123456792473501, 0.000964476180908933, 0.00050183072567683, -7.50123173603279e-05, -0.000665045307926845, -0.0011544089120901, -0.0014376325685592, -0.00143400740635686, -0.00110949235060818, -0.000490220739685433, 0.00032960456929634, 0.00118730876197234, 0.00186771040896923, 0.00213474475612689, 0.00178210035343867, 0.000708591894667253, -0.000989697411321248, -0.00290253355223835, -0.00418398966909905, -0.00341891818845348, 0.001493718660633, 0.0134410299289778, -0.00799585967674611]
-coefHPF7Hz=[0.00615390916485461, -0.0138178112497615, 0.0023815388257622, 0.00579286306252072, 0.0037507129416394, 0.000504076253643598, -0.00189157546267444, -0.00279755540798956, -0.00239143998875109, -0.00121236159716938, 0.000147795357452836, 0.00122683848470698, 0.00176307290177877, 0.0017099428061728, 0.00117796534591086, 0.000379768036652658, -0.000444279286135707, -0.00108327414086406, -0.00139881425287709, -0.00134229524689894, -0.000954438100116363, -0.000347672458201357, 0.000322312596039613, 0.000897850045368997, 0.00124597746484331, 0.00129372846615987, 0.00103186482858387, 0.000525834325279422, -0.000109779541748031, -0.000724528291042055, -0.0011785354781569, -0.00136025736034396, -0.00122507178229329, -0.000795762745635384, -0.000168419553813067, 0.000519482035849218, 0.00110661117000156, 0.00145393019869244, 0.00146803611738483, 0.00113659595613103, 0.000520196766821568, -0.000243804816233764, -0.000984636539183554, -0.00152129688796436, -0.00172320381973209, -0.00152271840144793, -0.000952911519665805, -0.000126871857548669, 0.000765503413189533, 0.001520922264948, 0.00194890170379847, 0.00193572408615208, 0.00145902952803015, 0.000614742467362181, -0.000420566807668142, -0.0014042722207636, -0.00210627443306058, -0.00233802943386324, -0.00203121352102183, -0.00121979560711365, -8.51923996704902e-05, 0.00113572236081037, 0.00213927254180167, 0.00269924137030552, 0.00263092924374048, 0.00194810520541971, 0.000760663553525838, -0.000673555414015027, -0.00200470269910244, -0.0029517577167922, -0.00322946207624202, -0.00275998243247793, -0.0016192868302736, -2.65148560436632e-05, 0.00165654402363326, 0.00302354039786618, 0.00375904372487513, 0.00364322163528355, 0.0026504084050036, 0.000979673924751029, -0.00100784839263302, -0.00287025187421316, -0.0041566718122941, -0.00452585729589595, -0.0038398766351186, -0.00221380336357895, 3.01528777893452e-05, 0.00239495108456392, 0.00432844757243801, 0.00534134966296421, 0.00515159241729537, 0.0037336802903853, 0.00134897285226932, -0.00150289444611705, -0.00416960583498471, -0.00600954102590494, -0.00653855931734137, -0.00555441778031182, -0.00319023936382387, 8.48955343958329e-05, 0.00355729547131399, 0.0064140853022651, 0.00794058464242121, 0.00768538199643365, 0.00558900061373959, 0.0020130114819432, -0.00230444116285469, -0.00640073731262139, -0.00928683663188817, -0.0101853047752309, -0.00872461967316194, -0.00506030129478596, 0.000129293377637311, 0.00575129034710603, 0.0105123982545695, 0.0131992758370432, 0.0129742064709765, 0.0095989754728222, 0.00354637414620184, -0.00404309503425869, -0.0115429379852092, -0.0171659824907213, -0.0193372361827451, -0.0170725070192445, -0.0102663173025877, 0.000160722634727315, 0.0123326221539128, 0.023683804514348, 0.0313705980861123, 0.0328001233107757, 0.0261253912924463, 0.0106819043318419, -0.0128221731028027, -0.0422576369397268, -0.0743718226433738, -0.105238098531277, -0.130845276087182, -0.147762642652997, 0.846322964096144, -0.147762642652997, -0.130845276087182, -0.105238098531277, -0.0743718226433738, -0.0422576369397268, -0.0128221731028027, 0.0106819043318419, 0.0261253912924463, 0.0328001233107757, 0.0313705980861123, 0.023683804514348, 0.0123326221539128, 0.000160722634727315, -0.0102663173025877, -0.0170725070192445, -0.0193372361827451, -0.0171659824907213, -0.0115429379852092, -0.00404309503425869, 0.00354637414620184, 0.0095989754728222, 0.0129742064709765, 0.0131992758370432, 0.0105123982545695, 0.00575129034710603, 0.000129293377637311, -0.00506030129478596, -0.00872461967316194, -0.0101853047752309, -0.00928683663188817, -0.00640073731262139, -0.00230444116285469, 0.0020130114819432, 0.00558900061373959, 0.00768538199643365, 0.00794058464242121, 0.0064140853022651, 0.00355729547131399, 8.48955343958329e-05, -0.00319023936382387, -0.00555441778031182, -0.00653855931734137, -0.00600954102590494, -0.00416960583498471, -0.00150289444611705, 0.00134897285226932, 0.0037336802903853, 0.00515159241729537, 0.00534134966296421, 0.00432844757243801, 0.00239495108456392, 3.01528777893452e-05, -0.00221380336357895, -0.0038398766351186, -0.00452585729589595, -0.0041566718122941, -0.00287025187421316, -0.00100784839263302, 0.000979673924751029, 0.0026504084050036, 0.00364322163528355, 0.00375904372487513, 0.00302354039786618, 0.00165654402363326, -2.65148560436632e-05, -0.0016192868302736, -0.00275998243247793, -0.00322946207624202, -0.0029517577167922, -0.00200470269910244, -0.000673555414015027, 0.000760663553525838, 0.00194810520541971, 0.00263092924374048, 0.00269924137030552, 0.00213927254180167, 0.00113572236081037, -8.51923996704902e-05, -0.00121979560711365, -0.00203121352102183, -0.00233802943386324, -0.00210627443306058, -0.0014042722207636, -0.000420566807668142, 0.000614742467362181, 0.00145902952803015, 0.00193572408615208, 0.00194890170379847, 0.001520922264948, 0.000765503413189533, -0.000126871857548669, -0.000952911519665805, -0.00152271840144793, -0.00172320381973209, -0.00152129688796436, -0.000984636539183554, -0.000243804816233764, 0.000520196766821568, 0.00113659595613103, 0.00146803611738483, 0.00145393019869244, 0.00110661117000156, 0.000519482035849218, -0.000168419553813067, -0.000795762745635384, -0.00122507178229329, -0.00136025736034396, -0.0011785354781569, -0.000724528291042055, -0.000109779541748031, 0.000525834325279422, 0.00103186482858387, 0.00129372846615987, 0.00124597746484331, 0.000897850045368997, 0.000322312596039613, -0.000347672458201357, -0.000954438100116363, -0.00134229524689894, -0.00139881425287709, -0.00108327414086406, -0.000444279286135707, 0.000379768036652658, 0.00117796534591086, 0.0017099428061728, 0.00176307290177877, 0.00122683848470698, 0.000147795357452836, -0.00121236159716938, -0.00239143998875109, -0.00279755540798956, -0.00189157546267444, 0.000504076253643598, 0.0037507129416394, 0.00579286306252072, 0.0023815388257622, -0.0138178112497615, 0.00615390916485461]
-coefHPF8Hz=[-0.00413732007217832, 0.0128137524085206, -0.00703239786113732, -0.00607083910624466, -0.000640671095662891, 0.00297803995042684, 0.00358711069824249, 0.00212122813515183, 1.20634430802487e-05, -0.00162229186814809, -0.00224357980431246, -0.00185905716421619, -0.000826135992733773, 0.000361383817096532, 0.00126933201769037, 0.00163492277994348, 0.00141674269257045, 0.000749987589261391, -0.000106830446243471, -0.000874356431260248, -0.00132372970456104, -0.00134164480116526, -0.000945451454026294, -0.000271907606064438, 0.000469605846410585, 0.00105849962636506, 0.00132420453858745, 0.0011889288885873, 0.000697548973113783, -7.98678093481562e-06, -0.000719903463196644, -0.00122768095291933, -0.00137825875644953, -0.00112062646389691, -0.000519168793739445, 0.000255645775584092, 0.000979218871969742, 0.00143254421739358, 0.00147334289735732, 0.00107260133645527, 0.000335098996278771, -0.000534528984986327, -0.00128155845801129, -0.00167477983394595, -0.00158036954087765, -0.00100572754723018, -0.000100781275673597, 0.000875691800708778, 0.00163556139406487, 0.00193707123392925, 0.00166829702098915, 0.00088359943058775, -0.000205494768544111, -0.0012846767725705, -0.00203005102851951, -0.00220228232144701, -0.00171654208860809, -0.000690986696455559, 0.000595774312454011, 0.00176600413679084, 0.00246423596024682, 0.0024560033583318, 0.00170690183044077, 0.000405488750356142, -0.00108627343451726, -0.00232435802971384, -0.00292828600464903, -0.00267996069570949, -0.00161570185749083, -4.07843843012482e-06, 0.00168409949474666, 0.00296378311483144, 0.00340433908357821, 0.00286229347043372, 0.00141486180240569, -0.000522444587098718, -0.00241051006640883, -0.00368117651166998, -0.00389682733124141, -0.00297130558097849, -0.00109085757948247, 0.00122035105371062, 0.00328247514886421, 0.00447563792227029, 0.00439371396010101, 0.0029765404711487, 0.000595414088869011, -0.00209887995320602, -0.00432039748678537, -0.00537127977612491, -0.00486281406544215, -0.00287071946510663, 0.00010354088691596, 0.00322918961977541, 0.00557095088379558, 0.00637433766830528, 0.00531527202264858, 0.0025915091201344, -0.00108664182001548, -0.004678133047824, -0.00709098650480612, -0.00753013307353265, -0.00573197775364846, -0.00208349161096913, 0.00245587890208382, 0.00658217166824698, 0.00902161630109317, 0.00891221752162046, 0.00610438219572149, 0.00122619313576092, -0.00442204432549004, -0.00920209509231665, -0.0115942099855114, -0.0106749989793909, -0.00642182768599087, 0.000192405982117237, 0.00740345805148766, 0.0130927191344585, 0.015378058171202, 0.0131853100046952, 0.00667588197213641, -0.00270167858176768, -0.0124680982464787, -0.0197141714635492, -0.0218766729774822, -0.0175137764156827, -0.00686519968869282, 0.00794473435053117, 0.0232350343778747, 0.0344524691162944, 0.0372277893188389, 0.0284125294645153, 0.00698026975536834, -0.0255190738230011, -0.0650618568816555, -0.105796666967498, -0.14116317241066, -0.165180740012818, 0.826314444610813, -0.165180740012818, -0.14116317241066, -0.105796666967498, -0.0650618568816555, -0.0255190738230011, 0.00698026975536834, 0.0284125294645153, 0.0372277893188389, 0.0344524691162944, 0.0232350343778747, 0.00794473435053117, -0.00686519968869282, -0.0175137764156827, -0.0218766729774822, -0.0197141714635492, -0.0124680982464787, -0.00270167858176768, 0.00667588197213641, 0.0131853100046952, 0.015378058171202, 0.0130927191344585, 0.00740345805148766, 0.000192405982117237, -0.00642182768599087, -0.0106749989793909, -0.0115942099855114, -0.00920209509231665, -0.00442204432549004, 0.00122619313576092, 0.00610438219572149, 0.00891221752162046, 0.00902161630109317, 0.00658217166824698, 0.00245587890208382, -0.00208349161096913, -0.00573197775364846, -0.00753013307353265, -0.00709098650480612, -0.004678133047824, -0.00108664182001548, 0.0025915091201344, 0.00531527202264858, 0.00637433766830528, 0.00557095088379558, 0.00322918961977541, 0.00010354088691596, -0.00287071946510663, -0.00486281406544215, -0.00537127977612491, -0.00432039748678537, -0.00209887995320602, 0.000595414088869011, 0.0029765404711487, 0.00439371396010101, 0.00447563792227029, 0.00328247514886421, 0.00122035105371062, -0.00109085757948247, -0.00297130558097849, -0.00389682733124141, -0.00368117651166998, -0.00241051006640883, -0.000522444587098718, 0.00141486180240569, 0.00286229347043372, 0.00340433908357821, 0.00296378311483144, 0.00168409949474666, -4.07843843012482e-06, -0.00161570185749083, -0.00267996069570949, -0.00292828600464903, -0.00232435802971384, -0.00108627343451726, 0.000405488750356142, 0.00170690183044077, 0.0024560033583318, 0.00246423596024682, 0.00176600413679084, 0.000595774312454011, -0.000690986696455559, -0.00171654208860809, -0.00220228232144701, -0.00203005102851951, -0.0012846767725705, -0.000205494768544111, 0.00088359943058775, 0.00166829702098915, 0.00193707123392925, 0.00163556139406487, 0.000875691800708778, -0.000100781275673597, -0.00100572754723018, -0.00158036954087765, -0.00167477983394595, -0.00128155845801129, -0.000534528984986327, 0.000335098996278771, 0.00107260133645527, 0.00147334289735732, 0.00143254421739358, 0.000979218871969742, 0.000255645775584092, -0.000519168793739445, -0.00112062646389691, -0.00137825875644953, -0.00122768095291933, -0.000719903463196644, -7.98678093481562e-06, 0.000697548973113783, 0.0011889288885873, 0.00132420453858745, 0.00105849962636506, 0.000469605846410585, -0.000271907606064438, -0.000945451454026294, -0.00134164480116526, -0.00132372970456104, -0.000874356431260248, -0.000106830446243471, 0.000749987589261391, 0.00141674269257045, 0.00163492277994348, 0.00126933201769037, 0.000361383817096532, -0.000826135992733773, -0.00185905716421619, -0.00224357980431246, -0.00162229186814809, 1.20634430802487e-05, 0.00212122813515183, 0.00358711069824249, 0.00297803995042684, -0.000640671095662891, -0.00607083910624466, -0.00703239786113732, 0.0128137524085206, -0.00413732007217832]
-coefHPF9Hz=[0.00179817678475639, -0.00969856923396572, 0.0115094104018065, 0.00221163926568191, -0.00419938715000395, -0.00435454666669288, -0.00143648039857538, 0.00143955237721547, 0.00271254464090236, 0.00225552056321439, 0.000780012875518423, -0.000789678002135984, -0.00174084095328603, -0.00179070576068125, -0.0010753675423278, 4.69706847260471e-06, 0.000972221199146832, 0.00146849860153294, 0.00135035763050005, 0.000718056806989056, -0.000155400739852762, -0.000928818860792925, -0.00132528498455291, -0.0012132477214374, -0.000650607587149387, 0.000146635657406114, 0.000883106450085931, 0.00129235995117941, 0.00122537386626841, 0.000704383347583921, -8.40746946013404e-05, -0.00085553679046411, -0.00132657570743015, -0.00131878506783451, -0.000824001746149661, -1.07718595312606e-05, 0.000834641227294451, 0.00140127565743289, 0.00146923830508131, 0.000994688582790593, 0.000132845809020652, -0.000815223111345428, -0.00150166722251148, -0.00165939129597227, -0.00120670166476429, -0.000285298016234385, 0.000784828829349206, 0.00161374824415514, 0.00188078118126495, 0.00145983164642164, 0.00047520676272625, -0.000732672428583958, -0.00172669697520979, -0.00212728387391327, -0.00175668557801622, -0.000713782195480003, 0.000646002586977486, 0.00183406365096426, 0.00240058108425365, 0.00210254936159489, 0.00100598484747341, -0.000519951115362439, -0.00192918779819422, -0.00269353916499187, -0.00249532406680877, -0.00135951126097609, 0.000338926569786906, 0.00199801388720307, 0.00300262822619271, 0.00294349838511554, 0.00178809236440392, -9.12730786327695e-05, -0.00203462758015647, -0.00332699409182238, -0.00345091799692413, -0.00229971171851006, -0.000234404701557986, 0.00202797633041068, 0.00365976442192094, 0.00401953021537838, 0.00290593847602584, 0.000656843799272683, -0.00196070007078734, -0.00399208695777638, -0.00465692191759987, -0.00362866924449299, -0.00120362790364253, 0.00181888173791569, 0.00431939523136581, 0.00538287191921514, 0.00448923202114093, 0.0018893090210407, -0.00156662685033309, -0.00465445355319583, -0.00618656532495375, -0.00552651247108489, -0.0027726392257629, 0.00119403384830584, 0.00495711850985014, 0.00712761468896888, 0.00679383700581212, 0.00389630814668191, -0.0006388069972653, -0.00525025125826626, -0.0082332829904071, -0.0083611425055981, -0.0053724948454765, -0.000160805470030688, 0.00551399624064956, 0.00958104754475908, 0.0103902013906259, 0.0073664634880091, 0.00132263828846481, -0.00575213810530972, -0.0113166383692868, -0.0131469112452079, -0.0101933649130773, -0.00308494076244007, 0.00595050333133207, 0.0137445516176727, 0.0172270849825017, 0.0145610107246625, 0.00596456084810903, -0.00611565149848142, -0.0176216758803406, -0.0241217801890504, -0.0223282134730125, -0.0114266161491894, 0.00622929251317601, 0.0253835111589121, 0.039112938772248, 0.0407244925293678, 0.0257855397504155, -0.00629958006359578, -0.0516712854073545, -0.102611168639475, -0.149245575372926, -0.181931320939204, 0.806323761888699, -0.181931320939204, -0.149245575372926, -0.102611168639475, -0.0516712854073545, -0.00629958006359578, 0.0257855397504155, 0.0407244925293678, 0.039112938772248, 0.0253835111589121, 0.00622929251317601, -0.0114266161491894, -0.0223282134730125, -0.0241217801890504, -0.0176216758803406, -0.00611565149848142, 0.00596456084810903, 0.0145610107246625, 0.0172270849825017, 0.0137445516176727, 0.00595050333133207, -0.00308494076244007, -0.0101933649130773, -0.0131469112452079, -0.0113166383692868, -0.00575213810530972, 0.00132263828846481, 0.0073664634880091, 0.0103902013906259, 0.00958104754475908, 0.00551399624064956, -0.000160805470030688, -0.0053724948454765, -0.0083611425055981, -0.0082332829904071, -0.00525025125826626, -0.0006388069972653, 0.00389630814668191, 0.00679383700581212, 0.00712761468896888, 0.00495711850985014, 0.00119403384830584, -0.0027726392257629, -0.00552651247108489, -0.00618656532495375, -0.00465445355319583, -0.00156662685033309, 0.0018893090210407, 0.00448923202114093, 0.00538287191921514, 0.00431939523136581, 0.00181888173791569, -0.00120362790364253, -0.00362866924449299, -0.00465692191759987, -0.00399208695777638, -0.00196070007078734, 0.000656843799272683, 0.00290593847602584, 0.00401953021537838, 0.00365976442192094, 0.00202797633041068, -0.000234404701557986, -0.00229971171851006, -0.00345091799692413, -0.00332699409182238, -0.00203462758015647, -9.12730786327695e-05, 0.00178809236440392, 0.00294349838511554, 0.00300262822619271, 0.00199801388720307, 0.000338926569786906, -0.00135951126097609, -0.00249532406680877, -0.00269353916499187, -0.00192918779819422, -0.000519951115362439, 0.00100598484747341, 0.00210254936159489, 0.00240058108425365, 0.00183406365096426, 0.000646002586977486, -0.000713782195480003, -0.00175668557801622, -0.00212728387391327, -0.00172669697520979, -0.000732672428583958, 0.00047520676272625, 0.00145983164642164, 0.00188078118126495, 0.00161374824415514, 0.000784828829349206, -0.000285298016234385, -0.00120670166476429, -0.00165939129597227, -0.00150166722251148, -0.000815223111345428, 0.000132845809020652, 0.000994688582790593, 0.00146923830508131, 0.00140127565743289, 0.000834641227294451, -1.07718595312606e-05, -0.000824001746149661, -0.00131878506783451, -0.00132657570743015, -0.00085553679046411, -8.40746946013404e-05, 0.000704383347583921, 0.00122537386626841, 0.00129235995117941, 0.000883106450085931, 0.000146635657406114, -0.000650607587149387, -0.0012132477214374, -0.00132528498455291, -0.000928818860792925, -0.000155400739852762, 0.000718056806989056, 0.00135035763050005, 0.00146849860153294, 0.000972221199146832, 4.69706847260471e-06, -0.0010753675423278, -0.00179070576068125, -0.00174084095328603, -0.000789678002135984, 0.000780012875518423, 0.00225552056321439, 0.00271254464090236, 0.00143955237721547, -0.00143648039857538, -0.00435454666669288, -0.00419938715000395, 0.00221163926568191, 0.0115094104018065, -0.00969856923396572, 0.00179817678475639]
-coefHPF10Hz=[0.00120422255208542, 0.00250514439415607, -0.0124645093361826, 0.00822034815425232, 0.00427088733240394, 0.000249846792356272, -0.00278001631150402, -0.00294908587492334, -0.00128225645630049, 0.000750771302764696, 0.00195433145797153, 0.00189540509118764, 0.000860293943462391, -0.000465909860315329, -0.00140013886063699, -0.00155565955185078, -0.000955915077445847, 4.62707051063719e-05, 0.000956206329647315, 0.0013731466239003, 0.00114182083559318, 0.000402855310409746, -0.000495840616029347, -0.00115184322876539, -0.00127872992597726, -0.000834989328893486, -1.65055830672147e-05, 0.000807498097746083, 0.0012834304878143, 0.00118815897741858, 0.000561532254495165, -0.00032531766934304, -0.0010899696753714, -0.00138968117608286, -0.00107412089630374, -0.000272211341118376, 0.000680781976868464, 0.00136347573626689, 0.00146257357695957, 0.000909058997333299, -7.23080708836907e-05, -0.00106510621307051, -0.00162158257455124, -0.00147737355703862, -0.000661691029232533, 0.000487705872691617, 0.00147362348199289, 0.00184245820805962, 0.00140162410619133, 0.000308470107047349, -0.000975253111716346, -0.00188382336074824, -0.00198900058661499, -0.00120706110149815, 0.000156980779943853, 0.00151676114706536, 0.00226521702793104, 0.00203194571071284, 0.000875300442261723, -0.000733265248057928, -0.00209376366902523, -0.00258440706834351, -0.00193768937264593, -0.000389910294341031, 0.00141339619654676, 0.00267457351980406, 0.00280014654576856, 0.00167460806494916, -0.000258750666843505, -0.00217710495985867, -0.00321681416782182, -0.00286910312077331, -0.00121685419773026, 0.00106599195872607, 0.00299241420231958, 0.00367887933521335, 0.00275443990283497, 0.000544668260956693, -0.00202698621888312, -0.00382997876616799, -0.00401226365327083, -0.00240657662129, 0.00036647750206974, 0.00312578716463917, 0.00463715137166616, 0.00415313205101477, 0.00178232097422094, -0.00152116066628991, -0.00433002092143184, -0.00536125574513225, -0.0040469910796968, -0.000843244016966826, 0.00293040507192863, 0.00561489113901632, 0.00594195785217618, 0.0036202141772347, -0.000467248001365106, -0.00460360546670864, -0.00693252887461378, -0.00629815111903677, -0.00279274926571167, 0.00220102863594201, 0.00654579901391716, 0.00824460910502734, 0.00635202642580349, 0.00145777046300721, -0.00445163984075186, -0.00879924948540777, -0.00950462120818236, -0.00597210608095218, 0.000549990621918189, 0.00736476375020557, 0.0114295930870385, 0.0106670273609965, 0.00498652630763188, -0.00350728655724993, -0.0112410504385651, -0.0146341997953685, -0.0116870592535975, -0.00304995552868054, 0.00800700825551806, 0.0167434060846153, 0.018868525358116, 0.0125223491947668, -0.000592075069398786, -0.0155380229781743, -0.0257046304040327, -0.0255506485161353, -0.0131539530661895, 0.00841911767266024, 0.0313289539435286, 0.0452995078536441, 0.0409709005411096, 0.0135366449532475, -0.0350419071321866, -0.0957952108620176, -0.154979719808371, -0.1979606271572, 0.786336276772912, -0.1979606271572, -0.154979719808371, -0.0957952108620176, -0.0350419071321866, 0.0135366449532475, 0.0409709005411096, 0.0452995078536441, 0.0313289539435286, 0.00841911767266024, -0.0131539530661895, -0.0255506485161353, -0.0257046304040327, -0.0155380229781743, -0.000592075069398786, 0.0125223491947668, 0.018868525358116, 0.0167434060846153, 0.00800700825551806, -0.00304995552868054, -0.0116870592535975, -0.0146341997953685, -0.0112410504385651, -0.00350728655724993, 0.00498652630763188, 0.0106670273609965, 0.0114295930870385, 0.00736476375020557, 0.000549990621918189, -0.00597210608095218, -0.00950462120818236, -0.00879924948540777, -0.00445163984075186, 0.00145777046300721, 0.00635202642580349, 0.00824460910502734, 0.00654579901391716, 0.00220102863594201, -0.00279274926571167, -0.00629815111903677, -0.00693252887461378, -0.00460360546670864, -0.000467248001365106, 0.0036202141772347, 0.00594195785217618, 0.00561489113901632, 0.00293040507192863, -0.000843244016966826, -0.0040469910796968, -0.00536125574513225, -0.00433002092143184, -0.00152116066628991, 0.00178232097422094, 0.00415313205101477, 0.00463715137166616, 0.00312578716463917, 0.00036647750206974, -0.00240657662129, -0.00401226365327083, -0.00382997876616799, -0.00202698621888312, 0.000544668260956693, 0.00275443990283497, 0.00367887933521335, 0.00299241420231958, 0.00106599195872607, -0.00121685419773026, -0.00286910312077331, -0.00321681416782182, -0.00217710495985867, -0.000258750666843505, 0.00167460806494916, 0.00280014654576856, 0.00267457351980406, 0.00141339619654676, -0.000389910294341031, -0.00193768937264593, -0.00258440706834351, -0.00209376366902523, -0.000733265248057928, 0.000875300442261723, 0.00203194571071284, 0.00226521702793104, 0.00151676114706536, 0.000156980779943853, -0.00120706110149815, -0.00198900058661499, -0.00188382336074824, -0.000975253111716346, 0.000308470107047349, 0.00140162410619133, 0.00184245820805962, 0.00147362348199289, 0.000487705872691617, -0.000661691029232533, -0.00147737355703862, -0.00162158257455124, -0.00106510621307051, -7.23080708836907e-05, 0.000909058997333299, 0.00146257357695957, 0.00136347573626689, 0.000680781976868464, -0.000272211341118376, -0.00107412089630374, -0.00138968117608286, -0.0010899696753714, -0.00032531766934304, 0.000561532254495165, 0.00118815897741858, 0.0012834304878143, 0.000807498097746083, -1.65055830672147e-05, -0.000834989328893486, -0.00127872992597726, -0.00115184322876539, -0.000495840616029347, 0.000402855310409746, 0.00114182083559318, 0.0013731466239003, 0.000956206329647315, 4.62707051063719e-05, -0.000955915077445847, -0.00155565955185078, -0.00140013886063699, -0.000465909860315329, 0.000860293943462391, 0.00189540509118764, 0.00195433145797153, 0.000750771302764696, -0.00128225645630049, -0.00294908587492334, -0.00278001631150402, 0.000249846792356272, 0.00427088733240394, 0.00822034815425232, -0.0124645093361826, 0.00250514439415607, 0.00120422255208542]
-coefHPF11Hz=[-0.00457352133553451, 0.0120555326458326, -0.00629443974187259, -0.00515486645202256, 0.000407661106576981, 0.00341163422604701, 0.00275485082081916, 0.000271183322055502, -0.00179958912008074, -0.0022451291091604, -0.00117930919499869, 0.000439457959292695, 0.00156046616642575, 0.00162272246079434, 0.000746899360691779, -0.000463453440385091, -0.00131067248790092, -0.00137022815977255, -0.000676948750172351, 0.000346582696961141, 0.00113719934521841, 0.00129190326541346, 0.000753080862708469, -0.000174955320148868, -0.000997182814616161, -0.00128528617569155, -0.00089431519024369, -2.70688433973394e-05, 0.000863174721945031, 0.00131041478181592, 0.0010724496706337, 0.000261772181144012, -0.000707561264566379, -0.00132787374737133, -0.00126445978476446, -0.000528673764621447, 0.000513562107165826, 0.00132349814850845, 0.00146136924665408, 0.000828445104414388, -0.000272132096248984, -0.00127395726485975, -0.0016418601568251, -0.00115171860063543, -2.67949637019482e-05, 0.00116609100611226, 0.0017918733414641, 0.00149338916834149, 0.000384442562933856, -0.00098163908099049, -0.00189097555191376, -0.00183646114563558, -0.000802651671652119, 0.000711941595823305, 0.00192089252779445, 0.00216802550727394, 0.00127190319945574, -0.000345988551717851, -0.00186164460696636, -0.00246156933474767, -0.00178387686082635, -0.000117934715218755, 0.00169268983171442, 0.00269919872972742, 0.00231431158515529, 0.000683656351106659, -0.00140106129922426, -0.00284079302322072, -0.00285028499992238, -0.00133633302458509, 0.000961710082240187, 0.00286976210001637, 0.0033534435127642, 0.00206896657173782, -0.00036446690694248, -0.00275406554272313, -0.00378810723678297, -0.00287370402402543, -0.000380954054570492, 0.00245398289340941, 0.00413144896212955, 0.00370195647969423, 0.0012906265281609, -0.00195051800458738, -0.00433059708521923, -0.00453381554259918, -0.00234255043937329, 0.00121377245450762, 0.00433502822806121, 0.00532545446719169, 0.00353786745620341, -0.000232230862669042, -0.00409804656998653, -0.00602194554606246, -0.00485430214446273, -0.00102645748022258, 0.00358387377290824, 0.00656925895960263, 0.00624887172166548, 0.00257698207729735, -0.00271401092199054, -0.00691194409150035, -0.00769800921553143, -0.00442838517131974, 0.00143358001427227, 0.00695150138744187, 0.00916063703873338, 0.00662770979890441, 0.000346587598482372, -0.00661647847168361, -0.0105911458413624, -0.00920725438243841, -0.00274921846329125, 0.00576319836646825, 0.0119505897269479, 0.0122681531237996, 0.00597420013855691, -0.00420648617749716, -0.0131875913263537, -0.0159964505458648, -0.0104032686882743, 0.0015785612411851, 0.0142644326126474, 0.0208503660385936, 0.0168646397757809, 0.00285485207841167, -0.0151503228392239, -0.0279697578920091, -0.0275150488800236, -0.0111714069810961, 0.0157996265896446, 0.0412465338895958, 0.0504154548187339, 0.0320545318275976, -0.0162010596327976, -0.0855892439116928, -0.158267764544518, -0.213219138176728, 0.766342512015461, -0.213219138176728, -0.158267764544518, -0.0855892439116928, -0.0162010596327976, 0.0320545318275976, 0.0504154548187339, 0.0412465338895958, 0.0157996265896446, -0.0111714069810961, -0.0275150488800236, -0.0279697578920091, -0.0151503228392239, 0.00285485207841167, 0.0168646397757809, 0.0208503660385936, 0.0142644326126474, 0.0015785612411851, -0.0104032686882743, -0.0159964505458648, -0.0131875913263537, -0.00420648617749716, 0.00597420013855691, 0.0122681531237996, 0.0119505897269479, 0.00576319836646825, -0.00274921846329125, -0.00920725438243841, -0.0105911458413624, -0.00661647847168361, 0.000346587598482372, 0.00662770979890441, 0.00916063703873338, 0.00695150138744187, 0.00143358001427227, -0.00442838517131974, -0.00769800921553143, -0.00691194409150035, -0.00271401092199054, 0.00257698207729735, 0.00624887172166548, 0.00656925895960263, 0.00358387377290824, -0.00102645748022258, -0.00485430214446273, -0.00602194554606246, -0.00409804656998653, -0.000232230862669042, 0.00353786745620341, 0.00532545446719169, 0.00433502822806121, 0.00121377245450762, -0.00234255043937329, -0.00453381554259918, -0.00433059708521923, -0.00195051800458738, 0.0012906265281609, 0.00370195647969423, 0.00413144896212955, 0.00245398289340941, -0.000380954054570492, -0.00287370402402543, -0.00378810723678297, -0.00275406554272313, -0.00036446690694248, 0.00206896657173782, 0.0033534435127642, 0.00286976210001637, 0.000961710082240187, -0.00133633302458509, -0.00285028499992238, -0.00284079302322072, -0.00140106129922426, 0.000683656351106659, 0.00231431158515529, 0.00269919872972742, 0.00169268983171442, -0.000117934715218755, -0.00178387686082635, -0.00246156933474767, -0.00186164460696636, -0.000345988551717851, 0.00127190319945574, 0.00216802550727394, 0.00192089252779445, 0.000711941595823305, -0.000802651671652119, -0.00183646114563558, -0.00189097555191376, -0.00098163908099049, 0.000384442562933856, 0.00149338916834149, 0.0017918733414641, 0.00116609100611226, -2.67949637019482e-05, -0.00115171860063543, -0.0016418601568251, -0.00127395726485975, -0.000272132096248984, 0.000828445104414388, 0.00146136924665408, 0.00132349814850845, 0.000513562107165826, -0.000528673764621447, -0.00126445978476446, -0.00132787374737133, -0.000707561264566379, 0.000261772181144012, 0.0010724496706337, 0.00131041478181592, 0.000863174721945031, -2.70688433973394e-05, -0.00089431519024369, -0.00128528617569155, -0.000997182814616161, -0.000174955320148868, 0.000753080862708469, 0.00129190326541346, 0.00113719934521841, 0.000346582696961141, -0.000676948750172351, -0.00137022815977255, -0.00131067248790092, -0.000463453440385091, 0.000746899360691779, 0.00162272246079434, 0.00156046616642575, 0.000439457959292695, -0.00117930919499869, -0.0022451291091604, -0.00179958912008074, 0.000271183322055502, 0.00275485082081916, 0.00341163422604701, 0.000407661106576981, -0.00515486645202256, -0.00629443974187259, 0.0120555326458326, -0.00457352133553451]
-coefHPF12Hz=[0.00312052121977404, -0.0106277424985623, 0.00949913029552592, 0.00279721740052617, -0.00377898193182997, -0.00383609069254769, -0.000312260206671177, 0.00247179017762064, 0.00255034195353749, 0.000631183485115924, -0.00139164481881617, -0.00206218191474362, -0.00117904691460727, 0.000396774249742121, 0.00151390866602645, 0.0015091644353579, 0.000516416447194746, -0.00072751834185053, -0.00141799006254506, -0.00116616409248742, -0.000193215079183122, 0.000859637045486331, 0.00133976696467549, 0.000976711725691467, 1.34635614726783e-05, -0.000945253259416969, -0.00131605881732436, -0.000873994533598593, 0.000109867191121428, 0.00103667571241638, 0.00133657030065477, 0.000818802695688436, -0.000218727809296852, -0.00114641794838007, -0.00139432830389427, -0.000783110290741431, 0.000332496427863473, 0.00128183734745499, 0.00147058357102107, 0.000754403291214528, -0.00045848563134608, -0.00143738809568055, -0.00156416614385196, -0.000725090902129195, 0.00060212324789797, 0.00161421211953498, 0.00167031704257961, 0.000689826207998536, -0.000766087711162731, -0.00181504250888935, -0.00178569583522137, -0.000642493403211511, 0.000954977591822197, 0.00203849111192925, 0.00190579910355018, 0.000581065609803065, -0.00117275795695914, -0.00228321976768814, -0.00202904761200168, -0.000499090044090332, 0.00141676521085164, 0.00255063322387748, 0.00215386047054698, 0.000399195548090126, -0.00169484417743204, -0.00284113526345424, -0.00228245432622104, -0.000273793375531926, 0.00200848157236471, 0.00316307913810553, 0.00240705923378925, 0.000119084414279724, -0.00236669663608015, -0.00350731984408495, -0.00253254746104974, 7.40783877271474e-05, 0.00276339868373718, 0.00388767897330376, 0.00264721412573915, -0.000292859336858749, -0.00322055786596556, -0.00429920609204911, -0.00276685253251187, 0.000561457140149253, 0.00373974091200688, 0.00475398202411312, 0.00288493329875235, -0.000890848347113988, -0.00432732869284054, -0.00526533021804076, -0.00298972920112818, 0.00127721423378403, 0.00500855651238504, 0.00583884343491697, 0.00309231303428312, -0.00174561300948501, -0.00580186018019682, -0.00649867738227542, -0.00318683353945035, 0.00232012033175014, 0.00674281678051831, 0.00725751123100946, 0.00327750384470339, -0.00302774322131532, -0.00787975470676443, -0.00815657254163604, -0.00335851087196031, 0.00390636001288248, 0.00928810899133458, 0.0092666823458994, 0.00342941642777925, -0.0050498897689394, -0.0110819315098481, -0.0106726653175308, -0.00349453361060053, 0.00657840134308292, 0.0134763649226525, 0.0125449150738667, 0.00354672286516551, -0.008715712741009, -0.0168649781099399, -0.015229091039619, -0.0035947904259946, 0.0119743243439426, 0.0220968018675052, 0.019451337045449, 0.00362965870736295, -0.0175309181155757, -0.0313693662407285, -0.0272990095817002, -0.00365691028016065, 0.0293375769997165, 0.0527758760959326, 0.0474461704809459, 0.00367139568683421, -0.0723300399369049, -0.159061458107159, -0.227646877489919, 0.746322441438488, -0.227646877489919, -0.159061458107159, -0.0723300399369049, 0.00367139568683421, 0.0474461704809459, 0.0527758760959326, 0.0293375769997165, -0.00365691028016065, -0.0272990095817002, -0.0313693662407285, -0.0175309181155757, 0.00362965870736295, 0.019451337045449, 0.0220968018675052, 0.0119743243439426, -0.0035947904259946, -0.015229091039619, -0.0168649781099399, -0.008715712741009, 0.00354672286516551, 0.0125449150738667, 0.0134763649226525, 0.00657840134308292, -0.00349453361060053, -0.0106726653175308, -0.0110819315098481, -0.0050498897689394, 0.00342941642777925, 0.0092666823458994, 0.00928810899133458, 0.00390636001288248, -0.00335851087196031, -0.00815657254163604, -0.00787975470676443, -0.00302774322131532, 0.00327750384470339, 0.00725751123100946, 0.00674281678051831, 0.00232012033175014, -0.00318683353945035, -0.00649867738227542, -0.00580186018019682, -0.00174561300948501, 0.00309231303428312, 0.00583884343491697, 0.00500855651238504, 0.00127721423378403, -0.00298972920112818, -0.00526533021804076, -0.00432732869284054, -0.000890848347113988, 0.00288493329875235, 0.00475398202411312, 0.00373974091200688, 0.000561457140149253, -0.00276685253251187, -0.00429920609204911, -0.00322055786596556, -0.000292859336858749, 0.00264721412573915, 0.00388767897330376, 0.00276339868373718, 7.40783877271474e-05, -0.00253254746104974, -0.00350731984408495, -0.00236669663608015, 0.000119084414279724, 0.00240705923378925, 0.00316307913810553, 0.00200848157236471, -0.000273793375531926, -0.00228245432622104, -0.00284113526345424, -0.00169484417743204, 0.000399195548090126, 0.00215386047054698, 0.00255063322387748, 0.00141676521085164, -0.000499090044090332, -0.00202904761200168, -0.00228321976768814, -0.00117275795695914, 0.000581065609803065, 0.00190579910355018, 0.00203849111192925, 0.000954977591822197, -0.000642493403211511, -0.00178569583522137, -0.00181504250888935, -0.000766087711162731, 0.000689826207998536, 0.00167031704257961, 0.00161421211953498, 0.00060212324789797, -0.000725090902129195, -0.00156416614385196, -0.00143738809568055, -0.00045848563134608, 0.000754403291214528, 0.00147058357102107, 0.00128183734745499, 0.000332496427863473, -0.000783110290741431, -0.00139432830389427, -0.00114641794838007, -0.000218727809296852, 0.000818802695688436, 0.00133657030065477, 0.00103667571241638, 0.000109867191121428, -0.000873994533598593, -0.00131605881732436, -0.000945253259416969, 1.34635614726783e-05, 0.000976711725691467, 0.00133976696467549, 0.000859637045486331, -0.000193215079183122, -0.00116616409248742, -0.00141799006254506, -0.00072751834185053, 0.000516416447194746, 0.0015091644353579, 0.00151390866602645, 0.000396774249742121, -0.00117904691460727, -0.00206218191474362, -0.00139164481881617, 0.000631183485115924, 0.00255034195353749, 0.00247179017762064, -0.000312260206671177, -0.00383609069254769, -0.00377898193182997, 0.00279721740052617, 0.00949913029552592, -0.0106277424985623, 0.00312052121977404]
-coefHPF13Hz=[-0.00176678070553555, 0.00825113824275017, -0.0114891479227419, 0.00172828520361746, 0.00572653843692078, 0.00121818294334439, -0.00302689301174882, -0.00299352721099734, -0.000163709023248472, 0.00216938578946332, 0.00217211844914362, 0.000369992995150025, -0.00144485067109776, -0.00186115318490161, -0.000780490383717616, 0.000772690699871178, 0.00159107573712496, 0.00115450354737976, -9.83722571389436e-05, -0.0011968467617851, -0.0013654482895553, -0.000541973539497585, 0.000639272955160045, 0.0013263945405131, 0.00105400512097479, 3.40320974957293e-05, -0.00100204220336988, -0.00132320013231748, -0.00070390862761344, 0.000420408325586249, 0.00126098353916184, 0.00121809385851337, 0.000308047648699202, -0.000845875342294387, -0.00142724826720199, -0.00100619470573752, 0.000146635292744599, 0.00123267139135441, 0.00147796904020638, 0.000674475179738554, -0.000641695381826751, -0.00155191458006956, -0.00138925028929309, -0.00022632866399473, 0.0011505786531781, 0.00176500046694413, 0.00114302277453572, -0.000328112443589105, -0.00163193645015748, -0.00182894845644024, -0.000723091871963317, 0.00095580991465594, 0.0020312615006007, 0.00170060133316064, 0.000134163949726939, -0.0016066730996826, -0.00228051403853116, -0.00135240109084913, 0.000592645328044203, 0.00220952748977404, 0.0023246264394545, 0.000778031204895289, -0.00140600179476253, -0.00269356435847499, -0.00211419581217396, 1.02890282003878e-05, 0.00223833162173339, 0.0029747554709714, 0.00161540120591734, -0.000970979905510597, -0.00299527042405123, -0.00297860119801964, -0.000825132086194803, 0.002029930320648, 0.00358173665849511, 0.00265016726070939, -0.000231386605995323, -0.00309975150036829, -0.00390095765714009, -0.00195075171110474, 0.0015050059862455, 0.00406841544073033, 0.00385577384133688, 0.000869710176938951, -0.00290671626317106, -0.0048065388232369, -0.00337149582745293, 0.000564154795334034, 0.0043166882452372, 0.00519384538705595, 0.00239150266054536, -0.00228253638481101, -0.00560574567384832, -0.00509377285645827, -0.000903415555859124, 0.00419528577975157, 0.00659820258502649, 0.00440450319682826, -0.00107973243986293, -0.00615404142521591, -0.00713137459202075, -0.00304212298983686, 0.00350843799559347, 0.00799334278470862, 0.00703259327586071, 0.000925170627365006, -0.00628916354638714, -0.00951083780534363, -0.0061086114782427, 0.001985029564985, 0.0092952983902628, 0.0104789463920847, 0.00416767352074444, -0.0057398800982904, -0.0123814881900677, -0.0106279906754813, -0.000945039838472237, 0.010418610964383, 0.0153725428077528, 0.00959235502827386, -0.00393493772878744, -0.0162336038400455, -0.0181121948919448, -0.00678627143570616, 0.0112895238250724, 0.0237649153200851, 0.0204371061691711, 0.000955638169778831, -0.0232293335906061, -0.0349089371125325, -0.0222066206799095, 0.0118356799480713, 0.047718597325803, 0.0581904681280413, 0.0233088351897866, -0.056514805457286, -0.157342948226607, -0.241171888175062, 0.726309468481421, -0.241171888175062, -0.157342948226607, -0.056514805457286, 0.0233088351897866, 0.0581904681280413, 0.047718597325803, 0.0118356799480713, -0.0222066206799095, -0.0349089371125325, -0.0232293335906061, 0.000955638169778831, 0.0204371061691711, 0.0237649153200851, 0.0112895238250724, -0.00678627143570616, -0.0181121948919448, -0.0162336038400455, -0.00393493772878744, 0.00959235502827386, 0.0153725428077528, 0.010418610964383, -0.000945039838472237, -0.0106279906754813, -0.0123814881900677, -0.0057398800982904, 0.00416767352074444, 0.0104789463920847, 0.0092952983902628, 0.001985029564985, -0.0061086114782427, -0.00951083780534363, -0.00628916354638714, 0.000925170627365006, 0.00703259327586071, 0.00799334278470862, 0.00350843799559347, -0.00304212298983686, -0.00713137459202075, -0.00615404142521591, -0.00107973243986293, 0.00440450319682826, 0.00659820258502649, 0.00419528577975157, -0.000903415555859124, -0.00509377285645827, -0.00560574567384832, -0.00228253638481101, 0.00239150266054536, 0.00519384538705595, 0.0043166882452372, 0.000564154795334034, -0.00337149582745293, -0.0048065388232369, -0.00290671626317106, 0.000869710176938951, 0.00385577384133688, 0.00406841544073033, 0.0015050059862455, -0.00195075171110474, -0.00390095765714009, -0.00309975150036829, -0.000231386605995323, 0.00265016726070939, 0.00358173665849511, 0.002029930320648, -0.000825132086194803, -0.00297860119801964, -0.00299527042405123, -0.000970979905510597, 0.00161540120591734, 0.0029747554709714, 0.00223833162173339, 1.02890282003878e-05, -0.00211419581217396, -0.00269356435847499, -0.00140600179476253, 0.000778031204895289, 0.0023246264394545, 0.00220952748977404, 0.000592645328044203, -0.00135240109084913, -0.00228051403853116, -0.0016066730996826, 0.000134163949726939, 0.00170060133316064, 0.0020312615006007, 0.00095580991465594, -0.000723091871963317, -0.00182894845644024, -0.00163193645015748, -0.000328112443589105, 0.00114302277453572, 0.00176500046694413, 0.0011505786531781, -0.00022632866399473, -0.00138925028929309, -0.00155191458006956, -0.000641695381826751, 0.000674475179738554, 0.00147796904020638, 0.00123267139135441, 0.000146635292744599, -0.00100619470573752, -0.00142724826720199, -0.000845875342294387, 0.000308047648699202, 0.00121809385851337, 0.00126098353916184, 0.000420408325586249, -0.00070390862761344, -0.00132320013231748, -0.00100204220336988, 3.40320974957293e-05, 0.00105400512097479, 0.0013263945405131, 0.000639272955160045, -0.000541973539497585, -0.0013654482895553, -0.0011968467617851, -9.83722571389436e-05, 0.00115450354737976, 0.00159107573712496, 0.000772690699871178, -0.000780490383717616, -0.00186115318490161, -0.00144485067109776, 0.000369992995150025, 0.00217211844914362, 0.00216938578946332, -0.000163709023248472, -0.00299352721099734, -0.00302689301174882, 0.00121818294334439, 0.00572653843692078, 0.00172828520361746, -0.0114891479227419, 0.00825113824275017, -0.00176678070553555]
-coefHPF14Hz=[0.000377636037140298, -0.00456069137772758, 0.0110845900621743, -0.00783653370029881, -0.00347864141678721, 0.00346436456243174, 0.0036355941220879, -0.000239324021988387, -0.00279838423762138, -0.00197623309145996, 0.000559542823137702, 0.00210926212674923, 0.00149700656863332, -0.00035340451005882, -0.0016565574589845, -0.00138890706693362, 3.02624241723852e-05, 0.00129830114540955, 0.0013876461026674, 0.000324417444139555, -0.000945367331962155, -0.00138325448092449, -0.000676728492290062, 0.000560251187241705, 0.00131393091150541, 0.000992526896767618, -0.00012953378200578, -0.00114677254800268, -0.00123746571281862, -0.000325658904453764, 0.000860353616827887, 0.00136979391082057, 0.000779091920062184, -0.000459558141962128, -0.00135790579535095, -0.00117900739646618, -3.55751262262079e-05, 0.0011768707226154, 0.00147290304426851, 0.000581561415388632, -0.000817888527092431, -0.0016103621958551, -0.00112090707680585, 0.000304567608991195, 0.00154529349943252, 0.00157939623316451, 0.000322371954533701, -0.00125376864201287, -0.0018809448898607, -0.000998723810576207, 0.000742104737345094, 0.00195843256693568, 0.00163478119081353, -4.34839720827078e-05, -0.00176564415059286, -0.00213289661502024, -0.000773185317129402, 0.00128609481716805, 0.00239993480552409, 0.00160676019551157, -0.000542692510991048, -0.00235703580086998, -0.00233609565788503, -0.000402165367484174, 0.00195820410523049, 0.00283741500574607, 0.00144332416342124, -0.00120183958139779, -0.00300086478802553, -0.00244230036101501, 0.000141922138229085, 0.00274515964154065, 0.0032414555443769, 0.00111501606078622, -0.00203538294819234, -0.00368789276051953, -0.00241523532088001, 0.000898485726774033, 0.00365503954878305, 0.00357278914340573, 0.000568496312504372, -0.0030632724931717, -0.00439088464001302, -0.00220485465381873, 0.00190423924343806, 0.0046878095437503, 0.00379486083454238, -0.000251497477754024, -0.00432208692023665, -0.00509133312789236, -0.00174239787404138, 0.00322576468191283, 0.00584958576130974, 0.00384571071825367, -0.00142688511224445, -0.00585623191087779, -0.00576335041171093, -0.000942159479800404, 0.00495675613559849, 0.00717300557563279, 0.00365189737263951, -0.0030977812979896, -0.00776293517660696, -0.00637810851088626, 0.000345456397092604, 0.00727124105969942, 0.00872375024453764, 0.00310078372702304, -0.00551270521445851, -0.0102558458323177, -0.0069218363163618, 0.00241883280794929, 0.0105511732356095, 0.0106800481407724, 0.0019422212018166, -0.00922858722971148, -0.0138301941074205, -0.00736474192875482, 0.00594852504016886, 0.0157643170126316, 0.0135116276455602, -0.00040941708238146, -0.0158107446120535, -0.0199354152253282, -0.00769673260152387, 0.0130784007946479, 0.0261539845156009, 0.0189916182679788, -0.00622133245219423, -0.0316473517806163, -0.0352501086620081, -0.00789729055602823, 0.0359627888869296, 0.0632211041313638, 0.0414696959329254, -0.0387036728294666, -0.153153930121384, -0.253735430122786, 0.706323486399583, -0.253735430122786, -0.153153930121384, -0.0387036728294666, 0.0414696959329254, 0.0632211041313638, 0.0359627888869296, -0.00789729055602823, -0.0352501086620081, -0.0316473517806163, -0.00622133245219423, 0.0189916182679788, 0.0261539845156009, 0.0130784007946479, -0.00769673260152387, -0.0199354152253282, -0.0158107446120535, -0.00040941708238146, 0.0135116276455602, 0.0157643170126316, 0.00594852504016886, -0.00736474192875482, -0.0138301941074205, -0.00922858722971148, 0.0019422212018166, 0.0106800481407724, 0.0105511732356095, 0.00241883280794929, -0.0069218363163618, -0.0102558458323177, -0.00551270521445851, 0.00310078372702304, 0.00872375024453764, 0.00727124105969942, 0.000345456397092604, -0.00637810851088626, -0.00776293517660696, -0.0030977812979896, 0.00365189737263951, 0.00717300557563279, 0.00495675613559849, -0.000942159479800404, -0.00576335041171093, -0.00585623191087779, -0.00142688511224445, 0.00384571071825367, 0.00584958576130974, 0.00322576468191283, -0.00174239787404138, -0.00509133312789236, -0.00432208692023665, -0.000251497477754024, 0.00379486083454238, 0.0046878095437503, 0.00190423924343806, -0.00220485465381873, -0.00439088464001302, -0.0030632724931717, 0.000568496312504372, 0.00357278914340573, 0.00365503954878305, 0.000898485726774033, -0.00241523532088001, -0.00368789276051953, -0.00203538294819234, 0.00111501606078622, 0.0032414555443769, 0.00274515964154065, 0.000141922138229085, -0.00244230036101501, -0.00300086478802553, -0.00120183958139779, 0.00144332416342124, 0.00283741500574607, 0.00195820410523049, -0.000402165367484174, -0.00233609565788503, -0.00235703580086998, -0.000542692510991048, 0.00160676019551157, 0.00239993480552409, 0.00128609481716805, -0.000773185317129402, -0.00213289661502024, -0.00176564415059286, -4.34839720827078e-05, 0.00163478119081353, 0.00195843256693568, 0.000742104737345094, -0.000998723810576207, -0.0018809448898607, -0.00125376864201287, 0.000322371954533701, 0.00157939623316451, 0.00154529349943252, 0.000304567608991195, -0.00112090707680585, -0.0016103621958551, -0.000817888527092431, 0.000581561415388632, 0.00147290304426851, 0.0011768707226154, -3.55751262262079e-05, -0.00117900739646618, -0.00135790579535095, -0.000459558141962128, 0.000779091920062184, 0.00136979391082057, 0.000860353616827887, -0.000325658904453764, -0.00123746571281862, -0.00114677254800268, -0.00012953378200578, 0.000992526896767618, 0.00131393091150541, 0.000560251187241705, -0.000676728492290062, -0.00138325448092449, -0.000945367331962155, 0.000324417444139555, 0.0013876461026674, 0.00129830114540955, 3.02624241723852e-05, -0.00138890706693362, -0.0016565574589845, -0.00035340451005882, 0.00149700656863332, 0.00210926212674923, 0.000559542823137702, -0.00197623309145996, -0.00279838423762138, -0.000239324021988387, 0.0036355941220879, 0.00346436456243174, -0.00347864141678721, -0.00783653370029881, 0.0110845900621743, -0.00456069137772758, 0.000377636037140298]
-coefHPF15Hz=[0.00120406617956575, -0.00138625334238554, -0.00516364433567482, 0.0120558637406396, -0.00616713011224386, -0.00312130367790692, 0.000207688839111879, 0.00331948631162485, 0.00148300248447799, -0.00132057533049223, -0.00227406278357272, -0.000719635292312402, 0.00129459685548887, 0.00177004193068234, 0.000477436085607324, -0.00113196668479852, -0.00151849921273329, -0.000450830038302897, 0.000960110974563017, 0.00139798487325896, 0.000523394838947495, -0.000796887771055385, -0.00134008405607645, -0.000645367019178505, 0.000627541009852064, 0.00131387829938693, 0.000796441353152415, -0.000449835253127163, -0.00129129297404996, -0.000963357006666195, 0.000252850101474112, 0.00125826345323585, 0.00113663190448607, -3.12638247879476e-05, -0.00120391106668977, -0.00130757472515316, -0.000213712950486704, 0.00111330208533486, 0.00146883689044159, 0.00048537409164063, -0.000983166821861837, -0.00160965659884189, -0.000778797131312521, 0.0008063218505991, 0.00171847812256494, 0.00108844566000648, -0.000575908768929443, -0.00178671768513975, -0.00140603102475486, 0.000291101597785944, 0.00180221981611622, 0.00171983127087583, 4.87927848499393e-05, -0.00175102083775399, -0.00202049311261555, -0.000441827393017056, 0.00162412819864167, 0.00229539625122552, 0.000882224721486354, -0.0014168528350819, -0.00252629476491092, -0.00135927376427542, 0.00112174491910099, 0.00269440258233565, 0.00186124088598204, -0.000733222086646088, -0.00278323700801593, -0.00237276581626036, 0.000250995955927968, 0.00277546570071345, 0.00287368898160035, 0.000324206857061007, -0.00265489224638483, -0.00334414104276938, -0.000984866748771224, 0.00240801004593355, 0.00376082367470982, 0.00171618673079297, -0.00202191699120511, -0.00409484115123226, -0.00250189211089893, 0.00148465619391663, 0.00431749314962291, 0.00332431644799042, -0.000789645679196109, -0.00440313881552642, -0.00415922867907067, -6.20046953206932e-05, 0.00432488163807841, 0.00497412137684718, 0.00106598842882682, -0.00405376269855657, -0.0057328114619949, -0.00221410147395209, 0.00355904056345153, 0.00639840637600801, 0.00349615409546053, -0.00281581153237185, -0.00693246645098184, -0.00489398935446023, 0.00180583547792146, 0.0072869860858051, 0.00637822198302074, -0.000501989075859678, -0.00740561467395531, -0.00792516425152216, -0.00112491290044476, 0.00723272103199717, 0.00950909430376073, 0.00310368323827257, -0.006709566583747, -0.0110903090730536, -0.00547366045275247, 0.00575387722750592, 0.0126264123868127, 0.00830168857014193, -0.00424904861015408, -0.0140884381387553, -0.0116963810200605, 0.00203597931770722, 0.0154496784671582, 0.0158319356085629, 0.00116271222719826, -0.0166636763711263, -0.0210980226290398, -0.00585684876540902, 0.0177000616106205, 0.0283226044036243, 0.0131556509594083, -0.0185410845442329, -0.0395675473826757, -0.026136992715015, 0.0191557251944185, 0.0620781655962856, 0.0570221224817631, -0.0195310753958362, -0.14653858178805, -0.265296511464503, 0.686324384335858, -0.265296511464503, -0.14653858178805, -0.0195310753958362, 0.0570221224817631, 0.0620781655962856, 0.0191557251944185, -0.026136992715015, -0.0395675473826757, -0.0185410845442329, 0.0131556509594083, 0.0283226044036243, 0.0177000616106205, -0.00585684876540902, -0.0210980226290398, -0.0166636763711263, 0.00116271222719826, 0.0158319356085629, 0.0154496784671582, 0.00203597931770722, -0.0116963810200605, -0.0140884381387553, -0.00424904861015408, 0.00830168857014193, 0.0126264123868127, 0.00575387722750592, -0.00547366045275247, -0.0110903090730536, -0.006709566583747, 0.00310368323827257, 0.00950909430376073, 0.00723272103199717, -0.00112491290044476, -0.00792516425152216, -0.00740561467395531, -0.000501989075859678, 0.00637822198302074, 0.0072869860858051, 0.00180583547792146, -0.00489398935446023, -0.00693246645098184, -0.00281581153237185, 0.00349615409546053, 0.00639840637600801, 0.00355904056345153, -0.00221410147395209, -0.0057328114619949, -0.00405376269855657, 0.00106598842882682, 0.00497412137684718, 0.00432488163807841, -6.20046953206932e-05, -0.00415922867907067, -0.00440313881552642, -0.000789645679196109, 0.00332431644799042, 0.00431749314962291, 0.00148465619391663, -0.00250189211089893, -0.00409484115123226, -0.00202191699120511, 0.00171618673079297, 0.00376082367470982, 0.00240801004593355, -0.000984866748771224, -0.00334414104276938, -0.00265489224638483, 0.000324206857061007, 0.00287368898160035, 0.00277546570071345, 0.000250995955927968, -0.00237276581626036, -0.00278323700801593, -0.000733222086646088, 0.00186124088598204, 0.00269440258233565, 0.00112174491910099, -0.00135927376427542, -0.00252629476491092, -0.0014168528350819, 0.000882224721486354, 0.00229539625122552, 0.00162412819864167, -0.000441827393017056, -0.00202049311261555, -0.00175102083775399, 4.87927848499393e-05, 0.00171983127087583, 0.00180221981611622, 0.000291101597785944, -0.00140603102475486, -0.00178671768513975, -0.000575908768929443, 0.00108844566000648, 0.00171847812256494, 0.0008063218505991, -0.000778797131312521, -0.00160965659884189, -0.000983166821861837, 0.00048537409164063, 0.00146883689044159, 0.00111330208533486, -0.000213712950486704, -0.00130757472515316, -0.00120391106668977, -3.12638247879476e-05, 0.00113663190448607, 0.00125826345323585, 0.000252850101474112, -0.000963357006666195, -0.00129129297404996, -0.000449835253127163, 0.000796441353152415, 0.00131387829938693, 0.000627541009852064, -0.000645367019178505, -0.00134008405607645, -0.000796887771055385, 0.000523394838947495, 0.00139798487325896, 0.000960110974563017, -0.000450830038302897, -0.00151849921273329, -0.00113196668479852, 0.000477436085607324, 0.00177004193068234, 0.00129459685548887, -0.000719635292312402, -0.00227406278357272, -0.00132057533049223, 0.00148300248447799, 0.00331948631162485, 0.000207688839111879, -0.00312130367790692, -0.00616713011224386, 0.0120558637406396, -0.00516364433567482, -0.00138625334238554, 0.00120406617956575]
-coefHPF16Hz=[-0.00230331686228658, 0.00836683573627826, -0.0102872649546862, 0.00174953104696055, 0.00506330420998353, -7.52158979255413e-05, -0.00341063434365162, -0.00152425148633392, 0.00174617948499645, 0.00227952019388446, 0.000112961687015653, -0.00181723429078082, -0.0014669382633414, 0.000428353617236692, 0.00164559833215254, 0.000998053728471211, -0.000639919456657835, -0.0014810948437703, -0.000728982372277507, 0.000733207314543699, 0.00137137045136327, 0.000578658722766177, -0.000782921994674482, -0.0013115118187689, -0.000491152711969859, 0.000823659745539285, 0.00129266572550508, 0.000442533525573418, -0.000866106063852858, -0.00130429407821579, -0.000415268482294982, 0.000917395656396487, 0.00134072447625446, 0.000400616500217427, -0.000977413332165076, -0.00139562957987483, -0.000395105954724499, 0.00104930528084403, 0.0014687756900724, 0.000391615981957236, -0.00113273871063864, -0.0015525794827252, -0.000390896439417858, 0.00122520347270327, 0.00164997460806762, 0.000391823034299946, -0.0013292731284991, -0.00175817057465746, -0.000392993698627906, 0.0014434246454147, 0.0018779540143872, 0.000394950775206263, -0.00156935208013748, -0.00200903711663445, -0.000396234627931678, 0.00170638923786518, 0.00215203161285738, 0.00039816779660138, -0.00185727510419251, -0.00230768149140923, -0.000397277324704684, 0.00202101634057289, 0.00247438296433148, 0.000396223597213331, -0.00219835442978541, -0.00265403893645818, -0.000394383007398057, 0.00238840843059474, 0.00284939934975055, 0.000394745844019576, -0.00259687249692364, -0.00306247338480811, -0.000393264984645793, 0.00282317190785887, 0.00329487695916691, 0.000391416244425848, -0.00307228825799685, -0.00354599269506148, -0.000388038311888698, 0.00334144481323407, 0.00382195978864209, 0.000385524677946866, -0.00363809959625523, -0.00412381895696044, -0.000384952238039591, 0.00396536471333485, 0.00446010531244924, 0.000381356771427738, -0.00432568590714262, -0.00483750152309592, -0.000373394484452055, 0.00472716615162233, 0.00525617616065258, 0.000368391016484171, -0.00518301934223061, -0.00571950978047043, -0.000371134141118705, 0.0057010778748638, 0.00625114027562799, 0.000365777028558921, -0.00628229215361872, -0.00687104517955612, -0.00036100869423152, 0.00696698474692175, 0.00757881748916284, 0.000359864714988787, -0.00776491348224791, -0.00842239116279103, -0.000352340646668522, 0.00871499627237555, 0.00942826426614478, 0.000355396091813656, -0.00987276733783059, -0.0106746118649872, -0.00034949508577418, 0.0113207792224559, 0.0122341814497526, 0.00034809030146328, -0.0131798317912114, -0.0142758603452146, -0.000344949681806432, 0.0156767500929317, 0.0170552887245676, 0.00034489268277269, -0.0192127395942808, -0.0210979639101242, -0.000345263834705688, 0.02465272376684, 0.0275226507626367, 0.000338860919917331, -0.0341125582868586, -0.0393967102483819, -0.000342968136550643, 0.0548501664027086, 0.0690026761243566, 0.000342762224697716, -0.137620372063193, -0.275814335125817, 0.666328630107294, -0.275814335125817, -0.137620372063193, 0.000342762224697716, 0.0690026761243566, 0.0548501664027086, -0.000342968136550643, -0.0393967102483819, -0.0341125582868586, 0.000338860919917331, 0.0275226507626367, 0.02465272376684, -0.000345263834705688, -0.0210979639101242, -0.0192127395942808, 0.00034489268277269, 0.0170552887245676, 0.0156767500929317, -0.000344949681806432, -0.0142758603452146, -0.0131798317912114, 0.00034809030146328, 0.0122341814497526, 0.0113207792224559, -0.00034949508577418, -0.0106746118649872, -0.00987276733783059, 0.000355396091813656, 0.00942826426614478, 0.00871499627237555, -0.000352340646668522, -0.00842239116279103, -0.00776491348224791, 0.000359864714988787, 0.00757881748916284, 0.00696698474692175, -0.00036100869423152, -0.00687104517955612, -0.00628229215361872, 0.000365777028558921, 0.00625114027562799, 0.0057010778748638, -0.000371134141118705, -0.00571950978047043, -0.00518301934223061, 0.000368391016484171, 0.00525617616065258, 0.00472716615162233, -0.000373394484452055, -0.00483750152309592, -0.00432568590714262, 0.000381356771427738, 0.00446010531244924, 0.00396536471333485, -0.000384952238039591, -0.00412381895696044, -0.00363809959625523, 0.000385524677946866, 0.00382195978864209, 0.00334144481323407, -0.000388038311888698, -0.00354599269506148, -0.00307228825799685, 0.000391416244425848, 0.00329487695916691, 0.00282317190785887, -0.000393264984645793, -0.00306247338480811, -0.00259687249692364, 0.000394745844019576, 0.00284939934975055, 0.00238840843059474, -0.000394383007398057, -0.00265403893645818, -0.00219835442978541, 0.000396223597213331, 0.00247438296433148, 0.00202101634057289, -0.000397277324704684, -0.00230768149140923, -0.00185727510419251, 0.00039816779660138, 0.00215203161285738, 0.00170638923786518, -0.000396234627931678, -0.00200903711663445, -0.00156935208013748, 0.000394950775206263, 0.0018779540143872, 0.0014434246454147, -0.000392993698627906, -0.00175817057465746, -0.0013292731284991, 0.000391823034299946, 0.00164997460806762, 0.00122520347270327, -0.000390896439417858, -0.0015525794827252, -0.00113273871063864, 0.000391615981957236, 0.0014687756900724, 0.00104930528084403, -0.000395105954724499, -0.00139562957987483, -0.000977413332165076, 0.000400616500217427, 0.00134072447625446, 0.000917395656396487, -0.000415268482294982, -0.00130429407821579, -0.000866106063852858, 0.000442533525573418, 0.00129266572550508, 0.000823659745539285, -0.000491152711969859, -0.0013115118187689, -0.000782921994674482, 0.000578658722766177, 0.00137137045136327, 0.000733207314543699, -0.000728982372277507, -0.0014810948437703, -0.000639919456657835, 0.000998053728471211, 0.00164559833215254, 0.000428353617236692, -0.0014669382633414, -0.00181723429078082, 0.000112961687015653, 0.00227952019388446, 0.00174617948499645, -0.00152425148633392, -0.00341063434365162, -7.52158979255413e-05, 0.00506330420998353, 0.00174953104696055, -0.0102872649546862, 0.00836683573627826, -0.00230331686228658]
-coefHPF17Hz=[0.00127003324653421, -0.00612635197998921, 0.010546278229932, -0.00597758317945446, -0.00344789655230945, 0.00355387091129856, 0.00288282315560461, -0.00164805767455517, -0.0028120569938605, -4.64639866013548e-05, 0.00223742524757747, 0.00134068575010228, -0.00105654300613253, -0.0018502061964246, -0.00034653129466246, 0.00140076117801189, 0.001345912901324, -0.000264048474497301, -0.00145148119316053, -0.000898590549164066, 0.000649883826923398, 0.001388248720437, 0.00052348205918008, -0.000910224929383452, -0.00128324135236522, -0.00019751981278053, 0.00110454057509637, 0.00115262199725572, -0.000104599607366625, -0.00125526530948498, -0.000997068794446083, 0.000399187206211412, 0.00137069820510828, 0.000807248947022318, -0.000692141436647677, -0.00144701756675965, -0.000576949758486952, 0.000983550452578265, 0.00147478876150366, 0.000300934870675658, -0.00126165654631665, -0.00144637573446435, 1.51076577038606e-05, 0.00152209670066541, 0.00135328808507518, -0.000370754899788665, -0.00175052414342047, -0.00118930480483803, 0.000760753727357351, 0.00193330305675886, 0.000945227495217727, -0.00117327926778911, -0.00205240832244422, -0.000619657243751533, 0.00159457740871947, 0.00208954125605221, 0.000212905852509115, -0.0020007722107653, -0.00203234612997099, 0.000265832278683944, 0.00237290602129681, 0.00186953789213267, -0.000804647140023592, -0.00269248289451541, -0.00159062919294711, 0.00139161521233771, 0.00293259315158272, 0.00119025797883738, -0.00200625917183113, -0.00306729615654229, -0.00067008767506741, 0.00262186341260833, 0.00307795950205615, 3.54662013609869e-05, -0.00321205011643285, -0.00294711559573879, 0.000705817630490354, 0.00374765632295223, 0.00265583194735528, -0.00153765014153142, -0.00419682399321709, -0.00218849077729118, 0.00243704818236726, 0.0045234742566474, 0.00153863118504456, -0.00337465038373991, -0.00469505142822931, -0.000705361801293397, 0.00431863799149799, 0.00468027179699095, -0.000308649519531107, -0.00523472028550839, -0.00444546038730738, 0.00149814291998586, 0.00607688094764156, 0.00395803931539709, -0.0028434643877646, -0.00679713414634006, -0.003194739193211, 0.00432171194714261, 0.00735162303529858, 0.00212840611907459, -0.00590901831855973, -0.00768917006195776, -0.000725856088086164, 0.00757164231982898, 0.00774374442301199, -0.00103155457276105, -0.00927673380240774, -0.00744643907899883, 0.00316677669427461, 0.0109950796778705, 0.00672288985314376, -0.005743086965233, -0.0126690169845589, -0.00547823902313714, 0.00882955877024562, 0.0142646938041705, 0.00355657436992351, -0.0125340985441009, -0.0157507926399386, -0.000742175309948797, 0.0171164467716241, 0.0170737477571599, -0.00338459892391941, -0.0230273513359207, -0.0182113488291969, 0.00966020385733406, 0.0313724491156057, 0.0191265029993134, -0.0202058627848398, -0.0451698360920018, -0.0198013389488125, 0.0422558262828363, 0.0766449263220878, 0.0202086412781631, -0.126519263697028, -0.285246072904765, 0.646315552832376, -0.285246072904765, -0.126519263697028, 0.0202086412781631, 0.0766449263220878, 0.0422558262828363, -0.0198013389488125, -0.0451698360920018, -0.0202058627848398, 0.0191265029993134, 0.0313724491156057, 0.00966020385733406, -0.0182113488291969, -0.0230273513359207, -0.00338459892391941, 0.0170737477571599, 0.0171164467716241, -0.000742175309948797, -0.0157507926399386, -0.0125340985441009, 0.00355657436992351, 0.0142646938041705, 0.00882955877024562, -0.00547823902313714, -0.0126690169845589, -0.005743086965233, 0.00672288985314376, 0.0109950796778705, 0.00316677669427461, -0.00744643907899883, -0.00927673380240774, -0.00103155457276105, 0.00774374442301199, 0.00757164231982898, -0.000725856088086164, -0.00768917006195776, -0.00590901831855973, 0.00212840611907459, 0.00735162303529858, 0.00432171194714261, -0.003194739193211, -0.00679713414634006, -0.0028434643877646, 0.00395803931539709, 0.00607688094764156, 0.00149814291998586, -0.00444546038730738, -0.00523472028550839, -0.000308649519531107, 0.00468027179699095, 0.00431863799149799, -0.000705361801293397, -0.00469505142822931, -0.00337465038373991, 0.00153863118504456, 0.0045234742566474, 0.00243704818236726, -0.00218849077729118, -0.00419682399321709, -0.00153765014153142, 0.00265583194735528, 0.00374765632295223, 0.000705817630490354, -0.00294711559573879, -0.00321205011643285, 3.54662013609869e-05, 0.00307795950205615, 0.00262186341260833, -0.00067008767506741, -0.00306729615654229, -0.00200625917183113, 0.00119025797883738, 0.00293259315158272, 0.00139161521233771, -0.00159062919294711, -0.00269248289451541, -0.000804647140023592, 0.00186953789213267, 0.00237290602129681, 0.000265832278683944, -0.00203234612997099, -0.0020007722107653, 0.000212905852509115, 0.00208954125605221, 0.00159457740871947, -0.000619657243751533, -0.00205240832244422, -0.00117327926778911, 0.000945227495217727, 0.00193330305675886, 0.000760753727357351, -0.00118930480483803, -0.00175052414342047, -0.000370754899788665, 0.00135328808507518, 0.00152209670066541, 1.51076577038606e-05, -0.00144637573446435, -0.00126165654631665, 0.000300934870675658, 0.00147478876150366, 0.000983550452578265, -0.000576949758486952, -0.00144701756675965, -0.000692141436647677, 0.000807248947022318, 0.00137069820510828, 0.000399187206211412, -0.000997068794446083, -0.00125526530948498, -0.000104599607366625, 0.00115262199725572, 0.00110454057509637, -0.00019751981278053, -0.00128324135236522, -0.000910224929383452, 0.00052348205918008, 0.001388248720437, 0.000649883826923398, -0.000898590549164066, -0.00145148119316053, -0.000264048474497301, 0.001345912901324, 0.00140076117801189, -0.00034653129466246, -0.0018502061964246, -0.00105654300613253, 0.00134068575010228, 0.00223742524757747, -4.64639866013548e-05, -0.0028120569938605, -0.00164805767455517, 0.00288282315560461, 0.00355387091129856, -0.00344789655230945, -0.00597758317945446, 0.010546278229932, -0.00612635197998921, 0.00127003324653421]
-coefHPF18Hz=[-0.00040902948940295, 0.00350257406721834, -0.00896475576494779, 0.00943546982650645, -0.00118520488035034, -0.00501516908533367, 0.000756959732185083, 0.00356661720140156, 0.000355544091715056, -0.00261271312689954, -0.00133223633846908, 0.00152752138434033, 0.0018794438043689, -0.000300146729485026, -0.00180805388936306, -0.000809618787232981, 0.00112609694580541, 0.00145701041724726, -8.1736848891332e-05, -0.00141601113366884, -0.000894017043189171, 0.00072156222484571, 0.00137397310303065, 0.000288354899628829, -0.00113162002524223, -0.00111571919833135, 0.000291075349022476, 0.00132916509554381, 0.000710970219921189, -0.000801017841397691, -0.00132731852752312, -0.000204019238849303, 0.00119964377041756, 0.00112950836957429, -0.000356074680952084, -0.00144044172072792, -0.000747967845367712, 0.00090789471262113, 0.00148014769458481, 0.000211115618673901, -0.00137288117030082, -0.00129084783570131, 0.000420239578041482, 0.00167567943742798, 0.000872593523600518, -0.00106798983200533, -0.00174887777510463, -0.000253131058138419, 0.00163245788708688, 0.00154602040786112, -0.000498231409997726, -0.00201273895873123, -0.00105608952649325, 0.00128250065343883, 0.00211409090676131, 0.000314136703639309, -0.00196972472580422, -0.00187926711770334, 0.000589613585322356, 0.00243834636552757, 0.00129993111234499, -0.00154017423566138, -0.00257861651673565, -0.000410331088879531, 0.00238741464357948, 0.00231081541812931, -0.000689249115267827, -0.00297324297910141, -0.00161739222303319, 0.00185090030044124, 0.00316123639133943, 0.000546058303360481, -0.00289482968416338, -0.00286083229324843, 0.000790016395662807, 0.00363693064932269, 0.00203931979385149, -0.00222192357212152, -0.00390158062596317, -0.000741323690749948, 0.00352466139520885, 0.00356762655494958, -0.000892803012114497, -0.00447076439825157, -0.00259739980045403, 0.00266397338307299, 0.00485459954311125, 0.00102873287908411, -0.00431550109098269, -0.00450820160133665, 0.00099194722852108, 0.00555558015803237, 0.00336083312552571, -0.00321856134211593, -0.00612172837874327, -0.00145088224218707, 0.00535018065981141, 0.00579815056080052, -0.00107911640119392, -0.00703106982039237, -0.00445070380944823, 0.00394977669207556, 0.00790484964971552, 0.0020894768822578, -0.00679467963128464, -0.00767491374500137, 0.00115651925707767, 0.00917911892288216, 0.00610984341871033, -0.00499949704788368, -0.0106219846332877, -0.00312863501587791, 0.00901669719906434, 0.0106818510272128, -0.00122123434669198, -0.0126850643296738, -0.00893895485843934, 0.00673337396352896, 0.0153694507871442, 0.00505950749783902, -0.0130502299462098, -0.016385677290218, 0.00126662187244766, 0.0197160435358674, 0.0149012097484754, -0.0104193777892634, -0.02619075317237, -0.00977398456887276, 0.0232303383255893, 0.0319507540871835, -0.00129854802009576, -0.0423287557133561, -0.0364760162307644, 0.0255124696679602, 0.079467575065925, 0.0393650900920781, -0.113422012260145, -0.293555298988246, 0.626306360101101, -0.293555298988246, -0.113422012260145, 0.0393650900920781, 0.079467575065925, 0.0255124696679602, -0.0364760162307644, -0.0423287557133561, -0.00129854802009576, 0.0319507540871835, 0.0232303383255893, -0.00977398456887276, -0.02619075317237, -0.0104193777892634, 0.0149012097484754, 0.0197160435358674, 0.00126662187244766, -0.016385677290218, -0.0130502299462098, 0.00505950749783902, 0.0153694507871442, 0.00673337396352896, -0.00893895485843934, -0.0126850643296738, -0.00122123434669198, 0.0106818510272128, 0.00901669719906434, -0.00312863501587791, -0.0106219846332877, -0.00499949704788368, 0.00610984341871033, 0.00917911892288216, 0.00115651925707767, -0.00767491374500137, -0.00679467963128464, 0.0020894768822578, 0.00790484964971552, 0.00394977669207556, -0.00445070380944823, -0.00703106982039237, -0.00107911640119392, 0.00579815056080052, 0.00535018065981141, -0.00145088224218707, -0.00612172837874327, -0.00321856134211593, 0.00336083312552571, 0.00555558015803237, 0.00099194722852108, -0.00450820160133665, -0.00431550109098269, 0.00102873287908411, 0.00485459954311125, 0.00266397338307299, -0.00259739980045403, -0.00447076439825157, -0.000892803012114497, 0.00356762655494958, 0.00352466139520885, -0.000741323690749948, -0.00390158062596317, -0.00222192357212152, 0.00203931979385149, 0.00363693064932269, 0.000790016395662807, -0.00286083229324843, -0.00289482968416338, 0.000546058303360481, 0.00316123639133943, 0.00185090030044124, -0.00161739222303319, -0.00297324297910141, -0.000689249115267827, 0.00231081541812931, 0.00238741464357948, -0.000410331088879531, -0.00257861651673565, -0.00154017423566138, 0.00129993111234499, 0.00243834636552757, 0.000589613585322356, -0.00187926711770334, -0.00196972472580422, 0.000314136703639309, 0.00211409090676131, 0.00128250065343883, -0.00105608952649325, -0.00201273895873123, -0.000498231409997726, 0.00154602040786112, 0.00163245788708688, -0.000253131058138419, -0.00174887777510463, -0.00106798983200533, 0.000872593523600518, 0.00167567943742798, 0.000420239578041482, -0.00129084783570131, -0.00137288117030082, 0.000211115618673901, 0.00148014769458481, 0.00090789471262113, -0.000747967845367712, -0.00144044172072792, -0.000356074680952084, 0.00112950836957429, 0.00119964377041756, -0.000204019238849303, -0.00132731852752312, -0.000801017841397691, 0.000710970219921189, 0.00132916509554381, 0.000291075349022476, -0.00111571919833135, -0.00113162002524223, 0.000288354899628829, 0.00137397310303065, 0.00072156222484571, -0.000894017043189171, -0.00141601113366884, -8.1736848891332e-05, 0.00145701041724726, 0.00112609694580541, -0.000809618787232981, -0.00180805388936306, -0.000300146729485026, 0.0018794438043689, 0.00152752138434033, -0.00133223633846908, -0.00261271312689954, 0.000355544091715056, 0.00356661720140156, 0.000756959732185083, -0.00501516908533367, -0.00118520488035034, 0.00943546982650645, -0.00896475576494779, 0.00350257406721834, -0.00040902948940295]
-coefHPF19Hz=[-0.000405357185768609, -0.00022588086878995, 0.00464459441777237, -0.0100217149022779, 0.00801667048334221, 0.000771766244563294, -0.00414288335988757, -0.000940055518007315, 0.00286883247314, 0.0013920096949544, -0.00184520306565985, -0.00178601276815311, 0.000841194353814924, 0.00188981795320946, 0.000135114466500249, -0.00161056588077105, -0.000941008645270088, 0.000973052363248009, 0.00140127880427869, -0.00012368525238518, -0.00139605507079942, -0.000699765873720934, 0.000927243649025177, 0.0012405453747036, -0.000146486293190144, -0.00131286565078912, -0.00067674982369267, 0.000881484345394657, 0.00123940627979412, -9.40583949539247e-05, -0.00131549749513629, -0.000755224172249211, 0.000850844104760734, 0.0013285341314701, -5.03816109105617e-06, -0.00137193128384503, -0.000896143209939779, 0.000830796924321251, 0.00147618112687597, 0.000110296133983036, -0.00146225692555852, -0.00108027972869906, 0.000809808431181557, 0.00166177153996728, 0.00025597756167943, -0.00156815127378596, -0.00130448838662211, 0.000770929356292457, 0.0018813915255453, 0.00043992055936919, -0.00167907912237834, -0.00157699013244941, 0.000712281909589903, 0.00212912209443553, 0.00066755610948264, -0.0017906556168527, -0.00189082097945408, 0.000619931244049715, 0.0023978759799059, 0.000947820254180664, -0.00188746928871996, -0.00225512004352322, 0.000479777852916457, 0.00269128263367027, 0.00129134447325286, -0.00196911552608895, -0.00267245325826626, 0.000288726415051275, 0.00300294973189521, 0.00169989266074283, -0.00202136972161874, -0.00313888560989763, 2.64972476339046e-05, 0.00332349669270592, 0.00219421050098023, -0.00203105654478933, -0.00367113455696362, -0.00031596422155359, 0.00365539602193678, 0.00277999813715675, -0.00198986951614639, -0.0042631620889844, -0.000760425209291098, 0.00398633336248665, 0.00347823117388199, -0.0018740560758394, -0.00493276766759225, -0.00133196372091589, 0.0043204268269146796, 0.00430951551712071, -0.00167229588521266, -0.00568570751275621, -0.00205599866487476, 0.00464106359544757, 0.00530860168110869, -0.00134969877249599, -0.00654951101979851, -0.00297971053738842, 0.00495520333403206, 0.00651563705599039, -0.000875206220289859, -0.00754299432610759, -0.00417114025254176, 0.00524444407712012, 0.00801861152507445, -0.000188355936345145, -0.00873319501735016, -0.00573011577553945, 0.00550792953027081, 0.00993661781650431, 0.000812499467434458, -0.0102147137022419, -0.00785394330843635, 0.00574477690811403, 0.0125105626400777, 0.0023016863827832, -0.0121794329632751, -0.0109110032303794, 0.00594032669273889, 0.0162564431040319, 0.00463201302533306, -0.0150465119600144, -0.0157439157596494, 0.00610393940627235, 0.0223749888962772, 0.00875382256957006, -0.0199821871410975, -0.0246999728493825, 0.00622115343545199, 0.0348217549327565, 0.0179177406059813, -0.0314425440253763, -0.0480163191877202, 0.00629284243642278, 0.0772978865303638, 0.0571081425069324, -0.0985535891159445, -0.300695627401115, 0.606316879182003, -0.300695627401115, -0.0985535891159445, 0.0571081425069324, 0.0772978865303638, 0.00629284243642278, -0.0480163191877202, -0.0314425440253763, 0.0179177406059813, 0.0348217549327565, 0.00622115343545199, -0.0246999728493825, -0.0199821871410975, 0.00875382256957006, 0.0223749888962772, 0.00610393940627235, -0.0157439157596494, -0.0150465119600144, 0.00463201302533306, 0.0162564431040319, 0.00594032669273889, -0.0109110032303794, -0.0121794329632751, 0.0023016863827832, 0.0125105626400777, 0.00574477690811403, -0.00785394330843635, -0.0102147137022419, 0.000812499467434458, 0.00993661781650431, 0.00550792953027081, -0.00573011577553945, -0.00873319501735016, -0.000188355936345145, 0.00801861152507445, 0.00524444407712012, -0.00417114025254176, -0.00754299432610759, -0.000875206220289859, 0.00651563705599039, 0.00495520333403206, -0.00297971053738842, -0.00654951101979851, -0.00134969877249599, 0.00530860168110869, 0.00464106359544757, -0.00205599866487476, -0.00568570751275621, -0.00167229588521266, 0.00430951551712071, 0.0043204268269146796, -0.00133196372091589, -0.00493276766759225, -0.0018740560758394, 0.00347823117388199, 0.00398633336248665, -0.000760425209291098, -0.0042631620889844, -0.00198986951614639, 0.00277999813715675, 0.00365539602193678, -0.00031596422155359, -0.00367113455696362, -0.00203105654478933, 0.00219421050098023, 0.00332349669270592, 2.64972476339046e-05, -0.00313888560989763, -0.00202136972161874, 0.00169989266074283, 0.00300294973189521, 0.000288726415051275, -0.00267245325826626, -0.00196911552608895, 0.00129134447325286, 0.00269128263367027, 0.000479777852916457, -0.00225512004352322, -0.00188746928871996, 0.000947820254180664, 0.0023978759799059, 0.000619931244049715, -0.00189082097945408, -0.0017906556168527, 0.00066755610948264, 0.00212912209443553, 0.000712281909589903, -0.00157699013244941, -0.00167907912237834, 0.00043992055936919, 0.0018813915255453, 0.000770929356292457, -0.00130448838662211, -0.00156815127378596, 0.00025597756167943, 0.00166177153996728, 0.000809808431181557, -0.00108027972869906, -0.00146225692555852, 0.000110296133983036, 0.00147618112687597, 0.000830796924321251, -0.000896143209939779, -0.00137193128384503, -5.03816109105617e-06, 0.0013285341314701, 0.000850844104760734, -0.000755224172249211, -0.00131549749513629, -9.40583949539247e-05, 0.00123940627979412, 0.000881484345394657, -0.00067674982369267, -0.00131286565078912, -0.000146486293190144, 0.0012405453747036, 0.000927243649025177, -0.000699765873720934, -0.00139605507079942, -0.00012368525238518, 0.00140127880427869, 0.000973052363248009, -0.000941008645270088, -0.00161056588077105, 0.000135114466500249, 0.00188981795320946, 0.000841194353814924, -0.00178601276815311, -0.00184520306565985, 0.0013920096949544, 0.00286883247314, -0.000940055518007315, -0.00414288335988757, 0.000771766244563294, 0.00801667048334221, -0.0100217149022779, 0.00464459441777237, -0.00022588086878995, -0.000405357185768609]
-coefHPF20Hz=[0.00131785288212968, -0.00455626369825475, 0.00572217279227883, -0.000152643444726798, -0.00758076114774409, 0.00765292181969449, -0.00139691993116815, -0.000216508291792208, -0.00367942380172464, 0.00369566758075208, 0.000198583102819021, 7.63250362597423e-05, -0.00279985069220334, 0.00126439221244364, 0.00100354983695109, 0.00088106074600885, -0.00193325694173168, -0.000465295192347633, 0.000618868887491421, 0.0015407855607574, -0.000567764663551784, -0.00116438087338088, -0.000503608197660745, 0.00129986761054217, 0.000798924848843268, -0.000595135944625622, -0.00134037925787117, 0.000107781372902326, 0.00123815408582319, 0.000675438597298808, -0.00101871252322755, -0.00112895679891002, 0.000364647103807462, 0.00141837565127549, 0.000324908413272785, -0.00124429154849712, -0.00103808061788018, 0.00076269983516467, 0.00146086135710851, 1.35388246841968e-05, -0.00152935774984204, -0.000824539940603, 0.00113903048513837, 0.00148566096322063, -0.000396720853436972, -0.00176123669800567, -0.00054206411799591, 0.00155588205837858, 0.00140495025503364, -0.000867325316400143, -0.00194363621003681, -0.000142184921839874, 0.00196112994031147, 0.00121145142463499, -0.00139992459913897, -0.00203132550876905, 0.000367065769961645, 0.00233202263005799, 0.000881345367390264, -0.00196953376796945, -0.00199915832846538, 0.000984830481083391, 0.00263567413425746, 0.000400392119044732, -0.0025562368865175, -0.00180959268857997, 0.00170201418498404, 0.00283010378950922, -0.000249485223327671, -0.00311203727107662, -0.00143312409491192, 0.00249124195568447, 0.00286829166771831, -0.00105799900637455, -0.00359570670423723, -0.000850854580285253, 0.00332367293572905, 0.00271108016311352, -0.00202031673474585, -0.00396100119311221, -3.65347291681956e-05, 0.00415734817884079, 0.0023106092175606, -0.00311804196454564, -0.00414749815795405, 0.00102116461748133, 0.00493707590392654, 0.00163007625278192, -0.00432447868920591, -0.00409755655516728, 0.00232647084226032, 0.00561515330507424, 0.000621284366300815, -0.00561035000572695, -0.00374327472260927, 0.00389448414706471, 0.00611693832089039, -0.000766901566834986, -0.00693126037227595, -0.00300439128653812, 0.00572644023843352, 0.00636981720416502, -0.00259737491217022, -0.00824833899032413, -0.00178014677642001, 0.00785267247083118, 0.00626664076172107, -0.00496952711268407, -0.00950520112330511, 7.24909454042794e-05, 0.0103204960196142, 0.00567296416779729, -0.00804365282537248, -0.010672886446525, 0.00281141248232099, 0.0132627157076274, 0.00436014401787178, -0.0121734608340314, -0.0116896551959835, 0.00692398425315084, 0.0169980640849865, 0.00187749711369814, -0.018152223708776, -0.0125337996750705, 0.0136347815468724, 0.0224070536873015, -0.00294707678371354, -0.0283005656877056, -0.0131601441170635, 0.0268542992492549, 0.0327089061882864, -0.0145748308915496, -0.0528188603335794, -0.0135417331504404, 0.0702679007276933, 0.0728356628666031, -0.0821278471443384, -0.306654760987973, 0.58632749323416, -0.306654760987973, -0.0821278471443384, 0.0728356628666031, 0.0702679007276933, -0.0135417331504404, -0.0528188603335794, -0.0145748308915496, 0.0327089061882864, 0.0268542992492549, -0.0131601441170635, -0.0283005656877056, -0.00294707678371354, 0.0224070536873015, 0.0136347815468724, -0.0125337996750705, -0.018152223708776, 0.00187749711369814, 0.0169980640849865, 0.00692398425315084, -0.0116896551959835, -0.0121734608340314, 0.00436014401787178, 0.0132627157076274, 0.00281141248232099, -0.010672886446525, -0.00804365282537248, 0.00567296416779729, 0.0103204960196142, 7.24909454042794e-05, -0.00950520112330511, -0.00496952711268407, 0.00626664076172107, 0.00785267247083118, -0.00178014677642001, -0.00824833899032413, -0.00259737491217022, 0.00636981720416502, 0.00572644023843352, -0.00300439128653812, -0.00693126037227595, -0.000766901566834986, 0.00611693832089039, 0.00389448414706471, -0.00374327472260927, -0.00561035000572695, 0.000621284366300815, 0.00561515330507424, 0.00232647084226032, -0.00409755655516728, -0.00432447868920591, 0.00163007625278192, 0.00493707590392654, 0.00102116461748133, -0.00414749815795405, -0.00311804196454564, 0.0023106092175606, 0.00415734817884079, -3.65347291681956e-05, -0.00396100119311221, -0.00202031673474585, 0.00271108016311352, 0.00332367293572905, -0.000850854580285253, -0.00359570670423723, -0.00105799900637455, 0.00286829166771831, 0.00249124195568447, -0.00143312409491192, -0.00311203727107662, -0.000249485223327671, 0.00283010378950922, 0.00170201418498404, -0.00180959268857997, -0.0025562368865175, 0.000400392119044732, 0.00263567413425746, 0.000984830481083391, -0.00199915832846538, -0.00196953376796945, 0.000881345367390264, 0.00233202263005799, 0.000367065769961645, -0.00203132550876905, -0.00139992459913897, 0.00121145142463499, 0.00196112994031147, -0.000142184921839874, -0.00194363621003681, -0.000867325316400143, 0.00140495025503364, 0.00155588205837858, -0.00054206411799591, -0.00176123669800567, -0.000396720853436972, 0.00148566096322063, 0.00113903048513837, -0.000824539940603, -0.00152935774984204, 1.35388246841968e-05, 0.00146086135710851, 0.00076269983516467, -0.00103808061788018, -0.00124429154849712, 0.000324908413272785, 0.00141837565127549, 0.000364647103807462, -0.00112895679891002, -0.00101871252322755, 0.000675438597298808, 0.00123815408582319, 0.000107781372902326, -0.00134037925787117, -0.000595135944625622, 0.000798924848843268, 0.00129986761054217, -0.000503608197660745, -0.00116438087338088, -0.000567764663551784, 0.0015407855607574, 0.000618868887491421, -0.000465295192347633, -0.00193325694173168, 0.00088106074600885, 0.00100354983695109, 0.00126439221244364, -0.00279985069220334, 7.63250362597423e-05, 0.000198583102819021, 0.00369566758075208, -0.00367942380172464, -0.000216508291792208, -0.00139691993116815, 0.00765292181969449, -0.00758076114774409, -0.000152643444726798, 0.00572217279227883, -0.00455626369825475, 0.00131785288212968]
-coefHPF21Hz=[-0.000870115506069305, 0.00427898518729541, -0.00861767047022724, 0.00825663807961297, -0.00138447747141066, -0.00430654720815438, 0.00200329041399203, 0.00280611883303261, -0.00161676972349065, -0.00224265268649919, 0.00111257317151401, 0.0020063598719525, -0.000600209610529609, -0.00185592466656559, 9.77536977595592e-05, 0.00168223854500985, 0.000376936796243266, -0.00143196434370442, -0.000793788274113443, 0.00108417657527237, 0.00111698846418316, -0.00064608432765018, -0.00130911520231981, 0.000148233572344587, 0.00133856367656228, 0.000361651387255888, -0.00118891671034784, -0.000825840616259025, 0.000868735130378415, 0.00118017345769478, -0.000410467526636612, -0.00136580589282687, -0.000132834958852758, 0.00134616327626112, 0.000684310364620068, -0.00110798728274979, -0.00115826281877619, 0.000668920065825773, 0.00147575888747129, -8.55347804613125e-05, -0.0015699456571532, -0.000558541508463618, 0.0014022015968148, 0.0011655746453018, -0.000980865645883655, -0.00162506640134117, 0.000349429747876574, 0.00184683233870193, 0.000403280765283398, -0.00176933669414749, -0.00115738149502487, 0.00137215630924159, 0.00178655320886986, -0.000696645831347432, -0.00216288485497207, -0.000173191505518847, 0.00219935079940015, 0.00110014324483562, -0.00185004067619859, -0.00192955739318303, 0.00113751917226445, 0.00250321532816584, -0.000147899201118179, -0.00269359309526937, -0.000971904578954937, 0.00242501657670226, 0.00203757351408253, -0.00169603872856797, -0.00285415177780046, 0.000587948141189002, 0.00324697954138578, 0.00074581794437356, -0.0031028848641046, -0.00208932487563466, 0.0023870481016997, 0.00320485671527966, -0.00116514677901041, -0.00386767461179696, -0.000399616641705022, 0.00390750196761964, 0.00206680812101053, -0.0032483140914568, -0.00354868120250522, 0.00192890408300742, 0.00455821956618286, -0.000109403710441738, -0.0048616107773705, -0.00193929335772018, 0.00431944747062417, 0.00387810778924589, -0.00292977328939388, -0.00534520606016301, 0.000840027318628465, 0.00601857512806321, 0.00166168734678301, -0.00567911010491876, -0.00417802515086371, 0.00426029019554198, 0.00625612027367501, -0.00187310863437438, -0.00746717365648182, -0.00118072810602413, 0.00747106073745841, 0.004449077538991, -0.00609897464393959, -0.00737282059124224, 0.00338942330828521, 0.00938233981781978, 0.00036978246282228, -0.00996501936808132, -0.00468400359007257, 0.008788449689783, 0.00886826484091562, -0.00574334279932769, -0.0121626708742866, 0.00102466274292419, 0.0138115589872517, 0.00486535652373123, -0.0131677306947838, -0.0111698582341988, 0.00984518567785557, 0.0168639987523228, -0.00370281042190019, -0.0208463555816588, -0.00500576951712862, 0.0219281833255528, 0.0157041775819574, -0.0189149679772616, -0.0275281852324633, 0.0105210455209463, 0.0394128002844684, 0.00508338331991097, -0.050202258343685, -0.0320732093576219, 0.058824852635508, 0.0859881525028444, -0.0643918825771388, -0.311405690673731, 0.566318489072978, -0.311405690673731, -0.0643918825771388, 0.0859881525028444, 0.058824852635508, -0.0320732093576219, -0.050202258343685, 0.00508338331991097, 0.0394128002844684, 0.0105210455209463, -0.0275281852324633, -0.0189149679772616, 0.0157041775819574, 0.0219281833255528, -0.00500576951712862, -0.0208463555816588, -0.00370281042190019, 0.0168639987523228, 0.00984518567785557, -0.0111698582341988, -0.0131677306947838, 0.00486535652373123, 0.0138115589872517, 0.00102466274292419, -0.0121626708742866, -0.00574334279932769, 0.00886826484091562, 0.008788449689783, -0.00468400359007257, -0.00996501936808132, 0.00036978246282228, 0.00938233981781978, 0.00338942330828521, -0.00737282059124224, -0.00609897464393959, 0.004449077538991, 0.00747106073745841, -0.00118072810602413, -0.00746717365648182, -0.00187310863437438, 0.00625612027367501, 0.00426029019554198, -0.00417802515086371, -0.00567911010491876, 0.00166168734678301, 0.00601857512806321, 0.000840027318628465, -0.00534520606016301, -0.00292977328939388, 0.00387810778924589, 0.00431944747062417, -0.00193929335772018, -0.0048616107773705, -0.000109403710441738, 0.00455821956618286, 0.00192890408300742, -0.00354868120250522, -0.0032483140914568, 0.00206680812101053, 0.00390750196761964, -0.000399616641705022, -0.00386767461179696, -0.00116514677901041, 0.00320485671527966, 0.0023870481016997, -0.00208932487563466, -0.0031028848641046, 0.00074581794437356, 0.00324697954138578, 0.000587948141189002, -0.00285415177780046, -0.00169603872856797, 0.00203757351408253, 0.00242501657670226, -0.000971904578954937, -0.00269359309526937, -0.000147899201118179, 0.00250321532816584, 0.00113751917226445, -0.00192955739318303, -0.00185004067619859, 0.00110014324483562, 0.00219935079940015, -0.000173191505518847, -0.00216288485497207, -0.000696645831347432, 0.00178655320886986, 0.00137215630924159, -0.00115738149502487, -0.00176933669414749, 0.000403280765283398, 0.00184683233870193, 0.000349429747876574, -0.00162506640134117, -0.000980865645883655, 0.0011655746453018, 0.0014022015968148, -0.000558541508463618, -0.0015699456571532, -8.55347804613125e-05, 0.00147575888747129, 0.000668920065825773, -0.00115826281877619, -0.00110798728274979, 0.000684310364620068, 0.00134616327626112, -0.000132834958852758, -0.00136580589282687, -0.000410467526636612, 0.00118017345769478, 0.000868735130378415, -0.000825840616259025, -0.00118891671034784, 0.000361651387255888, 0.00133856367656228, 0.000148233572344587, -0.00130911520231981, -0.00064608432765018, 0.00111698846418316, 0.00108417657527237, -0.000793788274113443, -0.00143196434370442, 0.000376936796243266, 0.00168223854500985, 9.77536977595592e-05, -0.00185592466656559, -0.000600209610529609, 0.0020063598719525, 0.00111257317151401, -0.00224265268649919, -0.00161676972349065, 0.00280611883303261, 0.00200329041399203, -0.00430654720815438, -0.00138447747141066, 0.00825663807961297, -0.00861767047022724, 0.00427898518729541, -0.000870115506069305]
-coefHPF22Hz=[0.000262107745529041, -0.0022500977879605, 0.00639224982703431, -0.00914769246811704, 0.00584701195431285, 0.00142387751501159, -0.00435261936219884, 0.000301703173157821, 0.00314082366785549, -0.000595076235911548, -0.00246863800140835, 0.000498738664213223, 0.00209030481818034, -0.000278906425444051, -0.00185171202998115, 1.5469419997786e-05, 0.00166633593120756, 0.000264221030699744, -0.00148856958407728, -0.000541070952692232, 0.00128900574132662, 0.000800829105275175, -0.00105180879152258, -0.00102923940661558, 0.000772302166109571, 0.00120929136561543, -0.00045251204292327, -0.00132368679138387, 9.92137586671344e-05, 0.00135995933960583, 0.000271471699403124, -0.00130686314846756, -0.000638926195029666, 0.00115758827855588, 0.000979870962864446, -0.000912363940332699, -0.00126969926766419, 0.000581148128400338, 0.00148085243975846, -0.000179168225890004, -0.00158990932816293, -0.000270159867565282, 0.00157870699652766, 0.000736263463580647, -0.00143665478058389, -0.00118219905801111, 0.00116032306638245, 0.00157097821160182, -0.000759339990314036, -0.00186469161785156, 0.000254592502082803, 0.0020288609747714, 0.000321648152463783, -0.00203497312007276, -0.000929192017589901, 0.00186704530222022, 0.00151842009165636, -0.00152064197653001, -0.00203644869469364, 0.00100636692700561, 0.00243034408853604, -0.000349405354315892, -0.00265406492249101, -0.000407588940469102, 0.00266959710892674, 0.00120938401886279, -0.00245353443566395, -0.00198972838178846, 0.00199871175655983, 0.0026783778969894, -0.00131934127765076, -0.00320408043504788, 0.000449459971846615, 0.00350353513157697, 0.00055497680283769, -0.00352515672339274, -0.00162091108160938, 0.00323709952485394, 0.00266018488997891, -0.00262938204125401, -0.0035784733432966, 0.00172000132819367, 0.00428001611987049, -0.000553603380139688, -0.00467873223015789, -0.000796603941934487, 0.00470450844851764, 0.00223368113337543, -0.00431314569046581, -0.00363902970527126, 0.00348832031757462, 0.00488439560199372, -0.00224882056161432, -0.0058405929182193, 0.000650387503429295, 0.00639023449397577, 0.00121019577885529, -0.00643306576712776, -0.00320283248159652, 0.00589837695836743, 0.00516954388334889, -0.00475208100661716, -0.00693735207033619, 0.00300833078968895, 0.00832573513378459, -0.000731795790272248, -0.00916043218932009, -0.00195862921609751, 0.00928103030690186, 0.00489960168351962, -0.00855992716314478, -0.00788652481203853, 0.00691504691322138, 0.0106798433748138, -0.00432061874736221, -0.0130071751619247, 0.000800690006995702, 0.0145855450187682, 0.00356242030498138, -0.0151309149945825, -0.00862490569828679, 0.0143584258318973, 0.0141834052322371, -0.0119618521872214, -0.0200044608473093, 0.007603431085341, 0.025826973939619, -0.000837529769099403, -0.0313718764212029, -0.00908517246110081, 0.0363521608479997, 0.0237736225519985, -0.0405307866948755, -0.0474581021212238, 0.0436836864061366, 0.0960880980141435, -0.0456410034593099, -0.314923281344051, 0.546307636796925, -0.314923281344051, -0.0456410034593099, 0.0960880980141435, 0.0436836864061366, -0.0474581021212238, -0.0405307866948755, 0.0237736225519985, 0.0363521608479997, -0.00908517246110081, -0.0313718764212029, -0.000837529769099403, 0.025826973939619, 0.007603431085341, -0.0200044608473093, -0.0119618521872214, 0.0141834052322371, 0.0143584258318973, -0.00862490569828679, -0.0151309149945825, 0.00356242030498138, 0.0145855450187682, 0.000800690006995702, -0.0130071751619247, -0.00432061874736221, 0.0106798433748138, 0.00691504691322138, -0.00788652481203853, -0.00855992716314478, 0.00489960168351962, 0.00928103030690186, -0.00195862921609751, -0.00916043218932009, -0.000731795790272248, 0.00832573513378459, 0.00300833078968895, -0.00693735207033619, -0.00475208100661716, 0.00516954388334889, 0.00589837695836743, -0.00320283248159652, -0.00643306576712776, 0.00121019577885529, 0.00639023449397577, 0.000650387503429295, -0.0058405929182193, -0.00224882056161432, 0.00488439560199372, 0.00348832031757462, -0.00363902970527126, -0.00431314569046581, 0.00223368113337543, 0.00470450844851764, -0.000796603941934487, -0.00467873223015789, -0.000553603380139688, 0.00428001611987049, 0.00172000132819367, -0.0035784733432966, -0.00262938204125401, 0.00266018488997891, 0.00323709952485394, -0.00162091108160938, -0.00352515672339274, 0.00055497680283769, 0.00350353513157697, 0.000449459971846615, -0.00320408043504788, -0.00131934127765076, 0.0026783778969894, 0.00199871175655983, -0.00198972838178846, -0.00245353443566395, 0.00120938401886279, 0.00266959710892674, -0.000407588940469102, -0.00265406492249101, -0.000349405354315892, 0.00243034408853604, 0.00100636692700561, -0.00203644869469364, -0.00152064197653001, 0.00151842009165636, 0.00186704530222022, -0.000929192017589901, -0.00203497312007276, 0.000321648152463783, 0.0020288609747714, 0.000254592502082803, -0.00186469161785156, -0.000759339990314036, 0.00157097821160182, 0.00116032306638245, -0.00118219905801111, -0.00143665478058389, 0.000736263463580647, 0.00157870699652766, -0.000270159867565282, -0.00158990932816293, -0.000179168225890004, 0.00148085243975846, 0.000581148128400338, -0.00126969926766419, -0.000912363940332699, 0.000979870962864446, 0.00115758827855588, -0.000638926195029666, -0.00130686314846756, 0.000271471699403124, 0.00135995933960583, 9.92137586671344e-05, -0.00132368679138387, -0.00045251204292327, 0.00120929136561543, 0.000772302166109571, -0.00102923940661558, -0.00105180879152258, 0.000800829105275175, 0.00128900574132662, -0.000541070952692232, -0.00148856958407728, 0.000264221030699744, 0.00166633593120756, 1.5469419997786e-05, -0.00185171202998115, -0.000278906425444051, 0.00209030481818034, 0.000498738664213223, -0.00246863800140835, -0.000595076235911548, 0.00314082366785549, 0.000301703173157821, -0.00435261936219884, 0.00142387751501159, 0.00584701195431285, -0.00914769246811704, 0.00639224982703431, -0.0022500977879605, 0.000262107745529041]
-coefHPF23Hz=[0.000218224411150052, 0.000199609839660316, -0.00288926946630832, 0.00732020026906462, -0.00901886710159752, 0.00454219657430209, 0.00219913545528202, -0.00368400767995786, -0.000487686256003024, 0.00289074868184578, -0.000101440316755777, -0.00233496384644716, 0.000269726465717417, 0.0019780071512224, -0.000266892552072517, -0.00175213912785471, 0.000189952492898117, 0.00160361166970235, -7.3772846142376e-05, -0.00150196461768395, -6.29019621175093e-05, 0.0014230421426354, 0.000214348033277225, -0.00135346819818304, -0.000374908592891899, 0.00128100936036365, 0.000543545123794707, -0.00120085394043214, -0.000713315040446335, 0.00110233621284059, 0.000886062926794495, -0.000986457080685421, -0.00105307192100625, 0.000845996778956332, 0.00121334662897272, -0.000682500196987497, -0.0013583838220958, 0.000492247256613397, 0.0014844628037655, -0.00027638104119741, -0.00158479741230627, 3.46792857341561e-05, 0.0016554366719769, 0.000228811069198082, -0.00168941124722673, -0.000512202710129154, 0.00168416077182284, 0.000807441894706396, -0.00163251383098231, -0.00111015007322109, 0.00153253004068552, 0.00141033055663208, -0.00137837012890795, -0.00170170917591633, 0.00116911218581286, 0.00197508634953972, -0.00090400892396292, -0.00222235154837715, 0.000586743404980246, 0.0024317305610021, -0.000220171182801687, -0.00259281873347419, -0.000189487019337811, 0.00269246707353833, 0.000639081281068081, -0.00272375008742273, -0.0011192449368309, 0.00267862356936177, 0.00161946631648171, -0.00255154837150608, -0.00212518695470253, 0.002336582428892, 0.0026201057715822, -0.00202675803929934, -0.00309092394496366, 0.0016202776047476, 0.00352378938157673, -0.00112155712344665, -0.00389912330750693, 0.000532722383814694, 0.00420306638255114, 0.000131649705808939, -0.00440679134304616, -0.000874236291682265, 0.00450388873620278, 0.00167629548139334, -0.00447753590434764, -0.00252131538157501, 0.00431555963822015, 0.00338415048283682, -0.00399701803590363, -0.00425162702828834, 0.00351790280786932, 0.0050981988341916, -0.00287311696513658, -0.00589693414174579, 0.00206383508469814, 0.00660847129299545, -0.00107385418632296, -0.00722222438799966, -7.43277820202021e-05, 0.00769384959669462, 0.00137736486100391, -0.00798596073652198, -0.00283789853307336, 0.00808690922431423, 0.00441607742127105, -0.00793930774748774, -0.0061141101139986, 0.00752655855896679, 0.00789593728806684, -0.00680306651580707, -0.0097433011733131, 0.00573577920639767, 0.0116242784262935, -0.0042782970406689, -0.0135111713705167, 0.0023793128818228, 0.0153732607209614, 2.82832965734224e-05, -0.0171797115282137, -0.00303693068633975, 0.0188972479828059, 0.00678973929133041, -0.0204959736402381, -0.0115162904426054, 0.0219470056054669, 0.0176185999722893, -0.0232241727549005, -0.0258669337974533, 0.0243051174413648, 0.0379299743356293, -0.0251672125644771, -0.0581908475183139, 0.0257951606889154, 0.102786295831567, -0.0261759156507956, -0.317198485994479, 0.526303609811409, -0.317198485994479, -0.0261759156507956, 0.102786295831567, 0.0257951606889154, -0.0581908475183139, -0.0251672125644771, 0.0379299743356293, 0.0243051174413648, -0.0258669337974533, -0.0232241727549005, 0.0176185999722893, 0.0219470056054669, -0.0115162904426054, -0.0204959736402381, 0.00678973929133041, 0.0188972479828059, -0.00303693068633975, -0.0171797115282137, 2.82832965734224e-05, 0.0153732607209614, 0.0023793128818228, -0.0135111713705167, -0.0042782970406689, 0.0116242784262935, 0.00573577920639767, -0.0097433011733131, -0.00680306651580707, 0.00789593728806684, 0.00752655855896679, -0.0061141101139986, -0.00793930774748774, 0.00441607742127105, 0.00808690922431423, -0.00283789853307336, -0.00798596073652198, 0.00137736486100391, 0.00769384959669462, -7.43277820202021e-05, -0.00722222438799966, -0.00107385418632296, 0.00660847129299545, 0.00206383508469814, -0.00589693414174579, -0.00287311696513658, 0.0050981988341916, 0.00351790280786932, -0.00425162702828834, -0.00399701803590363, 0.00338415048283682, 0.00431555963822015, -0.00252131538157501, -0.00447753590434764, 0.00167629548139334, 0.00450388873620278, -0.000874236291682265, -0.00440679134304616, 0.000131649705808939, 0.00420306638255114, 0.000532722383814694, -0.00389912330750693, -0.00112155712344665, 0.00352378938157673, 0.0016202776047476, -0.00309092394496366, -0.00202675803929934, 0.0026201057715822, 0.002336582428892, -0.00212518695470253, -0.00255154837150608, 0.00161946631648171, 0.00267862356936177, -0.0011192449368309, -0.00272375008742273, 0.000639081281068081, 0.00269246707353833, -0.000189487019337811, -0.00259281873347419, -0.000220171182801687, 0.0024317305610021, 0.000586743404980246, -0.00222235154837715, -0.00090400892396292, 0.00197508634953972, 0.00116911218581286, -0.00170170917591633, -0.00137837012890795, 0.00141033055663208, 0.00153253004068552, -0.00111015007322109, -0.00163251383098231, 0.000807441894706396, 0.00168416077182284, -0.000512202710129154, -0.00168941124722673, 0.000228811069198082, 0.0016554366719769, 3.46792857341561e-05, -0.00158479741230627, -0.00027638104119741, 0.0014844628037655, 0.000492247256613397, -0.0013583838220958, -0.000682500196987497, 0.00121334662897272, 0.000845996778956332, -0.00105307192100625, -0.000986457080685421, 0.000886062926794495, 0.00110233621284059, -0.000713315040446335, -0.00120085394043214, 0.000543545123794707, 0.00128100936036365, -0.000374908592891899, -0.00135346819818304, 0.000214348033277225, 0.0014230421426354, -6.29019621175093e-05, -0.00150196461768395, -7.3772846142376e-05, 0.00160361166970235, 0.000189952492898117, -0.00175213912785471, -0.000266892552072517, 0.0019780071512224, 0.000269726465717417, -0.00233496384644716, -0.000101440316755777, 0.00289074868184578, -0.000487686256003024, -0.00368400767995786, 0.00219913545528202, 0.00454219657430209, -0.00901886710159752, 0.00732020026906462, -0.00288926946630832, 0.000199609839660316, 0.000218224411150052]
-coefHPF24Hz=[-0.000664986106123646, 0.00217619192377996, -0.00279450440834321, -0.000109494180235813, 0.00582816001819563, -0.00910090822793442, 0.00609950616046872, -0.000352595991911521, -0.00134874027810249, -0.00156239430287818, 0.0031174852622599, -0.000556429248256464, -0.00168873284991246, 0.000128249036569064, 0.00189108098009374, -0.0006029785139105, -0.00145262952751486, 0.00050206019736847, 0.00142262284521718, -0.000595938307055214, -0.00128243775619643, 0.000559862461246306, 0.00125532960680967, -0.00056585831292748, -0.0012204646049512, 0.000542226500536039, 0.00122384362057582, -0.000527654910719976, -0.00123531177233959, 0.000504914777586501, 0.00126464239323997, -0.000483288167517592, -0.00130400254877059, 0.000460328708422529, 0.00135128232565399, -0.000432998761488511, -0.00140947882249188, 0.000405371771892967, 0.00147446857824154, -0.000375982155771726, -0.00154410729058308, 0.000340710578477394, 0.00162401896726747, -0.000308248199240636, -0.00170125653517995, 0.000263496833134545, 0.00179053716065608, -0.000220012690888986, -0.00187885497173411, 0.000166544712702355, 0.00197357706569008, -0.000105781927386692, -0.00207611353977286, 4.27433348229175e-05, 0.00217816018085967, 3.24562704238086e-05, -0.00228960005399753, -0.000110010389061827, 0.00240075202292518, 0.000197413729015267, -0.00251467664781389, -0.000294772008165648, 0.00263126842713867, 0.00040409780134463, -0.0027543320204253, -0.00051909473404664, 0.00287350956973304, 0.000653905207663799, -0.0030051227937552, -0.000790673075023665, 0.00313069874184223, 0.000945189560781713, -0.0032599697283483, -0.00111286752669469, 0.00338980070070387, 0.00129650621677925, -0.00352136233180103, -0.00149581491311224, 0.00365224521075905, 0.00171648333575584, -0.00379036847877644, -0.00194846332941619, 0.00392396282973736, 0.00220041452684273, -0.00405270236888503, -0.0024807992305697, 0.00418587719241389, 0.00278474950753618, -0.00432368669497268, -0.00310607987821349, 0.00445318349972167, 0.00345872255382388, -0.00458039260063837, -0.00384487646643211, 0.00470761199979134, 0.00426541277494542, -0.00483458865663587, -0.00472114326909355, 0.00495599576426574, 0.00522157375371604, -0.00507436018072836, -0.00577148870537288, 0.00518885300066591, 0.00637946100322191, -0.00530232231885429, -0.0070494975358345, 0.0054086398670508, 0.00779797130714164, -0.00551050500068203, -0.00863857056357134, 0.00560820530629477, 0.00958936345125916, -0.00570131913163592, -0.0106748620377737, 0.00578952007872299, 0.0119274363085939, -0.00586963505414343, -0.0133977280461946, 0.00594577404807138, 0.0151481945294789, -0.00601494651553692, -0.0172780639438514, 0.006077954190795, 0.0199360466465174, -0.0061329065192464, -0.0233667733240596, 0.00618276584307556, 0.0279850365180125, -0.0062229537564944, -0.0345866603953956, 0.00625805131267317, 0.0448629987814715, -0.0062846752556229, -0.063225162848376, 0.00630361591855321, 0.105840722814569, -0.00631482048712619, -0.318222773664539, 0.506319445124863, -0.318222773664539, -0.00631482048712619, 0.105840722814569, 0.00630361591855321, -0.063225162848376, -0.0062846752556229, 0.0448629987814715, 0.00625805131267317, -0.0345866603953956, -0.0062229537564944, 0.0279850365180125, 0.00618276584307556, -0.0233667733240596, -0.0061329065192464, 0.0199360466465174, 0.006077954190795, -0.0172780639438514, -0.00601494651553692, 0.0151481945294789, 0.00594577404807138, -0.0133977280461946, -0.00586963505414343, 0.0119274363085939, 0.00578952007872299, -0.0106748620377737, -0.00570131913163592, 0.00958936345125916, 0.00560820530629477, -0.00863857056357134, -0.00551050500068203, 0.00779797130714164, 0.0054086398670508, -0.0070494975358345, -0.00530232231885429, 0.00637946100322191, 0.00518885300066591, -0.00577148870537288, -0.00507436018072836, 0.00522157375371604, 0.00495599576426574, -0.00472114326909355, -0.00483458865663587, 0.00426541277494542, 0.00470761199979134, -0.00384487646643211, -0.00458039260063837, 0.00345872255382388, 0.00445318349972167, -0.00310607987821349, -0.00432368669497268, 0.00278474950753618, 0.00418587719241389, -0.0024807992305697, -0.00405270236888503, 0.00220041452684273, 0.00392396282973736, -0.00194846332941619, -0.00379036847877644, 0.00171648333575584, 0.00365224521075905, -0.00149581491311224, -0.00352136233180103, 0.00129650621677925, 0.00338980070070387, -0.00111286752669469, -0.0032599697283483, 0.000945189560781713, 0.00313069874184223, -0.000790673075023665, -0.0030051227937552, 0.000653905207663799, 0.00287350956973304, -0.00051909473404664, -0.0027543320204253, 0.00040409780134463, 0.00263126842713867, -0.000294772008165648, -0.00251467664781389, 0.000197413729015267, 0.00240075202292518, -0.000110010389061827, -0.00228960005399753, 3.24562704238086e-05, 0.00217816018085967, 4.27433348229175e-05, -0.00207611353977286, -0.000105781927386692, 0.00197357706569008, 0.000166544712702355, -0.00187885497173411, -0.000220012690888986, 0.00179053716065608, 0.000263496833134545, -0.00170125653517995, -0.000308248199240636, 0.00162401896726747, 0.000340710578477394, -0.00154410729058308, -0.000375982155771726, 0.00147446857824154, 0.000405371771892967, -0.00140947882249188, -0.000432998761488511, 0.00135128232565399, 0.000460328708422529, -0.00130400254877059, -0.000483288167517592, 0.00126464239323997, 0.000504914777586501, -0.00123531177233959, -0.000527654910719976, 0.00122384362057582, 0.000542226500536039, -0.0012204646049512, -0.00056585831292748, 0.00125532960680967, 0.000559862461246306, -0.00128243775619643, -0.000595938307055214, 0.00142262284521718, 0.00050206019736847, -0.00145262952751486, -0.0006029785139105, 0.00189108098009374, 0.000128249036569064, -0.00168873284991246, -0.000556429248256464, 0.0031174852622599, -0.00156239430287818, -0.00134874027810249, -0.000352595991911521, 0.00609950616046872, -0.00910090822793442, 0.00582816001819563, -0.000109494180235813, -0.00279450440834321, 0.00217619192377996, -0.000664986106123646]
-coefHPF25Hz=[0.000562317636189772, -0.00276154026584417, 0.00620838926744539, -0.00812726706070023, 0.00554493917833318, 0.000234032907011235, -0.00384046306756779, 0.00200493127121588, 0.00191612846454345, -0.00238074226629293, -0.00066432481845508, 0.00219433792336619, -8.54314145447837e-05, -0.00187678126397601, 0.000531224880794162, 0.00155889966761099, -0.000798764678915588, -0.00127947628286602, 0.000963088141479574, 0.00104461533943656, -0.00107114029770087, -0.000846225973475818, 0.00114780884936308, 0.000675824271227464, -0.00120890112296441, -0.000522487789629329, 0.00125902434753799, 0.000383051396734081, -0.00130692705651972, -0.000246591706709771, 0.00134928440411892, 0.000112581033346321, -0.00138912207501926, 2.46978863630927e-05, 0.00142306971999794, -0.000164248131112486, -0.00145424860978962, 0.000312794425433632, 0.00147607278522459, -0.000467045427441514, -0.00149039203164931, 0.000630794512449147, 0.00149227894642186, -0.000801484175973527, -0.00148230356356531, 0.000981890563820698, 0.00145408395930909, -0.00116599344102185, -0.00141041567219337, 0.00135570239008194, 0.00134794261336945, -0.00154802359683331, -0.00126761699405059, 0.00174474474172974, 0.00116445382518956, -0.0019406783113721, -0.00104049194046737, 0.00213724469693616, 0.000891349473856776, -0.00232995625116926, -0.000717237718389929, 0.00251733751886171, 0.000515231852854927, -0.0026928732500949, -0.000289461752193874, 0.00285753560095857, 3.77910776717969e-05, -0.00300782952189683, 0.000238945997463588, 0.0031430493525234, -0.000543984922612398, -0.00325665174797413, 0.000874271901231697, 0.00334728598322122, -0.00123094420060102, -0.00340924317478065, 0.00160995556064982, 0.00344213251541396, -0.0020120121500435, -0.00344159378457244, 0.00243420501583676, 0.0034073950862734, -0.00287928173992858, -0.00333211655538274, 0.00334303339143488, 0.00321338670775212, -0.00382455111520551, -0.00304540788581136, 0.00431813452201846, 0.00282871629855541, -0.00482530819059514, -0.00255669017103112, 0.00534171151151662, 0.00222731313902362, -0.00586801371501123, -0.0018318526904181, 0.00639722161171263, 0.00136859485890666, -0.00692857135758607, -0.000830210104624208, 0.00745611456159416, 0.000215392275571278, -0.00798318461313761, 0.000488941460146374, 0.00850349107124718, -0.00129071642020498, -0.00901456043228997, 0.00220330141720962, 0.00950820901758024, -0.00323297477716005, -0.00998968852014281, 0.00440400720734554, 0.0104535738340589, -0.00574066395567579, -0.0108965564693214, 0.00727754699224703, 0.0113099413896741, -0.00905081388002078, -0.0117007006025991, 0.0111323178355511, 0.0120635117788857, -0.0136189623093598, -0.0123934749391119, 0.0166577587454931, 0.0126851257353338, -0.0204809743279451, -0.0129465971218367, 0.0255135046470973, 0.0131725161663766, -0.0325469047125908, -0.0133521322481373, 0.0432602565884988, 0.0135003734652815, -0.0620759856188541, -0.0136017720479031, 0.10514610133538, 0.0136683294715352, -0.317994589083751, 0.486317633578695, -0.317994589083751, 0.0136683294715352, 0.10514610133538, -0.0136017720479031, -0.0620759856188541, 0.0135003734652815, 0.0432602565884988, -0.0133521322481373, -0.0325469047125908, 0.0131725161663766, 0.0255135046470973, -0.0129465971218367, -0.0204809743279451, 0.0126851257353338, 0.0166577587454931, -0.0123934749391119, -0.0136189623093598, 0.0120635117788857, 0.0111323178355511, -0.0117007006025991, -0.00905081388002078, 0.0113099413896741, 0.00727754699224703, -0.0108965564693214, -0.00574066395567579, 0.0104535738340589, 0.00440400720734554, -0.00998968852014281, -0.00323297477716005, 0.00950820901758024, 0.00220330141720962, -0.00901456043228997, -0.00129071642020498, 0.00850349107124718, 0.000488941460146374, -0.00798318461313761, 0.000215392275571278, 0.00745611456159416, -0.000830210104624208, -0.00692857135758607, 0.00136859485890666, 0.00639722161171263, -0.0018318526904181, -0.00586801371501123, 0.00222731313902362, 0.00534171151151662, -0.00255669017103112, -0.00482530819059514, 0.00282871629855541, 0.00431813452201846, -0.00304540788581136, -0.00382455111520551, 0.00321338670775212, 0.00334303339143488, -0.00333211655538274, -0.00287928173992858, 0.0034073950862734, 0.00243420501583676, -0.00344159378457244, -0.0020120121500435, 0.00344213251541396, 0.00160995556064982, -0.00340924317478065, -0.00123094420060102, 0.00334728598322122, 0.000874271901231697, -0.00325665174797413, -0.000543984922612398, 0.0031430493525234, 0.000238945997463588, -0.00300782952189683, 3.77910776717969e-05, 0.00285753560095857, -0.000289461752193874, -0.0026928732500949, 0.000515231852854927, 0.00251733751886171, -0.000717237718389929, -0.00232995625116926, 0.000891349473856776, 0.00213724469693616, -0.00104049194046737, -0.0019406783113721, 0.00116445382518956, 0.00174474474172974, -0.00126761699405059, -0.00154802359683331, 0.00134794261336945, 0.00135570239008194, -0.00141041567219337, -0.00116599344102185, 0.00145408395930909, 0.000981890563820698, -0.00148230356356531, -0.000801484175973527, 0.00149227894642186, 0.000630794512449147, -0.00149039203164931, -0.000467045427441514, 0.00147607278522459, 0.000312794425433632, -0.00145424860978962, -0.000164248131112486, 0.00142306971999794, 2.46978863630927e-05, -0.00138912207501926, 0.000112581033346321, 0.00134928440411892, -0.000246591706709771, -0.00130692705651972, 0.000383051396734081, 0.00125902434753799, -0.000522487789629329, -0.00120890112296441, 0.000675824271227464, 0.00114780884936308, -0.000846225973475818, -0.00107114029770087, 0.00104461533943656, 0.000963088141479574, -0.00127947628286602, -0.000798764678915588, 0.00155889966761099, 0.000531224880794162, -0.00187678126397601, -8.54314145447837e-05, 0.00219433792336619, -0.00066432481845508, -0.00238074226629293, 0.00191612846454345, 0.00200493127121588, -0.00384046306756779, 0.000234032907011235, 0.00554493917833318, -0.00812726706070023, 0.00620838926744539, -0.00276154026584417, 0.000562317636189772]
-coefHPF26Hz=[-0.00012719515804804, 0.00126098356172866, -0.00395998747679095, 0.00708438871989602, -0.00769555383692791, 0.00405481102739411, 0.00141904037795772, -0.00383712350337891, 0.00140065287074043, 0.00215291678065831, -0.00221410773492647, -0.000729949011275086, 0.00217073097316693, -0.000241474701926174, -0.00180271675225236, 0.000847219942880445, 0.00133980523899489, -0.00119649859953924, -0.000873497619915183, 0.00136925878958265, 0.000440234899350667, -0.00142245508681861, -4.79174140790813e-05, 0.00138894069506933, -0.000301793764880666, -0.00128984863413867, 0.000610510022556113, 0.00113668697795065, -0.000877226573939804, -0.000939285667016771, 0.00110359598285251, 0.000699805089206203, -0.00128415463402645, -0.000423462540361242, 0.00141369620815545, 0.000114324438465165, -0.00148184779491117, 0.000215156017827084, 0.00148601051163067, -0.000558221701722465, -0.00141626872600263, 0.000896635717263785, 0.00127508065528101, -0.00122142965220531, -0.00105649417963148, 0.0015122329239657, 0.000766109900553563, -0.00175438399996234, -0.000407935015336301, 0.00192816598705206, -5.12233753210492e-06, -0.00201792702300751, 0.000455404079353747, 0.00201427776976233, -0.000926641788207101, -0.00190709748287488, 0.00139700658055096, 0.00169225961280647, -0.00184486260334712, -0.00136704914237267, 0.00224386401644777, 0.000935400004194671, -0.00256497143375559, -0.000412852460286165, 0.00278692658548105, -0.000183967592015878, -0.0028892888575373, 0.000833275738323526, 0.00285507733751657, -0.00150942463971734, -0.00266996894508304, 0.0021804517851044, 0.00232615569932734, -0.00280927846844633, -0.00182619840107113, 0.00335882062025898, 0.00118280476600392, -0.00379772196262533, -0.000411395645854788, 0.00409563453088906, -0.000470356750435282, -0.00421510893097691, 0.00142607970887299, 0.00413068747335164, -0.00241209494817936, -0.00383085987818336, 0.00338888362047882, 0.00330469659964645, -0.00431045388876622, -0.00254736967248031, 0.00512233500414655, 0.0015682904664455, -0.00576735751340273, -0.000397063792045245, 0.00620413439242476, -0.000940441829646398, -0.00638439744143843, 0.00240418451348289, 0.00626200072756864, -0.00393629810030479, -0.00580549781905239, 0.00547079788828319, 0.00500138901730728, -0.00695123236886471, -0.00382562008226537, 0.00829542573665269, 0.00227851932960054, -0.00941882417687482, -0.000381086329400207, 0.0102483451455767, -0.00184728212515835, -0.0107011476033677, 0.00437737434105778, 0.0106776703948441, -0.00713954904366282, -0.0101159195756624, 0.0100981570093947, 0.00890498186508969, -0.0131657115409529, -0.00696300602179575, 0.0162773919892751, 0.00416889233498371, -0.0193512164727707, -0.000368485200023167, 0.0223011291424891, -0.00466089963023471, -0.0250571236503903, 0.0113226147962411, 0.0275325649496039, -0.0203582260073299, -0.0296663750492827, 0.0334187055239262, 0.0313895174075551, -0.0548406805907989, -0.0326605261470322, 0.100725985297245, 0.0334364462397839, -0.316501998617429, 0.466300271925092, -0.316501998617429, 0.0334364462397839, 0.100725985297245, -0.0326605261470322, -0.0548406805907989, 0.0313895174075551, 0.0334187055239262, -0.0296663750492827, -0.0203582260073299, 0.0275325649496039, 0.0113226147962411, -0.0250571236503903, -0.00466089963023471, 0.0223011291424891, -0.000368485200023167, -0.0193512164727707, 0.00416889233498371, 0.0162773919892751, -0.00696300602179575, -0.0131657115409529, 0.00890498186508969, 0.0100981570093947, -0.0101159195756624, -0.00713954904366282, 0.0106776703948441, 0.00437737434105778, -0.0107011476033677, -0.00184728212515835, 0.0102483451455767, -0.000381086329400207, -0.00941882417687482, 0.00227851932960054, 0.00829542573665269, -0.00382562008226537, -0.00695123236886471, 0.00500138901730728, 0.00547079788828319, -0.00580549781905239, -0.00393629810030479, 0.00626200072756864, 0.00240418451348289, -0.00638439744143843, -0.000940441829646398, 0.00620413439242476, -0.000397063792045245, -0.00576735751340273, 0.0015682904664455, 0.00512233500414655, -0.00254736967248031, -0.00431045388876622, 0.00330469659964645, 0.00338888362047882, -0.00383085987818336, -0.00241209494817936, 0.00413068747335164, 0.00142607970887299, -0.00421510893097691, -0.000470356750435282, 0.00409563453088906, -0.000411395645854788, -0.00379772196262533, 0.00118280476600392, 0.00335882062025898, -0.00182619840107113, -0.00280927846844633, 0.00232615569932734, 0.0021804517851044, -0.00266996894508304, -0.00150942463971734, 0.00285507733751657, 0.000833275738323526, -0.0028892888575373, -0.000183967592015878, 0.00278692658548105, -0.000412852460286165, -0.00256497143375559, 0.000935400004194671, 0.00224386401644777, -0.00136704914237267, -0.00184486260334712, 0.00169225961280647, 0.00139700658055096, -0.00190709748287488, -0.000926641788207101, 0.00201427776976233, 0.000455404079353747, -0.00201792702300751, -5.12233753210492e-06, 0.00192816598705206, -0.000407935015336301, -0.00175438399996234, 0.000766109900553563, 0.0015122329239657, -0.00105649417963148, -0.00122142965220531, 0.00127508065528101, 0.000896635717263785, -0.00141626872600263, -0.000558221701722465, 0.00148601051163067, 0.000215156017827084, -0.00148184779491117, 0.000114324438465165, 0.00141369620815545, -0.000423462540361242, -0.00128415463402645, 0.000699805089206203, 0.00110359598285251, -0.000939285667016771, -0.000877226573939804, 0.00113668697795065, 0.000610510022556113, -0.00128984863413867, -0.000301793764880666, 0.00138894069506933, -4.79174140790813e-05, -0.00142245508681861, 0.000440234899350667, 0.00136925878958265, -0.000873497619915183, -0.00119649859953924, 0.00133980523899489, 0.000847219942880445, -0.00180271675225236, -0.000241474701926174, 0.00217073097316693, -0.000729949011275086, -0.00221410773492647, 0.00215291678065831, 0.00140065287074043, -0.00383712350337891, 0.00141904037795772, 0.00405481102739411, -0.00769555383692791, 0.00708438871989602, -0.00395998747679095, 0.00126098356172866, -0.00012719515804804]
-coefHPF27Hz=[-0.000171733212439743, 5.82273627655921e-05, 0.00124561342340721, -0.00415317455097448, 0.00718973619044897, -0.00752884194241616, 0.00389416983435078, 0.0012258582727711, -0.00348632954330319, 0.00138789654241659, 0.0018667967394671, -0.0022021469870991, -0.000351976037515328, 0.00205156334375814, -0.000699102577777812, -0.00148198198401544, 0.00129432525544915, 0.000782380422590942, -0.00152046750134344, -0.000104051489073372, 0.00147201434638321, -0.000478973842467641, -0.00122631481620326, 0.000927784172059767, 0.000847592680293313, -0.00122305069068936, -0.000389953924665471, 0.00135600326058308, -9.7041607138901e-05, -0.00132837626682005, 0.000570465767019949, 0.00114607170868908, -0.000987410879899288, -0.000822715692325772, 0.00130408074414508, 0.000384479285464532, -0.00147889053025393, 0.000124457283487518, 0.00148503258610609, -0.00065053248360776, -0.00131215672471037, 0.00113533861781064, 0.000968913711951859, -0.00152395110260522, -0.000476614589784273, 0.00176006884478012, -0.00012072886845337, -0.00179852231400391, 0.000759095137595079, 0.00161445487653395, -0.00135951186919892, -0.00121628686379073, 0.00185187005893507, 0.000627592525184186, -0.00216474117040016, 0.000101178412996784, 0.00223795503683008, -0.000893633299347846, -0.0020329887868273, 0.00164733863028493, 0.00156013037053607, -0.00227614240521104, -0.000844613333432475, 0.00268898765275908, -5.31105604892876e-05, -0.00280856375606795, 0.0010388058014737, 0.00258724548913322, -0.00199107704497234, -0.00203210032867173, 0.00280901763261244, 0.00115467138996724, -0.00335743465443718, -4.43082208249435e-05, 0.0035482830121445, -0.00118716889416813, -0.00332702857639546, 0.00241381735398065, 0.00266070830508929, -0.003467128941496, -0.00160025783731413, 0.00421545839916862, 0.000217656826856207, -0.00452006357909483, 0.0013403811958212, 0.00430744005526043, -0.00291505875678646, -0.00353611720736885, 0.00430963556196199, 0.00224244265900454, -0.00534105161195466, -0.000515474090999305, 0.00583579398967713, -0.00148255588143877, -0.00567413043645879, 0.00354788082953589, 0.00479102212429492, -0.00543701696408593, -0.00320547251145967, 0.00690597438964617, 0.00101052550919449, -0.00771908262131047, 0.00161051063309957, 0.00769212710241045, -0.0044070382103518, -0.00670789205291096, 0.00707211440477466, 0.00474372264095077, -0.00927665801915377, -0.00187332879103351, 0.0106861468229874, -0.00171499642283124, -0.0110048774363282, 0.00573285404844385, 0.00999985901104979, -0.00980027462554063, -0.00753184877619614, 0.0134711953936413, 0.00356886508007227, -0.0162496205106835, 0.00179226278530786, 0.0176254552042805, -0.00833664425536852, -0.0170815621131561, 0.0157363305499818, 0.0140912629809171, -0.0235740356430023, -0.00806010797899114, 0.0313685692837089, -0.00184103030586819, -0.038626244918486, 0.0172175217683799, 0.0448609929442961, -0.0422432062755352, -0.0496531884237414, 0.0927392325253406, 0.0526662448346613, -0.31376594278165, 0.44630243931399, -0.31376594278165, 0.0526662448346613, 0.0927392325253406, -0.0496531884237414, -0.0422432062755352, 0.0448609929442961, 0.0172175217683799, -0.038626244918486, -0.00184103030586819, 0.0313685692837089, -0.00806010797899114, -0.0235740356430023, 0.0140912629809171, 0.0157363305499818, -0.0170815621131561, -0.00833664425536852, 0.0176254552042805, 0.00179226278530786, -0.0162496205106835, 0.00356886508007227, 0.0134711953936413, -0.00753184877619614, -0.00980027462554063, 0.00999985901104979, 0.00573285404844385, -0.0110048774363282, -0.00171499642283124, 0.0106861468229874, -0.00187332879103351, -0.00927665801915377, 0.00474372264095077, 0.00707211440477466, -0.00670789205291096, -0.0044070382103518, 0.00769212710241045, 0.00161051063309957, -0.00771908262131047, 0.00101052550919449, 0.00690597438964617, -0.00320547251145967, -0.00543701696408593, 0.00479102212429492, 0.00354788082953589, -0.00567413043645879, -0.00148255588143877, 0.00583579398967713, -0.000515474090999305, -0.00534105161195466, 0.00224244265900454, 0.00430963556196199, -0.00353611720736885, -0.00291505875678646, 0.00430744005526043, 0.0013403811958212, -0.00452006357909483, 0.000217656826856207, 0.00421545839916862, -0.00160025783731413, -0.003467128941496, 0.00266070830508929, 0.00241381735398065, -0.00332702857639546, -0.00118716889416813, 0.0035482830121445, -4.43082208249435e-05, -0.00335743465443718, 0.00115467138996724, 0.00280901763261244, -0.00203210032867173, -0.00199107704497234, 0.00258724548913322, 0.0010388058014737, -0.00280856375606795, -5.31105604892876e-05, 0.00268898765275908, -0.000844613333432475, -0.00227614240521104, 0.00156013037053607, 0.00164733863028493, -0.0020329887868273, -0.000893633299347846, 0.00223795503683008, 0.000101178412996784, -0.00216474117040016, 0.000627592525184186, 0.00185187005893507, -0.00121628686379073, -0.00135951186919892, 0.00161445487653395, 0.000759095137595079, -0.00179852231400391, -0.00012072886845337, 0.00176006884478012, -0.000476614589784273, -0.00152395110260522, 0.000968913711951859, 0.00113533861781064, -0.00131215672471037, -0.00065053248360776, 0.00148503258610609, 0.000124457283487518, -0.00147889053025393, 0.000384479285464532, 0.00130408074414508, -0.000822715692325772, -0.000987410879899288, 0.00114607170868908, 0.000570465767019949, -0.00132837626682005, -9.7041607138901e-05, 0.00135600326058308, -0.000389953924665471, -0.00122305069068936, 0.000847592680293313, 0.000927784172059767, -0.00122631481620326, -0.000478973842467641, 0.00147201434638321, -0.000104051489073372, -0.00152046750134344, 0.000782380422590942, 0.00129432525544915, -0.00148198198401544, -0.000699102577777812, 0.00205156334375814, -0.000351976037515328, -0.0022021469870991, 0.0018667967394671, 0.00138789654241659, -0.00348632954330319, 0.0012258582727711, 0.00389416983435078, -0.00752884194241616, 0.00718973619044897, -0.00415317455097448, 0.00124561342340721, 5.82273627655921e-05, -0.000171733212439743]
-coefHPF28Hz=[0.000407506295802007, -0.00131986512155776, 0.00208348824254792, -0.00128177702267221, -0.00185255049103319, 0.00593087785965088, -0.00790897518529837, 0.0058963388783867, -0.00148795164635577, -0.00144615878420192, 0.000743276347949657, 0.00175715417241208, -0.0025241599139584, 0.000601587453190053, 0.00144951076401484, -0.00108206268576707, -0.000904669318244668, 0.00162534342934217, -0.00013218743789816, -0.00137961773543455, 0.000786194193456786, 0.000951321417035972, -0.00125858247725261, -0.000281166361869897, 0.00135833304586527, -0.000380591828512723, -0.00116618250544111, 0.000948052205520691, 0.000708224612223587, -0.00129248043979467, -9.88102363293742e-05, 0.00136116769309197, -0.000549227504967379, -0.00113189662732367, 0.00110523754157877, 0.000636468117092937, -0.00144241241064675, 2.77917993927742e-05, 0.00148370792295947, -0.000739462795464417, -0.00118703227833761, 0.00133570926481759, 0.000596785618986982, -0.00167327090002605, 0.000171252903627539, 0.00166815187397661, -0.000973911347557623, -0.00128308977856079, 0.00163409704728727, 0.000562865462787726, -0.00198057530922918, 0.000355577857611829, 0.00190563440752834, -0.00127991421867338, -0.00139042416049547, 0.00200606967077938, 0.000504958879248815, -0.00234949811649311, 0.000591851540274099, 0.00218368006949318, -0.00166024757777273, -0.00150495248380763, 0.00246228285416539, 0.000408372375077061, -0.00278110316044805, 0.000892579215674338, 0.00250053476428345, -0.00212881227810908, -0.00161612875905818, 0.00300551413628052, 0.000273429452426608, -0.00329304654997526, 0.00127680331378805, 0.00285952146565375, -0.0027018307640251, -0.00172820684243698, 0.00366573578528893, 8.08983158561989e-05, -0.00390150828052717, 0.0017675364194243, 0.00327245529962798, -0.00341507364688217, -0.00183214269709161, 0.00447280389591633, -0.000188993658321374, -0.00463128680358801, 0.00239495894887453, 0.00375880791208733, -0.00431627877995386, -0.0019253468640058, 0.00547785149122206, -0.00055896788503951, -0.00553749466366954, 0.00322005083174723, 0.00434409985032073, -0.00547827243408635, -0.00201392382184151, 0.00677996309325496, -0.00107880238713287, -0.00670542355517633, 0.00433594645189915, 0.00509262444992722, -0.00705349697134583, -0.00208890135175617, 0.00854670904343474, -0.00183259668005113, -0.00830254718591713, 0.00593149838360015, 0.00611136530386319, -0.00932092829353982, -0.00215037236523356, 0.0111294565248703, -0.00299803586022932, -0.0106803100891731, 0.00840544999347234, 0.00765199826408838, -0.012923757655681, -0.00219886227652795, 0.0153740806961114, -0.00500979158635627, -0.0147482953491381, 0.0128204625209131, 0.0104102961810273, -0.0197137705163135, -0.00223438009986711, 0.0239532696998468, -0.00931711516678816, -0.0237420428869475, 0.0232272513091455, 0.0172450755473277, -0.0380311256405045, -0.00225785557458493, 0.0520311692604444, -0.0255131623531517, -0.0635228310742445, 0.0814649771098185, 0.0710672297886833, -0.309793775835106, 0.426307089264442, -0.309793775835106, 0.0710672297886833, 0.0814649771098185, -0.0635228310742445, -0.0255131623531517, 0.0520311692604444, -0.00225785557458493, -0.0380311256405045, 0.0172450755473277, 0.0232272513091455, -0.0237420428869475, -0.00931711516678816, 0.0239532696998468, -0.00223438009986711, -0.0197137705163135, 0.0104102961810273, 0.0128204625209131, -0.0147482953491381, -0.00500979158635627, 0.0153740806961114, -0.00219886227652795, -0.012923757655681, 0.00765199826408838, 0.00840544999347234, -0.0106803100891731, -0.00299803586022932, 0.0111294565248703, -0.00215037236523356, -0.00932092829353982, 0.00611136530386319, 0.00593149838360015, -0.00830254718591713, -0.00183259668005113, 0.00854670904343474, -0.00208890135175617, -0.00705349697134583, 0.00509262444992722, 0.00433594645189915, -0.00670542355517633, -0.00107880238713287, 0.00677996309325496, -0.00201392382184151, -0.00547827243408635, 0.00434409985032073, 0.00322005083174723, -0.00553749466366954, -0.00055896788503951, 0.00547785149122206, -0.0019253468640058, -0.00431627877995386, 0.00375880791208733, 0.00239495894887453, -0.00463128680358801, -0.000188993658321374, 0.00447280389591633, -0.00183214269709161, -0.00341507364688217, 0.00327245529962798, 0.0017675364194243, -0.00390150828052717, 8.08983158561989e-05, 0.00366573578528893, -0.00172820684243698, -0.0027018307640251, 0.00285952146565375, 0.00127680331378805, -0.00329304654997526, 0.000273429452426608, 0.00300551413628052, -0.00161612875905818, -0.00212881227810908, 0.00250053476428345, 0.000892579215674338, -0.00278110316044805, 0.000408372375077061, 0.00246228285416539, -0.00150495248380763, -0.00166024757777273, 0.00218368006949318, 0.000591851540274099, -0.00234949811649311, 0.000504958879248815, 0.00200606967077938, -0.00139042416049547, -0.00127991421867338, 0.00190563440752834, 0.000355577857611829, -0.00198057530922918, 0.000562865462787726, 0.00163409704728727, -0.00128308977856079, -0.000973911347557623, 0.00166815187397661, 0.000171252903627539, -0.00167327090002605, 0.000596785618986982, 0.00133570926481759, -0.00118703227833761, -0.000739462795464417, 0.00148370792295947, 2.77917993927742e-05, -0.00144241241064675, 0.000636468117092937, 0.00110523754157877, -0.00113189662732367, -0.000549227504967379, 0.00136116769309197, -9.88102363293742e-05, -0.00129248043979467, 0.000708224612223587, 0.000948052205520691, -0.00116618250544111, -0.000380591828512723, 0.00135833304586527, -0.000281166361869897, -0.00125858247725261, 0.000951321417035972, 0.000786194193456786, -0.00137961773543455, -0.00013218743789816, 0.00162534342934217, -0.000904669318244668, -0.00108206268576707, 0.00144951076401484, 0.000601587453190053, -0.0025241599139584, 0.00175715417241208, 0.000743276347949657, -0.00144615878420192, -0.00148795164635577, 0.0058963388783867, -0.00790897518529837, 0.00593087785965088, -0.00185255049103319, -0.00128177702267221, 0.00208348824254792, -0.00131986512155776, 0.000407506295802007]
-coefHPF29Hz=[-0.000324763471821058, 0.00159316726836383, -0.00385545926686872, 0.00620312226444317, -0.00677685748696558, 0.00446248058744747, -0.000278109087302855, -0.00290787937517658, 0.00285085877845542, -0.000159196363917869, -0.00217364337157798, 0.00182227770575361, 0.000479318201511434, -0.00192281567674242, 0.000933386973609367, 0.00107543877153156, -0.00156873018005948, 5.0021005597338e-05, 0.00142273872675562, -0.000958774793336432, -0.000739934243219627, 0.00137964917318702, -0.000143447226110045, -0.00125210383536314, 0.000907523392144846, 0.000680868177586316, -0.00131352262941336, 0.000115629736972301, 0.00124757353873634, -0.000867875814162599, -0.000741339005191169, 0.00132808200155025, -4.1408075233091e-05, -0.00133456038428838, 0.000843420446388385, 0.000867928047723376, -0.00139190271850877, -6.08039304998264e-05, 0.00147693292233997, -0.000822271479907077, -0.00104188475538603, 0.00148159073588472, 0.000195429768884752, -0.00166195812906771, 0.000793209163671772, 0.00126114989124205, -0.00158785068000893, -0.000365738200972768, 0.00188335362767527, -0.000750102248255437, -0.00152217539496491, 0.00170143005658899, 0.000573261529955438, -0.00212923214415003, 0.000678548578656211, 0.00182598752753836, -0.00180826015412332, -0.000831786488876753, 0.00239870609959284, -0.000566196082338854, -0.00218109524308819, 0.00190535732376375, 0.00114792534599832, -0.00269187871386718, 0.000409480183854845, 0.00258359380730003, -0.00198017665986611, -0.00152888072545999, 0.00299887649059398, -0.000189258713935252, -0.00304200407387601, 0.00202275202538053, 0.00198941970403459, -0.00332208948103145, -0.000103272675869068, 0.00356057110616241, -0.00202635033167053, -0.0025344571134807, 0.00365181956503373, 0.000483431446417218, -0.00413762707189609, 0.00196651337545703, 0.00318804010484503, -0.00398538275380838, -0.000977207575844479, 0.00479332256671126, -0.00184016271718679, -0.00396067875822384, 0.00431649794896671, 0.00160237893611696, -0.00552519550125775, 0.00161161207483917, 0.00488891152361982, -0.00463961084487068, -0.00240337073532212, 0.00636574125663081, -0.00126695653421042, -0.00600388174243513, 0.00494868467031522, 0.00342300167257915, -0.00732956779105318, 0.000750206950971324, 0.00737949474128185, -0.00524230698102559, -0.00474452037920309, 0.00847552242866567, -1.21346245660395e-05, -0.00910529051995868, 0.00550403532774938, 0.00650541327242591, -0.00988647458330754, -0.00106514869578664, 0.0113817722847376, -0.00574279328630413, -0.00893895666779922, 0.0117240577889433, 0.00268266986959257, -0.0145702395389437, 0.00594400332761939, 0.0125578951076936, -0.014357100971032, -0.00527056546289097, 0.0195009489995857, -0.0061026418795621, -0.0185855832633785, 0.0187109338662507, 0.00998692013326962, -0.0285314842984666, 0.00621759259367662, 0.0309658802482649, -0.0280345971365718, -0.0213013365063663, 0.0518967343708811, -0.00628736347568852, -0.0734046596679256, 0.0673109143224638, 0.0883430610507839, -0.304597638031201, 0.406311678165836, -0.304597638031201, 0.0883430610507839, 0.0673109143224638, -0.0734046596679256, -0.00628736347568852, 0.0518967343708811, -0.0213013365063663, -0.0280345971365718, 0.0309658802482649, 0.00621759259367662, -0.0285314842984666, 0.00998692013326962, 0.0187109338662507, -0.0185855832633785, -0.0061026418795621, 0.0195009489995857, -0.00527056546289097, -0.014357100971032, 0.0125578951076936, 0.00594400332761939, -0.0145702395389437, 0.00268266986959257, 0.0117240577889433, -0.00893895666779922, -0.00574279328630413, 0.0113817722847376, -0.00106514869578664, -0.00988647458330754, 0.00650541327242591, 0.00550403532774938, -0.00910529051995868, -1.21346245660395e-05, 0.00847552242866567, -0.00474452037920309, -0.00524230698102559, 0.00737949474128185, 0.000750206950971324, -0.00732956779105318, 0.00342300167257915, 0.00494868467031522, -0.00600388174243513, -0.00126695653421042, 0.00636574125663081, -0.00240337073532212, -0.00463961084487068, 0.00488891152361982, 0.00161161207483917, -0.00552519550125775, 0.00160237893611696, 0.00431649794896671, -0.00396067875822384, -0.00184016271718679, 0.00479332256671126, -0.000977207575844479, -0.00398538275380838, 0.00318804010484503, 0.00196651337545703, -0.00413762707189609, 0.000483431446417218, 0.00365181956503373, -0.0025344571134807, -0.00202635033167053, 0.00356057110616241, -0.000103272675869068, -0.00332208948103145, 0.00198941970403459, 0.00202275202538053, -0.00304200407387601, -0.000189258713935252, 0.00299887649059398, -0.00152888072545999, -0.00198017665986611, 0.00258359380730003, 0.000409480183854845, -0.00269187871386718, 0.00114792534599832, 0.00190535732376375, -0.00218109524308819, -0.000566196082338854, 0.00239870609959284, -0.000831786488876753, -0.00180826015412332, 0.00182598752753836, 0.000678548578656211, -0.00212923214415003, 0.000573261529955438, 0.00170143005658899, -0.00152217539496491, -0.000750102248255437, 0.00188335362767527, -0.000365738200972768, -0.00158785068000893, 0.00126114989124205, 0.000793209163671772, -0.00166195812906771, 0.000195429768884752, 0.00148159073588472, -0.00104188475538603, -0.000822271479907077, 0.00147693292233997, -6.08039304998264e-05, -0.00139190271850877, 0.000867928047723376, 0.000843420446388385, -0.00133456038428838, -4.1408075233091e-05, 0.00132808200155025, -0.000741339005191169, -0.000867875814162599, 0.00124757353873634, 0.000115629736972301, -0.00131352262941336, 0.000680868177586316, 0.000907523392144846, -0.00125210383536314, -0.000143447226110045, 0.00137964917318702, -0.000739934243219627, -0.000958774793336432, 0.00142273872675562, 5.0021005597338e-05, -0.00156873018005948, 0.00107543877153156, 0.000933386973609367, -0.00192281567674242, 0.000479318201511434, 0.00182227770575361, -0.00217364337157798, -0.000159196363917869, 0.00285085877845542, -0.00290787937517658, -0.000278109087302855, 0.00446248058744747, -0.00677685748696558, 0.00620312226444317, -0.00385545926686872, 0.00159316726836383, -0.000324763471821058]
-coefHPF30Hz=[2.39766783695612e-05, -0.000557946091879617, 0.00198563509090665, -0.00424368717671841, 0.0062860988321027, -0.00653997857395991, 0.00419042877366288, -0.000266470404267536, -0.00276393016349939, 0.00292873797615633, -0.000565958110675046, -0.00187633262568478, 0.00210928224012549, -0.000184589257330837, -0.00168229460231245, 0.0015235224792517, 0.000300202600881319, -0.00161943577476375, 0.00097035759463814, 0.000769486753975168, -0.00149258547648448, 0.000384306898181359, 0.00114419177941468, -0.00121275171857313, -0.000225865334618914, 0.0013534224577943, -0.000760050619392573, -0.000793478398678416, 0.00133254670351101, -0.000164527593494296, -0.00122686694569767, 0.00105189205381825, 0.000490048996071256, -0.00142750450737422, 0.00052726487321533, 0.00108583787498427, -0.00132536240379372, -0.000165154166298801, 0.0014893284923064, -0.000902221899540395, -0.000895719007906953, 0.00158485580091053, -0.000212090896682214, -0.00149838978622978, 0.00130388604011698, 0.000621699545740507, -0.00181093591388529, 0.000658690696530413, 0.00141729209844266, -0.00171160371404316, -0.00024939474141538, 0.00197453265358642, -0.00116506180405623, -0.00122994449104457, 0.00211240920674569, -0.000236903980622873, -0.00204563965759254, 0.00172713431458742, 0.000899306552458935, -0.00246238661250376, 0.000832586850928341, 0.0019872110784897, -0.00231127043296415, -0.00041910536799139, 0.00273291779079204, -0.00153436110493769, -0.00176377238556762, 0.00288527839985855, -0.000227150063513936, -0.00287039363905073, 0.00230895621753089, 0.00135609139599483, -0.00341054638355562, 0.0010353744410821, 0.00284176682059172, -0.00313904481417097, -0.000728981661669174, 0.00383219438988211, -0.00199495254480202, -0.00260180362771774, 0.0039824732733163, -0.000132388948295917, -0.00410158322802046, 0.00309502462758168, 0.00209915702806756, -0.00478455157587073, 0.00123699607506384, 0.00416082696351878, -0.00430844361064053, -0.00129141267079959, 0.00548989374888621, -0.00259469304210004, -0.00394205874480837, 0.00559621308923753, 0.000138810075085961, -0.00603811464816225, 0.00421369957683119, 0.0033737470717521, -0.00692248735052442, 0.00141525524318392, 0.00635259506797457, -0.00610661098307658, -0.00236396050840274, 0.00824362190490125, -0.00344593580323504, -0.00633793663616606, 0.00830003254913539, 0.000786915406269229, -0.00951373028946889, 0.00607435291153134, 0.00586231880270265, -0.0108561912405393, 0.00155689003059543, 0.010683439505209, -0.00951863881710058, -0.00472400525167184, 0.0139281351611454, -0.00503524452415616, -0.0117112105845096, 0.0142523054377635, 0.00253417242967992, -0.0179015279929578, 0.0104738997867619, 0.012557089080073, -0.0214604827467684, 0.0016483829812268, 0.0238877485454262, -0.0202151232231396, -0.0131867414889317, 0.0350493078546195, -0.011085304138083, -0.0363053785584941, 0.0444657832529221, 0.0135742275019662, -0.0786788578605564, 0.0507537665856022, 0.104243301991032, -0.298192714580547, 0.386294794118178, -0.298192714580547, 0.104243301991032, 0.0507537665856022, -0.0786788578605564, 0.0135742275019662, 0.0444657832529221, -0.0363053785584941, -0.011085304138083, 0.0350493078546195, -0.0131867414889317, -0.0202151232231396, 0.0238877485454262, 0.0016483829812268, -0.0214604827467684, 0.012557089080073, 0.0104738997867619, -0.0179015279929578, 0.00253417242967992, 0.0142523054377635, -0.0117112105845096, -0.00503524452415616, 0.0139281351611454, -0.00472400525167184, -0.00951863881710058, 0.010683439505209, 0.00155689003059543, -0.0108561912405393, 0.00586231880270265, 0.00607435291153134, -0.00951373028946889, 0.000786915406269229, 0.00830003254913539, -0.00633793663616606, -0.00344593580323504, 0.00824362190490125, -0.00236396050840274, -0.00610661098307658, 0.00635259506797457, 0.00141525524318392, -0.00692248735052442, 0.0033737470717521, 0.00421369957683119, -0.00603811464816225, 0.000138810075085961, 0.00559621308923753, -0.00394205874480837, -0.00259469304210004, 0.00548989374888621, -0.00129141267079959, -0.00430844361064053, 0.00416082696351878, 0.00123699607506384, -0.00478455157587073, 0.00209915702806756, 0.00309502462758168, -0.00410158322802046, -0.000132388948295917, 0.0039824732733163, -0.00260180362771774, -0.00199495254480202, 0.00383219438988211, -0.000728981661669174, -0.00313904481417097, 0.00284176682059172, 0.0010353744410821, -0.00341054638355562, 0.00135609139599483, 0.00230895621753089, -0.00287039363905073, -0.000227150063513936, 0.00288527839985855, -0.00176377238556762, -0.00153436110493769, 0.00273291779079204, -0.00041910536799139, -0.00231127043296415, 0.0019872110784897, 0.000832586850928341, -0.00246238661250376, 0.000899306552458935, 0.00172713431458742, -0.00204563965759254, -0.000236903980622873, 0.00211240920674569, -0.00122994449104457, -0.00116506180405623, 0.00197453265358642, -0.00024939474141538, -0.00171160371404316, 0.00141729209844266, 0.000658690696530413, -0.00181093591388529, 0.000621699545740507, 0.00130388604011698, -0.00149838978622978, -0.000212090896682214, 0.00158485580091053, -0.000895719007906953, -0.000902221899540395, 0.0014893284923064, -0.000165154166298801, -0.00132536240379372, 0.00108583787498427, 0.00052726487321533, -0.00142750450737422, 0.000490048996071256, 0.00105189205381825, -0.00122686694569767, -0.000164527593494296, 0.00133254670351101, -0.000793478398678416, -0.000760050619392573, 0.0013534224577943, -0.000225865334618914, -0.00121275171857313, 0.00114419177941468, 0.000384306898181359, -0.00149258547648448, 0.000769486753975168, 0.00097035759463814, -0.00161943577476375, 0.000300202600881319, 0.0015235224792517, -0.00168229460231245, -0.000184589257330837, 0.00210928224012549, -0.00187633262568478, -0.000565958110675046, 0.00292873797615633, -0.00276393016349939, -0.000266470404267536, 0.00419042877366288, -0.00653997857395991, 0.0062860988321027, -0.00424368717671841, 0.00198563509090665, -0.000557946091879617, 2.39766783695612e-05]
-coefHPF31Hz=[0.000154716738633032, -0.000232884229118531, -0.000157065773906953, 0.00148620444622235, -0.00371076771467773, 0.00591070599153708, -0.00663620677233032, 0.00496810322780274, -0.00149740878912075, -0.00178300420954477, 0.00287273664514154, -0.00139594954611459, -0.00102571996637255, 0.00215641332333335, -0.00112282085626272, -0.000865561400118806, 0.00177985652302231, -0.000798369442277166, -0.000929108829319497, 0.00154770051320188, -0.000462591165024545, -0.00107302014368443, 0.00136212824739741, -0.000126331546279546, -0.00121351736431285, 0.00114480304576993, 0.00023418883485837, -0.001332444058833, 0.000883325275139399, 0.000597348007595323, -0.00139175636533067, 0.000561369999736948, 0.000944216541812631, -0.00136283105966876, 0.0001739441460465, 0.00125507827212891, -0.00123314069898034, -0.000258935836682972, 0.00149072725043685, -0.000981951277039145, -0.000722777268720522, 0.0016275590551458, -0.000615500764511779, -0.00117776765132377, 0.00163120687255265, -0.000141567090009617, -0.00158511270766187, 0.0014806894754903, 0.000413604316538367, -0.00189878687246295, 0.00116499582434934, 0.00100912804118942, -0.00207044869629338, 0.000684071659433831, 0.00159661408780911, -0.00206213644911576, 6.03005123420409e-05, 0.00211378594981069, -0.00184212749383164, -0.000669647306714632, 0.00249822170622318, -0.00139817957363043, -0.00144893979256847, 0.00268844754512865, -0.000738572243700134, -0.00220495897482948, 0.00263088073706952, 0.000106476899274452, -0.00285709226115394, 0.00229108024611533, 0.00107908655835105, -0.00331816118283478, 0.00165455881955953, 0.00210128407092656, -0.00350849314308454, 0.000737380486078239, 0.00307466152070286, -0.00336133659545648, -0.000413356556844083, 0.00388898143099303, -0.00283277492879381, -0.00171928795926441, 0.00443260589938563, -0.00191205524594917, -0.00307048275286139, 0.00459954590010643, -0.000623765186744593, -0.00433560552946089, 0.00430535514037517, 0.000964246073126982, -0.00536672702909859, 0.00349454901476828, 0.00274400904913277, -0.00601350540477491, 0.00215261495353467, 0.00456929611014384, -0.00613527110163389, 0.0003132316199269, 0.00626228318917149, -0.00561379386020279, -0.00193843534988938, 0.00762475873201446, -0.00436741529584428, -0.00446353908972995, 0.00844876311598896, -0.0023605345414453, -0.00707334252568987, 0.00852963538994139, 0.000388959294716555, -0.00953535737067776, 0.00767802148875052, 0.00380501753932602, -0.0115784938615557, 0.00572464291073306, 0.00775733638286167, -0.012900709238287, 0.00252158342402621, 0.0120646345566201, -0.0131625078137755, -0.00207873337494788, 0.0165082113451537, -0.0119639207652559, -0.00827347116318353, 0.0208446960817477, -0.00876108915368227, -0.0164445674945268, 0.0248242045536338, -0.00262250831765059, -0.0275354986773432, 0.0282088496779319, 0.00859710015133117, -0.044383885103237, 0.0307907983949698, 0.0320918452141352, -0.079001569138484, 0.0324082449494316, 0.118487961474044, -0.290615318263282, 0.366292642441633, -0.290615318263282, 0.118487961474044, 0.0324082449494316, -0.079001569138484, 0.0320918452141352, 0.0307907983949698, -0.044383885103237, 0.00859710015133117, 0.0282088496779319, -0.0275354986773432, -0.00262250831765059, 0.0248242045536338, -0.0164445674945268, -0.00876108915368227, 0.0208446960817477, -0.00827347116318353, -0.0119639207652559, 0.0165082113451537, -0.00207873337494788, -0.0131625078137755, 0.0120646345566201, 0.00252158342402621, -0.012900709238287, 0.00775733638286167, 0.00572464291073306, -0.0115784938615557, 0.00380501753932602, 0.00767802148875052, -0.00953535737067776, 0.000388959294716555, 0.00852963538994139, -0.00707334252568987, -0.0023605345414453, 0.00844876311598896, -0.00446353908972995, -0.00436741529584428, 0.00762475873201446, -0.00193843534988938, -0.00561379386020279, 0.00626228318917149, 0.0003132316199269, -0.00613527110163389, 0.00456929611014384, 0.00215261495353467, -0.00601350540477491, 0.00274400904913277, 0.00349454901476828, -0.00536672702909859, 0.000964246073126982, 0.00430535514037517, -0.00433560552946089, -0.000623765186744593, 0.00459954590010643, -0.00307048275286139, -0.00191205524594917, 0.00443260589938563, -0.00171928795926441, -0.00283277492879381, 0.00388898143099303, -0.000413356556844083, -0.00336133659545648, 0.00307466152070286, 0.000737380486078239, -0.00350849314308454, 0.00210128407092656, 0.00165455881955953, -0.00331816118283478, 0.00107908655835105, 0.00229108024611533, -0.00285709226115394, 0.000106476899274452, 0.00263088073706952, -0.00220495897482948, -0.000738572243700134, 0.00268844754512865, -0.00144893979256847, -0.00139817957363043, 0.00249822170622318, -0.000669647306714632, -0.00184212749383164, 0.00211378594981069, 6.03005123420409e-05, -0.00206213644911576, 0.00159661408780911, 0.000684071659433831, -0.00207044869629338, 0.00100912804118942, 0.00116499582434934, -0.00189878687246295, 0.000413604316538367, 0.0014806894754903, -0.00158511270766187, -0.000141567090009617, 0.00163120687255265, -0.00117776765132377, -0.000615500764511779, 0.0016275590551458, -0.000722777268720522, -0.000981951277039145, 0.00149072725043685, -0.000258935836682972, -0.00123314069898034, 0.00125507827212891, 0.0001739441460465, -0.00136283105966876, 0.000944216541812631, 0.000561369999736948, -0.00139175636533067, 0.000597348007595323, 0.000883325275139399, -0.001332444058833, 0.00023418883485837, 0.00114480304576993, -0.00121351736431285, -0.000126331546279546, 0.00136212824739741, -0.00107302014368443, -0.000462591165024545, 0.00154770051320188, -0.000929108829319497, -0.000798369442277166, 0.00177985652302231, -0.000865561400118806, -0.00112282085626272, 0.00215641332333335, -0.00102571996637255, -0.00139594954611459, 0.00287273664514154, -0.00178300420954477, -0.00149740878912075, 0.00496810322780274, -0.00663620677233032, 0.00591070599153708, -0.00371076771467773, 0.00148620444622235, -0.000157065773906953, -0.000232884229118531, 0.000154716738633032]
-coefHPF32Hz=[-0.000278017954814378, 0.000888125439400297, -0.00169502734928613, 0.00212629371606558, -0.00145256849834082, -0.000643832451477581, 0.00357374012358135, -0.00593849864215099, 0.00635623230379324, -0.00450440726234949, 0.00152289250084292, 0.000696865235593554, -0.000899187264734889, -0.000576027714175443, 0.00211555719590511, -0.00222401971926406, 0.000797749519148334, 0.000854161885831413, -0.00126695500928328, 0.000192603914396733, 0.0012019211724114, -0.00149491401804867, 0.000401323994282172, 0.000969043828922267, -0.00124254846357289, 0.000172983491790059, 0.00111138403901071, -0.00126591215236477, 0.000119223001439121, 0.0011389408640102, -0.00118672054640534, -4.11041303361109e-05, 0.00125965258233235, -0.00116637707185782, -0.0001733914516142, 0.00135844797539982, -0.00111130915975699, -0.000347192256196751, 0.00148399526231963, -0.00105795036875193, -0.000529928569510971, 0.00160547826620076, -0.000981349591234407, -0.000736243874790613, 0.00172792334069973, -0.000882825605247371, -0.000962662513289731, 0.00184532135696808, -0.000758711991590982, -0.00120630041515617, 0.00194981326720789, -0.000602431811041669, -0.00146741651659785, 0.00203650915364587, -0.000410103300167282, -0.00174442460595088, 0.00210032108717273, -0.000179160360201027, -0.00203390420682725, 0.00213495894349421, 9.27457169220708e-05, -0.00233084652287996, 0.00213163676219052, 0.000411588047775133, -0.00263624097241016, 0.00209134647473647, 0.000769432575379886, -0.00293393443273843, 0.00199603238076727, 0.00117839634875636, -0.00322884700616563, 0.00185012616337127, 0.0016271716262453, -0.00350307065926442, 0.00163734306466592, 0.00212241266978342, -0.00375410881162012, 0.00135469969540411, 0.00265971095381574, -0.00397153427681308, 0.000995088844929651, 0.00323552115180213, -0.00414400350431518, 0.000550130444023608, 0.00384737177701689, -0.00426143170892944, 1.32994691201869e-05, 0.00449078001909824, -0.00431283665038043, -0.00062034198467985, 0.00515676004440622, -0.00428070526442096, -0.00136289635846516, 0.00584319364708971, -0.00415405987516664, -0.00221953569669849, 0.00654011586104943, -0.00391404863769919, -0.00320098787399286, 0.00723848756204363, -0.00353768930674974, -0.0043251512132502, 0.00793667795112964, -0.00300906145165804, -0.00560008729824741, 0.00861604913150236, -0.00228739378995255, -0.00706079725298652, 0.00927841964620474, -0.00134269515371646, -0.0087340783712473, 0.00990794977814999, -0.000114174115759544, -0.0106774048478795, 0.0104973872751632, 0.00148090595968309, -0.0129799952249756, 0.0110435284048737, 0.00356476236030068, -0.0157781663668197, 0.0115293058339304, 0.00636614213303819, -0.0193408576370881, 0.0119583868587504, 0.0102801605575285, -0.0241624937353808, 0.0123153376791754, 0.0161643148935366, -0.0313703461571933, 0.0126002733264885, 0.0261421121760056, -0.044019122968454, 0.0128073860854152, 0.0474577193177868, -0.0743668413018109, 0.0129314271443503, 0.130854796784474, -0.281899507365515, 0.346308140033388, -0.281899507365515, 0.130854796784474, 0.0129314271443503, -0.0743668413018109, 0.0474577193177868, 0.0128073860854152, -0.044019122968454, 0.0261421121760056, 0.0126002733264885, -0.0313703461571933, 0.0161643148935366, 0.0123153376791754, -0.0241624937353808, 0.0102801605575285, 0.0119583868587504, -0.0193408576370881, 0.00636614213303819, 0.0115293058339304, -0.0157781663668197, 0.00356476236030068, 0.0110435284048737, -0.0129799952249756, 0.00148090595968309, 0.0104973872751632, -0.0106774048478795, -0.000114174115759544, 0.00990794977814999, -0.0087340783712473, -0.00134269515371646, 0.00927841964620474, -0.00706079725298652, -0.00228739378995255, 0.00861604913150236, -0.00560008729824741, -0.00300906145165804, 0.00793667795112964, -0.0043251512132502, -0.00353768930674974, 0.00723848756204363, -0.00320098787399286, -0.00391404863769919, 0.00654011586104943, -0.00221953569669849, -0.00415405987516664, 0.00584319364708971, -0.00136289635846516, -0.00428070526442096, 0.00515676004440622, -0.00062034198467985, -0.00431283665038043, 0.00449078001909824, 1.32994691201869e-05, -0.00426143170892944, 0.00384737177701689, 0.000550130444023608, -0.00414400350431518, 0.00323552115180213, 0.000995088844929651, -0.00397153427681308, 0.00265971095381574, 0.00135469969540411, -0.00375410881162012, 0.00212241266978342, 0.00163734306466592, -0.00350307065926442, 0.0016271716262453, 0.00185012616337127, -0.00322884700616563, 0.00117839634875636, 0.00199603238076727, -0.00293393443273843, 0.000769432575379886, 0.00209134647473647, -0.00263624097241016, 0.000411588047775133, 0.00213163676219052, -0.00233084652287996, 9.27457169220708e-05, 0.00213495894349421, -0.00203390420682725, -0.000179160360201027, 0.00210032108717273, -0.00174442460595088, -0.000410103300167282, 0.00203650915364587, -0.00146741651659785, -0.000602431811041669, 0.00194981326720789, -0.00120630041515617, -0.000758711991590982, 0.00184532135696808, -0.000962662513289731, -0.000882825605247371, 0.00172792334069973, -0.000736243874790613, -0.000981349591234407, 0.00160547826620076, -0.000529928569510971, -0.00105795036875193, 0.00148399526231963, -0.000347192256196751, -0.00111130915975699, 0.00135844797539982, -0.0001733914516142, -0.00116637707185782, 0.00125965258233235, -4.11041303361109e-05, -0.00118672054640534, 0.0011389408640102, 0.000119223001439121, -0.00126591215236477, 0.00111138403901071, 0.000172983491790059, -0.00124254846357289, 0.000969043828922267, 0.000401323994282172, -0.00149491401804867, 0.0012019211724114, 0.000192603914396733, -0.00126695500928328, 0.000854161885831413, 0.000797749519148334, -0.00222401971926406, 0.00211555719590511, -0.000576027714175443, -0.000899187264734889, 0.000696865235593554, 0.00152289250084292, -0.00450440726234949, 0.00635623230379324, -0.00593849864215099, 0.00357374012358135, -0.000643832451477581, -0.00145256849834082, 0.00212629371606558, -0.00169502734928613, 0.000888125439400297, -0.000278017954814378]
-coefHPF33Hz=[0.000145084818300141, -0.00076977607116323, 0.00195601376885067, -0.00362572561043895, 0.00514877843322218, -0.00569271285268704, 0.00464962967143317, -0.00218352250862306, -0.000678228738186974, 0.00254199138473777, -0.00252174112162043, 0.000874586220606816, 0.00111873743870025, -0.00202921625850986, 0.00130217053273562, 0.000357660036019488, -0.00156931081413672, 0.0013886436400794, -5.71300422996898e-05, -0.00123534128543886, 0.00138049784815223, -0.000300026737172009, -0.00100712660738516, 0.00136328460073076, -0.000465620881818852, -0.000846705725515729, 0.00135986163537072, -0.000599554039093425, -0.000725916434282401, 0.00137416380976104, -0.000725523855185913, -0.000623374667240174, 0.00140019226922459, -0.000850191274577593, -0.000531272800533825, 0.00143803152651769, -0.000981695230987005, -0.000440435488580106, 0.00148437165664664, -0.00112364191987737, -0.000345361858515112, 0.00153855074041621, -0.00128320285183239, -0.000233461816065513, 0.00158790748919106, -0.00145198124586997, -0.000108529560710819, 0.00163452444038629, -0.0016332743498349, 3.45626022374615e-05, 0.00167330754062192, -0.00182398126515765, 0.000194510479906617, 0.00170617503848486, -0.00202945402825849, 0.00038068880593641, 0.00172192451101307, -0.00223973660637107, 0.000585968091569091, 0.00172572545204906, -0.00245976542992852, 0.000815460804027184, 0.00171404708007194, -0.00269002432602396, 0.0010740723962251, 0.00168009744962546, -0.00292579021833239, 0.00136154386875272, 0.00162029678928407, -0.0031618358378619, 0.0016721917023137, 0.00154218024830626, -0.0034100386955275, 0.0020228474684193, 0.0014266323294352, -0.00365341620458008, 0.00240132103324762, 0.00128193417704293, -0.00389909887096797, 0.0028146765111594, 0.00110348268872353, -0.00414879365524666, 0.00327217425242979, 0.000877750145819486, -0.00438999313217677, 0.00376486913007293, 0.00061281415987674, -0.0046348988753852, 0.00431072337843949, 0.00028934528654905, -0.00486969166438037, 0.00490392363911041, -8.99239984059847e-05, -0.00510195901767924, 0.00555956699655134, -0.000541206973449822, -0.0053242556609797, 0.00628197488318954, -0.00107207605050952, -0.005538555578561, 0.0070864103000995, -0.00169995382726721, -0.0057417494757102, 0.00798839598422709, -0.00244340834404654, -0.00593487059264793, 0.00901457318405329, -0.00333321251848643, -0.00611463273726542, 0.0101977388160932, -0.00440797468614791, -0.00628204236997236, 0.011591458031098, -0.00572968092724071, -0.00643468883239154, 0.0132738265103347, -0.00739070072094914, -0.00657236446019334, 0.015373051263827, -0.0095441552346481, -0.0066931718434597, 0.0181065688951746, -0.012456264774614, -0.00679584728124054, 0.0218795790128415, -0.0166379008581177, -0.00688252409507073, 0.0275472060499853, -0.0232228958217755, -0.00694691135601135, 0.0372335933678291, -0.0352702104276904, -0.00699586153203361, 0.0581938069092562, -0.065053485010457, -0.00702385885354435, 0.141169531227294, -0.272059884850588, 0.326300362506734, -0.272059884850588, 0.141169531227294, -0.00702385885354435, -0.065053485010457, 0.0581938069092562, -0.00699586153203361, -0.0352702104276904, 0.0372335933678291, -0.00694691135601135, -0.0232228958217755, 0.0275472060499853, -0.00688252409507073, -0.0166379008581177, 0.0218795790128415, -0.00679584728124054, -0.012456264774614, 0.0181065688951746, -0.0066931718434597, -0.0095441552346481, 0.015373051263827, -0.00657236446019334, -0.00739070072094914, 0.0132738265103347, -0.00643468883239154, -0.00572968092724071, 0.011591458031098, -0.00628204236997236, -0.00440797468614791, 0.0101977388160932, -0.00611463273726542, -0.00333321251848643, 0.00901457318405329, -0.00593487059264793, -0.00244340834404654, 0.00798839598422709, -0.0057417494757102, -0.00169995382726721, 0.0070864103000995, -0.005538555578561, -0.00107207605050952, 0.00628197488318954, -0.0053242556609797, -0.000541206973449822, 0.00555956699655134, -0.00510195901767924, -8.99239984059847e-05, 0.00490392363911041, -0.00486969166438037, 0.00028934528654905, 0.00431072337843949, -0.0046348988753852, 0.00061281415987674, 0.00376486913007293, -0.00438999313217677, 0.000877750145819486, 0.00327217425242979, -0.00414879365524666, 0.00110348268872353, 0.0028146765111594, -0.00389909887096797, 0.00128193417704293, 0.00240132103324762, -0.00365341620458008, 0.0014266323294352, 0.0020228474684193, -0.0034100386955275, 0.00154218024830626, 0.0016721917023137, -0.0031618358378619, 0.00162029678928407, 0.00136154386875272, -0.00292579021833239, 0.00168009744962546, 0.0010740723962251, -0.00269002432602396, 0.00171404708007194, 0.000815460804027184, -0.00245976542992852, 0.00172572545204906, 0.000585968091569091, -0.00223973660637107, 0.00172192451101307, 0.00038068880593641, -0.00202945402825849, 0.00170617503848486, 0.000194510479906617, -0.00182398126515765, 0.00167330754062192, 3.45626022374615e-05, -0.0016332743498349, 0.00163452444038629, -0.000108529560710819, -0.00145198124586997, 0.00158790748919106, -0.000233461816065513, -0.00128320285183239, 0.00153855074041621, -0.000345361858515112, -0.00112364191987737, 0.00148437165664664, -0.000440435488580106, -0.000981695230987005, 0.00143803152651769, -0.000531272800533825, -0.000850191274577593, 0.00140019226922459, -0.000623374667240174, -0.000725523855185913, 0.00137416380976104, -0.000725916434282401, -0.000599554039093425, 0.00135986163537072, -0.000846705725515729, -0.000465620881818852, 0.00136328460073076, -0.00100712660738516, -0.000300026737172009, 0.00138049784815223, -0.00123534128543886, -5.71300422996898e-05, 0.0013886436400794, -0.00156931081413672, 0.000357660036019488, 0.00130217053273562, -0.00202921625850986, 0.00111873743870025, 0.000874586220606816, -0.00252174112162043, 0.00254199138473777, -0.000678228738186974, -0.00218352250862306, 0.00464962967143317, -0.00569271285268704, 0.00514877843322218, -0.00362572561043895, 0.00195601376885067, -0.00076977607116323, 0.000145084818300141]
-coefHPF34Hz=[4.42201655948325e-05, 0.000124448243725265, -0.000659130136991297, 0.0017336375530247, -0.00324678000379065, 0.00474197661613778, -0.005523376215091, 0.00500352187153467, -0.0031110081839508, 0.000479449479719521, 0.00178004836093976, -0.00266346649348659, 0.00188248116898516, -8.34602353250367e-05, -0.00152265416675844, 0.00192280168252147, -0.0009578893823762, -0.000592683596259373, 0.00158057194544933, -0.00131929633788307, 7.37111847477308e-05, 0.00116048726384643, -0.00142823949513614, 0.000550988247449747, 0.00074351934106392, -0.00140588729123197, 0.000906740921164235, 0.00033545374032321, -0.00129265867516034, 0.0011679353478324, -5.76137851153877e-05, -0.00111613590535564, 0.00136277251200243, -0.000455234294998008, -0.00086022250970063, 0.00147128348768926, -0.000835377627232137, -0.000539723354583086, 0.00149570999341927, -0.00119442457381381, -0.000150186039020665, 0.00141608707803615, -0.00150481826031306, 0.000291148546244196, 0.0012276265706404, -0.00174653767661848, 0.000770362927249999, 0.00092035243241046, -0.00188840912963104, 0.00125801999811617, 0.000497468622436613, -0.00190302361992444, 0.00171744327475278, -2.53791240818269e-05, -0.00177156764439859, 0.00211146280749401, -0.000625822142957309, -0.00147956462829987, 0.00239774748308008, -0.00126732847433037, -0.00102774469212669, 0.00254145799149878, -0.00191132192962305, -0.000421421761162091, 0.00250484487551089, -0.00250464931702046, 0.000313794383711266, 0.00226455060992568, -0.00299493786222444, 0.00114254679216732, 0.001805707669682, -0.00332625192855796, 0.00201324470249107, 0.0011319615896692, -0.00345068867487852, 0.00286761706976597, 0.000260327264189673, -0.00332696054638279, 0.0036401811142075, -0.000776921924488921, -0.00292327567520021, 0.00425951259388343, -0.00192962279139885, -0.00222336998705522, 0.00465444236051835, -0.00313269958121707, -0.00122720616514127, 0.00475524455570103, -0.00430351921350156, 4.06205561337028e-05, 0.00450557309294293, -0.00535261318179752, 0.0015368867613812, 0.00386077046513151, -0.00618256623763265, 0.00319553660393392, 0.00279563796383639, -0.00669651233201597, 0.00493350408838829, 0.00130216927945769, -0.00679716936057732, 0.00664800135788373, -0.000605101817006686, -0.00639269107712287, 0.00821973553506884, -0.00288843444112639, -0.00539969661427272, 0.00951566720446626, -0.00548796774754042, -0.00374341921295437, 0.0103895484852109, -0.00832253726870263, -0.00135686871565794, 0.0106833040956089, -0.0112968362816166, 0.00183240373076496, 0.0102148884238633, -0.0143017779360788, 0.00591881006379854, 0.00876056201977091, -0.0172228235641694, 0.0110653869204395, 0.00600023440984619, -0.0199417739815127, 0.017599279956453, 0.00139247529056413, -0.022345798150001, 0.0262740663419555, -0.00619453329393153, -0.0243324627808838, 0.0391079488219177, -0.0198022487928991, -0.0258159886052013, 0.0632278061543874, -0.0516467442598777, -0.0267328135184596, 0.14925731915931, -0.261144807327605, 0.306290742780714, -0.261144807327605, 0.14925731915931, -0.0267328135184596, -0.0516467442598777, 0.0632278061543874, -0.0258159886052013, -0.0198022487928991, 0.0391079488219177, -0.0243324627808838, -0.00619453329393153, 0.0262740663419555, -0.022345798150001, 0.00139247529056413, 0.017599279956453, -0.0199417739815127, 0.00600023440984619, 0.0110653869204395, -0.0172228235641694, 0.00876056201977091, 0.00591881006379854, -0.0143017779360788, 0.0102148884238633, 0.00183240373076496, -0.0112968362816166, 0.0106833040956089, -0.00135686871565794, -0.00832253726870263, 0.0103895484852109, -0.00374341921295437, -0.00548796774754042, 0.00951566720446626, -0.00539969661427272, -0.00288843444112639, 0.00821973553506884, -0.00639269107712287, -0.000605101817006686, 0.00664800135788373, -0.00679716936057732, 0.00130216927945769, 0.00493350408838829, -0.00669651233201597, 0.00279563796383639, 0.00319553660393392, -0.00618256623763265, 0.00386077046513151, 0.0015368867613812, -0.00535261318179752, 0.00450557309294293, 4.06205561337028e-05, -0.00430351921350156, 0.00475524455570103, -0.00122720616514127, -0.00313269958121707, 0.00465444236051835, -0.00222336998705522, -0.00192962279139885, 0.00425951259388343, -0.00292327567520021, -0.000776921924488921, 0.0036401811142075, -0.00332696054638279, 0.000260327264189673, 0.00286761706976597, -0.00345068867487852, 0.0011319615896692, 0.00201324470249107, -0.00332625192855796, 0.001805707669682, 0.00114254679216732, -0.00299493786222444, 0.00226455060992568, 0.000313794383711266, -0.00250464931702046, 0.00250484487551089, -0.000421421761162091, -0.00191132192962305, 0.00254145799149878, -0.00102774469212669, -0.00126732847433037, 0.00239774748308008, -0.00147956462829987, -0.000625822142957309, 0.00211146280749401, -0.00177156764439859, -2.53791240818269e-05, 0.00171744327475278, -0.00190302361992444, 0.000497468622436613, 0.00125801999811617, -0.00188840912963104, 0.00092035243241046, 0.000770362927249999, -0.00174653767661848, 0.0012276265706404, 0.000291148546244196, -0.00150481826031306, 0.00141608707803615, -0.000150186039020665, -0.00119442457381381, 0.00149570999341927, -0.000539723354583086, -0.000835377627232137, 0.00147128348768926, -0.00086022250970063, -0.000455234294998008, 0.00136277251200243, -0.00111613590535564, -5.76137851153877e-05, 0.0011679353478324, -0.00129265867516034, 0.00033545374032321, 0.000906740921164235, -0.00140588729123197, 0.00074351934106392, 0.000550988247449747, -0.00142823949513614, 0.00116048726384643, 7.37111847477308e-05, -0.00131929633788307, 0.00158057194544933, -0.000592683596259373, -0.0009578893823762, 0.00192280168252147, -0.00152265416675844, -8.34602353250367e-05, 0.00188248116898516, -0.00266346649348659, 0.00178004836093976, 0.000479449479719521, -0.0031110081839508, 0.00500352187153467, -0.005523376215091, 0.00474197661613778, -0.00324678000379065, 0.0017336375530247, -0.000659130136991297, 0.000124448243725265, 4.42201655948325e-05]
-coefHPF35Hz=[-0.000140339338560551, 0.000293084124547189, -0.000370189902412341, 0.000134448665441038, 0.000630283511253592, -0.0019643748212482, 0.00360317047872231, -0.00499172005214247, 0.00549182991922109, -0.00471047751523718, 0.00277572889424989, -0.00037153061245426, -0.00154160067085418, 0.00220645845176698, -0.00148693177104572, -3.7801322432009e-05, 0.00139133397354998, -0.00176544765078032, 0.000995388994276139, 0.000357444042324399, -0.00138068575983411, 0.00141137212699096, -0.000470375569747707, -0.000761982642657602, 0.00141857344799969, -0.00104768660164539, -7.1719334731328e-05, 0.00112765756533953, -0.00135398020654779, 0.000583547734818908, 0.000623547211551662, -0.00137907131939377, 0.00111446533750699, -8.17414885725732e-06, -0.00112921678308, 0.00144315959526949, -0.000673868953704737, -0.000630036971386273, 0.00149806402024714, -0.00125607436214773, 4.74686141099672e-05, 0.00124425057162641, -0.00163732759738445, 0.000794807784533529, 0.000691527643825373, -0.00171253807511121, 0.00146603237117782, -8.38391511503626e-05, -0.00142635373446076, 0.001912039895646, -0.000952333758235073, -0.000784465244382738, 0.00200134607142473, -0.00173788201003244, 0.000124383919105805, 0.00166453238193256, -0.00226120831077937, 0.00114713612015031, 0.000905589058372293, -0.00236351154117057, 0.00207384679721243, -0.000171488340775476, -0.00195937635474156, 0.00268800516012287, -0.00138127575443155, -0.00105698992558996, 0.00280374201611832, -0.00247525689467623, 0.00021742542048139, 0.00232718831022217, -0.00320888538262033, 0.00165973332513357, 0.00125149367028411, -0.00334788676832816, 0.00296716154253483, -0.000272998439600107, -0.00277434861433367, 0.00383704117140992, -0.00198645507399757, -0.00150300029867012, 0.0040201284219712, -0.00356374903726831, 0.000324015182147497, 0.00334433473772529, -0.00462453567618793, 0.00239214343826134, 0.00181999667323851, -0.00485915240137662, 0.00430254775523679, -0.000375719037073137, -0.00406993268535659, 0.00561466036308522, -0.00288810371913648, -0.00224695611683536, 0.00594627512778031, -0.00524698163757027, 0.000420789232264843, 0.00503688928923314, -0.00691925454859161, 0.00353063090682193, 0.00283427575223253, -0.00741317826198999, 0.00651528741302244, -0.000464501645253508, -0.00637681184548597, 0.00872114361018529, -0.00440776282230544, -0.00368594095887402, 0.00951234922895009, -0.00832871266083922, 0.000499835885930571, 0.00837778276880215, -0.011417456566197, 0.00571599106067265, 0.0050282962618937, -0.0128156304934201, 0.0112091717649981, -0.000530065456995553, -0.0117175452950013, 0.0159868573294004, -0.00796381679908552, -0.00744702444004475, 0.0188791860583755, -0.0166373066372735, 0.000553437156233306, 0.0185385255527147, -0.0256871520811647, 0.0129384590565407, 0.0131937115944565, -0.0341310890137305, 0.031300165303337, -0.000566460165431278, -0.0410028128428575, 0.0620663588393842, -0.0349949117780615, -0.0454895016119239, 0.154985941485323, -0.249197233210341, 0.286281231123277, -0.249197233210341, 0.154985941485323, -0.0454895016119239, -0.0349949117780615, 0.0620663588393842, -0.0410028128428575, -0.000566460165431278, 0.031300165303337, -0.0341310890137305, 0.0131937115944565, 0.0129384590565407, -0.0256871520811647, 0.0185385255527147, 0.000553437156233306, -0.0166373066372735, 0.0188791860583755, -0.00744702444004475, -0.00796381679908552, 0.0159868573294004, -0.0117175452950013, -0.000530065456995553, 0.0112091717649981, -0.0128156304934201, 0.0050282962618937, 0.00571599106067265, -0.011417456566197, 0.00837778276880215, 0.000499835885930571, -0.00832871266083922, 0.00951234922895009, -0.00368594095887402, -0.00440776282230544, 0.00872114361018529, -0.00637681184548597, -0.000464501645253508, 0.00651528741302244, -0.00741317826198999, 0.00283427575223253, 0.00353063090682193, -0.00691925454859161, 0.00503688928923314, 0.000420789232264843, -0.00524698163757027, 0.00594627512778031, -0.00224695611683536, -0.00288810371913648, 0.00561466036308522, -0.00406993268535659, -0.000375719037073137, 0.00430254775523679, -0.00485915240137662, 0.00181999667323851, 0.00239214343826134, -0.00462453567618793, 0.00334433473772529, 0.000324015182147497, -0.00356374903726831, 0.0040201284219712, -0.00150300029867012, -0.00198645507399757, 0.00383704117140992, -0.00277434861433367, -0.000272998439600107, 0.00296716154253483, -0.00334788676832816, 0.00125149367028411, 0.00165973332513357, -0.00320888538262033, 0.00232718831022217, 0.00021742542048139, -0.00247525689467623, 0.00280374201611832, -0.00105698992558996, -0.00138127575443155, 0.00268800516012287, -0.00195937635474156, -0.000171488340775476, 0.00207384679721243, -0.00236351154117057, 0.000905589058372293, 0.00114713612015031, -0.00226120831077937, 0.00166453238193256, 0.000124383919105805, -0.00173788201003244, 0.00200134607142473, -0.000784465244382738, -0.000952333758235073, 0.001912039895646, -0.00142635373446076, -8.38391511503626e-05, 0.00146603237117782, -0.00171253807511121, 0.000691527643825373, 0.000794807784533529, -0.00163732759738445, 0.00124425057162641, 4.74686141099672e-05, -0.00125607436214773, 0.00149806402024714, -0.000630036971386273, -0.000673868953704737, 0.00144315959526949, -0.00112921678308, -8.17414885725732e-06, 0.00111446533750699, -0.00137907131939377, 0.000623547211551662, 0.000583547734818908, -0.00135398020654779, 0.00112765756533953, -7.1719334731328e-05, -0.00104768660164539, 0.00141857344799969, -0.000761982642657602, -0.000470375569747707, 0.00141137212699096, -0.00138068575983411, 0.000357444042324399, 0.000995388994276139, -0.00176544765078032, 0.00139133397354998, -3.7801322432009e-05, -0.00148693177104572, 0.00220645845176698, -0.00154160067085418, -0.00037153061245426, 0.00277572889424989, -0.00471047751523718, 0.00549182991922109, -0.00499172005214247, 0.00360317047872231, -0.0019643748212482, 0.000630283511253592, 0.000134448665441038, -0.000370189902412341, 0.000293084124547189, -0.000140339338560551]
-coefHPF36Hz=[0.000197598794298865, -0.000591127164059554, 0.00123970827733524, -0.00202518337427546, 0.0026836993095112, -0.002866226546701, 0.00228512728219258, -0.000883159412179736, -0.00106551994637225, 0.00299963640770482, -0.00427335142984682, 0.0044414610408489, -0.00348948229176831, 0.00187680869419884, -0.000344822659793731, -0.000433021616787675, 0.000185105934840925, 0.000822414834070063, -0.00193358144182894, 0.00246536282732627, -0.00208874818924354, 0.00101138544559552, 0.000148802817287294, -0.000731805443166244, 0.000431485395634891, 0.000518600590766325, -0.00148682360486958, 0.00183244067242181, -0.00130627631045067, 0.000212747882551391, 0.000774948241688482, -0.0010384786187403, 0.00041330487590714, 0.000693719268264411, -0.00155288034343331, 0.00157756580540905, -0.00071225083321281, -0.000513477533269121, 0.00131279725849625, -0.00115110845996231, 0.000109121709047996, 0.00114595755286738, -0.00177875439470554, 0.00133347820114443, -5.34721599528968e-05, -0.00125001506391356, 0.00171313735479065, -0.000993517228735463, -0.000476838905460495, 0.0017438929224443, -0.00194497492757431, 0.000890639104730249, 0.000775861790453408, -0.00196904786187732, 0.00186737055549472, -0.00047752959774786, -0.00132863782670374, 0.00235610186158648, -0.00187302040813832, 0.000125938126603239, 0.00177616884871411, -0.00256345458775056, 0.00165090863239789, 0.000432976857633543, -0.00234444737749825, 0.00278670936091381, -0.00138526713270925, -0.00101210467799057, 0.00284274602569802, -0.002844453916536, 0.000921586567197245, 0.00172934526040076, -0.00335821632129985, 0.0028119381994057, -0.000343574684102216, -0.00248364947697306, 0.00378099689144029, -0.00259108009043005, -0.000416097921310176, 0.00330758205960651, -0.00412384430822568, 0.00220026854871064, 0.0013133105611868, -0.00412952627377638, 0.00430579178351232, -0.00157593797319169, -0.00237621978326433, 0.00494528564825607, -0.0043134552143862, 0.000724665867763319, 0.00356177022622871, -0.0056826584983666, 0.00407297206049524, 0.000398172806245583, -0.00487055270813449, 0.00630951257112331, -0.003550855807713, -0.00179477959232552, 0.00625984701139415, -0.0067528728129657, 0.00267910107567644, 0.00349299476833083, -0.00770350747701303, 0.00694959528139354, -0.00139709015326879, -0.00551053571037726, 0.00915837980586141, -0.00681203123957425, -0.000382962474870641, 0.00788520783116615, -0.0105838299149119, 0.00623318338662713, 0.0027819757624239, -0.0106807617941603, 0.0119326923886322, -0.0050534247400183, -0.00600622309694956, 0.0140355174800258, -0.0131652092127738, 0.00301932978365713, 0.0104320478796094, -0.0182378603434344, 0.0142376536758929, 0.000372079119499079, -0.0168845188350107, 0.0239884894608007, -0.0151148371015349, -0.00632114558605448, 0.0275342071614786, -0.0333081640275561, 0.0157652862312599, 0.0187602990992745, -0.050425449369659, 0.0548402400216701, -0.0161647033273714, -0.0626189011883591, 0.158271659900107, -0.236286289537739, 0.266299877968876, -0.236286289537739, 0.158271659900107, -0.0626189011883591, -0.0161647033273714, 0.0548402400216701, -0.050425449369659, 0.0187602990992745, 0.0157652862312599, -0.0333081640275561, 0.0275342071614786, -0.00632114558605448, -0.0151148371015349, 0.0239884894608007, -0.0168845188350107, 0.000372079119499079, 0.0142376536758929, -0.0182378603434344, 0.0104320478796094, 0.00301932978365713, -0.0131652092127738, 0.0140355174800258, -0.00600622309694956, -0.0050534247400183, 0.0119326923886322, -0.0106807617941603, 0.0027819757624239, 0.00623318338662713, -0.0105838299149119, 0.00788520783116615, -0.000382962474870641, -0.00681203123957425, 0.00915837980586141, -0.00551053571037726, -0.00139709015326879, 0.00694959528139354, -0.00770350747701303, 0.00349299476833083, 0.00267910107567644, -0.0067528728129657, 0.00625984701139415, -0.00179477959232552, -0.003550855807713, 0.00630951257112331, -0.00487055270813449, 0.000398172806245583, 0.00407297206049524, -0.0056826584983666, 0.00356177022622871, 0.000724665867763319, -0.0043134552143862, 0.00494528564825607, -0.00237621978326433, -0.00157593797319169, 0.00430579178351232, -0.00412952627377638, 0.0013133105611868, 0.00220026854871064, -0.00412384430822568, 0.00330758205960651, -0.000416097921310176, -0.00259108009043005, 0.00378099689144029, -0.00248364947697306, -0.000343574684102216, 0.0028119381994057, -0.00335821632129985, 0.00172934526040076, 0.000921586567197245, -0.002844453916536, 0.00284274602569802, -0.00101210467799057, -0.00138526713270925, 0.00278670936091381, -0.00234444737749825, 0.000432976857633543, 0.00165090863239789, -0.00256345458775056, 0.00177616884871411, 0.000125938126603239, -0.00187302040813832, 0.00235610186158648, -0.00132863782670374, -0.00047752959774786, 0.00186737055549472, -0.00196904786187732, 0.000775861790453408, 0.000890639104730249, -0.00194497492757431, 0.0017438929224443, -0.000476838905460495, -0.000993517228735463, 0.00171313735479065, -0.00125001506391356, -5.34721599528968e-05, 0.00133347820114443, -0.00177875439470554, 0.00114595755286738, 0.000109121709047996, -0.00115110845996231, 0.00131279725849625, -0.000513477533269121, -0.00071225083321281, 0.00157756580540905, -0.00155288034343331, 0.000693719268264411, 0.00041330487590714, -0.0010384786187403, 0.000774948241688482, 0.000212747882551391, -0.00130627631045067, 0.00183244067242181, -0.00148682360486958, 0.000518600590766325, 0.000431485395634891, -0.000731805443166244, 0.000148802817287294, 0.00101138544559552, -0.00208874818924354, 0.00246536282732627, -0.00193358144182894, 0.000822414834070063, 0.000185105934840925, -0.000433021616787675, -0.000344822659793731, 0.00187680869419884, -0.00348948229176831, 0.0044414610408489, -0.00427335142984682, 0.00299963640770482, -0.00106551994637225, -0.000883159412179736, 0.00228512728219258, -0.002866226546701, 0.0026836993095112, -0.00202518337427546, 0.00123970827733524, -0.000591127164059554, 0.000197598794298865]
-coefHPF37Hz=[-1.63724710165888e-05, 0.000242535833062085, -0.000671990717356765, 0.00140384548340327, -0.00237941583896562, 0.00342051368488642, -0.00423832203278804, 0.0045179833191402, -0.00404321750634696, 0.00281302093174171, -0.00109166756448608, -0.00064761298756817, 0.00188077755418448, -0.00223746107073912, 0.00166420471400977, -0.000465411715075349, -0.000810694205292197, 0.00160246474486273, -0.00158233098581872, 0.000805055623428649, 0.000319718087161503, -0.00122540969477966, 0.0014662011913249, -0.00093863502087112, -6.65824763387795e-05, 0.00101366385095741, -0.00139997469222712, 0.00102130365073933, -8.35377594987519e-05, -0.000902971613432979, 0.00139545997549025, -0.00111472857485319, 0.000204350478319282, 0.000838793256403057, -0.00143164143012324, 0.00122819486052662, -0.000320903231140324, -0.0007970670702109, 0.00149669751798209, -0.00136449526318759, 0.000445473350379762, 0.00076447432573333, -0.00158334230149408, 0.00152496279027082, -0.000585654462644456, -0.00073246432436548, 0.00168726272370263, -0.00171203433862949, 0.000749623303280395, 0.00069071885694881, -0.00180010706510384, 0.00192191988894581, -0.000938303209993865, -0.000635736155298771, 0.0019185920940772, -0.0021536837547368, 0.00115313967178435, 0.000565005204221956, -0.00204122940405151, 0.00240784828215083, -0.00139634967788586, -0.000476505217836475, 0.00216813571851285, -0.00268775696321474, 0.00167373546188064, 0.000364131924727822, -0.00229540414060567, 0.00299301788014695, -0.00198784492029535, -0.000224547352343816, 0.00242134049193222, -0.00332481844424412, 0.00234200370316686, 5.45813122628078e-05, -0.00254528454567222, 0.00368581310416823, -0.00274062907900442, 0.000148727681641865, 0.00266878316968033, -0.00408286014842927, 0.0031935554367387, -0.000393625545381521, -0.00278948760644919, 0.00452094542141539, -0.00371042893089279, 0.000688801267832957, 0.0029051482329103, -0.00500626799428326, 0.00430281340426705, -0.00104436929510554, -0.00301375506778303, 0.00554704331409755, -0.0049846705982798, 0.00147081205675569, 0.00311701111797676, -0.00615951210405574, 0.00577998675087412, -0.001986539303414, -0.00321466407199376, 0.00686516275189194, -0.00672245587062876, 0.00261818096694572, 0.00330583128858371, -0.00769485673347301, 0.0078615147595881, -0.00340572334850015, -0.00338790691017165, 0.00869312044261454, -0.00926960366178621, 0.0044070120476964, 0.00346146149301213, -0.00993526619577583, 0.0110673155477881, -0.00571912499308821, -0.00352660751554803, 0.0115492750649855, -0.0134636751586423, 0.00751366455183825, 0.00358370155077589, -0.0137719518911601, 0.0168553915380593, -0.0101262381178109, -0.00363049387337968, 0.0170892690160114, -0.022088575110239, 0.0143009147896268, 0.00366669178623132, -0.0226988041077135, 0.0313667283618966, -0.0221062753207305, -0.00369198253399949, 0.0345377839767938, -0.0527721304626083, 0.0422314362238919, 0.00370759146407647, -0.0775507086384136, 0.159061702863957, -0.222421090364874, 0.246287342654388, -0.222421090364874, 0.159061702863957, -0.0775507086384136, 0.00370759146407647, 0.0422314362238919, -0.0527721304626083, 0.0345377839767938, -0.00369198253399949, -0.0221062753207305, 0.0313667283618966, -0.0226988041077135, 0.00366669178623132, 0.0143009147896268, -0.022088575110239, 0.0170892690160114, -0.00363049387337968, -0.0101262381178109, 0.0168553915380593, -0.0137719518911601, 0.00358370155077589, 0.00751366455183825, -0.0134636751586423, 0.0115492750649855, -0.00352660751554803, -0.00571912499308821, 0.0110673155477881, -0.00993526619577583, 0.00346146149301213, 0.0044070120476964, -0.00926960366178621, 0.00869312044261454, -0.00338790691017165, -0.00340572334850015, 0.0078615147595881, -0.00769485673347301, 0.00330583128858371, 0.00261818096694572, -0.00672245587062876, 0.00686516275189194, -0.00321466407199376, -0.001986539303414, 0.00577998675087412, -0.00615951210405574, 0.00311701111797676, 0.00147081205675569, -0.0049846705982798, 0.00554704331409755, -0.00301375506778303, -0.00104436929510554, 0.00430281340426705, -0.00500626799428326, 0.0029051482329103, 0.000688801267832957, -0.00371042893089279, 0.00452094542141539, -0.00278948760644919, -0.000393625545381521, 0.0031935554367387, -0.00408286014842927, 0.00266878316968033, 0.000148727681641865, -0.00274062907900442, 0.00368581310416823, -0.00254528454567222, 5.45813122628078e-05, 0.00234200370316686, -0.00332481844424412, 0.00242134049193222, -0.000224547352343816, -0.00198784492029535, 0.00299301788014695, -0.00229540414060567, 0.000364131924727822, 0.00167373546188064, -0.00268775696321474, 0.00216813571851285, -0.000476505217836475, -0.00139634967788586, 0.00240784828215083, -0.00204122940405151, 0.000565005204221956, 0.00115313967178435, -0.0021536837547368, 0.0019185920940772, -0.000635736155298771, -0.000938303209993865, 0.00192191988894581, -0.00180010706510384, 0.00069071885694881, 0.000749623303280395, -0.00171203433862949, 0.00168726272370263, -0.00073246432436548, -0.000585654462644456, 0.00152496279027082, -0.00158334230149408, 0.00076447432573333, 0.000445473350379762, -0.00136449526318759, 0.00149669751798209, -0.0007970670702109, -0.000320903231140324, 0.00122819486052662, -0.00143164143012324, 0.000838793256403057, 0.000204350478319282, -0.00111472857485319, 0.00139545997549025, -0.000902971613432979, -8.35377594987519e-05, 0.00102130365073933, -0.00139997469222712, 0.00101366385095741, -6.65824763387795e-05, -0.00093863502087112, 0.0014662011913249, -0.00122540969477966, 0.000319718087161503, 0.000805055623428649, -0.00158233098581872, 0.00160246474486273, -0.000810694205292197, -0.000465411715075349, 0.00166420471400977, -0.00223746107073912, 0.00188077755418448, -0.00064761298756817, -0.00109166756448608, 0.00281302093174171, -0.00404321750634696, 0.0045179833191402, -0.00423832203278804, 0.00342051368488642, -0.00237941583896562, 0.00140384548340327, -0.000671990717356765, 0.000242535833062085, -1.63724710165888e-05]
-coefHPF38Hz=[-7.84545991310274e-05, 8.08088706181859e-05, -1.11568853136268e-05, -0.000232131419249523, 0.000721063861199685, -0.00147399966114648, 0.00241981666909351, -0.00338679453160254, 0.00413007258529378, -0.00439816778696371, 0.00402165524717706, -0.00299254392399743, 0.00149939896513919, 0.000105065274356561, -0.00140342747251517, 0.0020512919961809, -0.00190353607494891, 0.00107756247683892, 7.8110199387838e-05, -0.0011065352555875, 0.001613531606521, -0.00142070045084992, 0.00063684793617094, 0.00038697148340583, -0.00120381337268519, 0.00146117964506179, -0.00105385402168913, 0.000171812034708345, 0.000781639869298272, -0.00136885213820395, 0.00131628890347522, -0.000642786248391086, -0.000343333647806388, 0.00118136820018993, -0.00147038944120175, 0.00105979798079091, -0.000127996734948625, -0.000892174453899829, 0.00151174263988648, -0.00141796083084647, 0.000631146329089061, 0.000492423415745171, -0.00141942978917547, 0.00169056115107178, -0.00114658236319367, 1.85495174973683e-05, 0.00116749500510697, -0.0018338534895339, 0.00163081121755379, -0.00061809537415198, -0.000745202667601881, 0.00180649821363935, -0.00203027893846962, 0.00126640330468356, 0.000157421819510397, -0.00157310708129604, 0.00228366152553848, -0.00190444353075275, 0.000568005477750304, 0.0011151306707469, -0.0023329421132192, 0.00246162559829578, -0.00138257430159636, -0.000433324537358443, 0.00212764562518702, -0.00285786851262009, 0.00221393092369475, -0.000442992279481382, -0.00163840321631626, 0.00301788336080534, -0.00297703341186181, 0.0014617555859112, 0.000856055255723453, -0.00287227422803796, 0.00357351069600822, -0.00254301906532436, 0.000198626638809116, 0.00236927164830703, -0.0039010690361128, 0.0035821465478179, -0.00147017718831152, -0.00148593154717045, 0.00386713793227644, -0.00446115434709286, 0.00287435336952667, 0.000227693186839808, -0.00339074008311131, 0.00504814686102679, -0.00429109405805667, 0.00135675861773947, 0.0024232517460689, -0.00521976607386243, 0.00558428582153807, -0.00319024997538619, -0.000937826925145829, 0.00485125778066345, -0.00658820769536466, 0.00514711609279157, -0.0010443107359632, -0.00384616240943808, 0.00713638141350294, -0.00707782473542777, 0.003473033762788, 0.00212155966647116, -0.00704934553593504, 0.00879816674200486, -0.00626056557257696, 0.000387067496913524, 0.00613411686183939, -0.0100834918663577, 0.00927220636330678, -0.00371446470852712, -0.00419912451504117, 0.0106925457640194, -0.0123658281743601, 0.00792307294188809, 0.000987185768690078, -0.010311672601115, 0.0153732746500674, -0.0131366522750417, 0.00389643578736272, 0.00849507274864141, -0.0181245496739121, 0.0196995791784733, -0.0112537062404658, -0.00442211567933584, 0.0204589334303373, -0.0286440765869078, 0.0231997761356846, -0.00400829382779986, -0.0222391618425366, 0.0437350895275261, -0.0476969264960187, 0.0254801161883005, 0.0233507495457375, -0.0897344539700225, 0.157339920202654, -0.207674120375053, 0.226270839516311, -0.207674120375053, 0.157339920202654, -0.0897344539700225, 0.0233507495457375, 0.0254801161883005, -0.0476969264960187, 0.0437350895275261, -0.0222391618425366, -0.00400829382779986, 0.0231997761356846, -0.0286440765869078, 0.0204589334303373, -0.00442211567933584, -0.0112537062404658, 0.0196995791784733, -0.0181245496739121, 0.00849507274864141, 0.00389643578736272, -0.0131366522750417, 0.0153732746500674, -0.010311672601115, 0.000987185768690078, 0.00792307294188809, -0.0123658281743601, 0.0106925457640194, -0.00419912451504117, -0.00371446470852712, 0.00927220636330678, -0.0100834918663577, 0.00613411686183939, 0.000387067496913524, -0.00626056557257696, 0.00879816674200486, -0.00704934553593504, 0.00212155966647116, 0.003473033762788, -0.00707782473542777, 0.00713638141350294, -0.00384616240943808, -0.0010443107359632, 0.00514711609279157, -0.00658820769536466, 0.00485125778066345, -0.000937826925145829, -0.00319024997538619, 0.00558428582153807, -0.00521976607386243, 0.0024232517460689, 0.00135675861773947, -0.00429109405805667, 0.00504814686102679, -0.00339074008311131, 0.000227693186839808, 0.00287435336952667, -0.00446115434709286, 0.00386713793227644, -0.00148593154717045, -0.00147017718831152, 0.0035821465478179, -0.0039010690361128, 0.00236927164830703, 0.000198626638809116, -0.00254301906532436, 0.00357351069600822, -0.00287227422803796, 0.000856055255723453, 0.0014617555859112, -0.00297703341186181, 0.00301788336080534, -0.00163840321631626, -0.000442992279481382, 0.00221393092369475, -0.00285786851262009, 0.00212764562518702, -0.000433324537358443, -0.00138257430159636, 0.00246162559829578, -0.0023329421132192, 0.0011151306707469, 0.000568005477750304, -0.00190444353075275, 0.00228366152553848, -0.00157310708129604, 0.000157421819510397, 0.00126640330468356, -0.00203027893846962, 0.00180649821363935, -0.000745202667601881, -0.00061809537415198, 0.00163081121755379, -0.0018338534895339, 0.00116749500510697, 1.85495174973683e-05, -0.00114658236319367, 0.00169056115107178, -0.00141942978917547, 0.000492423415745171, 0.000631146329089061, -0.00141796083084647, 0.00151174263988648, -0.000892174453899829, -0.000127996734948625, 0.00105979798079091, -0.00147038944120175, 0.00118136820018993, -0.000343333647806388, -0.000642786248391086, 0.00131628890347522, -0.00136885213820395, 0.000781639869298272, 0.000171812034708345, -0.00105385402168913, 0.00146117964506179, -0.00120381337268519, 0.00038697148340583, 0.00063684793617094, -0.00142070045084992, 0.001613531606521, -0.0011065352555875, 7.8110199387838e-05, 0.00107756247683892, -0.00190353607494891, 0.0020512919961809, -0.00140342747251517, 0.000105065274356561, 0.00149939896513919, -0.00299254392399743, 0.00402165524717706, -0.00439816778696371, 0.00413007258529378, -0.00338679453160254, 0.00241981666909351, -0.00147399966114648, 0.000721063861199685, -0.000232131419249523, -1.11568853136268e-05, 8.08088706181859e-05, -7.84545991310274e-05]
-coefHPF39Hz=[0.000119775739328594, -0.000257243172770882, 0.000455978982956043, -0.00065804071046313, 0.000783258382473533, -0.000732534684193375, 0.00041571747807189, 0.000213078175940769, -0.00112428562885647, 0.00219855612268202, -0.00323884239237533, 0.00401173102029723, -0.00430971531098599, 0.00401708210789228, -0.00315801412524593, 0.00190667756430806, -0.000551525982528852, -0.000581363458325263, 0.00122383721357124, -0.00125024728547507, 0.000721003536823513, 0.000132865822001724, -0.000982984617999076, 0.00151268693527761, -0.00152558644272426, 0.00101483926558276, -0.00016655594731504, -0.000706528484981018, 0.0012795534481875, -0.00133724008348553, 0.00085768434207472, -2.48267798208969e-05, -0.000837552036220572, 0.00138791265277912, -0.00139980337699693, 0.000854150305740869, 4.68241122069349e-05, -0.000952607579184948, 0.0014990662524558, -0.00145370185973678, 0.000814011302900285, 0.000182454268034602, -0.00114429125006619, 0.00167818993333739, -0.00154838343724418, 0.000779310504889876, 0.00034271336469876, -0.00137432706206895, 0.00188884463872878, -0.00165142078282003, 0.000724203052364164, 0.000544876565419164, -0.00165089665513268, 0.00213138962403861, -0.00175826794860299, 0.000643135125104869, 0.00079166568636397, -0.00197116146923992, 0.0023966767419809, -0.00185498842401053, 0.000520653555092593, 0.00109614564488695, -0.00234271508326131, 0.0026856814518285, -0.00193715495003716, 0.00035013424965719, 0.00146308484554912, -0.00276505572416549, 0.00299124563481284, -0.00199230273903864, 0.000117519130481912, 0.00190334225269569, -0.00324172558855005, 0.003307706201541, -0.0020066707527487, -0.000195178892167474, 0.00243379154949605, -0.00378358099138928, 0.00363728792633977, -0.00197463527749853, -0.000597424486623631, 0.00306191369558964, -0.00439067557776719, 0.00396976716075379, -0.00187680587137805, -0.00111270214794418, 0.0038077662043775, -0.00507229907146205, 0.00429935955285673, -0.00169314096501333, -0.00176899076908661, 0.00469709247763715, -0.0058412500222356, 0.00461864932220193, -0.00139538538533057, -0.00260820619216519, 0.0057721074623872, -0.00672473319906885, 0.00492822028178337, -0.000954774495008998, -0.0036796820771541, 0.00708388634054403, -0.00775241943549866, 0.00521748192769698, -0.000314498302635192, -0.00507428748733868, 0.00872803481473039, -0.00898631776797268, 0.00548125092942388, 0.000611496735230383, -0.00694189384227967, 0.010869571762667, -0.0105383086088737, 0.00571386799491115, 0.00197835381462761, -0.00956324921235804, 0.0138281465283094, -0.0126347865240757, 0.00591329237266193, 0.00409640502521172, -0.0135258357812761, 0.0182973088060549, -0.0157842965198407, 0.00607219053280713, 0.00772673882145409, -0.0203349910672776, 0.0261464251236171, -0.0214422680334793, 0.00618782637271604, 0.0153107901829188, -0.035259776234628, 0.0445967082180873, -0.0359313777232596, 0.00625833629329879, 0.0414999279819122, -0.0987233236383686, 0.153140009713358, -0.19212855107634, 0.206282493902133, -0.19212855107634, 0.153140009713358, -0.0987233236383686, 0.0414999279819122, 0.00625833629329879, -0.0359313777232596, 0.0445967082180873, -0.035259776234628, 0.0153107901829188, 0.00618782637271604, -0.0214422680334793, 0.0261464251236171, -0.0203349910672776, 0.00772673882145409, 0.00607219053280713, -0.0157842965198407, 0.0182973088060549, -0.0135258357812761, 0.00409640502521172, 0.00591329237266193, -0.0126347865240757, 0.0138281465283094, -0.00956324921235804, 0.00197835381462761, 0.00571386799491115, -0.0105383086088737, 0.010869571762667, -0.00694189384227967, 0.000611496735230383, 0.00548125092942388, -0.00898631776797268, 0.00872803481473039, -0.00507428748733868, -0.000314498302635192, 0.00521748192769698, -0.00775241943549866, 0.00708388634054403, -0.0036796820771541, -0.000954774495008998, 0.00492822028178337, -0.00672473319906885, 0.0057721074623872, -0.00260820619216519, -0.00139538538533057, 0.00461864932220193, -0.0058412500222356, 0.00469709247763715, -0.00176899076908661, -0.00169314096501333, 0.00429935955285673, -0.00507229907146205, 0.0038077662043775, -0.00111270214794418, -0.00187680587137805, 0.00396976716075379, -0.00439067557776719, 0.00306191369558964, -0.000597424486623631, -0.00197463527749853, 0.00363728792633977, -0.00378358099138928, 0.00243379154949605, -0.000195178892167474, -0.0020066707527487, 0.003307706201541, -0.00324172558855005, 0.00190334225269569, 0.000117519130481912, -0.00199230273903864, 0.00299124563481284, -0.00276505572416549, 0.00146308484554912, 0.00035013424965719, -0.00193715495003716, 0.0026856814518285, -0.00234271508326131, 0.00109614564488695, 0.000520653555092593, -0.00185498842401053, 0.0023966767419809, -0.00197116146923992, 0.00079166568636397, 0.000643135125104869, -0.00175826794860299, 0.00213138962403861, -0.00165089665513268, 0.000544876565419164, 0.000724203052364164, -0.00165142078282003, 0.00188884463872878, -0.00137432706206895, 0.00034271336469876, 0.000779310504889876, -0.00154838343724418, 0.00167818993333739, -0.00114429125006619, 0.000182454268034602, 0.000814011302900285, -0.00145370185973678, 0.0014990662524558, -0.000952607579184948, 4.68241122069349e-05, 0.000854150305740869, -0.00139980337699693, 0.00138791265277912, -0.000837552036220572, -2.48267798208969e-05, 0.00085768434207472, -0.00133724008348553, 0.0012795534481875, -0.000706528484981018, -0.00016655594731504, 0.00101483926558276, -0.00152558644272426, 0.00151268693527761, -0.000982984617999076, 0.000132865822001724, 0.000721003536823513, -0.00125024728547507, 0.00122383721357124, -0.000581363458325263, -0.000551525982528852, 0.00190667756430806, -0.00315801412524593, 0.00401708210789228, -0.00430971531098599, 0.00401173102029723, -0.00323884239237533, 0.00219855612268202, -0.00112428562885647, 0.000213078175940769, 0.00041571747807189, -0.000732534684193375, 0.000783258382473533, -0.00065804071046313, 0.000455978982956043, -0.000257243172770882, 0.000119775739328594]
-coefHPF40Hz=[-6.00953990607934e-05, 0.000252829735541357, -0.000508159244628347, 0.000938231122101198, -0.0014799958884458, 0.00210984155799719, -0.0027323885565207, 0.00324052346184778, -0.00351368460383169, 0.00345611586077664, -0.00302108912978638, 0.00223439050920302, -0.00119972405770575, 8.58468704400645e-05, 0.000906028276109543, -0.0015874212211506, 0.00182991725108246, -0.00160156078215091, 0.000980889333484432, -0.000142365104078939, -0.000685210628302169, 0.00127767656611753, -0.00147635669053885, 0.00123338615318742, -0.000627262897193837, -0.000157583061986102, 0.000883004006062531, -0.00132709071315753, 0.00135160279150277, -0.000946089195537318, 0.000234117835816457, 0.000561869020105191, -0.00118790134530881, 0.00143821446437151, -0.00122249226687159, 0.000598633580640543, 0.000240888345322219, -0.00102672237814131, 0.00149774172089508, -0.00148685755260832, 0.000979668942920551, -0.00012550901229903, -0.000805027322989138, 0.00150461928524796, -0.00172962992683176, 0.00138407506959031, -0.000558388942114036, -0.000492170241928754, 0.00142519851770869, -0.00192160348142372, 0.00179376525869443, -0.00105489110694365, -7.56507481703928e-05, 0.00123589562316049, -0.00203603271719864, 0.00218834257935703, -0.00160922725599231, 0.000457715171360395, 0.000905879871305464, -0.00203143936864384, 0.00252640961012274, -0.00219142446681674, 0.00109766905208426, 0.000423325701528695, -0.00187836284517014, 0.00277111651666533, -0.00277007725779768, 0.00182934688211652, -0.000219121555186786, -0.00154930356289622, 0.00288425996990754, -0.00331000334757942, 0.00263425174465465, -0.00102838230330825, -0.00101144574207151, 0.00281530561394695, -0.00375771578900442, 0.00347233484303389, -0.00199029298463447, -0.000248866359449946, 0.00252441424243902, -0.00406395674189596, 0.00430310227914736, -0.00308875681511727, 0.000753867092508715, 0.00196864787229143, -0.0041728093341002, 0.0050778943979044, -0.00430109421921456, 0.00201055003642411, 0.00110019690098126, -0.00401757666981808, 0.00573422696526922, -0.00559217660306451, 0.0035276656828959, -0.000128770200778273, -0.00352509579135332, 0.00620026438690115, -0.0069193321355245, 0.00531014645793576, -0.00177146692281577, -0.00261262199262588, 0.00639662796932172, -0.00824160479348353, 0.0073785605837908, -0.00390997657893312, -0.0011631640467685, 0.00621728138134849, -0.00951292952115362, 0.0097782896284847, -0.00667825504928316, 0.00100274103724001, 0.00551042532111338, -0.010687211310785, 0.0126186408696368, -0.0103327841326949, 0.0042103336810078, 0.00401617576382001, -0.0117164827090298, 0.0161603043282783, -0.0154283282690462, 0.00914805004906264, 0.00120226667393547, -0.0125639277013055, 0.0211148900145251, -0.0234320335229317, 0.0176708794199216, -0.00440064785496952, -0.0131950902942292, 0.0298759224309459, -0.0395701915117857, 0.0369762923338985, -0.0191178777049629, -0.0135841898831471, 0.0570515834576853, -0.104221550259712, 0.146525014192951, -0.175818488397317, 0.186285359082001, -0.175818488397317, 0.146525014192951, -0.104221550259712, 0.0570515834576853, -0.0135841898831471, -0.0191178777049629, 0.0369762923338985, -0.0395701915117857, 0.0298759224309459, -0.0131950902942292, -0.00440064785496952, 0.0176708794199216, -0.0234320335229317, 0.0211148900145251, -0.0125639277013055, 0.00120226667393547, 0.00914805004906264, -0.0154283282690462, 0.0161603043282783, -0.0117164827090298, 0.00401617576382001, 0.0042103336810078, -0.0103327841326949, 0.0126186408696368, -0.010687211310785, 0.00551042532111338, 0.00100274103724001, -0.00667825504928316, 0.0097782896284847, -0.00951292952115362, 0.00621728138134849, -0.0011631640467685, -0.00390997657893312, 0.0073785605837908, -0.00824160479348353, 0.00639662796932172, -0.00261262199262588, -0.00177146692281577, 0.00531014645793576, -0.0069193321355245, 0.00620026438690115, -0.00352509579135332, -0.000128770200778273, 0.0035276656828959, -0.00559217660306451, 0.00573422696526922, -0.00401757666981808, 0.00110019690098126, 0.00201055003642411, -0.00430109421921456, 0.0050778943979044, -0.0041728093341002, 0.00196864787229143, 0.000753867092508715, -0.00308875681511727, 0.00430310227914736, -0.00406395674189596, 0.00252441424243902, -0.000248866359449946, -0.00199029298463447, 0.00347233484303389, -0.00375771578900442, 0.00281530561394695, -0.00101144574207151, -0.00102838230330825, 0.00263425174465465, -0.00331000334757942, 0.00288425996990754, -0.00154930356289622, -0.000219121555186786, 0.00182934688211652, -0.00277007725779768, 0.00277111651666533, -0.00187836284517014, 0.000423325701528695, 0.00109766905208426, -0.00219142446681674, 0.00252640961012274, -0.00203143936864384, 0.000905879871305464, 0.000457715171360395, -0.00160922725599231, 0.00218834257935703, -0.00203603271719864, 0.00123589562316049, -7.56507481703928e-05, -0.00105489110694365, 0.00179376525869443, -0.00192160348142372, 0.00142519851770869, -0.000492170241928754, -0.000558388942114036, 0.00138407506959031, -0.00172962992683176, 0.00150461928524796, -0.000805027322989138, -0.00012550901229903, 0.000979668942920551, -0.00148685755260832, 0.00149774172089508, -0.00102672237814131, 0.000240888345322219, 0.000598633580640543, -0.00122249226687159, 0.00143821446437151, -0.00118790134530881, 0.000561869020105191, 0.000234117835816457, -0.000946089195537318, 0.00135160279150277, -0.00132709071315753, 0.000883004006062531, -0.000157583061986102, -0.000627262897193837, 0.00123338615318742, -0.00147635669053885, 0.00127767656611753, -0.000685210628302169, -0.000142365104078939, 0.000980889333484432, -0.00160156078215091, 0.00182991725108246, -0.0015874212211506, 0.000906028276109543, 8.58468704400645e-05, -0.00119972405770575, 0.00223439050920302, -0.00302108912978638, 0.00345611586077664, -0.00351368460383169, 0.00324052346184778, -0.0027323885565207, 0.00210984155799719, -0.0014799958884458, 0.000938231122101198, -0.000508159244628347, 0.000252829735541357, -6.00953990607934e-05]
-coefHPF41Hz=[-5.1870087858456e-05, 1.43181943430181e-05, 4.32607019724785e-05, -0.000174452481364485, 0.000403558826472614, -0.000745280772521021, 0.0011968454325304, -0.00173203956079644, 0.00229917278887673, -0.0028245581329477, 0.00322207666749485, -0.00340790627868191, 0.00331800932826668, -0.00292480694010653, 0.00224903471822948, -0.00136314654217226, 0.000384085890732993, 0.000544499404163247, -0.00127795629159123, 0.00169943869414213, -0.00174569840234043, 0.00142358251012995, -0.000812494516379195, 5.10584925920761e-05, 0.000690179844746464, -0.00124492782898942, 0.00148835973212157, -0.00136647574657983, 0.000910293299970847, -0.000230790247889249, -0.000505682114347423, 0.00111635335440399, -0.00144609810760338, 0.00140702691623746, -0.00100215132393585, 0.000327738583577969, 0.000448227945642814, -0.00112650213137284, 0.00152677587767043, -0.00153504185009796, 0.00113580208619747, -0.000420019087177459, -0.00043441622201331, 0.00120586324825861, -0.0016855588133796, 0.00173343244908696, -0.00131834110110843, 0.000531266446623138, 0.000433326887010696, -0.00132457238949869, 0.00189962380439401, -0.00198909283961108, 0.00154600730185305, -0.000664358230980596, -0.000439225056079878, 0.00147771209216997, -0.00216748605747956, 0.00230494036608236, -0.00182542588343409, 0.000827764332061971, 0.000444172836162575, -0.00165993961253627, 0.0024874259908088, -0.00268268294374035, 0.00216041707199693, -0.00102539506296312, -0.000446141351202954, 0.00187235569100774, -0.00286385466010319, 0.00312886595941517, -0.00255752429098595, 0.00126126604055735, 0.000445727243809685, -0.002121093585704, 0.00330760891147084, -0.0036565880540363, 0.00302844266400882, -0.00154183627213484, -0.000444657184498472, 0.00241705433559486, -0.00383727589424515, 0.00428817718571819, -0.00359364071970548, 0.00187976866336781, 0.00044266924232236, -0.00277415997300267, 0.00447901522286782, -0.0050563504790595, 0.00428409465856403, -0.00229540523719575, -0.000437116545123624, 0.00321033918141398, -0.00526856088745002, 0.0060061834925203, -0.0051415819114769, 0.00281339495999182, 0.00043161112976938, -0.00376220172394846, 0.00627129483378034, -0.00721815042670903, 0.00624076627253345, -0.00347910428923006, -0.00042981712280901, 0.00449194015535003, -0.00760231548999484, 0.00883804878905792, -0.00772226160384575, 0.00438599695683245, 0.000422559758595469, -0.00549485897697294, 0.00945469362104628, -0.0111184644191826, 0.00983177905092706, -0.00569082155019644, -0.000419429963522593, 0.00699491284300824, -0.0122621784737924, 0.0146309886645527, -0.0131397883476187, 0.00777708014364311, 0.000415887365024327, -0.00950756575960686, 0.017086917850739, -0.0208419347408582, 0.0191770290010438, -0.0117203724780873, -0.000412777366334122, 0.0146862851923322, -0.0275525477783832, 0.0351388437971868, -0.0340756387692902, 0.0222904109304194, 0.000412104557753214, -0.0321243599390638, 0.0690344735089425, -0.106028031185952, 0.137583881896711, -0.158787675585995, 0.166257125374562, -0.158787675585995, 0.137583881896711, -0.106028031185952, 0.0690344735089425, -0.0321243599390638, 0.000412104557753214, 0.0222904109304194, -0.0340756387692902, 0.0351388437971868, -0.0275525477783832, 0.0146862851923322, -0.000412777366334122, -0.0117203724780873, 0.0191770290010438, -0.0208419347408582, 0.017086917850739, -0.00950756575960686, 0.000415887365024327, 0.00777708014364311, -0.0131397883476187, 0.0146309886645527, -0.0122621784737924, 0.00699491284300824, -0.000419429963522593, -0.00569082155019644, 0.00983177905092706, -0.0111184644191826, 0.00945469362104628, -0.00549485897697294, 0.000422559758595469, 0.00438599695683245, -0.00772226160384575, 0.00883804878905792, -0.00760231548999484, 0.00449194015535003, -0.00042981712280901, -0.00347910428923006, 0.00624076627253345, -0.00721815042670903, 0.00627129483378034, -0.00376220172394846, 0.00043161112976938, 0.00281339495999182, -0.0051415819114769, 0.0060061834925203, -0.00526856088745002, 0.00321033918141398, -0.000437116545123624, -0.00229540523719575, 0.00428409465856403, -0.0050563504790595, 0.00447901522286782, -0.00277415997300267, 0.00044266924232236, 0.00187976866336781, -0.00359364071970548, 0.00428817718571819, -0.00383727589424515, 0.00241705433559486, -0.000444657184498472, -0.00154183627213484, 0.00302844266400882, -0.0036565880540363, 0.00330760891147084, -0.002121093585704, 0.000445727243809685, 0.00126126604055735, -0.00255752429098595, 0.00312886595941517, -0.00286385466010319, 0.00187235569100774, -0.000446141351202954, -0.00102539506296312, 0.00216041707199693, -0.00268268294374035, 0.0024874259908088, -0.00165993961253627, 0.000444172836162575, 0.000827764332061971, -0.00182542588343409, 0.00230494036608236, -0.00216748605747956, 0.00147771209216997, -0.000439225056079878, -0.000664358230980596, 0.00154600730185305, -0.00198909283961108, 0.00189962380439401, -0.00132457238949869, 0.000433326887010696, 0.000531266446623138, -0.00131834110110843, 0.00173343244908696, -0.0016855588133796, 0.00120586324825861, -0.00043441622201331, -0.000420019087177459, 0.00113580208619747, -0.00153504185009796, 0.00152677587767043, -0.00112650213137284, 0.000448227945642814, 0.000327738583577969, -0.00100215132393585, 0.00140702691623746, -0.00144609810760338, 0.00111635335440399, -0.000505682114347423, -0.000230790247889249, 0.000910293299970847, -0.00136647574657983, 0.00148835973212157, -0.00124492782898942, 0.000690179844746464, 5.10584925920761e-05, -0.000812494516379195, 0.00142358251012995, -0.00174569840234043, 0.00169943869414213, -0.00127795629159123, 0.000544499404163247, 0.000384085890732993, -0.00136314654217226, 0.00224903471822948, -0.00292480694010653, 0.00331800932826668, -0.00340790627868191, 0.00322207666749485, -0.0028245581329477, 0.00229917278887673, -0.00173203956079644, 0.0011968454325304, -0.000745280772521021, 0.000403558826472614, -0.000174452481364485, 4.32607019724785e-05, 1.43181943430181e-05, -5.1870087858456e-05]
-coefHPF42Hz=[8.4638498646256e-05, -0.000126395771006315, 0.000197011157434646, -0.000267043353441989, 0.000317633224263568, -0.000324671133045856, 0.000261882160242213, -0.000105292385225307, -0.00016152914877844, 0.000542227361000787, -0.00102344497725885, 0.00157283858579601, -0.00214020888446182, 0.00266200833973306, -0.00306906607899727, 0.00329681529357656, -0.00329637483646557, 0.00304448411025038, -0.00255061690948801, 0.00185944917773229, -0.0010473240619083, 0.000213134868739379, 0.000535574255094041, -0.00109963541230853, 0.00140466988118867, -0.00141520941355219, 0.00114234862079201, -0.00064409415186614, 1.70984103587708e-05, 0.000618912421616391, -0.00114183177625643, 0.00144928637734244, -0.00147813614206873, 0.00121752325352476, -0.000712554843749743, 5.73915846541868e-05, 0.000621425322921859, -0.00118870322672524, 0.00152706694281547, -0.00156101092843119, 0.00127370857088661, -0.000712804179710849, -1.6582521250256e-05, 0.000770720795838045, -0.00139490621008718, 0.00175466701356958, -0.00176420173116541, 0.00140634065971793, -0.000739186438404264, -0.00011230462051647, 0.000979091217058588, -0.00168097711092827, 0.00206355673074878, -0.00203161165675501, 0.00157188198181519, -0.000759912193132269, -0.000251300115344523, 0.00125942790477486, -0.0020526729649986, 0.00245367023946906, -0.00235844708330672, 0.00176198385779142, -0.000764361520716689, -0.000444846031704144, 0.00162181300910725, -0.00251691633124666, 0.00292698176499852, -0.00274049051398541, 0.00196584810165428, -0.000735934358164765, -0.000713388182049757, 0.00208754205463167, -0.00309229493524542, 0.00349582352322041, -0.00318098284926524, 0.00217614970094368, -0.00065703430918856, -0.00108250242794797, 0.00268614222061105, -0.0038070066441918, 0.00418145755303434, -0.00368936478519183, 0.00238737818923877, -0.000506698698346578, -0.00158610793621467, 0.00345906032511781, -0.00470243073233627, 0.00501662706236295, -0.00428180887859416, 0.00259351585767063, -0.000254886404338491, -0.00227536403576904, 0.00447083017095029, -0.00584469890219226, 0.00605506264371057, -0.00498592362599667, 0.0027855151059126, 0.000148741065912238, -0.00323865387753277, 0.00583599161500898, -0.00735491256377701, 0.00739972957423854, -0.00586097512738012, 0.00295768162703243, 0.000786438754185415, -0.00463228232869308, 0.00776586466874388, -0.00946431497166813, 0.00925464488172687, -0.00703190447215321, 0.00310944682937425, 0.00181395345934353, -0.00676944324455933, 0.0106983957514862, -0.0126657802927595, 0.0120657185190633, -0.00877701741012552, 0.00323327796119274, 0.00361335787014754, -0.0104364849030733, 0.0157682786924162, -0.0182829379826321, 0.0170802062288324, -0.0119148345978117, 0.00332420710214401, 0.00737790567858275, -0.0182508977949574, 0.0270039852357051, -0.0313597352479074, 0.0294462894785882, -0.0201517688109373, 0.00337754524069631, 0.0198583695753385, -0.0474928641447841, 0.0766603179335143, -0.104073226774779, 0.126483625954813, -0.141153112650376, 0.146256399695874, -0.141153112650376, 0.126483625954813, -0.104073226774779, 0.0766603179335143, -0.0474928641447841, 0.0198583695753385, 0.00337754524069631, -0.0201517688109373, 0.0294462894785882, -0.0313597352479074, 0.0270039852357051, -0.0182508977949574, 0.00737790567858275, 0.00332420710214401, -0.0119148345978117, 0.0170802062288324, -0.0182829379826321, 0.0157682786924162, -0.0104364849030733, 0.00361335787014754, 0.00323327796119274, -0.00877701741012552, 0.0120657185190633, -0.0126657802927595, 0.0106983957514862, -0.00676944324455933, 0.00181395345934353, 0.00310944682937425, -0.00703190447215321, 0.00925464488172687, -0.00946431497166813, 0.00776586466874388, -0.00463228232869308, 0.000786438754185415, 0.00295768162703243, -0.00586097512738012, 0.00739972957423854, -0.00735491256377701, 0.00583599161500898, -0.00323865387753277, 0.000148741065912238, 0.0027855151059126, -0.00498592362599667, 0.00605506264371057, -0.00584469890219226, 0.00447083017095029, -0.00227536403576904, -0.000254886404338491, 0.00259351585767063, -0.00428180887859416, 0.00501662706236295, -0.00470243073233627, 0.00345906032511781, -0.00158610793621467, -0.000506698698346578, 0.00238737818923877, -0.00368936478519183, 0.00418145755303434, -0.0038070066441918, 0.00268614222061105, -0.00108250242794797, -0.00065703430918856, 0.00217614970094368, -0.00318098284926524, 0.00349582352322041, -0.00309229493524542, 0.00208754205463167, -0.000713388182049757, -0.000735934358164765, 0.00196584810165428, -0.00274049051398541, 0.00292698176499852, -0.00251691633124666, 0.00162181300910725, -0.000444846031704144, -0.000764361520716689, 0.00176198385779142, -0.00235844708330672, 0.00245367023946906, -0.0020526729649986, 0.00125942790477486, -0.000251300115344523, -0.000759912193132269, 0.00157188198181519, -0.00203161165675501, 0.00206355673074878, -0.00168097711092827, 0.000979091217058588, -0.00011230462051647, -0.000739186438404264, 0.00140634065971793, -0.00176420173116541, 0.00175466701356958, -0.00139490621008718, 0.000770720795838045, -1.6582521250256e-05, -0.000712804179710849, 0.00127370857088661, -0.00156101092843119, 0.00152706694281547, -0.00118870322672524, 0.000621425322921859, 5.73915846541868e-05, -0.000712554843749743, 0.00121752325352476, -0.00147813614206873, 0.00144928637734244, -0.00114183177625643, 0.000618912421616391, 1.70984103587708e-05, -0.00064409415186614, 0.00114234862079201, -0.00141520941355219, 0.00140466988118867, -0.00109963541230853, 0.000535574255094041, 0.000213134868739379, -0.0010473240619083, 0.00185944917773229, -0.00255061690948801, 0.00304448411025038, -0.00329637483646557, 0.00329681529357656, -0.00306906607899727, 0.00266200833973306, -0.00214020888446182, 0.00157283858579601, -0.00102344497725885, 0.000542227361000787, -0.00016152914877844, -0.000105292385225307, 0.000261882160242213, -0.000324671133045856, 0.000317633224263568, -0.000267043353441989, 0.000197011157434646, -0.000126395771006315, 8.4638498646256e-05]
-coefHPF43Hz=[-8.69214673313762e-05, 0.000166165285999335, -0.00028908531236866, 0.000476616161867523, -0.000701987772811943, 0.000987791312592356, -0.00129748950135554, 0.00163653592425955, -0.00195727066602108, 0.00225089807324005, -0.00246508126482936, 0.00258798907274077, -0.00257637064971007, 0.00243112626206201, -0.00213318458976838, 0.00170944432323992, -0.00117306448790831, 0.000578846472031518, 3.37819933553526e-05, -0.000595546677826734, 0.00106144280850389, -0.00137273777102272, 0.00150612114914257, -0.00143877375664992, 0.00118917475697726, -0.00078167873352873, 0.000277076915887246, 0.000264957275407778, -0.000764102206488416, 0.001157374824644, -0.0013819553435156, 0.00140884088780569, -0.00122484154601965, 0.000857154270435377, -0.000350354996861656, -0.000219730242194388, 0.000774287787132153, -0.001225459344989, 0.00150554453642117, -0.00156225670106284, 0.00138211645758633, -0.000980176314200902, 0.000412259264347514, 0.000244059501850458, -0.000888592946301947, 0.00142378599061842, -0.00175944695519983, 0.00183676836548925, -0.0016296896875897, 0.0011592439582483, -0.000484393648105125, -0.000297444633861969, 0.00107102224824084, -0.00171327888929198, 0.00211878614769488, -0.00221082728854419, 0.00196075310535467, -0.00138939776733447, 0.000571540109263623, 0.000377895169564438, -0.0013152407373437, 0.00209342383233136, -0.00258087480353749, 0.00268680879235159, -0.00237405026015988, 0.00167107437702887, -0.000667777953646947, -0.000492450627042699, 0.00163534774699713, -0.00257892569471317, 0.00316433497601582, -0.00327968635614417, 0.00288254857903096, -0.00200811314189059, 0.000769887805816353, 0.000656020029761597, -0.00205349009264748, 0.00320012831420966, -0.00390042463812369, 0.00401963244085821, -0.00350694814841867, 0.00240945366797118, -0.000868804379210296, -0.000894777596981323, 0.00261406770385072, -0.00401340875776736, 0.00485281497056814, -0.00496694703348683, 0.00429641225899134, -0.00290230761842915, 0.000964359835867837, 0.00124139952194117, -0.00337983053503435, 0.00510686499558969, -0.00612258441389383, 0.00622191153711302, -0.00533205873238655, 0.00353278749465376, -0.00105270372029377, -0.00175681633298949, 0.00446968004566465, -0.00664681413043239, 0.00790483867263709, -0.0079796205634664, 0.00677619513306692, -0.0043949752117405, 0.00112999761395936, 0.00256355152907317, -0.00612851874907466, 0.00898538148517845, -0.0106206313486214, 0.0106719334278197, -0.00899615200849693, 0.00570955575891763, -0.00119137293086924, -0.00395169806817923, 0.00895847091701728, -0.0130149669063668, 0.0153730184769884, -0.015469025149724, 0.0130268375698135, -0.00812812600429547, 0.00123898980472886, 0.00681484206492681, -0.0149234963136028, 0.0218130639504027, -0.0261964070113938, 0.0269372401300649, -0.0232062588038283, 0.0146091721235584, -0.00126842010100196, -0.0161536075922323, 0.0364956052101443, -0.058199804394171, 0.0794655857867641, -0.0984368901046011, 0.113401699185325, -0.122979735146198, 0.126275753589366, -0.122979735146198, 0.113401699185325, -0.0984368901046011, 0.0794655857867641, -0.058199804394171, 0.0364956052101443, -0.0161536075922323, -0.00126842010100196, 0.0146091721235584, -0.0232062588038283, 0.0269372401300649, -0.0261964070113938, 0.0218130639504027, -0.0149234963136028, 0.00681484206492681, 0.00123898980472886, -0.00812812600429547, 0.0130268375698135, -0.015469025149724, 0.0153730184769884, -0.0130149669063668, 0.00895847091701728, -0.00395169806817923, -0.00119137293086924, 0.00570955575891763, -0.00899615200849693, 0.0106719334278197, -0.0106206313486214, 0.00898538148517845, -0.00612851874907466, 0.00256355152907317, 0.00112999761395936, -0.0043949752117405, 0.00677619513306692, -0.0079796205634664, 0.00790483867263709, -0.00664681413043239, 0.00446968004566465, -0.00175681633298949, -0.00105270372029377, 0.00353278749465376, -0.00533205873238655, 0.00622191153711302, -0.00612258441389383, 0.00510686499558969, -0.00337983053503435, 0.00124139952194117, 0.000964359835867837, -0.00290230761842915, 0.00429641225899134, -0.00496694703348683, 0.00485281497056814, -0.00401340875776736, 0.00261406770385072, -0.000894777596981323, -0.000868804379210296, 0.00240945366797118, -0.00350694814841867, 0.00401963244085821, -0.00390042463812369, 0.00320012831420966, -0.00205349009264748, 0.000656020029761597, 0.000769887805816353, -0.00200811314189059, 0.00288254857903096, -0.00327968635614417, 0.00316433497601582, -0.00257892569471317, 0.00163534774699713, -0.000492450627042699, -0.000667777953646947, 0.00167107437702887, -0.00237405026015988, 0.00268680879235159, -0.00258087480353749, 0.00209342383233136, -0.0013152407373437, 0.000377895169564438, 0.000571540109263623, -0.00138939776733447, 0.00196075310535467, -0.00221082728854419, 0.00211878614769488, -0.00171327888929198, 0.00107102224824084, -0.000297444633861969, -0.000484393648105125, 0.0011592439582483, -0.0016296896875897, 0.00183676836548925, -0.00175944695519983, 0.00142378599061842, -0.000888592946301947, 0.000244059501850458, 0.000412259264347514, -0.000980176314200902, 0.00138211645758633, -0.00156225670106284, 0.00150554453642117, -0.001225459344989, 0.000774287787132153, -0.000219730242194388, -0.000350354996861656, 0.000857154270435377, -0.00122484154601965, 0.00140884088780569, -0.0013819553435156, 0.001157374824644, -0.000764102206488416, 0.000264957275407778, 0.000277076915887246, -0.00078167873352873, 0.00118917475697726, -0.00143877375664992, 0.00150612114914257, -0.00137273777102272, 0.00106144280850389, -0.000595546677826734, 3.37819933553526e-05, 0.000578846472031518, -0.00117306448790831, 0.00170944432323992, -0.00213318458976838, 0.00243112626206201, -0.00257637064971007, 0.00258798907274077, -0.00246508126482936, 0.00225089807324005, -0.00195727066602108, 0.00163653592425955, -0.00129748950135554, 0.000987791312592356, -0.000701987772811943, 0.000476616161867523, -0.00028908531236866, 0.000166165285999335, -8.69214673313762e-05]
-coefHPF44Hz=[-4.88461465315147e-05, 1.39807632111647e-05, 1.268964791581e-06, -3.51040024100356e-05, 9.3495100821252e-05, -0.000182228460106934, 0.000306097525459429, -0.000468058956161859, 0.000668403867074412, -0.000904053658697063, 0.00116806519131524, -0.00144944800300419, 0.0017333699461672, -0.00200181199279756, 0.00223466259255956, -0.0024112055666884, 0.00251190106179342, -0.00252031913027278, 0.00242505635300428, -0.00222144317944039, 0.00191282158937903, -0.0015111916882322, 0.00103709512963987, -0.000518674974010074, -1.00795695904691e-05, 0.000511835851725639, -0.000949012073540298, 0.00128719526155986, -0.00149850814522171, 0.00156460460346945, -0.00147902947939567, 0.00124864888898037, -0.000893767553034089, 0.000446878216422912, 4.97026302551545e-05, -0.000547351061172193, 0.000995938171244452, -0.0013482817440097, 0.00156541590305044, -0.00162069180129818, 0.00150319731415961, -0.00121957285499247, 0.000794156257056619, -0.00026725817873702, -0.000308332385988037, 0.000872358992770332, -0.00136317337220203, 0.00172428389201534, -0.00191068192612772, 0.00189426553648618, -0.0016677228367765, 0.0012463604895043, -0.00066755753323153, -1.22227047185619e-05, 0.000722665213019179, -0.0013866242811878, 0.00192826642575334, -0.00228151090483159, 0.0023978355175709, -0.00225253926219304, 0.00184870389127806, -0.00121830572241953, 0.00042016179972972, 0.000465225474203628, -0.00134348834715087, 0.00211615221068289, -0.00269142426979255, 0.00299478285387127, -0.00297817024820292, 0.00262677539016319, -0.0019624822943466, 0.00104329243584524, 4.11327873044403e-05, -0.00117790576683698, 0.00224223120566346, -0.00311077183595083, 0.00367550678067685, -0.00385666724762915, 0.00361319357877799, -0.00294943601678989, 0.00191714415523614, -0.000612271164683185, -0.000833342719602067, 0.00226474932314876, -0.0035199625160506, 0.00444770408781084, -0.00492493893818424, 0.00487224136910288, -0.00426516573098337, 0.00314012340547981, -0.00159381059371056, -0.000224098950518649, 0.00212458051128216, -0.00389806125188613, 0.00533659808403476, -0.00625716714340491, 0.00652358966698491, -0.0060645853871496, 0.0048857267083888, -0.00307362927653514, 0.000791493853520685, 0.0017340969726601, -0.00423415956956769, 0.00642427435612283, -0.00803498513450965, 0.00884257004920375, -0.00869681792038285, 0.00754276633230014, -0.00543354175831989, 0.00253250444760966, 0.000896336645824776, -0.00450929479499761, 0.00791398444774325, -0.0107076946484741, 0.0125196999937497, -0.0130534327226355, 0.0121242289721217, -0.00968856245781193, 0.0058613310758099, -0.000918739552763892, -0.00471437675323832, 0.0104924644390621, -0.0157905927061198, 0.0199560489104374, -0.0223658664505654, 0.0224852054393093, -0.0199212409935724, 0.0144674132659151, -0.00613358235564685, -0.00484120791552793, 0.017995141724897, -0.0326693402637784, 0.048051221192313, -0.0632322172043382, 0.0772751919472728, -0.0892859843710095, 0.0984829474564194, -0.10425856245436, 0.10622772862903, -0.10425856245436, 0.0984829474564194, -0.0892859843710095, 0.0772751919472728, -0.0632322172043382, 0.048051221192313, -0.0326693402637784, 0.017995141724897, -0.00484120791552793, -0.00613358235564685, 0.0144674132659151, -0.0199212409935724, 0.0224852054393093, -0.0223658664505654, 0.0199560489104374, -0.0157905927061198, 0.0104924644390621, -0.00471437675323832, -0.000918739552763892, 0.0058613310758099, -0.00968856245781193, 0.0121242289721217, -0.0130534327226355, 0.0125196999937497, -0.0107076946484741, 0.00791398444774325, -0.00450929479499761, 0.000896336645824776, 0.00253250444760966, -0.00543354175831989, 0.00754276633230014, -0.00869681792038285, 0.00884257004920375, -0.00803498513450965, 0.00642427435612283, -0.00423415956956769, 0.0017340969726601, 0.000791493853520685, -0.00307362927653514, 0.0048857267083888, -0.0060645853871496, 0.00652358966698491, -0.00625716714340491, 0.00533659808403476, -0.00389806125188613, 0.00212458051128216, -0.000224098950518649, -0.00159381059371056, 0.00314012340547981, -0.00426516573098337, 0.00487224136910288, -0.00492493893818424, 0.00444770408781084, -0.0035199625160506, 0.00226474932314876, -0.000833342719602067, -0.000612271164683185, 0.00191714415523614, -0.00294943601678989, 0.00361319357877799, -0.00385666724762915, 0.00367550678067685, -0.00311077183595083, 0.00224223120566346, -0.00117790576683698, 4.11327873044403e-05, 0.00104329243584524, -0.0019624822943466, 0.00262677539016319, -0.00297817024820292, 0.00299478285387127, -0.00269142426979255, 0.00211615221068289, -0.00134348834715087, 0.000465225474203628, 0.00042016179972972, -0.00121830572241953, 0.00184870389127806, -0.00225253926219304, 0.0023978355175709, -0.00228151090483159, 0.00192826642575334, -0.0013866242811878, 0.000722665213019179, -1.22227047185619e-05, -0.00066755753323153, 0.0012463604895043, -0.0016677228367765, 0.00189426553648618, -0.00191068192612772, 0.00172428389201534, -0.00136317337220203, 0.000872358992770332, -0.000308332385988037, -0.00026725817873702, 0.000794156257056619, -0.00121957285499247, 0.00150319731415961, -0.00162069180129818, 0.00156541590305044, -0.0013482817440097, 0.000995938171244452, -0.000547351061172193, 4.97026302551545e-05, 0.000446878216422912, -0.000893767553034089, 0.00124864888898037, -0.00147902947939567, 0.00156460460346945, -0.00149850814522171, 0.00128719526155986, -0.000949012073540298, 0.000511835851725639, -1.00795695904691e-05, -0.000518674974010074, 0.00103709512963987, -0.0015111916882322, 0.00191282158937903, -0.00222144317944039, 0.00242505635300428, -0.00252031913027278, 0.00251190106179342, -0.0024112055666884, 0.00223466259255956, -0.00200181199279756, 0.0017333699461672, -0.00144944800300419, 0.00116806519131524, -0.000904053658697063, 0.000668403867074412, -0.000468058956161859, 0.000306097525459429, -0.000182228460106934, 9.3495100821252e-05, -3.51040024100356e-05, 1.268964791581e-06, 1.39807632111647e-05, -4.88461465315147e-05]
-coefHPF45Hz=[7.01331997939505e-05, -7.20921756243825e-05, 0.000104128077667312, -0.000140656993661871, 0.000179783592844497, -0.000218773598217849, 0.000254063147512828, -0.00028133449510737, 0.0002956822221424, -0.000291870821896511, 0.000264659200101245, -0.000209176366555971, 0.000121331368058313, 1.74142585830074e-06, -0.000161245238777952, 0.000356358773151688, -0.000583983476878787, 0.000838587638742798, -0.0011121657490376, 0.00139438903647062, -0.00167299519043761, 0.00193432855388189, -0.00216396284394373, 0.00234752199191067, -0.00247168235973873, 0.0025250757550882, -0.00249909687120657, 0.0023888880937575, -0.00219400514365943, 0.00191859420718359, -0.00157196723285275, 0.00116801290945475, -0.00072503049855975, 0.000264709523824341, 0.000188901794990825, -0.000610802056170263, 0.000976553745893388, -0.0012639059500068, 0.00145438825529442, -0.00153474680390037, 0.00149812305651098, -0.00134488432316857, 0.00108302022692068, -0.000728018034507533, 0.000302211044825849, 0.000166364451783389, -0.000645578497100945, 0.0011012354880473, -0.00149933898658416, 0.00180845081843725, -0.00200204666564162, 0.00206065499660241, -0.0019735661619848, 0.00174004999043625, -0.00136994460556384, 0.000883439613028706, -0.00031018294643652, -0.000312356249189145, 0.000941275800734693, -0.00153097014525264, 0.00203640709242741, -0.00241636814576496, 0.00263671654615548, -0.00267322845095009, 0.00251390813153991, -0.00216051095095154, 0.00162914580648043, -0.000949845389739875, 0.000165099642832354, 0.00067259581180018, -0.00150407685202764, 0.0022675143781371, -0.00290281713214362, 0.00335615070367398, -0.00358425627135995, 0.00355819702143182, -0.00326626793473109, 0.00271580001584729, -0.00193364560651852, 0.000965256498720266, 0.000127636981058167, -0.00127069869220158, 0.00238178338230661, -0.0033765340921425, 0.00417450250123785, -0.00470529096453486, 0.00491428349070706, -0.00476758629254766, 0.00425565854221814, -0.00339544513672258, 0.00223061471824392, -0.000829921976111406, -0.000716388610672269, 0.00230192438962588, -0.00381099007468962, 0.00512648676733565, -0.00613837632196724, 0.00675214138198512, -0.00689661627326516, 0.00653060622425166, -0.00564776079435476, 0.00427924702633308, -0.00249390090105891, 0.000395738783500396, 0.00188119880527292, -0.00418043512120605, 0.00633269171760246, -0.00816702809710805, 0.00952283407566359, -0.0102618659430938, 0.0102795426464554, -0.00951472099793502, 0.0079571692155446, -0.00565217436787254, 0.00270179169841481, 0.000737512741700203, -0.00446082539542846, 0.00822422214253627, -0.0117571639298336, 0.0147772850451825, -0.0170066972564152, 0.018188914068311, -0.0181053299998399, 0.0165902712434072, -0.0135436167094318, 0.0089401420854603, -0.00283492737902521, -0.00463563924760114, 0.0132574651463626, -0.0227468687403945, 0.0327628477087674, -0.042922926534611, 0.0528216937575005, -0.0620510500524497, 0.0702210107759184, -0.0769799101863632, 0.0820328042343556, -0.0851570521878285, 0.086214139080596, -0.0851570521878285, 0.0820328042343556, -0.0769799101863632, 0.0702210107759184, -0.0620510500524497, 0.0528216937575005, -0.042922926534611, 0.0327628477087674, -0.0227468687403945, 0.0132574651463626, -0.00463563924760114, -0.00283492737902521, 0.0089401420854603, -0.0135436167094318, 0.0165902712434072, -0.0181053299998399, 0.018188914068311, -0.0170066972564152, 0.0147772850451825, -0.0117571639298336, 0.00822422214253627, -0.00446082539542846, 0.000737512741700203, 0.00270179169841481, -0.00565217436787254, 0.0079571692155446, -0.00951472099793502, 0.0102795426464554, -0.0102618659430938, 0.00952283407566359, -0.00816702809710805, 0.00633269171760246, -0.00418043512120605, 0.00188119880527292, 0.000395738783500396, -0.00249390090105891, 0.00427924702633308, -0.00564776079435476, 0.00653060622425166, -0.00689661627326516, 0.00675214138198512, -0.00613837632196724, 0.00512648676733565, -0.00381099007468962, 0.00230192438962588, -0.000716388610672269, -0.000829921976111406, 0.00223061471824392, -0.00339544513672258, 0.00425565854221814, -0.00476758629254766, 0.00491428349070706, -0.00470529096453486, 0.00417450250123785, -0.0033765340921425, 0.00238178338230661, -0.00127069869220158, 0.000127636981058167, 0.000965256498720266, -0.00193364560651852, 0.00271580001584729, -0.00326626793473109, 0.00355819702143182, -0.00358425627135995, 0.00335615070367398, -0.00290281713214362, 0.0022675143781371, -0.00150407685202764, 0.00067259581180018, 0.000165099642832354, -0.000949845389739875, 0.00162914580648043, -0.00216051095095154, 0.00251390813153991, -0.00267322845095009, 0.00263671654615548, -0.00241636814576496, 0.00203640709242741, -0.00153097014525264, 0.000941275800734693, -0.000312356249189145, -0.00031018294643652, 0.000883439613028706, -0.00136994460556384, 0.00174004999043625, -0.0019735661619848, 0.00206065499660241, -0.00200204666564162, 0.00180845081843725, -0.00149933898658416, 0.0011012354880473, -0.000645578497100945, 0.000166364451783389, 0.000302211044825849, -0.000728018034507533, 0.00108302022692068, -0.00134488432316857, 0.00149812305651098, -0.00153474680390037, 0.00145438825529442, -0.0012639059500068, 0.000976553745893388, -0.000610802056170263, 0.000188901794990825, 0.000264709523824341, -0.00072503049855975, 0.00116801290945475, -0.00157196723285275, 0.00191859420718359, -0.00219400514365943, 0.0023888880937575, -0.00249909687120657, 0.0025250757550882, -0.00247168235973873, 0.00234752199191067, -0.00216396284394373, 0.00193432855388189, -0.00167299519043761, 0.00139438903647062, -0.0011121657490376, 0.000838587638742798, -0.000583983476878787, 0.000356358773151688, -0.000161245238777952, 1.74142585830074e-06, 0.000121331368058313, -0.000209176366555971, 0.000264659200101245, -0.000291870821896511, 0.0002956822221424, -0.00028133449510737, 0.000254063147512828, -0.000218773598217849, 0.000179783592844497, -0.000140656993661871, 0.000104128077667312, -7.20921756243825e-05, 7.01331997939505e-05]
-coefHPF46Hz=[4.01917506556527e-06, 6.44363666132214e-05, -7.1807711856667e-05, 0.000107272427374642, -0.000154010564258075, 0.000211997288859966, -0.000281947167356413, 0.000364295510670216, -0.000459064974738012, 0.00056579083296242, -0.000683458517076595, 0.000810461074866899, -0.00094457480400601, 0.00108296093114093, -0.00122219478733726, 0.0013583240739144, -0.00148695663076273, 0.00160338546253742, -0.00170273335951359, 0.00178014447170675, -0.00183095431967421, 0.00185092345538298, -0.00183643150268186, 0.00178469187124336, -0.00169395772441521, 0.00156368434872141, -0.00139467600555857, 0.00118918391164097, -0.000950939269955356, 0.000685146449761067, -0.000398407928429166, 9.85770446716765e-05, 0.000205438827241095, -0.000503943238008766, 0.000786777936512296, -0.00104369487407804, 0.00126475497878548, -0.00144074170091639, 0.00156358268252514, -0.00162674117073984, 0.00162558735761683, -0.00155772091757896, 0.00142320731952004, -0.00122473282069851, 0.000967651812802568, -0.000659924139861292, 0.000311962897900562, 6.36471483144935e-05, -0.000452553156668741, 0.000839122070856175, -0.00120704004759581, 0.00153993620359211, -0.00182206209860392, 0.00203898998707554, -0.00217831529303204, 0.00223030123579732, -0.0021884186067645, 0.00204978179759573, -0.00181549321021176, 0.00149084498448683, -0.00108529792163327, 0.0006122488461933, -8.87064495253569e-05, -0.000465174604522063, 0.00102689737272122, -0.00157254795479052, 0.00207741218123458, -0.00251747964937655, 0.00287011505730625, -0.00311536023475875, 0.00323684386131769, -0.00322271442995003, 0.00306639747439911, -0.00276716507328206, 0.00233048255817589, -0.00176810952825686, 0.0010979297555248, -0.000343505563789027, -0.000466639322315851, 0.00129998854032822, -0.00212122871492252, 0.00289362541382231, -0.00358054934273752, 0.00414704654088475, -0.00456148806850578, 0.00479707323599127, -0.00483329861509935, 0.00465717328419759, -0.00426419784755901, 0.0036590595084961, -0.00285593556778075, 0.00187842248186866, -0.000759079325381239, -0.000461456196074866, 0.00173573247586317, -0.00301109230092421, 0.0042316036326978, -0.00534023781093137, 0.00628120542130653, -0.00700236714263275, 0.00745763679205106, -0.00760928065678743, 0.00742999245398814, -0.00690468023033088, 0.00603185210420713, -0.00482454559289889, 0.00331074669244219, -0.00153323826673509, -0.000451118908914012, 0.00257268151511892, -0.00475088284260923, 0.00689657271633382, -0.00891479300449848, 0.0107079174909994, -0.0121790144125123, 0.0132353469195202, -0.0137918548646624, 0.0137745238041993, -0.0131234982455072, 0.0117958047172767, -0.00976758159537769, 0.00703573663376628, -0.00361894511430404, -0.000442089604236121, 0.0050851166354666, -0.0102275302501759, 0.015768315854842, -0.0215906906494361, 0.0275652648572618, -0.0335537223167032, 0.0394129512654782, -0.0449992319018132, 0.0501727327515872, -0.0548017582651956, 0.0587669076546934, -0.0619648235123387, 0.0643114763207117, -0.0657448453890548, 0.0662269057363434, -0.0657448453890548, 0.0643114763207117, -0.0619648235123387, 0.0587669076546934, -0.0548017582651956, 0.0501727327515872, -0.0449992319018132, 0.0394129512654782, -0.0335537223167032, 0.0275652648572618, -0.0215906906494361, 0.015768315854842, -0.0102275302501759, 0.0050851166354666, -0.000442089604236121, -0.00361894511430404, 0.00703573663376628, -0.00976758159537769, 0.0117958047172767, -0.0131234982455072, 0.0137745238041993, -0.0137918548646624, 0.0132353469195202, -0.0121790144125123, 0.0107079174909994, -0.00891479300449848, 0.00689657271633382, -0.00475088284260923, 0.00257268151511892, -0.000451118908914012, -0.00153323826673509, 0.00331074669244219, -0.00482454559289889, 0.00603185210420713, -0.00690468023033088, 0.00742999245398814, -0.00760928065678743, 0.00745763679205106, -0.00700236714263275, 0.00628120542130653, -0.00534023781093137, 0.0042316036326978, -0.00301109230092421, 0.00173573247586317, -0.000461456196074866, -0.000759079325381239, 0.00187842248186866, -0.00285593556778075, 0.0036590595084961, -0.00426419784755901, 0.00465717328419759, -0.00483329861509935, 0.00479707323599127, -0.00456148806850578, 0.00414704654088475, -0.00358054934273752, 0.00289362541382231, -0.00212122871492252, 0.00129998854032822, -0.000466639322315851, -0.000343505563789027, 0.0010979297555248, -0.00176810952825686, 0.00233048255817589, -0.00276716507328206, 0.00306639747439911, -0.00322271442995003, 0.00323684386131769, -0.00311536023475875, 0.00287011505730625, -0.00251747964937655, 0.00207741218123458, -0.00157254795479052, 0.00102689737272122, -0.000465174604522063, -8.87064495253569e-05, 0.0006122488461933, -0.00108529792163327, 0.00149084498448683, -0.00181549321021176, 0.00204978179759573, -0.0021884186067645, 0.00223030123579732, -0.00217831529303204, 0.00203898998707554, -0.00182206209860392, 0.00153993620359211, -0.00120704004759581, 0.000839122070856175, -0.000452553156668741, 6.36471483144935e-05, 0.000311962897900562, -0.000659924139861292, 0.000967651812802568, -0.00122473282069851, 0.00142320731952004, -0.00155772091757896, 0.00162558735761683, -0.00162674117073984, 0.00156358268252514, -0.00144074170091639, 0.00126475497878548, -0.00104369487407804, 0.000786777936512296, -0.000503943238008766, 0.000205438827241095, 9.85770446716765e-05, -0.000398407928429166, 0.000685146449761067, -0.000950939269955356, 0.00118918391164097, -0.00139467600555857, 0.00156368434872141, -0.00169395772441521, 0.00178469187124336, -0.00183643150268186, 0.00185092345538298, -0.00183095431967421, 0.00178014447170675, -0.00170273335951359, 0.00160338546253742, -0.00148695663076273, 0.0013583240739144, -0.00122219478733726, 0.00108296093114093, -0.00094457480400601, 0.000810461074866899, -0.000683458517076595, 0.00056579083296242, -0.000459064974738012, 0.000364295510670216, -0.000281947167356413, 0.000211997288859966, -0.000154010564258075, 0.000107272427374642, -7.1807711856667e-05, 6.44363666132214e-05, 4.01917506556527e-06]
-coefHPF47Hz=[-6.55784482241431e-05, 3.43372109967686e-05, -4.21000791864028e-05, 4.99919989347815e-05, -5.76775599414598e-05, 6.47450694275189e-05, -7.07113728061748e-05, 7.50225548891498e-05, -7.70585125851606e-05, 7.61469318554816e-05, -7.15709638758185e-05, 6.2580394858803e-05, -4.8407965333914e-05, 2.8281675754420298e-05, -1.44838637681464e-06, -3.27978605181199e-05, 7.50916337765335e-05, -0.000125973175278035, 0.0001858655637159, -0.000255055744989836, 0.000333670952926991, -0.000421643926930037, 0.000518681846462646, -0.000624253419566945, 0.00073758931434442, -0.000857682449435702, 0.000983275174557965, -0.00111283039437711, 0.001244538982069, -0.00137637994616542, 0.00150615736711602, -0.0016314597742667, 0.00174965728753459, -0.00185808499311414, 0.00195410887847479, -0.00203481128556325, 0.00209764926515171, -0.00213995594177099, 0.00215937569440269, -0.00215374915431821, 0.00212124583373142, -0.0020604081264027, 0.00197021425683571, -0.00185014176602608, 0.00170021333924608, -0.001521037885295, 0.00131384272790529, -0.00108048667863317, 0.000823471619538899, -0.000545941613369053, 0.00025165816778795, 5.50417648850403e-05, -0.000369295768611338, 0.000685778806947297, -0.000998782670565176, 0.00130231241580065, -0.00159019950349793, 0.00185621881332777, -0.00209420337961627, 0.00229817871287333, -0.00246251951935708, 0.00258208375421117, -0.00265232847887347, 0.00266944889621706, -0.00263052858007453, 0.00253363436333907, -0.00237788662874893, 0.00216359009025775, -0.00189229107286503, 0.0015667315045295, -0.00119101281550107, 0.000770422444955867, -0.000311525603607035, -0.00017799171946573, 0.00068937083021328, -0.00121292504946969, 0.00173818499872394, -0.00225406942611743, 0.0027490919896015, -0.00321157450371643, 0.00362987241390285, -0.00399262541016392, 0.00428900966621731, -0.00450898989387031, 0.00464356918782941, -0.00468502999731521, 0.00462716259658295, -0.00446548056188087, 0.00419740724455869, -0.00382242514859419, 0.00334220231783125, -0.00276068922882901, 0.00208415986936529, -0.0013212062620767, 0.000482707845634328, 0.00041825046264534, -0.00136652317703267, 0.00234508550946051, -0.00333523870061756, 0.00431688050175968, -0.00526882209037919, 0.00616909566778185, -0.00699532052482956, 0.00772511710068967, -0.00833643954271675, 0.00880806636772369, -0.00911992404182704, 0.00925355212216144, -0.00919244160599857, 0.00892242703759859, -0.00843201122013033, 0.00771265317516505, -0.00675903216182231, 0.00556924944973923, -0.00414497448333589, 0.00249154250941985, -0.000617981779060274, -0.00146301928191547, 0.00373520302212963, -0.00617890277367379, 0.00877127130887869, -0.0114865573547512, 0.0142964349194413, -0.0171703961846587, 0.0200761850448198, -0.0229802548094425, 0.0258482645417331, -0.0286456056314499, 0.0313379263389436, -0.0338916565965092, 0.0362745388416378, -0.0384561427605119, 0.040408338849038, -0.0421057518988518, 0.0435261778885945, -0.0446509291827373, 0.0454651450936025, -0.0459580467505523, 0.0461230730912101, -0.0459580467505523, 0.0454651450936025, -0.0446509291827373, 0.0435261778885945, -0.0421057518988518, 0.040408338849038, -0.0384561427605119, 0.0362745388416378, -0.0338916565965092, 0.0313379263389436, -0.0286456056314499, 0.0258482645417331, -0.0229802548094425, 0.0200761850448198, -0.0171703961846587, 0.0142964349194413, -0.0114865573547512, 0.00877127130887869, -0.00617890277367379, 0.00373520302212963, -0.00146301928191547, -0.000617981779060274, 0.00249154250941985, -0.00414497448333589, 0.00556924944973923, -0.00675903216182231, 0.00771265317516505, -0.00843201122013033, 0.00892242703759859, -0.00919244160599857, 0.00925355212216144, -0.00911992404182704, 0.00880806636772369, -0.00833643954271675, 0.00772511710068967, -0.00699532052482956, 0.00616909566778185, -0.00526882209037919, 0.00431688050175968, -0.00333523870061756, 0.00234508550946051, -0.00136652317703267, 0.00041825046264534, 0.000482707845634328, -0.0013212062620767, 0.00208415986936529, -0.00276068922882901, 0.00334220231783125, -0.00382242514859419, 0.00419740724455869, -0.00446548056188087, 0.00462716259658295, -0.00468502999731521, 0.00464356918782941, -0.00450898989387031, 0.00428900966621731, -0.00399262541016392, 0.00362987241390285, -0.00321157450371643, 0.0027490919896015, -0.00225406942611743, 0.00173818499872394, -0.00121292504946969, 0.00068937083021328, -0.00017799171946573, -0.000311525603607035, 0.000770422444955867, -0.00119101281550107, 0.0015667315045295, -0.00189229107286503, 0.00216359009025775, -0.00237788662874893, 0.00253363436333907, -0.00263052858007453, 0.00266944889621706, -0.00265232847887347, 0.00258208375421117, -0.00246251951935708, 0.00229817871287333, -0.00209420337961627, 0.00185621881332777, -0.00159019950349793, 0.00130231241580065, -0.000998782670565176, 0.000685778806947297, -0.000369295768611338, 5.50417648850403e-05, 0.00025165816778795, -0.000545941613369053, 0.000823471619538899, -0.00108048667863317, 0.00131384272790529, -0.001521037885295, 0.00170021333924608, -0.00185014176602608, 0.00197021425683571, -0.0020604081264027, 0.00212124583373142, -0.00215374915431821, 0.00215937569440269, -0.00213995594177099, 0.00209764926515171, -0.00203481128556325, 0.00195410887847479, -0.00185808499311414, 0.00174965728753459, -0.0016314597742667, 0.00150615736711602, -0.00137637994616542, 0.001244538982069, -0.00111283039437711, 0.000983275174557965, -0.000857682449435702, 0.00073758931434442, -0.000624253419566945, 0.000518681846462646, -0.000421643926930037, 0.000333670952926991, -0.000255055744989836, 0.0001858655637159, -0.000125973175278035, 7.50916337765335e-05, -3.27978605181199e-05, -1.44838637681464e-06, 2.8281675754420298e-05, -4.8407965333914e-05, 6.2580394858803e-05, -7.15709638758185e-05, 7.61469318554816e-05, -7.70585125851606e-05, 7.50225548891498e-05, -7.07113728061748e-05, 6.47450694275189e-05, -5.76775599414598e-05, 4.99919989347815e-05, -4.21000791864028e-05, 3.43372109967686e-05, -6.55784482241431e-05]
-coefHPF48Hz=[3.83628495971789e-05, -5.66086061520352e-05, 2.62310820168475e-05, -6.29455159464636e-05, 5.89149455801066e-05, -8.42407571176935e-05, 9.37285282006442e-05, -0.000116884778124607, 0.000134801846779851, -0.000159935846151802, 0.000184398998173181, -0.000213470963592137, 0.000243874599459464, -0.00027786119634906, 0.000314068562691429, -0.000353445712193364, 0.000395407368725474, -0.00044032251532223, 0.00048789124792842, -0.000538200318241564, 0.000591043207355745, -0.000646349936014829, 0.000703918453150733, -0.000763567856323972, 0.000825044403938653, -0.000888077138417402, 0.000952335365905094, -0.00101748231956256, 0.00108311960328724, -0.00114883293771199, 0.00121415738018997, -0.00127858653960845, 0.00134159198223747, -0.00140261089722393, 0.00146107349949364, -0.00151636335661296, 0.00156784329717464, -0.00161484480552595, 0.00165671374805743, -0.00169278506686675, 0.00172238931545515, -0.00174483528530737, 0.00175944674818171, -0.00176558032577855, 0.0017626252139729, -0.00174995297452649, 0.00172698649286823, -0.00169319225346818, 0.00164811902130994, -0.00159130595241899, 0.0015223711675321, -0.00144103198756623, 0.00134707884098474, -0.00124032088476604, 0.00112072060557159, -0.000988313794777405, 0.000843233001090774, -0.000685671751893954, 0.000516028653557991, -0.000334718506801719, 0.000142304687391192, 6.05304539798307e-05, -0.000272967061416925, 0.000494140506042853, -0.000722974097308863, 0.000958329708696313, -0.00119896339722745, 0.00144349079579679, -0.0016904123034047, 0.00193818668882695, -0.0021850848830692, 0.00242936055010039, -0.00266917353654462, 0.00290256854474916, -0.00312757911794928, 0.00334215560369227, -0.00354420088292192, 0.003731623106795, -0.00390228431113951, 0.00405402675938669, -0.00418476214900953, 0.00429235489363634, -0.00437476532832919, 0.00442997445857381, -0.00445603647898295, 0.00445109692687436, -0.00441341040391466, 0.00434130080861008, -0.00423328329462602, 0.00408794416924453, -0.00390408861099568, 0.00368066018246397, -0.00341675969622635, 0.00311173595580655, -0.00276507854800387, 0.00237653372083673, -0.00194604213083852, 0.00147376614827201, -0.00096012668353389, 0.000405748296221013, 0.000188502771264574, -0.000821491480064447, 0.00149188800091303, -0.00219809062669478, 0.00293829028386442, -0.00371043497018535, 0.00451224979669214, -0.00534128103500694, 0.0061948042509038, -0.0070699860869797, 0.00796374782784683, -0.00887289207595001, 0.00979403593896123, -0.0107236927770369, 0.0116582613173209, -0.0125940063140282, 0.0135271788670849, -0.0144539172194549, 0.0153703556938755, -0.0162726166280798, 0.0171568150189211, -0.0180191109535005, 0.0188557035726172, -0.0196628879238054, 0.0204370424108335, -0.0211746549659551, 0.0218723765898439, -0.0225269957049849, 0.0231354886152311, -0.0236950364643091, 0.0242030131334645, -0.0246570448764678, 0.0250549874216296, -0.0253949640567418, 0.025675357664225, -0.0258948417774141, 0.0260523688172316, -0.0261471791714871, 0.0261788472386352, -0.0261471791714871, 0.0260523688172316, -0.0258948417774141, 0.025675357664225, -0.0253949640567418, 0.0250549874216296, -0.0246570448764678, 0.0242030131334645, -0.0236950364643091, 0.0231354886152311, -0.0225269957049849, 0.0218723765898439, -0.0211746549659551, 0.0204370424108335, -0.0196628879238054, 0.0188557035726172, -0.0180191109535005, 0.0171568150189211, -0.0162726166280798, 0.0153703556938755, -0.0144539172194549, 0.0135271788670849, -0.0125940063140282, 0.0116582613173209, -0.0107236927770369, 0.00979403593896123, -0.00887289207595001, 0.00796374782784683, -0.0070699860869797, 0.0061948042509038, -0.00534128103500694, 0.00451224979669214, -0.00371043497018535, 0.00293829028386442, -0.00219809062669478, 0.00149188800091303, -0.000821491480064447, 0.000188502771264574, 0.000405748296221013, -0.00096012668353389, 0.00147376614827201, -0.00194604213083852, 0.00237653372083673, -0.00276507854800387, 0.00311173595580655, -0.00341675969622635, 0.00368066018246397, -0.00390408861099568, 0.00408794416924453, -0.00423328329462602, 0.00434130080861008, -0.00441341040391466, 0.00445109692687436, -0.00445603647898295, 0.00442997445857381, -0.00437476532832919, 0.00429235489363634, -0.00418476214900953, 0.00405402675938669, -0.00390228431113951, 0.003731623106795, -0.00354420088292192, 0.00334215560369227, -0.00312757911794928, 0.00290256854474916, -0.00266917353654462, 0.00242936055010039, -0.0021850848830692, 0.00193818668882695, -0.0016904123034047, 0.00144349079579679, -0.00119896339722745, 0.000958329708696313, -0.000722974097308863, 0.000494140506042853, -0.000272967061416925, 6.05304539798307e-05, 0.000142304687391192, -0.000334718506801719, 0.000516028653557991, -0.000685671751893954, 0.000843233001090774, -0.000988313794777405, 0.00112072060557159, -0.00124032088476604, 0.00134707884098474, -0.00144103198756623, 0.0015223711675321, -0.00159130595241899, 0.00164811902130994, -0.00169319225346818, 0.00172698649286823, -0.00174995297452649, 0.0017626252139729, -0.00176558032577855, 0.00175944674818171, -0.00174483528530737, 0.00172238931545515, -0.00169278506686675, 0.00165671374805743, -0.00161484480552595, 0.00156784329717464, -0.00151636335661296, 0.00146107349949364, -0.00140261089722393, 0.00134159198223747, -0.00127858653960845, 0.00121415738018997, -0.00114883293771199, 0.00108311960328724, -0.00101748231956256, 0.000952335365905094, -0.000888077138417402, 0.000825044403938653, -0.000763567856323972, 0.000703918453150733, -0.000646349936014829, 0.000591043207355745, -0.000538200318241564, 0.00048789124792842, -0.00044032251532223, 0.000395407368725474, -0.000353445712193364, 0.000314068562691429, -0.00027786119634906, 0.000243874599459464, -0.000213470963592137, 0.000184398998173181, -0.000159935846151802, 0.000134801846779851, -0.000116884778124607, 9.37285282006442e-05, -8.42407571176935e-05, 5.89149455801066e-05, -6.29455159464636e-05, 2.62310820168475e-05, -5.66086061520352e-05, 3.83628495971789e-05]
-coefHPF49Hz=[0.000136636799591579, -3.91341909136856e-05, 4.46847519140211e-05, -5.07155373730287e-05, 5.72498250740746e-05, -6.43113636661352e-05, 7.19216702510992e-05, -8.01058570026526e-05, 8.88910294524087e-05, -9.83058149126022e-05, 0.000108379007363328, -0.000119140459836385, 0.000130618948853896, -0.000142839694203996, 0.000155828098035303, -0.000169609903165332, 0.000184206914122435, -0.000199653315643012, 0.000215975588148551, -0.000233209939238446, 0.000251385656729072, -0.000270527539172963, 0.000290661167225718, -0.000311799643560641, 0.000333967659322875, -0.00035719345738574, 0.000381513522320839, -0.000406968797977671, 0.000433587212658653, -0.000461375264619073, 0.000490330451043006, -0.000520468741675363, 0.000551845748158597, -0.000584529498110618, 0.000618522484258042, -0.000653733379704015, 0.000690187667077397, -0.000728189527839408, 0.000767322799313788, -0.000807923594255264, 0.00084986268417069, -0.000893191555305288, 0.000937916396584832, -0.000984045187135216, 0.00103158422953122, -0.0010805380643157, 0.00113091156674165, -0.00118270861617418, 0.00123593231733587, -0.00129058346237855, 0.0013466576887663, -0.00140414877640538, 0.0014630498872085, -0.00152334773003338, 0.00158504051920461, -0.00164811261623802, 0.00171255977885273, -0.00177835947358829, 0.0018454893274059, -0.00191393038462797, 0.00198365726081653, -0.00205465761803535, 0.00212690952629761, -0.00220037775759258, 0.00227502522909932, -0.00235082098370089, 0.00242774053895213, -0.00250575375407209, 0.00258481100824154, -0.00266485909079809, 0.00274587168276212, -0.00282782805018894, 0.00291064678178115, -0.00299426333137131, 0.00307870771962417, -0.00316382620497349, 0.00324964519966583, -0.00333607005178789, 0.00342305930843867, -0.0035105503496427, 0.00359848280444606, -0.00368679530497559, 0.00377542486446541, -0.00386430882400358, 0.00395338307476658, -0.00404258163165263, 0.00413183612169542, -0.00422107441087111, 0.00431022553309933, -0.00439922229192905, 0.00448799069071605, -0.00457646697730233, 0.00466456448406768, -0.00475221984137652, 0.00483934985339985, -0.00492588591563498, 0.00501175917823542, -0.00509688383503662, 0.00518118711848649, -0.00526459815673746, 0.005347043357956, -0.00542844807503097, 0.0055087340561558, -0.00558782479546987, 0.00566565318756408, -0.00574215032220725, 0.00581723568490871, -0.00589083693093237, 0.00596289944637229, -0.00603333978692028, 0.00610207996675648, -0.00616908849531328, 0.0062342573714855, -0.00629755718792985, 0.00635890684791803, -0.00641825396181883, 0.00647553520002742, -0.00653069295581237, 0.0065836736667034, -0.00663442535641449, 0.00668289751697268, -0.00672903958247095, 0.00677280328534064, -0.00681414528947975, 0.00685302404651478, -0.00688939955699784, 0.00692323534580504, -0.00695448962140142, 0.00698314317583102, -0.00700914980511124, 0.00703250422586467, -0.00705316155849978, 0.00707110511083464, -0.00708632527360944, 0.00709879696249194, -0.00710851068327581, 0.00711545877365016, -0.00711963001377814, 0.00712102015080809, -0.00711963001377814, 0.00711545877365016, -0.00710851068327581, 0.00709879696249194, -0.00708632527360944, 0.00707110511083464, -0.00705316155849978, 0.00703250422586467, -0.00700914980511124, 0.00698314317583102, -0.00695448962140142, 0.00692323534580504, -0.00688939955699784, 0.00685302404651478, -0.00681414528947975, 0.00677280328534064, -0.00672903958247095, 0.00668289751697268, -0.00663442535641449, 0.0065836736667034, -0.00653069295581237, 0.00647553520002742, -0.00641825396181883, 0.00635890684791803, -0.00629755718792985, 0.0062342573714855, -0.00616908849531328, 0.00610207996675648, -0.00603333978692028, 0.00596289944637229, -0.00589083693093237, 0.00581723568490871, -0.00574215032220725, 0.00566565318756408, -0.00558782479546987, 0.0055087340561558, -0.00542844807503097, 0.005347043357956, -0.00526459815673746, 0.00518118711848649, -0.00509688383503662, 0.00501175917823542, -0.00492588591563498, 0.00483934985339985, -0.00475221984137652, 0.00466456448406768, -0.00457646697730233, 0.00448799069071605, -0.00439922229192905, 0.00431022553309933, -0.00422107441087111, 0.00413183612169542, -0.00404258163165263, 0.00395338307476658, -0.00386430882400358, 0.00377542486446541, -0.00368679530497559, 0.00359848280444606, -0.0035105503496427, 0.00342305930843867, -0.00333607005178789, 0.00324964519966583, -0.00316382620497349, 0.00307870771962417, -0.00299426333137131, 0.00291064678178115, -0.00282782805018894, 0.00274587168276212, -0.00266485909079809, 0.00258481100824154, -0.00250575375407209, 0.00242774053895213, -0.00235082098370089, 0.00227502522909932, -0.00220037775759258, 0.00212690952629761, -0.00205465761803535, 0.00198365726081653, -0.00191393038462797, 0.0018454893274059, -0.00177835947358829, 0.00171255977885273, -0.00164811261623802, 0.00158504051920461, -0.00152334773003338, 0.0014630498872085, -0.00140414877640538, 0.0013466576887663, -0.00129058346237855, 0.00123593231733587, -0.00118270861617418, 0.00113091156674165, -0.0010805380643157, 0.00103158422953122, -0.000984045187135216, 0.000937916396584832, -0.000893191555305288, 0.00084986268417069, -0.000807923594255264, 0.000767322799313788, -0.000728189527839408, 0.000690187667077397, -0.000653733379704015, 0.000618522484258042, -0.000584529498110618, 0.000551845748158597, -0.000520468741675363, 0.000490330451043006, -0.000461375264619073, 0.000433587212658653, -0.000406968797977671, 0.000381513522320839, -0.00035719345738574, 0.000333967659322875, -0.000311799643560641, 0.000290661167225718, -0.000270527539172963, 0.000251385656729072, -0.000233209939238446, 0.000215975588148551, -0.000199653315643012, 0.000184206914122435, -0.000169609903165332, 0.000155828098035303, -0.000142839694203996, 0.000130618948853896, -0.000119140459836385, 0.000108379007363328, -9.83058149126022e-05, 8.88910294524087e-05, -8.01058570026526e-05, 7.19216702510992e-05, -6.43113636661352e-05, 5.72498250740746e-05, -5.07155373730287e-05, 4.46847519140211e-05, -3.91341909136856e-05, 0.000136636799591579]
-coefHPF50Hz=[-0.000123922948873968, 1.79457245111767e-05, -1.92405383832073e-05, 2.05951908778383e-05, -2.20091867340983e-05, 2.3484602955648e-05, -2.50204554315275e-05, 2.66195915632136e-05, -2.82812243384271e-05, 3.00076200457323e-05, -3.17992744645547e-05, 3.36588072575116e-05, -3.55885213548099e-05, 3.75905196445135e-05, -3.96678906318661e-05, 4.18242547814199e-05, -4.40598858588754e-05, 4.63788529893171e-05, -4.87801217918255e-05, 5.12658410106457e-05, -5.38345777910018e-05, 5.64876711156877e-05, -5.92248787745419e-05, 6.20492130243927e-05, -6.49637331562545e-05, 6.79735399366225e-05, -7.10825639546657e-05, 7.42973132454044e-05, -7.76159843396244e-05, 8.10386184941921e-05, -8.45573062593529e-05, 8.81678458932943e-05, -9.18682484011795e-05, 9.5670837579503e-05, -9.95984287578122e-05, 0.000103673820100869, -0.000107884850915371, 0.000112159403923141, -0.000116428089843697, 0.000121067618053996, -0.000125649263642779, 0.000130410170510676, -0.000135286830348098, 0.000140289789708794, -0.000145420431723132, 0.000150681098988195, -0.000156073047437161, 0.000161598792595129, -0.000167258352527925, 0.000173054199629196, -0.000178985275409254, 0.000185055839277084, -0.000191264614967223, 0.000197615838449994, -0.000204111364447702, 0.000210753263903529, -0.000217543729152261, 0.000224483716693287, -0.000231573187421579, 0.000238813033451565, -0.00024620306135853, 0.000253745629098463, -0.00026144283811319, 0.00026930009998555, -0.000277319334116724, 0.000285500933007283, -0.000293844324715964, 0.000302345794840718, -0.000311006238603623, 0.000319830494582076, -0.00032882700732226, 0.000337999017798675, -0.000347338093914558, 0.000356833513000742, -0.000366491844963216, 0.000376342666874679, -0.000386383552977771, 0.000396540190804472, -0.000406925734908886, 0.000417457377187115, -0.000428172962417428, 0.000439062818950142, -0.000450129597528698, 0.000461374610267775, -0.000472798575332607, 0.000484401846298064, -0.000496185147044517, 0.000508147651280853, -0.000520290797639038, 0.000532612206908305, -0.000545115600009659, 0.000557799241289024, -0.000570665315212998, 0.000583714552211404, -0.000596946235807669, 0.000610360195793569, -0.000623955525447288, 0.00063773074649033, -0.000651687269280907, 0.000665825673670705, -0.000680147692596367, 0.000694651009204274, -0.000709335452785442, 0.000724198177836335, -0.000739238296591587, 0.000754458539882323, -0.000769860687539164, 0.000785442988766835, -0.000801199787848181, 0.000817126954258863, -0.000833230095822107, 0.000849514363742748, -0.000865974969241451, 0.000882596713893072, -0.000899389659945356, 0.000916373004445983, -0.00093349953863752, 0.00095081088074278, -0.000968280333692241, 0.000985916478220113, -0.00100371627925203, 0.00102167753593741, -0.00103980021385788, 0.00105808137279603, -0.00107651992787676, 0.00109511295554618, -0.00111385846031245, 0.00113275554548358, -0.00115180059121457, 0.00117099398253827, -0.00119033298115934, 0.00120981405973405, -0.00122943647369935, 0.00124919482571618, -0.00126908906124319, 0.001289116696031, -0.00130927621553618, 0.00132956331676314, -0.00134997537022222, 0.00137050845339784, -0.00139116012568668, 0.00141192881658686, -0.0014328147383931, 0.0014538109832953, -0.00147491398513058, 0.00149611837518315, -0.00151742637882744, 0.00153883508451128, -0.00156033845519329, 0.00158192852896502, -0.00160360785636328, 0.0016253782045064, -0.0016472277465895, 0.00166914666594671, -0.00169115418250125, 0.00171321907590567, -0.00173535851555026, 0.00175755717911812, -0.00177981649795829, 0.00180213089630603, -0.00182449732723209, 0.00184691070180326, -0.0018693678579573, 0.00189186337474685, -0.00191439517827014, 0.00193695655572242, -0.00195954773279295, 0.00198215915384882, -0.0020047901903471, 0.00202743394809233, -0.0020500870060491, 0.0020727465796729, -0.00209540803513629, 0.00211806531404326, -0.00214071480116926, 0.00216335041541485, -0.0021859687622701, 0.00220856514222203, -0.0022311377203311, 0.00225367865031153, -0.0022761825260395, 0.00229864567715411, -0.00232106535387588, 0.00234343693757144, -0.0023657527187907, 0.00238800674021667, -0.00241019828588911, 0.00243232363846459, -0.00245437473678416, 0.00247634361302481, -0.00249823329554434, 0.0025200372285494998, -0.00254174113008991, 0.00256335571396308, -0.00258486192395189, 0.0026062643789926, -0.00262755414830675, 0.00264872717947137, -0.00266977885947351, 0.00269070376633663, -0.00271149791755592, 0.00273215664367952, -0.00275267512765632, 0.00277304938902904, -0.00279327123089465, 0.00281334013574896, -0.00283324759808183, 0.00285299238355308, -0.00287256963039302, 0.00289197218565801, -0.00291119719435633, 0.00293023937658749, -0.00294909376883076, 0.00296775700322256, -0.00298622500341123, 0.00300449216922153, -0.00302255211449776, 0.00304040307495359, -0.00305804169511926, 0.00307546230285644, -0.00309265942396666, 0.00310962822165007, -0.00312636765398232, 0.00314287333247168, -0.00315913837961186, 0.00317515858041819, -0.00319093298326978, 0.00320645832792059, -0.00322172536126255, 0.0032367336068174, -0.00325148286802432, 0.00326596041444014, -0.0032801732674701, 0.00329410922131415, -0.00330776908185005, 0.00332114779587529, -0.00333424228510063, 0.00334705024197188, -0.00335956778940705, 0.00337179180534185, -0.00338371839925914, 0.00339534395127161, -0.00340666836889142, 0.00341768470241962, -0.00342839539309748, 0.00343879261767555, -0.00344887512108897, 0.00345864238837076, -0.00346808879019323, 0.00347721428761298, -0.00348601647836848, 0.00349449181820821, -0.00350263676817279, 0.00351045152488648, -0.00351793509098469, 0.00352508352296697, -0.00353189377109442, 0.00353836594343762, -0.00354449855277287, 0.00355029098895518, -0.00355573790802107, 0.00356083988822536, -0.00356559678165336, 0.00357000779611877, -0.0035740683427033, 0.00357777876548565, -0.0035811405527409, 0.00358415061576263, -0.00358680681720813, 0.00358911416093536, -0.00359106296567649, 0.00359266111675786, -0.00359390258294963, 0.00359479082950862, -0.00359532382115758, 0.00359550185013739, -0.00359532382115758, 0.00359479082950862, -0.00359390258294963, 0.00359266111675786, -0.00359106296567649, 0.00358911416093536, -0.00358680681720813, 0.00358415061576263, -0.0035811405527409, 0.00357777876548565, -0.0035740683427033, 0.00357000779611877, -0.00356559678165336, 0.00356083988822536, -0.00355573790802107, 0.00355029098895518, -0.00354449855277287, 0.00353836594343762, -0.00353189377109442, 0.00352508352296697, -0.00351793509098469, 0.00351045152488648, -0.00350263676817279, 0.00349449181820821, -0.00348601647836848, 0.00347721428761298, -0.00346808879019323, 0.00345864238837076, -0.00344887512108897, 0.00343879261767555, -0.00342839539309748, 0.00341768470241962, -0.00340666836889142, 0.00339534395127161, -0.00338371839925914, 0.00337179180534185, -0.00335956778940705, 0.00334705024197188, -0.00333424228510063, 0.00332114779587529, -0.00330776908185005, 0.00329410922131415, -0.0032801732674701, 0.00326596041444014, -0.00325148286802432, 0.0032367336068174, -0.00322172536126255, 0.00320645832792059, -0.00319093298326978, 0.00317515858041819, -0.00315913837961186, 0.00314287333247168, -0.00312636765398232, 0.00310962822165007, -0.00309265942396666, 0.00307546230285644, -0.00305804169511926, 0.00304040307495359, -0.00302255211449776, 0.00300449216922153, -0.00298622500341123, 0.00296775700322256, -0.00294909376883076, 0.00293023937658749, -0.00291119719435633, 0.00289197218565801, -0.00287256963039302, 0.00285299238355308, -0.00283324759808183, 0.00281334013574896, -0.00279327123089465, 0.00277304938902904, -0.00275267512765632, 0.00273215664367952, -0.00271149791755592, 0.00269070376633663, -0.00266977885947351, 0.00264872717947137, -0.00262755414830675, 0.0026062643789926, -0.00258486192395189, 0.00256335571396308, -0.00254174113008991, 0.0025200372285494998, -0.00249823329554434, 0.00247634361302481, -0.00245437473678416, 0.00243232363846459, -0.00241019828588911, 0.00238800674021667, -0.0023657527187907, 0.00234343693757144, -0.00232106535387588, 0.00229864567715411, -0.0022761825260395, 0.00225367865031153, -0.0022311377203311, 0.00220856514222203, -0.0021859687622701, 0.00216335041541485, -0.00214071480116926, 0.00211806531404326, -0.00209540803513629, 0.0020727465796729, -0.0020500870060491, 0.00202743394809233, -0.0020047901903471, 0.00198215915384882, -0.00195954773279295, 0.00193695655572242, -0.00191439517827014, 0.00189186337474685, -0.0018693678579573, 0.00184691070180326, -0.00182449732723209, 0.00180213089630603, -0.00177981649795829, 0.00175755717911812, -0.00173535851555026, 0.00171321907590567, -0.00169115418250125, 0.00166914666594671, -0.0016472277465895, 0.0016253782045064, -0.00160360785636328, 0.00158192852896502, -0.00156033845519329, 0.00153883508451128, -0.00151742637882744, 0.00149611837518315, -0.00147491398513058, 0.0014538109832953, -0.0014328147383931, 0.00141192881658686, -0.00139116012568668, 0.00137050845339784, -0.00134997537022222, 0.00132956331676314, -0.00130927621553618, 0.001289116696031, -0.00126908906124319, 0.00124919482571618, -0.00122943647369935, 0.00120981405973405, -0.00119033298115934, 0.00117099398253827, -0.00115180059121457, 0.00113275554548358, -0.00111385846031245, 0.00109511295554618, -0.00107651992787676, 0.00105808137279603, -0.00103980021385788, 0.00102167753593741, -0.00100371627925203, 0.000985916478220113, -0.000968280333692241, 0.00095081088074278, -0.00093349953863752, 0.000916373004445983, -0.000899389659945356, 0.000882596713893072, -0.000865974969241451, 0.000849514363742748, -0.000833230095822107, 0.000817126954258863, -0.000801199787848181, 0.000785442988766835, -0.000769860687539164, 0.000754458539882323, -0.000739238296591587, 0.000724198177836335, -0.000709335452785442, 0.000694651009204274, -0.000680147692596367, 0.000665825673670705, -0.000651687269280907, 0.00063773074649033, -0.000623955525447288, 0.000610360195793569, -0.000596946235807669, 0.000583714552211404, -0.000570665315212998, 0.000557799241289024, -0.000545115600009659, 0.000532612206908305, -0.000520290797639038, 0.000508147651280853, -0.000496185147044517, 0.000484401846298064, -0.000472798575332607, 0.000461374610267775, -0.000450129597528698, 0.000439062818950142, -0.000428172962417428, 0.000417457377187115, -0.000406925734908886, 0.000396540190804472, -0.000386383552977771, 0.000376342666874679, -0.000366491844963216, 0.000356833513000742, -0.000347338093914558, 0.000337999017798675, -0.00032882700732226, 0.000319830494582076, -0.000311006238603623, 0.000302345794840718, -0.000293844324715964, 0.000285500933007283, -0.000277319334116724, 0.00026930009998555, -0.00026144283811319, 0.000253745629098463, -0.00024620306135853, 0.000238813033451565, -0.000231573187421579, 0.000224483716693287, -0.000217543729152261, 0.000210753263903529, -0.000204111364447702, 0.000197615838449994, -0.000191264614967223, 0.000185055839277084, -0.000178985275409254, 0.000173054199629196, -0.000167258352527925, 0.000161598792595129, -0.000156073047437161, 0.000150681098988195, -0.000145420431723132, 0.000140289789708794, -0.000135286830348098, 0.000130410170510676, -0.000125649263642779, 0.000121067618053996, -0.000116428089843697, 0.000112159403923141, -0.000107884850915371, 0.000103673820100869, -9.95984287578122e-05, 9.5670837579503e-05, -9.18682484011795e-05, 8.81678458932943e-05, -8.45573062593529e-05, 8.10386184941921e-05, -7.76159843396244e-05, 7.42973132454044e-05, -7.10825639546657e-05, 6.79735399366225e-05, -6.49637331562545e-05, 6.20492130243927e-05, -5.92248787745419e-05, 5.64876711156877e-05, -5.38345777910018e-05, 5.12658410106457e-05, -4.87801217918255e-05, 4.63788529893171e-05, -4.40598858588754e-05, 4.18242547814199e-05, -3.96678906318661e-05, 3.75905196445135e-05, -3.55885213548099e-05, 3.36588072575116e-05, -3.17992744645547e-05, 3.00076200457323e-05, -2.82812243384271e-05, 2.66195915632136e-05, -2.50204554315275e-05, 2.3484602955648e-05, -2.20091867340983e-05, 2.05951908778383e-05, -1.92405383832073e-05, 1.79457245111767e-05, -0.000123922948873968]
+globals().update(load_set('Filters'))
@@ -0,0 +1,414 @@
+# Lazy, memoized export sheets for the download pages.
+#
+# The pages wrote the whole ExcelWriter workbook (raw, detrended, normalized, stats, Welch, columns comparison)
+# and filtered all 49 bands on every rerun, i.e. on every widget change, whether or not anything was downloaded.
+# Here every sheet is a task: a function registered under the sheet name, run the first time a download needs
+# it. Its result is kept under (fingerprint of the data, task name, task params, keys of the tasks it reads),
+# and so are the workbook bytes. A repeat click, a rerun or another session exporting the same scans gets them
+# back without running anything. Results are shared by every session of the server process, least recently
+# used first out once they take more than CACHE_BYTES.
+#
+#   tasks = ExportTasks(fingerprint(df_combined, df_metadata_filtered))
+#   tasks.add('Raw Data', lambda: df_combined)
+#   tasks.add('Detrended Data', lambda: df_combined.apply(detrend))
+#   tasks.add('Time Domain Features', lambda: stats_radar(tasks['Detrended Data']), deps=['Detrended Data'])
+#   download_export(tasks, selected_sheets, "Download Selected Sheets", file_name, key='download-excel', fmt='Parquet')
+#
+# A task returns a DataFrame, written as one sheet under the task name, or a {sheet name: DataFrame} dict.
+#
+# Besides xlsx, exports can be written as Parquet, Arrow IPC (Feather v2) or a zip of CSV files (see FORMATS).
+# Sheets of one task that have the same columns, like the 49 '<band> Filtered Data' sheets, are stacked into
+# one table with a 'sheet' column. Each sheet is one Parquet row group or one Arrow record batch, so a reader
+# can load one band without the others. The 'Metadata' sheet goes into the file metadata of every Parquet /
+# Arrow file (JSON records under the b'metadata' key) instead of a table of its own. An export made of more
+# than one table is downloaded as a zip of the files.
+#
+# xlsx exports are written row by row to a file in EXPORT_DIR (see xlsx_stream.py), cached as an ExportFile
+# and handed to the download button as an open file. The file is removed when it leaves the cache.
+
+import io
+import os
+import tempfile
+import threading
+import zipfile
+from collections import OrderedDict
+from hashlib import sha1
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from xlsx_stream import write_workbooks
+
+XLSX_MIME = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+ZIP_MIME = 'application/zip'
+METADATA_SHEET = 'Metadata'
+# Name of the column telling the stacked sheets of a table apart
+SHEET_COLUMN = 'sheet'
+# Bytes of sheets and workbooks kept for reuse; set with TREBIRTH_EXPORT_CACHE_MB
+CACHE_BYTES = int(float(os.environ.get('TREBIRTH_EXPORT_CACHE_MB', 512)) * 2 ** 20)
+# Where xlsx exports are written; set with TREBIRTH_EXPORT_DIR
+EXPORT_DIR = os.environ.get('TREBIRTH_EXPORT_DIR', os.path.join(tempfile.gettempdir(), 'trebirth_exports'))
+
+_results = OrderedDict()
+_results_bytes = 0
+_results_lock = threading.Lock()
+_building = {}
+
+
+def fingerprint(*frames):
+    """Hex digest of the columns, index and values of the given DataFrames."""
+    digest = sha1()
+    for frame in frames:
+        digest.update(repr(list(frame.columns)).encode())
+        digest.update(pd.util.hash_pandas_object(frame, index=True).values.tobytes())
+    return digest.hexdigest()
+
+
+class ExportFile:
+    """An export written to disk; size counts against CACHE_BYTES like bytes in memory would."""
+
+    def __init__(self, path):
+        self.path = path
+        self.size = os.path.getsize(path)
+
+    def open(self):
+        return open(self.path, 'rb')
+
+    def head(self, n=4):
+        with self.open() as f:
+            return f.read(n)
+
+    def discard(self):
+        # A session still downloading it keeps its open file
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+def _size(value):
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, ExportFile):
+        return value.size
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return int(value.memory_usage(index=True, deep=False).sum())
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, dict):
+        return sum(_size(item) for item in value.values())
+    if isinstance(value, (tuple, list)):
+        return sum(_size(item) for item in value)
+    return 0
+
+
+def cached(key):
+    """The stored result for key, None if there is none."""
+    with _results_lock:
+        entry = _results.get(key)
+        if entry is None:
+            return None
+        _results.move_to_end(key)
+        return entry[0]
+
+
+def memoized(key, func):
+    """func()'s result for key, computed once: sessions asking for a key being built wait for it."""
+    global _results_bytes
+    value = cached(key)
+    if value is not None:
+        return value
+    with _results_lock:
+        building = _building.setdefault(key, threading.Lock())
+    with building:
+        try:
+            value = cached(key)
+            if value is None:
+                value = func()
+                size = _size(value)
+                with _results_lock:
+                    evicted = []
+                    # A file bigger than the whole cache is still kept (alone), so it can be downloaded and removed
+                    if size <= CACHE_BYTES or isinstance(value, ExportFile):
+                        _results[key] = (value, size)
+                        _results_bytes += size
+                        while _results_bytes > CACHE_BYTES and len(_results) > 1:
+                            old_value, old_size = _results.popitem(last=False)[1]
+                            _results_bytes -= old_size
+                            evicted.append(old_value)
+                for old_value in evicted:
+                    if isinstance(old_value, ExportFile):
+                        old_value.discard()
+        finally:
+            # Also when func() raised; a session waiting on this lock then tries again
+            with _results_lock:
+                if _building.get(key) is building:
+                    del _building[key]
+    return value
+
+
+def _copy(value):
+    # Stored results are shared by every session; each caller gets frames it can change
+    if isinstance(value, (pd.DataFrame, pd.Series, np.ndarray)):
+        return value.copy()
+    if isinstance(value, dict):
+        return {name: _copy(item) for name, item in value.items()}
+    if isinstance(value, (tuple, list)):
+        return type(value)(_copy(item) for item in value)
+    return value
+
+
+def clear_exports():
+    global _results_bytes
+    with _results_lock:
+        values = [value for value, _ in _results.values()]
+        _results.clear()
+        _results_bytes = 0
+    for value in values:
+        if isinstance(value, ExportFile):
+            value.discard()
+
+
+def _common_suffix(names):
+    # Whole words only: '1Hz-2Hz Filtered Data', '2Hz-3Hz Filtered Data' -> 'Filtered Data'
+    words = os.path.commonprefix([name.split()[::-1] for name in names])
+    return ' '.join(words[::-1])
+
+
+def _tables(sheets):
+    """[(table name, [(sheet name, frame), ...])]: the given (task, {sheet: frame}) pairs with the sheets of a
+    task that share their columns grouped together, in order. The metadata sheet is left out."""
+    tables = []
+    for task_name, task_sheets in sheets:
+        if task_name == METADATA_SHEET:
+            continue
+        groups = {}
+        for sheet_name, frame in task_sheets.items():
+            schema = tuple((str(column), str(dtype)) for column, dtype in frame.dtypes.items())
+            groups.setdefault(schema, []).append((sheet_name, frame))
+        for group in groups.values():
+            name = group[0][0] if len(group) == 1 else _common_suffix([sheet for sheet, _ in group]) or task_name
+            tables.append((name, group))
+    return tables
+
+
+def _arrow_column(series):
+    try:
+        return pa.array(series.to_numpy(), from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Mixed types in an object column, e.g. numbers and strings in one metadata field
+        return pa.array(series.map(lambda value: None if pd.isna(value) else str(value)).to_numpy(), pa.string())
+
+
+def _record_batches(group):
+    # Columns go to Arrow one by one; float columns are wrapped, not copied. Stacked sheets share one dictionary
+    # for the sheet column (an Arrow file cannot change it between batches).
+    sheet_names = pa.array([sheet_name for sheet_name, _ in group])
+    for i, (sheet_name, frame) in enumerate(group):
+        arrays = [_arrow_column(frame[column]) for column in frame.columns]
+        names = [str(column) for column in frame.columns]
+        if len(group) > 1:
+            arrays.insert(0, pa.DictionaryArray.from_arrays(pa.array(np.full(len(frame), i, dtype=np.int32)),
+                                                            sheet_names))
+            names.insert(0, SHEET_COLUMN)
+        yield len(frame), pa.RecordBatch.from_arrays(arrays, names)
+
+
+def _schema_metadata(metadata):
+    if metadata is None:
+        return None
+    return {b'metadata': metadata.to_json(orient='records', date_format='iso').encode()}
+
+
+def _write_parquet(sink, group, metadata):
+    writer = None
+    for rows, batch in _record_batches(group):
+        if writer is None:
+            writer = pq.ParquetWriter(sink, batch.schema.with_metadata(_schema_metadata(metadata)), compression='zstd')
+        # One row group per sheet
+        writer.write_table(pa.Table.from_batches([batch]), row_group_size=max(rows, 1))
+    writer.close()
+
+
+def _write_arrow(sink, group, metadata):
+    writer = None
+    for _, batch in _record_batches(group):
+        if writer is None:
+            writer = pa.ipc.new_file(sink, batch.schema.with_metadata(_schema_metadata(metadata)),
+                                     options=pa.ipc.IpcWriteOptions(compression='zstd'))
+        writer.write_batch(batch)
+    writer.close()
+
+
+def write_xlsx(sheets, metadata):
+    # The metadata sheet is a sheet like the others here
+    named = (item for _, task_sheets in sheets for item in task_sheets.items())
+    return ExportFile(write_workbooks(named, EXPORT_DIR))
+
+
+def write_csv_zip(sheets, metadata):
+    data = BytesIO()
+    with zipfile.ZipFile(data, 'w', zipfile.ZIP_DEFLATED) as archive:
+        # A CSV file has no file metadata, so the metadata sheet is a CSV file of its own
+        for sheet_name, frame in (item for _, task_sheets in sheets for item in task_sheets.items()):
+            # Written into the archive as it is formatted, without the whole CSV text in memory
+            with archive.open(f'{sheet_name}.csv', 'w') as entry, io.TextIOWrapper(entry, 'utf-8', newline='') as text:
+                frame.to_csv(text, index=False)
+    return data.getvalue()
+
+
+def _columnar(write, extension):
+    def write_tables(sheets, metadata):
+        tables = _tables(sheets)
+        if not tables and metadata is not None:
+            tables = [(METADATA_SHEET, [(METADATA_SHEET, metadata)])]
+        if len(tables) == 1:
+            data = BytesIO()
+            write(data, tables[0][1], metadata)
+            return data.getvalue()
+        data = BytesIO()
+        # The files are compressed already
+        with zipfile.ZipFile(data, 'w', zipfile.ZIP_STORED) as archive:
+            for name, group in tables:
+                with archive.open(f'{name}.{extension}', 'w') as entry:
+                    write(entry, group, metadata)
+        return data.getvalue()
+    return write_tables
+
+
+# format: (writer(sheets, metadata) -> bytes, file extension, mime type)
+FORMATS = {
+    'Excel (.xlsx)': (write_xlsx, 'xlsx', XLSX_MIME),
+    'Parquet': (_columnar(_write_parquet, 'parquet'), 'parquet', 'application/vnd.apache.parquet'),
+    'Arrow / Feather': (_columnar(_write_arrow, 'arrow'), 'arrow', 'application/vnd.apache.arrow.file'),
+    'CSV (zip)': (write_csv_zip, 'zip', ZIP_MIME),
+}
+
+
+def export_file(data, file_stem, fmt):
+    """(file name, mime type) of an export (bytes or ExportFile)."""
+    _, extension, mime = FORMATS[fmt]
+    if isinstance(data, ExportFile):
+        if extension == 'xlsx' and data.path.endswith('.zip'):
+            # Too big for one workbook (see xlsx_stream.py)
+            return f'{file_stem}.zip', ZIP_MIME
+        return f'{file_stem}.{extension}', mime
+    if data[:4] == b'PK\x03\x04' and extension not in ('xlsx', 'zip'):
+        return f'{file_stem}.{extension}.zip', ZIP_MIME
+    return f'{file_stem}.{extension}', mime
+
+
+class ExportTasks:
+    """The sheets one page can export for one set of scans (identified by fingerprint)."""
+
+    def __init__(self, fingerprint):
+        self.fingerprint = fingerprint
+        self._tasks = {}
+
+    def add(self, name, func, deps=(), **params):
+        """Register func(**params) as task name. deps lists the tasks func reads, so their params are part of
+        this task's key too. Nothing runs until the result is asked for."""
+        self._tasks[name] = (func, tuple(deps), tuple(sorted(params.items())))
+
+    def key(self, name):
+        func, deps, params = self._tasks[name]
+        return self.fingerprint, name, params, tuple(self.key(dep) for dep in deps)
+
+    def __contains__(self, name):
+        return name in self._tasks
+
+    def __iter__(self):
+        # Task names in the order they were added
+        return iter(self._tasks)
+
+    def __getitem__(self, name):
+        """Task name's result, a copy of the stored one."""
+        return _copy(self._result(name))
+
+    def _result(self, name):
+        # The stored result itself, for the writers, which only read it
+        func, deps, params = self._tasks[name]
+        return memoized(self.key(name), lambda: func(**dict(params)))
+
+    def sheets(self, name):
+        """{sheet name: frame} of task name; the frames are the stored ones, not to be changed."""
+        value = self._result(name)
+        return value if isinstance(value, dict) else {name: value}
+
+    def export_key(self, names, fmt='Excel (.xlsx)'):
+        return self.fingerprint, fmt, tuple(self.key(name) for name in names)
+
+    def cached_export(self, names, fmt='Excel (.xlsx)'):
+        return cached(self.export_key(names, fmt))
+
+    def export(self, names, fmt='Excel (.xlsx)', progress=None):
+        """The sheets of the given tasks, in order, in one of the FORMATS (bytes or ExportFile); built once per
+        key. progress(stage, fraction) is told which task is being computed."""
+        def build():
+            sheets = []
+            for i, name in enumerate(names):
+                if progress is not None:
+                    progress(f'Computing {name}', i / (len(names) + 1))
+                sheets.append((name, self.sheets(name)))
+            metadata = self._result(METADATA_SHEET) if METADATA_SHEET in names else None
+            if progress is not None:
+                progress(f'Writing {fmt}', len(names) / (len(names) + 1))
+            return FORMATS[fmt][0](sheets, metadata)
+        return memoized(self.export_key(names, fmt), build)
+
+
+def _download_button(label, data, file_name, mime, key):
+    import streamlit as st
+    if isinstance(data, ExportFile):
+        with data.open() as f:
+            st.download_button(label, f, file_name=file_name, mime=mime, key=key)
+    else:
+        st.download_button(label, data, file_name=file_name, mime=mime, key=key)
+
+
+def download_export(tasks, names, label, file_stem, key, fmt='Excel (.xlsx)'):
+    # Offers the export once it exists; until then a button queues it as a background job (see export_jobs.py),
+    # so nothing runs on plain reruns and the page stays usable while it is built
+    import streamlit as st
+    from export_jobs import DONE, FAILED, get_job, job_id, submit
+
+    data = tasks.cached_export(names, fmt)
+    if data is not None:
+        _download_button(label, data, *export_file(data, file_stem, fmt), key=key)
+        return
+
+    export_key = tasks.export_key(names, fmt)
+    # Id of the job this session queued and is waiting for
+    job_key = f'{key}-job'
+    job = get_job(job_id(export_key))
+    if job is None or job.state in (DONE, FAILED):
+        waited_for = st.session_state.pop(job_key, None)
+        if job is None and waited_for == job_id(export_key):
+            # Swept or lost with the jobs database before it was picked up
+            st.warning(f"{label}: the export job is gone (it expired or the server restarted). Prepare it again.")
+    if job is not None and job.state == DONE and os.path.exists(job.path):
+        _download_button(label, ExportFile(job.path), job.file_name, job.mime, key=key)
+        return
+    if job is not None and job.state == FAILED:
+        st.error(f"{label} failed: {job.error}")
+    if job is None or job.state in (DONE, FAILED):
+        # Not queued or running: no job yet, it failed, or its file is gone
+        if not st.button(f"Prepare: {label}", key=f'{key}-prepare', disabled=not names):
+            return
+
+        def build(progress):
+            data = tasks.export(names, fmt, progress)
+            return (data,) + export_file(data, file_stem, fmt)
+        st.session_state[job_key] = submit(export_key, build, label)
+
+    @st.fragment(run_every=1)
+    def show_progress():
+        job = get_job(job_id(export_key))
+        if job is None or job.state in (DONE, FAILED):
+            # Once, to show the download button (or the error, or the job being gone) in place of the progress bar
+            st.rerun()
+        st.progress(job.progress, text=f"{label}: {job.stage}")
+    show_progress()
@@ -2,81 +2,24 @@
 
 import pandas as pd
 import numpy as np
+from fir_engine import process
+from filter_bank import FilterBank
+from coef_store import load_set
 
 
-coefLPF5Hz=[-0.000100383602260307,-9.99194252718732E-05,-0.000142432132672974,-0.000190087396101507,-0.000240028820208714,-0.000287961340309197,-0.000329087554856373,-0.000357298891879589,-0.000365774335002126,-0.000347547898732011,-0.000295513679753394,-0.000203483188189709,-6.62641478876482E-05,0.000119320167856697,0.000354364650747168,0.000636924113202534,0.000962020383852602,0.00132123559623765,0.00170299171250755,0.00209262318376679,0.00247300545726971,0.00282525904974925,0.00312971829391473,0.00336707325079412,0.00351958031414947,0.00357239744884826,0.00351472010724079,0.00334092865764201,0.00305134913211528,0.00265283581534916,0.00215886490635076,0.00158930848761436,0.000969672003675897,0.000329934142588367,-0.000297001998393762,-0.000877188704696361,-0.00137769150348794,-0.00176878490248029,-0.00202600316250974,-0.00213208155244748,-0.00207845419664811,-0.00186635414029278,-0.00150722546121334,-0.0010225503432286,-0.000442902876499923,0.000193618333358358,0.000843602447412602,0.00146100734627191,0.00200019157195234,0.00241908886035022,0.00268229291015571,0.00276387691702756,0.00264966862919381,0.00233884801626261,0.00184464590204015,0.00119412239541405,0.000426913579172406,-0.000406962158437822,-0.00125017703153505,-0.00204184323188685,-0.00272172451222681,-0.00323462978351118,-0.00353466424224984,-0.00358905938802174,-0.00338123395433887,-0.00291287428194656,-0.00220477184559971,-0.00129635500932492,-0.000243807077839275,0.000883108178361332,0.00200540408294677,0.00304011382425774,0.00390612776785469,0.00453020769659233,0.0048527665537351,0.00483298184840451,0.00445282940972251,0.0037196998600051,0.00266730799236564,0.00135476287370057,-0.000136269903513438,-0.00170618272998286,-0.00324361349449703,-0.00463282574591933,-0.00576184664210322,-0.00653080647260912,-0.00685990679909381,-0.00669643079907607,-0.00602024092292762,-0.00484729888193064,-0.00323082966297427,-0.00125993635260457,0.000944412184130487,0.00323586645904038,0.00545137948514313,0.00742159114369466,0.00898233158445749,0.00998650307735988,0.0103155827363995,0.00988994283553055,0.00867724847560928,0.00669826751356273,0.00402957422782925,0.000802813109366718,-0.00279961826548797,-0.00655236151750008,-0.0101980562309712,-0.0134609103732012,-0.0160621736691258,-0.0177366234608755,-0.0182491068197698,-0.0174101161456228,-0.0150894234129295,-0.0112268685126438,-0.00583955685957133,0.000975085138804532,0.00904071463076293,0.0181079822307313,0.0278647359480215,0.0379500249089087,0.0479711972700069,0.0575231593305669,0.0662087473927292,0.0736590521779566,0.0795525540401978,0.0836319569870053,0.0857177586743081,0.0857177586743081,0.0836319569870053,0.0795525540401978,0.0736590521779566,0.0662087473927292,0.0575231593305669,0.0479711972700069,0.0379500249089087,0.0278647359480215,0.0181079822307313,0.00904071463076293,0.000975085138804532,-0.00583955685957133,-0.0112268685126438,-0.0150894234129295,-0.0174101161456228,-0.0182491068197698,-0.0177366234608755,-0.0160621736691258,-0.0134609103732012,-0.0101980562309712,-0.00655236151750008,-0.00279961826548797,0.000802813109366718,0.00402957422782925,0.00669826751356273,0.00867724847560928,0.00988994283553055,0.0103155827363995,0.00998650307735988,0.00898233158445749,0.00742159114369466,0.00545137948514313,0.00323586645904038,0.000944412184130487,-0.00125993635260457,-0.00323082966297427,-0.00484729888193064,-0.00602024092292762,-0.00669643079907607,-0.00685990679909381,-0.00653080647260912,-0.00576184664210322,-0.00463282574591933,-0.00324361349449703,-0.00170618272998286,-0.000136269903513438,0.00135476287370057,0.00266730799236564,0.0037196998600051,0.00445282940972251,0.00483298184840451,0.0048527665537351,0.00453020769659233,0.00390612776785469,0.00304011382425774,0.00200540408294677,0.000883108178361332,-0.000243807077839275,-0.00129635500932492,-0.00220477184559971,-0.00291287428194656,-0.00338123395433887,-0.00358905938802174,-0.00353466424224984,-0.00323462978351118,-0.00272172451222681,-0.00204184323188685,-0.00125017703153505,-0.000406962158437822,0.000426913579172406,0.00119412239541405,0.00184464590204015,0.00233884801626261,0.00264966862919381,0.00276387691702756,0.00268229291015571,0.00241908886035022,0.00200019157195234,0.00146100734627191,0.000843602447412602,0.000193618333358358,-0.000442902876499923,-0.0010225503432286,-0.00150722546121334,-0.00186635414029278,-0.00207845419664811,-0.00213208155244748,-0.00202600316250974,-0.00176878490248029,-0.00137769150348794,-0.000877188704696361,-0.000297001998393762,0.000329934142588367,0.000969672003675897,0.00158930848761436,0.00215886490635076,0.00265283581534916,0.00305134913211528,0.00334092865764201,0.00351472010724079,0.00357239744884826,0.00351958031414947,0.00336707325079412,0.00312971829391473,0.00282525904974925,0.00247300545726971,0.00209262318376679,0.00170299171250755,0.00132123559623765,0.000962020383852602,0.000636924113202534,0.000354364650747168,0.000119320167856697,-6.62641478876482e-05,-0.000203483188189709,-0.000295513679753394,-0.000347547898732011,-0.000365774335002126,-0.000357298891879589,-0.000329087554856373,-0.000287961340309197,-0.000240028820208714,-0.000190087396101507,-0.000142432132672974,-9.99194252718732e-05,-0.000100383602260307]
-coefLPF10Hz=[-0.000175156889691888,-0.000392767848478502,-0.00074830177329763,-0.00120839766970474,-0.00171428779663654,-0.00216630756066558,-0.00243696249755266,-0.0023960276831646,-0.00194520711516224,-0.0010518156644659,0.000226200554845451,0.00173485121787534,0.00324354511956566,0.00448797182213592,0.00522895677265925,0.00531357761248018,0.00472083098138501,0.00357811421735832,0.00214040559094802,0.000733598540672947,-0.000325203686772278,-0.000809748935070543,-0.000646519304077986,6.27894503565341E-05,0.00106705691466221,0.00203500950314497,0.00264982030919608,0.00270220375235126,0.0021542312545108,0.00115354452067666,-8.67593869169104E-06,-0.000985142883510528,-0.00147976837421939,-0.00134223108034387,-0.000619653140690418,0.000452811458012442,0.0015218262653577,0.00222620602008467,0.00231378167441427,0.00172723682947691,0.000629787057317802,-0.000640205447834215,-0.00167397021035344,-0.0021245719057281,-0.00182438023417345,-0.000848292378795015,0.000500734002774399,0.00178255605506941,0.00256045633545381,0.00254716890248022,0.00170787235039771,0.000283639347962157,-0.00127636437531859,-0.00245569207080234,-0.00284086725207185,-0.0022654416788527,-0.000878234308498719,0.000891048920545906,0.00246246368632342,0.00329369051419045,0.00306485234110608,0.00179788995649626,-0.000133201282587918,-0.00211039525311688,-0.00346768261703398,-0.0037136517252625,-0.00270688615151211,-0.000722448474336463,0.00161883195166342,0.0035418115155995,0.00437106102623865,0.00376501684279708,0.00185000701585649,-0.00079668123709128,-0.00331730860218897,-0.00484864580524743,-0.00481430359887348,-0.00313651954732362,-0.00029115931702941,0.00282163137096246,0.00515800247772128,0.00587611961644421,0.00463390308551231,0.00173523844460968,-0.00193386522982023,-0.0051702576607716,-0.00684242694070746,-0.00627929310537687,-0.00352762853770945,0.000617201358966177,0.00483206408579389,0.00768020225240331,0.00809162248557078,0.00575204532426992,0.00126302656294202,-0.00399647701488366,-0.00828141599017012,-0.010045877778568,-0.00848335224065669,-0.00385868549169236,0.00249544565700476,0.00854232009978026,0.0121719878899922,0.0119100281271441,0.00747441088172157,-1.76962060480846E-05,-0.00829231627641539,-0.0145703559971889,-0.0164516251832028,-0.012763209741392,-0.00409192264918967,0.00720336150296006,0.0175567862222369,0.0232184851476466,0.0214620963074337,0.0116217523249239,-0.00437617490541542,-0.0221982000769307,-0.0360220080531252,-0.0399905125874603,-0.0298344157835331,-0.00422210132017505,0.0345559159684053,0.0807985418143667,0.126497850620354,0.163088670403913,0.183415098632447,0.183415098632447,0.163088670403913,0.126497850620354,0.0807985418143667,0.0345559159684053,-0.00422210132017505,-0.0298344157835331,-0.0399905125874603,-0.0360220080531252,-0.0221982000769307,-0.00437617490541542,0.0116217523249239,0.0214620963074337,0.0232184851476466,0.0175567862222369,0.00720336150296006,-0.00409192264918967,-0.012763209741392,-0.0164516251832028,-0.0145703559971889,-0.00829231627641539,-1.76962060480846E-05,0.00747441088172157,0.0119100281271441,0.0121719878899922,0.00854232009978026,0.00249544565700476,-0.00385868549169236,-0.00848335224065669,-0.010045877778568,-0.00828141599017012,-0.00399647701488366,0.00126302656294202,0.00575204532426992,0.00809162248557078,0.00768020225240331,0.00483206408579389,0.000617201358966177,-0.00352762853770945,-0.00627929310537687,-0.00684242694070746,-0.0051702576607716,-0.00193386522982023,0.00173523844460968,0.00463390308551231,0.00587611961644421,0.00515800247772128,0.00282163137096246,-0.00029115931702941,-0.00313651954732362,-0.00481430359887348,-0.00484864580524743,-0.00331730860218897,-0.00079668123709128,0.00185000701585649,0.00376501684279708,0.00437106102623865,0.0035418115155995,0.00161883195166342,-0.000722448474336463,-0.00270688615151211,-0.0037136517252625,-0.00346768261703398,-0.00211039525311688,-0.000133201282587918,0.00179788995649626,0.00306485234110608,0.00329369051419045,0.00246246368632342,0.000891048920545906,-0.000878234308498719,-0.0022654416788527,-0.00284086725207185,-0.00245569207080234,-0.00127636437531859,0.000283639347962157,0.00170787235039771,0.00254716890248022,0.00256045633545381,0.00178255605506941,0.000500734002774399,-0.000848292378795015,-0.00182438023417345,-0.0021245719057281,-0.00167397021035344,-0.000640205447834215,0.000629787057317802,0.00172723682947691,0.00231378167441427,0.00222620602008467,0.0015218262653577,0.000452811458012442,-0.000619653140690418,-0.00134223108034387,-0.00147976837421939,-0.000985142883510528,-8.67593869169104E-06,0.00115354452067666,0.0021542312545108,0.00270220375235126,0.00264982030919608,0.00203500950314497,0.00106705691466221,6.27894503565341E-05,-0.000646519304077986,-0.000809748935070543,-0.000325203686772278,0.000733598540672947,0.00214040559094802,0.00357811421735832,0.00472083098138501,0.00531357761248018,0.00522895677265925,0.00448797182213592,0.00324354511956566,0.00173485121787534,0.000226200554845451,-0.0010518156644659,-0.00194520711516224,-0.0023960276831646,-0.00243696249755266,-0.00216630756066558,-0.00171428779663654,-0.00120839766970474,-0.00074830177329763,-0.000392767848478502,-0.000175156889691888]
-coefLPF15Hz=[3.55697254446379E-05,-0.0002412036094847,-0.000962697417399605,-0.00232672736351453,-0.00422182388997661,-0.00616670917315467,-0.0074025614005278,-0.00720885163143577,-0.0053150736078481,-0.00217425372019816,0.00111528667581011,0.00327391888138532,0.00348696143839864,0.00187198813344289,-0.000538760165748846,-0.00234413604791606,-0.00256155535222414,-0.0011903489137826,0.0008097765183786,0.00213357420985453,0.00196356814179588,0.000487061375014753,-0.00124731961694488,-0.00204654086013335,-0.00138591748324762,0.000236511874557873,0.00165434028167811,0.00185684793420704,0.000707937940682052,-0.00095319531995672,-0.00191192681019968,-0.0014584649732893,8.54903194720614E-05,0.00158650658594245,0.00192246438468277,0.000816969282377798,-0.000933318550688074,-0.00202594578848996,-0.00161588119840557,3.37413194888462E-05,0.00171322289144199,0.0021480516977422,0.000962386126628341,-0.00100151474303954,-0.00227584557307787,-0.00185952040022093,-7.17255742464003E-07,0.00193932310119228,0.00247782316217538,0.00113898163252135,-0.00113626809740507,-0.00264580759926621,-0.00219541494357894,-3.86028767115403E-05,0.00224883098826808,0.00291488533828484,0.00136864577357408,-0.00130840478556001,-0.00311085853595877,-0.00260574575352805,-6.42585759199178E-05,0.00266008650082682,0.00347746005373273,0.00165922825801356,-0.00152978867099471,-0.00370170771355203,-0.00312721141838179,-0.000103923747791858,0.0031650480853522,0.00416851743583478,0.00200843782344722,-0.00181917781624787,-0.00444821988304011,-0.00378039853841067,-0.000148758807036154,0.00380367666606397,0.00503647850248164,0.00243976586712305,-0.00219686783452241,-0.00540095099281788,-0.00460565309486743,-0.000189819034388045,0.00463979701885376,0.0061615335146965,0.00299046356176337,-0.00270426206112465,-0.00665874820574927,-0.00568793502348088,-0.000225409488162682,0.00577718245791251,0.00768456184956589,0.00373104681893091,-0.00341158576560392,-0.00840126100455811,-0.00718910675523617,-0.000262127203626299,0.00740040941413177,0.00986377819310777,0.00478638769369433,-0.00447050619683313,-0.01099962213947,-0.00944006024678085,-0.000295481284940611,0.00993872586276283,0.013303286006643,0.00646192498120954,-0.00623209479585795,-0.0153593313172749,-0.0132781068156597,-0.000317289646970516,0.0145519821598287,0.0197043651980651,0.00965555929562568,-0.00978404355520908,-0.0244372466762048,-0.0216128651382028,-0.000331730909657625,0.0257951533565655,0.0363673671151856,0.0186311096727892,-0.0208721456809534,-0.0562099112121131,-0.0554237027218455,-0.00034030320634473,0.0992814914253122,0.206921237467243,0.276516801529043,0.276516801529043,0.206921237467243,0.0992814914253122,-0.00034030320634473,-0.0554237027218455,-0.0562099112121131,-0.0208721456809534,0.0186311096727892,0.0363673671151856,0.0257951533565655,-0.000331730909657625,-0.0216128651382028,-0.0244372466762048,-0.00978404355520908,0.00965555929562568,0.0197043651980651,0.0145519821598287,-0.000317289646970516,-0.0132781068156597,-0.0153593313172749,-0.00623209479585795,0.00646192498120954,0.013303286006643,0.00993872586276283,-0.000295481284940611,-0.00944006024678085,-0.01099962213947,-0.00447050619683313,0.00478638769369433,0.00986377819310777,0.00740040941413177,-0.000262127203626299,-0.00718910675523617,-0.00840126100455811,-0.00341158576560392,0.00373104681893091,0.00768456184956589,0.00577718245791251,-0.000225409488162682,-0.00568793502348088,-0.00665874820574927,-0.00270426206112465,0.00299046356176337,0.0061615335146965,0.00463979701885376,-0.000189819034388045,-0.00460565309486743,-0.00540095099281788,-0.00219686783452241,0.00243976586712305,0.00503647850248164,0.00380367666606397,-0.000148758807036154,-0.00378039853841067,-0.00444821988304011,-0.00181917781624787,0.00200843782344722,0.00416851743583478,0.0031650480853522,-0.000103923747791858,-0.00312721141838179,-0.00370170771355203,-0.00152978867099471,0.00165922825801356,0.00347746005373273,0.00266008650082682,-6.42585759199178E-05,-0.00260574575352805,-0.00311085853595877,-0.00130840478556001,0.00136864577357408,0.00291488533828484,0.00224883098826808,-3.86028767115403E-05,-0.00219541494357894,-0.00264580759926621,-0.00113626809740507,0.00113898163252135,0.00247782316217538,0.00193932310119228,-7.17255742464003E-07,-0.00185952040022093,-0.00227584557307787,-0.00100151474303954,0.000962386126628341,0.0021480516977422,0.00171322289144199,3.37413194888462E-05,-0.00161588119840557,-0.00202594578848996,-0.000933318550688074,0.000816969282377798,0.00192246438468277,0.00158650658594245,8.54903194720614E-05,-0.0014584649732893,-0.00191192681019968,-0.00095319531995672,0.000707937940682052,0.00185684793420704,0.00165434028167811,0.000236511874557873,-0.00138591748324762,-0.00204654086013335,-0.00124731961694488,0.000487061375014753,0.00196356814179588,0.00213357420985453,0.0008097765183786,-0.0011903489137826,-0.00256155535222414,-0.00234413604791606,-0.000538760165748846,0.00187198813344289,0.00348696143839864,0.00327391888138532,0.00111528667581011,-0.00217425372019816,-0.0053150736078481,-0.00720885163143577,-0.0074025614005278,-0.00616670917315467,-0.00422182388997661,-0.00232672736351453,-0.000962697417399605,-0.0002412036094847,3.55697254446379E-05]
-coefLPF20Hz=[0.000510388377116647,0.00171080163044858,0.00317338688707365,0.00350354300358788,0.00126227738249417,-0.00347398804799743,-0.00838499457297971,-0.0102463648129759,-0.00763653383871138,-0.00253075247229533,0.00112551786335012,0.000894310210687683,-0.00194723364474319,-0.00382373875209842,-0.00257451556642184,0.000409847297469214,0.00191200101621659,0.000539650491982057,-0.00179749619241132,-0.00221893048995877,-0.000253646787411827,0.00169915598894196,0.00132897668251086,-0.000795372707651568,-0.00197703507118617,-0.000742295331779862,0.0013457135490515,0.00166055593723431,-0.00018038641368911,-0.00182497991752277,-0.00115926563162638,0.000989430482091288,0.0018730496527049,0.00032932133228882,-0.00168480882287052,-0.00155695319866841,0.000603151390497817,0.00203087122635593,0.000835268747908194,-0.00150001271211459,-0.0019451440711758,0.000155880224854269,0.00213380704464076,0.00137564834605566,-0.0012320883828489,-0.00232566606597794,-0.000395176724052346,0.00214109273747053,0.00195575873897581,-0.000831216688579696,-0.00265240184958626,-0.00105105524939727,0.00201524430252227,0.00255605028817062,-0.000264626486626673,-0.0028680291843603,-0.00178902310686365,0.00172333159418838,0.00312815441337314,0.000453643742032568,-0.00295523077542615,-0.00260708599642276,0.00122901144073301,0.00363441420360955,0.00133462066290715,-0.00286226656651235,-0.00347725407307757,0.000496697940876885,0.00401760268504443,0.00237739353173524,-0.00251622752931076,-0.00432071120166458,-0.000461032228208131,0.00423313380077608,0.00354931572534185,-0.00190735571934016,-0.00513453489415857,-0.00170162278918537,0.00419561285957428,0.00483112279510336,-0.000951568018417644,-0.00580924986887171,-0.00319487129868016,0.00385234211070702,0.00618226839660476,0.000383211655758679,-0.00629920199284788,-0.00497598132914003,0.00310018727558175,0.00755146987834394,0.00216631160864454,-0.00650046198849574,-0.00704006265436389,0.00184956589690146,0.00889952795083603,0.00448824694566453,-0.00631123830604761,-0.00943882768305804,-6.52975714144485E-05,0.0101728489597887,0.0075090756944298,-0.00556685937619683,-0.0122655474485632,-0.00290954061702354,0.0113211330993054,0.0115400279462207,-0.00399884718451207,-0.0157647062915471,-0.00722354780872869,0.0123055667516059,0.0173203252920329,-0.001009156367514,-0.0205627169328587,-0.0143439640735005,0.013084316857792,0.0268985920253848,0.00505105020603228,-0.0287505377052616,-0.0288043000099982,0.0136173151347124,0.0487836968187378,0.0218299729052096,-0.0518777249359025,-0.0811117831421959,0.013892960283143,0.205651249332771,0.362837745852107,0.362837745852107,0.205651249332771,0.013892960283143,-0.0811117831421959,-0.0518777249359025,0.0218299729052096,0.0487836968187378,0.0136173151347124,-0.0288043000099982,-0.0287505377052616,0.00505105020603228,0.0268985920253848,0.013084316857792,-0.0143439640735005,-0.0205627169328587,-0.001009156367514,0.0173203252920329,0.0123055667516059,-0.00722354780872869,-0.0157647062915471,-0.00399884718451207,0.0115400279462207,0.0113211330993054,-0.00290954061702354,-0.0122655474485632,-0.00556685937619683,0.0075090756944298,0.0101728489597887,-6.52975714144485E-05,-0.00943882768305804,-0.00631123830604761,0.00448824694566453,0.00889952795083603,0.00184956589690146,-0.00704006265436389,-0.00650046198849574,0.00216631160864454,0.00755146987834394,0.00310018727558175,-0.00497598132914003,-0.00629920199284788,0.000383211655758679,0.00618226839660476,0.00385234211070702,-0.00319487129868016,-0.00580924986887171,-0.000951568018417644,0.00483112279510336,0.00419561285957428,-0.00170162278918537,-0.00513453489415857,-0.00190735571934016,0.00354931572534185,0.00423313380077608,-0.000461032228208131,-0.00432071120166458,-0.00251622752931076,0.00237739353173524,0.00401760268504443,0.000496697940876885,-0.00347725407307757,-0.00286226656651235,0.00133462066290715,0.00363441420360955,0.00122901144073301,-0.00260708599642276,-0.00295523077542615,0.000453643742032568,0.00312815441337314,0.00172333159418838,-0.00178902310686365,-0.0028680291843603,-0.000264626486626673,0.00255605028817062,0.00201524430252227,-0.00105105524939727,-0.00265240184958626,-0.000831216688579696,0.00195575873897581,0.00214109273747053,-0.000395176724052346,-0.00232566606597794,-0.0012320883828489,0.00137564834605566,0.00213380704464076,0.000155880224854269,-0.0019451440711758,-0.00150001271211459,0.000835268747908194,0.00203087122635593,0.000603151390497817,-0.00155695319866841,-0.00168480882287052,0.00032932133228882,0.0018730496527049,0.000989430482091288,-0.00115926563162638,-0.00182497991752277,-0.00018038641368911,0.00166055593723431,0.0013457135490515,-0.000742295331779862,-0.00197703507118617,-0.000795372707651568,0.00132897668251086,0.00169915598894196,-0.000253646787411827,-0.00221893048995877,-0.00179749619241132,0.000539650491982057,0.00191200101621659,0.000409847297469214,-0.00257451556642184,-0.00382373875209842,-0.00194723364474319,0.000894310210687683,0.00112551786335012,-0.00253075247229533,-0.00763653383871138,-0.0102463648129759,-0.00838499457297971,-0.00347398804799743,0.00126227738249417,0.00350354300358788,0.00317338688707365,0.00171080163044858,0.000510388377116647]
-coefLPF25Hz=[-2.40315206882241E-05,0.00116069304613221,0.00492252807398285,0.010097436206524,0.0119294130425666,0.00680863462195925,-0.00181995425177064,-0.00571219086447201,-0.00178725986741497,0.00348642088330401,0.00283107078067247,-0.00180567188312746,-0.00294160522228027,0.000678430618871547,0.00272688746038229,5.77440667166688E-05,-0.0024246681976041,-0.000544996260359634,0.0021199658455373,0.000876708158341309,-0.00183909413646347,-0.00110633949422351,0.0015991925440464,0.00128734737961683,-0.00137913818455521,-0.00142719936916941,0.00118538097471023,0.00154996345294602,-0.00100386013316305,-0.00165951807389408,0.000830636674428462,0.0017626445727826,-0.000657338567865205,-0.00185759510187648,0.000482614174726521,0.00194570741022587,-0.000305016249132185,-0.00203014636084671,0.000119246647997446,0.00211050035378571,8.07020205236553E-05,-0.00217987596225562,-0.000292167203172069,0.00223911196980925,0.000517852099004696,-0.00228510554165633,-0.000758352119945141,0.00231557018939323,0.00101574948212749,-0.00232377594367384,-0.00128590872212484,0.00230785444436679,0.00156557800892274,-0.00226814902213639,-0.00185434345649991,0.00220364831911466,0.00215260394294901,-0.00211128170945917,-0.00245950703063741,0.00198757298144045,0.00277313857055043,-0.00182848987700197,-0.00308930911299497,0.00163206426632938,0.0034040067080038,-0.0013972859137554,-0.00371377149242699,0.00112367281976903,0.00401626398061875,-0.000809528665364646,-0.00430825019586182,0.000453760082159891,0.0045867942535809,-5.50481460011589E-05,-0.00484984792628886,-0.00039039848241821,0.00509261585593096,0.00088621400873359,-0.00530744951379836,-0.00143304095024399,0.00548591292166026,0.00202624715878626,-0.00562707419100375,-0.00266694051446102,0.00572884532137937,0.00335935602351544,-0.00578623002910076,-0.00410927086096942,0.00578883095021072,0.00491804832192095,-0.00572698700318967,-0.00578495595664634,0.00559394387387139,0.00671117017309105,-0.00538508618979823,-0.0077045354423035,0.00509053651539513,0.00877430656376601,-0.00469815303719801,-0.00993660289165391,0.00418103003133373,0.0111939437639354,-0.00352507147026608,-0.0125651306754206,0.00270750534623204,0.0140798654219394,-0.00169540144696531,-0.0157877638450487,0.00042596978359006,0.0177435002714825,0.00118236950968741,-0.020027475384464,-0.00323850774332989,0.0227880013314548,0.00592286187580121,-0.0263070735453883,-0.00961664728202788,0.0310138677459437,0.0149485547739041,-0.0379188215247415,-0.0234479819142726,0.0493658385025427,0.039190126231699,-0.07329743952751,-0.0796192585954185,0.159551736166191,0.440203830269532,0.440203830269532,0.159551736166191,-0.0796192585954185,-0.07329743952751,0.039190126231699,0.0493658385025427,-0.0234479819142726,-0.0379188215247415,0.0149485547739041,0.0310138677459437,-0.00961664728202788,-0.0263070735453883,0.00592286187580121,0.0227880013314548,-0.00323850774332989,-0.020027475384464,0.00118236950968741,0.0177435002714825,0.00042596978359006,-0.0157877638450487,-0.00169540144696531,0.0140798654219394,0.00270750534623204,-0.0125651306754206,-0.00352507147026608,0.0111939437639354,0.00418103003133373,-0.00993660289165391,-0.00469815303719801,0.00877430656376601,0.00509053651539513,-0.0077045354423035,-0.00538508618979823,0.00671117017309105,0.00559394387387139,-0.00578495595664634,-0.00572698700318967,0.00491804832192095,0.00578883095021072,-0.00410927086096942,-0.00578623002910076,0.00335935602351544,0.00572884532137937,-0.00266694051446102,-0.00562707419100375,0.00202624715878626,0.00548591292166026,-0.00143304095024399,-0.00530744951379836,0.00088621400873359,0.00509261585593096,-0.00039039848241821,-0.00484984792628886,-5.50481460011589E-05,0.0045867942535809,0.000453760082159891,-0.00430825019586182,-0.000809528665364646,0.00401626398061875,0.00112367281976903,-0.00371377149242699,-0.0013972859137554,0.0034040067080038,0.00163206426632938,-0.00308930911299497,-0.00182848987700197,0.00277313857055043,0.00198757298144045,-0.00245950703063741,-0.00211128170945917,0.00215260394294901,0.00220364831911466,-0.00185434345649991,-0.00226814902213639,0.00156557800892274,0.00230785444436679,-0.00128590872212484,-0.00232377594367384,0.00101574948212749,0.00231557018939323,-0.000758352119945141,-0.00228510554165633,0.000517852099004696,0.00223911196980925,-0.000292167203172069,-0.00217987596225562,8.07020205236553E-05,0.00211050035378571,0.000119246647997446,-0.00203014636084671,-0.000305016249132185,0.00194570741022587,0.000482614174726521,-0.00185759510187648,-0.000657338567865205,0.0017626445727826,0.000830636674428462,-0.00165951807389408,-0.00100386013316305,0.00154996345294602,0.00118538097471023,-0.00142719936916941,-0.00137913818455521,0.00128734737961683,0.0015991925440464,-0.00110633949422351,-0.00183909413646347,0.000876708158341309,0.0021199658455373,-0.000544996260359634,-0.0024246681976041,5.77440667166688E-05,0.00272688746038229,0.000678430618871547,-0.00294160522228027,-0.00180567188312746,0.00283107078067247,0.00348642088330401,-0.00178725986741497,-0.00571219086447201,-0.00181995425177064,0.00680863462195925,0.0119294130425666,0.010097436206524,0.00492252807398285,0.00116069304613221,-2.40315206882241E-05]
-coefLPF30Hz=[-0.00148005009454812,-0.00704072042245734,-0.0133831717698789,-0.0112209575611251,0.000172476406099431,0.00670767635540093,0.000846109764748419,-0.00475901494389311,-0.000300686655406097,0.00375939503654242,-0.000499069533142044,-0.00299208744409175,0.00126640724204992,0.00218268173023106,-0.00185755051552303,-0.00125868517522442,0.0021658296013993,0.0002672769219175,-0.00211357747379021,0.000676572446990261,0.00168451878532286,-0.00142441485176756,-0.000941276391966281,0.00183169811938809,1.98508894220489E-05,-0.00180566335543423,0.000888752786648267,0.00134107308241683,-0.00157346018738052,-0.000530574893341484,0.00185969401209866,-0.00044178370171816,-0.0016606720248401,0.0013270023137392,0.000993619728763142,-0.00189219023278422,-1.36365580701671E-05,0.00195903461840182,-0.00103443762769292,-0.00147264027521915,0.00186573761448941,0.000529950038293372,-0.0022220637081218,0.000646952878530947,0.00196895582951742,-0.00173358741282391,-0.00111695893654899,0.00241464069600738,-0.000138106981033625,-0.00245096017975489,0.00147119075911662,0.00176954245974004,-0.00250098725330123,-0.000500317507599693,0.00289330496474233,-0.00104460347362001,-0.0024681555829613,0.00243903608945855,0.00126840879483706,-0.00325326314089614,0.000433127238928975,0.00318413958895983,-0.00218730507967082,-0.00215997474645196,0.00347743116798213,0.000381641080361291,-0.00386846113301872,0.00170609668420276,0.00314954481980452,-0.00350561137574437,-0.00139484351962064,0.00447271096814464,-0.000953433449490933,-0.0041785405828506,0.00331551050585875,0.00262765107887888,-0.00491929533975924,-7.18704250660491E-05,0.00524985141426703,-0.00280617352726569,-0.00404349531563406,0.00516853278008071,0.00144316080741622,-0.00627618517879813,0.00191925105845517,0.0056289331190568,-0.00512035927076301,-0.00317325724334911,0.00719132935258101,-0.000589612272010751,-0.00736292414672591,0.00469057627097558,0.00530297847970079,-0.00794200617648955,-0.00129647744381537,0.00924923020711763,-0.00373432840362349,-0.00791501546590152,0.00842163928219891,0.00389736664458609,-0.011295110166928,0.0020555637748947,0.0111677796777289,-0.00848992892419794,-0.00749635716629902,0.0135610709697855,0.000671076587397651,-0.0154338924551613,0.0079561637860603,0.0127898787703254,-0.0162388913897591,-0.00526475797275278,0.0215797439488404,-0.00634121352590134,-0.0214826960226013,0.019966274147892,0.0139645410907531,-0.0325103141492424,0.00213704308727536,0.0399948772060035,-0.0274888585828161,-0.037279250320098,0.0641463640329209,0.0145779825681,-0.126504455983467,0.0786421401671125,0.506728598758666,0.506728598758666,0.0786421401671125,-0.126504455983467,0.0145779825681,0.0641463640329209,-0.037279250320098,-0.0274888585828161,0.0399948772060035,0.00213704308727536,-0.0325103141492424,0.0139645410907531,0.019966274147892,-0.0214826960226013,-0.00634121352590134,0.0215797439488404,-0.00526475797275278,-0.0162388913897591,0.0127898787703254,0.0079561637860603,-0.0154338924551613,0.000671076587397651,0.0135610709697855,-0.00749635716629902,-0.00848992892419794,0.0111677796777289,0.0020555637748947,-0.011295110166928,0.00389736664458609,0.00842163928219891,-0.00791501546590152,-0.00373432840362349,0.00924923020711763,-0.00129647744381537,-0.00794200617648955,0.00530297847970079,0.00469057627097558,-0.00736292414672591,-0.000589612272010751,0.00719132935258101,-0.00317325724334911,-0.00512035927076301,0.0056289331190568,0.00191925105845517,-0.00627618517879813,0.00144316080741622,0.00516853278008071,-0.00404349531563406,-0.00280617352726569,0.00524985141426703,-7.18704250660491E-05,-0.00491929533975924,0.00262765107887888,0.00331551050585875,-0.0041785405828506,-0.000953433449490933,0.00447271096814464,-0.00139484351962064,-0.00350561137574437,0.00314954481980452,0.00170609668420276,-0.00386846113301872,0.000381641080361291,0.00347743116798213,-0.00215997474645196,-0.00218730507967082,0.00318413958895983,0.000433127238928975,-0.00325326314089614,0.00126840879483706,0.00243903608945855,-0.0024681555829613,-0.00104460347362001,0.00289330496474233,-0.000500317507599693,-0.00250098725330123,0.00176954245974004,0.00147119075911662,-0.00245096017975489,-0.000138106981033625,0.00241464069600738,-0.00111695893654899,-0.00173358741282391,0.00196895582951742,0.000646952878530947,-0.0022220637081218,0.000529950038293372,0.00186573761448941,-0.00147264027521915,-0.00103443762769292,0.00195903461840182,-1.36365580701671E-05,-0.00189219023278422,0.000993619728763142,0.0013270023137392,-0.0016606720248401,-0.00044178370171816,0.00185969401209866,-0.000530574893341484,-0.00157346018738052,0.00134107308241683,0.000888752786648267,-0.00180566335543423,1.98508894220489E-05,0.00183169811938809,-0.000941276391966281,-0.00142441485176756,0.00168451878532286,0.000676572446990261,-0.00211357747379021,0.0002672769219175,0.0021658296013993,-0.00125868517522442,-0.00185755051552303,0.00218268173023106,0.00126640724204992,-0.00299208744409175,-0.000499069533142044,0.00375939503654242,-0.000300686655406097,-0.00475901494389311,0.000846109764748419,0.00670767635540093,0.000172476406099431,-0.0112209575611251,-0.0133831717698789,-0.00704072042245734,-0.00148005009454812]
-coefLPF35Hz=[0.00286052451911446,0.00689421894477802,0.000171791260094445,-0.0144315746331356,-0.0134938248246984,-0.000249484609270549,-0.000671542361469203,-0.0064451817937964,-0.00032085706393209,0.00175328513357562,-0.00352026969578768,-0.000257307004630263,0.00205840265719351,-0.00238087884525104,-0.000168932836887247,0.00192173117262515,-0.00193615902178963,-3.53434309625143E-05,0.00171718397701454,-0.00177974670711542,0.000139066746247014,0.0015171779876459,-0.00174456484806256,0.000353996185123452,0.0013219790662887,-0.0017671925849572,0.000596417648886558,0.0011173477094727,-0.00181116036772361,0.000857558614255232,0.000889049431354982,-0.00184892568098015,0.0011375712932949,0.000630151798346483,-0.00186356450853915,0.00142799234110786,0.000332362777376675,-0.00184287748015974,0.00171977246041933,-5.00436100187582E-06,-0.00177465897736845,0.00199715931517009,-0.000383014929836591,-0.00164258366184916,0.00224878689306432,-0.00080319460729486,-0.00143774217837556,0.00246557085941545,-0.0012572328064487,-0.00115723493398223,0.00262718577560355,-0.00173537056367451,-0.000793835522824425,0.0027170377341635,-0.00222463175880611,-0.000340006231455586,0.00272509318148554,-0.00270970851023106,0.000196150754813349,0.00263130056319846,-0.00316999266261455,0.000809539046283863,0.0024161143480868,-0.00358446661134107,0.00150001685777166,0.00207621527499821,-0.00393067164845756,0.0022443944788561,0.00159669358376555,-0.00417811636073852,0.00302948585478434,0.000969312957234955,-0.00430105711642147,0.00383661655588089,0.000195554049530546,-0.0042722359587213,0.0046308151261068,-0.000736167101841015,-0.00406836697987848,0.00539397866464288,-0.00180408887336609,-0.00366341360495056,0.00607616995314641,-0.00300737762511807,-0.00302593047118286,0.00665032714309213,-0.00433308743532193,-0.00215445007587822,0.00705545064893274,-0.00574165321873578,-0.00097682017869419,0.00726947791771135,-0.00724312597862948,0.000464470915382251,0.00720806728386651,-0.00876738247590412,0.00227762810857135,0.00685116297811635,-0.0103211531443027,0.00443365877044031,0.00610753280826822,-0.0118487957548325,0.00699299533574618,0.00487186009458921,-0.0133101155323796,0.0100706450135081,0.00303333581720301,-0.0146900867592252,0.0137725120166987,0.000368418422395496,-0.0159516124016022,0.0183653175519431,-0.00349368565245596,-0.0170516047489627,0.0244245074532579,-0.0092758902561387,-0.0179660756596518,0.0332198397743336,-0.0187627486034801,-0.0186773470137127,0.0484211207517772,-0.037682798284909,-0.0191615315459978,0.0865225708490084,-0.0992525009950619,-0.0194064738508026,0.56076681307655,0.56076681307655,-0.0194064738508026,-0.0992525009950619,0.0865225708490084,-0.0191615315459978,-0.037682798284909,0.0484211207517772,-0.0186773470137127,-0.0187627486034801,0.0332198397743336,-0.0179660756596518,-0.0092758902561387,0.0244245074532579,-0.0170516047489627,-0.00349368565245596,0.0183653175519431,-0.0159516124016022,0.000368418422395496,0.0137725120166987,-0.0146900867592252,0.00303333581720301,0.0100706450135081,-0.0133101155323796,0.00487186009458921,0.00699299533574618,-0.0118487957548325,0.00610753280826822,0.00443365877044031,-0.0103211531443027,0.00685116297811635,0.00227762810857135,-0.00876738247590412,0.00720806728386651,0.000464470915382251,-0.00724312597862948,0.00726947791771135,-0.00097682017869419,-0.00574165321873578,0.00705545064893274,-0.00215445007587822,-0.00433308743532193,0.00665032714309213,-0.00302593047118286,-0.00300737762511807,0.00607616995314641,-0.00366341360495056,-0.00180408887336609,0.00539397866464288,-0.00406836697987848,-0.000736167101841015,0.0046308151261068,-0.0042722359587213,0.000195554049530546,0.00383661655588089,-0.00430105711642147,0.000969312957234955,0.00302948585478434,-0.00417811636073852,0.00159669358376555,0.0022443944788561,-0.00393067164845756,0.00207621527499821,0.00150001685777166,-0.00358446661134107,0.0024161143480868,0.000809539046283863,-0.00316999266261455,0.00263130056319846,0.000196150754813349,-0.00270970851023106,0.00272509318148554,-0.000340006231455586,-0.00222463175880611,0.0027170377341635,-0.000793835522824425,-0.00173537056367451,0.00262718577560355,-0.00115723493398223,-0.0012572328064487,0.00246557085941545,-0.00143774217837556,-0.00080319460729486,0.00224878689306432,-0.00164258366184916,-0.000383014929836591,0.00199715931517009,-0.00177465897736845,-5.00436100187582E-06,0.00171977246041933,-0.00184287748015974,0.000332362777376675,0.00142799234110786,-0.00186356450853915,0.000630151798346483,0.0011375712932949,-0.00184892568098015,0.000889049431354982,0.000857558614255232,-0.00181116036772361,0.0011173477094727,0.000596417648886558,-0.0017671925849572,0.0013219790662887,0.000353996185123452,-0.00174456484806256,0.0015171779876459,0.000139066746247014,-0.00177974670711542,0.00171718397701454,-3.53434309625143E-05,-0.00193615902178963,0.00192173117262515,-0.000168932836887247,-0.00238087884525104,0.00205840265719351,-0.000257307004630263,-0.00352026969578768,0.00175328513357562,-0.00032085706393209,-0.0064451817937964,-0.000671542361469203,-0.000249484609270549,-0.0134938248246984,-0.0144315746331356,0.000171791260094445,0.00689421894477802,0.00286052451911446]
-coefLPF40Hz=[7.36612113030118E-05,0.00827393685204169,0.0188050945694965,0.00613925324655648,-0.00839028517336533,0.00237873365816439,0.00303237825476885,-0.00460025972929725,0.00281322712580925,0.000227663593700988,-0.0024980484002123,0.00297768588751064,-0.00180213833294673,-0.000130227284429429,0.00174778578506937,-0.00231795963726925,0.0017106165411535,-0.000344707845255587,-0.00107784511273602,0.00190516898179935,-0.00180551172784913,0.000884727917743335,0.000400104346154563,-0.00146093557974357,0.00183763439589299,-0.00138382593363797,0.000321140607103956,0.000881335824933475,-0.00169117228201986,0.00175166833939549,-0.00103328514788442,-0.000154861470637748,0.00129607108153636,-0.00188354469522702,0.00164461219601313,-0.000668416992729401,-0.000636368082309153,0.00169776728789737,-0.00203733392039835,0.00148182872841004,-0.000238535453181885,-0.00115949544259279,0.00209454052112559,-0.00212993830852947,0.0012106024738346,0.000288177747488429,-0.00172752872071627,0.00245436690199692,-0.00211568667934729,0.000807474903527144,0.000921170457340089,-0.00231751703201615,0.00274094652895069,-0.00195668339040572,0.000255594743747733,0.00164559205530941,-0.00290377166050596,0.0029196262011907,-0.00162444931154245,-0.000465092245270892,0.00245269541350386,-0.00344310316102585,0.00293741118678849,-0.0010829571032893,-0.00135513425855896,0.00330977586999722,-0.00388188084622404,0.00273626039149349,-0.000312477057313763,-0.00240155984277346,0.00415347493242287,-0.00417662735758531,0.00227645109708154,0.000704539469828412,-0.0035593497149859,0.00498355659187566,-0.0042241367934493,0.00154815010617744,0.00198470262286463,-0.00484782679903402,0.00568199046986206,-0.00401438838694565,0.000454141244284714,0.00354245528866161,-0.0061957451245992,0.0062096224579838,-0.00343435183116884,-0.00105425471520864,0.00537055366578375,-0.00755991370042115,0.00647907907411835,-0.0023988356987672,-0.00304184372667103,0.00749691741180904,-0.00889727149365176,0.00638118068657657,-0.000779769194531045,-0.00562045516763908,0.00998075819303377,-0.0101648607099072,0.00575600872996527,0.00165333265047048,-0.00898941668150813,0.0129129212860991,-0.0113126129802686,0.00437726525133766,0.00529266590989373,-0.0135879300429532,0.0165807673509755,-0.0122939995811387,0.00175794400406478,0.01102500316598,-0.0204964781579532,0.0218147669507226,-0.0130551786185287,-0.00344535218506123,0.0215174539626792,-0.0330886773126452,0.0313146893535734,-0.0135919720087032,-0.0164753519278216,0.0490847107383775,-0.0701348676654205,0.0639762816079425,-0.0138641519368914,-0.113212843391097,0.601013642839604,0.601013642839604,-0.113212843391097,-0.0138641519368914,0.0639762816079425,-0.0701348676654205,0.0490847107383775,-0.0164753519278216,-0.0135919720087032,0.0313146893535734,-0.0330886773126452,0.0215174539626792,-0.00344535218506123,-0.0130551786185287,0.0218147669507226,-0.0204964781579532,0.01102500316598,0.00175794400406478,-0.0122939995811387,0.0165807673509755,-0.0135879300429532,0.00529266590989373,0.00437726525133766,-0.0113126129802686,0.0129129212860991,-0.00898941668150813,0.00165333265047048,0.00575600872996527,-0.0101648607099072,0.00998075819303377,-0.00562045516763908,-0.000779769194531045,0.00638118068657657,-0.00889727149365176,0.00749691741180904,-0.00304184372667103,-0.0023988356987672,0.00647907907411835,-0.00755991370042115,0.00537055366578375,-0.00105425471520864,-0.00343435183116884,0.0062096224579838,-0.0061957451245992,0.00354245528866161,0.000454141244284714,-0.00401438838694565,0.00568199046986206,-0.00484782679903402,0.00198470262286463,0.00154815010617744,-0.0042241367934493,0.00498355659187566,-0.0035593497149859,0.000704539469828412,0.00227645109708154,-0.00417662735758531,0.00415347493242287,-0.00240155984277346,-0.000312477057313763,0.00273626039149349,-0.00388188084622404,0.00330977586999722,-0.00135513425855896,-0.0010829571032893,0.00293741118678849,-0.00344310316102585,0.00245269541350386,-0.000465092245270892,-0.00162444931154245,0.0029196262011907,-0.00290377166050596,0.00164559205530941,0.000255594743747733,-0.00195668339040572,0.00274094652895069,-0.00231751703201615,0.000921170457340089,0.000807474903527144,-0.00211568667934729,0.00245436690199692,-0.00172752872071627,0.000288177747488429,0.0012106024738346,-0.00212993830852947,0.00209454052112559,-0.00115949544259279,-0.000238535453181885,0.00148182872841004,-0.00203733392039835,0.00169776728789737,-0.000636368082309153,-0.000668416992729401,0.00164461219601313,-0.00188354469522702,0.00129607108153636,-0.000154861470637748,-0.00103328514788442,0.00175166833939549,-0.00169117228201986,0.000881335824933475,0.000321140607103956,-0.00138382593363797,0.00183763439589299,-0.00146093557974357,0.000400104346154563,0.000884727917743335,-0.00180551172784913,0.00190516898179935,-0.00107784511273602,-0.000344707845255587,0.0017106165411535,-0.00231795963726925,0.00174778578506937,-0.000130227284429429,-0.00180213833294673,0.00297768588751064,-0.0024980484002123,0.000227663593700988,0.00281322712580925,-0.00460025972929725,0.00303237825476885,0.00237873365816439,-0.00839028517336533,0.00613925324655648,0.0188050945694965,0.00827393685204169,7.36612113030118E-05]
-coefLPF45Hz=[-0.0027382121341004,-0.0174404549438097,-0.0129614801971657,0.00885050079202038,-0.00214700754063622,-0.00216619059354045,0.00401132877312635,-0.00409836859567159,0.00314068971781407,-0.00171530355299506,0.000244723890597958,0.000994960213342859,-0.00184548788163159,0.00225521099865984,-0.00224085828923458,0.00187436083667111,-0.00125831586968416,0.000510848073740786,0.000255509709013268,-0.000936380290568184,0.00144920273949241,-0.00173992550259079,0.00178546466929525,-0.00159167324965776,0.00119000952563327,-0.000635567133733494,1.05038309947559E-06,0.000633051715687953,-0.00118711105483685,0.00159088134430639,-0.00179314256986779,0.00176481908628002,-0.00150437060374632,0.00104087662162403,-0.000429793491071559,-0.000255820146803013,0.000928543181976206,-0.00150350228508029,0.00190257737434223,-0.00206776145162401,0.00196788126293586,-0.00160680794924692,0.00101763979696601,-0.000268997495178547,-0.000547357322107599,0.00133080125919313,-0.00196741933907828,0.00238409254496624,-0.00248952095854596,0.00230231796686082,-0.00175711760018838,0.00100650370010789,-3.68299930716522E-05,-0.000957124055830671,0.00187008287252561,-0.00261015304523408,0.00301320758596356,-0.003041289298096,0.00269258169231295,-0.0019539770464589,0.00090922657421777,0.000286575959732915,-0.00151282675323777,0.00261777023150532,-0.0034260490173765,0.00381172824671718,-0.0037267900366358,0.00315645164607254,-0.00213128915430411,0.000760992608096924,0.000776457324877985,-0.00228657311772807,0.00358556615996066,-0.00449397411652711,0.00485721772215617,-0.00459147306650435,0.00370736918836108,-0.00229285374528089,0.00049604526261404,0.0014780293071866,-0.00337776236068723,0.0049429466114495,-0.00594500684899198,0.00622227851119586,-0.00570171441581113,0.00440519291134889,-0.00244361631944692,2.79179820206164E-05,0.00255080665628862,-0.00496136524430927,0.0068761570121963,-0.00801348744092909,0.0081783871938505,-0.00728110636017627,0.00535097513618365,-0.0025702421303384,-0.000772581094241054,0.00426817298462864,-0.0074837884514361,0.00995931609201388,-0.0113338577335747,0.0113124877651764,-0.00979201422436936,0.00682743310270211,-0.00265721769796799,-0.00228246377547146,0.00744428228610514,-0.0121728633055491,0.0158033806245583,-0.0177383414378206,0.0175268612143534,-0.0149031506380631,0.00987892812122689,-0.00272835270241086,-0.00598451659647439,0.0154224874979788,-0.0245445354888713,0.0321743794978691,-0.0370479546765878,0.0378854147231694,-0.033423194271879,0.022307373911458,-0.00275518939952796,-0.0284684514067138,0.0796657312966307,-0.182342798033183,0.62644755347981,0.62644755347981,-0.182342798033183,0.0796657312966307,-0.0284684514067138,-0.00275518939952796,0.022307373911458,-0.033423194271879,0.0378854147231694,-0.0370479546765878,0.0321743794978691,-0.0245445354888713,0.0154224874979788,-0.00598451659647439,-0.00272835270241086,0.00987892812122689,-0.0149031506380631,0.0175268612143534,-0.0177383414378206,0.0158033806245583,-0.0121728633055491,0.00744428228610514,-0.00228246377547146,-0.00265721769796799,0.00682743310270211,-0.00979201422436936,0.0113124877651764,-0.0113338577335747,0.00995931609201388,-0.0074837884514361,0.00426817298462864,-0.000772581094241054,-0.0025702421303384,0.00535097513618365,-0.00728110636017627,0.0081783871938505,-0.00801348744092909,0.0068761570121963,-0.00496136524430927,0.00255080665628862,2.79179820206164E-05,-0.00244361631944692,0.00440519291134889,-0.00570171441581113,0.00622227851119586,-0.00594500684899198,0.0049429466114495,-0.00337776236068723,0.0014780293071866,0.00049604526261404,-0.00229285374528089,0.00370736918836108,-0.00459147306650435,0.00485721772215617,-0.00449397411652711,0.00358556615996066,-0.00228657311772807,0.000776457324877985,0.000760992608096924,-0.00213128915430411,0.00315645164607254,-0.0037267900366358,0.00381172824671718,-0.0034260490173765,0.00261777023150532,-0.00151282675323777,0.000286575959732915,0.00090922657421777,-0.0019539770464589,0.00269258169231295,-0.003041289298096,0.00301320758596356,-0.00261015304523408,0.00187008287252561,-0.000957124055830671,-3.68299930716522E-05,0.00100650370010789,-0.00175711760018838,0.00230231796686082,-0.00248952095854596,0.00238409254496624,-0.00196741933907828,0.00133080125919313,-0.000547357322107599,-0.000268997495178547,0.00101763979696601,-0.00160680794924692,0.00196788126293586,-0.00206776145162401,0.00190257737434223,-0.00150350228508029,0.000928543181976206,-0.000255820146803013,-0.000429793491071559,0.00104087662162403,-0.00150437060374632,0.00176481908628002,-0.00179314256986779,0.00159088134430639,-0.00118711105483685,0.000633051715687953,1.05038309947559E-06,-0.000635567133733494,0.00119000952563327,-0.00159167324965776,0.00178546466929525,-0.00173992550259079,0.00144920273949241,-0.000936380290568184,0.000255509709013268,0.000510848073740786,-0.00125831586968416,0.00187436083667111,-0.00224085828923458,0.00225521099865984,-0.00184548788163159,0.000994960213342859,0.000244723890597958,-0.00171530355299506,0.00314068971781407,-0.00409836859567159,0.00401132877312635,-0.00216619059354045,-0.00214700754063622,0.00885050079202038,-0.0129614801971657,-0.0174404549438097,-0.0027382121341004]
-coefLPF50Hz=[4.24129636085939E-05,-1.44144608481753E-05,1.68477257729405E-05,-1.95429436854322E-05,2.2515532174184E-05,-2.5778413160858E-05,2.9345656442446E-05,-3.32429164088226E-05,3.7509396980674E-05,-4.21804584701592E-05,4.72591340363865E-05,-5.2724316383931E-05,5.86239951202531E-05,-6.51011611748688E-05,7.197814844332E-05,-7.94442363716891E-05,8.74518037268674E-05,-9.60566979404931E-05,0.000105291644636488,-0.000115186129284405,0.000125764594101103,-0.000137059462188628,0.000149117083699554,-0.000161976580320718,0.000175654500452997,-0.000190190966135315,0.000205658284438052,-0.00022204974525455,0.000239450345335136,-0.000257876360451826,0.000277379201163254,-0.000298004636527769,0.000319802323596859,-0.000342815842677618,0.000367088105389084,-0.000392673319065413,0.000419628665633698,-0.000447998116634612,0.000477836054669347,-0.000509210343728559,0.000542157895936,-0.000576759288867365,0.000613062871554776,-0.000651133087240805,0.00069103130210672,-0.000732826240481196,0.000776585362835747,-0.000822373803361809,0.000870263461542994,-0.00092033127614315,0.000972648491458731,-0.00102729512274613,0.00108435774920304,-0.00114390732935177,0.00120604247063003,-0.00127084710597034,0.00133841651041394,-0.00140884425695555,0.00148223195515611,-0.00155868501203943,0.00163831035816187,-0.00172122206514721,0.00180754054574769,-0.00189738600842842,0.00199089092405301,-0.00208819625795861,0.00218943775903483,-0.00229477381274086,0.00240436099150359,-0.00251837141956318,0.00263698327532467,-0.00276038811437691,0.0028887897135375,-0.00302240353983719,0.00316146245210489,-0.00330621621280179,0.00345692701065983,-0.00361388217041031,0.00377739269687961,-0.003947786117468,0.00412542650117025,-0.00431070095356731,0.00450403519238077,-0.00470589061151361,0.00491677276831298,-0.00513723483572884,0.00536788177589627,-0.00560938228809345,0.00586247525245848,-0.00612797298864552,0.00640678101789621,-0.00669990767027243,0.00700847333005711,-0.00733373996533251,0.00767711974925497,-0.00804020815878503,0.00842480967027692,-0.00883297654239881,0.00926705118988397,-0.00972971591141536,0.0102240628125216,-0.0107536730762436,0.0113227116091812,-0.0119360597287647,0.0125994700715301,-0.0133197660462447,0.0141051134925248,-0.0149653548162374,0.0159124683654527,-0.0169611758785403,0.01812977642118,-0.0194413011122754,0.0209251405496964,-0.0226194062836882,0.0245744175306759,-0.0268580047689287,0.0295638577244138,-0.0328251295819524,0.0368376486177606,-0.0419017115157253,0.0485024348599068,-0.0574777789438847,0.0704105939881028,-0.0906927500513817,0.127143180418914,-0.212098082465704,0.636583595233109,0.636583595233109,-0.212098082465704,0.127143180418914,-0.0906927500513817,0.0704105939881028,-0.0574777789438847,0.0485024348599068,-0.0419017115157253,0.0368376486177606,-0.0328251295819524,0.0295638577244138,-0.0268580047689287,0.0245744175306759,-0.0226194062836882,0.0209251405496964,-0.0194413011122754,0.01812977642118,-0.0169611758785403,0.0159124683654527,-0.0149653548162374,0.0141051134925248,-0.0133197660462447,0.0125994700715301,-0.0119360597287647,0.0113227116091812,-0.0107536730762436,0.0102240628125216,-0.00972971591141536,0.00926705118988397,-0.00883297654239881,0.00842480967027692,-0.00804020815878503,0.00767711974925497,-0.00733373996533251,0.00700847333005711,-0.00669990767027243,0.00640678101789621,-0.00612797298864552,0.00586247525245848,-0.00560938228809345,0.00536788177589627,-0.00513723483572884,0.00491677276831298,-0.00470589061151361,0.00450403519238077,-0.00431070095356731,0.00412542650117025,-0.003947786117468,0.00377739269687961,-0.00361388217041031,0.00345692701065983,-0.00330621621280179,0.00316146245210489,-0.00302240353983719,0.0028887897135375,-0.00276038811437691,0.00263698327532467,-0.00251837141956318,0.00240436099150359,-0.00229477381274086,0.00218943775903483,-0.00208819625795861,0.00199089092405301,-0.00189738600842842,0.00180754054574769,-0.00172122206514721,0.00163831035816187,-0.00155868501203943,0.00148223195515611,-0.00140884425695555,0.00133841651041394,-0.00127084710597034,0.00120604247063003,-0.00114390732935177,0.00108435774920304,-0.00102729512274613,0.000972648491458731,-0.00092033127614315,0.000870263461542994,-0.000822373803361809,0.000776585362835747,-0.000732826240481196,0.00069103130210672,-0.000651133087240805,0.000613062871554776,-0.000576759288867365,0.000542157895936,-0.000509210343728559,0.000477836054669347,-0.000447998116634612,0.000419628665633698,-0.000392673319065413,0.000367088105389084,-0.000342815842677618,0.000319802323596859,-0.000298004636527769,0.000277379201163254,-0.000257876360451826,0.000239450345335136,-0.00022204974525455,0.000205658284438052,-0.000190190966135315,0.000175654500452997,-0.000161976580320718,0.000149117083699554,-0.000137059462188628,0.000125764594101103,-0.000115186129284405,0.000105291644636488,-9.60566979404931E-05,8.74518037268674E-05,-7.94442363716891E-05,7.197814844332E-05,-6.51011611748688E-05,5.86239951202531E-05,-5.2724316383931E-05,4.72591340363865E-05,-4.21804584701592E-05,3.7509396980674E-05,-3.32429164088226E-05,2.9345656442446E-05,-2.5778413160858E-05,2.2515532174184E-05,-1.95429436854322E-05,1.68477257729405E-05,-1.44144608481753E-05,4.24129636085939E-05]
-coefHPF5Hz=[0.00956007782594759,-0.0119176027996869,-0.0040560930682953,0.000451711663614908,0.00254849655334898,0.00303319459044621,0.00254717379017194,0.00158757402200011,0.000509750124632545,-0.000445931800717611,-0.00114440820947483,-0.00152749311293889,-0.00160056296860589,-0.0014048024889439,-0.00101349500191313,-0.000505704527088071,3.4630457999579E-05,0.000533987444071884,0.000929113881584981,0.00117822309625131,0.00125677958927932,0.00116518717174205,0.000917512560829131,0.000553842727893304,0.000117378352320078,-0.000331754088250172,-0.000743173079020418,-0.00105895613394743,-0.00124401548742318,-0.00126779301115785,-0.00112878042160233,-0.000835126376257162,-0.000426252778261492,5.42263178990552E-05,0.000540569017502663,0.000978082108973409,0.00129901293560305,0.00146673171276073,0.00144252934852769,0.00123478448242562,0.000843030217041633,0.000339793545858787,-0.000256357769064973,-0.000813266865992743,-0.00132235621421503,-0.00165989291080789,-0.00178850061363651,-0.00171593782891683,-0.00138460418915006,-0.000858882668536566,-0.000206302696043146,0.000509292010973746,0.00120700725449702,0.00176884045836107,0.00211993785248337,0.00221263579098581,0.00202733911908571,0.00155759575974907,0.000852900664184838,1.74272399605713E-06,-0.000885053032921335,-0.00170126185249503,-0.00233784361427153,-0.00270425278249918,-0.00272777571783961,-0.00239225333882745,-0.00172134453422739,-0.000795856580832849,0.000281822176007718,0.00137783213071209,0.00235547561195798,0.00307336156249977,0.00342364988796638,0.00333824832575134,0.00281151976281671,0.00188793252883805,0.000671828747820565,-0.000698509513111541,-0.00205011261539409,-0.00321077882035894,-0.0040103966455072,-0.004328125135415,-0.00408916174661264,-0.00330530423782223,-0.00203996802711605,-0.000444631448005178,0.00129940137121533,0.00297204031417107,0.00434793311483168,0.00524228198104264,0.00549182042686709,0.00504102929122049,0.00390181515469458,0.00217906073693199,7.0163766985848E-05,-0.00217227057066891,-0.00427277572704477,-0.00594216229096958,-0.00693763215316691,-0.00709051079518505,-0.00632615297110937,-0.00467856232852844,-0.00230240355227384,0.000540624326947068,0.0035109425308065,0.00623752603684671,0.00833973935097155,0.00950171702392821,0.00949900249486947,0.00824753758181271,0.00580622788465951,0.00239457347462657,-0.00162748428564587,-0.00579049843789324,-0.00956912702332021,-0.0124374540138304,-0.0139352885987373,-0.0137294091468719,-0.0116686657297549,-0.00781534010581268,-0.00246256031142502,0.00388358174582781,0.0105361274595354,0.0166892175872121,0.0214838035818804,0.0241036682629298,0.02385928987272,0.0202704198386493,0.0131232502048367,0.00250776284996433,-0.0111524062379253,-0.0271488888713128,-0.0445067687835018,-0.0620892775787776,-0.0786708175508969,-0.0930575519910038,-0.10418917447198,-0.111225318806401,0.886370131727763,-0.111225318806401,-0.10418917447198,-0.0930575519910038,-0.0786708175508969,-0.0620892775787776,-0.0445067687835018,-0.0271488888713128,-0.0111524062379253,0.00250776284996433,0.0131232502048367,0.0202704198386493,0.02385928987272,0.0241036682629298,0.0214838035818804,0.0166892175872121,0.0105361274595354,0.00388358174582781,-0.00246256031142502,-0.00781534010581268,-0.0116686657297549,-0.0137294091468719,-0.0139352885987373,-0.0124374540138304,-0.00956912702332021,-0.00579049843789324,-0.00162748428564587,0.00239457347462657,0.00580622788465951,0.00824753758181271,0.00949900249486947,0.00950171702392821,0.00833973935097155,0.00623752603684671,0.0035109425308065,0.000540624326947068,-0.00230240355227384,-0.00467856232852844,-0.00632615297110937,-0.00709051079518505,-0.00693763215316691,-0.00594216229096958,-0.00427277572704477,-0.00217227057066891,7.0163766985848e-05,0.00217906073693199,0.00390181515469458,0.00504102929122049,0.00549182042686709,0.00524228198104264,0.00434793311483168,0.00297204031417107,0.00129940137121533,-0.000444631448005178,-0.00203996802711605,-0.00330530423782223,-0.00408916174661264,-0.004328125135415,-0.0040103966455072,-0.00321077882035894,-0.00205011261539409,-0.000698509513111541,0.000671828747820565,0.00188793252883805,0.00281151976281671,0.00333824832575134,0.00342364988796638,0.00307336156249977,0.00235547561195798,0.00137783213071209,0.000281822176007718,-0.000795856580832849,-0.00172134453422739,-0.00239225333882745,-0.00272777571783961,-0.00270425278249918,-0.00233784361427153,-0.00170126185249503,-0.000885053032921335,1.74272399605713e-06,0.000852900664184838,0.00155759575974907,0.00202733911908571,0.00221263579098581,0.00211993785248337,0.00176884045836107,0.00120700725449702,0.000509292010973746,-0.000206302696043146,-0.000858882668536566,-0.00138460418915006,-0.00171593782891683,-0.00178850061363651,-0.00165989291080789,-0.00132235621421503,-0.000813266865992743,-0.000256357769064973,0.000339793545858787,0.000843030217041633,0.00123478448242562,0.00144252934852769,0.00146673171276073,0.00129901293560305,0.000978082108973409,0.000540569017502663,5.42263178990552e-05,-0.000426252778261492,-0.000835126376257162,-0.00112878042160233,-0.00126779301115785,-0.00124401548742318,-0.00105895613394743,-0.000743173079020418,-0.000331754088250172,0.000117378352320078,0.000553842727893304,0.000917512560829131,0.00116518717174205,0.00125677958927932,0.00117822309625131,0.000929113881584981,0.000533987444071884,3.4630457999579e-05,-0.000505704527088071,-0.00101349500191313,-0.0014048024889439,-0.00160056296860589,-0.00152749311293889,-0.00114440820947483,-0.000445931800717611,0.000509750124632545,0.00158757402200011,0.00254717379017194,0.00303319459044621,0.00254849655334898,0.000451711663614908,-0.0040560930682953,-0.0119176027996869,0.00956007782594759]
-coefHPF10Hz=[0.00123469009337073,0.00239749232727201,-0.0123791868131472,0.00829135027219673,0.00418789272530291,0.000225689150144595,-0.00278237350388411,-0.00292822734030507,-0.00126114060129885,0.000759113427999958,0.00194921392663312,0.00188339593772406,0.000850057680615835,-0.000471358557635888,-0.00139920204295161,-0.00154958902242173,-0.000946006014165002,5.22634602700881E-05,0.000957427182190283,0.00136818014171268,0.00113391583562883,0.000395932199907064,-0.000496544406180367,-0.00114919973708007,-0.00127387299881767,-0.000828481574886906,-1.50173421376014E-05,0.000809620029628358,0.00127841306062181,0.00118245913237242,0.000559081552466721,-0.000327451558746776,-0.00108763598038631,-0.00138642467254688,-0.00107143017240647,-0.000269165103159191,0.000682141924400051,0.00136191276947935,0.00145850865218403,0.000906264264819541,-7.47112517844297E-05,-0.00106463239595381,-0.00162087854397832,-0.00147374658895577,-0.000658658495032717,0.000490403834452415,0.0014732387473149,0.00183928248514669,0.00139770088922839,0.000306955281073004,-0.000975628985224327,-0.00188303474629927,-0.00198895756633454,-0.00120439852764102,0.000160052243162782,0.00151993761508449,0.00226482311130504,0.00202892837233549,0.000871590452911773,-0.000737207657255676,-0.0020966930502979,-0.00258201457845414,-0.00193225143978664,-0.00038433425922951,0.0014155063588051,0.00267212550274639,0.00279674840540765,0.00167098758750123,-0.00026051249834263,-0.00217830460285669,-0.00321460910878787,-0.00286975159529452,-0.00121447450106909,0.00106967411626427,0.00299668255814361,0.00368001030406367,0.00274900161519657,0.000541977122203466,-0.00203502599590237,-0.00383235710095452,-0.00400718129412822,-0.00240076220644521,0.000371256448256948,0.00312941057589494,0.00463455276995535,0.00415013222789188,0.00177795029404479,-0.00152478649897084,-0.00433334757996004,-0.00535929103697442,-0.00404442429701913,-0.000837179537584939,0.00293430426910719,0.00561673413435485,0.00593812790954361,0.00362003238572849,-0.000473503610047654,-0.00461158373790045,-0.00693014815570768,-0.00629384992661184,-0.00279944936541034,0.00222378839053935,0.0065439272565822,0.00823967970210631,0.00634946334736252,0.0014536053571985,-0.00445548602805887,-0.00880646686446852,-0.00949884623367249,-0.00596915023297181,0.000554449964388657,0.00736733722754003,0.0114383007873,0.0106677557954673,0.00497820459123207,-0.00352295991910257,-0.0112455560839266,-0.0146292848265082,-0.0116796331887723,-0.00304516619122563,0.00801356947409237,0.0167432608901378,0.0188711510132322,0.0125201373508605,-0.000610155499552467,-0.0155408812582302,-0.0256998348700916,-0.0255534090388355,-0.0131437858034926,0.00842277605791738,0.0313393510898926,0.045295293407581,0.0409693803047795,0.0135247417264063,-0.0350483808632794,-0.0957981921053217,-0.154972966696025,-0.197956945442086,0.786341251026435,-0.197956945442086,-0.154972966696025,-0.0957981921053217,-0.0350483808632794,0.0135247417264063,0.0409693803047795,0.045295293407581,0.0313393510898926,0.00842277605791738,-0.0131437858034926,-0.0255534090388355,-0.0256998348700916,-0.0155408812582302,-0.000610155499552467,0.0125201373508605,0.0188711510132322,0.0167432608901378,0.00801356947409237,-0.00304516619122563,-0.0116796331887723,-0.0146292848265082,-0.0112455560839266,-0.00352295991910257,0.00497820459123207,0.0106677557954673,0.0114383007873,0.00736733722754003,0.000554449964388657,-0.00596915023297181,-0.00949884623367249,-0.00880646686446852,-0.00445548602805887,0.0014536053571985,0.00634946334736252,0.00823967970210631,0.0065439272565822,0.00222378839053935,-0.00279944936541034,-0.00629384992661184,-0.00693014815570768,-0.00461158373790045,-0.000473503610047654,0.00362003238572849,0.00593812790954361,0.00561673413435485,0.00293430426910719,-0.000837179537584939,-0.00404442429701913,-0.00535929103697442,-0.00433334757996004,-0.00152478649897084,0.00177795029404479,0.00415013222789188,0.00463455276995535,0.00312941057589494,0.000371256448256948,-0.00240076220644521,-0.00400718129412822,-0.00383235710095452,-0.00203502599590237,0.000541977122203466,0.00274900161519657,0.00368001030406367,0.00299668255814361,0.00106967411626427,-0.00121447450106909,-0.00286975159529452,-0.00321460910878787,-0.00217830460285669,-0.00026051249834263,0.00167098758750123,0.00279674840540765,0.00267212550274639,0.0014155063588051,-0.00038433425922951,-0.00193225143978664,-0.00258201457845414,-0.0020966930502979,-0.000737207657255676,0.000871590452911773,0.00202892837233549,0.00226482311130504,0.00151993761508449,0.000160052243162782,-0.00120439852764102,-0.00198895756633454,-0.00188303474629927,-0.000975628985224327,0.000306955281073004,0.00139770088922839,0.00183928248514669,0.0014732387473149,0.000490403834452415,-0.000658658495032717,-0.00147374658895577,-0.00162087854397832,-0.00106463239595381,-7.47112517844297E-05,0.000906264264819541,0.00145850865218403,0.00136191276947935,0.000682141924400051,-0.000269165103159191,-0.00107143017240647,-0.00138642467254688,-0.00108763598038631,-0.000327451558746776,0.000559081552466721,0.00118245913237242,0.00127841306062181,0.000809620029628358,-1.50173421376014E-05,-0.000828481574886906,-0.00127387299881767,-0.00114919973708007,-0.000496544406180367,0.000395932199907064,0.00113391583562883,0.00136818014171268,0.000957427182190283,5.22634602700881E-05,-0.000946006014165002,-0.00154958902242173,-0.00139920204295161,-0.000471358557635888,0.000850057680615835,0.00188339593772406,0.00194921392663312,0.000759113427999958,-0.00126114060129885,-0.00292822734030507,-0.00278237350388411,0.000225689150144595,0.00418789272530291,0.00829135027219673,-0.0123791868131472,0.00239749232727201,0.00123469009337073]
-coefHPF15Hz=[0.00120024140099883,-0.00136509920262565,-0.00520353735064067,0.0120786506300163,-0.00614668775625168,-0.00314986361588413,0.000210209089711227,0.00332092755637587,0.00149240066007135,-0.00132233672535468,-0.00227761576916585,-0.000722248479938449,0.0012943835770711,0.00177237842188208,0.000479597096605921,-0.00113014662226976,-0.00152217778307077,-0.00045401128641424,0.000962243028333411,0.00139955479557237,0.000524512653386634,-0.000797572614373339,-0.00134063945931436,-0.000646368717664872,0.000627054129654277,0.00131421745083579,0.000797528869315662,-0.000447767796561566,-0.00129337534635084,-0.000963860964858922,0.000251723908112382,0.00125822982893514,0.00113912042431511,-3.10936876385792E-05,-0.00120400216476671,-0.00130927309279872,-0.000215501687124437,0.00111647935723651,0.00146841604859796,0.000485360837304459,-0.00098307350541769,-0.00161156135933677,-0.000776952287530353,0.00080749184330139,0.00171655437395344,0.00108666900530773,-0.000574710575963945,-0.00178484891157528,-0.00140314176685955,0.000288550197873234,0.00179602363184048,0.0017213536240925,5.37107668501137E-05,-0.00174740969076711,-0.00202359892027175,-0.000446882760760354,0.00162350951418753,0.00229800620689236,0.00088559258413297,-0.00141650370934892,-0.00252793264354116,-0.00136191099931978,0.00112114063775823,0.00269540509838085,0.0018633161154757,-0.000732375159819485,-0.00278359388270996,-0.00237373934177199,0.000248315416089954,0.00277630881290884,0.0028742824861056,0.000327158436557675,-0.00265506902461556,-0.00334613596048093,-0.000985378486578744,0.00240685356721675,0.00376079801999955,0.0017183715453262,-0.00201940347804215,-0.00409599542886101,-0.00250466219098918,0.00148191198112791,0.00432029117563986,0.00332753309253442,-0.000790175649216528,-0.0044058436390254,-0.00415869414599191,-6.18577854478425E-05,0.00432610231819539,0.00497073116751479,0.00106725744067292,-0.00405092084700966,-0.00573136070975185,-0.00221763209435298,0.00355684818694419,0.0063980005183044,0.00350119439553184,-0.00281743534814031,-0.00693093611197924,-0.00489659077593103,0.00180756165303163,0.00728278769234926,0.00637965633833288,-0.000500713685971631,-0.00740102758947497,-0.00792706507626393,-0.00112842383006774,0.00723096027200619,0.00950880173583929,0.00310830550148127,-0.00670913634571464,-0.0110857279503915,-0.00548260005535713,0.00575106842763446,0.012631071315412,0.00830349228068501,-0.00424865951137071,-0.0140855838717201,-0.0117014306415398,0.00203273201336909,0.0154543070510765,0.0158266774045227,0.00117010848072356,-0.0166570051191093,-0.0211131268516463,-0.00585433506126223,0.0177018060726328,0.0283267834151208,0.0131536886590872,-0.0185430041406967,-0.0395657098395368,-0.0261357334111923,0.0191523989795444,0.0620740881213981,0.0570309954383573,-0.0195303152490594,-0.146546153437764,-0.265294447163656,0.686326929185213,-0.265294447163656,-0.146546153437764,-0.0195303152490594,0.0570309954383573,0.0620740881213981,0.0191523989795444,-0.0261357334111923,-0.0395657098395368,-0.0185430041406967,0.0131536886590872,0.0283267834151208,0.0177018060726328,-0.00585433506126223,-0.0211131268516463,-0.0166570051191093,0.00117010848072356,0.0158266774045227,0.0154543070510765,0.00203273201336909,-0.0117014306415398,-0.0140855838717201,-0.00424865951137071,0.00830349228068501,0.012631071315412,0.00575106842763446,-0.00548260005535713,-0.0110857279503915,-0.00670913634571464,0.00310830550148127,0.00950880173583929,0.00723096027200619,-0.00112842383006774,-0.00792706507626393,-0.00740102758947497,-0.000500713685971631,0.00637965633833288,0.00728278769234926,0.00180756165303163,-0.00489659077593103,-0.00693093611197924,-0.00281743534814031,0.00350119439553184,0.0063980005183044,0.00355684818694419,-0.00221763209435298,-0.00573136070975185,-0.00405092084700966,0.00106725744067292,0.00497073116751479,0.00432610231819539,-6.18577854478425E-05,-0.00415869414599191,-0.0044058436390254,-0.000790175649216528,0.00332753309253442,0.00432029117563986,0.00148191198112791,-0.00250466219098918,-0.00409599542886101,-0.00201940347804215,0.0017183715453262,0.00376079801999955,0.00240685356721675,-0.000985378486578744,-0.00334613596048093,-0.00265506902461556,0.000327158436557675,0.0028742824861056,0.00277630881290884,0.000248315416089954,-0.00237373934177199,-0.00278359388270996,-0.000732375159819485,0.0018633161154757,0.00269540509838085,0.00112114063775823,-0.00136191099931978,-0.00252793264354116,-0.00141650370934892,0.00088559258413297,0.00229800620689236,0.00162350951418753,-0.000446882760760354,-0.00202359892027175,-0.00174740969076711,5.37107668501137E-05,0.0017213536240925,0.00179602363184048,0.000288550197873234,-0.00140314176685955,-0.00178484891157528,-0.000574710575963945,0.00108666900530773,0.00171655437395344,0.00080749184330139,-0.000776952287530353,-0.00161156135933677,-0.00098307350541769,0.000485360837304459,0.00146841604859796,0.00111647935723651,-0.000215501687124437,-0.00130927309279872,-0.00120400216476671,-3.10936876385792E-05,0.00113912042431511,0.00125822982893514,0.000251723908112382,-0.000963860964858922,-0.00129337534635084,-0.000447767796561566,0.000797528869315662,0.00131421745083579,0.000627054129654277,-0.000646368717664872,-0.00134063945931436,-0.000797572614373339,0.000524512653386634,0.00139955479557237,0.000962243028333411,-0.00045401128641424,-0.00152217778307077,-0.00113014662226976,0.000479597096605921,0.00177237842188208,0.0012943835770711,-0.000722248479938449,-0.00227761576916585,-0.00132233672535468,0.00149240066007135,0.00332092755637587,0.000210209089711227,-0.00314986361588413,-0.00614668775625168,0.0120786506300163,-0.00520353735064067,-0.00136509920262565,0.00120024140099883]
-coefHPF20Hz=[0.00132019110824171,-0.00457152741704369,0.00576477329185775,-0.000218840272390312,-0.00752218394371693,0.00762883851445958,-0.00139719355650915,-0.000217308850439302,-0.00367711952656418,0.00370569866943775,0.000181547394562727,8.66720046320668E-05,-0.00280772909586353,0.0012778947902183,0.000991270120614408,0.00088775502971946,-0.00194303664016267,-0.000450930803092815,0.000608866697929736,0.00154684434950018,-0.000576628266356315,-0.00115529411312965,-0.000509271292355543,0.00130622276966022,0.000791676364366034,-0.000591602912913707,-0.00134320922069115,0.000114162285040054,0.00123304091844839,0.000676809820286326,-0.00102182079629598,-0.00112390914727603,0.000362149895592255,0.00142072306309046,0.000320060637832615,-0.00124126119996724,-0.00103864650253786,0.000764867079906537,0.00145916343579828,1.26358646343491E-05,-0.0015307224425407,-0.000821866289902842,0.00114223713759643,0.00148096128225545,-0.000399285836618603,-0.00175805339507477,-0.000537474140062217,0.00155120496091855,0.00140372607446878,-0.000868253855018997,-0.00193822453872312,-0.000143142383611989,0.00195682705204642,0.00121306055406137,-0.00139820900041229,-0.00203154577202864,0.000365506682815356,0.00233292009499697,0.000881735461371406,-0.00197006000508726,-0.0020004386901783,0.000986723869588249,0.00263694174094806,0.000397359626019014,-0.00255601721942226,-0.00180893647258209,0.00170390663618718,0.00282924117990717,-0.000251027345380887,-0.00311293833456452,-0.00143069467667567,0.00249246728054868,0.00286661062355249,-0.00105980963625292,-0.00359529769705734,-0.000848220967119726,0.00332371777065796,0.00270884139679814,-0.00202042406861395,-0.00396074044049606,-3.52215604986552E-05,0.00415743344821751,0.00231117219137586,-0.00312153733241741,-0.00414719527137246,0.00102461724137458,0.00493865884827422,0.00162569802197381,-0.00432705241573205,-0.00409369706602354,0.00233080244275147,0.00561042233429421,0.000619224831077592,-0.00560980338287179,-0.0037382726805982,0.00389042270921626,0.00611963338394821,-0.00077090453919172,-0.00692950192970617,-0.00300493551261255,0.00573122315927759,0.00636579377336577,-0.00260024445066094,-0.00824570680959562,-0.00177764820103792,0.0078527464232018,0.00626099649284305,-0.00496483934662683,-0.00950670375423221,7.2091647402133E-05,0.0103240173671905,0.00566847940107434,-0.00804246593185769,-0.010671256157666,0.00280747698859214,0.0132684343479322,0.00435997294339545,-0.0121818137045123,-0.011683435148113,0.00692602859991269,0.0169945578014983,0.00188043800343659,-0.0181579925258365,-0.0125293423373812,0.0136333713455472,0.0224117223033035,-0.0029516825571124,-0.0283039129956527,-0.0131570860668667,0.0268591773232585,0.032706991605452,-0.0145801066997213,-0.0528177791549758,-0.0135405290157871,0.0702750549792996,0.0728291353826229,-0.0821336459369456,-0.306645291855377,0.586320693617738,-0.306645291855377,-0.0821336459369456,0.0728291353826229,0.0702750549792996,-0.0135405290157871,-0.0528177791549758,-0.0145801066997213,0.032706991605452,0.0268591773232585,-0.0131570860668667,-0.0283039129956527,-0.0029516825571124,0.0224117223033035,0.0136333713455472,-0.0125293423373812,-0.0181579925258365,0.00188043800343659,0.0169945578014983,0.00692602859991269,-0.011683435148113,-0.0121818137045123,0.00435997294339545,0.0132684343479322,0.00280747698859214,-0.010671256157666,-0.00804246593185769,0.00566847940107434,0.0103240173671905,7.2091647402133E-05,-0.00950670375423221,-0.00496483934662683,0.00626099649284305,0.0078527464232018,-0.00177764820103792,-0.00824570680959562,-0.00260024445066094,0.00636579377336577,0.00573122315927759,-0.00300493551261255,-0.00692950192970617,-0.00077090453919172,0.00611963338394821,0.00389042270921626,-0.0037382726805982,-0.00560980338287179,0.000619224831077592,0.00561042233429421,0.00233080244275147,-0.00409369706602354,-0.00432705241573205,0.00162569802197381,0.00493865884827422,0.00102461724137458,-0.00414719527137246,-0.00312153733241741,0.00231117219137586,0.00415743344821751,-3.52215604986552E-05,-0.00396074044049606,-0.00202042406861395,0.00270884139679814,0.00332371777065796,-0.000848220967119726,-0.00359529769705734,-0.00105980963625292,0.00286661062355249,0.00249246728054868,-0.00143069467667567,-0.00311293833456452,-0.000251027345380887,0.00282924117990717,0.00170390663618718,-0.00180893647258209,-0.00255601721942226,0.000397359626019014,0.00263694174094806,0.000986723869588249,-0.0020004386901783,-0.00197006000508726,0.000881735461371406,0.00233292009499697,0.000365506682815356,-0.00203154577202864,-0.00139820900041229,0.00121306055406137,0.00195682705204642,-0.000143142383611989,-0.00193822453872312,-0.000868253855018997,0.00140372607446878,0.00155120496091855,-0.000537474140062217,-0.00175805339507477,-0.000399285836618603,0.00148096128225545,0.00114223713759643,-0.000821866289902842,-0.0015307224425407,1.26358646343491E-05,0.00145916343579828,0.000764867079906537,-0.00103864650253786,-0.00124126119996724,0.000320060637832615,0.00142072306309046,0.000362149895592255,-0.00112390914727603,-0.00102182079629598,0.000676809820286326,0.00123304091844839,0.000114162285040054,-0.00134320922069115,-0.000591602912913707,0.000791676364366034,0.00130622276966022,-0.000509271292355543,-0.00115529411312965,-0.000576628266356315,0.00154684434950018,0.000608866697929736,-0.000450930803092815,-0.00194303664016267,0.00088775502971946,0.000991270120614408,0.0012778947902183,-0.00280772909586353,8.66720046320668E-05,0.000181547394562727,0.00370569866943775,-0.00367711952656418,-0.000217308850439302,-0.00139719355650915,0.00762883851445958,-0.00752218394371693,-0.000218840272390312,0.00576477329185775,-0.00457152741704369,0.00132019110824171]
-coefHPF25Hz=[0.000559698976016492,-0.00275306427903118,0.00619522785781451,-0.0081170869747179,0.00554541085145594,0.000225501392717494,-0.0038347146273456,0.0020083279988101,0.00190931494207299,-0.00237891668736035,-0.000661848856383247,0.00219450835928291,-8.94200732945097E-05,-0.001874756061399,0.000533449127045469,0.00155739913367855,-0.000801248895700068,-0.00127678919399872,0.000963774825461087,0.0010436486553397,-0.00107342629331633,-0.000843867808796013,0.00114965276725924,0.000672725706580375,-0.00121033071337124,-0.000518132209781849,0.00125850511229878,0.000379191347122335,-0.00130506363510898,-0.000243908674061862,0.00134706277397483,0.000110761549819119,-0.00138662448346358,2.51434767345823E-05,0.00142165364130427,-0.000164823836785614,-0.00145302232211052,0.000313107190504016,0.00147556627820852,-0.000468278652603788,-0.00148880401929509,0.000630744830037341,0.0014919994544497,-0.000802128137063872,-0.0014823170405783,0.000983475440240369,0.00145330538033998,-0.00116719249005378,-0.00141045322857071,0.00135866557660661,0.00134632799622259,-0.001551172357563,-0.00126427848283396,0.00174696082552407,0.00115967256949322,-0.0019403720384008,-0.00103720735757579,0.00213772357196665,0.000886090460404884,-0.00232701055168669,-0.000714531299403181,0.00251426656065038,0.000514356529463877,-0.00269095614478395,-0.000289011263097442,0.00285654791819001,3.72883155384582E-05,-0.00300829406946228,0.000242080806410027,0.00314066870342295,-0.000545280643480887,-0.00325481002763545,0.000875994625382011,0.00334373953287029,-0.00123008767468782,-0.00340702488431799,0.00160794164851507,0.00344219539902981,-0.00201072874535559,-0.00344329498156517,0.00243499597235059,0.00340897488588665,-0.00288186750463669,-0.00333213068224822,0.00334566877746441,0.00321278259837399,-0.00382777833775101,-0.0030430810561709,0.00432020681602922,0.00282608421272457,-0.00482669602654875,-0.00255377713126137,0.0053419702292557,0.00222516232432328,-0.0058679541664673,-0.00183074412894468,0.00639789178198497,0.00136789289843289,-0.00693040921007737,-0.000829640488398045,0.00746153265026367,0.000208223803650221,-0.00798228497189371,0.000492585479469836,0.00850486851540128,-0.00129952161948562,-0.00900563404191374,0.00219827662226372,0.00951312831886729,-0.00323885193894385,-0.00998813324714495,0.00440774491158735,0.0104515064230591,-0.00574296658192101,-0.0108969580774964,0.00728485598006771,0.011303033897959,-0.0090516105043471,-0.0116964190181707,0.011131930584426,0.0120619323179812,-0.013621150628823,-0.01238972542696,0.0166586700018933,0.0126808648644633,-0.0204795067873725,-0.0129455428115077,0.0255155323418213,0.0131672486170718,-0.0325439452395649,-0.0133513521317601,0.0432601356107314,0.0134976996319854,-0.0620727989838284,-0.0136047950701708,0.105150681914788,0.0136634237344987,-0.317992841935749,0.486318165429503,-0.317992841935749,0.0136634237344987,0.105150681914788,-0.0136047950701708,-0.0620727989838284,0.0134976996319854,0.0432601356107314,-0.0133513521317601,-0.0325439452395649,0.0131672486170718,0.0255155323418213,-0.0129455428115077,-0.0204795067873725,0.0126808648644633,0.0166586700018933,-0.01238972542696,-0.013621150628823,0.0120619323179812,0.011131930584426,-0.0116964190181707,-0.0090516105043471,0.011303033897959,0.00728485598006771,-0.0108969580774964,-0.00574296658192101,0.0104515064230591,0.00440774491158735,-0.00998813324714495,-0.00323885193894385,0.00951312831886729,0.00219827662226372,-0.00900563404191374,-0.00129952161948562,0.00850486851540128,0.000492585479469836,-0.00798228497189371,0.000208223803650221,0.00746153265026367,-0.000829640488398045,-0.00693040921007737,0.00136789289843289,0.00639789178198497,-0.00183074412894468,-0.0058679541664673,0.00222516232432328,0.0053419702292557,-0.00255377713126137,-0.00482669602654875,0.00282608421272457,0.00432020681602922,-0.0030430810561709,-0.00382777833775101,0.00321278259837399,0.00334566877746441,-0.00333213068224822,-0.00288186750463669,0.00340897488588665,0.00243499597235059,-0.00344329498156517,-0.00201072874535559,0.00344219539902981,0.00160794164851507,-0.00340702488431799,-0.00123008767468782,0.00334373953287029,0.000875994625382011,-0.00325481002763545,-0.000545280643480887,0.00314066870342295,0.000242080806410027,-0.00300829406946228,3.72883155384582E-05,0.00285654791819001,-0.000289011263097442,-0.00269095614478395,0.000514356529463877,0.00251426656065038,-0.000714531299403181,-0.00232701055168669,0.000886090460404884,0.00213772357196665,-0.00103720735757579,-0.0019403720384008,0.00115967256949322,0.00174696082552407,-0.00126427848283396,-0.001551172357563,0.00134632799622259,0.00135866557660661,-0.00141045322857071,-0.00116719249005378,0.00145330538033998,0.000983475440240369,-0.0014823170405783,-0.000802128137063872,0.0014919994544497,0.000630744830037341,-0.00148880401929509,-0.000468278652603788,0.00147556627820852,0.000313107190504016,-0.00145302232211052,-0.000164823836785614,0.00142165364130427,2.51434767345823E-05,-0.00138662448346358,0.000110761549819119,0.00134706277397483,-0.000243908674061862,-0.00130506363510898,0.000379191347122335,0.00125850511229878,-0.000518132209781849,-0.00121033071337124,0.000672725706580375,0.00114965276725924,-0.000843867808796013,-0.00107342629331633,0.0010436486553397,0.000963774825461087,-0.00127678919399872,-0.000801248895700068,0.00155739913367855,0.000533449127045469,-0.001874756061399,-8.94200732945097E-05,0.00219450835928291,-0.000661848856383247,-0.00237891668736035,0.00190931494207299,0.0020083279988101,-0.0038347146273456,0.000225501392717494,0.00554541085145594,-0.0081170869747179,0.00619522785781451,-0.00275306427903118,0.000559698976016492]
-coefHPF30Hz=[2.40838897372598E-05,-0.000558542461414335,0.00198719840163762,-0.00424642990504051,0.00628945489948095,-0.00654260201849837,0.00419094351723439,-0.000264555140575577,-0.00276691305504815,0.00293058172763573,-0.000565216577275379,-0.00187930413152591,0.00211247294870601,-0.000186118152586297,-0.00168281127044228,0.00152500710263397,0.000299389968794278,-0.00162004293241197,0.000972136112226105,0.000767351737187886,-0.00149072127038946,0.0003831266329651,0.00114445498184822,-0.00121219814204704,-0.000226713405590329,0.00135362792769808,-0.000758973086331767,-0.000795574535158287,0.00133462709058849,-0.000165661110698328,-0.0012268040657756,0.00105230704116668,0.000489828657008257,-0.00142764909772893,0.000527482524606464,0.00108579665882576,-0.0013255835470501,-0.000164691628431627,0.00148873851050739,-0.00090192955351287,-0.000895182983310565,0.00158349250237688,-0.000211030525435108,-0.00149736705883873,0.00130006412105014,0.000626582983314169,-0.00181347167426701,0.000656590655224539,0.00142287851302852,-0.00171663199426842,-0.000248556645228198,0.0019779983390537,-0.00116943762834282,-0.00122837940938209,0.00211450394713229,-0.000240284603930027,-0.00204400578669279,0.00172821412839849,0.000897023520550347,-0.00246100815554078,0.000832875039479353,0.00198608653661863,-0.00231047804561916,-0.000419126841859189,0.00273239905855555,-0.00153349525745409,-0.0017650033239817,0.00288662770289043,-0.000227814172052926,-0.00287130144621288,0.00231153372412104,0.00135279891765275,-0.0034079049142055,0.00103418633955108,0.00284156414977124,-0.00313792582828176,-0.000730644325889147,0.00383409975885859,-0.00199658348146467,-0.00260105611702187,0.00398263708557051,-0.000132469983783758,-0.00410308885641749,0.00309883427786808,0.00209397677880007,-0.00478011499036339,0.00123505338352821,0.0041601039950091,-0.00430625342212674,-0.00129378335677622,0.00549202341746647,-0.00259671858024032,-0.00394039495350102,0.0055958477716136,0.000137189457024209,-0.0060352183169307,0.00421160185277928,0.00337312778767406,-0.00691897389366732,0.00141046200335565,0.00635680095466472,-0.00610951340122662,-0.00236205517922367,0.00824260508517074,-0.00344649967074845,-0.00633517885933969,0.00829590216812423,0.000790138972253378,-0.00951404277501704,0.00607183645824,0.00586565649430484,-0.0108585041254489,0.00155831084851367,0.0106812142111613,-0.00951453201590911,-0.00472891705183971,0.0139313970346485,-0.00503531670948269,-0.0117136065446632,0.0142551113503316,0.00253222071685946,-0.0178998754536574,0.0104711794754588,0.0125613081911459,-0.0214651458162893,0.00165203639302621,0.0238855532679192,-0.0202135881624372,-0.0131886643745215,0.0350518608740659,-0.011087880686173,-0.0363034177882939,0.044464419781545,0.013575542759318,-0.0786805090744744,0.0507555409060639,0.104241951353775,-0.298192034648613,0.386294436963489,-0.298192034648613,0.104241951353775,0.0507555409060639,-0.0786805090744744,0.013575542759318,0.044464419781545,-0.0363034177882939,-0.011087880686173,0.0350518608740659,-0.0131886643745215,-0.0202135881624372,0.0238855532679192,0.00165203639302621,-0.0214651458162893,0.0125613081911459,0.0104711794754588,-0.0178998754536574,0.00253222071685946,0.0142551113503316,-0.0117136065446632,-0.00503531670948269,0.0139313970346485,-0.00472891705183971,-0.00951453201590911,0.0106812142111613,0.00155831084851367,-0.0108585041254489,0.00586565649430484,0.00607183645824,-0.00951404277501704,0.000790138972253378,0.00829590216812423,-0.00633517885933969,-0.00344649967074845,0.00824260508517074,-0.00236205517922367,-0.00610951340122662,0.00635680095466472,0.00141046200335565,-0.00691897389366732,0.00337312778767406,0.00421160185277928,-0.0060352183169307,0.000137189457024209,0.0055958477716136,-0.00394039495350102,-0.00259671858024032,0.00549202341746647,-0.00129378335677622,-0.00430625342212674,0.0041601039950091,0.00123505338352821,-0.00478011499036339,0.00209397677880007,0.00309883427786808,-0.00410308885641749,-0.000132469983783758,0.00398263708557051,-0.00260105611702187,-0.00199658348146467,0.00383409975885859,-0.000730644325889147,-0.00313792582828176,0.00284156414977124,0.00103418633955108,-0.0034079049142055,0.00135279891765275,0.00231153372412104,-0.00287130144621288,-0.000227814172052926,0.00288662770289043,-0.0017650033239817,-0.00153349525745409,0.00273239905855555,-0.000419126841859189,-0.00231047804561916,0.00198608653661863,0.000832875039479353,-0.00246100815554078,0.000897023520550347,0.00172821412839849,-0.00204400578669279,-0.000240284603930027,0.00211450394713229,-0.00122837940938209,-0.00116943762834282,0.0019779983390537,-0.000248556645228198,-0.00171663199426842,0.00142287851302852,0.000656590655224539,-0.00181347167426701,0.000626582983314169,0.00130006412105014,-0.00149736705883873,-0.000211030525435108,0.00158349250237688,-0.000895182983310565,-0.00090192955351287,0.00148873851050739,-0.000164691628431627,-0.0013255835470501,0.00108579665882576,0.000527482524606464,-0.00142764909772893,0.000489828657008257,0.00105230704116668,-0.0012268040657756,-0.000165661110698328,0.00133462709058849,-0.000795574535158287,-0.000758973086331767,0.00135362792769808,-0.000226713405590329,-0.00121219814204704,0.00114445498184822,0.0003831266329651,-0.00149072127038946,0.000767351737187886,0.000972136112226105,-0.00162004293241197,0.000299389968794278,0.00152500710263397,-0.00168281127044228,-0.000186118152586297,0.00211247294870601,-0.00187930413152591,-0.000565216577275379,0.00293058172763573,-0.00276691305504815,-0.000264555140575577,0.00419094351723439,-0.00654260201849837,0.00628945489948095,-0.00424642990504051,0.00198719840163762,-0.000558542461414335,2.40838897372598E-05]
-coefHPF35Hz=[-0.000140398070507043,0.000294657534693052,-0.000375457503663856,0.000146181992400876,0.000610390907828925,-0.00193710700779362,0.00357296268584966,-0.00496586303148598,0.00547797304912414,-0.00471317073827009,0.00279379021944793,-0.000397866012005895,-0.00151734825647436,0.00219317781953346,-0.00148808630294252,-2.55349213297592E-05,0.00137591309549066,-0.00175494235105809,0.000993772963866709,0.000351869474027291,-0.00137339436073695,0.00140783127664514,-0.000472655392773982,-0.00075597750180302,0.00141302661764147,-0.00104566446890283,-7.03508552096723E-05,0.00112571910192132,-0.001354487123118,0.000587134328735273,0.000619225290507237,-0.00137757047989938,0.00111772996402102,-1.47592225216832E-05,-0.00112337309273468,0.00144194774725568,-0.000678211460019804,-0.000622895180234777,0.00149268460669062,-0.00125565873549203,5.16639446728211E-05,0.00123893367910074,-0.00163484158209899,0.000796630962086994,0.000687369338254909,-0.00170980181466996,0.00146724581666436,-8.82681445165761E-05,-0.00142219956569757,0.00191171848775855,-0.000956599704380669,-0.000778456644117029,0.00199804517368262,-0.00174002412619973,0.000130862211754497,0.00165798085717161,-0.00225896639086533,0.00115054142831015,0.000899189354726055,-0.00235876145010158,0.0020739301878364,-0.000175826268760444,-0.0019545271719036,0.00268651288873794,-0.00138403174114256,-0.00105282483451148,0.00280253560498429,-0.00247944344102119,0.000225455732156446,0.00231985448816942,-0.00320643395265026,0.0016628433210608,0.00124616255788676,-0.00334507077269266,0.0029692122957268,-0.000277887018731365,-0.00277160919572947,0.00384055499060021,-0.00199608020817989,-0.00149195092860605,0.00401374969431806,-0.00356520316771508,0.000331190622212096,0.00333734833246972,-0.00462318825600817,0.00239753744665879,0.00181173806373613,-0.00485381619116185,0.00430341664741731,-0.000381141351040595,-0.00406515850139199,0.0056151756896627,-0.00289432922803791,-0.00223920203593395,0.00594256663791841,-0.00524995667301161,0.000428039231563461,0.00503104347925439,-0.0069194278746003,0.00353680431756931,0.00282677242708344,-0.00741006202578887,0.00651885087029343,-0.000471740856417243,-0.00637195480455674,0.00872307193926297,-0.00441564713857725,-0.0036777792663313,0.00951025007883944,-0.00833478233680317,0.00051007976913452,0.0083707684747235,-0.0114191200733643,0.00572573715555505,0.00501683679303633,-0.0128101048495953,0.0112130493403167,-0.000540215704778542,-0.0117085003353286,0.0159851864051174,-0.00797026644883598,-0.00743751029369621,0.0188735260238582,-0.0166391475112885,0.000560669295587692,0.0185318661605546,-0.0256861970895365,0.0129436802054799,0.0131866124686303,-0.0341276269162688,0.0313027075188564,-0.000572466583255764,-0.0409986299491623,0.0620677122509164,-0.035000892173173,-0.0454838012781429,0.154985613261454,-0.249203528684723,0.286290473028629,-0.249203528684723,0.154985613261454,-0.0454838012781429,-0.035000892173173,0.0620677122509164,-0.0409986299491623,-0.000572466583255764,0.0313027075188564,-0.0341276269162688,0.0131866124686303,0.0129436802054799,-0.0256861970895365,0.0185318661605546,0.000560669295587692,-0.0166391475112885,0.0188735260238582,-0.00743751029369621,-0.00797026644883598,0.0159851864051174,-0.0117085003353286,-0.000540215704778542,0.0112130493403167,-0.0128101048495953,0.00501683679303633,0.00572573715555505,-0.0114191200733643,0.0083707684747235,0.00051007976913452,-0.00833478233680317,0.00951025007883944,-0.0036777792663313,-0.00441564713857725,0.00872307193926297,-0.00637195480455674,-0.000471740856417243,0.00651885087029343,-0.00741006202578887,0.00282677242708344,0.00353680431756931,-0.0069194278746003,0.00503104347925439,0.000428039231563461,-0.00524995667301161,0.00594256663791841,-0.00223920203593395,-0.00289432922803791,0.0056151756896627,-0.00406515850139199,-0.000381141351040595,0.00430341664741731,-0.00485381619116185,0.00181173806373613,0.00239753744665879,-0.00462318825600817,0.00333734833246972,0.000331190622212096,-0.00356520316771508,0.00401374969431806,-0.00149195092860605,-0.00199608020817989,0.00384055499060021,-0.00277160919572947,-0.000277887018731365,0.0029692122957268,-0.00334507077269266,0.00124616255788676,0.0016628433210608,-0.00320643395265026,0.00231985448816942,0.000225455732156446,-0.00247944344102119,0.00280253560498429,-0.00105282483451148,-0.00138403174114256,0.00268651288873794,-0.0019545271719036,-0.000175826268760444,0.0020739301878364,-0.00235876145010158,0.000899189354726055,0.00115054142831015,-0.00225896639086533,0.00165798085717161,0.000130862211754497,-0.00174002412619973,0.00199804517368262,-0.000778456644117029,-0.000956599704380669,0.00191171848775855,-0.00142219956569757,-8.82681445165761E-05,0.00146724581666436,-0.00170980181466996,0.000687369338254909,0.000796630962086994,-0.00163484158209899,0.00123893367910074,5.16639446728211E-05,-0.00125565873549203,0.00149268460669062,-0.000622895180234777,-0.000678211460019804,0.00144194774725568,-0.00112337309273468,-1.47592225216832E-05,0.00111772996402102,-0.00137757047989938,0.000619225290507237,0.000587134328735273,-0.001354487123118,0.00112571910192132,-7.03508552096723E-05,-0.00104566446890283,0.00141302661764147,-0.00075597750180302,-0.000472655392773982,0.00140783127664514,-0.00137339436073695,0.000351869474027291,0.000993772963866709,-0.00175494235105809,0.00137591309549066,-2.55349213297592E-05,-0.00148808630294252,0.00219317781953346,-0.00151734825647436,-0.000397866012005895,0.00279379021944793,-0.00471317073827009,0.00547797304912414,-0.00496586303148598,0.00357296268584966,-0.00193710700779362,0.000610390907828925,0.000146181992400876,-0.000375457503663856,0.000294657534693052,-0.000140398070507043]
-coefHPF40Hz=[-5.99924895341726E-05,0.000252627204397954,-0.000507859262285777,0.000937791806754419,-0.00147944299553093,0.00210914280083139,-0.00273161490300217,0.00323973359822656,-0.00351292809744892,0.00345542680612114,-0.00302054365078438,0.00223407084265691,-0.00119968975264665,8.61641487517701E-05,0.000905241527558903,-0.00158602788669283,0.00182780666113103,-0.00159864902877525,0.000977145974127151,-0.000137863158817023,-0.000690285031754741,0.00128304554371056,-0.00148165931383786,0.00123822285647981,-0.000631308465804929,-0.000154539185452641,0.000881039492171231,-0.00132612184522828,0.00135138705453593,-0.000946320302360761,0.000234480002549587,0.000561643864071703,-0.00118793496020533,0.00143847768204544,-0.00122285522517742,0.00059888677431118,0.00024095479897004,-0.00102722840580466,0.00149869108837248,-0.00148812222313011,0.000981000533785929,-0.000126657515196856,-0.000804271992420766,0.0015043444549662,-0.00172974028617834,0.00138434223431598,-0.000558497115856674,-0.000492609812517403,0.00142645052974828,-0.00192379039167359,0.00179686169467468,-0.00105862254399618,-7.16481468276407E-05,0.0012320085760424,-0.0020326564489989,0.00218569879340123,-0.00160740495613281,0.000456674521473391,0.000906332603920787,-0.00203147621980625,0.00252621232987017,-0.00219111234064279,0.00109724581378817,0.000423841783400346,-0.00187899142686327,0.00277182786845146,-0.00277074435152553,0.00182981712326123,-0.000219191772982525,-0.00154977810102988,0.00288532754233997,-0.00331158181325036,0.0026361059133745,-0.00103019490032023,-0.00101002779206647,0.00281454545120959,-0.0037577388202963,0.00347303057173865,-0.00199136806867532,-0.000247833724724695,0.00252389355574865,-0.0040642916220594,0.00430449979787644,-0.00309113666045431,0.000756991755933711,0.00196524247349034,-0.00416961227699789,0.00507533717315284,-0.00429949715365164,0.00200997659014172,0.00109981731993607,-0.00401651049478906,0.00573275443198208,-0.00559061170435563,0.00352622471435893,-0.000127610263837831,-0.00352590701423221,0.00620069380242771,-0.00691935693697766,0.00530972184027493,-0.00177054515561495,-0.00261411050531817,0.00639864926655069,-0.00824406899662613,0.00738120351597163,-0.0039124564345323,-0.00116126975381784,0.00621632800283768,-0.0095131517978514,0.00977970165379943,-0.00668063724576353,0.00100566037410255,0.0055075397488613,-0.0106849280895349,0.0126174504477379,-0.01033290248873,0.0042117428374576,0.00401381837774997,-0.0117136782852153,0.0161576648422599,-0.0154263795598646,0.0091471477809238,0.00120202671610964,-0.0125627117173421,0.0211130940726396,-0.0234301533733082,0.0176694271107658,-0.00440000357065415,-0.0131947372970995,0.0298746233955804,-0.0395682105491163,0.0369740435084294,-0.0191158282684197,-0.013585610181145,0.0570520878464143,-0.104221029734333,0.146523567613772,-0.175816403232253,0.186283044467813,-0.175816403232253,0.146523567613772,-0.104221029734333,0.0570520878464143,-0.013585610181145,-0.0191158282684197,0.0369740435084294,-0.0395682105491163,0.0298746233955804,-0.0131947372970995,-0.00440000357065415,0.0176694271107658,-0.0234301533733082,0.0211130940726396,-0.0125627117173421,0.00120202671610964,0.0091471477809238,-0.0154263795598646,0.0161576648422599,-0.0117136782852153,0.00401381837774997,0.0042117428374576,-0.01033290248873,0.0126174504477379,-0.0106849280895349,0.0055075397488613,0.00100566037410255,-0.00668063724576353,0.00977970165379943,-0.0095131517978514,0.00621632800283768,-0.00116126975381784,-0.0039124564345323,0.00738120351597163,-0.00824406899662613,0.00639864926655069,-0.00261411050531817,-0.00177054515561495,0.00530972184027493,-0.00691935693697766,0.00620069380242771,-0.00352590701423221,-0.000127610263837831,0.00352622471435893,-0.00559061170435563,0.00573275443198208,-0.00401651049478906,0.00109981731993607,0.00200997659014172,-0.00429949715365164,0.00507533717315284,-0.00416961227699789,0.00196524247349034,0.000756991755933711,-0.00309113666045431,0.00430449979787644,-0.0040642916220594,0.00252389355574865,-0.000247833724724695,-0.00199136806867532,0.00347303057173865,-0.0037577388202963,0.00281454545120959,-0.00101002779206647,-0.00103019490032023,0.0026361059133745,-0.00331158181325036,0.00288532754233997,-0.00154977810102988,-0.000219191772982525,0.00182981712326123,-0.00277074435152553,0.00277182786845146,-0.00187899142686327,0.000423841783400346,0.00109724581378817,-0.00219111234064279,0.00252621232987017,-0.00203147621980625,0.000906332603920787,0.000456674521473391,-0.00160740495613281,0.00218569879340123,-0.0020326564489989,0.0012320085760424,-7.16481468276407E-05,-0.00105862254399618,0.00179686169467468,-0.00192379039167359,0.00142645052974828,-0.000492609812517403,-0.000558497115856674,0.00138434223431598,-0.00172974028617834,0.0015043444549662,-0.000804271992420766,-0.000126657515196856,0.000981000533785929,-0.00148812222313011,0.00149869108837248,-0.00102722840580466,0.00024095479897004,0.00059888677431118,-0.00122285522517742,0.00143847768204544,-0.00118793496020533,0.000561643864071703,0.000234480002549587,-0.000946320302360761,0.00135138705453593,-0.00132612184522828,0.000881039492171231,-0.000154539185452641,-0.000631308465804929,0.00123822285647981,-0.00148165931383786,0.00128304554371056,-0.000690285031754741,-0.000137863158817023,0.000977145974127151,-0.00159864902877525,0.00182780666113103,-0.00158602788669283,0.000905241527558903,8.61641487517701E-05,-0.00119968975264665,0.00223407084265691,-0.00302054365078438,0.00345542680612114,-0.00351292809744892,0.00323973359822656,-0.00273161490300217,0.00210914280083139,-0.00147944299553093,0.000937791806754419,-0.000507859262285777,0.000252627204397954,-5.99924895341726E-05]
-coefHPF45Hz=[7.00734635068217E-05,-7.21160356798871E-05,0.000104195536044526,-0.000140798844818927,0.000180045670023332,-0.00021919941660782,0.000254690768352808,-0.000282212638620109,0.000296875216979492,-0.000293434022199619,0.000266620286068185,-0.000211550678524086,0.000124158426916248,-1.58318292686028E-06,-0.000157438202408034,0.000352145243949423,-0.000579421765590874,0.0008337067175147,-0.0011070637059892,0.0013892213424246,-0.00166785119519819,0.00192932359136221,-0.00215930361484952,0.00234327362607742,-0.00246806734232966,0.00252210734705163,-0.00249690225831929,0.00238753515385292,-0.0021934758221215,0.00191894410163543,-0.00157309793091452,0.00116988061647101,-0.000727515194224026,0.000267671253172221,0.000185629944141387,-0.000607375338541517,0.000973125289141822,-0.00126063586074734,0.00145141536379903,-0.00153217383038798,0.00149604084491712,-0.00134335124641653,0.00108203428965785,-0.000727556306686603,0.000302213748887452,0.000166007438579225,-0.000644960484286749,0.00110050398363696,-0.00149859892291687,0.00180783623153573,-0.00200166535569555,0.00206058697701196,-0.00197386665787165,0.00174074882538647,-0.00137101497668176,0.000884830605160477,-0.000311817039406214,-0.000310605767261814,0.000939523065392553,-0.0015293579078343,0.00203506378302649,-0.00241542647182679,0.00263626745377573,-0.00267334456646201,0.00251463248407054,-0.00216183682019026,0.00163103152598235,-0.0009522149981205,0.000167839619135762,0.000669609805023699,-0.00150100766067913,0.00226450747405967,-0.00290002620033722,0.00335370942363544,-0.00358227120339479,0.00355674064233125,-0.00326537860656036,0.00271547010637104,-0.00193382772647234,0.00096587618828155,0.000126687191283488,-0.00126955200661248,0.00238056924125954,-0.0033753864293476,0.00417354652098479,-0.00470461851985673,0.00491396444248813,-0.00476764766716547,0.00425609497852659,-0.00339620758421626,0.00223162752930823,-0.000831075702284991,-0.000715207979832473,0.00230085335851169,-0.00381014551163071,0.00512597695346775,-0.00613828170002195,0.00675250981010314,-0.0068974526229235,0.00653187633096161,-0.00564938982812819,0.00428111957744849,-0.00249587727073778,0.000397660742704505,0.00187950001197698,-0.00417911758124456,0.00633188935832429,-0.00816685124532613,0.009523345168523,-0.0102630759654577,0.0102814147086331,-0.0095171591532565,0.00796003395242797,-0.00565528587183011,0.0027049367224681,0.000734546005873062,-0.00445826076488692,0.00822225161473881,-0.0117559557142073,0.0147769543511453,-0.0170073095927974,0.0181904692269668,-0.0181077657185959,0.0165934643648253,-0.0135473867337461,0.00894426520332189,-0.00283915506513201,-0.00463157198909561,0.0132538162503068,-0.0227438654529156,0.0327606828571725,-0.0429217333364067,0.0528215412088981,-0.062051936113975,0.0702228640855936,-0.0769825910973874,0.0820361214010851,-0.0851607667267365,0.0862179903077404,-0.0851607667267365,0.0820361214010851,-0.0769825910973874,0.0702228640855936,-0.062051936113975,0.0528215412088981,-0.0429217333364067,0.0327606828571725,-0.0227438654529156,0.0132538162503068,-0.00463157198909561,-0.00283915506513201,0.00894426520332189,-0.0135473867337461,0.0165934643648253,-0.0181077657185959,0.0181904692269668,-0.0170073095927974,0.0147769543511453,-0.0117559557142073,0.00822225161473881,-0.00445826076488692,0.000734546005873062,0.0027049367224681,-0.00565528587183011,0.00796003395242797,-0.0095171591532565,0.0102814147086331,-0.0102630759654577,0.009523345168523,-0.00816685124532613,0.00633188935832429,-0.00417911758124456,0.00187950001197698,0.000397660742704505,-0.00249587727073778,0.00428111957744849,-0.00564938982812819,0.00653187633096161,-0.0068974526229235,0.00675250981010314,-0.00613828170002195,0.00512597695346775,-0.00381014551163071,0.00230085335851169,-0.000715207979832473,-0.000831075702284991,0.00223162752930823,-0.00339620758421626,0.00425609497852659,-0.00476764766716547,0.00491396444248813,-0.00470461851985673,0.00417354652098479,-0.0033753864293476,0.00238056924125954,-0.00126955200661248,0.000126687191283488,0.00096587618828155,-0.00193382772647234,0.00271547010637104,-0.00326537860656036,0.00355674064233125,-0.00358227120339479,0.00335370942363544,-0.00290002620033722,0.00226450747405967,-0.00150100766067913,0.000669609805023699,0.000167839619135762,-0.0009522149981205,0.00163103152598235,-0.00216183682019026,0.00251463248407054,-0.00267334456646201,0.00263626745377573,-0.00241542647182679,0.00203506378302649,-0.0015293579078343,0.000939523065392553,-0.000310605767261814,-0.000311817039406214,0.000884830605160477,-0.00137101497668176,0.00174074882538647,-0.00197386665787165,0.00206058697701196,-0.00200166535569555,0.00180783623153573,-0.00149859892291687,0.00110050398363696,-0.000644960484286749,0.000166007438579225,0.000302213748887452,-0.000727556306686603,0.00108203428965785,-0.00134335124641653,0.00149604084491712,-0.00153217383038798,0.00145141536379903,-0.00126063586074734,0.000973125289141822,-0.000607375338541517,0.000185629944141387,0.000267671253172221,-0.000727515194224026,0.00116988061647101,-0.00157309793091452,0.00191894410163543,-0.0021934758221215,0.00238753515385292,-0.00249690225831929,0.00252210734705163,-0.00246806734232966,0.00234327362607742,-0.00215930361484952,0.00192932359136221,-0.00166785119519819,0.0013892213424246,-0.0011070637059892,0.0008337067175147,-0.000579421765590874,0.000352145243949423,-0.000157438202408034,-1.58318292686028E-06,0.000124158426916248,-0.000211550678524086,0.000266620286068185,-0.000293434022199619,0.000296875216979492,-0.000282212638620109,0.000254690768352808,-0.00021919941660782,0.000180045670023332,-0.000140798844818927,0.000104195536044526,-7.21160356798871E-05,7.00734635068217E-05]
-coefHPF50Hz=[0.00012834496303445,-3.74312127742707E-05,4.28133759559518E-05,-4.86569215636566E-05,5.49926017596651E-05,-6.18509558030173E-05,6.92630643598532E-05,-7.72605705939923E-05,8.58720085066672E-05,-9.51254775588699E-05,0.000105035435013871,-0.000115626423788786,0.000126913279839619,-0.000138925708493305,0.000151692136867928,-0.000165250876616128,0.000179642825686662,-0.000194904622279557,0.000211066004779088,-0.000228139336046883,0.000246137223048219,-0.000265072620651438,0.000284993307130127,-0.000305957088897224,0.000328016547913569,-0.000351172625116226,0.000375377045342921,-0.000400626915515231,0.000427093577693114,-0.000454948692120756,0.000483650065399475,-0.00051382806006937,0.000545155658098503,-0.000577776462546688,0.000611692585297247,-0.000646927357678225,0.000683500011621296,-0.000721426702864063,0.000760723752154903,-0.000801397962718749,0.000843469510887843,-0.00088694623316015,0.000931851111279015,-0.000978189367916799,0.00102596740555681,-0.00107518699752139,0.00112585128588529,-0.00117797336455294,0.00123156236439663,-0.00128661932395333,0.00134312576326984,-0.00140107424081062,0.00146046253917933,-0.00152130694507079,0.00158360025125579,-0.00164730024954117,0.00171238044551985,-0.0017788779595917,0.00184678163849636,-0.00191596001417488,0.00198654995071385,-0.00205840277735133,0.00213155941699005,-0.00220596702423852,0.00228159976141866,-0.00235842425513549,0.00243640882012832,-0.00251552165870875,0.00259571932572569,-0.00267696484598134,0.00275920367277024,-0.00284240397993309,0.00292651466873945,-0.0030114955153818,0.00309729269592792,-0.00318384551099904,0.00327110217060733,-0.00335901163840901,0.00344752126094083,-0.0035365651337778,0.00362607935637069,-0.00371599488484909,0.00380626197521022,-0.00389681680725354,0.00398757678959368,-0.00407847085936194,0.00416945522671559,-0.00426044912732798,0.00435134858897007,-0.00444214243327199,0.00453269230534199,-0.00462297148305598,0.00471288419209685,-0.00480236220979633,0.00489132386877985,-0.00497969261968064,0.00506739524972159,-0.00515435393224134,0.00524049773382093,-0.00532573585633699,0.00541000328687075,-0.00549320947722968,0.00557529246356387,-0.00565617271706329,0.00573576792779463,-0.00581400595490431,0.00589081276463428,-0.00596611724670872,0.00603984566038564,-0.00611192628808423,0.00618228134380865,-0.00625085396070401,0.00631757707678897,-0.00638237536312219,0.00644518341912138,-0.00650595113305063,0.00656460916339761,-0.00662109263658323,0.00667536997437102,-0.00672734671007867,0.00677700249050476,-0.00682426869645805,0.00686910796107266,-0.00691146809451069,0.00695130482586461,-0.00698857747529409,0.00702324681048744,-0.00705528333730979,0.00708464140319955,-0.00711130579964019,0.00713522644692832,-0.0071564017530317,0.00717479888475439,-0.00719039493270269,0.0072031795929363,-0.00721313564174272,0.00722025402745655,-0.00722453055186388,0.00722595993490053,-0.00722453055186388,0.00722025402745655,-0.00721313564174272,0.0072031795929363,-0.00719039493270269,0.00717479888475439,-0.0071564017530317,0.00713522644692832,-0.00711130579964019,0.00708464140319955,-0.00705528333730979,0.00702324681048744,-0.00698857747529409,0.00695130482586461,-0.00691146809451069,0.00686910796107266,-0.00682426869645805,0.00677700249050476,-0.00672734671007867,0.00667536997437102,-0.00662109263658323,0.00656460916339761,-0.00650595113305063,0.00644518341912138,-0.00638237536312219,0.00631757707678897,-0.00625085396070401,0.00618228134380865,-0.00611192628808423,0.00603984566038564,-0.00596611724670872,0.00589081276463428,-0.00581400595490431,0.00573576792779463,-0.00565617271706329,0.00557529246356387,-0.00549320947722968,0.00541000328687075,-0.00532573585633699,0.00524049773382093,-0.00515435393224134,0.00506739524972159,-0.00497969261968064,0.00489132386877985,-0.00480236220979633,0.00471288419209685,-0.00462297148305598,0.00453269230534199,-0.00444214243327199,0.00435134858897007,-0.00426044912732798,0.00416945522671559,-0.00407847085936194,0.00398757678959368,-0.00389681680725354,0.00380626197521022,-0.00371599488484909,0.00362607935637069,-0.0035365651337778,0.00344752126094083,-0.00335901163840901,0.00327110217060733,-0.00318384551099904,0.00309729269592792,-0.0030114955153818,0.00292651466873945,-0.00284240397993309,0.00275920367277024,-0.00267696484598134,0.00259571932572569,-0.00251552165870875,0.00243640882012832,-0.00235842425513549,0.00228159976141866,-0.00220596702423852,0.00213155941699005,-0.00205840277735133,0.00198654995071385,-0.00191596001417488,0.00184678163849636,-0.0017788779595917,0.00171238044551985,-0.00164730024954117,0.00158360025125579,-0.00152130694507079,0.00146046253917933,-0.00140107424081062,0.00134312576326984,-0.00128661932395333,0.00123156236439663,-0.00117797336455294,0.00112585128588529,-0.00107518699752139,0.00102596740555681,-0.000978189367916799,0.000931851111279015,-0.00088694623316015,0.000843469510887843,-0.000801397962718749,0.000760723752154903,-0.000721426702864063,0.000683500011621296,-0.000646927357678225,0.000611692585297247,-0.000577776462546688,0.000545155658098503,-0.00051382806006937,0.000483650065399475,-0.000454948692120756,0.000427093577693114,-0.000400626915515231,0.000375377045342921,-0.000351172625116226,0.000328016547913569,-0.000305957088897224,0.000284993307130127,-0.000265072620651438,0.000246137223048219,-0.000228139336046883,0.000211066004779088,-0.000194904622279557,0.000179642825686662,-0.000165250876616128,0.000151692136867928,-0.000138925708493305,0.000126913279839619,-0.000115626423788786,0.000105035435013871,-9.51254775588699E-05,8.58720085066672E-05,-7.72605705939923E-05,6.92630643598532E-05,-6.18509558030173E-05,5.49926017596651E-05,-4.86569215636566E-05,4.28133759559518E-05,-3.74312127742707E-05,0.00012834496303445]
-def process(coef, in_signal):
-    FILTERTAPS = len(coef)
-    values = in_signal[:FILTERTAPS].copy()
-    k = 0
-    out_signal = []
-    gain = 1.0
-    for in_value in in_signal:
-        out = 0.0
-        values[k] = in_value
-        for i in range(len(coef)):
-            out += coef[i] * values[(i + k) % FILTERTAPS]
-        out /= gain
-        k = (k + 1) % FILTERTAPS
-        out_signal.append(out)
-    return out_signal
-def allfiltering(input_signal):
-    LPF_outputs = {}
-    HPF_outputs = {}
-
-    LPF_outputs['LPF5Hz'] = process(coefLPF5Hz, input_signal)
-    LPF_outputs['LPF10Hz'] = process(coefLPF10Hz, input_signal)
-    LPF_outputs['LPF15Hz'] = process(coefLPF15Hz, input_signal)
-    LPF_outputs['LPF20Hz'] = process(coefLPF20Hz, input_signal)
-    LPF_outputs['LPF25Hz'] = process(coefLPF25Hz, input_signal)
-    LPF_outputs['LPF30Hz'] = process(coefLPF30Hz, input_signal)
-    LPF_outputs['LPF35Hz'] = process(coefLPF35Hz, input_signal)
-    LPF_outputs['LPF40Hz'] = process(coefLPF40Hz, input_signal)
-    LPF_outputs['LPF45Hz'] = process(coefLPF45Hz, input_signal)
-    LPF_outputs['LPF50Hz'] = process(coefLPF50Hz, input_signal)
+# Coefficients from filter_coefs.npy (set "filters", see coef_store.py)
+globals().update(load_set('filters'))
 
-    HPF_outputs['HPF5Hz'] = process(coefHPF5Hz, input_signal)
-    HPF_outputs['HPF10Hz'] = process(coefHPF10Hz, input_signal)
-    HPF_outputs['HPF15Hz'] = process(coefHPF15Hz, input_signal)
-    HPF_outputs['HPF20Hz'] = process(coefHPF20Hz, input_signal)
-    HPF_outputs['HPF25Hz'] = process(coefHPF25Hz, input_signal)
-    HPF_outputs['HPF30Hz'] = process(coefHPF30Hz, input_signal)
-    HPF_outputs['HPF35Hz'] = process(coefHPF35Hz, input_signal)
-    HPF_outputs['HPF40Hz'] = process(coefHPF40Hz, input_signal)
-    HPF_outputs['HPF45Hz'] = process(coefHPF45Hz, input_signal)
-    HPF_outputs['HPF50Hz'] = process(coefHPF50Hz, input_signal)
+# The 10 LPFs and 10 HPFs above, applied together in one batched pass
+FILTER_BANK = FilterBank({f'{kind}{f}Hz': globals()[f'coef{kind}{f}Hz'] for kind in ('LPF', 'HPF') for f in range(5, 55, 5)})
 
-    all_outputs = pd.DataFrame({**LPF_outputs, **HPF_outputs})
-    return all_outputs
+def allfiltering(input_signal):
+    all_outputs = FILTER_BANK.apply(input_signal)
+    return pd.DataFrame(all_outputs[:, 0, :].T, columns=FILTER_BANK.names)
 
 
 def apply_allfiltering_to_columns(df):
-    output_dfs = []
-    for column in df.columns:
-        input_signal = df[column]
-        filtered_output = allfiltering(input_signal)
-        filtered_output.columns = [f"{column}_{col}" for col in filtered_output.columns]
-        output_dfs.append(filtered_output)
-    return pd.concat(output_dfs, axis=1)
+    return FILTER_BANK.to_frame(FILTER_BANK.apply(df.values, axis=0), df.columns)
 
 
 # apply_allfiltering_to_columns use this function to filter a whole DF
@@ -0,0 +1,177 @@
+# Vectorized versions of the per-sample process(coef, in_signal) loops used by the analytics pages.
+#
+# Two variants of process() are in use in this repo and both are reproduced exactly:
+#   process()         - filters.py / Preprocessing.py: ring buffer seeded with in_signal[:FILTERTAPS],
+#                       out += coef[i] * values[(i + k) % FILTERTAPS]
+#   process_rolled()  - 8686.py / Filterwebapp.py / DATA__ANALYTICS.py: ring buffer of zeros,
+#                       out = np.dot(coef, np.roll(values, k))
+# filter_block() / filter_block_rolled() apply the same filters to a whole 2-D block (samples x columns) at once,
+# StreamingFIR applies them chunk by chunk with the state carried over between chunks.
+
+import numpy as np
+from scipy import signal, sparse
+
+
+def circular_kernel(coef):
+    # In the ring buffer loop coef[0] always meets the newest sample and coef[i] (i > 0) meets the
+    # sample written FILTERTAPS - i steps earlier, so the loop is a plain FIR with this kernel
+    coef = np.asarray(coef, dtype=float)
+    return np.concatenate([coef[:1], coef[:0:-1]])
+
+
+def _windowed_nan_mask(nan, taps):
+    # True where any of the last `taps` samples (including the current one) is NaN
+    counts = np.concatenate([np.zeros(nan.shape[:-1] + (1,), dtype=np.int64), np.cumsum(nan, axis=-1)], axis=-1)
+    return (counts[..., taps:] - counts[..., :-taps]) > 0
+
+
+def filter_block(coef, block, axis=0):
+    """Same output as process(coef, column) for every column of `block` along `axis`.
+
+    The original loop seeds its buffer with in_signal[:FILTERTAPS], so before the buffer has wrapped
+    once the "past" samples it sees are in_signal[1:FILTERTAPS]. That prefix is prepended here and the
+    result is computed with one FFT convolution. Signals shorter than the filter (where the loop
+    raises IndexError) are treated as if the missing seed samples were zero.
+    """
+    x = np.moveaxis(np.asarray(block, dtype=float), axis, -1)
+    taps = len(coef)
+    n = x.shape[-1]
+    if n == 0:
+        return np.moveaxis(x.copy(), -1, axis)
+
+    seed = np.zeros(x.shape[:-1] + (taps - 1,))
+    m = min(taps, n) - 1
+    seed[..., :m] = x[..., 1:1 + m]
+    # NaN only poisons the outputs whose window contains it, like in the loop
+    ext = np.concatenate([seed, x], axis=-1)
+    return np.moveaxis(_convolve_valid(circular_kernel(coef), ext), -1, axis)
+
+
+def _convolve_valid(kernel, ext):
+    # ext: (..., taps - 1 + n) samples, the first taps - 1 being history -> (..., n) filtered samples
+    nan = np.isnan(ext)
+    has_nan = nan.any()
+    if has_nan:
+        ext = np.where(nan, 0.0, ext)
+    out = signal.fftconvolve(ext, kernel.reshape((1,) * (ext.ndim - 1) + (len(kernel),)), mode='valid', axes=-1)
+    if has_nan:
+        out[_windowed_nan_mask(nan, len(kernel))] = np.nan
+    return out
+
+
+def rolled_operator(coef, n, start=0):
+    # process_rolled() is time varying: at step t the ring index is k = t % FILTERTAPS and coef[j]
+    # meets the sample written (2k - j) % FILTERTAPS steps earlier. Written as a sparse (n x n)
+    # matrix so the whole block is filtered with a single product.
+    # With start > 0 the rows are steps start .. start + n - 1 and the matrix is applied to the
+    # min(start, FILTERTAPS - 1) samples before the block followed by the block itself.
+    coef = np.asarray(coef, dtype=float)
+    taps = len(coef)
+    history = min(start, taps - 1)
+    t = np.arange(n)[:, None]
+    j = np.arange(taps)[None, :]
+    cols = history + t - (2 * ((start + t) % taps) - j) % taps
+    valid = cols >= 0
+    rows = np.broadcast_to(t, cols.shape)[valid]
+    data = np.broadcast_to(coef[None, :], cols.shape)[valid]
+    return sparse.csr_matrix((data, (rows, cols[valid])), shape=(n, history + n))
+
+
+def filter_block_rolled(coef, block, axis=0):
+    """Same output as the np.roll based process(coef, column) for every column of `block` along `axis`."""
+    x = np.moveaxis(np.asarray(block, dtype=float), axis, 0)
+    shape = x.shape
+    op = rolled_operator(coef, shape[0])
+    out = op @ x.reshape(shape[0], -1)
+    return np.moveaxis(np.asarray(out).reshape(shape), 0, axis)
+
+
+def process(coef, in_signal):
+    return filter_block(coef, in_signal).tolist()
+
+
+def process_rolled(coef, in_signal):
+    return filter_block_rolled(coef, in_signal).tolist()
+
+
+class StreamingFIR:
+    """Chunked filtering with state kept between calls, like FIR<T, ntaps> in FIR.h.
+
+    Feeding a signal through filter() in chunks of any size and then calling flush() gives the same
+    samples as filtering it in one go:
+      mode='seeded'  process() / filter_block()
+      mode='rolled'  process_rolled() / filter_block_rolled()
+      mode='zero'    FIR.h processReading() (ring buffer of zeros) divided by `gain`; FIR.h itself uses
+                     gain = sum(coef), the default of 1.0 leaves the output unscaled like process()
+    Chunks are (samples,) or (samples, channels) with samples along `axis`, every channel keeping its own
+    state. In 'seeded' mode nothing comes out until FILTERTAPS samples have arrived, because the first output
+    already depends on them; flush() returns what is still held back.
+    """
+
+    def __init__(self, coef, mode='seeded', gain=1.0, axis=0):
+        if mode not in ('seeded', 'rolled', 'zero'):
+            raise ValueError(f"Unknown mode {mode!r}")
+        self.coef = np.asarray(coef, dtype=float)
+        self.taps = len(self.coef)
+        self.mode = mode
+        self.gain = gain
+        self.axis = axis
+        self._kernel = circular_kernel(self.coef)
+        self.reset()
+
+    def reset(self):
+        self.samples_in = 0
+        self._history = None  # last FILTERTAPS - 1 input samples (seeded: the seed until it has been used up)
+        self._pending = []    # seeded mode: chunks held back until FILTERTAPS samples have arrived
+
+    def filter(self, chunk):
+        x = np.moveaxis(np.asarray(chunk, dtype=float), self.axis, -1)
+        if self.mode == 'seeded' and self._history is None:
+            self._pending.append(x)
+            if self.samples_in + x.shape[-1] < self.taps:
+                self.samples_in += x.shape[-1]
+                return np.moveaxis(x[..., :0], -1, self.axis)
+            x = np.concatenate(self._pending, axis=-1)
+            self._pending = []
+            self._history = self._seed(x)
+            self.samples_in = 0
+        return np.moveaxis(self._step(x), -1, self.axis)
+
+    def flush(self):
+        """Output for the samples still held back (signals shorter than the filter); resets the state."""
+        if self._pending:
+            x = np.concatenate(self._pending, axis=-1)
+            self._pending = []
+            self._history = self._seed(x)
+            self.samples_in = 0
+            out = self._step(x)
+        else:
+            out = np.zeros((() if self._history is None else self._history.shape[:-1]) + (0,))
+        self.reset()
+        return np.moveaxis(out, -1, self.axis)
+
+    def _seed(self, x):
+        # Same seed as filter_block(): in_signal[1:FILTERTAPS], zero filled when the signal is shorter
+        seed = np.zeros(x.shape[:-1] + (self.taps - 1,))
+        m = min(self.taps, x.shape[-1]) - 1
+        seed[..., :m] = x[..., 1:1 + m]
+        return seed
+
+    def _step(self, x):
+        n = x.shape[-1]
+        if n == 0:
+            return x.copy()
+        if self._history is None:
+            self._history = np.zeros(x.shape[:-1] + (self.taps - 1 if self.mode != 'rolled' else 0,))
+        ext = np.concatenate([self._history, x], axis=-1)
+        if self.mode == 'rolled':
+            op = rolled_operator(self.coef, n, self.samples_in)
+            flat = ext.reshape(-1, ext.shape[-1])
+            out = np.asarray(op @ flat.T).T.reshape(x.shape)
+        else:
+            out = _convolve_valid(self._kernel, ext)
+            if self.mode == 'zero' and self.gain != 1.0:
+                out /= self.gain
+        self._history = ext[..., max(0, ext.shape[-1] - (self.taps - 1)):]
+        self.samples_in += n
+        return out
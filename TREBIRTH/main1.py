@@ -1,20 +1,18 @@
 import streamlit as st
-from google.cloud import firestore
+from firestore_client import get_client
 import pandas as pd
 from google.cloud.firestore import FieldFilter
 from io import BytesIO
 import matplotlib.pyplot as plt
 from datetime import datetime
 import numpy as np
-import time
 import zipfile
 import os
-import random
 import json
 from scipy import signal
 from scipy.stats import skew, kurtosis
 from preprocess import detrend, fq, calculate_statistics, columns_reports_unique, stats_filtereddata
-from google.api_core.exceptions import ResourceExhausted, RetryError
+from export_tasks import FORMATS, ExportTasks, download_export, fingerprint
 from Filters import (coefLPF1Hz, coefLPF2Hz, coefLPF3Hz, coefLPF4Hz, coefLPF5Hz, coefLPF6Hz, coefLPF7Hz, coefLPF8Hz, 
                      coefLPF9Hz, coefLPF10Hz, coefLPF11Hz, coefLPF12Hz, coefLPF13Hz, coefLPF14Hz, coefLPF15Hz, 
                      coefLPF16Hz, coefLPF17Hz, coefLPF18Hz, coefLPF19Hz, coefLPF20Hz, coefLPF21Hz, coefLPF22Hz, 
@@ -54,19 +52,6 @@ creds = {
     "client_x509_cert_url": st.secrets["firestore"]["client_x509_cert_url"]
 }
 
-def process(coef, in_signal):
-    FILTERTAPS = len(coef)
-    values = np.zeros(FILTERTAPS)
-    out_signal = []
-    gain = 1.0
-    k = 0
-    for in_value in in_signal:
-        values[k] = in_value
-        out = np.dot(coef, np.roll(values, k))
-        out /= gain
-        out_signal.append(out)
-        k = (k + 1) % FILTERTAPS
-    return out_signal
 
 # Function to show login page
 def show_login_page():
@@ -96,34 +81,9 @@ def show_main_page():
         unsafe_allow_html=True,
     )
 
-    def exponential_backoff(retries):
-        base_delay = 1
-        max_delay = 60
-        delay = base_delay * (2 ** retries) + random.uniform(0, 1)
-        return min(delay, max_delay)
-
-    def get_firestore_data(query):
-        retries = 0
-        max_retries = 10
-        while retries < max_retries:
-            try:
-                results = query.stream()
-                return list(results)
-            except ResourceExhausted as e:
-                st.warning(f"Quota exceeded, retrying... (attempt {retries + 1})")
-                time.sleep(exponential_backoff(retries))
-                retries += 1
-            except RetryError as e:
-                st.warning(f"Retry error: {e}, retrying... (attempt {retries + 1})")
-                time.sleep(exponential_backoff(retries))
-                retries += 1
-            except Exception as e:
-                st.error(f"An error occurred: {e}")
-                break
-        raise Exception("Max retries exceeded")
 
     # Authenticate to Firestore with the JSON account key.
-    db = firestore.Client.from_service_account_info(creds)
+    db = get_client(info=creds)
     
     # User input for Row No., Tree No., Scan No., and Label
     row_number = st.text_input('Enter Row number', 'All')
@@ -136,6 +96,9 @@ def show_main_page():
     
     # Dropdown for selecting sheets in Excel
     selected_sheets = st.multiselect('Select Sheets', ['Raw Data', 'Detrended Data', 'Normalized Data', 'Detrended & Normalized Data', 'Metadata', 'Time Domain Features', 'Frequency Domain Features', 'Columns Comparison'], default=['Raw Data', 'Metadata'])
+
+    # File format of the downloads (see export_tasks.FORMATS)
+    export_format = st.selectbox('Export format', list(FORMATS), index=0)
     
     # Create a reference to the Firestore collection
     query = db.collection('M1V6_SS_Testing')
@@ -203,12 +166,6 @@ def show_main_page():
         # Concatenate all DataFrames column-wise
         df_combined = pd.concat([df_radar, df_adxl, df_ax, df_ay, df_az], axis=1)
     
-        # Detrend all the columns
-        df_combined_detrended = df_combined.apply(detrend)
-      
-        # Normalize all the columns
-        df_combined_normalized = (df_combined_detrended - df_combined_detrended.min()) / (df_combined_detrended.max() - df_combined_detrended.min())
-    
         # Convert list of dictionaries to DataFrame
         df_metadata = pd.DataFrame(metadata_list)
     
@@ -227,37 +184,26 @@ def show_main_page():
     
         # Join file name parts with underscore
         file_name = '_'.join(file_name_parts)
-    
-        # Convert DataFrame to Excel format
-        excel_data = BytesIO()
-        with pd.ExcelWriter(excel_data, engine='xlsxwriter') as writer:
-            if 'Raw Data' in selected_sheets:
-                df_combined.to_excel(writer, sheet_name='Raw Data', index=False)
-            if 'Detrended Data' in selected_sheets:
-                df_combined_detrended.to_excel(writer, sheet_name='Detrended Data', index=False)
-            if 'Normalized Data' in selected_sheets:
-                df_combined_normalized.to_excel(writer, sheet_name='Normalized Data', index=False)
-            if 'Detrended & Normalized Data' in selected_sheets:
-                df_combined_detrended_normalized = (df_combined_detrended - df_combined_detrended.min()) / (df_combined_detrended.max() - df_combined_detrended.min())
-                df_combined_detrended_normalized.to_excel(writer, sheet_name='Detrended & Normalized Data', index=False)
-            if 'Metadata' in selected_sheets:
-                df_metadata_filtered.to_excel(writer, sheet_name='Metadata', index=False)
-            if 'Time Domain Features' in selected_sheets:
-                time_domain_features = calculate_statistics(df_combined)
-                time_domain_features.to_excel(writer, sheet_name='Time Domain Features', index=False)
-            if 'Frequency Domain Features' in selected_sheets:
-                frequencies, powers = fq(df_combined_detrended)
-                frequencies.to_excel(writer, sheet_name='Frequencies', index=False)
-                powers.to_excel(writer, sheet_name='Powers', index=False)
-            if 'Columns Comparison' in selected_sheets:
-                columns_comparison = columns_reports_unique(df_combined_detrended)
-                columns_comparison.to_excel(writer, sheet_name='Columns Comparison', index=False)
-    
-        excel_data.seek(0)
+
+        def normalize(df):
+            return (df - df.min()) / (df.max() - df.min())
+
+        # Every sheet is computed only when a download asks for it (see export_tasks.py)
+        tasks = ExportTasks(fingerprint(df_combined, df_metadata_filtered))
+        tasks.add('Raw Data', lambda: df_combined)
+        # Detrend all the columns
+        tasks.add('Detrended Data', lambda: df_combined.apply(detrend))
+        # Normalize all the columns
+        tasks.add('Normalized Data', lambda: normalize(tasks['Detrended Data']), deps=['Detrended Data'])
+        tasks.add('Detrended & Normalized Data', lambda: tasks['Normalized Data'], deps=['Normalized Data'])
+        tasks.add('Metadata', lambda: df_metadata_filtered)
+        tasks.add('Time Domain Features', lambda: calculate_statistics(df_combined))
+        tasks.add('Frequency Domain Features', lambda: dict(zip(['Frequencies', 'Powers'], fq(tasks['Detrended Data']))), deps=['Detrended Data'])
+        tasks.add('Columns Comparison', lambda: columns_reports_unique(tasks['Detrended Data']), deps=['Detrended Data'])
     
         # Download button for selected sheets and metadata
-        st.download_button("Download Selected Sheets and Metadata", excel_data, file_name=f"{file_name}.xlsx", mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", key='download-excel')
-        st.write("Columns in df_combined_detrended:", df_combined_detrended.columns)
+        download_export(tasks, [name for name in tasks if name in selected_sheets], "Download Selected Sheets and Metadata", file_name, key='download-excel', fmt=export_format)
+        st.write("Columns in df_combined_detrended:", df_combined.columns)
 
 # Set page configuration
 st.set_page_config(layout="wide")
@@ -3,20 +3,56 @@ import numpy as np
 import pandas as pd
 from scipy import signal
 from scipy.stats import skew, kurtosis
+from functools import lru_cache
 
 def detrend(dataframe):
     detrended_data = dataframe - dataframe.mean()
     return detrended_data
 
 # Define feature extraction functions
-def fq(df):
-    frequencies = []
-    powers = []
+@lru_cache(maxsize=16)
+def _welch_window(window, nperseg):
+    # get_window() is recomputed by every welch() call otherwise; shared, so read-only
+    w = signal.get_window(window, nperseg)
+    w.flags.writeable = False
+    return w
+
+
+def welch_spectra(block, fs=100, window='flattop', nperseg=1024, axis=0, dtype=np.float32):
+    """signal.welch() of every column of a 2-D block in one call.
+
+    Returns (frequencies, powers): one frequency vector shared by all columns and a (column x frequency)
+    power matrix ('spectrum' scaling) in `dtype`, float32 by default to keep it compact.
+    """
+    x = np.moveaxis(np.asarray(block, dtype=float), axis, -1)
+    nperseg = min(nperseg, x.shape[-1])
+    frequencies, powers = signal.welch(x, fs, _welch_window(window, nperseg), nperseg, scaling='spectrum', axis=-1)
+    return frequencies, powers.astype(dtype, copy=False)
+
+
+def band_powers(frequencies, powers, edges=range(1, 51)):
+    """Welch power summed over the bins [edges[k], edges[k + 1]) -> (column x band), 1 Hz bands 1-50 Hz by default.
 
-    for i in df:
-        f, p = signal.welch(df[i], 100, 'flattop', 1024, scaling='spectrum')
-        frequencies.append(f)
-        powers.append(p)
+    Band energies without running the 49 band filters.
+    """
+    edges = np.asarray(edges, dtype=float)
+    idx = np.searchsorted(frequencies, edges)
+    cumulative = np.concatenate([np.zeros(powers.shape[:-1] + (1,)), np.cumsum(powers, axis=-1, dtype=float)], axis=-1)
+    return (cumulative[..., idx[1:]] - cumulative[..., idx[:-1]]).astype(powers.dtype, copy=False)
+
+
+def band_power_features(df, fs=100, nperseg=1024, edges=range(1, 51)):
+    # One row per column of df, one '{low}Hz-{high}Hz' column per band
+    frequencies, powers = welch_spectra(df.to_numpy(dtype=float), fs, nperseg=nperseg)
+    edges = list(edges)
+    names = [f'{low:g}Hz-{high:g}Hz' for low, high in zip(edges[:-1], edges[1:])]
+    return pd.DataFrame(band_powers(frequencies, powers, edges), index=df.columns, columns=names)
+
+def fq(df):
+    # One frequency vector and power spectrum per column, all columns in one welch_spectra() call
+    f, p = welch_spectra(df.to_numpy(dtype=float), 100, 'flattop', 1024, dtype=float)
+    frequencies = [f] * df.shape[1]
+    powers = list(p)
 
     #frequencies = pd.DataFrame(frequencies)
     #powers = pd.DataFrame(powers)
@@ -111,28 +147,133 @@ def stats_filtereddata(df, band):
 
     return pd.DataFrame(stats)
 
+def band_stats(filtered, bands, columns, chunk_bands=8):
+    """stats_filtereddata() for every band at once, as one table with a row per (band, column).
+
+    filtered: (band x scan x sample) block such as FilterBank.apply(). Gives the same STD / PTP / Mean / RMS /
+    Skew / Kurtosis (NaNs counted as the column mean), but from power sums of each sample taken in one sweep
+    over a few bands at a time instead of seven reductions per column.
+    """
+    x = np.asarray(filtered, dtype=float)
+    n_bands, n_scans, n = x.shape
+    stats = {name: np.empty((n_bands, n_scans)) for name in ("STD", "PTP", "Mean", "RMS", "Skew", "Kurtosis")}
+    for start in range(0, n_bands, chunk_bands):
+        block = x[start:start + chunk_bands]
+        chunk = slice(start, start + len(block))
+        nan = np.isnan(block)
+        has_nan = nan.any()
+        count = n - nan.sum(axis=-1) if has_nan else np.full(block.shape[:-1], n)
+
+        # Sums of powers around the first sample: shifting leaves the central moments unchanged and keeps
+        # the raw sums from cancelling when a column has a large offset
+        shift = np.nan_to_num(block[..., 0])
+        d = block - shift[..., None]
+        if has_nan:
+            d[nan] = 0.0
+        d2 = d * d
+        s1 = d.sum(axis=-1)
+        s2 = d2.sum(axis=-1)
+        s3 = (d2 * d).sum(axis=-1)
+        s4 = (d2 * d2).sum(axis=-1)
+        lo = np.where(nan, np.inf, block).min(axis=-1) if has_nan else block.min(axis=-1)
+        hi = np.where(nan, -np.inf, block).max(axis=-1) if has_nan else block.max(axis=-1)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mu = s1 / count
+            mean = shift + mu
+            # Central moments; the NaN samples (filled with the mean) add nothing but still count in n
+            m2 = np.maximum(s2 - count * mu**2, 0.0) / n
+            m3 = (s3 - 3 * mu * s2 + 2 * count * mu**3) / n
+            m4 = (s4 - 4 * mu * s3 + 6 * mu**2 * s2 - 3 * count * mu**4) / n
+            # Same cut off as scipy.stats.skew / kurtosis for (nearly) constant data
+            constant = m2 <= (np.finfo(float).resolution * mean)**2
+            stats["STD"][chunk] = np.sqrt(m2)
+            stats["PTP"][chunk] = np.where(count > 0, hi - lo, np.nan)
+            stats["Mean"][chunk] = mean
+            stats["RMS"][chunk] = np.sqrt(m2 + mean**2)
+            stats["Skew"][chunk] = np.where(constant, np.nan, m3 / m2**1.5)
+            stats["Kurtosis"][chunk] = np.where(constant, np.nan, m4 / m2**2 - 3.0)
+
+    table = pd.DataFrame({"Band": np.repeat(list(bands), n_scans), "Column": np.tile(list(columns), n_bands)})
+    for name, values in stats.items():
+        table[name] = values.ravel()
+    return table
+
+def _sensor(column):
+    # 'Radar 12' -> 'Radar'
+    return str(column).rstrip('0123456789').strip()
+
 # Define function to compare columns
-def columns_reports_unique(df):
-    report = []
-    num_columns = len(df.columns)
-    for i in range(num_columns):
-        for j in range(i + 1, num_columns):  # Start j from i + 1
-            column1 = df.columns[i]
-            column2 = df.columns[j]
-            diff = df[column1] - df[column2]
-            mean_diff = np.mean(diff)
-            deviation_diff = np.std(diff)
-            ptp_diff = np.ptp(diff)
-            skewness_diff = skew(diff)
-            correlation = df[[column1, column2]].corr().iloc[0, 1]
-            report.append({
-                'Column 1': column1,
-                'Column 2': column2,
-                'Mean Difference': mean_diff,
-                'Deviation Difference': deviation_diff,
-                'PTP Difference': ptp_diff,
-                'Skewness Difference': skewness_diff,
-                'Correlation': correlation,
-            })
-    report_df = pd.DataFrame(report)
-    return report_df
+def columns_reports_unique(df, same_sensor=False, top_k=None, max_block_bytes=64 * 2**20):
+    """Mean / deviation / PTP / skewness of the difference of every pair of columns, and their correlation.
+
+    All pairs are computed together from Gram matrices of the centred columns (with a presence mask, so columns
+    of different lengths are compared over their common rows like the pandas version did); only the PTP needs
+    the differences themselves, which are formed for blocks of pairs of at most max_block_bytes.
+    same_sensor: only compare columns of the same sensor, e.g. 'Radar 1' with 'Radar 2' but not with 'ADXL 1'.
+    top_k: only keep the k pairs with the highest absolute correlation, most correlated first.
+    """
+    columns = list(df.columns)
+    x = df.to_numpy(dtype=float)
+    n_rows, num_columns = x.shape
+    first, second = np.triu_indices(num_columns, k=1)
+    if same_sensor:
+        sensors = np.array([_sensor(column) for column in columns])
+        keep = sensors[first] == sensors[second]
+        first, second = first[keep], second[keep]
+
+    present = ~np.isnan(x)
+    complete = present.all(axis=0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        center = np.where(present.any(axis=0), np.nansum(x, axis=0) / present.sum(axis=0), 0.0)
+    xc = np.where(present, x - center, 0.0)
+    w = present.astype(float)
+    xc2 = xc * xc
+    count = (w.T @ w)[first, second]                 # rows where both columns are present
+    sums = xc.T @ w                                  # sums[a, b]: column a summed over the rows b is present in
+    squares = xc2.T @ w
+    cross = (xc.T @ xc)[first, second]
+    cubes = (xc2 * xc).sum(axis=0)
+    square_cross = xc2.T @ xc                        # square_cross[a, b] = sum(a**2 * b)
+
+    s1, s1_other = sums[first, second], sums[second, first]
+    q, q_other = squares[first, second], squares[second, first]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        # Moments of (column 1 - column 2), the columns centred; the centring only moves the mean
+        d1 = (s1 - s1_other) / count
+        d2 = (q + q_other - 2 * cross) / count
+        d3 = (cubes[first] - cubes[second] - 3 * square_cross[first, second] + 3 * square_cross[second, first]) / count
+        mean_diff = d1 + center[first] - center[second]
+        m2 = np.maximum(d2 - d1**2, 0.0)
+        m3 = d3 - 3 * d1 * d2 + 2 * d1**3
+        # skew() of a difference with NaNs in it is NaN; same cut off for constant data as scipy
+        skewness_diff = np.where(complete[first] & complete[second] & (m2 > (np.finfo(float).resolution * mean_diff)**2),
+                                 m3 / m2**1.5, np.nan)
+        # Pearson correlation over the common rows, like DataFrame.corr()
+        covariance = cross - s1 * s1_other / count
+        variance = (q - s1**2 / count) * (q_other - s1_other**2 / count)
+        correlation = np.clip(np.where((count > 1) & (variance > 0), covariance / np.sqrt(variance), np.nan), -1.0, 1.0)
+        mean_diff = np.where(count > 0, mean_diff, np.nan)
+        deviation_diff = np.where(count > 0, np.sqrt(m2), np.nan)
+
+    pairs = np.arange(len(first))
+    if top_k is not None:
+        pairs = np.argsort(-np.nan_to_num(np.abs(correlation), nan=-1.0), kind='stable')[:top_k]
+
+    # PTP of the differences themselves, a block of pairs at a time (NaN if either column has NaNs, like np.ptp)
+    ptp_diff = np.empty(len(pairs))
+    per_block = max(1, max_block_bytes // (8 * max(n_rows, 1)))
+    for start in range(0, len(pairs), per_block):
+        block = pairs[start:start + per_block]
+        diff = x[:, first[block]] - x[:, second[block]]
+        ptp_diff[start:start + per_block] = diff.max(axis=0) - diff.min(axis=0) if n_rows else np.nan
+
+    return pd.DataFrame({
+        'Column 1': [columns[a] for a in first[pairs]],
+        'Column 2': [columns[b] for b in second[pairs]],
+        'Mean Difference': mean_diff[pairs],
+        'Deviation Difference': deviation_diff[pairs],
+        'PTP Difference': ptp_diff,
+        'Skewness Difference': skewness_diff[pairs],
+        'Correlation': correlation[pairs],
+    })
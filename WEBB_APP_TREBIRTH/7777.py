@@ -1,17 +1,16 @@
 import streamlit as st
-from google.cloud import firestore
+from firestore_client import get_client
 import pandas as pd
 from google.cloud.firestore import FieldFilter
 from io import BytesIO
 import matplotlib.pyplot as plt
 from datetime import datetime
 import numpy as np
-import time
-import random
 from scipy import signal
 from scipy.stats import skew, kurtosis
 from preprocess import detrend, fq, stats_radar, columns_reports_unique
-from google.api_core.exceptions import ResourceExhausted, RetryError
+from paged_reader import iter_scan_batches, warn_on_page
+from sensor_block import RaggedBlock
 from Filters import (coefLPF1Hz, coefLPF2Hz, coefLPF3Hz, coefLPF4Hz, coefLPF5Hz, coefLPF6Hz, coefLPF7Hz, coefLPF8Hz, 
                      coefLPF9Hz, coefLPF10Hz, coefLPF11Hz, coefLPF12Hz, coefLPF13Hz, coefLPF14Hz, coefLPF15Hz, 
                      coefLPF16Hz, coefLPF17Hz, coefLPF18Hz, coefLPF19Hz, coefLPF20Hz, coefLPF21Hz, coefLPF22Hz, 
@@ -55,34 +54,8 @@ st.markdown(
     unsafe_allow_html=True,
 )
 
-def exponential_backoff(retries):
-    base_delay = 1
-    max_delay = 60
-    delay = base_delay * (2 ** retries) + random.uniform(0, 1)
-    return min(delay, max_delay)
-
-def get_firestore_data(query):
-    retries = 0
-    max_retries = 10
-    while retries < max_retries:
-        try:
-            results = query.stream()
-            return list(results)
-        except ResourceExhausted as e:
-            st.warning(f"Quota exceeded, retrying... (attempt {retries + 1})")
-            time.sleep(exponential_backoff(retries))
-            retries += 1
-        except RetryError as e:
-            st.warning(f"Retry error: {e}, retrying... (attempt {retries + 1})")
-            time.sleep(exponential_backoff(retries))
-            retries += 1
-        except Exception as e:
-            st.error(f"An error occurred: {e}")
-            break
-    raise Exception("Max retries exceeded")
-
 # Authenticate to Firestore with the JSON account key.
-db = firestore.Client.from_service_account_json("WEBB_APP_TREBIRTH/testdata1-20ec5-firebase-adminsdk-an9r6-a87cacba1d.json")
+db = get_client("WEBB_APP_TREBIRTH/testdata1-20ec5-firebase-adminsdk-an9r6-a87cacba1d.json")
 
 # User input for Row No., Tree No., Scan No., and Label
 row_number = st.text_input('Enter Row number', 'All')
@@ -108,38 +81,39 @@ if scan_number != 'All':
 if label_infstat != 'All':
     query = query.where('InfStat', '==', label_infstat)
 
-# Get documents based on the query
+
+def sensor_frame(blocks):
+    # (sample, scan) frame of the per page blocks, shorter scans padded with NaN like pd.DataFrame(arrays).transpose()
+    length = max(int(block.lengths.max(initial=0)) for block in blocks)
+    return pd.DataFrame(np.hstack([block.dense(length) for block in blocks]), copy=False)
+
+
+# One RaggedBlock per sensor and page: a page's arrays are packed into one buffer as it arrives and then dropped
+sensor_fields = ['RadarRaw', 'ADXLRaw', 'Ax', 'Ay', 'Az']
+sensor_blocks = {name: [] for name in sensor_fields}
+metadata_list = []
+
+# Get documents based on the query, a page at a time with the arrays decoded to numpy (see paged_reader.py)
 try:
-    query_results = get_firestore_data(query)
+    for batch in iter_scan_batches(query, on_retry=warn_on_page):
+        for name in sensor_fields:
+            sensor_blocks[name].append(RaggedBlock.from_arrays(batch.arrays[name], dtype=np.float64))
+        for metadata in batch.meta:
+            # Convert datetime values to timezone-unaware
+            for key, value in metadata.items():
+                if isinstance(value, datetime):
+                    metadata[key] = value.replace(tzinfo=None)
+            metadata_list.append(metadata)
 except Exception as e:
     st.error(f"Failed to retrieve data: {e}")
     st.stop()
 
-if len(query_results) == 0:
+if len(metadata_list) == 0:
     st.write("No data found matching the specified criteria.")
 else:
-    # Create empty lists to store data
-    radar_data = []
-    adxl_data = []
-    ax_data = []
-    ay_data = []
-    az_data = []
-    metadata_list = []
-
-    for doc in query_results:
-        radar_data.append(doc.to_dict().get('RadarRaw', []))
-        adxl_data.append(doc.to_dict().get('ADXLRaw', []))
-        ax_data.append(doc.to_dict().get('Ax', []))
-        ay_data.append(doc.to_dict().get('Ay', []))
-        az_data.append(doc.to_dict().get('Az', []))
-        metadata = doc.to_dict()
-        # Convert datetime values to timezone-unaware
-        for key, value in metadata.items():
-            if isinstance(value, datetime):
-                metadata[key] = value.replace(tzinfo=None)
-        metadata_list.append(metadata)
-
-    num_scans = max(len(radar_data[0]), len(adxl_data[0]), len(ax_data[0]), len(ay_data[0]), len(az_data[0]))
+
+    # Samples in the first scan of each sensor
+    num_scans = max(int(next(block for block in blocks if len(block)).lengths[0]) for blocks in sensor_blocks.values())
 
     # Create DataFrames for each data type
     radar_columns = [f'Radar {i+1}' for i in range(num_scans)]
@@ -148,23 +122,24 @@ else:
     ay_columns = [f'Ay {i+1}' for i in range(num_scans)]
     az_columns = [f'Az {i+1}' for i in range(num_scans)]
 
-    df_radar = pd.DataFrame(radar_data).transpose()
+    df_radar = sensor_frame(sensor_blocks['RadarRaw'])
     df_radar.columns = radar_columns
 
-    df_adxl = pd.DataFrame(adxl_data).transpose()
+    df_adxl = sensor_frame(sensor_blocks['ADXLRaw'])
     df_adxl.columns = adxl_columns
 
-    df_ax = pd.DataFrame(ax_data).transpose()
+    df_ax = sensor_frame(sensor_blocks['Ax'])
     df_ax.columns = ax_columns
 
-    df_ay = pd.DataFrame(ay_data).transpose()
+    df_ay = sensor_frame(sensor_blocks['Ay'])
     df_ay.columns = ay_columns
 
-    df_az = pd.DataFrame(az_data).transpose()
+    df_az = sensor_frame(sensor_blocks['Az'])
     df_az.columns = az_columns
 
     # Concatenate the DataFrames column-wise
     df_combined = pd.concat([df_radar, df_adxl, df_ax, df_ay, df_az], axis=1)
+    del sensor_blocks, df_radar, df_adxl, df_ax, df_ay, df_az
 
     # Slice the DataFrame to the desired range
     df_combined = df_combined[100:1800]
@@ -6,14 +6,15 @@ from io import BytesIO
 import matplotlib.pyplot as plt
 from datetime import datetime
 import numpy as np
-import time
 import zipfile
 import os
-import random
 from scipy import signal
 from scipy.stats import skew, kurtosis
 from preprocess import detrend, fq, stats_radar, columns_reports_unique, stats_filtereddata
-from google.api_core.exceptions import ResourceExhausted, RetryError
+from fir_engine import filter_block_rolled
+from band_kernels import band_names
+from parallel_pipeline import filter_bands_and_stats
+from export_tasks import FORMATS, ExportTasks, download_export, fingerprint
 from Filters import (coefLPF1Hz, coefLPF2Hz, coefLPF3Hz, coefLPF4Hz, coefLPF5Hz, coefLPF6Hz, coefLPF7Hz, coefLPF8Hz, 
                      coefLPF9Hz, coefLPF10Hz, coefLPF11Hz, coefLPF12Hz, coefLPF13Hz, coefLPF14Hz, coefLPF15Hz, 
                      coefLPF16Hz, coefLPF17Hz, coefLPF18Hz, coefLPF19Hz, coefLPF20Hz, coefLPF21Hz, coefLPF22Hz, 
@@ -31,19 +32,6 @@ from Filters import (coefLPF1Hz, coefLPF2Hz, coefLPF3Hz, coefLPF4Hz, coefLPF5Hz,
 
 
 
-def process(coef, in_signal):
-    FILTERTAPS = len(coef)
-    values = np.zeros(FILTERTAPS)
-    out_signal = []
-    gain = 1.0
-    k = 0
-    for in_value in in_signal:
-        values[k] = in_value
-        out = np.dot(coef, np.roll(values, k))
-        out /= gain
-        out_signal.append(out)
-        k = (k + 1) % FILTERTAPS
-    return out_signal
 # Set page configuration
 st.set_page_config(layout="wide")
 st.title('Data Analytics')
@@ -58,31 +46,6 @@ st.markdown(
     unsafe_allow_html=True,
 )
 
-def exponential_backoff(retries):
-    base_delay = 1
-    max_delay = 60
-    delay = base_delay * (2 ** retries) + random.uniform(0, 1)
-    return min(delay, max_delay)
-
-def get_firestore_data(query):
-    retries = 0
-    max_retries = 10
-    while retries < max_retries:
-        try:
-            results = query.stream()
-            return list(results)
-        except ResourceExhausted as e:
-            st.warning(f"Quota exceeded, retrying... (attempt {retries + 1})")
-            time.sleep(exponential_backoff(retries))
-            retries += 1
-        except RetryError as e:
-            st.warning(f"Retry error: {e}, retrying... (attempt {retries + 1})")
-            time.sleep(exponential_backoff(retries))
-            retries += 1
-        except Exception as e:
-            st.error(f"An error occurred: {e}")
-            break
-    raise Exception("Max retries exceeded")
 
 # Authenticate to Firestore with the JSON account key.
 db = firestore.Client.from_service_account_json("WEBB_APP_TREBIRTH/testdata1-20ec5-firebase-adminsdk-an9r6-a87cacba1d.json")
@@ -99,6 +62,9 @@ label_infstat = st.selectbox('Select Label', ['All', 'Infected', 'Healthy'], ind
 # Dropdown for selecting sheets in Excel
 selected_sheets = st.multiselect('Select Sheets', ['Raw Data', 'Detrended Data', 'Normalized Data', 'Detrended & Normalized Data', 'Metadata', 'Time Domain Features', 'Frequency Domain Features', 'Columns Comparison'], default=['Raw Data', 'Metadata'])
 
+# File format of the downloads (see export_tasks.FORMATS)
+export_format = st.selectbox('Export format', list(FORMATS), index=0)
+
 # Create a reference to the Firestore collection
 query = db.collection('M1V6_SS_Testing')
 
@@ -171,14 +137,6 @@ else:
     # Concatenate all DataFrames column-wise
     df_combined = pd.concat([df_radar, df_adxl, df_ax, df_ay, df_az], axis=1)
 
-    filtered_data_df = pd.DataFrame({col: process(coefLPF50Hz, df_combined[col].values) for col in df_combined.columns})
-
-    # Detrend all the columns
-    df_combined_detrended = df_combined.apply(detrend)
-  
-    # Normalize all the columns
-    df_combined_normalized = (df_combined_detrended - df_combined_detrended.min()) / (df_combined_detrended.max() - df_combined_detrended.min())
-
     # Convert list of dictionaries to DataFrame
     df_metadata = pd.DataFrame(metadata_list)
 
@@ -198,72 +156,48 @@ else:
     # Join file name parts with underscore
     file_name = '_'.join(file_name_parts)
 
-    # Convert DataFrame to Excel format
-    excel_data = BytesIO()
-    with pd.ExcelWriter(excel_data, engine='xlsxwriter') as writer:
-        if 'Raw Data' in selected_sheets:
-            df_combined.to_excel(writer, sheet_name='Raw Data', index=False)
-        if 'Detrended Data' in selected_sheets:
-            df_combined_detrended.to_excel(writer, sheet_name='Detrended Data', index=False)
-        if 'Normalized Data' in selected_sheets:
-            df_combined_normalized.to_excel(writer, sheet_name='Normalized Data', index=False)
-        if 'Detrended & Normalized Data' in selected_sheets:
-            df_combined_detrended_normalized = (df_combined_detrended - df_combined_detrended.min()) / (df_combined_detrended.max() - df_combined_detrended.min())
-            df_combined_detrended_normalized.to_excel(writer, sheet_name='Detrended & Normalized Data', index=False)
-        if 'Metadata' in selected_sheets:
-            df_metadata_filtered.to_excel(writer, sheet_name='Metadata', index=False)
-        if 'Time Domain Features' in selected_sheets:
-            time_domain_features = stats_radar(df_combined_detrended)
-            time_domain_features.to_excel(writer, sheet_name='Time Domain Features', index=False)
-        if 'Frequency Domain Features' in selected_sheets:
-            frequencies, powers = fq(df_combined_detrended)
-            frequencies.to_excel(writer, sheet_name='Frequencies', index=False)
-            powers.to_excel(writer, sheet_name='Powers', index=False)
-        if 'Columns Comparison' in selected_sheets:
-            columns_comparison = columns_reports_unique(df_combined_detrended)
-            columns_comparison.to_excel(writer, sheet_name='Columns Comparison', index=False)
-
-    excel_data.seek(0)
+    def normalize(df):
+        return (df - df.min()) / (df.max() - df.min())
+
+    # Every sheet is computed only when a download asks for it (see export_tasks.py)
+    tasks = ExportTasks(fingerprint(df_combined, df_metadata_filtered))
+    tasks.add('Raw Data', lambda: df_combined)
+    # Detrend all the columns
+    tasks.add('Detrended Data', lambda: df_combined.apply(detrend))
+    # Normalize all the columns
+    tasks.add('Normalized Data', lambda: normalize(tasks['Detrended Data']), deps=['Detrended Data'])
+    tasks.add('Detrended & Normalized Data', lambda: tasks['Normalized Data'], deps=['Normalized Data'])
+    tasks.add('Metadata', lambda: df_metadata_filtered)
+    tasks.add('Time Domain Features', lambda: stats_radar(tasks['Detrended Data']), deps=['Detrended Data'])
+    tasks.add('Frequency Domain Features', lambda: dict(zip(['Frequencies', 'Powers'], fq(tasks['Detrended Data']))), deps=['Detrended Data'])
+    tasks.add('Columns Comparison', lambda: columns_reports_unique(tasks['Detrended Data']), deps=['Detrended Data'])
 
     # Download button for selected sheets and metadata
-    st.download_button("Download Selected Sheets and Metadata", excel_data, file_name=f"{file_name}.xlsx", mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", key='download-excel')
-    st.write("Columns in df_combined_detrended:", df_combined_detrended.columns)
+    download_export(tasks, [name for name in tasks if name in selected_sheets], "Download Selected Sheets and Metadata", file_name, key='download-excel', fmt=export_format)
+    st.write("Columns in df_combined_detrended:", df_combined.columns)
+
+    def filter_all_bands(method):
+        # Filtering and stats run on the worker pool, split by scan (see parallel_pipeline.py)
+        filtered, stats = filter_bands_and_stats(tasks['Detrended Data'], method)
+        sheets = {f'{band} Filtered Data': pd.DataFrame(filtered[i].T, columns=df_combined.columns)
+                  for i, band in enumerate(band_names())}
+        # One row per (band, column) for all 49 bands
+        sheets['Stats'] = stats
+        return sheets
 
     def download_filtered_data_and_stats():
-        filtered_data_dict = {}
-        stats_dict = {}
-
-        for low_freq in range(1, 50):
-            high_freq = low_freq + 1
-            hpf_coeffs = globals()[f'coefHPF{low_freq}Hz']
-            lpf_coeffs = globals()[f'coefLPF{high_freq}Hz']
-
-            # Apply HPF first
-            filtered_data_low = pd.DataFrame({col: process(hpf_coeffs, df_combined_detrended[col].values) for col in df_combined_detrended.columns})
-
-            # Apply LPF next
-            filtered_data = pd.DataFrame({col: process(lpf_coeffs, filtered_data_low[col].values) for col in filtered_data_low.columns})
-            filtered_data_dict[f'{low_freq}Hz-{high_freq}Hz'] = filtered_data
-
-            # Calculate stats for the filtered data
-            stats_dict[f'{low_freq}Hz-{high_freq}Hz'] = stats_filtereddata(filtered_data, f'{low_freq}Hz-{high_freq}Hz')
-
-        # Create an Excel file with filtered data and stats
-        filtered_excel_data = BytesIO()
-        with pd.ExcelWriter(filtered_excel_data, engine='xlsxwriter') as writer:
-            for band, filtered_data in filtered_data_dict.items():
-                filtered_data.to_excel(writer, sheet_name=f'{band} Filtered Data', index=False)
-            for band, stats in stats_dict.items():
-                stats.to_excel(writer, sheet_name=f'{band} Stats', index=False)
-        filtered_excel_data.seek(0)
-
-        # Provide a download button for the filtered data and stats
-        st.download_button(
-            "Download All Scans Filtered (1-50Hz) and Stats",
-            filtered_excel_data,
-            file_name="Filtered_1-50Hz_and_Stats.xlsx",
-            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-        )
+        # The combined kernels start from a zero filter state (FIR.h) and give slightly different numbers; opt-in
+        if st.checkbox('Filter bands with combined HPF+LPF kernels (FIR.h filtering, one pass per band)', value=False):
+            method = 'kernels'
+        else:
+            # Apply all the HPFs first, then each band's LPF to its own HPF output
+            method = 'cascade'
+        tasks.add('Filtered Bands and Stats', filter_all_bands, deps=['Detrended Data'], method=method)
+
+        # Provide a download button for the filtered data and stats; the kernel filtered files are named apart
+        suffix = "_FIR_kernels" if method == 'kernels' else ""
+        download_export(tasks, ['Filtered Bands and Stats'], "Download All Scans Filtered (1-50Hz) and Stats",
+                        f"Filtered_1-50Hz_and_Stats{suffix}", key='download-bands-excel', fmt=export_format)
 
     # Add the download button before asking the user for filter type and frequency
     download_filtered_data_and_stats()
@@ -273,70 +207,46 @@ else:
 
     if filter_type == 'Band Pass Filter (BPF)':
         low_freq, high_freq = st.slider('Select Frequency Range (Hz)', 1, 50, (5, 10))
+        filter_params = {'low_freq': low_freq, 'high_freq': high_freq}
     else:
         frequency = st.slider('Select Frequency (Hz)', 1, 50)
-
-    # Map selected filter type and frequency to the corresponding coefficients
-    if filter_type == 'Low Pass Filter (LPF)':
-        filter_coef = globals()[f'coefLPF{frequency}Hz']
-    elif filter_type == 'High Pass Filter (HPF)':
-        filter_coef = globals()[f'coefHPF{frequency}Hz']
-    elif filter_type == 'Band Pass Filter (BPF)':
-        filter_coef_low = globals()[f'coefHPF{low_freq}Hz']
-        filter_coef_high = globals()[f'coefLPF{high_freq}Hz']
-
-    # Apply the selected filter only to Radar and ADXL columns
-    # List to hold all Radar and ADXL column names
-    radar_columns = [f'Radar {i}' for i in range(30)]  # Assuming there are 10 scans
-    adxl_columns = [f'ADXL {i}' for i in range(30)]  # Assuming there are 10 scans
-
-    # Dictionary to hold the filtered data columns for Radar and ADXL
-    filtered_radar_columns = {}
-    filtered_adxl_columns = {}
-
-    # Add data for each scan to the filtered columns dictionary
-    for i in range(30):  # Assuming there are 10 scans
-        filtered_radar_columns[f'Radar {i+1}'] = df_combined_detrended[f'Radar {i+1}']
-        filtered_adxl_columns[f'ADXL {i+1}'] = df_combined_detrended[f'ADXL {i+1}']
-
-    # Apply the process function on each column
-    if filter_type == 'Band Pass Filter (BPF)':
-        filtered_radar_data_low = pd.DataFrame({col: process(filter_coef_low, data.values) for col, data in filtered_radar_columns.items()})
-        filtered_radar_data = pd.DataFrame({col: process(filter_coef_high, data.values) for col, data in filtered_radar_data_low.items()})
-        filtered_adxl_data_low = pd.DataFrame({col: process(filter_coef_low, data.values) for col, data in filtered_adxl_columns.items()})
-        filtered_adxl_data = pd.DataFrame({col: process(filter_coef_high, data.values) for col, data in filtered_adxl_data_low.items()})
-    else:
-        filtered_radar_data = pd.DataFrame({col: process(filter_coef, data.values) for col, data in filtered_radar_columns.items()})
-        filtered_adxl_data = pd.DataFrame({col: process(filter_coef, data.values) for col, data in filtered_adxl_columns.items()})
-
-filtered_data = pd.concat([filtered_radar_data, filtered_adxl_data], axis=1)
-
-# Multi-select box to select desired sheets
-selected_sheets = st.multiselect('Select Sheets to Download', ['Filtered Data', 'Time Domain Features', 'Columns Comparison'])
-
-# Add a button to trigger the download
-if st.button("Download Selected Sheets"):
-    # Prepare the Excel file with selected sheets
-    filtered_excel_data = BytesIO()
-    with pd.ExcelWriter(filtered_excel_data, engine='xlsxwriter') as writer:
-        for sheet_name in selected_sheets:
-            # Write each selected sheet to the Excel file
-            if sheet_name == 'Filtered Data':
-                # Write filtered data to the sheet
-                filtered_data.to_excel(writer, sheet_name=sheet_name, index=False)
-            elif sheet_name == 'Time Domain Features':
-                # Apply the time domain features on the filtered data
-                time_domain_features_filtered = stats_radar(filtered_data)
-                # Write time domain features data to the sheet
-                time_domain_features_filtered.to_excel(writer, sheet_name=sheet_name, index=False)
-            elif sheet_name == 'Columns Comparison':
-                # Apply the columns comparison on the filtered data
-                columns_comparison_filtered = columns_reports_unique(filtered_data)
-                # Write column comparison data to the sheet
-                columns_comparison_filtered.to_excel(writer, sheet_name=sheet_name, index=False)
-
-    # Set the pointer to the beginning of the file
-    filtered_excel_data.seek(0)
-
-    # Trigger the download of the Excel file
-    st.download_button("Download Filtered Data", filtered_excel_data, file_name=f"Filtered_{filter_type.replace(' ', '')}{frequency if filter_type != 'Band Pass Filter (BPF)' else f'{low_freq}to{high_freq}'}Hz.xlsx", mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", key='download-filtered-excel')
+        filter_params = {'frequency': frequency}
+
+    def filter_radar_adxl(filter_type, low_freq=None, high_freq=None, frequency=None):
+        # Apply the selected filter only to Radar and ADXL columns
+        df_combined_detrended = tasks['Detrended Data']
+
+        # Dictionary to hold the filtered data columns for Radar and ADXL
+        filtered_radar_columns = {}
+        filtered_adxl_columns = {}
+
+        # Add data for each scan to the filtered columns dictionary
+        for i in range(30):  # Assuming there are 10 scans
+            filtered_radar_columns[f'Radar {i+1}'] = df_combined_detrended[f'Radar {i+1}']
+            filtered_adxl_columns[f'ADXL {i+1}'] = df_combined_detrended[f'ADXL {i+1}']
+
+        # Map selected filter type and frequency to the corresponding coefficients
+        if filter_type == 'Band Pass Filter (BPF)':
+            filter_coefs = [globals()[f'coefHPF{low_freq}Hz'], globals()[f'coefLPF{high_freq}Hz']]
+        elif filter_type == 'Low Pass Filter (LPF)':
+            filter_coefs = [globals()[f'coefLPF{frequency}Hz']]
+        else:
+            filter_coefs = [globals()[f'coefHPF{frequency}Hz']]
+
+        filtered_radar_data = pd.DataFrame(filtered_radar_columns)
+        filtered_adxl_data = pd.DataFrame(filtered_adxl_columns)
+        for filter_coef in filter_coefs:
+            filtered_radar_data = pd.DataFrame(filter_block_rolled(filter_coef, filtered_radar_data.values), columns=filtered_radar_data.columns)
+            filtered_adxl_data = pd.DataFrame(filter_block_rolled(filter_coef, filtered_adxl_data.values), columns=filtered_adxl_data.columns)
+        return pd.concat([filtered_radar_data, filtered_adxl_data], axis=1)
+
+    tasks.add('Filtered Data', filter_radar_adxl, deps=['Detrended Data'], filter_type=filter_type, **filter_params)
+    tasks.add('Filtered Time Domain Features', lambda: {'Time Domain Features': stats_radar(tasks['Filtered Data'])}, deps=['Filtered Data'])
+    tasks.add('Filtered Columns Comparison', lambda: {'Columns Comparison': columns_reports_unique(tasks['Filtered Data'])}, deps=['Filtered Data'])
+
+    # Multi-select box to select desired sheets
+    selected_sheets = st.multiselect('Select Sheets to Download', ['Filtered Data', 'Time Domain Features', 'Columns Comparison'])
+
+    # The button builds the export of the selected sheets, computed on the filtered data
+    download_export(tasks, [name if name == 'Filtered Data' else f'Filtered {name}' for name in selected_sheets],
+                    "Download Filtered Data", f"Filtered_{filter_type.replace(' ', '')}{frequency if filter_type != 'Band Pass Filter (BPF)' else f'{low_freq}to{high_freq}'}Hz", key='download-filtered-excel', fmt=export_format)
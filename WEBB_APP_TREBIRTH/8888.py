@@ -1,19 +1,19 @@
 import streamlit as st
-from google.cloud import firestore
+from firestore_client import get_client
 import pandas as pd
 from google.cloud.firestore import FieldFilter
 from io import BytesIO
 import matplotlib.pyplot as plt
 from datetime import datetime
 import numpy as np
-import time
 import zipfile
 import os
-import random
 from scipy import signal
 from scipy.stats import skew, kurtosis
-from preprocess import detrend, fq, calculate_statistics, columns_reports_unique, stats_filtereddata
-from google.api_core.exceptions import ResourceExhausted, RetryError
+from preprocess import detrend, fq, calculate_statistics, columns_reports_unique, stats_filtereddata, band_power_features
+from parallel_pipeline import parallel_calculate_statistics
+from scan_cache import get_scan_cache, table_metadata
+from sensor_block import combined_frame, decode_table
 from Filters import (coefLPF1Hz, coefLPF2Hz, coefLPF3Hz, coefLPF4Hz, coefLPF5Hz, coefLPF6Hz, coefLPF7Hz, coefLPF8Hz, 
                      coefLPF9Hz, coefLPF10Hz, coefLPF11Hz, coefLPF12Hz, coefLPF13Hz, coefLPF14Hz, coefLPF15Hz, 
                      coefLPF16Hz, coefLPF17Hz, coefLPF18Hz, coefLPF19Hz, coefLPF20Hz, coefLPF21Hz, coefLPF22Hz, 
@@ -31,19 +31,6 @@ from Filters import (coefLPF1Hz, coefLPF2Hz, coefLPF3Hz, coefLPF4Hz, coefLPF5Hz,
 
 
 
-def process(coef, in_signal):
-    FILTERTAPS = len(coef)
-    values = np.zeros(FILTERTAPS)
-    out_signal = []
-    gain = 1.0
-    k = 0
-    for in_value in in_signal:
-        values[k] = in_value
-        out = np.dot(coef, np.roll(values, k))
-        out /= gain
-        out_signal.append(out)
-        k = (k + 1) % FILTERTAPS
-    return out_signal
 # Set page configuration
 st.set_page_config(layout="wide")
 st.title('Data Analytics')
@@ -58,34 +45,9 @@ st.markdown(
     unsafe_allow_html=True,
 )
 
-def exponential_backoff(retries):
-    base_delay = 1
-    max_delay = 60
-    delay = base_delay * (2 ** retries) + random.uniform(0, 1)
-    return min(delay, max_delay)
-
-def get_firestore_data(query):
-    retries = 0
-    max_retries = 10
-    while retries < max_retries:
-        try:
-            results = query.stream()
-            return list(results)
-        except ResourceExhausted as e:
-            st.warning(f"Quota exceeded, retrying... (attempt {retries + 1})")
-            time.sleep(exponential_backoff(retries))
-            retries += 1
-        except RetryError as e:
-            st.warning(f"Retry error: {e}, retrying... (attempt {retries + 1})")
-            time.sleep(exponential_backoff(retries))
-            retries += 1
-        except Exception as e:
-            st.error(f"An error occurred: {e}")
-            break
-    raise Exception("Max retries exceeded")
 
 # Authenticate to Firestore with the JSON account key.
-db = firestore.Client.from_service_account_json("WEBB_APP_TREBIRTH/testdata1-20ec5-firebase-adminsdk-an9r6-a87cacba1d.json")
+db = get_client("WEBB_APP_TREBIRTH/testdata1-20ec5-firebase-adminsdk-an9r6-a87cacba1d.json")
 
 # User input for Row No., Tree No., Scan No., and Label
 row_number = st.text_input('Enter Row number', 'All')
@@ -99,80 +61,46 @@ label_infstat = st.selectbox('Select Label', ['All', 'Infected', 'Healthy'], ind
 # Dropdown for selecting sheets in Excel
 selected_sheets = st.multiselect('Select Sheets', ['Raw Data', 'Detrended Data', 'Normalized Data', 'Detrended & Normalized Data', 'Metadata', 'Time Domain Features', 'Frequency Domain Features', 'Columns Comparison'], default=['Raw Data', 'Metadata'])
 
-# Create a reference to the Firestore collection
-query = db.collection('M1V6_SS_Testing')
+# Scans are served from the local copy of the collection, synced with Firestore (see scan_cache.py)
+scans = get_scan_cache(db, 'M1V6_SS_Testing')
 
 # Apply filters based on user input
+filters = {}
 if row_number != 'All':
-    query = query.where('RowNo', '==', int(row_number))
+    filters['RowNo'] = int(row_number)
 if tree_number != 'All':
-    query = query.where('TreeNo', '==', int(tree_number))
+    filters['TreeNo'] = int(tree_number)
 if scan_number != 'All':
-    query = query.where('ScanNo', '==', int(scan_number))
+    filters['ScanNo'] = int(scan_number)
 if bucket_number != 'All':
-    query = query.where('BucketID', '==', int(bucket_number))
+    filters['BucketID'] = int(bucket_number)
 if label_infstat != 'All':
-    query = query.where('InfStat', '==', label_infstat)
+    filters['InfStat'] = label_infstat
 
 # Get documents based on the query
 try:
-    query_results = [doc.to_dict() for doc in query.stream()]
+    scans.sync()
+    scan_table = scans.table(**filters)
 except Exception as e:
     st.error(f"Failed to retrieve data: {e}")
     st.stop()
 
-if not query_results:
+if not scan_table.num_rows:
     st.write("No data found matching the specified criteria.")
 else:
-    # Create empty lists to store data
-    radar_data = []
-    adxl_data = []
-    ax_data = []
-    ay_data = []
-    az_data = []
-    metadata_list = []
-
-    # Function to slice data
-    #def slice_data(data):
-        #if len(data) > 1000:
-            #return data[100:-100]
-        #return data
-
-    for doc in query_results:
-        radar_data.append(doc.get('RadarRaw', []))
-        #adxl_data.append(slice_data(doc.get('ADXLRaw', [])))
-        adxl_data.append(doc.get('ADXLRaw', []))
-        ax_data.append(doc.get('Ax', []))
-        ay_data.append(doc.get('Ay', []))
-        az_data.append(doc.get('Az', []))
-        metadata = doc
+    metadata_list = table_metadata(scan_table)
+    for metadata in metadata_list:
         # Convert datetime values to timezone-unaware
         for key, value in metadata.items():
             if isinstance(value, datetime):
                 metadata[key] = value.replace(tzinfo=None)
-        metadata_list.append(metadata)
-
-    # Process each scan's data individually and concatenate later
-    def process_data(data_list, prefix):
-        processed_list = []
-        for i, data in enumerate(data_list):
-            df = pd.DataFrame(data).dropna()
-            df.fillna(df.mean(), inplace=True)
-            new_columns = [f'{prefix}{i+1}']
-            df.columns = new_columns
-            processed_list.append(df)
-        return pd.concat(processed_list, axis=1)
-
-    df_radar = process_data(radar_data, 'Radar ')
-    df_adxl = process_data(adxl_data, 'ADXL ')
-    df_ax = process_data(ax_data, 'Ax ')
-    df_ay = process_data(ay_data, 'Ay ')
-    df_az = process_data(az_data, 'Az ')
-
-    # Concatenate all DataFrames column-wise
-    df_combined = pd.concat([df_radar, df_adxl, df_ax, df_ay, df_az], axis=1)
-
-    filtered_data_df = pd.DataFrame({col: process(coefLPF50Hz, df_combined[col].values) for col in df_combined.columns})
+
+    # The sensor arrays straight from the cached table's buffers, one ragged block per sensor (see
+    # sensor_block.py); block.trim() would apply the slice_data() 100:-100 rule
+    blocks = decode_table(scan_table)
+
+    # All sensors side by side, laid out like the old per scan pd.concat
+    df_combined = combined_frame(blocks)
 
     # Detrend all the columns
     df_combined_detrended = df_combined.apply(detrend)
@@ -214,12 +142,14 @@ else:
         if 'Metadata' in selected_sheets:
             df_metadata_filtered.to_excel(writer, sheet_name='Metadata', index=False)
         if 'Time Domain Features' in selected_sheets:
-            time_domain_features = calculate_statistics(df_combined_detrended)
+            time_domain_features = parallel_calculate_statistics(df_combined_detrended)
             time_domain_features.to_excel(writer, sheet_name='Time Domain Features', index=False)
         if 'Frequency Domain Features' in selected_sheets:
             frequencies, powers = fq(df_combined_detrended)
             frequencies.to_excel(writer, sheet_name='Frequencies', index=False)
             powers.to_excel(writer, sheet_name='Powers', index=False)
+            # Power in 1 Hz bands from 1 to 50 Hz, one row per column
+            band_power_features(df_combined_detrended, nperseg=850).to_excel(writer, sheet_name='Band Powers')
         if 'Columns Comparison' in selected_sheets:
             columns_comparison = columns_reports_unique(df_combined_detrended)
             columns_comparison.to_excel(writer, sheet_name='Columns Comparison', index=False)
@@ -6,14 +6,12 @@ from io import BytesIO
 import matplotlib.pyplot as plt
 from datetime import datetime
 import numpy as np
-import time
 import zipfile
 import os
-import random
 from scipy import signal
 from scipy.stats import skew, kurtosis
 from preprocess import detrend, fq, stats_radar, columns_reports_unique
-from google.api_core.exceptions import ResourceExhausted, RetryError
+from fir_engine import filter_block_rolled
 from filterss import (coefLPF1HZ, coefLPF2HZ, coefLPF3HZ, coefLPF4HZ, coefLPF5HZ, coefLPF6HZ, coefLPF7HZ, coefLPF8HZ, 
 coefLPF9HZ, coefLPF10HZ, coefLPF11HZ, coefLPF12HZ, coefLPF13HZ, coefLPF14HZ, coefLPF15HZ, 
  coefHPF1HZ, coefHPF2HZ, coefHPF3HZ, coefHPF4HZ, coefHPF5HZ, coefHPF6HZ, coefHPF7HZ, coefHPF8HZ, 
@@ -42,19 +40,6 @@ def stats_filtereddata(df, band):
 
     return pd.DataFrame(stats)
 
-def process(coef, in_signal):
-    FILTERTAPS = len(coef)
-    values = np.zeros(FILTERTAPS)
-    out_signal = []
-    gain = 1.0
-    k = 0
-    for in_value in in_signal:
-        values[k] = in_value
-        out = np.dot(coef, np.roll(values, k))
-        out /= gain
-        out_signal.append(out)
-        k = (k + 1) % FILTERTAPS
-    return out_signal
   
 # Set page configuration
 st.set_page_config(layout="wide")
@@ -70,31 +55,6 @@ st.markdown(
     unsafe_allow_html=True,
 )
 
-def exponential_backoff(retries):
-    base_delay = 1
-    max_delay = 60
-    delay = base_delay * (2 ** retries) + random.uniform(0, 1)
-    return min(delay, max_delay)
-
-def get_firestore_data(query):
-    retries = 0
-    max_retries = 10
-    while retries < max_retries:
-        try:
-            results = query.stream()
-            return list(results)
-        except ResourceExhausted as e:
-            st.warning(f"Quota exceeded, retrying... (attempt {retries + 1})")
-            time.sleep(exponential_backoff(retries))
-            retries += 1
-        except RetryError as e:
-            st.warning(f"Retry error: {e}, retrying... (attempt {retries + 1})")
-            time.sleep(exponential_backoff(retries))
-            retries += 1
-        except Exception as e:
-            st.error(f"An error occurred: {e}")
-            break
-    raise Exception("Max retries exceeded")
 
 # Authenticate to Firestore with the JSON account key.
 db = firestore.Client.from_service_account_json("WEBB_APP_TREBIRTH/testdata1-20ec5-firebase-adminsdk-an9r6-a87cacba1d.json")
@@ -211,7 +171,7 @@ else:
     df_combined = pd.concat([df_radar, df_ax, df_ay, df_az], axis=1)
     #df_combined = pd.concat([df_radar, df_adxl, df_ax, df_ay, df_az], axis=1)
 
-    filtered_data_df = pd.DataFrame({col: process(coefLPF15HZ, df_combined[col].values) for col in df_combined.columns})
+    filtered_data_df = pd.DataFrame(filter_block_rolled(coefLPF15HZ, df_combined.values), columns=df_combined.columns)
 
     # Detrend all the columns
     df_combined_detrended = df_combined.apply(detrend)
@@ -303,13 +263,13 @@ else:
 
     # Apply the process function on each column
     if filter_type == 'Band Pass Filter (BPF)':
-        filtered_radar_data_low = pd.DataFrame({col: process(filter_coef_low, data.values) for col, data in filtered_radar_columns.items()})
-        filtered_radar_data = pd.DataFrame({col: process(filter_coef_high, data.values) for col, data in filtered_radar_data_low.items()})
-        #filtered_adxl_data_low = pd.DataFrame({col: process(filter_coef_low, data.values) for col, data in filtered_adxl_columns.items()})
-        #filtered_adxl_data = pd.DataFrame({col: process(filter_coef_high, data.values) for col, data in filtered_adxl_data_low.items()})
+        filtered_radar_data_low = pd.DataFrame(filter_block_rolled(filter_coef_low, pd.DataFrame(filtered_radar_columns).values), columns=list(filtered_radar_columns))
+        filtered_radar_data = pd.DataFrame(filter_block_rolled(filter_coef_high, filtered_radar_data_low.values), columns=filtered_radar_data_low.columns)
+        #filtered_adxl_data_low = pd.DataFrame(filter_block_rolled(filter_coef_low, pd.DataFrame(filtered_adxl_columns).values), columns=list(filtered_adxl_columns))
+        #filtered_adxl_data = pd.DataFrame(filter_block_rolled(filter_coef_high, filtered_adxl_data_low.values), columns=filtered_adxl_data_low.columns)
     else:
-        filtered_radar_data = pd.DataFrame({col: process(filter_coef, data.values) for col, data in filtered_radar_columns.items()})
-        #filtered_adxl_data = pd.DataFrame({col: process(filter_coef, data.values) for col, data in filtered_adxl_columns.items()})
+        filtered_radar_data = pd.DataFrame(filter_block_rolled(filter_coef, pd.DataFrame(filtered_radar_columns).values), columns=list(filtered_radar_columns))
+        #filtered_adxl_data = pd.DataFrame(filter_block_rolled(filter_coef, pd.DataFrame(filtered_adxl_columns).values), columns=list(filtered_adxl_columns))
 
 filtered_data = pd.concat([filtered_radar_data], axis=1)
 #filtered_data = pd.concat([filtered_radar_data, filtered_adxl_data], axis=1)
@@ -1,3 +1,5 @@
+from fir_engine import process
+
 # Define detrend function
 def detrend(dataframe):
     detrended_data = dataframe - dataframe.mean()
@@ -69,22 +71,6 @@ def columns_reports_unique(df):
     return report_df
 
 # Define filtering functions
-def process(coef, in_signal):
-    FILTERTAPS = len(coef)
-    values = in_signal[:FILTERTAPS].copy()
-    k = 0
-    out_signal = []
-    gain = 1.0
-    for in_value in in_signal:
-        out = 0.0
-        values[k] = in_value
-        for i in range(len(coef)):
-            out += coef[i] * values[(i + k) % FILTERTAPS]
-        out /= gain
-        k = (k + 1) % FILTERTAPS
-        out_signal.append(out)
-    return out_signal
-
 def allfiltering(input_signal):
     LPF_outputs = {}
     HPF_outputs = {}
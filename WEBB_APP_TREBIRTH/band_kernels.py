@@ -0,0 +1,167 @@
+# Combined band-pass kernels for the 49 coefHPF{n}Hz -> coefLPF{n+1}Hz cascades of the
+# "Download All Scans Filtered (1-50Hz) and Stats" export.
+#
+# Both stages are FIR filters, so each cascade is a single kernel: the convolution of the two ring buffer
+# kernels (see fir_engine.circular_kernel). Filtering with it from a zero state gives exactly what the device
+# FIR.h filters produce when chained, in one pass instead of two. The kernels are built on first use and
+# persisted next to this file (band_kernels.npz) together with the fingerprint of the coefficient set they came from.
+
+import os
+
+import numpy as np
+from scipy import fft
+
+from coef_store import open_store
+from fir_engine import circular_kernel
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CACHE_PATH = os.path.join(HERE, 'band_kernels.npz')
+CACHE_VERSION = 1
+
+_loaded = {}
+
+
+def band_names():
+    return [f'{low_freq}Hz-{low_freq + 1}Hz' for low_freq in range(1, 50)]
+
+
+def combine(hpf_coef, lpf_coef):
+    return np.convolve(circular_kernel(hpf_coef), circular_kernel(lpf_coef))
+
+
+def truncate(kernel, tol):
+    # Drop the smallest taps from either end while their absolute values sum to at most tol * sum(|kernel|).
+    # For an input bounded by A the filtered output then moves by at most tol * A * sum(|kernel|).
+    # Returns (offset, kernel) where offset is the number of leading taps dropped.
+    mag = np.abs(kernel)
+    budget = tol * mag.sum()
+    lo, hi = 0, len(kernel)
+    while hi - lo > 1:
+        drop = lo if mag[lo] <= mag[hi - 1] else hi - 1
+        if mag[drop] > budget:
+            break
+        budget -= mag[drop]
+        if drop == lo:
+            lo += 1
+        else:
+            hi -= 1
+    return lo, kernel[lo:hi]
+
+
+class BandKernels:
+    def __init__(self, names, offsets, kernels, tol=0.0, fingerprint=''):
+        self.names = list(names)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.lengths = np.array([len(k) for k in kernels], dtype=np.int64)
+        self.tol = tol
+        self.fingerprint = fingerprint
+        # One row per band, each kernel placed at its offset so row b is the full (untrimmed span) kernel
+        self.matrix = np.zeros((len(self.names), int((self.offsets + self.lengths).max())))
+        for b, k in enumerate(kernels):
+            self.matrix[b, self.offsets[b]:self.offsets[b] + len(k)] = k
+        self._spectra = {}
+
+    @classmethod
+    def build(cls, hpf, lpf, tol=0.0, fingerprint=''):
+        # hpf / lpf: {band name: coefficients} for the first and second stage of each band
+        offsets, kernels = [], []
+        for band in hpf:
+            offset, kernel = truncate(combine(hpf[band], lpf[band]), tol)
+            offsets.append(offset)
+            kernels.append(kernel)
+        return cls(list(hpf), offsets, kernels, tol, fingerprint)
+
+    def save(self, path=CACHE_PATH):
+        np.savez(path, version=CACHE_VERSION, names=np.array(self.names), offsets=self.offsets,
+                 lengths=self.lengths, matrix=self.matrix, tol=self.tol, fingerprint=self.fingerprint)
+
+    @classmethod
+    def load(cls, path=CACHE_PATH):
+        with np.load(path) as data:
+            if int(data['version']) != CACHE_VERSION:
+                raise ValueError(f"{path} was written by an older version")
+            offsets, lengths = data['offsets'], data['lengths']
+            kernels = [data['matrix'][b, o:o + n] for b, (o, n) in enumerate(zip(offsets, lengths))]
+            return cls(data['names'].tolist(), offsets, kernels, float(data['tol']), str(data['fingerprint']))
+
+    def __len__(self):
+        return len(self.names)
+
+    def kernel(self, band):
+        b = self.names.index(band)
+        return self.offsets[b], self.matrix[b, self.offsets[b]:self.offsets[b] + self.lengths[b]]
+
+    def apply(self, block, axis=0, max_chunk_bytes=64 * 2**20):
+        """Filter every scan of `block` (samples along `axis`) with every band kernel -> (band, scan, sample).
+
+        Like FilterBank.apply() the result is laid out sample x scan x band in memory.
+        """
+        x = np.moveaxis(np.asarray(block, dtype=float), axis, -1)
+        if x.ndim == 1:
+            x = x[None, :]
+        n_scans, n = x.shape
+        out = np.empty((n, n_scans, len(self)))
+        if n == 0:
+            return out.transpose(2, 1, 0)
+
+        nan = np.isnan(x)
+        has_nan = nan.any()
+        if has_nan:
+            x = np.where(nan, 0.0, x)
+
+        span = self.matrix.shape[1]
+        nfft = fft.next_fast_len(n + span - 1, real=True)
+        if nfft not in self._spectra:
+            self._spectra = {nfft: fft.rfft(self.matrix, nfft, axis=-1)}
+        spectra = self._spectra[nfft]
+        signal_spectrum = fft.rfft(x, nfft, axis=-1)
+
+        per_chunk = max(1, max_chunk_bytes // (16 * n_scans * (nfft // 2 + 1)))
+        for start in range(0, len(self), per_chunk):
+            stop = min(start + per_chunk, len(self))
+            y = fft.irfft(signal_spectrum[None] * spectra[start:stop, None], nfft, axis=-1)[..., :n]
+            out[:, :, start:stop] = y.transpose(2, 1, 0)
+
+        if has_nan:
+            # Output t sees x[t - offset - length + 1 .. t - offset]; poison it if any of those is NaN
+            counts = np.concatenate([np.zeros((n_scans, 1), dtype=np.int64), np.cumsum(nan, axis=-1)], axis=-1)
+            t = np.arange(n)
+            for b in range(len(self)):
+                hi = np.clip(t - self.offsets[b] + 1, 0, n)
+                lo = np.clip(t - self.offsets[b] - self.lengths[b] + 1, 0, n)
+                out[:, :, b][(counts[:, hi] - counts[:, lo]).T > 0] = np.nan
+        return out.transpose(2, 1, 0)
+
+
+def get_band_kernels(tol=0.0, path=CACHE_PATH, set_name='Filters'):
+    """The 49 band kernels, built from a coefficient set on first use and reused from `path` afterwards.
+
+    The persisted file is rebuilt whenever the coefficient set or the tolerance changes.
+    """
+    store = open_store()
+    fingerprint = store.fingerprint(set_name)
+    key = (tol, path, fingerprint)
+    if key in _loaded:
+        return _loaded[key]
+
+    kernels = None
+    if os.path.exists(path):
+        try:
+            kernels = BandKernels.load(path)
+        except (OSError, ValueError, KeyError):
+            kernels = None
+        if kernels is not None and (kernels.fingerprint != fingerprint or kernels.tol != tol):
+            kernels = None
+
+    if kernels is None:
+        bands = band_names()
+        hpf = {band: store.get('HPF', low_freq, set_name) for low_freq, band in enumerate(bands, 1)}
+        lpf = {band: store.get('LPF', low_freq + 1, set_name) for low_freq, band in enumerate(bands, 1)}
+        kernels = BandKernels.build(hpf, lpf, tol, fingerprint)
+        try:
+            kernels.save(path)
+        except OSError:
+            pass
+
+    _loaded[key] = kernels
+    return kernels
@@ -0,0 +1,136 @@
+# Binary store for the FIR coefficient sets that used to live in Filters.py / Filter.py / filterss.py / filters.py
+# as 600 KB of Python literals. All sets are concatenated into one float64 .npy that is memory mapped on load
+# (nothing to parse, coefficients come back as zero-copy read-only views), plus a small JSON index giving each
+# filter's set, type (LPF/HPF), cutoff, offset and number of taps.
+#
+#   python coef_store.py build 3 Filters=Filters.py Filter=Filter.py   (re)build the store, 3 = store version
+#   python coef_store.py header Filters > fir_coefs.h                  C arrays for FIR<T, ntaps>::setFilterCoeffs()
+#
+# Sources for build can be the old literal modules or coefficient workbooks such as Coefs_LPF.xlsx.
+
+import hashlib
+import json
+import os
+import re
+import sys
+
+import numpy as np
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DATA_PATH = os.path.join(HERE, 'filter_coefs.npy')
+INDEX_PATH = os.path.join(HERE, 'filter_coefs.json')
+FORMAT_VERSION = 1
+
+NAME_RE = re.compile(r'coef(LPF|HPF)(\d+)H[zZ]$')
+# No ^ anchor: FILTERS.py has two assignments run together on one line
+LITERAL_RE = re.compile(r'(coef\w+)\s*=\s*\[([^\]]*)\]')
+EXCEL_COLUMN_RES = [re.compile(r'^\s*(\d+)\s*Hz\s*(LPF|HPF)\s*$', re.I), re.compile(r'^\s*(LPF|HPF)\s*(\d+)\s*Hz\s*$', re.I)]
+
+_stores = {}
+
+
+def read_literal_module(path):
+    with open(path) as f:
+        text = f.read()
+    return {name: np.array([float(v) for v in body.split(',') if v.strip()]) for name, body in LITERAL_RE.findall(text)}
+
+
+def read_excel(path):
+    import pandas as pd
+    coefs = {}
+    for column, values in pd.read_excel(path, index_col=None).items():
+        for pattern in EXCEL_COLUMN_RES:
+            match = pattern.match(str(column))
+            if match:
+                cutoff, kind = sorted(match.groups(), key=str.isdigit, reverse=True)
+                coefs[f'coef{kind.upper()}{cutoff}Hz'] = values.dropna().to_numpy(dtype=float)
+                break
+    return coefs
+
+
+def build(sources, version, data_path=DATA_PATH, index_path=INDEX_PATH):
+    """sources: {set name: literal module (.py) or workbook (.xlsx)}"""
+    chunks, sets, offset = [], {}, 0
+    for set_name, path in sources.items():
+        coefs = read_excel(path) if path.endswith('.xlsx') else read_literal_module(path)
+        filters = {}
+        for name, values in coefs.items():
+            match = NAME_RE.match(name)
+            kind, cutoff = (match.group(1), int(match.group(2))) if match else (None, None)
+            filters[name] = [kind, cutoff, offset, len(values)]
+            chunks.append(values)
+            offset += len(values)
+        data = np.concatenate([coefs[name] for name in filters]) if filters else np.zeros(0)
+        sets[set_name] = {'source': os.path.basename(path), 'sha1': hashlib.sha1(data.tobytes()).hexdigest(), 'filters': filters}
+
+    np.save(data_path, np.concatenate(chunks) if chunks else np.zeros(0))
+    with open(index_path, 'w') as f:
+        json.dump({'format': FORMAT_VERSION, 'version': version, 'sets': sets}, f, indent=1)
+
+
+class CoefStore:
+    def __init__(self, data_path=DATA_PATH, index_path=INDEX_PATH):
+        with open(index_path) as f:
+            self.index = json.load(f)
+        if self.index.get('format') != FORMAT_VERSION:
+            raise ValueError(f"{index_path} has format {self.index.get('format')}, expected {FORMAT_VERSION}")
+        self.version = self.index['version']
+        self.data = np.load(data_path, mmap_mode='r').view(np.ndarray)
+
+    def sets(self):
+        return list(self.index['sets'])
+
+    def fingerprint(self, set_name):
+        return self.index['sets'][set_name]['sha1']
+
+    def coef(self, name, set_name='Filters'):
+        _, _, offset, taps = self.index['sets'][set_name]['filters'][name]
+        return self.data[offset:offset + taps]
+
+    def get(self, kind, cutoff, set_name='Filters'):
+        for name, (k, c, offset, taps) in self.index['sets'][set_name]['filters'].items():
+            if k == kind and c == cutoff:
+                return self.data[offset:offset + taps]
+        raise KeyError(f"No {cutoff}Hz {kind} in set {set_name}")
+
+    def load_set(self, set_name):
+        # {variable name as in the old module: coefficients}, e.g. {'coefLPF1Hz': array([...]), ...}
+        return {name: self.data[offset:offset + taps]
+                for name, (_, _, offset, taps) in self.index['sets'][set_name]['filters'].items()}
+
+
+def open_store(data_path=DATA_PATH, index_path=INDEX_PATH):
+    key = (data_path, index_path)
+    if key not in _stores:
+        _stores[key] = CoefStore(data_path, index_path)
+    return _stores[key]
+
+
+def load_set(set_name, data_path=DATA_PATH, index_path=INDEX_PATH):
+    return open_store(data_path, index_path).load_set(set_name)
+
+
+def c_header(store, set_name, ctype='float'):
+    # Arrays in the layout FIR.h expects: FIR<float, COEFLPF1HZ_TAPS> fir; fir.setFilterCoeffs(coefLPF1Hz);
+    guard = f'FIR_COEFS_{re.sub(r"[^A-Za-z0-9]", "_", set_name).upper()}_H'
+    lines = [f'// Generated by coef_store.py from set "{set_name}" (store version {store.version}, sha1 {store.fingerprint(set_name)})',
+             f'#ifndef {guard}', f'#define {guard}', '']
+    for name, coef in store.load_set(set_name).items():
+        taps = f'{name.upper()}_TAPS'
+        values = [repr(float(v)) for v in coef]
+        lines.append(f'#define {taps} {len(values)}')
+        lines.append(f'{ctype} {name}[{taps}] = {{')
+        lines.extend('  ' + ', '.join(values[i:i + 6]) + ',' for i in range(0, len(values), 6))
+        lines.append('};')
+        lines.append('')
+    lines.append(f'#endif  // {guard}')
+    return '\n'.join(lines) + '\n'
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 3 and sys.argv[1] == 'build':
+        build(dict(arg.split('=', 1) for arg in sys.argv[3:]), int(sys.argv[2]))
+    elif len(sys.argv) == 3 and sys.argv[1] == 'header':
+        sys.stdout.write(c_header(open_store(), sys.argv[2]))
+    else:
+        sys.exit(f"usage: {sys.argv[0]} build VERSION SET=SOURCE ... | header SET")
@@ -0,0 +1,183 @@
+# Background export jobs.
+#
+# Building an export (all 49 bands, columns comparison, a big workbook) ran in the Streamlit script thread: the
+# user's tab was frozen until it was done, and everyone else on the server waited behind it. submit() puts the
+# build on a pool of JOB_WORKERS threads instead and returns at once. Jobs live in a SQLite table (JOBS_DB), so
+# any session can see a job's state, stage and progress while it runs, and the finished file stays in JOBS_DIR
+# for JOB_TTL seconds, so a user can come back for it. A job's id is the hash of what it exports: asking for
+# an export that is queued, running or done gives back the existing job instead of starting another one.
+#
+#   job_id = submit(tasks.export_key(names, fmt), build, label="Filtered 1-50Hz")
+#   job = get_job(job_id)       # Job(state='running', stage='Computing Filtered Bands and Stats', progress=0.5, ...)
+#   job.path                    # the finished file, once job.state == DONE
+#
+# build(progress) returns (data, file name, mime type), data being bytes or an ExportFile; it reports its
+# stages with progress(stage, fraction). The workers are threads because the builds are closures over the
+# page's DataFrames, and the heavy parts (NumPy, the filter pool of parallel_pipeline.py) do not hold the GIL.
+
+import hashlib
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from export_tasks import EXPORT_DIR, ExportFile
+
+JOBS_DIR = os.path.join(EXPORT_DIR, 'jobs')
+JOBS_DB = os.environ.get('TREBIRTH_JOBS_DB', os.path.join(EXPORT_DIR, 'jobs.sqlite3'))
+# Exports built at the same time; set with TREBIRTH_JOB_WORKERS
+JOB_WORKERS = int(os.environ.get('TREBIRTH_JOB_WORKERS', 2))
+# Seconds a finished (or failed) job and its file are kept
+JOB_TTL = 24 * 3600
+
+QUEUED, RUNNING, DONE, FAILED = 'queued', 'running', 'done', 'failed'
+
+Job = namedtuple('Job', ['id', 'label', 'state', 'stage', 'progress', 'path', 'file_name', 'mime', 'error',
+                         'created', 'updated', 'pid'])
+
+_executor = None
+_jobs_lock = threading.Lock()
+_ready = False
+
+
+@contextmanager
+def _connect():
+    # Autocommit; every statement is its own transaction
+    connection = sqlite3.connect(JOBS_DB, timeout=30, isolation_level=None)
+    connection.row_factory = sqlite3.Row
+    try:
+        yield connection
+    finally:
+        connection.close()
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def _init():
+    # Under _jobs_lock
+    global _ready
+    if _ready:
+        return
+    os.makedirs(JOBS_DIR, exist_ok=True)
+    with _connect() as connection:
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS jobs (id TEXT PRIMARY KEY, label TEXT, state TEXT, stage TEXT, progress REAL, '
+            'path TEXT, file_name TEXT, mime TEXT, error TEXT, created REAL, updated REAL, pid INTEGER)')
+        # Jobs of a server process that is gone will not finish
+        for row in connection.execute('SELECT id, pid FROM jobs WHERE state IN (?, ?)', (QUEUED, RUNNING)).fetchall():
+            if row['pid'] != os.getpid() and not _pid_alive(row['pid']):
+                connection.execute('UPDATE jobs SET state = ?, error = ?, updated = ? WHERE id = ?',
+                                   (FAILED, 'Interrupted by a server restart', time.time(), row['id']))
+    _ready = True
+
+
+def _pool():
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=JOB_WORKERS, thread_name_prefix='export-job')
+    return _executor
+
+
+def _update(job_id, **fields):
+    fields['updated'] = time.time()
+    with _connect() as connection:
+        connection.execute(f"UPDATE jobs SET {', '.join(f'{name} = ?' for name in fields)} WHERE id = ?",
+                           (*fields.values(), job_id))
+
+
+def job_id(key):
+    """Id of the job exporting key (e.g. ExportTasks.export_key())."""
+    return hashlib.sha1(repr(key).encode()).hexdigest()
+
+
+def get_job(job_id):
+    with _jobs_lock:
+        _init()
+    with _connect() as connection:
+        row = connection.execute('SELECT * FROM jobs WHERE id = ?', (job_id,)).fetchone()
+    return Job(**dict(row)) if row is not None else None
+
+
+def recent_jobs(limit=20):
+    """The latest jobs, newest first."""
+    with _jobs_lock:
+        _init()
+    with _connect() as connection:
+        rows = connection.execute('SELECT * FROM jobs ORDER BY created DESC LIMIT ?', (limit,)).fetchall()
+    return [Job(**dict(row)) for row in rows]
+
+
+def _usable(job):
+    if job.state in (QUEUED, RUNNING):
+        return True
+    return job.state == DONE and job.path is not None and os.path.exists(job.path)
+
+
+def submit(key, build, label=''):
+    """Queue build(progress) as the job for key, unless that job is queued, running or done already; its id."""
+    new_id = job_id(key)
+    with _jobs_lock:
+        _init()
+        with _connect() as connection:
+            # Checked and queued in one transaction, so another server process cannot queue it in between
+            connection.execute('BEGIN IMMEDIATE')
+            try:
+                row = connection.execute('SELECT * FROM jobs WHERE id = ?', (new_id,)).fetchone()
+                if row is not None and _usable(Job(**dict(row))):
+                    return new_id
+                now = time.time()
+                connection.execute('INSERT OR REPLACE INTO jobs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                                   (new_id, label, QUEUED, 'Queued', 0.0, None, None, None, None, now, now, os.getpid()))
+            finally:
+                connection.execute('COMMIT')
+        _pool().submit(_run, new_id, build)
+    sweep()
+    return new_id
+
+
+def _store(job_id, data, file_name):
+    directory = os.path.join(JOBS_DIR, job_id)
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, os.path.basename(file_name))
+    if isinstance(data, ExportFile):
+        # A copy: the export cache may remove its file before the user downloads this one
+        shutil.copyfile(data.path, path)
+    else:
+        with open(path, 'wb') as f:
+            f.write(data)
+    return path
+
+
+def _run(job_id, build):
+    _update(job_id, state=RUNNING, stage='Starting')
+    try:
+        data, file_name, mime = build(lambda stage, fraction: _update(job_id, stage=stage, progress=fraction))
+        _update(job_id, stage='Saving', progress=1.0)
+        path = _store(job_id, data, file_name)
+        _update(job_id, state=DONE, stage='Done', path=path, file_name=file_name, mime=mime)
+    except Exception as e:
+        _update(job_id, state=FAILED, error=f'{type(e).__name__}: {e}')
+
+
+def sweep(ttl=JOB_TTL):
+    """Remove finished and failed jobs (and their files) older than ttl seconds."""
+    with _jobs_lock:
+        _init()
+        with _connect() as connection:
+            rows = connection.execute('SELECT id FROM jobs WHERE state IN (?, ?) AND updated < ?',
+                                      (DONE, FAILED, time.time() - ttl)).fetchall()
+            for row in rows:
+                shutil.rmtree(os.path.join(JOBS_DIR, row['id']), ignore_errors=True)
+                connection.execute('DELETE FROM jobs WHERE id = ?', (row['id'],))
@@ -0,0 +1,175 @@
+# Applies many FIR coefficient sets (e.g. all coefLPF{n}Hz / coefHPF{n}Hz from Filters.py) to a block of scans at once.
+#
+# The coefficient sets are stacked into one zero padded matrix and the whole (n_scans x n_samples) block is
+# filtered against every band with batched FFTs. The result is a (band x scan x sample) array whose memory is laid
+# out sample x scan x band, so to_frame() can expose it as the usual wide DataFrame ("{column}_{band}" columns)
+# without copying.
+
+import numpy as np
+import pandas as pd
+from scipy import fft
+
+from fir_engine import StreamingFIR, circular_kernel, rolled_operator, _windowed_nan_mask
+
+
+class FilterBank:
+    def __init__(self, coefs, rolled=False, max_chunk_bytes=64 * 2**20):
+        # coefs: {band name: coefficients}. rolled=True reproduces the np.roll process() of 8686.py & co,
+        # otherwise the seeded ring buffer process() of filters.py is used.
+        self.names = list(coefs)
+        self.taps = np.array([len(c) for c in coefs.values()])
+        self.coef_matrix = np.zeros((len(self.names), self.taps.max()))
+        for i, c in enumerate(coefs.values()):
+            self.coef_matrix[i, :len(c)] = c
+        self.rolled = rolled
+        self.max_chunk_bytes = max_chunk_bytes
+        self._kernel_spectra = {}
+
+    def __len__(self):
+        return len(self.names)
+
+    def coef(self, band):
+        return self.coef_matrix[band, :self.taps[band]]
+
+    def apply(self, block, axis=-1):
+        """Filter every scan of `block` (samples along `axis`) with every band -> (band, scan, sample)."""
+        x = np.moveaxis(np.asarray(block, dtype=float), axis, -1)
+        if x.ndim == 1:
+            x = x[None, :]
+        return self._run(x[None], shared=True)
+
+    def apply_each(self, blocks, axis=-1):
+        """Filter blocks[b] with band b only, e.g. the second stage of a HPF -> LPF cascade."""
+        x = np.moveaxis(np.asarray(blocks, dtype=float), axis, -1)
+        if x.shape[0] != len(self):
+            raise ValueError(f"Expected {len(self)} blocks, got {x.shape[0]}")
+        return self._run(x, shared=False)
+
+    def to_frame(self, filtered, columns):
+        # Same layout as apply_allfiltering_to_columns(): one column per (input column, band)
+        wide = filtered.transpose(2, 1, 0).reshape(filtered.shape[2], -1)
+        names = [f"{column}_{name}" for column in columns for name in self.names]
+        return pd.DataFrame(wide, columns=names, copy=False)
+
+    def _run(self, x, shared):
+        n_scans, n = x.shape[-2:]
+        out = np.empty((n, n_scans, len(self)))
+        if n:
+            if self.rolled:
+                self._run_rolled(x, shared, out)
+            else:
+                self._run_seeded(x, shared, out)
+        return out.transpose(2, 1, 0)
+
+    def _run_rolled(self, x, shared, out):
+        n = x.shape[-1]
+        for b in range(len(self)):
+            out[:, :, b] = rolled_operator(self.coef(b), n) @ x[0 if shared else b].T
+
+    def _spectra(self, nfft):
+        if nfft not in self._kernel_spectra:
+            kernels = np.zeros_like(self.coef_matrix)
+            for b in range(len(self)):
+                kernels[b, :self.taps[b]] = circular_kernel(self.coef(b))
+            self._kernel_spectra = {nfft: fft.rfft(kernels, nfft, axis=-1)}
+        return self._kernel_spectra[nfft]
+
+    def _extended(self, x, taps, tmax, nfft):
+        # Signal as seen by the seeded ring buffer: in_signal[1:taps] acts as the samples before the start.
+        # Left padded to the longest filter so that every band lines up on the same output positions.
+        n_scans, n = x.shape
+        ext = np.zeros((n_scans, tmax - 1 + n))
+        m = min(taps, n) - 1
+        ext[:, tmax - taps:tmax - taps + m] = x[:, 1:1 + m]
+        ext[:, tmax - 1:] = x
+        nan = np.isnan(ext)
+        mask = None
+        if nan.any():
+            ext[nan] = 0.0
+            mask = _windowed_nan_mask(nan, taps)[:, tmax - taps:]
+        return fft.rfft(ext, nfft, axis=-1), mask
+
+    def _run_seeded(self, x, shared, out):
+        n_scans, n = x.shape[-2:]
+        tmax = self.taps.max()
+        nfft = fft.next_fast_len(n + tmax - 1, real=True)
+        kernels = self._spectra(nfft)
+        per_chunk = max(1, self.max_chunk_bytes // (16 * n_scans * (nfft // 2 + 1)))
+        # With a shared input only one extended spectrum per distinct filter length is needed
+        cache = {}
+        for start in range(0, len(self), per_chunk):
+            chunk = range(start, min(start + per_chunk, len(self)))
+            spectra, masks = [], []
+            for b in chunk:
+                taps = self.taps[b]
+                if not shared or taps not in cache:
+                    cache[taps] = self._extended(x[0 if shared else b], taps, tmax, nfft)
+                spectra.append(cache[taps][0])
+                masks.append(cache[taps][1])
+                if not shared:
+                    del cache[taps]
+            y = fft.irfft(np.stack(spectra) * kernels[chunk.start:chunk.stop, None], nfft, axis=-1)
+            y = y[..., tmax - 1:tmax - 1 + n]
+            for i, mask in enumerate(masks):
+                if mask is not None:
+                    y[i][mask] = np.nan
+            out[:, :, chunk.start:chunk.stop] = y.transpose(2, 1, 0)
+
+
+class StreamingFilterBank:
+    """FilterBank for data that arrives in chunks: every band keeps its own StreamingFIR state.
+
+    filter(chunk) takes (samples,) or (samples, scans) like FilterBank.apply(block, axis=0) and returns the
+    (band, scan, sample) output for that chunk only, so a long recording never needs every band's full output
+    in memory. Concatenating the chunk outputs along the sample axis (plus flush()) equals FilterBank.apply().
+    """
+
+    def __init__(self, coefs, mode='seeded'):
+        self.names = list(coefs)
+        self.filters = [StreamingFIR(c, mode) for c in coefs.values()]
+        self.mode = mode
+        # In seeded mode every band waits for its own FILTERTAPS samples; holding the input back until
+        # the longest filter is ready keeps all bands emitting the same samples.
+        self._warmup = max(f.taps for f in self.filters) if mode == 'seeded' else 0
+        self._pending = []
+        self._held = 0
+
+    def __len__(self):
+        return len(self.names)
+
+    def filter(self, chunk):
+        x = np.asarray(chunk, dtype=float)
+        if self._pending or self._held + x.shape[0] < self._warmup:
+            self._pending.append(x)
+            self._held += x.shape[0]
+            if self._held < self._warmup:
+                return self._stack([x[:0]] * len(self))
+            x = np.concatenate(self._pending, axis=0)
+            self._pending, self._held = [], 0
+        return self._stack([f.filter(x) for f in self.filters])
+
+    def flush(self):
+        """Output for input still held back in seeded mode; resets every band."""
+        x = np.concatenate(self._pending, axis=0) if self._pending else None
+        self._pending, self._held = [], 0
+        outs = []
+        for f in self.filters:
+            parts = [f.filter(x)] if x is not None else []
+            parts.append(f.flush())
+            outs.append(np.concatenate(parts, axis=0))
+        return self._stack(outs)
+
+    def reset(self):
+        self._pending, self._held = [], 0
+        for f in self.filters:
+            f.reset()
+
+    def _stack(self, outs):
+        # (sample, [scan]) per band -> (band, scan, sample) with sample x scan x band memory, as FilterBank.apply()
+        out = np.stack([o.reshape(o.shape[0], int(np.prod(o.shape[1:]))) for o in outs], axis=-1)
+        return out.transpose(2, 1, 0)
+
+
+def bank_from_module(module, kinds=('LPF', 'HPF'), cutoffs=range(1, 51), rolled=False):
+    # e.g. bank_from_module(Filters) for all 100 coefLPF{n}Hz / coefHPF{n}Hz sets
+    return FilterBank({f'{kind}{f}Hz': getattr(module, f'coef{kind}{f}Hz') for kind in kinds for f in cutoffs}, rolled=rolled)
@@ -0,0 +1,185 @@
+# Runs the per-scan filtering and stats of the analytics exports on a pool of worker processes.
+#
+# The scans (columns) are split into contiguous partitions, one per worker. The input block and the filtered
+# output live in shared memory, so only the partition bounds travel to the workers and only the stats tables
+# come back. Partitions are put back together in scan order, so the Excel sheets are the same as when
+# everything runs in one process.
+#
+# The number of workers comes from the TREBIRTH_WORKERS environment variable (default: one per CPU);
+# 1 runs everything in the calling process.
+
+import multiprocessing as mp
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+import pandas as pd
+
+from band_kernels import band_names, get_band_kernels
+from coef_store import open_store
+from filter_bank import FilterBank
+from preprocess import band_stats, calculate_statistics
+
+MAX_WORKERS = int(os.environ.get('TREBIRTH_WORKERS', os.cpu_count() or 1))
+# Below this many scans per worker starting the tasks costs more than it saves
+MIN_SCANS_PER_WORKER = 4
+
+_executors = {}
+
+
+def get_executor(max_workers=MAX_WORKERS):
+    # One pool per server process, reused across Streamlit reruns. forkserver (or spawn) instead of fork
+    # so the workers do not inherit the Streamlit server's threads.
+    if max_workers not in _executors:
+        method = 'forkserver' if 'forkserver' in mp.get_all_start_methods() else 'spawn'
+        _executors[max_workers] = ProcessPoolExecutor(max_workers, mp_context=mp.get_context(method))
+    return _executors[max_workers]
+
+
+def _attach(name):
+    # The owner unlinks the block, so a worker attaching to it must not register it with the resource_tracker
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    # Before 3.13 attaching always registers. The workers share the owner's tracker, where an unregister() after
+    # attaching would drop the owner's own registration, so the registration is skipped instead
+    register = resource_tracker.register
+    resource_tracker.register = lambda name, rtype: None if rtype == 'shared_memory' else register(name, rtype)
+    try:
+        return shared_memory.SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+
+class SharedArray:
+    # A numpy array in a SharedMemory block. Pickles as (shape, dtype, name), so a worker receiving it
+    # attaches to the same memory instead of getting a copy.
+    def __init__(self, shape, dtype=float, name=None):
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self.owner = name is None
+        size = max(1, int(np.prod(self.shape)) * self.dtype.itemsize)
+        self.shm = shared_memory.SharedMemory(create=True, size=size) if self.owner else _attach(name)
+        self.array = np.ndarray(self.shape, self.dtype, buffer=self.shm.buf)
+
+    def __reduce__(self):
+        return SharedArray, (self.shape, self.dtype, self.shm.name)
+
+    def close(self):
+        self.array = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+def partitions(n_scans, max_workers=MAX_WORKERS):
+    # Contiguous (start, stop) scan ranges, at most one per worker
+    count = max(1, min(max_workers, n_scans // MIN_SCANS_PER_WORKER))
+    edges = np.linspace(0, n_scans, count + 1).astype(int)
+    return list(zip(edges[:-1].tolist(), edges[1:].tolist()))
+
+
+def _cascade(x):
+    # The two pass HPF{n}Hz -> LPF{n+1}Hz filtering (np.roll process()) of the Filters coefficient set
+    store = open_store()
+    bands = band_names()
+    hpf_bank = FilterBank({band: store.get('HPF', low_freq) for low_freq, band in enumerate(bands, 1)}, rolled=True)
+    lpf_bank = FilterBank({band: store.get('LPF', low_freq + 1) for low_freq, band in enumerate(bands, 1)}, rolled=True)
+    return lpf_bank.apply_each(hpf_bank.apply(x, axis=0))
+
+
+def filter_and_stats(x, out, columns, method='cascade'):
+    """Filter the scans of x (sample x scan) into every 1-50Hz band and compute their band_stats() table.
+
+    out: (sample, scan, band) array receiving the filtered data.
+    """
+    filtered = _cascade(x) if method == 'cascade' else get_band_kernels().apply(x, axis=0)
+    stats = band_stats(filtered, band_names(), columns)
+    nan = np.isnan(filtered)
+    if nan.any():
+        # The filtered sheets have always shown NaNs filled with the column mean, as stats_filtereddata() left them
+        mean = stats["Mean"].to_numpy().reshape(filtered.shape[:2])
+        filtered = np.where(nan, mean[..., None], filtered)
+    out[...] = filtered.transpose(2, 1, 0)
+    return stats
+
+
+def _filter_and_stats_task(src, dst, start, stop, columns, method):
+    try:
+        return filter_and_stats(src.array[:, start:stop], dst.array[:, start:stop], columns, method)
+    finally:
+        src.close()
+        dst.close()
+
+
+def filter_bands_and_stats(df, method='cascade', max_workers=MAX_WORKERS):
+    """Filtered data and stats of every scan for the "Filtered (1-50Hz) and Stats" export.
+
+    method: 'cascade' for the HPF -> LPF np.roll filters, 'kernels' for the combined band kernels (band_kernels.py).
+    Returns (filtered, stats): filtered is (band, scan, sample) like FilterBank.apply(), stats is the band_stats()
+    table with the rows in (band, column) order.
+    """
+    x = df.to_numpy(dtype=float)
+    n, n_scans = x.shape
+    columns = list(df.columns)
+    bands = band_names()
+    bounds = partitions(n_scans, max_workers)
+
+    if len(bounds) == 1:
+        out = np.empty((n, n_scans, len(bands)))
+        return out.transpose(2, 1, 0), filter_and_stats(x, out, columns, method)
+
+    src = SharedArray(x.shape)
+    dst = SharedArray((n, n_scans, len(bands)))
+    try:
+        src.array[...] = x
+        executor = get_executor(max_workers)
+        futures = [executor.submit(_filter_and_stats_task, src, dst, start, stop, columns[start:stop], method)
+                   for start, stop in bounds]
+        # Collected in submission order, not completion order
+        results = [future.result() for future in futures]
+        out = dst.array.copy()
+    finally:
+        src.close()
+        dst.close()
+
+    # Each partition's table is (band, its columns); interleave them back into (band, column) order
+    names = list(results[0].columns[2:])
+    values = np.concatenate([result[names].to_numpy().reshape(len(bands), -1, len(names)) for result in results], axis=1)
+    stats = pd.DataFrame({"Band": np.repeat(bands, n_scans), "Column": np.tile(columns, len(bands))})
+    for i, name in enumerate(names):
+        stats[name] = values[..., i].ravel()
+    return out.transpose(2, 1, 0), stats
+
+
+def _column_task(func, src, start, stop, columns):
+    try:
+        return func(pd.DataFrame(src.array[:, start:stop], columns=columns))
+    finally:
+        src.close()
+
+
+def map_columns(func, df, max_workers=MAX_WORKERS):
+    """func(df) for a column-wise reduction such as calculate_statistics(), with the columns split across workers.
+
+    func must be importable by the workers (a module level function) and compute each column independently.
+    The partial results are concatenated in column order.
+    """
+    bounds = partitions(df.shape[1], max_workers)
+    if len(bounds) == 1 or not all(np.issubdtype(dtype, np.number) for dtype in df.dtypes):
+        return func(df)
+
+    columns = list(df.columns)
+    src = SharedArray(df.shape)
+    try:
+        src.array[...] = df.to_numpy(dtype=float)
+        executor = get_executor(max_workers)
+        futures = [executor.submit(_column_task, func, src, start, stop, columns[start:stop]) for start, stop in bounds]
+        return pd.concat([future.result() for future in futures], axis=0)
+    finally:
+        src.close()
+
+
+def parallel_calculate_statistics(df, max_workers=MAX_WORKERS):
+    return map_columns(calculate_statistics, df, max_workers)
@@ -0,0 +1,75 @@
+# Parallel rendering of the per-column plots of the analytics pages.
+#
+# 77777.py, 33.py and web2.py drew every Radar / ADXL column one after the other with pyplot, saved each PNG to
+# temp_plots/, read it back for st.image() and then zipped the files from disk. render_plots() draws the
+# figures on the worker pool of parallel_pipeline.py, with the Agg renderer of a bare matplotlib Figure (no
+# pyplot state), straight into PNG bytes and hands them back as they finish. show_plots() puts those bytes on
+# the page and into an in-memory zip, so nothing is written to disk and the time taken goes with the number
+# of cores rather than the number of columns.
+#
+#   specs = domain_plots(filtered_radar_columns, 'Frequency Domain', lambda column: f'{column} - Frequency Domain Plot')
+#   zip_data = show_plots(specs, [f'{name}.png' for name in filtered_radar_columns])
+
+import zipfile
+from collections import namedtuple
+from concurrent.futures import as_completed
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+from matplotlib.figure import Figure
+
+from parallel_pipeline import MAX_WORKERS, get_executor
+from preprocess import fq
+
+PlotSpec = namedtuple('PlotSpec', ['x', 'y', 'title', 'xlabel', 'ylabel'])
+
+
+def domain_plots(columns, domain, title, sampling_rate=100):
+    """One PlotSpec per {column name: samples} entry; title(column) gives the figure titles."""
+    names = list(columns)
+    if domain == 'Time Domain':
+        return [PlotSpec(np.arange(len(columns[name])) / sampling_rate, np.asarray(columns[name], dtype=float),
+                         title(name), 'Time (s)', 'Signal') for name in names]
+    # The spectra of all columns in one fq() call; column i is what fq(pd.DataFrame(data)) gave for column i
+    frequencies, powers = fq(pd.DataFrame({i: np.asarray(columns[name], dtype=float) for i, name in enumerate(names)}))
+    with np.errstate(divide='ignore'):
+        # Power in dB
+        return [PlotSpec(frequencies[i].to_numpy(), 10 * np.log10(powers[i].to_numpy()), title(name),
+                         'Frequency (Hz)', 'Power Spectrum (dB)') for i, name in enumerate(names)]
+
+
+def render_png(spec):
+    """PNG bytes of one line plot, drawn like the pages' plt.subplots() figures."""
+    fig = Figure()
+    ax = fig.subplots()
+    ax.plot(spec.x, spec.y)
+    ax.set_xlabel(spec.xlabel)
+    ax.set_ylabel(spec.ylabel)
+    ax.set_title(spec.title)
+    data = BytesIO()
+    fig.savefig(data, format='png')
+    return data.getvalue()
+
+
+def render_plots(specs, max_workers=MAX_WORKERS):
+    """(index, PNG bytes) of every spec, in the order they finish."""
+    if max_workers <= 1 or len(specs) <= 1:
+        for i, spec in enumerate(specs):
+            yield i, render_png(spec)
+        return
+    futures = {get_executor(max_workers).submit(render_png, spec): i for i, spec in enumerate(specs)}
+    for future in as_completed(futures):
+        yield futures[future], future.result()
+
+
+def show_plots(specs, file_names, max_workers=MAX_WORKERS):
+    """st.image() every plot, in spec order, as soon as it is rendered; the bytes of a zip of all of them."""
+    import streamlit as st
+    slots = [st.empty() for _ in specs]
+    data = BytesIO()
+    with zipfile.ZipFile(data, 'w') as archive:
+        for i, png in render_plots(specs, max_workers):
+            slots[i].image(png)
+            archive.writestr(file_names[i], png)
+    return data.getvalue()
@@ -0,0 +1,302 @@
+# Local on-disk copy of the scan collections (M1V6_SS_Testing, DevOps, demo_db, ...) so a page view does not
+# download every document with its RadarRaw / ADXLRaw / Ax / Ay / Az arrays again.
+#
+# One directory per Firestore project, database and collection holding Parquet parts. Every part has a row per
+# document with
+#   _id                         the document id
+#   RadarRaw, ADXLRaw, ...      the sensor arrays as Arrow list<double> columns, i.e. one flat value buffer
+#                               plus offsets, handed out as zero-copy numpy slices
+#   RowNo, TreeNo, ...          the fields the pages filter on, JSON encoded so 3 and "3" stay different
+#                               like they are for Firestore
+#   _timestamp, _meta           the document timestamp and all non-array fields as JSON
+# sync() asks Firestore for the documents timestamped from LATE_WINDOW before the newest one already stored
+# and appends the new ones and the ones whose fields changed as a new part; a later copy of a document replaces
+# the earlier one. Every FULL_SYNC_INTERVAL the collection is downloaded again and replaces the parts, which
+# picks up older edits, deletions and documents without a timestamp.
+#
+#   scans = get_scan_cache(db, 'M1V6_SS_Testing')
+#   docs = scans.query(RowNo=3, InfStat='Infected')     # list of dicts like doc.to_dict()
+
+import json
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from firestore_client import client_scope
+from paged_reader import iter_pages, to_array
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.environ.get('TREBIRTH_SCAN_CACHE', os.path.join(HERE, '.scan_cache'))
+FORMAT_VERSION = 2
+
+ARRAY_FIELDS = ('RadarRaw', 'ADXLRaw', 'Ax', 'Ay', 'Az')
+FILTER_FIELDS = ('RowNo', 'TreeNo', 'ScanNo', 'BucketID', 'InfStat', 'DeviceName:')
+TIMESTAMP_FIELD = 'timestamp'
+# Seconds between two syncs of the same collection; page reruns in between are answered locally
+SYNC_INTERVAL = 60
+# Seconds before the newest stored timestamp an incremental sync reads again, for scans written late
+LATE_WINDOW = 600
+# Seconds between two full downloads of the same collection
+FULL_SYNC_INTERVAL = 3600
+# Parts are merged into one (dropping replaced documents) once there are more than this many
+MAX_PARTS = 32
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def _encode_key(value):
+    # Firestore equality is type strict except that 3 == 3.0
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return json.dumps(value, default=str)
+
+
+def _encode_meta(value):
+    if isinstance(value, datetime):
+        return {'$datetime': value.isoformat()}
+    return str(value)
+
+
+def _decode_meta(value):
+    if '$datetime' in value and len(value) == 1:
+        return datetime.fromisoformat(value['$datetime'])
+    return value
+
+
+def _utc(value):
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _schema():
+    fields = [pa.field('_id', pa.string()), pa.field('_timestamp', pa.timestamp('us', tz='UTC')), pa.field('_meta', pa.string())]
+    fields += [pa.field(name, pa.list_(pa.float64())) for name in ARRAY_FIELDS]
+    fields += [pa.field(name, pa.string()) for name in FILTER_FIELDS]
+    return pa.schema(fields)
+
+
+def documents_to_table(documents):
+    """[(document id, doc.to_dict()), ...] -> Arrow table in the cache layout."""
+    columns = {name: [] for name in _schema().names}
+    for doc_id, data in documents:
+        columns['_id'].append(doc_id)
+        timestamp = data.get(TIMESTAMP_FIELD)
+        columns['_timestamp'].append(_utc(timestamp) if isinstance(timestamp, datetime) else None)
+        columns['_meta'].append(json.dumps({k: v for k, v in data.items() if k not in ARRAY_FIELDS}, default=_encode_meta))
+        for name in ARRAY_FIELDS:
+            columns[name].append(to_array(data.get(name)))
+        for name in FILTER_FIELDS:
+            columns[name].append(_encode_key(data[name]) if name in data else None)
+    return pa.table(columns, schema=_schema())
+
+
+class ScanCache:
+    def __init__(self, db, collection, root=CACHE_DIR, sync_interval=SYNC_INTERVAL,
+                 full_sync_interval=FULL_SYNC_INTERVAL):
+        self.db = db
+        self.collection = collection
+        # The same collection name in another project or database is another collection
+        self.path = os.path.join(root, *client_scope(db), collection)
+        self.sync_interval = sync_interval
+        self.full_sync_interval = full_sync_interval
+        self._lock = threading.Lock()
+        self._last_sync = 0.0
+        self._table = None
+        os.makedirs(self.path, exist_ok=True)
+        self.state = self._read_state()
+
+    # --- state -------------------------------------------------------------------------------------------
+
+    def _state_path(self):
+        return os.path.join(self.path, 'state.json')
+
+    def _read_state(self):
+        try:
+            with open(self._state_path()) as f:
+                state = json.load(f)
+            if state.get('format') == FORMAT_VERSION:
+                return state
+            # Parts of an older layout are not read any more
+            self._remove_parts(state.get('parts', []))
+        except (OSError, ValueError):
+            pass
+        return {'format': FORMAT_VERSION, 'watermark': None, 'parts': [], 'full_sync': None}
+
+    def _write_state(self):
+        tmp = self._state_path() + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(self.state, f)
+        os.replace(tmp, self._state_path())
+
+    @property
+    def watermark(self):
+        return datetime.fromisoformat(self.state['watermark']) if self.state['watermark'] else None
+
+    # --- sync --------------------------------------------------------------------------------------------
+
+    def sync(self, force=False, full=False):
+        """Fetch the documents added or changed since the last sync; returns how many came in.
+
+        The first sync, and one every full_sync_interval, downloads the whole collection and replaces the local
+        copy. The others query timestamp >= watermark - LATE_WINDOW and keep the documents that are new or whose
+        fields changed. Firestore is read outside the lock, so page reruns are answered from the local copy
+        meanwhile. Reads that hit the quota are retried from the last document received.
+        """
+        with self._lock:
+            if not force and time.monotonic() - self._last_sync < self.sync_interval:
+                return 0
+            # Claimed before downloading so concurrent reruns do not start the same download
+            self._last_sync = time.monotonic()
+            last_full = self.state.get('full_sync')
+            full = full or last_full is None or time.time() - last_full >= self.full_sync_interval
+            watermark = self.watermark
+            if not full and watermark is None:
+                # No timestamped documents to continue from; the next full sync picks up new ones
+                return 0
+        query = self.db.collection(self.collection)
+        if not full:
+            since = watermark - timedelta(seconds=LATE_WINDOW)
+            query = query.where(TIMESTAMP_FIELD, '>=', since).order_by(TIMESTAMP_FIELD)
+        started = time.time()
+        # Page by page, so only one page of raw documents is held at a time (see paged_reader.py)
+        tables = [documents_to_table((doc.id, doc.to_dict()) for doc in page) for page in iter_pages(query)]
+        table = pa.concat_tables(tables) if tables else _schema().empty_table()
+        with self._lock:
+            if full:
+                self._replace(table, started)
+                return table.num_rows
+            table = self._changed(table, since)
+            if table.num_rows:
+                self._append(table)
+            return table.num_rows
+
+    def resync(self):
+        """Download the collection again, replacing the local copy."""
+        return self.sync(force=True, full=True)
+
+    def _changed(self, table, since):
+        # The rows of table that are not in the local copy with the same fields; only the local documents
+        # timestamped since `since` can match, since the query only returned those
+        local = self._load()
+        recent = pc.greater_equal(local['_timestamp'], pa.scalar(since, local['_timestamp'].type))
+        local = local.filter(pc.fill_null(recent, False))
+        stored = set(zip(local['_id'].to_pylist(), local['_meta'].to_pylist()))
+        keep = [row not in stored for row in zip(table['_id'].to_pylist(), table['_meta'].to_pylist())]
+        return table.filter(pa.array(keep, pa.bool_()))
+
+    def _write_part(self, table, suffix):
+        name = f'part-{int(time.time() * 1000)}-{suffix}.parquet'
+        tmp = os.path.join(self.path, name + '.tmp')
+        pq.write_table(table, tmp)
+        os.replace(tmp, os.path.join(self.path, name))
+        return name
+
+    def _append(self, table):
+        self.state['parts'].append(self._write_part(table, f'{len(self.state["parts"]):05d}'))
+        newest = pc.max(table['_timestamp']).as_py()
+        if newest is not None and (self.watermark is None or newest > self.watermark):
+            self.state['watermark'] = newest.isoformat()
+        self._write_state()
+        self._table = None
+        if len(self.state['parts']) > MAX_PARTS:
+            self._compact()
+
+    def _replace(self, table, started):
+        # A full download: its part becomes the only one and the watermark is its newest timestamp
+        newest = pc.max(table['_timestamp']).as_py() if table.num_rows else None
+        old, self.state['parts'] = self.state['parts'], [self._write_part(table, 'full')]
+        self.state['watermark'] = newest.isoformat() if newest is not None else None
+        self.state['full_sync'] = started
+        self._write_state()
+        self._table = None
+        self._remove_parts(old)
+
+    def _remove_parts(self, parts):
+        for part in parts:
+            try:
+                os.remove(os.path.join(self.path, part))
+            except OSError:
+                pass
+
+    def _compact(self):
+        old, self.state['parts'] = self.state['parts'], [self._write_part(self._load(), 'compact')]
+        self._write_state()
+        self._remove_parts(old)
+
+    # --- local queries -----------------------------------------------------------------------------------
+
+    def _load(self):
+        # All parts, keeping the last copy of each document, in document id order like query.stream()
+        if self._table is None:
+            parts = [pq.read_table(os.path.join(self.path, part), schema=_schema()) for part in self.state['parts']]
+            table = pa.concat_tables(parts) if parts else _schema().empty_table()
+            if len(parts) > 1:
+                ids = table['_id'].to_numpy(zero_copy_only=False)
+                _, last = np.unique(ids[::-1], return_index=True)
+                table = table.take(np.sort(len(ids) - 1 - last))
+            self._table = table.sort_by('_id').combine_chunks()
+        return self._table
+
+    def table(self, **filters):
+        """Arrow table of the documents whose fields equal the given values, e.g. table(RowNo=3, InfStat='Healthy').
+
+        The device is filtered on with table(**{'DeviceName:': name}), the field's stored name."""
+        with self._lock:
+            table = self._load()
+        unknown = set(filters) - set(FILTER_FIELDS)
+        if unknown:
+            raise ValueError(f"Can only filter on {FILTER_FIELDS}, not {sorted(unknown)}")
+        mask = None
+        for name, value in filters.items():
+            condition = pc.equal(table[name], _encode_key(value))
+            mask = condition if mask is None else pc.and_(mask, condition)
+        return table if mask is None else table.filter(pc.fill_null(mask, False))
+
+    def query(self, sync=True, **filters):
+        """Documents matching filters as dicts like doc.to_dict(), the sensor arrays as numpy arrays.
+
+        With sync=True Firestore is asked for new documents first (at most once per sync_interval).
+        """
+        if sync:
+            self.sync()
+        return table_to_documents(self.table(**filters))
+
+
+def table_to_documents(table):
+    arrays = {}
+    for name in ARRAY_FIELDS:
+        column = table[name].combine_chunks() if table.num_rows else None
+        if column is not None and column.null_count < len(column):
+            # One flat buffer plus offsets; every document gets a view into it
+            values = column.values.to_numpy(zero_copy_only=False)
+            offsets = column.offsets.to_numpy()
+            valid = column.is_valid().to_numpy(zero_copy_only=False)
+            arrays[name] = [values[offsets[i]:offsets[i + 1]] if valid[i] else None for i in range(len(column))]
+    documents = table_metadata(table)
+    for i, doc in enumerate(documents):
+        for name, values in arrays.items():
+            if values[i] is not None:
+                doc[name] = values[i]
+    return documents
+
+
+def table_metadata(table):
+    """The non-array fields of every document of table, as dicts like doc.to_dict()."""
+    return [json.loads(meta, object_hook=_decode_meta) for meta in table['_meta'].to_pylist()]
+
+
+def get_scan_cache(db, collection, root=CACHE_DIR):
+    # One cache per Firestore database, collection and server process, shared by all sessions
+    with _caches_lock:
+        key = (client_scope(db), collection, root)
+        if key not in _caches:
+            _caches[key] = ScanCache(db, collection, root)
+        return _caches[key]
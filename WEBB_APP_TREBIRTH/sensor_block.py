@@ -0,0 +1,131 @@
+# Ragged sensor blocks: the RadarRaw / ADXLRaw / Ax / Ay / Az arrays of a batch of scans, one contiguous float
+# buffer per sensor plus the start / stop of every scan in it.
+#
+# The export pages built a one-column DataFrame per scan and sensor (dropna, fillna, rename) and concatenated
+# them, five times over and then once more into df_combined. decode_scans() fills each sensor's buffer straight
+# from the documents, and from_arrow() wraps the scan cache's list<double> columns without copying anything.
+# Trimming (the slice_data() 100:-100 rule) only moves the start / stop of each scan. A DataFrame is only made
+# by combined_frame() / RaggedBlock.frame(), when a sheet needs one, and it is laid out like the old
+# pd.concat result.
+#
+#   blocks = decode_scans(docs)                         # {'RadarRaw': RaggedBlock, 'ADXLRaw': ..., ...}
+#   blocks = {name: block.trim() for name, block in blocks.items()}
+#   df_combined = combined_frame(blocks)                # columns 'Radar 1', ..., 'ADXL 1', ..., 'Az n'
+
+import numpy as np
+import pandas as pd
+
+ARRAY_FIELDS = ('RadarRaw', 'ADXLRaw', 'Ax', 'Ay', 'Az')
+# Column prefix of every sensor in the exported sheets
+PREFIXES = {'RadarRaw': 'Radar ', 'ADXLRaw': 'ADXL ', 'Ax': 'Ax ', 'Ay': 'Ay ', 'Az': 'Az '}
+
+
+def _fill(out, values):
+    try:
+        out[...] = values
+    except (TypeError, ValueError):
+        # Mixed / non numeric entries: keep what converts, like pd.to_numeric(errors='coerce')
+        out[...] = [v if isinstance(v, (int, float)) else np.nan for v in values]
+
+
+class RaggedBlock:
+    """Scan i is values[starts[i]:stops[i]]; scans may share or skip parts of values (see trim())."""
+
+    def __init__(self, values, starts, stops):
+        self.values = values
+        self.starts = np.asarray(starts, dtype=np.int64)
+        self.stops = np.asarray(stops, dtype=np.int64)
+
+    @classmethod
+    def from_arrays(cls, arrays, dtype=np.float32):
+        """One block from a list of per scan sequences (lists, numpy arrays, None for a missing array)."""
+        lengths = np.array([0 if a is None else len(a) for a in arrays], dtype=np.int64)
+        stops = np.cumsum(lengths)
+        values = np.empty(int(stops[-1]) if len(stops) else 0, dtype=dtype)
+        for a, start, stop in zip(arrays, stops - lengths, stops):
+            if stop > start:
+                _fill(values[start:stop], a)
+        return cls(values, stops - lengths, stops)
+
+    @classmethod
+    def from_arrow(cls, column, dtype=None):
+        """Block over a pyarrow list<double> column (e.g. ScanCache.table()['RadarRaw']), without copying it
+        unless dtype asks for a conversion. Null entries become empty scans."""
+        if hasattr(column, 'chunks'):
+            column = column.chunk(0) if column.num_chunks == 1 else column.combine_chunks()
+        offsets = column.offsets.to_numpy()
+        values = column.values.to_numpy(zero_copy_only=False)
+        if dtype is not None and values.dtype != dtype:
+            values = values.astype(dtype)
+        starts, stops = offsets[:-1].astype(np.int64), offsets[1:].astype(np.int64)
+        if column.null_count:
+            valid = column.is_valid().to_numpy(zero_copy_only=False)
+            stops = np.where(valid, stops, starts)
+        return cls(values, starts, stops)
+
+    def __len__(self):
+        return len(self.starts)
+
+    @property
+    def lengths(self):
+        return self.stops - self.starts
+
+    def scan(self, i):
+        return self.values[self.starts[i]:self.stops[i]]
+
+    def trim(self, head=100, tail=100, min_length=1000):
+        """The slice_data() rule: scans longer than min_length lose head samples at the start and tail at the
+        end. The returned block shares values with this one."""
+        long = self.lengths > min_length
+        return RaggedBlock(self.values, np.where(long, self.starts + head, self.starts),
+                           np.where(long, self.stops - tail, self.stops))
+
+    def dense(self, length=None, fill=np.nan):
+        """(sample, scan) array, scans shorter than length (default: the longest scan) padded with fill."""
+        length = int(self.lengths.max(initial=0)) if length is None else length
+        out = np.full((length, len(self)), fill, dtype=self.values.dtype)
+        for i in range(len(self)):
+            n = min(length, self.stops[i] - self.starts[i])
+            out[:n, i] = self.values[self.starts[i]:self.starts[i] + n]
+        return out
+
+    def frame(self, prefix):
+        return combined_frame({None: self}, {None: prefix})
+
+
+def decode_scans(docs, fields=ARRAY_FIELDS, dtype=np.float32):
+    """{field: RaggedBlock} for a list of document dicts (doc.to_dict(), ScanCache.query() results)."""
+    return {name: RaggedBlock.from_arrays([doc.get(name) for doc in docs], dtype) for name in fields}
+
+
+def decode_table(table, fields=ARRAY_FIELDS, dtype=None):
+    """{field: RaggedBlock} over the array columns of a ScanCache.table(), sharing its buffers."""
+    return {name: RaggedBlock.from_arrow(table[name], dtype) for name in fields}
+
+
+def combined_frame(blocks, prefixes=PREFIXES, dtype=None):
+    """One DataFrame of all blocks side by side, columns f'{prefix}{i + 1}' per block in the given order.
+
+    Laid out like the pd.concat of the per scan frames it replaces: row r is sample r of every scan (NaN where
+    a scan is shorter or the sample is NaN), rows where every scan is NaN are left out and the remaining rows
+    keep their sample number as index. Rows are always in sample order (pd.concat could move a row that was NaN
+    in the first scan behind later ones).
+    """
+    blocks = {name: block for name, block in blocks.items() if len(block)}
+    if not blocks:
+        return pd.DataFrame()
+    length = max(int(block.lengths.max(initial=0)) for block in blocks.values())
+    dtype = dtype or np.result_type(*[block.values.dtype for block in blocks.values()])
+    out = np.full((length, sum(len(block) for block in blocks.values())), np.nan, dtype=dtype)
+    columns = []
+    col = 0
+    for name, block in blocks.items():
+        for i in range(len(block)):
+            n = block.stops[i] - block.starts[i]
+            out[:n, col + i] = block.values[block.starts[i]:block.stops[i]]
+        columns += [f'{prefixes[name]}{i + 1}' for i in range(len(block))]
+        col += len(block)
+    keep = ~np.isnan(out).all(axis=1)
+    if keep.all():
+        return pd.DataFrame(out, columns=columns, copy=False)
+    return pd.DataFrame(out[keep], index=np.flatnonzero(keep), columns=columns, copy=False)
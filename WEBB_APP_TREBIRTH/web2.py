@@ -6,14 +6,12 @@ from io import BytesIO
 import matplotlib.pyplot as plt
 from datetime import datetime
 import numpy as np
-import time
 import zipfile
 import os
-import random
 from scipy import signal
 from scipy.stats import skew, kurtosis
 from preprocess import detrend, fq, stats_radar, columns_reports_unique
-from google.api_core.exceptions import ResourceExhausted, RetryError
+from plot_batch import domain_plots, show_plots
 from Filters import (coefLPF1Hz, coefLPF2Hz, coefLPF3Hz, coefLPF4Hz, coefLPF5Hz, coefLPF6Hz, coefLPF7Hz, coefLPF8Hz, 
                      coefLPF9Hz, coefLPF10Hz, coefLPF11Hz, coefLPF12Hz, coefLPF13Hz, coefLPF14Hz, coefLPF15Hz, 
                      coefLPF16Hz, coefLPF17Hz, coefLPF18Hz, coefLPF19Hz, coefLPF20Hz, coefLPF21Hz, coefLPF22Hz, 
@@ -59,31 +57,6 @@ st.markdown(
     unsafe_allow_html=True,
 )
 
-def exponential_backoff(retries):
-    base_delay = 1
-    max_delay = 60
-    delay = base_delay * (2 ** retries) + random.uniform(0, 1)
-    return min(delay, max_delay)
-
-def get_firestore_data(query):
-    retries = 0
-    max_retries = 10
-    while retries < max_retries:
-        try:
-            results = query.stream()
-            return list(results)
-        except ResourceExhausted as e:
-            st.warning(f"Quota exceeded, retrying... (attempt {retries + 1})")
-            time.sleep(exponential_backoff(retries))
-            retries += 1
-        except RetryError as e:
-            st.warning(f"Retry error: {e}, retrying... (attempt {retries + 1})")
-            time.sleep(exponential_backoff(retries))
-            retries += 1
-        except Exception as e:
-            st.error(f"An error occurred: {e}")
-            break
-    raise Exception("Max retries exceeded")
 
 # Authenticate to Firestore with the JSON account key.
 db = firestore.Client.from_service_account_json("WEBB_APP_TREBIRTH/testdata1-20ec5-firebase-adminsdk-an9r6-a87cacba1d.json")
@@ -302,75 +275,20 @@ if st.button("Download Selected Sheets"):
     st.download_button("Download Filtered Data", filtered_excel_data, file_name=f"Filtered_{filter_type.replace(' ', '')}{frequency if filter_type != 'Band Pass Filter (BPF)' else f'{low_freq}to{high_freq}'}Hz.xlsx", mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", key='download-filtered-excel')
 
 
-# Define functions for plotting time and frequency domain graphs
-def plot_time_domain(data, column, sampling_rate=100):
-    fig, ax = plt.subplots()
-    time_seconds = np.arange(len(data)) / sampling_rate  # Assuming 100 signals per second
-    ax.plot(time_seconds, data)
-    title = f'{row_number}_{tree_number}_{column}_{filter_type}_{frequency}Hz - Time Domain Plot'
-    ax.set_xlabel('Time (s)')
-    ax.set_ylabel('Signal')
-    ax.set_title(title)
-    return fig
-
-def plot_frequency_domain(data, column):
-    frequencies, powers = fq(pd.DataFrame(data))
-    powers_db = 10 * np.log10(powers[0])  # Convert power to dB scale
-    fig, ax = plt.subplots()
-    ax.plot(frequencies[0], powers_db)
-    title = f'{row_number}_{tree_number}_{column}_{filter_type}_{frequency}Hz - Frequency Domain Plot'
-    ax.set_xlabel('Frequency (Hz)')
-    ax.set_ylabel('Power Spectrum (dB)')
-    ax.set_title(title)
-    return fig
+# Titles of the time and frequency domain graphs
+def plot_title(column, domain):
+    return f'{row_number}_{tree_number}_{column}_{filter_type}_{frequency}Hz - {domain} Plot'
 
 selected_domain = st.selectbox('Select Domain to Plot', ['Time Domain', 'Frequency Domain'])
 
-# Create a temporary directory to store the plots
-temp_dir = "temp_plots"
-os.makedirs(temp_dir, exist_ok=True)
-
-# Function to save plot and return the file path
-def save_plot(fig, column, row_number, tree_number, scan_number):
-    plot_filename = f"{column.replace(' ', '_')}_{row_number}_{tree_number}_{scan_number}.png"
-    plot_path = os.path.join(temp_dir, plot_filename)
-    fig.savefig(plot_path, format='png')
-    plt.close(fig)  # Close the figure to release memory
-    return plot_path
-
-# List to store paths of the saved plots
-plot_paths = []
-
-# Loop through each Radar column and plot the selected domain
-for column, data in filtered_radar_columns.items():
-    if selected_domain == 'Time Domain':
-        fig = plot_time_domain(data, column)
-    elif selected_domain == 'Frequency Domain':
-        fig = plot_frequency_domain(data, column)
-    
-    plot_path = save_plot(fig, column, row_number, tree_number, scan_number)
-    plot_paths.append(plot_path)
-    st.image(plot_path)  # Display the plot in Streamlit
-
-# Loop through each ADXL column and plot the selected domain
-for column, data in filtered_adxl_columns.items():
-    if selected_domain == 'Time Domain':
-        fig = plot_time_domain(data, column)
-    elif selected_domain == 'Frequency Domain':
-        fig = plot_frequency_domain(data, column)
-    
-    plot_path = save_plot(fig, column, row_number, tree_number, scan_number)
-    plot_paths.append(plot_path)
-    st.image(plot_path)  # Display the plot in Streamlit
-
-# Create a zip file
-zip_filename = f"plots_{row_number}_{tree_number}_{scan_number}.zip"
-zip_filepath = os.path.join(temp_dir, zip_filename)
+# Every Radar column, then every ADXL column, rendered on the worker pool (see plot_batch.py)
+plot_columns = {**filtered_radar_columns, **filtered_adxl_columns}
+plot_specs = domain_plots(plot_columns, selected_domain, lambda column: plot_title(column, selected_domain))
+plot_file_names = [f"{column.replace(' ', '_')}_{row_number}_{tree_number}_{scan_number}.png" for column in plot_columns]
 
-# Add plots to the zip file
-with zipfile.ZipFile(zip_filepath, 'w') as zipf:
-    for plot_path in plot_paths:
-        zipf.write(plot_path, os.path.basename(plot_path))
+# Display the plots and zip the same PNG bytes in memory
+zip_data = show_plots(plot_specs, plot_file_names)
+zip_filename = f"plots_{row_number}_{tree_number}_{scan_number}.zip"
 
 # Provide a download button for the zip file
-st.download_button("Download All Plots", data=open(zip_filepath, 'rb').read(), file_name=zip_filename, mime="application/zip")
+st.download_button("Download All Plots", data=zip_data, file_name=zip_filename, mime="application/zip")
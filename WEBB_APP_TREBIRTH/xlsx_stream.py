@@ -0,0 +1,128 @@
+# Streaming xlsx writing for the large exports.
+#
+# pd.ExcelWriter + to_excel keeps a cell object for every value of every sheet until the workbook is closed; the
+# 49 band 'Filtered_1-50Hz_and_Stats' workbook of 30 scans x 5 sensors did not fit in the server's memory.
+# write_workbooks() uses xlsxwriter's constant_memory mode instead: every row goes to a temporary file as soon as
+# it is written, taken from the sheet's NumPy values a block of rows at a time, and the workbook is assembled on
+# disk. Sheets wider or longer than Excel allows are split into numbered sheets, and once a workbook holds
+# WORKBOOK_CELLS cells the next sheets go into a new one; several workbooks are returned as one zip.
+#
+#   path = write_workbooks([('Raw Data', df_combined), ('Metadata', df_metadata_filtered)], EXPORT_DIR)
+
+import datetime
+import os
+import tempfile
+import zipfile
+
+import numpy as np
+import xlsxwriter
+
+EXCEL_MAX_ROWS = 1048576
+EXCEL_MAX_COLUMNS = 16384
+EXCEL_MAX_SHEET_NAME = 31
+# Cells per workbook before the next sheets go into a new workbook; set with TREBIRTH_WORKBOOK_CELLS
+WORKBOOK_CELLS = int(os.environ.get('TREBIRTH_WORKBOOK_CELLS', 20_000_000))
+# Rows converted to Python values at a time
+ROW_BLOCK = 1000
+
+
+def sheet_pieces(sheet_name, frame, max_rows=EXCEL_MAX_ROWS - 1, max_columns=EXCEL_MAX_COLUMNS):
+    """(sheet name, frame) pieces of frame within Excel's limits (a header row takes one of the rows)."""
+    row_starts = range(0, max(len(frame), 1), max_rows)
+    column_starts = range(0, max(len(frame.columns), 1), max_columns)
+    if len(row_starts) == 1 and len(column_starts) == 1:
+        return [(sheet_name[:EXCEL_MAX_SHEET_NAME], frame)]
+    pieces = []
+    for row in row_starts:
+        for column in column_starts:
+            suffix = f' ({len(pieces) + 1})'
+            pieces.append((sheet_name[:EXCEL_MAX_SHEET_NAME - len(suffix)] + suffix,
+                           frame.iloc[row:row + max_rows, column:column + max_columns]))
+    return pieces
+
+
+def _cell(value):
+    # What xlsxwriter's write() takes as is; NaN / NaT / None become blank cells, other types their text
+    if isinstance(value, (str, int, float, datetime.date, datetime.time, datetime.timedelta)):
+        return None if value != value else value
+    if value is None or isinstance(value, np.generic) and np.isnan(value):
+        return None
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+def write_sheet(workbook, sheet_name, frame, header_format=None):
+    worksheet = workbook.add_worksheet(sheet_name)
+    worksheet.write_row(0, 0, [str(column) for column in frame.columns], header_format)
+    values = frame.to_numpy()
+    numeric = values.dtype.kind in 'fiub'
+    for start in range(0, len(values), ROW_BLOCK):
+        block = values[start:start + ROW_BLOCK]
+        # Rows with a NaN are the only ones that need looking at value by value
+        gaps = np.isnan(block).any(axis=1) if values.dtype.kind == 'f' else np.zeros(len(block), dtype=bool)
+        for offset, row in enumerate(block.tolist()):
+            if not numeric:
+                row = [_cell(value) for value in row]
+            elif gaps[offset]:
+                row = [None if value != value else value for value in row]
+            worksheet.write_row(start + offset + 1, 0, row)
+
+
+def _new_workbook(directory):
+    handle, path = tempfile.mkstemp(suffix='.xlsx', dir=directory)
+    os.close(handle)
+    workbook = xlsxwriter.Workbook(path, {
+        'constant_memory': True, 'tmpdir': directory, 'strings_to_urls': False, 'nan_inf_to_errors': True,
+        'remove_timezone': True, 'default_date_format': 'yyyy-mm-dd hh:mm:ss'})
+    # The header style of to_excel()
+    header_format = workbook.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'})
+    return path, workbook, header_format
+
+
+def write_workbooks(sheets, directory, workbook_cells=WORKBOOK_CELLS):
+    """Write the (sheet name, frame) pairs in order; the path of the .xlsx, or of a .zip of 'Part <n>.xlsx'
+    workbooks when they do not fit in one."""
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    workbook = None
+    cells = 0
+    try:
+        for sheet_name, frame in sheets:
+            for piece_name, piece in sheet_pieces(sheet_name, frame):
+                if workbook is None or (cells and cells + piece.size > workbook_cells):
+                    if workbook is not None:
+                        workbook.close()
+                    path, workbook, header_format = _new_workbook(directory)
+                    paths.append(path)
+                    cells = 0
+                write_sheet(workbook, piece_name, piece, header_format)
+                cells += piece.size
+        if workbook is None:
+            path, workbook, header_format = _new_workbook(directory)
+            paths.append(path)
+            # An xlsx file needs one sheet
+            workbook.add_worksheet()
+        workbook.close()
+        workbook = None
+        if len(paths) == 1:
+            return paths[0]
+        handle, zip_path = tempfile.mkstemp(suffix='.zip', dir=directory)
+        os.close(handle)
+        # The workbooks are compressed already
+        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_STORED) as archive:
+            for number, path in enumerate(paths, 1):
+                archive.write(path, f'Part {number}.xlsx')
+        for path in paths:
+            os.remove(path)
+        return zip_path
+    except Exception:
+        if workbook is not None:
+            try:
+                workbook.close()
+            except Exception:
+                pass
+        for path in paths:
+            if os.path.exists(path):
+                os.remove(path)
+        raise
@@ -7,21 +7,13 @@ import matplotlib.pyplot as plt
 from google.cloud import firestore
 from io import BytesIO
 from datetime import datetime
+from filter_design import firwin_design
 
 # Function to apply filter
 def apply_filter(data, filter_type, cutoff_freq):
-    nyquist_freq = 0.5 * sampling_rate  #ensures that the cutoff frequency is specified in a consistent and standardized manner.
-    
-    if filter_type == 'LPF' or filter_type == 'HPF':
-        # For LPF and HPF, cutoff_freq should be a single float
-        normalized_cutoff_freq = cutoff_freq / nyquist_freq
-        pass_zero = (filter_type == 'LPF') if filter_type in ['LPF', 'HPF'] else False
-        b = signal.firwin(order, cutoff_freq, window='hamming', fs=sampling_rate, pass_zero=pass_zero)
-    elif filter_type == 'BPF':
-        # For BPF, cutoff_freq should be a tuple containing two floats
-        normalized_cutoff_freq = (cutoff_freq[0] / nyquist_freq, cutoff_freq[1] / nyquist_freq)
-        b = signal.firwin(order, cutoff_freq, window='hamming', fs=sampling_rate, pass_zero=False)
-    
+    # For LPF and HPF cutoff_freq is a single float, for BPF a tuple of two floats.
+    # The design is cached per (type, cutoff, order, fs), see filter_design.py
+    b = firwin_design(filter_type, cutoff_freq, order, sampling_rate)
     filtered_data = signal.lfilter(b, 1, data) #The function signal.lfilter() applies a linear filter to a signal, b = coefficients, 1 = denominator of coefficients
     return filtered_data
 
@@ -8,23 +8,14 @@ import matplotlib.pyplot as plt
 from google.cloud import firestore
 from io import BytesIO
 from datetime import datetime
+from filter_design import firwin_design
 
 
 # Function to apply filter
 # Function to apply filter
 def apply_filter(data, filter_type, cutoff_freq, sampling_rate=100, stopband_attenuation=60, steepness=0.9999):
-    nyquist_freq = 0.5 * sampling_rate
-    
-    if filter_type == 'LPF' or filter_type == 'HPF':
-        normalized_cutoff_freq = cutoff_freq / nyquist_freq
-        pass_zero = (filter_type == 'LPF')
-        # Corrected the call to firwin function
-        b = signal.firwin(order, cutoff_freq, window='hamming', fs=sampling_rate, pass_zero=pass_zero)
-    elif filter_type == 'BPF':
-        normalized_cutoff_freq = (cutoff_freq[0] / nyquist_freq, cutoff_freq[1] / nyquist_freq)
-        # Corrected the call to firwin function
-        b = signal.firwin(order, cutoff_freq, window='hamming', fs=sampling_rate, pass_zero=False)
-    
+    # Cached per (type, cutoff, order, fs), see filter_design.py
+    b = firwin_design(filter_type, cutoff_freq, order, sampling_rate)
     filtered_data = signal.lfilter(b, 1, data)
     return filtered_data
 
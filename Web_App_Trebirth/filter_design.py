@@ -0,0 +1,71 @@
+# Cached FIR designs for the apply_filter() functions of the filter explorer pages.
+#
+# A design only depends on (type, cutoff, fs, attenuation, steepness) or (type, cutoff, order, fs), but the pages
+# redesign it for every column and again for the time domain plot, the frequency domain plot and the export.
+# The designs are kept in bounded LRU caches at module level, so they are shared by every Streamlit session of
+# the server process. The returned coefficients are read-only because they are shared.
+
+from functools import lru_cache
+
+import numpy as np
+from scipy import signal
+from scipy.signal import get_window
+
+DESIGN_CACHE_SIZE = 256
+
+
+def _cutoff_key(cutoff_freq):
+    # Slider values come as int, float or (low, high) tuple / list; use a hashable, canonical form
+    if np.ndim(cutoff_freq):
+        return tuple(float(f) for f in cutoff_freq)
+    return float(cutoff_freq)
+
+
+def _read_only(b):
+    b.flags.writeable = False
+    return b
+
+
+@lru_cache(maxsize=DESIGN_CACHE_SIZE)
+def _remez(filter_type, cutoff_freq, sampling_rate, stopband_attenuation, steepness):
+    if filter_type == 'LPF' or filter_type == 'HPF':
+        numtaps = 2 * int(sampling_rate / cutoff_freq) + 1
+        b = signal.remez(numtaps, [0, cutoff_freq - steepness / 2, cutoff_freq + steepness / 2, sampling_rate / 2], [1, 0], fs=sampling_rate, weight=[1, stopband_attenuation])
+    elif filter_type == 'BPF':
+        numtaps = 2 * int(sampling_rate / min(cutoff_freq)) + 1
+        b = signal.remez(numtaps, [0, cutoff_freq[0] - steepness / 2, cutoff_freq[0] + steepness / 2, cutoff_freq[1] - steepness / 2, cutoff_freq[1] + steepness / 2, sampling_rate / 2], [0, 1, 0], fs=sampling_rate, weight=[stopband_attenuation, 1, stopband_attenuation])
+    else:
+        raise ValueError(f"Unknown filter type {filter_type!r}")
+    return _read_only(b * get_window('hamming', numtaps))
+
+
+def remez_design(filter_type, cutoff_freq, sampling_rate=100, stopband_attenuation=60, steepness=0.9999):
+    """Hamming windowed remez design used by AnushaPulip.py's apply_filter()."""
+    return _remez(filter_type, _cutoff_key(cutoff_freq), float(sampling_rate), float(stopband_attenuation), float(steepness))
+
+
+@lru_cache(maxsize=DESIGN_CACHE_SIZE)
+def _firwin(filter_type, cutoff_freq, order, sampling_rate):
+    if filter_type == 'LPF' or filter_type == 'HPF':
+        b = signal.firwin(order, cutoff_freq, window='hamming', fs=sampling_rate, pass_zero=(filter_type == 'LPF'))
+    elif filter_type == 'BPF':
+        b = signal.firwin(order, list(cutoff_freq), window='hamming', fs=sampling_rate, pass_zero=False)
+    else:
+        raise ValueError(f"Unknown filter type {filter_type!r}")
+    return _read_only(b)
+
+
+def firwin_design(filter_type, cutoff_freq, order, sampling_rate=100):
+    """Hamming windowed firwin design used by the firwin based apply_filter() variants."""
+    return _firwin(filter_type, _cutoff_key(cutoff_freq), int(order), float(sampling_rate))
+
+
+def design_cache_info():
+    # {'remez': {'hits': .., 'misses': .., 'size': .., 'maxsize': ..}, 'firwin': {...}}
+    return {name: {'hits': info.hits, 'misses': info.misses, 'size': info.currsize, 'maxsize': info.maxsize}
+            for name, info in (('remez', _remez.cache_info()), ('firwin', _firwin.cache_info()))}
+
+
+def clear_design_cache():
+    _remez.cache_clear()
+    _firwin.cache_clear()
@@ -7,19 +7,12 @@ import matplotlib.pyplot as plt
 from google.cloud import firestore
 from io import BytesIO
 from datetime import datetime
+from filter_design import firwin_design
 
 # Function to apply filter
 def apply_filter(data, filter_type, cutoff_freq):
-    nyquist_freq = 0.5 * sampling_rate
-    normalized_cutoff_freq = cutoff_freq / nyquist_freq
-    
-    if filter_type == 'LPF':
-        b = signal.firwin(order, cutoff_freq, window='hamming', fs=sampling_rate, pass_zero=True)
-    elif filter_type == 'HPF':
-        b = signal.firwin(order, cutoff_freq, window='hamming', fs=sampling_rate, pass_zero=False)
-    elif filter_type == 'BPF':
-        b = signal.firwin(order, [cutoff_freq[0], cutoff_freq[1]], window='hamming', fs=sampling_rate, pass_zero=False)
-    
+    # Cached per (type, cutoff, order, fs), see filter_design.py
+    b = firwin_design(filter_type, cutoff_freq, order, sampling_rate)
     filtered_data = signal.lfilter(b, 1, data)
     return filtered_data
 
@@ -0,0 +1,115 @@
+# band_kernels.py against the two stage HPF{n}Hz -> LPF{n+1}Hz cascade it folds into one kernel.
+#
+# fir_h() is the filt() loop of the device's FIR.h: a ring buffer starting from zeros, coef[i] meeting
+# values[(i + k) % ntaps]. Chaining two of them per band is what get_band_kernels() must reproduce.
+
+import importlib.util
+import os
+import sys
+
+import numpy as np
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_DIR = 'WEBB_APP_TREBIRTH'
+N_SAMPLES = 900
+
+
+def _load(app_dir, name):
+    # The module's own imports (fir_engine, coef_store, ...) come from the same app directory
+    directory = os.path.join(ROOT, app_dir)
+    for module_name, module in list(sys.modules.items()):
+        path = getattr(module, '__file__', None) or ''
+        if path.startswith(ROOT + os.sep) and os.path.dirname(path) != os.path.dirname(os.path.abspath(__file__)):
+            del sys.modules[module_name]
+    sys.path.insert(0, directory)
+    try:
+        spec = importlib.util.spec_from_file_location(f'{app_dir}_{name}', os.path.join(directory, f'{name}.py'))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        sys.path.remove(directory)
+    return module
+
+
+def fir_h(coef, in_signal, gain=1.0):
+    ntaps = len(coef)
+    values = np.zeros(ntaps)
+    k = 0
+    out_signal = []
+    for in_value in in_signal:
+        values[k] = in_value
+        out = np.dot(coef, values[(np.arange(ntaps) + k) % ntaps])
+        out /= gain
+        k = (k + 1) % ntaps
+        out_signal.append(out)
+    return np.array(out_signal)
+
+
+@pytest.fixture(scope='module')
+def band_kernels():
+    return _load(APP_DIR, 'band_kernels')
+
+
+@pytest.fixture(scope='module')
+def store(band_kernels):
+    return band_kernels.open_store()
+
+
+@pytest.fixture(scope='module')
+def scans():
+    return np.random.default_rng(0).normal(size=(N_SAMPLES, 2)).cumsum(axis=0)
+
+
+def cascade(store, low_freq, x):
+    return fir_h(store.get('LPF', low_freq + 1), fir_h(store.get('HPF', low_freq), x))
+
+
+def test_band_names(band_kernels):
+    names = band_kernels.band_names()
+    assert len(names) == 49
+    assert names[0] == '1Hz-2Hz' and names[-1] == '49Hz-50Hz'
+
+
+# First band, a middle one and the last one, whose LPF50Hz stage is the longest (507 taps)
+@pytest.mark.parametrize('low_freq', [1, 25, 49])
+def test_kernels_match_zero_state_cascade(band_kernels, store, scans, tmp_path, low_freq):
+    kernels = band_kernels.get_band_kernels(path=str(tmp_path / 'band_kernels.npz'))
+    out = kernels.apply(scans, axis=0)
+    assert out.shape == (49, scans.shape[1], N_SAMPLES)
+    for j in range(scans.shape[1]):
+        np.testing.assert_allclose(out[low_freq - 1, j], cascade(store, low_freq, scans[:, j]), rtol=1e-9, atol=1e-9)
+
+
+def test_nan_poisons_the_kernel_window(band_kernels, store, tmp_path):
+    x = np.random.default_rng(1).normal(size=N_SAMPLES)
+    x[100] = np.nan
+    kernels = band_kernels.get_band_kernels(path=str(tmp_path / 'band_kernels.npz'))
+    out = kernels.apply(x)[0, 0]
+    expected = cascade(store, 1, x)
+    # NaN while the sample is in either ring buffer, the same values before and after
+    np.testing.assert_array_equal(np.isnan(out), np.isnan(expected))
+    assert np.isnan(out).sum() == len(kernels.kernel('1Hz-2Hz')[1])
+    np.testing.assert_allclose(out, expected, rtol=1e-9, atol=1e-9)
+
+
+def test_truncated_kernels_stay_within_tolerance(band_kernels, store, scans, tmp_path):
+    tol = 1e-4
+    kernels = band_kernels.get_band_kernels(tol=tol, path=str(tmp_path / 'band_kernels.npz'))
+    exact = band_kernels.get_band_kernels(path=str(tmp_path / 'exact.npz'))
+    assert kernels.lengths.sum() < exact.lengths.sum()
+    out, expected = kernels.apply(scans), exact.apply(scans)
+    bound = tol * np.abs(scans).max() * np.abs(exact.matrix).sum(axis=1)
+    assert (np.abs(out - expected).max(axis=(1, 2)) <= bound + 1e-9).all()
+
+
+def test_kernels_are_persisted(band_kernels, tmp_path):
+    path = str(tmp_path / 'band_kernels.npz')
+    built = band_kernels.get_band_kernels(path=path)
+    assert os.path.exists(path)
+    # A fresh module (a new server process) reads the file instead of building the kernels again
+    fresh = _load(APP_DIR, 'band_kernels')
+    fresh.BandKernels.build = None
+    loaded = fresh.get_band_kernels(path=path)
+    np.testing.assert_array_equal(loaded.matrix, built.matrix)
+    assert loaded.names == built.names and loaded.fingerprint == built.fingerprint
@@ -0,0 +1,147 @@
+# export_jobs.py: one job per export key, finished files kept until swept, jobs of a dead server failed.
+#
+# Every test gets its own jobs database and directory (TREBIRTH_EXPORT_DIR / TREBIRTH_JOBS_DB are read when
+# the module is loaded). Both copies of export_jobs.py are checked.
+
+import importlib.util
+import os
+import sqlite3
+import sys
+import threading
+import time
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_DIRS = ['WEBB_APP_TREBIRTH', 'TREBIRTH']
+
+
+def _load(app_dir, name):
+    # The module's own imports (fir_engine, coef_store, ...) come from the same app directory
+    directory = os.path.join(ROOT, app_dir)
+    for module_name, module in list(sys.modules.items()):
+        path = getattr(module, '__file__', None) or ''
+        if path.startswith(ROOT + os.sep) and os.path.dirname(path) != os.path.dirname(os.path.abspath(__file__)):
+            del sys.modules[module_name]
+    sys.path.insert(0, directory)
+    try:
+        spec = importlib.util.spec_from_file_location(f'{app_dir}_{name}', os.path.join(directory, f'{name}.py'))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        sys.path.remove(directory)
+    return module
+
+
+@pytest.fixture(params=APP_DIRS)
+def export_jobs(request, tmp_path, monkeypatch):
+    monkeypatch.setenv('TREBIRTH_EXPORT_DIR', str(tmp_path))
+    monkeypatch.setenv('TREBIRTH_JOBS_DB', str(tmp_path / 'jobs.sqlite3'))
+    module = _load(request.param, 'export_jobs')
+    yield module
+    if module._executor is not None:
+        module._executor.shutdown(wait=True)
+
+
+def _wait(export_jobs, job_id, timeout=10):
+    deadline = time.monotonic() + timeout
+    while True:
+        job = export_jobs.get_job(job_id)
+        if job.state in (export_jobs.DONE, export_jobs.FAILED) or time.monotonic() > deadline:
+            return job
+        time.sleep(0.01)
+
+
+def _build(calls, release=None, data=b'PK\x03\x04 export'):
+    def build(progress):
+        calls.append(threading.current_thread().name)
+        progress('Computing Raw Data', 0.5)
+        if release is not None:
+            release.wait(10)
+        return data, 'R1_T2.zip', 'application/zip'
+    return build
+
+
+def test_submit_runs_a_key_once(export_jobs):
+    calls, release = [], threading.Event()
+    key = ('fingerprint', 'CSV (zip)', ('Raw Data',))
+    job_id = export_jobs.submit(key, _build(calls, release), label='Raw Data')
+    # Queued or running: asking again gives the same job, nothing new is started
+    assert export_jobs.submit(key, _build(calls), label='Raw Data') == job_id
+    release.set()
+    job = _wait(export_jobs, job_id)
+    assert job.state == export_jobs.DONE and job.progress == 1.0 and job.label == 'Raw Data'
+    assert job.file_name == 'R1_T2.zip' and job.mime == 'application/zip'
+    with open(job.path, 'rb') as f:
+        assert f.read() == b'PK\x03\x04 export'
+    # Done with its file on disk: still the same job
+    assert export_jobs.submit(key, _build(calls)) == job_id
+    assert len(calls) == 1
+    assert job_id == export_jobs.job_id(key) != export_jobs.job_id(key + ('Metadata',))
+
+
+def test_done_job_without_file_runs_again(export_jobs):
+    calls = []
+    key = ('fingerprint', 'Parquet', ('Raw Data',))
+    job = _wait(export_jobs, export_jobs.submit(key, _build(calls)))
+    os.remove(job.path)
+    assert _wait(export_jobs, export_jobs.submit(key, _build(calls))).state == export_jobs.DONE
+    assert len(calls) == 2
+
+
+def test_failed_job_runs_again(export_jobs):
+    def fail(progress):
+        raise MemoryError('too big')
+
+    key = ('fingerprint', 'Excel (.xlsx)', ('Filtered Data',))
+    job = _wait(export_jobs, export_jobs.submit(key, fail))
+    assert job.state == export_jobs.FAILED and job.error == 'MemoryError: too big'
+    calls = []
+    assert _wait(export_jobs, export_jobs.submit(key, _build(calls))).state == export_jobs.DONE
+    assert len(calls) == 1
+
+
+def test_export_file_is_copied(export_jobs, tmp_path):
+    # An ExportFile from the export cache is copied, so the cache may remove its own file
+    path = tmp_path / 'cached.xlsx'
+    path.write_bytes(b'PK\x03\x04 workbook')
+    exported = export_jobs.ExportFile(str(path))
+    job = _wait(export_jobs, export_jobs.submit(('key',), lambda progress: (exported, 'R1.xlsx', 'xlsx')))
+    exported.discard()
+    with open(job.path, 'rb') as f:
+        assert f.read() == b'PK\x03\x04 workbook'
+
+
+def test_sweep_removes_old_jobs_and_files(export_jobs):
+    old = _wait(export_jobs, export_jobs.submit(('old',), _build([])))
+    new = _wait(export_jobs, export_jobs.submit(('new',), _build([])))
+    with sqlite3.connect(export_jobs.JOBS_DB) as connection:
+        connection.execute('UPDATE jobs SET updated = ? WHERE id = ?', (time.time() - 2 * export_jobs.JOB_TTL, old.id))
+    export_jobs.sweep()
+    assert export_jobs.get_job(old.id) is None
+    assert not os.path.exists(os.path.dirname(old.path))
+    assert export_jobs.get_job(new.id).state == export_jobs.DONE and os.path.exists(new.path)
+    assert [job.id for job in export_jobs.recent_jobs()] == [new.id]
+
+
+def test_sweep_keeps_running_jobs(export_jobs):
+    release = threading.Event()
+    job_id = export_jobs.submit(('running',), _build([], release))
+    export_jobs.sweep(ttl=-1)
+    assert export_jobs.get_job(job_id) is not None
+    release.set()
+    assert _wait(export_jobs, job_id).state == export_jobs.DONE
+    export_jobs.sweep(ttl=-1)
+    assert export_jobs.get_job(job_id) is None
+
+
+def test_jobs_of_a_dead_server_fail(export_jobs, tmp_path):
+    # A job left queued by a server process that is gone never finishes; the next process marks it failed
+    export_jobs.get_job('none')
+    with sqlite3.connect(export_jobs.JOBS_DB) as connection:
+        connection.execute('INSERT INTO jobs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                           ('orphan', '', export_jobs.RUNNING, 'Computing', 0.5, None, None, None, None,
+                            time.time(), time.time(), 2 ** 22 + 1))
+    restarted = _load(os.path.basename(os.path.dirname(export_jobs.__file__)), 'export_jobs')
+    job = restarted.get_job('orphan')
+    assert job.state == restarted.FAILED and job.error == 'Interrupted by a server restart'
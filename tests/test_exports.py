@@ -0,0 +1,216 @@
+# The export writers of xlsx_stream.py / export_tasks.py against what the pages wrote before.
+#
+# excel_writer() is the pages' pd.ExcelWriter(engine='xlsxwriter') + to_excel(index=False) loop; the streamed
+# workbooks must read back the same. Parquet, Arrow and the CSV zip have no old writer: their files must give
+# back every sheet (and the metadata) as it went in, the CSV files byte for byte as to_csv() writes them.
+# Both copies of the modules are checked.
+
+import importlib.util
+import io
+import json
+import os
+import sys
+import zipfile
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_DIRS = ['WEBB_APP_TREBIRTH', 'TREBIRTH']
+
+
+def _load(app_dir, name):
+    # The module's own imports (fir_engine, coef_store, ...) come from the same app directory
+    directory = os.path.join(ROOT, app_dir)
+    for module_name, module in list(sys.modules.items()):
+        path = getattr(module, '__file__', None) or ''
+        if path.startswith(ROOT + os.sep) and os.path.dirname(path) != os.path.dirname(os.path.abspath(__file__)):
+            del sys.modules[module_name]
+    sys.path.insert(0, directory)
+    try:
+        spec = importlib.util.spec_from_file_location(f'{app_dir}_{name}', os.path.join(directory, f'{name}.py'))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        sys.path.remove(directory)
+    return module
+
+
+def excel_writer(sheets):
+    excel_data = io.BytesIO()
+    with pd.ExcelWriter(excel_data, engine='xlsxwriter') as writer:
+        for sheet_name, frame in sheets:
+            frame.to_excel(writer, sheet_name=sheet_name, index=False)
+    excel_data.seek(0)
+    return excel_data
+
+
+@pytest.fixture(params=APP_DIRS)
+def export_tasks(request, tmp_path, monkeypatch):
+    module = _load(request.param, 'export_tasks')
+    monkeypatch.setattr(module, 'EXPORT_DIR', str(tmp_path))
+    return module
+
+
+@pytest.fixture(params=APP_DIRS)
+def xlsx_stream(request):
+    return _load(request.param, 'xlsx_stream')
+
+
+def _raw(n=60, scans=3, seed=0):
+    rng = np.random.default_rng(seed)
+    columns = [f'Radar {i + 1}' for i in range(scans)] + [f'ADXL {i + 1}' for i in range(scans)]
+    x = rng.normal(size=(n, len(columns))).cumsum(axis=0)
+    x[n - 20:, 1] = np.nan
+    x[7, 5] = np.nan
+    return pd.DataFrame(x, columns=columns)
+
+
+def _metadata():
+    return pd.DataFrame({
+        'TreeSec': ['A', 'B', None],
+        'TreeNo': [1, 2, 3],
+        'InfStat': ['Healthy', 'Infected', 'Healthy'],
+        'TreeID': ['T-1', 7, 'T-3'],
+        'RowNo': [3.0, np.nan, 5.5],
+        'ScanNo': [True, False, True],
+        'timestamp': [datetime(2024, 5, 1, 10, 30), datetime(2024, 5, 2, 11, 0, 5), datetime(2024, 5, 3)],
+    })
+
+
+def _bands(n=50):
+    rng = np.random.default_rng(1)
+    columns = ['Radar 1', 'Radar 2', 'ADXL 1']
+    return {f'{f}Hz-{f + 1}Hz Filtered Data': pd.DataFrame(rng.normal(size=(n, 3)), columns=columns) for f in range(1, 4)}
+
+
+def _sheets():
+    # (task, {sheet: frame}) pairs as ExportTasks.export() hands them to the writers
+    return [('Raw Data', {'Raw Data': _raw()}), ('Filtered Data', _bands()), ('Metadata', {'Metadata': _metadata()})]
+
+
+def _named(sheets):
+    return [item for _, task_sheets in sheets for item in task_sheets.items()]
+
+
+def _read_workbook(path_or_buffer):
+    return pd.read_excel(path_or_buffer, sheet_name=None)
+
+
+def test_xlsx_reads_back_like_excel_writer(export_tasks):
+    sheets = _sheets()
+    data = export_tasks.FORMATS['Excel (.xlsx)'][0](sheets, _metadata())
+    assert isinstance(data, export_tasks.ExportFile) and data.head() == b'PK\x03\x04'
+    streamed = _read_workbook(data.path)
+    expected = _read_workbook(excel_writer(_named(sheets)))
+    assert list(streamed) == list(expected)
+    for name in expected:
+        pd.testing.assert_frame_equal(streamed[name], expected[name], check_exact=False, rtol=1e-15)
+    data.discard()
+    assert not os.path.exists(data.path)
+
+
+def test_workbooks_split_by_cells(xlsx_stream, tmp_path):
+    named = _named(_sheets())
+    path = xlsx_stream.write_workbooks(named, str(tmp_path), workbook_cells=300)
+    assert path.endswith('.zip')
+    read = {}
+    with zipfile.ZipFile(path) as archive:
+        parts = archive.namelist()
+        assert parts == [f'Part {number}.xlsx' for number in range(1, len(parts) + 1)]
+        for part in parts:
+            read.update(_read_workbook(io.BytesIO(archive.read(part))))
+    expected = _read_workbook(excel_writer(named))
+    assert list(read) == list(expected)
+    for name in expected:
+        pd.testing.assert_frame_equal(read[name], expected[name], check_exact=False, rtol=1e-15)
+    # Only the zip is left behind
+    assert os.listdir(tmp_path) == [os.path.basename(path)]
+
+
+def test_sheet_pieces_cover_the_frame(xlsx_stream):
+    frame = _raw(n=25, scans=3)
+    pieces = xlsx_stream.sheet_pieces('A sheet name longer than Excel allows', frame, max_rows=10, max_columns=4)
+    assert [name for name, _ in pieces][:2] == ['A sheet name longer than Ex (1)', 'A sheet name longer than Ex (2)']
+    assert all(len(name) <= xlsx_stream.EXCEL_MAX_SHEET_NAME for name, _ in pieces)
+    rows = [pd.concat([piece for _, piece in pieces[i:i + 2]], axis=1) for i in range(0, len(pieces), 2)]
+    pd.testing.assert_frame_equal(pd.concat(rows), frame)
+    assert xlsx_stream.sheet_pieces('Raw Data', frame) == [('Raw Data', frame)]
+
+
+def _tables_from_zip(data, extension, read):
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        return {name[:-len(extension) - 1]: read(archive.read(name)) for name in archive.namelist()}
+
+
+def _split(table):
+    # A stacked table back into its sheets
+    frame = table.to_pandas()
+    return {str(sheet): part.drop(columns='sheet').reset_index(drop=True)
+            for sheet, part in frame.groupby('sheet', sort=False, observed=True)}
+
+
+def _metadata_records():
+    return json.loads(_metadata().to_json(orient='records', date_format='iso'))
+
+
+@pytest.mark.parametrize('fmt, extension', [('Parquet', 'parquet'), ('Arrow / Feather', 'arrow')])
+def test_columnar_exports_give_back_the_sheets(export_tasks, fmt, extension):
+    def read(data):
+        return pq.read_table(io.BytesIO(data)) if extension == 'parquet' else pa.ipc.open_file(data).read_all()
+
+    data = export_tasks.FORMATS[fmt][0](_sheets(), _metadata())
+    tables = _tables_from_zip(data, extension, read)
+    # The band sheets share their columns: one table named after them, one sheet per row group / batch
+    assert list(tables) == ['Raw Data', 'Filtered Data']
+    pd.testing.assert_frame_equal(tables['Raw Data'].to_pandas(), _raw())
+    bands = _split(tables['Filtered Data'])
+    assert list(bands) == list(_bands())
+    for name, frame in _bands().items():
+        pd.testing.assert_frame_equal(bands[name], frame)
+    for table in tables.values():
+        assert json.loads(table.schema.metadata[b'metadata']) == _metadata_records()
+    if extension == 'parquet':
+        with zipfile.ZipFile(io.BytesIO(data)) as archive:
+            assert pq.ParquetFile(io.BytesIO(archive.read('Filtered Data.parquet'))).num_row_groups == 3
+
+
+def test_single_table_is_not_zipped(export_tasks):
+    data = export_tasks.FORMATS['Parquet'][0]([('Raw Data', {'Raw Data': _raw()})], None)
+    assert data[:4] == b'PAR1'
+    pd.testing.assert_frame_equal(pq.read_table(io.BytesIO(data)).to_pandas(), _raw())
+    assert export_tasks.export_file(data, 'R1', 'Parquet') == ('R1.parquet', 'application/vnd.apache.parquet')
+
+
+def test_csv_zip_is_to_csv(export_tasks):
+    sheets = _sheets()
+    data = export_tasks.FORMATS['CSV (zip)'][0](sheets, _metadata())
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        assert archive.namelist() == [f'{name}.csv' for name, _ in _named(sheets)]
+        for name, frame in _named(sheets):
+            assert archive.read(f'{name}.csv') == frame.to_csv(index=False).encode()
+
+
+def test_export_builds_once(export_tasks):
+    calls = []
+
+    def raw():
+        calls.append('Raw Data')
+        return _raw()
+
+    tasks = export_tasks.ExportTasks(export_tasks.fingerprint(_raw(), _metadata()))
+    tasks.add('Raw Data', raw)
+    tasks.add('Metadata', _metadata)
+    data = tasks.export(['Raw Data', 'Metadata'], 'CSV (zip)')
+    assert tasks.export(['Raw Data', 'Metadata'], 'CSV (zip)') is data
+    assert tasks.cached_export(['Raw Data', 'Metadata'], 'CSV (zip)') is data
+    assert calls == ['Raw Data']
+    # Every caller gets its own copy of a stored result
+    frame = tasks['Raw Data']
+    frame.iloc[:, 0] = 0.0
+    pd.testing.assert_frame_equal(tasks['Raw Data'], _raw())
+    export_tasks.clear_exports()
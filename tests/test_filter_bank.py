@@ -0,0 +1,167 @@
+# filter_bank.py against the per-column, per-band loops of apply_allfiltering_to_columns().
+#
+# seeded_process() and rolled_process() are verbatim copies of the two process() loops of the pages
+# (filters.py / Preprocessing.py and 8686.py / Filterwebapp.py), apply_allfiltering_to_columns() the
+# filters.py loop with the band list passed in. Both copies of filter_bank.py are checked.
+
+import importlib.util
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_DIRS = ['WEBB_APP_TREBIRTH', 'TREBIRTH']
+# One filter of every length of the Filters set: 254, 507, 277 and 551 taps
+BANDS = ['coefLPF5Hz', 'coefLPF50Hz', 'coefHPF10Hz', 'coefHPF50Hz']
+N_SAMPLES = 800
+
+
+def _load(app_dir, name):
+    # The module's own imports (fir_engine, coef_store, ...) come from the same app directory
+    directory = os.path.join(ROOT, app_dir)
+    for module_name, module in list(sys.modules.items()):
+        path = getattr(module, '__file__', None) or ''
+        if path.startswith(ROOT + os.sep) and os.path.dirname(path) != os.path.dirname(os.path.abspath(__file__)):
+            del sys.modules[module_name]
+    sys.path.insert(0, directory)
+    try:
+        spec = importlib.util.spec_from_file_location(f'{app_dir}_{name}', os.path.join(directory, f'{name}.py'))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        sys.path.remove(directory)
+    return module
+
+
+def seeded_process(coef, in_signal):
+    FILTERTAPS = len(coef)
+    values = in_signal[:FILTERTAPS].copy()
+    k = 0
+    out_signal = []
+    gain = 1.0
+    for in_value in in_signal:
+        out = 0.0
+        values[k] = in_value
+        for i in range(len(coef)):
+            out += coef[i] * values[(i + k) % FILTERTAPS]
+        out /= gain
+        k = (k + 1) % FILTERTAPS
+        out_signal.append(out)
+    return out_signal
+
+
+def rolled_process(coef, in_signal):
+    FILTERTAPS = len(coef)
+    values = np.zeros(FILTERTAPS)
+    out_signal = []
+    gain = 1.0
+    k = 0
+    for in_value in in_signal:
+        values[k] = in_value
+        out = np.dot(coef, np.roll(values, k))
+        out /= gain
+        out_signal.append(out)
+        k = (k + 1) % FILTERTAPS
+    return out_signal
+
+
+def apply_allfiltering_to_columns(df, coefs, process):
+    output_dfs = []
+    for column in df.columns:
+        # The columns as numpy arrays: the loops index them by position
+        input_signal = df[column].to_numpy()
+        filtered_output = pd.DataFrame({band: process(coef, input_signal) for band, coef in coefs.items()})
+        filtered_output.columns = [f"{column}_{col}" for col in filtered_output.columns]
+        output_dfs.append(filtered_output)
+    return pd.concat(output_dfs, axis=1)
+
+
+@pytest.fixture(params=APP_DIRS)
+def filter_bank(request):
+    return _load(request.param, 'filter_bank')
+
+
+@pytest.fixture(scope='module')
+def coefs():
+    filters = _load('WEBB_APP_TREBIRTH', 'coef_store').load_set('Filters')
+    return {band: np.asarray(filters[band]) for band in BANDS}
+
+
+@pytest.fixture(scope='module')
+def scans():
+    # Three scans: plain, NaN in the seed samples, NaN after the longest filter's seed
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=(N_SAMPLES, 3)).cumsum(axis=0)
+    x[3, 1] = np.nan
+    x[600:602, 2] = np.nan
+    return pd.DataFrame(x, columns=['Radar 1', 'Radar 2', 'ADXL 1'])
+
+
+@pytest.fixture(scope='module')
+def expected(coefs, scans):
+    # The loops are slow; both app directories are compared against one run of them
+    return {'seeded': apply_allfiltering_to_columns(scans, coefs, seeded_process),
+            'rolled': apply_allfiltering_to_columns(scans, coefs, rolled_process)}
+
+
+def _assert_same(out, expected):
+    out, expected = np.asarray(out), np.asarray(expected)
+    assert out.shape == expected.shape
+    np.testing.assert_array_equal(np.isnan(out), np.isnan(expected))
+    np.testing.assert_allclose(out, expected, rtol=1e-9, atol=1e-9)
+
+
+@pytest.mark.parametrize('mode', ['seeded', 'rolled'])
+def test_filter_bank_matches_loops(filter_bank, coefs, scans, expected, mode):
+    bank = filter_bank.FilterBank(coefs, rolled=mode == 'rolled')
+    filtered = bank.apply(scans.to_numpy(), axis=0)
+    assert filtered.shape == (len(BANDS), scans.shape[1], N_SAMPLES)
+    frame = bank.to_frame(filtered, scans.columns)
+    assert list(frame.columns) == list(expected[mode].columns)
+    _assert_same(frame, expected[mode])
+
+
+def test_filter_bank_small_chunks(filter_bank, coefs, scans, expected):
+    # Bands spread over several FFT chunks give the same output
+    bank = filter_bank.FilterBank(coefs, max_chunk_bytes=1)
+    _assert_same(bank.to_frame(bank.apply(scans.to_numpy(), axis=0), scans.columns), expected['seeded'])
+
+
+def test_apply_each_is_a_cascade(filter_bank, coefs, scans):
+    # Second stage: block b through band b only, as the HPF -> LPF cascade of the 1-50Hz export uses it
+    x = scans.to_numpy()[:, :1]
+    first = filter_bank.FilterBank(coefs, rolled=True).apply(x, axis=0)
+    second = filter_bank.FilterBank(coefs, rolled=True).apply_each(first)
+    for b, coef in enumerate(coefs.values()):
+        _assert_same(second[b, 0], rolled_process(coef, first[b, 0]))
+    with pytest.raises(ValueError):
+        filter_bank.FilterBank(coefs).apply_each(first[:2])
+
+
+CHUNKINGS = [[N_SAMPLES], [100] * 8, [551, 0, 249], [1] * 5 + [300], [13] * 62]
+
+
+@pytest.mark.parametrize('sizes', CHUNKINGS)
+@pytest.mark.parametrize('mode', ['seeded', 'rolled'])
+def test_streaming_filter_bank_matches_loops(filter_bank, coefs, scans, expected, sizes, mode):
+    bank = filter_bank.StreamingFilterBank(coefs, mode=mode)
+    x = scans.to_numpy()
+    chunks, start = [], 0
+    for size in sizes:
+        chunks.append(bank.filter(x[start:start + size]))
+        start += size
+    chunks += [bank.filter(x[start:]), bank.flush()]
+    out = np.concatenate(chunks, axis=-1)
+    assert out.shape == (len(BANDS), scans.shape[1], N_SAMPLES)
+    _assert_same(filter_bank.FilterBank(coefs).to_frame(out, scans.columns), expected[mode])
+
+
+def test_streaming_filter_bank_resets_on_flush(filter_bank, coefs, scans, expected):
+    bank = filter_bank.StreamingFilterBank(coefs)
+    bank.filter(np.ones((600, 3)))
+    bank.flush()
+    out = np.concatenate([bank.filter(scans.to_numpy()), bank.flush()], axis=-1)
+    _assert_same(filter_bank.FilterBank(coefs).to_frame(out, scans.columns), expected['seeded'])
@@ -0,0 +1,186 @@
+# fir_engine.py against the per-sample process() loops it replaces.
+#
+# seeded_process() and rolled_process() are verbatim copies of the two loops the pages used
+# (Preprocessing.py / filters.py and 8686.py / Filterwebapp.py). Both copies of fir_engine.py are checked.
+
+import importlib.util
+import os
+
+import numpy as np
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_DIRS = ['WEBB_APP_TREBIRTH', 'TREBIRTH']
+
+
+def _load(app_dir, name):
+    spec = importlib.util.spec_from_file_location(f'{app_dir}_{name}', os.path.join(ROOT, app_dir, f'{name}.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def seeded_process(coef, in_signal):
+    FILTERTAPS = len(coef)
+    values = in_signal[:FILTERTAPS].copy()
+    k = 0
+    out_signal = []
+    gain = 1.0
+    for in_value in in_signal:
+        out = 0.0
+        values[k] = in_value
+        for i in range(len(coef)):
+            out += coef[i] * values[(i + k) % FILTERTAPS]
+        out /= gain
+        k = (k + 1) % FILTERTAPS
+        out_signal.append(out)
+    return out_signal
+
+
+def rolled_process(coef, in_signal):
+    FILTERTAPS = len(coef)
+    values = np.zeros(FILTERTAPS)
+    out_signal = []
+    gain = 1.0
+    k = 0
+    for in_value in in_signal:
+        values[k] = in_value
+        out = np.dot(coef, np.roll(values, k))
+        out /= gain
+        out_signal.append(out)
+        k = (k + 1) % FILTERTAPS
+    return out_signal
+
+
+def seeded_short(coef, in_signal):
+    # The seeded loop raises IndexError on signals shorter than the filter; fir_engine zero fills the missing
+    # seed samples, which is the loop run on the signal padded with zeros up to FILTERTAPS
+    padded = np.concatenate([in_signal, np.zeros(len(coef) - len(in_signal))])
+    return seeded_process(coef, padded)[:len(in_signal)]
+
+
+@pytest.fixture(params=APP_DIRS)
+def fir_engine(request):
+    return _load(request.param, 'fir_engine')
+
+
+@pytest.fixture(scope='module')
+def coef():
+    # A real filter of the Filters coefficient set (277 taps)
+    return _load('WEBB_APP_TREBIRTH', 'coef_store').load_set('Filters')['coefHPF10Hz']
+
+
+def _signal(n, seed=0, nans=()):
+    x = np.random.default_rng(seed).normal(size=n).cumsum()
+    x[list(nans)] = np.nan
+    return x
+
+
+def _columns(n, taps):
+    # Several signal shapes side by side: plain, NaN in the seed samples, NaN later on, NaN at the end
+    return np.column_stack([_signal(n, 1), _signal(n, 2, [3]), _signal(n, 3, [taps + 10, taps + 11]),
+                            _signal(n, 4, [n - 1])])
+
+
+def _chunks(x, sizes):
+    start = 0
+    for size in sizes:
+        yield x[start:start + size]
+        start += size
+    yield x[start:]
+
+
+def test_circular_kernel_is_the_seeded_loop(fir_engine):
+    coef = np.arange(1.0, 6.0)
+    x = np.zeros(20)
+    x[10] = 1.0
+    np.testing.assert_allclose(fir_engine.filter_block(coef, x)[10:15], fir_engine.circular_kernel(coef))
+    np.testing.assert_allclose(seeded_process(coef, x)[10:15], fir_engine.circular_kernel(coef))
+
+
+@pytest.mark.parametrize('n', [1, 10, 276, 277, 278, 900])
+def test_filter_block_matches_seeded_loop(fir_engine, coef, n):
+    x = _signal(n)
+    expected = seeded_process(coef, x) if n >= len(coef) else seeded_short(coef, x)
+    np.testing.assert_allclose(fir_engine.filter_block(coef, x), expected, rtol=1e-9, atol=1e-9)
+
+
+@pytest.mark.parametrize('n', [1, 10, 276, 277, 278, 900])
+def test_filter_block_rolled_matches_rolled_loop(fir_engine, coef, n):
+    x = _signal(n)
+    np.testing.assert_allclose(fir_engine.filter_block_rolled(coef, x), rolled_process(coef, x), rtol=1e-9, atol=1e-9)
+
+
+def test_short_signal_raises_in_seeded_loop(coef):
+    with pytest.raises(IndexError):
+        seeded_process(coef, _signal(len(coef) - 1))
+
+
+def test_filter_block_columns_with_nans(fir_engine, coef):
+    block = _columns(700, len(coef))
+    expected = np.column_stack([seeded_process(coef, block[:, j]) for j in range(block.shape[1])])
+    out = fir_engine.filter_block(coef, block)
+    # NaN exactly where the loop gives NaN, the same values elsewhere
+    np.testing.assert_array_equal(np.isnan(out), np.isnan(expected))
+    np.testing.assert_allclose(out, expected, rtol=1e-9, atol=1e-9)
+    np.testing.assert_allclose(fir_engine.filter_block(coef, block.T, axis=1), expected.T, rtol=1e-9, atol=1e-9)
+
+
+def test_filter_block_rolled_columns_with_nans(fir_engine, coef):
+    block = _columns(700, len(coef))
+    expected = np.column_stack([rolled_process(coef, block[:, j]) for j in range(block.shape[1])])
+    out = fir_engine.filter_block_rolled(coef, block)
+    np.testing.assert_array_equal(np.isnan(out), np.isnan(expected))
+    np.testing.assert_allclose(out, expected, rtol=1e-9, atol=1e-9)
+    np.testing.assert_allclose(fir_engine.filter_block_rolled(coef, block.T, axis=1), expected.T, rtol=1e-9, atol=1e-9)
+
+
+def test_process_wrappers(fir_engine, coef):
+    x = _signal(400)
+    np.testing.assert_allclose(fir_engine.process(coef, x), seeded_process(coef, x), rtol=1e-9, atol=1e-9)
+    np.testing.assert_allclose(fir_engine.process_rolled(coef, x), rolled_process(coef, x), rtol=1e-9, atol=1e-9)
+
+
+# Chunk sizes around the filter length: empty chunks, chunks shorter than FILTERTAPS, the seed completing in
+# the middle of a chunk, a boundary right at FILTERTAPS and one just after a full wrap of the ring buffer
+CHUNKINGS = [[700], [1] * 5 + [0, 300], [100, 100, 100, 100], [277, 277, 1], [276, 0, 2, 300], [13] * 60]
+
+
+@pytest.mark.parametrize('sizes', CHUNKINGS)
+@pytest.mark.parametrize('mode, loop', [('seeded', seeded_process), ('rolled', rolled_process)])
+def test_streaming_matches_loops_across_chunks(fir_engine, coef, sizes, mode, loop):
+    block = _columns(800, len(coef))
+    expected = np.column_stack([loop(coef, block[:, j]) for j in range(block.shape[1])])
+    fir = fir_engine.StreamingFIR(coef, mode=mode)
+    out = np.concatenate([fir.filter(chunk) for chunk in _chunks(block, sizes)] + [fir.flush()])
+    assert out.shape == expected.shape
+    np.testing.assert_array_equal(np.isnan(out), np.isnan(expected))
+    np.testing.assert_allclose(out, expected, rtol=1e-9, atol=1e-9)
+
+
+@pytest.mark.parametrize('mode', ['seeded', 'rolled'])
+def test_streaming_short_signal(fir_engine, coef, mode):
+    x = _signal(50)
+    expected = seeded_short(coef, x) if mode == 'seeded' else rolled_process(coef, x)
+    fir = fir_engine.StreamingFIR(coef, mode=mode)
+    out = np.concatenate([fir.filter(chunk) for chunk in _chunks(x, [20, 20])] + [fir.flush()])
+    np.testing.assert_allclose(out, expected, rtol=1e-9, atol=1e-9)
+    # flush() resets: the next signal starts from a fresh state
+    y = _signal(600, 5)
+    loop = seeded_process if mode == 'seeded' else rolled_process
+    np.testing.assert_allclose(np.concatenate([fir.filter(y), fir.flush()]), loop(coef, y), rtol=1e-9, atol=1e-9)
+
+
+def test_streaming_zero_mode_is_fir_h(fir_engine, coef):
+    # FIR.h: ring buffer of zeros, the same kernel as the seeded loop, divided by the gain
+    x = _signal(600)
+    gain = coef.sum()
+    fir = fir_engine.StreamingFIR(coef, mode='zero', gain=gain)
+    out = np.concatenate([fir.filter(chunk) for chunk in _chunks(x, [100, 250])])
+    expected = np.convolve(x, fir_engine.circular_kernel(coef))[:len(x)] / gain
+    np.testing.assert_allclose(out, expected, rtol=1e-9, atol=1e-9)
+
+
+def test_streaming_unknown_mode(fir_engine, coef):
+    with pytest.raises(ValueError):
+        fir_engine.StreamingFIR(coef, mode='other')
@@ -0,0 +1,203 @@
+# preprocess.py's vectorised band_stats(), fq() and columns_reports_unique() against the loops they replace.
+#
+# The loops are the baseline versions of preprocess.py: stats_filtereddata() run once per band,
+# columns_reports_unique() over every pair of columns, and the per-column signal.welch() of fq(), which
+# differs between the two app directories. Two changes to them for current pandas / SciPy: the chained
+# df[column].fillna(..., inplace=True) is written as an assignment, which is what it did before pandas' copy
+# on write made the chained form a no-op, and welch() is given the column's values (it can no longer index
+# a Series).
+
+import importlib.util
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import signal
+from scipy.stats import kurtosis, skew
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_DIRS = ['WEBB_APP_TREBIRTH', 'TREBIRTH']
+
+
+def _load(app_dir, name):
+    # The module's own imports (fir_engine, coef_store, ...) come from the same app directory
+    directory = os.path.join(ROOT, app_dir)
+    for module_name, module in list(sys.modules.items()):
+        path = getattr(module, '__file__', None) or ''
+        if path.startswith(ROOT + os.sep) and os.path.dirname(path) != os.path.dirname(os.path.abspath(__file__)):
+            del sys.modules[module_name]
+    sys.path.insert(0, directory)
+    try:
+        spec = importlib.util.spec_from_file_location(f'{app_dir}_{name}', os.path.join(directory, f'{name}.py'))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        sys.path.remove(directory)
+    return module
+
+
+def stats_filtereddata(df, band):
+    stats = {
+        "Band": [],
+        "STD": [],
+        "PTP": [],
+        "Mean": [],
+        "RMS": [],
+        "Skew": [],
+        "Kurtosis": []
+    }
+
+    for column in df.columns:
+        # Ensure the column is numeric and handle NaN values
+        df[column] = pd.to_numeric(df[column], errors='coerce')
+        df[column] = df[column].fillna(df[column].mean())
+
+        stats["Band"].append(f"{band} {column}")
+        stats["STD"].append(np.std(df[column]))
+        stats["PTP"].append(np.ptp(df[column]))
+        stats["Mean"].append(np.mean(df[column]))
+        stats["RMS"].append(np.sqrt(np.mean(df[column]**2)))
+        stats["Skew"].append(skew(df[column]))
+        stats["Kurtosis"].append(kurtosis(df[column]))
+
+    return pd.DataFrame(stats)
+
+
+def columns_reports_unique(df):
+    report = []
+    num_columns = len(df.columns)
+    for i in range(num_columns):
+        for j in range(i + 1, num_columns):  # Start j from i + 1
+            column1 = df.columns[i]
+            column2 = df.columns[j]
+            diff = df[column1] - df[column2]
+            mean_diff = np.mean(diff)
+            deviation_diff = np.std(diff)
+            ptp_diff = np.ptp(diff)
+            skewness_diff = skew(diff)
+            correlation = df[[column1, column2]].corr().iloc[0, 1]
+            report.append({
+                'Column 1': column1,
+                'Column 2': column2,
+                'Mean Difference': mean_diff,
+                'Deviation Difference': deviation_diff,
+                'PTP Difference': ptp_diff,
+                'Skewness Difference': skewness_diff,
+                'Correlation': correlation,
+            })
+    report_df = pd.DataFrame(report)
+    return report_df
+
+
+def fq_webb_app(df):
+    # WEBB_APP_TREBIRTH: 850 sample segments, the 0 Hz bin dropped, one column per scan
+    frequencies = []
+    powers = []
+
+    for i in df.columns:
+        f, p = signal.welch(df[i].to_numpy(), 100, 'flattop', 850, scaling='spectrum')
+        frequencies.append(f[1:])
+        powers.append(p[1:])
+
+    frequencies_df = pd.DataFrame(frequencies).transpose()
+    powers_df = pd.DataFrame(powers).transpose()
+    return frequencies_df, powers_df
+
+
+def fq_trebirth(df):
+    # TREBIRTH: 1024 sample segments, lists of arrays
+    frequencies = []
+    powers = []
+
+    for i in df:
+        f, p = signal.welch(df[i].to_numpy(), 100, 'flattop', 1024, scaling='spectrum')
+        frequencies.append(f)
+        powers.append(p)
+
+    return frequencies, powers
+
+
+@pytest.fixture(params=APP_DIRS)
+def app_dir(request):
+    return request.param
+
+
+@pytest.fixture
+def preprocess(app_dir):
+    return _load(app_dir, 'preprocess')
+
+
+def _filtered(n_bands=5, n_scans=4, n=700, seed=0):
+    # (band, scan, sample) like FilterBank.apply(): offsets, a constant scan and NaNs
+    x = np.random.default_rng(seed).normal(size=(n_bands, n_scans, n)).cumsum(axis=-1)
+    x[:, 1] += 1e4
+    x[:, 2] = 3.0
+    x[1, 3, [0, 10, 699]] = np.nan
+    x[4, 0, 200:300] = np.nan
+    return x
+
+
+# SciPy warns about the constant scan, then gives NaN skew / kurtosis like band_stats()
+@pytest.mark.filterwarnings('ignore:Precision loss occurred')
+def test_band_stats_matches_stats_filtereddata(preprocess):
+    filtered = _filtered()
+    bands = [f'{f}Hz-{f + 1}Hz' for f in range(1, filtered.shape[0] + 1)]
+    columns = ['Radar 1', 'Radar 2', 'ADXL 1', 'Ax 1']
+    table = preprocess.band_stats(filtered, bands, columns, chunk_bands=2)
+    expected = pd.concat([stats_filtereddata(pd.DataFrame(filtered[b].T, columns=columns), band)
+                          for b, band in enumerate(bands)], ignore_index=True)
+    assert (table['Band'] + ' ' + table['Column']).tolist() == expected['Band'].tolist()
+    for name in ('STD', 'PTP', 'Mean', 'RMS', 'Skew', 'Kurtosis'):
+        np.testing.assert_allclose(table[name], expected[name], rtol=1e-7, atol=1e-9, err_msg=name)
+
+
+def test_fq_matches_welch_loop(preprocess, app_dir):
+    df = pd.DataFrame(np.random.default_rng(2).normal(size=(1200, 3)), columns=['Radar 1', 'Radar 2', 'ADXL 1'])
+    frequencies, powers = preprocess.fq(df)
+    if app_dir == 'WEBB_APP_TREBIRTH':
+        expected_frequencies, expected_powers = fq_webb_app(df)
+        pd.testing.assert_frame_equal(frequencies, expected_frequencies, rtol=1e-12)
+        pd.testing.assert_frame_equal(powers, expected_powers, rtol=1e-9)
+    else:
+        expected_frequencies, expected_powers = fq_trebirth(df)
+        assert len(frequencies) == len(powers) == df.shape[1]
+        for j in range(df.shape[1]):
+            np.testing.assert_allclose(frequencies[j], expected_frequencies[j], rtol=1e-12)
+            np.testing.assert_allclose(powers[j], expected_powers[j], rtol=1e-9)
+
+
+def _columns_frame():
+    # Correlated columns, an offset one, a shorter one (NaN tail, as scans of different lengths) and a NaN
+    rng = np.random.default_rng(3)
+    base = rng.normal(size=600).cumsum()
+    df = pd.DataFrame({
+        'Radar 1': base,
+        'Radar 2': base + rng.normal(size=600),
+        'ADXL 1': rng.normal(size=600) + 500.0,
+        'ADXL 2': np.concatenate([rng.normal(size=450), np.full(150, np.nan)]),
+        'Ax 1': rng.normal(size=600),
+    })
+    df.loc[17, 'Ax 1'] = np.nan
+    return df
+
+
+def test_columns_reports_unique_matches_pair_loop(preprocess):
+    df = _columns_frame()
+    report = preprocess.columns_reports_unique(df, max_block_bytes=8 * 600 * 3)
+    expected = columns_reports_unique(df)
+    assert report[['Column 1', 'Column 2']].values.tolist() == expected[['Column 1', 'Column 2']].values.tolist()
+    for name in ('Mean Difference', 'Deviation Difference', 'PTP Difference', 'Skewness Difference', 'Correlation'):
+        np.testing.assert_allclose(report[name], expected[name], rtol=1e-7, atol=1e-9, err_msg=name)
+
+
+def test_columns_reports_unique_options(preprocess):
+    df = _columns_frame()
+    full = preprocess.columns_reports_unique(df)
+    same = preprocess.columns_reports_unique(df, same_sensor=True)
+    assert same[['Column 1', 'Column 2']].values.tolist() == [['Radar 1', 'Radar 2'], ['ADXL 1', 'ADXL 2']]
+    top = preprocess.columns_reports_unique(df, top_k=3)
+    assert len(top) == 3
+    expected = full.reindex(full['Correlation'].abs().sort_values(ascending=False, kind='stable').index[:3])
+    pd.testing.assert_frame_equal(top.reset_index(drop=True), expected.reset_index(drop=True))